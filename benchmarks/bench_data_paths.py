@@ -0,0 +1,339 @@
+"""
+Headless timings of the main data paths of the app.
+
+Runs MainWindow under the offscreen Qt platform against a throwaway data
+directory (MAU_DATA_DIR) and home (config, thumbnails), and measures:
+
+    startup          MainWindow() until the first project is shown
+    load_projects    reload of the sidebar, first page and every page
+    switch_project   display_project_info until the project is applied
+    switch_revisit   switching back and forth between a few projects, served
+                     from the ProjectRepository cache; with its hit/miss counters
+    switch_burst     BURST selections in a row (arrow-key scrolling), all tabs
+                     built, until the last one is applied; how many were applied
+    global_search    building the cross-project index and querying it
+    info_table       ProjectInfoTab.update_project_info with large info maps
+    info_search      ranked key search over the largest info map
+    todos            ProjectTodoTab.load_todos and save_current_todo, and
+                     load_todos again once every todo holds TODO_LARGE_KB
+    render_markdown  ProjectNoteTab.render_markdown on large notes, until the
+                     preview shows it: new text, one edited section, unchanged
+
+Results go to stdout (or --output) as JSON, tagged with the current commit so
+runs from different commits can be compared.
+
+    python benchmarks/bench_data_paths.py [--sizes 10 1000 10000] [--output results.json]
+"""
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+TMP = tempfile.TemporaryDirectory(prefix="mau-bench-")
+os.environ["QT_QPA_PLATFORM"] = "offscreen"
+os.environ["HOME"] = os.path.join(TMP.name, "home")
+os.environ["USERPROFILE"] = os.environ["HOME"]
+os.makedirs(os.environ["HOME"])
+
+from mongita import MongitaClientDisk  # noqa: E402
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from markdown_renderer import content_hash  # noqa: E402
+from rank import spread_ranks  # noqa: E402
+
+SWITCHES = 30
+BURST = 20
+INFO_SIZES = [100, 1000, 5000]
+TODOS = 200
+TODO_LARGE_KB = 20
+NOTE_SIZES_KB = [10, 100, 1000]
+TIMEOUT = 120
+
+
+def pump_until(app, predicate, timeout=TIMEOUT):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("benchmark step did not finish")
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def timed(function, repeat=5):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return summary(samples)
+
+
+def summary(samples):
+    samples = sorted(samples)
+    return {"median_ms": samples[len(samples) // 2] * 1000, "max_ms": samples[-1] * 1000, "runs": len(samples)}
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_data_dir(projects):
+    """Fresh MAU_DATA_DIR with `projects` projects already in Mongita."""
+    data_dir = tempfile.mkdtemp(prefix=f"data-{projects}-", dir=TMP.name)
+    client = MongitaClientDisk(os.path.join(data_dir, "mongita_data"))
+    db = client["projects_db"]
+    ranks = spread_ranks(projects)
+    for first in range(0, projects, 1000):
+        ids = db.projects.insert_many([
+            {"name": f"Project {i:05d}", "description": f"Description of project {i}", "rank": ranks[i]}
+            for i in range(first, min(first + 1000, projects))
+        ]).inserted_ids
+        db.project_info.insert_many([
+            {"project_id": str(project_id), "key": f"key {k}", "value": f"value {k}", "updated_at": 0, "order": k}
+            for project_id in ids for k in range(10)
+        ])
+    client.close()
+    return data_dir
+
+
+def open_window(app, data_dir):
+    import main
+    os.environ["MAU_DATA_DIR"] = data_dir
+    window = main.MainWindow()
+    window.config["minimize_to_tray"] = False
+    window.show()
+    return window
+
+
+def close_window(app, window):
+    window.close()
+    app.processEvents()
+    window.deleteLater()
+    app.processEvents()
+
+
+def bench_startup_and_projects(app, size):
+    data_dir = make_data_dir(size)
+
+    start = time.perf_counter()
+    window = open_window(app, data_dir)
+    pump_until(app, lambda: window.current_project_item is not None)
+    startup_ms = (time.perf_counter() - start) * 1000
+
+    model = window.project_model
+    pages = [0]
+    model.page_loaded.connect(lambda: pages.__setitem__(0, pages[0] + 1))
+
+    def first_page():
+        window.load_projects()
+        pump_until(app, lambda: not window.select_first_project_pending)
+
+    def all_pages():
+        first_page()
+        while model.canFetchMore():
+            loaded = pages[0]
+            model.fetchMore()
+            pump_until(app, lambda: pages[0] > loaded)
+
+    result = {
+        "projects": size,
+        "startup_ms": startup_ms,
+        "load_projects_first_page": timed(first_page),
+        "load_projects_all_pages": timed(all_pages, repeat=3),
+    }
+
+    rows = [model.index(row, 0) for row in range(1, min(model.rowCount(), 50))]
+    samples = []
+    for i in range(SWITCHES if len(rows) > 1 else 0):
+        index = rows[i % len(rows)]
+        window.current_project_item = None
+        start = time.perf_counter()
+        window.display_project_info(index)
+        pump_until(app, lambda: window.current_project_item is not None)
+        samples.append(time.perf_counter() - start)
+    if samples:
+        result["switch_project"] = summary(samples)
+
+    samples = []
+    for i in range(SWITCHES if len(rows) > 5 else 0):
+        index = rows[i % 5]
+        window.current_project_item = None
+        start = time.perf_counter()
+        window.display_project_info(index)
+        pump_until(app, lambda: window.current_project_item is not None)
+        samples.append(time.perf_counter() - start)
+    if samples:
+        result["switch_revisit"] = dict(summary(samples), cache=window.project_repository.stats())
+
+    if len(rows) > BURST:
+        # With every tab built, so each batch also reads todos and notes
+        for key in ("todo", "note"):
+            window.tabs.show_tab(key)
+        applied = [0]
+        window.project_loader.loaded.connect(lambda *args: applied.__setitem__(0, applied[0] + 1))
+        target = rows[BURST].data(Qt.UserRole)
+        start = time.perf_counter()
+        for index in rows[1:BURST + 1]:
+            window.project_list_view.setCurrentIndex(index)
+        pump_until(app, lambda: window.current_project_id == target and not window.project_loader.is_loading())
+        result["switch_burst"] = {"selections": BURST, "ms": (time.perf_counter() - start) * 1000,
+                                  "applied": applied[0], "cancelled": window.project_loader.cancelled}
+
+    search = window.global_search
+    start = time.perf_counter()
+    search.ensure_index()
+    pump_until(app, search.is_ready)
+    result["global_search"] = {
+        "build_ms": (time.perf_counter() - start) * 1000,
+        "queries": {query: timed(lambda: search.search(query), repeat=20)
+                    for query in ["project 1", "key", "value 7", "descr"]},
+    }
+
+    close_window(app, window)
+    return result
+
+
+def bench_tabs(app):
+    window = open_window(app, make_data_dir(1))
+    pump_until(app, lambda: window.current_project_item is not None)
+    results = {}
+
+    info_tab = window.project_info_tab
+    results["info_table"] = [
+        {"keys": size, **timed(lambda: info_tab.update_project_info(
+            "Project", "Description", {f"key {k}": f"value {k}" * 4 for k in range(size)}), repeat=3)}
+        for size in INFO_SIZES
+    ]
+
+    proxy = info_tab.info_proxy
+    info = {f"key {k}": f"value {k}" * 4 for k in range(INFO_SIZES[-1])}
+
+    def first_query():
+        # A new project resets the model, the first query builds the search index
+        info_tab.info_model.set_info(info)
+        proxy.set_query("key 1")
+
+    results["info_search"] = {
+        "keys": len(info),
+        "reset_and_first_query": timed(first_query, repeat=3),
+        "queries": {query: timed(lambda: proxy.set_query(query))
+                    for query in ["k", "key 12", "value 4", "ky12"]},
+    }
+    proxy.set_query("")
+
+    todo_tab = window.project_todo_tab
+    project_id = str(window.current_project_id)
+    todo_ranks = spread_ranks(TODOS)
+    window.storage.submit(lambda db: db.todos.insert_many([
+        {"title": f"todo {i}", "content": "☐ task\n\n" * 50, "project_id": project_id, "rank": todo_ranks[i]}
+        for i in range(TODOS)
+    ]))
+    window.storage.flush()
+
+    def load_todos():
+        todo_tab.current_todo_id = None
+        todo_tab.load_todos()
+        pump_until(app, lambda: todo_tab.current_todo_id is not None)
+
+    counter = iter(range(1000000))
+
+    def save_todo():
+        todo_tab.text_editor.setPlainText(f"☐ edited {next(counter)}\n" * 200)
+        todo_tab.save_current_todo()
+        todo_tab.write_buffer.flush()
+        window.storage.flush()
+
+    results["todos"] = {
+        "todos": TODOS,
+        "load_todos": timed(load_todos),
+        "save_current_todo": timed(save_todo),
+    }
+
+    large_content = "☐ task with a longer description\n" * (TODO_LARGE_KB * 1024 // 34)
+    window.storage.submit(lambda db: db.todos.update_many({"project_id": project_id},
+                                                          {"$set": {"content": large_content}}))
+    window.storage.flush()
+    results["todos"]["load_todos_large"] = dict(timed(load_todos), content_kb=TODO_LARGE_KB)
+
+    note_tab = window.project_note_tab
+    note_tab.toggle_mode(True)
+    section = "# Title {}\n\nSome *text* with `code` and a [link](url).\n\n- item\n- item\n\n```\ncode block\n```\n\n"
+    renders = []
+    for size_kb in NOTE_SIZES_KB:
+        count = size_kb * 1024 // len(section)
+        runs = iter(range(1000000))
+
+        def render(text):
+            note_tab.edit_area.setPlainText(text)
+            note_tab.render_markdown()
+            key = content_hash(text)
+            pump_until(app, lambda: note_tab.preview_hash == key)
+
+        def cold():
+            # Unique text every run, so nothing is cached
+            run = next(runs)
+            render("".join(section.format(f"{run}-{i}") for i in range(count)))
+
+        base = "".join(section.format(i) for i in range(count))
+        edits = iter(range(1000000))
+
+        def edit_one_section():
+            render(base + f"# Edited {next(edits)}\n\ntext\n")
+
+        renders.append({
+            "kb": size_kb,
+            "cold": timed(cold, repeat=3),
+            "edit_one_section": timed(edit_one_section, repeat=3),
+            "unchanged": timed(note_tab.render_markdown),
+        })
+    results["render_markdown"] = renders
+
+    close_window(app, window)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    results = {"projects": []}
+    # The app logs with print(), keep stdout for the JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        for size in args.sizes:
+            result = bench_startup_and_projects(app, size)
+            results["projects"].append(result)
+            print(f"{size} projects: startup {result['startup_ms']:.1f} ms, "
+                  f"first page {result['load_projects_first_page']['median_ms']:.1f} ms")
+        results.update(bench_tabs(app))
+
+    output = json.dumps({"benchmark": "data_paths", "commit": git_commit(), "results": results}, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    TMP.cleanup()
+    # Skip the interpreter teardown: some PySide6 releases (6.12) leak references
+    # to True in Signal.emit and abort while collecting at exit.
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
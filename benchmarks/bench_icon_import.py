@@ -0,0 +1,79 @@
+"""
+Startup cost of the embedded application icon.
+
+Compares importing the old `icon = bytes([...])` module against the base64
+module written by convert_png_to_bytes.py, both cold (no .pyc, so Python has
+to compile the source like on a first run) and warm (cached bytecode).
+
+    python benchmarks/bench_icon_import.py
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from convert_png_to_bytes import image_to_bytes  # noqa: E402
+
+IMAGE_PATH = os.path.join(ROOT, "assets", "banner", "mau-logo-alpha.png")
+RUNS = 5
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import icon; "
+    "data = icon.get_icon_bytes() if hasattr(icon, 'get_icon_bytes') else icon.icon; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def write_legacy_module(path):
+    """The format convert_png_to_bytes.py used to generate."""
+    with open(IMAGE_PATH, "rb") as f:
+        image_data = f.read()
+    with open(path, "w") as f:
+        f.write("icon = bytes([\n")
+        for i, byte in enumerate(image_data):
+            f.write(f"0x{byte:02X}, ")
+            if (i + 1) % 16 == 0:
+                f.write("\n")
+        f.write("\n])")
+
+
+def time_import(module_dir, cold):
+    env = dict(os.environ, PYTHONPATH=module_dir)
+    if cold:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+        shutil.rmtree(os.path.join(module_dir, "__pycache__"), ignore_errors=True)
+    else:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        subprocess.run([sys.executable, "-c", "import icon"], env=env, cwd=module_dir, check=True)
+    samples = []
+    for _ in range(RUNS):
+        out = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], env=env, cwd=module_dir,
+                             check=True, capture_output=True, text=True)
+        samples.append(float(out.stdout.strip()))
+    return min(samples)
+
+
+def main():
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, writer in (("bytes_literal", write_legacy_module),
+                             ("base64", lambda path: image_to_bytes(IMAGE_PATH, path))):
+            module_dir = os.path.join(tmp, name)
+            os.makedirs(module_dir)
+            module_path = os.path.join(module_dir, "icon.py")
+            writer(module_path)
+            results[name] = {
+                "source_bytes": os.path.getsize(module_path),
+                "cold_import_s": time_import(module_dir, cold=True),
+                "warm_import_s": time_import(module_dir, cold=False),
+            }
+    print(json.dumps({"benchmark": "icon_import", "results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Mongita against the SQLite engine (storage_backend) on the operations the app runs.
+
+Both databases are opened through storage_backend.open_database in a
+throwaway data directory, filled with the same projects and todos, indexed
+by storage_worker.ensure_indexes, and timed on: bulk insert, find_one by id,
+the sidebar summaries, project_store.set_info_value on an existing key, the
+todos of one project and a count. Also times migrate_from_mongita on the filled Mongita database.
+
+    python benchmarks/bench_storage_backends.py [--sizes 1000 10000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from storage_backend import BACKENDS, open_database, open_sqlite, migrate_from_mongita  # noqa: E402
+from storage_worker import ensure_indexes, find_summaries  # noqa: E402
+from project_store import INFO_COLLECTION, set_info_value  # noqa: E402
+
+TODOS_PER_PROJECT = 10
+INFO_PER_PROJECT = 10
+QUERIES = 50
+BATCH = 500
+
+
+def make_project(i):
+    return {"name": f"project {i}", "description": "A project. " * 20, "icon_path": ""}
+
+
+def fill(db, projects):
+    start = time.perf_counter()
+    ids = []
+    for offset in range(0, projects, BATCH):
+        batch = [make_project(i) for i in range(offset, min(projects, offset + BATCH))]
+        batch_ids = [str(i) for i in db.projects.insert_many(batch).inserted_ids]
+        db[INFO_COLLECTION].insert_many([
+            {"project_id": project_id, "key": f"key{k}", "value": "value " * 10, "updated_at": 0, "order": k}
+            for project_id in batch_ids for k in range(INFO_PER_PROJECT)
+        ])
+        ids.extend(batch_ids)
+    for offset in range(0, len(ids), BATCH // TODOS_PER_PROJECT):
+        db.todos.insert_many([
+            {"title": f"todo {t}", "content": "☐ task\n" * 20, "project_id": project_id}
+            for project_id in ids[offset:offset + BATCH // TODOS_PER_PROJECT]
+            for t in range(TODOS_PER_PROJECT)
+        ])
+    ensure_indexes(db)
+    return ids, (time.perf_counter() - start) * 1000
+
+
+def timed(operation, repeat=QUERIES):
+    samples = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        operation(i)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def measure(db, ids):
+    rng = random.Random(42)
+    picks = [rng.choice(ids) for _ in range(QUERIES)]
+
+    def find_one(i):
+        assert db.projects.find_one({"_id": picks[i]}) is not None
+
+    def set_info(i):
+        set_info_value(db, picks[i], "key3", f"changed {i}")
+
+    def todos(i):
+        assert len(list(db.todos.find({"project_id": picks[i]}))) == TODOS_PER_PROJECT
+
+    def summaries(i):
+        assert len(list(find_summaries(db, "projects"))) == len(ids)
+
+    return {
+        "find_one_ms": timed(find_one),
+        "set_info_key_ms": timed(set_info),
+        "todos_by_project_ms": timed(todos),
+        "count_ms": timed(lambda i: db.todos.count_documents({})),
+        "summaries_ms": timed(summaries, repeat=5),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        row = {"projects": size, "todos": size * TODOS_PER_PROJECT, INFO_COLLECTION: size * INFO_PER_PROJECT}
+        with tempfile.TemporaryDirectory() as tmp:
+            for backend in BACKENDS:
+                # One data directory each, or the SQLite one would migrate Mongita's data
+                client, db = open_database(backend, os.path.join(tmp, backend))
+                ids, insert_ms = fill(db, size)
+                row[backend] = {"insert_ms": insert_ms, **measure(db, ids)}
+                client.close()
+                print(f"{size} projects, {backend}: {row[backend]}", file=sys.stderr)
+
+            client, db = open_sqlite(os.path.join(tmp, "migrated"), "projects_db")
+            start = time.perf_counter()
+            copied = migrate_from_mongita(os.path.join(tmp, "mongita"), "projects_db", db)
+            row["migrate_ms"] = (time.perf_counter() - start) * 1000
+            assert copied == {"projects": size, "todos": size * TODOS_PER_PROJECT,
+                              INFO_COLLECTION: size * INFO_PER_PROJECT}, copied
+            client.close()
+        results.append(row)
+    print(json.dumps({"benchmark": "storage_backends", "results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+ProjectTodoTab.load_todos latency as the todos collection grows.
+
+Fills a throwaway Mongita directory with todos spread over many projects and
+times the `find({"project_id": ...})` query the todo tab runs, with and
+without the index created by storage_worker.ensure_indexes.
+
+    python benchmarks/bench_todo_index.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mongita import MongitaClientDisk  # noqa: E402
+
+from storage_worker import ensure_indexes  # noqa: E402
+
+TODOS_PER_PROJECT = 20
+QUERIES = 50
+BATCH = 5000
+
+
+def fill(db, count):
+    inserted = db.todos.count_documents({})
+    while inserted < count:
+        batch = min(BATCH, count - inserted)
+        db.todos.insert_many([
+            {"title": f"todo {i}", "content": "☐ task\n" * 20, "project_id": f"project-{i // TODOS_PER_PROJECT}"}
+            for i in range(inserted, inserted + batch)
+        ])
+        inserted += batch
+    return count // TODOS_PER_PROJECT
+
+
+def time_queries(db, projects):
+    rng = random.Random(42)
+    samples = []
+    for _ in range(QUERIES):
+        project_id = f"project-{rng.randrange(projects)}"
+        start = time.perf_counter()
+        todos = list(db.todos.find({"project_id": project_id}))
+        samples.append(time.perf_counter() - start)
+        assert len(todos) == TODOS_PER_PROJECT
+    samples.sort()
+    return {"median_ms": samples[len(samples) // 2] * 1000, "max_ms": samples[-1] * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        client = MongitaClientDisk(tmp)
+        db = client["projects_db"]
+        for size in sorted(args.sizes):
+            projects = fill(db, size)
+            for index_name in [list(index)[0] for index in db.todos.index_information()]:
+                if index_name != "_id_":
+                    db.todos.drop_index(index_name)
+            scan = time_queries(db, projects)
+            ensure_indexes(db)
+            indexed = time_queries(db, projects)
+            results.append({"todos": size, "projects": projects, "scan": scan, "indexed": indexed})
+            print(f"{size} todos: scan {scan['median_ms']:.2f} ms, indexed {indexed['median_ms']:.2f} ms",
+                  file=sys.stderr)
+        client.close()
+    print(json.dumps({"benchmark": "todo_index", "results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
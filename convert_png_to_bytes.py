@@ -1,16 +1,37 @@
+import base64
+
+LINE_WIDTH = 100
+
+
 def image_to_bytes(image_path, output_py_file):
+    """
+    Embed a PNG in a Python module as a base64 string.
+
+    A single string literal compiles much faster than a bytes([...]) list of ints
+    and is ~5x smaller; the PNG is only decoded when get_icon_bytes() is called.
+    base64 rather than base85 because binascii decodes it in C.
+    """
     with open(image_path, "rb") as f:
         image_data = f.read()
-    
+
+    encoded = base64.b64encode(image_data).decode("ascii")
+
     with open(output_py_file, "w") as f:
-        f.write("icon = bytes([\n")
-        for i, byte in enumerate(image_data):
-            f.write(f"0x{byte:02X}, ")
-            if (i + 1) % 16 == 0:
-                f.write("\n")
-        f.write("\n])")
-    
+        f.write(f"# Generated by convert_png_to_bytes.py from {image_path}, do not edit.\n")
+        f.write("import binascii\n")
+        f.write("from functools import lru_cache\n\n")
+        f.write("_ICON_B64 = (\n")
+        for i in range(0, len(encoded), LINE_WIDTH):
+            f.write(f'    "{encoded[i:i + LINE_WIDTH]}"\n')
+        f.write(")\n\n\n")
+        f.write("@lru_cache(maxsize=None)\n")
+        f.write("def get_icon_bytes():\n")
+        f.write('    """PNG bytes of the application icon, decoded on first use."""\n')
+        f.write("    return binascii.a2b_base64(_ICON_B64)\n")
+
     print(f"¡Listo! Archivo '{output_py_file}' generado correctamente.")
 
-# Uso: pon el nombre de tu imagen aquí
-image_to_bytes("assets/banner/mau-logo-alpha.png", "icon.py")
\ No newline at end of file
+
+if __name__ == "__main__":
+    # Uso: pon el nombre de tu imagen aquí
+    image_to_bytes("assets/banner/mau-logo-alpha.png", "icon.py")
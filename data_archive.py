@@ -0,0 +1,270 @@
+"""
+Export and import of all the app's data as a single zip archive.
+
+    manifest.json         format, version and how many entries of each kind
+    projects.jsonl        one project document per line, in sidebar order
+    project_info.jsonl    one info record per line (see project_store)
+    todos.jsonl           one todo per line, in list order
+    storage/<id>/<name>   the note files of each project
+
+Documents are read from the database and written to the archive one at a
+time, and note files are copied in chunks, so memory use does not grow with
+the amount of data. Both directions run on the storage thread (they need the
+database) and report progress through ArchiveJob's signals.
+
+Importing merges by default: projects and todos already in the database (same
+id) get the archived fields, new ones are added after the existing ones,
+info keys are set one by one and note files are written over. With
+replace=True the projects, info, todos and note folders are deleted first.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+from PySide6.QtCore import QObject, Signal
+
+from project_store import INFO_COLLECTION, as_object_id, set_info_value
+from rank import RANK_FIELD, last_rank, rank_between
+
+FORMAT = "gnu-mau-archive"
+VERSION = 1
+MANIFEST = "manifest.json"
+COLLECTIONS = ("projects", INFO_COLLECTION, "todos")
+STORAGE_PREFIX = "storage/"
+PROGRESS_EVERY = 200
+
+
+class ArchiveError(Exception):
+    pass
+
+
+def storage_files(storage_dir):
+    """
+    (archive name, path) of every note file under storage/. Only the project
+    folders are walked: files at the top (the note index) are not notes.
+    """
+    if not os.path.isdir(storage_dir):
+        return
+    for root, _, files in os.walk(storage_dir):
+        if os.path.samefile(root, storage_dir):
+            continue
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, storage_dir).replace(os.sep, "/")
+            yield STORAGE_PREFIX + relative, path
+
+
+def _json_line(document):
+    document = dict(document)
+    document["_id"] = str(document["_id"])
+    return (json.dumps(document, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _sorted_find(collection, name):
+    if name == "projects":
+        return collection.find({}, sort=[(RANK_FIELD, 1)])
+    if name == "todos":
+        return collection.find({}, sort=[("project_id", 1), (RANK_FIELD, 1)])
+    return collection.find({})
+
+
+def export_archive(db, storage_dir, path, progress=None):
+    """Write everything to the zip at `path`. Returns the manifest counts."""
+    files = list(storage_files(storage_dir))
+    counts = {name: db[name].count_documents({}) for name in COLLECTIONS}
+    total = sum(counts.values()) + len(files)
+    done = 0
+
+    def step(force=False):
+        if progress and (force or done % PROGRESS_EVERY == 0):
+            progress(done, total)
+
+    # Written next to the target and moved over it at the end, like atomic_write_text
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".export-", suffix=".zip", dir=directory)
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+            for name in COLLECTIONS:
+                with archive.open(f"{name}.jsonl", "w", force_zip64=True) as member:
+                    for document in _sorted_find(db[name], name):
+                        member.write(_json_line(document))
+                        done += 1
+                        step()
+            for archive_name, file_path in files:
+                with open(file_path, "rb") as source, archive.open(archive_name, "w", force_zip64=True) as member:
+                    shutil.copyfileobj(source, member, 1024 * 1024)
+                done += 1
+                step()
+            counts["notes"] = len(files)
+            archive.writestr(MANIFEST, json.dumps({
+                "format": FORMAT, "version": VERSION, "created_at": time.time(), "counts": counts,
+            }, indent=4))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    step(force=True)
+    return counts
+
+
+def read_manifest(archive):
+    try:
+        manifest = json.loads(archive.read(MANIFEST))
+    except KeyError:
+        raise ArchiveError("El archivo no es una exportación de GNU Mau (falta manifest.json)")
+    if manifest.get("format") != FORMAT or manifest.get("version", 0) > VERSION:
+        raise ArchiveError(f"Formato de exportación no soportado: {manifest.get('format')} "
+                           f"v{manifest.get('version')}")
+    return manifest
+
+
+def _read_lines(archive, name):
+    if name not in archive.namelist():
+        return
+    with archive.open(name) as member:
+        for line in member:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _storage_target(storage_dir, archive_name):
+    """Where an archived note goes, or None for names outside a project folder of storage/."""
+    relative = archive_name[len(STORAGE_PREFIX):]
+    target = os.path.normpath(os.path.join(storage_dir, relative))
+    root = os.path.normpath(storage_dir)
+    if (not relative or os.path.isabs(relative) or not target.startswith(root + os.sep)
+            or os.path.dirname(target) == root):
+        return None
+    return target
+
+
+def _upsert(collection, document, new_rank=None):
+    """
+    $set the archived fields on the document with the same id, or insert it
+    keeping that id. new_rank(document) gives the rank of an inserted one; a
+    document already there keeps its place. Returns True if it was inserted.
+    """
+    doc_id = as_object_id(document.pop("_id"))
+    fields = {key: value for key, value in document.items() if key != RANK_FIELD}
+    if fields and collection.update_one({"_id": doc_id}, {"$set": fields}).matched_count:
+        return False
+    if not fields and collection.count_documents({"_id": doc_id}):
+        return False
+    if new_rank is not None:
+        document[RANK_FIELD] = new_rank(document)
+    document["_id"] = doc_id
+    collection.insert_one(document)
+    return True
+
+
+def import_archive(db, storage_dir, path, replace=False, progress=None):
+    """Read the zip at `path` into the database and storage/. Returns what was added or updated."""
+    with zipfile.ZipFile(path) as archive:
+        manifest = read_manifest(archive)
+        notes = [name for name in archive.namelist()
+                 if name.startswith(STORAGE_PREFIX) and not name.endswith("/")]
+        total = sum(manifest.get("counts", {}).get(name, 0) for name in COLLECTIONS) + len(notes)
+        done = 0
+        summary = {"added": 0, "updated": 0, "notes": 0, "skipped": 0}
+
+        def step(force=False):
+            if progress and (force or done % PROGRESS_EVERY == 0):
+                progress(done, total)
+
+        if replace:
+            for name in COLLECTIONS:
+                db[name].delete_many({})
+            for project_dir in os.listdir(storage_dir) if os.path.isdir(storage_dir) else ():
+                if os.path.isdir(os.path.join(storage_dir, project_dir)):
+                    shutil.rmtree(os.path.join(storage_dir, project_dir))
+
+        # Imported projects and todos go after the ones already there, in archive order
+        ranks = {}
+
+        def rank_after(key, collection, filter):
+            if key not in ranks:
+                ranks[key] = last_rank(collection, filter)
+            ranks[key] = rank_between(ranks[key], None)
+            return ranks[key]
+
+        for project in _read_lines(archive, "projects.jsonl"):
+            inserted = _upsert(db.projects, project, lambda _: rank_after("projects", db.projects, None))
+            summary["added" if inserted else "updated"] += 1
+            done += 1
+            step()
+        for record in _read_lines(archive, f"{INFO_COLLECTION}.jsonl"):
+            inserted = set_info_value(db, record["project_id"], record["key"], record.get("value", ""))
+            summary["added" if inserted else "updated"] += 1
+            done += 1
+            step()
+        for todo in _read_lines(archive, "todos.jsonl"):
+            project_id = todo.get("project_id", "")
+            inserted = _upsert(db.todos, todo,
+                               lambda _: rank_after(("todos", project_id), db.todos, {"project_id": project_id}))
+            summary["added" if inserted else "updated"] += 1
+            done += 1
+            step()
+
+        for archive_name in notes:
+            target = _storage_target(storage_dir, archive_name)
+            if target is None:
+                summary["skipped"] += 1
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                # Same temp-and-replace as atomic_write_text, so a note is never half written
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=".import-")
+                try:
+                    with os.fdopen(fd, "wb") as out, archive.open(archive_name) as member:
+                        shutil.copyfileobj(member, out, 1024 * 1024)
+                    os.replace(tmp_path, target)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+                summary["notes"] += 1
+            done += 1
+            step()
+    step(force=True)
+    return summary
+
+
+class ArchiveJob(QObject):
+    """
+    Runs export_archive/import_archive on the storage thread.
+    progress(done, total) arrives while it works; finished(summary) or
+    failed(message) once it is over.
+    """
+
+    progress = Signal(int, int)
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, storage, storage_dir, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self.storage_dir = storage_dir
+        self.running = False
+
+    def export_to(self, path):
+        self._run(lambda db: export_archive(db, self.storage_dir, path, self.progress.emit))
+
+    def import_from(self, path, replace=False):
+        self._run(lambda db: import_archive(db, self.storage_dir, path, replace, self.progress.emit))
+
+    def _run(self, operation):
+        if self.running:
+            return
+        self.running = True
+        self.storage.submit(operation, callback=self._on_finished, on_error=self._on_failed)
+
+    def _on_finished(self, summary):
+        self.running = False
+        self.finished.emit(summary)
+
+    def _on_failed(self, message):
+        self.running = False
+        self.failed.emit(message)
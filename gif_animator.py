@@ -0,0 +1,114 @@
+import os
+
+from PySide6.QtCore import QObject, QEvent, QPoint, Qt
+from PySide6.QtGui import QIcon, QMovie
+
+from utils import get_resource_path
+
+
+class GifAnimator(QObject):
+    """
+    Drives animated project icons for a list view.
+
+    There is one QMovie per unique gif path, shared by every row that uses it.
+    A movie only runs while at least one of its rows is inside the viewport and
+    the window is visible; its frames are pushed to the model through
+    dataChanged(DecorationRole) from QMovie.frameChanged, so nothing polls.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.view = None
+        self.active = True
+        self._movies = {}
+        self._icons = {}
+        self._visible_rows = {}
+
+    def attach(self, view):
+        self.view = view
+        model = view.model()
+        view.verticalScrollBar().valueChanged.connect(self.refresh_visible)
+        view.viewport().installEventFilter(self)
+        model.rowsInserted.connect(self.refresh_visible)
+        model.rowsRemoved.connect(self.refresh_visible)
+        model.rowsMoved.connect(self.refresh_visible)
+        model.modelReset.connect(self.refresh_visible)
+        model.dataChanged.connect(self._on_data_changed)
+
+    def icon(self, icon_path):
+        """Current frame of the gif as an icon; the movie is created on first use."""
+        movie = self._movie_for(icon_path)
+        if movie is None:
+            return QIcon()
+        icon = self._icons.get(icon_path)
+        if icon is None:
+            icon = QIcon(movie.currentPixmap())
+            self._icons[icon_path] = icon
+        return icon
+
+    def set_active(self, active):
+        if active == self.active:
+            return
+        self.active = active
+        self.refresh_visible()
+
+    def refresh_visible(self):
+        """Work out which gif rows are on screen and run only their movies."""
+        self._visible_rows = {}
+        if self.view is not None and self.active:
+            model = self.view.model()
+            viewport = self.view.viewport()
+            first = self.view.indexAt(QPoint(0, 0)).row()
+            last = self.view.indexAt(QPoint(0, viewport.height() - 1)).row()
+            if first < 0:
+                first = 0
+            if last < 0:
+                last = model.rowCount() - 1
+            for row in range(first, last + 1):
+                icon_path = model.index(row, 0).data(Qt.UserRole + 1)
+                if icon_path and icon_path.endswith('.gif'):
+                    self._visible_rows.setdefault(icon_path, []).append(row)
+
+        for icon_path in self._visible_rows:
+            self._movie_for(icon_path)
+        for icon_path, movie in self._movies.items():
+            running = icon_path in self._visible_rows
+            if running and movie.state() == QMovie.NotRunning:
+                movie.start()
+            elif movie.state() != QMovie.NotRunning:
+                movie.setPaused(not running)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Resize, QEvent.Show):
+            self.refresh_visible()
+        return False
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        # Frame updates only touch the decoration; anything else may be a new icon path.
+        if list(roles) != [Qt.DecorationRole]:
+            self.refresh_visible()
+
+    def _movie_for(self, icon_path):
+        movie = self._movies.get(icon_path)
+        if movie is not None:
+            return movie
+        resolved_path = get_resource_path(icon_path)
+        if not os.path.exists(resolved_path):
+            return None
+        movie = QMovie(resolved_path, parent=self)
+        if not movie.isValid():
+            return None
+        movie.setCacheMode(QMovie.CacheAll)
+        movie.jumpToFrame(0)
+        movie.frameChanged.connect(lambda _frame, path=icon_path: self._on_frame_changed(path))
+        self._movies[icon_path] = movie
+        return movie
+
+    def _on_frame_changed(self, icon_path):
+        self._icons.pop(icon_path, None)
+        if self.view is None:
+            return
+        model = self.view.model()
+        for row in self._visible_rows.get(icon_path, ()):
+            index = model.index(row, 0)
+            model.dataChanged.emit(index, index, [Qt.DecorationRole])
@@ -0,0 +1,263 @@
+from bisect import bisect_left, insort
+import os
+import re
+
+from PySide6.QtCore import QObject, Signal
+
+from project_store import INFO_COLLECTION
+from storage_worker import find_summaries
+
+# Underscores split words too, so "password" finds "db_password"
+TOKEN_RE = re.compile(r"[^\W_]+")
+NOTE_EXTENSIONS = (".md", ".txt")
+TITLE_WEIGHT = 3
+BODY_WEIGHT = 1
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def project_text(description, info):
+    parts = [description or ""]
+    for key, value in (info or {}).items():
+        parts.append(f"{key}: {value}")
+    return "\n".join(parts)
+
+
+def note_files(storage_dir):
+    """(project_id, path) of every note under storage/<project_id>/."""
+    if not os.path.isdir(storage_dir):
+        return
+    for project_id in os.listdir(storage_dir):
+        notes_dir = os.path.join(storage_dir, project_id)
+        if not os.path.isdir(notes_dir):
+            continue
+        for name in os.listdir(notes_dir):
+            if name.endswith(NOTE_EXTENSIONS):
+                yield project_id, os.path.join(notes_dir, name)
+
+
+def read_note(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error al indexar nota {path}: {e}")
+        return ""
+
+
+class SearchDocument:
+    __slots__ = ("key", "kind", "project_id", "title", "text", "weights")
+
+    def __init__(self, key, kind, project_id, title, text):
+        self.key = key
+        self.kind = kind
+        self.project_id = str(project_id)
+        self.title = title
+        self.text = text
+        self.weights = {}
+        for token in tokenize(text):
+            self.weights[token] = BODY_WEIGHT
+        for token in tokenize(title):
+            self.weights[token] = TITLE_WEIGHT
+
+
+class SearchIndex:
+    """
+    Inverted index over projects, todos and notes.
+
+    Documents are keyed by (kind, id): ("project", project_id), ("todo", todo_id)
+    and ("note", path). Every token maps to the documents holding it, and the
+    vocabulary is kept sorted so the last word of a query can match as a prefix
+    while it is still being typed.
+    """
+
+    def __init__(self):
+        self.documents = {}
+        self._postings = {}
+        self._vocabulary = []
+
+    def update(self, key, kind, project_id, title, text):
+        self.remove(key)
+        document = SearchDocument(key, kind, project_id, title, text)
+        self.documents[key] = document
+        for token, weight in document.weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                insort(self._vocabulary, token)
+            postings[key] = weight
+
+    def remove(self, key):
+        document = self.documents.pop(key, None)
+        if document is None:
+            return
+        for token in document.weights:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(key, None)
+            if not postings:
+                del self._postings[token]
+                position = bisect_left(self._vocabulary, token)
+                if position < len(self._vocabulary) and self._vocabulary[position] == token:
+                    del self._vocabulary[position]
+
+    def _prefix_tokens(self, prefix):
+        position = bisect_left(self._vocabulary, prefix)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(prefix):
+            yield self._vocabulary[position]
+            position += 1
+
+    def _matches(self, word, as_prefix):
+        """{document key: score} for one query word."""
+        scores = dict(self._postings.get(word, {}))
+        for key in scores:
+            scores[key] += 0.5  # whole word
+        if as_prefix and len(word) > 1:
+            for token in self._prefix_tokens(word):
+                if token == word:
+                    continue
+                for key, weight in self._postings[token].items():
+                    if weight > scores.get(key, 0):
+                        scores[key] = weight
+        return scores
+
+    def search(self, query, limit=50):
+        words = tokenize(query)
+        if not words:
+            return []
+        totals = None
+        for position, word in enumerate(words):
+            scores = self._matches(word, as_prefix=position == len(words) - 1)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {key: totals[key] + score for key, score in scores.items() if key in totals}
+            if not totals:
+                return []
+        ranked = sorted(totals, key=lambda key: (-totals[key], self.documents[key].title.lower()))
+        return [self.documents[key] for key in ranked[:limit]]
+
+    def project_title(self, project_id):
+        document = self.documents.get(("project", str(project_id)))
+        return document.title if document else ""
+
+
+def snippet(text, query, width=80):
+    """One line of `text` around the first word of `query` found in it."""
+    lowered = text.lower()
+    start = -1
+    for word in tokenize(query):
+        start = lowered.find(word)
+        if start >= 0:
+            break
+    if start < 0:
+        return text[:width].replace("\n", " ").strip()
+    begin = max(0, start - width // 3)
+    line = text[begin:begin + width].replace("\n", " ").strip()
+    return ("…" if begin > 0 else "") + line
+
+
+def build_index(db, storage_dir):
+    """Read everything there is to search. Runs on the storage thread."""
+    index = SearchIndex()
+    info = {}
+    for record in db[INFO_COLLECTION].find({}, sort=[("order", 1)]):
+        info.setdefault(record["project_id"], {})[record["key"]] = record.get("value", "")
+    for project in find_summaries(db, "projects"):
+        project_id = str(project["_id"])
+        index.update(("project", project_id), "project", project_id, project.get("name", ""),
+                     project_text(project.get("description", ""), info.get(project_id)))
+    for todo in db.todos.find({}):
+        todo_id = str(todo["_id"])
+        index.update(("todo", todo_id), "todo", todo.get("project_id", ""), todo.get("title", ""),
+                     todo.get("content", ""))
+    for project_id, path in note_files(storage_dir):
+        index.update(("note", path), "note", project_id, os.path.basename(path), read_note(path))
+    return index
+
+
+class GlobalSearch(QObject):
+    """
+    Owns the search index of the main window.
+
+    The index is built once on the storage thread the first time it is needed;
+    after that the tabs keep it current by reporting every save. Changes that
+    arrive while the index is being built are replayed on top of it.
+    """
+
+    ready = Signal()
+
+    def __init__(self, storage, storage_dir, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self.storage_dir = storage_dir
+        self.index = None
+        self._building = False
+        self._rebuild = False
+        self._backlog = []
+
+    def is_ready(self):
+        return self.index is not None
+
+    def ensure_index(self):
+        if self.index is not None or self._building:
+            return
+        self._building = True
+        storage_dir = self.storage_dir
+        self.storage.submit(lambda db: build_index(db, storage_dir), callback=self._on_built)
+
+    def invalidate(self):
+        """Drop the index after a bulk change (an import); it is built again if it was in use."""
+        in_use = self.index is not None or self._building
+        self.index = None
+        self._backlog = []
+        if self._building:
+            self._rebuild = True
+        elif in_use:
+            self.ensure_index()
+
+    def _on_built(self, index):
+        self._building = False
+        if self._rebuild:
+            self._rebuild = False
+            self.ensure_index()
+            return
+        for method, args in self._backlog:
+            getattr(index, method)(*args)
+        self._backlog = []
+        self.index = index
+        print(f"Búsqueda global: {len(index.documents)} documentos indexados.")
+        self.ready.emit()
+
+    def _apply(self, method, *args):
+        if self.index is not None:
+            getattr(self.index, method)(*args)
+        elif self._building:
+            self._backlog.append((method, args))
+        # Before the first build there is nothing to keep current
+
+    def search(self, query, limit=50):
+        if self.index is None:
+            return []
+        return self.index.search(query, limit)
+
+    def update_project(self, project_id, name, description, info):
+        project_id = str(project_id)
+        self._apply("update", ("project", project_id), "project", project_id, name,
+                    project_text(description, info))
+
+    def update_todo(self, todo_id, project_id, title, content):
+        todo_id = str(todo_id)
+        self._apply("update", ("todo", todo_id), "todo", project_id, title, content)
+
+    def remove_todo(self, todo_id):
+        self._apply("remove", ("todo", str(todo_id)))
+
+    def update_note(self, path, project_id, text):
+        self._apply("update", ("note", path), "note", project_id, os.path.basename(path), text)
+
+    def remove_note(self, path):
+        self._apply("remove", ("note", path))
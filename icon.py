@@ -1,7076 +1,1522 @@
-icon = bytes([
-0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52, 
-0x00, 0x00, 0x01, 0x5C, 0x00, 0x00, 0x01, 0x3A, 0x08, 0x06, 0x00, 0x00, 0x00, 0x5A, 0xBB, 0xEA, 
-0x6B, 0x00, 0x00, 0x00, 0x01, 0x73, 0x52, 0x47, 0x42, 0x00, 0xAE, 0xCE, 0x1C, 0xE9, 0x00, 0x00, 
-0x00, 0x04, 0x67, 0x41, 0x4D, 0x41, 0x00, 0x00, 0xB1, 0x8F, 0x0B, 0xFC, 0x61, 0x05, 0x00, 0x00, 
-0x00, 0x09, 0x70, 0x48, 0x59, 0x73, 0x00, 0x00, 0x12, 0x74, 0x00, 0x00, 0x12, 0x74, 0x01, 0xDE, 
-0x66, 0x1F, 0x78, 0x00, 0x00, 0x01, 0x87, 0x69, 0x54, 0x58, 0x74, 0x58, 0x4D, 0x4C, 0x3A, 0x63, 
-0x6F, 0x6D, 0x2E, 0x61, 0x64, 0x6F, 0x62, 0x65, 0x2E, 0x78, 0x6D, 0x70, 0x00, 0x00, 0x00, 0x00, 
-0x00, 0x3C, 0x3F, 0x78, 0x70, 0x61, 0x63, 0x6B, 0x65, 0x74, 0x20, 0x62, 0x65, 0x67, 0x69, 0x6E, 
-0x3D, 0x27, 0xEF, 0xBB, 0xBF, 0x27, 0x20, 0x69, 0x64, 0x3D, 0x27, 0x57, 0x35, 0x4D, 0x30, 0x4D, 
-0x70, 0x43, 0x65, 0x68, 0x69, 0x48, 0x7A, 0x72, 0x65, 0x53, 0x7A, 0x4E, 0x54, 0x63, 0x7A, 0x6B, 
-0x63, 0x39, 0x64, 0x27, 0x3F, 0x3E, 0x0D, 0x0A, 0x3C, 0x78, 0x3A, 0x78, 0x6D, 0x70, 0x6D, 0x65, 
-0x74, 0x61, 0x20, 0x78, 0x6D, 0x6C, 0x6E, 0x73, 0x3A, 0x78, 0x3D, 0x22, 0x61, 0x64, 0x6F, 0x62, 
-0x65, 0x3A, 0x6E, 0x73, 0x3A, 0x6D, 0x65, 0x74, 0x61, 0x2F, 0x22, 0x3E, 0x3C, 0x72, 0x64, 0x66, 
-0x3A, 0x52, 0x44, 0x46, 0x20, 0x78, 0x6D, 0x6C, 0x6E, 0x73, 0x3A, 0x72, 0x64, 0x66, 0x3D, 0x22, 
-0x68, 0x74, 0x74, 0x70, 0x3A, 0x2F, 0x2F, 0x77, 0x77, 0x77, 0x2E, 0x77, 0x33, 0x2E, 0x6F, 0x72, 
-0x67, 0x2F, 0x31, 0x39, 0x39, 0x39, 0x2F, 0x30, 0x32, 0x2F, 0x32, 0x32, 0x2D, 0x72, 0x64, 0x66, 
-0x2D, 0x73, 0x79, 0x6E, 0x74, 0x61, 0x78, 0x2D, 0x6E, 0x73, 0x23, 0x22, 0x3E, 0x3C, 0x72, 0x64, 
-0x66, 0x3A, 0x44, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x6F, 0x6E, 0x20, 0x72, 0x64, 
-0x66, 0x3A, 0x61, 0x62, 0x6F, 0x75, 0x74, 0x3D, 0x22, 0x75, 0x75, 0x69, 0x64, 0x3A, 0x66, 0x61, 
-0x66, 0x35, 0x62, 0x64, 0x64, 0x35, 0x2D, 0x62, 0x61, 0x33, 0x64, 0x2D, 0x31, 0x31, 0x64, 0x61, 
-0x2D, 0x61, 0x64, 0x33, 0x31, 0x2D, 0x64, 0x33, 0x33, 0x64, 0x37, 0x35, 0x31, 0x38, 0x32, 0x66, 
-0x31, 0x62, 0x22, 0x20, 0x78, 0x6D, 0x6C, 0x6E, 0x73, 0x3A, 0x74, 0x69, 0x66, 0x66, 0x3D, 0x22, 
-0x68, 0x74, 0x74, 0x70, 0x3A, 0x2F, 0x2F, 0x6E, 0x73, 0x2E, 0x61, 0x64, 0x6F, 0x62, 0x65, 0x2E, 
-0x63, 0x6F, 0x6D, 0x2F, 0x74, 0x69, 0x66, 0x66, 0x2F, 0x31, 0x2E, 0x30, 0x2F, 0x22, 0x3E, 0x3C, 
-0x74, 0x69, 0x66, 0x66, 0x3A, 0x4F, 0x72, 0x69, 0x65, 0x6E, 0x74, 0x61, 0x74, 0x69, 0x6F, 0x6E, 
-0x3E, 0x31, 0x3C, 0x2F, 0x74, 0x69, 0x66, 0x66, 0x3A, 0x4F, 0x72, 0x69, 0x65, 0x6E, 0x74, 0x61, 
-0x74, 0x69, 0x6F, 0x6E, 0x3E, 0x3C, 0x2F, 0x72, 0x64, 0x66, 0x3A, 0x44, 0x65, 0x73, 0x63, 0x72, 
-0x69, 0x70, 0x74, 0x69, 0x6F, 0x6E, 0x3E, 0x3C, 0x2F, 0x72, 0x64, 0x66, 0x3A, 0x52, 0x44, 0x46, 
-0x3E, 0x3C, 0x2F, 0x78, 0x3A, 0x78, 0x6D, 0x70, 0x6D, 0x65, 0x74, 0x61, 0x3E, 0x0D, 0x0A, 0x3C, 
-0x3F, 0x78, 0x70, 0x61, 0x63, 0x6B, 0x65, 0x74, 0x20, 0x65, 0x6E, 0x64, 0x3D, 0x27, 0x77, 0x27, 
-0x3F, 0x3E, 0x2C, 0x94, 0x98, 0x0B, 0x00, 0x00, 0xFE, 0x12, 0x49, 0x44, 0x41, 0x54, 0x78, 0x5E, 
-0xEC, 0xBD, 0x77, 0x98, 0x65, 0x47, 0x79, 0xEE, 0xFB, 0xAB, 0xB0, 0xD6, 0xDA, 0xA1, 0xD3, 0xF4, 
-0x44, 0x4D, 0xD0, 0x28, 0xE7, 0x2C, 0x24, 0x21, 0xA2, 0x44, 0x4E, 0x36, 0x59, 0x60, 0xB2, 0x89, 
-0xC6, 0x36, 0xD8, 0x18, 0x67, 0x1F, 0x1F, 0x81, 0x7D, 0x8D, 0xED, 0x6B, 0x1F, 0xC7, 0xEB, 0x00, 
-0xE7, 0xD8, 0x1C, 0x8C, 0x03, 0x16, 0xB6, 0x31, 0x26, 0x98, 0x2C, 0x44, 0x12, 0xA0, 0xAC, 0x19, 
-0x69, 0x24, 0x4D, 0x8E, 0x3D, 0xD3, 0xB9, 0x77, 0x5C, 0xA1, 0xAA, 0xBE, 0xFB, 0x47, 0xED, 0x9E, 
-0x19, 0x8D, 0x24, 0x40, 0x80, 0xD1, 0x48, 0xEE, 0xB7, 0x9F, 0x7A, 0x76, 0xEF, 0xB4, 0xD6, 0x5E, 
-0xB5, 0xAA, 0xDE, 0xFA, 0xEA, 0x8B, 0xB0, 0x84, 0x25, 0x2C, 0x61, 0x09, 0x4B, 0x58, 0xC2, 0x12, 
-0x96, 0xB0, 0x84, 0x25, 0x2C, 0x61, 0x09, 0x4B, 0x58, 0xC2, 0x12, 0x96, 0xB0, 0x84, 0x25, 0x2C, 
-0x61, 0x09, 0x4B, 0x58, 0xC2, 0x12, 0x96, 0xB0, 0x84, 0x25, 0x2C, 0x61, 0x09, 0x4B, 0x58, 0xC2, 
-0x12, 0x96, 0xB0, 0x84, 0x25, 0x2C, 0x61, 0x09, 0x4B, 0x58, 0xC2, 0x12, 0x96, 0xB0, 0x84, 0x25, 
-0x2C, 0x61, 0x09, 0x4B, 0x58, 0xC2, 0x12, 0x96, 0xB0, 0x84, 0x25, 0x2C, 0x61, 0x09, 0x4B, 0x58, 
-0xC2, 0x12, 0x96, 0xB0, 0x84, 0x25, 0x2C, 0x61, 0x09, 0x4B, 0x58, 0xC2, 0x12, 0x96, 0xB0, 0x84, 
-0x25, 0x2C, 0x61, 0x09, 0x4B, 0x58, 0xC2, 0xC3, 0x84, 0x3A, 0xF6, 0x85, 0xC7, 0x3A, 0xDE, 0xFF, 
-0xFE, 0xF7, 0x27, 0x07, 0x0E, 0xE4, 0xF5, 0x89, 0x89, 0xD9, 0x54, 0x0F, 0xA3, 0x9B, 0x0C, 0x91, 
-0xE7, 0x95, 0xD7, 0xBA, 0xA8, 0xC6, 0xC7, 0xCF, 0xCD, 0xDF, 0xFB, 0xDE, 0x6B, 0xCA, 0x63, 0xBF, 
-0xB3, 0x84, 0x25, 0x2C, 0xE1, 0xE1, 0xE3, 0x4F, 0xFF, 0xF4, 0x4F, 0xB3, 0x1D, 0xB7, 0xCE, 0xD6, 
-0x65, 0x34, 0xCD, 0xBC, 0x2F, 0x4D, 0x51, 0xF4, 0x75, 0x59, 0x56, 0x32, 0x34, 0x34, 0xE2, 0xB3, 
-0x8C, 0x72, 0xFD, 0xFA, 0x91, 0xFE, 0xBB, 0xDF, 0xFD, 0xEE, 0xFE, 0xB1, 0xDF, 0x7B, 0x2C, 0xE3, 
-0x31, 0x4F, 0xB8, 0xD7, 0x5D, 0x27, 0xE6, 0xAB, 0x5F, 0x7D, 0xDF, 0xF8, 0xA7, 0x3F, 0xFD, 0xD9, 
-0xF3, 0xB4, 0xD6, 0x67, 0x1C, 0x3C, 0x30, 0x79, 0x61, 0xBF, 0x5F, 0xAC, 0x49, 0xB2, 0x6C, 0x59, 
-0x59, 0x94, 0x89, 0x0F, 0x55, 0x50, 0x5A, 0x97, 0x69, 0x92, 0xB6, 0x6D, 0x6A, 0x0F, 0x9D, 0x74, 
-0xD2, 0x89, 0x5B, 0x7C, 0xE5, 0xF6, 0x34, 0x9B, 0xCD, 0xFD, 0x3F, 0xF5, 0x53, 0x3F, 0xB9, 0xFB, 
-0xB4, 0xD3, 0x46, 0x16, 0xAE, 0xBE, 0xFA, 0xEA, 0xFC, 0xD8, 0xE3, 0x2E, 0x61, 0x09, 0x4B, 0x38, 
-0x82, 0xEB, 0xAE, 0xBB, 0xCE, 0xDC, 0x7A, 0xEB, 0xA1, 0xB1, 0x2F, 0x7E, 0xF1, 0xF3, 0x27, 0xF7, 
-0x8A, 0x6A, 0x63, 0xB7, 0xD5, 0x5B, 0xBB, 0x30, 0x37, 0x7F, 0x96, 0x4D, 0x92, 0xB5, 0x0B, 0xAD, 
-0xD6, 0xB2, 0xB2, 0xEC, 0xD4, 0xB2, 0xAC, 0x69, 0x9D, 0x2B, 0x45, 0xC4, 0x17, 0x5A, 0xAB, 0x79, 
-0x60, 0x72, 0xE3, 0xC6, 0x0D, 0xB7, 0x79, 0xFC, 0xEE, 0xA7, 0x3E, 0xE9, 0xAA, 0x3B, 0x9F, 0xFF, 
-0xFC, 0xD7, 0x1E, 0xB8, 0xE6, 0x9A, 0xF3, 0x1E, 0xD3, 0x02, 0xCF, 0x63, 0x9A, 0x70, 0xAF, 0xBF, 
-0x7E, 0x67, 0xED, 0x17, 0x7E, 0xE1, 0x1D, 0x4F, 0xDC, 0xB9, 0x7D, 0xCF, 0x2B, 0x8A, 0xB2, 0x7A, 
-0x5A, 0x3F, 0xCF, 0x57, 0xA7, 0xB6, 0x91, 0x55, 0x2E, 0x18, 0x21, 0x28, 0xB0, 0xCA, 0x68, 0x23, 
-0xC6, 0x18, 0xCA, 0xAA, 0x2F, 0x50, 0xBA, 0xC4, 0x36, 0xCA, 0xCA, 0x55, 0xFD, 0x5A, 0x56, 0x3B, 
-0x58, 0xB9, 0xE2, 0x9E, 0x7A, 0xBD, 0x76, 0xEB, 0xD9, 0x67, 0x9F, 0xFE, 0x99, 0xAB, 0xAE, 0x7A, 
-0xDC, 0xF6, 0x3F, 0xF8, 0x83, 0x5F, 0x69, 0x1F, 0x7B, 0x8E, 0x25, 0x2C, 0xE1, 0xBF, 0x33, 0xDE, 
-0xFF, 0xFE, 0x9B, 0x93, 0x3B, 0xEF, 0xFC, 0xE2, 0xCA, 0xBB, 0xEE, 0xBA, 0xE7, 0xF4, 0xD9, 0xD9, 
-0x85, 0x97, 0xEF, 0xD8, 0xB1, 0xEB, 0xF1, 0xBD, 0x6E, 0x7F, 0x63, 0x62, 0xD2, 0x5A, 0xE1, 0xFA, 
-0x69, 0x2D, 0xA9, 0x1B, 0x11, 0x74, 0xE5, 0x2A, 0xA5, 0x35, 0xB8, 0x50, 0x61, 0x94, 0x92, 0x34, 
-0xB3, 0x52, 0x14, 0x79, 0x50, 0x8A, 0xD2, 0x87, 0x62, 0x7E, 0xB8, 0x39, 0x76, 0x53, 0xB3, 0xD1, 
-0xFC, 0xB7, 0x67, 0x3F, 0xEF, 0xB9, 0xFF, 0xF1, 0xA1, 0x0F, 0xBD, 0x77, 0xFE, 0xD8, 0xF3, 0x3C, 
-0x56, 0xF0, 0x98, 0x24, 0x5C, 0x11, 0xD1, 0x2F, 0x7C, 0xEE, 0x1B, 0xCF, 0xBA, 0x7D, 0xF3, 0xF6, 
-0xD7, 0x1E, 0x3C, 0x38, 0xFD, 0x8A, 0x10, 0xC2, 0x06, 0x1F, 0x94, 0x49, 0x4C, 0x5D, 0x39, 0x2F, 
-0x18, 0x63, 0xD1, 0xCA, 0x22, 0xA2, 0x70, 0xDE, 0xA1, 0x4C, 0xEC, 0x06, 0x63, 0x14, 0x22, 0x42, 
-0x08, 0x01, 0x11, 0x25, 0x22, 0x42, 0x9A, 0xE9, 0xC2, 0x55, 0xF9, 0x7E, 0x6B, 0xC3, 0x1D, 0x6B, 
-0xD6, 0x8E, 0x7F, 0x21, 0x4B, 0xD4, 0x9D, 0xBF, 0xF6, 0x6B, 0x3F, 0x77, 0x57, 0xB3, 0x59, 0xB5, 
-0xAF, 0xB9, 0xE6, 0x1A, 0x7F, 0xEC, 0xB9, 0x97, 0xB0, 0x84, 0xC7, 0x3A, 0xFE, 0xF9, 0x9F, 0xBF, 
-0x51, 0xFF, 0xF4, 0xA7, 0x3F, 0xB1, 0xF1, 0xCE, 0x3B, 0xEF, 0xBE, 0x6C, 0xE7, 0xCE, 0xBD, 0x17, 
-0x79, 0xAF, 0x9F, 0x41, 0x30, 0x27, 0xB4, 0xBB, 0xBD, 0x71, 0xD0, 0xBA, 0xD1, 0x18, 0x55, 0xAE, 
-0x38, 0x22, 0xA8, 0x3A, 0x5F, 0xA2, 0xB5, 0x26, 0x4D, 0x13, 0x42, 0x70, 0x94, 0x55, 0x4E, 0x90, 
-0x9C, 0x34, 0x69, 0x20, 0xE2, 0x09, 0x21, 0x48, 0xA3, 0x59, 0x0B, 0xDD, 0x6E, 0x67, 0x36, 0xCB, 
-0x6A, 0x9F, 0x3B, 0xE3, 0x8C, 0x13, 0xFF, 0xEE, 0x37, 0x7E, 0xE3, 0xF7, 0xBE, 0xFC, 0x58, 0x94, 
-0x76, 0x1F, 0x73, 0x84, 0x2B, 0x22, 0xEA, 0x75, 0xAF, 0xFC, 0xF9, 0xB3, 0xFE, 0xF3, 0x73, 0xDF, 
-0xFC, 0x95, 0xE9, 0xB9, 0xF6, 0x8B, 0x32, 0x5B, 0x1F, 0x71, 0xCE, 0x29, 0xAD, 0x2C, 0xB5, 0x5A, 
-0x8D, 0x4E, 0xBF, 0x4B, 0x62, 0x53, 0x24, 0x28, 0x44, 0x2B, 0xBC, 0xF7, 0x28, 0xA5, 0x90, 0xE0, 
-0x49, 0x6D, 0x4A, 0xE1, 0x2A, 0x12, 0x9D, 0xE0, 0x45, 0x93, 0xD5, 0x6B, 0xB8, 0xB2, 0x24, 0x88, 
-0x93, 0x10, 0x0A, 0x6F, 0xB4, 0xEB, 0x7A, 0x5F, 0xEE, 0x5E, 0x36, 0xDE, 0xFC, 0xDA, 0xB2, 0xE1, 
-0xFA, 0xE7, 0x9F, 0xF3, 0x82, 0xE7, 0x7D, 0xF5, 0xFF, 0xFB, 0xFF, 0x7E, 0x6D, 0x4E, 0x29, 0x15, 
-0x8E, 0xFD, 0x1D, 0x4B, 0x58, 0xC2, 0x63, 0x0D, 0xD7, 0x5E, 0xFB, 0xC1, 0xDA, 0xDE, 0x43, 0xDB, 
-0x37, 0xDE, 0xFE, 0xED, 0xBB, 0x7E, 0x6C, 0xFF, 0x9E, 0x83, 0xCF, 0x9A, 0x9A, 0x9E, 0xBF, 0xB0, 
-0x96, 0x0D, 0x0D, 0x97, 0x95, 0xD4, 0xB4, 0x24, 0xAA, 0x14, 0xCF, 0xE8, 0xD0, 0x28, 0xED, 0x6E, 
-0x17, 0x54, 0xC0, 0x5A, 0x8D, 0x73, 0x0E, 0x51, 0x40, 0x10, 0x44, 0x4A, 0x34, 0x06, 0xAD, 0x15, 
-0x5A, 0x6B, 0x42, 0x08, 0x38, 0x09, 0x18, 0x6B, 0x91, 0xE0, 0x50, 0x4A, 0x24, 0xB5, 0x26, 0x2F, 
-0x8A, 0xF6, 0x1D, 0x8F, 0xBF, 0xFC, 0xEC, 0xDF, 0xFE, 0x9D, 0xDF, 0xFB, 0xF9, 0xCF, 0x5D, 0x7D, 
-0xF5, 0xD5, 0xEE, 0xD8, 0xDF, 0xF1, 0x68, 0xC6, 0x63, 0x8A, 0x70, 0x45, 0x44, 0x3F, 0xF7, 0xB9, 
-0x6F, 0xBF, 0xF0, 0xDB, 0xDF, 0xDA, 0x74, 0xED, 0xEC, 0x5C, 0xF5, 0x6C, 0x48, 0x6B, 0x35, 0x6B, 
-0x08, 0xBE, 0x44, 0x6B, 0xA8, 0x7C, 0x8E, 0x31, 0x42, 0xC0, 0xA3, 0x94, 0xE0, 0x11, 0x94, 0x32, 
-0x68, 0xAD, 0xD1, 0xDE, 0x20, 0x4E, 0xD0, 0x68, 0xB4, 0x49, 0x28, 0x44, 0x23, 0x4A, 0x61, 0x74, 
-0x02, 0x68, 0xBC, 0xF7, 0x18, 0xA5, 0xD1, 0x38, 0x9C, 0xEF, 0xFB, 0x40, 0x6F, 0xA1, 0x59, 0xB3, 
-0xB7, 0x0C, 0x0D, 0xD9, 0xAF, 0x3C, 0xFE, 0x49, 0x8F, 0xFB, 0xDC, 0x4B, 0x5F, 0xFA, 0xA4, 0x7B, 
-0x5E, 0xF3, 0x9A, 0xD7, 0xB4, 0x95, 0x52, 0x72, 0xEC, 0xEF, 0x5A, 0xC2, 0x12, 0x1E, 0xAD, 0xB8, 
-0xFE, 0xFA, 0xEB, 0xED, 0x97, 0xBF, 0xFC, 0xAD, 0x35, 0x1F, 0xF9, 0x97, 0xCF, 0x5C, 0x31, 0x33, 
-0xDB, 0xBF, 0x7A, 0x61, 0x3E, 0x7F, 0x9A, 0xB8, 0xE4, 0x24, 0x23, 0xF5, 0xBA, 0x38, 0x15, 0xE7, 
-0x06, 0x9E, 0xA1, 0xB4, 0x46, 0xE9, 0x4B, 0x84, 0x80, 0x0B, 0x05, 0xA4, 0x01, 0x2F, 0x0E, 0x09, 
-0x01, 0xB4, 0x02, 0x01, 0x82, 0xC2, 0x04, 0xD0, 0x4A, 0x81, 0x18, 0x2A, 0x81, 0xA4, 0x56, 0xA7, 
-0x12, 0x50, 0x02, 0x46, 0x09, 0x94, 0x25, 0x46, 0x07, 0x5F, 0xF8, 0x85, 0x6D, 0xEB, 0xD6, 0xAC, 
-0xF8, 0x9D, 0x37, 0xBF, 0xED, 0x5D, 0xFF, 0xFC, 0x58, 0x32, 0x64, 0x3F, 0xA6, 0x08, 0xF7, 0x65, 
-0x2F, 0x7B, 0xD7, 0xBA, 0x2F, 0x7C, 0xEE, 0xC6, 0x6B, 0xE7, 0x5B, 0xC5, 0x6B, 0xD2, 0x64, 0x55, 
-0xCD, 0x98, 0x44, 0x15, 0x79, 0x9B, 0x40, 0x97, 0xE1, 0x7A, 0x46, 0x59, 0xCC, 0x53, 0x49, 0x8E, 
-0xA8, 0x0A, 0x9B, 0x68, 0x82, 0x0A, 0xF8, 0x10, 0xC0, 0x83, 0x51, 0x29, 0x35, 0x53, 0x43, 0x89, 
-0xC6, 0x79, 0x08, 0x3A, 0xC1, 0x63, 0x51, 0xCA, 0x12, 0xBC, 0x26, 0x04, 0x85, 0x35, 0x29, 0x4A, 
-0x19, 0xBC, 0xCB, 0xD1, 0x52, 0x92, 0xA6, 0xB8, 0x7E, 0x39, 0x93, 0x2B, 0xDC, 0xBD, 0xEB, 0xD6, 
-0xAD, 0xBC, 0x7E, 0xE3, 0xC9, 0x27, 0xFC, 0xCB, 0xD3, 0x9F, 0xFE, 0xF4, 0x2D, 0xEF, 0x79, 0xCF, 
-0x3B, 0x97, 0x88, 0x77, 0x09, 0x8F, 0x6A, 0x88, 0x88, 0x7E, 0xCF, 0x7B, 0xFE, 0x68, 0xEC, 0xCB, 
-0x5F, 0xFB, 0xF6, 0x13, 0xEE, 0xDD, 0xB2, 0xF3, 0x27, 0x3A, 0x9D, 0xE2, 0x49, 0x9D, 0x56, 0xB1, 
-0x0A, 0x86, 0xB2, 0xC4, 0x36, 0x54, 0xF0, 0x96, 0xCC, 0xA6, 0x68, 0xAD, 0x29, 0x8B, 0x1C, 0x28, 
-0xF1, 0x94, 0x80, 0x03, 0x5D, 0xE2, 0xE9, 0x63, 0x52, 0x8D, 0xB6, 0x0A, 0x09, 0x0E, 0x23, 0x81, 
-0x44, 0x14, 0xA6, 0xF4, 0xB8, 0x50, 0xD2, 0x48, 0x96, 0xD1, 0xAB, 0x1C, 0xDE, 0x64, 0x04, 0x5B, 
-0x27, 0x88, 0x05, 0xB1, 0x58, 0xD1, 0x28, 0x0D, 0x62, 0x0A, 0x9F, 0xF7, 0xA7, 0x6F, 0x7D, 0xCA, 
-0x15, 0x4F, 0xFA, 0x8D, 0x1B, 0xDE, 0xFD, 0xC1, 0x2F, 0xA9, 0x6B, 0xD4, 0x63, 0x42, 0x7D, 0xF7, 
-0x98, 0x21, 0xDC, 0xFF, 0x78, 0xFF, 0x7F, 0x34, 0xDE, 0xFC, 0x9B, 0xBF, 0xFD, 0x3F, 0xE6, 0x66, 
-0xDC, 0x5B, 0x91, 0xC6, 0xF2, 0x2A, 0x58, 0x34, 0x9A, 0x5A, 0x0A, 0xA2, 0x72, 0xAA, 0x6A, 0x9E, 
-0xA1, 0x11, 0xC3, 0x65, 0x97, 0x5F, 0xC0, 0xEA, 0xB5, 0xCB, 0xD8, 0x78, 0xD2, 0x3A, 0xD2, 0x7A, 
-0x02, 0x5A, 0x51, 0x14, 0x05, 0xBD, 0x4E, 0x8F, 0xF9, 0xB9, 0x16, 0x7B, 0x77, 0xED, 0x65, 0xEF, 
-0xDE, 0x03, 0xCC, 0xCF, 0xF6, 0x59, 0x68, 0x17, 0x94, 0x15, 0x18, 0x5B, 0x23, 0x48, 0x42, 0xF0, 
-0x06, 0xD0, 0x68, 0xD1, 0x88, 0xAB, 0xB0, 0x5A, 0xA8, 0x27, 0x96, 0x7E, 0xDE, 0x42, 0xE1, 0xF3, 
-0x5A, 0x9A, 0x1D, 0x48, 0x12, 0xFB, 0xB5, 0xD5, 0xAB, 0x97, 0x7F, 0xE8, 0xE5, 0xAF, 0x7D, 0xC1, 
-0xCD, 0xEF, 0x7D, 0xEF, 0xCF, 0xB5, 0x8E, 0xFD, 0x9D, 0x4B, 0x58, 0xC2, 0xF1, 0x8C, 0xEB, 0xAE, 
-0xBB, 0xCE, 0xDC, 0x72, 0xCB, 0x8E, 0x75, 0x1F, 0xF9, 0xC8, 0x27, 0x9E, 0x71, 0xF0, 0xE0, 0xEC, 
-0x0B, 0x8A, 0xA2, 0x7A, 0xBC, 0xC2, 0xAC, 0x4A, 0x55, 0xC3, 0x68, 0x95, 0xE0, 0x82, 0x26, 0x60, 
-0x30, 0x2A, 0x05, 0xA3, 0x71, 0xA1, 0x42, 0x69, 0x07, 0xAA, 0x42, 0xEB, 0x0A, 0x6D, 0x3C, 0x8D, 
-0x9A, 0x62, 0xF5, 0xEA, 0x51, 0x4E, 0xDA, 0xB8, 0x9A, 0x93, 0x4E, 0x5C, 0xCD, 0xF8, 0x48, 0x9D, 
-0x91, 0x4C, 0xD1, 0x00, 0x42, 0xA7, 0x4D, 0x77, 0xA1, 0xC5, 0xBD, 0x77, 0x6F, 0x67, 0xDF, 0xA1, 
-0x59, 0xF6, 0x4C, 0xB6, 0xE9, 0x86, 0x8C, 0xBE, 0x0C, 0xE1, 0xCD, 0x18, 0xDE, 0xD7, 0xE8, 0x95, 
-0x6D, 0x94, 0x81, 0xC4, 0x4A, 0x85, 0x2B, 0x6F, 0x3C, 0xFF, 0xBC, 0x93, 0x7F, 0xE9, 0xE6, 0xDB, 
-0x3F, 0x76, 0xD3, 0x63, 0x41, 0x88, 0x79, 0x4C, 0x10, 0xEE, 0xCD, 0x37, 0xDF, 0x9C, 0xBC, 0xE9, 
-0x4D, 0xEF, 0x79, 0xFE, 0x9D, 0x77, 0xDE, 0xF7, 0xA7, 0x22, 0x43, 0xEB, 0xD3, 0x64, 0x58, 0x07, 
-0xAF, 0xF1, 0xA1, 0x40, 0x91, 0x93, 0x66, 0x9E, 0x75, 0xEB, 0x47, 0x78, 0xC2, 0x93, 0x2E, 0xE4, 
-0x75, 0xAF, 0x7D, 0x19, 0xA7, 0x9C, 0xB1, 0x1E, 0x54, 0x45, 0x56, 0xD3, 0x68, 0x6B, 0x08, 0xC1, 
-0xE1, 0x04, 0xF2, 0x7E, 0xC9, 0xE4, 0xE4, 0x14, 0x93, 0x87, 0x66, 0xB9, 0xEF, 0xEE, 0xDD, 0xDC, 
-0xF4, 0xED, 0xDB, 0xB9, 0xE3, 0xCE, 0x7B, 0x98, 0x9B, 0xEF, 0x91, 0xE7, 0x50, 0xE4, 0x01, 0x24, 
-0x21, 0xB5, 0x75, 0xA4, 0x0C, 0x14, 0x55, 0x97, 0x94, 0x3A, 0x1A, 0x85, 0xC7, 0x93, 0x9A, 0x54, 
-0x9C, 0xF7, 0x25, 0x54, 0xF7, 0x8E, 0x8D, 0xA7, 0x9F, 0x3F, 0xE7, 0xC2, 0x53, 0xFF, 0xED, 0x92, 
-0x4B, 0x1E, 0x77, 0xC7, 0x1F, 0xFE, 0xE1, 0x2F, 0xF6, 0x1E, 0x0B, 0x83, 0x65, 0x09, 0x8F, 0x5D, 
-0x44, 0x89, 0xF6, 0xFF, 0x8C, 0xDD, 0x78, 0xE3, 0x57, 0x9E, 0x70, 0xE3, 0x8D, 0xB7, 0xBE, 0xAE, 
-0x5F, 0x98, 0xAB, 0x5C, 0xA5, 0x97, 0x69, 0xD1, 0xD6, 0xA2, 0x50, 0x28, 0x32, 0x93, 0xE1, 0x82, 
-0xA0, 0xB4, 0xA6, 0x2F, 0x0E, 0xB4, 0x27, 0x50, 0x90, 0x35, 0x13, 0xAC, 0xCE, 0x19, 0x5F, 0xD6, 
-0xE4, 0xA4, 0x0D, 0xAB, 0x38, 0xE7, 0xF4, 0x8D, 0x5C, 0xFD, 0xC4, 0xCB, 0x38, 0xED, 0xA4, 0x55, 
-0x9C, 0xBA, 0x71, 0x15, 0x63, 0x75, 0x81, 0xB2, 0x0D, 0xBD, 0x05, 0xAA, 0xD9, 0x59, 0xBA, 0xB3, 
-0x0B, 0x6C, 0xBE, 0xE3, 0x2E, 0x76, 0xEE, 0x9F, 0xE2, 0x96, 0xBB, 0x76, 0xB3, 0x65, 0xCF, 0x3C, 
-0x77, 0xED, 0xE9, 0xD1, 0x0E, 0x63, 0x88, 0x5D, 0x43, 0xEE, 0x15, 0x5E, 0x95, 0x58, 0x8B, 0x58, 
-0x15, 0x7A, 0x46, 0x95, 0x7F, 0xFF, 0xBE, 0xFF, 0xF9, 0xAE, 0xDF, 0x78, 0xC7, 0xAF, 0xBF, 0x7E, 
-0xE6, 0xD8, 0xDF, 0xFD, 0x68, 0xC3, 0x63, 0x82, 0x70, 0xDF, 0xF9, 0xCE, 0xDF, 0x3A, 0xFD, 0x03, 
-0x1F, 0xF8, 0xC7, 0xFF, 0x55, 0xB9, 0xDA, 0xF3, 0x35, 0xC3, 0xDA, 0x98, 0x14, 0xE7, 0x0A, 0xD2, 
-0xC4, 0xA3, 0x74, 0xC1, 0xA5, 0x97, 0x9F, 0xC9, 0x4F, 0xFD, 0xD4, 0xAB, 0x79, 0xF2, 0x93, 0x2F, 
-0x60, 0xF5, 0xEA, 0x21, 0x44, 0xF5, 0xB0, 0xDA, 0xE3, 0x25, 0xC7, 0x39, 0x47, 0x50, 0x1E, 0x6D, 
-0x12, 0x50, 0x06, 0x07, 0x38, 0x2F, 0xB8, 0xDC, 0x30, 0x35, 0xB1, 0xC0, 0xDE, 0x7D, 0x93, 0x6C, 
-0xB9, 0x7B, 0x1B, 0x5F, 0xFF, 0xDA, 0xCD, 0xDC, 0xF2, 0xED, 0x4D, 0x1C, 0x3C, 0x30, 0x87, 0x38, 
-0x83, 0x0A, 0x09, 0x89, 0xAD, 0x45, 0x75, 0x83, 0x18, 0x94, 0xA9, 0xD1, 0xAF, 0x3C, 0x41, 0x1C, 
-0x46, 0x5B, 0x08, 0xAD, 0x32, 0x51, 0x7E, 0xE7, 0xB2, 0xF1, 0xE1, 0x4F, 0x5F, 0xF5, 0xB4, 0x27, 
-0xFE, 0xDB, 0x4F, 0x3C, 0xE3, 0xAA, 0x5B, 0x7F, 0xFC, 0x6D, 0x3F, 0xDE, 0x3B, 0xF6, 0xB7, 0x2F, 
-0x61, 0x09, 0x8F, 0x24, 0x44, 0x44, 0xFD, 0xD9, 0x9F, 0xFD, 0xFD, 0xF0, 0xFB, 0xDF, 0xFF, 0x77, 
-0xCF, 0x9A, 0x98, 0x98, 0xF9, 0xF1, 0x85, 0x85, 0xDE, 0xD3, 0xB4, 0xA9, 0xAD, 0x71, 0x95, 0x31, 
-0x60, 0x18, 0xAD, 0x8F, 0xD2, 0xEE, 0xCF, 0x31, 0x6A, 0x1A, 0xE4, 0xBE, 0x83, 0x36, 0x96, 0x22, 
-0xE4, 0x38, 0x5D, 0x91, 0x34, 0x35, 0xE3, 0x2B, 0xEA, 0x5C, 0x72, 0xF1, 0x59, 0x3C, 0xFE, 0x71, 
-0xE7, 0x72, 0xE5, 0xE3, 0x2E, 0xE0, 0xF4, 0x13, 0xD7, 0xB0, 0x7E, 0xE5, 0x18, 0x56, 0x7A, 0x40, 
-0x0F, 0x8A, 0x19, 0x98, 0xDE, 0x4D, 0x77, 0x66, 0x1F, 0xE5, 0xDC, 0x21, 0x5C, 0xA7, 0x45, 0xE8, 
-0x15, 0xE0, 0x35, 0xDA, 0x34, 0x59, 0x28, 0x52, 0x76, 0x4C, 0x79, 0xFE, 0xFD, 0xCB, 0xF7, 0xF1, 
-0xB5, 0x3B, 0xA6, 0xD8, 0xD3, 0xAE, 0x13, 0xCC, 0x38, 0x92, 0x2A, 0x3A, 0xFD, 0x05, 0x0C, 0x16, 
-0x93, 0xF8, 0xDD, 0xAB, 0x56, 0x67, 0xBF, 0xF5, 0x9B, 0xBF, 0xF9, 0xE7, 0x1F, 0x7E, 0xDB, 0xDB, 
-0x1E, 0x57, 0x1D, 0x7B, 0x0D, 0x8F, 0x26, 0x3C, 0xEA, 0x09, 0xF7, 0xFD, 0xEF, 0x7F, 0x7F, 0xF2, 
-0x5B, 0xBF, 0xF5, 0xC1, 0x9F, 0x3D, 0x34, 0xD5, 0xF9, 0x75, 0x68, 0xAE, 0xD0, 0x34, 0xA9, 0xAA, 
-0x0A, 0x6B, 0x4B, 0x9C, 0x9B, 0xE7, 0xDC, 0xF3, 0x4E, 0xE1, 0x75, 0xAF, 0x7F, 0x11, 0x6F, 0x78, 
-0xC3, 0x8B, 0x58, 0xB1, 0x3C, 0xC3, 0x95, 0x53, 0x68, 0xE9, 0xA3, 0x75, 0x01, 0xA1, 0x42, 0xA1, 
-0x20, 0xB1, 0xA0, 0x15, 0x95, 0x08, 0x95, 0x08, 0xA8, 0x84, 0x4C, 0x0D, 0x03, 0x09, 0x41, 0x2C, 
-0x0B, 0xF3, 0x3D, 0x76, 0xEE, 0x38, 0xC0, 0x2D, 0xDF, 0xDE, 0xC4, 0x97, 0xBE, 0xF0, 0x75, 0x6E, 
-0xFE, 0xE6, 0x1D, 0xCC, 0xCF, 0xF5, 0x29, 0x2B, 0x8D, 0x90, 0xE1, 0xC4, 0x52, 0x7A, 0x05, 0x64, 
-0x90, 0x0E, 0x81, 0x78, 0x12, 0x5F, 0xA2, 0x42, 0x11, 0x1C, 0xFD, 0xDC, 0x28, 0x76, 0xAD, 0x5B, 
-0xB7, 0xF2, 0x43, 0x67, 0x9C, 0x73, 0xFA, 0xBF, 0xFD, 0xD1, 0x1F, 0xBD, 0x6B, 0xCF, 0x79, 0xE7, 
-0x3D, 0xF6, 0xDC, 0x5D, 0x96, 0xF0, 0xE8, 0x82, 0x88, 0xA8, 0x5B, 0x6E, 0x39, 0x50, 0xFF, 0xCD, 
-0xDF, 0xFC, 0xAD, 0x8B, 0x6F, 0xBE, 0xF9, 0x8E, 0x97, 0xE7, 0x7D, 0xFF, 0xE2, 0x76, 0xA7, 0xB7, 
-0x06, 0x92, 0x04, 0x9D, 0xA8, 0x2C, 0x1D, 0xC2, 0x57, 0x0E, 0x23, 0x42, 0x11, 0xDA, 0xD4, 0xD1, 
-0x08, 0x05, 0x41, 0x57, 0xE8, 0x5A, 0xA0, 0x36, 0x6C, 0x79, 0xD2, 0x55, 0x8F, 0xE3, 0x59, 0xCF, 
-0xBC, 0x92, 0x2B, 0x2E, 0x3E, 0x8B, 0xD3, 0xD6, 0xAF, 0x60, 0x7C, 0x24, 0x83, 0x7E, 0x0B, 0x3A, 
-0x33, 0xD0, 0x6F, 0x51, 0xCD, 0xEC, 0x63, 0x7E, 0x72, 0x2B, 0xBD, 0xB9, 0x03, 0x48, 0x7F, 0x06, 
-0x5D, 0xF5, 0x30, 0xCE, 0xA1, 0x5D, 0xA0, 0x6E, 0x6B, 0x28, 0x6A, 0xA8, 0x6C, 0x05, 0x7D, 0xB3, 
-0x82, 0xAF, 0x6C, 0x9A, 0xE1, 0x33, 0xDF, 0x9E, 0xE0, 0x8B, 0x37, 0x1F, 0x62, 0x9E, 0x11, 0x72, 
-0x52, 0x54, 0x52, 0xC7, 0x24, 0x19, 0xDD, 0xDE, 0x54, 0x05, 0x9D, 0x9B, 0x5F, 0xF2, 0x92, 0x67, 
-0xBE, 0xFE, 0xDF, 0xFE, 0xED, 0xFD, 0x5B, 0x8F, 0xBD, 0x96, 0x47, 0x13, 0x1E, 0xF5, 0x84, 0xFB, 
-0xAC, 0x67, 0xBD, 0xFE, 0xAC, 0x2F, 0x7C, 0xE1, 0xEB, 0x1F, 0x0E, 0xC1, 0x5E, 0x02, 0xC3, 0x5A, 
-0xA9, 0x06, 0x36, 0x81, 0x20, 0x33, 0xAC, 0x59, 0xD3, 0xE0, 0x5D, 0xEF, 0x7A, 0x0B, 0xAF, 0x7D, 
-0xED, 0x0B, 0x59, 0xB5, 0xC2, 0x52, 0xF4, 0x0E, 0x92, 0xA8, 0x0E, 0x3A, 0x13, 0x28, 0x0B, 0x08, 
-0x65, 0xB4, 0x9E, 0x2A, 0x13, 0xBB, 0x42, 0x3C, 0x18, 0x03, 0x26, 0xA5, 0x72, 0x0A, 0x54, 0x82, 
-0xD2, 0x19, 0x88, 0x25, 0x48, 0x46, 0x91, 0x07, 0xF6, 0xEF, 0x9B, 0x66, 0xC7, 0x8E, 0x03, 0xDC, 
-0x7A, 0xCB, 0xDD, 0x5C, 0xF7, 0xD1, 0x4F, 0xB0, 0x7D, 0xC7, 0x7E, 0x5C, 0xA8, 0x51, 0x3A, 0x83, 
-0x6D, 0x8C, 0xE1, 0x49, 0x90, 0x5E, 0x45, 0x62, 0x52, 0x2A, 0xD7, 0x67, 0xA4, 0x3E, 0x4C, 0x51, 
-0x76, 0x45, 0xA8, 0xE6, 0x9A, 0xC3, 0xD9, 0x9D, 0x63, 0xA3, 0xCD, 0xFF, 0xB8, 0xF2, 0x89, 0x97, 
-0x7D, 0xFC, 0x1F, 0xFE, 0xE1, 0x77, 0x77, 0x2E, 0xA9, 0x19, 0x96, 0xF0, 0x48, 0x60, 0xF3, 0xE6, 
-0xCD, 0xE9, 0x5F, 0xFE, 0xE5, 0xBF, 0x9F, 0x73, 0xDD, 0x75, 0x9F, 0x7C, 0x65, 0x59, 0xF8, 0xE7, 
-0xB5, 0xDA, 0xFD, 0x53, 0x21, 0xAD, 0xD7, 0x1B, 0x23, 0xAA, 0x2C, 0x5D, 0xF4, 0x45, 0xF7, 0x25, 
-0x1A, 0x0F, 0x94, 0x8C, 0x8C, 0xD4, 0x59, 0x68, 0x4D, 0x32, 0x34, 0x62, 0x39, 0xF1, 0xE4, 0xD5, 
-0x5C, 0xFD, 0xAC, 0xC7, 0xF3, 0xE4, 0xA7, 0x3E, 0x8E, 0xD3, 0x4E, 0x5E, 0xCD, 0xC9, 0x6B, 0xC7, 
-0x68, 0xAA, 0x9C, 0x34, 0x74, 0xA0, 0x3D, 0x4B, 0x98, 0x9D, 0xA4, 0x98, 0x3D, 0xC4, 0xEC, 0xEE, 
-0x1D, 0xF8, 0xDE, 0x34, 0x2E, 0x9F, 0xC1, 0x4A, 0x9F, 0xC4, 0x38, 0x52, 0xA5, 0x50, 0x41, 0x81, 
-0x0F, 0xD4, 0xB5, 0xC5, 0x15, 0x01, 0x9D, 0x0C, 0x51, 0x1B, 0xDB, 0xC8, 0x6C, 0x58, 0xCD, 0xA6, 
-0x7D, 0x81, 0xBF, 0xF8, 0xA7, 0xAF, 0x73, 0xF3, 0xF6, 0x36, 0x3D, 0xBB, 0x9C, 0x05, 0x97, 0x51, 
-0x01, 0xB5, 0x7A, 0x26, 0x79, 0xFF, 0x40, 0x7F, 0xE5, 0x09, 0xA3, 0xFF, 0xCF, 0xFF, 0xFA, 0xFD, 
-0x77, 0xFE, 0xD9, 0xEB, 0x5E, 0xF7, 0xBA, 0xEE, 0xB1, 0xD7, 0xF4, 0x68, 0xC1, 0xA3, 0x9A, 0x70, 
-0xFF, 0xF9, 0x9F, 0xBF, 0x51, 0x7F, 0xEB, 0x4F, 0xBD, 0xFD, 0x1D, 0xED, 0xF9, 0xE2, 0x37, 0x45, 
-0x35, 0x86, 0x92, 0x64, 0x18, 0xEF, 0xA2, 0x91, 0x0C, 0x3D, 0xCD, 0x73, 0x9F, 0x7D, 0x05, 0xEF, 
-0x7D, 0xEF, 0xBB, 0xB9, 0xF0, 0x82, 0x93, 0x91, 0x6A, 0x92, 0x44, 0x16, 0xC0, 0xB7, 0xA0, 0xEC, 
-0x41, 0xAF, 0x03, 0x21, 0x80, 0x0F, 0x10, 0x00, 0x6B, 0x21, 0x49, 0x21, 0x4B, 0x20, 0x4D, 0x41, 
-0x67, 0xE0, 0x01, 0x65, 0xC1, 0xA4, 0x78, 0x2C, 0x41, 0xA5, 0x04, 0x95, 0xE1, 0x43, 0xC2, 0xD4, 
-0x74, 0x8F, 0xEB, 0xBF, 0xF8, 0x0D, 0x6E, 0xB9, 0x65, 0x0B, 0xD7, 0x5F, 0xFF, 0x4D, 0xB6, 0xEE, 
-0x98, 0x40, 0x9B, 0x26, 0x79, 0xCF, 0x93, 0x64, 0x23, 0x84, 0xCA, 0x92, 0xD8, 0x1A, 0x79, 0x91, 
-0x93, 0x26, 0x09, 0x36, 0xD1, 0xD2, 0xEB, 0xCD, 0x0B, 0x84, 0xF9, 0xE5, 0xE3, 0x63, 0x37, 0xAD, 
-0x5C, 0x35, 0xF6, 0xFE, 0x9F, 0xF9, 0x99, 0x77, 0x7C, 0xE5, 0x67, 0x7F, 0xF6, 0x19, 0xB3, 0x4B, 
-0xC4, 0xBB, 0x84, 0x1F, 0x05, 0xAE, 0xBF, 0xFE, 0x7A, 0xFB, 0x99, 0x8F, 0xDD, 0xB1, 0xF6, 0x63, 
-0x9F, 0xF9, 0xFC, 0xF3, 0x27, 0x27, 0x67, 0x5F, 0xDF, 0x69, 0x95, 0xE7, 0x05, 0x4C, 0x3D, 0x4D, 
-0x6B, 0xBA, 0xAC, 0x3C, 0xC1, 0x47, 0x9F, 0x58, 0x85, 0x07, 0xE9, 0x62, 0xAC, 0xC3, 0x87, 0x1C, 
-0xA5, 0x0B, 0x4E, 0x3B, 0x63, 0x3D, 0x4F, 0x7E, 0xEA, 0x25, 0x3C, 0xE5, 0x29, 0x97, 0x70, 0xD9, 
-0x65, 0x67, 0xB3, 0x6A, 0x3C, 0xA3, 0x6E, 0x0A, 0x32, 0x7A, 0x30, 0x73, 0x00, 0x5A, 0x53, 0xCC, 
-0xEE, 0xDE, 0x4A, 0x6F, 0x6A, 0x02, 0x3F, 0x3F, 0x47, 0xE2, 0x72, 0x6A, 0x54, 0x18, 0x9D, 0xA3, 
-0x24, 0x07, 0x15, 0x50, 0x4A, 0xA1, 0x25, 0x43, 0x8B, 0xC6, 0x86, 0x40, 0x62, 0x2C, 0x04, 0x45, 
-0xCF, 0x25, 0xF8, 0xA1, 0x93, 0xE9, 0x26, 0xEB, 0xF9, 0xCB, 0x8F, 0xDC, 0xC0, 0xF5, 0x77, 0xCE, 
-0x72, 0xF7, 0xAC, 0xA5, 0x32, 0xAB, 0xA9, 0x74, 0x46, 0x5E, 0xF5, 0x50, 0x09, 0x82, 0x6A, 0x7D, 
-0xFB, 0xE2, 0xF3, 0x36, 0xFE, 0xDC, 0xAD, 0xB7, 0x7E, 0xFE, 0x5B, 0xC7, 0x5E, 0xDB, 0xA3, 0x05, 
-0x8F, 0x6A, 0xC2, 0x7D, 0xF3, 0x9B, 0x7F, 0xF5, 0x8C, 0xBF, 0xFB, 0xBB, 0x4F, 0xFC, 0x45, 0x59, 
-0xF2, 0x74, 0x63, 0x86, 0x94, 0x0F, 0x1A, 0xAD, 0x35, 0xE8, 0x2E, 0x27, 0x9F, 0xDA, 0xE4, 0x57, 
-0x7F, 0xE5, 0x4D, 0x5C, 0xF3, 0xD2, 0x67, 0xD1, 0x48, 0x7A, 0x58, 0xE6, 0x41, 0xDA, 0x30, 0xB9, 
-0x8B, 0xB9, 0x3D, 0x3B, 0x70, 0x73, 0x73, 0x84, 0xBC, 0x44, 0x2A, 0x87, 0x56, 0x16, 0x9D, 0x66, 
-0xE8, 0x34, 0x23, 0x1B, 0x6A, 0x90, 0x36, 0x1A, 0xD8, 0x66, 0x13, 0x35, 0x34, 0x02, 0xCD, 0x61, 
-0xC8, 0x6A, 0x90, 0x24, 0x88, 0xAD, 0x51, 0xEA, 0x84, 0x2A, 0x24, 0x40, 0x0D, 0x91, 0x3A, 0xBD, 
-0x76, 0xE0, 0xB6, 0x5B, 0xEE, 0xE1, 0x9B, 0x5F, 0xBB, 0x83, 0x4F, 0x7C, 0xEC, 0x33, 0x4C, 0x1C, 
-0x98, 0xE5, 0xD0, 0x5C, 0x97, 0x5A, 0x7D, 0x35, 0xBD, 0x7E, 0x41, 0xAD, 0xBE, 0x1C, 0x6B, 0x13, 
-0x3A, 0xED, 0x1E, 0xA0, 0x51, 0x4A, 0xA1, 0xB4, 0xF3, 0xC1, 0x97, 0xFB, 0x86, 0x1B, 0xD9, 0x27, 
-0x2F, 0xBA, 0xF4, 0xCC, 0xBF, 0x7B, 0xCD, 0x6B, 0x2E, 0xBF, 0xED, 0x6D, 0x6F, 0x7B, 0xDB, 0xA3, 
-0x5A, 0x37, 0xB5, 0x84, 0xE3, 0x1B, 0xD7, 0x5E, 0xFB, 0xBF, 0xC7, 0xFF, 0xF6, 0x6F, 0xFF, 0xF1, 
-0x19, 0xDD, 0xB6, 0x7B, 0xD9, 0xFC, 0x7C, 0xF7, 0xA9, 0x46, 0xD7, 0x57, 0x28, 0xB4, 0xC6, 0x58, 
-0xCA, 0xAA, 0xC0, 0x1A, 0x43, 0x92, 0x58, 0xFA, 0x79, 0x07, 0x63, 0x2B, 0x92, 0xA4, 0x4F, 0xAD, 
-0xE1, 0x39, 0xFD, 0x8C, 0x13, 0x79, 0xDA, 0x33, 0xAE, 0xE4, 0xA9, 0x57, 0x5F, 0xCE, 0x99, 0xA7, 
-0xAD, 0x65, 0xD9, 0x08, 0xD4, 0x4D, 0x41, 0x2D, 0x74, 0x20, 0x9F, 0xA3, 0x3C, 0xB8, 0x8F, 0xF9, 
-0x5D, 0xF7, 0xD2, 0x9B, 0xD8, 0x83, 0xEA, 0xCF, 0xD3, 0xF0, 0x0E, 0xEB, 0x2B, 0x6A, 0x28, 0x8C, 
-0x38, 0x94, 0x2A, 0x00, 0x87, 0x57, 0x9A, 0xC8, 0x9A, 0x09, 0x4A, 0x34, 0xDA, 0x39, 0x52, 0xAB, 
-0xC0, 0x15, 0x90, 0xD4, 0xE9, 0xA9, 0x51, 0xBA, 0x76, 0x35, 0xF7, 0x1E, 0x82, 0x7F, 0xFC, 0xDC, 
-0x5D, 0x7C, 0xEA, 0x96, 0x69, 0xDA, 0x9C, 0x40, 0x5F, 0xD5, 0xC9, 0xD1, 0xA0, 0x1D, 0x48, 0x67, 
-0x7E, 0xC5, 0x8A, 0xE4, 0x4F, 0x3E, 0xFA, 0xF6, 0x3F, 0xFF, 0x9D, 0xAB, 0xDF, 0xFB, 0xE8, 0x0C, 
-0x88, 0x30, 0xC7, 0xBE, 0xF0, 0x68, 0xC1, 0xB5, 0xD7, 0x8A, 0xBE, 0xF1, 0xC6, 0xBF, 0x7E, 0xFE, 
-0xEE, 0xDD, 0x13, 0xAF, 0xB1, 0xBA, 0xD9, 0xB4, 0xDA, 0x2A, 0x1F, 0x2A, 0x8C, 0x11, 0x6C, 0x5A, 
-0xF2, 0xFC, 0xE7, 0x5D, 0xCE, 0xCB, 0x5F, 0xFA, 0x74, 0xD6, 0xAF, 0xAA, 0x63, 0xDC, 0x3C, 0xF8, 
-0x59, 0xF2, 0x5D, 0x77, 0x71, 0xE8, 0xDE, 0x3B, 0xF0, 0x33, 0x07, 0x28, 0x27, 0x0F, 0xE2, 0x5B, 
-0xD3, 0xD0, 0x69, 0x41, 0x77, 0x01, 0xD7, 0x99, 0xA7, 0x98, 0x3B, 0x44, 0x6F, 0x7A, 0x82, 0xCE, 
-0xF4, 0x7E, 0xDA, 0x13, 0x07, 0xA8, 0xE6, 0xA7, 0xD0, 0xBD, 0x05, 0x8C, 0xEB, 0xA1, 0x24, 0x47, 
-0x49, 0x85, 0xD5, 0x0E, 0x63, 0x1D, 0x9A, 0x12, 0xAD, 0x3C, 0xCD, 0x5A, 0xCA, 0xFA, 0x13, 0x56, 
-0x71, 0xF1, 0x79, 0xE7, 0x70, 0xEA, 0xC9, 0x1B, 0x59, 0x36, 0xD2, 0xA4, 0x2A, 0x4A, 0xDA, 0x45, 
-0x1F, 0x51, 0x96, 0xB2, 0xCA, 0x29, 0xFA, 0x3D, 0x6C, 0x5A, 0x23, 0x4D, 0x9B, 0xB8, 0xCA, 0x81, 
-0x4A, 0xB5, 0x56, 0xE9, 0x68, 0x08, 0xE1, 0x82, 0x5D, 0xBB, 0x76, 0x5E, 0xFE, 0xAD, 0x6F, 0xDE, 
-0xDD, 0x78, 0xF9, 0x35, 0xAF, 0x9F, 0x7E, 0xFB, 0xDB, 0xFF, 0xA8, 0xFD, 0xC9, 0x4F, 0x7E, 0x60, 
-0x29, 0x6A, 0x6D, 0x09, 0x3F, 0x34, 0x7C, 0xF6, 0xB3, 0x9F, 0x6D, 0xEE, 0xDA, 0x95, 0x3F, 0xE1, 
-0xD3, 0x9F, 0xF8, 0xF2, 0xBB, 0xA7, 0xA7, 0xBB, 0x3F, 0xD3, 0xEF, 0x87, 0xCB, 0x52, 0x3B, 0x32, 
-0xA4, 0xC4, 0x6A, 0x17, 0x02, 0xA9, 0xB5, 0x58, 0xA3, 0x08, 0x3E, 0x47, 0xA4, 0x8F, 0xB5, 0x8E, 
-0xE6, 0x10, 0xAC, 0xDD, 0x50, 0xE7, 0x9A, 0x57, 0x3E, 0x8B, 0x9F, 0xFB, 0xF9, 0x37, 0xF1, 0x82, 
-0xE7, 0x3F, 0x91, 0xD3, 0x4E, 0x19, 0x67, 0xC5, 0x70, 0xA0, 0xA1, 0xBA, 0xD8, 0x7C, 0x16, 0x66, 
-0xF7, 0xD1, 0xDD, 0x71, 0x37, 0xD3, 0x5B, 0x6E, 0xA7, 0xBF, 0x77, 0x27, 0xF5, 0xFE, 0x02, 0x43, 
-0x52, 0xD1, 0x94, 0x8A, 0x1A, 0x9E, 0xC4, 0x0B, 0x26, 0x04, 0x34, 0x01, 0x05, 0x18, 0x12, 0x10, 
-0x03, 0x92, 0x62, 0xC4, 0xA2, 0xBC, 0x60, 0xB4, 0x8A, 0x6A, 0x3D, 0x0D, 0x82, 0xC6, 0x64, 0x29, 
-0x26, 0x4D, 0x28, 0x82, 0xE6, 0xEE, 0x6D, 0x07, 0xE9, 0x55, 0x8A, 0x0A, 0x43, 0xC0, 0x44, 0x55, 
-0x1F, 0x3E, 0xC9, 0x7B, 0xED, 0xD1, 0x72, 0x6D, 0xF9, 0xB9, 0x4D, 0x9B, 0x6E, 0x9E, 0x3B, 0xF6, 
-0x5A, 0x1F, 0x0D, 0x78, 0xD4, 0x12, 0xEE, 0x95, 0x57, 0x66, 0xE3, 0x9F, 0xFA, 0xC4, 0x57, 0x7E, 
-0xB9, 0xAC, 0xFC, 0x85, 0xD6, 0xD4, 0x4D, 0xF0, 0x82, 0x50, 0xA1, 0x28, 0x18, 0x1B, 0x55, 0xFC, 
-0xF4, 0xDB, 0x5F, 0xCE, 0x55, 0x4F, 0x3E, 0x1F, 0x23, 0x6D, 0xC8, 0x67, 0x60, 0x72, 0x27, 0x53, 
-0xF7, 0xDD, 0x46, 0x7B, 0xCF, 0x7D, 0xA4, 0xFD, 0x79, 0xEA, 0xAE, 0x4F, 0xDD, 0xE7, 0xD4, 0x29, 
-0x69, 0x18, 0x47, 0x8D, 0x1C, 0xEB, 0xBA, 0x24, 0xAE, 0x85, 0x2D, 0x3B, 0xE8, 0x5E, 0x1B, 0xDF, 
-0x9A, 0xA3, 0x37, 0x7D, 0x90, 0xF9, 0xC9, 0xFD, 0xB4, 0xA6, 0x0E, 0x50, 0x76, 0x66, 0x31, 0x55, 
-0x9F, 0x14, 0x8F, 0xC1, 0x63, 0x55, 0x80, 0xB2, 0xC0, 0x6A, 0x61, 0x68, 0xAC, 0xC9, 0x29, 0xA7, 
-0x6D, 0xE4, 0x82, 0x8B, 0xCE, 0xE3, 0x8A, 0x27, 0x5C, 0x41, 0x73, 0x74, 0x98, 0x99, 0xD9, 0x29, 
-0x26, 0x27, 0x0F, 0xA0, 0xAD, 0x26, 0x4B, 0x6B, 0x28, 0xA5, 0x08, 0xA2, 0x01, 0x85, 0x35, 0x56, 
-0x05, 0x1F, 0xAC, 0xC0, 0x1A, 0x5F, 0x85, 0x2B, 0x36, 0xDF, 0x79, 0xE7, 0xB9, 0x37, 0xDF, 0xF4, 
-0x25, 0xFF, 0xA6, 0x57, 0xBC, 0xE9, 0xC0, 0x37, 0x6F, 0xBB, 0xE1, 0xBF, 0x55, 0xCA, 0xBA, 0x25, 
-0xFC, 0xD7, 0xE0, 0x35, 0xAF, 0x79, 0xD7, 0x69, 0x7F, 0xF6, 0x67, 0xFF, 0xF8, 0xDA, 0xCD, 0x9B, 
-0xB7, 0xFD, 0x32, 0x52, 0xBF, 0xCA, 0xE8, 0xDA, 0xF2, 0xCA, 0xA3, 0x5D, 0x08, 0x2A, 0x51, 0x16, 
-0xA3, 0x04, 0x91, 0x0A, 0x54, 0x1F, 0x63, 0x0B, 0xD2, 0xAC, 0xE2, 0xBC, 0x73, 0x4F, 0xE4, 0x9A, 
-0x57, 0x3C, 0x9B, 0x77, 0xFF, 0xF2, 0x9B, 0x78, 0xDE, 0x73, 0xAF, 0xE4, 0xB4, 0x53, 0x56, 0x93, 
-0xD1, 0xC6, 0x94, 0x73, 0xA4, 0xAE, 0x05, 0x73, 0xFB, 0xC9, 0x77, 0xDD, 0xC7, 0xCC, 0x5D, 0xB7, 
-0xD1, 0xDB, 0xB9, 0x03, 0x35, 0x33, 0xC9, 0x98, 0x78, 0x46, 0xAC, 0x26, 0x09, 0x15, 0xA1, 0x2A, 
-0xC0, 0x07, 0x8C, 0x4E, 0x50, 0x68, 0x14, 0x1A, 0xB0, 0x83, 0x96, 0xA0, 0x25, 0xC1, 0x88, 0x42, 
-0x79, 0x8F, 0xB6, 0x06, 0x42, 0x05, 0x0A, 0x2A, 0x15, 0x35, 0xC6, 0x26, 0x4D, 0x49, 0xB2, 0x61, 
-0x36, 0x6F, 0xDD, 0xCB, 0xD4, 0x42, 0x8F, 0x3E, 0x1A, 0x21, 0x45, 0x4C, 0x02, 0x4A, 0x6B, 0xF1, 
-0xED, 0xE1, 0xF9, 0x99, 0xD9, 0x9D, 0xDF, 0xF8, 0x9B, 0x2F, 0xDC, 0xF9, 0x97, 0x1F, 0xFD, 0xCB, 
-0x47, 0x5D, 0x30, 0xC4, 0xA3, 0x92, 0x70, 0xAF, 0xBB, 0xEE, 0x3A, 0xF3, 0xE1, 0x0F, 0xFF, 0xE7, 
-0xD3, 0x76, 0xED, 0x3E, 0xF0, 0x36, 0xCB, 0xF0, 0xA8, 0x12, 0x83, 0x93, 0x02, 0xAD, 0x3D, 0xDA, 
-0xE6, 0x5C, 0x7A, 0xE9, 0x29, 0xBC, 0xE1, 0xF5, 0xCF, 0xE3, 0x84, 0xE5, 0x16, 0x7A, 0x93, 0xD0, 
-0x3A, 0xC8, 0xE4, 0xDD, 0x37, 0xE1, 0xA6, 0xF6, 0x30, 0x12, 0x72, 0xB2, 0xA2, 0x43, 0xEA, 0x0A, 
-0x12, 0x57, 0x90, 0xF8, 0x0A, 0x1B, 0x2A, 0x8C, 0xCF, 0x51, 0x21, 0xC7, 0x4A, 0x41, 0x26, 0x8E, 
-0x34, 0x08, 0xB6, 0x2C, 0xA0, 0xEC, 0xA1, 0xFA, 0x5D, 0xCA, 0xF6, 0x02, 0xF9, 0xEC, 0x0C, 0xFD, 
-0xD9, 0x19, 0x7A, 0x33, 0x93, 0x48, 0xAF, 0x4B, 0x86, 0x47, 0x1B, 0x8D, 0xD6, 0x8A, 0xAA, 0xDF, 
-0x26, 0x49, 0x35, 0x43, 0xC3, 0x75, 0xD6, 0xAE, 0x5F, 0xC5, 0xD9, 0x67, 0x9F, 0xC1, 0xE8, 0x68, 
-0x9D, 0x2C, 0xD3, 0xF8, 0xAA, 0xCF, 0xCC, 0xD4, 0x24, 0x45, 0xDE, 0xC7, 0x5A, 0x8B, 0x77, 0x05, 
-0x3E, 0x78, 0xAC, 0xD5, 0xF8, 0xE0, 0x95, 0x84, 0x50, 0xAB, 0x42, 0x79, 0x6A, 0xAF, 0x97, 0x5F, 
-0xB5, 0x75, 0xC7, 0xF6, 0xF5, 0x97, 0x5D, 0xFA, 0x94, 0xA9, 0xDF, 0xFE, 0x9D, 0x3F, 0x9A, 0xFB, 
-0xD8, 0xC7, 0xFE, 0x7E, 0x49, 0xCD, 0xB0, 0x84, 0x87, 0x8D, 0xF7, 0xFD, 0xF9, 0x87, 0x96, 0x1F, 
-0xDA, 0x9B, 0x5F, 0x7D, 0xD3, 0x37, 0xEF, 0x7A, 0xEF, 0xCC, 0x74, 0xEB, 0x35, 0x82, 0x39, 0xD1, 
-0x9A, 0x7A, 0x5A, 0x95, 0x81, 0x7A, 0xDA, 0xA0, 0x96, 0xA5, 0x78, 0x97, 0x53, 0x84, 0x05, 0x34, 
-0x3D, 0xEA, 0x0D, 0xCF, 0xBA, 0xB5, 0x43, 0x3C, 0xE7, 0x39, 0x57, 0xF2, 0x96, 0xB7, 0xBC, 0x92, 
-0x1F, 0x7F, 0xE1, 0x53, 0x39, 0xF9, 0xA4, 0x31, 0xEA, 0x69, 0x81, 0xF5, 0x6D, 0xEA, 0x2A, 0xC7, 
-0x86, 0x36, 0x4C, 0xED, 0xA1, 0xB3, 0xF5, 0x2E, 0x16, 0xB6, 0x6F, 0x21, 0x4C, 0x4E, 0x90, 0xF6, 
-0x16, 0x18, 0x92, 0xC0, 0xB0, 0x56, 0x18, 0xEF, 0xF0, 0x65, 0x8E, 0x52, 0x90, 0x65, 0x35, 0xC4, 
-0x47, 0xC1, 0x42, 0xB4, 0x06, 0xE2, 0xFF, 0x0A, 0x85, 0x12, 0x83, 0x92, 0x80, 0x0A, 0x21, 0xDA, 
-0xAA, 0xC5, 0x23, 0x1A, 0xBC, 0x32, 0x14, 0x2E, 0x1A, 0xEC, 0x54, 0x52, 0xE3, 0xE0, 0x4C, 0x8F, 
-0xFD, 0x87, 0x5A, 0xB4, 0x9C, 0x10, 0xA8, 0xE3, 0x94, 0x41, 0x00, 0x82, 0x4B, 0x8A, 0x7E, 0xB7, 
-0x77, 0xE6, 0xA5, 0x67, 0xDC, 0xF0, 0xE9, 0xCF, 0x7F, 0xBC, 0x73, 0xEC, 0xB5, 0x1F, 0xEF, 0x78, 
-0x54, 0x12, 0xEE, 0x6B, 0x5F, 0xFB, 0xDA, 0xFA, 0xDF, 0xBC, 0xFF, 0x5F, 0x5E, 0x8F, 0x4B, 0x9F, 
-0x66, 0x54, 0xCD, 0xC4, 0xD8, 0xEC, 0x12, 0x65, 0x4A, 0xC6, 0x96, 0x19, 0x5E, 0xFD, 0xEA, 0xE7, 
-0xF0, 0xF4, 0xA7, 0x9C, 0x4D, 0x9D, 0x39, 0x68, 0x4D, 0x52, 0x4E, 0x6C, 0xE7, 0xD0, 0xDD, 0xB7, 
-0x32, 0xE2, 0xBA, 0x2C, 0xC3, 0x91, 0x14, 0x3D, 0xEA, 0x5A, 0x93, 0x28, 0xC1, 0x68, 0x8D, 0x56, 
-0xA0, 0x09, 0x58, 0xF1, 0x58, 0x1C, 0x89, 0x08, 0xCA, 0x79, 0x12, 0x11, 0x6A, 0x4A, 0x51, 0x57, 
-0x9A, 0xCC, 0x3B, 0x74, 0x2F, 0x47, 0xB5, 0xDB, 0xC8, 0x42, 0x87, 0xFE, 0xE4, 0x24, 0xD5, 0xFC, 
-0x02, 0xD2, 0xED, 0x92, 0x6A, 0x30, 0x2A, 0x40, 0x66, 0x10, 0xD7, 0x25, 0x48, 0xC9, 0x70, 0x33, 
-0xE3, 0xF2, 0x4B, 0x2E, 0xE0, 0x89, 0x8F, 0xBF, 0x94, 0x13, 0x4F, 0x5C, 0x83, 0xD1, 0x81, 0xB9, 
-0xD9, 0x43, 0x74, 0x3A, 0x0B, 0x24, 0xA9, 0xC1, 0x26, 0xE0, 0x7D, 0x85, 0x88, 0x27, 0x49, 0x53, 
-0xA5, 0xB4, 0xD1, 0x21, 0x84, 0x46, 0x37, 0xEF, 0x9E, 0x75, 0x68, 0x72, 0xE1, 0xB2, 0xAF, 0x7F, 
-0xF3, 0x9B, 0xCB, 0x9E, 0xF3, 0xEC, 0x57, 0xDC, 0x77, 0xD7, 0x5D, 0x5F, 0xEF, 0xBE, 0xF7, 0xBD, 
-0xEF, 0x3D, 0xB6, 0x0B, 0x96, 0xB0, 0x84, 0x07, 0xE0, 0xBA, 0xEB, 0xC4, 0xAC, 0x5D, 0x5B, 0xDB, 
-0xF8, 0x67, 0xBF, 0xFF, 0x57, 0xBF, 0xB4, 0x6F, 0xFF, 0xEC, 0xDB, 0x8D, 0x6E, 0x3E, 0x4E, 0xA9, 
-0xAC, 0x9E, 0xD8, 0xBA, 0x0A, 0x21, 0xE0, 0x42, 0x1F, 0x25, 0x9E, 0xBC, 0x9C, 0x47, 0x49, 0x8F, 
-0x46, 0x3D, 0xB0, 0x62, 0xA5, 0xE5, 0x39, 0xCF, 0x79, 0x3C, 0xBF, 0xF2, 0xCB, 0x6F, 0xE6, 0x55, 
-0xAF, 0x7E, 0x3E, 0x67, 0x9F, 0xB5, 0x96, 0x15, 0xCB, 0x35, 0xA9, 0xEA, 0x90, 0x99, 0x3E, 0x96, 
-0x3E, 0x74, 0xA6, 0xA8, 0xB6, 0xDF, 0xCD, 0xD4, 0xA6, 0x5B, 0x69, 0xEF, 0xDA, 0x4A, 0xD2, 0x9A, 
-0x63, 0x0C, 0x4F, 0x2D, 0x44, 0x61, 0x05, 0xEF, 0x08, 0x38, 0xD0, 0xA0, 0x8C, 0x45, 0x69, 0x83, 
-0x88, 0x02, 0x05, 0x41, 0xC5, 0x44, 0xA8, 0xA2, 0x15, 0x20, 0x68, 0x11, 0x14, 0x02, 0xE2, 0x50, 
-0x1A, 0x3C, 0x01, 0x31, 0x16, 0x65, 0x2C, 0x21, 0x08, 0xE2, 0x05, 0x6B, 0x32, 0x54, 0x6D, 0x84, 
-0x7D, 0x93, 0x0B, 0x4C, 0xCC, 0xF6, 0xA9, 0xC8, 0x28, 0x55, 0x06, 0xDE, 0x93, 0x58, 0xAD, 0xC4, 
-0x3B, 0xB5, 0x73, 0xEB, 0x7D, 0xB7, 0x4F, 0xCD, 0xEF, 0xDD, 0x7E, 0x6C, 0x1F, 0x1C, 0xEF, 0x78, 
-0x54, 0x12, 0xAE, 0xEB, 0x35, 0xCF, 0xDD, 0xB4, 0x79, 0xDB, 0xCF, 0xA5, 0x49, 0x73, 0x7D, 0xE5, 
-0x50, 0xD1, 0xF2, 0x57, 0x02, 0x1D, 0xCE, 0x3A, 0x7B, 0x03, 0x6F, 0x7D, 0xF3, 0x4B, 0x38, 0x63, 
-0x43, 0x13, 0xE5, 0xE7, 0x29, 0x27, 0x76, 0x30, 0xBB, 0xF3, 0x6E, 0xFC, 0xD4, 0x3E, 0xC6, 0x95, 
-0x23, 0xCD, 0x7B, 0x18, 0x57, 0x41, 0x90, 0xD8, 0x04, 0x64, 0xF0, 0x7F, 0xF0, 0x01, 0x9C, 0x03, 
-0x0F, 0xD6, 0xA4, 0x18, 0xAD, 0xD0, 0x01, 0xB4, 0x0F, 0x68, 0x17, 0xC8, 0x44, 0xA8, 0x0D, 0x1A, 
-0xFD, 0x9C, 0xDE, 0xDC, 0x2C, 0x0B, 0x53, 0x93, 0xF4, 0xE6, 0x67, 0xE8, 0xB7, 0xE6, 0xA9, 0x29, 
-0x87, 0xC1, 0x63, 0xEA, 0x29, 0xDA, 0x80, 0x0A, 0x25, 0xC3, 0x4D, 0xCB, 0xD9, 0x67, 0x9D, 0xC6, 
-0x79, 0xE7, 0x9D, 0xCD, 0x9A, 0x13, 0x56, 0xE1, 0x7C, 0xC1, 0xFE, 0xFD, 0x7B, 0xA8, 0xCA, 0x9C, 
-0x80, 0xC7, 0x24, 0x26, 0x66, 0x24, 0x0B, 0x81, 0xAC, 0x36, 0xA4, 0x42, 0x48, 0x52, 0x6D, 0xB3, 
-0x13, 0xE6, 0x67, 0xE7, 0x9E, 0xB0, 0x67, 0xF7, 0xFE, 0x8B, 0xFE, 0xF2, 0x2F, 0x3F, 0x5C, 0xFC, 
-0xEE, 0xEF, 0x7E, 0x68, 0xCF, 0xA7, 0x3E, 0xF5, 0x7F, 0xAB, 0x25, 0xE2, 0x5D, 0xC2, 0x83, 0x41, 
-0x44, 0xF4, 0x49, 0x27, 0x5D, 0x35, 0xFA, 0x3F, 0xFF, 0xE7, 0x5B, 0x5F, 0xF1, 0x8D, 0xAF, 0xDE, 
-0xFC, 0x9E, 0xAA, 0xB2, 0x2F, 0xB6, 0x66, 0xE4, 0x84, 0x7E, 0xE9, 0x4C, 0x62, 0x32, 0xB4, 0xD6, 
-0xE4, 0x55, 0x9F, 0x2C, 0xB5, 0x18, 0x53, 0x21, 0xF4, 0x19, 0x1A, 0x16, 0x2E, 0xBF, 0xE2, 0x6C, 
-0xDE, 0xF2, 0x96, 0x6B, 0x78, 0xF3, 0x9B, 0x5F, 0xCA, 0x59, 0x67, 0xAF, 0x25, 0x4B, 0x0B, 0x92, 
-0x34, 0x47, 0xF9, 0x79, 0x34, 0x7D, 0xC8, 0xE7, 0xE1, 0xE0, 0x1E, 0xE6, 0xEF, 0xB9, 0x93, 0x85, 
-0x9D, 0x5B, 0xD0, 0x0B, 0x93, 0x0C, 0x55, 0x7D, 0x6A, 0x55, 0x0F, 0xE3, 0x72, 0x12, 0x25, 0x58, 
-0x0B, 0x4A, 0x0B, 0x4A, 0x2F, 0x4A, 0xB3, 0xE0, 0x9C, 0xC3, 0x28, 0x0D, 0x08, 0x41, 0x07, 0x82, 
-0x12, 0x04, 0x0F, 0x04, 0xB4, 0x08, 0x10, 0x50, 0x56, 0x23, 0x08, 0x4E, 0x09, 0x5E, 0x81, 0x52, 
-0x16, 0x82, 0xA0, 0x7D, 0x85, 0x52, 0x09, 0xF5, 0x91, 0x95, 0x1C, 0x6A, 0x95, 0xDC, 0xBB, 0x6B, 
-0x8A, 0x76, 0x48, 0xF0, 0xAA, 0x41, 0x50, 0x3A, 0xAA, 0x41, 0x82, 0x6B, 0x36, 0xB3, 0x6C, 0xF6, 
-0x9D, 0xBF, 0xF8, 0x3B, 0x5F, 0xBD, 0xE1, 0x86, 0x8F, 0x3F, 0xAA, 0x8C, 0x67, 0x8F, 0x3A, 0xC2, 
-0xBD, 0xF6, 0xDA, 0x6B, 0xF5, 0x97, 0x6F, 0xB8, 0xF5, 0x05, 0xB3, 0x33, 0x9D, 0x97, 0x29, 0xB2, 
-0xBA, 0x17, 0xA3, 0x14, 0x82, 0x22, 0xA7, 0x56, 0x0F, 0x3C, 0xF7, 0xF9, 0x4F, 0xE2, 0x45, 0x2F, 
-0x78, 0x12, 0xC3, 0x8D, 0x3E, 0x74, 0xF6, 0x33, 0x71, 0xEF, 0x9D, 0xF4, 0x27, 0x76, 0x33, 0xE2, 
-0xFB, 0xD4, 0xAB, 0x02, 0xE3, 0x7D, 0x24, 0x5A, 0x6C, 0xF4, 0xBF, 0x55, 0x09, 0x4A, 0x27, 0x28, 
-0x2C, 0x4A, 0x5B, 0x34, 0x09, 0x4A, 0x25, 0x94, 0x12, 0x10, 0xA5, 0x41, 0x1B, 0x94, 0x52, 0x58, 
-0x6D, 0xB0, 0x4A, 0x63, 0x83, 0xA0, 0xCA, 0x8A, 0xA6, 0x35, 0x64, 0x0A, 0x9A, 0xC6, 0x40, 0xDE, 
-0xA7, 0x3F, 0x3B, 0x47, 0x7F, 0x6A, 0x92, 0xCE, 0xC1, 0x03, 0x14, 0x73, 0xD3, 0x58, 0xA3, 0x71, 
-0xA1, 0xC4, 0x66, 0xD1, 0x18, 0xB0, 0xAC, 0x99, 0x71, 0xCE, 0x39, 0x67, 0x70, 0xC1, 0x45, 0xE7, 
-0xB3, 0x7A, 0xCD, 0x4A, 0x26, 0xA7, 0x0E, 0xD2, 0xEA, 0x74, 0xF0, 0x21, 0x20, 0x68, 0x6C, 0x92, 
-0x01, 0x09, 0xCE, 0x55, 0x78, 0x17, 0x54, 0x96, 0x8D, 0xD9, 0x7E, 0x3F, 0x3F, 0xB1, 0xD3, 0xEE, 
-0x5C, 0xFE, 0xAD, 0x1B, 0xBF, 0x3A, 0xFE, 0x8D, 0x1B, 0x6E, 0x9F, 0xBC, 0x67, 0xEB, 0xB7, 0xA7, 
-0x96, 0x48, 0x77, 0x09, 0x47, 0xE3, 0xD3, 0x9F, 0xFE, 0x74, 0xF6, 0xD3, 0x3F, 0xFD, 0x3B, 0x8F, 
-0xFB, 0xD0, 0xDF, 0xFE, 0xC3, 0xBB, 0xE7, 0x67, 0xF3, 0xB7, 0x76, 0xF2, 0xE2, 0x1C, 0x6B, 0x86, 
-0x53, 0x24, 0xC5, 0xA8, 0x94, 0xCA, 0x55, 0x78, 0x5F, 0x91, 0x26, 0x1A, 0x17, 0x7A, 0x04, 0xE9, 
-0xF2, 0xC4, 0x27, 0x5F, 0xCC, 0xEB, 0xDF, 0xF0, 0x62, 0xDE, 0xF4, 0x96, 0x6B, 0xB8, 0xFA, 0xAA, 
-0x8B, 0x19, 0x19, 0x85, 0x2C, 0x2D, 0xA9, 0x35, 0x3C, 0x26, 0xA9, 0x50, 0x55, 0x0B, 0xFA, 0x73, 
-0x70, 0x68, 0x3F, 0x0B, 0x3B, 0xEE, 0x65, 0x61, 0xD7, 0x7D, 0xE8, 0xD9, 0x29, 0x86, 0x42, 0xCE, 
-0x10, 0x25, 0x89, 0xE4, 0x58, 0x1D, 0x50, 0xC6, 0x23, 0x3A, 0x50, 0x89, 0xA7, 0x0C, 0x15, 0x41, 
-0x02, 0xDA, 0xC4, 0xBC, 0xB7, 0xE2, 0x4B, 0x44, 0x55, 0x04, 0xE5, 0x09, 0xCA, 0x23, 0x04, 0xD0, 
-0x82, 0x16, 0x62, 0x6A, 0x30, 0xAD, 0x70, 0x02, 0x5E, 0xDB, 0xE8, 0x9D, 0xE9, 0x3D, 0x3A, 0x04, 
-0xD2, 0xE8, 0xD7, 0x89, 0x4B, 0x9B, 0x14, 0xAA, 0xC1, 0xA6, 0xED, 0x53, 0x4C, 0xF7, 0xA0, 0x52, 
-0x4D, 0xB0, 0x29, 0x2A, 0x54, 0x28, 0x82, 0xEE, 0x77, 0x16, 0x92, 0x0B, 0xCE, 0x39, 0xFD, 0x53, 
-0x37, 0xDE, 0x7C, 0xFD, 0xA3, 0x2A, 0x5F, 0xC9, 0xA3, 0x8E, 0x70, 0x5F, 0xF5, 0xDC, 0x57, 0x8D, 
-0x7C, 0xFC, 0x53, 0x37, 0xFC, 0x5C, 0x5E, 0x98, 0x4B, 0x9C, 0xA4, 0x5A, 0xAB, 0x94, 0x80, 0xC3, 
-0xAA, 0x3E, 0x6B, 0x56, 0xD7, 0x79, 0xC5, 0xAB, 0x5F, 0xC0, 0xE5, 0x97, 0x9E, 0x8C, 0x55, 0x33, 
-0x54, 0x07, 0xEF, 0x63, 0x7A, 0xCB, 0xED, 0xD4, 0x7B, 0xF3, 0x8C, 0x85, 0x80, 0xCA, 0x73, 0x4C, 
-0xAD, 0x06, 0x55, 0x35, 0xB0, 0x7A, 0x82, 0x78, 0x8D, 0xF7, 0x01, 0xEF, 0x03, 0x21, 0x08, 0x41, 
-0x14, 0x5E, 0x40, 0xA9, 0x48, 0xB4, 0x21, 0x04, 0x9C, 0xF7, 0x51, 0x0B, 0x65, 0x0D, 0xCA, 0x28, 
-0x0C, 0x71, 0x5B, 0x64, 0x83, 0x23, 0xB3, 0x16, 0xAA, 0x02, 0x5D, 0x95, 0x28, 0xD7, 0xC7, 0x77, 
-0xE6, 0x29, 0x7B, 0x2D, 0xE6, 0xE7, 0x27, 0xA1, 0xEC, 0x21, 0x9D, 0x05, 0xD2, 0xB2, 0x8F, 0x49, 
-0x52, 0xEA, 0x59, 0xCA, 0xFA, 0xD5, 0xAB, 0x38, 0xF7, 0xAC, 0x33, 0x39, 0xED, 0xF4, 0x53, 0x28, 
-0x8B, 0x9C, 0x76, 0x7B, 0x9E, 0x56, 0xBB, 0x4D, 0x08, 0x0A, 0xEF, 0x05, 0xC4, 0x92, 0xA5, 0x4D, 
-0xCA, 0xB2, 0x20, 0x21, 0x31, 0x43, 0x8D, 0xD1, 0x65, 0x73, 0xED, 0xB9, 0xC7, 0x4D, 0xEC, 0x3D, 
-0x74, 0xD9, 0xFF, 0xFD, 0xF0, 0xC7, 0xF7, 0xFF, 0xD2, 0x2F, 0xFD, 0xE2, 0xD4, 0x17, 0xBE, 0xF0, 
-0xC9, 0xE2, 0xD8, 0x7E, 0x59, 0xC2, 0x7F, 0x2F, 0x88, 0x88, 0xBE, 0xE9, 0x2B, 0x5B, 0x4F, 0xFC, 
-0xC0, 0xDF, 0xFC, 0xDB, 0x4F, 0xDE, 0xBD, 0x65, 0xCF, 0x7B, 0xFA, 0xBD, 0xF0, 0x8C, 0x2A, 0xA4, 
-0xE3, 0x50, 0x33, 0xDA, 0x64, 0xF8, 0x00, 0xD6, 0x40, 0x08, 0x05, 0x26, 0x71, 0x40, 0x9B, 0x33, 
-0x4E, 0x5B, 0xCD, 0x0B, 0x7F, 0xFC, 0x69, 0xFC, 0xE4, 0xEB, 0x5F, 0xCC, 0x8B, 0x5F, 0xFC, 0x0C, 
-0x36, 0xAC, 0x1B, 0xC1, 0x98, 0x9C, 0x5A, 0xEA, 0x30, 0xD2, 0xC5, 0x75, 0x66, 0x30, 0x65, 0x17, 
-0x7A, 0x0B, 0xF8, 0x9D, 0xF7, 0x31, 0xBF, 0x75, 0x33, 0x0B, 0xBB, 0xB7, 0x92, 0xF6, 0x17, 0x18, 
-0x51, 0x1E, 0x5B, 0xF5, 0xA1, 0xE8, 0xA1, 0x95, 0x47, 0x69, 0x87, 0x97, 0x92, 0x4A, 0x62, 0x6E, 
-0x85, 0x98, 0x49, 0x4F, 0x81, 0x08, 0xE2, 0x1C, 0x91, 0x59, 0x89, 0xB9, 0x70, 0x55, 0x40, 0x21, 
-0x68, 0x3C, 0x4A, 0x3C, 0x82, 0x10, 0x82, 0xC7, 0x2B, 0x41, 0x1B, 0x8B, 0x08, 0x04, 0x5F, 0x91, 
-0x2A, 0x21, 0x11, 0x01, 0xA3, 0xC9, 0xC5, 0x60, 0xEB, 0xE3, 0x6C, 0xDA, 0x7A, 0x80, 0x89, 0x99, 
-0x1E, 0x85, 0xD4, 0x10, 0x53, 0xC3, 0x79, 0xD0, 0x28, 0x2D, 0x84, 0x6C, 0xCF, 0x9E, 0x3D, 0xF7, 
-0x7C, 0xF1, 0x86, 0xFF, 0xB8, 0xE7, 0x03, 0x1F, 0x78, 0xF4, 0x78, 0xF6, 0x3C, 0xEA, 0x08, 0xB7, 
-0x2A, 0x1A, 0xE7, 0xEE, 0xD8, 0x3E, 0xFD, 0xE6, 0xC0, 0xC8, 0x09, 0x9E, 0x5A, 0x74, 0x19, 0xD1, 
-0x0E, 0x2D, 0xF3, 0x3C, 0xEE, 0xC2, 0x53, 0xF8, 0x89, 0x37, 0xBC, 0x80, 0x75, 0x6B, 0x53, 0x64, 
-0x6E, 0x07, 0xAD, 0x9D, 0x9B, 0xE0, 0xC0, 0x36, 0x96, 0x57, 0x05, 0xBA, 0x5D, 0x90, 0x99, 0x1A, 
-0xE8, 0x04, 0xD1, 0xA0, 0x6A, 0x9A, 0xB2, 0xDF, 0x45, 0x07, 0xC1, 0x68, 0x83, 0xF3, 0x39, 0x41, 
-0x07, 0x74, 0x62, 0x91, 0x20, 0x18, 0x74, 0xB4, 0xA6, 0x1A, 0x85, 0xB6, 0x0A, 0xAC, 0x80, 0x72, 
-0x28, 0xF1, 0x30, 0xC8, 0x37, 0xAE, 0x94, 0x41, 0x82, 0xC7, 0x2A, 0x30, 0x5A, 0xB0, 0x94, 0x58, 
-0xFA, 0xE8, 0xAA, 0x4D, 0x68, 0xCD, 0x90, 0x1F, 0xDC, 0xC7, 0xC2, 0x9E, 0x3D, 0xCC, 0xEE, 0xDA, 
-0x43, 0x98, 0x9B, 0xA7, 0x89, 0x82, 0x24, 0xA5, 0xD9, 0xAC, 0x71, 0xE6, 0x29, 0x27, 0x72, 0xF1, 
-0xA5, 0x17, 0xB0, 0x7C, 0xF9, 0x38, 0x9D, 0x6E, 0x8B, 0xD6, 0x7C, 0x8B, 0xAA, 0xA8, 0x50, 0x62, 
-0x48, 0x94, 0x41, 0x2B, 0x87, 0xB1, 0x0A, 0x57, 0x08, 0x01, 0x9B, 0x78, 0x5F, 0x3B, 0xA1, 0x35, 
-0x5F, 0x5E, 0xF6, 0xD5, 0x1B, 0xEF, 0x5C, 0xFB, 0xA2, 0x57, 0xFC, 0xE4, 0x3D, 0xEF, 0xF9, 0x1F, 
-0x5F, 0xEE, 0x7C, 0xF4, 0xA3, 0xEF, 0x5D, 0x0A, 0x98, 0xF8, 0x6F, 0x88, 0x0F, 0x7E, 0xF0, 0xFA, 
-0xDA, 0xCF, 0xBC, 0xED, 0x17, 0xAF, 0xBE, 0xF1, 0x5B, 0x77, 0xFE, 0x6A, 0xBB, 0x1D, 0x5E, 0x2D, 
-0x34, 0x37, 0x04, 0x6A, 0x16, 0x49, 0xD0, 0xB5, 0x26, 0xCE, 0x7B, 0x50, 0x15, 0x69, 0x4D, 0xA8, 
-0xDC, 0x2C, 0xAB, 0xD7, 0xD4, 0x78, 0xDE, 0x73, 0xAE, 0xE0, 0xE7, 0xDF, 0xF9, 0x5A, 0x5E, 0xFB, 
-0x13, 0xCF, 0xE5, 0xBC, 0x73, 0xD6, 0x51, 0x4F, 0x2B, 0x34, 0x39, 0x5A, 0x95, 0x98, 0xD0, 0x47, 
-0x85, 0x0A, 0x13, 0x1C, 0x61, 0xFF, 0x1E, 0x66, 0xEF, 0xBC, 0x8D, 0xD6, 0x96, 0x5B, 0x49, 0x17, 
-0x0E, 0xD2, 0xF0, 0x6D, 0xEA, 0xA1, 0x24, 0xF3, 0x81, 0x04, 0xB0, 0x5A, 0x83, 0x12, 0x84, 0x12, 
-0x14, 0x68, 0xA5, 0xD1, 0x62, 0x51, 0xC1, 0xA2, 0x45, 0x47, 0x61, 0x44, 0x81, 0xB6, 0x35, 0xF2, 
-0xCA, 0xA3, 0x95, 0x46, 0x79, 0x4F, 0x66, 0x14, 0x52, 0x96, 0x24, 0x16, 0x50, 0x9E, 0xE8, 0xC2, 
-0xA9, 0x71, 0x45, 0x89, 0x19, 0x4C, 0x2F, 0x24, 0xA0, 0xAD, 0x8A, 0x79, 0xAA, 0x75, 0xCC, 0x4C, 
-0xD6, 0xE9, 0x7B, 0xB6, 0xEF, 0x9E, 0xA4, 0x17, 0x52, 0x2A, 0xC9, 0x08, 0xA4, 0x04, 0xD1, 0x78, 
-0x5C, 0xA2, 0x95, 0x1C, 0xBA, 0xEC, 0x8A, 0x27, 0x7C, 0xE5, 0x63, 0x1F, 0xFB, 0x87, 0x47, 0x8D, 
-0x00, 0xF2, 0xA8, 0x22, 0xDC, 0x9B, 0x6F, 0x96, 0xE4, 0x83, 0x7F, 0xFD, 0x17, 0x2F, 0x9E, 0x5D, 
-0xE8, 0xBF, 0x58, 0x18, 0xAA, 0x89, 0xAD, 0x01, 0x1E, 0x54, 0xCE, 0xB0, 0xE9, 0xF1, 0xC2, 0x17, 
-0x5D, 0xC5, 0xD5, 0xCF, 0xBE, 0x94, 0x66, 0xD2, 0x41, 0xA6, 0xF7, 0xD0, 0xDE, 0xBE, 0x19, 0x33, 
-0x7B, 0x80, 0xAC, 0x2C, 0xA8, 0x25, 0x43, 0x94, 0x62, 0x58, 0xF0, 0x10, 0x9A, 0x4D, 0xF2, 0xB2, 
-0x22, 0xAB, 0x37, 0x31, 0x49, 0x8A, 0x77, 0x0E, 0xD1, 0x0E, 0x63, 0x35, 0x82, 0x86, 0x00, 0x56, 
-0x74, 0x8C, 0xF6, 0xD5, 0x71, 0x0B, 0x24, 0x1A, 0x94, 0x0A, 0xA0, 0x24, 0xE6, 0x5F, 0x10, 0x89, 
-0x81, 0x0C, 0x28, 0x20, 0x60, 0x54, 0x40, 0xAB, 0x12, 0x2D, 0x25, 0x89, 0x94, 0x0C, 0x59, 0x85, 
-0xCA, 0x7B, 0x84, 0x76, 0x87, 0x72, 0x6E, 0x8E, 0xE9, 0x7D, 0xFB, 0x99, 0xDE, 0xBB, 0x0F, 0xBA, 
-0x6D, 0x9A, 0x5A, 0xA1, 0x13, 0xC5, 0xF2, 0xB5, 0x2B, 0xB9, 0xF0, 0x9C, 0xB3, 0x38, 0xFF, 0xFC, 
-0x73, 0x49, 0x92, 0x94, 0xB9, 0xD9, 0x69, 0x7C, 0x59, 0x51, 0x54, 0x7D, 0x2A, 0x9F, 0x13, 0x84, 
-0xA8, 0xCF, 0xB2, 0xC3, 0x14, 0x41, 0xB4, 0x88, 0x59, 0x01, 0xE6, 0xFC, 0x2D, 0x9B, 0xEF, 0x3E, 
-0x7B, 0xCB, 0x96, 0x4F, 0xB5, 0xFF, 0xEC, 0x97, 0x7F, 0x6B, 0xEF, 0xBF, 0x7C, 0xEE, 0x5F, 0x1E, 
-0x55, 0x3A, 0xAC, 0x25, 0x7C, 0xFF, 0x10, 0x11, 0x35, 0x35, 0xD5, 0x5D, 0xF3, 0xE7, 0x7F, 0xFE, 
-0xD7, 0xAF, 0xB9, 0xE7, 0xBE, 0xED, 0xD7, 0x2A, 0x9A, 0x57, 0x5A, 0xD3, 0x18, 0x76, 0x1E, 0xD5, 
-0x68, 0x0E, 0xA1, 0x8C, 0xC2, 0xE5, 0x1D, 0x6C, 0xDD, 0xE0, 0xCB, 0x19, 0x46, 0x46, 0x14, 0xE7, 
-0x9F, 0x7F, 0x12, 0x6F, 0xFC, 0xC9, 0x17, 0xF3, 0xA6, 0xD7, 0xBF, 0x98, 0xC7, 0x5D, 0x7A, 0x1A, 
-0x59, 0xAD, 0x44, 0x54, 0x0F, 0x93, 0x94, 0x88, 0x74, 0x48, 0xB4, 0x43, 0x51, 0x42, 0x6B, 0x1A, 
-0xD9, 0xB3, 0x83, 0xF9, 0x6D, 0xF7, 0xD2, 0xDB, 0xBB, 0x95, 0xA1, 0xB2, 0x45, 0xCD, 0x75, 0x48, 
-0x5C, 0x1F, 0x13, 0x2A, 0xCC, 0x20, 0x49, 0x78, 0x34, 0x7B, 0x78, 0xD0, 0x83, 0x4A, 0x0E, 0xD8, 
-0x01, 0x8D, 0x58, 0x94, 0xA8, 0x18, 0xA5, 0xA6, 0xA0, 0xAC, 0x3C, 0xDA, 0x18, 0x6A, 0xD6, 0x12, 
-0x9C, 0x47, 0xA1, 0x09, 0xA2, 0x71, 0x58, 0x7A, 0x95, 0x42, 0xD7, 0x46, 0x10, 0x3B, 0x84, 0x53, 
-0x09, 0xC5, 0x20, 0xED, 0x29, 0x5A, 0x81, 0xF2, 0x88, 0x8A, 0x13, 0x4F, 0x74, 0x46, 0x4E, 0x8D, 
-0x5D, 0x13, 0x0B, 0x4C, 0x2C, 0x78, 0x9C, 0x6E, 0xE2, 0xC8, 0x50, 0x3A, 0x25, 0x4D, 0x53, 0x6D, 
-0x54, 0x59, 0xED, 0xDC, 0xBA, 0xE5, 0x1B, 0xFB, 0x0F, 0x6E, 0x3B, 0x74, 0x6C, 0x5F, 0x1D, 0xAF, 
-0x78, 0x54, 0x11, 0xEE, 0x93, 0x9F, 0x7C, 0xC5, 0xD0, 0x27, 0x3E, 0xFE, 0x85, 0xD7, 0x15, 0xB9, 
-0xBE, 0xDC, 0x91, 0x6A, 0x63, 0x0C, 0x21, 0xE4, 0xD8, 0xA4, 0xE0, 0xC4, 0xF5, 0x43, 0xBC, 0xE9, 
-0x8D, 0x2F, 0xE1, 0xFC, 0xF3, 0xD7, 0xA3, 0x3A, 0x07, 0xE9, 0xDE, 0xB3, 0x85, 0xDE, 0xDE, 0x1D, 
-0x34, 0xE8, 0x53, 0x54, 0x25, 0x6A, 0x78, 0x9C, 0xB2, 0xB9, 0x8C, 0x39, 0xD3, 0xC4, 0xD5, 0x46, 
-0xD1, 0xD9, 0x08, 0xED, 0x7E, 0x4E, 0x9E, 0xE7, 0x28, 0x23, 0x28, 0xE3, 0x71, 0xDE, 0xA1, 0xC5, 
-0x92, 0xA5, 0x75, 0xF0, 0x21, 0x1A, 0x02, 0x94, 0xC4, 0x80, 0x3C, 0xA5, 0x10, 0xA5, 0x50, 0xE8, 
-0xC8, 0xB5, 0x03, 0xB2, 0x95, 0x81, 0xC9, 0x4E, 0x06, 0x7A, 0x2A, 0x45, 0x74, 0x79, 0xF1, 0x55, 
-0x89, 0xAA, 0x1C, 0x4D, 0x63, 0x19, 0xA9, 0x65, 0x24, 0x65, 0xC9, 0xFC, 0xA1, 0x03, 0xEC, 0xBD, 
-0x77, 0x0B, 0xF7, 0xDD, 0x75, 0x07, 0xA1, 0xD7, 0xA1, 0xA6, 0x04, 0xAB, 0x35, 0x27, 0x9D, 0xBC, 
-0x91, 0xA7, 0x3C, 0xE9, 0x4A, 0xCE, 0x3E, 0xE7, 0x34, 0x94, 0x2E, 0xD9, 0xB9, 0x77, 0x2B, 0x85, 
-0x06, 0x6C, 0x42, 0xF0, 0xD1, 0x20, 0xD1, 0xC8, 0xEA, 0x38, 0x57, 0x28, 0xC4, 0xA5, 0x68, 0x7F, 
-0xF2, 0xC1, 0xA9, 0xFD, 0x8F, 0xFF, 0xDC, 0x4D, 0x5F, 0x5D, 0xF9, 0xCA, 0x17, 0xBD, 0x62, 0xFF, 
-0xED, 0x9B, 0xBE, 0x35, 0xFB, 0xDE, 0xF7, 0x2E, 0x49, 0xBB, 0x8F, 0x65, 0x7C, 0xF0, 0x83, 0x1F, 
-0xAC, 0xBD, 0xE3, 0x5D, 0xBF, 0x7F, 0xE9, 0xBF, 0x7F, 0xEC, 0x8B, 0xEF, 0xC9, 0x73, 0xF3, 0xDA, 
-0x5A, 0xBA, 0xEC, 0x44, 0xF1, 0xDA, 0x8A, 0x44, 0x0F, 0x99, 0xA2, 0x5C, 0x40, 0x7C, 0x0F, 0xD1, 
-0x7D, 0x6A, 0x59, 0xC5, 0x86, 0x13, 0x47, 0x78, 0xED, 0xEB, 0x7E, 0x8C, 0x9F, 0xFD, 0xA9, 0xD7, 
-0xF2, 0xDC, 0x67, 0x3D, 0x91, 0xB5, 0x6B, 0x86, 0x40, 0xF7, 0xF1, 0xBA, 0xC0, 0xD6, 0x85, 0xBC, 
-0x6A, 0x91, 0xAA, 0x02, 0xAD, 0x72, 0x98, 0x3B, 0x44, 0xB1, 0xED, 0x6E, 0xA6, 0xB7, 0x6E, 0xA2, 
-0x77, 0x68, 0x37, 0xA6, 0xB7, 0x40, 0x2D, 0x94, 0x18, 0x5F, 0x22, 0x38, 0x14, 0xB1, 0x4A, 0x83, 
-0x22, 0xEA, 0x08, 0x44, 0x47, 0xF6, 0x0D, 0x4A, 0x21, 0x18, 0x04, 0x8B, 0x60, 0x88, 0x3C, 0x19, 
-0x77, 0x80, 0x46, 0x29, 0x08, 0x9E, 0xAA, 0xAA, 0xA2, 0xDA, 0x21, 0x6D, 0xE2, 0x74, 0x1D, 0x97, 
-0x2C, 0x43, 0xEA, 0xAB, 0xE9, 0x9A, 0x71, 0x66, 0x8B, 0x1A, 0x55, 0xB6, 0x02, 0x9F, 0x34, 0xA9, 
-0x82, 0x46, 0x6B, 0x43, 0x6A, 0x0C, 0x04, 0xC1, 0x05, 0x08, 0xA6, 0x8E, 0x6A, 0xAC, 0x66, 0xFF, 
-0x5C, 0xC5, 0x96, 0x3D, 0xF3, 0x14, 0xD2, 0xC0, 0xA9, 0x14, 0x94, 0x26, 0xB8, 0x92, 0x10, 0xCA, 
-0xFA, 0xD8, 0x48, 0x73, 0xD3, 0xC1, 0xA9, 0x1D, 0x77, 0x3E, 0x5A, 0x6C, 0x1B, 0x8F, 0x2A, 0xC2, 
-0x1D, 0x1E, 0x5E, 0x77, 0xDA, 0xDD, 0x9B, 0x77, 0xBF, 0xBD, 0xAC, 0xF4, 0x5A, 0x4F, 0xA2, 0x14, 
-0x0A, 0xD1, 0x15, 0xF5, 0x86, 0xE7, 0xA9, 0x4F, 0x3E, 0x8F, 0x6B, 0x5E, 0x76, 0x35, 0x2B, 0xC6, 
-0x04, 0x66, 0xF6, 0x31, 0xB3, 0xE9, 0x36, 0x98, 0x39, 0x44, 0xA3, 0xA6, 0xF1, 0x36, 0xE5, 0x60, 
-0x9E, 0xB0, 0x7D, 0xCE, 0x71, 0xCF, 0xC1, 0x92, 0x2D, 0xFB, 0x3B, 0xB4, 0x4B, 0x4B, 0x25, 0x35, 
-0x86, 0x46, 0xC7, 0x30, 0xA9, 0x25, 0x2F, 0x7A, 0x24, 0xD6, 0x50, 0xB3, 0x0D, 0x3A, 0x0B, 0x6D, 
-0x92, 0x34, 0x41, 0x54, 0x88, 0x5C, 0xAB, 0x25, 0xFA, 0x00, 0x12, 0xCD, 0x73, 0x31, 0x22, 0x5A, 
-0x0F, 0x56, 0x78, 0x19, 0x90, 0x72, 0x88, 0xD6, 0x57, 0x01, 0x8D, 0x50, 0x33, 0x06, 0x13, 0x1C, 
-0x78, 0x87, 0x0A, 0x05, 0x59, 0x02, 0x43, 0x29, 0x84, 0xB2, 0x4F, 0x77, 0x76, 0x9A, 0x7D, 0xDB, 
-0xB7, 0x31, 0xB3, 0x77, 0x1F, 0xD2, 0xED, 0xD3, 0xD0, 0x8A, 0x86, 0x55, 0x9C, 0xB6, 0x71, 0x03, 
-0xE7, 0x9E, 0x79, 0x12, 0xAB, 0x56, 0x8E, 0xB1, 0xB0, 0xD0, 0x61, 0xE2, 0xD0, 0x41, 0x8C, 0x08, 
-0x88, 0xA7, 0x2C, 0x0B, 0x42, 0xB4, 0xF4, 0x2A, 0x34, 0x56, 0x94, 0x1F, 0xCF, 0x7B, 0x9D, 0x8B, 
-0xEE, 0xDE, 0xBE, 0xFD, 0xB4, 0x8F, 0xFE, 0xEB, 0x27, 0x27, 0xFF, 0xF0, 0xFF, 0x7D, 0xCF, 0xE4, 
-0xC7, 0x3E, 0xF6, 0xB1, 0x25, 0xBF, 0xDD, 0xC7, 0x20, 0x7E, 0xF7, 0x77, 0xFF, 0x72, 0xD9, 0xEF, 
-0xFE, 0xFE, 0x07, 0x5F, 0xB7, 0x65, 0xCB, 0xBE, 0x5F, 0x55, 0x34, 0x9F, 0xE6, 0x5C, 0x18, 0xAD, 
-0x9C, 0xD3, 0x69, 0x5A, 0xC3, 0xFB, 0x02, 0xAD, 0x0A, 0xB4, 0xF4, 0xD0, 0xBA, 0xC7, 0xF8, 0x98, 
-0xE5, 0x8A, 0xCB, 0xCE, 0xE4, 0x0D, 0x6F, 0x7C, 0x11, 0x2F, 0x7F, 0xE9, 0xB3, 0xB9, 0xE8, 0xBC, 
-0x53, 0x31, 0x26, 0xA7, 0xAC, 0x16, 0x62, 0x84, 0x64, 0x5A, 0x52, 0x55, 0x2D, 0x6A, 0xB6, 0xC2, 
-0x56, 0x5D, 0x98, 0xDA, 0x47, 0xEB, 0xBE, 0x4D, 0xCC, 0x6E, 0xBD, 0x8B, 0x30, 0x3B, 0xC1, 0x50, 
-0xC8, 0x69, 0x50, 0x62, 0x7C, 0x8C, 0xF1, 0x52, 0xCA, 0x47, 0x97, 0xC7, 0x81, 0xD0, 0x81, 0x52, 
-0x04, 0xD4, 0x60, 0xEC, 0xC7, 0x18, 0xB2, 0xD8, 0xE2, 0x7C, 0x10, 0xE5, 0x50, 0x78, 0x82, 0xAF, 
-0x50, 0x46, 0x13, 0x94, 0x21, 0x98, 0x3A, 0x2E, 0x19, 0xA1, 0xC7, 0x28, 0x33, 0x45, 0x83, 0xA9, 
-0x7C, 0x88, 0xBB, 0xF6, 0x15, 0xDC, 0x7B, 0x30, 0x67, 0xE7, 0x4C, 0xCE, 0xA1, 0x56, 0x41, 0x56, 
-0x6F, 0x90, 0xD8, 0x04, 0x29, 0x7A, 0x30, 0xF8, 0xAE, 0x33, 0x16, 0xEA, 0xCB, 0x98, 0xEB, 0x1B, 
-0xEE, 0xDC, 0x76, 0x90, 0x76, 0xA9, 0x11, 0x5D, 0xC7, 0x85, 0x18, 0x38, 0xE4, 0x7C, 0x61, 0x5D, 
-0x99, 0xCF, 0xF7, 0x8A, 0xF0, 0xA5, 0x1B, 0x6E, 0xF8, 0xF4, 0xA3, 0x22, 0x03, 0xDF, 0xA3, 0x86, 
-0x70, 0x45, 0x44, 0xBD, 0xEF, 0xF7, 0x3F, 0x70, 0xF5, 0xDE, 0x3D, 0xB3, 0xAF, 0x0E, 0x92, 0x34, 
-0x8C, 0xAE, 0xA9, 0x40, 0x40, 0x74, 0x8F, 0x91, 0x31, 0x78, 0xCD, 0x6B, 0x9E, 0xC3, 0x55, 0x4F, 
-0x3A, 0x9B, 0xC4, 0xCD, 0xE2, 0x0F, 0x6E, 0xA3, 0xDA, 0x7D, 0x1F, 0xB6, 0xBF, 0x00, 0x89, 0xA1, 
-0xAB, 0x86, 0xF8, 0xD4, 0x37, 0x77, 0xF0, 0x91, 0xCF, 0xDD, 0xC3, 0xA7, 0x6E, 0xDC, 0xCB, 0x97, 
-0x6E, 0xDA, 0xC7, 0x8D, 0xB7, 0xED, 0x60, 0xDF, 0x54, 0x07, 0x6F, 0x12, 0xB2, 0x66, 0x93, 0x7A, 
-0x3D, 0xC1, 0x88, 0x47, 0x97, 0x9E, 0xCC, 0x68, 0xD0, 0x01, 0x51, 0x91, 0x4C, 0x95, 0x52, 0x03, 
-0xC2, 0x1D, 0x38, 0x73, 0x0F, 0x06, 0x5C, 0x1C, 0x73, 0x01, 0xF0, 0x28, 0x11, 0xD4, 0x60, 0xDB, 
-0x85, 0x08, 0x55, 0xB7, 0x4F, 0x62, 0xA2, 0xEA, 0x00, 0xE3, 0xB0, 0x19, 0xD4, 0xEB, 0x86, 0x46, 
-0xAA, 0x69, 0x68, 0x85, 0xCC, 0x2D, 0xD0, 0x9F, 0x98, 0x64, 0xEA, 0x9E, 0xAD, 0xEC, 0xB9, 0x73, 
-0x33, 0xDD, 0x89, 0x09, 0xE8, 0xB7, 0x19, 0xC9, 0x14, 0x4F, 0xB9, 0xF2, 0x0A, 0x9E, 0xF8, 0xF8, 
-0x2B, 0x49, 0x95, 0x62, 0x6E, 0xFA, 0x10, 0xB3, 0xB3, 0x93, 0xE8, 0xCC, 0x60, 0x52, 0x83, 0x68, 
-0x8D, 0x88, 0x20, 0xA2, 0x54, 0x92, 0xD4, 0x53, 0x57, 0xCA, 0x29, 0x87, 0x26, 0xA6, 0xAF, 0xBC, 
-0xFE, 0xFA, 0x5B, 0x87, 0xDE, 0xFE, 0xF6, 0x5F, 0xDA, 0x7E, 0xE3, 0x8D, 0x9F, 0xED, 0x3C, 0x5A, 
-0x56, 0xFB, 0x25, 0x7C, 0x67, 0x5C, 0x77, 0x9D, 0x98, 0xBD, 0x7B, 0xEF, 0xB8, 0xEC, 0xDF, 0xFF, 
-0xFD, 0x4B, 0xBF, 0xB0, 0x30, 0xEF, 0x7F, 0xDA, 0x57, 0x9C, 0xA6, 0xD5, 0x68, 0x92, 0x65, 0x23, 
-0x0A, 0x31, 0x68, 0xE5, 0x71, 0xBE, 0x43, 0x2D, 0x75, 0x24, 0x59, 0xCE, 0x99, 0x67, 0xAC, 0xE6, 
-0xD5, 0xD7, 0x3C, 0x97, 0x77, 0xFC, 0xDC, 0x6B, 0xB9, 0xEA, 0xAA, 0x4B, 0x18, 0x1F, 0xB7, 0x14, 
-0xE5, 0x3C, 0xC6, 0x14, 0xD4, 0x86, 0x52, 0xA0, 0x8B, 0x84, 0x1E, 0x35, 0x5D, 0x62, 0xA4, 0xC2, 
-0xEF, 0xDF, 0xC1, 0xEC, 0xDD, 0x77, 0xD2, 0xDA, 0x7E, 0x37, 0x66, 0x7E, 0x92, 0x11, 0x5D, 0xD1, 
-0xA0, 0x44, 0x95, 0x3D, 0xAC, 0x52, 0x18, 0x25, 0xD1, 0x40, 0xB6, 0xB8, 0xCB, 0x5B, 0x14, 0x34, 
-0x00, 0xA5, 0xF4, 0xC0, 0xCB, 0x67, 0xA0, 0x52, 0x50, 0x44, 0x43, 0x99, 0x76, 0xB1, 0x80, 0x64, 
-0xF4, 0xBA, 0x25, 0x97, 0x04, 0x9F, 0x8E, 0xE1, 0x6B, 0xAB, 0x99, 0xCC, 0x9B, 0x7C, 0x63, 0xD3, 
-0x24, 0x1F, 0xFF, 0xF2, 0x7D, 0xFC, 0xCB, 0x97, 0x36, 0xF3, 0x8D, 0xBB, 0x27, 0xF9, 0xE2, 0x2D, 
-0xDB, 0xD8, 0x74, 0xDF, 0x5E, 0xC6, 0xC6, 0xC6, 0x58, 0xB1, 0x6C, 0x84, 0x91, 0xD4, 0xD0, 0xAC, 
-0x1B, 0x50, 0x0E, 0x6C, 0x82, 0xB3, 0x0D, 0x0A, 0xDD, 0xE0, 0xDE, 0x9D, 0xD3, 0x1C, 0x98, 0xEF, 
-0x80, 0x19, 0xC5, 0x49, 0xAC, 0xB8, 0x5D, 0xAF, 0xD5, 0x4C, 0xB7, 0xDB, 0x4E, 0xD6, 0xAF, 0x39, 
-0xE1, 0xF3, 0x77, 0xDE, 0xF5, 0xF5, 0xE9, 0x63, 0xFB, 0xEF, 0x78, 0xC4, 0xA3, 0x86, 0x70, 0xEB, 
-0x6B, 0xCF, 0x1D, 0xFD, 0xF2, 0x67, 0x6F, 0x7C, 0xCB, 0xC2, 0x7C, 0x71, 0xA5, 0xD2, 0x0D, 0x13, 
-0x19, 0xAF, 0x42, 0xE8, 0xB2, 0x61, 0xC3, 0x08, 0x6F, 0x7E, 0xF3, 0x8F, 0x73, 0xFA, 0xE9, 0xCB, 
-0x61, 0x6E, 0x2F, 0xBD, 0x5D, 0x77, 0xD1, 0xDB, 0x73, 0x1F, 0x35, 0xA3, 0xE9, 0x85, 0x94, 0x7B, 
-0x27, 0x1C, 0xFF, 0xF1, 0xB5, 0x9D, 0xDC, 0xB1, 0xCB, 0x33, 0xEB, 0xC6, 0xE8, 0xB8, 0x11, 0xE6, 
-0x4B, 0xCD, 0xD4, 0x82, 0x63, 0xEF, 0xA1, 0x59, 0xB0, 0x09, 0x6B, 0xD7, 0xAE, 0x25, 0x11, 0xF0, 
-0xED, 0x2E, 0xCD, 0x46, 0x3D, 0x3A, 0x72, 0x13, 0xD0, 0x7A, 0x40, 0xA4, 0x03, 0xE7, 0xB3, 0x38, 
-0xE0, 0xD4, 0x80, 0x59, 0x03, 0x4A, 0x05, 0x06, 0x9A, 0xDF, 0xC1, 0x96, 0x0B, 0x14, 0x0A, 0x9B, 
-0xA6, 0xB1, 0xFC, 0xBA, 0xF2, 0x38, 0x89, 0x7A, 0x59, 0xE7, 0x4A, 0x6A, 0xD6, 0x30, 0xDE, 0x68, 
-0xB0, 0xBC, 0x3E, 0x44, 0x35, 0xBF, 0xC0, 0xB0, 0x4E, 0x50, 0xDD, 0x9C, 0x99, 0xBD, 0x7B, 0xC8, 
-0xA7, 0xA7, 0xD1, 0xFD, 0x0E, 0x75, 0x60, 0x79, 0x73, 0x84, 0xAB, 0xAE, 0x78, 0x3C, 0x2B, 0xC7, 
-0x9B, 0x74, 0x5A, 0xB3, 0xB4, 0x3B, 0x0B, 0x74, 0xBB, 0x6D, 0x8C, 0xD6, 0x94, 0x65, 0x41, 0xA6, 
-0x32, 0x54, 0x30, 0x4A, 0x54, 0x62, 0x24, 0x30, 0x5E, 0x7A, 0x2E, 0xB8, 0xFD, 0xF6, 0xBB, 0x4E, 
-0xF8, 0xF4, 0xA7, 0xBE, 0xB2, 0xE7, 0x63, 0x1F, 0xFB, 0xE0, 0xCC, 0xA3, 0xC9, 0x72, 0xBB, 0x84, 
-0x07, 0xE2, 0xDA, 0x6B, 0xFF, 0xBF, 0xA1, 0x7F, 0xFF, 0x97, 0x3F, 0xB9, 0xEA, 0xA6, 0x6F, 0x6F, 
-0xF9, 0xAD, 0x4E, 0xAF, 0x7A, 0x5E, 0x08, 0xD9, 0xB2, 0x5A, 0x6D, 0xA5, 0xAE, 0x2A, 0x87, 0x08, 
-0x68, 0x5D, 0x51, 0x56, 0xB3, 0x08, 0x3D, 0x46, 0x46, 0x85, 0xF3, 0xCF, 0x3B, 0x91, 0xB7, 0xBC, 
-0xE5, 0x1A, 0xDE, 0xF8, 0xC6, 0x97, 0xB3, 0x7E, 0xFD, 0x18, 0x49, 0x5A, 0xA2, 0x13, 0x87, 0xB1, 
-0x1E, 0x6B, 0x03, 0x8A, 0x82, 0xAA, 0xD7, 0x22, 0x93, 0x12, 0xE5, 0x72, 0xD8, 0xB9, 0x9D, 0xB9, 
-0xFB, 0xEE, 0xA6, 0xB7, 0x7B, 0x1B, 0xB5, 0x5E, 0x8B, 0x21, 0x1C, 0xB5, 0x50, 0xA1, 0x82, 0x43, 
-0x8B, 0x60, 0x88, 0x02, 0x2D, 0x2A, 0x12, 0xA8, 0x08, 0x48, 0x80, 0xA0, 0xA2, 0x54, 0xAB, 0x94, 
-0x39, 0x4C, 0xC1, 0x03, 0x11, 0x64, 0xF0, 0x59, 0x1F, 0x3D, 0x78, 0xAC, 0x25, 0xAF, 0xA0, 0xB0, 
-0x43, 0xB8, 0xDA, 0x1A, 0xEE, 0x3B, 0xE8, 0xF8, 0xCA, 0x1D, 0xFB, 0xF9, 0xEC, 0x8D, 0xBB, 0xB8, 
-0x71, 0xDB, 0x21, 0x5A, 0x7E, 0x05, 0x87, 0x8A, 0x8C, 0x56, 0x48, 0x98, 0xEB, 0xE7, 0xF4, 0xDB, 
-0x1D, 0x9A, 0x99, 0xE5, 0x8C, 0x0D, 0xAB, 0x91, 0xA2, 0x83, 0x31, 0x25, 0x62, 0x14, 0x41, 0xD5, 
-0x91, 0x64, 0x94, 0x3D, 0x87, 0x3A, 0x6C, 0xDF, 0x3D, 0x4D, 0x45, 0x03, 0x51, 0x29, 0x26, 0xA9, 
-0x11, 0x02, 0x2A, 0x4B, 0xAD, 0x9D, 0x3C, 0xB4, 0x77, 0xD3, 0xBF, 0x7F, 0xE2, 0xC3, 0x77, 0x7F, 
-0xE8, 0x43, 0x1F, 0x3A, 0xEE, 0xC7, 0xFC, 0xA3, 0x82, 0x70, 0x45, 0x44, 0xFD, 0xDC, 0x5B, 0x7F, 
-0xF3, 0xA2, 0x9D, 0x3B, 0x0E, 0xBE, 0xD5, 0x85, 0x6C, 0xAD, 0x88, 0x51, 0x22, 0x82, 0x55, 0x01, 
-0x65, 0xFB, 0x3C, 0xE5, 0xA9, 0xE7, 0xF3, 0x92, 0x97, 0x3E, 0x95, 0xF1, 0xA1, 0x92, 0xB0, 0xFF, 
-0x3E, 0x5A, 0xBB, 0xB6, 0x90, 0xE4, 0x73, 0xA4, 0x59, 0x93, 0x3D, 0xF3, 0x96, 0xFF, 0xB8, 0x61, 
-0x27, 0xD7, 0xDF, 0x31, 0xCF, 0x8C, 0xAC, 0xA4, 0x94, 0xB5, 0xF4, 0x18, 0xC2, 0xA9, 0x11, 0x3A, 
-0x95, 0x65, 0xDF, 0x42, 0x9B, 0x5D, 0xBB, 0x26, 0x71, 0x85, 0x63, 0xED, 0x8A, 0xD5, 0x9C, 0x30, 
-0x3A, 0x06, 0x55, 0x0F, 0xA5, 0x03, 0x4A, 0x07, 0xB4, 0x44, 0x97, 0x96, 0x38, 0xB0, 0x14, 0x21, 
-0xAE, 0xEF, 0x04, 0x25, 0x28, 0x25, 0x83, 0xE4, 0x1C, 0xF1, 0x33, 0xF1, 0x13, 0x86, 0x80, 0xC2, 
-0x8B, 0xE0, 0x24, 0xE0, 0x51, 0x68, 0x63, 0xB0, 0x46, 0x63, 0x95, 0xC6, 0x28, 0x30, 0x4A, 0x93, 
-0x68, 0xCD, 0x68, 0x73, 0x98, 0x44, 0x34, 0xAE, 0xDB, 0x67, 0x54, 0xA7, 0x64, 0xBD, 0x92, 0xB9, 
-0x7B, 0x76, 0x30, 0x71, 0xD7, 0x3D, 0xB4, 0xF6, 0xEF, 0x87, 0x5E, 0x9B, 0x0B, 0xCF, 0x39, 0x9D, 
-0xE7, 0x3E, 0xF3, 0x2A, 0x08, 0x8E, 0xAD, 0xF7, 0xDE, 0x0B, 0x85, 0xA7, 0xAE, 0x33, 0x8C, 0x24, 
-0x84, 0x00, 0x55, 0x10, 0xEA, 0xF5, 0x11, 0x55, 0x95, 0x55, 0xDD, 0x95, 0xF9, 0xD9, 0xF3, 0xED, 
-0xEE, 0xC5, 0x9F, 0xFD, 0xEC, 0x37, 0xCC, 0x2B, 0xDE, 0xF2, 0xE6, 0x1D, 0x37, 0x7D, 0xF5, 0x0B, 
-0xC5, 0x92, 0xB4, 0xFB, 0xE8, 0xC2, 0x75, 0xD7, 0x5D, 0x67, 0x56, 0xAE, 0xBC, 0xF8, 0xD4, 0x0F, 
-0x7E, 0xF0, 0x9F, 0x7F, 0x6D, 0xCB, 0x3D, 0xBB, 0xDF, 0xE9, 0x7C, 0x7A, 0x61, 0x23, 0x1B, 0x4F, 
-0x35, 0x99, 0xF2, 0x1E, 0x44, 0x02, 0xA9, 0xF5, 0x84, 0xD0, 0xA6, 0x56, 0xF7, 0x9C, 0x7D, 0xF6, 
-0x09, 0xBC, 0xE9, 0x2D, 0x2F, 0xE3, 0x97, 0x7F, 0xED, 0x67, 0xB8, 0xEC, 0xB2, 0x33, 0x69, 0xD4, 
-0x21, 0x49, 0x3D, 0x55, 0xD9, 0x42, 0xA9, 0x8A, 0x2A, 0x94, 0x74, 0x7A, 0x2D, 0xAC, 0xF2, 0xA4, 
-0xA9, 0x85, 0x5E, 0x97, 0x72, 0xF3, 0x66, 0xE6, 0xEE, 0xBA, 0x13, 0x26, 0x0E, 0x50, 0xEB, 0xB7, 
-0x19, 0x55, 0x60, 0x71, 0x04, 0x1F, 0x77, 0xE5, 0x26, 0x49, 0x10, 0x51, 0x51, 0xB2, 0x1D, 0xD8, 
-0x26, 0xA2, 0x33, 0x97, 0xC2, 0x44, 0xFF, 0x9D, 0xC3, 0xF3, 0x41, 0x29, 0x8F, 0x22, 0xB6, 0x98, 
-0x82, 0x31, 0xA6, 0x37, 0x28, 0x2B, 0x8F, 0xB3, 0x43, 0x54, 0x8D, 0x75, 0xEC, 0x9E, 0x4F, 0xF8, 
-0xE8, 0x17, 0x36, 0xF3, 0x89, 0x1B, 0xEE, 0x63, 0xDB, 0xBC, 0x47, 0xCC, 0x46, 0xDA, 0x6A, 0x9C, 
-0x8E, 0xD4, 0x31, 0x8D, 0x95, 0x38, 0x6F, 0x98, 0x9C, 0x9B, 0xA2, 0x6A, 0xCD, 0x71, 0xE1, 0x99, 
-0x27, 0x91, 0xD9, 0x92, 0x2C, 0x29, 0x11, 0x71, 0x28, 0xDB, 0x04, 0x33, 0xC4, 0x42, 0xAE, 0xD9, 
-0x33, 0xB1, 0xC0, 0x42, 0x4F, 0xE3, 0x24, 0x05, 0x9B, 0x51, 0x94, 0x7D, 0xBC, 0xAB, 0x12, 0x6B, 
-0x65, 0xF7, 0x73, 0x9F, 0xFF, 0xD2, 0xAF, 0xFC, 0xD3, 0x3F, 0x7D, 0xE0, 0xB8, 0x57, 0xA9, 0x3D, 
-0x2A, 0x08, 0xF7, 0x3D, 0xEF, 0x79, 0x8F, 0xB9, 0xF6, 0xBD, 0x7F, 0xFE, 0xAC, 0x6E, 0x4F, 0x5E, 
-0x0A, 0x59, 0x53, 0x29, 0x0B, 0x12, 0x48, 0x13, 0xA1, 0x56, 0x2F, 0x79, 0xF1, 0x4B, 0xAE, 0xE2, 
-0x29, 0x4F, 0x3D, 0x87, 0x86, 0x9F, 0x27, 0xDF, 0x75, 0x0F, 0xC5, 0xE4, 0x6E, 0x6C, 0xA8, 0xE8, 
-0x94, 0x9A, 0x7B, 0x27, 0x34, 0x9F, 0xFE, 0xC6, 0x3E, 0xF6, 0x74, 0xC6, 0xF0, 0x6C, 0xA0, 0x20, 
-0xDE, 0xC0, 0x60, 0xEB, 0x14, 0x62, 0x48, 0xD3, 0x65, 0x74, 0x73, 0xC7, 0x81, 0x3D, 0x13, 0x8C, 
-0x0F, 0x8D, 0x72, 0xFA, 0x49, 0x1B, 0x30, 0x3A, 0x5A, 0x61, 0x95, 0xAA, 0x06, 0xA1, 0x88, 0x51, 
-0x37, 0xAB, 0x06, 0x7E, 0x85, 0x32, 0xA8, 0xFA, 0x2C, 0x6A, 0x40, 0xFA, 0x4A, 0x50, 0xD1, 0xE1, 
-0x70, 0x20, 0x01, 0x47, 0x1A, 0xD6, 0x36, 0xC5, 0x68, 0x03, 0x02, 0x3A, 0x28, 0xB4, 0x8A, 0x1E, 
-0x10, 0xDE, 0x7B, 0x8C, 0x35, 0x24, 0xB5, 0x1A, 0xB8, 0x40, 0x28, 0x4A, 0x54, 0x5E, 0x92, 0x39, 
-0x18, 0x95, 0x84, 0xAC, 0xF2, 0x94, 0x9D, 0x16, 0xB3, 0x13, 0x7B, 0xE8, 0xCE, 0x4D, 0x33, 0x9C, 
-0x6A, 0xD6, 0x8E, 0x8F, 0xB3, 0x71, 0xD5, 0x4A, 0xFA, 0x53, 0x73, 0xCC, 0xCE, 0x1D, 0x44, 0x8B, 
-0x50, 0xA7, 0x46, 0x40, 0x28, 0x9C, 0x47, 0xB4, 0x52, 0xCA, 0xA6, 0x49, 0xD1, 0xEB, 0xAC, 0x5D, 
-0x68, 0xF5, 0x1E, 0xB7, 0x7B, 0xEB, 0x7E, 0xBF, 0x79, 0xD3, 0xAE, 0x7D, 0x77, 0xDC, 0x71, 0xC3, 
-0xFC, 0xB1, 0xFD, 0xB9, 0x84, 0xE3, 0x13, 0xD7, 0x5D, 0xB7, 0x39, 0x7D, 0xDF, 0x6F, 0xFD, 0xC5, 
-0x13, 0xBF, 0x78, 0xFD, 0x37, 0x7E, 0xB9, 0xD5, 0xF6, 0xD7, 0x88, 0xAA, 0xAF, 0xA9, 0x67, 0xA3, 
-0x3A, 0x2F, 0x0A, 0x85, 0x40, 0x66, 0x35, 0x2E, 0xB4, 0x50, 0xD2, 0xA1, 0xD9, 0xF4, 0x3C, 0xF9, 
-0xA9, 0x17, 0xF2, 0xDA, 0xD7, 0xFF, 0x38, 0xCF, 0x7D, 0xDE, 0x93, 0x38, 0x71, 0xE3, 0x38, 0xC6, 
-0x96, 0xA4, 0x75, 0x28, 0x8A, 0x16, 0x99, 0x05, 0x25, 0x8E, 0xAC, 0xA6, 0xA9, 0x27, 0x1A, 0xE3, 
-0x4B, 0x98, 0x9C, 0x80, 0x7D, 0xBB, 0x99, 0xBB, 0x7B, 0x33, 0x4C, 0x1D, 0xA0, 0x9E, 0x77, 0x18, 
-0xC2, 0x63, 0xC5, 0x21, 0xA1, 0x02, 0xA5, 0x51, 0xDA, 0xE0, 0x7D, 0x40, 0x2F, 0xEE, 0xE2, 0x94, 
-0x8F, 0x76, 0x0A, 0x04, 0x94, 0xC2, 0x28, 0x83, 0x52, 0x3A, 0x7A, 0x24, 0xA8, 0x80, 0x16, 0x1F, 
-0x3F, 0x33, 0x20, 0x5E, 0x51, 0xE0, 0x95, 0x45, 0xD2, 0x06, 0x45, 0xB2, 0x9C, 0xBD, 0x0B, 0x75, 
-0x6E, 0xB8, 0x63, 0x8A, 0x4F, 0x7E, 0x75, 0x1B, 0xFB, 0x8B, 0x06, 0x8E, 0xD5, 0xCC, 0x4B, 0x46, 
-0x57, 0x6A, 0xD8, 0x74, 0x9C, 0xBC, 0x52, 0xF8, 0x20, 0x8C, 0x18, 0x8D, 0x2F, 0xDB, 0x9C, 0xB6, 
-0x71, 0x25, 0xA7, 0x9D, 0xBC, 0x92, 0x9A, 0xEE, 0xE1, 0xAB, 0x1C, 0x93, 0xD6, 0x11, 0x53, 0xA7, 
-0x94, 0x1A, 0xFB, 0x27, 0xDB, 0x1C, 0x98, 0xE9, 0x53, 0x48, 0x86, 0x27, 0xBA, 0x88, 0x59, 0xAD, 
-0x14, 0x2A, 0x4C, 0xAF, 0x5B, 0x3E, 0xFC, 0xA5, 0xAF, 0x7E, 0xF3, 0x73, 0xED, 0x63, 0xFB, 0xF4, 
-0x78, 0x83, 0x3A, 0xF6, 0x85, 0xE3, 0x11, 0x9B, 0x37, 0x6F, 0x4E, 0x9F, 0xFA, 0xB4, 0xB7, 0xBC, 
-0x67, 0x66, 0xBA, 0x7C, 0x37, 0xD2, 0x4C, 0x6D, 0xD6, 0x40, 0xBB, 0x8A, 0x10, 0xE6, 0x39, 0xEB, 
-0x9C, 0x65, 0xFC, 0xD6, 0x6F, 0xBF, 0x95, 0x1F, 0x7B, 0xC1, 0xF9, 0xD8, 0xB9, 0xFB, 0x68, 0xDD, 
-0x7C, 0x3D, 0xBD, 0x5D, 0x5B, 0x50, 0xBE, 0xA2, 0xB4, 0x2B, 0xF8, 0xE0, 0x27, 0x76, 0x72, 0xDD, 
-0x17, 0x77, 0x71, 0xA8, 0x58, 0x4D, 0x87, 0x11, 0x02, 0x31, 0x7A, 0xAC, 0x94, 0x8A, 0x24, 0x4B, 
-0x70, 0x65, 0x41, 0x5D, 0xF5, 0x19, 0xF2, 0x93, 0x9C, 0xD1, 0xCC, 0x79, 0xD5, 0xD3, 0xCE, 0xE6, 
-0xC7, 0x9E, 0x78, 0x32, 0x4D, 0x75, 0x80, 0xD4, 0x4F, 0xD3, 0xB4, 0x42, 0xE8, 0xB7, 0xD1, 0x89, 
-0x05, 0x2F, 0x38, 0x65, 0xF1, 0x4A, 0x23, 0x56, 0x47, 0x95, 0xC3, 0xA0, 0x04, 0xB4, 0x09, 0x31, 
-0x49, 0x47, 0x20, 0x89, 0x0A, 0x86, 0x81, 0xAF, 0x2E, 0xA2, 0xA3, 0xF6, 0x61, 0xF0, 0x7C, 0x91, 
-0xAC, 0x83, 0xD2, 0xE8, 0x60, 0xD0, 0xD2, 0xA0, 0x6C, 0x09, 0xB3, 0x7B, 0x3B, 0x74, 0x26, 0x73, 
-0xEA, 0x61, 0x88, 0x5A, 0x7D, 0x84, 0x2E, 0x8E, 0x56, 0x10, 0x3A, 0xDA, 0x50, 0x26, 0x75, 0x6A, 
-0xCB, 0x4F, 0xA0, 0xBE, 0x62, 0x03, 0xF7, 0xEC, 0x9A, 0xE2, 0x53, 0xD7, 0x7F, 0x9B, 0x6D, 0xD3, 
-0x1D, 0x26, 0x08, 0x74, 0xA8, 0x53, 0x65, 0x0D, 0x3A, 0x3E, 0x9A, 0xD4, 0xAC, 0x36, 0xB8, 0xCA, 
-0x0B, 0x22, 0x2D, 0x93, 0x72, 0xC7, 0x79, 0xE7, 0x9F, 0xFA, 0xEB, 0x3F, 0xFD, 0xD6, 0xD7, 0xDC, 
-0xF6, 0xB6, 0xE3, 0xA4, 0x9E, 0xDA, 0xB5, 0xD7, 0x5E, 0xAB, 0xCF, 0x3D, 0xF7, 0xE5, 0x56, 0xA4, 
-0x65, 0x94, 0x2A, 0x4C, 0x51, 0xF4, 0x75, 0x9A, 0x6A, 0x7B, 0xF0, 0xE0, 0x82, 0xF9, 0x87, 0x7F, 
-0xF8, 0x60, 0x26, 0x52, 0x6B, 0x54, 0x55, 0x55, 0xB7, 0xA4, 0xA9, 0x04, 0xC9, 0x8A, 0x90, 0x1B, 
-0x11, 0xAD, 0x45, 0x44, 0x89, 0x54, 0x83, 0xE5, 0x2E, 0xC2, 0x01, 0x89, 0xD2, 0x41, 0x25, 0x89, 
-0x00, 0x28, 0xAF, 0x03, 0x50, 0xAA, 0xD4, 0x96, 0xA1, 0xA8, 0x5C, 0xAD, 0x96, 0x15, 0x55, 0x55, 
-0x15, 0xAF, 0x79, 0xCD, 0x6B, 0xFB, 0xEB, 0xD6, 0xAD, 0x74, 0x8D, 0x06, 0x4E, 0xA9, 0xC4, 0x6B, 
-0x5D, 0xF3, 0xD6, 0x8E, 0xF8, 0x6F, 0x7D, 0xEB, 0xF4, 0xEA, 0xBD, 0xEF, 0x5D, 0xBC, 0x51, 0x8F, 
-0x1C, 0x44, 0x44, 0x3F, 0xE7, 0x39, 0x3F, 0x75, 0xE2, 0xAD, 0x37, 0x6F, 0xBA, 0x66, 0x7E, 0xAE, 
-0x78, 0x5B, 0x15, 0xCC, 0x7A, 0x65, 0xD2, 0x54, 0x7C, 0x20, 0x49, 0x32, 0x32, 0xAB, 0xE8, 0xF5, 
-0xE7, 0x48, 0x09, 0x31, 0xD1, 0xCC, 0x86, 0x65, 0xBC, 0xF1, 0x2D, 0x2F, 0xE3, 0x59, 0xCF, 0x7B, 
-0x02, 0xA7, 0x9C, 0xB6, 0x06, 0x2F, 0xAD, 0xA8, 0x5E, 0x0B, 0x39, 0x9A, 0x40, 0xAA, 0x41, 0x57, 
-0x39, 0x31, 0xDD, 0x4B, 0x88, 0x29, 0x10, 0xA7, 0x67, 0x98, 0xBA, 0x67, 0x33, 0x9D, 0x6D, 0xF7, 
-0x31, 0xDC, 0x6F, 0xD3, 0x74, 0x7D, 0x6A, 0x92, 0x0F, 0x24, 0x53, 0x47, 0xD0, 0xE0, 0x25, 0x86, 
-0x27, 0x00, 0xE8, 0x10, 0x5F, 0x47, 0x55, 0x04, 0xB5, 0xE8, 0x79, 0x68, 0xD1, 0x21, 0x41, 0x89, 
-0xC5, 0xA8, 0x04, 0x7C, 0x81, 0xF3, 0x7D, 0xEC, 0x50, 0x8A, 0xF8, 0x92, 0x7E, 0xE5, 0xA8, 0x37, 
-0x46, 0xE8, 0x8B, 0xA5, 0x34, 0x23, 0xF4, 0x92, 0xB5, 0xFC, 0xC3, 0xE7, 0xB6, 0xF2, 0x4F, 0x9F, 
-0xD9, 0xC2, 0x81, 0x62, 0x8C, 0x4A, 0xAD, 0xA4, 0x22, 0x25, 0x17, 0x83, 0x50, 0x47, 0x74, 0x82, 
-0xC7, 0x60, 0xA5, 0xCD, 0xA8, 0x9A, 0x66, 0x54, 0xF6, 0xF0, 0x92, 0xAB, 0x4E, 0xE4, 0x0D, 0xCF, 
-0x3F, 0x8F, 0x75, 0xC9, 0x7E, 0xD2, 0xD0, 0xC6, 0x64, 0xCB, 0x69, 0x87, 0x31, 0x66, 0xC3, 0x6A, 
-0xFE, 0xE9, 0xB3, 0x5B, 0xF8, 0x87, 0xCF, 0xDE, 0xC7, 0x6C, 0x58, 0x4D, 0x3B, 0x8C, 0xE1, 0x74, 
-0x4A, 0x08, 0x7D, 0xA9, 0x27, 0x6E, 0xFB, 0xF9, 0xE7, 0x9C, 0xF0, 0xD6, 0x6F, 0xDF, 0xF1, 0x1F, 
-0xD7, 0xDF, 0xAF, 0x63, 0x8F, 0x43, 0x3C, 0x2A, 0x08, 0xF7, 0x77, 0x7E, 0xE7, 0x7F, 0xAF, 0x7E, 
-0xDF, 0xEF, 0xBE, 0xFF, 0xFF, 0x74, 0xBB, 0xF2, 0xDC, 0xAC, 0xB1, 0xD2, 0x14, 0xDD, 0x0E, 0x5A, 
-0x05, 0x6A, 0xB5, 0x3E, 0xCF, 0x7E, 0xF6, 0x85, 0xFC, 0x8F, 0xDF, 0x78, 0x3D, 0x97, 0x5C, 0xB8, 
-0x0C, 0xB7, 0xFF, 0x76, 0x16, 0xBE, 0xFD, 0x15, 0x8A, 0x43, 0xFB, 0x48, 0x1B, 0x75, 0xF6, 0xCE, 
-0x65, 0xFC, 0xF1, 0x3F, 0x6D, 0xE2, 0x73, 0xB7, 0xCE, 0xD3, 0x62, 0x2D, 0x15, 0x43, 0x83, 0xD5, 
-0xDA, 0x63, 0x4D, 0x42, 0xE1, 0x1D, 0xA0, 0xB1, 0xCA, 0x31, 0x2C, 0x6D, 0xC6, 0x98, 0xE1, 0xF2, 
-0x53, 0x9B, 0xBC, 0xF8, 0xA9, 0xA7, 0x72, 0xF5, 0xC5, 0x63, 0x34, 0xAA, 0x03, 0xD8, 0xFE, 0x1C, 
-0x35, 0x1B, 0xA0, 0xEA, 0xC5, 0x3C, 0x0B, 0xB5, 0x06, 0x45, 0x10, 0xC4, 0xD8, 0xFB, 0x11, 0xAE, 
-0x92, 0x48, 0xB8, 0x22, 0xD9, 0xC0, 0xA0, 0x36, 0xF0, 0x5A, 0x08, 0xF6, 0x70, 0x37, 0x47, 0x23, 
-0x5C, 0x20, 0xA8, 0xE8, 0xE0, 0x5D, 0x96, 0x8E, 0x44, 0x37, 0x49, 0x7C, 0x8D, 0xDE, 0x94, 0x67, 
-0xE1, 0x40, 0x17, 0xD7, 0x06, 0xE3, 0x13, 0x94, 0x32, 0x04, 0x6D, 0xC8, 0x45, 0xD1, 0x71, 0x42, 
-0x65, 0x52, 0x74, 0x6D, 0x8C, 0x9C, 0x06, 0x33, 0x4E, 0xF3, 0x8D, 0x2D, 0xBB, 0xB8, 0x75, 0xFF, 
-0x14, 0xDB, 0xAB, 0x3E, 0x1D, 0x9A, 0xE4, 0xB6, 0x41, 0xA9, 0x53, 0x04, 0x83, 0xF3, 0x16, 0xC1, 
-0x88, 0xF7, 0xED, 0xAA, 0xD1, 0x48, 0xBF, 0xB5, 0x6C, 0x59, 0xF6, 0xE1, 0xDF, 0xFD, 0xDD, 0x5F, 
-0xFF, 0xC7, 0xD7, 0xBD, 0xEE, 0xD9, 0x3F, 0x92, 0xD2, 0x24, 0xD7, 0x5E, 0x7B, 0x6D, 0x3A, 0x3F, 
-0x4F, 0xA3, 0x28, 0x48, 0x45, 0x92, 0xA4, 0xDF, 0x9F, 0xAF, 0x79, 0x9F, 0x64, 0xB3, 0xB3, 0x87, 
-0x1A, 0xF7, 0xDE, 0xBB, 0x73, 0x44, 0x24, 0xAC, 0xD5, 0x98, 0x8D, 0x69, 0x56, 0x5B, 0xD6, 0x69, 
-0xF7, 0x6B, 0x45, 0xDE, 0xAF, 0x6B, 0x6D, 0x6B, 0xF3, 0xAD, 0x56, 0xA3, 0x59, 0x6F, 0xD4, 0xFB, 
-0x45, 0x5E, 0x57, 0x3A, 0xA9, 0x05, 0x5F, 0xD5, 0x41, 0x2C, 0x0A, 0x25, 0x12, 0xB4, 0x07, 0x85, 
-0x17, 0xE5, 0x83, 0x47, 0x2F, 0x96, 0xC9, 0x50, 0xDA, 0x5B, 0x6B, 0x05, 0x14, 0x2E, 0x04, 0xB1, 
-0x2A, 0xA9, 0x30, 0xDA, 0x95, 0xFD, 0xDC, 0xD7, 0x87, 0x1A, 0x65, 0xAF, 0x35, 0x5F, 0x34, 0x47, 
-0x46, 0x17, 0x8A, 0xBC, 0xD7, 0xC9, 0xB2, 0xB4, 0xD7, 0x68, 0xD6, 0x72, 0x94, 0x6F, 0x69, 0x15, 
-0x0E, 0x26, 0x49, 0xBA, 0xFD, 0xBC, 0xB3, 0xCF, 0x9E, 0x59, 0x7D, 0xE2, 0x8A, 0x76, 0xD3, 0x36, 
-0xFA, 0x76, 0x54, 0xE7, 0xAA, 0x57, 0x16, 0x5A, 0x8F, 0x14, 0x7F, 0xFC, 0xC7, 0xEF, 0xFE, 0x91, 
-0xA4, 0xC8, 0xBC, 0xF6, 0x5A, 0xD1, 0x9B, 0x36, 0xBD, 0xE3, 0x8C, 0x2F, 0x7C, 0xFE, 0xC6, 0x5F, 
-0x68, 0xB7, 0xCB, 0x1F, 0x87, 0xC6, 0xCA, 0x5A, 0x6D, 0x58, 0xE7, 0x3E, 0x90, 0x24, 0x09, 0x65, 
-0x6F, 0x06, 0x8D, 0xA3, 0x99, 0x0A, 0x8D, 0x9A, 0xE3, 0xB2, 0xCB, 0xCF, 0xE2, 0x9A, 0x57, 0x3E, 
-0x97, 0xA7, 0x3D, 0xEB, 0x0A, 0x56, 0xAE, 0x1D, 0xC2, 0x85, 0x36, 0x65, 0xD5, 0xA5, 0x56, 0xB7, 
-0x28, 0x15, 0x08, 0xAE, 0x44, 0x55, 0x25, 0x35, 0x1D, 0x13, 0xC4, 0xD0, 0xEB, 0x20, 0x93, 0x93, 
-0x2C, 0xEC, 0xDE, 0x49, 0x67, 0xEF, 0x0E, 0xEC, 0xFC, 0x0C, 0x23, 0x52, 0x92, 0xB8, 0x2E, 0xC9, 
-0xC0, 0x4E, 0x01, 0x10, 0xB4, 0xC6, 0x8B, 0x8A, 0x39, 0x6B, 0x01, 0xC1, 0x45, 0xC2, 0x1D, 0x10, 
-0x32, 0x80, 0x16, 0x8D, 0x12, 0x8B, 0x0A, 0x06, 0x8D, 0x05, 0x2A, 0xD0, 0x25, 0x41, 0x55, 0x88, 
-0xD6, 0x04, 0x95, 0x51, 0x85, 0x8C, 0xC2, 0x0C, 0xD3, 0xAB, 0xAF, 0xE4, 0x2B, 0x9B, 0xA6, 0xF9, 
-0xB7, 0x2F, 0xED, 0xE3, 0x96, 0x1D, 0x8E, 0x39, 0xBF, 0x8A, 0x3E, 0x0D, 0xFC, 0xA2, 0x4A, 0x6E, 
-0xE0, 0x4A, 0x26, 0x24, 0x18, 0x0A, 0x86, 0x99, 0xA3, 0xC9, 0x01, 0x9E, 0x7C, 0xD1, 0x28, 0xAF, 
-0x7F, 0xDE, 0x99, 0x5C, 0x71, 0x62, 0x49, 0xBD, 0x9A, 0xC6, 0x07, 0x43, 0x48, 0x56, 0xD2, 0x66, 
-0x25, 0x9F, 0xBB, 0xE5, 0x10, 0x7F, 0xFD, 0xAF, 0xB7, 0xB2, 0xB3, 0x3D, 0x42, 0xDF, 0x9C, 0x40, 
-0xBB, 0xD4, 0x18, 0x0D, 0xB5, 0x2C, 0xB4, 0xC6, 0x86, 0xAA, 0xF7, 0xBD, 0xF9, 0xA7, 0xDF, 0xFD, 
-0xC7, 0xEF, 0x7D, 0xEF, 0x35, 0xC7, 0xB5, 0xB7, 0xC2, 0xA3, 0x82, 0x70, 0x9F, 0xF3, 0x63, 0x6F, 
-0x7E, 0xFC, 0x67, 0x3F, 0xFD, 0xCD, 0xEB, 0x44, 0xEA, 0x1B, 0xAC, 0x1D, 0xC1, 0x95, 0x7D, 0x20, 
-0x67, 0x74, 0xCC, 0xF3, 0x73, 0x3F, 0xF7, 0x72, 0xDE, 0xF9, 0x53, 0x2F, 0x64, 0xF9, 0x70, 0x9B, 
-0x62, 0xFB, 0xB7, 0xE9, 0xDE, 0xF9, 0x6D, 0x42, 0x6B, 0x9E, 0x64, 0x68, 0x9C, 0x6F, 0xDC, 0x33, 
-0xCF, 0x6F, 0x7F, 0xE8, 0x5B, 0xDC, 0x7E, 0xC0, 0x50, 0xDA, 0xF5, 0x78, 0x86, 0xC9, 0x3C, 0xB1, 
-0xC8, 0xA3, 0xCA, 0x28, 0xA5, 0xA2, 0x02, 0x34, 0x25, 0x23, 0x56, 0x10, 0x77, 0x90, 0x61, 0x35, 
-0xC7, 0xD3, 0x2F, 0x5A, 0xCD, 0x1B, 0x5F, 0x70, 0x3E, 0xE7, 0xAE, 0x02, 0xDD, 0xDA, 0xCB, 0x98, 
-0x2D, 0xA1, 0x5C, 0x00, 0xA9, 0xA0, 0x56, 0xC7, 0x39, 0xA2, 0xCB, 0x0A, 0x60, 0xBD, 0x3B, 0xAC, 
-0x72, 0x88, 0x12, 0x6E, 0x46, 0x50, 0xF1, 0x98, 0x31, 0x2B, 0x92, 0x01, 0xB1, 0x03, 0x7F, 0x5D, 
-0x21, 0xA8, 0x80, 0x28, 0x87, 0x56, 0x81, 0xAA, 0xAA, 0x48, 0x4D, 0x86, 0x35, 0x43, 0x48, 0x2F, 
-0xA1, 0x33, 0xEB, 0x98, 0x9B, 0xEC, 0xD2, 0x9B, 0xCA, 0x19, 0xF6, 0x35, 0x32, 0x9D, 0x51, 0x09, 
-0x04, 0x6D, 0x30, 0x49, 0x4A, 0xDF, 0x2B, 0x8A, 0xA0, 0xA1, 0x39, 0xCA, 0x1C, 0x75, 0xB6, 0x4C, 
-0x2F, 0xF0, 0xCD, 0xDD, 0x87, 0xB8, 0xF3, 0xE0, 0x3C, 0x13, 0x41, 0xD1, 0x37, 0x23, 0x94, 0xBA, 
-0x41, 0xEE, 0x0D, 0xC6, 0x34, 0xC9, 0x5D, 0x0E, 0xD2, 0xF3, 0xC6, 0x56, 0x2D, 0x93, 0x16, 0xFF, 
-0x70, 0xFE, 0xB9, 0x67, 0xFC, 0xF5, 0x2F, 0xFD, 0xD2, 0x6B, 0xEF, 0xB9, 0xE6, 0x9A, 0x6B, 0x7E, 
-0xA0, 0x3C, 0xA2, 0x22, 0xA2, 0xFE, 0xEF, 0xFF, 0xFD, 0x72, 0xE6, 0xFD, 0x42, 0xB2, 0x77, 0xEF, 
-0xA1, 0x6C, 0xD3, 0xA6, 0x3B, 0x9A, 0x5B, 0xB7, 0xEE, 0x3E, 0xB1, 0x2C, 0x3B, 0x6B, 0x8A, 0x42, 
-0xD6, 0xB6, 0xDB, 0xED, 0x53, 0x8A, 0xBC, 0x38, 0xB3, 0xD7, 0x2F, 0x57, 0x88, 0x30, 0x2E, 0xE2, 
-0x32, 0xAD, 0x6B, 0xD6, 0x68, 0x6B, 0x2A, 0x57, 0xDA, 0xC4, 0x66, 0xB6, 0x72, 0x2E, 0x49, 0x4C, 
-0xDD, 0x86, 0x80, 0xF2, 0x12, 0x50, 0x18, 0x86, 0x1A, 0x43, 0xF4, 0x7A, 0x39, 0x9E, 0x8A, 0xB8, 
-0x7F, 0x18, 0x08, 0x9F, 0xB1, 0x73, 0xE3, 0x2E, 0x21, 0x48, 0xB4, 0x4C, 0xA2, 0x40, 0xE9, 0x18, 
-0x99, 0x12, 0xAD, 0x3B, 0x83, 0xD1, 0x6C, 0x50, 0xDA, 0x22, 0x4E, 0x30, 0x69, 0x12, 0x9D, 0xEE, 
-0x07, 0xC9, 0x53, 0xC4, 0x57, 0x98, 0xC4, 0x8A, 0x0F, 0xA5, 0x68, 0x70, 0xC1, 0xB7, 0x1D, 0x58, 
-0x07, 0xCE, 0x43, 0x28, 0xB4, 0x4D, 0x66, 0xD2, 0x2C, 0x3B, 0xD0, 0x68, 0xA4, 0x3B, 0x6B, 0x59, 
-0xBA, 0xDD, 0xA8, 0x70, 0xC8, 0x2B, 0x99, 0xAD, 0xD5, 0xD2, 0xF9, 0xB3, 0xCE, 0xBB, 0x70, 0xEF, 
-0xD3, 0x9F, 0x78, 0x71, 0x7B, 0xFD, 0xFA, 0x73, 0xFB, 0x4A, 0xED, 0x2B, 0x7F, 0xD0, 0x3E, 0x04, 
-0x78, 0xF7, 0xBB, 0xFF, 0xA0, 0xF9, 0xCF, 0xFF, 0xFC, 0xAF, 0x2F, 0xDA, 0xB7, 0x6F, 0xE2, 0x97, 
-0x6A, 0xD9, 0x8A, 0xB3, 0xC5, 0xA7, 0x09, 0x92, 0xA8, 0xD2, 0x07, 0xC4, 0x28, 0x08, 0x15, 0x5A, 
-0x17, 0xD4, 0x4C, 0xCE, 0xDA, 0x55, 0x0D, 0x5E, 0xF5, 0xCA, 0xE7, 0xF1, 0x33, 0x3F, 0xFB, 0x1A, 
-0x56, 0xAC, 0x6A, 0x50, 0x86, 0x16, 0x26, 0x73, 0x14, 0xAE, 0x83, 0x36, 0x82, 0x51, 0x81, 0xE0, 
-0x2A, 0xAC, 0x36, 0x24, 0x26, 0x40, 0xD1, 0x86, 0xBC, 0x0B, 0x07, 0x0E, 0x32, 0x73, 0xF7, 0x66, 
-0x3A, 0x7B, 0x77, 0xD3, 0x0C, 0x39, 0x0D, 0x53, 0x11, 0xAA, 0x0E, 0x46, 0x7B, 0x14, 0x0E, 0x83, 
-0x8A, 0x15, 0x18, 0xC4, 0x10, 0xD3, 0x7A, 0xD9, 0xC1, 0x1E, 0x22, 0x10, 0xB4, 0x8B, 0x02, 0x8A, 
-0x8A, 0x76, 0x8A, 0xE8, 0x7E, 0x1B, 0x09, 0x57, 0x85, 0x01, 0xA1, 0xD7, 0x03, 0x55, 0x99, 0x23, 
-0x49, 0x8A, 0xC9, 0xC6, 0xE8, 0xE4, 0x75, 0x7C, 0x63, 0x2D, 0x9B, 0xA6, 0x4A, 0xFE, 0xE6, 0xE3, 
-0xDF, 0xE6, 0x6B, 0x77, 0xF4, 0x69, 0xB3, 0x81, 0x1E, 0x2B, 0xE9, 0x63, 0x51, 0x94, 0x28, 0xED, 
-0x51, 0x41, 0x06, 0x84, 0x5B, 0x23, 0x21, 0x90, 0x30, 0x4F, 0xC6, 0x21, 0x4E, 0x5F, 0xEB, 0x79, 
-0xE5, 0xB3, 0x4E, 0xE1, 0xE5, 0x97, 0x8D, 0x31, 0xCE, 0x2C, 0x45, 0xAF, 0x4B, 0x36, 0xB4, 0x82, 
-0x76, 0x58, 0xC6, 0xE6, 0x03, 0x9E, 0x3F, 0xFC, 0xFB, 0x6F, 0x72, 0xEB, 0x6E, 0x61, 0x9E, 0x13, 
-0x28, 0xF5, 0x28, 0x8A, 0x80, 0x0F, 0x0B, 0xBE, 0x69, 0x8B, 0x4F, 0xBE, 0xE3, 0x17, 0xDF, 0xF9, 
-0x93, 0xBF, 0xF7, 0x7B, 0x3F, 0x7D, 0x5C, 0x27, 0x26, 0x3F, 0xEE, 0x09, 0xF7, 0xE6, 0x9B, 0x6F, 
-0x4E, 0x5E, 0xF5, 0xAA, 0x5F, 0x7E, 0xEB, 0xD6, 0xFB, 0x0E, 0xFD, 0x81, 0xD2, 0xC3, 0xF5, 0x10, 
-0x2C, 0xC6, 0x82, 0x32, 0x1D, 0x56, 0xAD, 0x54, 0xFC, 0xE1, 0x1F, 0xBC, 0x8B, 0x97, 0x3E, 0xF7, 
-0x62, 0xD2, 0xEA, 0x00, 0x9D, 0xBB, 0xBE, 0x4E, 0xD8, 0x73, 0x2F, 0xD2, 0xEB, 0x53, 0x24, 0xCB, 
-0xF8, 0xC4, 0x8D, 0xBB, 0xF8, 0xFD, 0x8F, 0xDC, 0xCE, 0xDE, 0x62, 0x39, 0xB9, 0x59, 0x09, 0xAE, 
-0x46, 0xEA, 0x2D, 0x56, 0xA2, 0xF1, 0xCB, 0xA0, 0xF1, 0x06, 0x9C, 0xCF, 0xC9, 0x8C, 0x80, 0xB4, 
-0x31, 0x61, 0x8E, 0xF5, 0xA3, 0x39, 0x2F, 0xBC, 0xFC, 0x04, 0x7E, 0xE2, 0xE9, 0xE7, 0xB0, 0x2E, 
-0xEB, 0x91, 0xF6, 0xF7, 0xD3, 0xA4, 0x8D, 0xD2, 0x65, 0x8C, 0xFB, 0x56, 0x96, 0x4A, 0x25, 0x30, 
-0x20, 0x5C, 0x2D, 0x71, 0x30, 0x06, 0xA5, 0x71, 0x2A, 0x01, 0xAD, 0x10, 0x4A, 0x94, 0x04, 0xC0, 
-0xA0, 0x83, 0x1D, 0xB8, 0x94, 0x11, 0xB7, 0x6F, 0x2A, 0xE0, 0x7D, 0x89, 0xB1, 0xD1, 0xC8, 0x26, 
-0x4E, 0xA3, 0x43, 0x03, 0x15, 0x32, 0x16, 0xA6, 0xBA, 0x4C, 0xEF, 0x9A, 0x65, 0xB4, 0x18, 0xC6, 
-0x3A, 0x8B, 0xF7, 0x1E, 0x94, 0x22, 0xB5, 0x19, 0xDA, 0x5A, 0x0A, 0x1F, 0xE8, 0x07, 0x8D, 0x6F, 
-0x8C, 0xD2, 0xB6, 0x4D, 0xEE, 0x5B, 0xE8, 0xF3, 0xAD, 0x5D, 0x93, 0xDC, 0x36, 0xB1, 0xC0, 0xBE, 
-0x02, 0xE6, 0x49, 0xE9, 0xD3, 0xA0, 0x8F, 0xC5, 0x98, 0x1A, 0x5A, 0x07, 0xF2, 0xAA, 0x2D, 0x81, 
-0xFE, 0x42, 0xA3, 0x66, 0x6E, 0xB8, 0xE0, 0xA2, 0xD3, 0xFF, 0xE0, 0x17, 0x7E, 0xE1, 0x77, 0x6F, 
-0xBA, 0xE6, 0x9A, 0xEF, 0xAD, 0x72, 0xB0, 0x88, 0xA8, 0x0F, 0x7C, 0xE0, 0x16, 0x7B, 0xFB, 0xED, 
-0x9F, 0x1F, 0xEA, 0x76, 0xDB, 0x8D, 0xAA, 0xCA, 0x87, 0x77, 0xED, 0xDA, 0xBD, 0x6E, 0x6A, 0x6A, 
-0xE6, 0xBC, 0x76, 0xBB, 0xBB, 0xBE, 0xDF, 0xCD, 0xD7, 0x54, 0xDE, 0xAD, 0x0A, 0x2E, 0xAC, 0x77, 
-0xDE, 0x8F, 0x8B, 0x84, 0x86, 0x60, 0x92, 0xC4, 0x66, 0xB6, 0xAC, 0x2A, 0xAD, 0x48, 0xB4, 0x20, 
-0x4A, 0x61, 0x48, 0x6C, 0x34, 0xF4, 0x25, 0x49, 0x1A, 0x5D, 0xDB, 0x82, 0x42, 0x44, 0x61, 0x8C, 
-0xA1, 0x2C, 0x1D, 0x69, 0x9A, 0xD2, 0x2F, 0x3B, 0xD4, 0x92, 0x26, 0x79, 0x95, 0x1F, 0xF1, 0x6D, 
-0x56, 0x8B, 0x01, 0x28, 0x0F, 0x86, 0x81, 0x19, 0x42, 0xC5, 0xC7, 0x68, 0x3D, 0xD7, 0xD4, 0x6A, 
-0x0D, 0x7A, 0x9D, 0x98, 0x2E, 0x55, 0x19, 0x45, 0x96, 0x26, 0x14, 0x45, 0x31, 0xD0, 0x55, 0x0A, 
-0xC6, 0x6A, 0x7C, 0x55, 0x90, 0xD4, 0x52, 0x20, 0xE0, 0xCA, 0x4A, 0x94, 0x52, 0x12, 0xA4, 0x0A, 
-0xC6, 0x68, 0xE7, 0xAB, 0x7E, 0x99, 0xA6, 0x69, 0x65, 0xAD, 0xE9, 0x39, 0x57, 0xB5, 0x9C, 0xF3, 
-0x7B, 0xB2, 0x7A, 0x7A, 0x60, 0x6C, 0x64, 0x64, 0xC7, 0x48, 0xB3, 0x71, 0xDF, 0xA5, 0x97, 0x5F, 
-0xBE, 0xB3, 0xD9, 0x6C, 0xCE, 0x8F, 0x8C, 0xD4, 0xDA, 0x43, 0x43, 0x2B, 0x5A, 0xEF, 0x79, 0xCF, 
-0x1B, 0x8A, 0x87, 0x53, 0x9B, 0xEE, 0xA7, 0x7F, 0xFA, 0xDA, 0x35, 0x1F, 0xFD, 0xE7, 0x4F, 0xBD, 
-0x74, 0x76, 0xBE, 0xF3, 0x33, 0x59, 0x3A, 0x74, 0x46, 0x55, 0x2A, 0x53, 0xF9, 0x92, 0xE1, 0xC6, 
-0x0A, 0xF2, 0x2A, 0xA7, 0x92, 0x02, 0xAD, 0x4A, 0x52, 0x5B, 0x72, 0xC9, 0x05, 0xA7, 0xF0, 0x96, 
-0x37, 0xBE, 0x98, 0xA7, 0x3D, 0xED, 0x71, 0x9C, 0x78, 0xE2, 0x18, 0x81, 0x2E, 0x55, 0xE8, 0x23, 
-0x94, 0x54, 0xA1, 0xA0, 0x9E, 0x59, 0xAC, 0x56, 0x50, 0x95, 0x10, 0x3C, 0x14, 0x1D, 0xE8, 0xCE, 
-0xE1, 0xF7, 0xEE, 0xA4, 0xB5, 0x63, 0x07, 0xF9, 0x81, 0x7D, 0xD8, 0x6E, 0x8B, 0xD1, 0xBA, 0x22, 
-0xB5, 0x9E, 0x6E, 0xD1, 0x41, 0x45, 0x2D, 0x0C, 0x1A, 0x85, 0x09, 0x16, 0xED, 0x55, 0xD4, 0xCB, 
-0x0E, 0x08, 0x77, 0x71, 0x27, 0x16, 0x77, 0x11, 0x82, 0x92, 0x10, 0x3D, 0x71, 0x82, 0x89, 0x69, 
-0x12, 0x82, 0xC2, 0x87, 0x12, 0xD3, 0x08, 0x14, 0xC1, 0x51, 0xEA, 0x0C, 0x53, 0x5B, 0x43, 0xBF, 
-0x1A, 0x67, 0x26, 0x8C, 0xF3, 0xF7, 0x5F, 0xBC, 0x83, 0x8F, 0x7D, 0x75, 0x1B, 0xFB, 0x3B, 0x23, 
-0x78, 0x36, 0xD2, 0x61, 0x08, 0x45, 0x06, 0xBA, 0x8F, 0x48, 0x1F, 0xA3, 0x40, 0x82, 0x42, 0xD1, 
-0x20, 0xCE, 0x8E, 0x16, 0x96, 0x69, 0xC6, 0xEA, 0x0B, 0xBC, 0xE8, 0xC9, 0xEB, 0xF8, 0xE9, 0xE7, 
-0x9E, 0xC2, 0x89, 0xF5, 0x16, 0xAE, 0x37, 0x8F, 0x4D, 0xEA, 0x74, 0xA5, 0xCE, 0xBE, 0xEE, 0x08, 
-0x7F, 0x72, 0xDD, 0x4D, 0x7C, 0xF1, 0x8E, 0x16, 0xD3, 0x61, 0x2D, 0xA5, 0x5E, 0x16, 0xC3, 0xEB, 
-0x7D, 0x4F, 0x14, 0x0B, 0xB7, 0x3D, 0xED, 0xA9, 0x97, 0xBF, 0xE2, 0x73, 0x37, 0xFC, 0xFD, 0xB6, 
-0x63, 0xFB, 0xFA, 0x78, 0xC2, 0x71, 0x4F, 0xB8, 0x7F, 0xFC, 0xC7, 0x1F, 0x1C, 0xFB, 0x8D, 0x5F, 
-0xFF, 0xFD, 0xF7, 0xBB, 0xB2, 0xF1, 0x72, 0xEF, 0x13, 0x95, 0x24, 0x19, 0x79, 0xD5, 0xC1, 0x64, 
-0x39, 0xE7, 0x9E, 0xBF, 0x8A, 0x0F, 0xFC, 0xC5, 0x6F, 0x70, 0xD9, 0x99, 0xE3, 0xE8, 0xD9, 0xFB, 
-0x98, 0xBC, 0xED, 0xCB, 0x64, 0xAD, 0x09, 0x7C, 0x1E, 0x68, 0xFB, 0x15, 0xFC, 0xDD, 0x67, 0xEE, 
-0xE4, 0xAF, 0x3F, 0xB3, 0x83, 0x19, 0xB5, 0x96, 0xC2, 0x2C, 0x83, 0xDC, 0x90, 0x90, 0x61, 0xD1, 
-0x38, 0x3C, 0x29, 0x09, 0x95, 0x2A, 0x09, 0xDA, 0x21, 0xBE, 0xC0, 0x68, 0x4F, 0x23, 0x0B, 0x48, 
-0x7F, 0x1F, 0x67, 0xAD, 0xA8, 0x78, 0xFD, 0xF3, 0x2E, 0xE5, 0x85, 0x57, 0x6C, 0x64, 0xA8, 0xDC, 
-0x47, 0xA3, 0xD8, 0x8F, 0x91, 0x0E, 0x28, 0x43, 0x19, 0x04, 0x31, 0x19, 0x12, 0x14, 0x89, 0x38, 
-0xB4, 0x78, 0xB4, 0x80, 0xD7, 0x1A, 0xAF, 0x2D, 0x5E, 0x81, 0xD3, 0x65, 0x74, 0x4B, 0x0C, 0x9A, 
-0x24, 0x28, 0x74, 0xD0, 0x8B, 0xF9, 0x3C, 0xF0, 0x3A, 0xE0, 0x94, 0x43, 0x5B, 0x83, 0x68, 0x85, 
-0x2F, 0x02, 0x56, 0x32, 0x12, 0xD3, 0xC4, 0x75, 0x0A, 0x16, 0x0E, 0xF4, 0xE8, 0xEE, 0xC9, 0xB1, 
-0x65, 0x42, 0x9A, 0xD4, 0xD0, 0x4A, 0x51, 0xF4, 0x4B, 0xAC, 0xB5, 0xD4, 0xEB, 0xF5, 0x98, 0x65, 
-0xC9, 0x24, 0xB8, 0xAC, 0x49, 0x3F, 0x19, 0xE5, 0x60, 0xA5, 0xB9, 0xED, 0x60, 0x87, 0x6F, 0x6C, 
-0xDB, 0xC7, 0x3D, 0xD3, 0x2D, 0x66, 0xA9, 0xB3, 0x40, 0x86, 0x4F, 0x1B, 0xB4, 0xCA, 0x16, 0x43, 
-0xE9, 0x30, 0x45, 0x95, 0x53, 0x4A, 0xBF, 0xD2, 0xDA, 0x6F, 0x6F, 0x34, 0xB3, 0xFF, 0xFD, 0xB2, 
-0x97, 0xBD, 0xF0, 0xC3, 0x7F, 0xFB, 0xB7, 0xEF, 0x9B, 0x3E, 0x9A, 0x24, 0x44, 0x44, 0x7D, 0xF4, 
-0xA3, 0x77, 0x25, 0x30, 0x95, 0x7E, 0xFC, 0xE3, 0x9F, 0x1F, 0xBE, 0xF3, 0xCE, 0x3B, 0xCF, 0x99, 
-0x9A, 0x9D, 0x5E, 0x87, 0xC8, 0xC5, 0xAD, 0xF9, 0xF6, 0xC5, 0xBD, 0x5E, 0x77, 0xAD, 0x52, 0xE9, 
-0xA8, 0xD6, 0x36, 0xF3, 0xBE, 0xAC, 0x19, 0x9D, 0x25, 0x5A, 0x6B, 0x1D, 0xFD, 0x82, 0x07, 0x13, 
-0x58, 0x6B, 0x8C, 0x89, 0xC4, 0x5A, 0xBA, 0x40, 0x9A, 0xA6, 0x68, 0xAD, 0x71, 0x2E, 0x20, 0x22, 
-0x78, 0x17, 0x49, 0x14, 0x14, 0xD6, 0x26, 0x31, 0x61, 0x0F, 0xD1, 0xFA, 0x6E, 0x06, 0xBB, 0x86, 
-0x24, 0x49, 0xA8, 0xAA, 0x68, 0x70, 0x16, 0x89, 0x82, 0xA4, 0x2C, 0x4A, 0xBB, 0x44, 0x17, 0xBD, 
-0x10, 0xC2, 0x40, 0xB2, 0x8D, 0x49, 0x86, 0xD4, 0xC0, 0x55, 0x69, 0x60, 0xDA, 0x8C, 0x0B, 0x15, 
-0x01, 0x63, 0x0C, 0xDE, 0x39, 0xC0, 0x61, 0xD3, 0x8C, 0x10, 0x02, 0xC6, 0x28, 0x7C, 0xE5, 0x08, 
-0xC1, 0xA1, 0x06, 0x7E, 0xCD, 0x88, 0xA0, 0x8D, 0x42, 0x29, 0x85, 0x31, 0x71, 0x5A, 0x94, 0x55, 
-0x0E, 0x22, 0xD8, 0x24, 0x89, 0xC7, 0xF1, 0x1E, 0xEF, 0x5D, 0x65, 0x50, 0x95, 0xF3, 0xFD, 0xB2, 
-0x56, 0x6B, 0xF6, 0xF3, 0xBC, 0x35, 0xB1, 0xFA, 0x84, 0xD5, 0xDF, 0x76, 0xA5, 0xBB, 0x3D, 0x49, 
-0xD4, 0x9E, 0xA1, 0xA1, 0x91, 0xDD, 0x2F, 0x7B, 0xD9, 0xCB, 0x26, 0xCE, 0x3C, 0xF3, 0xEC, 0xFE, 
-0x1B, 0xDE, 0x70, 0xD5, 0x03, 0x48, 0xF8, 0xBA, 0xEB, 0xAE, 0x4B, 0x7F, 0xED, 0xD7, 0xDE, 0x7F, 
-0xE9, 0x9E, 0x3D, 0xFB, 0xFE, 0xA7, 0x77, 0xE6, 0xA9, 0x59, 0x3A, 0x52, 0x2B, 0xCB, 0x4A, 0x89, 
-0x08, 0x69, 0x9A, 0x12, 0x82, 0xA7, 0x74, 0x2D, 0x74, 0xE2, 0x19, 0x6A, 0x2A, 0x5E, 0xF1, 0xF2, 
-0xE7, 0xF1, 0xDA, 0xD7, 0xFC, 0x38, 0x57, 0x5C, 0x76, 0x16, 0x49, 0xD2, 0xA7, 0x72, 0x2D, 0x9C, 
-0xEF, 0x51, 0x6F, 0xD4, 0x00, 0x47, 0x55, 0x96, 0xD8, 0xE0, 0xD1, 0x52, 0x46, 0xC9, 0x3F, 0x14, 
-0x30, 0x3B, 0x49, 0xD8, 0xB7, 0x9D, 0x89, 0x2D, 0x77, 0x52, 0x4D, 0x4E, 0xB2, 0x22, 0xD1, 0x34, 
-0x71, 0x84, 0xAA, 0x83, 0x28, 0x07, 0x89, 0xA2, 0x1C, 0xF4, 0xA7, 0x0A, 0x16, 0x25, 0x71, 0x8C, 
-0x2E, 0xFA, 0x91, 0x8B, 0x08, 0x18, 0xF0, 0x8A, 0xC3, 0x2E, 0x90, 0x4A, 0xA2, 0x9B, 0x6D, 0x24, 
-0xE5, 0x81, 0x5D, 0xC2, 0x04, 0x2A, 0xDD, 0xA7, 0x32, 0x9A, 0x2E, 0x75, 0x4C, 0xF3, 0x24, 0x16, 
-0xBA, 0xCB, 0xF9, 0xCA, 0xA6, 0x59, 0xFE, 0xCF, 0x67, 0x6F, 0xE3, 0x9E, 0x83, 0x82, 0x63, 0x0D, 
-0x15, 0xCB, 0xE8, 0x93, 0x62, 0x54, 0x82, 0xA8, 0x1E, 0x42, 0x11, 0x85, 0x11, 0x31, 0x18, 0xEA, 
-0x18, 0x04, 0xA1, 0x8B, 0x66, 0x8E, 0x44, 0xCD, 0xF0, 0x8C, 0x8B, 0xC7, 0xF9, 0xB5, 0x97, 0x5F, 
-0xC0, 0x59, 0x2B, 0x0A, 0x74, 0x3E, 0x8B, 0x77, 0x39, 0xC1, 0x0E, 0x31, 0x59, 0x8D, 0xF2, 0x77, 
-0x5F, 0xDC, 0xC1, 0x3F, 0x5F, 0xBF, 0x8B, 0x89, 0x7C, 0x0D, 0x3D, 0xBD, 0x02, 0xAD, 0x12, 0x82, 
-0x2B, 0x50, 0x32, 0x3F, 0x55, 0xAF, 0xC9, 0xBB, 0x3E, 0xFE, 0x9F, 0xF7, 0xFC, 0xF3, 0xD5, 0x57, 
-0x1F, 0x56, 0x3A, 0x1F, 0x77, 0x38, 0xEE, 0x09, 0xF7, 0x99, 0x4F, 0xBD, 0xE6, 0xBC, 0x1B, 0xBE, 
-0x7A, 0xEB, 0x87, 0x09, 0x23, 0x17, 0xA1, 0x32, 0x94, 0x28, 0x9C, 0xEA, 0xE1, 0xF5, 0x3C, 0x2F, 
-0xBE, 0xE6, 0x49, 0xFC, 0xF1, 0xEF, 0xFF, 0x3C, 0x1B, 0x87, 0x73, 0xC2, 0xAE, 0xDB, 0xD8, 0x7F, 
-0xDB, 0x57, 0x18, 0xF1, 0x6D, 0x2A, 0x97, 0x72, 0x60, 0x61, 0x94, 0xBF, 0xFC, 0xE8, 0x4D, 0xFC, 
-0xFB, 0x2D, 0x2D, 0x66, 0xCD, 0x1A, 0x2A, 0x3B, 0x04, 0xCE, 0x92, 0x7A, 0x3B, 0xC8, 0x5C, 0x14, 
-0x49, 0xB7, 0xA2, 0x20, 0x4D, 0x13, 0xCA, 0xB2, 0x42, 0xE1, 0x19, 0x6D, 0xD6, 0x29, 0xBB, 0x07, 
-0x18, 0x33, 0xD3, 0x3C, 0xFE, 0xCC, 0x61, 0xDE, 0xF9, 0x92, 0x2B, 0xB8, 0x68, 0xAD, 0x90, 0xB4, 
-0xB6, 0xA2, 0xCA, 0x69, 0xEA, 0xF5, 0x8C, 0x7E, 0xE1, 0x51, 0xB6, 0x8E, 0x12, 0xC1, 0x86, 0x80, 
-0xC2, 0xA3, 0x71, 0x04, 0x6D, 0x70, 0xCA, 0xE0, 0x35, 0x83, 0x6D, 0x6F, 0xC0, 0x88, 0xC6, 0x1C, 
-0x35, 0x98, 0xA3, 0xA4, 0x1B, 0xB7, 0x8C, 0xA5, 0x8F, 0x05, 0x2C, 0x8D, 0x31, 0xA8, 0x10, 0x07, 
-0x72, 0x70, 0x01, 0xE9, 0x19, 0xA6, 0xB6, 0xB5, 0xE9, 0x1C, 0x2A, 0xA8, 0xA9, 0x94, 0xD1, 0xE6, 
-0x30, 0x2E, 0x0F, 0xA8, 0x10, 0xFD, 0x1B, 0x9D, 0x2B, 0xB1, 0xF5, 0x8C, 0x22, 0x68, 0x5C, 0xD2, 
-0xA4, 0xA8, 0x8D, 0x30, 0x51, 0x65, 0x6C, 0x9E, 0x98, 0xE7, 0x96, 0x9D, 0x07, 0xD9, 0x3C, 0xD3, 
-0x62, 0xA7, 0xC0, 0x02, 0x09, 0x59, 0x3A, 0x8A, 0xF3, 0x9A, 0x9E, 0xF7, 0x04, 0x84, 0x7A, 0xBD, 
-0x1E, 0x3A, 0xFD, 0xE9, 0xFD, 0xA3, 0xCB, 0x86, 0xFF, 0xFE, 0x19, 0x4F, 0x7B, 0xF2, 0x47, 0xC6, 
-0xD6, 0x35, 0x0F, 0xA9, 0x9E, 0x4F, 0x42, 0x48, 0x9B, 0x33, 0x87, 0xA6, 0x4E, 0xD8, 0x74, 0xE7, 
-0xDD, 0x17, 0xB5, 0x5A, 0xBD, 0xD3, 0x0A, 0x27, 0xEB, 0xF3, 0xC2, 0x9F, 0x99, 0x24, 0xC9, 0x0A, 
-0x63, 0x54, 0xB3, 0xD7, 0xCB, 0x13, 0x09, 0xDA, 0x24, 0x49, 0xA2, 0x42, 0x88, 0xE4, 0xA9, 0xB5, 
-0x8E, 0x24, 0x24, 0x9E, 0xC4, 0x24, 0x28, 0x2D, 0x54, 0x55, 0x15, 0x1D, 0x88, 0x74, 0x82, 0x1C, 
-0x26, 0x45, 0x06, 0x84, 0x66, 0x48, 0x92, 0xB8, 0x33, 0xA8, 0xAA, 0x8A, 0x34, 0xB5, 0x54, 0x55, 
-0x35, 0x20, 0x69, 0x43, 0x51, 0x14, 0x03, 0x32, 0xAD, 0x50, 0x83, 0xDC, 0xAA, 0x11, 0xF1, 0x7C, 
-0x10, 0x83, 0x50, 0xD4, 0xE2, 0x31, 0xF5, 0x40, 0xA5, 0x40, 0x6C, 0x0A, 0x43, 0x08, 0x61, 0x70, 
-0xDE, 0x80, 0x4D, 0x06, 0x64, 0xAC, 0x14, 0x65, 0x51, 0x90, 0xA4, 0x29, 0x55, 0x59, 0xA2, 0x30, 
-0x68, 0x3D, 0x28, 0xE8, 0x39, 0x38, 0xD6, 0x22, 0x89, 0x2F, 0x5E, 0x5B, 0x3A, 0x28, 0x89, 0x14, 
-0x4B, 0x86, 0xCB, 0xE0, 0xF5, 0x23, 0xD3, 0xC5, 0x6A, 0xF0, 0xDE, 0x89, 0x97, 0x22, 0x80, 0x94, 
-0x59, 0x9A, 0xF6, 0x8D, 0x51, 0x0B, 0x4A, 0xB3, 0x5F, 0x29, 0xB6, 0xA5, 0x69, 0xBA, 0x7D, 0xDD, 
-0xC6, 0xD5, 0x77, 0x6E, 0x38, 0x71, 0xFD, 0x9E, 0xF1, 0xE1, 0xFA, 0x82, 0x19, 0x51, 0xFD, 0xF6, 
-0x7C, 0x2F, 0xBB, 0x67, 0xD3, 0x8E, 0xCB, 0xEF, 0xB9, 0x6B, 0xC7, 0xCF, 0x28, 0xB2, 0xCB, 0xB3, 
-0x74, 0xB8, 0xEE, 0xAA, 0x48, 0x70, 0x49, 0xAA, 0x10, 0x71, 0xF4, 0x8B, 0x19, 0x9A, 0x43, 0x19, 
-0xEB, 0x37, 0x8C, 0xF0, 0xCC, 0x67, 0x5C, 0xC9, 0x5B, 0xDE, 0xFC, 0x4A, 0xCE, 0x3C, 0xE3, 0x04, 
-0x50, 0x1D, 0x90, 0x2E, 0x41, 0x55, 0x64, 0x99, 0xA1, 0xDB, 0xEB, 0x93, 0xD9, 0x04, 0x2D, 0x01, 
-0x1B, 0x3C, 0xB8, 0x1C, 0xAA, 0x2E, 0x2C, 0x4C, 0x93, 0xEF, 0xDD, 0xC1, 0xDC, 0xBD, 0x77, 0xC1, 
-0xC2, 0x34, 0x69, 0x55, 0x30, 0x6C, 0x85, 0x54, 0x0A, 0xA4, 0xCA, 0x09, 0xCA, 0xA1, 0x6C, 0x32, 
-0x70, 0xE4, 0xB2, 0x68, 0x51, 0x80, 0x1E, 0xE4, 0x4A, 0x88, 0xEE, 0x8D, 0x22, 0x3E, 0xEE, 0xD2, 
-0x14, 0x84, 0x81, 0xE9, 0x4D, 0xB1, 0x48, 0xB8, 0x91, 0x6C, 0x43, 0x08, 0x98, 0xBA, 0xA5, 0x2F, 
-0x5D, 0x72, 0x6D, 0xC8, 0xED, 0x18, 0xAA, 0x7E, 0x0A, 0xF7, 0xEC, 0xD0, 0x7C, 0xF0, 0xDF, 0x6F, 
-0xE5, 0x8B, 0x5B, 0xBB, 0xCC, 0xF9, 0x51, 0x60, 0x39, 0x42, 0x1D, 0x3F, 0x38, 0x8E, 0x90, 0xA3, 
-0xAC, 0x0C, 0x92, 0xEF, 0x2B, 0x12, 0x55, 0x1B, 0x78, 0x00, 0xF5, 0x50, 0x2C, 0x90, 0xA8, 0x0E, 
-0x17, 0x6D, 0x54, 0xFC, 0xC6, 0x2B, 0x2F, 0xE2, 0x8A, 0x93, 0x2D, 0x49, 0x7E, 0x10, 0x5F, 0x74, 
-0x49, 0x9A, 0xC3, 0xCC, 0x85, 0x65, 0x7C, 0x76, 0x73, 0x97, 0xBF, 0xFA, 0xF7, 0xDB, 0xB9, 0x77, 
-0x6A, 0x88, 0xDC, 0xAC, 0xA6, 0x72, 0x86, 0x20, 0x3D, 0x86, 0x12, 0xC9, 0x1B, 0x0D, 0xFE, 0xE4, 
-0xCF, 0x3F, 0xF0, 0x57, 0xBF, 0xF5, 0x8A, 0x57, 0x3C, 0xE1, 0x47, 0xA2, 0x7F, 0xFF, 0x7E, 0x70, 
-0x5C, 0x13, 0xAE, 0x88, 0xE8, 0x15, 0xCB, 0x2E, 0x78, 0x65, 0xAF, 0x2B, 0x7F, 0x52, 0x55, 0xC9, 
-0x4A, 0x4B, 0x03, 0x47, 0x11, 0x9D, 0xB9, 0x47, 0xFB, 0xFC, 0xD2, 0xAF, 0xBE, 0x9E, 0x77, 0xBC, 
-0xE5, 0x05, 0x2C, 0x73, 0x13, 0x74, 0xEF, 0xF8, 0x3A, 0xF3, 0xF7, 0xDD, 0x42, 0x43, 0x77, 0x09, 
-0x8C, 0xF2, 0xED, 0xBB, 0xE0, 0x2F, 0x3F, 0x72, 0x3B, 0xB7, 0x4F, 0x0E, 0x33, 0xC3, 0x32, 0x2A, 
-0x9B, 0x21, 0xA2, 0xC8, 0x04, 0x7C, 0x28, 0xD1, 0x26, 0x21, 0x0F, 0x2E, 0xBA, 0x7F, 0xD9, 0x14, 
-0x55, 0x5A, 0xB4, 0xC4, 0x1C, 0xB7, 0x48, 0x8B, 0xD4, 0x4C, 0xB2, 0xBA, 0x36, 0xC9, 0xCB, 0xAE, 
-0x5C, 0xC7, 0x2B, 0x9F, 0x7A, 0x32, 0x1B, 0xEA, 0xB3, 0xE8, 0xFE, 0x04, 0xB5, 0x5A, 0x8A, 0x73, 
-0x01, 0x54, 0x3D, 0x12, 0xA0, 0x04, 0x8C, 0x54, 0x80, 0x43, 0x8C, 0xA2, 0xD2, 0x16, 0x44, 0x91, 
-0x78, 0x8D, 0x92, 0x10, 0x07, 0xAD, 0x8E, 0xEA, 0xB1, 0x78, 0x51, 0x7A, 0x90, 0x55, 0xC9, 0xE2, 
-0x8A, 0x02, 0xAD, 0x0C, 0x3A, 0x49, 0x08, 0x78, 0x4A, 0xA9, 0x06, 0x39, 0x43, 0x6B, 0xE8, 0x4E, 
-0x93, 0x7D, 0x5B, 0x0E, 0xD1, 0x39, 0xD4, 0x66, 0x34, 0x19, 0x61, 0xD8, 0x0E, 0xA1, 0x25, 0x66, 
-0x52, 0x0A, 0x04, 0x4C, 0x42, 0x94, 0xB4, 0x95, 0xA5, 0x30, 0x35, 0xAA, 0x64, 0x94, 0x22, 0x19, 
-0x61, 0xEF, 0x7C, 0x9F, 0x9B, 0x0E, 0xCD, 0xF0, 0xB9, 0x89, 0x49, 0x36, 0xCD, 0xB6, 0x81, 0x26, 
-0x8E, 0x94, 0xC4, 0x2E, 0xA3, 0xEF, 0x42, 0x34, 0x6E, 0x18, 0x2F, 0x95, 0x6B, 0xE7, 0xA8, 0x72, 
-0xB7, 0x49, 0x98, 0x14, 0x71, 0x4D, 0x71, 0xB2, 0x5A, 0x82, 0x1F, 0x35, 0x6A, 0x28, 0xB5, 0xA6, 
-0x9E, 0x68, 0x53, 0xD3, 0x79, 0xE9, 0xD0, 0xDA, 0x92, 0x24, 0x49, 0x24, 0x9E, 0x10, 0xB7, 0xF7, 
-0x8B, 0x8F, 0x10, 0xF0, 0x3E, 0xEA, 0x48, 0xAD, 0xB5, 0x54, 0xAE, 0x44, 0x44, 0xA8, 0xD5, 0x52, 
-0xFA, 0xFD, 0x2E, 0xDA, 0x1C, 0x25, 0xA1, 0xC6, 0x1C, 0x7C, 0x83, 0x4E, 0xF0, 0x83, 0xF4, 0x98, 
-0x01, 0x7C, 0x0E, 0x26, 0xC5, 0x26, 0x26, 0x12, 0x4F, 0x92, 0x50, 0xAB, 0xA5, 0x24, 0x46, 0xD0, 
-0x1A, 0xAC, 0xB5, 0x18, 0x1B, 0xAB, 0x31, 0x2B, 0xA5, 0xD0, 0x3A, 0xFE, 0xAF, 0xB5, 0x26, 0x44, 
-0x1E, 0xC7, 0x7B, 0xC1, 0x3B, 0xC1, 0xB9, 0x40, 0x55, 0x79, 0xCA, 0xB2, 0xC4, 0x7B, 0x4F, 0x51, 
-0x14, 0x54, 0xFD, 0x1E, 0x98, 0x14, 0x42, 0x88, 0x1F, 0x46, 0xA3, 0x75, 0x12, 0x25, 0xE4, 0xC1, 
-0xE2, 0x07, 0x16, 0x6B, 0x92, 0x81, 0x74, 0x9B, 0x80, 0xB6, 0xE4, 0xFD, 0x0A, 0x9B, 0x66, 0x98, 
-0xC1, 0x67, 0xA3, 0xEA, 0xC3, 0x1E, 0x26, 0xE8, 0x28, 0x21, 0x07, 0xD2, 0x34, 0x21, 0x88, 0xA3, 
-0x2C, 0x4B, 0x20, 0xA0, 0x35, 0x78, 0xDF, 0x1B, 0x44, 0x01, 0x84, 0x12, 0x8A, 0x3E, 0x9A, 0x99, 
-0xB4, 0x66, 0x0E, 0x2A, 0xA5, 0xEB, 0x55, 0xE9, 0x4F, 0x43, 0x6A, 0xCB, 0x82, 0x4B, 0x94, 0x56, 
-0x35, 0x94, 0xD2, 0x18, 0x0B, 0x95, 0xEB, 0x21, 0xF4, 0x69, 0x34, 0x0D, 0x67, 0x9E, 0x79, 0x02, 
-0xEF, 0xF9, 0xCD, 0x9F, 0xE5, 0x82, 0x0B, 0x4F, 0x66, 0xDD, 0xDA, 0x11, 0x44, 0xBA, 0x78, 0x69, 
-0x61, 0x6C, 0xA0, 0xA8, 0x72, 0x30, 0x96, 0xC4, 0xD6, 0x51, 0x4E, 0x50, 0x45, 0x49, 0x6A, 0x24, 
-0xF6, 0xE3, 0xA1, 0xDD, 0xCC, 0x6F, 0xDF, 0xCC, 0xD4, 0x7D, 0x77, 0xD3, 0x58, 0x68, 0xB1, 0xB2, 
-0xA6, 0x51, 0xBA, 0xA2, 0x2A, 0x3A, 0x68, 0xC9, 0xA9, 0x59, 0x03, 0x5E, 0xC0, 0x29, 0x20, 0x03, 
-0x65, 0x11, 0xD4, 0x60, 0x7C, 0x0A, 0xE0, 0x50, 0x12, 0x8D, 0x65, 0x1A, 0x85, 0x28, 0x1D, 0xB3, 
-0xF1, 0x0D, 0xB0, 0x48, 0xB8, 0xA0, 0x09, 0x21, 0xA0, 0x6B, 0x9A, 0xBE, 0xCA, 0xE9, 0x68, 0x43, 
-0x95, 0xAD, 0xE6, 0x50, 0x67, 0x8C, 0x2F, 0x7E, 0x65, 0x9A, 0x7F, 0xFA, 0xCC, 0xBD, 0xEC, 0x76, 
-0xAB, 0x69, 0xB3, 0x0C, 0x4D, 0x82, 0x25, 0x03, 0x84, 0x8A, 0x12, 0xAD, 0x14, 0x5E, 0x07, 0x82, 
-0x28, 0x42, 0x00, 0xAD, 0x0C, 0x48, 0xC0, 0xAA, 0x12, 0x25, 0x2D, 0x1A, 0x89, 0x63, 0x7D, 0x63, 
-0x96, 0x9F, 0x7F, 0xE1, 0x19, 0x3C, 0xFF, 0xB2, 0x55, 0x34, 0xDC, 0x14, 0x26, 0xF4, 0x50, 0xA9, 
-0xA5, 0xAD, 0x57, 0x70, 0xC7, 0x74, 0x83, 0xBF, 0xF8, 0x97, 0x5B, 0xF9, 0xEA, 0x3D, 0x15, 0x73, 
-0xD5, 0x28, 0x4A, 0x37, 0x50, 0xC1, 0x93, 0x99, 0xC2, 0x27, 0x89, 0xFB, 0xD2, 0xD3, 0x9F, 0xF6, 
-0xF8, 0xB7, 0xFC, 0xDB, 0xA7, 0xFF, 0x76, 0xF7, 0xE1, 0x1F, 0x7D, 0x9C, 0xE1, 0xB8, 0x26, 0xDC, 
-0xEB, 0x45, 0xEC, 0x35, 0xE3, 0x97, 0xBC, 0x77, 0x6A, 0xAE, 0xFB, 0xAE, 0x54, 0xAD, 0xAC, 0x7B, 
-0x09, 0x0C, 0xD5, 0x12, 0xDA, 0xF9, 0x04, 0xA7, 0x5D, 0xB8, 0x9C, 0xDF, 0x7D, 0xDF, 0x3B, 0x79, 
-0xC1, 0x55, 0x67, 0x93, 0xB6, 0x76, 0x31, 0x7D, 0xE3, 0x97, 0x28, 0x26, 0xB6, 0x93, 0x48, 0x1F, 
-0xA7, 0x97, 0xF3, 0xAF, 0xD7, 0xCF, 0xF1, 0x7F, 0xFE, 0xF5, 0x6E, 0x66, 0x38, 0x89, 0xD9, 0xD0, 
-0xA0, 0xC4, 0x12, 0x10, 0x32, 0x25, 0x38, 0xA9, 0x62, 0xB8, 0x82, 0x06, 0x95, 0x68, 0xA4, 0x74, 
-0x18, 0x9A, 0xD4, 0x4C, 0x8D, 0xC2, 0xF5, 0x48, 0x71, 0x04, 0x3D, 0xCB, 0xA8, 0x39, 0xC4, 0xD9, 
-0x63, 0x6D, 0xDE, 0xFE, 0xA2, 0x4B, 0x78, 0xFA, 0x79, 0x4D, 0xB2, 0xFC, 0x20, 0x54, 0x5D, 0xB2, 
-0xC4, 0xE0, 0xC5, 0x20, 0x02, 0x89, 0x54, 0x51, 0xA5, 0x40, 0x89, 0x68, 0x83, 0x53, 0x16, 0x83, 
-0x45, 0xBB, 0x58, 0x4D, 0x02, 0x1D, 0x08, 0x0A, 0xBC, 0x8E, 0x8E, 0xE3, 0xA0, 0x31, 0x41, 0x47, 
-0xB7, 0x9A, 0xCA, 0x47, 0x12, 0x50, 0x8A, 0x0A, 0x8F, 0xD8, 0x80, 0x58, 0x08, 0xDE, 0x42, 0xA7, 
-0x46, 0x7B, 0xA2, 0x47, 0xEB, 0x40, 0x8B, 0xA4, 0xC8, 0x18, 0xD6, 0x23, 0x48, 0x15, 0x75, 0xCF, 
-0x59, 0xDD, 0xE2, 0x43, 0x89, 0x73, 0x25, 0x49, 0x92, 0xE1, 0xB4, 0xA5, 0xE7, 0x2D, 0xCE, 0x0E, 
-0xD1, 0x33, 0x4D, 0xB6, 0x97, 0xF0, 0xE9, 0x03, 0x93, 0xDC, 0xDB, 0x76, 0x6C, 0xDB, 0x3B, 0x4D, 
-0x27, 0x18, 0x02, 0x63, 0x38, 0x9B, 0x51, 0x89, 0xC2, 0xAB, 0x80, 0x50, 0x00, 0x5E, 0xAC, 0xF5, 
-0xE2, 0xF2, 0xBE, 0x32, 0x49, 0xA6, 0x40, 0x63, 0x4D, 0x0D, 0x57, 0x29, 0x04, 0x7B, 0xD8, 0x62, 
-0xAD, 0xF4, 0xA2, 0xCA, 0x20, 0x06, 0x7B, 0x28, 0x42, 0x4C, 0x6A, 0x9D, 0x19, 0x9C, 0x73, 0x78, 
-0xD7, 0x8B, 0x99, 0x9E, 0x88, 0x86, 0x14, 0x6B, 0x34, 0x49, 0x0A, 0xB5, 0xCC, 0x60, 0x8C, 0xA1, 
-0xDE, 0xC8, 0x18, 0x1E, 0x1E, 0xA2, 0xD1, 0xA8, 0xD1, 0x68, 0xD6, 0xB0, 0xA9, 0xA1, 0x51, 0xAB, 
-0xD3, 0x1C, 0x6E, 0x92, 0xA5, 0x96, 0x24, 0x4D, 0x31, 0x1A, 0x46, 0x97, 0x8D, 0x61, 0x94, 0xA6, 
-0xD9, 0xAC, 0x93, 0xD5, 0x52, 0x92, 0xC4, 0x90, 0x65, 0x19, 0x59, 0x96, 0xC4, 0xEA, 0xB2, 0x36, 
-0x4A, 0xC2, 0xFA, 0xB0, 0xF4, 0xAB, 0xA9, 0xBC, 0xA7, 0x2C, 0x1D, 0x45, 0x51, 0x50, 0x14, 0x15, 
-0xFD, 0x5E, 0x4E, 0x51, 0x14, 0x74, 0x5A, 0x2D, 0x8A, 0xCA, 0xD3, 0x6D, 0xB5, 0x29, 0x8A, 0x82, 
-0x7E, 0xBF, 0xA0, 0xD5, 0xEA, 0xE0, 0x5D, 0xA0, 0x28, 0x2A, 0xCA, 0xD2, 0x11, 0x3C, 0x74, 0x3A, 
-0x5D, 0x3A, 0xBD, 0x9C, 0xA2, 0xA8, 0xE8, 0xF5, 0x72, 0x8A, 0xBC, 0xC2, 0x79, 0x48, 0x6C, 0x03, 
-0xBF, 0x78, 0xFD, 0x2A, 0xE6, 0x0A, 0x08, 0x3E, 0x12, 0x76, 0xD4, 0x13, 0x0F, 0xA4, 0x69, 0x89, 
-0x79, 0x36, 0xB2, 0x34, 0xC3, 0x4B, 0x34, 0xEA, 0x69, 0xAD, 0xD0, 0x06, 0xF2, 0x7C, 0x01, 0x6D, 
-0x20, 0x49, 0x95, 0x14, 0x45, 0x2E, 0x88, 0x28, 0x63, 0x33, 0xE5, 0x9D, 0xA1, 0x96, 0x8E, 0xE2, 
-0x7D, 0xF4, 0xC9, 0x16, 0x4A, 0x6C, 0xE2, 0x19, 0x19, 0x36, 0x3C, 0xF1, 0xC9, 0x97, 0xF0, 0xEA, 
-0xD7, 0xBC, 0x80, 0xAB, 0x9E, 0x7C, 0x1E, 0x2B, 0xC6, 0x0D, 0x65, 0x31, 0x83, 0x4A, 0x4B, 0x2A, 
-0xD7, 0xC1, 0x66, 0x1A, 0xD1, 0x86, 0xAA, 0x12, 0x34, 0x96, 0x9A, 0x68, 0x6C, 0x5E, 0x46, 0xC9, 
-0x76, 0x6A, 0x2F, 0xF3, 0xDB, 0xEE, 0xA4, 0x7D, 0x70, 0x17, 0x2C, 0x4C, 0xB3, 0x4A, 0x20, 0x09, 
-0x15, 0x85, 0xEB, 0x22, 0xDA, 0x53, 0x4B, 0x15, 0xCA, 0x07, 0x54, 0xE5, 0x41, 0xD7, 0xA0, 0xD2, 
-0x83, 0x90, 0x5C, 0x4D, 0xD0, 0x01, 0xAF, 0x23, 0xE1, 0x0A, 0x0E, 0x8D, 0x1B, 0x84, 0xF3, 0x6A, 
-0x90, 0x6C, 0x60, 0x98, 0x1C, 0xE8, 0xD3, 0x17, 0x15, 0x24, 0x5A, 0xE1, 0x50, 0x54, 0xA9, 0xA6, 
-0x45, 0x8D, 0x96, 0x5D, 0xC3, 0x6D, 0x5B, 0x0B, 0xFE, 0xF1, 0x3F, 0xEE, 0xE3, 0x9B, 0xBB, 0x7B, 
-0xF4, 0xD4, 0xC9, 0xE4, 0x6A, 0x04, 0x82, 0x90, 0x99, 0x14, 0xEF, 0x0B, 0x02, 0x81, 0x34, 0xAD, 
-0xD1, 0x2F, 0xFB, 0x51, 0xCA, 0xF6, 0x3E, 0xFA, 0xF4, 0x06, 0x47, 0x6A, 0x02, 0xE2, 0xBB, 0x0C, 
-0x35, 0x35, 0xCD, 0x6A, 0x0F, 0x6F, 0x7A, 0xE6, 0x06, 0xDE, 0xF0, 0xEC, 0x33, 0x19, 0x0B, 0x87, 
-0x18, 0xB2, 0x3D, 0xFA, 0xAE, 0x20, 0x4F, 0x97, 0xB1, 0xA7, 0x5A, 0xC3, 0xFB, 0xFF, 0xFD, 0x0E, 
-0x3E, 0xF1, 0xB5, 0x49, 0x26, 0xAB, 0x51, 0xD2, 0x64, 0x0D, 0x79, 0x55, 0x61, 0xE9, 0x8B, 0xD1, 
-0xE5, 0x7D, 0x4F, 0x7C, 0xF2, 0x25, 0x6F, 0xF8, 0xC2, 0x0D, 0xFF, 0xF0, 0xCD, 0xC1, 0xAF, 0x3C, 
-0xEE, 0x70, 0x5C, 0x13, 0xEE, 0x07, 0xFF, 0xF8, 0x63, 0x63, 0x6F, 0xFF, 0xE5, 0x5F, 0xFE, 0x48, 
-0x5E, 0x65, 0xCF, 0xD0, 0x2C, 0x37, 0x4A, 0x19, 0x30, 0x2D, 0x6C, 0x32, 0xCD, 0x4B, 0x5E, 0xF1, 
-0x78, 0xFE, 0xC7, 0x2F, 0xBF, 0x8E, 0x73, 0x36, 0x0C, 0xC1, 0xC4, 0x7D, 0x4C, 0xDD, 0xF2, 0x75, 
-0xCA, 0xA9, 0x09, 0x86, 0x6A, 0x19, 0x07, 0xBB, 0x4D, 0x7E, 0xEF, 0x1F, 0x37, 0xF3, 0xB9, 0x5B, 
-0x17, 0xE8, 0xF9, 0x15, 0x94, 0x8C, 0xE1, 0x55, 0x4A, 0x25, 0x71, 0x50, 0xC5, 0x6A, 0x0C, 0x71, 
-0xE4, 0x88, 0x1A, 0x04, 0x35, 0x0C, 0x56, 0x6E, 0x8D, 0x06, 0x1C, 0x41, 0xF7, 0xA9, 0xDB, 0x79, 
-0xEA, 0xE5, 0x4E, 0x7E, 0xE2, 0x29, 0xA7, 0xF3, 0x93, 0xCF, 0x38, 0x83, 0xB5, 0xE9, 0x2C, 0xCB, 
-0x74, 0x07, 0xCA, 0x0E, 0x62, 0x0C, 0x41, 0x49, 0xF4, 0x46, 0x50, 0x15, 0x36, 0x44, 0x17, 0x33, 
-0x91, 0x66, 0x54, 0x58, 0x48, 0x74, 0xB9, 0x59, 0x0C, 0x94, 0x20, 0xDA, 0x19, 0x80, 0x45, 0xF7, 
-0x9A, 0xA3, 0x2E, 0x94, 0xC5, 0xCF, 0xC4, 0x88, 0x1E, 0x1D, 0x2C, 0xA6, 0xAA, 0x41, 0x91, 0x30, 
-0xBB, 0xB7, 0xC5, 0xA1, 0xDD, 0xB3, 0x0C, 0xE9, 0x71, 0x9A, 0xD9, 0x08, 0x55, 0xE1, 0xB0, 0x56, 
-0x13, 0xAA, 0x3E, 0x89, 0x8D, 0x5B, 0x62, 0x27, 0x90, 0xAB, 0x94, 0xDC, 0x34, 0xE8, 0xD9, 0x8C, 
-0x59, 0x3B, 0xC2, 0xE4, 0xC8, 0x5A, 0xBE, 0xB5, 0x7B, 0x8A, 0xAF, 0xDC, 0xBE, 0x89, 0xBD, 0xED, 
-0x3E, 0x0B, 0xD4, 0x91, 0xFA, 0x08, 0x45, 0x19, 0xF5, 0xA7, 0x58, 0x0B, 0x2E, 0xD6, 0xA3, 0xB2, 
-0x4A, 0xA3, 0xB5, 0x8D, 0x0B, 0xC3, 0xE1, 0xB8, 0xBA, 0xB8, 0xF5, 0xD7, 0x04, 0x50, 0x1E, 0xAD, 
-0x41, 0x69, 0x8F, 0xF7, 0x25, 0xC1, 0x75, 0xC1, 0x78, 0x94, 0x0A, 0x24, 0x16, 0xB2, 0x9A, 0xA1, 
-0x96, 0x1A, 0x1A, 0xCD, 0x94, 0x65, 0xCB, 0xC6, 0x18, 0x1D, 0x69, 0x70, 0xE2, 0xBA, 0x15, 0x2C, 
-0x1B, 0x1B, 0x62, 0xF5, 0xEA, 0x55, 0xAC, 0x5E, 0xB3, 0x92, 0x15, 0x2B, 0xC6, 0x59, 0xBE, 0x62, 
-0x8C, 0xE5, 0xCB, 0x97, 0xD1, 0x18, 0xAA, 0x33, 0x3C, 0xD4, 0x40, 0x94, 0x60, 0x94, 0x46, 0x19, 
-0x1D, 0x73, 0xAF, 0x0D, 0x1E, 0x19, 0x48, 0xC4, 0x87, 0x55, 0x07, 0x51, 0x53, 0x8B, 0x5A, 0x54, 
-0x82, 0x1F, 0x85, 0xA8, 0x73, 0xF4, 0x87, 0x25, 0xF0, 0x28, 0xC8, 0x0A, 0x2A, 0x08, 0x1E, 0x05, 
-0x7E, 0xE0, 0xF6, 0x14, 0x04, 0xE7, 0x1C, 0x55, 0xE9, 0xF1, 0x5E, 0x58, 0x98, 0xEF, 0xB0, 0xD0, 
-0xE9, 0x32, 0x39, 0x35, 0xC7, 0x81, 0x83, 0x53, 0x1C, 0x3C, 0x34, 0xC5, 0xC4, 0x81, 0x29, 0x0E, 
-0x4E, 0x4E, 0xB2, 0x30, 0xDF, 0xA5, 0xC8, 0xC1, 0x3B, 0xE8, 0xF7, 0xFB, 0x2C, 0x2C, 0xB4, 0x69, 
-0x77, 0x8B, 0xF8, 0xDD, 0xA0, 0x10, 0x31, 0x88, 0xB2, 0x18, 0x9D, 0x45, 0x37, 0x3C, 0x17, 0x40, 
-0x2C, 0xDA, 0x44, 0x7D, 0xA8, 0x0F, 0x51, 0x3D, 0xE5, 0x7D, 0x81, 0x36, 0x8A, 0x24, 0x31, 0x78, 
-0x09, 0xB8, 0xC2, 0x81, 0xB2, 0xA4, 0x69, 0x93, 0xB2, 0x70, 0xA4, 0xB6, 0x86, 0x77, 0x05, 0xD6, 
-0x0A, 0x95, 0x9F, 0xE7, 0x92, 0x4B, 0xCE, 0xE2, 0xFF, 0xFD, 0x83, 0xDF, 0xE6, 0xD2, 0x4B, 0x4E, 
-0x21, 0xD1, 0x0B, 0x58, 0xBD, 0x80, 0x0B, 0x2D, 0x92, 0xBA, 0x27, 0xF7, 0x5D, 0x48, 0x34, 0xA5, 
-0xD7, 0xA4, 0x26, 0x23, 0x95, 0x14, 0xDD, 0xE9, 0x60, 0x95, 0x20, 0xDB, 0x36, 0x31, 0xB7, 0xF5, 
-0x4E, 0xF2, 0x43, 0xBB, 0x49, 0x43, 0x4C, 0xA9, 0x58, 0x17, 0x4F, 0x12, 0x02, 0x7E, 0x10, 0x01, 
-0x06, 0xB1, 0xDA, 0x82, 0x02, 0x54, 0x88, 0x0B, 0x3F, 0x80, 0x28, 0x1D, 0x93, 0x34, 0xC5, 0x5E, 
-0x1A, 0x74, 0xAA, 0x1F, 0x78, 0x39, 0x6B, 0x54, 0xA8, 0xC7, 0x85, 0x57, 0xF9, 0x58, 0xE1, 0x57, 
-0x17, 0x88, 0x0A, 0x68, 0x95, 0x52, 0x38, 0x03, 0xF5, 0x71, 0x0E, 0xE5, 0x75, 0x0E, 0x86, 0xD5, 
-0xFC, 0xD5, 0xBF, 0x7C, 0x93, 0x2F, 0xDC, 0xD1, 0xA5, 0x2D, 0xAB, 0xE8, 0xCB, 0x08, 0x9E, 0x2C, 
-0x1E, 0xE3, 0x7E, 0x34, 0x13, 0xE7, 0x84, 0x52, 0x83, 0xC0, 0x8A, 0xE0, 0xE3, 0x18, 0x13, 0x87, 
-0x51, 0x1E, 0xA3, 0x85, 0x21, 0x35, 0xC9, 0xB3, 0x2F, 0x6C, 0xF0, 0x2B, 0xAF, 0x7F, 0x22, 0xEB, 
-0xC2, 0x4E, 0x6A, 0x7E, 0x0A, 0x95, 0x0A, 0x6D, 0xEA, 0x2C, 0x24, 0xEB, 0xF9, 0xE4, 0x8D, 0x13, 
-0xFC, 0xF5, 0x75, 0xB7, 0x73, 0xB0, 0xBF, 0x82, 0x1E, 0x27, 0x60, 0xEC, 0x30, 0xA5, 0x9B, 0x23, 
-0x33, 0x32, 0xD7, 0x1C, 0x53, 0xBF, 0xFE, 0xDB, 0xEF, 0x7B, 0xEB, 0xDF, 0xBC, 0xED, 0x6D, 0x6F, 
-0x3B, 0x2E, 0xA3, 0xCE, 0x8E, 0x6B, 0xC2, 0xBD, 0xE6, 0xF9, 0x6F, 0xBB, 0xF0, 0xBA, 0x4F, 0xFD, 
-0xE7, 0xBF, 0xDA, 0x64, 0xF5, 0x29, 0xBE, 0x1A, 0x56, 0x82, 0x43, 0xD9, 0x05, 0x4C, 0x3A, 0xC5, 
-0xAF, 0xFF, 0xEA, 0x2B, 0xF8, 0xD9, 0x37, 0x3D, 0x8F, 0x95, 0x0D, 0x87, 0xDB, 0x76, 0x27, 0x07, 
-0xEF, 0xBC, 0x19, 0x69, 0x2F, 0xD0, 0x4C, 0x9B, 0xEC, 0x98, 0x4D, 0xB8, 0xF6, 0x9F, 0x36, 0xF1, 
-0xF5, 0x2D, 0x7D, 0x5C, 0x58, 0x8E, 0x67, 0x08, 0xA1, 0x3E, 0x48, 0x34, 0x37, 0x48, 0x72, 0x3C, 
-0x30, 0xD6, 0x44, 0x4F, 0x82, 0x98, 0xE7, 0x36, 0xB2, 0x9E, 0x1D, 0x58, 0x68, 0x4B, 0x32, 0xD3, 
-0x27, 0xAD, 0x26, 0x38, 0x7F, 0x75, 0xE0, 0x35, 0x4F, 0x3D, 0x89, 0xE7, 0x5D, 0x7A, 0x02, 0xCD, 
-0xDE, 0x5E, 0xC6, 0x1B, 0x1E, 0x17, 0x2A, 0x82, 0xAE, 0x10, 0x15, 0xDD, 0x6B, 0x12, 0x71, 0xE8, 
-0x60, 0x11, 0x89, 0x03, 0x54, 0x74, 0x75, 0x64, 0x00, 0x3F, 0x4C, 0x88, 0x28, 0x2C, 0x0D, 0x70, 
-0x09, 0xFD, 0x43, 0x39, 0x93, 0xBB, 0xE6, 0xA1, 0x9F, 0x50, 0x53, 0x0D, 0xBC, 0x83, 0x7A, 0xAD, 
-0x86, 0x52, 0x82, 0x0B, 0x8E, 0xD2, 0x79, 0x9C, 0xB6, 0x94, 0xD9, 0x28, 0x3D, 0x9D, 0x31, 0x95, 
-0x07, 0x0E, 0x14, 0x86, 0xBB, 0xE6, 0x1C, 0x3B, 0x5A, 0x15, 0x77, 0x1D, 0x38, 0xC0, 0x74, 0x05, 
-0xF3, 0x24, 0x54, 0x59, 0x93, 0xE8, 0x38, 0x91, 0x81, 0x8B, 0xAE, 0x39, 0x89, 0x08, 0x46, 0x45, 
-0xB2, 0xAA, 0x08, 0x04, 0x65, 0xC0, 0x46, 0x75, 0x08, 0x2A, 0xA0, 0x55, 0xDC, 0x26, 0x1B, 0x2B, 
-0xD4, 0xEA, 0x86, 0x65, 0x63, 0x4D, 0x46, 0xC7, 0xEA, 0xAC, 0x5C, 0x3E, 0xC2, 0xF0, 0x48, 0x8D, 
-0xD5, 0x6B, 0x96, 0xB3, 0xF6, 0x84, 0x15, 0xAC, 0x5A, 0x3D, 0xCE, 0x8A, 0x95, 0xCB, 0x58, 0x3E, 
-0x36, 0xCA, 0xF0, 0x50, 0x9D, 0xB1, 0xE1, 0x94, 0x34, 0x15, 0xB2, 0x2C, 0xC3, 0xDA, 0x28, 0xF1, 
-0x19, 0xE5, 0x31, 0x46, 0x63, 0x8C, 0xC2, 0x68, 0x0E, 0xF7, 0xCF, 0xD1, 0x83, 0x50, 0x0B, 0xA0, 
-0x0C, 0x61, 0xD1, 0x08, 0x77, 0xD4, 0x7B, 0x10, 0xE2, 0xAE, 0x61, 0x11, 0x6A, 0xF1, 0xF9, 0xFD, 
-0x5E, 0x8C, 0x07, 0x74, 0x03, 0xBB, 0x89, 0x1A, 0x1C, 0x41, 0xE2, 0xD7, 0x83, 0x87, 0x80, 0xC2, 
-0x66, 0x0D, 0xC4, 0x83, 0x0B, 0x8A, 0xC2, 0x09, 0x45, 0x19, 0xE8, 0x97, 0x15, 0xFD, 0xBC, 0xA2, 
-0x2A, 0x85, 0xF9, 0x99, 0x1E, 0xBD, 0x6E, 0xC1, 0xCC, 0xCC, 0x0C, 0x93, 0xD3, 0x33, 0x4C, 0x4E, 
-0xCF, 0x33, 0x3D, 0x35, 0xC7, 0xE4, 0xD4, 0x1C, 0xF3, 0x0B, 0x3D, 0x26, 0xA7, 0xE7, 0x98, 0x9A, 
-0x6A, 0x31, 0xB7, 0xD0, 0x43, 0x82, 0x89, 0xC4, 0x5B, 0x49, 0x4C, 0xE6, 0x66, 0x13, 0x24, 0x78, 
-0xB4, 0xD6, 0x88, 0xF8, 0xC3, 0xEA, 0x0B, 0x6D, 0x52, 0xAC, 0xA9, 0x81, 0x18, 0x7C, 0x15, 0xD5, 
-0x32, 0x56, 0x83, 0xB1, 0x81, 0xAA, 0x6A, 0xD3, 0x68, 0x2A, 0xAE, 0x7E, 0xFA, 0x13, 0x38, 0xF5, 
-0xA4, 0x95, 0x3C, 0xEB, 0xAA, 0x8B, 0x38, 0xF5, 0xB4, 0x55, 0xAC, 0xDF, 0x38, 0x8A, 0xE8, 0x1C, 
-0xAF, 0xFA, 0xA8, 0x54, 0x11, 0x94, 0xA6, 0xEA, 0xF6, 0xA9, 0x0B, 0x64, 0xAE, 0x84, 0xE9, 0x03, 
-0xCC, 0xDF, 0xFE, 0x2D, 0x98, 0xD9, 0x07, 0xED, 0x29, 0x54, 0xD9, 0xA1, 0x99, 0xC6, 0xFB, 0xA7, 
-0x06, 0xEA, 0x9C, 0x87, 0x0F, 0x21, 0xE8, 0x32, 0xEE, 0xC6, 0x5C, 0x73, 0x10, 0x45, 0x29, 0x88, 
-0x2E, 0x11, 0xD3, 0x8F, 0x85, 0x21, 0xBD, 0xC1, 0xD1, 0x24, 0x24, 0xAB, 0x98, 0x76, 0xCB, 0xF9, 
-0xE2, 0x5D, 0x0B, 0x7C, 0xE0, 0xE3, 0xB7, 0xB0, 0xB5, 0x3D, 0xCA, 0x7C, 0x18, 0x43, 0x31, 0x34, 
-0x90, 0xA0, 0x1F, 0x2A, 0x98, 0x75, 0x50, 0x05, 0x42, 0x02, 0x71, 0x69, 0x0C, 0x28, 0x05, 0x06, 
-0xA1, 0xA1, 0x67, 0xB8, 0xF2, 0x4C, 0xCD, 0x2F, 0xBE, 0xEA, 0x72, 0x2E, 0x18, 0x9A, 0xA2, 0xE9, 
-0xF6, 0x23, 0x49, 0x45, 0x5F, 0xD5, 0xE8, 0xA6, 0xEB, 0xF8, 0xCA, 0xDD, 0x2D, 0xFE, 0xFC, 0xC3, 
-0xDF, 0x66, 0xDB, 0xDC, 0x08, 0x2D, 0xD6, 0xA1, 0xD4, 0x38, 0x5E, 0xDA, 0x08, 0xDD, 0x22, 0x4D, 
-0xAB, 0xBF, 0xB9, 0xF6, 0xB7, 0x7F, 0xE9, 0x57, 0x7F, 0xE5, 0x57, 0xDE, 0x7C, 0x5C, 0x46, 0x9D, 
-0x1D, 0xB7, 0x84, 0x7B, 0xFD, 0xF5, 0xD7, 0xDB, 0xD7, 0xBF, 0xFC, 0xDD, 0x6F, 0xDC, 0x3F, 0xD3, 
-0xF9, 0x63, 0x2F, 0xB5, 0x86, 0x56, 0x2B, 0x09, 0x52, 0x81, 0x9A, 0x66, 0xED, 0x06, 0xF8, 0xBD, 
-0xDF, 0x7D, 0x2B, 0xD7, 0xBC, 0xE0, 0x32, 0xB2, 0xCE, 0x01, 0xE6, 0xEE, 0xBE, 0x95, 0xF9, 0xAD, 
-0x9B, 0x48, 0xCB, 0x8A, 0x7A, 0xDA, 0xE0, 0xF6, 0xBD, 0x15, 0xD7, 0x7E, 0xF8, 0x0E, 0x6E, 0xDF, 
-0xA7, 0x11, 0x56, 0xE0, 0x19, 0x89, 0x99, 0xE2, 0x89, 0x59, 0x88, 0x44, 0x45, 0x52, 0xE3, 0x58, 
-0xC2, 0x85, 0x23, 0x8E, 0xDF, 0xBA, 0xC2, 0xEA, 0x1E, 0x89, 0x9F, 0x67, 0x48, 0xF6, 0xF3, 0xE4, 
-0x93, 0x6A, 0xBC, 0xEB, 0x55, 0x4F, 0xE5, 0xE4, 0xC6, 0x02, 0xCB, 0xD3, 0x1E, 0x2A, 0xF4, 0x40, 
-0x95, 0x51, 0xF7, 0xA5, 0xA2, 0x5B, 0x98, 0x09, 0x1A, 0x25, 0x51, 0x32, 0x1C, 0xA4, 0x52, 0x3C, 
-0x72, 0x41, 0x0F, 0x03, 0x5E, 0x69, 0x4A, 0xD1, 0x24, 0xAA, 0x86, 0xCC, 0x06, 0x26, 0xEF, 0x3B, 
-0x84, 0x9B, 0x75, 0x8C, 0xA6, 0x63, 0x40, 0xF4, 0x92, 0xC8, 0x01, 0xB2, 0x1A, 0x3E, 0x1B, 0xA2, 
-0xAB, 0xEB, 0x4C, 0xE6, 0x86, 0x1D, 0x33, 0x05, 0x5B, 0x27, 0x16, 0xD8, 0xBD, 0x50, 0xB0, 0xAD, 
-0x55, 0xB0, 0x40, 0xC2, 0xBC, 0x38, 0x0A, 0x52, 0x0A, 0x95, 0x12, 0x4C, 0x82, 0x78, 0x85, 0x4D, 
-0x2D, 0x94, 0x25, 0x5A, 0x1C, 0x8A, 0x2A, 0x2A, 0x5B, 0x34, 0x78, 0x64, 0x40, 0xBA, 0x0E, 0x2D, 
-0x25, 0xCD, 0x7A, 0xC2, 0xF8, 0xF8, 0x18, 0xAB, 0x56, 0x2F, 0x67, 0xD5, 0xAA, 0x71, 0x4E, 0xDC, 
-0xB8, 0x8E, 0xF3, 0xCE, 0x3D, 0x83, 0x53, 0x4F, 0xDB, 0xC0, 0x05, 0x17, 0x9E, 0x4D, 0x92, 0x42, 
-0x9A, 0x69, 0x8C, 0x16, 0x94, 0x8E, 0x12, 0x90, 0x10, 0x08, 0xA1, 0x1C, 0xF8, 0x86, 0xFA, 0xD8, 
-0xAD, 0xCA, 0xA1, 0x11, 0xC4, 0x3B, 0x74, 0x18, 0xC4, 0xDE, 0x7B, 0x17, 0x2D, 0xDF, 0x2C, 0xF2, 
-0xE5, 0x20, 0xFD, 0xDF, 0x60, 0x51, 0x8C, 0xD9, 0x53, 0xA2, 0xF7, 0xC0, 0x91, 0x36, 0x50, 0xC1, 
-0x40, 0xF4, 0xC7, 0x55, 0x21, 0x4A, 0xB0, 0x8B, 0xEF, 0x2F, 0xF6, 0xB7, 0x56, 0x87, 0x43, 0x51, 
-0x95, 0x32, 0xF1, 0xB8, 0x03, 0x22, 0x8F, 0x29, 0x06, 0x0D, 0x52, 0x54, 0xA8, 0xA4, 0x16, 0xF5, 
-0xBB, 0x26, 0x4A, 0x62, 0x28, 0x0B, 0xDA, 0x80, 0x4E, 0xC1, 0x0C, 0x81, 0x07, 0xAA, 0x40, 0x15, 
-0x04, 0x1F, 0x14, 0x79, 0x51, 0xB1, 0xD0, 0xEE, 0xD3, 0xE9, 0x96, 0xDC, 0x73, 0xDF, 0x4E, 0xEE, 
-0xB9, 0x77, 0x3B, 0x77, 0xDF, 0xBD, 0x8D, 0x83, 0x93, 0xB3, 0xCC, 0xCC, 0xB6, 0x99, 0x38, 0x34, 
-0xCD, 0xDC, 0xDC, 0x02, 0xAE, 0x02, 0xF1, 0xB1, 0x36, 0x9E, 0xC8, 0x60, 0x21, 0x57, 0x09, 0x5A, 
-0xA7, 0x91, 0x9C, 0x83, 0x90, 0x24, 0x43, 0x54, 0x95, 0xC7, 0x6A, 0x85, 0x0F, 0x05, 0xA9, 0x15, 
-0x0A, 0xD7, 0x01, 0x1C, 0xCB, 0x86, 0x13, 0x56, 0x8C, 0xA5, 0x5C, 0x79, 0xC5, 0xB9, 0xBC, 0xF0, 
-0xC5, 0x4F, 0xE7, 0xA2, 0x4B, 0x4F, 0x65, 0xCD, 0xFA, 0x31, 0xBC, 0xF4, 0xC8, 0x12, 0x4F, 0x4A, 
-0x09, 0x65, 0x1F, 0xD9, 0x75, 0x0F, 0x73, 0x5B, 0x6E, 0xA1, 0xB3, 0xF3, 0x1E, 0xC6, 0x4D, 0xA0, 
-0x1E, 0x4A, 0xA4, 0x2A, 0xB1, 0x89, 0x45, 0x42, 0x0C, 0xB3, 0xFD, 0xFE, 0x10, 0xFD, 0xC5, 0x01, 
-0x74, 0xC8, 0xE2, 0xEE, 0x4F, 0x85, 0xA8, 0x72, 0xD0, 0x55, 0xD4, 0xC1, 0xAA, 0x84, 0x9E, 0x6F, 
-0x40, 0xFD, 0x44, 0xEE, 0x9B, 0x4A, 0xF9, 0xDB, 0x4F, 0xDC, 0xC1, 0xA7, 0x6E, 0xDF, 0x4F, 0x5B, 
-0x6F, 0xA0, 0x2D, 0xA3, 0x28, 0xA9, 0xA1, 0x58, 0xF4, 0xE9, 0xE5, 0x01, 0x4B, 0x67, 0x5C, 0xD0, 
-0x8F, 0x10, 0x6E, 0xDC, 0x5B, 0x45, 0xC2, 0xAD, 0xA9, 0x39, 0xCE, 0x5F, 0x9F, 0xF3, 0xF6, 0x17, 
-0x5D, 0xC8, 0x33, 0x4F, 0x11, 0x46, 0x42, 0x8C, 0xA9, 0x2C, 0x74, 0x46, 0x27, 0x5D, 0xCB, 0xBD, 
-0x93, 0x96, 0xFF, 0xF5, 0xA1, 0xAF, 0x71, 0xCB, 0x2E, 0xA1, 0xC3, 0x49, 0x54, 0x0C, 0x93, 0x59, 
-0x8F, 0x0F, 0x5D, 0x2F, 0xA6, 0x73, 0xC3, 0xCF, 0xFE, 0xFC, 0x5B, 0x5E, 0xFB, 0x07, 0x7F, 0xF0, 
-0x2B, 0x07, 0xEE, 0x77, 0xC2, 0xE3, 0x04, 0xDF, 0xF7, 0x2D, 0xF9, 0xAF, 0xC6, 0xDF, 0xFD, 0xDD, 
-0x67, 0x9B, 0xEF, 0xFE, 0xD9, 0x77, 0xFF, 0xCE, 0x7C, 0x5F, 0xDE, 0x51, 0x55, 0x4A, 0xA7, 0xE9, 
-0x5A, 0x94, 0xF2, 0x14, 0xC5, 0x4E, 0x4E, 0x3B, 0x73, 0x84, 0xBF, 0xFE, 0x8B, 0x5F, 0xE4, 0x69, 
-0x8F, 0xDF, 0x88, 0x4C, 0x6C, 0xE5, 0xD0, 0x5D, 0x37, 0x93, 0xEF, 0xD9, 0x46, 0x53, 0x69, 0x8C, 
-0x1D, 0xE2, 0xAB, 0x77, 0xCD, 0xF2, 0xDB, 0x1F, 0xD9, 0xCC, 0x8E, 0xD9, 0x51, 0x82, 0x8C, 0xE3, 
-0x64, 0x88, 0x8A, 0x58, 0x30, 0x32, 0xA8, 0x2A, 0xBA, 0x03, 0x0D, 0xF4, 0x72, 0x0F, 0x4E, 0xB8, 
-0x01, 0x65, 0x1C, 0x4A, 0x72, 0x12, 0x95, 0xD3, 0x90, 0x19, 0x56, 0xC8, 0x41, 0xDE, 0xF6, 0x92, 
-0xCB, 0x78, 0xD9, 0x13, 0x37, 0xD2, 0x28, 0xF6, 0xD1, 0xD4, 0x6D, 0x0C, 0x05, 0x5E, 0x31, 0xE8, 
-0xC6, 0xE8, 0xF6, 0x65, 0x07, 0x73, 0x5E, 0xE4, 0xFB, 0x1F, 0xF0, 0x5E, 0x69, 0x0A, 0xA3, 0xB1, 
-0x92, 0x92, 0x75, 0x0D, 0x73, 0xDB, 0xA7, 0x68, 0xEF, 0xEF, 0x50, 0x37, 0xC3, 0xE8, 0x6C, 0x98, 
-0x42, 0xA7, 0x94, 0xB5, 0x26, 0xD3, 0x15, 0x1C, 0x68, 0x97, 0xEC, 0x9A, 0x2D, 0xD8, 0x3E, 0x99, 
-0xB3, 0x73, 0xB6, 0x64, 0xB2, 0x1F, 0x98, 0x27, 0xA1, 0x8D, 0xA6, 0x20, 0xA5, 0x44, 0x23, 0x26, 
-0x21, 0x24, 0x29, 0x2E, 0x78, 0x5C, 0x59, 0x00, 0x01, 0x4B, 0x49, 0xAA, 0x3D, 0x56, 0x0B, 0x22, 
-0x39, 0xDA, 0xC2, 0xD0, 0xB2, 0x61, 0xD6, 0xAE, 0x5F, 0xC7, 0xCA, 0x35, 0xE3, 0x9C, 0x7E, 0xCA, 
-0x3A, 0xD6, 0xAD, 0x5B, 0xC1, 0xE9, 0xA7, 0x9F, 0xCA, 0xC6, 0x8D, 0x27, 0xB2, 0x6C, 0xB4, 0x49, 
-0x56, 0xB3, 0x0C, 0x0F, 0xD5, 0x18, 0x6A, 0xA6, 0x04, 0xDF, 0x43, 0x1B, 0x40, 0x55, 0xD1, 0x36, 
-0x24, 0x15, 0xD1, 0xB9, 0xD2, 0x13, 0x5C, 0x89, 0xD6, 0x42, 0x08, 0x05, 0xB8, 0x6A, 0xA0, 0xA4, 
-0x50, 0xF1, 0x33, 0x3E, 0xE6, 0x08, 0x86, 0x81, 0x14, 0x5A, 0x39, 0x28, 0x4A, 0x28, 0x2B, 0x42, 
-0x15, 0x63, 0x10, 0x44, 0x3C, 0xCE, 0x17, 0xF7, 0x53, 0x15, 0x48, 0x70, 0x51, 0x5F, 0xBA, 0xD8, 
-0x7C, 0x7C, 0xAE, 0x16, 0xDF, 0x1F, 0x7C, 0x56, 0x24, 0x96, 0xE5, 0xC6, 0x68, 0x44, 0x1F, 0xF1, 
-0x42, 0xD0, 0x72, 0x94, 0xD1, 0x4D, 0x59, 0x30, 0xB1, 0x68, 0xA8, 0x32, 0x29, 0x4A, 0xA7, 0x28, 
-0x63, 0xD0, 0x36, 0x25, 0x49, 0x6B, 0x68, 0x5B, 0x43, 0xD9, 0x1A, 0xCA, 0x66, 0xA8, 0x24, 0x03, 
-0x9B, 0x80, 0x49, 0x22, 0x21, 0x2B, 0x1B, 0xAB, 0x11, 0x84, 0x84, 0x4E, 0xEE, 0xE8, 0x76, 0x2B, 
-0x5A, 0xBD, 0x82, 0xD9, 0xB9, 0x16, 0x3B, 0x76, 0xED, 0x63, 0xCB, 0x96, 0x7B, 0xD9, 0xBD, 0x67, 
-0x82, 0xBD, 0xFB, 0x17, 0x98, 0x9C, 0x9A, 0x67, 0x6A, 0x72, 0x86, 0x56, 0xA7, 0x8F, 0xAB, 0x34, 
-0x41, 0x2C, 0x46, 0xD7, 0x30, 0x49, 0x93, 0x22, 0xF7, 0xA0, 0x2C, 0x89, 0x49, 0xA8, 0x5C, 0x45, 
-0x2D, 0x8B, 0xD5, 0x75, 0x7B, 0xFD, 0x16, 0x89, 0x01, 0xA5, 0x72, 0x9A, 0x35, 0x58, 0xB3, 0x66, 
-0x88, 0xB3, 0xCE, 0x5D, 0xCF, 0xB3, 0x9F, 0xF5, 0x78, 0x9E, 0xF4, 0x84, 0x0B, 0x39, 0x79, 0xC3, 
-0x18, 0x35, 0x37, 0x8F, 0x9B, 0xDC, 0xC1, 0xC4, 0xA6, 0x6F, 0xA0, 0xA7, 0x76, 0xB2, 0x9C, 0x1E, 
-0x75, 0x97, 0x23, 0xFD, 0x0E, 0x1A, 0x03, 0xDA, 0xC6, 0x34, 0x9E, 0xDF, 0xE7, 0xF8, 0x8B, 0xAA, 
-0x2F, 0x89, 0xEB, 0x84, 0x28, 0xB4, 0x2C, 0x92, 0x65, 0x20, 0x28, 0x8F, 0xD7, 0x20, 0xB6, 0xC6, 
-0xBC, 0x6B, 0x50, 0x26, 0x27, 0xF1, 0xB1, 0x2F, 0x6F, 0xE7, 0x23, 0x9F, 0xDF, 0xCA, 0xAE, 0xEE, 
-0x10, 0xF3, 0x8C, 0xE1, 0xED, 0x32, 0x82, 0x37, 0x71, 0xA7, 0xF7, 0x10, 0x84, 0x1B, 0x93, 0x3C, 
-0x1E, 0x25, 0xF0, 0x0C, 0x04, 0x14, 0x03, 0xD4, 0xD4, 0x1C, 0x1B, 0x97, 0xB7, 0x79, 0xED, 0xD3, 
-0x4E, 0xE6, 0x55, 0x57, 0x2C, 0x67, 0xB9, 0x1C, 0xC4, 0xFB, 0x05, 0x2A, 0x9B, 0xD0, 0xD1, 0xCB, 
-0x39, 0xE4, 0x56, 0xF0, 0x81, 0x7F, 0xBB, 0x8D, 0xCF, 0xDC, 0x34, 0xC5, 0x5C, 0xD8, 0x40, 0x2B, 
-0x64, 0xD4, 0xB4, 0x06, 0x55, 0x48, 0xDF, 0x4F, 0xED, 0xBC, 0xEC, 0xB2, 0x4B, 0xDE, 0xFA, 0xED, 
-0x6F, 0x7F, 0xE2, 0x4B, 0xC7, 0xBA, 0xE4, 0x1D, 0x0F, 0xF8, 0x3E, 0x6F, 0xC9, 0x7F, 0x3D, 0xFE, 
-0xFC, 0x7D, 0x1F, 0x5A, 0xFE, 0x2B, 0xEF, 0x7D, 0xDF, 0x07, 0x4A, 0x67, 0x5F, 0xE2, 0xA9, 0x23, 
-0xBE, 0x01, 0x94, 0xE8, 0x64, 0x9A, 0xA7, 0x5F, 0x7D, 0x06, 0x7F, 0xFA, 0x87, 0xEF, 0xE0, 0xEC, 
-0x53, 0x1A, 0xB8, 0x9D, 0x9B, 0x99, 0xDC, 0xFC, 0x2D, 0xCA, 0x43, 0xFB, 0xA9, 0x6B, 0x0B, 0x6A, 
-0x88, 0x4F, 0x7E, 0x73, 0x0F, 0x7F, 0xFC, 0x89, 0x1D, 0x1C, 0xE8, 0xAF, 0xA2, 0x72, 0x63, 0x78, 
-0x69, 0x52, 0xA0, 0xD1, 0x58, 0x82, 0x2A, 0x10, 0x91, 0x38, 0x30, 0x0F, 0x0F, 0x83, 0x70, 0x78, 
-0x5B, 0x1A, 0x16, 0xBB, 0x44, 0xC7, 0xD8, 0x74, 0x6B, 0x34, 0x0D, 0xDD, 0x47, 0x57, 0xBB, 0x78, 
-0xDA, 0xD9, 0x2B, 0x78, 0xFB, 0x0B, 0xCF, 0xE3, 0xDC, 0x15, 0x25, 0x23, 0x61, 0x82, 0x44, 0x7A, 
-0x03, 0x4B, 0xAE, 0x42, 0x48, 0x51, 0x02, 0x89, 0x2C, 0x46, 0x98, 0x2D, 0x26, 0x69, 0x7E, 0x68, 
-0x44, 0x43, 0xD4, 0x03, 0xE1, 0x95, 0xC6, 0x25, 0x96, 0x90, 0x07, 0x86, 0x7C, 0x9D, 0x72, 0xA2, 
-0xCB, 0xD4, 0xEE, 0x59, 0xF2, 0xDC, 0x22, 0xF5, 0x15, 0xF8, 0xD1, 0x15, 0xCC, 0xA8, 0x06, 0x9B, 
-0xF6, 0xCF, 0x73, 0xF3, 0xB6, 0x43, 0x6C, 0x9D, 0xE8, 0x32, 0xE5, 0x0D, 0x3D, 0x1A, 0x54, 0x34, 
-0x70, 0xA4, 0x14, 0x4A, 0x70, 0x5A, 0xE3, 0x25, 0x50, 0x06, 0x0F, 0x46, 0xE3, 0x43, 0x09, 0x14, 
-0x58, 0x13, 0x48, 0x74, 0x81, 0xD6, 0x25, 0xC3, 0xC3, 0x09, 0x27, 0x6E, 0x3C, 0x81, 0x0B, 0x2F, 
-0x3A, 0x9B, 0x4B, 0x2F, 0xBB, 0x98, 0x33, 0xCF, 0x3E, 0x8B, 0x55, 0xAB, 0xC7, 0x18, 0x1A, 0x4E, 
-0x68, 0xD4, 0x2D, 0xF5, 0x5A, 0x4A, 0x62, 0x54, 0x74, 0x81, 0xD3, 0xD1, 0x05, 0x0E, 0x9F, 0x83, 
-0x2B, 0x41, 0x47, 0xB5, 0x03, 0xBE, 0x1C, 0x84, 0x80, 0x0A, 0xF8, 0x0A, 0xCA, 0x7E, 0x7C, 0xAC, 
-0xFA, 0x90, 0xE7, 0x84, 0xAA, 0x20, 0x38, 0x8F, 0x54, 0x39, 0xBE, 0xC8, 0x91, 0xAA, 0xA2, 0xEA, 
-0xF7, 0x50, 0x95, 0x27, 0x94, 0x05, 0x55, 0x5E, 0xE0, 0x0A, 0x47, 0x55, 0x94, 0x48, 0xE9, 0xA2, 
-0xF4, 0xEB, 0x72, 0x8C, 0x0C, 0x8C, 0x52, 0x12, 0x5D, 0x95, 0x44, 0xA2, 0x76, 0x59, 0x44, 0xF0, 
-0x03, 0xD2, 0x8E, 0x79, 0xAB, 0xA2, 0x61, 0x8F, 0xC1, 0x7B, 0x81, 0xE8, 0x19, 0x22, 0x3A, 0xBE, 
-0x27, 0x32, 0xA8, 0x16, 0x4B, 0xF4, 0x13, 0xD6, 0x7A, 0x10, 0xF9, 0xA7, 0x2C, 0xA2, 0x0D, 0x4A, 
-0x27, 0x68, 0x9B, 0x62, 0x93, 0x2C, 0x7A, 0x64, 0x24, 0x09, 0x7A, 0x74, 0x04, 0xD2, 0x48, 0xC0, 
-0x26, 0x89, 0x41, 0x27, 0xC6, 0xD6, 0x30, 0x69, 0x1D, 0x9D, 0x35, 0xC0, 0xD4, 0xA0, 0x3E, 0x04, 
-0x69, 0x33, 0x4A, 0xC8, 0x36, 0x8B, 0x92, 0x71, 0x5E, 0xD2, 0xEB, 0x15, 0x4C, 0xCC, 0x77, 0xD9, 
-0xB2, 0x6D, 0x0F, 0xB7, 0xDE, 0xBA, 0x99, 0xBB, 0x36, 0x6F, 0x65, 0xDB, 0xCE, 0x03, 0x1C, 0x98, 
-0x58, 0x60, 0x6E, 0xBE, 0x4F, 0xE1, 0x14, 0xB5, 0xDA, 0x38, 0x5E, 0x2C, 0xDE, 0x5B, 0x82, 0xD8, 
-0xC8, 0x37, 0x3A, 0x43, 0x99, 0xB8, 0x43, 0x12, 0xE9, 0xC7, 0xD0, 0x59, 0xB7, 0x80, 0xB1, 0x15, 
-0x27, 0xAC, 0x6E, 0xF2, 0xD4, 0x2B, 0x2F, 0xE0, 0xF9, 0x57, 0x5F, 0xC2, 0x13, 0xCE, 0x5F, 0x47, 
-0xB1, 0xEF, 0x0E, 0xC2, 0xE4, 0x16, 0x46, 0x7A, 0xFB, 0x58, 0x95, 0x95, 0xD8, 0xAA, 0x13, 0x23, 
-0xBF, 0x74, 0x42, 0x55, 0x09, 0xC6, 0xA6, 0xDF, 0xF7, 0xF4, 0x5E, 0xB4, 0x35, 0xC4, 0x8D, 0xC7, 
-0xA2, 0x0F, 0x6E, 0x7C, 0x31, 0x28, 0xA1, 0xD2, 0x86, 0x42, 0x67, 0x14, 0xD9, 0x09, 0xDC, 0x73, 
-0x28, 0xE3, 0x8F, 0x3E, 0x78, 0x3D, 0x37, 0xEF, 0x0B, 0xE4, 0x6A, 0x3D, 0x0B, 0x92, 0x21, 0xA6, 
-0x31, 0x08, 0x69, 0x3F, 0x8A, 0xF4, 0x0F, 0xFF, 0x13, 0x67, 0xDC, 0x22, 0xE1, 0xEA, 0x45, 0x37, 
-0xB4, 0x01, 0xE1, 0x2A, 0x14, 0x99, 0x5E, 0x60, 0x4D, 0x73, 0x96, 0xE7, 0x5D, 0xBA, 0x9C, 0x77, 
-0x3E, 0xE7, 0x34, 0xD6, 0x98, 0x29, 0xAC, 0x9F, 0xC3, 0x6B, 0xC3, 0x82, 0x1E, 0xA2, 0x9D, 0xAE, 
-0xE7, 0xA3, 0x5F, 0xDE, 0xC5, 0x87, 0x3E, 0xB9, 0x99, 0xA9, 0x6A, 0x2D, 0x5D, 0x19, 0x46, 0xB4, 
-0x60, 0x8C, 0x90, 0x57, 0x93, 0xB3, 0xCB, 0x96, 0x0D, 0xFD, 0xCA, 0xEC, 0xFB, 0xEF, 0xFD, 0xA0, 
-0xBA, 0x66, 0x90, 0xBA, 0xEC, 0x38, 0xC2, 0xF7, 0x77, 0x47, 0x7E, 0x04, 0xB8, 0xFC, 0x92, 0x1F, 
-0x7B, 0xFC, 0x4D, 0xB7, 0x6E, 0xF9, 0x80, 0xB6, 0x43, 0xE7, 0x1B, 0xDB, 0xA4, 0x2A, 0x34, 0x22, 
-0x6D, 0x1A, 0x43, 0x5D, 0xDE, 0xF4, 0x93, 0xCF, 0xE2, 0x37, 0x7F, 0xE5, 0x27, 0x58, 0x39, 0xD2, 
-0xA7, 0xB8, 0xFB, 0x26, 0xA6, 0xB6, 0xDC, 0x0A, 0x0B, 0xD3, 0x64, 0xBA, 0x46, 0xCF, 0x35, 0xB8, 
-0xEE, 0x8B, 0xF7, 0xF0, 0xD7, 0x5F, 0x38, 0xC0, 0x6C, 0xD8, 0x40, 0x59, 0x8D, 0x20, 0x34, 0xC9, 
-0x11, 0x0C, 0x49, 0x24, 0x5C, 0xC2, 0x60, 0xD5, 0x8E, 0x26, 0xB2, 0x23, 0x84, 0x1B, 0x06, 0x6A, 
-0x87, 0xB8, 0x1D, 0x76, 0xE2, 0xA2, 0xDF, 0x6B, 0xD5, 0xA2, 0xA9, 0x3A, 0x9C, 0x34, 0x96, 0xF3, 
-0xFC, 0x4B, 0x47, 0x79, 0xF3, 0xF3, 0xCF, 0x65, 0x85, 0xDF, 0x45, 0x23, 0x2C, 0xC4, 0x5D, 0x2F, 
-0x0A, 0xA7, 0x32, 0x94, 0x40, 0x2A, 0x45, 0xCC, 0x9A, 0x14, 0xE3, 0x72, 0x8E, 0xBD, 0xAC, 0x07, 
-0xC5, 0xB1, 0xC4, 0x1B, 0x14, 0x54, 0x18, 0xB4, 0x57, 0xD4, 0xCA, 0x8C, 0xD6, 0x44, 0x8B, 0xF6, 
-0xB4, 0xC3, 0xD9, 0x65, 0x4C, 0x96, 0x75, 0x76, 0xB5, 0x0D, 0xB7, 0x4C, 0xB4, 0xD8, 0x3A, 0xE7, 
-0xD8, 0x31, 0x55, 0x30, 0xEB, 0x2C, 0x95, 0x1A, 0xA2, 0x54, 0x96, 0x22, 0x40, 0x89, 0xC4, 0xD2, 
-0x28, 0x03, 0xCF, 0x81, 0x32, 0x14, 0x64, 0xA9, 0x21, 0xAB, 0x69, 0x56, 0xAE, 0x6C, 0x32, 0xBE, 
-0xAC, 0xCE, 0xC5, 0x17, 0x9F, 0xCE, 0x29, 0xA7, 0xAC, 0xE1, 0xDC, 0x73, 0x4E, 0x61, 0xC3, 0x89, 
-0xAB, 0x18, 0x1E, 0xCA, 0x48, 0x33, 0x4D, 0xA3, 0x96, 0x91, 0xA5, 0x90, 0x24, 0x9E, 0xC4, 0x00, 
-0x41, 0x10, 0x5F, 0xA1, 0x55, 0x88, 0x7E, 0xAF, 0x65, 0x1F, 0xBA, 0xED, 0x38, 0x41, 0xAA, 0x1C, 
-0xFA, 0x39, 0x55, 0xBF, 0x83, 0xCB, 0xFB, 0x54, 0x65, 0x41, 0x59, 0xF4, 0xF1, 0x45, 0x8F, 0xAA, 
-0xD7, 0x8A, 0x04, 0x5B, 0x56, 0x48, 0xF0, 0x20, 0x51, 0x8D, 0x10, 0xAA, 0x12, 0x71, 0x8E, 0x44, 
-0x11, 0x0B, 0x78, 0x86, 0x80, 0x0E, 0x03, 0xDD, 0xA7, 0xC4, 0x52, 0x2E, 0x26, 0x04, 0xA2, 0xA7, 
-0xE8, 0x40, 0x0A, 0x3A, 0x2C, 0xA5, 0x86, 0xC1, 0xCE, 0x64, 0xE0, 0x8E, 0xA6, 0xE3, 0xC2, 0xA9, 
-0x06, 0x49, 0xE2, 0x17, 0x21, 0x22, 0xB8, 0xFB, 0xE9, 0x75, 0x8F, 0xF4, 0xB1, 0x19, 0x94, 0x4A, 
-0xF2, 0xDE, 0x47, 0x83, 0x11, 0x1A, 0x51, 0x31, 0xA1, 0x91, 0xC2, 0xE0, 0x51, 0x54, 0x4A, 0x28, 
-0x2C, 0x54, 0xA8, 0x28, 0x25, 0x6B, 0x83, 0x32, 0x16, 0x51, 0x86, 0xA0, 0x2D, 0xA2, 0x13, 0xD2, 
-0x5A, 0x13, 0x65, 0x1B, 0xD8, 0xAC, 0x8E, 0x4D, 0x1B, 0xA4, 0x59, 0x83, 0x24, 0xAB, 0x53, 0x6B, 
-0x34, 0x51, 0xF5, 0x26, 0x2E, 0xCB, 0xF0, 0x49, 0x0D, 0xE7, 0x2D, 0x9D, 0x4E, 0x60, 0x7A, 0x36, 
-0x67, 0xCF, 0xFE, 0x59, 0xEE, 0xD9, 0xBA, 0x8F, 0x9D, 0x7B, 0x0E, 0xB1, 0x75, 0xDB, 0x01, 0xF6, 
-0x1E, 0x98, 0x61, 0xCF, 0x81, 0x69, 0x30, 0x0D, 0x8A, 0xC2, 0x10, 0x24, 0xC1, 0x9A, 0x06, 0x85, 
-0x0B, 0x71, 0xB7, 0x40, 0x00, 0xE5, 0x18, 0x6E, 0x24, 0xF4, 0xDA, 0xD3, 0x64, 0xAA, 0xCF, 0x89, 
-0xCB, 0x33, 0x2E, 0x3C, 0x75, 0x94, 0x27, 0x9D, 0x39, 0xC6, 0x95, 0xA7, 0x0F, 0xB3, 0x3E, 0x9D, 
-0xA7, 0x56, 0x1D, 0xA2, 0xE6, 0xBB, 0x64, 0x59, 0x8C, 0xDC, 0xF3, 0x12, 0xFD, 0xBA, 0xE1, 0x28, 
-0x9F, 0xE5, 0x87, 0x09, 0x2F, 0x6A, 0xE0, 0x07, 0x36, 0x20, 0x42, 0x19, 0xE4, 0x04, 0x51, 0x8A, 
-0xC2, 0x64, 0x74, 0xA8, 0x53, 0x34, 0x4E, 0xE4, 0x5F, 0x6F, 0xD8, 0xC7, 0xFF, 0xFE, 0xD7, 0x5B, 
-0x38, 0x54, 0xAD, 0xA6, 0xC3, 0x38, 0x62, 0x9B, 0x54, 0x4E, 0x30, 0xEA, 0xA1, 0x09, 0x57, 0x44, 
-0xE2, 0xE5, 0x1D, 0x45, 0xBC, 0x88, 0x1F, 0xE8, 0x72, 0x15, 0x89, 0x6E, 0x33, 0x9A, 0x1C, 0xE2, 
-0x29, 0x67, 0xD6, 0xF8, 0xD5, 0x17, 0x5F, 0xC0, 0xC9, 0x8D, 0x79, 0xEA, 0x32, 0x8F, 0x36, 0xC2, 
-0x82, 0xD4, 0xE8, 0x37, 0xD7, 0xF3, 0x85, 0xDB, 0xE7, 0xF9, 0xF3, 0x8F, 0xDC, 0xC8, 0xF6, 0xF6, 
-0x28, 0x21, 0x5B, 0x4B, 0xE1, 0x01, 0xED, 0x51, 0xAA, 0xC8, 0x9B, 0x43, 0xC9, 0x1F, 0xFE, 0xD5, 
-0x5F, 0xFD, 0x8F, 0xDF, 0xBE, 0xE6, 0x9A, 0xE3, 0x2F, 0xAF, 0xC2, 0x43, 0x69, 0xB4, 0x1F, 0x71, 
-0xB4, 0x5B, 0xF6, 0xC9, 0x41, 0xB2, 0x57, 0x3A, 0xAF, 0xEB, 0xDE, 0x79, 0xB2, 0x5A, 0x1D, 0x63, 
-0x3C, 0x43, 0x43, 0x8E, 0xE7, 0x3E, 0xF3, 0x32, 0x9E, 0x7C, 0xC5, 0x99, 0x24, 0xC5, 0x1C, 0xDD, 
-0x3D, 0x5B, 0xC8, 0xA7, 0x0F, 0x90, 0x89, 0xC3, 0xE8, 0x94, 0x76, 0x61, 0xF9, 0xDA, 0x6D, 0xBB, 
-0xB9, 0x73, 0x4F, 0x49, 0x5F, 0x8D, 0xE1, 0x42, 0x02, 0x2A, 0x23, 0x40, 0xAC, 0x47, 0xA6, 0x7C, 
-0x54, 0xE3, 0xC9, 0x60, 0x40, 0xC2, 0x61, 0xB2, 0x8D, 0xFF, 0xC5, 0xE2, 0x91, 0x68, 0x41, 0x6B, 
-0x43, 0xF0, 0x86, 0x00, 0xD8, 0xB4, 0x4E, 0xE9, 0xFA, 0xF4, 0x5A, 0x07, 0x39, 0xEB, 0xB4, 0x13, 
-0x58, 0x3D, 0xA4, 0x48, 0x25, 0x66, 0x67, 0x52, 0x31, 0xE5, 0x72, 0x94, 0x06, 0x0E, 0xBB, 0xD4, 
-0xC4, 0xE3, 0x7F, 0x3F, 0x50, 0x80, 0xC6, 0x90, 0xD9, 0x1A, 0x04, 0x4B, 0xBB, 0xE5, 0xE9, 0xFA, 
-0x3A, 0x0B, 0x6A, 0x8C, 0x4D, 0x87, 0x3C, 0x37, 0x6C, 0x9D, 0xE5, 0x9B, 0x7B, 0x73, 0xB6, 0x2D, 
-0x64, 0x4C, 0x86, 0x61, 0xBA, 0x6A, 0x94, 0x5C, 0x27, 0xF4, 0x82, 0xC3, 0x2B, 0x87, 0x4D, 0x3D, 
-0x55, 0xE8, 0xA1, 0x74, 0x41, 0x92, 0x79, 0x86, 0x1A, 0xC2, 0x99, 0x67, 0xAE, 0xE5, 0xAA, 0xAB, 
-0x2E, 0xE6, 0xD5, 0xAF, 0x7A, 0x3E, 0xAF, 0x7D, 0xFD, 0x8F, 0xF1, 0x9C, 0xE7, 0x5E, 0xC1, 0x15, 
-0x57, 0x9C, 0xC1, 0x99, 0xA7, 0xAF, 0xE2, 0x84, 0x55, 0x19, 0xCB, 0x87, 0x3D, 0x23, 0x0D, 0x4F, 
-0x3D, 0x2B, 0x49, 0x6D, 0x81, 0xE9, 0xCF, 0xA3, 0xF2, 0x79, 0x54, 0x77, 0x16, 0xD5, 0x9A, 0x82, 
-0xF9, 0x29, 0x98, 0xDE, 0x47, 0x75, 0x60, 0x37, 0xE5, 0xC4, 0x6E, 0xE6, 0xB7, 0xDD, 0x4B, 0x77, 
-0xD7, 0x56, 0x5A, 0x3B, 0xB7, 0xD1, 0xD9, 0xB3, 0x93, 0xCE, 0xDE, 0x5D, 0xF4, 0xF7, 0xED, 0xA6, 
-0x3A, 0xB8, 0x1F, 0x99, 0x3A, 0x48, 0xAD, 0xDD, 0x22, 0x69, 0xCF, 0x93, 0xF5, 0x3A, 0x64, 0xFD, 
-0x0E, 0xF5, 0xA2, 0x47, 0xBD, 0xE8, 0xD3, 0xA8, 0x72, 0xEA, 0xAE, 0x64, 0xC8, 0x57, 0xD4, 0x43, 
-0x15, 0x2B, 0xC2, 0x8A, 0xA3, 0x2E, 0x9E, 0x9A, 0x38, 0x32, 0x71, 0x24, 0x78, 0x10, 0x87, 0x22, 
-0xE6, 0x9C, 0x50, 0xF8, 0xF8, 0xA8, 0x16, 0x8D, 0x2B, 0xD1, 0x43, 0x42, 0xA9, 0x81, 0x54, 0x4D, 
-0xAC, 0xA6, 0x2C, 0xC1, 0x45, 0x29, 0x4F, 0x3C, 0x2A, 0xC4, 0x5C, 0xC6, 0x5A, 0xA2, 0xEB, 0xBE, 
-0xC1, 0x63, 0x18, 0xA4, 0x13, 0x0C, 0x0E, 0xAB, 0x04, 0xA3, 0x21, 0x51, 0x90, 0xE8, 0x18, 0xD5, 
-0x6F, 0x70, 0x18, 0x3C, 0x89, 0x38, 0x9A, 0xAA, 0xA2, 0x1E, 0x0A, 0x1A, 0xBE, 0xA0, 0x19, 0x1C, 
-0xF5, 0x50, 0x90, 0x95, 0x7D, 0xD2, 0xB2, 0x47, 0x9A, 0x77, 0x49, 0xF2, 0x2E, 0xD2, 0x9E, 0xC6, 
-0xCD, 0x4D, 0x52, 0xCD, 0x1E, 0xA2, 0x3F, 0xB5, 0x87, 0xD6, 0x81, 0x1D, 0x74, 0xF6, 0xEF, 0x60, 
-0x61, 0x62, 0x2B, 0x0B, 0x93, 0xDB, 0x28, 0x67, 0x76, 0xA3, 0xDB, 0x53, 0x64, 0x65, 0x8B, 0xD5, 
-0x4D, 0xCB, 0x59, 0x1B, 0x57, 0x73, 0xE5, 0x85, 0xA7, 0x71, 0xF5, 0xE3, 0xCF, 0xE7, 0xB2, 0x0B, 
-0x4E, 0xE1, 0x94, 0xF5, 0xCB, 0x48, 0x55, 0x97, 0x84, 0x9C, 0x50, 0x2C, 0x60, 0x7C, 0x17, 0xAA, 
-0x1E, 0x9A, 0x02, 0x17, 0x2A, 0x6C, 0x12, 0x33, 0xCF, 0x16, 0x45, 0x05, 0x92, 0x61, 0x4C, 0x83, 
-0x4E, 0xCF, 0xB3, 0x6B, 0xF7, 0x7E, 0x76, 0xEC, 0xD8, 0x49, 0xB3, 0xDE, 0x60, 0xC5, 0xB2, 0x11, 
-0x96, 0x8D, 0x0F, 0x83, 0x78, 0x8A, 0xAA, 0xA4, 0xF2, 0x31, 0x74, 0x3A, 0x0C, 0x3C, 0x12, 0x38, 
-0x6A, 0xC1, 0x7A, 0x38, 0x50, 0x2C, 0xBA, 0x34, 0x44, 0x21, 0x51, 0xA9, 0x00, 0xDA, 0x10, 0x94, 
-0xA1, 0x52, 0x75, 0xFA, 0x7A, 0x94, 0xCD, 0x7B, 0x0B, 0x3E, 0xF1, 0xB5, 0xED, 0x6C, 0x3D, 0x04, 
-0x85, 0x59, 0x4D, 0x29, 0x43, 0x51, 0x45, 0xA3, 0xEC, 0x40, 0xA7, 0x1E, 0x55, 0x49, 0x8A, 0x38, 
-0xDF, 0xE2, 0xAF, 0x58, 0xCC, 0x1D, 0x7D, 0xD4, 0x79, 0x00, 0x06, 0xF9, 0x76, 0x41, 0xC7, 0xA2, 
-0x96, 0xD2, 0x61, 0x7C, 0xC8, 0x73, 0xE5, 0x39, 0xEB, 0x18, 0xAF, 0x55, 0xD4, 0xA5, 0xC4, 0x10, 
-0x70, 0x0A, 0xC4, 0xD6, 0xE9, 0x49, 0x8D, 0xFB, 0x76, 0x4F, 0x73, 0x60, 0xD6, 0xE1, 0x55, 0x93, 
-0xBE, 0x73, 0x38, 0xEF, 0x09, 0xE2, 0x41, 0xC2, 0x21, 0x63, 0x47, 0xBF, 0x70, 0xE7, 0x9D, 0x5F, 
-0x3B, 0xEE, 0x02, 0x20, 0x1E, 0xFE, 0x9D, 0xF8, 0x11, 0x40, 0x44, 0xD4, 0xF8, 0xF8, 0xA5, 0xEF, 
-0x9E, 0x9B, 0xAB, 0x7E, 0x5B, 0xDB, 0x5A, 0xCD, 0xD8, 0x1A, 0x55, 0x9E, 0x83, 0xEE, 0x71, 0xD1, 
-0x45, 0x2B, 0xF8, 0xFD, 0xFF, 0xE7, 0xA7, 0x78, 0xD6, 0x13, 0x4E, 0x82, 0xD6, 0x0E, 0xE6, 0x6E, 
-0xFD, 0x32, 0xBD, 0xBD, 0xDB, 0x68, 0x2A, 0x08, 0xAA, 0xC1, 0x9E, 0xD9, 0x94, 0x3F, 0xFD, 0xC7, 
-0xAF, 0xF1, 0xB9, 0x7B, 0x84, 0x8E, 0x3D, 0x89, 0xBC, 0xCA, 0xB0, 0x7A, 0x8C, 0x32, 0x78, 0x94, 
-0x56, 0x38, 0xC9, 0xA3, 0x44, 0x14, 0xA2, 0x0E, 0xF7, 0x88, 0x84, 0x1B, 0x07, 0x56, 0x18, 0x58, 
-0xB5, 0xBD, 0x54, 0x58, 0x6D, 0x71, 0xC1, 0x91, 0x98, 0x0C, 0xD1, 0x25, 0xAA, 0x9A, 0x60, 0xA5, 
-0xD9, 0xC7, 0xDB, 0x5E, 0x78, 0x3E, 0xAF, 0x7D, 0xD2, 0x09, 0x8C, 0xBB, 0x03, 0x34, 0x7C, 0x1F, 
-0x23, 0x0E, 0xA7, 0x52, 0x82, 0x0A, 0x18, 0xA2, 0x77, 0x82, 0x89, 0x56, 0x9F, 0xFB, 0x5D, 0xD7, 
-0x77, 0xC2, 0xB1, 0x52, 0x2E, 0x68, 0x24, 0x58, 0xB4, 0x6B, 0x32, 0x35, 0xEB, 0xD9, 0xBE, 0xAF, 
-0xE0, 0xB6, 0x9D, 0x3D, 0xBE, 0xBA, 0xAD, 0xC3, 0x96, 0x16, 0xCC, 0xB0, 0x8A, 0x05, 0x1A, 0x14, 
-0x64, 0x90, 0x18, 0x44, 0xFA, 0xF8, 0xD0, 0x21, 0x4B, 0x1D, 0xF5, 0xA6, 0xE6, 0xD4, 0x53, 0x36, 
-0x70, 0xDA, 0x29, 0xEB, 0xB9, 0xEC, 0xD2, 0x8B, 0x38, 0xFB, 0xCC, 0x53, 0x38, 0xF3, 0xCC, 0x13, 
-0x19, 0x69, 0x58, 0x86, 0x86, 0x0D, 0x69, 0x52, 0xA1, 0x54, 0x17, 0xA4, 0x1B, 0x7D, 0x38, 0xAB, 
-0x7E, 0xAC, 0x02, 0x90, 0x77, 0x29, 0xDB, 0x2D, 0xAA, 0x56, 0x0B, 0x55, 0xF4, 0xF1, 0xFD, 0x3E, 
-0xFD, 0xBC, 0x47, 0xD5, 0xCB, 0xA9, 0xCA, 0x9C, 0x50, 0x16, 0x68, 0x57, 0xC5, 0x74, 0x94, 0x12, 
-0xC0, 0x55, 0xD8, 0x10, 0x89, 0x6B, 0xF1, 0xB9, 0x92, 0x18, 0x85, 0x65, 0x63, 0x46, 0xAF, 0xC1, 
-0xE2, 0x43, 0x74, 0xFD, 0x59, 0x94, 0x58, 0x07, 0xF9, 0x11, 0x16, 0x17, 0xB9, 0x98, 0x90, 0x26, 
-0xF6, 0x81, 0x88, 0x44, 0x35, 0x8D, 0x8E, 0xF1, 0x80, 0x8B, 0x69, 0x2D, 0x1F, 0xA8, 0x8D, 0x1B, 
-0x2C, 0x90, 0x47, 0x79, 0x33, 0x2C, 0x12, 0x8B, 0x52, 0x31, 0x6A, 0x4F, 0x16, 0x23, 0xFC, 0x74, 
-0x34, 0xA0, 0x41, 0x00, 0x51, 0x84, 0x10, 0x0D, 0xA7, 0xD1, 0x35, 0x69, 0x60, 0x24, 0x1D, 0x04, 
-0x95, 0x28, 0x34, 0xDA, 0x28, 0x74, 0xA8, 0x10, 0xF1, 0xF1, 0x33, 0x5A, 0xE1, 0x02, 0x78, 0x09, 
-0x88, 0x8A, 0xD2, 0x6E, 0x10, 0x08, 0x87, 0xD3, 0xCF, 0x6B, 0x94, 0x89, 0x16, 0xF9, 0x10, 0xA0, 
-0x0C, 0x15, 0x95, 0xF6, 0x38, 0x14, 0xA2, 0xEB, 0x60, 0x1A, 0x60, 0x86, 0x50, 0xE9, 0x10, 0x69, 
-0x73, 0x0C, 0x5B, 0x1F, 0x26, 0x19, 0x1E, 0xA3, 0x39, 0xBA, 0x0A, 0xAF, 0x6B, 0xCC, 0xF7, 0x02, 
-0x5B, 0xB6, 0x1E, 0x60, 0xF3, 0xE6, 0x1D, 0x7C, 0xFD, 0x1B, 0xB7, 0xB3, 0x7F, 0xAA, 0xCD, 0xC4, 
-0x5C, 0xCE, 0x42, 0xCF, 0xE1, 0x5D, 0x4C, 0x58, 0x64, 0xEC, 0x08, 0xA5, 0x8B, 0xEE, 0x79, 0x3A, 
-0xB4, 0xA8, 0x71, 0x90, 0xB3, 0x56, 0xC1, 0xD3, 0xCF, 0x5F, 0xCE, 0x4B, 0xAF, 0x3E, 0x9B, 0x75, 
-0x8D, 0x9C, 0x9A, 0x5B, 0x20, 0xC1, 0xA1, 0x7C, 0x85, 0x39, 0xD6, 0x48, 0xF5, 0x30, 0x49, 0x57, 
-0x64, 0x10, 0xE4, 0xA2, 0x8F, 0xEC, 0x15, 0x44, 0x25, 0x38, 0x95, 0xD1, 0xD3, 0x63, 0xCC, 0xC9, 
-0x4A, 0xFE, 0xF1, 0x0B, 0x77, 0xF3, 0x8F, 0x5F, 0xDC, 0xC5, 0xC1, 0x72, 0x39, 0x85, 0x5E, 0x4B, 
-0xB0, 0xA3, 0x54, 0x65, 0x1F, 0xAB, 0xD2, 0x41, 0x28, 0x76, 0x38, 0xAC, 0x42, 0x40, 0x06, 0x86, 
-0xCC, 0x63, 0xB0, 0x28, 0xF1, 0xC5, 0xF7, 0xE2, 0x3D, 0xB5, 0xAA, 0x87, 0x61, 0x3F, 0x97, 0x6C, 
-0xD4, 0xBC, 0xE7, 0x55, 0x8F, 0xE3, 0xBC, 0xB1, 0x1E, 0xCB, 0x65, 0x1E, 0x1D, 0xBA, 0xF4, 0xB5, 
-0x21, 0xAF, 0xAF, 0x64, 0x57, 0x67, 0x94, 0xBF, 0xFB, 0xF4, 0x5D, 0x7C, 0xFC, 0xEB, 0xD3, 0xCC, 
-0xC9, 0x0A, 0x7A, 0xBA, 0x06, 0x49, 0x0D, 0x2D, 0x95, 0x88, 0xCF, 0x37, 0x3F, 0xF5, 0x69, 0x8F, 
-0x7F, 0xD5, 0xE7, 0x3F, 0xFF, 0xB7, 0x9B, 0xEF, 0x77, 0xB2, 0xE3, 0x00, 0xC7, 0xAB, 0x84, 0xAB, 
-0xBF, 0xFD, 0xAD, 0x3D, 0x3F, 0xD1, 0xCF, 0xDD, 0x65, 0xC6, 0xD4, 0x0D, 0x0A, 0x84, 0x80, 0xD5, 
-0x39, 0x97, 0x5D, 0x76, 0x0A, 0xCF, 0xBA, 0xEA, 0x12, 0xD6, 0xAD, 0x1F, 0xC2, 0x1D, 0xDA, 0x4E, 
-0x67, 0xEF, 0x56, 0xA4, 0x3D, 0x8B, 0xB8, 0x8A, 0xB4, 0x36, 0xC6, 0xFE, 0x79, 0xE1, 0x8B, 0x37, 
-0xED, 0x60, 0xF7, 0x82, 0xA5, 0x1F, 0x86, 0x80, 0x3A, 0x6E, 0x90, 0xE7, 0x33, 0x10, 0xD0, 0xFA, 
-0xE8, 0x1A, 0x4D, 0x8B, 0x32, 0x6E, 0x5C, 0x8D, 0x81, 0xC3, 0x55, 0x78, 0x95, 0x36, 0x58, 0x93, 
-0x20, 0x21, 0x5A, 0xC0, 0x6D, 0x92, 0x52, 0xF9, 0x82, 0xC4, 0x06, 0x42, 0xD9, 0xE1, 0xB4, 0x75, 
-0xA3, 0x2C, 0x6F, 0x26, 0x64, 0x52, 0x91, 0x24, 0x06, 0x7C, 0x88, 0xAE, 0x4F, 0x56, 0xE3, 0xFC, 
-0x20, 0x99, 0xB3, 0x7C, 0xEF, 0x03, 0x5D, 0x0D, 0xC2, 0x4C, 0x95, 0x8A, 0xDB, 0xD8, 0xA0, 0x02, 
-0x2A, 0xA9, 0xD1, 0xF5, 0x86, 0xB6, 0x6B, 0x70, 0xDF, 0x8C, 0xE3, 0x93, 0xDF, 0xBC, 0x87, 0x7B, 
-0xBB, 0xD0, 0x56, 0xCB, 0x69, 0xE9, 0x3A, 0x3D, 0x34, 0xC1, 0x08, 0x4A, 0xF7, 0xD1, 0x6A, 0x9E, 
-0xD1, 0x65, 0x9E, 0x8B, 0x2F, 0xDD, 0xC8, 0xB3, 0x9F, 0x75, 0x29, 0x6F, 0x7E, 0xCB, 0x8B, 0x79, 
-0xF1, 0x8F, 0x3F, 0x85, 0x67, 0x5C, 0x75, 0x21, 0x67, 0x9F, 0xBE, 0x9C, 0x65, 0xC3, 0x8E, 0x46, 
-0xB3, 0xC4, 0xAA, 0x05, 0x54, 0x71, 0x10, 0x95, 0x4F, 0xA1, 0xDA, 0x07, 0x91, 0x99, 0xBD, 0x54, 
-0x87, 0x76, 0x53, 0xEC, 0xDB, 0x4E, 0x77, 0xE7, 0xBD, 0xB4, 0xB7, 0xDD, 0x47, 0x77, 0xF7, 0x56, 
-0xCA, 0x89, 0x9D, 0xB8, 0xE9, 0xFD, 0xB0, 0x30, 0x8D, 0xED, 0xCE, 0x53, 0x2B, 0xDA, 0x34, 0xAA, 
-0x2E, 0x75, 0xDF, 0xA7, 0x16, 0xFA, 0xD4, 0x43, 0x4E, 0x4D, 0x2A, 0x6A, 0xAA, 0x20, 0xA5, 0xC0, 
-0x52, 0x91, 0xA8, 0x8A, 0x54, 0x3B, 0x2C, 0x0E, 0x2B, 0x82, 0x19, 0x48, 0x98, 0x5A, 0xA2, 0x2F, 
-0xEF, 0xA2, 0x9E, 0x0E, 0x04, 0x91, 0x45, 0x43, 0x57, 0x20, 0x0C, 0x6A, 0xC7, 0x2D, 0x36, 0x54, 
-0x00, 0x65, 0x0E, 0x7B, 0x04, 0x3F, 0x78, 0x0F, 0xC6, 0x77, 0x94, 0xD2, 0x28, 0xA5, 0x63, 0xDC, 
-0xC5, 0x22, 0x24, 0x86, 0xFC, 0x1E, 0x4E, 0x0A, 0x7F, 0xF8, 0xF6, 0x4A, 0x7C, 0x5D, 0xA9, 0x81, 
-0xBB, 0x58, 0xFC, 0xD2, 0xE0, 0xCE, 0xA3, 0x01, 0x3D, 0xB8, 0x6F, 0x88, 0x8F, 0xDF, 0x1F, 0x2C, 
-0x02, 0x1A, 0x89, 0x55, 0xBC, 0x95, 0xA0, 0xC5, 0x63, 0x14, 0xD8, 0x41, 0xC0, 0xAA, 0x55, 0x1E, 
-0x2B, 0x1E, 0x23, 0x15, 0x16, 0x47, 0x8D, 0x40, 0x23, 0x78, 0x86, 0x44, 0x68, 0x3A, 0xA1, 0xEE, 
-0x1C, 0x59, 0x59, 0x90, 0x15, 0x5D, 0xE8, 0xCE, 0xE0, 0x5B, 0x13, 0xB8, 0xB9, 0x7D, 0xE4, 0xD3, 
-0xDB, 0xE9, 0x4F, 0xEF, 0x40, 0x77, 0xF6, 0xB3, 0x7E, 0x58, 0x71, 0xC1, 0x49, 0xCB, 0xB8, 0xF4, 
-0xD4, 0xE5, 0x9C, 0xB5, 0x7E, 0x84, 0xB4, 0x9A, 0x67, 0x28, 0xB4, 0x91, 0xF6, 0x41, 0x74, 0x68, 
-0x43, 0xE8, 0x46, 0xEA, 0xB2, 0x0A, 0xB1, 0x01, 0x9D, 0x2A, 0x7A, 0xBD, 0x79, 0xDA, 0x0B, 0x2D, 
-0x36, 0x9C, 0x30, 0xCC, 0x99, 0x27, 0x9E, 0x40, 0x16, 0x1C, 0x35, 0x09, 0x90, 0x17, 0x68, 0x13, 
-0x3D, 0x32, 0x16, 0xC7, 0xD4, 0xC3, 0x81, 0x48, 0x00, 0x89, 0x2E, 0x7C, 0x95, 0xF3, 0x68, 0x63, 
-0x09, 0xC1, 0x23, 0xD6, 0x52, 0xAA, 0x14, 0x33, 0x74, 0x02, 0x3B, 0x67, 0x2D, 0xFF, 0xF4, 0xA9, 
-0xDB, 0xD8, 0xDB, 0x6E, 0xD0, 0x53, 0xCB, 0x70, 0x66, 0x08, 0xE7, 0x84, 0x34, 0x19, 0xA2, 0xF2, 
-0x55, 0x8C, 0x54, 0xD3, 0x47, 0x7B, 0xE0, 0x46, 0x59, 0x77, 0xF1, 0x2F, 0xA6, 0x18, 0x3A, 0x72, 
-0x77, 0xE3, 0xAB, 0x1A, 0x85, 0x06, 0x5D, 0x62, 0x54, 0x4E, 0xC3, 0x76, 0xB8, 0xF8, 0xD4, 0x95, 
-0x9C, 0x7E, 0xC2, 0x10, 0xAA, 0x3F, 0x4F, 0xA2, 0x1C, 0x3A, 0x01, 0xAF, 0x2D, 0xA5, 0xD4, 0xD9, 
-0xB5, 0xBF, 0xCD, 0xDD, 0xDB, 0x66, 0xE8, 0xD3, 0x20, 0xE8, 0x06, 0x41, 0x27, 0x88, 0x53, 0x2A, 
-0x04, 0xA7, 0xB3, 0x24, 0xF9, 0xCA, 0x4F, 0xFF, 0xEC, 0xBD, 0xDB, 0x6E, 0xB8, 0xE1, 0xF8, 0xAA, 
-0x66, 0x7D, 0x5C, 0x12, 0xEE, 0xC5, 0x17, 0x3F, 0x73, 0xCD, 0x4D, 0x37, 0xDD, 0xF3, 0xF3, 0x65, 
-0xA5, 0x36, 0x60, 0x12, 0xE5, 0x7D, 0x74, 0x8A, 0x6E, 0x36, 0x85, 0x67, 0x3D, 0xF3, 0x52, 0x9E, 
-0xF5, 0xF4, 0x8B, 0x18, 0xAE, 0x55, 0x30, 0xBB, 0x97, 0x7C, 0xDF, 0x4E, 0x54, 0xDE, 0xC6, 0x2A, 
-0xC1, 0xDB, 0x61, 0x76, 0xCF, 0x6A, 0xBE, 0x74, 0xF3, 0x4E, 0x0E, 0x76, 0x33, 0x2A, 0x46, 0x08, 
-0x0C, 0xDC, 0x53, 0x88, 0x13, 0x59, 0x2D, 0xE6, 0xB5, 0x90, 0x38, 0xE1, 0x1E, 0x8A, 0x70, 0x83, 
-0x48, 0xCC, 0x6E, 0x2F, 0x91, 0x20, 0xD4, 0xE2, 0xA0, 0x13, 0x87, 0xA1, 0x84, 0x7C, 0x96, 0xF3, 
-0x4E, 0x3B, 0x89, 0x21, 0x13, 0x48, 0xA5, 0xA2, 0xAC, 0xFA, 0x24, 0x46, 0xE3, 0x82, 0xC7, 0xDA, 
-0x04, 0x89, 0x05, 0x7F, 0x1F, 0xF6, 0x60, 0x07, 0x10, 0x25, 0x38, 0x2A, 0x4A, 0x04, 0x53, 0x5B, 
-0xCE, 0xBC, 0xCF, 0xF8, 0xF2, 0x6D, 0x3B, 0xF8, 0xD6, 0xEE, 0x79, 0x5A, 0xA6, 0xC9, 0x54, 0x70, 
-0xF4, 0xF1, 0xA8, 0xCC, 0xB1, 0x66, 0x75, 0x8D, 0xCB, 0x2E, 0xDE, 0xC8, 0x4B, 0x5F, 0xF8, 0x04, 
-0xDE, 0xFE, 0xA6, 0x17, 0xF3, 0xD6, 0x37, 0xBD, 0x88, 0x6B, 0x5E, 0x7C, 0x15, 0xA7, 0xAE, 0x6F, 
-0xB2, 0x6A, 0x99, 0x90, 0xD0, 0x82, 0xCE, 0x01, 0x98, 0xDB, 0x8D, 0x3B, 0x74, 0x1F, 0xFD, 0x3D, 
-0x77, 0xD3, 0xD9, 0xB5, 0x85, 0xD9, 0x6D, 0x77, 0x30, 0xBF, 0x7D, 0x0B, 0xB3, 0x3B, 0xEE, 0xA1, 
-0xBD, 0x7B, 0x1B, 0xE5, 0xC4, 0x3E, 0x98, 0x9F, 0x25, 0xED, 0xB7, 0xA8, 0xBB, 0x9C, 0x46, 0x28, 
-0xC9, 0xA4, 0x24, 0xF3, 0x15, 0x69, 0xA8, 0x48, 0x25, 0x12, 0x69, 0x12, 0x2A, 0xAC, 0x78, 0x92, 
-0xC1, 0xF6, 0xDB, 0xE0, 0xD0, 0x83, 0x5C, 0x12, 0x47, 0xE4, 0xBD, 0x81, 0x34, 0xAB, 0x88, 0xA2, 
-0xA9, 0x3A, 0x22, 0xBD, 0x44, 0x84, 0x81, 0xD1, 0xEA, 0xC8, 0xBE, 0x37, 0x2C, 0x06, 0x88, 0x0C, 
-0x0A, 0x76, 0x1E, 0xB9, 0x2F, 0x6A, 0xF0, 0xDD, 0xEF, 0xFC, 0x78, 0xFF, 0x5E, 0x8E, 0x93, 0xF7, 
-0xF0, 0x7C, 0x5E, 0x6C, 0x0C, 0x7C, 0x74, 0x79, 0x60, 0xF6, 0xB1, 0xC5, 0xF3, 0xC7, 0x71, 0x32, 
-0x50, 0x39, 0x1D, 0x26, 0xE6, 0xC5, 0xEF, 0x1E, 0x59, 0x00, 0xA2, 0x05, 0x40, 0x06, 0x35, 0xED, 
-0x02, 0x1A, 0x1F, 0xFB, 0x43, 0x24, 0xF6, 0x93, 0xF7, 0xD8, 0x20, 0x24, 0x21, 0x90, 0x84, 0x8A, 
-0x44, 0x1C, 0xA9, 0x54, 0x64, 0x14, 0x64, 0x21, 0x47, 0xCA, 0x39, 0x52, 0xDF, 0xC6, 0x96, 0x0B, 
-0x84, 0xCE, 0x14, 0xBE, 0x75, 0x10, 0xDD, 0x9F, 0x66, 0x2C, 0x2D, 0xD9, 0xB8, 0xA2, 0xCE, 0xE5, 
-0xE7, 0x9D, 0xC6, 0x45, 0x67, 0xAC, 0xE5, 0xBC, 0x93, 0x56, 0xB0, 0x61, 0x2C, 0x23, 0x93, 0x12, 
-0x9F, 0xCF, 0x53, 0x56, 0x2D, 0x9C, 0x6F, 0x61, 0xC8, 0x49, 0x70, 0x84, 0x2E, 0x9C, 0xBC, 0x2A, 
-0x70, 0xF6, 0x86, 0x95, 0x24, 0x65, 0x0F, 0x93, 0xF7, 0xB1, 0x59, 0x7A, 0x38, 0xAC, 0xFC, 0xE1, 
-0xE2, 0xB0, 0xAE, 0x5B, 0x6B, 0x9C, 0x73, 0x04, 0x2F, 0xE8, 0x24, 0xC1, 0x21, 0x04, 0x5D, 0xC3, 
-0x25, 0xA3, 0xCC, 0x95, 0x23, 0x7C, 0x6D, 0xD3, 0x0C, 0x5F, 0xBB, 0x63, 0x92, 0xA9, 0xA2, 0x49, 
-0xCE, 0x08, 0xA2, 0x6B, 0x48, 0x50, 0x58, 0x95, 0x0C, 0x36, 0x25, 0x83, 0x7E, 0x3C, 0x7C, 0xE4, 
-0x63, 0xEF, 0xD0, 0x77, 0x7A, 0xE6, 0x80, 0x2E, 0x43, 0x69, 0xC5, 0xA5, 0x67, 0x2C, 0xE7, 0x94, 
-0x35, 0x43, 0xD4, 0x5D, 0x1B, 0xAB, 0x2A, 0x94, 0x09, 0xD1, 0x17, 0x99, 0x26, 0x7B, 0x27, 0xDA, 
-0xDC, 0xB3, 0xB3, 0x4B, 0xC7, 0xD7, 0x29, 0x55, 0x83, 0xA0, 0x33, 0xC0, 0x90, 0x18, 0x63, 0x94, 
-0x84, 0x3D, 0xAF, 0x79, 0xFA, 0x99, 0xDF, 0xF8, 0x97, 0xCF, 0xFD, 0xCD, 0x71, 0x95, 0xC8, 0xE6, 
-0xFE, 0xFB, 0x8E, 0xE3, 0x04, 0x07, 0x0F, 0x4E, 0xAF, 0x2B, 0x2A, 0xBF, 0x01, 0x12, 0xAD, 0xD0, 
-0xE0, 0xA3, 0xAB, 0x90, 0xB1, 0x9E, 0x53, 0x4F, 0x3B, 0x91, 0xF1, 0xB1, 0x66, 0x34, 0xDE, 0x54, 
-0x39, 0xA1, 0xE8, 0x61, 0xC4, 0x63, 0x8C, 0xA1, 0x72, 0x30, 0xDF, 0x73, 0xB4, 0x0A, 0x70, 0x83, 
-0x04, 0xC7, 0x8B, 0x88, 0x2B, 0xFD, 0x60, 0xCB, 0x3A, 0x50, 0x1F, 0x1C, 0x7E, 0x6F, 0x30, 0x7D, 
-0x8E, 0x85, 0x0C, 0x52, 0x77, 0x08, 0x9E, 0xE0, 0x3C, 0xDA, 0xA4, 0x38, 0xD5, 0xE4, 0xE0, 0xBC, 
-0xF0, 0x8D, 0xDB, 0x0F, 0x30, 0xD9, 0xAF, 0xE1, 0x6B, 0x2B, 0xE8, 0x07, 0x8B, 0xD1, 0x49, 0x94, 
-0xD6, 0xBC, 0x30, 0x88, 0xA9, 0xF8, 0x01, 0x10, 0xC8, 0x12, 0x28, 0xAB, 0x3E, 0x05, 0x15, 0x52, 
-0x4F, 0x69, 0x6B, 0x4F, 0x1B, 0xE8, 0x27, 0x1D, 0xD4, 0x50, 0x9F, 0x95, 0x1B, 0x2A, 0xAE, 0xBE, 
-0x6A, 0x2D, 0xEF, 0x78, 0xFB, 0x93, 0x78, 0xEF, 0xAF, 0xFE, 0x18, 0xFF, 0xE3, 0x9D, 0xCF, 0xE3, 
-0xC5, 0x3F, 0x76, 0x01, 0xA7, 0x9E, 0x60, 0xD0, 0x73, 0xF7, 0x61, 0x8B, 0x7D, 0x30, 0x71, 0x27, 
-0xBD, 0x2D, 0x37, 0xD0, 0xBA, 0xEB, 0x2B, 0xCC, 0xDF, 0xF5, 0x15, 0xE6, 0xEF, 0xFC, 0x0A, 0xAD, 
-0x4D, 0xDF, 0x20, 0xBF, 0xE7, 0x66, 0xEC, 0xDE, 0x6D, 0x64, 0x87, 0xF6, 0x32, 0x34, 0x37, 0xCD, 
-0x48, 0xB7, 0xC5, 0x48, 0xD5, 0x67, 0xD8, 0xE7, 0x0C, 0x51, 0x31, 0xA4, 0x43, 0xD4, 0x77, 0xC6, 
-0xDD, 0xF4, 0x61, 0x3D, 0xEA, 0x62, 0x30, 0xC4, 0xE2, 0x36, 0x9F, 0xA3, 0x96, 0x2A, 0x19, 0xC8, 
-0xA3, 0x82, 0xC2, 0x2B, 0x85, 0xD3, 0x1A, 0xA7, 0x34, 0x4E, 0x33, 0x68, 0x3A, 0x7A, 0x4D, 0xA8, 
-0xD8, 0x16, 0x69, 0x6A, 0xB1, 0x2D, 0x4A, 0xA5, 0x48, 0x4C, 0x42, 0x03, 0x1C, 0x0E, 0x27, 0xFD, 
-0x5E, 0x1E, 0xC3, 0xA0, 0x2D, 0x3E, 0xF7, 0x5A, 0x70, 0x87, 0xDB, 0xE0, 0x37, 0x98, 0x70, 0xB8, 
-0x79, 0xCD, 0xA0, 0x05, 0xBC, 0x0E, 0x88, 0x8A, 0xCD, 0xEB, 0x80, 0x43, 0x16, 0xE9, 0x33, 0x36, 
-0x65, 0xF1, 0xCA, 0x12, 0x58, 0x6C, 0x1A, 0x91, 0x98, 0xD8, 0x46, 0x85, 0x63, 0x9A, 0xF8, 0x68, 
-0x68, 0x84, 0x78, 0x4C, 0xED, 0xC1, 0x38, 0xB4, 0x2E, 0xD1, 0xAA, 0x4F, 0x42, 0x97, 0x44, 0xBA, 
-0x34, 0x42, 0x8F, 0xB4, 0x6C, 0xD1, 0x70, 0x0B, 0x2C, 0x53, 0x3D, 0x86, 0xC3, 0x1C, 0x69, 0x7B, 
-0x1F, 0x66, 0x6E, 0x3B, 0xB5, 0xCE, 0x0E, 0x86, 0xCB, 0x6D, 0x9C, 0x3A, 0x34, 0xC5, 0x55, 0xA7, 
-0x1B, 0xAE, 0xB9, 0x72, 0x35, 0x6F, 0xBC, 0x7A, 0x03, 0xAF, 0x7E, 0xE2, 0x6A, 0x9E, 0x75, 0x7A, 
-0xC6, 0x25, 0xE3, 0x39, 0xEB, 0xC8, 0x59, 0x9F, 0xC2, 0x49, 0x63, 0xB0, 0xBA, 0x99, 0xD0, 0x30, 
-0x90, 0x6A, 0x50, 0x52, 0x45, 0x0F, 0x92, 0xEF, 0x03, 0xF7, 0x53, 0x6B, 0xE9, 0x98, 0x2F, 0xC1, 
-0xDA, 0xE8, 0x9B, 0xEC, 0x95, 0xA1, 0x32, 0x35, 0x7C, 0xB6, 0x8C, 0x9D, 0x53, 0x05, 0xDF, 0xBC, 
-0x63, 0x1F, 0x53, 0x5D, 0x83, 0x63, 0x08, 0x21, 0x5B, 0x3C, 0x40, 0xCC, 0xB3, 0xB1, 0xB8, 0x24, 
-0xC9, 0xE2, 0x2A, 0x76, 0x84, 0x50, 0x1F, 0x7C, 0xA6, 0xC5, 0x05, 0x6F, 0xB1, 0xC5, 0x4F, 0x18, 
-0x8A, 0xD2, 0x33, 0xD3, 0xEA, 0x91, 0x7B, 0xF0, 0x26, 0x8D, 0xCB, 0xB8, 0xC4, 0xBB, 0x92, 0x49, 
-0xC9, 0x58, 0x3D, 0x65, 0x45, 0xB3, 0x46, 0x8A, 0x8B, 0x7D, 0x2E, 0x20, 0xA2, 0x51, 0xA4, 0xE9, 
-0xFC, 0x42, 0x67, 0xED, 0x81, 0xD6, 0xA1, 0xC1, 0x0F, 0x3B, 0x7E, 0x70, 0xDC, 0x49, 0xB8, 0x37, 
-0xDF, 0x7C, 0x73, 0xF2, 0x27, 0x7F, 0xF0, 0xC1, 0xE7, 0xCF, 0xB7, 0xFC, 0x8B, 0x20, 0x4D, 0x8C, 
-0x4D, 0x06, 0x35, 0xEE, 0x4B, 0x86, 0x87, 0xE0, 0x55, 0x3F, 0xF1, 0x2C, 0xCE, 0x3C, 0x65, 0x1C, 
-0x53, 0xCC, 0xE1, 0xA6, 0xF6, 0xD2, 0xD9, 0xBB, 0x8D, 0x4C, 0x2A, 0x8C, 0x49, 0xE8, 0x48, 0x9D, 
-0x3B, 0xF6, 0x54, 0x7C, 0x63, 0xD3, 0x04, 0x0B, 0x55, 0x63, 0x50, 0xE1, 0x21, 0x43, 0x94, 0x89, 
-0xE1, 0x8B, 0x2A, 0x5A, 0x7D, 0x01, 0x94, 0x98, 0x41, 0xD0, 0xA1, 0xB9, 0x1F, 0x6D, 0x2C, 0x4A, 
-0xB8, 0x66, 0x31, 0x5E, 0x7F, 0x30, 0x08, 0xBD, 0x80, 0xD6, 0x16, 0x6D, 0x34, 0xE2, 0x2B, 0xA8, 
-0x7A, 0x9C, 0xBA, 0xE1, 0x04, 0x4E, 0x5A, 0x33, 0x86, 0xF6, 0x5D, 0x86, 0x6A, 0x16, 0xEF, 0x72, 
-0x94, 0x31, 0xF8, 0x10, 0x6B, 0x42, 0xA9, 0x01, 0xD1, 0x3F, 0x5C, 0x28, 0x25, 0x54, 0xBE, 0x87, 
-0x49, 0x53, 0x1C, 0x75, 0x1A, 0xE3, 0x27, 0xB0, 0x7C, 0xDD, 0xC9, 0x9C, 0x72, 0xC1, 0xE9, 0x5C, 
-0xFC, 0xC4, 0xCB, 0x78, 0xDE, 0x8F, 0x3F, 0x95, 0x37, 0xBE, 0xE1, 0xF9, 0xBC, 0xEA, 0x25, 0x4F, 
-0xE1, 0xB9, 0x4F, 0x3A, 0x93, 0x93, 0x56, 0x19, 0xD2, 0x62, 0x12, 0x26, 0x77, 0xD0, 0x9F, 0xD8, 
-0x41, 0x77, 0x62, 0x07, 0xF3, 0xF7, 0xDE, 0x4C, 0x6B, 0xE7, 0xDD, 0x74, 0xF7, 0xEF, 0xA2, 0x9C, 
-0xDC, 0x4D, 0x98, 0x9D, 0x40, 0xB5, 0xA6, 0xC9, 0xF2, 0x2E, 0x8D, 0x50, 0x52, 0xAF, 0x0A, 0x86, 
-0x08, 0x34, 0x14, 0x34, 0xB5, 0x22, 0x55, 0x12, 0x03, 0x21, 0x7C, 0x11, 0xF3, 0x9C, 0xEA, 0xA8, 
-0xE3, 0x56, 0x4A, 0x11, 0x7B, 0x6A, 0x51, 0xBA, 0x5B, 0xDC, 0xFC, 0x1D, 0xE9, 0xBD, 0xB8, 0x11, 
-0x1C, 0x34, 0x89, 0xAF, 0x08, 0x10, 0x54, 0xD4, 0xDB, 0x2D, 0xCA, 0xA9, 0xF1, 0xE2, 0xE2, 0x31, 
-0x16, 0x9F, 0x68, 0x59, 0x3C, 0xE2, 0x31, 0x7F, 0xEA, 0x68, 0x0A, 0xE7, 0x7B, 0x78, 0xBC, 0xBF, 
-0x34, 0x15, 0x8D, 0xF4, 0x83, 0x33, 0xAB, 0xA3, 0xFC, 0xAC, 0x1F, 0x80, 0xFB, 0xBF, 0x1E, 0xB9, 
-0x21, 0x5E, 0x21, 0xEA, 0xA8, 0xB0, 0x54, 0x75, 0xE4, 0xB3, 0x5A, 0x06, 0xD2, 0x39, 0xEA, 0xF0, 
-0x6B, 0x8B, 0xC2, 0x7A, 0x5C, 0xBC, 0x05, 0x8C, 0x22, 0x18, 0x85, 0x0C, 0x12, 0xC3, 0x44, 0xA3, 
-0x5F, 0x54, 0xAD, 0x28, 0x15, 0x48, 0x12, 0x85, 0xF2, 0xD1, 0x73, 0x23, 0x91, 0x68, 0xB8, 0xB3, 
-0xE2, 0x31, 0xA1, 0x42, 0xBB, 0x1C, 0xE5, 0xDB, 0x18, 0xDF, 0x61, 0x58, 0x97, 0xAC, 0x6C, 0x2A, 
-0x4E, 0x5C, 0x39, 0xCC, 0xD9, 0x27, 0xAF, 0xE2, 0xBC, 0xD3, 0xD6, 0x71, 0xFE, 0xA9, 0xEB, 0x38, 
-0xE7, 0xE4, 0x51, 0x2E, 0x3A, 0x6D, 0x9C, 0x2B, 0xCE, 0x1A, 0xE1, 0xD2, 0xB3, 0x4E, 0x64, 0x2C, 
-0xAD, 0xD0, 0x65, 0x9B, 0x34, 0x33, 0x51, 0x40, 0x31, 0x03, 0x09, 0xFF, 0x7B, 0xC4, 0xFD, 0x6D, 
-0x08, 0x8B, 0x57, 0xAD, 0xB0, 0x59, 0x86, 0x43, 0x51, 0x88, 0x26, 0xA4, 0x63, 0x2C, 0x84, 0x71, 
-0xBE, 0x7A, 0xDB, 0x04, 0xD7, 0xDF, 0x3C, 0xC1, 0x64, 0xD9, 0xC0, 0x9B, 0x71, 0x2A, 0x62, 0xE2, 
-0x1F, 0x00, 0x2B, 0xD1, 0x76, 0x11, 0x77, 0x0A, 0xF1, 0xDE, 0x1C, 0x8D, 0xC5, 0xE7, 0xC7, 0xEA, 
-0x73, 0xEF, 0xF7, 0x5C, 0x55, 0x68, 0x29, 0x49, 0x55, 0x8F, 0x53, 0x4E, 0xA8, 0x71, 0xEE, 0x29, 
-0xAB, 0x19, 0xD1, 0x25, 0x56, 0xFA, 0x68, 0x5D, 0x82, 0x32, 0x54, 0x3E, 0x65, 0x7A, 0x1E, 0x76, 
-0xEF, 0xF3, 0x1C, 0x5A, 0xF0, 0x74, 0xA9, 0xE3, 0x4D, 0x46, 0x08, 0x03, 0xB3, 0x77, 0xA8, 0xDA, 
-0xCB, 0x56, 0x67, 0x5F, 0xBA, 0xF3, 0xAE, 0xAF, 0xCD, 0x1C, 0x7D, 0x9E, 0x47, 0x1A, 0x0F, 0xB6, 
-0xD8, 0x3C, 0xA2, 0xD8, 0xBE, 0xBD, 0xB4, 0xFB, 0x0F, 0x1C, 0x3C, 0x29, 0x04, 0x89, 0xAB, 0x53, 
-0x10, 0x94, 0x8E, 0xE1, 0xA0, 0xE3, 0xCB, 0x47, 0x58, 0xB9, 0x6A, 0x9C, 0x44, 0x0B, 0xF8, 0x12, 
-0x5F, 0xF4, 0x07, 0x96, 0x65, 0x41, 0x29, 0x83, 0xF3, 0x8A, 0xA9, 0xF9, 0x1E, 0xFD, 0xEA, 0xFE, 
-0x59, 0x8E, 0x16, 0xB1, 0x18, 0x2E, 0xFA, 0x40, 0x03, 0x15, 0x83, 0xA1, 0x30, 0x58, 0x95, 0x19, 
-0x10, 0x65, 0x88, 0x06, 0x03, 0xAD, 0x4C, 0x1C, 0x82, 0x41, 0x40, 0x32, 0x44, 0x0D, 0xD3, 0x97, 
-0x65, 0x7C, 0xE5, 0x96, 0x5D, 0x6C, 0xDE, 0xD3, 0xA6, 0x6F, 0x46, 0x29, 0x48, 0x71, 0xC4, 0xC8, 
-0xA6, 0x45, 0xDF, 0xD0, 0x1F, 0x04, 0x52, 0x06, 0x1A, 0x69, 0x9D, 0x4C, 0x1C, 0x99, 0xEB, 0x70, 
-0xE9, 0x39, 0xEB, 0xF8, 0xC9, 0x97, 0x5D, 0xCD, 0xDB, 0x5E, 0xF1, 0x64, 0xDE, 0xF4, 0xA2, 0x4B, 
-0x78, 0xC2, 0xE9, 0x35, 0x36, 0xD6, 0xA6, 0xE1, 0xC0, 0x4D, 0xB4, 0x36, 0x7D, 0x81, 0xA9, 0x9B, 
-0x3E, 0xCD, 0xC4, 0xCD, 0x9F, 0x67, 0xF6, 0xCE, 0x6F, 0xD0, 0xBD, 0xF7, 0x56, 0xC2, 0xEE, 0xAD, 
-0xD4, 0xA6, 0x26, 0x18, 0x69, 0xCD, 0x30, 0xDC, 0x9B, 0xA7, 0x99, 0xB7, 0x18, 0x76, 0x05, 0xC3, 
-0x94, 0x34, 0x71, 0x24, 0x55, 0x85, 0x2E, 0x4B, 0x54, 0x51, 0x10, 0xF2, 0x02, 0x5F, 0x16, 0x78, 
-0x5F, 0x11, 0x0C, 0x51, 0xFF, 0x37, 0x20, 0x16, 0x2D, 0x31, 0x31, 0xB5, 0x1E, 0x64, 0xFA, 0x37, 
-0x47, 0x35, 0xEB, 0x0D, 0xDA, 0x25, 0x0F, 0x68, 0xD6, 0x19, 0x4C, 0xD0, 0x8B, 0xB2, 0x2B, 0x7A, 
-0x91, 0x90, 0x84, 0x41, 0x75, 0x01, 0x1D, 0xAB, 0xBF, 0x8A, 0x1E, 0xA4, 0xFB, 0x3B, 0xA6, 0x1D, 
-0xF3, 0xF9, 0x87, 0xDF, 0xA2, 0x11, 0x2F, 0xA6, 0x1B, 0x1C, 0x3C, 0x3E, 0x64, 0x3B, 0xFA, 0x5C, 
-0x60, 0x02, 0x83, 0x54, 0x85, 0xA0, 0x64, 0x51, 0xFE, 0x8E, 0x7E, 0xBC, 0x8B, 0xED, 0x70, 0x51, 
-0xD1, 0x87, 0xF8, 0x7D, 0xA2, 0x34, 0x95, 0xD6, 0x54, 0x03, 0xC9, 0xDA, 0x1B, 0xA8, 0x4C, 0x94, 
-0x9E, 0xBD, 0x22, 0x56, 0x74, 0xF6, 0x0A, 0xAD, 0x12, 0x8C, 0xAE, 0x11, 0xBC, 0xC1, 0x17, 0x02, 
-0x9E, 0x58, 0xD9, 0x59, 0x83, 0xD5, 0x9E, 0x44, 0xE5, 0x58, 0x37, 0x4F, 0x68, 0xEF, 0x47, 0xB5, 
-0x76, 0xB0, 0x5C, 0x0E, 0x71, 0xFE, 0x0A, 0xCF, 0xD3, 0xCE, 0x1C, 0xE1, 0x9A, 0x2B, 0x4F, 0xE3, 
-0xE5, 0x4F, 0x38, 0x9D, 0x67, 0x5F, 0x72, 0x2A, 0x27, 0x2F, 0x4B, 0xD0, 0x45, 0x8B, 0xCA, 0xF5, 
-0x40, 0x83, 0x33, 0x10, 0x38, 0x2A, 0x48, 0xE4, 0x41, 0xDA, 0x77, 0x83, 0xAB, 0x64, 0x50, 0x91, 
-0x41, 0x28, 0xAA, 0x12, 0xAF, 0x53, 0x5C, 0x32, 0xC6, 0xBE, 0x99, 0xC0, 0xB7, 0x37, 0x4F, 0x30, 
-0xD5, 0xB5, 0x78, 0xC6, 0x10, 0x55, 0x43, 0x42, 0xAC, 0x16, 0xA1, 0x51, 0x83, 0x82, 0x92, 0x8B, 
-0xBB, 0xF8, 0xC5, 0xBB, 0x1F, 0x8D, 0xD3, 0xF7, 0x27, 0x1B, 0x39, 0xA6, 0x0D, 0x5E, 0x55, 0xC4, 
-0xCF, 0xAB, 0x84, 0xE0, 0x0D, 0x73, 0xAD, 0x82, 0x9E, 0x83, 0x60, 0x6A, 0x04, 0x65, 0x0E, 0xAB, 
-0xA2, 0x12, 0x2D, 0x8C, 0x66, 0x86, 0x55, 0x23, 0x0D, 0xEA, 0x68, 0x12, 0x15, 0x62, 0xD2, 0x20, 
-0x0D, 0x2A, 0xE6, 0x4A, 0x39, 0xE1, 0x4B, 0x5F, 0xFC, 0xCA, 0x69, 0x72, 0x74, 0x4E, 0xCD, 0xE3, 
-0x00, 0xC7, 0x1D, 0xE1, 0x4E, 0x4E, 0x1E, 0x6C, 0x0C, 0x0D, 0x8D, 0x6F, 0x54, 0xCA, 0x1A, 0xD0, 
-0x87, 0x73, 0x1E, 0x64, 0x89, 0xE5, 0xB4, 0x93, 0x4F, 0x62, 0xC5, 0xF8, 0x48, 0xBC, 0xA9, 0xAE, 
-0xA4, 0x2C, 0x62, 0xE6, 0x78, 0xA5, 0x14, 0x41, 0x84, 0xD2, 0xC1, 0xA1, 0xE9, 0x05, 0xF2, 0xA0, 
-0x81, 0x24, 0xFA, 0x57, 0x72, 0x64, 0xF0, 0xC5, 0x2D, 0xA8, 0xA0, 0x54, 0xF4, 0xE9, 0xFC, 0x8E, 
-0xF0, 0x2E, 0x4A, 0x67, 0x5A, 0x21, 0x36, 0xA6, 0xE5, 0xF3, 0x41, 0x90, 0x4A, 0x21, 0xA1, 0x46, 
-0xA9, 0x46, 0xB8, 0x73, 0xC7, 0x2C, 0xDF, 0xDC, 0xBC, 0x9B, 0xAE, 0x1A, 0xA1, 0xED, 0x41, 0x4C, 
-0x4A, 0x55, 0x55, 0x18, 0x7D, 0x24, 0xD9, 0xF8, 0xF7, 0x03, 0x25, 0x90, 0x25, 0x19, 0xF4, 0x0B, 
-0x54, 0x99, 0xE3, 0xDB, 0xD3, 0xF4, 0xF7, 0xDF, 0x4B, 0x6F, 0xD7, 0x6D, 0x74, 0xEF, 0xFB, 0x16, 
-0xFB, 0xBF, 0xF9, 0x19, 0x66, 0x6E, 0xF9, 0x12, 0xFB, 0x6F, 0xFC, 0x4F, 0x0E, 0x7C, 0xF3, 0x4B, 
-0xB4, 0xEE, 0xBE, 0x89, 0xB0, 0x7F, 0x1B, 0xC9, 0xDC, 0x3E, 0x92, 0xF6, 0x04, 0xF5, 0xCE, 0x14, 
-0xCB, 0xAA, 0x9C, 0x31, 0x57, 0x31, 0x1C, 0x0A, 0x1A, 0xDE, 0x51, 0x0B, 0x8E, 0xD4, 0x78, 0x8C, 
-0x38, 0x42, 0x59, 0x60, 0xCC, 0x62, 0xD4, 0x55, 0xCC, 0xC0, 0x65, 0x8D, 0x21, 0xB5, 0x1A, 0x6B, 
-0x6D, 0xCC, 0x23, 0x2B, 0x51, 0x4E, 0x51, 0x8B, 0x92, 0x8A, 0x2C, 0x96, 0x17, 0x8C, 0xBF, 0xEF, 
-0xC8, 0x8F, 0x5D, 0xFC, 0x67, 0x30, 0xA5, 0xA2, 0x98, 0x87, 0x22, 0x44, 0xF2, 0x1A, 0xB4, 0xA3, 
-0x09, 0xEB, 0xC8, 0x37, 0xBE, 0x9B, 0x41, 0xE7, 0xE8, 0xE1, 0x79, 0x64, 0xF2, 0x7E, 0x6F, 0x6D, 
-0xF1, 0xBF, 0x23, 0xA4, 0x7F, 0xBF, 0x26, 0x03, 0x12, 0x78, 0xB0, 0x47, 0x61, 0xA0, 0x97, 0x3E, 
-0xCA, 0xD0, 0xA7, 0xDC, 0x61, 0x75, 0xCA, 0xD1, 0x3B, 0xE5, 0x23, 0x2D, 0x12, 0xAD, 0x28, 0x62, 
-0xBD, 0xAE, 0x60, 0x20, 0x24, 0x47, 0x19, 0xEF, 0x06, 0x0B, 0xFD, 0x20, 0x71, 0x4C, 0xA8, 0x24, 
-0x26, 0xBC, 0x51, 0xE9, 0xE1, 0xA8, 0x47, 0x11, 0xA1, 0x72, 0x05, 0xBD, 0x5E, 0x87, 0xA2, 0xD7, 
-0x47, 0x2A, 0x87, 0x56, 0x42, 0x9A, 0x04, 0x52, 0x9D, 0x63, 0xCA, 0x79, 0x54, 0x7E, 0x08, 0xDD, 
-0x3B, 0x80, 0xB4, 0x76, 0x33, 0xA2, 0x16, 0x68, 0xFA, 0x79, 0x54, 0x6F, 0x9A, 0x9A, 0xF1, 0xA4, 
-0x89, 0x26, 0x2F, 0x0B, 0x1E, 0xAE, 0xD2, 0xF2, 0x81, 0x04, 0xAC, 0x63, 0xF4, 0x1D, 0x09, 0x95, 
-0x77, 0x54, 0xC1, 0xA3, 0xB3, 0x26, 0x79, 0xA8, 0xB1, 0x65, 0xC7, 0x2C, 0x5B, 0x76, 0xCF, 0xD3, 
-0x0B, 0x0D, 0xBC, 0x6E, 0xE2, 0x24, 0x89, 0x01, 0xB9, 0x87, 0x23, 0xD2, 0x16, 0x8D, 0xA0, 0xC7, 
-0x1C, 0xF2, 0xE1, 0x40, 0x14, 0x60, 0x09, 0xDE, 0x30, 0xDF, 0xC9, 0xE9, 0x55, 0x44, 0x4B, 0xC1, 
-0xC0, 0x5F, 0x5A, 0x23, 0x58, 0x3C, 0x75, 0xA3, 0x19, 0x1F, 0x6E, 0xD2, 0x4C, 0x0C, 0x5A, 0x62, 
-0x09, 0xA5, 0x38, 0xBF, 0x05, 0x41, 0xC6, 0x5A, 0x0B, 0x9D, 0x35, 0x47, 0x8F, 0xD0, 0xE3, 0x01, 
-0x71, 0x64, 0x1E, 0x47, 0xF8, 0xCF, 0xFF, 0xFC, 0xD4, 0xAA, 0x76, 0xBB, 0x7D, 0x92, 0x56, 0x91, 
-0xE4, 0x16, 0x07, 0x43, 0x96, 0x65, 0x9C, 0x73, 0xEE, 0xD9, 0x8C, 0x8E, 0x8E, 0xE0, 0x5D, 0x89, 
-0xCF, 0xFB, 0xE4, 0xDD, 0x0E, 0x66, 0x91, 0x54, 0x03, 0x54, 0x22, 0xCC, 0x2C, 0x74, 0xA8, 0x82, 
-0x7A, 0x80, 0x19, 0xE5, 0x3B, 0xE3, 0xFE, 0xDD, 0xA0, 0x85, 0x98, 0xA6, 0x4E, 0x45, 0x37, 0x31, 
-0x1F, 0x04, 0x59, 0xDC, 0x66, 0x42, 0xBC, 0xDD, 0xD2, 0xA4, 0x55, 0x26, 0xDC, 0x7C, 0xEF, 0x3E, 
-0xF6, 0xCC, 0x74, 0xF0, 0xA6, 0x4E, 0x18, 0x38, 0x7B, 0xAB, 0x81, 0x9B, 0xD3, 0xF7, 0x0B, 0x41, 
-0xA3, 0x74, 0x8D, 0x3C, 0x77, 0xD4, 0x15, 0x8C, 0x48, 0xCE, 0x50, 0x6F, 0x0A, 0xBD, 0x67, 0x0B, 
-0xC9, 0xEE, 0xBB, 0xA8, 0xED, 0xBE, 0x97, 0xE6, 0xBE, 0xDD, 0x2C, 0x3B, 0x34, 0xC9, 0xAA, 0x76, 
-0x8F, 0xD5, 0x95, 0xB0, 0x52, 0x02, 0xA3, 0xA1, 0xA2, 0x19, 0xBA, 0x34, 0x75, 0x49, 0x52, 0x15, 
-0xA8, 0xB2, 0x44, 0xAA, 0x0A, 0x1F, 0x2A, 0x9C, 0xF2, 0x94, 0x78, 0x0A, 0x2D, 0x54, 0x06, 0x1C, 
-0x21, 0x2E, 0x44, 0x10, 0xC7, 0x64, 0x10, 0x82, 0x13, 0x5C, 0xBF, 0x24, 0xEF, 0xF5, 0x51, 0x52, 
-0xA1, 0xA4, 0x38, 0xDC, 0x82, 0xAA, 0x0E, 0x37, 0xAF, 0x63, 0xAB, 0x6C, 0x45, 0x65, 0x3D, 0x55, 
-0xE2, 0xA9, 0x92, 0x8A, 0x2A, 0xA9, 0x28, 0x92, 0xF8, 0x1A, 0x1C, 0xF1, 0x50, 0xD0, 0x8B, 0x92, 
-0xE6, 0xA0, 0x45, 0x63, 0xD7, 0x40, 0xE2, 0x1B, 0xB4, 0xA3, 0xF5, 0xAB, 0x47, 0xEB, 0x7C, 0x0F, 
-0x37, 0xF5, 0xBD, 0x37, 0xBF, 0x58, 0xEB, 0xEC, 0x3B, 0x34, 0xA5, 0xCC, 0xC0, 0x70, 0xBA, 0xE8, 
-0xD1, 0x70, 0xA4, 0xC5, 0x2E, 0x71, 0x04, 0x1D, 0x13, 0x14, 0x05, 0x5D, 0x11, 0x94, 0x3F, 0xAA, 
-0x1D, 0xD1, 0x19, 0x7B, 0x15, 0x2B, 0x23, 0x38, 0xCD, 0xE1, 0xF3, 0x23, 0x86, 0xC4, 0x67, 0x64, 
-0x55, 0x46, 0x5A, 0xA6, 0xA4, 0xDE, 0x92, 0x54, 0x1A, 0x1B, 0x34, 0xC6, 0x81, 0x71, 0x31, 0x6C, 
-0x5B, 0x2A, 0x28, 0xFA, 0x05, 0x65, 0x5E, 0x12, 0x82, 0xC3, 0x58, 0xC1, 0x66, 0x86, 0x5A, 0x3D, 
-0x25, 0x35, 0x0D, 0x74, 0xC8, 0x08, 0xDE, 0x22, 0x24, 0xA8, 0x24, 0x45, 0x52, 0x45, 0x45, 0x45, 
-0xE9, 0x7B, 0xA4, 0x49, 0x85, 0xB8, 0x36, 0xA1, 0x6A, 0x21, 0x55, 0x07, 0xED, 0x0B, 0x2C, 0x71, 
-0x11, 0xB5, 0x36, 0xBD, 0xFF, 0x80, 0xFA, 0x0E, 0x78, 0x20, 0xD9, 0x02, 0xA2, 0xD1, 0x2A, 0x23, 
-0x60, 0xF0, 0x22, 0xE8, 0x34, 0xC1, 0x93, 0x32, 0x31, 0xD5, 0xE1, 0x96, 0xBB, 0xF6, 0x30, 0xDB, 
-0x33, 0x94, 0x64, 0x54, 0x58, 0x5C, 0x10, 0xB4, 0x8A, 0x35, 0xD1, 0x16, 0x8F, 0x15, 0xC2, 0xD1, 
-0x12, 0xEE, 0x22, 0x16, 0x97, 0xBA, 0xEF, 0x0D, 0x4A, 0x0C, 0x82, 0xA5, 0xD7, 0xF3, 0x94, 0x25, 
-0x71, 0x1F, 0xAB, 0x12, 0x94, 0x89, 0xAE, 0x82, 0xCA, 0xC7, 0xE0, 0x99, 0x15, 0x23, 0x23, 0x2C, 
-0x6B, 0x0E, 0x61, 0x94, 0x22, 0xF8, 0x02, 0x35, 0x48, 0x16, 0x64, 0x95, 0x6D, 0xD6, 0x9B, 0x43, 
-0x27, 0x7C, 0xF9, 0xCB, 0x5F, 0xFE, 0xDE, 0x4F, 0xFA, 0x23, 0xC0, 0x71, 0xF5, 0x63, 0x00, 0xB6, 
-0xDD, 0xB5, 0xF5, 0xA4, 0x20, 0x7A, 0x7D, 0x08, 0x51, 0x4D, 0x00, 0x60, 0x74, 0xA0, 0xD9, 0xB0, 
-0x9C, 0x7A, 0xCA, 0x3A, 0x46, 0x46, 0x32, 0x90, 0x0A, 0x57, 0xF4, 0xA8, 0xFA, 0xBD, 0x81, 0x24, 
-0x12, 0xD3, 0x1A, 0x0A, 0x96, 0x5E, 0x51, 0x11, 0x48, 0x40, 0x25, 0x47, 0xBC, 0x13, 0x06, 0xDB, 
-0xA8, 0x38, 0x99, 0xE2, 0x16, 0xF9, 0x08, 0x16, 0x09, 0xE0, 0xFE, 0xD0, 0x58, 0x12, 0x52, 0x94, 
-0x28, 0x82, 0x77, 0xD1, 0xA1, 0x5A, 0x83, 0x52, 0x1A, 0x51, 0x96, 0x8A, 0x94, 0x4A, 0x0F, 0xB1, 
-0x6D, 0x7F, 0x8B, 0x7B, 0xF7, 0xB5, 0x09, 0xF5, 0xE5, 0x54, 0xBA, 0x8E, 0x49, 0x12, 0xC2, 0xE1, 
-0x44, 0xDB, 0xDF, 0x2F, 0x14, 0x95, 0x13, 0x6A, 0x59, 0x1D, 0x65, 0x34, 0x45, 0x67, 0x1E, 0x5B, 
-0xB4, 0x68, 0xB8, 0x16, 0xA3, 0xAE, 0xC3, 0x6A, 0x5D, 0x32, 0x52, 0xF4, 0x18, 0x71, 0x25, 0x0D, 
-0x17, 0xC9, 0x55, 0x97, 0x25, 0xA6, 0x2A, 0x48, 0x7C, 0x81, 0xF5, 0x15, 0x76, 0xA0, 0x37, 0xB4, 
-0x46, 0x91, 0xDA, 0x98, 0x43, 0x56, 0x06, 0x79, 0x54, 0x74, 0x62, 0xD1, 0x89, 0x45, 0x99, 0x45, 
-0x89, 0x2C, 0xFA, 0x5C, 0x6A, 0xAD, 0x49, 0x92, 0x84, 0xCC, 0xC6, 0xF0, 0xD2, 0x23, 0x5B, 0xBD, 
-0xC1, 0xEE, 0x60, 0x60, 0x58, 0x5A, 0x6C, 0x91, 0x70, 0xEE, 0xDF, 0x82, 0x1E, 0xD4, 0xC2, 0xFA, 
-0x2E, 0xEB, 0xDD, 0xE1, 0xF0, 0x51, 0xC5, 0x20, 0x97, 0xEE, 0x91, 0xBB, 0x10, 0x8D, 0xDC, 0x47, 
-0x8C, 0x69, 0x51, 0x46, 0x3D, 0xF2, 0x9D, 0xF8, 0x38, 0xD0, 0xD3, 0x3E, 0xC8, 0xA3, 0x1C, 0xF5, 
-0xD9, 0x07, 0xE2, 0xC8, 0xC4, 0x5F, 0x1C, 0x5F, 0x0C, 0x22, 0xA2, 0x8E, 0xC8, 0xF0, 0x0F, 0xFC, 
-0xFE, 0xFD, 0xA4, 0xD9, 0x41, 0xCF, 0x2C, 0xF6, 0xCE, 0xFD, 0x7F, 0xD7, 0xE2, 0x8B, 0x31, 0x24, 
-0x56, 0x01, 0xF8, 0x41, 0x59, 0x9A, 0x81, 0x74, 0x2B, 0x12, 0x25, 0x7B, 0x63, 0x34, 0x69, 0x9A, 
-0x52, 0xAB, 0x65, 0x18, 0x13, 0x73, 0x0B, 0x57, 0x55, 0x41, 0x08, 0x03, 0xFF, 0x5F, 0xD1, 0x04, 
-0x19, 0x24, 0x02, 0x57, 0xD1, 0x4F, 0xD8, 0x18, 0x45, 0x96, 0x2A, 0x12, 0x2B, 0x14, 0xBD, 0x05, 
-0x12, 0x03, 0xB5, 0xA1, 0xE6, 0xE1, 0xDC, 0xBC, 0x69, 0x52, 0xC3, 0x57, 0x31, 0xB5, 0xE2, 0x77, 
-0xC3, 0x83, 0x92, 0xED, 0x00, 0x4E, 0x42, 0xF4, 0x3B, 0xD6, 0x1A, 0x92, 0x3A, 0x1D, 0x6F, 0xD8, 
-0x36, 0xB1, 0xC0, 0xA6, 0x5D, 0x93, 0xF4, 0x68, 0x50, 0xEA, 0x1A, 0x5E, 0xD9, 0x58, 0xB5, 0x41, 
-0x27, 0x31, 0xE2, 0x8F, 0x28, 0x20, 0x45, 0xA3, 0xF4, 0x83, 0xCF, 0xAB, 0x23, 0x78, 0xB0, 0x1B, 
-0xB4, 0xA8, 0x06, 0x1A, 0xEC, 0x4A, 0x51, 0xE4, 0x95, 0xA6, 0x0C, 0x9A, 0x20, 0x1A, 0x51, 0x0A, 
-0x19, 0x2C, 0x94, 0xC1, 0x79, 0x52, 0x25, 0xAC, 0x68, 0x5A, 0x56, 0x0E, 0x65, 0x0C, 0x27, 0x0A, 
-0x7B, 0x78, 0x27, 0xA1, 0xB0, 0x69, 0x2D, 0xE9, 0xF5, 0xCA, 0x73, 0xFF, 0xF6, 0x6F, 0x3F, 0x3B, 
-0x7A, 0xEC, 0x59, 0x1E, 0x49, 0x7C, 0xF7, 0xBB, 0xF2, 0x23, 0xC6, 0x42, 0xBB, 0xBF, 0x5A, 0x29, 
-0x3D, 0x1C, 0xA5, 0xBC, 0xA8, 0x8F, 0xB3, 0x2A, 0xB0, 0x6C, 0xD4, 0xB2, 0x71, 0xC3, 0x32, 0x84, 
-0x1C, 0xA3, 0x1C, 0xAA, 0xDF, 0xC5, 0x94, 0x7D, 0x54, 0x28, 0xB0, 0x56, 0x91, 0x26, 0x35, 0x2A, 
-0x27, 0x74, 0x7A, 0x0E, 0x1F, 0x2C, 0x22, 0x16, 0x19, 0x64, 0xFE, 0x5A, 0x74, 0x57, 0x52, 0x41, 
-0xA1, 0x42, 0x7A, 0x54, 0x51, 0x47, 0x41, 0x08, 0x03, 0x27, 0xED, 0x38, 0xF8, 0xF4, 0x40, 0x96, 
-0x4D, 0xC9, 0xD0, 0x62, 0x30, 0x21, 0x86, 0x21, 0x2A, 0x13, 0xAB, 0xED, 0x56, 0x2A, 0xE0, 0x50, 
-0x78, 0x12, 0x2A, 0xA9, 0xD3, 0x63, 0x19, 0xB7, 0xDE, 0x37, 0xCD, 0x9E, 0x39, 0x45, 0x5F, 0x0F, 
-0x51, 0x05, 0xC1, 0x26, 0x44, 0x55, 0x84, 0x32, 0x0F, 0xB0, 0xC6, 0x3F, 0x54, 0xF3, 0xA2, 0xEE, 
-0xD7, 0xB4, 0xB6, 0x78, 0x81, 0xE0, 0x2A, 0xD2, 0x5A, 0x02, 0x46, 0xD0, 0x16, 0x8C, 0x72, 0x04, 
-0x1F, 0xFB, 0x00, 0x55, 0x11, 0xB4, 0x3B, 0x2C, 0x79, 0x89, 0x5A, 0xD4, 0x29, 0x0A, 0xA2, 0x23, 
-0xF9, 0x79, 0x71, 0x88, 0xF7, 0x68, 0xAF, 0xB0, 0x5E, 0x63, 0x9C, 0x82, 0x2A, 0x6E, 0xBF, 0x62, 
-0x00, 0x80, 0x3F, 0x8A, 0x44, 0xE3, 0x60, 0x8D, 0x93, 0x21, 0x4E, 0xF2, 0x30, 0x78, 0x3C, 0x2C, 
-0x19, 0x1E, 0xD5, 0xB4, 0xC4, 0xD2, 0x2C, 0x47, 0x37, 0x3B, 0x50, 0x1F, 0x04, 0xE2, 0xEE, 0x40, 
-0xB4, 0x41, 0xF4, 0x20, 0x4D, 0x9F, 0x8A, 0x65, 0x56, 0x8E, 0x26, 0xA6, 0x45, 0x5D, 0xA8, 0x46, 
-0x61, 0x54, 0xD4, 0x03, 0x1A, 0xA5, 0x0E, 0xBB, 0x97, 0x3D, 0xF4, 0x63, 0xF4, 0xAC, 0x7E, 0xB0, 
-0xC7, 0x28, 0x45, 0x1F, 0xB1, 0x7A, 0xDF, 0xBF, 0x0D, 0x16, 0x8A, 0xC1, 0xDF, 0xD1, 0xD2, 0x6A, 
-0x5C, 0x28, 0x42, 0xFC, 0x7D, 0x83, 0xC5, 0x79, 0xB1, 0xC5, 0x5A, 0x5E, 0x8B, 0xED, 0xFE, 0xFA, 
-0x62, 0x7D, 0x94, 0xBE, 0x57, 0x11, 0x62, 0x42, 0x1F, 0x53, 0x22, 0xBA, 0x40, 0x74, 0x85, 0xE8, 
-0x45, 0x35, 0x84, 0x06, 0xAD, 0x50, 0x86, 0x23, 0xD2, 0x32, 0x0E, 0x2F, 0x51, 0x5D, 0x11, 0xF5, 
-0xFF, 0xB1, 0xEC, 0x8D, 0x12, 0x87, 0x36, 0x1E, 0x74, 0x1C, 0xA1, 0xF1, 0x3D, 0x83, 0xF2, 0x0E, 
-0xE3, 0x3D, 0xAA, 0xAA, 0xC8, 0x92, 0x14, 0x11, 0x08, 0x85, 0x43, 0xE9, 0x04, 0xA5, 0x0D, 0xBE, 
-0xAA, 0xB0, 0x47, 0x25, 0x68, 0x7F, 0x60, 0x8B, 0xF8, 0x4E, 0x64, 0x8B, 0x0A, 0x71, 0x7C, 0x19, 
-0x08, 0x49, 0x9D, 0xD2, 0x0C, 0x31, 0x1F, 0x9A, 0xDC, 0x78, 0xF7, 0x5E, 0xA6, 0xFA, 0x86, 0xC2, 
-0x36, 0x29, 0x94, 0xC5, 0x89, 0xA0, 0xD1, 0x44, 0x59, 0x24, 0x96, 0x4E, 0x97, 0x41, 0xE9, 0x25, 
-0x94, 0x8F, 0x63, 0x4B, 0xC7, 0xF1, 0xB5, 0xF8, 0xB7, 0xF8, 0x3B, 0xE2, 0xE7, 0xA3, 0x51, 0x32, 
-0xEE, 0x1D, 0x8F, 0xF6, 0x80, 0xF1, 0x68, 0x84, 0x0A, 0xA1, 0xC2, 0xD2, 0x2D, 0xE3, 0xE2, 0x68, 
-0xB5, 0x41, 0x07, 0x83, 0x56, 0x19, 0x09, 0x16, 0x5D, 0xE6, 0xAC, 0xAC, 0x09, 0x6B, 0x87, 0x20, 
-0xF3, 0x51, 0xF0, 0x52, 0xC1, 0xE0, 0x45, 0x53, 0x54, 0xC1, 0x54, 0xA8, 0x33, 0xE7, 0xE7, 0x8B, 
-0x65, 0xC7, 0x5E, 0xDE, 0x23, 0x89, 0xE3, 0x8E, 0x70, 0x1B, 0xCD, 0xC6, 0x09, 0x2E, 0x48, 0x16, 
-0x27, 0xFF, 0x40, 0xB2, 0xF2, 0x25, 0xAB, 0x97, 0x8F, 0x30, 0x36, 0x5C, 0x8B, 0x03, 0x21, 0x38, 
-0x7C, 0x91, 0x63, 0xBC, 0x47, 0xAB, 0xF8, 0x99, 0x80, 0x90, 0x97, 0x0E, 0xE7, 0xC3, 0x40, 0x9D, 
-0x30, 0x88, 0xFD, 0x06, 0x20, 0x0C, 0x1C, 0xAD, 0x07, 0x16, 0xE6, 0xFB, 0x19, 0xD4, 0x8E, 0x96, 
-0x55, 0x8E, 0x60, 0x71, 0x80, 0x2C, 0x76, 0x50, 0x94, 0x8E, 0xE3, 0x24, 0x14, 0x14, 0xA8, 0x84, 
-0x32, 0x58, 0x8A, 0x30, 0xC4, 0xB6, 0xFD, 0x1D, 0x36, 0x6F, 0x9D, 0x24, 0xA7, 0x01, 0x36, 0xA5, 
-0xFA, 0x81, 0x25, 0xDC, 0x23, 0x38, 0x22, 0x59, 0x1D, 0x19, 0x90, 0x71, 0x70, 0xC6, 0x49, 0x7A, 
-0x34, 0x59, 0x72, 0xD4, 0x0D, 0x5D, 0x7C, 0x7D, 0x11, 0x0F, 0x3A, 0xED, 0x8E, 0x3A, 0xE6, 0xFD, 
-0x25, 0x52, 0x7D, 0x58, 0xCA, 0xE4, 0xE8, 0xC7, 0x63, 0x70, 0xAC, 0xC1, 0xE9, 0xE8, 0x06, 0x9A, 
-0xA0, 0x62, 0xCA, 0xC7, 0xA3, 0xDB, 0x22, 0xD9, 0x2E, 0x1A, 0x6F, 0x8E, 0x6E, 0xD1, 0xB5, 0x27, 
-0x3E, 0x2E, 0x1E, 0xFF, 0xA1, 0x1F, 0x17, 0xAB, 0x0F, 0x3C, 0xF0, 0xF1, 0x07, 0xC1, 0xFD, 0xA4, 
-0xD4, 0x07, 0x51, 0x45, 0x3C, 0x58, 0x5F, 0x1C, 0xF9, 0x5D, 0x47, 0xD4, 0x25, 0x28, 0x87, 0x68, 
-0x77, 0xFF, 0xC5, 0xEC, 0x7E, 0x6D, 0x70, 0x7F, 0x0E, 0x93, 0xCC, 0x22, 0x06, 0x77, 0xE8, 0x41, 
-0xDF, 0x7B, 0xE0, 0x7D, 0x54, 0xCA, 0x1C, 0xD6, 0x1F, 0xFF, 0xF0, 0xA6, 0x73, 0x00, 0xA9, 0x10, 
-0xE7, 0x28, 0x4B, 0xC8, 0x43, 0x83, 0xDD, 0x07, 0x4B, 0xEE, 0xDB, 0xD3, 0x66, 0xB6, 0x67, 0xC8, 
-0x7D, 0x32, 0x30, 0x4A, 0x3F, 0xF0, 0x9C, 0x41, 0x45, 0x0F, 0x95, 0xFB, 0x8D, 0xA7, 0xC5, 0x0E, 
-0xFA, 0x2E, 0x38, 0x5A, 0xBF, 0xAF, 0x06, 0x3B, 0x95, 0xCA, 0x6B, 0x7A, 0xFD, 0x80, 0x0B, 0x0C, 
-0xCE, 0x15, 0x93, 0xBC, 0x1B, 0x63, 0x48, 0xB4, 0xD0, 0xB4, 0x81, 0x65, 0x75, 0x4B, 0x4D, 0x79, 
-0x12, 0x06, 0x7A, 0x64, 0xD1, 0xB8, 0x10, 0x74, 0x10, 0xB5, 0x76, 0xDB, 0xB6, 0xAD, 0x1B, 0x8F, 
-0x27, 0xC3, 0xD9, 0x0F, 0xEB, 0x0E, 0xFD, 0x50, 0xF0, 0xA7, 0x7F, 0xFA, 0xA7, 0xD9, 0xC1, 0xC9, 
-0xD9, 0xB3, 0x05, 0x49, 0x0E, 0x47, 0xF8, 0x68, 0x41, 0x69, 0xE1, 0x94, 0x53, 0x4F, 0x66, 0xD5, 
-0xAA, 0x15, 0x51, 0x82, 0x08, 0x8E, 0x22, 0xEF, 0x0D, 0x4A, 0x74, 0x2C, 0x1A, 0x5E, 0x34, 0x45, 
-0x51, 0x51, 0x55, 0xB1, 0x58, 0xE2, 0x0F, 0x02, 0xC1, 0x53, 0xA9, 0xFE, 0xA0, 0x09, 0x48, 0x02, 
-0x92, 0xA1, 0x42, 0x86, 0x1E, 0x54, 0x39, 0x0D, 0x28, 0x1C, 0x96, 0xA0, 0x1A, 0xEC, 0xDE, 0x3F, 
-0xC7, 0x6D, 0x9B, 0x76, 0xD0, 0x2F, 0x12, 0x94, 0x6D, 0xE2, 0x62, 0xCE, 0xC6, 0xFF, 0xD6, 0xF8, 
-0x4E, 0x12, 0xD4, 0x77, 0x7A, 0xEF, 0xBF, 0x0B, 0x1E, 0xCC, 0x58, 0x78, 0xF4, 0x6B, 0x8B, 0xE3, 
-0xFA, 0xA1, 0xDA, 0xB1, 0x9F, 0xFF, 0x61, 0x42, 0x21, 0x18, 0x1D, 0xD5, 0x51, 0xC6, 0x36, 0x09, 
-0x7A, 0x19, 0xBB, 0xF6, 0xF6, 0xD8, 0x33, 0x51, 0x51, 0xC9, 0x30, 0x5A, 0x8D, 0xA2, 0x24, 0x1D, 
-0x08, 0x21, 0x51, 0x30, 0xF1, 0x8B, 0x19, 0xA0, 0x07, 0x76, 0x8F, 0xB8, 0x1B, 0x3A, 0x6A, 0x85, 
-0x39, 0x4C, 0xCE, 0x47, 0x2D, 0x4A, 0x0F, 0x09, 0x1D, 0x5D, 0x39, 0x31, 0x14, 0x55, 0x49, 0xBB, 
-0xDB, 0x89, 0xEA, 0x8D, 0xA3, 0x16, 0xC4, 0xC5, 0x31, 0x64, 0xB5, 0x62, 0xD9, 0xF0, 0x30, 0x99, 
-0x31, 0xC4, 0xAC, 0x27, 0xB1, 0xC2, 0x85, 0x31, 0x06, 0xC1, 0x0F, 0xED, 0xD9, 0xB5, 0xE7, 0xDC, 
-0x3F, 0xFB, 0xB3, 0xFF, 0xFC, 0xDE, 0x95, 0xDA, 0xFF, 0xC5, 0x38, 0xAE, 0x08, 0xF7, 0xE6, 0x9B, 
-0x27, 0x86, 0x14, 0x9C, 0x68, 0x54, 0xAA, 0x19, 0x10, 0x9F, 0xD2, 0x82, 0x4D, 0x14, 0x67, 0x9C, 
-0x71, 0x0A, 0x2B, 0x57, 0x8C, 0x1D, 0x26, 0x5C, 0xD7, 0xEF, 0xC7, 0x2C, 0x54, 0x10, 0xE3, 0xDB, 
-0xB5, 0xA1, 0x28, 0x03, 0xDE, 0xC5, 0x1B, 0x71, 0xF4, 0x94, 0x3E, 0xEC, 0x4B, 0xF9, 0x3D, 0x22, 
-0x28, 0xF0, 0xDA, 0xE3, 0x4C, 0xD4, 0x23, 0x81, 0xC5, 0xC8, 0xA0, 0x0D, 0xB6, 0xB4, 0x41, 0x3C, 
-0x82, 0x21, 0xE8, 0x26, 0x1D, 0x32, 0xB6, 0xEE, 0x6D, 0xB1, 0x7F, 0xA6, 0xA4, 0xA0, 0x81, 0x57, 
-0xF5, 0x98, 0xCC, 0xE6, 0xBF, 0x31, 0xBE, 0x13, 0x19, 0x7C, 0xA7, 0xF7, 0x96, 0xF0, 0xBD, 0xE1, 
-0xBF, 0xBC, 0x0F, 0x43, 0x20, 0x78, 0x45, 0x30, 0x23, 0x4C, 0xCE, 0x38, 0xEE, 0xDE, 0x3E, 0xC7, 
-0x42, 0x91, 0x51, 0xD1, 0xC4, 0x87, 0xF4, 0x70, 0xDE, 0xE8, 0xD8, 0x1C, 0x42, 0x34, 0x20, 0x46, 
-0xB7, 0x2D, 0xCD, 0xA2, 0x5A, 0xEA, 0xC1, 0xA4, 0xE0, 0x23, 0x38, 0x76, 0xE1, 0x3D, 0xF2, 0x39, 
-0xA5, 0x62, 0x00, 0x4C, 0x55, 0x7A, 0x5A, 0xAD, 0x76, 0xBC, 0xDE, 0xC3, 0xF1, 0xDB, 0x9A, 0x10, 
-0x88, 0xE1, 0xF4, 0xC0, 0xF0, 0x50, 0x8D, 0x46, 0x02, 0x76, 0xA0, 0xEC, 0x8B, 0x3B, 0x8C, 0x40, 
-0x08, 0x21, 0x71, 0xCE, 0x9F, 0x64, 0x4C, 0x67, 0xD1, 0x28, 0xF1, 0x88, 0xE3, 0xA1, 0x7A, 0xE2, 
-0x11, 0x41, 0x77, 0xAE, 0xB3, 0xD2, 0xDA, 0x74, 0x6D, 0x90, 0xA0, 0xB5, 0xD2, 0x10, 0x3C, 0x21, 
-0x94, 0xA4, 0xA9, 0x66, 0xC3, 0xFA, 0x13, 0x68, 0x36, 0xB2, 0xE8, 0xAA, 0x13, 0x3C, 0xAE, 0x2A, 
-0xA2, 0x6B, 0x57, 0x90, 0x78, 0x19, 0x3A, 0xA5, 0x74, 0x7E, 0x90, 0xD4, 0x2F, 0xAA, 0x0C, 0xD4, 
-0xA0, 0xDD, 0xDF, 0xCC, 0xB1, 0xD8, 0x8E, 0xC5, 0xE2, 0xA7, 0xE3, 0x37, 0xE2, 0xD6, 0x48, 0x0D, 
-0x88, 0x33, 0xA6, 0xA2, 0xB1, 0x38, 0x34, 0x05, 0x4A, 0xE5, 0x31, 0xCD, 0xA3, 0xB1, 0xE4, 0x92, 
-0xE2, 0x59, 0xCE, 0xC1, 0x39, 0xC5, 0xDD, 0xDB, 0xE7, 0x99, 0xEF, 0xD7, 0xF1, 0x76, 0x04, 0xFF, 
-0x20, 0x7E, 0xC0, 0xC7, 0x13, 0x8E, 0x95, 0x98, 0x1E, 0xB0, 0xBD, 0xFF, 0x01, 0x71, 0xEC, 0xF1, 
-0x8F, 0x6D, 0x4B, 0x38, 0x8E, 0x31, 0x50, 0xBB, 0x79, 0x32, 0x4A, 0x19, 0xE6, 0xAE, 0x6D, 0x33, 
-0x6C, 0xD9, 0x31, 0x87, 0xA8, 0x71, 0x14, 0x4D, 0x44, 0xD9, 0x81, 0x71, 0x6B, 0xD1, 0x6D, 0xEE, 
-0x28, 0x15, 0x9A, 0x58, 0x08, 0x26, 0x3E, 0x72, 0x94, 0x9E, 0xFB, 0x7E, 0x64, 0x23, 0x83, 0xBF, 
-0x07, 0x4A, 0xBB, 0xD1, 0xB5, 0x4C, 0x11, 0x24, 0x0A, 0x3A, 0xA5, 0x83, 0x76, 0xA7, 0x17, 0x73, 
-0x6B, 0x1C, 0x3D, 0x6E, 0x82, 0x22, 0x38, 0x41, 0x05, 0xCF, 0x70, 0x66, 0x19, 0xA9, 0xA5, 0xA4, 
-0x87, 0x43, 0xCC, 0x85, 0x10, 0x1C, 0xC1, 0xFB, 0xC4, 0x58, 0xBD, 0x6E, 0xF3, 0xE6, 0xBB, 0x1A, 
-0x47, 0xBE, 0xF8, 0xC8, 0xE2, 0xB8, 0x21, 0xDC, 0xEB, 0xAE, 0xBB, 0xCE, 0xDC, 0xB1, 0x69, 0xD3, 
-0x59, 0xAD, 0xEE, 0xDC, 0xB8, 0x35, 0x49, 0x2C, 0xB1, 0x8D, 0xC7, 0x87, 0x92, 0x46, 0x33, 0x61, 
-0xF9, 0x8A, 0x61, 0x94, 0xF6, 0xE8, 0xE0, 0x21, 0x54, 0x48, 0x55, 0x44, 0xE7, 0x76, 0x25, 0xB1, 
-0x4E, 0x17, 0x03, 0x09, 0x37, 0x1C, 0x8E, 0x55, 0x3A, 0xF6, 0x14, 0x0F, 0x03, 0x1A, 0x25, 0x71, 
-0xD0, 0xA8, 0x81, 0x7F, 0xE6, 0xE2, 0x4A, 0xAE, 0xA8, 0x40, 0x95, 0x91, 0xB4, 0xB5, 0xA2, 0x08, 
-0xE0, 0x69, 0xD0, 0xAA, 0x14, 0x5B, 0xB6, 0x4F, 0x70, 0xA8, 0x55, 0x22, 0x66, 0xE8, 0xBF, 0xBD, 
-0x84, 0x7B, 0x34, 0x1E, 0x8C, 0x64, 0x8F, 0x25, 0xE0, 0x63, 0xDB, 0x7F, 0x57, 0xFC, 0x30, 0xAE, 
-0xFD, 0x07, 0x5D, 0x30, 0x45, 0xE9, 0x58, 0x7A, 0x28, 0x19, 0xA2, 0x55, 0x28, 0x36, 0xDD, 0xB7, 
-0x87, 0xFD, 0xD3, 0x0B, 0x60, 0xEB, 0xC4, 0xB8, 0xC3, 0x41, 0xA2, 0x1F, 0x01, 0x06, 0x0A, 0xBC, 
-0x45, 0xCA, 0x8C, 0x3A, 0xFC, 0x81, 0x7B, 0xDD, 0x61, 0x7D, 0xF7, 0xE2, 0x63, 0x18, 0x08, 0x3B, 
-0xDF, 0x83, 0x4A, 0x41, 0x14, 0x0A, 0x8B, 0x0B, 0x81, 0x76, 0xB7, 0x4F, 0xD0, 0x9A, 0x30, 0xC8, 
-0x59, 0x7C, 0x38, 0x29, 0x4F, 0x10, 0x94, 0x77, 0xD4, 0x8D, 0x66, 0xF9, 0x50, 0x9D, 0x81, 0x23, 
-0x1B, 0x22, 0x15, 0x4A, 0x29, 0xB4, 0x51, 0x9A, 0xC0, 0x86, 0xAF, 0x7D, 0xED, 0xAB, 0x6B, 0x8E, 
-0x3D, 0xC3, 0x23, 0x85, 0xE3, 0x86, 0x70, 0x87, 0x86, 0x86, 0xEC, 0x6C, 0x6B, 0xE1, 0x54, 0xB0, 
-0xCD, 0x34, 0x4D, 0x07, 0x85, 0xF7, 0x3C, 0x4A, 0x57, 0x2C, 0x5F, 0x31, 0xC2, 0xF2, 0xF1, 0xA1, 
-0xF8, 0x5C, 0x1C, 0xE4, 0x39, 0xCA, 0x15, 0x68, 0x71, 0x31, 0xA1, 0xB4, 0x28, 0x9C, 0x57, 0xF4, 
-0x73, 0x8F, 0xF3, 0x72, 0x94, 0x51, 0xEC, 0x81, 0x2B, 0xE8, 0x22, 0x16, 0xD7, 0xD8, 0x07, 0xFB, 
-0x53, 0x42, 0xAC, 0x9C, 0xEB, 0x17, 0x4D, 0x6D, 0x32, 0xD8, 0x36, 0x55, 0x88, 0x8A, 0x85, 0x23, 
-0xD1, 0x32, 0xC8, 0x54, 0xAF, 0x09, 0x83, 0xE2, 0xD2, 0x07, 0x67, 0x5B, 0x4C, 0xB7, 0xFB, 0x94, 
-0xC6, 0xDC, 0xDF, 0xF8, 0xF2, 0x08, 0xE0, 0xE8, 0x2B, 0xFF, 0x7E, 0xDA, 0x0F, 0x13, 0x3F, 0x2C, 
-0xA9, 0x79, 0x09, 0xDF, 0x1D, 0x3F, 0x8C, 0x7E, 0x0E, 0x40, 0xDF, 0x05, 0x9C, 0xB1, 0xCC, 0xB6, 
-0xBB, 0xEC, 0x39, 0x38, 0x49, 0x4E, 0x81, 0xAB, 0xFA, 0x04, 0xBA, 0xA8, 0xD0, 0x8F, 0xB9, 0x35, 
-0x00, 0x30, 0x87, 0xA3, 0x3A, 0x95, 0x80, 0x16, 0x37, 0xA8, 0x95, 0x77, 0x7F, 0xA5, 0xC2, 0x83, 
-0xE2, 0x18, 0x83, 0x60, 0x44, 0xFC, 0x46, 0x40, 0x21, 0xCA, 0xE2, 0xBC, 0xA2, 0xDB, 0x2B, 0x0E, 
-0x7B, 0x99, 0x88, 0x22, 0xAA, 0x2C, 0x3C, 0x04, 0xEF, 0xD1, 0xAE, 0x22, 0x23, 0xB0, 0xA2, 0x99, 
-0xD0, 0x24, 0xE6, 0x50, 0x16, 0x62, 0x46, 0x40, 0x6B, 0x2D, 0x65, 0x55, 0xAC, 0xDB, 0xBD, 0x7B, 
-0xFF, 0x49, 0xC7, 0x9E, 0xE5, 0x91, 0xC2, 0x43, 0xF6, 0xC5, 0x8F, 0x1A, 0x7B, 0xF7, 0x3A, 0x53, 
-0x15, 0xFE, 0x04, 0xAD, 0xD2, 0xA4, 0xDF, 0x2F, 0x08, 0x3E, 0x76, 0x9E, 0x4D, 0x14, 0xCB, 0xC6, 
-0x9B, 0x8C, 0x8C, 0xD6, 0xA3, 0x65, 0x5E, 0x3C, 0xA1, 0xEC, 0xC7, 0x9C, 0x9F, 0x87, 0xA3, 0xCC, 
-0x14, 0x95, 0x87, 0x7E, 0xE1, 0xA9, 0x7C, 0xBC, 0x51, 0x3F, 0x28, 0xE1, 0x69, 0x89, 0xF9, 0x02, 
-0x16, 0x3B, 0x28, 0x6A, 0x86, 0x42, 0x74, 0x91, 0x1A, 0x6C, 0xB8, 0xAC, 0x54, 0xD4, 0x55, 0x8E, 
-0xA6, 0x45, 0x4A, 0x0F, 0xF1, 0x2D, 0xF2, 0x62, 0x1E, 0x91, 0x87, 0x1B, 0xEB, 0xF3, 0xD8, 0xC3, 
-0x43, 0x91, 0xEC, 0x43, 0xBD, 0xBE, 0x84, 0x1F, 0x1C, 0x3F, 0xCC, 0x7E, 0xF5, 0x5A, 0xB0, 0x75, 
-0x8B, 0xF3, 0x7D, 0x54, 0xE8, 0x32, 0x6A, 0x3D, 0x99, 0x5A, 0xA0, 0x4E, 0x87, 0x86, 0x8E, 0x29, 
-0x39, 0xF5, 0xA0, 0x94, 0xFA, 0x91, 0xCA, 0x19, 0xA0, 0x07, 0x01, 0xC1, 0xFA, 0x28, 0x0F, 0x9F, 
-0x23, 0xCB, 0xF8, 0x51, 0xB2, 0xF0, 0x83, 0x92, 0x6D, 0x44, 0xFC, 0x54, 0x3C, 0x8A, 0x0B, 0x8A, 
-0xBC, 0x72, 0x38, 0x59, 0x0C, 0xCD, 0x1F, 0xA8, 0x3B, 0x2A, 0x8F, 0x94, 0x2E, 0x16, 0xCD, 0x0C, 
-0x25, 0x63, 0xA9, 0xA5, 0x86, 0xC7, 0xE2, 0x20, 0x04, 0xC4, 0x7B, 0xBC, 0x17, 0x5C, 0x70, 0xC3, 
-0x59, 0x56, 0x5B, 0x7D, 0xEC, 0x39, 0x1E, 0x29, 0x1C, 0x37, 0x84, 0xBB, 0x79, 0xF3, 0xA6, 0x66, 
-0x40, 0x6D, 0x14, 0xB1, 0xDA, 0x9A, 0x14, 0x6B, 0x2C, 0x22, 0x25, 0x69, 0xA6, 0x38, 0xE5, 0xD4, 
-0x0D, 0x18, 0xED, 0xA0, 0xEA, 0x01, 0x15, 0x55, 0xAF, 0x43, 0x28, 0xFB, 0x58, 0x3C, 0xDE, 0x7B, 
-0xB4, 0x8D, 0x05, 0x22, 0xDB, 0x9D, 0x3E, 0x28, 0x8B, 0x32, 0x8B, 0x7E, 0xB6, 0x3C, 0x60, 0x8D, 
-0x5D, 0x94, 0x62, 0x1F, 0x08, 0x39, 0xA6, 0x05, 0x02, 0x15, 0x28, 0xA2, 0x05, 0x56, 0x69, 0x54, 
-0xD6, 0x44, 0x9B, 0x3A, 0x26, 0x18, 0xD2, 0xE0, 0xA9, 0x85, 0x0E, 0xA3, 0x7A, 0x8E, 0x35, 0xE9, 
-0x02, 0xA7, 0xAD, 0x16, 0xAE, 0xB8, 0x60, 0x25, 0xEB, 0x57, 0x5A, 0x2C, 0x5D, 0x94, 0x54, 0x0F, 
-0x3A, 0x01, 0x1E, 0x8A, 0x70, 0x8E, 0xDD, 0x52, 0x3F, 0x58, 0x7B, 0xB0, 0xCF, 0x1F, 0x8B, 0x63, 
-0xBF, 0xF3, 0x50, 0xED, 0x58, 0x1C, 0xFB, 0xFE, 0x77, 0x6B, 0xDF, 0x1D, 0xC7, 0xCA, 0xCC, 0xB1, 
-0xC5, 0x72, 0x38, 0x8B, 0x13, 0xEF, 0x48, 0x8B, 0xB9, 0x71, 0x8F, 0xB4, 0xFF, 0xCE, 0xF8, 0xDE, 
-0xFA, 0xF7, 0x08, 0x16, 0xC7, 0xD4, 0xB1, 0xF7, 0xE8, 0x3B, 0xDD, 0xAF, 0x63, 0xDF, 0xBF, 0x5F, 
-0xD3, 0x42, 0x92, 0x0A, 0x21, 0x74, 0x18, 0x1F, 0x85, 0xE7, 0x3F, 0xFD, 0x22, 0xAE, 0x3C, 0x7F, 
-0x25, 0x1B, 0x97, 0xE5, 0x2C, 0x37, 0xD3, 0x64, 0x61, 0x82, 0x8C, 0x38, 0xFF, 0x20, 0x9A, 0x51, 
-0x74, 0x96, 0x10, 0x24, 0x4A, 0x97, 0xD6, 0x02, 0x54, 0x04, 0xCA, 0xC3, 0xD2, 0xA6, 0x1A, 0x24, 
-0x32, 0x02, 0xA2, 0x07, 0x81, 0xC4, 0x9D, 0xE9, 0x91, 0xF9, 0xB8, 0x38, 0x4F, 0xA3, 0x5C, 0xAC, 
-0x94, 0xC5, 0x0D, 0x5C, 0x31, 0xF3, 0xA2, 0xC2, 0x49, 0x40, 0x0F, 0x02, 0x78, 0x08, 0x81, 0xE0, 
-0x62, 0x64, 0x64, 0x0A, 0xA8, 0x32, 0x67, 0x2C, 0xD3, 0x0C, 0x1B, 0x85, 0xA1, 0x22, 0x31, 0xD1, 
-0x26, 0x61, 0xAD, 0x05, 0x54, 0x56, 0x96, 0xD5, 0xF2, 0xE3, 0xC5, 0x35, 0xEC, 0xB8, 0x21, 0xDC, 
-0x5B, 0x6E, 0xB9, 0x6D, 0x3C, 0xCF, 0xCB, 0x35, 0x0C, 0xE2, 0xEB, 0xA3, 0xF3, 0x34, 0xD4, 0x1B, 
-0x86, 0x15, 0x2B, 0x47, 0x49, 0x33, 0x15, 0xAB, 0xC3, 0xE6, 0x5D, 0x8A, 0x6E, 0x2B, 0x6E, 0x5D, 
-0x54, 0x4C, 0x0C, 0xAD, 0x94, 0xA1, 0x0A, 0x9A, 0xDC, 0x09, 0x95, 0x68, 0x7E, 0x18, 0x6E, 0xB0, 
-0x46, 0x99, 0x18, 0x3D, 0x63, 0x03, 0x18, 0x8F, 0x28, 0x87, 0xAB, 0x62, 0x4A, 0xC8, 0x91, 0x24, 
-0x30, 0xAA, 0x3A, 0x8C, 0xC8, 0x24, 0x67, 0xAC, 0x2E, 0x79, 0xE5, 0x73, 0xCE, 0xE2, 0x9D, 0x6F, 
-0x7C, 0x06, 0x2F, 0x7A, 0xC6, 0x79, 0x9C, 0xBC, 0x32, 0xA3, 0x26, 0x39, 0x7A, 0xB1, 0x5A, 0xC0, 
-0x31, 0x78, 0xB0, 0xD7, 0x1E, 0x0C, 0x8B, 0x93, 0xE8, 0xE8, 0xF6, 0xA3, 0xC4, 0xB1, 0xE7, 0x3E, 
-0xB6, 0x7D, 0x2F, 0x78, 0x38, 0xD7, 0xBA, 0x84, 0xFF, 0x5A, 0x7C, 0xAF, 0xF7, 0x22, 0x42, 0x70, 
-0x65, 0x89, 0xF2, 0x3D, 0xD6, 0x0C, 0x6B, 0x9E, 0x7E, 0xD9, 0xC9, 0xFC, 0xD4, 0x2B, 0x9F, 0xC2, 
-0xDB, 0xAE, 0x79, 0x3C, 0x4F, 0xBB, 0x74, 0x39, 0x1B, 0x86, 0x5B, 0xD4, 0x98, 0xA0, 0xA9, 0x5B, 
-0x8C, 0x34, 0x02, 0x46, 0x55, 0xB8, 0xA2, 0x83, 0xD2, 0x90, 0xA5, 0x19, 0x7D, 0x57, 0xC4, 0x00, 
-0x96, 0x98, 0x65, 0x21, 0x16, 0xDB, 0x18, 0x98, 0xA0, 0x05, 0xC1, 0x2D, 0x56, 0x6D, 0x7E, 0x48, 
-0x44, 0xD2, 0x45, 0x19, 0x82, 0x28, 0xBC, 0x80, 0x0F, 0x1C, 0x56, 0x62, 0x20, 0x9A, 0x50, 0x05, 
-0x94, 0x0F, 0x48, 0x55, 0x92, 0x86, 0x8A, 0x65, 0x89, 0x61, 0x34, 0x8D, 0x55, 0xE9, 0x44, 0x3C, 
-0x69, 0x9A, 0x52, 0x14, 0x15, 0x46, 0xA5, 0x06, 0xF4, 0xF8, 0xE0, 0xA0, 0x8F, 0x38, 0x8E, 0x1B, 
-0xC2, 0xDD, 0xB9, 0x73, 0xE7, 0x0A, 0x85, 0x5E, 0x2D, 0xC4, 0x48, 0x2B, 0xF1, 0x15, 0x56, 0x43, 
-0xBD, 0x61, 0x59, 0xB7, 0x61, 0x05, 0x43, 0xCD, 0x2C, 0x46, 0xF0, 0x54, 0x39, 0xBE, 0xDF, 0x03, 
-0x57, 0xA1, 0xC3, 0xA0, 0x0C, 0x08, 0x0A, 0x1F, 0x14, 0x79, 0x1E, 0xA8, 0x9C, 0x8F, 0x81, 0x0F, 
-0x87, 0x7D, 0xFF, 0x1E, 0x0A, 0x0F, 0x94, 0xBE, 0x8E, 0x34, 0xC8, 0xA5, 0x40, 0x10, 0x7C, 0x28, 
-0x09, 0xBE, 0x8B, 0x26, 0xA7, 0xA6, 0x7A, 0xA4, 0xCC, 0x92, 0x55, 0x13, 0x9C, 0xBA, 0x22, 0xE7, 
-0x05, 0x4F, 0x58, 0xCD, 0x1B, 0x5E, 0x78, 0x06, 0x3F, 0xF6, 0xC4, 0x95, 0x5C, 0xB8, 0xDE, 0xB1, 
-0x3A, 0x6D, 0xD1, 0xAC, 0x5A, 0x64, 0x55, 0x81, 0x7D, 0x50, 0x29, 0x3A, 0xE2, 0x7B, 0x19, 0xFC, 
-0xC7, 0xFE, 0xA2, 0xC5, 0xE6, 0x45, 0xF0, 0x8B, 0x95, 0x69, 0xBF, 0x43, 0x7B, 0xA4, 0xF1, 0xBD, 
-0x5C, 0xE3, 0x63, 0x19, 0xC7, 0xDE, 0x8F, 0x87, 0xDB, 0xFE, 0x2B, 0xF0, 0xBD, 0xDE, 0x13, 0x2D, 
-0x50, 0x4F, 0x52, 0x92, 0xAA, 0x24, 0xE9, 0xCF, 0x32, 0x26, 0x33, 0x9C, 0xB1, 0xBC, 0xCB, 0x55, 
-0x17, 0xD4, 0x78, 0xD9, 0x33, 0xD6, 0xF1, 0xBA, 0x17, 0x9F, 0xCD, 0x33, 0x2F, 0x5B, 0xC9, 0x58, 
-0x76, 0x90, 0xAA, 0xB7, 0x8D, 0xA1, 0xA4, 0x4D, 0x23, 0x0B, 0x48, 0xC8, 0x71, 0x95, 0xA2, 0x6E, 
-0x46, 0x88, 0x59, 0x85, 0x4B, 0x3C, 0x05, 0x3E, 0xE4, 0x04, 0x29, 0xA3, 0xF4, 0x3C, 0xE0, 0xBD, 
-0x58, 0xF3, 0xE1, 0xE8, 0xB6, 0x98, 0xE0, 0x33, 0xFE, 0x2D, 0xCE, 0x61, 0x09, 0x1A, 0xEF, 0x84, 
-0x2A, 0xC4, 0x88, 0x35, 0x00, 0x82, 0x50, 0x15, 0x0E, 0x2A, 0x0F, 0x65, 0x45, 0x12, 0x3C, 0x63, 
-0xA9, 0x61, 0xBC, 0x91, 0x62, 0x89, 0x75, 0xEF, 0xCA, 0xB2, 0xC4, 0x9A, 0x04, 0x2F, 0x95, 0xD6, 
-0xCA, 0x9E, 0xF8, 0xCE, 0x77, 0xBE, 0x67, 0xE8, 0xFE, 0x57, 0xF9, 0xC8, 0xE0, 0x3B, 0x31, 0xD2, 
-0x8F, 0x14, 0x3A, 0x49, 0xC7, 0xB4, 0x49, 0x46, 0xE2, 0x76, 0x62, 0xF1, 0x67, 0x05, 0x1A, 0x8D, 
-0x94, 0xB5, 0x6B, 0x57, 0x51, 0xAB, 0x9B, 0xA8, 0xF7, 0xF1, 0x15, 0xBE, 0xEC, 0x21, 0x55, 0x0E, 
-0xE2, 0x63, 0xA2, 0x19, 0x51, 0x54, 0x41, 0xE8, 0xE6, 0x15, 0x2E, 0x44, 0xED, 0xD1, 0x62, 0xA6, 
-0xB0, 0xEF, 0x0F, 0x81, 0x9A, 0x4E, 0x62, 0x59, 0x76, 0xDF, 0xA6, 0x99, 0xF4, 0x18, 0x31, 0xB3, 
-0xD4, 0xFC, 0x01, 0x4E, 0x6E, 0x76, 0x79, 0xF6, 0xA5, 0x6B, 0x78, 0xDB, 0xCB, 0x2E, 0xE3, 0x6D, 
-0x2F, 0xBF, 0x9C, 0xE7, 0x3D, 0x61, 0x35, 0x1B, 0xC6, 0xDA, 0xD4, 0xDD, 0x04, 0x0D, 0x99, 0x67, 
-0x48, 0xC5, 0x4C, 0xFF, 0x8B, 0x67, 0x3F, 0x76, 0xBB, 0xF6, 0x83, 0xE2, 0x87, 0x75, 0x9C, 0xE3, 
-0x01, 0x0F, 0x47, 0x5A, 0x5E, 0xC2, 0x83, 0xE3, 0xE1, 0xF6, 0xDF, 0xF7, 0x36, 0x7E, 0x62, 0x05, 
-0xE5, 0x54, 0x84, 0xD4, 0xE7, 0xE8, 0xEE, 0x34, 0xA6, 0xBD, 0x97, 0x71, 0x7D, 0x88, 0x4B, 0x4F, 
-0xCD, 0x78, 0xD1, 0x53, 0x37, 0xF2, 0xA6, 0x97, 0x5F, 0xCA, 0xCB, 0x9F, 0x75, 0x3A, 0x17, 0x9D, 
-0xA8, 0x69, 0xFA, 0x3D, 0xD4, 0xAA, 0x03, 0x8C, 0x9A, 0x92, 0xBA, 0xF1, 0xE4, 0xBE, 0x35, 0x70, 
-0xCF, 0xAA, 0x88, 0xB1, 0x86, 0x6E, 0xD0, 0x3C, 0x5A, 0x2F, 0xCA, 0xBE, 0x47, 0xCE, 0xF5, 0x90, 
-0xC2, 0xE7, 0x20, 0x2C, 0xDC, 0x89, 0xE0, 0xC3, 0x51, 0xCB, 0x90, 0x0F, 0x54, 0x79, 0x81, 0x0E, 
-0x0A, 0xE3, 0x1D, 0x89, 0xF3, 0x8C, 0x58, 0xCD, 0x78, 0xAD, 0x16, 0x63, 0x24, 0x83, 0xC7, 0xAA, 
-0x04, 0xE7, 0x04, 0x4D, 0x5D, 0x57, 0x95, 0x9C, 0x30, 0xBB, 0x6F, 0xA1, 0x79, 0xF4, 0xA1, 0x1F, 
-0x29, 0xFC, 0x20, 0xAC, 0xF4, 0x43, 0x85, 0x52, 0xC9, 0x68, 0xE5, 0x42, 0x5D, 0xAB, 0x54, 0x29, 
-0xA5, 0x30, 0xC6, 0xA0, 0x34, 0x0C, 0x8F, 0x0C, 0xB1, 0x6C, 0x7C, 0x04, 0xC1, 0x81, 0x2F, 0xC0, 
-0xE5, 0x94, 0xBD, 0x1E, 0xE2, 0x1C, 0xCA, 0x39, 0x44, 0x84, 0xE0, 0x21, 0x78, 0x45, 0x3F, 0x2F, 
-0x08, 0x81, 0xA3, 0x08, 0x7B, 0xF1, 0x66, 0x3E, 0xC4, 0x0D, 0x85, 0x07, 0x91, 0x2D, 0x62, 0x0C, 
-0x99, 0x0A, 0x7D, 0x1A, 0x3A, 0xA7, 0xCE, 0x2C, 0xBA, 0xDA, 0xCE, 0x72, 0xBD, 0x97, 0x2B, 0x36, 
-0x3A, 0x5E, 0xF2, 0xA4, 0x35, 0xBC, 0xE6, 0xD9, 0x27, 0xF1, 0xB4, 0x73, 0xEB, 0x9C, 0xD8, 0x9C, 
-0x42, 0xB7, 0xB7, 0x62, 0xBA, 0x7B, 0xA9, 0x85, 0x36, 0xD6, 0x97, 0x90, 0x7B, 0xA8, 0x62, 0xF1, 
-0xC2, 0x1F, 0x04, 0xC7, 0x12, 0xF5, 0xB1, 0xED, 0xBF, 0x1A, 0xC7, 0x9E, 0xEF, 0xD8, 0xF6, 0x83, 
-0xE2, 0xE1, 0x12, 0xC5, 0x12, 0xBE, 0x33, 0x8E, 0xBE, 0x27, 0x3F, 0x94, 0xFB, 0xE3, 0x63, 0xB2, 
-0xA7, 0x54, 0x29, 0x9A, 0x46, 0x68, 0xD0, 0xA7, 0xE6, 0xE6, 0x69, 0x54, 0x07, 0x69, 0xFA, 0x7D, 
-0x9C, 0xB6, 0xBC, 0xCD, 0x4F, 0x3C, 0xF3, 0x14, 0x7E, 0xF6, 0x65, 0x17, 0xF0, 0xFC, 0xC7, 0x8D, 
-0x71, 0xDA, 0xD8, 0x2C, 0x0D, 0xBF, 0x93, 0xC4, 0x1D, 0x62, 0x2C, 0xC6, 0x88, 0xA1, 0xB5, 0x27, 
-0x35, 0x01, 0xA3, 0x14, 0x46, 0x69, 0x94, 0x84, 0x98, 0x64, 0x07, 0x19, 0x64, 0x9D, 0x50, 0x0F, 
-0xA0, 0xA0, 0x18, 0xD0, 0x1B, 0xC7, 0xC7, 0xE2, 0x58, 0x13, 0x39, 0x2A, 0xE3, 0x49, 0x50, 0xE0, 
-0x02, 0x55, 0x51, 0x41, 0x10, 0xAC, 0x07, 0x13, 0x2A, 0x32, 0x84, 0x91, 0x7A, 0x1A, 0xC3, 0x7B, 
-0x07, 0x7D, 0xA0, 0x55, 0x82, 0x26, 0xD1, 0x60, 0xD6, 0x74, 0x8B, 0x62, 0xEC, 0x7E, 0x27, 0x7A, 
-0x84, 0x70, 0xDC, 0x10, 0x6E, 0xD9, 0xCF, 0x57, 0x23, 0xDE, 0x5A, 0x6B, 0x71, 0x2E, 0xC4, 0x64, 
-0xD8, 0xC1, 0x31, 0x3E, 0x3E, 0xC2, 0xC8, 0x70, 0x3D, 0xEA, 0x6F, 0x43, 0x05, 0xCE, 0x11, 0x5C, 
-0x85, 0xF2, 0xD1, 0x63, 0x61, 0xB1, 0xAC, 0x87, 0x0F, 0x90, 0x97, 0x61, 0x90, 0x7A, 0x66, 0x31, 
-0xF5, 0xDE, 0xD1, 0xF8, 0x5E, 0x06, 0x61, 0x24, 0x5C, 0x1D, 0x53, 0x66, 0x90, 0x84, 0x69, 0x86, 
-0xF4, 0x34, 0x67, 0xAD, 0x50, 0xBC, 0xE8, 0xC9, 0x27, 0xF3, 0x8E, 0x9F, 0xB8, 0x82, 0xD7, 0x3C, 
-0xF3, 0x34, 0x2E, 0xDD, 0x00, 0x8D, 0x7C, 0x17, 0x69, 0x6F, 0x1F, 0x75, 0xDF, 0xA6, 0x99, 0x78, 
-0x52, 0x2D, 0x71, 0x8B, 0xA3, 0x35, 0x64, 0x47, 0x2A, 0x7B, 0x7C, 0x3F, 0xBA, 0x4F, 0xBE, 0x67, 
-0x49, 0x64, 0x09, 0xFF, 0x5D, 0xF1, 0x70, 0xC7, 0xD3, 0xC3, 0x85, 0x58, 0x45, 0xC0, 0x11, 0x2A, 
-0x87, 0x94, 0x0E, 0x8A, 0x0A, 0x7A, 0x5D, 0xE8, 0x2C, 0x60, 0x3A, 0x33, 0xA8, 0xF9, 0x3D, 0xAC, 
-0x52, 0xD3, 0x3C, 0xF9, 0xCC, 0x1A, 0x3F, 0xF9, 0x82, 0xB3, 0x78, 0xF5, 0x73, 0xCE, 0xE4, 0x82, 
-0xB5, 0x50, 0x67, 0x3F, 0x29, 0xD3, 0x08, 0x1D, 0x5C, 0xC8, 0xF1, 0xA1, 0xC4, 0xEA, 0xC0, 0xE1, 
-0x02, 0x2A, 0xC8, 0x60, 0x2E, 0x46, 0x83, 0x58, 0xC4, 0xB1, 0x73, 0x35, 0x1A, 0xD1, 0x16, 0x25, 
-0xE1, 0x10, 0x06, 0x44, 0x3D, 0xB8, 0x66, 0x5F, 0x39, 0xAA, 0xC2, 0xA1, 0xBD, 0x8A, 0xC9, 0xDA, 
-0x83, 0x90, 0x22, 0x8C, 0xD4, 0x32, 0xEA, 0x2A, 0xFA, 0xBF, 0x97, 0xC1, 0x91, 0x65, 0x35, 0x40, 
-0xA9, 0xB2, 0xA8, 0xC6, 0xEE, 0xBE, 0xEB, 0xBE, 0x8D, 0x72, 0xED, 0x03, 0x48, 0xE1, 0x47, 0x8E, 
-0x47, 0xFC, 0x07, 0x00, 0x5C, 0x7B, 0xFD, 0xF5, 0xB6, 0xAA, 0xC2, 0x49, 0xA8, 0xC4, 0x04, 0x20, 
-0x0C, 0x56, 0x42, 0x08, 0xAC, 0x5E, 0xB3, 0x92, 0xE1, 0x91, 0xC6, 0x11, 0x09, 0x54, 0x84, 0xE0, 
-0x63, 0x29, 0xF2, 0xC5, 0x1B, 0x10, 0xC2, 0x20, 0x1F, 0x6E, 0xE5, 0x63, 0xB6, 0xAB, 0xA3, 0x42, 
-0x00, 0xEF, 0x7F, 0x89, 0xDF, 0x89, 0xC0, 0x8E, 0x6C, 0x59, 0x14, 0x15, 0xA9, 0xEE, 0x50, 0x63, 
-0x8A, 0x73, 0x36, 0xA4, 0xBC, 0xE4, 0xEA, 0xD3, 0x79, 0xF9, 0x55, 0x27, 0x71, 0xC9, 0xDA, 0xC0, 
-0xF2, 0xB0, 0x97, 0x64, 0x61, 0x07, 0x43, 0x6E, 0x8E, 0xB4, 0xEA, 0x93, 0x38, 0x41, 0x9C, 0xA2, 
-0xA8, 0x14, 0x62, 0x2C, 0x18, 0xC1, 0x17, 0xDD, 0xEF, 0x98, 0xCF, 0xE1, 0x7B, 0x99, 0x28, 0xFF, 
-0xD5, 0x13, 0xEA, 0x91, 0xC4, 0x77, 0xBB, 0xAE, 0xEF, 0xF6, 0xFE, 0x12, 0x1E, 0x1A, 0xDF, 0xCB, 
-0x22, 0xFD, 0xDD, 0x3E, 0x13, 0x94, 0x50, 0x4A, 0x9F, 0xCA, 0x94, 0xA8, 0x44, 0xA1, 0x92, 0x1A, 
-0x86, 0x3A, 0xC6, 0x37, 0x49, 0x7C, 0x8D, 0x86, 0x24, 0xAC, 0x50, 0x8A, 0x66, 0x7F, 0x9A, 0x91, 
-0x7C, 0x0F, 0x67, 0x8C, 0xB4, 0x79, 0xDE, 0xE5, 0xE3, 0xBC, 0xF9, 0x65, 0x17, 0xF0, 0xEC, 0x2B, 
-0x56, 0xD1, 0xB0, 0x07, 0x69, 0x26, 0xD1, 0xAD, 0xB3, 0x92, 0x02, 0xEF, 0x5D, 0xDC, 0x39, 0x0E, 
-0xA6, 0xE2, 0x91, 0xA0, 0xA4, 0x63, 0xE7, 0xE7, 0xFD, 0xB1, 0x28, 0xDD, 0x3A, 0xE7, 0x28, 0xBD, 
-0x8B, 0x29, 0x1B, 0x7D, 0xC0, 0x7B, 0x4F, 0xA8, 0x1C, 0xC1, 0xF9, 0x98, 0xA1, 0x8E, 0x68, 0x2C, 
-0x1B, 0x6D, 0x36, 0xA8, 0x67, 0x29, 0x20, 0x58, 0x52, 0xFA, 0x79, 0x41, 0x2D, 0x6B, 0x50, 0xF9, 
-0xAA, 0x5E, 0x54, 0xE5, 0x9A, 0x5B, 0xD6, 0xDE, 0xF2, 0x88, 0x87, 0x7F, 0x3E, 0xF4, 0xD5, 0xFE, 
-0x08, 0xB1, 0xED, 0xFF, 0x7C, 0xB9, 0xE1, 0x42, 0xD8, 0x88, 0x60, 0x63, 0xE1, 0xBA, 0x04, 0xAB, 
-0x0D, 0x59, 0x9A, 0xB2, 0x6A, 0x7C, 0x8C, 0x66, 0x33, 0x8B, 0xB1, 0x0C, 0x21, 0xE0, 0xAB, 0x12, 
-0x5F, 0x16, 0x03, 0x82, 0x14, 0xC2, 0x60, 0xBB, 0xE1, 0x45, 0xE1, 0xBC, 0x44, 0xFD, 0xAD, 0x0C, 
-0xEA, 0x58, 0xE1, 0x09, 0x70, 0x54, 0xD1, 0x42, 0x06, 0x29, 0xE2, 0xC2, 0xE0, 0xD2, 0x0D, 0x90, 
-0xC5, 0x5C, 0x09, 0x80, 0x25, 0x27, 0x63, 0x8E, 0x26, 0x13, 0xAC, 0x4E, 0xF7, 0xF3, 0x92, 0xA7, 
-0x6C, 0xE4, 0x5D, 0xAF, 0xBF, 0x9A, 0x1F, 0x7B, 0xC2, 0x29, 0xAC, 0xC9, 0xDA, 0x34, 0xFC, 0x34, 
-0x23, 0xBA, 0x43, 0x26, 0x1D, 0x92, 0x44, 0xB0, 0xAE, 0x8C, 0xE5, 0xD9, 0xC5, 0x62, 0x06, 0xF9, 
-0x3A, 0x49, 0x0C, 0x2A, 0x89, 0x69, 0x34, 0x1E, 0x8C, 0x38, 0x1E, 0xEC, 0xB5, 0xEF, 0x86, 0x45, 
-0xF2, 0x3D, 0xBA, 0xFD, 0x57, 0xE3, 0xD8, 0xF3, 0x1D, 0xDB, 0xBE, 0x5F, 0x7C, 0xB7, 0xEF, 0x7E, 
-0xB7, 0xF7, 0x97, 0xF0, 0x83, 0xE1, 0xBB, 0x91, 0x6D, 0x44, 0x40, 0x59, 0x08, 0x44, 0x63, 0x55, 
-0xF0, 0x3E, 0xE6, 0x2E, 0x08, 0x0A, 0x1D, 0x14, 0x49, 0x00, 0x5D, 0xF5, 0xB1, 0x55, 0x8F, 0x86, 
-0x74, 0xC9, 0xCA, 0x49, 0xC6, 0xD5, 0x1C, 0x4F, 0x38, 0x6B, 0x94, 0xD7, 0xFF, 0xD8, 0x79, 0xBC, 
-0xF1, 0x45, 0x17, 0x72, 0xF2, 0xB2, 0x3E, 0x2B, 0x6B, 0x5D, 0x1A, 0xB4, 0x30, 0xC4, 0xBC, 0xD5, 
-0x01, 0x4F, 0x50, 0x8E, 0x60, 0x02, 0xA8, 0x18, 0x86, 0x1B, 0x15, 0x0B, 0x1A, 0x45, 0x74, 0xE5, 
-0x8C, 0xC9, 0x35, 0xD5, 0xC0, 0x75, 0x90, 0xE8, 0xA5, 0x10, 0xC0, 0xFB, 0x0A, 0xF1, 0x01, 0x25, 
-0x51, 0x8D, 0xA0, 0x2A, 0x41, 0xF9, 0x28, 0x24, 0x89, 0x8A, 0x12, 0x74, 0xBD, 0x96, 0x52, 0x33, 
-0x19, 0x06, 0x4D, 0xA2, 0x23, 0xB7, 0xE6, 0xA5, 0x27, 0x51, 0xCD, 0xEC, 0xD0, 0xE4, 0xF4, 0xCA, 
-0xC9, 0x0D, 0x23, 0x8F, 0x38, 0xDF, 0x3D, 0xE2, 0x3F, 0x00, 0x40, 0x0D, 0x53, 0x2B, 0x2B, 0x56, 
-0x80, 0xD6, 0xC6, 0xDA, 0x41, 0x48, 0xAF, 0xA0, 0xBD, 0x70, 0xE6, 0x69, 0x27, 0x52, 0xAF, 0x1B, 
-0x0A, 0x5F, 0x82, 0x8D, 0xB9, 0x5E, 0xF1, 0x01, 0x35, 0xC8, 0xF7, 0x1A, 0x8C, 0x21, 0x28, 0x4B, 
-0xBF, 0xC8, 0x29, 0x2B, 0x17, 0x4B, 0xEB, 0x88, 0x42, 0x70, 0xA8, 0xC4, 0xA3, 0x12, 0x35, 0x48, 
-0xDE, 0xEC, 0xF1, 0x3A, 0xA0, 0x6C, 0xAC, 0xA4, 0x1A, 0xF5, 0x47, 0x0D, 0xAC, 0x59, 0x8E, 0xA2, 
-0x81, 0x26, 0xF0, 0xFF, 0xB3, 0xF7, 0xE7, 0xD1, 0xB2, 0x3D, 0xD9, 0x5D, 0x1F, 0xF8, 0xD9, 0x11, 
-0x71, 0xCE, 0xC9, 0xBC, 0xE3, 0x9B, 0xC7, 0xDF, 0x50, 0xF3, 0xA0, 0x1A, 0xA5, 0x92, 0x54, 0x02, 
-0x49, 0x50, 0x42, 0x16, 0x42, 0x92, 0x25, 0x4A, 0x8D, 0x28, 0xDC, 0x16, 0xC6, 0xD8, 0xD8, 0x18, 
-0xDB, 0xDD, 0x36, 0x34, 0x60, 0xF7, 0xE4, 0x55, 0x52, 0x1B, 0x6C, 0xBC, 0x1A, 0x1B, 0x04, 0x6B, 
-0x61, 0x90, 0x8D, 0xD5, 0x6A, 0x0C, 0x6D, 0x57, 0x2D, 0x6C, 0x90, 0x05, 0x42, 0x36, 0x06, 0xC9, 
-0x03, 0x62, 0x90, 0x84, 0xA4, 0x52, 0xA9, 0xE6, 0xFA, 0x8D, 0x6F, 0x9E, 0xDF, 0x1D, 0x32, 0xF3, 
-0x9C, 0x18, 0xFA, 0x8F, 0x1D, 0x91, 0x79, 0xF2, 0xDC, 0xBC, 0xF7, 0xDD, 0xF7, 0x7E, 0x53, 0x09, 
-0xD5, 0x77, 0xAD, 0x7D, 0xE3, 0xE6, 0x19, 0xE3, 0xC4, 0xB0, 0x63, 0xC7, 0x8E, 0x1D, 0x7B, 0x8F, 
-0x78, 0xC0, 0x36, 0xCF, 0xF1, 0x9E, 0x0B, 0xB7, 0xF8, 0xBD, 0xBF, 0xE5, 0x24, 0xFF, 0xC2, 0x6F, 
-0xDA, 0xE4, 0x6B, 0xCF, 0xEC, 0x70, 0x26, 0x5E, 0x67, 0x83, 0x5D, 0x9C, 0xCF, 0xA3, 0xB5, 0x31, 
-0xD0, 0x75, 0x18, 0x63, 0xA8, 0x53, 0xC2, 0x78, 0x4F, 0x85, 0xEE, 0xB4, 0x69, 0x63, 0x22, 0x9A, 
-0xC3, 0x75, 0x9D, 0x87, 0x1D, 0x3F, 0x0A, 0xE5, 0x9E, 0x3E, 0x1D, 0x76, 0xAE, 0x60, 0xC8, 0x20, 
-0x1F, 0x97, 0x86, 0x38, 0xEC, 0x3D, 0x8F, 0x8B, 0x47, 0xDD, 0xBF, 0x38, 0x5F, 0x06, 0xC6, 0x37, 
-0x8A, 0x5E, 0x21, 0x72, 0xC8, 0xE3, 0x65, 0x97, 0x8C, 0x3D, 0xE7, 0x59, 0xAF, 0x10, 0x87, 0xD5, 
-0x47, 0xA9, 0xBF, 0xE2, 0xEF, 0x77, 0xE8, 0xF7, 0xB7, 0xEF, 0x26, 0xF3, 0x30, 0x02, 0xA3, 0xB1, 
-0xE9, 0x52, 0x85, 0x31, 0x02, 0xE2, 0x11, 0x09, 0x18, 0x1B, 0x30, 0x12, 0x89, 0x41, 0x23, 0x54, 
-0x88, 0x49, 0xF8, 0xD6, 0x53, 0x8B, 0x30, 0x0A, 0xFB, 0xAC, 0xB7, 0x37, 0x78, 0xE7, 0xFA, 0x5D, 
-0xFE, 0xA5, 0x6F, 0x3D, 0xCF, 0xBF, 0xFA, 0x1D, 0x97, 0xF9, 0xFA, 0xA7, 0xF6, 0x39, 0x27, 0xB7, 
-0xD9, 0x36, 0x7B, 0x48, 0x9A, 0xD0, 0xC5, 0x29, 0xD1, 0x79, 0x82, 0x9D, 0x61, 0xDC, 0x0C, 0x61, 
-0x46, 0x05, 0xD4, 0x54, 0x58, 0x2A, 0x84, 0x86, 0x68, 0x2A, 0x42, 0xDE, 0x34, 0x61, 0x44, 0x99, 
-0x6D, 0x34, 0x96, 0xE8, 0x5B, 0xDD, 0xD6, 0x3F, 0x8B, 0x48, 0x2B, 0xB8, 0x59, 0xA2, 0x89, 0xCA, 
-0xB2, 0x5B, 0x0B, 0x9D, 0xF1, 0x34, 0xE3, 0x86, 0x31, 0x35, 0xEB, 0xAC, 0x63, 0x52, 0xA4, 0xAE, 
-0x1C, 0x46, 0x2C, 0x29, 0x19, 0x69, 0xC6, 0x6B, 0x27, 0x5E, 0x7A, 0xE9, 0xB3, 0x5F, 0x95, 0x70, 
-0x01, 0xF6, 0x6F, 0x3E, 0xD8, 0x30, 0x54, 0x27, 0x4C, 0xD5, 0x48, 0x69, 0x3C, 0x95, 0xAB, 0x68, 
-0x9A, 0x8A, 0x13, 0x27, 0x36, 0x19, 0x8D, 0x1C, 0x62, 0xAD, 0x7A, 0xA1, 0x0F, 0x01, 0x89, 0x29, 
-0x3B, 0xB9, 0x50, 0x25, 0x7A, 0x24, 0x33, 0x0A, 0x95, 0x6F, 0x01, 0x30, 0xC6, 0xE0, 0x7D, 0xC4, 
-0x77, 0x41, 0x27, 0x31, 0xAE, 0xC2, 0x38, 0xA7, 0x3B, 0x62, 0x30, 0xD4, 0x4D, 0x43, 0x22, 0x30, 
-0x0B, 0xF7, 0xA8, 0xD8, 0x63, 0x93, 0x87, 0x9C, 0x32, 0x77, 0xF8, 0xC8, 0xD7, 0x9E, 0xE1, 0x5F, 
-0xFB, 0xE8, 0x87, 0xF8, 0xD8, 0x3F, 0xF7, 0x2E, 0xDE, 0x7B, 0xC9, 0xB1, 0xE1, 0x6F, 0x33, 0x4E, 
-0xBB, 0x6C, 0x54, 0x60, 0x24, 0xE0, 0xBD, 0xCF, 0x1E, 0xC4, 0x14, 0xC5, 0x31, 0x87, 0x6E, 0x6B, 
-0xD4, 0x63, 0x6A, 0x25, 0x31, 0xBF, 0xE4, 0xAB, 0xF8, 0x0D, 0x8A, 0x55, 0x03, 0xD7, 0x1B, 0x81, 
-0xA3, 0x06, 0xB8, 0xD5, 0x58, 0x38, 0x59, 0xD7, 0x36, 0x9D, 0x34, 0x8E, 0x60, 0x1E, 0x8C, 0xD4, 
-0xC1, 0x7B, 0xC2, 0x24, 0x8D, 0xA6, 0x42, 0x4A, 0xB8, 0x18, 0x18, 0x85, 0x3D, 0x36, 0xC3, 0x3D, 
-0xB6, 0xE2, 0x35, 0x3E, 0xFA, 0x5B, 0xDE, 0xCC, 0x1F, 0xF9, 0x97, 0xBF, 0x9D, 0x8F, 0x7E, 0xE4, 
-0x5D, 0x6C, 0xBA, 0x3B, 0x54, 0xF1, 0x36, 0xA7, 0xD6, 0x2D, 0xA3, 0x5A, 0xA0, 0x9B, 0xE8, 0x1A, 
-0x4D, 0x76, 0xEB, 0xE8, 0x69, 0xE9, 0xE8, 0x88, 0x78, 0xC4, 0x82, 0x75, 0x96, 0x98, 0xFB, 0x7A, 
-0x07, 0xF8, 0xA8, 0xFD, 0x4E, 0x52, 0x42, 0x92, 0x25, 0x4C, 0x23, 0x26, 0x80, 0x89, 0x99, 0x07, 
-0xA4, 0x0E, 0x2B, 0x9E, 0x91, 0xF5, 0x9C, 0xA8, 0x1D, 0x1B, 0x40, 0x48, 0x33, 0xDA, 0x6E, 0xA6, 
-0xDB, 0xFE, 0x49, 0x76, 0x32, 0x9D, 0x6D, 0xAF, 0xAD, 0xE9, 0x96, 0x8C, 0x37, 0x12, 0x6F, 0x38, 
-0xC3, 0x4D, 0x29, 0xC9, 0x73, 0xCF, 0x3D, 0x7F, 0x3E, 0x84, 0xB4, 0x05, 0x1A, 0x48, 0x2F, 0x12, 
-0xF1, 0x69, 0x86, 0xB8, 0xC4, 0xC9, 0x53, 0xDB, 0x54, 0x55, 0xA5, 0x1B, 0x21, 0xD4, 0x6F, 0xCD, 
-0xC2, 0x5B, 0x7C, 0xCA, 0xF1, 0x71, 0x63, 0x22, 0x45, 0x0F, 0xA9, 0x03, 0x66, 0x48, 0x8A, 0xA4, 
-0x34, 0x86, 0x34, 0xD6, 0xC9, 0x4A, 0x0C, 0x54, 0x21, 0x20, 0x6D, 0x24, 0x79, 0x4B, 0x4C, 0x8E, 
-0x2E, 0x78, 0x12, 0x0F, 0xD9, 0xB0, 0x0F, 0xD8, 0x34, 0x2F, 0x71, 0xDA, 0xBD, 0xC0, 0xD7, 0xBF, 
-0xD5, 0xF2, 0x7B, 0xBE, 0xFD, 0x3D, 0x7C, 0xF0, 0x4D, 0x27, 0xD9, 0xAE, 0x85, 0xD4, 0xCD, 0x98, 
-0x4D, 0xF7, 0x49, 0xA1, 0x43, 0x52, 0x20, 0xC5, 0xA8, 0x1E, 0xFB, 0x2B, 0x0D, 0x50, 0xB9, 0x70, 
-0xFC, 0xBC, 0x80, 0x06, 0x20, 0x2C, 0xCE, 0xB0, 0xBF, 0x8A, 0xDF, 0xA8, 0x38, 0x8C, 0xD9, 0xAA, 
-0x73, 0x97, 0xE1, 0xD1, 0x5F, 0x0F, 0x58, 0xD6, 0xB7, 0xF6, 0x99, 0xB8, 0xC4, 0x00, 0x65, 0x87, 
-0xA0, 0x44, 0x6C, 0xEA, 0x68, 0xEC, 0x0E, 0x4F, 0x9D, 0xF2, 0xFC, 0xB6, 0x6F, 0x7A, 0x9A, 0x7F, 
-0xFE, 0x5B, 0xDF, 0xC6, 0x9B, 0x4F, 0x06, 0xEA, 0xFD, 0x6B, 0x8C, 0xDB, 0x3D, 0xC6, 0x52, 0x31, 
-0xB2, 0x63, 0x9C, 0x1D, 0x23, 0xCE, 0x81, 0x31, 0xCA, 0xC4, 0x4D, 0x07, 0x69, 0x4A, 0xF4, 0x53, 
-0x50, 0xEB, 0x2F, 0x95, 0xC8, 0x93, 0xD0, 0x7A, 0x0D, 0x07, 0x90, 0x30, 0xEC, 0x4F, 0x67, 0xA4, 
-0x98, 0xE3, 0xB7, 0x91, 0xA8, 0x88, 0x8C, 0xE9, 0xD8, 0x76, 0x9E, 0xF3, 0xEB, 0x89, 0x75, 0x99, 
-0xB2, 0x61, 0x2D, 0x8D, 0xAB, 0x34, 0x84, 0x51, 0x35, 0x32, 0x75, 0xD5, 0x9C, 0xF8, 0xF4, 0xA7, 
-0xBF, 0xF4, 0x86, 0xBB, 0x69, 0x7C, 0xC3, 0x19, 0xEE, 0x27, 0x3F, 0xF9, 0x49, 0xF3, 0xFC, 0x4B, 
-0x2F, 0xBD, 0xC9, 0xFB, 0x6E, 0x33, 0x05, 0x5D, 0x08, 0x53, 0xDE, 0xEA, 0xA9, 0xC6, 0xC2, 0xC6, 
-0xD6, 0x1A, 0x88, 0x6E, 0x70, 0x90, 0x24, 0x68, 0x28, 0xE9, 0x1C, 0x43, 0x29, 0x19, 0x24, 0xE8, 
-0x3C, 0x28, 0xA5, 0x44, 0x0A, 0x5E, 0xED, 0xFE, 0x52, 0x20, 0x46, 0x83, 0xA1, 0xA1, 0xC1, 0x51, 
-0x21, 0x48, 0x52, 0x83, 0x68, 0x83, 0xC5, 0x59, 0x03, 0x71, 0x9F, 0xED, 0xD1, 0x94, 0x3A, 0x7C, 
-0x89, 0xF3, 0xE3, 0xAB, 0xFC, 0xEB, 0x3F, 0xF0, 0x75, 0xFC, 0xBB, 0xBF, 0xF7, 0xB7, 0xF0, 0xF5, 
-0x6F, 0xD9, 0xE0, 0x7C, 0xD3, 0xE2, 0x77, 0xEF, 0x22, 0x44, 0xD6, 0x46, 0x35, 0x95, 0xB5, 0xF9, 
-0xD9, 0xAA, 0x6F, 0x8A, 0x3E, 0x2E, 0x5B, 0x41, 0xE4, 0xFF, 0xB5, 0x09, 0xBE, 0x0A, 0xD3, 0xD1, 
-0xAF, 0xE2, 0xAB, 0x78, 0x15, 0x30, 0x54, 0x37, 0xBC, 0x16, 0x90, 0xD8, 0x8F, 0x19, 0x08, 0xC4, 
-0x80, 0xA5, 0x83, 0xC9, 0x6D, 0x6C, 0x7B, 0x8D, 0xAF, 0x7F, 0xC7, 0x16, 0x7F, 0xF0, 0xF7, 0x7C, 
-0x0B, 0xBF, 0xFF, 0x7B, 0x3F, 0xC4, 0x07, 0x9F, 0x19, 0x71, 0xCA, 0xEC, 0xB0, 0x96, 0xF6, 0x10, 
-0x3F, 0x21, 0x84, 0x96, 0x36, 0x74, 0x74, 0x78, 0xA2, 0xF5, 0x88, 0xF3, 0x18, 0xE3, 0x31, 0x04, 
-0x6C, 0xDE, 0xFE, 0x2D, 0xA4, 0xDC, 0x9F, 0x35, 0x04, 0x51, 0xC4, 0x31, 0x6B, 0xA3, 0xAA, 0x3D, 
-0x8C, 0xC1, 0x19, 0x8B, 0x23, 0x51, 0x8B, 0x67, 0x5D, 0x02, 0x67, 0xD7, 0x0D, 0x63, 0x26, 0x74, 
-0x61, 0x1F, 0xEF, 0x3D, 0xFB, 0xB3, 0x7D, 0xDA, 0x6E, 0x46, 0xE8, 0xBA, 0x73, 0x7F, 0xFF, 0xEF, 
-0xFC, 0x9D, 0x53, 0xC3, 0xFC, 0xBF, 0xDE, 0x78, 0xC3, 0x19, 0xEE, 0xBD, 0x7B, 0x6F, 0x31, 0x3B, 
-0x3B, 0xBB, 0x67, 0x8C, 0x91, 0x5A, 0xB7, 0xF3, 0x2A, 0xC3, 0xAD, 0x1B, 0x38, 0x79, 0x7A, 0x93, 
-0x8D, 0x0D, 0x75, 0x65, 0x29, 0x29, 0x61, 0xB1, 0xA4, 0xEC, 0x56, 0x5E, 0x23, 0x3C, 0xD9, 0x3C, 
-0xFD, 0xC9, 0x7A, 0x47, 0x89, 0x08, 0x1D, 0x86, 0x48, 0xA0, 0xCD, 0x0C, 0x56, 0xD7, 0x44, 0x2D, 
-0x8E, 0x1A, 0x47, 0x65, 0xC1, 0xA4, 0x7D, 0xAA, 0x78, 0x1B, 0xD7, 0x3D, 0xCF, 0x07, 0x9F, 0x4D, 
-0x7C, 0xFF, 0x6F, 0xB9, 0xC4, 0xF7, 0xFD, 0xA6, 0x8B, 0xBC, 0xFB, 0x6C, 0x4B, 0xB3, 0xF3, 0x3C, 
-0x9B, 0x69, 0x97, 0xAD, 0x91, 0xA1, 0xB1, 0x82, 0x4D, 0x01, 0xFC, 0x8C, 0x18, 0xD5, 0x8B, 0xBC, 
-0xB5, 0x96, 0xD6, 0x77, 0xAA, 0xEF, 0xCA, 0x2E, 0x3A, 0x16, 0x8E, 0x72, 0x74, 0xFB, 0xA2, 0x4E, 
-0xB9, 0x7E, 0x63, 0x63, 0xA8, 0x13, 0x1E, 0xD2, 0x57, 0xB1, 0x1A, 0xCB, 0x72, 0xE4, 0x93, 0xE3, 
-0x95, 0x33, 0x5A, 0x19, 0x50, 0x81, 0xE6, 0x70, 0x71, 0x24, 0x65, 0xF5, 0x42, 0x84, 0x2C, 0xD4, 
-0xD8, 0xD4, 0x52, 0x85, 0x87, 0x9C, 0xB4, 0xBB, 0x34, 0x93, 0x17, 0x38, 0x6B, 0x6F, 0xF0, 0xCF, 
-0x7F, 0xD3, 0x45, 0xFE, 0xC5, 0xEF, 0x7C, 0x27, 0x1F, 0x78, 0xC6, 0xB0, 0x99, 0x6E, 0xB2, 0x66, 
-0xF6, 0xA8, 0x64, 0x86, 0xB1, 0x11, 0xB1, 0x42, 0x24, 0xD0, 0x85, 0x8E, 0x18, 0x5B, 0xAC, 0x0B, 
-0xD9, 0x15, 0xAA, 0x2F, 0x3D, 0x0C, 0x89, 0x6A, 0x6F, 0xEF, 0x7D, 0x64, 0x36, 0xEB, 0x30, 0xC6, 
-0x61, 0x6D, 0x85, 0x13, 0x87, 0x13, 0x43, 0x95, 0x94, 0xE9, 0x9E, 0x5C, 0xB3, 0xD4, 0x66, 0x46, 
-0x2D, 0x89, 0xAA, 0xB2, 0x34, 0xC6, 0xE1, 0xC4, 0x21, 0xA4, 0xED, 0x17, 0x6F, 0x5C, 0xDB, 0xEA, 
-0x7D, 0xC8, 0x1B, 0x82, 0x57, 0xA3, 0x6E, 0x5F, 0x11, 0xEA, 0x7A, 0xC7, 0xA6, 0x28, 0x17, 0xAC, 
-0xAD, 0x2B, 0x50, 0x9B, 0xBB, 0x44, 0xC0, 0x3A, 0x38, 0x73, 0xF6, 0x24, 0xCD, 0xA8, 0x22, 0x79, 
-0xAF, 0x1E, 0x32, 0x44, 0xA7, 0x1E, 0xFD, 0xEA, 0xD6, 0x09, 0x7C, 0x8E, 0xEE, 0x9A, 0x94, 0xD5, 
-0x45, 0x13, 0xD0, 0x18, 0xA7, 0x1D, 0x9E, 0x4E, 0x83, 0xF0, 0x91, 0xD4, 0xA5, 0x5C, 0x78, 0x88, 
-0x0B, 0x37, 0x39, 0xD3, 0xDC, 0xE3, 0x43, 0x6F, 0x6D, 0xF8, 0x77, 0x7E, 0xF0, 0x23, 0xFC, 0x81, 
-0xDF, 0xF9, 0x8D, 0x6C, 0xA7, 0x9B, 0xC8, 0xC3, 0xE7, 0xD9, 0x72, 0x2D, 0x2E, 0xEE, 0x63, 0x62, 
-0x4B, 0x37, 0xD9, 0xA5, 0x9B, 0x4D, 0xF3, 0xBA, 0xA9, 0xEA, 0x94, 0x00, 0x2A, 0x57, 0x2F, 0xE9, 
-0x71, 0x0F, 0x22, 0xC7, 0x62, 0xFB, 0x2A, 0xBE, 0x8A, 0x7F, 0x86, 0x21, 0x99, 0xB1, 0x6B, 0xBC, 
-0x5E, 0x74, 0x83, 0x6E, 0x02, 0x49, 0x9E, 0x3A, 0xB5, 0xAC, 0x33, 0xA1, 0x9E, 0xDD, 0xC5, 0xEC, 
-0x3C, 0xCF, 0x85, 0xD1, 0x3D, 0xBE, 0xF3, 0x9B, 0x2E, 0xF3, 0x7B, 0xBF, 0xF7, 0xFD, 0x7C, 0xE7, 
-0x37, 0x3F, 0xCD, 0x89, 0xFA, 0x0E, 0x63, 0xF3, 0x80, 0x9A, 0x09, 0xCE, 0x05, 0xB5, 0xD3, 0x4D, 
-0x89, 0x10, 0x82, 0xAA, 0x15, 0x53, 0xC8, 0xBA, 0x97, 0x90, 0x23, 0x20, 0x1B, 0x52, 0xE7, 0xE9, 
-0xF6, 0x67, 0x74, 0xB3, 0x0E, 0x23, 0x0E, 0x23, 0x8E, 0x24, 0x16, 0x23, 0x95, 0xB2, 0xB2, 0x94, 
-0xD8, 0x5A, 0xAB, 0x18, 0x39, 0x08, 0xA9, 0xA5, 0xEB, 0x66, 0x18, 0x63, 0x88, 0x29, 0x32, 0xED, 
-0xDA, 0x13, 0xE3, 0xAA, 0x79, 0xC3, 0x37, 0x3F, 0xBC, 0xE1, 0x0C, 0xD7, 0xDA, 0xD6, 0x82, 0x39, 
-0x11, 0x63, 0x30, 0x29, 0x6F, 0x62, 0x50, 0x69, 0x52, 0x38, 0x77, 0xEE, 0x0C, 0x4D, 0x95, 0xF5, 
-0xDC, 0x51, 0x95, 0x5F, 0x12, 0x83, 0x46, 0x04, 0x35, 0x89, 0x24, 0xA2, 0x2B, 0x98, 0xA2, 0x94, 
-0x70, 0x24, 0x1C, 0x31, 0x25, 0x5C, 0x15, 0x08, 0xEC, 0xE3, 0xD1, 0x18, 0x67, 0x9E, 0x80, 0xE7, 
-0x21, 0x1B, 0xD5, 0x43, 0x9E, 0xDE, 0x9E, 0xF2, 0xCD, 0xEF, 0x1E, 0xF3, 0x83, 0xDF, 0xFE, 0x4E, 
-0xBE, 0xF6, 0x92, 0xB0, 0x35, 0xBD, 0xC9, 0x46, 0xD8, 0x65, 0xCB, 0x19, 0xF0, 0x1D, 0xBE, 0x9D, 
-0x51, 0x99, 0x44, 0x6D, 0x61, 0xAD, 0x71, 0x8C, 0x9B, 0x11, 0x4E, 0x0C, 0xC9, 0x07, 0x7C, 0xD2, 
-0xA8, 0xAE, 0x51, 0x16, 0xF2, 0x6C, 0x91, 0x00, 0x8A, 0xFE, 0xB6, 0x1F, 0x0C, 0xEF, 0xAB, 0xF8, 
-0x8D, 0x8D, 0xA2, 0xB3, 0xED, 0xEB, 0x6E, 0xFB, 0xD2, 0x67, 0x91, 0x68, 0x5F, 0x2D, 0xC9, 0xF6, 
-0x38, 0x78, 0x1C, 0xE9, 0xF7, 0x60, 0x5B, 0x5F, 0xC6, 0x82, 0xE9, 0x92, 0xAF, 0x48, 0x98, 0x04, 
-0x2E, 0x40, 0x98, 0xCC, 0x58, 0x93, 0xC0, 0xA6, 0x69, 0x09, 0xF7, 0xBF, 0xC4, 0x7A, 0x7C, 0x9E, 
-0x0F, 0xBF, 0xAB, 0xE6, 0xFB, 0xBF, 0xFD, 0x29, 0xBE, 0xE1, 0x5D, 0x15, 0x4F, 0x9D, 0xDC, 0xC5, 
-0xFA, 0x1B, 0xA4, 0xC9, 0x03, 0x5C, 0x4A, 0x58, 0xE3, 0x30, 0xAE, 0xCA, 0xD1, 0xAE, 0x55, 0x63, 
-0x2B, 0x04, 0x4C, 0x4C, 0x54, 0x62, 0xA0, 0x8B, 0xF8, 0x49, 0x47, 0x6A, 0x23, 0xC6, 0xE8, 0x1B, 
-0xC1, 0x92, 0xA4, 0x22, 0xA6, 0x8A, 0x84, 0x63, 0xB4, 0xBE, 0xC1, 0x68, 0x34, 0x9A, 0x2F, 0xEE, 
-0x59, 0xD1, 0x81, 0x40, 0x90, 0xAD, 0x84, 0xFB, 0x2A, 0xC3, 0x0D, 0x61, 0xBF, 0x8A, 0x49, 0x4E, 
-0xFA, 0x90, 0x24, 0xE5, 0xED, 0x7C, 0x56, 0x84, 0xB5, 0xB5, 0x11, 0xE7, 0xCE, 0x9E, 0x66, 0x6D, 
-0x7D, 0x4C, 0x5D, 0xD9, 0xAC, 0xD3, 0xD1, 0x91, 0x2F, 0xA5, 0xBC, 0xF1, 0x41, 0x72, 0xB5, 0x64, 
-0xDD, 0x8E, 0xFA, 0x7B, 0x17, 0x6D, 0x20, 0xA9, 0x23, 0xE1, 0x89, 0xE2, 0xB1, 0x55, 0x42, 0xD8, 
-0xA3, 0xE6, 0x2E, 0x17, 0x37, 0xF7, 0xF8, 0xBA, 0x37, 0x59, 0xFE, 0xF0, 0xBF, 0xF8, 0x5B, 0xF9, 
-0x8E, 0x0F, 0x9E, 0x63, 0xDB, 0xDF, 0x61, 0x1C, 0xEE, 0xD3, 0xC4, 0x19, 0xB1, 0x9D, 0x62, 0x44, 
-0xA8, 0xAA, 0x0A, 0x62, 0xD0, 0xAD, 0x88, 0xBE, 0xA3, 0xEB, 0x66, 0x84, 0xE8, 0xA9, 0xAA, 0x0A, 
-0xE7, 0x5C, 0xDE, 0x94, 0x61, 0x34, 0x58, 0x5E, 0x9E, 0x54, 0x7D, 0x15, 0x5F, 0xC5, 0x71, 0xF0, 
-0x38, 0xCC, 0xEE, 0xB5, 0xC0, 0xAB, 0xFD, 0x7E, 0x11, 0x95, 0x6E, 0x45, 0x54, 0xBA, 0x25, 0x0F, 
-0x32, 0x06, 0x4B, 0x63, 0x1D, 0x71, 0xD6, 0x61, 0xBA, 0x09, 0x9B, 0xB5, 0xA7, 0xEE, 0x6E, 0xB3, 
-0x65, 0x6E, 0xF0, 0x8D, 0xEF, 0xDA, 0xE0, 0x0F, 0xFD, 0x1F, 0x7F, 0x33, 0xDF, 0xF1, 0xE1, 0x4B, 
-0x3C, 0x73, 0xB2, 0x65, 0xCC, 0x6D, 0xAA, 0xB4, 0x47, 0x23, 0x20, 0xC9, 0x10, 0x7C, 0x66, 0xEE, 
-0x6E, 0x31, 0x14, 0xB9, 0xE4, 0x10, 0xEF, 0x88, 0x6D, 0xD0, 0x1D, 0x66, 0x62, 0x10, 0x11, 0xDD, 
-0xEA, 0x8B, 0xD3, 0x18, 0x6B, 0xC9, 0x50, 0xD7, 0x35, 0x75, 0xE3, 0xA8, 0x30, 0x58, 0x6B, 0xE6, 
-0xB3, 0xD2, 0xA6, 0x5A, 0x5B, 0xBF, 0x7F, 0xF7, 0xFE, 0x1B, 0x1E, 0x32, 0xFD, 0x0D, 0x67, 0xB8, 
-0x7F, 0xF5, 0xAF, 0xFE, 0xB7, 0x6B, 0x4D, 0xD3, 0x9C, 0xB4, 0xD6, 0x8A, 0xC9, 0xFB, 0xFF, 0x62, 
-0xD4, 0x91, 0xE9, 0xCD, 0xCF, 0x3E, 0x4D, 0x65, 0x1D, 0xB1, 0xCB, 0xEE, 0xDC, 0xAC, 0x64, 0x7B, 
-0xC0, 0x84, 0xA9, 0xA0, 0xC3, 0x13, 0x24, 0x21, 0x55, 0x4D, 0x97, 0x40, 0x4C, 0x8D, 0x50, 0x41, 
-0x52, 0xA7, 0x17, 0x10, 0x10, 0x17, 0x98, 0x76, 0xB7, 0x59, 0x73, 0x0F, 0xB8, 0xBC, 0x35, 0xE3, 
-0x9B, 0xDF, 0xBD, 0xC9, 0xEF, 0xFF, 0xAE, 0x0F, 0xF0, 0xE6, 0xF1, 0x2E, 0x1B, 0xD3, 0x6B, 0xAC, 
-0x85, 0x1D, 0xAA, 0xA8, 0xBE, 0x6B, 0xC5, 0x39, 0x82, 0x18, 0x42, 0xD6, 0x33, 0x3A, 0x03, 0x36, 
-0xBB, 0x80, 0x34, 0xC6, 0x90, 0x50, 0xE9, 0x5B, 0x56, 0xC4, 0x00, 0x4B, 0x49, 0xED, 0x1B, 0x5F, 
-0x2D, 0x0C, 0x9F, 0x3D, 0xC4, 0xF0, 0xFC, 0x90, 0x86, 0x1D, 0x6B, 0xD5, 0x33, 0x1E, 0x07, 0xC3, 
-0xE7, 0x0F, 0xF1, 0xA8, 0xF3, 0xAF, 0x17, 0x5E, 0xAD, 0x85, 0xA2, 0xE1, 0x37, 0x3C, 0xEE, 0x33, 
-0x0F, 0xB3, 0x46, 0x28, 0xE5, 0xF3, 0x4A, 0x25, 0xDA, 0xF2, 0x9D, 0x87, 0xD1, 0x61, 0x78, 0xC5, 
-0xF5, 0x33, 0x30, 0x24, 0x56, 0xDF, 0xC5, 0xAA, 0x06, 0x44, 0xE6, 0xAB, 0x1A, 0x59, 0xBE, 0x74, 
-0x18, 0x5B, 0x21, 0x62, 0xC1, 0x77, 0xD8, 0x30, 0xA5, 0xF6, 0x0F, 0x31, 0xFB, 0x2F, 0xF2, 0xF6, 
-0x73, 0x1D, 0x3F, 0xF0, 0x6D, 0x6F, 0xE5, 0x23, 0xEF, 0xDF, 0xE2, 0xA9, 0x8D, 0x87, 0xD4, 0xE1, 
-0x2A, 0xB6, 0x7B, 0x80, 0xF3, 0x09, 0xA8, 0x88, 0x52, 0x31, 0x09, 0x89, 0x48, 0x45, 0xA2, 0x46, 
-0xE2, 0x88, 0x91, 0x5D, 0xA7, 0xDB, 0x0B, 0x54, 0x38, 0x1C, 0x50, 0x1B, 0x43, 0xDE, 0xDF, 0x90, 
-0xA1, 0x4C, 0x5F, 0x77, 0x9B, 0x45, 0x24, 0x05, 0x7C, 0xF4, 0x54, 0xAE, 0x21, 0x45, 0x6C, 0x12, 
-0x79, 0xC3, 0x63, 0x9B, 0xBD, 0x92, 0x3A, 0x7F, 0x55, 0xF0, 0x60, 0xC2, 0xC9, 0xB6, 0xF5, 0x67, 
-0x8A, 0xEE, 0x26, 0xA5, 0x44, 0x88, 0x1D, 0xD6, 0x0A, 0x6B, 0x6B, 0x63, 0x2A, 0xA3, 0xA6, 0x5F, 
-0x06, 0x01, 0x49, 0xC4, 0xD4, 0x12, 0xE9, 0x30, 0x2E, 0x51, 0x35, 0x15, 0xAE, 0x71, 0xEA, 0x69, 
-0xDE, 0x98, 0xBC, 0x3B, 0x45, 0x19, 0x64, 0x68, 0x27, 0x88, 0x4D, 0x38, 0xF6, 0xD8, 0x70, 0x3B, 
-0x9C, 0x68, 0x6E, 0xF3, 0xAD, 0xEF, 0x3B, 0xC1, 0xBF, 0xF6, 0xFD, 0x1F, 0xE6, 0x43, 0xCF, 0x8E, 
-0xD9, 0xF4, 0xB7, 0x18, 0xF9, 0x1D, 0x6C, 0x9A, 0xAA, 0x24, 0x4C, 0xC8, 0x51, 0x47, 0x55, 0xF7, 
-0x2A, 0x26, 0x3D, 0x91, 0xC5, 0x41, 0xCA, 0x16, 0x13, 0x6F, 0x34, 0x4A, 0x1E, 0xFA, 0x1D, 0xEC, 
-0xB5, 0x62, 0x88, 0xAF, 0xF6, 0xF3, 0x5E, 0x09, 0xBE, 0x92, 0xF2, 0xF2, 0x1B, 0x01, 0x07, 0x99, 
-0xBB, 0xF6, 0x99, 0x94, 0x92, 0xDA, 0xC8, 0x27, 0xD1, 0x19, 0x61, 0x76, 0x3A, 0x63, 0xBB, 0x19, 
-0xF5, 0x74, 0x87, 0xF5, 0xEE, 0x36, 0x6F, 0x39, 0xD5, 0xF2, 0xBB, 0xBE, 0xFD, 0x6D, 0x7C, 0xDF, 
-0x6F, 0x7D, 0x13, 0x4F, 0xAD, 0x4F, 0x18, 0x71, 0x87, 0xB1, 0x0D, 0x34, 0x06, 0xB0, 0x16, 0xAC, 
-0xCE, 0x5A, 0x2D, 0x15, 0x8D, 0xDB, 0xC4, 0xF8, 0x11, 0x74, 0x15, 0x12, 0x0C, 0x36, 0x81, 0xA4, 
-0x0E, 0x09, 0x1D, 0x12, 0x5A, 0x08, 0x1E, 0x1B, 0x22, 0xB5, 0x44, 0x46, 0xCE, 0x10, 0x99, 0x22, 
-0x92, 0xB0, 0x22, 0x74, 0xBE, 0x23, 0x06, 0xB1, 0x6B, 0xE3, 0xF5, 0xAF, 0x2E, 0x9A, 0xCD, 0x76, 
-0xF6, 0x37, 0x62, 0xE7, 0x37, 0x52, 0x12, 0x44, 0x2C, 0x92, 0x22, 0x04, 0x4F, 0xDD, 0x18, 0xB6, 
-0xB7, 0x37, 0x71, 0x95, 0xDA, 0xE6, 0x96, 0x8A, 0x8D, 0x51, 0x47, 0xD2, 0x99, 0x6F, 0x69, 0xBB, 
-0x7D, 0xBC, 0x6F, 0xF1, 0xDD, 0x8C, 0xF5, 0x71, 0xC3, 0xC6, 0xB8, 0xA6, 0xA1, 0xC3, 0xA6, 0x19, 
-0xE3, 0x7A, 0x1D, 0xC2, 0x8C, 0xB1, 0x3C, 0xE4, 0x44, 0x75, 0x93, 0xDF, 0xFE, 0xF5, 0xE7, 0xF8, 
-0x3D, 0xBF, 0xED, 0x1D, 0x5C, 0x34, 0x77, 0xD8, 0x9A, 0xDD, 0x61, 0xDC, 0xED, 0x63, 0x43, 0xAB, 
-0x36, 0xBF, 0xA2, 0x21, 0xD1, 0xA3, 0x51, 0x86, 0x3D, 0x7F, 0x57, 0xDE, 0x12, 0xDC, 0x87, 0xC9, 
-0x1B, 0x1C, 0x6C, 0x0E, 0x25, 0xB2, 0x68, 0x70, 0xE5, 0x9E, 0xB2, 0x5B, 0xE7, 0x8D, 0x85, 0x41, 
-0x2D, 0x3B, 0xFA, 0xFA, 0xC1, 0xC7, 0xA1, 0x57, 0x8A, 0xE1, 0xF3, 0x1E, 0x97, 0x5E, 0x09, 0xFA, 
-0x12, 0xE4, 0x93, 0xD2, 0x6B, 0x85, 0xE3, 0x3F, 0x7F, 0xB8, 0xF3, 0xED, 0x71, 0xE9, 0x95, 0x42, 
-0xFB, 0x42, 0xA1, 0xB9, 0x2E, 0xB7, 0x10, 0x80, 0x2C, 0x76, 0xD2, 0xF5, 0xA1, 0x3A, 0x5F, 0x08, 
-0x46, 0xFB, 0x56, 0x10, 0x83, 0x4F, 0x15, 0x31, 0x54, 0xA4, 0xD6, 0x61, 0x5B, 0xC1, 0xEE, 0xEF, 
-0xD0, 0xB4, 0x37, 0x79, 0xFF, 0x33, 0x86, 0xEF, 0xF9, 0x96, 0x8B, 0xFC, 0xD6, 0x0F, 0x9D, 0xE6, 
-0xFC, 0xF8, 0x21, 0x29, 0x5C, 0xA1, 0x8E, 0x13, 0x08, 0x53, 0x52, 0xF4, 0x6A, 0x16, 0xE6, 0x2D, 
-0x36, 0x8C, 0x68, 0x77, 0x21, 0xCE, 0x0C, 0x8D, 0x19, 0xE9, 0x0C, 0x22, 0x7A, 0x24, 0xB4, 0x48, 
-0x9C, 0xE1, 0x7C, 0x47, 0x1D, 0x5B, 0xD6, 0x88, 0x6C, 0x55, 0x42, 0x0D, 0xEA, 0xBE, 0x55, 0x04, 
-0xD4, 0x3F, 0x99, 0x84, 0x36, 0x6E, 0x2F, 0xE7, 0xF4, 0xF5, 0xC7, 0xF1, 0xEA, 0xFE, 0x35, 0x84, 
-0x27, 0xAD, 0x83, 0x59, 0x2B, 0x53, 0x21, 0x63, 0x0C, 0x98, 0x44, 0xDD, 0x58, 0x4E, 0x9C, 0x5C, 
-0xC3, 0x19, 0x21, 0x46, 0x0F, 0x92, 0x1D, 0x12, 0x27, 0xAD, 0x60, 0x6B, 0x05, 0x6B, 0x85, 0xCA, 
-0x0A, 0x95, 0x24, 0xC6, 0x2E, 0x32, 0x32, 0x2D, 0x8E, 0x5D, 0xD6, 0xCD, 0x94, 0x71, 0xD8, 0xE1, 
-0x94, 0x99, 0xB0, 0xE1, 0xAF, 0xF1, 0xDB, 0x3E, 0x78, 0x91, 0x7F, 0xE5, 0xA3, 0xDF, 0xC8, 0x7B, 
-0x9F, 0xAA, 0x18, 0xCD, 0x6E, 0x11, 0x77, 0x6F, 0x20, 0xD1, 0x6B, 0x45, 0xA4, 0xD2, 0x98, 0xB4, 
-0xA1, 0xAA, 0xFE, 0xA9, 0xC8, 0xC9, 0x5A, 0x3C, 0x65, 0x73, 0xC3, 0xA3, 0x25, 0xC4, 0x9C, 0xBF, 
-0xC4, 0x0A, 0x6F, 0x65, 0xAF, 0x3F, 0x0E, 0x4A, 0x1F, 0xAF, 0x2E, 0x8E, 0x2E, 0x8B, 0xAF, 0xE2, 
-0x9F, 0x65, 0x3C, 0xB2, 0x6D, 0x49, 0x2F, 0x9C, 0x92, 0x88, 0xFA, 0x2D, 0x49, 0x35, 0x26, 0x56, 
-0x48, 0x10, 0xC6, 0x92, 0x60, 0xFF, 0x0E, 0x76, 0x7A, 0x95, 0xB7, 0x9C, 0xF3, 0x7C, 0xFF, 0xB7, 
-0xBF, 0x8B, 0xDF, 0xFE, 0x9B, 0x9E, 0xE1, 0xB2, 0xD9, 0x63, 0x8D, 0x5B, 0xAC, 0xC9, 0x43, 0xD6, 
-0xED, 0x94, 0x0D, 0x60, 0x5D, 0x0C, 0x32, 0x09, 0xEC, 0xDD, 0xDD, 0x27, 0xEE, 0x43, 0x63, 0xD7, 
-0xB2, 0x1F, 0x6C, 0x5D, 0x40, 0xB7, 0x31, 0x62, 0x63, 0xC4, 0x85, 0x48, 0x43, 0x60, 0xCD, 0x59, 
-0x46, 0x62, 0x09, 0xB1, 0x05, 0x22, 0x4E, 0x1C, 0x06, 0x63, 0x26, 0xD3, 0xD9, 0xE9, 0x8F, 0x7F, 
-0xFC, 0x13, 0xF5, 0x30, 0xAB, 0xAF, 0x27, 0xDE, 0x70, 0xAE, 0x10, 0x83, 0x5D, 0xB3, 0xAE, 0x1E, 
-0x59, 0xB3, 0xD8, 0x04, 0x22, 0x92, 0x68, 0x46, 0xA2, 0x5E, 0xC2, 0x44, 0x7D, 0xDE, 0x92, 0x4C, 
-0xDE, 0xE0, 0x20, 0x10, 0x04, 0x89, 0x82, 0x11, 0xA1, 0x71, 0x86, 0xB5, 0x0A, 0x46, 0x69, 0xCA, 
-0xBA, 0x99, 0xB0, 0xCE, 0x0E, 0xA7, 0xAA, 0x1D, 0x9A, 0xF0, 0x22, 0xE7, 0xCD, 0x2D, 0xBE, 0xE7, 
-0x1B, 0x9E, 0xE6, 0x63, 0xBF, 0xF5, 0x9D, 0x3C, 0xBB, 0xBE, 0x43, 0x33, 0xB9, 0xCA, 0x89, 0x91, 
-0xA7, 0x2E, 0x0B, 0x9C, 0xA8, 0x93, 0x19, 0x40, 0x6D, 0xFD, 0x88, 0x59, 0x67, 0xAB, 0x4A, 0x0C, 
-0x5D, 0x90, 0x5B, 0x2E, 0xA2, 0xB2, 0x12, 0x5B, 0xA8, 0x60, 0x59, 0x1E, 0x78, 0xE5, 0xC5, 0x3A, 
-0xD4, 0xC9, 0xF5, 0x99, 0xFD, 0x71, 0x98, 0xDC, 0xF0, 0xFE, 0x21, 0xBD, 0x52, 0x1C, 0x27, 0x0F, 
-0xAF, 0x04, 0xC3, 0xFC, 0x0E, 0xE9, 0x9F, 0x55, 0x1C, 0xA6, 0xFB, 0x1D, 0x62, 0xD8, 0x1E, 0x86, 
-0xF4, 0xEA, 0xA0, 0x2F, 0x31, 0x2F, 0x4B, 0xBA, 0x73, 0x9A, 0x6B, 0x6D, 0xF3, 0x95, 0xB9, 0x6A, 
-0x8A, 0xE0, 0x02, 0x64, 0xBB, 0xF4, 0x45, 0x4F, 0xB3, 0x18, 0x24, 0x24, 0x9A, 0x18, 0xB1, 0xED, 
-0x0E, 0x66, 0xFF, 0x26, 0xEF, 0xB8, 0xE4, 0xF8, 0x9D, 0x1F, 0x79, 0x1B, 0xDF, 0xF9, 0xE1, 0x0B, 
-0x5C, 0xAE, 0x6F, 0x71, 0x32, 0x5E, 0x65, 0xA3, 0xBD, 0xC1, 0x26, 0xF7, 0x38, 0x21, 0x1E, 0xB7, 
-0x3F, 0x85, 0xBD, 0x8E, 0x2A, 0x54, 0x98, 0xE8, 0xF2, 0x53, 0x13, 0x11, 0xB5, 0x58, 0x12, 0x22, 
-0x26, 0x06, 0x9A, 0x94, 0x18, 0x5B, 0x30, 0xB2, 0x88, 0xC0, 0x6D, 0x8D, 0xC1, 0x1A, 0x8B, 0xB5, 
-0xEE, 0xE4, 0xAD, 0x5B, 0x9F, 0xFE, 0x0D, 0xCE, 0x70, 0x63, 0x58, 0x13, 0xB1, 0x8D, 0xCE, 0x80, 
-0x4B, 0x43, 0x49, 0x34, 0x8D, 0x63, 0x34, 0xB6, 0x84, 0x7E, 0x6C, 0xB0, 0x64, 0x20, 0x39, 0x52, 
-0xB2, 0x44, 0x1F, 0x09, 0xD3, 0x16, 0x3F, 0x9D, 0x50, 0xE3, 0xD9, 0xA8, 0x02, 0x97, 0x4E, 0x35, 
-0x6C, 0x59, 0x60, 0x76, 0x93, 0x37, 0x8D, 0xF7, 0xF8, 0x96, 0x77, 0x6F, 0xF2, 0xFB, 0xBF, 0xFB, 
-0xEB, 0x78, 0xEF, 0xA5, 0x8A, 0xE9, 0xF5, 0xCF, 0x61, 0x66, 0x77, 0x49, 0x61, 0x4A, 0x17, 0x5A, 
-0x7D, 0x77, 0xFE, 0x7C, 0x93, 0xC0, 0x44, 0xB0, 0x51, 0x57, 0x49, 0xB5, 0x32, 0x65, 0x9E, 0xEA, 
-0xFF, 0xAB, 0xD1, 0x3F, 0x13, 0x05, 0x92, 0xB1, 0xA4, 0xEC, 0xB4, 0xE4, 0x2B, 0x01, 0xFF, 0x2C, 
-0x33, 0xA7, 0xAF, 0xE2, 0xB5, 0x42, 0x7A, 0x45, 0x6A, 0x09, 0x11, 0x15, 0x88, 0x88, 0xBA, 0x29, 
-0x49, 0x92, 0x5A, 0xFC, 0x48, 0xEA, 0x20, 0x79, 0x48, 0x91, 0xE8, 0x3D, 0xBE, 0x9B, 0xD1, 0x18, 
-0xA1, 0xEA, 0x26, 0x98, 0xFD, 0x1B, 0xBC, 0xF5, 0xAC, 0xE1, 0x7B, 0xBE, 0xF5, 0x4D, 0x7C, 0xE4, 
-0x6B, 0x4F, 0x71, 0xDE, 0xDE, 0x63, 0x9B, 0x5B, 0x6C, 0xF1, 0x80, 0x73, 0xD6, 0x23, 0x3B, 0x0F, 
-0xA9, 0xDA, 0xC8, 0x9A, 0x5D, 0x83, 0xA0, 0xD6, 0xF8, 0x09, 0x43, 0x10, 0xF5, 0x5B, 0x12, 0x93, 
-0x5A, 0x2C, 0x18, 0x84, 0xDA, 0x3A, 0x62, 0xF4, 0x54, 0xC6, 0xA9, 0x4F, 0x95, 0xE0, 0x09, 0x31, 
-0x1A, 0x67, 0xDD, 0x66, 0x55, 0xF1, 0x86, 0xFA, 0x53, 0x78, 0xC3, 0x19, 0xAE, 0xEF, 0x66, 0xEB, 
-0x31, 0x46, 0x4B, 0x4A, 0x6A, 0x6B, 0x0B, 0x24, 0x02, 0xF5, 0x9A, 0xC3, 0x8D, 0x8C, 0x7A, 0x25, 
-0x12, 0x51, 0x66, 0x1B, 0x50, 0x37, 0x6E, 0xC1, 0x30, 0x6E, 0xD6, 0x68, 0xAA, 0x5A, 0xC3, 0xA5, 
-0xC7, 0x96, 0x71, 0xE5, 0x79, 0xFF, 0x3B, 0x2E, 0xF1, 0xA1, 0xF7, 0x9C, 0xE6, 0x03, 0x6F, 0x1A, 
-0xF3, 0x3B, 0x3E, 0x7C, 0x99, 0x1F, 0xFC, 0xCE, 0xAF, 0xE1, 0xCD, 0x5B, 0x53, 0xB6, 0xD3, 0x3D, 
-0xCE, 0xAC, 0x57, 0x98, 0xD8, 0x62, 0xD6, 0x1A, 0x82, 0x33, 0xB4, 0xA2, 0x6E, 0x1D, 0x6D, 0x82, 
-0x2A, 0x42, 0x1D, 0x0C, 0x2E, 0x3A, 0x24, 0x1A, 0x62, 0x2A, 0x36, 0xBD, 0x3D, 0xB5, 0xC2, 0x7C, 
-0x30, 0xC8, 0x3B, 0x5F, 0xE6, 0x11, 0x66, 0xFB, 0x0D, 0x53, 0x37, 0x60, 0x7C, 0x25, 0xA8, 0x13, 
-0x0A, 0x5E, 0x3D, 0x69, 0xE7, 0xF8, 0x78, 0x3D, 0xDE, 0xF9, 0xEB, 0x6D, 0x20, 0x31, 0x8F, 0xE8, 
-0x6C, 0xC7, 0x95, 0x6C, 0x5F, 0x2F, 0x68, 0x7E, 0x0F, 0x32, 0xDD, 0xC5, 0x2C, 0x2E, 0xCF, 0xF1, 
-0x86, 0x5E, 0xD0, 0x72, 0xBD, 0x18, 0x2A, 0x6C, 0x34, 0xD8, 0x68, 0xB4, 0x5F, 0xA7, 0x19, 0x30, 
-0x05, 0x99, 0x80, 0xCC, 0x10, 0xAB, 0xC1, 0x5F, 0x6D, 0x6A, 0x18, 0x57, 0x6B, 0x34, 0xC9, 0x33, 
-0xF2, 0x77, 0x79, 0xFF, 0x5B, 0x1C, 0xDF, 0xFF, 0x6D, 0x6F, 0xE6, 0xFB, 0xBE, 0xE9, 0x12, 0xDF, 
-0xFE, 0xCE, 0xF3, 0xFC, 0xE6, 0xCB, 0xA7, 0xF9, 0xBA, 0x67, 0xCE, 0xB3, 0xDE, 0xCD, 0xA8, 0x67, 
-0x1D, 0xB5, 0xB1, 0xC4, 0x60, 0x00, 0x87, 0x17, 0x08, 0x22, 0x04, 0x71, 0x04, 0x71, 0x24, 0x2C, 
-0x46, 0x6A, 0x2A, 0xD7, 0x50, 0x19, 0xAB, 0xB6, 0xF3, 0xB9, 0x2D, 0x26, 0x84, 0xCE, 0xC7, 0xCD, 
-0xC9, 0xE4, 0x37, 0x3A, 0xC3, 0x6D, 0xE3, 0x7A, 0x4A, 0xD1, 0x92, 0x3B, 0x91, 0xC9, 0x3A, 0x1F, 
-0x57, 0x3B, 0xC4, 0x18, 0x02, 0x09, 0xB1, 0xC5, 0xFB, 0x96, 0xDA, 0xD8, 0x46, 0x12, 0x6D, 0xEB, 
-0xE7, 0x7B, 0xA9, 0x4D, 0x9C, 0xB2, 0x66, 0x5B, 0xBE, 0xE1, 0x3D, 0x97, 0xF9, 0x7D, 0xDF, 0xF7, 
-0x61, 0xFE, 0xD8, 0xEF, 0xFF, 0xED, 0xFC, 0xDE, 0xEF, 0xF9, 0x00, 0xEF, 0xBA, 0x00, 0xEB, 0xF1, 
-0x36, 0x61, 0xE7, 0x26, 0x23, 0x09, 0x34, 0xD6, 0xB0, 0x73, 0xF7, 0x8E, 0xDA, 0xD9, 0x82, 0xEA, 
-0x6C, 0x63, 0x66, 0xF4, 0x51, 0x48, 0x31, 0x5B, 0x19, 0xC4, 0x12, 0x22, 0xA7, 0xEC, 0x69, 0x33, 
-0x90, 0x16, 0xC7, 0x0A, 0x53, 0x2D, 0x1E, 0xCB, 0xE6, 0xD7, 0x94, 0xD1, 0xDD, 0xE4, 0x7D, 0xE5, 
-0x6F, 0x20, 0xFA, 0x53, 0xCB, 0xD7, 0x66, 0xBA, 0xB9, 0x1A, 0xAF, 0xD6, 0xF3, 0x8F, 0xD3, 0x30, 
-0xBF, 0x92, 0x99, 0x6E, 0x61, 0xB0, 0x43, 0x46, 0x5B, 0xDA, 0x45, 0x3F, 0x5D, 0xD5, 0x56, 0x56, 
-0x1D, 0x7B, 0x1C, 0xBC, 0x3A, 0x9B, 0x6F, 0x4C, 0x99, 0x03, 0x2E, 0x6C, 0x6C, 0x87, 0xD4, 0xDB, 
-0xD4, 0x61, 0xB2, 0x97, 0x31, 0x92, 0x51, 0xC6, 0x2B, 0x76, 0xE9, 0x5E, 0x88, 0x20, 0x1E, 0xC4, 
-0x13, 0x42, 0xA0, 0xA9, 0xC7, 0xF8, 0xD6, 0x13, 0x27, 0x33, 0x1A, 0x02, 0x4C, 0xEF, 0xB0, 0xC1, 
-0x7D, 0xDE, 0x7D, 0xA9, 0xE2, 0x0F, 0xFC, 0xAE, 0x6F, 0xE5, 0x5F, 0xFA, 0x9E, 0xAF, 0xE7, 0x07, 
-0x7E, 0xEB, 0xFB, 0xF9, 0xE6, 0xF7, 0x3E, 0xCB, 0x89, 0xCA, 0x22, 0x5D, 0xA7, 0x5B, 0x7C, 0xA3, 
-0x32, 0xDA, 0x88, 0xCB, 0xCC, 0x5C, 0x9D, 0xE7, 0x90, 0x02, 0x56, 0x84, 0x5A, 0x2A, 0x6A, 0x53, 
-0xA9, 0xB3, 0xF2, 0xD8, 0x51, 0xD5, 0x0E, 0xE7, 0x2A, 0x99, 0xCD, 0xDA, 0xB5, 0xB4, 0xD7, 0xBD, 
-0xA1, 0x0E, 0x6C, 0x8E, 0xD3, 0xAE, 0x5F, 0x53, 0x88, 0x98, 0xED, 0x14, 0xA3, 0x38, 0x71, 0x38, 
-0x93, 0x1D, 0x07, 0x87, 0x8E, 0xF1, 0xDA, 0x3A, 0xE3, 0x8D, 0x4D, 0xF5, 0xEE, 0x1E, 0x23, 0xC9, 
-0x24, 0x70, 0x11, 0x4F, 0xD0, 0xCD, 0xBA, 0x02, 0x21, 0x24, 0x90, 0x48, 0x4A, 0x53, 0x64, 0x76, 
-0x93, 0x93, 0xF6, 0x2E, 0xEF, 0x3F, 0x3B, 0xE5, 0x3D, 0x27, 0x76, 0x39, 0x67, 0x6E, 0xB2, 0xCD, 
-0x5D, 0xEA, 0xB8, 0xC7, 0x46, 0x63, 0x49, 0x3E, 0x20, 0xC9, 0x30, 0xAA, 0x1A, 0x92, 0x57, 0x7F, 
-0x0B, 0x42, 0x24, 0x19, 0x0D, 0xC7, 0x9C, 0x8C, 0x51, 0xFF, 0xA5, 0x26, 0x61, 0x24, 0x60, 0x88, 
-0xD8, 0xA4, 0xBB, 0xC6, 0x4C, 0x36, 0xE4, 0x16, 0xD1, 0x00, 0x97, 0xC9, 0x2C, 0x08, 0x54, 0xFA, 
-0x96, 0x7C, 0x9D, 0xA4, 0x80, 0x09, 0xDA, 0xC2, 0x8A, 0x76, 0x6B, 0x99, 0x0E, 0x76, 0xC6, 0xD7, 
-0x82, 0x96, 0xCB, 0xF8, 0x70, 0xFD, 0xE7, 0x61, 0xE7, 0x34, 0x0E, 0xD5, 0x82, 0x86, 0xCF, 0x3F, 
-0x8C, 0xCA, 0xF5, 0x39, 0xD0, 0xDC, 0xA1, 0xA4, 0x53, 0xCC, 0xD5, 0x04, 0x6A, 0xEB, 0x7C, 0xD4, 
-0x7B, 0x75, 0xAA, 0x7A, 0xB8, 0x35, 0xC2, 0x70, 0x90, 0x19, 0xD2, 0xA3, 0x30, 0x7C, 0xF7, 0xF0, 
-0x5D, 0x87, 0x95, 0x4D, 0xC9, 0x57, 0x9F, 0x11, 0x3D, 0x2E, 0x15, 0x0C, 0xD7, 0x0B, 0xB2, 0x8B, 
-0xDD, 0x47, 0x92, 0x56, 0xA3, 0xBA, 0x4F, 0x7C, 0x32, 0x62, 0xEE, 0x9E, 0x51, 0x5D, 0x34, 0xAA, 
-0xE3, 0x28, 0x93, 0x4A, 0xE8, 0x73, 0x96, 0xAE, 0x55, 0x52, 0x5F, 0xD5, 0x85, 0x0A, 0x92, 0xE8, 
-0x4E, 0x30, 0x41, 0xA9, 0xCC, 0x1C, 0xC1, 0x40, 0x54, 0x87, 0xE2, 0x95, 0x11, 0xAA, 0xD0, 0xB1, 
-0x61, 0x12, 0x66, 0xFF, 0x21, 0x6B, 0xF1, 0x01, 0x27, 0x9B, 0xBB, 0xBC, 0xE3, 0x42, 0xE4, 0xAD, 
-0xA7, 0x3C, 0xDB, 0xE1, 0x1E, 0xAE, 0xDB, 0x07, 0x9F, 0x9D, 0x98, 0x1B, 0x21, 0x60, 0x31, 0xE2, 
-0xA8, 0x13, 0x54, 0xA1, 0xA5, 0xA6, 0xC5, 0xA5, 0x19, 0x2E, 0x7A, 0xC6, 0x62, 0x31, 0x3E, 0x30, 
-0x32, 0x8E, 0x24, 0x89, 0x59, 0xEA, 0xE8, 0x52, 0x94, 0x7A, 0x34, 0x1E, 0x85, 0x24, 0xBF, 0x71, 
-0x75, 0xB8, 0x1F, 0xFF, 0xF8, 0xC7, 0xCD, 0xED, 0xDB, 0xF7, 0xB6, 0x0D, 0x95, 0xA4, 0x94, 0xE8, 
-0x3A, 0xDD, 0x80, 0x60, 0xAB, 0x86, 0xB5, 0xD1, 0x26, 0x8D, 0x6B, 0xA8, 0x4C, 0xAD, 0xCC, 0x2E, 
-0xAB, 0x1B, 0x04, 0xDD, 0x61, 0x42, 0xB2, 0x2A, 0x61, 0xE6, 0x8A, 0x36, 0xCC, 0xA8, 0xE3, 0x43, 
-0xD6, 0xFC, 0x03, 0xD6, 0xC3, 0x5D, 0xC6, 0x71, 0x17, 0xC7, 0x3E, 0x15, 0x1D, 0xA6, 0x44, 0xB4, 
-0x37, 0xBA, 0xD0, 0x86, 0xA8, 0x92, 0x3D, 0xE5, 0xD6, 0x1D, 0x74, 0x3D, 0x8E, 0x60, 0x92, 0x32, 
-0x70, 0x29, 0x3E, 0x3F, 0x8B, 0x9B, 0x45, 0x9D, 0x5A, 0x25, 0x80, 0x94, 0x3D, 0xEE, 0x26, 0x43, 
-0xCC, 0x8B, 0x79, 0xF3, 0xF0, 0xCD, 0xE5, 0x7A, 0x89, 0x20, 0x8B, 0x2D, 0xC0, 0xCB, 0xA4, 0x8E, 
-0xA0, 0xFB, 0xCB, 0x11, 0x47, 0x11, 0x39, 0x34, 0xFA, 0x22, 0x17, 0xC7, 0x4B, 0x5F, 0x2D, 0xE2, 
-0x09, 0xDE, 0x0F, 0xCB, 0xD3, 0xCC, 0xC7, 0x25, 0x32, 0xC3, 0x1C, 0xBE, 0xB7, 0x6C, 0x48, 0x19, 
-0x1E, 0x7F, 0xCD, 0xD2, 0x5C, 0xAF, 0x47, 0xA5, 0x29, 0xA5, 0x03, 0xC7, 0x57, 0x3C, 0x69, 0x9E, 
-0xEA, 0xF7, 0x2D, 0xA7, 0x49, 0x96, 0x53, 0x88, 0x20, 0x1A, 0xFD, 0xAB, 0x4F, 0x31, 0x1D, 0x3C, 
-0xB6, 0x8A, 0x0A, 0x0E, 0xB6, 0xBD, 0xE3, 0xD3, 0xE2, 0x79, 0x02, 0xA4, 0x9C, 0xAF, 0xFE, 0xD3, 
-0x73, 0x3B, 0xEF, 0xA7, 0x3D, 0x44, 0x89, 0x04, 0xA3, 0xC7, 0xF5, 0xDE, 0x32, 0x4B, 0x55, 0x96, 
-0x23, 0x22, 0x44, 0xC9, 0xAB, 0x28, 0x12, 0xB0, 0x29, 0x61, 0x25, 0x52, 0x11, 0x71, 0x69, 0x46, 
-0x15, 0xEE, 0xB3, 0xC6, 0x3D, 0x9A, 0xF8, 0x80, 0x34, 0xB9, 0x43, 0x95, 0x02, 0x75, 0x65, 0xE9, 
-0xBA, 0x99, 0xF6, 0xAD, 0x18, 0xB5, 0x3D, 0xC4, 0x22, 0x18, 0x79, 0x9C, 0x49, 0x54, 0x02, 0xB5, 
-0x11, 0x2A, 0xCC, 0x9C, 0x67, 0x04, 0x12, 0x3E, 0x45, 0xF6, 0xA7, 0xB3, 0xEA, 0x85, 0x17, 0x5F, 
-0x5C, 0x04, 0x1C, 0x7C, 0x03, 0xF0, 0x86, 0x32, 0x5C, 0xC0, 0x4D, 0xF7, 0xA7, 0x1B, 0xCE, 0xD6, 
-0x26, 0x66, 0xA9, 0x30, 0xC6, 0x88, 0x49, 0x86, 0x13, 0xE3, 0x2D, 0xD6, 0xCD, 0x98, 0x3A, 0xD5, 
-0xD8, 0x60, 0x91, 0xE8, 0x20, 0x38, 0x6A, 0x6A, 0xEA, 0x54, 0x63, 0x82, 0xC5, 0x04, 0x83, 0x51, 
-0xDE, 0x96, 0x49, 0x47, 0xE1, 0x94, 0x04, 0x50, 0xC6, 0x96, 0x24, 0x65, 0xBF, 0x0B, 0xDA, 0x31, 
-0x56, 0xFD, 0x1E, 0xA6, 0x21, 0x33, 0xE3, 0x28, 0x49, 0xB7, 0x0F, 0x0F, 0xD2, 0x50, 0x5C, 0x27, 
-0x1F, 0x72, 0x3E, 0x89, 0x3E, 0xFF, 0x68, 0x52, 0xC6, 0xFE, 0x28, 0xD2, 0x3C, 0x3D, 0x7E, 0x7A, 
-0x5C, 0x8A, 0x84, 0x95, 0xFF, 0xCF, 0x8F, 0x3D, 0x41, 0xAA, 0x74, 0xB0, 0x13, 0x3F, 0x1E, 0x69, 
-0x7E, 0x42, 0x0E, 0xCD, 0x12, 0x72, 0xDE, 0x56, 0xBD, 0xEF, 0xB5, 0x4B, 0x0F, 0xB6, 0x8D, 0x7E, 
-0x1A, 0x7B, 0x6D, 0x6C, 0xE9, 0xB8, 0x24, 0x82, 0xD1, 0xDF, 0x29, 0x1F, 0x7F, 0x9C, 0x34, 0x98, 
-0x44, 0xF6, 0x3A, 0xFA, 0x44, 0x14, 0x8C, 0xD2, 0x70, 0x20, 0x7B, 0x1C, 0xD2, 0x67, 0xE4, 0xBC, 
-0x2C, 0xA5, 0x3D, 0xCA, 0x4C, 0x75, 0x29, 0xCD, 0x74, 0xB0, 0x2C, 0x35, 0xED, 0x53, 0x92, 0x3C, 
-0x73, 0x35, 0xA5, 0x4F, 0xEA, 0x71, 0x11, 0x20, 0x75, 0x54, 0x06, 0x1A, 0x0B, 0xD1, 0xCF, 0x30, 
-0x04, 0x2A, 0x6B, 0x0F, 0xC4, 0x33, 0xA4, 0x0C, 0x67, 0x46, 0xD5, 0x8D, 0x92, 0xBD, 0x0D, 0x1A, 
-0x0C, 0x9E, 0xBC, 0xFE, 0x13, 0xA2, 0x9A, 0x9B, 0xA6, 0x58, 0xDF, 0xB9, 0x79, 0x6B, 0x3B, 0x29, 
-0x83, 0x78, 0x43, 0xF0, 0x86, 0x32, 0xDC, 0x87, 0x0F, 0xB7, 0x6C, 0x55, 0xD5, 0xE3, 0x94, 0xA2, 
-0xC4, 0x14, 0x71, 0x56, 0xD5, 0x2B, 0x29, 0x44, 0x36, 0xC7, 0x6B, 0xD4, 0x52, 0x61, 0x62, 0x1E, 
-0x22, 0xA3, 0x4E, 0x43, 0xAC, 0xA8, 0x59, 0x09, 0xB1, 0x37, 0x3D, 0x2C, 0x14, 0x13, 0x29, 0x65, 
-0xBD, 0x2C, 0x3A, 0xCD, 0x29, 0xA9, 0x88, 0xBA, 0x74, 0x14, 0x91, 0xA5, 0xE3, 0xFD, 0x54, 0xF2, 
-0x2E, 0x31, 0x83, 0xBE, 0xD3, 0xE4, 0x7A, 0x29, 0xA9, 0x44, 0x95, 0xBC, 0x86, 0xC7, 0x87, 0x29, 
-0xFD, 0xFA, 0x1C, 0xB6, 0xE4, 0x42, 0x73, 0xF4, 0x27, 0xA4, 0x0B, 0x92, 0x62, 0x06, 0x17, 0x17, 
-0x7A, 0xB1, 0xC7, 0x4A, 0x57, 0x3C, 0xF3, 0x71, 0xE8, 0x51, 0xEF, 0x4F, 0xB9, 0x77, 0xAF, 0x4A, 
-0x53, 0x94, 0xB9, 0x9E, 0xFB, 0x95, 0x90, 0xC9, 0xD1, 0x97, 0x57, 0xBD, 0xFF, 0xA8, 0x94, 0xFC, 
-0xFE, 0xE1, 0xF1, 0x63, 0xA7, 0xB9, 0x66, 0xA4, 0xD4, 0xFB, 0x8A, 0x34, 0xA5, 0xB4, 0xF2, 0x78, 
-0xBE, 0x13, 0x80, 0x98, 0x55, 0x34, 0xC3, 0x54, 0x77, 0xF7, 0x1F, 0x3C, 0x5E, 0xD2, 0xA2, 0x21, 
-0x55, 0xE9, 0xF2, 0xF1, 0xD3, 0x03, 0x6D, 0xED, 0x49, 0x08, 0x72, 0x5B, 0x18, 0xA6, 0x85, 0x86, 
-0xC7, 0x87, 0xE7, 0x17, 0x6B, 0x1C, 0xFD, 0xB4, 0xA8, 0x1F, 0xF4, 0x6A, 0xDD, 0x97, 0x2B, 0xF9, 
-0x77, 0x49, 0x51, 0x97, 0x34, 0x58, 0x49, 0xAC, 0x6F, 0x8C, 0x68, 0x46, 0x96, 0x36, 0xB6, 0x24, 
-0x89, 0x20, 0xA2, 0x8B, 0xD9, 0x62, 0x55, 0x15, 0x88, 0x05, 0x51, 0x35, 0x45, 0x4C, 0x42, 0x14, 
-0x43, 0x32, 0x82, 0xB5, 0x56, 0x83, 0xB1, 0x27, 0xED, 0xB3, 0x22, 0x82, 0xB1, 0xCE, 0xED, 0xEC, 
-0x4D, 0xD6, 0xF9, 0xA1, 0x79, 0x15, 0xBF, 0xEE, 0x58, 0x7C, 0xE1, 0x1B, 0x80, 0xD9, 0xAC, 0xB1, 
-0x29, 0xA6, 0xB1, 0x8F, 0x1D, 0xA0, 0xDB, 0x73, 0x43, 0x08, 0x54, 0x95, 0xA5, 0xAE, 0x1D, 0x06, 
-0x0F, 0x79, 0x83, 0x42, 0x99, 0xB6, 0x98, 0xAC, 0x8F, 0x47, 0xF2, 0xF1, 0x4C, 0x11, 0x4F, 0x32, 
-0xEA, 0x92, 0x31, 0xA1, 0xFA, 0x5A, 0xC9, 0xBA, 0xA7, 0x21, 0x69, 0xB4, 0x88, 0xE5, 0x63, 0x3A, 
-0x8B, 0x5B, 0xFC, 0xB6, 0xC9, 0x2C, 0x91, 0x89, 0x07, 0x8F, 0x1D, 0x46, 0x26, 0x0A, 0x36, 0x5A, 
-0xA5, 0x15, 0xE7, 0x6D, 0x32, 0x59, 0x42, 0xB7, 0x98, 0x20, 0xAB, 0xE9, 0x31, 0xDE, 0xB7, 0x92, 
-0xF2, 0x0A, 0xF1, 0x71, 0xA8, 0xBC, 0x73, 0xE9, 0xD8, 0x2B, 0x7E, 0xBF, 0x7B, 0x65, 0x94, 0x9F, 
-0xE3, 0xB0, 0x4B, 0x74, 0xE0, 0x3D, 0x3D, 0x32, 0x39, 0xC8, 0xE1, 0xF0, 0xF8, 0x63, 0xD3, 0x3C, 
-0x1F, 0x07, 0xCB, 0xEA, 0x71, 0x48, 0xF5, 0x9A, 0x8B, 0xB4, 0x98, 0x4A, 0x0D, 0x8F, 0x1F, 0x48, 
-0xA3, 0xC3, 0x44, 0x87, 0xA4, 0x1A, 0x13, 0xEB, 0xA5, 0x54, 0x42, 0x35, 0x4F, 0x89, 0xD5, 0xA1, 
-0xE9, 0xA3, 0x48, 0x52, 0x7E, 0xDE, 0x4A, 0x72, 0x48, 0xB4, 0xCB, 0x74, 0xA0, 0x1F, 0xD9, 0x01, 
-0xE5, 0x6F, 0x2C, 0xDF, 0x10, 0x16, 0x34, 0xEF, 0x0B, 0x3D, 0xAA, 0x82, 0xC5, 0x85, 0x83, 0xC7, 
-0x95, 0x04, 0x63, 0x1C, 0x3E, 0x46, 0x9A, 0xCD, 0x4D, 0xD6, 0x4E, 0x6E, 0x33, 0x4B, 0x81, 0xBD, 
-0x6E, 0x46, 0xB2, 0x4E, 0x43, 0x4F, 0x1A, 0x47, 0xA0, 0xC6, 0x9B, 0x9A, 0x60, 0x2B, 0x3A, 0x63, 
-0x09, 0x62, 0xD5, 0xA1, 0x94, 0x58, 0x95, 0x68, 0xD1, 0xCD, 0x17, 0x89, 0xA0, 0x6B, 0x41, 0x21, 
-0xB8, 0xC9, 0x6C, 0x7F, 0xE3, 0x93, 0xEF, 0xF9, 0x0D, 0xCA, 0x70, 0x37, 0x37, 0x77, 0x6D, 0x08, 
-0xBE, 0x01, 0xC4, 0x59, 0x87, 0x0F, 0x1D, 0x3E, 0xA9, 0x57, 0xAE, 0x66, 0x54, 0xA9, 0xB0, 0xA2, 
-0xB6, 0x60, 0xCA, 0x70, 0x2D, 0x18, 0x67, 0x49, 0x8E, 0x3C, 0xE5, 0xCA, 0xD3, 0x12, 0x89, 0xE8, 
-0x95, 0x25, 0xEE, 0x92, 0x07, 0xE9, 0x2D, 0x78, 0xF5, 0x48, 0x62, 0xCA, 0x31, 0xD1, 0x0E, 0x9E, 
-0x5B, 0xBA, 0xEE, 0x09, 0x48, 0xAD, 0x1D, 0x8E, 0xB9, 0x60, 0x32, 0x97, 0x63, 0x0E, 0xA1, 0xE1, 
-0xF5, 0x8F, 0x41, 0x0C, 0x9F, 0xF5, 0x24, 0xB4, 0xE2, 0xB9, 0xAF, 0x1B, 0x65, 0xC9, 0x64, 0x15, 
-0xE9, 0x4A, 0xF8, 0xC1, 0xE3, 0xC7, 0x2E, 0xF7, 0x63, 0xD3, 0xE1, 0x79, 0x78, 0x14, 0x15, 0x94, 
-0xFF, 0xA5, 0x48, 0x59, 0xBD, 0xDF, 0x47, 0xA6, 0x59, 0xE7, 0x6B, 0xB2, 0xC9, 0xE1, 0x93, 0xA4, 
-0xDA, 0x8E, 0x9F, 0x34, 0x1D, 0xCA, 0xAA, 0xF9, 0xD8, 0x63, 0xD0, 0x52, 0x79, 0xC4, 0x74, 0x50, 
-0xD1, 0x7C, 0x48, 0x9D, 0xCD, 0xD5, 0xC4, 0xC9, 0x83, 0x74, 0xD0, 0x24, 0x36, 0xB7, 0xC7, 0xD8, 
-0x2A, 0x32, 0x09, 0xFB, 0x24, 0xE3, 0x35, 0x0C, 0x66, 0x4F, 0xA5, 0x20, 0x29, 0xAF, 0xEB, 0xA0, 
-0xED, 0xC3, 0x8A, 0xD1, 0x90, 0x5B, 0xA8, 0x4F, 0x14, 0x6B, 0x2D, 0x31, 0x7A, 0x52, 0xF2, 0x26, 
-0xC6, 0x38, 0x3E, 0x7B, 0xF6, 0x67, 0xF4, 0xE2, 0x37, 0x00, 0x6F, 0x28, 0xC3, 0x6D, 0xDB, 0xCA, 
-0xC6, 0x14, 0x47, 0x0E, 0x2B, 0x82, 0xC6, 0x25, 0xB3, 0x22, 0x74, 0xA1, 0xC5, 0xAD, 0x8D, 0x48, 
-0x95, 0xC5, 0x1B, 0x50, 0x4F, 0x15, 0x80, 0x13, 0x52, 0x65, 0x49, 0xD6, 0x10, 0x4D, 0x0E, 0x7F, 
-0xDE, 0xD3, 0x5D, 0xA5, 0xA2, 0x5F, 0x95, 0x44, 0x4A, 0x9E, 0xC4, 0x41, 0x42, 0x74, 0x3B, 0x60, 
-0x9F, 0x56, 0x1D, 0x4F, 0xA6, 0x9B, 0x53, 0x94, 0x76, 0xE9, 0xF7, 0x2B, 0x22, 0x09, 0x99, 0xBA, 
-0xA3, 0x69, 0x78, 0x5F, 0x8F, 0xA2, 0xB4, 0x47, 0x52, 0xA2, 0x85, 0xE1, 0xF3, 0x1E, 0x97, 0x56, 
-0xBC, 0xB7, 0xFF, 0xFE, 0xE1, 0xB1, 0x83, 0xD4, 0x3E, 0x39, 0x89, 0x57, 0x3A, 0xE4, 0x7B, 0x0F, 
-0xBE, 0xEB, 0x20, 0x21, 0xAF, 0x8C, 0x92, 0x09, 0x47, 0x52, 0x14, 0x75, 0xFD, 0x39, 0x24, 0xAC, 
-0x46, 0x94, 0x66, 0x5E, 0xCF, 0x4F, 0x46, 0x8B, 0xBC, 0x94, 0xFA, 0xD4, 0x3A, 0x7D, 0xBD, 0xD2, 
-0x28, 0x81, 0x28, 0x5D, 0x8F, 0x82, 0x92, 0xE9, 0x0E, 0x21, 0x3F, 0x27, 0x35, 0xFD, 0x2A, 0xF9, 
-0x1F, 0x90, 0x19, 0x10, 0xED, 0x82, 0xCA, 0x79, 0x5A, 0x24, 0x4E, 0x71, 0xD6, 0x43, 0x9A, 0x60, 
-0xD7, 0x84, 0xF5, 0x13, 0x15, 0xC8, 0x84, 0xC4, 0x14, 0x6B, 0x3A, 0x2A, 0x49, 0x54, 0x04, 0xAA, 
-0xA8, 0x76, 0x0F, 0x55, 0x4C, 0x54, 0xA1, 0x55, 0x8B, 0x85, 0xD8, 0xE5, 0x60, 0xB2, 0x91, 0x94, 
-0x82, 0x46, 0x1E, 0x06, 0x44, 0x8C, 0x41, 0x64, 0x34, 0xE4, 0x43, 0xAF, 0x27, 0xDE, 0x50, 0x86, 
-0xEB, 0xFD, 0xD4, 0x26, 0x42, 0x9D, 0x08, 0xF8, 0xD0, 0x62, 0x8D, 0x30, 0x1A, 0x55, 0x74, 0x7E, 
-0x86, 0x6B, 0x1C, 0x54, 0x96, 0xA2, 0x96, 0x0B, 0x06, 0x40, 0xF5, 0x33, 0x18, 0x9B, 0xB7, 0xDD, 
-0xB2, 0xB4, 0x8D, 0xB6, 0x2F, 0x5D, 0x64, 0x2D, 0xC1, 0x23, 0x29, 0xA4, 0x74, 0xE0, 0xD8, 0xE3, 
-0x9C, 0x7F, 0xDC, 0xEB, 0x86, 0x0B, 0x1C, 0x87, 0xD1, 0x50, 0x18, 0x58, 0x08, 0x05, 0xC7, 0x5B, 
-0xA9, 0x7E, 0xD4, 0xA2, 0xCB, 0x51, 0xA1, 0xB2, 0x03, 0x87, 0xBF, 0xE3, 0xB8, 0xEF, 0x5F, 0x5E, 
-0x20, 0x7C, 0x7C, 0x8A, 0x44, 0x62, 0x4A, 0x07, 0xDE, 0x77, 0xD8, 0xB1, 0x83, 0xEF, 0x7F, 0x72, 
-0x3A, 0xAA, 0xFC, 0x1F, 0x87, 0x62, 0x96, 0xA3, 0x8A, 0xDB, 0xCE, 0xF2, 0xFB, 0x38, 0x69, 0x59, 
-0x58, 0x0A, 0xF8, 0xFC, 0x7F, 0x09, 0x75, 0x5E, 0xC2, 0x9E, 0x2F, 0x7E, 0x1F, 0x95, 0xF2, 0xA4, 
-0xE9, 0xDC, 0x82, 0x62, 0x40, 0x2B, 0xBE, 0x73, 0x48, 0x31, 0x2F, 0xBA, 0xF5, 0xEF, 0x2B, 0x53, 
-0xA7, 0x7E, 0x1B, 0x1B, 0xB6, 0xBB, 0x48, 0xAE, 0x5B, 0x89, 0xA4, 0xE4, 0xA1, 0x32, 0x90, 0x5A, 
-0xA8, 0x23, 0xA3, 0xED, 0x1A, 0x69, 0x12, 0x41, 0x5A, 0x4C, 0x95, 0x30, 0x56, 0x17, 0xC2, 0x8C, 
-0x31, 0x6A, 0x2D, 0x9F, 0x63, 0xAB, 0x99, 0xE0, 0x31, 0x31, 0xE0, 0x8C, 0x9A, 0xEB, 0xA9, 0x64, 
-0x1B, 0x80, 0x8E, 0x18, 0x83, 0xB1, 0xA4, 0xB5, 0xCD, 0xCD, 0xCD, 0xDF, 0x98, 0x12, 0xEE, 0xFE, 
-0xFE, 0xAE, 0xA9, 0xAC, 0x71, 0x01, 0xAF, 0xC1, 0x3B, 0x6D, 0x62, 0x3A, 0xD9, 0x41, 0xB2, 0xBE, 
-0x36, 0x92, 0x48, 0x22, 0x04, 0x9F, 0x28, 0x3E, 0xE5, 0x2B, 0x37, 0xC6, 0x77, 0x89, 0xCA, 0x34, 
-0x18, 0x1C, 0x92, 0x2C, 0x36, 0x39, 0x8D, 0x6B, 0x1F, 0x2D, 0x36, 0x2F, 0x76, 0x45, 0x2C, 0xDE, 
-0x98, 0x43, 0xA9, 0x13, 0xA1, 0x13, 0x39, 0x70, 0xBC, 0x50, 0x10, 0xA5, 0x68, 0xEC, 0xFC, 0xFF, 
-0x3E, 0x69, 0xC4, 0x25, 0x59, 0xBA, 0xAE, 0x4F, 0x8B, 0x6B, 0x55, 0xB7, 0xB4, 0x20, 0x51, 0xA3, 
-0x6D, 0x63, 0x06, 0xE4, 0x96, 0xA8, 0x33, 0xB2, 0x92, 0xBC, 0x35, 0x78, 0x6B, 0x08, 0xCE, 0xCE, 
-0xFF, 0x5F, 0x49, 0xAA, 0x58, 0x39, 0x94, 0xA2, 0x31, 0xF3, 0xBC, 0x0C, 0x29, 0x9A, 0xC5, 0x73, 
-0x0E, 0x7B, 0xFF, 0xA3, 0xE8, 0x51, 0xF7, 0x0C, 0x9F, 0x3B, 0xBC, 0x6E, 0xD5, 0xB1, 0x55, 0xE7, 
-0x0F, 0xBD, 0x46, 0xE4, 0x89, 0xA9, 0x94, 0xC3, 0x30, 0x7F, 0xAD, 0x30, 0xA7, 0xE1, 0xB9, 0xFE, 
-0x35, 0xF3, 0x32, 0x4E, 0xBA, 0x40, 0x96, 0x10, 0xA2, 0xE8, 0xA2, 0xD6, 0xB1, 0xD3, 0x4C, 0x25, 
-0x32, 0x74, 0xF9, 0xFD, 0x38, 0xA4, 0xF7, 0x95, 0xFB, 0x1F, 0x2F, 0xF5, 0x08, 0x21, 0x29, 0x2D, 
-0x5B, 0x92, 0x3B, 0x22, 0x2E, 0x6F, 0x61, 0x57, 0x8A, 0xA2, 0xCE, 0xF8, 0xA3, 0xA8, 0x01, 0xA6, 
-0xEA, 0x58, 0x2D, 0xDE, 0x2E, 0xA8, 0x33, 0x86, 0x56, 0xF4, 0x9C, 0x47, 0x88, 0xD6, 0x11, 0x8C, 
-0x3D, 0x48, 0xF9, 0xDD, 0x2D, 0x89, 0x90, 0x3C, 0x9D, 0x49, 0x50, 0x0B, 0xCD, 0xD9, 0x13, 0xD4, 
-0x27, 0xD7, 0xD8, 0xE9, 0xF6, 0x69, 0x89, 0x74, 0x29, 0x82, 0x58, 0x62, 0xF6, 0xDB, 0x17, 0x52, 
-0xC2, 0x9A, 0x0A, 0xDF, 0x45, 0x9D, 0x0C, 0x57, 0x86, 0x8E, 0x29, 0x22, 0x42, 0x08, 0x01, 0x31, 
-0x15, 0x91, 0x60, 0xBA, 0x10, 0x46, 0x5F, 0xFE, 0xF2, 0xE8, 0x37, 0x26, 0xC3, 0x1D, 0x8D, 0x6A, 
-0x8B, 0x11, 0x9B, 0x08, 0x32, 0xF3, 0x53, 0x66, 0xDD, 0x84, 0x40, 0x87, 0xB1, 0xB0, 0x36, 0xAA, 
-0x30, 0x12, 0x48, 0xB1, 0x53, 0x1F, 0xB8, 0xC9, 0xAB, 0xC1, 0xBC, 0x24, 0x46, 0x75, 0x85, 0xA4, 
-0x88, 0x45, 0xB0, 0xC5, 0x20, 0x1C, 0xC1, 0x91, 0xB0, 0x11, 0x1C, 0xA5, 0x3C, 0x7B, 0x43, 0xEB, 
-0x80, 0xCA, 0x26, 0x86, 0xC3, 0x68, 0x78, 0xFD, 0x90, 0x8E, 0x77, 0x9D, 0xEE, 0xB4, 0x59, 0x45, 
-0x29, 0x9B, 0xAF, 0xA5, 0x24, 0xA4, 0x68, 0xE7, 0xAB, 0xFB, 0x8B, 0x55, 0x7E, 0x77, 0xE0, 0x9E, 
-0xA3, 0x48, 0x2D, 0x5D, 0x16, 0xBF, 0x45, 0xEC, 0x2B, 0xA2, 0x92, 0xB7, 0x55, 0xEF, 0x39, 0x0E, 
-0xAD, 0xDA, 0x4C, 0x01, 0x07, 0x37, 0x5A, 0x1C, 0x76, 0xDD, 0x61, 0xEF, 0x1B, 0xE6, 0xE7, 0x30, 
-0x1A, 0x7E, 0xCF, 0x90, 0x86, 0xD7, 0x0F, 0x29, 0x99, 0x83, 0xF7, 0x18, 0xE3, 0x0E, 0x1C, 0x3B, 
-0x8C, 0xD4, 0x96, 0x46, 0x5B, 0xE8, 0xAA, 0x74, 0xA5, 0x75, 0x44, 0x2F, 0x2D, 0xF6, 0xE6, 0x4F, 
-0x4A, 0x73, 0x5D, 0x77, 0xF9, 0x7F, 0x90, 0xC2, 0x0A, 0xDD, 0xF1, 0x3C, 0x55, 0xA1, 0x65, 0xD8, 
-0xC6, 0xFB, 0xFF, 0xA7, 0xA8, 0x96, 0x2A, 0x43, 0x8B, 0x14, 0x8D, 0x70, 0xA6, 0xDF, 0x37, 0xA4, 
-0x72, 0x4E, 0x58, 0xDD, 0xBE, 0xE6, 0x75, 0x23, 0x56, 0xB7, 0xEE, 0x46, 0xF0, 0x46, 0xD7, 0xF9, 
-0x18, 0x1B, 0xC6, 0xA7, 0xD6, 0x68, 0xB6, 0x46, 0x74, 0x74, 0x44, 0x03, 0x3E, 0x6F, 0xCF, 0x0F, 
-0x51, 0xF7, 0xD3, 0xA4, 0xA4, 0xA3, 0x9C, 0x88, 0xB0, 0xBF, 0xBF, 0xCB, 0x86, 0x6C, 0xE8, 0x42, 
-0x7C, 0xCC, 0x3A, 0x5F, 0x92, 0x49, 0x31, 0xAE, 0x6D, 0x6C, 0xD4, 0xC3, 0xC6, 0xF6, 0xBA, 0xC1, 
-0x0C, 0x0F, 0xBC, 0x9E, 0xA8, 0xEB, 0x4A, 0x52, 0x88, 0xB6, 0x32, 0x15, 0xA3, 0x6A, 0xC4, 0xA8, 
-0x19, 0x51, 0xD9, 0x0A, 0x67, 0x13, 0xD6, 0x74, 0x10, 0x76, 0x91, 0x38, 0xC1, 0x32, 0xC3, 0x49, 
-0x0B, 0x69, 0x46, 0xEC, 0xF6, 0x21, 0x76, 0x08, 0x1E, 0x92, 0xD7, 0xC0, 0x90, 0xA9, 0xC3, 0x24, 
-0x1D, 0x3B, 0x21, 0x40, 0x8A, 0x54, 0x11, 0x5C, 0x30, 0x87, 0x92, 0xF5, 0x72, 0x24, 0xF5, 0x2D, 
-0x06, 0x86, 0xAB, 0xCF, 0xB6, 0xB7, 0xB2, 0x7F, 0x18, 0xB9, 0x20, 0x38, 0x7F, 0x38, 0x55, 0xC1, 
-0x2C, 0x28, 0x0E, 0x49, 0xFD, 0x3B, 0x2C, 0x5D, 0x33, 0xA0, 0xFE, 0x33, 0xCA, 0xFF, 0x07, 0x9E, 
-0x7B, 0x04, 0x0D, 0xF3, 0x33, 0xA4, 0xC3, 0xAE, 0x1B, 0x3E, 0x67, 0x25, 0x45, 0x55, 0xBB, 0xAF, 
-0x22, 0x13, 0xD3, 0xA1, 0xD4, 0xBF, 0xCE, 0x85, 0x74, 0xF0, 0xB9, 0x87, 0xE4, 0x69, 0x15, 0x0D, 
-0xEB, 0xAB, 0x90, 0x4B, 0x16, 0x97, 0xEC, 0x81, 0xE3, 0x43, 0x1A, 0x3E, 0xAF, 0x50, 0x1D, 0x2D, 
-0x75, 0xB4, 0x07, 0xF2, 0xD4, 0x27, 0x1B, 0x57, 0x58, 0x3E, 0x0C, 0xA8, 0x58, 0x54, 0xAC, 0xA6, 
-0x84, 0x8B, 0x68, 0x1B, 0x7A, 0x42, 0xB2, 0x51, 0xC9, 0x04, 0x30, 0x81, 0xF9, 0xEF, 0xE1, 0xF1, 
-0xD5, 0x94, 0x70, 0xD8, 0x15, 0xED, 0x72, 0x41, 0xFA, 0x1E, 0x8D, 0x5D, 0x56, 0x45, 0x99, 0x53, 
-0x9D, 0x0C, 0x75, 0x32, 0xD8, 0x24, 0x2B, 0xC9, 0x14, 0xCA, 0x79, 0x5A, 0x95, 0x3F, 0x13, 0x0D, 
-0x46, 0x1C, 0x31, 0x09, 0x41, 0xC0, 0x4B, 0x80, 0x2A, 0x52, 0x6F, 0x8E, 0x70, 0x1B, 0x15, 0x7B, 
-0xED, 0x2E, 0xC9, 0x14, 0x95, 0x4B, 0xB6, 0x81, 0x9E, 0xEB, 0x69, 0x45, 0xA3, 0xF8, 0x9A, 0x8A, 
-0x94, 0x12, 0xFB, 0x7E, 0x9F, 0xCA, 0x55, 0xD4, 0x75, 0x8D, 0x91, 0x4A, 0xDA, 0x2E, 0x8C, 0xC6, 
-0xE3, 0x2B, 0xBF, 0x31, 0x19, 0x2E, 0x8C, 0xE9, 0x62, 0x47, 0x88, 0x81, 0xAE, 0xEB, 0x98, 0xCD, 
-0x66, 0x2A, 0xFE, 0x8B, 0x30, 0x6E, 0x2A, 0xAC, 0x49, 0x58, 0x13, 0xD5, 0xBF, 0x82, 0x11, 0xB0, 
-0xEA, 0x8C, 0xC2, 0x7B, 0x5D, 0x81, 0x54, 0xFD, 0x50, 0xB1, 0xC9, 0x43, 0xF5, 0xB9, 0x59, 0xCF, 
-0xF4, 0x4A, 0xD1, 0x97, 0x16, 0x56, 0x61, 0x28, 0x51, 0x1C, 0xA0, 0x6C, 0xF3, 0x7B, 0x18, 0x2D, 
-0xB0, 0xAA, 0x0A, 0x1E, 0x4F, 0xBA, 0xD1, 0x68, 0x17, 0x87, 0x3D, 0xFF, 0x95, 0x61, 0xF8, 0xDC, 
-0x63, 0x11, 0x79, 0x17, 0xE0, 0x63, 0x62, 0x61, 0x57, 0xAD, 0xD2, 0x10, 0x2B, 0xDE, 0x5F, 0x8E, 
-0xCD, 0xF5, 0x77, 0x87, 0xD0, 0x10, 0xFD, 0xFB, 0x9F, 0x14, 0xFD, 0xFB, 0x87, 0xF9, 0x1A, 0xD2, 
-0xA3, 0x30, 0xBC, 0x7E, 0x48, 0xAF, 0x26, 0x56, 0x3D, 0x6F, 0xF8, 0xBE, 0x42, 0xA5, 0xFC, 0x44, 
-0x1E, 0xDD, 0x86, 0x55, 0x22, 0x5D, 0xD4, 0x49, 0xF9, 0xFF, 0x28, 0xF4, 0xEF, 0xEF, 0xFF, 0x1E, 
-0x5C, 0x85, 0x15, 0xA7, 0xE6, 0x9A, 0x92, 0x9D, 0x98, 0xD3, 0x51, 0xAF, 0x1B, 0xD6, 0x36, 0x6A, 
-0xB0, 0x01, 0x1F, 0x67, 0xC4, 0xD8, 0x12, 0x92, 0x9F, 0xBB, 0x69, 0x8C, 0x2A, 0xEF, 0x92, 0x52, 
-0xA0, 0xAA, 0x1A, 0x3C, 0x01, 0x4B, 0x85, 0xB5, 0x15, 0xED, 0xAC, 0x43, 0x30, 0xA6, 0xAA, 0xC7, 
-0x4D, 0xD3, 0xBC, 0x75, 0xF8, 0xC2, 0xD7, 0x0D, 0x07, 0x5B, 0xE6, 0xEB, 0x88, 0xB6, 0xF5, 0xA9, 
-0x36, 0x55, 0x5A, 0xAB, 0xD6, 0x68, 0x9A, 0xD1, 0xBC, 0x82, 0x9B, 0xA6, 0xA1, 0x69, 0x1A, 0x2C, 
-0x86, 0xE0, 0x13, 0xB3, 0x69, 0x47, 0xE8, 0x3C, 0x44, 0x61, 0xEA, 0x23, 0x53, 0x1F, 0xF1, 0x52, 
-0x13, 0x8C, 0x23, 0x18, 0x87, 0xB7, 0x8E, 0xCE, 0xD6, 0x74, 0xB6, 0xA6, 0xB5, 0x35, 0xDE, 0x3A, 
-0xBC, 0xB5, 0x07, 0x37, 0x99, 0xF7, 0x48, 0xAC, 0x39, 0x92, 0x96, 0x14, 0xFE, 0x2B, 0xEE, 0x1F, 
-0xD2, 0x70, 0x71, 0x21, 0xDA, 0x94, 0x49, 0xE6, 0x54, 0x76, 0x00, 0x05, 0x43, 0xEF, 0x78, 0xBE, 
-0xCE, 0xC8, 0x12, 0xA5, 0x63, 0x52, 0x59, 0x70, 0x18, 0xFE, 0xEE, 0xBF, 0xF7, 0x49, 0x68, 0xF8, 
-0x9E, 0xC7, 0xA1, 0x68, 0xF5, 0x1B, 0x98, 0x1B, 0xA7, 0xAB, 0xD7, 0xB5, 0x55, 0x54, 0xAE, 0xE9, 
-0x53, 0x1A, 0x7C, 0xCF, 0x61, 0xFF, 0x1F, 0x49, 0x2B, 0xBE, 0xA9, 0x4F, 0xFD, 0xBA, 0x58, 0x45, 
-0xA9, 0xEC, 0x7E, 0xEA, 0x91, 0x2E, 0x46, 0xE5, 0x5D, 0x52, 0x2B, 0xCE, 0x2F, 0x5D, 0xFB, 0x8A, 
-0xE8, 0x60, 0x7E, 0x1F, 0x97, 0x42, 0x8F, 0xBC, 0xD1, 0xA9, 0xB9, 0x37, 0x2C, 0x1D, 0x3F, 0x92, 
-0x44, 0x77, 0x9A, 0xF5, 0xDB, 0x64, 0x50, 0x57, 0xD4, 0xBA, 0x20, 0xDB, 0xCF, 0xEB, 0xE0, 0xDC, 
-0x2A, 0x9A, 0x5F, 0x37, 0x68, 0xFF, 0xC3, 0xFF, 0xE7, 0x8B, 0x6D, 0x41, 0x67, 0x3D, 0x92, 0x34, 
-0xCA, 0x4B, 0x4C, 0x2D, 0x34, 0x96, 0xED, 0x93, 0x6B, 0x9C, 0x38, 0xB9, 0x9E, 0xE3, 0x70, 0x77, 
-0x44, 0xBC, 0x5A, 0x25, 0x19, 0xB4, 0x6E, 0xE8, 0x88, 0x02, 0x21, 0x04, 0x2C, 0x0D, 0xB5, 0x59, 
-0xC3, 0x77, 0x09, 0xA8, 0xA9, 0xAA, 0x91, 0xEC, 0x3D, 0x9C, 0xB8, 0x97, 0x5E, 0x7A, 0x79, 0xC8, 
-0x8A, 0x5E, 0x37, 0xBC, 0x61, 0x9C, 0x1E, 0xE0, 0xDF, 0xF9, 0x03, 0x7F, 0xF2, 0xFC, 0x7F, 0xF1, 
-0x63, 0x9F, 0xFC, 0x64, 0x17, 0xE5, 0x5B, 0x8D, 0xD4, 0xF8, 0x34, 0x23, 0x31, 0x63, 0x63, 0x33, 
-0xF2, 0x97, 0x7F, 0xEC, 0x4F, 0xF0, 0xDD, 0xDF, 0xFD, 0x0D, 0x54, 0xE9, 0x21, 0x26, 0x4D, 0xB1, 
-0xD6, 0x22, 0xB3, 0x3D, 0xEE, 0xFC, 0xF2, 0x3F, 0xE4, 0xE6, 0xAF, 0xFE, 0x23, 0xCE, 0x85, 0x07, 
-0x8C, 0xD3, 0xB4, 0x04, 0x82, 0x80, 0xAC, 0xA7, 0x01, 0x93, 0x75, 0x39, 0x79, 0x9F, 0xF6, 0x13, 
-0xA2, 0xD8, 0xF8, 0xF5, 0x71, 0x70, 0x24, 0x56, 0x1C, 0x75, 0xED, 0x92, 0xF7, 0xC6, 0x43, 0xAE, 
-0x55, 0x2C, 0xE7, 0x36, 0x7B, 0x6C, 0x78, 0x24, 0x0E, 0x7D, 0x9E, 0x59, 0x9D, 0xD7, 0x63, 0x23, 
-0xEF, 0xD6, 0xEB, 0xE3, 0xB0, 0xEF, 0x1F, 0x22, 0x95, 0xCB, 0x24, 0x87, 0xE7, 0x78, 0xDC, 0x94, 
-0x85, 0x2E, 0x6E, 0x15, 0xCA, 0xCE, 0xA1, 0xC3, 0x90, 0x44, 0xF3, 0x1A, 0x45, 0x6D, 0x42, 0x57, 
-0xA5, 0x12, 0x75, 0x95, 0x7C, 0x78, 0xDC, 0x94, 0xCF, 0x96, 0xD5, 0x1E, 0xDF, 0x4A, 0x79, 0xAF, 
-0x92, 0xA2, 0xFB, 0x88, 0x8F, 0xA8, 0xBF, 0x43, 0xEB, 0x2D, 0x43, 0xBF, 0x2F, 0x22, 0xD9, 0x57, 
-0xC7, 0xE3, 0xA6, 0x60, 0xD4, 0xDA, 0x20, 0x99, 0xBC, 0x45, 0xD2, 0x68, 0x9C, 0xBE, 0xFC, 0x3B, 
-0x69, 0x21, 0x1C, 0x38, 0xCE, 0x31, 0x67, 0x26, 0x1A, 0xF3, 0xEF, 0xF8, 0x10, 0x91, 0xA5, 0x12, 
-0x59, 0x55, 0x7F, 0xA5, 0x09, 0x90, 0x2D, 0x41, 0x43, 0x12, 0xBA, 0xCA, 0x12, 0x12, 0x18, 0x1F, 
-0x59, 0x97, 0x31, 0x6E, 0xC7, 0xF2, 0xE0, 0xDA, 0x3E, 0xD7, 0x9E, 0xBB, 0x8F, 0x74, 0x15, 0x36, 
-0x24, 0x1A, 0x53, 0x13, 0x63, 0x22, 0x98, 0x86, 0xD6, 0x6C, 0xF2, 0xD9, 0x69, 0xC5, 0x9F, 0xFD, 
-0xDF, 0x3F, 0xC3, 0x17, 0xE3, 0x98, 0x3B, 0x58, 0x3A, 0x6A, 0x9A, 0xD1, 0x1A, 0xBE, 0xDD, 0x0F, 
-0xC4, 0xDD, 0x3F, 0xF7, 0xD7, 0x7F, 0xE2, 0xA7, 0xFF, 0x9F, 0xDF, 0xF7, 0x7D, 0x97, 0xF7, 0x87, 
-0xEF, 0x7F, 0x3D, 0x70, 0xF0, 0xAB, 0x5F, 0x47, 0xFC, 0xCB, 0xFF, 0xF2, 0xC7, 0x2F, 0xFC, 0x0F, 
-0xFF, 0xDD, 0xDF, 0xFB, 0xFF, 0x3D, 0xD8, 0xD9, 0xFB, 0x08, 0x18, 0x8C, 0x80, 0xAB, 0x12, 0x6B, 
-0x1B, 0x91, 0xBF, 0xF8, 0x5F, 0xFC, 0x29, 0x7E, 0xDB, 0xB7, 0x7D, 0x00, 0x13, 0x1F, 0x60, 0xE9, 
-0x74, 0xD4, 0xDB, 0xBD, 0xCB, 0xED, 0x4F, 0xFF, 0x02, 0xD3, 0x17, 0x3F, 0xC3, 0xD6, 0xFE, 0x4D, 
-0xC6, 0x71, 0x4A, 0xB2, 0x99, 0xB1, 0x25, 0xDD, 0x5F, 0x1D, 0x00, 0x52, 0x59, 0x44, 0x3A, 0x1C, 
-0x1A, 0xEA, 0xFC, 0x70, 0x3C, 0xAA, 0x43, 0x49, 0x8E, 0xC2, 0xD0, 0x47, 0xFF, 0xF7, 0x70, 0x4A, 
-0x7D, 0xE0, 0xDA, 0xA3, 0x5F, 0xCF, 0x20, 0xD0, 0xC4, 0x91, 0x18, 0x3E, 0x7B, 0x55, 0x63, 0x7E, 
-0xBD, 0x21, 0x22, 0xE8, 0x27, 0x0A, 0x90, 0x74, 0x10, 0x24, 0xCD, 0x7F, 0xF7, 0x53, 0xCD, 0xEE, 
-0xF2, 0xF1, 0xE2, 0x71, 0x6A, 0xF8, 0x2D, 0xE5, 0x5B, 0x87, 0xC7, 0x87, 0x48, 0x39, 0xDE, 0x16, 
-0x31, 0x2D, 0xF3, 0xF2, 0xFC, 0xDB, 0x64, 0x5F, 0xAE, 0x43, 0x5E, 0x5F, 0x3A, 0xBC, 0xC9, 0xB9, 
-0xEF, 0x97, 0x6D, 0xFF, 0xFF, 0x47, 0xBD, 0xFF, 0x95, 0x46, 0x70, 0x2E, 0xCF, 0x37, 0x49, 0x19, 
-0xE7, 0xE3, 0xA6, 0x3A, 0x7B, 0x38, 0x9C, 0xE1, 0x0E, 0x53, 0xC1, 0x1E, 0xCD, 0x70, 0xB3, 0xE5, 
-0xD0, 0xFC, 0xE7, 0x81, 0xEF, 0x57, 0x0F, 0x6F, 0x0B, 0xA8, 0x5A, 0xA2, 0x8F, 0xD4, 0xFB, 0x3D, 
-0x3C, 0x27, 0xB9, 0xBE, 0x16, 0x0B, 0x77, 0x89, 0x68, 0x2C, 0xAD, 0x33, 0xF8, 0x14, 0x11, 0x1F, 
-0x18, 0xA5, 0x8A, 0x6A, 0xE2, 0x08, 0x0F, 0x0D, 0xCF, 0xFD, 0xDA, 0x0D, 0xE8, 0x1C, 0xA6, 0x83, 
-0xCA, 0xE8, 0x22, 0x9C, 0x37, 0x35, 0x9D, 0xDD, 0xE6, 0xF9, 0xA9, 0xE5, 0x2F, 0xFC, 0xBD, 0x7F, 
-0xCC, 0x4B, 0xB1, 0xE1, 0x36, 0x8E, 0x20, 0x4D, 0xB6, 0xB6, 0xD8, 0x0D, 0xE7, 0xB6, 0x37, 0xFF, 
-0xC2, 0x8F, 0xFE, 0xF8, 0x7F, 0xFE, 0xFF, 0xF8, 0xE8, 0x47, 0xDF, 0xBD, 0xB3, 0x94, 0x81, 0xD7, 
-0x09, 0xC3, 0x52, 0x7B, 0x6C, 0xA4, 0x94, 0xCC, 0x27, 0x3E, 0xF1, 0x89, 0xE6, 0xE1, 0x43, 0xC6, 
-0x9F, 0xF8, 0xC4, 0x27, 0xB7, 0x1F, 0x3E, 0x9C, 0x6D, 0xA6, 0x8E, 0x35, 0x23, 0x95, 0x6D, 0xDB, 
-0xFD, 0x00, 0xAE, 0xF5, 0xDD, 0xAC, 0xAD, 0xD6, 0x1B, 0xFF, 0xBE, 0x77, 0xBC, 0x3B, 0xBC, 0xE3, 
-0x7D, 0xEF, 0x48, 0x55, 0xD5, 0x84, 0x1B, 0x37, 0xF6, 0xCD, 0x5F, 0xFB, 0x2B, 0xFF, 0xCD, 0xD7, 
-0xDF, 0xB9, 0xBD, 0xF7, 0x1F, 0x0A, 0xF5, 0xDB, 0x31, 0x96, 0xB6, 0x9B, 0x22, 0xE2, 0xA9, 0x47, 
-0x81, 0x7F, 0xE5, 0x0F, 0xFC, 0x00, 0xDF, 0xF8, 0xF5, 0xEF, 0x66, 0xBA, 0x7F, 0x87, 0x14, 0x26, 
-0x84, 0x10, 0xE8, 0x76, 0x1F, 0xB0, 0xFB, 0xD2, 0x17, 0xA8, 0x76, 0x6F, 0xB1, 0x36, 0xBD, 0x4F, 
-0x9D, 0x3C, 0x98, 0xEC, 0x75, 0x28, 0x45, 0x7C, 0x52, 0x7F, 0xB6, 0xE4, 0xCE, 0x74, 0x68, 0xE3, 
-0x39, 0x06, 0x64, 0x45, 0xA3, 0xE8, 0x77, 0xA1, 0x72, 0xEE, 0xB0, 0x0E, 0x49, 0x5C, 0x6E, 0x40, 
-0x43, 0xA6, 0xB8, 0xF8, 0x6D, 0x50, 0x0B, 0xDD, 0xE5, 0x74, 0xF8, 0xEE, 0xC3, 0x30, 0x7C, 0x6E, 
-0x81, 0x8E, 0x37, 0xFA, 0x3C, 0xE1, 0x60, 0x47, 0x3A, 0xEC, 0xBE, 0x82, 0xC3, 0x06, 0x9C, 0xE3, 
-0xE6, 0x6B, 0x21, 0xE1, 0x2D, 0xBE, 0x4B, 0xED, 0x21, 0x0F, 0x7E, 0xAF, 0x46, 0x5B, 0x1E, 0x7C, 
-0x7F, 0xE9, 0x78, 0xC3, 0x3A, 0x38, 0x06, 0xC3, 0x2D, 0x63, 0x6D, 0x91, 0xF4, 0xCA, 0x7B, 0xFB, 
-0xEF, 0x17, 0xB1, 0x07, 0xF2, 0x31, 0xCF, 0x4F, 0x1E, 0x0D, 0xA5, 0xF7, 0xBE, 0x61, 0x7A, 0xE4, 
-0xFB, 0xF3, 0x75, 0x47, 0x8D, 0xF9, 0x87, 0x95, 0x6F, 0xC1, 0x42, 0xBA, 0x3E, 0x98, 0xBF, 0xE3, 
-0xA4, 0x87, 0xBD, 0x5B, 0xB2, 0xE4, 0x6F, 0xD1, 0xB4, 0x7F, 0xBC, 0x8F, 0xE1, 0x6F, 0x7D, 0xF6, 
-0x41, 0x94, 0xE7, 0x58, 0xB4, 0xB1, 0xAB, 0xF5, 0xEB, 0x82, 0xB1, 0xCC, 0xFB, 0xC9, 0xE0, 0x99, 
-0xFD, 0xFF, 0x53, 0x99, 0x8D, 0x49, 0xD6, 0xDB, 0x03, 0xC9, 0x07, 0xB0, 0x86, 0x58, 0x5B, 0x82, 
-0x80, 0x89, 0x81, 0x2A, 0x56, 0xB8, 0xCE, 0x61, 0x66, 0x35, 0xD7, 0x5F, 0xBA, 0x47, 0x9A, 0x59, 
-0x52, 0x17, 0xD5, 0x6F, 0x42, 0x14, 0x92, 0xAD, 0x48, 0xD5, 0x26, 0x57, 0x27, 0x89, 0xFF, 0xF5, 
-0xCB, 0x37, 0x78, 0x79, 0x96, 0xD8, 0xC5, 0x22, 0xF5, 0x1A, 0x5D, 0x1B, 0xA8, 0x1D, 0x29, 0xF8, 
-0xDD, 0xBF, 0xF5, 0xB6, 0xB7, 0xBF, 0xE9, 0x4F, 0x7C, 0xC7, 0x77, 0x7D, 0xC3, 0xB5, 0x5F, 0xF8, 
-0x85, 0x5F, 0x3D, 0xD9, 0x75, 0x0F, 0x4F, 0x8D, 0xC7, 0x23, 0x2B, 0x21, 0xA4, 0x44, 0x12, 0x11, 
-0x6C, 0x14, 0x31, 0x12, 0x63, 0xB2, 0x26, 0xCC, 0x42, 0x48, 0x93, 0x77, 0x7C, 0xCD, 0x3B, 0x6F, 
-0x7D, 0xCB, 0xB7, 0xFC, 0xE6, 0xFB, 0x27, 0x4F, 0x3E, 0x33, 0xD9, 0xDC, 0xDC, 0x69, 0xBF, 0xED, 
-0xDB, 0xBE, 0x4D, 0x17, 0x91, 0x9E, 0x00, 0xC3, 0x52, 0x7D, 0x2C, 0xFC, 0xC8, 0xC7, 0xFF, 0xCA, 
-0xD6, 0x7F, 0xF7, 0x33, 0x7F, 0xE3, 0xEB, 0x3E, 0xF5, 0xA9, 0xCF, 0x7C, 0xF7, 0x74, 0xEA, 0xDF, 
-0xDC, 0x05, 0x73, 0xDE, 0xBA, 0xF1, 0x3A, 0xC1, 0x36, 0xA2, 0x35, 0x4F, 0x4A, 0xD2, 0xEA, 0xBE, 
-0x00, 0x15, 0x41, 0x53, 0x54, 0xFF, 0x5E, 0x01, 0x49, 0xE0, 0x2E, 0x92, 0xE4, 0x29, 0x28, 0x01, 
-0xCD, 0xA2, 0x4A, 0xAA, 0x32, 0xE5, 0xD4, 0x76, 0x8D, 0x91, 0x19, 0x46, 0x72, 0xDC, 0xFB, 0x94, 
-0xD4, 0xA0, 0x39, 0xB4, 0xB8, 0xE8, 0xA9, 0xD1, 0x88, 0x9E, 0xF3, 0xA9, 0x20, 0xEA, 0xF2, 0x30, 
-0xBF, 0x76, 0x31, 0x35, 0x3C, 0x06, 0x73, 0x59, 0x05, 0x5D, 0x4D, 0xD5, 0x67, 0x53, 0x3A, 0x51, 
-0x9E, 0xAA, 0x42, 0xEF, 0x78, 0x5E, 0xE8, 0x31, 0xD9, 0x04, 0x87, 0xDC, 0x98, 0xCA, 0xE6, 0x81, 
-0x47, 0x15, 0xB0, 0x4A, 0xC2, 0x2B, 0x3A, 0x4C, 0x6E, 0x84, 0x26, 0x95, 0xFC, 0x2F, 0xBC, 0xD7, 
-0xD3, 0x6F, 0xB0, 0x99, 0x91, 0x2E, 0xE7, 0x4B, 0x3D, 0x6D, 0x15, 0xB1, 0x4D, 0x27, 0x73, 0xFA, 
-0x3D, 0xA9, 0xB7, 0xC5, 0x14, 0x98, 0xAB, 0x1E, 0xFA, 0xDF, 0x03, 0x0B, 0x86, 0x70, 0x54, 0xD9, 
-0x0D, 0x3B, 0xE5, 0xCA, 0x6B, 0x0F, 0x91, 0xA8, 0x1E, 0x95, 0x0E, 0x9F, 0xCD, 0xE0, 0xF9, 0xE9, 
-0x08, 0xB5, 0xC2, 0xE2, 0xBA, 0x52, 0x03, 0x8B, 0x54, 0x4D, 0x9B, 0x0E, 0x1E, 0x1F, 0x9E, 0x5F, 
-0x59, 0xD6, 0x03, 0xAC, 0xFC, 0xDE, 0x7C, 0xFD, 0x51, 0x33, 0xA8, 0x61, 0xDE, 0x0F, 0x7B, 0xBE, 
-0x42, 0xF3, 0xA5, 0xAF, 0x5A, 0xCE, 0xAF, 0xDE, 0xB6, 0xFA, 0x3B, 0x74, 0x70, 0xE9, 0x3D, 0x25, 
-0x33, 0x33, 0xD0, 0x76, 0xAC, 0xC3, 0x70, 0x3F, 0xFF, 0xA5, 0xCC, 0x35, 0xDF, 0x8F, 0x9A, 0x21, 
-0x96, 0xF6, 0xB1, 0x34, 0x33, 0xC8, 0xF5, 0x67, 0x25, 0x91, 0xB2, 0x87, 0x2E, 0xE9, 0xCD, 0x04, 
-0xCB, 0x3D, 0x21, 0x69, 0x3B, 0x2F, 0xEE, 0x36, 0x53, 0xD6, 0xBB, 0x93, 0x74, 0xED, 0x84, 0x98, 
-0xA8, 0x8C, 0x6E, 0x33, 0x0E, 0x39, 0x1B, 0x22, 0x82, 0x14, 0x0B, 0x8F, 0xE4, 0x68, 0xDB, 0x88, 
-0x89, 0xE5, 0x46, 0x85, 0x2E, 0xA0, 0x3B, 0x66, 0x66, 0xCC, 0xBD, 0xAE, 0x61, 0x26, 0x8D, 0xDA, 
-0x2D, 0xE5, 0xE9, 0xA2, 0xAE, 0xA7, 0xFB, 0x07, 0x89, 0xF0, 0xD9, 0xC6, 0xC9, 0x7E, 0xB2, 0xF1, 
-0xA4, 0x33, 0x6C, 0xA1, 0xBE, 0xD0, 0x52, 0x4A, 0x41, 0x00, 0x31, 0x06, 0x71, 0x29, 0x25, 0x1F, 
-0x63, 0x2B, 0x89, 0x99, 0x18, 0x73, 0xDF, 0xDA, 0xEA, 0x76, 0x88, 0xE1, 0x8B, 0x6F, 0xBE, 0xFC, 
-0xD4, 0xAF, 0x7C, 0xCF, 0x77, 0xFF, 0x73, 0xFF, 0x73, 0xB5, 0xFD, 0xB5, 0xB7, 0x7E, 0xF8, 0x87, 
-0x1F, 0x9F, 0xF1, 0x1E, 0x5D, 0xAA, 0x87, 0xE0, 0x2F, 0xFD, 0xA5, 0x9F, 0xAF, 0x7E, 0xFC, 0xBF, 
-0xFC, 0x0F, 0xDF, 0xF3, 0xF9, 0x2F, 0x3E, 0xFF, 0xAF, 0xDF, 0xDF, 0xD9, 0xFD, 0xA8, 0xF7, 0xE9, 
-0x9C, 0x71, 0xEB, 0x2E, 0x06, 0x87, 0x48, 0x83, 0x88, 0x83, 0x98, 0x7D, 0x26, 0xCE, 0xF7, 0x39, 
-0x97, 0x57, 0xE5, 0x8E, 0x9C, 0xD3, 0x95, 0x48, 0x2D, 0xA4, 0x49, 0x66, 0xB6, 0x8B, 0x06, 0xA9, 
-0x0C, 0x43, 0x7D, 0xDB, 0x2E, 0x35, 0xD8, 0x44, 0xAF, 0xC1, 0x28, 0x0E, 0xEB, 0x0C, 0xC7, 0x81, 
-0x01, 0xAA, 0x79, 0x3E, 0x75, 0x07, 0x59, 0x69, 0x7F, 0xA5, 0x1B, 0x0D, 0xDB, 0xA3, 0xCC, 0x6D, 
-0x1E, 0x35, 0xED, 0x56, 0xE8, 0x0C, 0x96, 0x18, 0xDD, 0x00, 0xFD, 0xD2, 0x98, 0xDF, 0x59, 0x5A, 
-0xF3, 0x01, 0x76, 0xAC, 0x8C, 0x7A, 0x2E, 0x19, 0x2C, 0x41, 0x75, 0x78, 0x31, 0xFB, 0xA4, 0x9A, 
-0xBF, 0xB3, 0x78, 0x50, 0x9B, 0xBF, 0xA9, 0x0C, 0x08, 0x65, 0xEA, 0xBF, 0x90, 0x08, 0xCB, 0x00, 
-0x47, 0xAE, 0xB5, 0x84, 0x76, 0xD0, 0xD2, 0x51, 0x4B, 0xA7, 0xE8, 0xFF, 0x96, 0x04, 0x11, 0x65, 
-0xE6, 0xE5, 0xF7, 0x6B, 0x91, 0x92, 0x77, 0x95, 0x1D, 0xA5, 0x12, 0x48, 0x8F, 0x50, 0x19, 0xA4, 
-0x43, 0xF2, 0xFF, 0x24, 0xE9, 0x50, 0x65, 0x71, 0xDC, 0xE7, 0xF5, 0xEF, 0xC3, 0xA8, 0xCD, 0xEC, 
-0xD2, 0x75, 0xBD, 0x01, 0x3B, 0x26, 0xF5, 0x03, 0xD6, 0x67, 0xAB, 0x26, 0xEB, 0x44, 0xFB, 0xC7, 
-0x11, 0x59, 0xF4, 0xB2, 0x03, 0xDD, 0x2B, 0xB7, 0xE7, 0xB2, 0x2B, 0x2F, 0x0E, 0xB4, 0xCC, 0x4B, 
-0x2A, 0x83, 0xD2, 0x0E, 0x0E, 0x87, 0x1C, 0xD2, 0x96, 0x8B, 0xE0, 0x21, 0x49, 0x05, 0x04, 0xC9, 
-0x56, 0x08, 0x29, 0x25, 0x42, 0x52, 0x31, 0x44, 0x10, 0x8C, 0xB1, 0x9A, 0x97, 0x1C, 0x35, 0x1B, 
-0x34, 0xFF, 0xF3, 0x81, 0x25, 0x69, 0x10, 0x80, 0x92, 0x8F, 0xDE, 0x97, 0x95, 0x57, 0x91, 0xAF, 
-0x5C, 0x82, 0x60, 0x09, 0x38, 0x92, 0xDB, 0x20, 0x50, 0x21, 0xBD, 0x76, 0x09, 0x45, 0xF7, 0x1C, 
-0xF1, 0xDE, 0x63, 0x8C, 0x60, 0x45, 0x7F, 0xC7, 0xA4, 0x6E, 0x1F, 0xCB, 0x35, 0xC1, 0x4F, 0x31, 
-0x46, 0x6D, 0x8D, 0x03, 0x91, 0x91, 0xAC, 0x13, 0x52, 0x17, 0x3B, 0x26, 0x7B, 0xA7, 0x37, 0x4F, 
-0x7C, 0xE6, 0xDC, 0xB9, 0xAD, 0x4F, 0x7E, 0xF7, 0x47, 0xBF, 0xEF, 0xAF, 0xFF, 0xE9, 0x3F, 0xFD, 
-0x7F, 0x7E, 0x5E, 0x74, 0x8A, 0x76, 0x2C, 0xAC, 0xEA, 0xB1, 0x47, 0xE2, 0xEF, 0xFF, 0xFD, 0xBF, 
-0xEF, 0xFE, 0xFD, 0x3F, 0xFC, 0xE7, 0xBF, 0xF5, 0x73, 0x9F, 0x7B, 0xE9, 0x8F, 0xEF, 0x4D, 0x67, 
-0xDF, 0xE2, 0xDC, 0x68, 0x23, 0x82, 0x84, 0x64, 0x09, 0x01, 0xA0, 0xC6, 0x18, 0x4B, 0x8C, 0x13, 
-0xA0, 0x37, 0xC5, 0x28, 0x23, 0x6C, 0x96, 0xC8, 0x52, 0x2F, 0xDE, 0x50, 0xA9, 0x94, 0x45, 0x47, 
-0xCF, 0x5B, 0xFB, 0x4A, 0x71, 0x16, 0xC9, 0x31, 0xFF, 0xD4, 0x27, 0x2C, 0x1A, 0x88, 0x2C, 0x55, 
-0x48, 0xC1, 0x32, 0xC3, 0x1B, 0x4A, 0x11, 0x47, 0x32, 0x64, 0x89, 0x39, 0xF0, 0x51, 0xF6, 0xBB, 
-0xD9, 0x1B, 0x48, 0x0F, 0xBB, 0x4B, 0xF2, 0x3B, 0xE6, 0x52, 0x71, 0x19, 0xAD, 0xFB, 0xD7, 0x1C, 
-0x76, 0x73, 0x6E, 0xA8, 0x4B, 0xC8, 0xAB, 0xE1, 0x64, 0x5D, 0xD8, 0x5C, 0x92, 0x2F, 0x8B, 0x3E, 
-0x61, 0x79, 0x4A, 0xB8, 0x40, 0xEE, 0xF0, 0x58, 0x42, 0x9E, 0x01, 0x90, 0xDF, 0xDD, 0x6F, 0xAA, 
-0xF3, 0x8E, 0xDF, 0x2B, 0xA9, 0x64, 0xFA, 0x12, 0xE6, 0xE2, 0x3A, 0xD5, 0x08, 0x2E, 0x33, 0xDC, 
-0x03, 0x0C, 0x62, 0xC8, 0x48, 0xB2, 0xFC, 0x24, 0x03, 0x46, 0xF1, 0x4A, 0xD3, 0x39, 0xC3, 0xED, 
-0x31, 0x9C, 0xC2, 0x68, 0x16, 0x8C, 0xC9, 0x60, 0xD0, 0xF2, 0x1F, 0xE6, 0xEF, 0x40, 0x3E, 0x0F, 
-0x39, 0x7F, 0x9C, 0xB4, 0x3F, 0xC0, 0xF4, 0xCB, 0x05, 0x23, 0x1A, 0x2B, 0xB1, 0x77, 0xFD, 0xB0, 
-0xDC, 0x56, 0xBD, 0x7F, 0xCE, 0x78, 0x8D, 0x46, 0x42, 0x18, 0x9E, 0x3F, 0xEE, 0x80, 0xD6, 0x97, 
-0x2A, 0x73, 0x09, 0x65, 0x55, 0x9B, 0xA2, 0xE4, 0x07, 0x23, 0x03, 0x46, 0x5B, 0xEE, 0x21, 0x33, 
-0xBE, 0x05, 0x64, 0xF0, 0xBB, 0x30, 0xD3, 0x61, 0xBB, 0xD5, 0xF7, 0x1A, 0xC8, 0xEC, 0x52, 0x10, 
-0x9C, 0x71, 0x48, 0xD9, 0xF1, 0x05, 0x38, 0x67, 0xF0, 0xDE, 0x93, 0x48, 0xEA, 0xD9, 0x2F, 0x5F, 
-0xA7, 0xD0, 0x76, 0x13, 0x4D, 0x1E, 0xD8, 0x7B, 0x10, 0x91, 0x39, 0xFF, 0x30, 0xA6, 0xF0, 0x8F, 
-0xE5, 0x99, 0x9F, 0x7E, 0x99, 0x21, 0x04, 0x4B, 0x44, 0x67, 0x77, 0x85, 0x6D, 0xEB, 0x3B, 0x12, 
-0xE4, 0x33, 0x88, 0x46, 0x18, 0x11, 0xA3, 0x82, 0xDC, 0x9C, 0xFF, 0x48, 0x20, 0xD0, 0x66, 0xDB, 
-0x5D, 0xC7, 0x6C, 0xD6, 0x51, 0x99, 0x06, 0xE7, 0x1C, 0x93, 0xD9, 0x1E, 0x81, 0x36, 0x36, 0x36, 
-0xDD, 0x39, 0x79, 0x72, 0xED, 0x27, 0x3F, 0xFA, 0x03, 0xDF, 0xFD, 0x9F, 0xFD, 0xC5, 0xBF, 0xF8, 
-0xC3, 0xBF, 0xDA, 0xCB, 0xC0, 0x91, 0x18, 0x7C, 0xD2, 0xA3, 0xF1, 0xEF, 0xFE, 0x5B, 0x7F, 0xE6, 
-0x83, 0x3F, 0xF6, 0x63, 0x9F, 0xF8, 0x33, 0xED, 0x44, 0xBE, 0xA5, 0x43, 0x9C, 0x13, 0x93, 0xA7, 
-0x08, 0x80, 0x75, 0xA4, 0x98, 0x47, 0x34, 0xDA, 0xEC, 0x42, 0x31, 0x77, 0xF3, 0xB9, 0x0E, 0xB1, 
-0x8C, 0x78, 0xAB, 0x57, 0x2D, 0xF3, 0xB2, 0xD7, 0x9C, 0xC9, 0x0E, 0x19, 0xE3, 0x3C, 0xC3, 0x71, 
-0x59, 0xA2, 0x35, 0xBD, 0x67, 0x00, 0x99, 0x59, 0x1D, 0xC4, 0xFC, 0x3D, 0xC3, 0x16, 0x35, 0x80, 
-0x6E, 0x8E, 0x1D, 0xB0, 0xED, 0x2C, 0x51, 0xAE, 0x7C, 0xC6, 0x60, 0x55, 0xBF, 0x3F, 0x85, 0xEB, 
-0x63, 0xD8, 0x40, 0x87, 0x28, 0x1D, 0xAE, 0x34, 0x0C, 0xFD, 0xB2, 0xA2, 0x73, 0x54, 0x28, 0xE3, 
-0x15, 0xE2, 0xBC, 0xF7, 0x0E, 0xB1, 0x08, 0x7E, 0xA9, 0xDC, 0x59, 0x17, 0x53, 0xFA, 0xCF, 0x9B, 
-0x4B, 0xAA, 0xF9, 0x3B, 0xA2, 0x68, 0xA3, 0x2B, 0xC7, 0x0C, 0x92, 0x83, 0x64, 0x6A, 0xBA, 0x9C, 
-0x8F, 0xC5, 0x73, 0x56, 0xA5, 0xA9, 0x1F, 0x69, 0xF9, 0x09, 0xD1, 0x1F, 0x8C, 0x57, 0x1D, 0x7F, 
-0x14, 0x16, 0xE5, 0xB5, 0x9C, 0xAF, 0x55, 0xF9, 0x5D, 0x95, 0xAE, 0xFA, 0xCE, 0x47, 0x95, 0xC3, 
-0x42, 0x17, 0xDD, 0x43, 0x19, 0xC0, 0xFA, 0x8B, 0x52, 0xC7, 0x48, 0xFB, 0x12, 0xEA, 0xAA, 0x6F, 
-0x1E, 0x1E, 0x1B, 0x96, 0xD3, 0x02, 0xF9, 0x41, 0x45, 0xD0, 0xC9, 0xF7, 0x15, 0x95, 0xC7, 0xD0, 
-0xDA, 0x60, 0x31, 0x33, 0x5A, 0xFE, 0x8E, 0x61, 0xBB, 0x2D, 0xEF, 0x33, 0x03, 0x16, 0x52, 0x98, 
-0xA0, 0xB1, 0x8E, 0x2E, 0x26, 0x62, 0xCC, 0xDF, 0xDE, 0x83, 0x25, 0x0F, 0x08, 0x12, 0x21, 0xA5, 
-0xF9, 0x02, 0x65, 0x9F, 0x03, 0x04, 0x61, 0x69, 0x91, 0x6D, 0x8E, 0x9C, 0xAF, 0x45, 0x1F, 0x1C, 
-0x5E, 0xA3, 0xE7, 0x87, 0x8B, 0xD6, 0x05, 0x79, 0x8D, 0x5D, 0xEB, 0x52, 0x16, 0x02, 0x9E, 0x76, 
-0xED, 0x1C, 0xC1, 0x83, 0x00, 0x4E, 0x7D, 0x3A, 0x58, 0x2A, 0x42, 0x48, 0xC4, 0x98, 0x30, 0x52, 
-0xE1, 0x8C, 0xC1, 0x98, 0xA8, 0x0E, 0x76, 0x4C, 0x37, 0x5B, 0x5F, 0x33, 0x3F, 0xF5, 0x3B, 0xFF, 
-0x0F, 0xDF, 0xF9, 0xC7, 0xFF, 0xF2, 0x5F, 0xFE, 0x53, 0x5F, 0x1C, 0xBC, 0x6A, 0x25, 0x86, 0xB9, 
-0x3D, 0x12, 0x1F, 0xFF, 0xF8, 0x9F, 0xBF, 0xF4, 0xA3, 0xFF, 0xF9, 0xDF, 0xF8, 0x93, 0x77, 0x6E, 
-0x4D, 0x7E, 0x37, 0x69, 0xBC, 0x2E, 0xE2, 0x30, 0x16, 0x66, 0x7E, 0x97, 0x48, 0x87, 0x13, 0x08, 
-0x29, 0x60, 0x8D, 0x10, 0xA2, 0xEF, 0x35, 0x48, 0xD0, 0xF1, 0x65, 0x61, 0xE4, 0x6C, 0xC4, 0xE5, 
-0x4E, 0xBE, 0xAC, 0xCF, 0xD2, 0x0F, 0x4E, 0x0B, 0x37, 0xCD, 0x85, 0x99, 0x1F, 0x68, 0x74, 0x32, 
-0x67, 0xCA, 0xF4, 0x1A, 0x44, 0x91, 0xEE, 0x73, 0x00, 0x89, 0xC3, 0xD1, 0xAF, 0xCC, 0x03, 0xCF, 
-0x1E, 0x9C, 0x9F, 0x1F, 0x3B, 0xE4, 0x38, 0x2C, 0x84, 0x83, 0xF2, 0xAC, 0x03, 0x0D, 0x61, 0x35, 
-0x56, 0x37, 0x0B, 0x80, 0xE2, 0x44, 0xA4, 0xCF, 0x08, 0x32, 0x44, 0xCB, 0x2F, 0x95, 0x0E, 0xBA, 
-0x0A, 0xBD, 0x7C, 0x24, 0xE2, 0x01, 0x31, 0x68, 0x2E, 0x89, 0xF7, 0xAF, 0x25, 0xCE, 0x07, 0x15, 
-0x9B, 0x77, 0xEA, 0x0C, 0xEF, 0x17, 0xCC, 0xD2, 0x73, 0x86, 0xBF, 0x53, 0xE4, 0xA0, 0x38, 0xF4, 
-0x04, 0xE8, 0x33, 0x94, 0x61, 0xFB, 0xE8, 0x63, 0xC8, 0x68, 0xE6, 0x8C, 0xDA, 0x2C, 0x18, 0x58, 
-0x22, 0x1C, 0x60, 0x68, 0x8F, 0x4A, 0x95, 0xE1, 0x0C, 0xCB, 0x3F, 0xE6, 0x0E, 0x1E, 0x31, 0xC6, 
-0x2D, 0xFD, 0x1E, 0x32, 0xDC, 0xA0, 0xD3, 0xBD, 0x5E, 0xB9, 0x93, 0x1B, 0x89, 0xE4, 0x74, 0xB9, 
-0xDC, 0x96, 0x52, 0x00, 0x53, 0x66, 0x84, 0x87, 0x94, 0xE5, 0x61, 0xED, 0x30, 0xF7, 0x81, 0x14, 
-0xE3, 0xA0, 0x77, 0x97, 0x1F, 0x8B, 0x4D, 0x32, 0x8A, 0xDC, 0xBF, 0xE6, 0x65, 0xA7, 0xEF, 0x33, 
-0x2B, 0xA4, 0xD7, 0x3E, 0xCA, 0xF7, 0x09, 0x7D, 0xE9, 0x54, 0x91, 0x04, 0x5D, 0xF0, 0x4A, 0x89, 
-0x14, 0xF3, 0xB7, 0x1A, 0x87, 0x73, 0x35, 0x24, 0xD5, 0x6F, 0xA7, 0xF9, 0x26, 0x17, 0x7D, 0xA7, 
-0x24, 0x72, 0xB9, 0xAB, 0x44, 0x5A, 0x16, 0xD0, 0x16, 0x58, 0x7E, 0xC7, 0x90, 0x89, 0x2F, 0xB0, 
-0x3C, 0xB0, 0xAC, 0x86, 0xEA, 0x97, 0xE7, 0xC2, 0x5D, 0x9E, 0xC1, 0x15, 0x06, 0x9C, 0x24, 0x62, 
-0x1C, 0x84, 0xAE, 0x85, 0xE4, 0x70, 0xF5, 0x08, 0xF2, 0x56, 0x66, 0x23, 0x42, 0x08, 0x1D, 0xCE, 
-0x24, 0x90, 0x8E, 0x94, 0xF6, 0xEE, 0x5F, 0xB8, 0x70, 0xF2, 0x47, 0xFE, 0xC5, 0xDF, 0xFB, 0xBD, 
-0x7F, 0xE6, 0x3F, 0xF9, 0x4F, 0xFE, 0xAF, 0x0F, 0x06, 0x2F, 0x3A, 0x80, 0xC3, 0x6B, 0x6D, 0x80, 
-0xBF, 0xFD, 0xB7, 0xFF, 0x76, 0xF3, 0x87, 0xFE, 0xD0, 0xFF, 0xFB, 0x0F, 0xBE, 0xF8, 0xE2, 0xBD, 
-0xFF, 0x97, 0x33, 0xA7, 0x4F, 0xA4, 0x68, 0x68, 0x5C, 0x03, 0x32, 0xA3, 0x0B, 0xBB, 0x88, 0x4C, 
-0x58, 0xDF, 0x70, 0x48, 0x0A, 0x34, 0x23, 0x47, 0x55, 0xD9, 0x79, 0x87, 0x16, 0x59, 0xDE, 0xB5, 
-0x82, 0x11, 0xAC, 0xD8, 0xCC, 0x58, 0x17, 0x28, 0x95, 0x10, 0xFB, 0x0D, 0xB6, 0xD7, 0x79, 0xFB, 
-0x0D, 0x60, 0xDE, 0xB1, 0x06, 0xE5, 0x6A, 0x88, 0xFA, 0x5E, 0xD1, 0xF7, 0x9B, 0xA4, 0x26, 0x3A, 
-0xC3, 0x29, 0x39, 0x41, 0xAF, 0xEB, 0x1F, 0xEF, 0x5F, 0x27, 0x79, 0x4A, 0x3A, 0x6F, 0x18, 0x73, 
-0x09, 0xB6, 0x48, 0x70, 0x2A, 0xE1, 0xE8, 0x6E, 0x1B, 0x6D, 0x54, 0x22, 0x69, 0xC5, 0xC8, 0xBA, 
-0xBA, 0xE3, 0x96, 0x54, 0x0E, 0xE9, 0xF0, 0x29, 0xEB, 0xAF, 0xE9, 0x7D, 0xAB, 0x96, 0x8D, 0x16, 
-0x6A, 0x3A, 0x62, 0xE1, 0xC5, 0x00, 0x26, 0x4F, 0x4F, 0xF5, 0xC0, 0xB2, 0x09, 0x9B, 0xDE, 0xBB, 
-0x78, 0x26, 0xA5, 0x8E, 0x24, 0x47, 0x1C, 0xC6, 0x12, 0x4B, 0xE5, 0x65, 0x73, 0xA2, 0x22, 0xA1, 
-0x0D, 0x25, 0xB5, 0xE1, 0xEF, 0xC2, 0xE0, 0xFA, 0x76, 0x9E, 0x4F, 0x92, 0x1E, 0x66, 0x27, 0x5A, 
-0x8E, 0x0B, 0xF6, 0x50, 0x33, 0x27, 0xED, 0x48, 0xBA, 0x51, 0x61, 0x95, 0xBD, 0x6D, 0x20, 0xCD, 
-0x57, 0xD7, 0x87, 0xED, 0xA2, 0xB4, 0xB1, 0x7E, 0x99, 0xF7, 0x31, 0x3C, 0x3E, 0x4C, 0x4B, 0x3D, 
-0x38, 0x57, 0x1F, 0x28, 0xF3, 0x7E, 0x7A, 0x34, 0xB4, 0xBE, 0x62, 0x8E, 0x78, 0xAB, 0x9F, 0xBC, 
-0xFC, 0x1D, 0x47, 0xE5, 0x7F, 0x3E, 0xBB, 0xEB, 0x5B, 0x0D, 0x0C, 0x76, 0x86, 0xA9, 0x80, 0xBB, 
-0x60, 0x7C, 0x9A, 0xAF, 0x85, 0xEE, 0xDE, 0x40, 0x36, 0xCD, 0x13, 0x96, 0x07, 0x0A, 0x4D, 0x9D, 
-0xAB, 0x96, 0x7E, 0x9B, 0x24, 0x24, 0x03, 0x16, 0x43, 0x14, 0xDD, 0xCC, 0x83, 0x58, 0x44, 0x72, 
-0x24, 0x86, 0x60, 0x99, 0xF9, 0x40, 0xDB, 0x25, 0x5A, 0x1F, 0x55, 0x87, 0x9B, 0x23, 0xAC, 0x48, 
-0xCA, 0x8B, 0x7C, 0xB1, 0xAC, 0x98, 0x68, 0xFF, 0x2B, 0xCC, 0xB3, 0x40, 0xF3, 0xB6, 0xF8, 0x1E, 
-0xBD, 0x6E, 0xB5, 0x39, 0x9B, 0x71, 0xCA, 0x90, 0x57, 0x97, 0xBB, 0xC6, 0x44, 0x4B, 0x29, 0x4B, 
-0xD9, 0xDA, 0xAB, 0x17, 0xA7, 0x8D, 0xAA, 0x2C, 0x7C, 0x8A, 0xC4, 0x2E, 0x61, 0x4D, 0x43, 0xE8, 
-0x12, 0x74, 0x11, 0xEB, 0x1A, 0x62, 0xE8, 0x68, 0x6A, 0x07, 0x71, 0x86, 0x75, 0x3E, 0xCD, 0xDA, 
-0x07, 0x57, 0xDE, 0xF7, 0x35, 0x6F, 0xF9, 0xB7, 0x7F, 0xF1, 0x57, 0x7E, 0xF2, 0x27, 0xA5, 0x78, 
-0xDE, 0x3A, 0x04, 0xC7, 0x66, 0xB8, 0x1F, 0xFF, 0xF8, 0x8F, 0x3E, 0xF5, 0xE7, 0x7F, 0xE4, 0xBF, 
-0xFA, 0x4B, 0x93, 0xE9, 0xE8, 0x77, 0xCC, 0x66, 0xD6, 0x8C, 0x9B, 0x35, 0xA6, 0xB3, 0x3D, 0x42, 
-0xBA, 0x4D, 0x5D, 0x47, 0xDE, 0xF3, 0xDE, 0xCB, 0x7C, 0xEB, 0xB7, 0x7C, 0x88, 0x37, 0x3D, 0x7B, 
-0x91, 0x0B, 0x17, 0xCF, 0x22, 0x12, 0x96, 0x18, 0x6A, 0xE9, 0xD0, 0xC6, 0xB8, 0x25, 0xB6, 0x33, 
-0x44, 0x29, 0x98, 0xD8, 0x2D, 0x9F, 0x4D, 0x45, 0x3F, 0x37, 0x6F, 0x1C, 0x0A, 0x49, 0xCB, 0x85, 
-0x39, 0x67, 0xA8, 0x79, 0xC7, 0x92, 0x0C, 0x74, 0x5F, 0x45, 0x77, 0x96, 0x82, 0x9A, 0xCE, 0x0C, 
-0xCF, 0x6B, 0xAA, 0x7B, 0xB4, 0x41, 0xA7, 0x5E, 0x29, 0xA9, 0xD3, 0xF2, 0x52, 0xE1, 0x43, 0x86, 
-0xAB, 0x51, 0x28, 0xF2, 0xEF, 0x9E, 0x33, 0xE4, 0x9C, 0xC3, 0x95, 0x0D, 0xF6, 0x91, 0xA9, 0xD1, 
-0xC6, 0x30, 0xEF, 0x10, 0xB9, 0x71, 0xF6, 0xF3, 0x55, 0xBE, 0xB7, 0x2F, 0xB1, 0x94, 0xB4, 0xB6, 
-0x0B, 0x49, 0xA6, 0x08, 0x4D, 0xA9, 0x4C, 0x97, 0xE8, 0xEB, 0xC0, 0x16, 0xE5, 0x3C, 0x67, 0xBA, 
-0xC9, 0xD0, 0x34, 0xEB, 0x5A, 0x5F, 0xE2, 0x96, 0x18, 0xEE, 0x90, 0xC1, 0x1D, 0x76, 0xFC, 0x95, 
-0x32, 0xDC, 0x18, 0xF2, 0x74, 0xB7, 0xF7, 0x9E, 0xBE, 0xA4, 0x7A, 0xD8, 0x00, 0x50, 0xDE, 0x1B, 
-0x73, 0x48, 0x96, 0x7E, 0xA9, 0xAE, 0x5A, 0x7C, 0x1A, 0xA6, 0x8B, 0x99, 0xC1, 0xA2, 0x03, 0x2F, 
-0x77, 0x56, 0x45, 0x11, 0x08, 0xFA, 0xED, 0xB1, 0x7F, 0x5D, 0xC8, 0x53, 0xAC, 0xFE, 0xB1, 0xC3, 
-0xFE, 0xEF, 0xA3, 0xD4, 0x49, 0xCA, 0x92, 0xD6, 0x30, 0x7F, 0xFD, 0x7C, 0xAE, 0x3A, 0xAE, 0xA9, 
-0xC1, 0xB9, 0x5A, 0xEB, 0x32, 0x0B, 0x3A, 0x6A, 0x31, 0xB0, 0x10, 0x7A, 0x74, 0xD1, 0x4A, 0x19, 
-0x4F, 0x8C, 0xA5, 0xBD, 0xF7, 0xFA, 0x5C, 0x58, 0x2C, 0x7A, 0xAF, 0x4A, 0x63, 0x60, 0xA9, 0x3E, 
-0x0C, 0x16, 0x4C, 0x5A, 0xA4, 0xCE, 0x65, 0x4D, 0xA9, 0xA3, 0x0B, 0xC2, 0xCD, 0x3B, 0x0F, 0x78, 
-0xFE, 0x85, 0x6B, 0xDC, 0xBC, 0xBB, 0x43, 0xDB, 0x45, 0xA6, 0xB3, 0x40, 0x48, 0x46, 0x83, 0x38, 
-0xE7, 0x3E, 0x16, 0x63, 0x9C, 0x3B, 0x17, 0x2F, 0xFD, 0x7F, 0x58, 0x4E, 0x7D, 0x5D, 0xB4, 0x7E, 
-0xCB, 0xA2, 0x1F, 0xF6, 0x51, 0x2E, 0x3B, 0xAC, 0x7E, 0xAC, 0x2D, 0xF7, 0xE9, 0x85, 0x29, 0x0B, 
-0x21, 0xC6, 0x18, 0x8D, 0xC4, 0x2C, 0x0E, 0x49, 0x86, 0xE9, 0xB4, 0xC3, 0x77, 0x70, 0xE7, 0xE6, 
-0x3D, 0x6E, 0x5E, 0xBB, 0x4D, 0xF4, 0x3A, 0x58, 0x0B, 0x11, 0xDF, 0x4D, 0x70, 0xB6, 0x23, 0xF8, 
-0xFD, 0x30, 0xAA, 0xC3, 0x5F, 0xFB, 0x3F, 0xFD, 0x91, 0x7F, 0xE9, 0xDF, 0xFD, 0x53, 0x7F, 0xEA, 
-0xFF, 0x76, 0x6F, 0xFE, 0x92, 0x15, 0x58, 0xE4, 0xFE, 0x11, 0x78, 0xEF, 0x7B, 0xBF, 0xFB, 0x63, 
-0x9F, 0xFE, 0xB5, 0x97, 0xFF, 0x53, 0x49, 0xDB, 0x4F, 0xA9, 0x25, 0x82, 0x10, 0xD9, 0x67, 0x73, 
-0xBD, 0xE3, 0x37, 0x7D, 0xF3, 0xBB, 0xF8, 0x5D, 0xBF, 0xEB, 0xDB, 0xF9, 0x1D, 0xBF, 0xE3, 0x5B, 
-0x59, 0x5F, 0xB7, 0x59, 0xC7, 0xA1, 0x8C, 0xAC, 0xFF, 0x91, 0x7D, 0x06, 0x30, 0x1C, 0x99, 0xFA, 
-0x1F, 0x4E, 0x8F, 0x91, 0x94, 0x63, 0xA5, 0x42, 0x08, 0x5A, 0x39, 0x5A, 0x60, 0x8A, 0x94, 0x3B, 
-0x52, 0xFF, 0xFE, 0xD4, 0x53, 0xA6, 0x0F, 0xD3, 0x55, 0xE8, 0x9F, 0x8B, 0x52, 0xEC, 0x18, 0xF3, 
-0x94, 0xB1, 0x1F, 0x3F, 0x2D, 0x43, 0xAD, 0x04, 0xD2, 0x92, 0xD4, 0xD0, 0xCF, 0x6F, 0x9C, 0x5F, 
-0xBB, 0xBA, 0x4B, 0x3C, 0xCA, 0x3C, 0xC9, 0x18, 0xA3, 0x41, 0x1D, 0x4B, 0x43, 0xEC, 0x4D, 0xC5, 
-0xCA, 0x3B, 0x00, 0x4C, 0x56, 0xD3, 0x14, 0x02, 0x9D, 0x0E, 0x56, 0xC6, 0xAA, 0x0F, 0x0A, 0xB1, 
-0xA4, 0x2C, 0xB6, 0x45, 0xF4, 0x59, 0x91, 0xA0, 0x2A, 0x89, 0xFC, 0xFC, 0xA2, 0xAB, 0x95, 0x94, 
-0x25, 0xF6, 0x94, 0x9F, 0x9C, 0x1B, 0xB4, 0xEA, 0x13, 0x17, 0x92, 0xF9, 0x50, 0x17, 0x3A, 0xB4, 
-0xA3, 0xED, 0x0F, 0x48, 0xFD, 0xE3, 0x8F, 0x93, 0x96, 0xA9, 0xFA, 0x71, 0x9E, 0x53, 0xDE, 0xBF, 
-0xAC, 0x63, 0xD5, 0x05, 0x99, 0x3E, 0xA3, 0x18, 0xFE, 0x3E, 0xF4, 0x78, 0xAF, 0x2E, 0x87, 0xCF, 
-0xED, 0xAB, 0x14, 0x86, 0x3A, 0xEE, 0xC5, 0x75, 0xCB, 0x76, 0xB6, 0xAB, 0xDA, 0xDD, 0xAA, 0x63, 
-0xCB, 0xD0, 0x3E, 0xC4, 0xB1, 0xAE, 0x1D, 0xC2, 0xCC, 0xD7, 0x48, 0x8C, 0x31, 0x18, 0xA3, 0x21, 
-0x67, 0xD4, 0xDB, 0x99, 0xB6, 0x93, 0xD2, 0x96, 0x82, 0x57, 0x37, 0x88, 0x29, 0x25, 0x02, 0x41, 
-0xC3, 0xFC, 0x14, 0x31, 0xFF, 0x08, 0x0C, 0xFB, 0xAB, 0x0C, 0xFC, 0x30, 0xA4, 0x94, 0xF0, 0x31, 
-0x52, 0xD5, 0x1B, 0x44, 0x2C, 0xCF, 0xBF, 0x78, 0x83, 0x7F, 0xFA, 0xCB, 0x9F, 0xE1, 0x85, 0x97, 
-0x6F, 0xE1, 0xA3, 0x65, 0xDA, 0x46, 0x62, 0x32, 0x84, 0x20, 0xF8, 0x18, 0x89, 0x51, 0x7D, 0x20, 
-0xA7, 0xDC, 0xBF, 0xFB, 0xA1, 0xD6, 0xFB, 0xEF, 0x29, 0xFF, 0x1F, 0xE6, 0x4D, 0xAD, 0x9C, 0x8F, 
-0xBD, 0xD9, 0x69, 0xA1, 0xE5, 0xE7, 0x68, 0x1F, 0x1B, 0x7E, 0x87, 0x31, 0x06, 0x6B, 0x2D, 0xB5, 
-0xD4, 0x10, 0xC0, 0xFB, 0x88, 0xB3, 0x0D, 0xD7, 0xAE, 0xDC, 0xE4, 0x17, 0xFF, 0xC9, 0x2F, 0x71, 
-0xF3, 0xDA, 0x6D, 0x42, 0x17, 0xB1, 0x92, 0xA8, 0x1C, 0xB4, 0xB3, 0x5D, 0x52, 0x98, 0xB0, 0xB5, 
-0xE9, 0x7E, 0xED, 0xE2, 0x85, 0x13, 0x7F, 0xE8, 0x33, 0x5F, 0xF8, 0x7B, 0xFF, 0x6B, 0x7E, 0xC1, 
-0x4A, 0x94, 0x56, 0x75, 0x24, 0x3E, 0xFE, 0xF1, 0xBF, 0xB4, 0xF6, 0xE7, 0xFF, 0xFC, 0x8F, 0xFE, 
-0xD9, 0x7B, 0xF7, 0xD3, 0xEF, 0xAB, 0xCC, 0xC9, 0xC6, 0xC7, 0x84, 0x73, 0xD0, 0x76, 0xF7, 0x78, 
-0xF3, 0x9B, 0x37, 0xF9, 0x13, 0xFF, 0xD1, 0x1F, 0xE1, 0xA3, 0x1F, 0xFD, 0x08, 0xCE, 0x4D, 0x09, 
-0x61, 0x2F, 0xC7, 0x0F, 0x72, 0xC4, 0xCC, 0xA8, 0x8A, 0x34, 0x55, 0x1C, 0xD3, 0xB8, 0xAA, 0x5A, 
-0xD2, 0x7D, 0xF5, 0x0B, 0x53, 0x11, 0x21, 0xF9, 0xB9, 0x32, 0xBD, 0x0F, 0x39, 0xB0, 0x0A, 0xBB, 
-0x2C, 0x51, 0xF6, 0x1B, 0x40, 0x1F, 0xC3, 0xDF, 0x05, 0xFD, 0x8A, 0xEA, 0xFF, 0x4F, 0x9E, 0x92, 
-0x90, 0xA7, 0x75, 0xFD, 0xEB, 0xF3, 0x51, 0xB5, 0x76, 0x0D, 0x91, 0xAA, 0xAA, 0x68, 0x83, 0xC7, 
-0x5A, 0xCB, 0xAC, 0x6D, 0xB5, 0xC2, 0x55, 0x0E, 0x19, 0x8C, 0xC0, 0xCB, 0x0C, 0xA5, 0xAF, 0x8A, 
-0x58, 0x4E, 0xF5, 0x1D, 0x21, 0x0F, 0x58, 0x55, 0x55, 0x11, 0x63, 0xA4, 0x6D, 0x5B, 0x9C, 0x73, 
-0xC4, 0x18, 0xB1, 0x56, 0x54, 0x2D, 0xE2, 0xB5, 0x4C, 0x53, 0x8C, 0x38, 0xE7, 0x18, 0x8D, 0x46, 
-0xC4, 0x2E, 0xE2, 0xA4, 0x61, 0x36, 0x9B, 0xD1, 0x8C, 0xC7, 0x60, 0x0C, 0xAD, 0x6F, 0x31, 0xCE, 
-0x12, 0x51, 0xC9, 0x24, 0x24, 0x94, 0x29, 0x65, 0x49, 0x46, 0xB0, 0xA4, 0xD0, 0x65, 0x7F, 0xA2, 
-0xEA, 0x30, 0xC8, 0x65, 0x49, 0x28, 0xC6, 0xB0, 0x64, 0x07, 0x5A, 0x7E, 0x8B, 0x90, 0x5D, 0xF8, 
-0x71, 0x60, 0xC0, 0xE8, 0x0F, 0x28, 0x49, 0x15, 0xBB, 0x4B, 0xBF, 0x1F, 0x3D, 0xE0, 0x58, 0x38, 
-0xC4, 0xFE, 0x74, 0x55, 0xBA, 0xFC, 0xBC, 0x52, 0xEE, 0x2C, 0x0D, 0xEC, 0x43, 0xD5, 0x44, 0x61, 
-0xB4, 0xAB, 0x18, 0xEE, 0x82, 0x61, 0x1E, 0x64, 0xF0, 0x10, 0xE7, 0x53, 0xF2, 0x61, 0xFD, 0x96, 
-0xF7, 0xC6, 0xBC, 0xA8, 0xBB, 0xD4, 0xA6, 0x38, 0x38, 0xF8, 0x2F, 0xB7, 0xE5, 0xFE, 0xF1, 0xEC, 
-0xD6, 0xB0, 0x87, 0x61, 0x3F, 0x39, 0xAC, 0x4D, 0xAB, 0x74, 0x97, 0xF5, 0x94, 0x29, 0x69, 0x9B, 
-0xB2, 0xD9, 0x9D, 0xA2, 0x64, 0x26, 0x2C, 0xEA, 0xB6, 0xD0, 0x7B, 0xF5, 0x0B, 0x61, 0x8C, 0xA1, 
-0xF5, 0x33, 0x74, 0xCC, 0x58, 0x7E, 0xCF, 0x2A, 0x0C, 0xDF, 0x1D, 0x65, 0xD1, 0x7F, 0x9C, 0x28, 
-0xE3, 0x6D, 0xDB, 0x96, 0x51, 0xBD, 0x8D, 0x47, 0xF8, 0xF2, 0x73, 0x57, 0xF9, 0xD9, 0xFF, 0xED, 
-0x1F, 0xD1, 0x05, 0xC7, 0xDD, 0xFB, 0xFB, 0x44, 0x2C, 0x21, 0x1A, 0x82, 0x87, 0x2E, 0xEA, 0xC0, 
-0xA5, 0xCE, 0xC2, 0x93, 0xB6, 0x97, 0xA8, 0x0B, 0xBB, 0x07, 0xDF, 0xB7, 0x18, 0x30, 0x0A, 0x83, 
-0xEF, 0x33, 0x79, 0xB4, 0x76, 0x74, 0xA7, 0x61, 0x76, 0x64, 0x53, 0x06, 0x97, 0x7E, 0x99, 0xF7, 
-0xEB, 0x47, 0xCF, 0xE9, 0xFF, 0xC6, 0x59, 0x0D, 0x54, 0x1B, 0x0D, 0xEB, 0xEB, 0x1B, 0x18, 0x71, 
-0xD4, 0x76, 0x44, 0xF0, 0xF0, 0xE9, 0x4F, 0x7D, 0x96, 0xFF, 0xED, 0x67, 0xFF, 0x01, 0x57, 0x9E, 
-0x7F, 0x89, 0xA6, 0xAA, 0x99, 0x4D, 0xF7, 0x31, 0xE2, 0x69, 0x5C, 0xA2, 0x6D, 0xEF, 0xEE, 0x5E, 
-0xBE, 0x70, 0xFA, 0x87, 0xFF, 0xF4, 0x9F, 0xFB, 0x63, 0x7F, 0xE6, 0x63, 0x1F, 0xFB, 0xD8, 0x42, 
-0x1F, 0x38, 0xC0, 0xEA, 0x1A, 0x1B, 0xE0, 0x07, 0x7F, 0xF0, 0xDF, 0x7B, 0xEA, 0x27, 0x7F, 0xF2, 
-0xEF, 0xFD, 0xF7, 0x0F, 0x1E, 0x74, 0x1F, 0xB2, 0xF6, 0x8C, 0x58, 0x6B, 0xF1, 0x61, 0x8F, 0xAA, 
-0xDE, 0xE3, 0x3B, 0x7E, 0xFB, 0x07, 0xF9, 0xB3, 0x3F, 0xF2, 0x71, 0x9E, 0x7E, 0x7A, 0x9B, 0xE9, 
-0xF4, 0x2E, 0xE3, 0x4A, 0x1B, 0xC9, 0xAC, 0x75, 0x74, 0x5D, 0xC0, 0xFB, 0x1C, 0xAA, 0x38, 0x37, 
-0x42, 0x00, 0xB1, 0x66, 0xFE, 0x7F, 0x41, 0x7F, 0xAA, 0x80, 0xC4, 0x2C, 0x2D, 0x44, 0x96, 0xA6, 
-0x4E, 0xBD, 0x06, 0x37, 0xBF, 0x3F, 0xDB, 0xFB, 0x2D, 0x15, 0x68, 0x8F, 0xC9, 0x17, 0x95, 0x41, 
-0x51, 0x25, 0x0C, 0xED, 0x2F, 0x87, 0xC7, 0x4B, 0xEA, 0x53, 0xE9, 0xB0, 0xFA, 0xDE, 0x45, 0x1B, 
-0xD4, 0x7C, 0x7A, 0xEF, 0x71, 0x75, 0x4D, 0x17, 0x34, 0x06, 0xDB, 0x74, 0xD6, 0x51, 0x8D, 0x1A, 
-0xC6, 0xE3, 0x31, 0x18, 0xA1, 0x0D, 0x3E, 0xB3, 0xDC, 0x83, 0x1D, 0x85, 0x7E, 0xFE, 0x7B, 0x58, 
-0x5C, 0xB7, 0x68, 0x48, 0xAD, 0xEF, 0xE6, 0x9D, 0x3F, 0xFA, 0x90, 0xE3, 0x33, 0x45, 0x42, 0xE7, 
-0x91, 0x14, 0x98, 0xEE, 0xCF, 0x90, 0x18, 0x18, 0x8D, 0x46, 0xAA, 0xD0, 0xEF, 0x3C, 0xDE, 0x47, 
-0x9A, 0x7A, 0x4D, 0xFD, 0x84, 0x22, 0xB4, 0xA1, 0x65, 0x6B, 0x7B, 0x9B, 0x66, 0x6D, 0x4C, 0xEB, 
-0xBB, 0xB9, 0x55, 0x49, 0x48, 0x1A, 0x19, 0x55, 0x92, 0x4E, 0x91, 0x53, 0x6E, 0x98, 0x2E, 0x41, 
-0xF2, 0x53, 0x2D, 0xFF, 0x43, 0xEC, 0x4C, 0xFB, 0x2A, 0x99, 0x55, 0xA9, 0xC9, 0x86, 0x61, 0xFD, 
-0xE3, 0x87, 0x99, 0x51, 0xAD, 0x4A, 0xFB, 0xEF, 0x1D, 0x3E, 0x27, 0x09, 0x58, 0x31, 0x2B, 0x55, 
-0x45, 0x9A, 0x1A, 0x24, 0xAA, 0xEA, 0x6A, 0xF5, 0x79, 0xBD, 0x7F, 0xF8, 0x9E, 0xBE, 0x3D, 0xEC, 
-0xE2, 0xFB, 0x56, 0xFB, 0x2A, 0x38, 0x32, 0x45, 0x67, 0x19, 0x7D, 0x73, 0x35, 0xF2, 0xAC, 0x27, 
-0x45, 0x8D, 0x64, 0x61, 0x8D, 0x2E, 0x2A, 0x0D, 0xCF, 0x97, 0x54, 0x9F, 0xA7, 0xD1, 0xA9, 0xCB, 
-0x77, 0xF6, 0xDB, 0x71, 0x65, 0xDD, 0x3C, 0xFF, 0xAB, 0xCE, 0x87, 0xD0, 0xCD, 0x07, 0xF0, 0x90, 
-0xF2, 0x80, 0xE3, 0xAC, 0xCE, 0x0C, 0xC5, 0xAA, 0x1D, 0x6A, 0xE5, 0x38, 0x73, 0xE6, 0x0C, 0x62, 
-0x0D, 0x5D, 0xD7, 0x91, 0x24, 0xD2, 0x75, 0x01, 0xE7, 0x0C, 0xB3, 0x4E, 0x57, 0xF1, 0x57, 0xCD, 
-0x08, 0xCA, 0x80, 0xB5, 0xF4, 0x7B, 0x3E, 0xB3, 0xD0, 0x35, 0x8D, 0x4A, 0xA0, 0xEB, 0x02, 0x62, 
-0x6B, 0x84, 0x8A, 0x5F, 0xF9, 0xD4, 0x67, 0xF9, 0xC5, 0x5F, 0xF8, 0x14, 0xB3, 0x4E, 0x98, 0xCE, 
-0x3C, 0x29, 0x5A, 0x42, 0x14, 0x62, 0xD4, 0xBE, 0x30, 0xDF, 0x04, 0x41, 0xC8, 0x51, 0xB7, 0x17, 
-0xB3, 0xD6, 0x3E, 0x73, 0x5F, 0xD6, 0x49, 0x2F, 0x7B, 0xCA, 0x23, 0xF7, 0xA1, 0x24, 0xC5, 0xB6, 
-0x57, 0x55, 0x14, 0xF3, 0x7B, 0x07, 0x83, 0x1F, 0xA2, 0x8B, 0x60, 0x88, 0xAA, 0xD1, 0xC4, 0xAA, 
-0x74, 0x6B, 0xAD, 0xC5, 0x99, 0x2A, 0x33, 0x63, 0x58, 0x5F, 0xDB, 0x64, 0x6B, 0x7D, 0x8B, 0x6B, 
-0x57, 0x6E, 0xF2, 0x8F, 0x7F, 0xEE, 0x17, 0xF9, 0xD2, 0xE7, 0xBF, 0xC4, 0x74, 0x77, 0x1F, 0x62, 
-0xA4, 0xAE, 0x84, 0xD0, 0xEE, 0xE1, 0xEC, 0xD4, 0xD7, 0x35, 0x7F, 0xFD, 0x5F, 0xFD, 0xD8, 0xBF, 
-0xF0, 0x87, 0x7E, 0xE4, 0xC7, 0x7F, 0xF8, 0xFE, 0xE2, 0x25, 0xCB, 0xE8, 0xBD, 0x7D, 0x35, 0x3E, 
-0xF1, 0x89, 0x4F, 0xD8, 0x3F, 0xFA, 0x47, 0xFF, 0xEC, 0xF7, 0xDC, 0xB8, 0xBE, 0xFF, 0x5F, 0x75, 
-0xDD, 0xF8, 0xB4, 0xC8, 0x1A, 0x31, 0xCD, 0x70, 0xCE, 0x73, 0xF2, 0x8C, 0xE5, 0xDF, 0xFA, 0xB7, 
-0x7F, 0x80, 0x3F, 0xFE, 0xEF, 0xFD, 0x41, 0xAC, 0x99, 0x62, 0xC4, 0x93, 0x3A, 0xCF, 0xCF, 0xFF, 
-0x93, 0x5F, 0xE2, 0xF3, 0x5F, 0x7C, 0x81, 0xC9, 0xB4, 0x65, 0x36, 0x9B, 0x2D, 0x46, 0x9E, 0x18, 
-0x09, 0x41, 0xFD, 0x22, 0x14, 0x26, 0x52, 0xCC, 0x3A, 0xCA, 0x35, 0x29, 0xEA, 0x68, 0x99, 0x92, 
-0x1C, 0x68, 0x90, 0x7A, 0x7E, 0xF9, 0xFA, 0xF2, 0xFF, 0x90, 0xE9, 0x26, 0x9F, 0xCF, 0xA7, 0x44, 
-0x88, 0xCA, 0xB8, 0xCB, 0x73, 0x12, 0x10, 0x43, 0xD6, 0x86, 0x0E, 0x3A, 0x82, 0x9E, 0x37, 0x84, 
-0x94, 0x4D, 0xAB, 0xF2, 0x33, 0x4D, 0x66, 0xEC, 0x05, 0x5D, 0xEB, 0x19, 0xAD, 0xAF, 0x11, 0x52, 
-0x44, 0xAC, 0xC5, 0xC7, 0xC0, 0xF9, 0x8B, 0x17, 0xB8, 0x78, 0xF9, 0x69, 0x5C, 0x5D, 0xE1, 0x93, 
-0xCA, 0xB8, 0xC3, 0xD1, 0xB5, 0x60, 0x9E, 0xCF, 0x52, 0x36, 0x73, 0xF6, 0xAC, 0x10, 0xB1, 0x2A, 
-0x39, 0x67, 0x89, 0xD9, 0x18, 0x43, 0x0A, 0x3A, 0x2A, 0x47, 0x1F, 0xB0, 0x22, 0x5C, 0xBF, 0x7A, 
-0x85, 0xCF, 0xFD, 0xDA, 0xE7, 0xB8, 0x75, 0xF3, 0x3A, 0x23, 0x5B, 0x41, 0x4A, 0x74, 0xD3, 0x19, 
-0xB6, 0xAE, 0x48, 0xD1, 0x62, 0xEA, 0x0A, 0xE3, 0x1C, 0x55, 0x53, 0xF1, 0x75, 0xDF, 0xF8, 0x0D, 
-0x9C, 0xBD, 0x70, 0x5E, 0x75, 0x75, 0xD6, 0x30, 0x9B, 0xCD, 0x88, 0x31, 0xE6, 0x7D, 0xE8, 0x09, 
-0xDF, 0x75, 0x58, 0x31, 0x38, 0x31, 0x84, 0xD9, 0x94, 0x2F, 0x7C, 0xF6, 0xD3, 0x84, 0xAE, 0x25, 
-0x74, 0x7E, 0xCE, 0x90, 0x42, 0x09, 0xAC, 0x68, 0x35, 0xAC, 0x49, 0xBF, 0xC3, 0x13, 0xD5, 0x85, 
-0xE6, 0x90, 0x31, 0x0E, 0x19, 0x76, 0x49, 0xFB, 0xCF, 0x5D, 0x95, 0x0E, 0x19, 0xFA, 0xF0, 0x39, 
-0xD1, 0xAB, 0x09, 0xDB, 0x90, 0xD1, 0x68, 0x2A, 0xA4, 0x80, 0xD6, 0x5F, 0xEF, 0x78, 0x9F, 0x41, 
-0x0F, 0x9F, 0x5F, 0xD2, 0xF2, 0x5D, 0x85, 0x21, 0xAF, 0x64, 0xA8, 0x59, 0x67, 0x19, 0x73, 0x74, 
-0xE8, 0x24, 0xDA, 0x68, 0x17, 0xE7, 0xA1, 0x9D, 0xCE, 0x96, 0xF2, 0x97, 0x42, 0x24, 0x24, 0x9D, 
-0x32, 0x47, 0x12, 0xB3, 0xC9, 0x74, 0x29, 0x5F, 0x25, 0x5D, 0xE4, 0x4B, 0xAF, 0x1B, 0x9E, 0x2F, 
-0xCF, 0x8B, 0x5E, 0xD7, 0x48, 0xFA, 0xDF, 0xDF, 0x2F, 0x07, 0xB5, 0xA2, 0x50, 0x06, 0xE5, 0x93, 
-0x4A, 0xE4, 0xD6, 0x39, 0xAA, 0xA6, 0x26, 0xA0, 0x1E, 0xF9, 0x2E, 0x5D, 0xBE, 0xCC, 0xD7, 0x7D, 
-0xC3, 0xD7, 0xB3, 0xBE, 0xB9, 0xC1, 0xAC, 0x6D, 0x71, 0x95, 0x61, 0x6F, 0x77, 0x82, 0x38, 0xC9, 
-0x56, 0x3E, 0x65, 0x06, 0x7A, 0x50, 0xA5, 0xB2, 0x3C, 0x43, 0x0D, 0x1A, 0x2D, 0xB7, 0xC7, 0x70, 
-0x47, 0x79, 0x86, 0x18, 0x7C, 0xC2, 0x89, 0xE3, 0x1F, 0xFE, 0x83, 0x9F, 0xE7, 0x8B, 0x5F, 0xF8, 
-0x32, 0xA1, 0x53, 0x5B, 0x5A, 0x5D, 0x13, 0xC9, 0x8B, 0x83, 0x51, 0x67, 0x55, 0x40, 0x7E, 0xD7, 
-0x32, 0x96, 0x18, 0xEE, 0x8A, 0xFF, 0xFB, 0x69, 0xE9, 0x4F, 0xC6, 0x0D, 0x16, 0xED, 0x45, 0xD3, 
-0xC5, 0xCC, 0x65, 0xD1, 0x8E, 0x31, 0xA2, 0x91, 0xBC, 0xB3, 0x3A, 0xC1, 0x18, 0xC3, 0xFA, 0xE6, 
-0x3A, 0x62, 0x12, 0x95, 0x53, 0x21, 0x6A, 0x6D, 0xB4, 0xC6, 0xFE, 0x7E, 0xCB, 0xCB, 0x2F, 0x5C, 
-0xE3, 0xFA, 0x95, 0x1B, 0xCC, 0x76, 0x66, 0x58, 0xE7, 0x30, 0xC9, 0x93, 0xFC, 0x84, 0x71, 0x43, 
-0x8A, 0x69, 0xF2, 0x99, 0x6F, 0xFE, 0xA6, 0x6F, 0xF8, 0x9D, 0xFF, 0xE3, 0xCF, 0xFE, 0xD7, 0x87, 
-0x9A, 0x88, 0x2D, 0x72, 0x7F, 0x08, 0x7E, 0xEC, 0xC7, 0xFE, 0xFE, 0xE8, 0xDF, 0xFC, 0xB7, 0xFF, 
-0xCD, 0x3F, 0x3E, 0xDD, 0xAF, 0xFF, 0x03, 0x23, 0xDB, 0x95, 0x33, 0x63, 0x5C, 0x25, 0x04, 0xEE, 
-0xF1, 0xF4, 0xD3, 0x9B, 0xFC, 0xC9, 0xFF, 0xF8, 0x0F, 0xF3, 0x1D, 0xDF, 0xF1, 0x61, 0xC6, 0x23, 
-0xFD, 0x90, 0x5F, 0xFE, 0xC5, 0x5F, 0xE3, 0xCF, 0xFF, 0xB9, 0xBF, 0xC8, 0xA7, 0x7F, 0xED, 0x4B, 
-0x4C, 0x67, 0x5D, 0x66, 0x18, 0x8B, 0x05, 0x06, 0x9F, 0xF5, 0x45, 0x0B, 0x1D, 0xEC, 0x32, 0x23, 
-0x8B, 0x49, 0xF2, 0xA8, 0xCC, 0xD2, 0xE6, 0x88, 0x39, 0xD3, 0x3A, 0xA0, 0x63, 0x5B, 0xA0, 0x7F, 
-0xAD, 0xA4, 0xDE, 0x9E, 0xAA, 0x01, 0x73, 0x26, 0x2B, 0xCD, 0x87, 0x4C, 0xAF, 0xA4, 0x11, 0x34, 
-0xD6, 0x7D, 0xCA, 0x0C, 0x24, 0x25, 0x0D, 0x71, 0x9D, 0x51, 0x06, 0x84, 0xAA, 0xAE, 0xD5, 0xA5, 
-0x5C, 0x8A, 0x54, 0xE3, 0x11, 0x5F, 0xFB, 0xA1, 0xAF, 0xE3, 0xE9, 0x67, 0xDF, 0xA4, 0x8D, 0x3A, 
-0xE7, 0x37, 0x64, 0xA7, 0x3A, 0xAB, 0x24, 0xDA, 0x3E, 0x52, 0x6E, 0x10, 0x05, 0x31, 0x42, 0x5D, 
-0xD7, 0x74, 0x5D, 0x87, 0x88, 0x46, 0x22, 0xED, 0xBA, 0x0E, 0x53, 0xB6, 0xE8, 0xC6, 0xC8, 0xE7, 
-0x3E, 0xFD, 0xAB, 0x7C, 0xF6, 0xD7, 0x3E, 0xC7, 0xDE, 0xFD, 0xFB, 0xAC, 0xD5, 0x0D, 0x56, 0x0C, 
-0xA1, 0xEB, 0xA8, 0x9A, 0x86, 0x2E, 0x78, 0x66, 0xC1, 0xD3, 0x6C, 0xAC, 0xB1, 0x7D, 0xF2, 0x04, 
-0x1F, 0xFE, 0xE6, 0xDF, 0xCC, 0xFA, 0xF6, 0x16, 0xBE, 0x74, 0xC8, 0xAC, 0x9A, 0xA8, 0xAC, 0x55, 
-0x26, 0xE0, 0x03, 0x6B, 0xCD, 0x88, 0x18, 0x02, 0x77, 0x6E, 0x5C, 0xE7, 0xE7, 0x7E, 0xF6, 0x7F, 
-0xA1, 0x9B, 0xEC, 0xEB, 0x3B, 0xCB, 0x96, 0xCC, 0xA0, 0x3A, 0x5F, 0xE7, 0x54, 0x17, 0x78, 0xA0, 
-0x6E, 0x32, 0xFA, 0xE7, 0x0A, 0x86, 0xBF, 0xFB, 0x0D, 0xFF, 0x51, 0x18, 0xDE, 0x7B, 0xD8, 0xB1, 
-0x3E, 0xE2, 0xBC, 0xDF, 0x0A, 0xAB, 0x54, 0x10, 0xAC, 0x50, 0x75, 0x68, 0xF1, 0xEB, 0xEF, 0x47, 
-0xA9, 0x3C, 0x16, 0x5B, 0x80, 0x59, 0xF1, 0xBC, 0x83, 0xED, 0xB3, 0x94, 0x51, 0xA1, 0xAA, 0xCA, 
-0xBB, 0xD9, 0x7B, 0xE7, 0xFB, 0x29, 0x14, 0x3B, 0xD5, 0xD5, 0x12, 0xA5, 0x11, 0xB7, 0xF2, 0x78, 
-0xBF, 0x7F, 0xE8, 0xB4, 0x5B, 0x17, 0x8F, 0x83, 0x4F, 0x98, 0xCA, 0x61, 0x5C, 0x45, 0x1B, 0x03, 
-0xE3, 0xF5, 0x35, 0xDE, 0xFB, 0xFE, 0xF7, 0xF3, 0xEE, 0xF7, 0x7C, 0x0D, 0x51, 0xC0, 0xC7, 0x80, 
-0x75, 0x6E, 0x2E, 0xF9, 0x86, 0x90, 0x6D, 0xB2, 0xF3, 0x40, 0x52, 0xD2, 0xF2, 0xBE, 0x55, 0xEF, 
-0x8D, 0xA2, 0x0C, 0xB7, 0x6C, 0xED, 0x2D, 0xED, 0x69, 0xB2, 0x3B, 0xE5, 0x1F, 0xFD, 0xEF, 0x3F, 
-0xC7, 0xCD, 0x6B, 0x37, 0x91, 0x20, 0x58, 0x74, 0x9D, 0x40, 0x72, 0x1C, 0x32, 0xED, 0x71, 0xAA, 
-0xDA, 0x9A, 0x97, 0xC3, 0xBC, 0x64, 0x14, 0xAB, 0xCA, 0x73, 0x88, 0x61, 0xFF, 0xD1, 0x41, 0x82, 
-0x3C, 0x10, 0xC8, 0x3C, 0xED, 0xAB, 0x3F, 0x14, 0x0B, 0x29, 0xD9, 0x88, 0x03, 0x93, 0x98, 0xC5, 
-0x16, 0x5B, 0x59, 0x46, 0x4D, 0xA5, 0x21, 0xDB, 0xBD, 0x47, 0x70, 0xF8, 0x36, 0xB1, 0xFF, 0x70, 
-0x42, 0xE8, 0xD4, 0x52, 0xA4, 0x9D, 0xEC, 0x53, 0x3B, 0xC1, 0x77, 0x0F, 0x80, 0xC9, 0xCD, 0xAF, 
-0xFF, 0xC0, 0xFB, 0x7E, 0xCF, 0x3F, 0xFA, 0xE5, 0xBF, 0xF5, 0x33, 0xF3, 0x8C, 0x0C, 0xB0, 0xBC, 
-0xB4, 0xB7, 0x02, 0xDF, 0xFD, 0xDD, 0xDF, 0xB3, 0xFE, 0xD3, 0x7F, 0xE7, 0x7F, 0xFB, 0xC1, 0xE4, 
-0x47, 0x5F, 0x3B, 0xAE, 0x37, 0x65, 0xE6, 0xA7, 0x74, 0x7E, 0x87, 0xCA, 0xB6, 0xBC, 0xE5, 0xAD, 
-0x67, 0xF8, 0x81, 0x8F, 0x7D, 0x27, 0x17, 0x2E, 0x9C, 0x64, 0x34, 0x6A, 0xB8, 0x7A, 0xE5, 0x36, 
-0xFF, 0xCD, 0x5F, 0xFD, 0x9B, 0x7C, 0xF2, 0x93, 0x7F, 0x87, 0xDD, 0x7D, 0xC7, 0xDE, 0xBE, 0x61, 
-0x32, 0x35, 0xB4, 0x6D, 0xC5, 0xD4, 0x3B, 0x66, 0x5D, 0x45, 0xE7, 0x1B, 0xBC, 0x6F, 0x98, 0xCE, 
-0x1C, 0xB3, 0xB6, 0x62, 0xD6, 0x3A, 0xDA, 0xD6, 0x31, 0x6B, 0x6B, 0x66, 0x6D, 0x45, 0xDB, 0xD5, 
-0xB4, 0x9D, 0xC3, 0x87, 0x0A, 0xEF, 0x1D, 0xC1, 0x3B, 0x7C, 0x67, 0xE9, 0xBC, 0x1E, 0xEB, 0x7C, 
-0x85, 0x0F, 0x8E, 0xB6, 0xB3, 0xF8, 0xE0, 0xE6, 0xC7, 0x7D, 0xA8, 0x7B, 0x54, 0x91, 0xA2, 0xC3, 
-0x67, 0x8A, 0xA9, 0x26, 0xA4, 0x8A, 0x90, 0x2A, 0x62, 0xAA, 0x49, 0x34, 0x74, 0xDE, 0xCE, 0xCF, 
-0x87, 0x58, 0x29, 0xCD, 0xAF, 0xA9, 0xF0, 0xC9, 0x12, 0xA2, 0x32, 0xD6, 0x98, 0x25, 0xDE, 0x80, 
-0x52, 0xC2, 0x82, 0x6B, 0x98, 0x85, 0x48, 0x90, 0x8A, 0x49, 0x48, 0xAC, 0x9F, 0x3C, 0xCD, 0x3B, 
-0xDF, 0xFB, 0x7E, 0x9A, 0xF5, 0x4D, 0xA2, 0xAD, 0xE8, 0x92, 0xD0, 0x0D, 0x62, 0x9A, 0xF5, 0x63, 
-0x96, 0xF9, 0x5E, 0x1C, 0xA7, 0x68, 0x97, 0xE3, 0x99, 0x45, 0xA9, 0x88, 0xF9, 0x1E, 0x9F, 0x04, 
-0x71, 0x35, 0xC9, 0x3A, 0x42, 0x04, 0xEB, 0x1A, 0x5C, 0x3D, 0xE2, 0xEE, 0xDD, 0x07, 0x7C, 0xF6, 
-0x73, 0x5F, 0x60, 0xE7, 0xDE, 0x2E, 0xB5, 0xD3, 0xF8, 0x6E, 0x29, 0x1A, 0xBC, 0x07, 0x1F, 0xC0, 
-0xAE, 0xD5, 0xEC, 0xCF, 0x66, 0x9C, 0x3C, 0x7F, 0x8E, 0x67, 0xDE, 0xFC, 0x66, 0x2E, 0xBD, 0xE9, 
-0x59, 0xA2, 0x35, 0x04, 0xEB, 0x08, 0x46, 0xF0, 0xC5, 0x57, 0x29, 0xD0, 0x86, 0x08, 0xD6, 0xE2, 
-0x46, 0x23, 0x76, 0xF7, 0xA7, 0xBC, 0xF0, 0xC2, 0xCB, 0xDC, 0xBA, 0x7E, 0x0B, 0xEF, 0x23, 0x21, 
-0x09, 0xC6, 0xD6, 0x18, 0x5B, 0x83, 0x71, 0x18, 0x5B, 0x63, 0x5D, 0x43, 0x88, 0x02, 0xC6, 0x81, 
-0x38, 0x30, 0x0E, 0x31, 0x15, 0x62, 0x2A, 0xFD, 0x2D, 0x0E, 0x4C, 0xAD, 0x2E, 0x32, 0x32, 0x89, 
-0xA9, 0x41, 0x16, 0xBF, 0x35, 0x16, 0x95, 0x3B, 0x94, 0x90, 0x8A, 0x24, 0x4E, 0x89, 0x9C, 0xF6, 
-0x08, 0xA9, 0x96, 0x48, 0x06, 0xEF, 0x33, 0x62, 0xB0, 0xCE, 0x62, 0x4C, 0x85, 0x71, 0x06, 0x63, 
-0x2A, 0x6C, 0x65, 0xB1, 0xB6, 0xC2, 0xBA, 0x9C, 0x56, 0x16, 0x6B, 0x6B, 0x8C, 0x33, 0x58, 0xBB, 
-0xB8, 0xCE, 0x38, 0x0D, 0xB1, 0x83, 0xC9, 0xDF, 0xB8, 0x22, 0x35, 0xAE, 0xCA, 0xBE, 0x93, 0x17, 
-0xA9, 0x71, 0x16, 0xE3, 0x74, 0x56, 0x91, 0xC4, 0xA8, 0x2D, 0x6D, 0x26, 0xB1, 0x16, 0xB1, 0x0E, 
-0xE3, 0x94, 0xE9, 0x61, 0xCC, 0x9C, 0xF4, 0x9C, 0x52, 0xB9, 0xD6, 0xD9, 0x4A, 0xF3, 0xEC, 0x9A, 
-0x9C, 0xE7, 0x45, 0xAA, 0x26, 0x67, 0x39, 0x9C, 0x8F, 0x51, 0x86, 0x60, 0x4C, 0xDD, 0x4B, 0x2D, 
-0x62, 0x05, 0x24, 0x3B, 0x06, 0xB0, 0x16, 0x53, 0x55, 0xEA, 0x8F, 0x36, 0xFB, 0x27, 0x38, 0x73, 
-0xF1, 0x12, 0xEF, 0xFD, 0xE0, 0x07, 0xA9, 0x37, 0x37, 0x98, 0x74, 0x1D, 0xD4, 0x15, 0x1D, 0x89, 
-0x60, 0xD4, 0x87, 0x73, 0x40, 0xE3, 0xAB, 0xC5, 0x5E, 0x1A, 0x80, 0x28, 0x8B, 0x34, 0x19, 0x43, 
-0x32, 0x46, 0xDB, 0x92, 0x59, 0xFC, 0x8E, 0xC6, 0x12, 0xA3, 0xC1, 0xD5, 0xEB, 0xB4, 0x6D, 0xE4, 
-0xE5, 0x97, 0xAF, 0xF2, 0xF2, 0x8B, 0x57, 0x98, 0xEE, 0x4D, 0xA9, 0x6C, 0x8D, 0x89, 0xEA, 0x8C, 
-0x46, 0xA2, 0x3A, 0x9D, 0x2A, 0x21, 0xE9, 0x13, 0xCA, 0x80, 0x63, 0x52, 0x93, 0xCD, 0x28, 0x69, 
-0x4E, 0x69, 0xF0, 0x1B, 0xA3, 0x66, 0x68, 0xE5, 0x5C, 0xFF, 0x3C, 0x22, 0x54, 0xAE, 0xC1, 0x99, 
-0x0A, 0x6B, 0x1C, 0xD6, 0xD8, 0x4C, 0x06, 0x23, 0x16, 0x2B, 0x96, 0xCA, 0x38, 0x8C, 0xD1, 0xFF, 
-0x35, 0x1C, 0x92, 0xD1, 0x7D, 0x02, 0x79, 0xC0, 0xB2, 0xCE, 0xE9, 0x00, 0x9A, 0xC0, 0x77, 0x9E, 
-0xAE, 0x6D, 0x11, 0x81, 0x4A, 0x1C, 0xBE, 0x0B, 0x74, 0x6D, 0x20, 0x7A, 0x9D, 0x61, 0x8C, 0x9A, 
-0x8A, 0xB6, 0x9B, 0x02, 0xD1, 0x19, 0xCC, 0xE7, 0xFE, 0xF0, 0x1F, 0xFB, 0xCF, 0x7E, 0xFE, 0x67, 
-0x7F, 0xF6, 0x93, 0x07, 0x45, 0xF5, 0xDE, 0x10, 0x70, 0x28, 0x6E, 0xDF, 0x7E, 0x30, 0xDA, 0xDC, 
-0xD8, 0x3E, 0x93, 0xB0, 0xA2, 0x5C, 0x3E, 0xB1, 0xD6, 0x34, 0x38, 0xD7, 0xF1, 0x9E, 0xF7, 0xBD, 
-0x85, 0x33, 0xA7, 0xC7, 0xB8, 0x3A, 0x10, 0x63, 0xE0, 0xEE, 0xDD, 0x7B, 0xFC, 0xEA, 0xA7, 0x3E, 
-0x8F, 0x0F, 0x8E, 0x28, 0x6B, 0x88, 0xDD, 0xC2, 0xD5, 0x27, 0xB1, 0xF5, 0x16, 0xC6, 0x6E, 0x21, 
-0x76, 0x03, 0xB1, 0x1B, 0x18, 0xB7, 0x79, 0x80, 0xC4, 0x6D, 0x64, 0xDA, 0x44, 0xDC, 0x26, 0xC8, 
-0x78, 0x4E, 0x62, 0xD6, 0xB0, 0x66, 0x0D, 0x63, 0xD7, 0x70, 0x76, 0x1D, 0x6B, 0xD7, 0x97, 0x52, 
-0x63, 0xD6, 0xB0, 0xB2, 0x86, 0xC8, 0x18, 0xC3, 0x18, 0x6B, 0x46, 0x44, 0x1A, 0x22, 0x0D, 0x49, 
-0x16, 0xFF, 0x17, 0x0A, 0xA9, 0xC6, 0xB8, 0xF5, 0x25, 0x12, 0xBB, 0xD6, 0xA3, 0x11, 0x62, 0x6A, 
-0x8C, 0x6B, 0x10, 0x33, 0x46, 0xCC, 0x18, 0xE3, 0x46, 0x18, 0x37, 0xC2, 0x56, 0x6B, 0x48, 0x35, 
-0x06, 0x57, 0x13, 0xA5, 0x26, 0x99, 0x8A, 0xCD, 0x93, 0xA7, 0xB9, 0xFC, 0xCC, 0x9B, 0xD8, 0x38, 
-0x75, 0x9A, 0x16, 0xC7, 0xC4, 0x47, 0xDA, 0x64, 0x95, 0x41, 0x27, 0x87, 0xEE, 0x0A, 0x57, 0x26, 
-0x1A, 0xA9, 0x08, 0xC6, 0x11, 0xA5, 0x26, 0x8A, 0xA6, 0x01, 0x4B, 0xA0, 0x5A, 0xA4, 0xE2, 0xC0, 
-0x35, 0xB4, 0x51, 0xE8, 0x92, 0x21, 0x88, 0x9A, 0xD6, 0x24, 0x5B, 0x23, 0xD5, 0x88, 0x2E, 0x08, 
-0xB7, 0xEE, 0xDE, 0xE3, 0xDE, 0xDD, 0x87, 0xF8, 0x98, 0x70, 0xB6, 0x41, 0x70, 0x54, 0x6E, 0xC4, 
-0xFA, 0xFA, 0x16, 0x1B, 0x1B, 0x9B, 0x24, 0xA9, 0xA0, 0xAA, 0x39, 0x79, 0xEA, 0x0C, 0xE7, 0x2E, 
-0x5F, 0x06, 0xD7, 0x30, 0xE9, 0x22, 0x33, 0x1F, 0x98, 0x84, 0x48, 0xB2, 0x15, 0xB8, 0x5A, 0x53, 
-0xDB, 0x60, 0xAA, 0x35, 0x7C, 0x72, 0xDC, 0x7B, 0xB0, 0xCB, 0xF5, 0x5B, 0x77, 0xE9, 0x7C, 0x22, 
-0x44, 0x03, 0xA9, 0x22, 0x26, 0x4B, 0x0C, 0xBA, 0xC8, 0x11, 0x83, 0xC5, 0x07, 0xB5, 0xAB, 0x2C, 
-0x69, 0x4C, 0x96, 0x14, 0x5D, 0x2F, 0x55, 0xE6, 0x1F, 0x93, 0xC9, 0xBF, 0x35, 0x4D, 0x58, 0x48, 
-0x15, 0x09, 0x8B, 0x35, 0x23, 0x65, 0xDE, 0xC7, 0x48, 0xAD, 0x6B, 0x70, 0x76, 0xAC, 0x4C, 0x27, 
-0x1F, 0x37, 0xD2, 0x28, 0xB3, 0xC9, 0xA9, 0x50, 0x83, 0x38, 0x84, 0x5A, 0xA3, 0xDB, 0x49, 0x85, 
-0x6E, 0xD0, 0xD6, 0xC0, 0x87, 0x3A, 0x6B, 0x52, 0x37, 0x7E, 0x25, 0xF5, 0xD1, 0x10, 0x23, 0x2B, 
-0x53, 0x11, 0xAB, 0x03, 0xC5, 0x21, 0x69, 0x8C, 0xA8, 0x59, 0x53, 0x44, 0x07, 0x8F, 0x1C, 0xB8, 
-0x54, 0x53, 0x35, 0x7F, 0x14, 0xEB, 0x0E, 0x4D, 0xF5, 0x39, 0xCA, 0x34, 0x93, 0x98, 0x9C, 0x4F, 
-0xD1, 0x2E, 0x99, 0x34, 0x50, 0x63, 0xCC, 0x83, 0x68, 0x48, 0x76, 0x29, 0xED, 0x82, 0x9A, 0x5B, 
-0x25, 0xA9, 0x90, 0x7C, 0x1D, 0xC9, 0xCE, 0x53, 0x70, 0x90, 0xD4, 0x3A, 0x81, 0xA4, 0xDF, 0xE2, 
-0x5C, 0x9D, 0x17, 0x0A, 0x0D, 0xE3, 0xF5, 0x0D, 0x36, 0xB6, 0xB6, 0x68, 0xD6, 0xD7, 0xE9, 0x7C, 
-0x20, 0x88, 0x50, 0x8D, 0x46, 0xE0, 0x1C, 0xD1, 0x39, 0xDA, 0x08, 0x98, 0x3C, 0xE0, 0xD9, 0x3C, 
-0xC8, 0x59, 0x97, 0x07, 0x33, 0xA7, 0x5E, 0xB9, 0xAC, 0xA6, 0xD1, 0x28, 0xD3, 0xD7, 0xE0, 0xA9, 
-0x8E, 0x68, 0x2C, 0x48, 0x45, 0x33, 0xDA, 0x00, 0xB1, 0xEC, 0xED, 0xCD, 0x78, 0xF9, 0xE5, 0xAB, 
-0x4C, 0x27, 0x2D, 0x92, 0x54, 0x65, 0xE5, 0xC4, 0x60, 0xC5, 0x50, 0x65, 0x7D, 0xA9, 0xB5, 0x16, 
-0x71, 0x16, 0x63, 0xAB, 0x4C, 0x0E, 0xE7, 0xAA, 0x25, 0xB2, 0xD6, 0xCD, 0xA9, 0x7F, 0x6C, 0x78, 
-0x9D, 0x1E, 0xAF, 0x48, 0xD9, 0xDC, 0xAC, 0xAF, 0xD2, 0x9B, 0x4B, 0xC5, 0x12, 0xE7, 0x0B, 0x6A, 
-0x7A, 0xAC, 0x37, 0xFB, 0x14, 0xDD, 0x7C, 0x61, 0x92, 0x83, 0x68, 0x91, 0x60, 0xF2, 0xC2, 0x70, 
-0x36, 0xCB, 0xCC, 0xE6, 0x80, 0x26, 0x41, 0xEC, 0x5A, 0x9C, 0xAD, 0xF1, 0x5D, 0xC4, 0x99, 0x11, 
-0x8D, 0xDB, 0xA8, 0xEE, 0xDF, 0x7D, 0x78, 0xF9, 0xD2, 0xA5, 0x91, 0xEA, 0x73, 0x56, 0xE0, 0x91, 
-0x0C, 0xF7, 0xEF, 0xFC, 0xCF, 0x3F, 0x73, 0xF9, 0xF6, 0xBD, 0x07, 0x17, 0x13, 0x45, 0x2F, 0x14, 
-0xD8, 0x9F, 0xDD, 0x67, 0x3C, 0x4A, 0x7C, 0xED, 0x07, 0xDF, 0xC1, 0xD6, 0x89, 0x8A, 0xCE, 0xEF, 
-0xD2, 0x76, 0xBB, 0x5C, 0xBF, 0x7E, 0x8D, 0x7B, 0x0F, 0xEE, 0xB3, 0xB6, 0xB1, 0x85, 0xB1, 0x15, 
-0x38, 0xA5, 0x64, 0x9D, 0x46, 0xF5, 0xCC, 0x51, 0xC7, 0xBA, 0x94, 0x0E, 0x44, 0x8A, 0x4D, 0xA8, 
-0xCE, 0x34, 0x66, 0xDD, 0x6D, 0x4A, 0x49, 0x47, 0xBE, 0xA8, 0x36, 0xB0, 0x12, 0x55, 0x3F, 0x25, 
-0x31, 0xA8, 0x63, 0x8B, 0xA4, 0x93, 0x37, 0x93, 0x80, 0x94, 0x90, 0x14, 0x10, 0x22, 0x92, 0x0B, 
-0xD1, 0x5A, 0x8B, 0x71, 0xB2, 0x14, 0x4C, 0x00, 0x93, 0xED, 0x5B, 0x4D, 0xC2, 0xC7, 0xEE, 0x08, 
-0x0A, 0xA4, 0x90, 0x74, 0x3F, 0xBC, 0x8F, 0x24, 0x1F, 0x75, 0xEB, 0x5A, 0x48, 0xBA, 0xCD, 0x2F, 
-0x40, 0xD7, 0x06, 0x12, 0x86, 0x2E, 0x44, 0xCE, 0x9C, 0x3D, 0xCF, 0xA5, 0xA7, 0x9F, 0x21, 0x62, 
-0xF0, 0x41, 0x83, 0xDA, 0x69, 0x07, 0x2A, 0x92, 0x92, 0x03, 0xAB, 0x92, 0x20, 0xB9, 0xB3, 0xCD, 
-0x3B, 0x5E, 0x8F, 0xFA, 0x12, 0x51, 0x21, 0x5B, 0x2D, 0xA6, 0xEF, 0xCE, 0x69, 0x3D, 0xDE, 0xBD, 
-0x7B, 0x97, 0x6B, 0x57, 0xAE, 0xE6, 0x55, 0xE0, 0x86, 0xCA, 0x39, 0x5D, 0x59, 0x4D, 0xD0, 0xEE, 
-0x4D, 0x98, 0xED, 0x4E, 0x99, 0xEE, 0xCE, 0x58, 0x1B, 0x6D, 0xB1, 0xB5, 0x79, 0x9A, 0xB5, 0xD1, 
-0x36, 0xDE, 0x1B, 0xC4, 0x34, 0x88, 0x1D, 0x51, 0x57, 0x1B, 0x04, 0x6F, 0x69, 0x3B, 0x43, 0xE7, 
-0x8D, 0xCE, 0x00, 0xBC, 0xE5, 0xEE, 0x9D, 0x5D, 0xAE, 0xBC, 0x7C, 0x8B, 0xDB, 0x37, 0xEF, 0x51, 
-0xD9, 0x11, 0xA3, 0x7A, 0xC4, 0xB8, 0x1E, 0xE3, 0x8C, 0xC3, 0x89, 0x9B, 0xA7, 0x92, 0x84, 0xDA, 
-0xD6, 0x54, 0xB6, 0xA2, 0x32, 0x55, 0x96, 0x18, 0x2A, 0x9C, 0x71, 0xF9, 0x78, 0xFD, 0xC8, 0xD4, 
-0x24, 0x0D, 0x96, 0x78, 0x58, 0x2A, 0x2A, 0xE2, 0x1C, 0x48, 0xCB, 0x79, 0x7D, 0x9F, 0xBE, 0xDF, 
-0x99, 0x0A, 0x27, 0x0E, 0x2B, 0x39, 0x9F, 0xE2, 0xA8, 0x4C, 0x4D, 0x25, 0x23, 0x9C, 0x8C, 0x70, 
-0x34, 0x58, 0x1A, 0x6C, 0xAA, 0x31, 0xA9, 0xC6, 0xA6, 0x9A, 0xCA, 0x8C, 0x69, 0xEC, 0x1A, 0xB5, 
-0x5D, 0x5B, 0x4A, 0x1B, 0xB7, 0xCE, 0xC8, 0xAD, 0xCF, 0xEF, 0x3D, 0x2C, 0x2D, 0xCF, 0x74, 0x34, 
-0xF3, 0x67, 0x9A, 0x54, 0x2F, 0xBD, 0x4B, 0x62, 0x85, 0x89, 0xD5, 0xCA, 0x74, 0xD5, 0xF3, 0x16, 
-0x69, 0x95, 0xC9, 0xE6, 0x6F, 0x52, 0x29, 0x4C, 0xE5, 0x30, 0xBB, 0x74, 0x7C, 0xD5, 0x79, 0x83, 
-0x86, 0x77, 0xB0, 0xA9, 0xD2, 0x30, 0x0F, 0x9D, 0x40, 0x30, 0x24, 0x0F, 0x56, 0x2A, 0x4E, 0x9F, 
-0x38, 0xCB, 0x3B, 0xDF, 0xF6, 0x35, 0x8C, 0xAA, 0x35, 0x62, 0x30, 0xC4, 0x68, 0x98, 0x4E, 0x3C, 
-0x5D, 0x9B, 0x20, 0x55, 0x54, 0x6E, 0x0C, 0x38, 0x4C, 0x29, 0xAF, 0xFC, 0x8D, 0x42, 0x03, 0xA9, 
-0xC6, 0xA4, 0x06, 0xCB, 0x08, 0x93, 0x9A, 0xC5, 0xB1, 0x58, 0x23, 0xA1, 0x02, 0xEF, 0x54, 0x7F, 
-0x1E, 0x22, 0x7B, 0xBB, 0x0F, 0xB9, 0xF2, 0xD2, 0x8B, 0x5C, 0x7B, 0xE9, 0xA5, 0xBC, 0xA2, 0x9F, 
-0xE8, 0x66, 0x53, 0x62, 0xE8, 0xE6, 0xCC, 0x30, 0xA4, 0x84, 0xC7, 0x12, 0x92, 0xC5, 0x63, 0xE9, 
-0xC4, 0xE2, 0xD1, 0xE7, 0x98, 0xCE, 0x61, 0x7D, 0x75, 0x80, 0x4C, 0xE7, 0x90, 0xD6, 0x62, 0x3A, 
-0xBD, 0x66, 0x48, 0xE2, 0x01, 0xA2, 0xAA, 0x42, 0x4C, 0x9A, 0xA7, 0x85, 0x07, 0x44, 0x03, 0x61, 
-0x2E, 0x2D, 0xAB, 0x95, 0x06, 0x36, 0xCF, 0xF7, 0x2D, 0x1A, 0x29, 0xBC, 0x8B, 0x48, 0xC8, 0xE5, 
-0x9A, 0xB4, 0x6C, 0x53, 0xA7, 0x0C, 0xD7, 0x5A, 0x4B, 0xD3, 0x34, 0x79, 0xE0, 0x4D, 0x74, 0x5D, 
-0x22, 0x46, 0xA1, 0xF5, 0xD1, 0xEC, 0x77, 0xFE, 0xEC, 0x74, 0xFA, 0xE0, 0xC9, 0x19, 0xEE, 0xF5, 
-0x6B, 0xB7, 0x4F, 0x8D, 0x9B, 0x8D, 0x6D, 0x6B, 0x1B, 0xA6, 0xBE, 0x05, 0x84, 0xDA, 0x1A, 0x8C, 
-0x0D, 0x5C, 0xB8, 0x78, 0x9A, 0x8D, 0xCD, 0x31, 0xD6, 0xA8, 0x4E, 0xE4, 0x8B, 0x5F, 0xFC, 0x22, 
-0xB7, 0xEF, 0xDC, 0xA7, 0xF3, 0xAA, 0xD7, 0x0C, 0xC9, 0x6B, 0x5A, 0x3C, 0x13, 0x89, 0x2A, 0xA4, 
-0xC9, 0x46, 0xF9, 0xC5, 0xDB, 0x95, 0xEA, 0x44, 0x8B, 0x51, 0x7F, 0xB6, 0xC3, 0xEB, 0x99, 0xD4, 
-0x14, 0xB2, 0xD9, 0x24, 0xA4, 0xA4, 0xC5, 0x72, 0xA0, 0x7F, 0xDC, 0x18, 0x1D, 0x41, 0xCB, 0xA8, 
-0x25, 0x45, 0xD5, 0x93, 0x77, 0x8A, 0x95, 0xDF, 0x36, 0x9B, 0xAE, 0x94, 0xD4, 0x65, 0x5B, 0x45, 
-0x9B, 0x47, 0x5F, 0xB5, 0x12, 0x58, 0x8C, 0xC0, 0x3A, 0x5D, 0x73, 0x73, 0xEB, 0x01, 0x11, 0x2D, 
-0xF4, 0x94, 0x12, 0xA7, 0x4F, 0x9F, 0xE6, 0xF4, 0x99, 0x73, 0x74, 0x5E, 0x75, 0x44, 0x55, 0xD5, 
-0x64, 0x85, 0x7D, 0x29, 0xDE, 0xE5, 0x54, 0xA5, 0x2C, 0x5D, 0xC8, 0xD0, 0x91, 0x77, 0x61, 0x9A, 
-0x52, 0x46, 0xE2, 0xA2, 0x2F, 0x35, 0x79, 0x0A, 0x1B, 0xA3, 0x96, 0x71, 0x37, 0x9D, 0x71, 0xF3, 
-0xDA, 0x75, 0x76, 0xEE, 0x3D, 0xD4, 0x60, 0x8B, 0xC9, 0xD2, 0x4E, 0xA6, 0x84, 0x1C, 0xE7, 0x2D, 
-0x92, 0x30, 0x75, 0x85, 0x6B, 0x46, 0x9C, 0x3A, 0x77, 0x9E, 0xED, 0x93, 0xA7, 0x31, 0x4D, 0x43, 
-0x17, 0xD5, 0x26, 0x57, 0xA5, 0x52, 0x50, 0x4D, 0x9A, 0xC5, 0x24, 0x4B, 0x63, 0x2B, 0x5C, 0x32, 
-0x4C, 0x76, 0xF6, 0x78, 0x78, 0xEF, 0x01, 0xED, 0xA4, 0x25, 0x76, 0x7E, 0xA1, 0xB7, 0xCE, 0xD2, 
-0x82, 0x49, 0xB9, 0xCC, 0xB2, 0x26, 0x4A, 0xF2, 0x66, 0x0C, 0x42, 0xDE, 0x08, 0x90, 0xAF, 0x93, 
-0x98, 0x54, 0x87, 0x96, 0x7F, 0xAF, 0x4A, 0x41, 0x6D, 0x99, 0x0F, 0x4B, 0x8F, 0xAA, 0x6F, 0x33, 
-0xD7, 0xAB, 0xE7, 0x81, 0x79, 0x90, 0xEA, 0x60, 0x6D, 0x72, 0x5D, 0x2F, 0x52, 0xB5, 0x59, 0xB6, 
-0x18, 0x44, 0x07, 0x4E, 0x1F, 0x08, 0x41, 0xF5, 0x8D, 0x31, 0x2A, 0x93, 0x28, 0x69, 0x4A, 0x32, 
-0x5F, 0xD8, 0x59, 0x95, 0x8A, 0xD8, 0x9C, 0xAF, 0xE5, 0x14, 0x74, 0xD0, 0x20, 0xB3, 0xC0, 0xFE, 
-0x6F, 0xFD, 0x2E, 0x2D, 0xF7, 0x10, 0x12, 0xC9, 0x2F, 0xCA, 0x49, 0x9F, 0x2B, 0xF3, 0x36, 0x40, 
-0x4C, 0xAA, 0x37, 0x4D, 0x9A, 0x82, 0x2E, 0xE0, 0x1D, 0x96, 0x4A, 0x5E, 0x69, 0x07, 0xE6, 0xD2, 
-0x6D, 0x6D, 0x55, 0xBD, 0xA0, 0xFA, 0x69, 0x4B, 0x12, 0x4B, 0x55, 0x8F, 0x38, 0x79, 0xFA, 0x0C, 
-0x1B, 0x5B, 0xDB, 0x3C, 0xDC, 0xDD, 0x27, 0x20, 0xD4, 0xD5, 0x48, 0xCB, 0x49, 0x34, 0x5F, 0xA1, 
-0x8B, 0x4B, 0x6B, 0x16, 0xE4, 0x50, 0x37, 0xFA, 0x15, 0x8A, 0xBE, 0x75, 0x80, 0x64, 0x5D, 0xE8, 
-0xBC, 0xEC, 0x63, 0x22, 0x75, 0x9E, 0x76, 0x67, 0x8F, 0xFB, 0x37, 0x6F, 0xD2, 0xEE, 0xED, 0x53, 
-0x89, 0x61, 0x5C, 0x37, 0x48, 0x16, 0x86, 0x24, 0x3B, 0xA8, 0x4F, 0x62, 0x40, 0x44, 0x05, 0x11, 
-0xA3, 0x52, 0xB4, 0x91, 0x4A, 0x07, 0x96, 0xA4, 0xC1, 0x40, 0x25, 0xE5, 0x6F, 0xCC, 0x69, 0xF9, 
-0x46, 0x92, 0xD1, 0x8D, 0x1D, 0x3D, 0x32, 0x94, 0x59, 0x03, 0xC8, 0x9C, 0xA1, 0x4A, 0x0E, 0x91, 
-0xA4, 0x6A, 0x07, 0xC8, 0x0B, 0xA7, 0x02, 0x49, 0x4A, 0x9B, 0x51, 0xAB, 0xA8, 0x94, 0xD4, 0x52, 
-0xC2, 0x5A, 0xAD, 0xCD, 0xAE, 0xEB, 0x88, 0x21, 0xCC, 0xFB, 0x7D, 0xCA, 0x0B, 0xF9, 0xEA, 0x6D, 
-0xCC, 0xE0, 0x43, 0x4B, 0x55, 0x55, 0x38, 0x53, 0x03, 0x8E, 0xAD, 0xF5, 0x53, 0x1B, 0x77, 0xEF, 
-0xEE, 0xD7, 0xA5, 0xE8, 0x86, 0x28, 0xE5, 0x77, 0x28, 0xBA, 0x49, 0x3A, 0xDD, 0xB6, 0x69, 0x23, 
-0x44, 0xD5, 0x07, 0x25, 0x04, 0x1F, 0x03, 0xF5, 0xB8, 0x62, 0x3C, 0x6E, 0x48, 0xDE, 0x22, 0x69, 
-0xC4, 0xBD, 0xBB, 0xFB, 0x7C, 0xF1, 0x4B, 0x2F, 0xD2, 0x05, 0x93, 0xA7, 0x56, 0x89, 0x14, 0x3D, 
-0x31, 0x74, 0xA4, 0xE8, 0xC9, 0xC3, 0x5E, 0x96, 0x52, 0x8B, 0xB4, 0x9A, 0x2B, 0x32, 0xA1, 0xB6, 
-0x9F, 0xAA, 0x31, 0xC2, 0xE4, 0xBD, 0xFE, 0xAA, 0xB5, 0x5F, 0xA0, 0x54, 0x68, 0x29, 0xA0, 0xA3, 
-0x88, 0xA0, 0x2B, 0xC2, 0xE5, 0x5D, 0x26, 0x29, 0xB3, 0xED, 0xBF, 0x7B, 0x98, 0x96, 0xBC, 0x80, 
-0x1A, 0x3C, 0x4B, 0x0E, 0x17, 0xDE, 0x75, 0x41, 0xAD, 0x2B, 0x52, 0x20, 0x46, 0x8F, 0x0F, 0xAD, 
-0xFE, 0x26, 0x70, 0xF6, 0xFC, 0x79, 0x2E, 0x5E, 0xBE, 0x84, 0xB5, 0x6A, 0x6A, 0x13, 0xA3, 0xEE, 
-0x32, 0xEA, 0xE7, 0x75, 0x08, 0x63, 0xB4, 0xF3, 0x0F, 0x49, 0x1B, 0x54, 0x6E, 0xE0, 0xD1, 0xE0, 
-0xA4, 0x22, 0x66, 0xE3, 0xEB, 0xBA, 0x1E, 0x11, 0x7C, 0x62, 0xBA, 0x3F, 0xE3, 0x4B, 0x9F, 0xFB, 
-0x12, 0x93, 0xFB, 0x7B, 0x34, 0x54, 0x1A, 0x61, 0xD6, 0x54, 0x88, 0x71, 0x74, 0x09, 0xEC, 0x78, 
-0xCC, 0x5E, 0x0C, 0xB8, 0x8D, 0x86, 0x67, 0xDF, 0xFE, 0x66, 0x36, 0x4E, 0x9F, 0x60, 0xAF, 0x9B, 
-0x31, 0x4B, 0x1A, 0x01, 0x0A, 0x6B, 0xD4, 0xEE, 0x31, 0x44, 0x24, 0x44, 0x68, 0x3D, 0x71, 0x3A, 
-0x61, 0xF2, 0xF0, 0x3E, 0x77, 0xAF, 0xBE, 0xC4, 0xDE, 0xDD, 0x5B, 0xAC, 0x55, 0x5A, 0x1F, 0x45, 
-0x0A, 0x29, 0x9D, 0x2A, 0xE5, 0xC5, 0xBF, 0xFE, 0x54, 0x8D, 0xBC, 0x58, 0x51, 0x3A, 0x1D, 0xF3, 
-0x7A, 0x3A, 0x58, 0x27, 0x4B, 0xF5, 0x93, 0x17, 0x4A, 0x8E, 0x7B, 0x7C, 0x78, 0x2E, 0x46, 0xBF, 
-0x44, 0xC3, 0x6B, 0x75, 0xB0, 0x57, 0xD2, 0x00, 0x83, 0xCB, 0x94, 0x44, 0x25, 0xA0, 0x21, 0xCD, 
-0xCF, 0xAF, 0x78, 0xFF, 0x93, 0x50, 0xC9, 0xF3, 0xF0, 0xBB, 0x44, 0xCA, 0xF6, 0xEA, 0xE5, 0xF3, 
-0x7A, 0x5C, 0x4D, 0xEA, 0x8E, 0xCE, 0x73, 0x9F, 0x69, 0xE4, 0xAE, 0x92, 0xE3, 0xEB, 0x49, 0x5E, 
-0x8D, 0x9F, 0x75, 0xEA, 0xA0, 0x3F, 0x08, 0x4C, 0x7D, 0x47, 0x35, 0x6E, 0x30, 0x6B, 0x15, 0x4F, 
-0xBF, 0xF5, 0x59, 0x52, 0x25, 0x50, 0x09, 0x91, 0x80, 0x8F, 0x2A, 0x71, 0x9A, 0x04, 0x2E, 0xFB, 
-0x81, 0x16, 0x34, 0x0A, 0xB6, 0xE0, 0x31, 0x12, 0x30, 0xA2, 0x0A, 0x2F, 0x6B, 0x22, 0xCE, 0x44, 
-0x10, 0x4F, 0xDB, 0xED, 0x63, 0x5D, 0x22, 0xA6, 0x96, 0xE0, 0xA7, 0xD4, 0x95, 0x60, 0x24, 0x90, 
-0x7C, 0x87, 0x69, 0x3B, 0xAE, 0x7F, 0xE9, 0x05, 0x6E, 0xBE, 0x74, 0x85, 0xDA, 0x3A, 0x2A, 0xA0, 
-0x9D, 0x4D, 0xA8, 0xAA, 0x4A, 0x17, 0x92, 0x4B, 0x7E, 0x97, 0xDA, 0x55, 0xEE, 0x87, 0x24, 0x6C, 
-0x52, 0x5E, 0x50, 0xF8, 0x42, 0x29, 0x9B, 0xFE, 0x2C, 0xB5, 0x5F, 0x5F, 0x5A, 0x5E, 0x6A, 0x71, 
-0xA4, 0x9B, 0x8E, 0x16, 0xA6, 0xA5, 0x5A, 0xE6, 0xA5, 0x3F, 0xEA, 0x3A, 0x9D, 0x24, 0x99, 0x93, 
-0x29, 0x33, 0xAB, 0x98, 0xA3, 0x6E, 0x27, 0x48, 0xA9, 0x43, 0xAC, 0x47, 0x9C, 0xBE, 0x23, 0x04, 
-0xB5, 0xE7, 0x35, 0x48, 0x16, 0xC0, 0x20, 0xA6, 0x0E, 0x23, 0x56, 0x37, 0x6E, 0x20, 0x08, 0x35, 
-0x81, 0xE6, 0xE4, 0x7F, 0xFF, 0xDF, 0xFE, 0xD4, 0xA9, 0x5E, 0x77, 0x5F, 0xC2, 0x23, 0x19, 0x6E, 
-0x08, 0x72, 0x22, 0xE1, 0xEA, 0x54, 0xA6, 0xFA, 0xE8, 0x80, 0xBB, 0xB1, 0xB9, 0xC6, 0xDA, 0xDA, 
-0x1A, 0x56, 0x74, 0x3A, 0xDA, 0xCE, 0x22, 0x77, 0xEE, 0xED, 0x30, 0x9D, 0x75, 0xD9, 0xD2, 0xA0, 
-0xA0, 0xA7, 0x1F, 0xC9, 0x28, 0x52, 0xE6, 0x61, 0xE9, 0x10, 0x87, 0x31, 0xAE, 0x47, 0xA1, 0x2F, 
-0x11, 0x3D, 0x2A, 0x4D, 0x03, 0x49, 0x49, 0x7A, 0xC6, 0xD1, 0x55, 0x55, 0x61, 0x8C, 0x99, 0x6F, 
-0xAB, 0x2D, 0xCC, 0xC5, 0xD5, 0x35, 0xE7, 0xCF, 0x9F, 0x67, 0x3C, 0x1E, 0xD3, 0x75, 0x9D, 0x5A, 
-0x5E, 0xAC, 0xF0, 0x51, 0x3B, 0xCC, 0x7B, 0xFF, 0xF7, 0x90, 0x31, 0x97, 0xB4, 0xBC, 0x3B, 0xFA, 
-0x80, 0x45, 0x2D, 0x0A, 0x24, 0x19, 0xAE, 0xBC, 0xF4, 0x12, 0xB3, 0xBD, 0x7D, 0xDD, 0xE8, 0x90, 
-0x2C, 0xA4, 0x44, 0x0A, 0xCA, 0xC4, 0xA3, 0x51, 0x3F, 0xBC, 0x81, 0xC4, 0xE9, 0xF3, 0xE7, 0x58, 
-0xDB, 0xDC, 0xC0, 0xD4, 0x95, 0x0E, 0x94, 0xA2, 0x76, 0xB7, 0x79, 0xAE, 0x41, 0x4A, 0x89, 0xD0, 
-0x79, 0xC6, 0x95, 0xA3, 0x36, 0xC2, 0x9D, 0x1B, 0xD7, 0xB9, 0x71, 0xE5, 0x65, 0xDA, 0xFD, 0x1D, 
-0xC8, 0x0D, 0xB4, 0x8F, 0x61, 0xFE, 0x5E, 0x7B, 0x94, 0x76, 0x53, 0x74, 0x70, 0xA5, 0xD3, 0x94, 
-0xB5, 0x88, 0xC5, 0xF9, 0xAF, 0xBC, 0xB4, 0xFC, 0xFF, 0x4A, 0xF0, 0xCA, 0x9F, 0x51, 0x2C, 0x81, 
-0xC4, 0x1A, 0x15, 0x92, 0xD6, 0xC6, 0x3C, 0xF5, 0xEC, 0x33, 0x34, 0x1B, 0x6B, 0x84, 0xCC, 0xA0, 
-0x86, 0xB5, 0x59, 0x06, 0x7F, 0x85, 0x2E, 0x68, 0xD1, 0x63, 0x7A, 0x90, 0xB7, 0xFC, 0x46, 0x8F, 
-0xB5, 0xBA, 0x59, 0xC1, 0x5A, 0xA1, 0xAE, 0x9D, 0x0A, 0x21, 0xA1, 0xA3, 0x76, 0x86, 0x07, 0x77, 
-0x6E, 0x73, 0xE3, 0xEA, 0x15, 0x68, 0x3D, 0xB5, 0x08, 0xA4, 0x44, 0x6D, 0x9D, 0x9A, 0xF3, 0xA9, 
-0xCE, 0x0D, 0x50, 0xB5, 0xA0, 0xE4, 0x3E, 0x28, 0xD9, 0xCC, 0xAD, 0xF4, 0x4B, 0x40, 0xD5, 0x01, 
-0x00, 0x64, 0x26, 0x9D, 0xCB, 0x25, 0x91, 0xED, 0x84, 0xF3, 0xF9, 0xC2, 0x9C, 0xD5, 0x82, 0x43, 
-0x9D, 0xD1, 0xF4, 0x67, 0x45, 0x05, 0x0B, 0xE1, 0x60, 0x31, 0xEB, 0x50, 0xF4, 0xE5, 0x77, 0x7A, 
-0xCF, 0x4E, 0xA8, 0x55, 0xCA, 0x72, 0xBF, 0xB6, 0x4E, 0x0E, 0xF8, 0x1C, 0x8E, 0x08, 0xDE, 0xC7, 
-0xD3, 0xAD, 0xF7, 0x17, 0x97, 0xCF, 0x2C, 0xF0, 0x48, 0x86, 0xBB, 0xBF, 0xBF, 0x7F, 0x29, 0x84, 
-0xD8, 0xE4, 0x79, 0x8F, 0x4E, 0x29, 0xAD, 0x70, 0xE2, 0xC4, 0x09, 0x36, 0x37, 0x37, 0x95, 0x11, 
-0x85, 0xC0, 0x6C, 0x36, 0xE3, 0xC6, 0xF5, 0x9B, 0xCC, 0x66, 0xDD, 0xAB, 0xD2, 0x29, 0x87, 0x8C, 
-0xE8, 0xB5, 0xC0, 0x51, 0xEF, 0xB0, 0x08, 0xB1, 0xF3, 0x73, 0xC6, 0x17, 0xF2, 0xB6, 0xD8, 0x94, 
-0xB7, 0x0D, 0x46, 0x12, 0xDB, 0xDB, 0xDB, 0x3C, 0xF5, 0xD4, 0x53, 0x54, 0xA3, 0x86, 0x69, 0xD7, 
-0x62, 0x8A, 0xF9, 0xD4, 0x8A, 0xE7, 0xF6, 0xDF, 0x75, 0x9C, 0xE3, 0xFD, 0x0A, 0x96, 0x94, 0xB0, 
-0x49, 0xD8, 0xBD, 0xFF, 0x80, 0x2B, 0x2F, 0xBC, 0x44, 0x37, 0x9D, 0x69, 0x03, 0x2D, 0xBB, 0x64, 
-0x24, 0x6F, 0x26, 0x41, 0xF3, 0xD6, 0xAC, 0x8D, 0xB9, 0x7C, 0xF9, 0x32, 0x1B, 0x5B, 0x5A, 0x3F, 
-0xE5, 0x59, 0x29, 0xA9, 0x34, 0x6F, 0x91, 0xB9, 0x39, 0x98, 0x15, 0xA1, 0x9B, 0xB5, 0xDC, 0xB8, 
-0x76, 0x9D, 0x3B, 0xB7, 0x6E, 0xAB, 0x8E, 0x2A, 0x77, 0xB8, 0x61, 0xBE, 0xFA, 0xF9, 0x7B, 0xAD, 
-0x31, 0x7C, 0xF7, 0xE3, 0x62, 0xD8, 0x41, 0x1E, 0x17, 0xA5, 0x63, 0x3E, 0x29, 0x3D, 0x0A, 0xC7, 
-0xB9, 0xA6, 0xE0, 0xB8, 0xCF, 0xEC, 0x23, 0x46, 0xF5, 0xFC, 0x56, 0xD6, 0x43, 0x62, 0x8C, 0x9C, 
-0x38, 0x71, 0x82, 0x67, 0x9E, 0x79, 0x86, 0xBA, 0x56, 0xC7, 0x3A, 0x47, 0x95, 0xB1, 0xB2, 0x19, 
-0xDD, 0x7C, 0x91, 0x44, 0xD7, 0x23, 0xE6, 0x4C, 0x29, 0x4F, 0xE7, 0x9D, 0xAB, 0xB3, 0xCF, 0x88, 
-0xEC, 0xBB, 0x21, 0x6A, 0x78, 0x73, 0x62, 0xE2, 0xE6, 0xF5, 0xEB, 0xDC, 0xBC, 0x7E, 0x95, 0x18, 
-0x3A, 0x2A, 0x31, 0x98, 0x90, 0x70, 0x62, 0x90, 0x10, 0x71, 0x91, 0x39, 0xD9, 0x98, 0x67, 0x9E, 
-0xA8, 0xC5, 0x82, 0x6E, 0x1B, 0x89, 0x6A, 0x6E, 0x99, 0xDF, 0x1B, 0x51, 0x81, 0xA1, 0xC0, 0x44, 
-0xF4, 0xDA, 0x14, 0x71, 0x31, 0xE2, 0x4A, 0x1A, 0x23, 0x55, 0x4A, 0xB8, 0xA8, 0xCB, 0x8F, 0xAA, 
-0x86, 0xC8, 0xDA, 0xED, 0x5E, 0xBA, 0x60, 0xB2, 0x65, 0x28, 0x59, 0x0C, 0x27, 0x21, 0xFB, 0xBE, 
-0x3E, 0x58, 0x22, 0xCB, 0x75, 0x56, 0xD4, 0x22, 0x32, 0xDF, 0xA9, 0xA6, 0xDE, 0x7D, 0xBB, 0xAE, 
-0x3B, 0xB5, 0x37, 0x9B, 0x9E, 0x5F, 0xBA, 0xB1, 0x87, 0x23, 0x19, 0xEE, 0xC7, 0x3F, 0xFE, 0x89, 
-0x7A, 0xBA, 0xBF, 0xFF, 0xE6, 0x94, 0x92, 0x13, 0x31, 0xBA, 0xF8, 0x64, 0x94, 0xDB, 0x9F, 0x38, 
-0x71, 0x42, 0x77, 0x55, 0x01, 0x29, 0x41, 0xEB, 0x03, 0xF7, 0xEF, 0xDF, 0xCF, 0xAB, 0x78, 0x39, 
-0xD6, 0xF1, 0x1B, 0x8C, 0x55, 0x8D, 0xB4, 0x1C, 0x5B, 0xD5, 0xC8, 0xFA, 0xE8, 0x17, 0xE6, 0xD2, 
-0xD4, 0xDA, 0x6A, 0x91, 0x89, 0x35, 0x9C, 0xBB, 0x70, 0x9E, 0xED, 0x93, 0x27, 0x20, 0x37, 0x70, 
-0x9F, 0x23, 0x07, 0xF7, 0x9F, 0x3D, 0xFC, 0x5D, 0x50, 0xF2, 0x31, 0xCC, 0x63, 0x79, 0xAF, 0x31, 
-0x6A, 0x77, 0x5B, 0x3B, 0x6D, 0xC0, 0xA1, 0xEB, 0x78, 0xE1, 0xCB, 0xCF, 0xB1, 0xF7, 0xE0, 0x21, 
-0x92, 0xB2, 0x0E, 0x5A, 0x54, 0x0D, 0x61, 0x8C, 0x36, 0x98, 0x2E, 0x06, 0xDD, 0x3D, 0x74, 0xEE, 
-0x2C, 0xA7, 0xCE, 0x9C, 0x9E, 0x4F, 0xDF, 0x0A, 0x4A, 0x3E, 0x44, 0x54, 0x8A, 0xA9, 0x9D, 0x61, 
-0x3A, 0x9D, 0x72, 0xEB, 0xC6, 0x0D, 0xEE, 0xDF, 0xBD, 0xAD, 0xD2, 0xF4, 0x70, 0xD8, 0xEE, 0x61, 
-0x55, 0x5E, 0x5F, 0x29, 0xFA, 0xCF, 0x18, 0xFE, 0x5F, 0x68, 0x15, 0xFA, 0xE7, 0x57, 0x51, 0xFF, 
-0x9A, 0xAF, 0x54, 0x1C, 0x95, 0xBF, 0xE1, 0xB7, 0x3C, 0x0E, 0x74, 0x36, 0x93, 0x25, 0x41, 0x23, 
-0xF8, 0x14, 0x19, 0xAF, 0xAF, 0x71, 0xEE, 0xE2, 0x05, 0xB6, 0xB6, 0xB6, 0x0E, 0xB4, 0xCF, 0x61, 
-0xBA, 0xAA, 0xBD, 0x92, 0x9F, 0x3B, 0xFF, 0xDF, 0x68, 0x1B, 0x4D, 0x79, 0x10, 0x27, 0x44, 0x2A, 
-0xE7, 0x70, 0xCE, 0x71, 0xFF, 0xCE, 0x5D, 0x6E, 0xDF, 0xBC, 0x41, 0x0A, 0xCA, 0x14, 0xCB, 0xAC, 
-0xA4, 0xDF, 0x87, 0x52, 0x9E, 0x6D, 0xF5, 0xDF, 0x25, 0x14, 0x49, 0x35, 0xBF, 0xA3, 0xAF, 0x2E, 
-0x39, 0x12, 0x65, 0x81, 0x2C, 0xA8, 0x0F, 0xEE, 0x9E, 0x58, 0x2B, 0xB9, 0x8F, 0x0C, 0xCB, 0x71, 
-0x59, 0x8A, 0x5E, 0x90, 0x32, 0xFA, 0xFE, 0x95, 0xCB, 0x18, 0xB6, 0xB3, 0x52, 0x5E, 0xE5, 0xF9, 
-0x31, 0x86, 0x71, 0x37, 0x6D, 0xCF, 0x0C, 0xEF, 0x2B, 0x38, 0xBC, 0x77, 0x01, 0xFB, 0xFB, 0xCF, 
-0x35, 0x09, 0xB9, 0x60, 0xAD, 0x31, 0x45, 0x7A, 0x8B, 0x31, 0x62, 0x05, 0x4E, 0x9C, 0xD8, 0xA2, 
-0xAA, 0x54, 0x57, 0x2B, 0x22, 0x74, 0x5D, 0xC7, 0x64, 0xD6, 0xE2, 0x5F, 0xF9, 0x4C, 0xE8, 0x2B, 
-0x02, 0x06, 0xC1, 0xE5, 0x45, 0x33, 0x50, 0x0B, 0x0D, 0x63, 0x2B, 0x92, 0x58, 0x62, 0x12, 0x36, 
-0xB6, 0xB6, 0xB8, 0x70, 0xF9, 0x92, 0x6E, 0x8B, 0xF4, 0xEA, 0x47, 0xA1, 0xAF, 0xD7, 0x1C, 0x62, 
-0x55, 0x43, 0x2E, 0x95, 0x34, 0x4C, 0x01, 0x62, 0xD2, 0xAD, 0xBB, 0xC4, 0x40, 0x63, 0x0D, 0xF7, 
-0x6E, 0xDD, 0xE4, 0xC5, 0xE7, 0xBE, 0x4C, 0x98, 0xB6, 0x54, 0x62, 0x54, 0x0A, 0x2D, 0x0B, 0x81, 
-0x59, 0xFD, 0x11, 0x52, 0x64, 0x6D, 0x73, 0x83, 0x4B, 0xCF, 0x3C, 0xCD, 0x68, 0x7D, 0x8D, 0x94, 
-0x8F, 0x17, 0x43, 0x6F, 0xB2, 0xE4, 0x4E, 0x54, 0xFD, 0x7A, 0xED, 0x2A, 0x76, 0xEF, 0x3F, 0xE4, 
-0xA5, 0x17, 0x5E, 0x64, 0x6F, 0x67, 0x17, 0xE7, 0x1C, 0x26, 0xE9, 0x2E, 0xAE, 0xD2, 0x20, 0xFB, 
-0x8D, 0x6B, 0xD5, 0xEF, 0x55, 0x18, 0x7E, 0xE7, 0x2B, 0x45, 0xFF, 0x9D, 0xC7, 0xA5, 0xE1, 0xFD, 
-0x5F, 0xC9, 0x78, 0x2D, 0xF2, 0x67, 0x9D, 0xD3, 0xED, 0x18, 0xC6, 0x81, 0x58, 0x4E, 0x9F, 0x3D, 
-0xCB, 0xE5, 0xCB, 0x97, 0xF5, 0x5D, 0xC6, 0xCC, 0xF5, 0xA7, 0xFD, 0x77, 0x97, 0x36, 0xBA, 0xAA, 
-0xFE, 0x56, 0x31, 0xBD, 0x90, 0x22, 0xCE, 0xA8, 0xA4, 0x17, 0x42, 0xA0, 0xAE, 0x6B, 0xE8, 0x02, 
-0x2F, 0x3C, 0xF7, 0x3C, 0x77, 0xEF, 0xDC, 0x61, 0x63, 0x6D, 0x3C, 0x3F, 0x47, 0x65, 0x99, 0xA5, 
-0x40, 0x6B, 0xA0, 0xB3, 0xC2, 0xCC, 0x1A, 0x5A, 0x63, 0xF0, 0xA6, 0xAC, 0x09, 0xAA, 0x8C, 0xA9, 
-0x36, 0xB9, 0xAA, 0xF8, 0x52, 0xCB, 0xA5, 0x9E, 0xB4, 0x9D, 0x25, 0xDD, 0x94, 0x25, 0xD0, 0x04, 
-0x78, 0x13, 0x17, 0x64, 0x13, 0x9D, 0x4D, 0x78, 0x9B, 0x9D, 0xD7, 0x64, 0x73, 0x3B, 0xC8, 0x96, 
-0x2F, 0x99, 0x96, 0x24, 0xF5, 0x1E, 0xF4, 0x1E, 0xA5, 0xC5, 0x9A, 0xA1, 0x64, 0x3A, 0x88, 0x61, 
-0x59, 0xE5, 0x88, 0x12, 0x75, 0x88, 0xFE, 0x62, 0x4A, 0xAB, 0x4A, 0xEC, 0x11, 0x0C, 0x77, 0x77, 
-0x37, 0x3A, 0x60, 0x23, 0x25, 0xCC, 0x7C, 0x11, 0x20, 0xAA, 0xB3, 0x96, 0xB3, 0x67, 0xCF, 0x32, 
-0x6A, 0x9A, 0xF9, 0x94, 0x75, 0x7F, 0x6F, 0xA2, 0xFB, 0xB1, 0xF3, 0xC8, 0xD5, 0x5F, 0xE4, 0x7C, 
-0x12, 0x1C, 0xD5, 0x81, 0x8E, 0x83, 0xA3, 0xEE, 0x39, 0xCE, 0x33, 0xFB, 0x3E, 0x20, 0xE8, 0xED, 
-0x4C, 0xF3, 0x31, 0xE0, 0xEA, 0x8A, 0x8B, 0x97, 0x2F, 0x71, 0xE2, 0xE4, 0xC9, 0xB9, 0xAA, 0xC1, 
-0xE4, 0x29, 0x06, 0xBD, 0x29, 0xFC, 0x10, 0xAB, 0x8E, 0x97, 0x63, 0xAB, 0xCE, 0x35, 0x4D, 0xA3, 
-0xFE, 0x0D, 0x42, 0xE4, 0xDA, 0x4B, 0x57, 0xD8, 0x7F, 0xB8, 0x83, 0x84, 0x48, 0x85, 0x6E, 0x8D, 
-0x9C, 0xAB, 0x38, 0xF2, 0x8E, 0xB6, 0xAA, 0xAE, 0x39, 0x75, 0xE6, 0x34, 0x17, 0x2E, 0x5D, 0xC4, 
-0xD5, 0x95, 0x1A, 0x87, 0xF7, 0xA6, 0x3F, 0x56, 0xB2, 0x44, 0x9C, 0x25, 0x12, 0x49, 0x89, 0x9D, 
-0x07, 0xF7, 0xB8, 0x7B, 0xEB, 0x36, 0xBE, 0xED, 0x70, 0xB2, 0xD8, 0x3E, 0xBC, 0x2A, 0x4F, 0xC3, 
-0xDF, 0xAB, 0x50, 0x1A, 0x60, 0xBF, 0xEE, 0x56, 0x51, 0x1F, 0x47, 0x1D, 0x5B, 0x75, 0xEE, 0xD5, 
-0xC0, 0xF0, 0xF9, 0x43, 0x7A, 0xA5, 0x18, 0x3E, 0x6F, 0x48, 0x8F, 0xC2, 0xE3, 0x5C, 0x5B, 0xB0, 
-0x74, 0x4F, 0x5E, 0x1C, 0x8D, 0x02, 0x6B, 0x1B, 0xEB, 0x5C, 0xB8, 0x70, 0x81, 0xAD, 0xED, 0x6D, 
-0x7C, 0x52, 0xA7, 0x2F, 0x47, 0x21, 0x89, 0xD6, 0x63, 0xC8, 0x8B, 0x50, 0xF3, 0xE3, 0x99, 0x8A, 
-0x4A, 0xAD, 0x98, 0x48, 0x55, 0x79, 0x53, 0x41, 0x0A, 0x91, 0xBB, 0x77, 0xEE, 0x70, 0xE5, 0x85, 
-0x17, 0xD9, 0xDF, 0xD9, 0x55, 0xCB, 0x9F, 0x2C, 0x05, 0x1A, 0xB3, 0x60, 0x98, 0x1D, 0x2A, 0x49, 
-0x16, 0xC6, 0x56, 0x78, 0x85, 0x88, 0xC6, 0x18, 0x2B, 0xDF, 0x7C, 0x18, 0x0F, 0x51, 0xA6, 0x58, 
-0xD4, 0x0C, 0x66, 0xFE, 0x8C, 0x50, 0x68, 0x61, 0xD8, 0xB1, 0xB4, 0x66, 0x51, 0x50, 0xD6, 0x8A, 
-0x8E, 0x2C, 0x85, 0xB9, 0xEE, 0x78, 0x35, 0xFA, 0xCF, 0x4B, 0xC5, 0xAA, 0x4A, 0x99, 0xB3, 0x8D, 
-0x31, 0x5D, 0xFC, 0xD1, 0x1F, 0xFD, 0xD1, 0x95, 0xA6, 0x61, 0x47, 0xBE, 0x33, 0x84, 0xA9, 0x0D, 
-0x21, 0x8C, 0x0A, 0xB7, 0x36, 0x46, 0x55, 0x0A, 0x75, 0xED, 0x38, 0x77, 0xE6, 0x54, 0x8E, 0xF9, 
-0xA3, 0x2B, 0xF9, 0x0F, 0x1E, 0xEC, 0xE0, 0xBB, 0x48, 0xC2, 0x60, 0xF3, 0x3E, 0xEE, 0x57, 0x13, 
-0x8F, 0xDB, 0x60, 0x8F, 0x83, 0xA3, 0x9E, 0x57, 0x0A, 0x34, 0x04, 0x6D, 0xB4, 0xC6, 0x5A, 0x9D, 
-0xB2, 0xDB, 0x8A, 0xD3, 0x67, 0xCF, 0xF3, 0xF4, 0xB3, 0x6F, 0x56, 0x5B, 0xD9, 0x6C, 0xDE, 0x16, 
-0xB3, 0xF7, 0x22, 0x31, 0x69, 0xAE, 0x76, 0x59, 0x36, 0x58, 0x51, 0x05, 0x7E, 0x21, 0xE9, 0xD9, 
-0x17, 0xF7, 0x8F, 0x97, 0x73, 0x26, 0xA9, 0x83, 0x12, 0x42, 0xE4, 0xC6, 0x95, 0xAB, 0xDC, 0xBE, 
-0x7E, 0x03, 0xF1, 0x11, 0xAB, 0x26, 0x85, 0x73, 0x4A, 0x82, 0xFA, 0x6D, 0x70, 0x86, 0xAD, 0xD3, 
-0x27, 0x39, 0x73, 0xE1, 0x3C, 0x9B, 0x27, 0xB6, 0x49, 0x6A, 0x74, 0x98, 0x5D, 0xF2, 0x2D, 0x36, 
-0x14, 0x5A, 0x51, 0xE9, 0x96, 0x98, 0x78, 0x70, 0xE7, 0x1E, 0xB7, 0x6E, 0xDC, 0x64, 0x3A, 0x99, 
-0xA8, 0x87, 0xA7, 0x5C, 0x0E, 0x6A, 0x56, 0x77, 0x70, 0x04, 0x5F, 0x25, 0xF9, 0xBC, 0x96, 0x28, 
-0xEF, 0x5F, 0xF5, 0xDE, 0xFE, 0xB9, 0x55, 0x34, 0xC4, 0xAA, 0x3A, 0xFE, 0x4A, 0xC2, 0x51, 0xF9, 
-0x3B, 0xAC, 0x8D, 0x1E, 0x06, 0xD5, 0x41, 0x1A, 0x3C, 0x82, 0xAD, 0x1C, 0x17, 0x2E, 0x5D, 0xE2, 
-0xDC, 0x85, 0x8B, 0xBA, 0xC3, 0x4D, 0x6C, 0xDE, 0xF6, 0xBA, 0x8C, 0xA3, 0xFA, 0x57, 0x61, 0xB4, 
-0x7D, 0x14, 0xA6, 0x9D, 0xB2, 0x99, 0x54, 0xED, 0x2A, 0x26, 0x3B, 0xBB, 0x5C, 0x79, 0x3E, 0xCF, 
-0x96, 0x8C, 0x65, 0x36, 0x9B, 0xE5, 0xEB, 0xD4, 0xEF, 0xAD, 0x0A, 0x2D, 0x82, 0x04, 0xC1, 0xC4, 
-0x83, 0x12, 0xE6, 0x41, 0x1C, 0x5C, 0x5C, 0x2B, 0x52, 0x6A, 0x31, 0xFF, 0x9A, 0x4B, 0xAB, 0x98, 
-0xB9, 0xD5, 0x41, 0x91, 0x5E, 0xE7, 0xFA, 0xD9, 0xA4, 0x76, 0xFE, 0xC5, 0x6D, 0x40, 0x91, 0x78, 
-0xC9, 0xDB, 0xFF, 0xFB, 0x8B, 0xF5, 0x65, 0xD7, 0x5B, 0x5F, 0xE5, 0x30, 0x44, 0x29, 0xA3, 0x22, 
-0x6C, 0x2E, 0x97, 0x57, 0x32, 0x02, 0x67, 0x7E, 0xE1, 0x17, 0xAE, 0x2E, 0xEF, 0xDD, 0xCE, 0x38, 
-0xF2, 0x8B, 0x53, 0xAA, 0x2A, 0xA2, 0xA9, 0xAC, 0x18, 0xAC, 0x13, 0x9C, 0x55, 0x47, 0x15, 0xC6, 
-0xC0, 0xC6, 0xC6, 0xC6, 0x7C, 0x4F, 0x7D, 0x8C, 0x91, 0xBD, 0xBD, 0xBD, 0x6C, 0x0E, 0xB5, 0x58, 
-0x1D, 0x7D, 0x25, 0x38, 0xAC, 0xF2, 0x5F, 0x2B, 0x0C, 0x1B, 0x9C, 0x73, 0x6A, 0x73, 0x1B, 0x73, 
-0xEB, 0x14, 0xA7, 0xB6, 0x7D, 0xD5, 0xA8, 0xE1, 0xDC, 0xA5, 0x8B, 0x9C, 0x3A, 0x77, 0x46, 0x3D, 
-0x82, 0x19, 0x75, 0xE9, 0xD6, 0x05, 0xB5, 0xCB, 0x2B, 0x1D, 0xFE, 0xA8, 0x0A, 0x63, 0x05, 0x33, 
-0x3B, 0x70, 0x3C, 0x26, 0x82, 0xF7, 0x48, 0x88, 0x3C, 0xFF, 0xE5, 0xE7, 0xD8, 0x7D, 0xF0, 0x10, 
-0x09, 0xAA, 0xDF, 0x4A, 0xD9, 0x25, 0x63, 0xA9, 0xF4, 0x94, 0x07, 0x84, 0x8D, 0xAD, 0x2D, 0xB6, 
-0x4F, 0x9E, 0x50, 0x1F, 0x0F, 0x49, 0x9D, 0xF1, 0x14, 0xCB, 0x8A, 0xF2, 0x4C, 0x99, 0x9B, 0xC6, 
-0x45, 0xEE, 0xDC, 0xBA, 0xC1, 0xED, 0x1B, 0x37, 0xF1, 0x6D, 0x87, 0xCD, 0x8D, 0xC7, 0x64, 0x8B, 
-0x8D, 0x7E, 0xFE, 0x86, 0x79, 0x5D, 0x95, 0xEF, 0x57, 0x1B, 0xAB, 0xDE, 0xD1, 0xCF, 0xD7, 0xA3, 
-0x68, 0x15, 0x5E, 0xAF, 0xB6, 0xF4, 0xA4, 0x78, 0x25, 0xF9, 0x1B, 0xDE, 0x1B, 0xF3, 0x42, 0x6A, 
-0x3D, 0x6A, 0xB8, 0x70, 0xE9, 0x22, 0xDB, 0xA7, 0xD5, 0x52, 0xC9, 0x39, 0x37, 0x37, 0x9F, 0x5A, 
-0x85, 0x55, 0x7D, 0xAE, 0x5F, 0x9E, 0x45, 0x72, 0xB4, 0x56, 0xDD, 0x18, 0x16, 0xF3, 0xCB, 0x4A, 
-0x0C, 0x93, 0x87, 0xBB, 0xDC, 0xBA, 0x71, 0x13, 0x2B, 0xC2, 0xC6, 0x78, 0x8D, 0x76, 0xDA, 0xAA, 
-0xA8, 0x91, 0x20, 0xB6, 0x1D, 0x15, 0x0E, 0x1B, 0x8D, 0xAA, 0xC4, 0x12, 0xD8, 0xCC, 0xD8, 0x6C, 
-0x62, 0xCE, 0x8A, 0xE6, 0x0B, 0x64, 0x87, 0x48, 0x98, 0x52, 0xCC, 0x3B, 0x13, 0x98, 0x68, 0xB0, 
-0xC9, 0xE2, 0x82, 0xBA, 0x53, 0x34, 0xC1, 0x62, 0xA3, 0xC3, 0x24, 0xF5, 0x07, 0x1C, 0x29, 0x5B, 
-0x82, 0x17, 0xF9, 0xEE, 0xB7, 0x8F, 0xC2, 0xC0, 0x0B, 0xD3, 0xED, 0x0B, 0x33, 0x87, 0xA1, 0x94, 
-0xCD, 0xBC, 0xFF, 0x59, 0xCD, 0xAB, 0x3E, 0x33, 0x02, 0xC9, 0xA4, 0xC4, 0xFA, 0xF6, 0xF6, 0xDA, 
-0x4A, 0x26, 0x78, 0x24, 0xC3, 0x6D, 0xDB, 0xAE, 0xF1, 0xC1, 0x37, 0x48, 0x44, 0x04, 0xBC, 0x6F, 
-0x11, 0x13, 0x69, 0x6A, 0xC7, 0xC6, 0x46, 0x8E, 0x08, 0x60, 0x74, 0xA4, 0xB8, 0x7B, 0xFF, 0x21, 
-0x21, 0x81, 0xB1, 0x15, 0x21, 0x9B, 0x64, 0x0C, 0xE9, 0x28, 0x0C, 0xAF, 0x3D, 0x4E, 0xE7, 0x39, 
-0x8A, 0x1E, 0x07, 0x47, 0xBD, 0xC7, 0xB9, 0x9A, 0xB6, 0x53, 0xFF, 0xB1, 0xD6, 0xD5, 0xD4, 0xA3, 
-0x86, 0xA7, 0x9E, 0x79, 0x1A, 0x5B, 0x35, 0xBA, 0x9B, 0x0E, 0x43, 0xF0, 0xEA, 0x8C, 0xC4, 0xFB, 
-0xE2, 0xCF, 0x73, 0xF5, 0xB3, 0xE8, 0x57, 0x54, 0x66, 0xE6, 0x73, 0xC9, 0xB8, 0xE7, 0xF0, 0x45, 
-0x12, 0x90, 0x02, 0x95, 0x11, 0x1E, 0xDE, 0xBF, 0xC7, 0x97, 0x3F, 0xFF, 0x39, 0x24, 0x06, 0x1C, 
-0x89, 0xE8, 0x3B, 0xC4, 0xA8, 0x71, 0xB6, 0x4F, 0x9E, 0x24, 0x91, 0x40, 0xA0, 0x1A, 0xAF, 0xF1, 
-0xE6, 0xB7, 0xBE, 0x8D, 0x8D, 0xAD, 0x13, 0xEC, 0xEC, 0x4F, 0xE6, 0x5B, 0x3A, 0xCB, 0x80, 0xE1, 
-0x8C, 0xD5, 0x2D, 0x95, 0x79, 0x93, 0x47, 0x37, 0x9B, 0x72, 0xFB, 0xE6, 0x2D, 0xA6, 0x93, 0x09, 
-0xA3, 0xCA, 0x69, 0xBE, 0xB3, 0xFB, 0xC7, 0xB2, 0xE9, 0x22, 0x0D, 0xEC, 0x6E, 0x0B, 0xF5, 0xEB, 
-0x66, 0x48, 0x05, 0xC3, 0xE3, 0x8F, 0x4B, 0xAB, 0xF0, 0x38, 0xF5, 0x3B, 0xCC, 0xF3, 0x30, 0xEF, 
-0xAF, 0x15, 0x86, 0xDF, 0xF1, 0xB8, 0x74, 0x14, 0xFA, 0xDF, 0x9F, 0xB2, 0x03, 0x1C, 0xE9, 0x39, 
-0x13, 0xA7, 0x27, 0x79, 0x76, 0x21, 0xE2, 0x46, 0x63, 0xB6, 0x4F, 0x9F, 0xE1, 0xD4, 0x99, 0x73, 
-0xD4, 0xA3, 0x86, 0x36, 0x78, 0x42, 0x36, 0x71, 0x5A, 0x94, 0xA1, 0x4A, 0x7C, 0xE5, 0xFD, 0xA5, 
-0x9C, 0xFA, 0x18, 0xE6, 0x4F, 0xB2, 0xB9, 0xA2, 0x73, 0x0E, 0x01, 0x1A, 0x57, 0x11, 0xDA, 0x8E, 
-0x4F, 0x7F, 0xEA, 0x57, 0x69, 0xF7, 0x27, 0x38, 0x1C, 0x21, 0x24, 0x9A, 0xD1, 0x1A, 0x29, 0x80, 
-0x33, 0x15, 0x8D, 0xA9, 0x49, 0xD3, 0x96, 0x3A, 0x0A, 0xCE, 0x27, 0x6C, 0x17, 0x71, 0x3E, 0xD1, 
-0x24, 0x47, 0x63, 0x1C, 0x65, 0x33, 0x4A, 0x48, 0x3A, 0x50, 0x68, 0xCE, 0x16, 0xB6, 0xB8, 0x92, 
-0xC8, 0xF6, 0xE9, 0xBA, 0x41, 0x44, 0x19, 0xAC, 0xE0, 0xBC, 0x50, 0xC7, 0x8A, 0x51, 0xA8, 0xA8, 
-0x3B, 0x51, 0x8A, 0xCA, 0xEB, 0x74, 0xB3, 0x43, 0x5E, 0x50, 0x23, 0xCB, 0x9E, 0x65, 0xDB, 0x69, 
-0x4F, 0xBA, 0x96, 0x64, 0x30, 0x31, 0x65, 0x6B, 0xA0, 0x05, 0x23, 0xD6, 0x3E, 0x94, 0xCB, 0x2A, 
-0x5F, 0x5F, 0xCA, 0xA1, 0xA8, 0xE9, 0xCA, 0x06, 0x88, 0x94, 0xD5, 0x26, 0xEA, 0x8B, 0x37, 0xD5, 
-0xA6, 0x6F, 0x0A, 0xD1, 0xC3, 0xCA, 0x83, 0x05, 0x6D, 0xDB, 0x8E, 0xC4, 0x98, 0x26, 0xA5, 0x44, 
-0xD7, 0xCD, 0x88, 0xC9, 0x43, 0xF0, 0x58, 0x6B, 0xD8, 0xDC, 0x5C, 0x9F, 0x57, 0x78, 0x08, 0x81, 
-0xBD, 0xBD, 0xBD, 0x85, 0xDE, 0x73, 0xAE, 0x98, 0xFE, 0x75, 0x0E, 0xA3, 0xBB, 0x61, 0x0A, 0x33, 
-0x1D, 0x6D, 0xAE, 0xF3, 0xEC, 0x9B, 0xDF, 0xCC, 0xFA, 0xE6, 0xC6, 0x5C, 0x4F, 0x9D, 0x7A, 0xA3, 
-0xDE, 0x71, 0x50, 0x1A, 0x6D, 0xA9, 0x20, 0x7A, 0x5E, 0xB8, 0x4C, 0x76, 0x0F, 0x67, 0xAD, 0xA5, 
-0xB6, 0x8E, 0xBD, 0x07, 0x0F, 0xB9, 0x7D, 0xF3, 0x96, 0x9A, 0xA8, 0xCD, 0x3A, 0x2A, 0xEB, 0x34, 
-0xFC, 0x47, 0x8E, 0x79, 0xE5, 0xEA, 0x8A, 0x2E, 0x45, 0x5C, 0x53, 0x73, 0xE1, 0xF2, 0x25, 0x36, 
-0x4F, 0x9E, 0xC0, 0x34, 0x6A, 0x77, 0x1B, 0x73, 0xC7, 0x72, 0xCE, 0xCD, 0xF5, 0xCF, 0x29, 0xDB, 
-0x18, 0x13, 0x23, 0x2F, 0x3E, 0xFF, 0x02, 0xF7, 0xEF, 0xDC, 0xCD, 0x5B, 0x2D, 0x8B, 0x0F, 0x52, 
-0xED, 0xB0, 0x7D, 0x93, 0x97, 0x27, 0xA5, 0x47, 0x61, 0x78, 0xFD, 0xAB, 0x4D, 0xA5, 0x1C, 0x0F, 
-0xA3, 0xE1, 0xF5, 0x43, 0x3A, 0x2E, 0x86, 0xF7, 0x0C, 0x9F, 0xF3, 0xA4, 0x74, 0x1C, 0xF8, 0xBC, 
-0xBB, 0xB0, 0x3F, 0xD3, 0x8C, 0x51, 0x67, 0x36, 0x62, 0x0C, 0xA3, 0xB5, 0x31, 0x97, 0x9E, 0x7A, 
-0x8A, 0xAD, 0x13, 0xDB, 0x44, 0x01, 0x97, 0xFB, 0xEB, 0xA3, 0xD0, 0x9F, 0x62, 0x1F, 0x86, 0x94, 
-0x74, 0x80, 0x6E, 0xAA, 0x9A, 0xCA, 0x39, 0x6E, 0x5E, 0xBF, 0xC1, 0xEE, 0xFD, 0x07, 0xF8, 0xE9, 
-0x4C, 0xDB, 0x6B, 0xDE, 0x00, 0x54, 0xDA, 0x36, 0xA5, 0x6C, 0x54, 0x67, 0x86, 0x98, 0x44, 0x4C, 
-0x9E, 0xD6, 0xCF, 0xE8, 0xBA, 0x0E, 0x72, 0xDB, 0x2B, 0xDF, 0xA1, 0x52, 0x6C, 0x9E, 0x5D, 0xF6, 
-0xF2, 0x53, 0x24, 0xD5, 0x90, 0x92, 0xDA, 0x95, 0x97, 0xF2, 0x9A, 0x97, 0x9B, 0x32, 0x3F, 0x9B, 
-0x37, 0x4F, 0x0D, 0xA5, 0xD5, 0xD4, 0xF7, 0xDC, 0x97, 0xD4, 0x7D, 0xE7, 0x42, 0x62, 0xCE, 0x12, 
-0xF7, 0x6A, 0xE1, 0x3A, 0xA3, 0xC7, 0xA8, 0x97, 0xCA, 0x72, 0x7E, 0x93, 0x48, 0x92, 0x46, 0x1E, 
-0x3E, 0x01, 0xC3, 0x7D, 0x70, 0xFB, 0xC1, 0xC8, 0x9A, 0xBA, 0x2A, 0x15, 0x5A, 0xD7, 0x0E, 0x57, 
-0x19, 0x46, 0xE3, 0x9A, 0xCD, 0x8D, 0x0D, 0xAC, 0x30, 0xDF, 0x8D, 0xF5, 0xF0, 0xE1, 0x2E, 0x21, 
-0xE8, 0x56, 0xD4, 0x52, 0xC0, 0xBF, 0x9E, 0xA1, 0x26, 0x2B, 0xB9, 0x12, 0xAD, 0xEA, 0x7F, 0xB6, 
-0x4F, 0x9E, 0xE6, 0xCD, 0x6F, 0x7D, 0x1B, 0x36, 0x6F, 0xDD, 0x2D, 0xCC, 0x36, 0xE5, 0x6D, 0x84, 
-0x22, 0x69, 0x6E, 0x1F, 0x78, 0x14, 0x4A, 0xA5, 0x97, 0xCE, 0x9F, 0x7A, 0x5B, 0x99, 0xCB, 0xFF, 
-0xD6, 0x5A, 0x6E, 0x5E, 0xBF, 0xC1, 0xB5, 0x97, 0x5E, 0xC6, 0x89, 0x21, 0x7A, 0x4F, 0x65, 0xB5, 
-0x1E, 0x30, 0xA2, 0xB6, 0xBE, 0x02, 0x6D, 0xF0, 0xB8, 0x71, 0xC3, 0xC5, 0xA7, 0x2F, 0x33, 0x5E, 
-0x5F, 0x03, 0xD1, 0x6D, 0xC3, 0x29, 0x09, 0x21, 0x09, 0xD6, 0x54, 0x3A, 0x52, 0xC7, 0x94, 0x19, 
-0xB6, 0xC1, 0xB7, 0x1D, 0xD7, 0x5F, 0xBE, 0xC2, 0x64, 0x7F, 0x5F, 0x75, 0xCB, 0xC6, 0xE8, 0x0A, 
-0x71, 0xDE, 0x64, 0xC0, 0xAB, 0xC8, 0x38, 0x9E, 0x94, 0x1E, 0x05, 0xD3, 0xF3, 0xF6, 0xBF, 0x8A, 
-0x86, 0xCF, 0x1B, 0xD2, 0xA3, 0x30, 0xBC, 0xFE, 0x30, 0x1A, 0xDE, 0x73, 0x5C, 0x0C, 0x9F, 0x33, 
-0xA4, 0x47, 0xC1, 0xE6, 0x99, 0x08, 0xA5, 0x0D, 0xF6, 0x06, 0x72, 0x32, 0x63, 0xDA, 0x3A, 0x75, 
-0x92, 0xCB, 0x4F, 0x3F, 0x45, 0x33, 0x1E, 0xD1, 0xB6, 0x6D, 0x7E, 0xF6, 0xC2, 0xA1, 0x4D, 0xCA, 
-0x16, 0x06, 0xAB, 0x88, 0xDE, 0x96, 0xE4, 0x55, 0x64, 0xB1, 0xA4, 0x00, 0xB5, 0xAD, 0x69, 0x27, 
-0x2D, 0x57, 0x5F, 0xB8, 0xC2, 0x6C, 0x7F, 0x86, 0x78, 0xA8, 0x70, 0xEA, 0xDF, 0xC2, 0xA8, 0x07, 
-0x35, 0xB1, 0x86, 0x68, 0x13, 0xDE, 0x25, 0x5A, 0x13, 0x98, 0x89, 0x87, 0x91, 0x55, 0x6A, 0x0C, 
-0xD1, 0xE9, 0xA6, 0xA2, 0xD2, 0x2F, 0x52, 0x50, 0x86, 0x5B, 0xD4, 0x0E, 0x05, 0x45, 0x3D, 0xD0, 
-0x5A, 0xF0, 0x95, 0xE0, 0x2B, 0xA1, 0x35, 0x91, 0x89, 0x89, 0x4C, 0x8C, 0x67, 0x6A, 0x03, 0x33, 
-0x17, 0x09, 0x36, 0xE9, 0x46, 0x99, 0xE8, 0xE7, 0xBB, 0x5C, 0xCB, 0xA2, 0x7F, 0xF1, 0x9D, 0x90, 
-0xF2, 0xC2, 0x9F, 0xAE, 0x4E, 0x29, 0x0C, 0x79, 0x0D, 0xA5, 0x57, 0x8E, 0xC5, 0xE6, 0xF8, 0x30, 
-0x94, 0xBA, 0x9A, 0xF7, 0x1B, 0xF5, 0xA7, 0x5C, 0xCD, 0x46, 0xD3, 0x95, 0x95, 0x78, 0xE8, 0x93, 
-0x52, 0x4A, 0xF2, 0xFC, 0x95, 0x17, 0x37, 0xBA, 0x6E, 0xEA, 0x42, 0x08, 0xC4, 0xD0, 0x41, 0x52, 
-0x07, 0xE2, 0x10, 0x35, 0x2A, 0x6F, 0x6F, 0x2A, 0xB3, 0xBB, 0xBB, 0x4F, 0x4A, 0x82, 0xB5, 0x1A, 
-0x0E, 0xE6, 0xD7, 0x3B, 0x44, 0x34, 0x1C, 0x8D, 0x58, 0xD5, 0x29, 0x35, 0x6B, 0x63, 0xCE, 0x5F, 
-0xBC, 0xC0, 0xE6, 0xF6, 0x96, 0xDA, 0xDB, 0xE6, 0x06, 0xA0, 0xCC, 0x76, 0xB9, 0x6C, 0x8F, 0x3B, 
-0xE0, 0x48, 0x56, 0x2D, 0x14, 0x89, 0x2B, 0x04, 0xDD, 0x42, 0x98, 0xB2, 0x43, 0xF0, 0xEB, 0x57, 
-0xAF, 0x71, 0xEF, 0xF6, 0x1D, 0x6D, 0x04, 0x89, 0x79, 0x24, 0x0B, 0x00, 0x8C, 0x30, 0x0B, 0x1E, 
-0xAC, 0x61, 0xEB, 0xC4, 0x09, 0xB6, 0x4E, 0x9C, 0xC0, 0x17, 0xDB, 0xCB, 0xA4, 0x4E, 0xB8, 0x0B, 
-0x42, 0xD7, 0x41, 0x4C, 0xD4, 0xD9, 0xA1, 0xF9, 0xED, 0x9B, 0xB7, 0xD8, 0x7B, 0xB8, 0xA3, 0xBA, 
-0x37, 0xE7, 0xD4, 0x20, 0xBD, 0x37, 0x10, 0xBC, 0x1A, 0xF5, 0x37, 0xEC, 0xC0, 0x43, 0x7A, 0xAD, 
-0x91, 0x56, 0x4C, 0xD7, 0xFB, 0xF4, 0x95, 0x8E, 0x61, 0x79, 0x0D, 0x69, 0xDE, 0x0E, 0xB2, 0xFA, 
-0x24, 0xE5, 0xB6, 0x51, 0xCE, 0x37, 0xE3, 0x11, 0x17, 0x2F, 0x5F, 0x62, 0x7D, 0x73, 0x83, 0x2E, 
-0x06, 0x7C, 0x08, 0x79, 0xD1, 0x57, 0x19, 0x60, 0xCA, 0x5B, 0x80, 0x8F, 0x83, 0xE1, 0x75, 0x29, 
-0x0B, 0x05, 0xC6, 0x18, 0xBC, 0xF7, 0xBC, 0xF8, 0xFC, 0x0B, 0xDC, 0xBA, 0x79, 0x53, 0x07, 0x75, 
-0xD4, 0x69, 0x7F, 0x37, 0x6B, 0xE7, 0x92, 0x6A, 0x61, 0x78, 0xA4, 0x2E, 0x6F, 0x17, 0xEE, 0x98, 
-0x4E, 0x76, 0xF0, 0xDD, 0x84, 0x94, 0x3A, 0x12, 0xDD, 0xFC, 0x1A, 0x63, 0x0C, 0x95, 0x75, 0x59, 
-0xAF, 0xBA, 0xF8, 0xC6, 0x94, 0x05, 0x9C, 0x22, 0xE8, 0xCC, 0xB7, 0x6E, 0x13, 0x88, 0xA9, 0x25, 
-0xD1, 0x21, 0x26, 0x20, 0xB4, 0x90, 0x3A, 0x9C, 0x40, 0x23, 0x42, 0x0D, 0x54, 0x39, 0x20, 0x56, 
-0x59, 0x2D, 0x34, 0x79, 0xD7, 0x68, 0x79, 0x56, 0xB1, 0x64, 0x38, 0x2E, 0x4A, 0x79, 0x94, 0xB2, 
-0x9E, 0xB7, 0x27, 0x55, 0x5D, 0x08, 0x31, 0x56, 0x6D, 0x3B, 0x5B, 0x59, 0xB8, 0x87, 0x32, 0xDC, 
-0x1F, 0xFA, 0x21, 0xE4, 0xFE, 0xFD, 0x9D, 0x51, 0x84, 0x25, 0x93, 0x83, 0x94, 0xB7, 0xE8, 0x55, 
-0x55, 0xD5, 0xEB, 0xA0, 0x89, 0x9D, 0x87, 0xBB, 0xF3, 0x8E, 0xAE, 0xF6, 0x6F, 0xBF, 0xCE, 0x91, 
-0xF5, 0x32, 0xA5, 0x52, 0xCE, 0x9C, 0x3D, 0xCB, 0xC5, 0xCB, 0x97, 0xD4, 0x0E, 0x37, 0xEF, 0xC0, 
-0x89, 0xD9, 0x24, 0xA5, 0x40, 0x7A, 0xF4, 0xA8, 0x4E, 0x6D, 0xF2, 0x0E, 0xBD, 0xD2, 0x51, 0xE8, 
-0x35, 0xE4, 0xCA, 0x39, 0x1E, 0xDE, 0xBB, 0xCF, 0xDD, 0x9B, 0x37, 0xE8, 0xDA, 0x29, 0x92, 0x07, 
-0xB8, 0xAE, 0xD3, 0x55, 0xDF, 0x90, 0x12, 0x62, 0x0D, 0x6D, 0xF0, 0x6C, 0x9E, 0xD8, 0xE6, 0xE2, 
-0xD3, 0x97, 0x19, 0xAD, 0x8D, 0xE9, 0xBC, 0xEE, 0x9D, 0x37, 0xC6, 0xE0, 0x32, 0x99, 0xDC, 0x21, 
-0xAD, 0x55, 0xE7, 0x2A, 0xF7, 0xEF, 0xDE, 0xE6, 0x85, 0xE7, 0xBE, 0xC4, 0x74, 0x3A, 0x9D, 0x77, 
-0xD4, 0xBE, 0xA4, 0x34, 0xEC, 0x5C, 0x87, 0x61, 0xC8, 0xC0, 0x1E, 0x97, 0x1E, 0x85, 0xE1, 0xF5, 
-0x43, 0x9A, 0x4F, 0x9F, 0x0F, 0xA1, 0xE1, 0xF5, 0x43, 0x7A, 0x14, 0x86, 0xD7, 0x1F, 0x46, 0xC3, 
-0x7B, 0x8E, 0x8B, 0xE1, 0x73, 0x86, 0xF4, 0x28, 0xA4, 0x1E, 0xD3, 0xEB, 0x33, 0xDC, 0x94, 0xDB, 
-0xEC, 0xC9, 0xD3, 0xA7, 0xB9, 0xFC, 0xF4, 0xB3, 0x24, 0xB1, 0x74, 0x3E, 0xE2, 0x9A, 0x11, 0x29, 
-0x87, 0x6E, 0xEA, 0xD7, 0x71, 0x9F, 0x89, 0xF7, 0xEB, 0x7F, 0x9E, 0xE6, 0xC1, 0xBE, 0x60, 0x3E, 
-0x4D, 0x8F, 0x89, 0xCA, 0x39, 0x26, 0x7B, 0xFB, 0x7C, 0xF1, 0xF3, 0x5F, 0x60, 0xF7, 0xDE, 0x83, 
-0xEC, 0x07, 0xA1, 0x38, 0xFF, 0xD1, 0x9B, 0x9C, 0x31, 0x38, 0x12, 0x55, 0xF0, 0xD4, 0x31, 0xB0, 
-0x46, 0x64, 0xC3, 0x24, 0xC6, 0x29, 0x30, 0x4E, 0x81, 0x26, 0x06, 0xEA, 0x14, 0xA9, 0x24, 0xE2, 
-0xAC, 0x20, 0xA2, 0x26, 0x8E, 0xF9, 0x6D, 0x73, 0xF5, 0xE4, 0x9C, 0xD9, 0xE6, 0x2D, 0xB7, 0x22, 
-0x09, 0x6B, 0x22, 0x95, 0xF1, 0x34, 0x26, 0xB2, 0x26, 0x9E, 0x35, 0x3C, 0x63, 0x3A, 0xC6, 0x61, 
-0x46, 0xD5, 0x75, 0x54, 0x3E, 0xD2, 0x20, 0x34, 0x46, 0xE3, 0xAC, 0x49, 0x62, 0x1E, 0x84, 0x36, 
-0xB1, 0x60, 0xE0, 0x61, 0x6E, 0x7F, 0xAB, 0x9E, 0x1B, 0xD2, 0xE1, 0x6C, 0x71, 0x09, 0xC3, 0xBE, 
-0x52, 0x7E, 0x47, 0xB0, 0x66, 0x7F, 0x35, 0x13, 0x5C, 0x79, 0xB0, 0xA0, 0xB6, 0xA3, 0xB5, 0xDA, 
-0xD4, 0xA6, 0x32, 0x1A, 0xEE, 0x05, 0x34, 0x78, 0xE1, 0x68, 0x5C, 0xD3, 0x64, 0x1B, 0xDC, 0x94, 
-0x12, 0xDE, 0x7B, 0x76, 0x77, 0x77, 0xE7, 0xE1, 0x6F, 0x86, 0x19, 0xF9, 0xF5, 0x8A, 0x2E, 0xE8, 
-0xD6, 0xDE, 0x7A, 0x3C, 0xE2, 0xDC, 0xC5, 0x0B, 0x9C, 0x38, 0x71, 0x42, 0xAD, 0x11, 0x72, 0xF8, 
-0x90, 0x79, 0x01, 0xAB, 0xAF, 0x67, 0x80, 0x25, 0x47, 0x34, 0x47, 0x75, 0x9E, 0xC2, 0x70, 0x8B, 
-0x34, 0x59, 0x98, 0x62, 0x55, 0x55, 0x84, 0xD0, 0x71, 0xE3, 0xDA, 0x75, 0xF6, 0x77, 0x77, 0xF5, 
-0x59, 0x31, 0xE1, 0xF2, 0xC6, 0x0A, 0xF2, 0x88, 0xDC, 0x85, 0xBC, 0xAB, 0xEC, 0xC2, 0x79, 0xCE, 
-0x5F, 0xBA, 0xA8, 0x6A, 0x8F, 0xDE, 0xCE, 0x9D, 0xD2, 0x09, 0x45, 0x84, 0xCA, 0x3A, 0xC6, 0xA3, 
-0x11, 0x31, 0x46, 0xEE, 0xDE, 0xBE, 0xC3, 0x9D, 0x3B, 0x77, 0x90, 0x6C, 0xFE, 0x55, 0xEC, 0x79, 
-0x45, 0x04, 0xC9, 0x8C, 0xBF, 0x2F, 0x3D, 0xBD, 0x56, 0x18, 0x32, 0x98, 0x21, 0xFD, 0x7A, 0xC3, 
-0xAB, 0x9D, 0xE7, 0x61, 0x79, 0x0C, 0xA9, 0xE8, 0x6F, 0x4B, 0x5D, 0x95, 0xBE, 0x18, 0x42, 0x60, 
-0x3C, 0x1E, 0x73, 0xFE, 0xFC, 0x45, 0xB6, 0x4F, 0x9E, 0xC0, 0x67, 0x5B, 0x5C, 0x0D, 0xDC, 0xAA, 
-0x53, 0xE8, 0x90, 0x83, 0xB9, 0x0E, 0x99, 0x6C, 0xC1, 0xF0, 0xF7, 0x2A, 0x48, 0x96, 0xEC, 0x76, 
-0x1E, 0x3C, 0xE0, 0xCE, 0xCD, 0x5B, 0x6A, 0x51, 0xE3, 0x35, 0x06, 0x9E, 0x13, 0xA3, 0x1E, 0xB4, 
-0x9C, 0xC1, 0xC6, 0x88, 0x6D, 0x3D, 0xD5, 0x74, 0xCA, 0xC6, 0xDE, 0x8C, 0xED, 0xFD, 0x8E, 0x53, 
-0x7B, 0x1D, 0x97, 0xA3, 0xE1, 0x74, 0x17, 0x58, 0xDF, 0x9F, 0x51, 0x4D, 0x26, 0xB8, 0x10, 0xA9, 
-0x04, 0x20, 0xD2, 0x05, 0x4F, 0x10, 0x93, 0xED, 0x6A, 0x17, 0xDB, 0x7A, 0x8B, 0x7E, 0xD5, 0xC5, 
-0xC8, 0x28, 0x26, 0xC6, 0xAD, 0xA7, 0x99, 0x4C, 0x70, 0x0F, 0x1F, 0x32, 0x7A, 0xB8, 0xCB, 0xD6, 
-0xEE, 0x84, 0xD3, 0xFB, 0x53, 0xB6, 0x67, 0x1D, 0xD5, 0x64, 0x02, 0xD3, 0x29, 0x69, 0x36, 0x83, 
-0xCE, 0x63, 0x93, 0xFA, 0x58, 0x40, 0x34, 0x74, 0x51, 0x2C, 0xB6, 0xBB, 0xD9, 0x1E, 0xB8, 0x4F, 
-0x47, 0x7D, 0x7F, 0x7F, 0x40, 0x5A, 0x55, 0x76, 0x19, 0x6E, 0x7F, 0x11, 0x70, 0x66, 0x09, 0x2B, 
-0x0F, 0x02, 0xBC, 0xE7, 0x3D, 0x9F, 0x94, 0x28, 0xB1, 0xEE, 0x62, 0x67, 0x74, 0xF5, 0x3D, 0xA8, 
-0xAB, 0xB2, 0xDC, 0x39, 0xCB, 0x62, 0x0C, 0x79, 0xD1, 0x67, 0xD6, 0xB5, 0x9A, 0xE1, 0x57, 0xB9, 
-0xE1, 0xBD, 0x51, 0x28, 0xDF, 0x21, 0xC6, 0x71, 0xFE, 0xFC, 0x45, 0x2E, 0x5C, 0xB8, 0x80, 0x58, 
-0x4B, 0x28, 0xC7, 0x7B, 0x05, 0xBD, 0xFC, 0xCD, 0x8B, 0x8D, 0x03, 0x8F, 0x42, 0xB9, 0x2F, 0xF5, 
-0x74, 0xBA, 0x31, 0x46, 0x6E, 0xDD, 0xBA, 0xC5, 0x8D, 0x6B, 0xD7, 0xF1, 0x6D, 0x47, 0x65, 0xEC, 
-0xDC, 0xFF, 0x41, 0x69, 0xE4, 0x00, 0xD1, 0x0A, 0x1B, 0xDB, 0x5B, 0x9C, 0x3D, 0x7F, 0x8E, 0xB5, 
-0xF5, 0x75, 0x7C, 0xD0, 0x55, 0x63, 0xEF, 0xBD, 0x4A, 0x02, 0x29, 0x11, 0x43, 0x76, 0x06, 0x92, 
-0xA5, 0xA0, 0xFB, 0x77, 0xEF, 0x71, 0xFB, 0xE6, 0x2D, 0xA2, 0x0F, 0x54, 0x56, 0x7D, 0x62, 0x98, 
-0xEC, 0x92, 0x72, 0xC9, 0x6B, 0xD3, 0xF1, 0xB2, 0xFF, 0x8A, 0x30, 0xEC, 0xF0, 0x43, 0x7A, 0xA5, 
-0x18, 0x3E, 0x6F, 0x48, 0x8F, 0xC2, 0xF0, 0xFA, 0xC3, 0x68, 0x78, 0xFD, 0xEB, 0x85, 0x61, 0x3F, 
-0x93, 0xBC, 0xD8, 0xE4, 0x9C, 0xE3, 0xE2, 0xC5, 0x8B, 0x9C, 0xBF, 0x78, 0x61, 0x49, 0xF2, 0x5D, 
-0xB2, 0x3C, 0xE9, 0x31, 0x95, 0xC2, 0x78, 0x86, 0x79, 0x97, 0xA4, 0xC2, 0x43, 0xFF, 0x77, 0x11, 
-0x22, 0x0A, 0x1E, 0xDC, 0xBD, 0xC7, 0x4B, 0x2F, 0xBC, 0x48, 0xDB, 0xAA, 0x1F, 0x11, 0x11, 0x15, 
-0x0E, 0xAC, 0xB5, 0x04, 0x09, 0x84, 0xD8, 0x91, 0xDA, 0x19, 0xA3, 0x69, 0xC7, 0xB9, 0x60, 0x79, 
-0x9B, 0x5B, 0xE7, 0x83, 0xCD, 0x09, 0x3E, 0x34, 0x3A, 0xC5, 0x07, 0xAB, 0x4D, 0xDE, 0x67, 0x37, 
-0x79, 0x8B, 0x8C, 0x39, 0xE7, 0x2D, 0xA3, 0x99, 0xC7, 0xF8, 0xA0, 0x9B, 0x75, 0x6A, 0x87, 0x17, 
-0x83, 0x37, 0x26, 0xFB, 0xCB, 0xCE, 0x83, 0x4A, 0x82, 0x2A, 0x46, 0xD6, 0xBA, 0x48, 0xB3, 0x37, 
-0x65, 0x7B, 0xE6, 0xB9, 0x14, 0x2C, 0xEF, 0xB0, 0x63, 0xDE, 0x57, 0x6F, 0xF0, 0xB5, 0xA3, 0x2D, 
-0xBE, 0x6E, 0xB4, 0xC5, 0xFB, 0xC6, 0x9B, 0x3C, 0xB5, 0xB1, 0xC5, 0x66, 0xD3, 0xE0, 0x22, 0x98, 
-0x6C, 0xBF, 0x5E, 0xA2, 0x09, 0x93, 0x9D, 0xDC, 0x24, 0x51, 0x65, 0x42, 0x91, 0x72, 0x17, 0x92, 
-0x2E, 0x0B, 0xC9, 0xFA, 0x98, 0xFC, 0x6C, 0xC9, 0x0D, 0x50, 0x8C, 0xA6, 0xF1, 0xF5, 0xCA, 0xC6, 
-0x70, 0x28, 0xC3, 0x05, 0x90, 0xCE, 0x57, 0x29, 0xEF, 0x2C, 0x76, 0x6E, 0x84, 0x88, 0xC5, 0x59, 
-0x4B, 0x55, 0x59, 0x65, 0x2C, 0x86, 0x39, 0x83, 0x49, 0x49, 0x34, 0x7E, 0xD2, 0x31, 0x33, 0xF8, 
-0x46, 0xE0, 0xB8, 0x8C, 0x24, 0x0A, 0x60, 0x04, 0x5B, 0x57, 0xD4, 0xA3, 0x86, 0xF3, 0x17, 0x2E, 
-0x70, 0xE2, 0xCC, 0x29, 0x22, 0x09, 0x63, 0x55, 0x7F, 0x04, 0xCC, 0x6D, 0x05, 0x4D, 0x62, 0x6E, 
-0xD7, 0xB8, 0x18, 0x29, 0x17, 0x7A, 0xD0, 0x94, 0x16, 0x2B, 0xA1, 0x65, 0x7A, 0x56, 0xCA, 0x69, 
-0xBE, 0x62, 0x9E, 0xFD, 0x23, 0x74, 0xD3, 0x19, 0xB7, 0xAE, 0x5D, 0x67, 0xF7, 0xFE, 0x3D, 0x6D, 
-0x24, 0xB9, 0xD1, 0xFB, 0x14, 0x11, 0x67, 0xF1, 0x68, 0x8D, 0xB8, 0xA6, 0x66, 0xEB, 0xD4, 0x49, 
-0x36, 0x4E, 0x6E, 0x23, 0xCE, 0xEA, 0x4E, 0xB3, 0xAA, 0x22, 0x90, 0x75, 0x79, 0xD6, 0x82, 0xA8, 
-0xC4, 0x13, 0x43, 0xC7, 0x6C, 0x77, 0x9F, 0xDB, 0xD7, 0xAF, 0x71, 0xFB, 0xE6, 0x4D, 0x52, 0x76, 
-0x00, 0x5D, 0x02, 0x64, 0x16, 0x8B, 0x06, 0xD0, 0xD0, 0xEC, 0xAF, 0x06, 0x86, 0x8C, 0x69, 0x48, 
-0x8F, 0xC2, 0xF0, 0xFA, 0xC7, 0xA5, 0x47, 0x61, 0x78, 0xFD, 0x90, 0x8E, 0x8B, 0xE1, 0x3D, 0xC3, 
-0xE7, 0x1C, 0x46, 0x8F, 0xC6, 0x72, 0xD7, 0x2C, 0x8C, 0xB1, 0xB4, 0xE1, 0x22, 0xD9, 0x16, 0xA6, 
-0x1A, 0xF3, 0x06, 0x18, 0xDB, 0xD4, 0x9C, 0xBF, 0x74, 0x99, 0xED, 0x93, 0x5B, 0x4C, 0xBB, 0x96, 
-0x64, 0x74, 0x01, 0x76, 0x1E, 0x1B, 0x2F, 0xCF, 0xA2, 0x4C, 0xD2, 0xBC, 0xF6, 0x57, 0xF2, 0x0F, 
-0xCB, 0x57, 0x5F, 0xFA, 0x23, 0x33, 0x5F, 0x7C, 0xE0, 0xCE, 0x8D, 0x9B, 0xBC, 0xFC, 0xDC, 0x0B, 
-0x48, 0xF0, 0xBA, 0xB9, 0xC7, 0x64, 0x73, 0xBC, 0xA4, 0x1B, 0x6B, 0xAA, 0x18, 0xD9, 0x8C, 0xF0, 
-0x4C, 0x35, 0xE2, 0x1B, 0xB7, 0xCE, 0xF1, 0x9D, 0x97, 0xDF, 0xC2, 0x47, 0xDF, 0xFE, 0x5E, 0x7E, 
-0xF7, 0xD7, 0xBC, 0x9F, 0x8F, 0xBD, 0xE7, 0x6B, 0xF9, 0x5D, 0x5F, 0xF3, 0x41, 0xFE, 0xF9, 0xB7, 
-0xBC, 0x8B, 0x0F, 0x9F, 0x3E, 0xCF, 0x65, 0x5B, 0x51, 0xCF, 0x66, 0xC4, 0x6E, 0x06, 0x44, 0xA2, 
-0x51, 0x66, 0x68, 0x00, 0xAB, 0x1D, 0x12, 0x00, 0x9B, 0x22, 0x55, 0x0C, 0x6C, 0x77, 0x1D, 0x6F, 
-0xAE, 0x6A, 0x7E, 0xD3, 0xD9, 0xF3, 0x7C, 0xCF, 0xDB, 0xDF, 0xCE, 0xEF, 0x7A, 0xDF, 0x07, 0xF8, 
-0x81, 0xF7, 0x7E, 0x80, 0xEF, 0x7F, 0xDB, 0xBB, 0xF9, 0xAE, 0x67, 0xDF, 0xCE, 0x87, 0xCF, 0x9C, 
-0xE3, 0xDD, 0x5B, 0xDB, 0x9C, 0xAF, 0x2A, 0xC6, 0x29, 0x62, 0x97, 0xFA, 0xA0, 0xC9, 0x8B, 0x63, 
-0xC5, 0x23, 0x58, 0x6F, 0xCD, 0xE2, 0x11, 0x8B, 0x64, 0x7A, 0xAD, 0x5E, 0xAF, 0x75, 0x99, 0x96, 
-0xEF, 0xCF, 0x4B, 0xE9, 0x53, 0xBB, 0xBF, 0xF2, 0x21, 0x2B, 0x0F, 0x16, 0xCC, 0xDA, 0x99, 0x35, 
-0x1A, 0x7A, 0x80, 0xE0, 0x0D, 0x92, 0x46, 0x08, 0xEA, 0xF7, 0x55, 0x4C, 0xC4, 0xC7, 0x19, 0xA6, 
-0x82, 0xD6, 0xB7, 0x90, 0x1C, 0xC1, 0xEB, 0x26, 0x80, 0x85, 0x0B, 0xBD, 0x05, 0xFA, 0xD2, 0x5C, 
-0xEA, 0xAD, 0xCA, 0x1F, 0xBF, 0x01, 0x3E, 0x1E, 0x8C, 0x68, 0x08, 0xE4, 0xF2, 0xFC, 0x98, 0x1B, 
-0x4C, 0xBF, 0xE1, 0x16, 0x07, 0xE8, 0x29, 0x25, 0xDD, 0x2D, 0x56, 0x46, 0xFB, 0xBC, 0xA8, 0xD0, 
-0x06, 0xCF, 0xB9, 0xCB, 0xE7, 0xB9, 0xF8, 0xCC, 0x25, 0xB0, 0x30, 0xF3, 0x33, 0x7C, 0x2C, 0xE1, 
-0xA7, 0x35, 0x2A, 0x97, 0x25, 0xE5, 0xD0, 0x54, 0xEA, 0x1E, 0xB1, 0x4C, 0x85, 0xF4, 0x59, 0x5A, 
-0x39, 0xC5, 0x21, 0x87, 0xA0, 0x95, 0x2D, 0x79, 0x95, 0x18, 0xE3, 0xE8, 0x72, 0xB4, 0xC3, 0x14, 
-0xB3, 0x7F, 0xDA, 0xD9, 0x8C, 0x2B, 0x5F, 0x7C, 0x8E, 0xD9, 0xFD, 0x1D, 0xD6, 0xAB, 0x46, 0xDD, 
-0xD9, 0xA5, 0x04, 0x79, 0x55, 0xB9, 0x93, 0x44, 0x70, 0x82, 0x54, 0x35, 0x6F, 0x7D, 0xE7, 0x3B, 
-0xD9, 0xD8, 0xDC, 0x66, 0x3A, 0xEB, 0x30, 0xC6, 0x31, 0x99, 0x75, 0x54, 0xAE, 0x21, 0xC6, 0x88, 
-0x4F, 0x1D, 0xA6, 0xD2, 0x8D, 0x2A, 0xB5, 0x35, 0xEC, 0xDC, 0xBB, 0xCB, 0xED, 0xAB, 0x57, 0x49, 
-0xB3, 0x99, 0xE6, 0x99, 0xA8, 0x2B, 0xB7, 0x26, 0x91, 0x4C, 0xD2, 0xC8, 0xAE, 0x82, 0x46, 0x74, 
-0x88, 0xDA, 0x90, 0x0E, 0xF7, 0xD7, 0xFA, 0x68, 0xFA, 0x4A, 0x47, 0x69, 0x87, 0x87, 0xD1, 0x71, 
-0x71, 0xF8, 0x3D, 0xCB, 0xE5, 0x36, 0xA4, 0x55, 0x65, 0xBB, 0xA0, 0x05, 0x63, 0x00, 0x43, 0xCC, 
-0xD3, 0xEA, 0x94, 0x57, 0xD6, 0x75, 0x50, 0x85, 0xBA, 0x76, 0x74, 0xDD, 0x0C, 0x5B, 0x5B, 0x24, 
-0xFB, 0x25, 0xB8, 0xF8, 0xEC, 0xB3, 0x9C, 0x38, 0x7F, 0x16, 0xDB, 0xD4, 0xD9, 0xA1, 0x4B, 0xA2, 
-0x0B, 0x2D, 0x75, 0xE3, 0xD4, 0x14, 0x2B, 0x74, 0x10, 0xFC, 0xC2, 0x3B, 0x97, 0x24, 0x8C, 0xA4, 
-0x85, 0xBD, 0x6B, 0xD9, 0x29, 0x49, 0xD6, 0x95, 0xE6, 0x76, 0x2F, 0x4E, 0xB0, 0xB5, 0xA5, 0x6D, 
-0xA7, 0x18, 0x49, 0xCC, 0x76, 0x76, 0xF8, 0xE2, 0xAF, 0x7E, 0x9A, 0x76, 0x67, 0x87, 0x3A, 0x25, 
-0x24, 0xA8, 0xEF, 0xEB, 0x28, 0x91, 0x18, 0x3D, 0x8D, 0x35, 0x34, 0x21, 0x71, 0x32, 0x24, 0x3E, 
-0x78, 0xE2, 0x0C, 0xDF, 0x7D, 0xF1, 0x59, 0x7E, 0xCB, 0xF8, 0x24, 0xEF, 0x8E, 0x89, 0xA7, 0xF6, 
-0xF7, 0xB9, 0xBC, 0xB7, 0xC7, 0x3B, 0x63, 0xE4, 0x9B, 0x9B, 0x0D, 0xBE, 0x6D, 0xFB, 0x1C, 0xEF, 
-0x1A, 0xAD, 0xB1, 0xD1, 0x75, 0x34, 0xC1, 0x53, 0x1B, 0x51, 0x4B, 0x1F, 0xDF, 0x51, 0x85, 0x04, 
-0xAD, 0xC7, 0xB7, 0xBA, 0xC9, 0x28, 0x98, 0x88, 0x0D, 0x53, 0x2E, 0x98, 0xC4, 0xD7, 0x9F, 0x38, 
-0xC1, 0x47, 0x2E, 0x9C, 0xE3, 0x5B, 0x4F, 0x9E, 0xE0, 0x5D, 0x24, 0x9E, 0x9D, 0x4C, 0x78, 0x1F, 
-0x15, 0x1F, 0xB2, 0x0D, 0xDF, 0x75, 0xE2, 0x2C, 0xBF, 0xED, 0xE4, 0x29, 0x2E, 0x93, 0x58, 0x8B, 
-0x1E, 0xA7, 0xAE, 0x13, 0xA9, 0xA5, 0xC1, 0x06, 0xC1, 0xC4, 0xA0, 0xF1, 0xD4, 0xF0, 0x18, 0x74, 
-0x80, 0x90, 0x28, 0x48, 0xB2, 0xA4, 0x81, 0x74, 0x9B, 0x08, 0xF3, 0xDD, 0xA3, 0x85, 0x41, 0x8B, 
-0xE8, 0xF1, 0x72, 0x8D, 0x6E, 0xEB, 0x55, 0x49, 0xF7, 0x60, 0x5B, 0x58, 0xE0, 0x48, 0x86, 0x8B, 
-0x05, 0xC9, 0x71, 0x49, 0x49, 0x2E, 0x67, 0x84, 0xB9, 0xD7, 0x74, 0xC9, 0xDE, 0xD2, 0x55, 0xB7, 
-0x28, 0x88, 0x14, 0x33, 0x93, 0x21, 0xD7, 0x7F, 0xFD, 0x51, 0xFA, 0xBC, 0xB0, 0x2C, 0xD9, 0xCE, 
-0x1B, 0x6E, 0x4F, 0xC7, 0x59, 0xF4, 0x5F, 0x29, 0x4B, 0x7B, 0x5D, 0x0C, 0xB4, 0xBE, 0x63, 0xFB, 
-0xD4, 0x49, 0x4E, 0x9E, 0x3E, 0x8D, 0xAD, 0x9C, 0x86, 0x5A, 0xCF, 0x0B, 0x52, 0x8A, 0xDC, 0x31, 
-0x56, 0x0C, 0x16, 0x4B, 0xD2, 0xC0, 0x21, 0x03, 0xCA, 0x5C, 0x6F, 0x9A, 0x1D, 0xFF, 0x38, 0xE7, 
-0x88, 0x6D, 0xC7, 0xB5, 0x97, 0xAE, 0xD0, 0xED, 0x4D, 0xA8, 0x8D, 0x25, 0x78, 0x8F, 0xCD, 0x56, 
-0x0C, 0x3E, 0x06, 0xB5, 0x3D, 0x24, 0xD1, 0xA5, 0xC8, 0xE9, 0x0B, 0xE7, 0x18, 0xAF, 0xAF, 0x63, 
-0x6B, 0x35, 0xBD, 0x29, 0xCE, 0x39, 0xE7, 0x8D, 0x24, 0x25, 0xF5, 0x55, 0xEA, 0x84, 0xE0, 0x3D, 
-0x37, 0xAE, 0xBC, 0xCC, 0x9D, 0x5B, 0xB7, 0x88, 0xA1, 0x9B, 0x5B, 0x3D, 0x7C, 0x15, 0x6F, 0x2C, 
-0x56, 0xB5, 0x0B, 0x45, 0xCC, 0x5D, 0xF3, 0xA0, 0x94, 0x5B, 0xEE, 0x49, 0x29, 0xCD, 0x7D, 0x30, 
-0x1B, 0x63, 0x98, 0xF9, 0x8E, 0xAD, 0x53, 0x27, 0x39, 0x79, 0xE1, 0x1C, 0xE3, 0xCD, 0xF5, 0x03, 
-0xB3, 0xB9, 0x3E, 0x13, 0x28, 0xA7, 0xFA, 0x97, 0x0C, 0xF3, 0xD2, 0x6F, 0xBF, 0xCE, 0x39, 0x6D, 
-0x7F, 0x21, 0x50, 0x57, 0x15, 0x12, 0x22, 0xB7, 0xAF, 0xDF, 0x60, 0xBA, 0xBB, 0x07, 0xBE, 0x53, 
-0x17, 0x8B, 0x59, 0x70, 0x10, 0x93, 0x07, 0xA0, 0xD9, 0x8C, 0xF5, 0x10, 0x79, 0xD7, 0x89, 0xB3, 
-0x7C, 0xE0, 0xC4, 0x79, 0xDE, 0x6C, 0x1A, 0xCE, 0xCF, 0x3A, 0xB6, 0x77, 0x77, 0x38, 0x35, 0x9B, 
-0x28, 0xED, 0xED, 0x71, 0x39, 0x04, 0xDE, 0xDE, 0x8C, 0x79, 0xFF, 0xC9, 0xB3, 0xBC, 0x7D, 0xE3, 
-0x04, 0x6B, 0x3E, 0x42, 0x37, 0x9B, 0x33, 0x7F, 0x93, 0xD4, 0xE1, 0x92, 0x31, 0x6A, 0xFD, 0x20, 
-0x3E, 0xB0, 0x06, 0xBC, 0xE7, 0xEC, 0x79, 0xBE, 0xF6, 0xCC, 0x39, 0xDE, 0x66, 0x2B, 0xCE, 0xEE, 
-0x4D, 0x39, 0xDF, 0x79, 0xCE, 0xB6, 0x1D, 0x9B, 0xFB, 0xFB, 0x9C, 0xED, 0x3C, 0x6F, 0x73, 0x15, 
-0x1F, 0xD8, 0x3A, 0xC9, 0xBB, 0x4F, 0x9D, 0x66, 0xDB, 0x18, 0x52, 0xA7, 0xEB, 0x25, 0xA5, 0xAF, 
-0x49, 0x52, 0x69, 0xD9, 0xA4, 0x04, 0xA8, 0x6E, 0xB7, 0x60, 0xD1, 0x37, 0x06, 0x3C, 0x6C, 0x69, 
-0xD6, 0x1A, 0xF4, 0xBE, 0x15, 0xE7, 0x62, 0x3A, 0xDC, 0xDF, 0xD8, 0x91, 0x0C, 0x57, 0x02, 0xA9, 
-0x5F, 0xC1, 0x05, 0x73, 0xAE, 0x5E, 0xBC, 0x54, 0x65, 0xFD, 0x90, 0xC8, 0x6A, 0x57, 0x68, 0xE5, 
-0xDA, 0x7E, 0xFA, 0x46, 0xA1, 0x4C, 0x2B, 0x6C, 0x5E, 0x8C, 0x92, 0x9C, 0xA7, 0x3E, 0xF3, 0xD5, 
-0x69, 0x51, 0xE2, 0xDC, 0x85, 0xF3, 0x5C, 0xB8, 0x74, 0x71, 0x1E, 0x36, 0xBA, 0x30, 0xC8, 0x55, 
-0x8D, 0x77, 0xFE, 0x3B, 0x6F, 0x4C, 0x28, 0x0E, 0x90, 0x8F, 0x82, 0xE4, 0x29, 0x1D, 0x31, 0xA9, 
-0x14, 0xFA, 0xE0, 0x3E, 0x2F, 0xBD, 0xF0, 0xC2, 0x3C, 0x34, 0x79, 0xDB, 0x75, 0xD8, 0xDE, 0xC6, 
-0x85, 0x62, 0x37, 0xB8, 0xBE, 0xBE, 0xCE, 0xA5, 0x4B, 0x97, 0x58, 0xDB, 0x58, 0x9F, 0x3B, 0xCD, 
-0x19, 0xD6, 0x93, 0x41, 0xB2, 0x83, 0x1A, 0x98, 0xEC, 0xEE, 0x71, 0xFD, 0xFA, 0x75, 0x76, 0x1E, 
-0x3C, 0xA4, 0x32, 0x1A, 0x62, 0xA6, 0x3F, 0x95, 0x24, 0xAB, 0x45, 0xFA, 0xBF, 0xBF, 0x8A, 0xD7, 
-0x07, 0x8F, 0x6A, 0x23, 0x7D, 0x94, 0x81, 0xB2, 0xB4, 0xC1, 0x62, 0x5D, 0xE2, 0xB3, 0x80, 0x70, 
-0xEE, 0xC2, 0x79, 0xCE, 0x9E, 0x3F, 0x47, 0x35, 0xD2, 0xD0, 0x4F, 0x7D, 0x7A, 0x5C, 0x88, 0xA8, 
-0xE3, 0xA3, 0x80, 0xEA, 0x64, 0xA3, 0xD7, 0x28, 0x2A, 0xCE, 0x58, 0x76, 0x1F, 0x3C, 0xE4, 0xCA, 
-0x4B, 0x2F, 0x33, 0xD9, 0xDB, 0x9F, 0xF7, 0x99, 0xA2, 0xC3, 0x45, 0x04, 0x9B, 0x22, 0xB5, 0x8F, 
-0x9C, 0xE8, 0xE0, 0x6B, 0x36, 0x4F, 0xF1, 0xEE, 0xCD, 0x13, 0x6C, 0x3B, 0xC3, 0x9A, 0x89, 0x8C, 
-0xFC, 0x8C, 0x35, 0xDF, 0xB1, 0x11, 0x03, 0x75, 0x37, 0xA3, 0x4E, 0x91, 0x53, 0x4D, 0xC3, 0x7B, 
-0x4F, 0x9E, 0xE7, 0x3D, 0x5B, 0x67, 0x38, 0xD1, 0x25, 0xAA, 0x56, 0xD7, 0x8C, 0xA2, 0x11, 0x42, 
-0x8E, 0xCC, 0x6B, 0xAD, 0xC1, 0xC4, 0x40, 0xD5, 0x79, 0x4E, 0x8A, 0xE3, 0x6D, 0xDB, 0x67, 0x78, 
-0xCB, 0xC6, 0x09, 0x4E, 0x7B, 0xCB, 0x78, 0xBF, 0x65, 0xDD, 0x47, 0xEA, 0x14, 0x88, 0xA1, 0xC5, 
-0xA6, 0x40, 0xDD, 0x7A, 0xCE, 0xB8, 0x86, 0xB7, 0x9D, 0x3A, 0xCF, 0xB9, 0x66, 0x8D, 0x35, 0x63, 
-0x18, 0x55, 0x8E, 0x0E, 0x35, 0x25, 0xEB, 0x23, 0x0A, 0x04, 0x13, 0x35, 0xCC, 0x3B, 0x1A, 0x71, 
-0xE2, 0x71, 0xD0, 0xEF, 0x7F, 0x05, 0x95, 0xD7, 0x25, 0xC0, 0x21, 0x8E, 0x64, 0xB8, 0xD8, 0xC2, 
-0x9E, 0x16, 0x48, 0x79, 0x41, 0xA6, 0x30, 0xA8, 0x94, 0x57, 0x4C, 0x9F, 0xA4, 0x52, 0x8F, 0xC2, 
-0xF0, 0x03, 0x1E, 0x17, 0x65, 0x84, 0x4E, 0xB9, 0xA1, 0x0E, 0x51, 0x16, 0xFC, 0xCA, 0xB7, 0x14, 
-0x9D, 0x56, 0x79, 0xEF, 0xDA, 0xE6, 0x06, 0xA7, 0xCF, 0x9E, 0x9D, 0xFB, 0x0F, 0x2D, 0x53, 0xFF, 
-0xE2, 0xD0, 0xB9, 0x8F, 0x92, 0xD3, 0x21, 0xD3, 0x52, 0x3D, 0x91, 0x22, 0x65, 0x8A, 0xC5, 0xD3, 
-0x7E, 0x6F, 0x91, 0xCA, 0x59, 0x4B, 0x98, 0xB5, 0x5C, 0xBB, 0x72, 0x95, 0xFB, 0xB7, 0xEE, 0xCC, 
-0x77, 0x92, 0xCD, 0xCB, 0x58, 0x80, 0x6C, 0x3B, 0x68, 0x8C, 0xE1, 0xD2, 0x53, 0x97, 0x39, 0x79, 
-0xFA, 0xD4, 0x7C, 0x91, 0xAD, 0xE8, 0x5D, 0x4B, 0x7D, 0x90, 0xDD, 0x30, 0x1A, 0x11, 0xF6, 0x77, 
-0x76, 0x75, 0x17, 0xD0, 0xC3, 0x1D, 0x8C, 0x31, 0x2A, 0x49, 0xBF, 0x0A, 0x76, 0xB6, 0x5F, 0xC5, 
-0xAB, 0x87, 0x55, 0x6D, 0x7D, 0x3E, 0x13, 0xEB, 0x9D, 0x2A, 0x3D, 0xD1, 0x24, 0x34, 0xE4, 0x77, 
-0x6E, 0x13, 0x5D, 0x0C, 0x34, 0xE3, 0x11, 0xE7, 0x2F, 0x5D, 0x64, 0xBC, 0xBE, 0xA6, 0x31, 0x04, 
-0x0F, 0x3E, 0x72, 0x09, 0xAB, 0xDE, 0x39, 0x6F, 0xFF, 0x99, 0x8A, 0x53, 0x26, 0x7A, 0xEF, 0xC4, 
-0x07, 0xAE, 0xBE, 0xF8, 0x32, 0xF7, 0x6E, 0xDF, 0x21, 0xF9, 0xA0, 0x96, 0x2E, 0xBD, 0xB6, 0x2C, 
-0x59, 0x08, 0xAB, 0x4D, 0xA2, 0x91, 0xC4, 0x29, 0x5B, 0xB1, 0x0E, 0x48, 0x37, 0xC3, 0x9A, 0x40, 
-0x63, 0x22, 0x4D, 0x6A, 0x19, 0xD9, 0x44, 0x95, 0x5A, 0x52, 0x98, 0x90, 0x66, 0x13, 0x4E, 0x57, 
-0x15, 0x97, 0xD6, 0xB7, 0x58, 0x33, 0x86, 0x4A, 0xC0, 0x64, 0x4B, 0x82, 0xB2, 0x7D, 0xDD, 0x58, 
-0xD4, 0xBE, 0x36, 0x46, 0x36, 0x5C, 0xC5, 0x49, 0xD7, 0x50, 0x4F, 0x5A, 0xEC, 0xDE, 0x84, 0xD1, 
-0xAC, 0xA3, 0xC9, 0x56, 0x0E, 0xC6, 0xAA, 0xAA, 0x8C, 0xFD, 0x09, 0x66, 0x67, 0x9F, 0xF3, 0xD5, 
-0x98, 0xB3, 0xCD, 0x9A, 0x3A, 0x27, 0x77, 0x0E, 0x44, 0x68, 0xB3, 0xCA, 0x53, 0xE6, 0x65, 0x1A, 
-0x35, 0xB6, 0x59, 0x56, 0x17, 0xA8, 0x23, 0xF4, 0xDC, 0x47, 0x0E, 0xF1, 0xE9, 0x50, 0xB0, 0xAA, 
-0x1C, 0x8D, 0x98, 0xD4, 0xB9, 0x6E, 0x05, 0xD7, 0x79, 0x04, 0xC3, 0x15, 0x29, 0x3D, 0x73, 0x31, 
-0x7D, 0x2E, 0x8C, 0x20, 0xC6, 0x38, 0xF7, 0x2E, 0x55, 0xA6, 0xE7, 0xC3, 0xFF, 0x0F, 0xC3, 0xAA, 
-0x4C, 0xAE, 0xC2, 0x71, 0xAF, 0x3B, 0x2E, 0x86, 0xD3, 0x68, 0xC9, 0xF9, 0x85, 0x65, 0xB3, 0x1A, 
-0x44, 0xD4, 0xE1, 0xC7, 0xC9, 0x13, 0x18, 0x67, 0x75, 0x41, 0x2C, 0xBB, 0x3A, 0x4C, 0xC5, 0xC0, 
-0x3C, 0xDF, 0xDF, 0x7F, 0x56, 0x41, 0x99, 0x06, 0x0D, 0xF3, 0xAF, 0x8C, 0x56, 0x47, 0x52, 0x5D, 
-0x58, 0xF0, 0xA4, 0x10, 0x69, 0x5C, 0xC5, 0xFD, 0xBB, 0xF7, 0xB8, 0xFA, 0xE2, 0x4B, 0xF8, 0x59, 
-0x8B, 0xC9, 0x5B, 0x22, 0xAD, 0xB5, 0xAA, 0xB3, 0x0B, 0x61, 0xB1, 0x01, 0x63, 0x34, 0xE2, 0xE9, 
-0x67, 0x9F, 0x65, 0xB4, 0xA6, 0x61, 0x52, 0x96, 0x9C, 0x9E, 0x9B, 0x2C, 0xA9, 0x47, 0x0D, 0x31, 
-0xE2, 0x8C, 0xE5, 0xFE, 0xBD, 0x7B, 0x2A, 0x8D, 0x4C, 0x26, 0xEA, 0x7D, 0xAC, 0xC4, 0x71, 0xEB, 
-0xE5, 0xB5, 0x3F, 0x48, 0x1C, 0x1C, 0x62, 0x9F, 0x14, 0xDA, 0x78, 0x9F, 0x9C, 0xBE, 0x8A, 0x7E, 
-0x29, 0x14, 0x7D, 0x6E, 0x7F, 0x10, 0xAF, 0xAA, 0x8A, 0x10, 0xD5, 0xC7, 0xC7, 0xF9, 0xCB, 0x97, 
-0x38, 0x7B, 0xE1, 0x3C, 0x38, 0x8B, 0xCF, 0x15, 0x58, 0x06, 0xF9, 0xC3, 0x68, 0xCE, 0x58, 0x87, 
-0xC7, 0x7B, 0xEE, 0x13, 0x75, 0xD7, 0xA2, 0xDA, 0xDC, 0x36, 0xC6, 0x31, 0xDD, 0xD9, 0xE3, 0xDA, 
-0x4B, 0x2F, 0x33, 0xDD, 0xDB, 0x9F, 0xCF, 0xE4, 0x52, 0x9E, 0xE5, 0x96, 0x99, 0x6E, 0x20, 0xE2, 
-0x6D, 0x24, 0x39, 0x70, 0x79, 0x1D, 0x61, 0x1A, 0xF7, 0x89, 0xB6, 0xC3, 0xD6, 0x89, 0x68, 0x5A, 
-0x12, 0x33, 0xB0, 0x09, 0x9F, 0x3A, 0x66, 0x61, 0x8A, 0x88, 0x7A, 0x21, 0x94, 0xDA, 0x10, 0x8C, 
-0x2E, 0x70, 0xD9, 0x1C, 0x64, 0x35, 0xE4, 0xF8, 0x6E, 0xA0, 0xFA, 0xE5, 0xDA, 0x08, 0x1B, 0xA3, 
-0x86, 0xD8, 0x6A, 0xEC, 0xB4, 0xB1, 0xB5, 0xAA, 0x82, 0x90, 0x88, 0x69, 0x0C, 0xC9, 0x78, 0xD6, 
-0xAC, 0xC5, 0x4E, 0x66, 0x6C, 0x19, 0xC7, 0xB6, 0xAB, 0x09, 0x93, 0x09, 0xB3, 0xD9, 0x84, 0xE4, 
-0x20, 0xE6, 0xB5, 0x1B, 0x49, 0xCB, 0x0C, 0x30, 0x9A, 0xDC, 0xF6, 0x1E, 0xC1, 0x64, 0x57, 0xA1, 
-0x98, 0xC4, 0x96, 0x5F, 0xD6, 0x56, 0x2B, 0x7B, 0xD1, 0x23, 0x18, 0xAE, 0xC6, 0x59, 0x2D, 0x92, 
-0x56, 0x61, 0xB8, 0xDE, 0xFB, 0xF9, 0xFE, 0x67, 0x58, 0x30, 0xD9, 0x79, 0xC7, 0x7F, 0x15, 0x31, 
-0x64, 0x5A, 0xAF, 0x06, 0x4C, 0x42, 0xFD, 0x07, 0xE4, 0x67, 0x8B, 0xC8, 0x7C, 0xA5, 0xDF, 0xA7, 
-0xC8, 0x68, 0x6D, 0x9D, 0x4B, 0x4F, 0x3D, 0xC5, 0xDA, 0xC6, 0xFA, 0x5C, 0x7A, 0x9C, 0x4F, 0x99, 
-0xF2, 0xFF, 0x7D, 0x94, 0xB2, 0x29, 0x03, 0xD0, 0xF0, 0x5C, 0x62, 0x79, 0xC1, 0xAE, 0x7F, 0xCE, 
-0x1A, 0x43, 0xF0, 0x2D, 0x77, 0x6F, 0xDE, 0xE2, 0xE1, 0xDD, 0x7B, 0xBA, 0x53, 0xA7, 0x0C, 0x02, 
-0x4E, 0xB7, 0x6F, 0xFA, 0xA4, 0x91, 0x47, 0xEB, 0xA6, 0x61, 0xFB, 0xCC, 0x29, 0x4E, 0x9D, 0x39, 
-0x8D, 0xAB, 0x2B, 0x0D, 0x98, 0x97, 0x9F, 0x97, 0x06, 0xA6, 0x3D, 0xCE, 0x0A, 0x12, 0x22, 0x0F, 
-0xEF, 0xDC, 0xE3, 0xDE, 0x9D, 0x3B, 0xA4, 0x3C, 0xFD, 0x0C, 0xD9, 0x7C, 0xEC, 0xAB, 0xF8, 0xCA, 
-0xC2, 0xB0, 0x9D, 0xEB, 0x82, 0xEB, 0x32, 0x4C, 0xD2, 0xC5, 0x60, 0xC9, 0xBB, 0x12, 0x8B, 0xE0, 
-0xB3, 0xB9, 0xBD, 0xC5, 0x53, 0xCF, 0x3E, 0xC3, 0x78, 0x43, 0x75, 0xB7, 0x25, 0xF6, 0xE0, 0x71, 
-0x51, 0xDA, 0xEF, 0xBC, 0x8F, 0x67, 0x86, 0x54, 0x1C, 0xDD, 0x40, 0xB6, 0xA0, 0xC9, 0xBB, 0x14, 
-0x1F, 0xDC, 0xBD, 0xA7, 0x11, 0x1E, 0xEC, 0xC2, 0xDF, 0x2D, 0x99, 0x59, 0x8B, 0x55, 0xE7, 0xE6, 
-0xAD, 0xF7, 0x44, 0x9B, 0xE8, 0x24, 0x11, 0x2B, 0x65, 0x26, 0x3E, 0x79, 0x5D, 0xF7, 0x21, 0xE2, 
-0x7D, 0xAB, 0x71, 0xC1, 0x2C, 0x88, 0x13, 0x3A, 0x49, 0xB4, 0x59, 0x8D, 0x10, 0x63, 0xC2, 0x65, 
-0x87, 0x32, 0x2A, 0xB8, 0x64, 0xBF, 0x09, 0x46, 0x10, 0x2B, 0x78, 0x49, 0xA4, 0xDA, 0x11, 0x8D, 
-0x60, 0x6A, 0x07, 0xD9, 0x8D, 0x69, 0xCC, 0x6D, 0xBC, 0xC4, 0x4C, 0x33, 0xE8, 0x26, 0xA2, 0x51, 
-0xD3, 0x60, 0x48, 0x78, 0xBF, 0xF0, 0xD9, 0xA0, 0x33, 0x00, 0xDD, 0x0C, 0x61, 0x63, 0xAF, 0x3F, 
-0x4B, 0xCC, 0x03, 0xDD, 0xC1, 0xF2, 0x1F, 0xA2, 0x94, 0x57, 0x41, 0x8A, 0xA2, 0x43, 0x90, 0x75, 
-0x31, 0xC6, 0xD5, 0xFB, 0xFB, 0x0F, 0x65, 0xB8, 0x9F, 0xFE, 0xF4, 0xEF, 0x4E, 0x22, 0xB6, 0xA3, 
-0x2C, 0x9A, 0x65, 0xC4, 0x18, 0xE7, 0x0C, 0x37, 0x65, 0x53, 0x0B, 0xB2, 0x43, 0x14, 0x49, 0x79, 
-0x65, 0x73, 0xD5, 0x1C, 0x7E, 0x45, 0xA3, 0x3A, 0x0A, 0x85, 0x39, 0x3D, 0x09, 0x01, 0x3D, 0xF3, 
-0x0E, 0x5D, 0xE5, 0x2D, 0x8B, 0x10, 0x65, 0x7F, 0x78, 0x0C, 0x60, 0xC4, 0x41, 0x76, 0xE5, 0x26, 
-0x62, 0x89, 0x01, 0xEA, 0x6A, 0xC4, 0xB9, 0x73, 0xE7, 0x38, 0x7D, 0xF6, 0x0C, 0xAE, 0xA9, 0xB5, 
-0xF1, 0x66, 0xEF, 0xF8, 0x01, 0xFD, 0xBF, 0xFF, 0x1D, 0x43, 0x89, 0xB0, 0xCF, 0x7C, 0xA5, 0x27, 
-0x31, 0xC4, 0x81, 0x69, 0x0D, 0xB9, 0x41, 0x98, 0x14, 0xB9, 0x7D, 0xED, 0x06, 0x37, 0x5E, 0xBE, 
-0x8A, 0x6F, 0x67, 0xEA, 0x74, 0x83, 0x34, 0x0F, 0x6B, 0x1D, 0xB2, 0x2F, 0xCF, 0x24, 0xB0, 0x79, 
-0x62, 0x9B, 0x4B, 0x4F, 0x3D, 0x85, 0x1D, 0xD5, 0xF3, 0x8D, 0x0E, 0x52, 0x54, 0x0E, 0x29, 0xE4, 
-0xE0, 0x79, 0xD9, 0xF1, 0x47, 0x66, 0xB6, 0x77, 0x6E, 0xDD, 0xA6, 0x9B, 0xB5, 0x1A, 0xFE, 0x3D, 
-0xAB, 0x2A, 0x56, 0xD5, 0x83, 0xF4, 0xE8, 0x55, 0x41, 0x29, 0x98, 0x27, 0xA5, 0xDF, 0x80, 0x18, 
-0xD6, 0x4B, 0xDF, 0xB4, 0xD0, 0x14, 0xBB, 0xD8, 0xD2, 0xAE, 0x93, 0xC1, 0x27, 0xB0, 0x75, 0xC5, 
-0xE9, 0xB3, 0x67, 0x39, 0x77, 0xF1, 0x82, 0x5A, 0xC7, 0x18, 0xF5, 0x1E, 0x37, 0xC4, 0x90, 0xA9, 
-0x3E, 0x0A, 0xA5, 0x1F, 0x95, 0x1D, 0x8A, 0x84, 0xC8, 0x83, 0xDB, 0x77, 0xB9, 0xF6, 0xD2, 0xCB, 
-0x3A, 0x0B, 0xCB, 0x33, 0xA8, 0x82, 0xB9, 0x79, 0xA3, 0x28, 0xD3, 0xB1, 0xE8, 0x0E, 0xB7, 0x6B, 
-0xFB, 0x3B, 0x3C, 0x88, 0x1E, 0xE3, 0x1C, 0xE2, 0xD1, 0x18, 0x63, 0x39, 0xAE, 0x98, 0xC5, 0x6A, 
-0x38, 0x76, 0x63, 0x79, 0xE8, 0x3B, 0xAE, 0xEF, 0xED, 0xE0, 0x43, 0xD2, 0x48, 0xD4, 0xD1, 0x60, 
-0x83, 0x0A, 0x24, 0x26, 0x3B, 0x63, 0x4A, 0x56, 0xF0, 0xCE, 0xB2, 0x13, 0x5A, 0x6E, 0x4D, 0xF6, 
-0x98, 0x8D, 0x2A, 0x42, 0x33, 0x62, 0x96, 0x12, 0x3E, 0x82, 0x09, 0x82, 0xB4, 0x6A, 0x6D, 0x30, 
-0x4D, 0x89, 0xB6, 0xAE, 0x79, 0x30, 0xDD, 0xE7, 0xE1, 0x64, 0x8A, 0x54, 0x1A, 0xFE, 0x07, 0xF2, 
-0x3A, 0x47, 0x2E, 0x43, 0x49, 0x82, 0x4D, 0x82, 0x8D, 0xD9, 0x35, 0x69, 0x2E, 0xF7, 0x39, 0x1F, 
-0x99, 0x63, 0xB9, 0x4D, 0x0E, 0xCB, 0xB0, 0x37, 0xC4, 0x25, 0x41, 0x42, 0x2C, 0x7C, 0x7B, 0x80, 
-0x43, 0x19, 0xEE, 0x0F, 0x01, 0xC9, 0xA4, 0x19, 0x88, 0x2F, 0x52, 0x5E, 0xCA, 0x99, 0xF5, 0xDE, 
-0xE7, 0x90, 0xE0, 0xFA, 0xCC, 0xF9, 0x08, 0xD7, 0xD3, 0x3B, 0xBE, 0x96, 0x78, 0x94, 0x14, 0xDD, 
-0x67, 0x6E, 0x07, 0x0B, 0x6E, 0x81, 0x22, 0xA9, 0x96, 0x45, 0xB2, 0x28, 0xD0, 0x8C, 0x47, 0x9C, 
-0x3D, 0x7F, 0x9E, 0x66, 0x3C, 0x52, 0xAF, 0x5B, 0x02, 0x25, 0x12, 0x6F, 0xF9, 0xBE, 0xE3, 0xDA, 
-0xAA, 0x96, 0x72, 0x48, 0x26, 0x33, 0xC5, 0x3E, 0x42, 0x24, 0xC5, 0x48, 0x6C, 0x3B, 0x6E, 0x5C, 
-0xB9, 0xCA, 0xAD, 0x9B, 0xD7, 0xB1, 0x69, 0xB1, 0x2D, 0x72, 0xDE, 0xC8, 0x24, 0xFB, 0xE2, 0x05, 
-0xB6, 0x4E, 0x6C, 0x73, 0xEE, 0xC2, 0x79, 0x74, 0x8C, 0xCB, 0xF9, 0xC8, 0x6A, 0x84, 0x94, 0x16, 
-0x9B, 0x23, 0x04, 0xE8, 0xA6, 0x33, 0x6E, 0xDF, 0xBC, 0xC5, 0xFD, 0xDB, 0x77, 0xC0, 0x07, 0x6A, 
-0x57, 0xE1, 0xAC, 0xC5, 0xA4, 0x85, 0x97, 0xA9, 0xA3, 0x30, 0xCC, 0xEE, 0x57, 0xF1, 0xFA, 0x40, 
-0x8A, 0x09, 0x63, 0xEF, 0xD8, 0x9C, 0xD9, 0xF6, 0xEA, 0xC5, 0xD5, 0x15, 0x88, 0x30, 0xDA, 0x58, 
-0xE3, 0xE4, 0xB9, 0x33, 0x6C, 0x9E, 0xD8, 0x56, 0xF5, 0x92, 0xA8, 0x73, 0xA3, 0x3E, 0x9E, 0xA4, 
-0x3F, 0x96, 0x7B, 0x4A, 0xD4, 0x86, 0xE0, 0x3D, 0xF7, 0xEE, 0xDC, 0xE5, 0xCE, 0x8D, 0x9B, 0x88, 
-0xD7, 0x68, 0x21, 0x92, 0x16, 0x9E, 0xEE, 0x62, 0x96, 0xB6, 0x43, 0x08, 0x78, 0xEF, 0x71, 0xAE, 
-0x66, 0xAF, 0x8B, 0xBC, 0xF8, 0xF0, 0x2E, 0xD7, 0xBA, 0x19, 0x93, 0xAA, 0x62, 0x62, 0x1C, 0x33, 
-0x57, 0xD3, 0xBA, 0x86, 0x59, 0x35, 0x62, 0x62, 0x2B, 0xF6, 0xA2, 0xB0, 0x8B, 0xE1, 0x7A, 0x68, 
-0xB9, 0xBA, 0xBF, 0xCB, 0x2C, 0x80, 0x93, 0x5A, 0x4D, 0x27, 0x63, 0xC2, 0x88, 0x9B, 0x3B, 0xC4, 
-0x8A, 0xE8, 0x22, 0xDA, 0x6E, 0x0C, 0xBC, 0xF8, 0xF0, 0x3E, 0x3B, 0x95, 0x61, 0xAF, 0xA9, 0x78, 
-0x28, 0x06, 0x6F, 0x2B, 0x92, 0x69, 0x88, 0x51, 0xC0, 0x35, 0xCC, 0xC6, 0x63, 0x26, 0xEB, 0x63, 
-0x9E, 0xDF, 0x7B, 0xC8, 0x73, 0x77, 0x6F, 0x32, 0x21, 0x42, 0xE5, 0x94, 0xE5, 0x69, 0xA7, 0x9E, 
-0x0B, 0x60, 0x92, 0xD4, 0x9F, 0xAE, 0x24, 0xA3, 0x31, 0xCD, 0xCC, 0x90, 0xBD, 0x16, 0xAC, 0x66, 
-0xBA, 0x29, 0x69, 0x00, 0xC9, 0xF9, 0x71, 0xE8, 0xD6, 0x8A, 0x63, 0x93, 0x01, 0x0E, 0x65, 0xB8, 
-0xFC, 0x10, 0x49, 0x44, 0xF6, 0x8D, 0xB5, 0xBE, 0x8C, 0x5E, 0x65, 0xA5, 0xBE, 0x6D, 0xDB, 0x39, 
-0x53, 0xE8, 0xBA, 0x2E, 0x6F, 0xFB, 0x55, 0x24, 0xDF, 0x1D, 0xFA, 0xD0, 0xA3, 0x18, 0xE5, 0xAA, 
-0x46, 0x51, 0x18, 0xC9, 0xAA, 0xDF, 0xE5, 0xFF, 0xE3, 0xD2, 0xF0, 0x9E, 0x62, 0x0C, 0xEE, 0xEA, 
-0x6A, 0x6E, 0x73, 0x6B, 0xF3, 0x56, 0xD9, 0xD3, 0x17, 0xCE, 0x81, 0x35, 0x6A, 0x9B, 0x4A, 0x9A, 
-0x4B, 0xB7, 0xD2, 0xB3, 0x62, 0x38, 0x0C, 0xE5, 0xF9, 0xD2, 0xB3, 0xE0, 0xB0, 0xD6, 0xCE, 0x47, 
-0xD7, 0x72, 0xBF, 0x24, 0xD8, 0x68, 0xC6, 0xEC, 0xDE, 0x7F, 0xC8, 0xCB, 0xCF, 0xBD, 0x40, 0x98, 
-0xB6, 0xAA, 0x5B, 0x4D, 0x1A, 0xC8, 0x31, 0x65, 0x73, 0xB1, 0x7A, 0x3C, 0x22, 0x92, 0xB0, 0x75, 
-0xC5, 0xDB, 0xDE, 0xF1, 0x0E, 0x36, 0x4E, 0x6E, 0x33, 0xF3, 0x9D, 0x6E, 0xC2, 0x70, 0x6A, 0x13, 
-0x5D, 0x16, 0x00, 0x67, 0xB3, 0x99, 0xFA, 0xBC, 0x8D, 0x30, 0xDD, 0xDD, 0xE7, 0xEA, 0x8B, 0x2F, 
-0x69, 0x48, 0x9E, 0x32, 0xE5, 0x2A, 0xFA, 0xF5, 0x5E, 0x99, 0x96, 0x59, 0xC1, 0xB0, 0x66, 0xFA, 
-0xE5, 0x46, 0x4F, 0x42, 0x7A, 0xBD, 0x30, 0xAC, 0xBF, 0x21, 0x3D, 0x0A, 0xC3, 0xEB, 0x87, 0xF4, 
-0x46, 0x63, 0x98, 0x9F, 0x7E, 0x9E, 0x24, 0x4F, 0xD3, 0x4B, 0xAA, 0xF5, 0xA6, 0x15, 0x15, 0x93, 
-0xFA, 0x2A, 0xE9, 0x42, 0x22, 0x39, 0xC7, 0xD9, 0x8B, 0x97, 0xB8, 0x78, 0xE9, 0xA9, 0x6C, 0xFF, 
-0x9E, 0x2D, 0x0A, 0x7A, 0xED, 0x73, 0x58, 0x67, 0xC3, 0x77, 0x0E, 0xA9, 0x0F, 0x6B, 0xB5, 0x7D, 
-0xD5, 0xAE, 0x62, 0xBA, 0xB3, 0xC7, 0xCB, 0xCF, 0xBF, 0x40, 0xB7, 0x3F, 0xCD, 0x3E, 0x3A, 0x16, 
-0xCF, 0x2D, 0x56, 0x34, 0x25, 0x75, 0xAE, 0xC6, 0x47, 0x61, 0x86, 0xE5, 0x85, 0xBD, 0x3D, 0xFE, 
-0xE9, 0x8D, 0xEB, 0xBC, 0xD0, 0xB5, 0xEC, 0x6E, 0x6C, 0x70, 0xB7, 0xAE, 0xB9, 0x53, 0x35, 0xDC, 
-0x14, 0xC3, 0xBD, 0x66, 0x4C, 0x7B, 0xEA, 0x0C, 0x37, 0x9D, 0xE5, 0x53, 0x77, 0x6E, 0xF3, 0xDC, 
-0xCE, 0x0E, 0xFB, 0x51, 0x88, 0x58, 0x02, 0x02, 0xAE, 0xC2, 0xE7, 0x6F, 0x2F, 0x33, 0xB4, 0x28, 
-0x8E, 0xBD, 0x04, 0x5F, 0xB8, 0x7F, 0x87, 0x7F, 0x7A, 0xED, 0x1A, 0x57, 0x62, 0x60, 0xB2, 0xB9, 
-0xC9, 0x03, 0x5B, 0xB3, 0x9B, 0x2C, 0x2D, 0x35, 0x7B, 0x52, 0xB1, 0xBB, 0xB1, 0xC9, 0x67, 0x27, 
-0xBB, 0xFC, 0xCA, 0xBD, 0x5B, 0x5C, 0x8F, 0x1D, 0x53, 0xA3, 0xB1, 0x08, 0xAD, 0x38, 0xC4, 0x27, 
-0x24, 0xCF, 0x7A, 0x25, 0x65, 0xA7, 0xE8, 0xC9, 0x62, 0xA3, 0x7A, 0x05, 0x2C, 0x3B, 0xDB, 0x98, 
-0x97, 0xD7, 0xB2, 0xCA, 0xB4, 0x50, 0x99, 0xED, 0x03, 0xD8, 0x1C, 0x55, 0x25, 0x12, 0xC1, 0xD0, 
-0xC5, 0x8D, 0xC7, 0x94, 0x70, 0x45, 0x24, 0x8D, 0xC7, 0xE3, 0x69, 0xEB, 0xF7, 0x82, 0xF7, 0xD3, 
-0x6C, 0xF0, 0xAF, 0x9D, 0x2E, 0xC6, 0xC8, 0x64, 0x32, 0xD1, 0x90, 0x3A, 0x49, 0x75, 0x82, 0xFD, 
-0x29, 0xC5, 0x61, 0x38, 0xEA, 0xDC, 0x2A, 0x0C, 0x9F, 0x57, 0x7E, 0x3F, 0xEE, 0x73, 0x0A, 0xFA, 
-0xF7, 0x8B, 0xE8, 0x26, 0x8D, 0x98, 0xE3, 0x91, 0x45, 0x12, 0xE3, 0xCD, 0x0D, 0x9E, 0x7A, 0xE6, 
-0x69, 0xB6, 0xB6, 0xB7, 0x21, 0x4F, 0xD5, 0x1F, 0xA7, 0x6B, 0xA6, 0xDE, 0x37, 0xC6, 0x18, 0xB1, 
-0x39, 0x8A, 0x69, 0xCA, 0x8B, 0x71, 0x29, 0x0F, 0x52, 0x8D, 0xAB, 0xA8, 0xAB, 0x8A, 0xDD, 0x87, 
-0xF7, 0xB9, 0x77, 0xE7, 0x0E, 0xED, 0x6C, 0x82, 0x8E, 0xB9, 0x9A, 0xAF, 0x32, 0x95, 0x14, 0x67, 
-0xD9, 0x9F, 0x4E, 0x10, 0x63, 0x38, 0x7B, 0xFE, 0x1C, 0x9B, 0xDB, 0x5B, 0x20, 0x1A, 0xF5, 0xD4, 
-0xA7, 0x6C, 0x8E, 0x57, 0xBE, 0x25, 0xEF, 0x54, 0xAB, 0x8C, 0xC5, 0x8A, 0xF0, 0xE2, 0xF3, 0xCF, 
-0xF3, 0xE0, 0xEE, 0x3D, 0x7C, 0xDB, 0x65, 0x49, 0x21, 0x87, 0xF9, 0x31, 0x66, 0xEE, 0x33, 0x61, 
-0x88, 0xC7, 0xF9, 0xD6, 0x55, 0x38, 0xAC, 0xE3, 0xBE, 0x11, 0x18, 0xD6, 0xF5, 0x90, 0xBE, 0x12, 
-0xB1, 0xAA, 0xFC, 0xCA, 0x60, 0x2D, 0x59, 0x72, 0x15, 0x51, 0xD7, 0x9C, 0x6D, 0x0A, 0xAC, 0x6F, 
-0x6C, 0x70, 0xFE, 0xE2, 0x45, 0xEA, 0xF5, 0x31, 0x49, 0x04, 0x57, 0x57, 0xAA, 0xA3, 0xEF, 0xB9, 
-0x5D, 0x64, 0xD0, 0x8F, 0x8E, 0xFB, 0xFD, 0x29, 0x69, 0xDC, 0xBB, 0x51, 0x55, 0x13, 0x3B, 0xCF, 
-0xED, 0x9B, 0xB7, 0x78, 0x78, 0xEF, 0x3E, 0xBE, 0xED, 0xB4, 0x9D, 0xF6, 0xAA, 0x78, 0x58, 0xDB, 
-0x51, 0xA0, 0x13, 0xA1, 0x1B, 0x35, 0xDC, 0x94, 0xC4, 0x2F, 0xDD, 0xBB, 0xC9, 0xFF, 0x7A, 0xE3, 
-0x65, 0x7E, 0xB9, 0xDD, 0xE7, 0xCA, 0xC6, 0x3A, 0xB7, 0x4E, 0x9E, 0xE0, 0xEE, 0xD9, 0x53, 0x3C, 
-0xEF, 0x0C, 0xFF, 0x64, 0xF7, 0x3E, 0x3F, 0x77, 0xEB, 0x06, 0xBF, 0x72, 0xFF, 0x36, 0x57, 0xBA, 
-0x19, 0xFB, 0x46, 0x88, 0xB6, 0xA6, 0x33, 0x86, 0x98, 0x05, 0x0F, 0x00, 0x8B, 0x86, 0xD3, 0x09, 
-0x62, 0x98, 0x55, 0x8E, 0xE7, 0x76, 0x76, 0xF9, 0xA5, 0x3B, 0x37, 0xF9, 0xC7, 0xB7, 0x6F, 0xF0, 
-0xE9, 0x76, 0x9F, 0x6B, 0x6B, 0x23, 0xEE, 0x9E, 0xDC, 0xE6, 0xD6, 0xC6, 0x98, 0xAB, 0xB5, 0xE5, 
-0x1F, 0xDF, 0xBE, 0xCE, 0x3F, 0xB9, 0x7D, 0x83, 0x2F, 0xEC, 0x3D, 0xE4, 0x7E, 0x65, 0xE8, 0xEA, 
-0x9A, 0x2E, 0x69, 0xB4, 0x94, 0xBA, 0xB7, 0x86, 0x21, 0x22, 0x58, 0xAC, 0x46, 0x7B, 0x20, 0x5B, 
-0x66, 0x94, 0x99, 0xB1, 0x44, 0xE8, 0xE9, 0xB1, 0x0F, 0xB6, 0x9F, 0x83, 0x65, 0x29, 0xD8, 0x64, 
-0x8C, 0x6D, 0xB7, 0xB6, 0x4E, 0x3C, 0x1E, 0xC3, 0x05, 0x78, 0xC7, 0x3B, 0xDE, 0xBA, 0xD7, 0xD4, 
-0x6B, 0xBE, 0xAA, 0x72, 0xB0, 0x48, 0xA3, 0x8C, 0x63, 0x32, 0x99, 0xB0, 0xB3, 0xB3, 0x33, 0x37, 
-0x07, 0x1B, 0x8F, 0x1B, 0x46, 0xA3, 0xD1, 0x9C, 0xE9, 0xBE, 0xDA, 0x1D, 0xEE, 0xB8, 0x8D, 0xA4, 
-0x8F, 0x7E, 0xE1, 0xAC, 0xBA, 0xB7, 0xE8, 0x3F, 0xBB, 0x18, 0x54, 0x47, 0x6B, 0x84, 0x53, 0x67, 
-0x4E, 0x73, 0xFE, 0xF2, 0x25, 0xDC, 0x58, 0xFD, 0xDD, 0x32, 0x18, 0x24, 0x0E, 0xA8, 0x05, 0x0E, 
-0x81, 0xE4, 0x41, 0xA9, 0xAF, 0xB2, 0x28, 0xC7, 0x8B, 0xC3, 0xE3, 0xC6, 0x1A, 0x6E, 0x5F, 0xBF, 
-0xC9, 0x8D, 0x97, 0xAF, 0x32, 0x9B, 0x4C, 0x55, 0x4F, 0x96, 0x19, 0x6D, 0x61, 0xD0, 0x45, 0x0A, 
-0x5F, 0xDF, 0xDA, 0xE4, 0xE2, 0xE5, 0xCB, 0xB8, 0x71, 0xA3, 0x0B, 0x68, 0xA8, 0x9A, 0x23, 0x89, 
-0x50, 0xE5, 0x50, 0x27, 0x06, 0x51, 0x07, 0x37, 0x3E, 0xB0, 0xFF, 0x70, 0x97, 0xEB, 0x57, 0xAF, 
-0x31, 0x9B, 0x4E, 0x91, 0x9E, 0x2B, 0xBF, 0xA1, 0x64, 0x7E, 0x94, 0xBA, 0xE5, 0x71, 0x30, 0x64, 
-0x12, 0x7A, 0xB0, 0xA7, 0xD7, 0x79, 0x02, 0x2A, 0x8D, 0xFE, 0x49, 0xE9, 0x9F, 0x05, 0xA4, 0x94, 
-0x75, 0x8D, 0x2C, 0x3C, 0x82, 0xA9, 0x53, 0x7C, 0x35, 0x2D, 0x3C, 0x79, 0xEE, 0x0C, 0x17, 0x9F, 
-0xBE, 0x4C, 0x55, 0xD7, 0xF8, 0xA8, 0xD7, 0x86, 0xA0, 0x2E, 0x0E, 0x59, 0xD1, 0x6F, 0xFA, 0xBF, 
-0x8F, 0x3A, 0x47, 0x71, 0x6C, 0x94, 0x34, 0xDD, 0xBD, 0xFF, 0x80, 0x1B, 0x57, 0xAE, 0x32, 0xDD, 
-0xDB, 0x87, 0x9E, 0xBE, 0x96, 0x01, 0xB3, 0x4D, 0xA2, 0xEA, 0xF7, 0x04, 0xF8, 0xBA, 0xE2, 0xA1, 
-0x83, 0xEB, 0x26, 0xF2, 0x25, 0x5A, 0xFE, 0xF7, 0xBD, 0x3B, 0xFC, 0x8D, 0xAB, 0x5F, 0xE6, 0x6F, 
-0x5E, 0x79, 0x8E, 0xBF, 0xFB, 0xE0, 0x0E, 0xFF, 0xD3, 0xDD, 0x5B, 0xFC, 0xED, 0x9B, 0x2F, 0xF3, 
-0x93, 0x37, 0x5F, 0xE4, 0x7F, 0x79, 0x70, 0x83, 0xCF, 0xF9, 0x29, 0x77, 0x2A, 0xCB, 0xA4, 0xA9, 
-0x99, 0x3A, 0x83, 0xB7, 0xBA, 0x63, 0xB3, 0x0C, 0x32, 0x02, 0x18, 0x2C, 0x51, 0x1C, 0x53, 0x5B, 
-0x73, 0xA7, 0xB2, 0x7C, 0x66, 0x36, 0xE5, 0x67, 0xEE, 0x5C, 0xE7, 0xA7, 0xAE, 0xBF, 0xC0, 0x4F, 
-0xDD, 0x7A, 0x99, 0x9F, 0xBA, 0x7B, 0x95, 0x9F, 0xBA, 0x7B, 0x9D, 0x9F, 0xBE, 0x7D, 0x85, 0x9F, 
-0xB9, 0xFA, 0x12, 0xBF, 0x74, 0xF7, 0x36, 0x2F, 0x74, 0x2D, 0x0F, 0xAC, 0xC5, 0x57, 0x1A, 0xBD, 
-0x98, 0x5C, 0xAE, 0x22, 0xA0, 0x7F, 0x14, 0xAB, 0xCA, 0x65, 0xF8, 0x7F, 0xFF, 0x58, 0x89, 0x13, 
-0xA8, 0xED, 0x3E, 0xEF, 0x1C, 0x2D, 0xCF, 0x4A, 0x76, 0x7A, 0xEB, 0xD6, 0x9D, 0xC7, 0x67, 0xB8, 
-0x27, 0x4F, 0x9E, 0x9F, 0xA6, 0x84, 0x67, 0x9E, 0x49, 0xDD, 0x8B, 0x1D, 0x63, 0x62, 0x77, 0x77, 
-0x4F, 0xA7, 0xC6, 0x22, 0x34, 0x4D, 0xC3, 0xDA, 0xDA, 0xDA, 0xA2, 0x12, 0x86, 0x9D, 0xEF, 0x55, 
-0xC0, 0x2B, 0x7D, 0xE6, 0xA2, 0xA0, 0x16, 0x85, 0x18, 0xB3, 0x04, 0x1B, 0x52, 0x64, 0x7D, 0x73, 
-0x93, 0xB3, 0x17, 0x2F, 0xE0, 0xC6, 0x0D, 0x6D, 0x5C, 0x6C, 0x72, 0x80, 0xBC, 0x05, 0xB8, 0x54, 
-0x7C, 0xAF, 0x92, 0x0A, 0x52, 0x7E, 0x0E, 0xBD, 0x29, 0xBA, 0x64, 0xD5, 0x41, 0xB1, 0xDF, 0x75, 
-0xCE, 0xA9, 0xE4, 0x11, 0x93, 0x9A, 0xD1, 0xB4, 0x1D, 0xB7, 0x6F, 0xDE, 0xE4, 0xCE, 0xED, 0x9B, 
-0xE0, 0x03, 0xD6, 0xE6, 0x77, 0xE5, 0x67, 0x45, 0xB4, 0x73, 0xD5, 0x4D, 0xC3, 0xC5, 0xCB, 0x97, 
-0x38, 0x73, 0xEE, 0x2C, 0x9D, 0xF7, 0x74, 0x25, 0x8E, 0x5A, 0xAF, 0x53, 0xC5, 0x6C, 0xA2, 0xD7, 
-0x18, 0xC7, 0x64, 0x67, 0x97, 0x97, 0x5F, 0x78, 0x91, 0xD9, 0xFE, 0x64, 0x2E, 0xF1, 0x4A, 0x52, 
-0x9D, 0x71, 0xC8, 0xAB, 0xB8, 0x25, 0x9F, 0xAB, 0x50, 0xBE, 0xE3, 0x51, 0xA5, 0xBD, 0x4A, 0x1A, 
-0x7B, 0x35, 0x31, 0xAC, 0xAF, 0x21, 0x1D, 0x85, 0xE1, 0xB5, 0x4F, 0x42, 0x6F, 0x34, 0x6C, 0x36, 
-0x53, 0x94, 0xFE, 0x34, 0x56, 0x50, 0xFB, 0x6D, 0x23, 0xAC, 0xE5, 0x41, 0x78, 0x63, 0x7B, 0x4B, 
-0xCD, 0x03, 0xBD, 0x27, 0x84, 0x90, 0x07, 0xE0, 0xC3, 0xFB, 0xE1, 0xF0, 0xD8, 0xF0, 0x7B, 0xCB, 
-0x6F, 0x83, 0xD0, 0xB8, 0x8A, 0x76, 0x32, 0xE5, 0xA5, 0x17, 0x5E, 0xE4, 0xEE, 0xAD, 0xDB, 0x54, 
-0xC6, 0x52, 0x15, 0xFB, 0x75, 0x51, 0x66, 0x58, 0xFE, 0x4F, 0xFD, 0x5D, 0x70, 0x02, 0x5D, 0x8A, 
-0xCC, 0x44, 0xE8, 0x1A, 0xC7, 0xFE, 0xDA, 0x88, 0x17, 0x4C, 0xE2, 0x9F, 0x3C, 0xB8, 0xCB, 0xDF, 
-0x7D, 0xE9, 0x79, 0x7E, 0xEA, 0x4B, 0x5F, 0xE4, 0xA7, 0xBE, 0xF4, 0x45, 0xFE, 0xFE, 0xD5, 0x2B, 
-0xFC, 0xFC, 0x83, 0x7B, 0x7C, 0x29, 0x76, 0xEC, 0xD4, 0x8E, 0x30, 0x6E, 0xF0, 0xCE, 0xD1, 0xA5, 
-0x48, 0x94, 0x44, 0x30, 0x69, 0xDE, 0x12, 0x25, 0x01, 0x31, 0x91, 0xC4, 0xD0, 0x1A, 0xCB, 0x74, 
-0x63, 0x9D, 0x5B, 0x8D, 0xE5, 0xB3, 0x61, 0xCA, 0x3F, 0xBC, 0x7F, 0x87, 0xFF, 0xF1, 0xEA, 0x73, 
-0xFC, 0xC4, 0x0B, 0x9F, 0xE7, 0x27, 0xAE, 0x7E, 0x99, 0xBF, 0x7B, 0xE3, 0x25, 0x7E, 0x75, 0xB2, 
-0xCB, 0x0D, 0x89, 0xEC, 0xD5, 0x0D, 0x13, 0x11, 0xDA, 0x04, 0xA6, 0xD2, 0x99, 0x78, 0xD7, 0xB5, 
-0x39, 0x9F, 0x2A, 0xBC, 0xF4, 0x2D, 0x42, 0x52, 0x4A, 0x2A, 0xF8, 0xCC, 0xE3, 0x94, 0x3D, 0x0A, 
-0x7D, 0x16, 0x9A, 0x97, 0x35, 0xAD, 0x99, 0x3D, 0x3D, 0x5A, 0x5B, 0x79, 0xF3, 0x91, 0x0C, 0x77, 
-0x6D, 0x8D, 0x36, 0xC6, 0xD8, 0xC6, 0x9E, 0x53, 0xEA, 0x12, 0x27, 0x6B, 0x7F, 0x7F, 0x7F, 0xA9, 
-0xC3, 0xAD, 0xAD, 0x8F, 0xD4, 0x3B, 0xD0, 0x8A, 0x15, 0xD2, 0x3E, 0x1E, 0xB7, 0x31, 0x0F, 0x3B, 
-0x75, 0xF9, 0x3D, 0xEC, 0x20, 0x43, 0x7A, 0xA4, 0xA4, 0x53, 0xE2, 0x26, 0x55, 0x8E, 0x24, 0x70, 
-0xEE, 0xF2, 0x45, 0x2E, 0x3F, 0xFD, 0x14, 0xB3, 0xE0, 0xE7, 0x0D, 0x88, 0x43, 0xF2, 0xDB, 0x6F, 
-0xA4, 0xE5, 0xBA, 0x21, 0xA4, 0x17, 0xF2, 0xA4, 0xC4, 0x68, 0x4A, 0x29, 0xE1, 0x8C, 0xA5, 0x31, 
-0x8E, 0x07, 0x77, 0xEE, 0xF1, 0xE0, 0xF6, 0x5D, 0xDA, 0xBD, 0x49, 0x76, 0xFC, 0x51, 0xF6, 0x6E, 
-0x2F, 0xFC, 0x3A, 0x84, 0x08, 0x6B, 0x9B, 0x5B, 0x5C, 0x7A, 0xEA, 0x19, 0xD6, 0x37, 0xB7, 0x88, 
-0x11, 0x04, 0x0B, 0xC6, 0x12, 0x08, 0x24, 0x02, 0x31, 0x7A, 0x62, 0xD7, 0xE2, 0x04, 0x0C, 0x91, 
-0x07, 0x77, 0x6E, 0xF3, 0xD2, 0x73, 0x5F, 0xA6, 0x9D, 0x4C, 0x91, 0xA8, 0x92, 0x72, 0x51, 0x67, 
-0x48, 0x5A, 0x36, 0x6F, 0xEB, 0x0B, 0x95, 0x47, 0x96, 0xD5, 0x13, 0x41, 0x25, 0xB3, 0x27, 0xA7, 
-0xC7, 0x47, 0xBF, 0x5E, 0x7E, 0xBD, 0xC3, 0xE4, 0xD5, 0x79, 0xF2, 0x77, 0x19, 0x67, 0xB3, 0xBF, 
-0x56, 0x41, 0x5C, 0xC5, 0x99, 0x0B, 0x17, 0x39, 0x77, 0xE9, 0x12, 0x88, 0x4A, 0xBC, 0x65, 0x80, 
-0x6F, 0x1A, 0xF5, 0xA5, 0x41, 0x1E, 0x54, 0xB5, 0x95, 0x2C, 0x68, 0x38, 0x13, 0x58, 0x45, 0x00, 
-0x12, 0x13, 0xA3, 0xAA, 0x66, 0xFF, 0xE1, 0x0E, 0x2F, 0x3F, 0xFF, 0x02, 0xBB, 0x3B, 0x3B, 0xF3, 
-0xB5, 0x82, 0xF2, 0xFC, 0x7E, 0x3F, 0xE9, 0x43, 0x12, 0x44, 0xDF, 0xE2, 0x2A, 0xDD, 0x68, 0x33, 
-0x8D, 0x91, 0x5D, 0xE3, 0xD8, 0x5B, 0xDF, 0xE0, 0x5E, 0x33, 0xE6, 0x85, 0xCE, 0x73, 0x15, 0xE1, 
-0xA6, 0x71, 0xDC, 0xAD, 0x2A, 0x76, 0x8D, 0x65, 0x96, 0x43, 0xF2, 0xA4, 0xA4, 0xF1, 0xFA, 0xE6, 
-0x4C, 0x8F, 0xEC, 0x98, 0x3C, 0xAB, 0x44, 0x43, 0x4A, 0xCC, 0x8C, 0xF0, 0x80, 0xC4, 0xDD, 0xCA, 
-0x72, 0x77, 0xD4, 0x70, 0x73, 0x7D, 0x8D, 0x97, 0x47, 0x35, 0xCF, 0x37, 0x8E, 0x2F, 0x35, 0xC2, 
-0x73, 0xB5, 0xE1, 0x56, 0xE5, 0xD8, 0xA9, 0x1A, 0x82, 0xAB, 0xC0, 0xD6, 0x90, 0x7D, 0x23, 0x44, 
-0x89, 0xE8, 0x2E, 0xE1, 0xDC, 0x7F, 0xB2, 0xD7, 0x30, 0x2F, 0x41, 0x37, 0x58, 0x24, 0x75, 0x31, 
-0x59, 0x0C, 0xAD, 0x0A, 0xEF, 0x59, 0x95, 0x96, 0xFF, 0x07, 0x6D, 0x2E, 0x19, 0x31, 0x3B, 0x0F, 
-0x9B, 0xAD, 0x95, 0x8C, 0xF0, 0xC8, 0x96, 0xED, 0xDC, 0x7A, 0x5B, 0xD7, 0xF5, 0x6C, 0x69, 0x35, 
-0x3F, 0x46, 0xDA, 0xB6, 0x65, 0x67, 0x67, 0x67, 0x3E, 0xCD, 0x89, 0x31, 0xCE, 0x77, 0x64, 0x81, 
-0xEE, 0xA7, 0x7E, 0xA5, 0x18, 0x32, 0xDA, 0x72, 0xEC, 0xD5, 0x44, 0xC8, 0xEE, 0xEC, 0xAA, 0xA6, 
-0xE1, 0xA9, 0xA7, 0x9F, 0x66, 0xF3, 0xD4, 0x09, 0x42, 0x8A, 0xD8, 0x2A, 0xEB, 0xCC, 0x8E, 0xE8, 
-0xBC, 0x69, 0x45, 0x07, 0x8F, 0x03, 0x06, 0x16, 0x48, 0xD8, 0x4A, 0xA3, 0xFF, 0x7A, 0xEF, 0x75, 
-0x6B, 0x64, 0x96, 0x40, 0x6E, 0x5C, 0xB9, 0xCA, 0xFE, 0xCE, 0xAE, 0x4E, 0x95, 0x7A, 0x9E, 0xFA, 
-0xFB, 0x4C, 0x30, 0x19, 0x61, 0x73, 0x6B, 0x8B, 0xAD, 0xAD, 0x2D, 0x5D, 0x90, 0x30, 0xAA, 0xBF, 
-0xED, 0x4B, 0xAA, 0xA0, 0xB6, 0x99, 0xCE, 0x5A, 0xFC, 0xB4, 0xE5, 0xDE, 0x9D, 0xBB, 0xEC, 0xEE, 
-0xEC, 0x40, 0xC8, 0x2A, 0x8D, 0x98, 0xB0, 0xA2, 0x26, 0x3C, 0x25, 0xAF, 0x3E, 0xAD, 0xDE, 0x89, 
-0xF4, 0x38, 0x4C, 0xB7, 0xE4, 0xF7, 0x2B, 0x85, 0xC1, 0x3D, 0x6E, 0x3E, 0x4A, 0xFB, 0x3A, 0x8C, 
-0x5E, 0x6B, 0x1C, 0x96, 0xDF, 0x94, 0x37, 0xAE, 0x78, 0xEF, 0x29, 0xDE, 0xDC, 0xC8, 0xD3, 0xF8, 
-0x90, 0xA3, 0x36, 0x54, 0x39, 0x12, 0xEF, 0x78, 0x73, 0x43, 0x3D, 0x82, 0xE5, 0x19, 0x54, 0x4A, 
-0x09, 0x2B, 0x86, 0xD0, 0x3D, 0xDA, 0x0A, 0xA5, 0x60, 0xF8, 0xBD, 0xE5, 0xFD, 0x82, 0xEA, 0x3B, 
-0xEF, 0xDD, 0xB9, 0xCB, 0xCE, 0x83, 0x87, 0x6A, 0xDB, 0x9A, 0x37, 0xCC, 0x94, 0x76, 0x1A, 0x95, 
-0xBB, 0x2C, 0xB5, 0x9B, 0x62, 0x8B, 0x6E, 0xAD, 0x40, 0xF0, 0xF8, 0xAE, 0x53, 0xAB, 0x51, 0x67, 
-0x09, 0xAE, 0xA2, 0xAD, 0x1A, 0xDA, 0xD1, 0x98, 0x59, 0xBD, 0x46, 0x18, 0xAD, 0x91, 0xEA, 0x86, 
-0x60, 0x2A, 0x62, 0x54, 0x0B, 0x1D, 0x43, 0x44, 0x27, 0x7B, 0x25, 0x54, 0x95, 0x1E, 0x93, 0xBC, 
-0x49, 0xA1, 0x98, 0x75, 0x06, 0x1C, 0x5E, 0x6A, 0x5A, 0xDB, 0x30, 0x73, 0x35, 0xBE, 0x59, 0x27, 
-0xAC, 0x6D, 0xD0, 0xAE, 0x6D, 0xB0, 0xDF, 0x8C, 0x99, 0x8E, 0x46, 0xEC, 0x25, 0x98, 0x05, 0xB0, 
-0xE2, 0xA8, 0x8C, 0x3A, 0xF0, 0x0F, 0xA1, 0xC3, 0x36, 0x02, 0xE2, 0xD1, 0x25, 0xAE, 0x40, 0x30, 
-0x71, 0xEE, 0x9A, 0x51, 0x58, 0x6C, 0xB8, 0x38, 0x0A, 0xC3, 0x72, 0x2B, 0xC7, 0x74, 0xA4, 0x48, 
-0xB7, 0xDE, 0xB5, 0xB7, 0xB1, 0xB2, 0x12, 0x8E, 0x64, 0xB8, 0xDE, 0xEF, 0xF9, 0x18, 0xBB, 0x59, 
-0x7F, 0xEB, 0xAE, 0x64, 0x1D, 0xED, 0xBD, 0x7B, 0xF7, 0x96, 0x5C, 0xBE, 0x9D, 0x3F, 0x73, 0x96, 
-0xC6, 0x69, 0x90, 0xBA, 0x61, 0x46, 0x0E, 0x6B, 0x5C, 0x47, 0x61, 0x55, 0x87, 0x1E, 0xFE, 0x3E, 
-0x0A, 0x8F, 0xEA, 0x3C, 0x45, 0xF2, 0xAB, 0x9A, 0x9A, 0xD3, 0xA7, 0x4F, 0x73, 0xE1, 0xD2, 0x45, 
-0x5D, 0x80, 0xB2, 0xAA, 0xA8, 0x2F, 0x77, 0xAD, 0xCA, 0x47, 0xC1, 0xEA, 0x27, 0x2F, 0x90, 0x7A, 
-0x26, 0x72, 0x29, 0xA8, 0xBF, 0x5B, 0x89, 0x89, 0xBB, 0xB7, 0xEF, 0x70, 0xED, 0xE5, 0x2B, 0x74, 
-0xD3, 0xD9, 0xDC, 0xB7, 0x41, 0x4A, 0x6A, 0x0D, 0x11, 0x7B, 0x03, 0xCB, 0xF6, 0xF6, 0x36, 0xE7, 
-0xCF, 0x9F, 0xA7, 0x6A, 0x6A, 0xBA, 0xCC, 0x64, 0x17, 0x33, 0x0D, 0xCD, 0x93, 0xCD, 0x3E, 0x3E, 
-0xBB, 0xAE, 0xE3, 0xD6, 0xAD, 0x5B, 0xDC, 0xBE, 0x71, 0x13, 0x49, 0x79, 0xB1, 0x25, 0x2F, 0xA0, 
-0xC9, 0xC0, 0x41, 0x4F, 0x41, 0x5F, 0xA2, 0x79, 0x25, 0x38, 0xAC, 0x7C, 0xBE, 0x8A, 0xC7, 0xC3, 
-0x52, 0xDD, 0x64, 0x75, 0xDD, 0x7C, 0x86, 0x12, 0x35, 0x30, 0xA3, 0x75, 0x8E, 0xB3, 0x67, 0xCF, 
-0x72, 0xFE, 0xE2, 0x05, 0xB5, 0xA4, 0x09, 0x69, 0x1E, 0x7B, 0xCF, 0x88, 0x10, 0x3A, 0xBF, 0x64, 
-0x41, 0xD0, 0x6F, 0xBF, 0xFD, 0x3A, 0x1A, 0xB6, 0x85, 0xE1, 0x6F, 0x49, 0x70, 0xFB, 0xFA, 0x0D, 
-0x5E, 0x7A, 0xE1, 0x45, 0x62, 0xE7, 0x19, 0x55, 0x35, 0x29, 0x04, 0xB5, 0x1D, 0x3F, 0x64, 0xD1, 
-0xB5, 0xC0, 0x48, 0xA2, 0x72, 0x96, 0xD8, 0x75, 0xD0, 0x05, 0x1A, 0xB1, 0xD4, 0x38, 0xFC, 0x34, 
-0x32, 0x99, 0x05, 0x02, 0x35, 0x3E, 0x08, 0x5D, 0x10, 0x24, 0x58, 0x5C, 0x76, 0x43, 0x5A, 0x09, 
-0x73, 0x4F, 0x76, 0x96, 0x34, 0xF0, 0x3E, 0x97, 0xED, 0xCB, 0xD1, 0x8D, 0x0A, 0x23, 0x53, 0x31, 
-0x32, 0x15, 0x4D, 0x74, 0xD8, 0x29, 0x98, 0x49, 0xA2, 0x9A, 0x59, 0xAA, 0x99, 0x45, 0x5A, 0x08, 
-0xC9, 0xE2, 0xB3, 0xB9, 0x97, 0x4B, 0xD9, 0x77, 0x08, 0x59, 0x8D, 0x90, 0x23, 0x46, 0x88, 0xE8, 
-0x36, 0xCB, 0x20, 0x89, 0xE0, 0x12, 0xC1, 0x28, 0x93, 0x77, 0xE8, 0x4E, 0xCD, 0x3E, 0x4A, 0xD9, 
-0xCD, 0xFB, 0x73, 0x8F, 0xBF, 0xF4, 0xCB, 0x36, 0x11, 0x03, 0xC2, 0x9D, 0x3F, 0xF8, 0x97, 0xFE, 
-0xE0, 0xE3, 0x33, 0x5C, 0x6B, 0x47, 0xA1, 0xAA, 0x6D, 0x6B, 0x6C, 0x4A, 0xCE, 0xAA, 0xA4, 0x24, 
-0x22, 0xC4, 0x60, 0x78, 0x70, 0x7F, 0x8F, 0xAE, 0x53, 0x53, 0x90, 0x66, 0x64, 0x39, 0x75, 0x7A, 
-0x8B, 0x66, 0xA4, 0x6E, 0xCE, 0xFB, 0x12, 0xD8, 0xAA, 0x8E, 0xB8, 0xEA, 0xD8, 0x51, 0x18, 0x36, 
-0x96, 0xC7, 0xBD, 0xBF, 0x14, 0x4C, 0x11, 0xBC, 0x63, 0xD6, 0x93, 0x26, 0xA3, 0xB1, 0x9F, 0x4E, 
-0x9E, 0x3B, 0xC3, 0xF6, 0xA9, 0x93, 0xF8, 0x98, 0xB7, 0xD3, 0x96, 0x9D, 0x5E, 0xFD, 0x77, 0xF6, 
-0x6C, 0x21, 0x0F, 0x20, 0xAB, 0x30, 0x86, 0x88, 0x31, 0x4B, 0x05, 0x51, 0x2B, 0xA5, 0xA9, 0x6A, 
-0x0D, 0xE0, 0x78, 0xF5, 0x0A, 0xF7, 0xEF, 0xDD, 0xC3, 0xF7, 0x42, 0x2C, 0xA7, 0x58, 0x3A, 0x85, 
-0x21, 0x24, 0xC1, 0x58, 0xCB, 0x99, 0xB3, 0x67, 0x39, 0x7B, 0xE1, 0xBC, 0xAE, 0x3E, 0xE7, 0xDD, 
-0x66, 0x3E, 0x45, 0xF5, 0x75, 0x8B, 0xEA, 0x65, 0x25, 0x26, 0xC4, 0x47, 0xDA, 0xBD, 0x09, 0xB7, 
-0x6E, 0xDC, 0xE0, 0xCE, 0xED, 0xDB, 0xFA, 0x9D, 0x59, 0x1A, 0x09, 0x39, 0xAA, 0x44, 0x4A, 0x8B, 
-0xD0, 0x25, 0xA5, 0xC3, 0x98, 0xC1, 0xB6, 0x5E, 0x93, 0x0E, 0x9F, 0x26, 0x1E, 0x07, 0xAB, 0x3A, 
-0xF6, 0x93, 0xA2, 0xFF, 0xAC, 0x55, 0x34, 0xBC, 0xF6, 0x2B, 0x01, 0xAB, 0xDA, 0xC0, 0x93, 0xC2, 
-0x22, 0xEA, 0x7C, 0x1E, 0xF0, 0x51, 0xB7, 0x83, 0x27, 0x07, 0xE3, 0xF5, 0x35, 0xCE, 0x5E, 0x3C, 
-0xC7, 0xC9, 0xD3, 0xA7, 0x11, 0x29, 0xE1, 0x99, 0xB4, 0x5E, 0x6D, 0x96, 0x72, 0xAB, 0xA6, 0x5E, 
-0xB8, 0x13, 0x1C, 0x60, 0x55, 0xF9, 0xF5, 0x61, 0x32, 0x53, 0x93, 0x10, 0xB9, 0xF6, 0xD2, 0x15, 
-0xAE, 0xBE, 0xF8, 0x12, 0x29, 0x46, 0x6A, 0xA7, 0xB1, 0x0A, 0x45, 0x04, 0x9F, 0xD7, 0x25, 0x56, 
-0x21, 0x01, 0x09, 0x95, 0xB2, 0xEB, 0xBA, 0xA6, 0xAE, 0x6B, 0xBC, 0x5F, 0x78, 0xE9, 0xAA, 0x47, 
-0x63, 0xD5, 0xFD, 0x56, 0xEA, 0xE5, 0x0C, 0x50, 0x9B, 0x5E, 0x29, 0xF9, 0x8D, 0xC4, 0xD0, 0x69, 
-0x1E, 0xF2, 0x33, 0xA3, 0xA0, 0xF7, 0x18, 0xC1, 0x64, 0x97, 0xA8, 0x7E, 0x3A, 0xC5, 0x84, 0x44, 
-0x25, 0x16, 0x67, 0xDC, 0xDC, 0x5E, 0xD7, 0x99, 0x0A, 0x6B, 0xD5, 0x5A, 0xA3, 0xAA, 0x17, 0xA1, 
-0xC0, 0x52, 0x0A, 0x54, 0x95, 0x06, 0x6D, 0x9D, 0xEF, 0x92, 0x95, 0xBC, 0xA9, 0x29, 0x4B, 0xE9, 
-0xAB, 0xCA, 0x46, 0xA4, 0x17, 0x69, 0x58, 0x64, 0x9E, 0xCF, 0xD2, 0x67, 0xFB, 0xC8, 0x03, 0x96, 
-0x77, 0x29, 0x3D, 0x90, 0x43, 0x7C, 0x94, 0x1E, 0xC9, 0x70, 0x9D, 0x5B, 0x0B, 0xD3, 0xE9, 0xFE, 
-0x8C, 0xD8, 0xA6, 0xCA, 0x46, 0xAC, 0x24, 0xBC, 0x8F, 0x18, 0x69, 0xB8, 0x77, 0x67, 0x4A, 0x08, 
-0x15, 0x21, 0x01, 0x26, 0x72, 0xF6, 0xE2, 0x26, 0x55, 0xE3, 0x69, 0xBB, 0x5D, 0x6A, 0x9B, 0xCD, 
-0x2E, 0x44, 0xC7, 0x2B, 0x44, 0x03, 0xD7, 0xE9, 0xCA, 0xFA, 0x62, 0x41, 0x08, 0x93, 0x77, 0x51, 
-0x95, 0x38, 0x42, 0x39, 0x66, 0xFC, 0x30, 0xA6, 0x50, 0x7F, 0xF4, 0x1D, 0x8E, 0xC4, 0xC3, 0x6B, 
-0x0A, 0x45, 0x02, 0xC6, 0xA0, 0xA3, 0x58, 0xF0, 0x48, 0x54, 0x5D, 0x50, 0x4A, 0x01, 0x4C, 0xC2, 
-0x8E, 0x1C, 0x9D, 0x09, 0x9C, 0x38, 0x7F, 0x96, 0x37, 0xBD, 0xE3, 0x6D, 0xEC, 0xEE, 0xEB, 0x22, 
-0xE0, 0x78, 0x3C, 0xC6, 0xB7, 0xAD, 0x86, 0xE3, 0x28, 0x7E, 0x6C, 0xB3, 0xFF, 0x01, 0xC9, 0xBA, 
-0x9D, 0xBE, 0x2F, 0x82, 0x98, 0x44, 0x6D, 0x24, 0xB3, 0xEE, 0xB1, 0xEF, 0xEF, 0xD6, 0x89, 0xC3, 
-0xA2, 0x69, 0xF1, 0x3D, 0xEA, 0xDB, 0x29, 0x2F, 0x3E, 0xFF, 0x65, 0x52, 0xF6, 0x49, 0x4A, 0x14, 
-0x46, 0xA3, 0x35, 0xBC, 0x8F, 0xB4, 0x1E, 0xAC, 0x1B, 0x11, 0x11, 0x5C, 0x53, 0xF3, 0xF4, 0x9B, 
-0x9E, 0x66, 0xED, 0xE4, 0x06, 0x7B, 0x7E, 0x4A, 0x74, 0x30, 0x8B, 0x2D, 0x52, 0xA9, 0xF3, 0x19, 
-0x93, 0xA0, 0x16, 0x4B, 0xE3, 0x2A, 0x46, 0xAE, 0xE2, 0xC1, 0x9D, 0xDB, 0xDC, 0xBE, 0x7E, 0x8D, 
-0x14, 0x74, 0xAA, 0x64, 0x2C, 0xA4, 0xD0, 0x51, 0x55, 0x16, 0x11, 0x5D, 0xD5, 0x56, 0x7B, 0x69, 
-0x35, 0xF6, 0x36, 0xD8, 0x25, 0xB2, 0xD8, 0x9E, 0x7B, 0x4D, 0xA5, 0x64, 0x16, 0x34, 0xD4, 0xF3, 
-0x3D, 0x9A, 0xB2, 0xCF, 0x88, 0x27, 0xA4, 0xC3, 0xEA, 0xB9, 0xA0, 0x9F, 0xCF, 0x55, 0x38, 0x98, 
-0x9F, 0x65, 0x3A, 0xEA, 0xDB, 0xD2, 0x8A, 0x8D, 0x03, 0xE5, 0x3D, 0xC3, 0xFB, 0x97, 0xEE, 0xEB, 
-0xFF, 0x3F, 0x68, 0x8F, 0xAB, 0x68, 0x88, 0xF2, 0x0E, 0x01, 0x2A, 0x63, 0x89, 0x9D, 0xA7, 0xAE, 
-0x9D, 0x9A, 0x09, 0x36, 0x06, 0x3B, 0xAE, 0x18, 0x6D, 0xAF, 0x73, 0xF1, 0xE9, 0x8B, 0xAA, 0xE7, 
-0x8C, 0x9E, 0xCA, 0x19, 0x75, 0xFC, 0x9D, 0xBC, 0xFA, 0xBB, 0x35, 0xBA, 0x08, 0x9C, 0xB5, 0xB8, 
-0xE4, 0xC8, 0x7B, 0xF3, 0x76, 0x2B, 0x51, 0xDB, 0x6B, 0x4A, 0x82, 0xAB, 0x1B, 0xBA, 0x10, 0x75, 
-0x6D, 0x40, 0x2C, 0xB5, 0xAD, 0xE9, 0xDA, 0x16, 0x97, 0x84, 0xBD, 0xDB, 0xF7, 0xB8, 0xF6, 0xFC, 
-0x8B, 0xD8, 0x2C, 0x68, 0x74, 0x5D, 0x47, 0xD5, 0x34, 0x4B, 0xCC, 0xB6, 0x4C, 0xF1, 0x17, 0x6D, 
-0xC7, 0x92, 0x4A, 0x48, 0x1C, 0x71, 0x84, 0x94, 0xD4, 0x14, 0xCB, 0xAA, 0x29, 0x62, 0x24, 0xA8, 
-0xF3, 0x7E, 0xA3, 0xFD, 0x33, 0xA2, 0x7A, 0xD3, 0x68, 0xD4, 0xA9, 0x7E, 0x10, 0x65, 0xD6, 0x62, 
-0x9C, 0xB6, 0xD1, 0xA4, 0xB1, 0x03, 0x13, 0x06, 0x8F, 0xE0, 0x8B, 0xE3, 0x27, 0x02, 0x95, 0x11, 
-0x88, 0x1D, 0x3E, 0xB5, 0x78, 0x1B, 0xF0, 0x2E, 0x31, 0x4D, 0x1D, 0xB3, 0x14, 0x48, 0x02, 0xCE, 
-0x44, 0x24, 0x75, 0x74, 0xB4, 0xEA, 0x09, 0xCC, 0xA8, 0x93, 0x27, 0x01, 0x9C, 0xA9, 0xB2, 0x8F, 
-0x61, 0xED, 0xB3, 0x20, 0x98, 0xA8, 0x3B, 0xCF, 0xA2, 0x2C, 0xFC, 0x0F, 0x8B, 0x76, 0xFE, 0xEC, 
-0x8A, 0xB1, 0xE8, 0x93, 0x35, 0x15, 0x11, 0xBC, 0xF7, 0x8C, 0x9A, 0x35, 0xB4, 0x48, 0x0C, 0xCE, 
-0x58, 0x2A, 0x71, 0x3E, 0x49, 0x78, 0x30, 0x2F, 0xA4, 0x01, 0x8E, 0x64, 0xB8, 0xB3, 0xD9, 0x5D, 
-0x6F, 0x2D, 0x7B, 0xCE, 0x49, 0x9A, 0xB4, 0x13, 0x66, 0x7E, 0x86, 0xA5, 0x62, 0x36, 0x0D, 0xEC, 
-0x3C, 0x9C, 0x32, 0x9B, 0xAA, 0xD4, 0x2C, 0x26, 0xB1, 0xBE, 0xD1, 0x30, 0x1E, 0x6B, 0x8C, 0xFA, 
-0x55, 0x58, 0xD5, 0xC0, 0x56, 0x41, 0x99, 0xD7, 0x2B, 0x47, 0x4A, 0x89, 0x2E, 0x78, 0x24, 0x26, 
-0xB5, 0x10, 0x28, 0xA6, 0x2C, 0xD6, 0xE8, 0x54, 0x2C, 0x06, 0xB6, 0xB6, 0xB7, 0xB9, 0xF8, 0xD4, 
-0x65, 0xD6, 0x36, 0xD6, 0xE7, 0x56, 0xCA, 0x6D, 0xDB, 0xD2, 0x34, 0xCD, 0xD2, 0xB3, 0x86, 0x3E, 
-0x12, 0x0E, 0xEB, 0xE4, 0x05, 0xA9, 0xE8, 0xC1, 0x72, 0x47, 0x6D, 0xDB, 0x16, 0x67, 0x2D, 0xDD, 
-0x74, 0xC6, 0x95, 0x97, 0x5E, 0x64, 0xB2, 0xB7, 0xAF, 0xFA, 0xDC, 0xEC, 0x69, 0x29, 0x84, 0x80, 
-0x71, 0x6A, 0x6F, 0xD9, 0xC5, 0x84, 0xB1, 0x96, 0xD3, 0x67, 0xCF, 0xD0, 0xAC, 0x37, 0x6A, 0x33, 
-0x3B, 0x77, 0x53, 0x97, 0x07, 0x2B, 0x1D, 0x9C, 0x89, 0x21, 0x60, 0x62, 0x62, 0xBA, 0x3F, 0xE1, 
-0xF6, 0xCD, 0x5B, 0xEC, 0x3C, 0x78, 0xA8, 0x8B, 0x0B, 0x29, 0x2C, 0x49, 0xAE, 0xAB, 0x50, 0xA4, 
-0xDB, 0xA1, 0x94, 0x5B, 0x10, 0x8F, 0xFE, 0xC4, 0xD7, 0x05, 0x8F, 0x2A, 0xE7, 0xAF, 0x24, 0x94, 
-0x66, 0x7B, 0xD4, 0x0C, 0xE1, 0x51, 0x83, 0x04, 0x7D, 0xA6, 0x9B, 0xDB, 0x4F, 0x8C, 0x11, 0xAC, 
-0x61, 0xDA, 0xCE, 0x68, 0xC6, 0x23, 0x9E, 0x79, 0xD3, 0xD3, 0xAC, 0x6F, 0x6D, 0xEA, 0xD4, 0x38, 
-0x4B, 0x6E, 0xA0, 0x33, 0x1A, 0x15, 0x34, 0x54, 0xDE, 0x2D, 0x52, 0xD9, 0xFC, 0xB9, 0x99, 0xE6, 
-0xBF, 0xB3, 0x94, 0x66, 0xB3, 0x3F, 0x5D, 0x42, 0x24, 0xFA, 0x40, 0x53, 0xD5, 0x48, 0x88, 0xDC, 
-0xBA, 0x7A, 0x9D, 0xC9, 0xEE, 0x1E, 0xD1, 0x07, 0x24, 0xC7, 0xBD, 0x5B, 0x52, 0x67, 0x1D, 0xB9, 
-0x13, 0x3B, 0x3B, 0x4C, 0x2F, 0x69, 0x8F, 0xA0, 0xC7, 0xC0, 0x4A, 0x98, 0x9B, 0x03, 0xD7, 0x2C, 
-0x63, 0xE5, 0xF9, 0xB2, 0xA8, 0x26, 0xEA, 0x64, 0x3D, 0x9A, 0x48, 0xCC, 0x0E, 0x77, 0x14, 0xB9, 
-0x24, 0x4C, 0x71, 0x18, 0xB5, 0x78, 0x5E, 0x41, 0x4A, 0xA2, 0x5B, 0xF7, 0xF3, 0xC9, 0x54, 0x76, 
-0xCC, 0xA5, 0xA4, 0x8B, 0xD3, 0x07, 0x66, 0xB4, 0xBD, 0xF2, 0xCC, 0xFD, 0xB6, 0x6D, 0xD5, 0xE2, 
-0x21, 0x04, 0xCF, 0x2C, 0xEE, 0x12, 0x52, 0x3B, 0xAD, 0x9A, 0xEA, 0x61, 0xEF, 0xA6, 0x25, 0x1C, 
-0xC9, 0x70, 0x2F, 0x5E, 0x7C, 0x8F, 0x1F, 0x8D, 0x46, 0xB7, 0x42, 0x08, 0x11, 0x0C, 0xB5, 0x1D, 
-0xD1, 0xD4, 0x63, 0xAA, 0xAA, 0xE1, 0xE1, 0xC3, 0x5D, 0xBA, 0x2E, 0xE0, 0x6C, 0x8D, 0x31, 0x86, 
-0x8D, 0x8D, 0x2D, 0x46, 0xA3, 0x31, 0x46, 0x1C, 0xD1, 0x2F, 0xA6, 0x33, 0x47, 0x35, 0x2E, 0x58, 
-0x14, 0xDC, 0x02, 0xFD, 0xFF, 0x9F, 0x1C, 0x65, 0x11, 0x21, 0x0D, 0x76, 0xEC, 0xC4, 0xB9, 0xFF, 
-0x5E, 0xE1, 0xE4, 0x99, 0xB3, 0x5C, 0xB8, 0x70, 0x61, 0x69, 0x65, 0xB7, 0x6D, 0xDB, 0x95, 0x1D, 
-0x63, 0xF8, 0xBB, 0x7F, 0xBC, 0x8F, 0x32, 0xB0, 0xF4, 0x25, 0xA5, 0x14, 0x22, 0x56, 0x0C, 0x0F, 
-0x1F, 0x3C, 0xE0, 0xF9, 0xE7, 0x9E, 0xC3, 0xE7, 0x9D, 0x7A, 0x92, 0x75, 0xAB, 0x21, 0xDB, 0x4E, 
-0x1A, 0x67, 0xF1, 0x21, 0xCC, 0xED, 0x6E, 0xC7, 0x1B, 0xEB, 0x2A, 0x49, 0xF5, 0x3B, 0x6B, 0x02, 
-0x9B, 0x37, 0x3A, 0x48, 0x52, 0xB5, 0xC5, 0xC3, 0xFB, 0x0F, 0xB8, 0x75, 0xE3, 0x06, 0xFB, 0xFB, 
-0xFB, 0xF3, 0x05, 0xB8, 0x5F, 0xAF, 0x58, 0x55, 0xF6, 0xE5, 0xF8, 0x1B, 0x81, 0x61, 0x1B, 0x38, 
-0x0C, 0xAB, 0x19, 0xCF, 0xE1, 0xDF, 0x73, 0x14, 0x44, 0x54, 0x75, 0x04, 0x0B, 0x5D, 0x6E, 0xD7, 
-0x75, 0x6C, 0x9D, 0x3C, 0xC1, 0xD3, 0xCF, 0x3E, 0xD3, 0x9B, 0x26, 0x2F, 0x66, 0x7D, 0x05, 0xFD, 
-0xFF, 0x87, 0xEF, 0x1C, 0x7E, 0x4B, 0x8C, 0x71, 0xAE, 0x26, 0x8B, 0xD1, 0xD3, 0x79, 0xDD, 0xA9, 
-0xF8, 0xE0, 0xDE, 0x7D, 0x5E, 0x7E, 0xF9, 0x65, 0xF6, 0xF6, 0xF6, 0xB4, 0x9D, 0xF5, 0xFA, 0xCF, 
-0xF0, 0x99, 0x5F, 0xC9, 0x38, 0x4E, 0x5E, 0x87, 0x75, 0xB3, 0xF4, 0xBB, 0xE7, 0x8F, 0x65, 0x31, 
-0x8B, 0x15, 0x48, 0xDA, 0xC7, 0xAC, 0xB5, 0x20, 0x11, 0x57, 0x19, 0x2A, 0x2B, 0x58, 0x1C, 0xB5, 
-0xAD, 0x27, 0x75, 0x65, 0x9E, 0x8C, 0xE1, 0xFE, 0xF0, 0x0F, 0x7F, 0xAC, 0xDD, 0x3A, 0xB1, 0xF9, 
-0x9C, 0x0F, 0x5D, 0x67, 0x4D, 0x83, 0x71, 0x0D, 0xFB, 0xED, 0x0C, 0xDF, 0x25, 0x76, 0xF7, 0x26, 
-0xCC, 0x66, 0xAA, 0x97, 0x31, 0x58, 0xD6, 0x47, 0xEB, 0xAC, 0x8D, 0xD6, 0x71, 0xE2, 0x34, 0x53, 
-0x1C, 0xDE, 0xF1, 0xCB, 0xF1, 0x7E, 0xE3, 0x58, 0xF5, 0x7B, 0x15, 0x0E, 0x7B, 0xE6, 0x10, 0xD6, 
-0x2E, 0x16, 0xA3, 0x8A, 0x1E, 0xB3, 0x14, 0xA6, 0x0F, 0x81, 0xF1, 0xFA, 0x3A, 0xE7, 0xCE, 0x9F, 
-0xA7, 0xAE, 0x6B, 0x65, 0xB6, 0x39, 0xF6, 0x93, 0x19, 0x6C, 0xDD, 0x3D, 0xB2, 0x42, 0x8E, 0x80, 
-0xF4, 0x1A, 0xA9, 0x73, 0x0E, 0x3F, 0x6B, 0xB9, 0xF6, 0xF2, 0x15, 0xEE, 0xDE, 0xBA, 0xAD, 0x3A, 
-0xDD, 0xDC, 0x49, 0x8B, 0x1E, 0x2B, 0xE5, 0x4E, 0x26, 0xD6, 0x70, 0xFE, 0x82, 0xDA, 0xDD, 0x0E, 
-0x07, 0x8D, 0x62, 0x70, 0x5E, 0xF2, 0x58, 0x5B, 0xC7, 0x6C, 0x7F, 0xC2, 0xED, 0x9B, 0x37, 0xD9, 
-0xD9, 0xD9, 0xC9, 0xCC, 0xF8, 0xF8, 0x81, 0xEF, 0xDE, 0x28, 0xAC, 0x2A, 0xBF, 0xA3, 0xCA, 0xF5, 
-0xB0, 0xE3, 0x5F, 0xA9, 0x90, 0xCC, 0xA4, 0x5E, 0x69, 0xBE, 0x13, 0xD9, 0x0A, 0x80, 0x44, 0x33, 
-0x1E, 0x73, 0xE1, 0xC2, 0x05, 0x36, 0x36, 0x36, 0xE6, 0x2E, 0x39, 0x0B, 0xCA, 0xBB, 0x8E, 0xFB, 
-0xCE, 0xC2, 0x44, 0xE7, 0x0C, 0x34, 0x64, 0xD5, 0x59, 0x82, 0x76, 0x36, 0xE3, 0xF9, 0xE7, 0x9F, 
-0xE7, 0xCE, 0x9D, 0x3B, 0x84, 0x9E, 0xD3, 0xFD, 0x3E, 0x8E, 0xD3, 0xBE, 0x1E, 0x27, 0x3F, 0x4F, 
-0x8A, 0xA3, 0x9E, 0x7F, 0xD8, 0xF1, 0x02, 0xD3, 0x73, 0x9A, 0x2E, 0x03, 0x27, 0xEA, 0x4A, 0xAA, 
-0x22, 0x29, 0x0C, 0xB6, 0x50, 0x99, 0x81, 0xEF, 0xEE, 0xEE, 0x12, 0x43, 0x20, 0xC6, 0x96, 0xAE, 
-0x9B, 0x91, 0xD0, 0x68, 0x18, 0xC6, 0xC6, 0x5D, 0x63, 0xE4, 0xFE, 0xF0, 0x7D, 0x05, 0x47, 0x32, 
-0x5C, 0x00, 0x2B, 0xE6, 0x3A, 0xD8, 0x16, 0x84, 0xE0, 0x8B, 0x8B, 0x06, 0xC3, 0x64, 0x32, 0xE5, 
-0xC1, 0xC3, 0x87, 0x73, 0xA9, 0xD1, 0x39, 0xC7, 0xE6, 0xE6, 0x36, 0xC6, 0x38, 0x6A, 0xD7, 0x2C, 
-0x3E, 0x38, 0xDB, 0xD2, 0x2D, 0x90, 0x80, 0x44, 0x4A, 0x71, 0xFE, 0x3F, 0x2C, 0x8C, 0x8D, 0x8F, 
-0x83, 0x47, 0x15, 0x26, 0xA0, 0xAB, 0xB5, 0xB9, 0x00, 0x53, 0x52, 0x3B, 0x45, 0x53, 0x39, 0xC4, 
-0xEA, 0xB1, 0xB3, 0xE7, 0xCF, 0x71, 0xF1, 0xF2, 0x25, 0xA2, 0xA8, 0x6D, 0x9F, 0x64, 0x53, 0x97, 
-0xA6, 0xE9, 0xE5, 0xFD, 0x31, 0xD1, 0x6F, 0x88, 0x21, 0x15, 0xDF, 0x05, 0x81, 0x51, 0x53, 0xF1, 
-0xF0, 0xC1, 0x03, 0xAE, 0xBE, 0xF8, 0x32, 0x61, 0xD6, 0x22, 0x5E, 0xD5, 0x09, 0x73, 0x18, 0xC1, 
-0xC7, 0x84, 0x0F, 0x89, 0x66, 0x6D, 0xCC, 0xF9, 0x4B, 0x17, 0x59, 0xDB, 0x58, 0x07, 0x51, 0x97, 
-0x91, 0xFA, 0xDC, 0xAC, 0x2B, 0x4B, 0xBA, 0x08, 0x67, 0xB2, 0x6B, 0xC7, 0xFB, 0xB7, 0xEF, 0x72, 
-0xF5, 0xE5, 0x2B, 0xB4, 0xD3, 0x19, 0xB5, 0xCD, 0xCE, 0xC5, 0xB3, 0x03, 0x9C, 0xA3, 0xE8, 0x8D, 
-0xC0, 0xAA, 0x0E, 0xB2, 0xEA, 0x58, 0x1F, 0xFD, 0x73, 0x47, 0x5D, 0xF7, 0x5A, 0x60, 0xD5, 0xFB, 
-0x56, 0x1D, 0xEB, 0x63, 0x95, 0x94, 0xFB, 0xB8, 0x48, 0xE8, 0xC6, 0x99, 0x94, 0x37, 0xD0, 0xA4, 
-0x94, 0x38, 0x7F, 0xF1, 0x02, 0x17, 0x2F, 0x69, 0x7B, 0x2D, 0xF5, 0x57, 0x7A, 0xCB, 0x82, 0x49, 
-0x2C, 0xA8, 0xE8, 0x40, 0x87, 0xDB, 0x70, 0x4B, 0xFE, 0x53, 0x4A, 0xA4, 0xBC, 0xE8, 0x0A, 0x50, 
-0xBB, 0x8A, 0x51, 0x55, 0x33, 0xD9, 0xDD, 0xD3, 0xF6, 0x34, 0x9B, 0xCC, 0xCD, 0xB2, 0x52, 0xD2, 
-0x98, 0x5E, 0xBA, 0x70, 0xA4, 0xA1, 0x9B, 0x8A, 0x3A, 0x60, 0x3E, 0x75, 0x3F, 0x40, 0xAF, 0x0D, 
-0xFA, 0xDF, 0x78, 0x14, 0xFA, 0xBA, 0xF5, 0x55, 0xEA, 0x84, 0x02, 0xC9, 0x74, 0x28, 0x52, 0x96, 
-0x6A, 0x7B, 0x57, 0xA6, 0x24, 0x34, 0xCD, 0x88, 0xD1, 0x68, 0x44, 0x55, 0x29, 0xBF, 0x68, 0xC3, 
-0x8C, 0x49, 0xB7, 0xC7, 0xA4, 0xDD, 0x7B, 0xB8, 0x7D, 0x7A, 0xFB, 0xCE, 0xF0, 0x31, 0x05, 0x8F, 
-0x64, 0xB8, 0x53, 0xDF, 0xDD, 0xAA, 0xEA, 0xF1, 0x7E, 0x88, 0x01, 0x1F, 0x22, 0x8D, 0x5D, 0xC7, 
-0x55, 0x63, 0xBC, 0x8F, 0xDC, 0xBD, 0x7B, 0x9F, 0xD9, 0x6C, 0xA6, 0xD2, 0x56, 0x5D, 0x73, 0xFE, 
-0xCC, 0xE9, 0x2C, 0x55, 0x06, 0xDD, 0xAA, 0x3A, 0xC0, 0x51, 0x1D, 0xFD, 0xB0, 0x73, 0x87, 0x1D, 
-0x7F, 0x14, 0x86, 0xA3, 0xB3, 0x14, 0x9D, 0x4B, 0x76, 0x52, 0x73, 0xFE, 0xD2, 0x45, 0x4E, 0x9C, 
-0xD6, 0x48, 0xBC, 0x29, 0xEB, 0x46, 0x8B, 0x23, 0x8A, 0x22, 0x75, 0xBE, 0x52, 0x48, 0x91, 0x46, 
-0x3B, 0xCF, 0xBD, 0x9B, 0xB7, 0x79, 0x70, 0xEF, 0x1E, 0x8E, 0x1C, 0x9B, 0x29, 0x01, 0xBD, 0x69, 
-0x5A, 0x20, 0xE1, 0xEA, 0x8A, 0x53, 0xA7, 0x4F, 0xB3, 0x7D, 0xFA, 0x24, 0xA6, 0xAE, 0x74, 0x5A, 
-0x59, 0x36, 0x71, 0x14, 0x9F, 0xC3, 0x41, 0x19, 0x6A, 0x2D, 0x96, 0x76, 0x32, 0xE5, 0xD6, 0x8D, 
-0x1B, 0xDC, 0xBB, 0x73, 0x0B, 0xA2, 0x3A, 0x89, 0x96, 0x58, 0x56, 0xAE, 0xBF, 0xB2, 0x30, 0xEC, 
-0x20, 0xC7, 0xE9, 0x34, 0x8F, 0x3A, 0xFF, 0xEB, 0x11, 0x8F, 0x1A, 0xF0, 0x4A, 0xB9, 0x24, 0x81, 
-0x2E, 0xEA, 0xF6, 0x16, 0x57, 0x57, 0x5C, 0x7E, 0xE6, 0x69, 0xB6, 0x4E, 0x6C, 0xAB, 0x05, 0x90, 
-0x99, 0xC7, 0x23, 0x58, 0x30, 0xD0, 0xC7, 0x28, 0x2A, 0x29, 0xAB, 0xEC, 0x65, 0xE6, 0x94, 0x77, 
-0x24, 0x9A, 0x98, 0xB8, 0x73, 0xEB, 0x36, 0x7B, 0x0F, 0x1E, 0x12, 0xBD, 0xAA, 0xB9, 0x8A, 0x40, 
-0xC5, 0x2B, 0xE8, 0x8B, 0xAF, 0x16, 0x5E, 0xAD, 0xF6, 0xD0, 0xFF, 0xFE, 0xD5, 0xB4, 0x78, 0x8F, 
-0x88, 0x20, 0xE4, 0xF5, 0x9F, 0x64, 0x48, 0x51, 0xEF, 0x9D, 0x4D, 0xA6, 0x4C, 0xF6, 0x76, 0xD5, 
-0x33, 0x9A, 0x81, 0xCA, 0x54, 0x54, 0xC6, 0x72, 0xF6, 0xD4, 0xE9, 0x7B, 0xDF, 0xFB, 0xBD, 0xDF, 
-0xF5, 0x64, 0x8B, 0x66, 0x00, 0xA7, 0x4E, 0x6D, 0x3E, 0xA8, 0xAA, 0x6A, 0x0F, 0x44, 0xD7, 0x08, 
-0xA3, 0xD0, 0x76, 0x1D, 0x5D, 0x1B, 0xB8, 0x7E, 0xFD, 0x3A, 0x0F, 0x1F, 0x3E, 0x24, 0x46, 0xCF, 
-0x78, 0xDC, 0x70, 0xF9, 0xA9, 0x8B, 0x54, 0xB5, 0xCD, 0xD2, 0xAB, 0x6E, 0x37, 0x1D, 0x2A, 0xD7, 
-0x1F, 0x49, 0x39, 0x7A, 0xE8, 0x2B, 0x85, 0xC4, 0x84, 0xCB, 0xD3, 0xEB, 0x94, 0x5D, 0x2F, 0xCE, 
-0xBA, 0x96, 0x84, 0x61, 0xFB, 0xF4, 0x19, 0xCE, 0x9C, 0x3D, 0xAB, 0xC1, 0x21, 0x53, 0x5E, 0xF9, 
-0x4C, 0x1A, 0xF6, 0x66, 0xD6, 0x85, 0xBC, 0xEA, 0xA8, 0x58, 0xD5, 0x41, 0x4A, 0x43, 0x3D, 0x0A, 
-0x6A, 0xB2, 0xA3, 0x4C, 0xF5, 0xC6, 0xF5, 0xEB, 0x5C, 0x79, 0xF9, 0x45, 0x62, 0x3B, 0xA3, 0x12, 
-0xB5, 0x0B, 0x9C, 0x87, 0x28, 0x8F, 0x11, 0x8C, 0xC1, 0x58, 0xCB, 0xC6, 0x89, 0x6D, 0x2E, 0x3E, 
-0xF3, 0x14, 0xA3, 0xB5, 0xB5, 0xF9, 0x02, 0x59, 0x79, 0x4F, 0xCC, 0x26, 0x66, 0x92, 0xCD, 0xCC, 
-0x62, 0x08, 0xDC, 0xBA, 0x76, 0x83, 0xDB, 0x37, 0x6F, 0x10, 0x7D, 0xC8, 0x26, 0x44, 0x0B, 0xB5, 
-0xC9, 0xAF, 0x57, 0x94, 0xFC, 0xBF, 0xD1, 0xDF, 0x30, 0xB4, 0x40, 0xE8, 0x4B, 0x4A, 0x8F, 0x9B, 
-0xB7, 0x7E, 0x67, 0x3E, 0x0A, 0xFD, 0xE7, 0x06, 0x12, 0x21, 0xEF, 0x52, 0x3C, 0x71, 0xEA, 0x14, 
-0x97, 0x2E, 0x5F, 0x9E, 0xAB, 0x17, 0xCA, 0xE0, 0x1B, 0xF3, 0xAA, 0xFD, 0xD1, 0x58, 0xDE, 0xE7, 
-0x4F, 0x96, 0xFE, 0xCA, 0xBB, 0x24, 0xCF, 0x94, 0xBA, 0xB6, 0xE5, 0xC1, 0xBD, 0xFB, 0x5C, 0x79, 
-0xE1, 0x79, 0xA2, 0x6F, 0xE7, 0xBB, 0x1F, 0x05, 0x6D, 0xC3, 0xFD, 0xEB, 0xFB, 0xF9, 0x2C, 0x0B, 
-0x59, 0xA5, 0xFF, 0xAE, 0xC2, 0xE3, 0x96, 0xD7, 0x2A, 0x3C, 0xCE, 0x33, 0x16, 0xD7, 0x1E, 0xE4, 
-0x23, 0xE5, 0xDC, 0x81, 0xBA, 0x48, 0xEA, 0x45, 0x4F, 0xAD, 0x8C, 0x96, 0xCF, 0x4B, 0x8E, 0x40, 
-0x51, 0x9E, 0x9A, 0x92, 0x5A, 0x16, 0x89, 0xA9, 0xA9, 0xAA, 0x86, 0x14, 0x05, 0x1F, 0x3D, 0x5D, 
-0x9C, 0xB1, 0x3F, 0xD9, 0x7D, 0xF0, 0xCC, 0xC6, 0xC5, 0xD9, 0xFC, 0xE6, 0x01, 0x1E, 0xC9, 0x70, 
-0xB7, 0xD6, 0x4E, 0x5D, 0x9F, 0x75, 0xFB, 0x37, 0xAD, 0x71, 0xEA, 0xA7, 0x52, 0x2C, 0x82, 0xB0, 
-0xB3, 0x3F, 0xE1, 0xE6, 0xCD, 0x5B, 0x3C, 0x78, 0xA0, 0x6A, 0x85, 0xF1, 0xB8, 0xE1, 0xFC, 0xF9, 
-0x73, 0x8C, 0xC7, 0x15, 0xB5, 0xEB, 0x3F, 0xF6, 0x91, 0xAF, 0x58, 0x89, 0xE3, 0x34, 0xD0, 0xA3, 
-0x20, 0x79, 0x14, 0x0B, 0x21, 0x10, 0x25, 0xBB, 0x90, 0x33, 0xC2, 0x68, 0x6D, 0xCC, 0xC5, 0xA7, 
-0x2E, 0xB3, 0xB9, 0xBD, 0x45, 0x8C, 0x71, 0x61, 0x9B, 0xEA, 0x1C, 0xA3, 0xD1, 0x68, 0xEE, 0x90, 
-0x87, 0x15, 0x95, 0xF2, 0x38, 0x79, 0x4A, 0x21, 0x92, 0x7C, 0xA0, 0x9B, 0xB5, 0x5C, 0x79, 0xF1, 
-0x25, 0x6E, 0x5D, 0xBD, 0x8E, 0x04, 0xF5, 0xC0, 0x64, 0xCA, 0xEA, 0xB3, 0x4E, 0xD8, 0xC0, 0xA8, 
-0xA7, 0xA7, 0xAD, 0x93, 0x27, 0x38, 0x7B, 0xFE, 0xDC, 0xDC, 0xEE, 0x36, 0x44, 0xB5, 0xBD, 0xD5, 
-0x0B, 0xF3, 0x22, 0x1B, 0x82, 0x43, 0x98, 0xEE, 0xED, 0x73, 0xF3, 0xFA, 0x75, 0x1E, 0xDE, 0xBF, 
-0xAF, 0xAE, 0xEB, 0xCC, 0xC2, 0x37, 0xE9, 0x71, 0xF3, 0xF8, 0x7A, 0xE1, 0xB8, 0x9D, 0xE5, 0xB8, 
-0xD7, 0xFD, 0x7A, 0xC0, 0x71, 0x99, 0x6C, 0x41, 0xFF, 0xDB, 0x63, 0x56, 0x25, 0x50, 0x59, 0xAA, 
-0xA6, 0xE6, 0xC4, 0xD9, 0xD3, 0x9C, 0x3E, 0x7D, 0x5A, 0xEB, 0x37, 0xDB, 0xC1, 0xF6, 0x19, 0xED, 
-0x12, 0x73, 0x38, 0xE2, 0x9D, 0x29, 0x3F, 0x9B, 0x3C, 0x8B, 0xB3, 0x39, 0x44, 0x8E, 0x49, 0x30, 
-0xDB, 0x9F, 0x70, 0xFF, 0xF6, 0x1D, 0x6E, 0x5C, 0xB9, 0x4A, 0xEA, 0x74, 0x76, 0x58, 0xD6, 0x0C, 
-0x0A, 0x95, 0xE7, 0x7E, 0x25, 0xCE, 0xA0, 0x0A, 0xB4, 0x1C, 0x57, 0xAB, 0x35, 0xFA, 0x65, 0x3C, 
-0xFC, 0xBF, 0xD0, 0xE2, 0x9C, 0x3E, 0xA3, 0xEC, 0x9A, 0xED, 0x5F, 0x6F, 0x92, 0x2E, 0xAE, 0xA7, 
-0x18, 0x31, 0xD9, 0x61, 0x90, 0x33, 0x8E, 0xC6, 0x8D, 0x02, 0x62, 0x6E, 0xED, 0x8F, 0x0E, 0x77, 
-0x38, 0xFD, 0xC8, 0x92, 0xFB, 0xC8, 0x47, 0xBE, 0xE9, 0x4E, 0x63, 0xEC, 0xAD, 0x94, 0x02, 0xCD, 
-0xA8, 0x66, 0x16, 0xA7, 0x34, 0xF5, 0x98, 0x14, 0x85, 0xDB, 0xB7, 0xEE, 0xB3, 0xBF, 0xD7, 0x62, 
-0x8C, 0xEA, 0x0E, 0x2F, 0x5D, 0xBA, 0xC0, 0xC6, 0x66, 0xC3, 0x74, 0xB6, 0x3B, 0xCF, 0xA0, 0x36, 
-0xBA, 0x45, 0x65, 0xF5, 0x3F, 0xAC, 0x60, 0x55, 0x03, 0x59, 0x75, 0xDD, 0x2A, 0x0C, 0x1B, 0x75, 
-0xBF, 0xF0, 0x62, 0x8C, 0x88, 0xCB, 0xDB, 0x06, 0x31, 0x58, 0x57, 0xB3, 0x7D, 0xF2, 0x24, 0x67, 
-0xCF, 0xA9, 0xBF, 0xDB, 0xD6, 0x7B, 0x8C, 0xAD, 0x48, 0x62, 0x89, 0x11, 0xDA, 0xD6, 0x53, 0x5B, 
-0x5D, 0xA8, 0x2A, 0xCF, 0xEA, 0x43, 0x06, 0xCA, 0xF5, 0xF2, 0xEE, 0x55, 0x0D, 0xD0, 0x18, 0x43, 
-0x53, 0xD7, 0xB4, 0xFB, 0x13, 0x6E, 0x5D, 0xBB, 0x41, 0x37, 0x9B, 0x51, 0x1B, 0xAB, 0xEE, 0x12, 
-0x73, 0xFE, 0xAC, 0x73, 0x18, 0xE7, 0x98, 0xF8, 0x16, 0x9C, 0xE5, 0xD9, 0xB7, 0xBE, 0x99, 0xB5, 
-0xAD, 0x6D, 0x7C, 0x3F, 0xB4, 0x89, 0xAD, 0xE6, 0xF6, 0xB1, 0x16, 0xC1, 0x77, 0xEA, 0x1E, 0xEF, 
-0xE1, 0xDD, 0xFB, 0xDC, 0xBC, 0x7E, 0x83, 0x94, 0xCD, 0xCB, 0x42, 0x50, 0x29, 0x37, 0x16, 0x33, 
-0xA1, 0x01, 0xFA, 0xE5, 0x32, 0xFC, 0xAE, 0x55, 0xE8, 0x33, 0x8C, 0x55, 0xF5, 0x73, 0x5C, 0x0C, 
-0xDF, 0xB5, 0xEA, 0xFD, 0xC3, 0x63, 0xC3, 0xBC, 0xF6, 0xE9, 0xE0, 0xE2, 0xC6, 0xEA, 0xEF, 0x5A, 
-0x75, 0xEC, 0x30, 0x0C, 0xAF, 0x3D, 0xEC, 0x7B, 0x1F, 0xA7, 0x3C, 0x0E, 0xCB, 0x57, 0x41, 0x8C, 
-0x91, 0xAA, 0xD2, 0xCD, 0x04, 0xE5, 0x79, 0xA9, 0xE7, 0xCF, 0x36, 0x90, 0x40, 0x2C, 0x5B, 0x27, 
-0x4E, 0xF1, 0xF6, 0x77, 0xBC, 0x8B, 0xC9, 0xAC, 0xC5, 0xD8, 0x8A, 0xD6, 0x07, 0x5C, 0xD5, 0x20, 
-0xA6, 0x78, 0xBF, 0x32, 0x2A, 0xC5, 0x96, 0x08, 0x06, 0xD9, 0xA6, 0xBA, 0xAF, 0xBB, 0x4D, 0x29, 
-0x65, 0xDB, 0xF6, 0x45, 0x3B, 0x2D, 0xAE, 0x3A, 0xA7, 0x93, 0x3D, 0x2A, 0xA7, 0x61, 0xC4, 0xBF, 
-0xF4, 0x85, 0x2F, 0xE2, 0xDB, 0x0E, 0x27, 0x46, 0x85, 0x82, 0xCE, 0x63, 0x72, 0x7C, 0x3E, 0x82, 
-0xDA, 0xF2, 0xA6, 0x32, 0x2B, 0x3B, 0x04, 0x07, 0x66, 0xAC, 0x99, 0x4C, 0x61, 0xEE, 0x25, 0xA2, 
-0xF5, 0x23, 0xAE, 0x39, 0xA8, 0x13, 0x3E, 0x1E, 0xA9, 0xAD, 0x7D, 0xBF, 0x7E, 0xCA, 0xB9, 0x83, 
-0xF5, 0xB7, 0x54, 0xE7, 0x51, 0x16, 0x1B, 0x19, 0x24, 0x6A, 0x88, 0x2A, 0x8D, 0x30, 0x46, 0xCA, 
-0x8B, 0xEE, 0xD6, 0x5A, 0x2A, 0x53, 0xD1, 0x75, 0x9E, 0x14, 0x05, 0xEB, 0x6A, 0xA2, 0x6E, 0x44, 
-0xD0, 0xFB, 0x42, 0xF2, 0x16, 0xB9, 0xF9, 0xF4, 0xD3, 0x6E, 0x75, 0x27, 0x3C, 0x0E, 0xC3, 0xFD, 
-0xF0, 0x87, 0x3F, 0x34, 0x6D, 0xC6, 0xD5, 0xBD, 0x98, 0x66, 0x69, 0x6F, 0x72, 0x1F, 0xC1, 0x29, 
-0x03, 0x4B, 0x86, 0x4F, 0xFF, 0xEA, 0xE7, 0xB9, 0xF2, 0xF2, 0x4D, 0x36, 0x37, 0x4F, 0xD3, 0x34, 
-0xEB, 0x6C, 0x9D, 0x3C, 0x41, 0x33, 0xAA, 0x68, 0x1A, 0x5D, 0xF9, 0x4F, 0x31, 0xAF, 0xF0, 0x01, 
-0x14, 0xE7, 0x11, 0xD9, 0xA6, 0xEF, 0xB8, 0x58, 0xD5, 0x58, 0x8F, 0x03, 0x11, 0xB5, 0xB9, 0xB5, 
-0xD6, 0x62, 0xAC, 0x65, 0x7F, 0x36, 0xC5, 0x56, 0x4E, 0xFD, 0xDD, 0x9E, 0xD8, 0x56, 0x09, 0x32, 
-0x69, 0xC3, 0x1E, 0x76, 0xA0, 0x61, 0xC7, 0xED, 0xA3, 0x54, 0x98, 0xF4, 0x24, 0x80, 0x90, 0x77, 
-0xD6, 0xF5, 0x99, 0x81, 0x89, 0x89, 0x6E, 0xD6, 0x72, 0xFB, 0xDA, 0x0D, 0xF6, 0x1E, 0x3C, 0xC4, 
-0xC4, 0xAC, 0xE6, 0xC8, 0xDB, 0x7B, 0xF5, 0x06, 0x99, 0xFB, 0xBB, 0x3D, 0x7D, 0xEE, 0x2C, 0xEB, 
-0x9B, 0x9B, 0x44, 0xC0, 0x47, 0xED, 0x20, 0x92, 0x8D, 0xAB, 0x8D, 0xD1, 0xE0, 0x81, 0x29, 0xFB, 
-0x27, 0x9D, 0x4D, 0x26, 0xDC, 0xB8, 0x76, 0x8D, 0xFD, 0x87, 0x3B, 0xA4, 0xD6, 0x93, 0xA2, 0x2E, 
-0x7E, 0x94, 0x7C, 0x99, 0xEC, 0x79, 0xEC, 0xD5, 0xC2, 0xB0, 0x0C, 0x8E, 0x8B, 0xE1, 0x7D, 0xC3, 
-0xDF, 0xAB, 0x8E, 0x0D, 0x7F, 0x1F, 0x86, 0xD2, 0x59, 0x0A, 0x0D, 0x8F, 0x1F, 0x75, 0xED, 0xF0, 
-0x7C, 0x1F, 0x47, 0x9D, 0x3F, 0xEC, 0xF8, 0x93, 0xA2, 0xB4, 0x9B, 0xD2, 0x8E, 0x62, 0x4F, 0x5F, 
-0x5A, 0x36, 0xBF, 0x5C, 0x7E, 0xF6, 0x19, 0xD6, 0x37, 0x37, 0x10, 0x67, 0xC1, 0xAA, 0xEA, 0x69, 
-0xD8, 0x5E, 0x0B, 0x1E, 0x27, 0x77, 0x31, 0x46, 0x52, 0xD0, 0x8D, 0x3E, 0xB1, 0xF3, 0xDC, 0xB8, 
-0x76, 0x8D, 0xDD, 0xFB, 0x0F, 0x34, 0x9A, 0x43, 0x96, 0xE2, 0xFE, 0x59, 0x46, 0xBF, 0xAC, 0x59, 
-0xD1, 0x46, 0x86, 0x4C, 0xB9, 0x5F, 0xF7, 0x82, 0x65, 0x7F, 0x6F, 0x1F, 0x7A, 0xFE, 0x70, 0x2D, 
-0xC2, 0x2C, 0xED, 0xED, 0xBD, 0xE3, 0xAD, 0x6F, 0xFF, 0xB5, 0xEF, 0xFA, 0xAE, 0xEF, 0x52, 0xE3, 
-0xDC, 0x15, 0x78, 0x24, 0xC3, 0xDD, 0xDE, 0xEE, 0xBA, 0x18, 0xC3, 0x4B, 0x22, 0xD1, 0xAF, 0x8D, 
-0xD7, 0x49, 0x04, 0x8C, 0x71, 0xF8, 0x4E, 0x78, 0xF9, 0xCA, 0x1D, 0x9E, 0x7B, 0xFE, 0x1A, 0xA4, 
-0x86, 0x14, 0x1D, 0x97, 0x2E, 0x3E, 0xCD, 0x9B, 0xDF, 0xF4, 0x56, 0xF6, 0xA6, 0x93, 0x25, 0xC6, 
-0xD4, 0x97, 0x48, 0x14, 0xB2, 0x82, 0x0E, 0xC7, 0x51, 0x0D, 0x7D, 0xA9, 0x20, 0x7A, 0xFF, 0xFB, 
-0xC4, 0x7C, 0x8F, 0xB9, 0x88, 0x30, 0xEB, 0x5A, 0x46, 0x6B, 0x6B, 0x5C, 0x7C, 0xFA, 0x29, 0xEA, 
-0xF1, 0x88, 0x90, 0xB2, 0xF7, 0xFC, 0x9E, 0x0E, 0xB7, 0x3C, 0x43, 0x1E, 0xD1, 0xF1, 0xC8, 0x15, 
-0xD6, 0x97, 0x74, 0xCB, 0x77, 0x82, 0x32, 0xD6, 0x14, 0x22, 0x3B, 0xF7, 0xEE, 0x73, 0xF5, 0xC5, 
-0x17, 0x98, 0xEE, 0xEE, 0x50, 0x89, 0x3A, 0x92, 0x29, 0xD2, 0x68, 0xC2, 0x20, 0xB6, 0x62, 0x16, 
-0x3D, 0x6B, 0xDB, 0x9B, 0x5C, 0x7A, 0xE6, 0x29, 0xC6, 0xEB, 0x1B, 0x3D, 0xAB, 0x04, 0x48, 0x46, 
-0x1D, 0x96, 0x14, 0xDF, 0xA4, 0xA2, 0xB2, 0x0C, 0x77, 0x6E, 0xDC, 0xE2, 0xCE, 0xF5, 0x9B, 0x74, 
-0x33, 0xDD, 0x50, 0x51, 0xB6, 0x80, 0x96, 0x48, 0x0E, 0x87, 0x75, 0xC8, 0xD7, 0x13, 0x47, 0x95, 
-0x1D, 0x87, 0x94, 0xEF, 0xF0, 0xF7, 0x51, 0x18, 0x5E, 0x5B, 0x9E, 0x77, 0x14, 0x0D, 0xAF, 0x7F, 
-0x12, 0x0C, 0xEF, 0x1B, 0x6E, 0x20, 0x29, 0xF4, 0x28, 0x98, 0x6C, 0x7F, 0x4D, 0x7E, 0x66, 0x5F, 
-0xF2, 0xC2, 0x08, 0x21, 0x46, 0xB6, 0x4E, 0x6C, 0xF3, 0xCC, 0x9B, 0x9E, 0xD5, 0xF6, 0x1A, 0x35, 
-0xFA, 0x88, 0xF4, 0x6C, 0x74, 0x0B, 0x86, 0x79, 0x02, 0x6D, 0xFB, 0x47, 0x75, 0xEF, 0x52, 0x26, 
-0xA3, 0xAA, 0xE6, 0xC1, 0x83, 0x07, 0xBC, 0xFC, 0xE2, 0x0B, 0x4C, 0xF6, 0x76, 0xE7, 0x61, 0x98, 
-0x86, 0xD2, 0xE7, 0xF0, 0xDE, 0x37, 0x1A, 0x87, 0xD5, 0x6B, 0x1F, 0xCB, 0x9B, 0x25, 0x16, 0x92, 
-0xEE, 0xF2, 0x45, 0xC5, 0xD6, 0xB6, 0x77, 0x68, 0x2E, 0xC5, 0x0B, 0xC6, 0x58, 0xAC, 0x55, 0x67, 
-0x56, 0x31, 0x80, 0xF7, 0x1A, 0xE5, 0xC1, 0xBA, 0x4A, 0xFB, 0xBF, 0xD1, 0x01, 0xB3, 0x8D, 0xD3, 
-0xB4, 0x35, 0xDE, 0xBC, 0x79, 0xF2, 0xEC, 0xF6, 0x17, 0x0F, 0xDB, 0xD6, 0xCB, 0x91, 0x35, 0x92, 
-0xF1, 0x91, 0x8F, 0x7C, 0xA4, 0x7D, 0xE7, 0x3B, 0xDF, 0xFA, 0x33, 0x29, 0x4D, 0x77, 0xA7, 0xD3, 
-0x3D, 0x9C, 0x71, 0xCC, 0x3A, 0x4F, 0x5D, 0x6F, 0xF2, 0xF2, 0x4B, 0x77, 0xF8, 0x6B, 0xFF, 0xF5, 
-0xDF, 0xE4, 0x6F, 0xFC, 0xCD, 0xFF, 0x99, 0x2F, 0x7D, 0xF9, 0x2A, 0xEB, 0x1B, 0xA7, 0xF8, 0xFA, 
-0x6F, 0xF8, 0x26, 0x46, 0xCD, 0x78, 0x5E, 0xE1, 0x29, 0x65, 0x51, 0x3D, 0x1B, 0x10, 0x0F, 0x15, 
-0xF8, 0xAF, 0x25, 0x42, 0xD4, 0x55, 0xFE, 0x2E, 0x06, 0x9A, 0xF1, 0x88, 0x73, 0x17, 0xCE, 0xB3, 
-0xB6, 0xB1, 0x8E, 0x2F, 0x96, 0x09, 0x83, 0x9D, 0x2D, 0x26, 0x33, 0xB5, 0x61, 0x25, 0x0E, 0x7F, 
-0x93, 0xA5, 0x93, 0xD2, 0x41, 0x8A, 0x64, 0x9B, 0xB2, 0xCE, 0x58, 0x12, 0xE0, 0x03, 0xD7, 0x5F, 
-0x78, 0x59, 0x63, 0x8A, 0x95, 0xE8, 0xA3, 0xBD, 0xCA, 0x2C, 0x96, 0x11, 0xCD, 0x68, 0xC4, 0xC5, 
-0xCB, 0x4F, 0x73, 0xEA, 0xCC, 0x39, 0x62, 0x36, 0x27, 0x93, 0xBC, 0xAD, 0xB6, 0x30, 0xF5, 0x10, 
-0x82, 0xEE, 0x67, 0xB7, 0x8E, 0xE9, 0xFE, 0x3E, 0x57, 0x5E, 0x7C, 0x89, 0xFD, 0xBD, 0xBD, 0xF9, 
-0x7E, 0x7B, 0x63, 0x74, 0x0A, 0x38, 0x67, 0xD4, 0xAF, 0x12, 0xC3, 0x7D, 0x54, 0x83, 0x7E, 0x1C, 
-0x1C, 0xF5, 0x9C, 0x27, 0x7D, 0xCF, 0x93, 0xDE, 0x57, 0x70, 0x9C, 0x4E, 0xBB, 0x0A, 0x8F, 0x7B, 
-0xFD, 0x2A, 0xCC, 0x07, 0xE7, 0x9E, 0x83, 0x9A, 0x22, 0xE9, 0x02, 0x54, 0xA3, 0x46, 0xFD, 0xDD, 
-0x6E, 0x6D, 0x92, 0x80, 0x36, 0xF8, 0xB9, 0x4E, 0xFF, 0xD5, 0x78, 0x3F, 0x39, 0x0F, 0x6D, 0xDB, 
-0x72, 0xED, 0xCA, 0x55, 0xEE, 0xDC, 0xBA, 0x35, 0x6F, 0x4F, 0xFD, 0xAD, 0xEB, 0x7D, 0x3C, 0x49, 
-0x59, 0xBD, 0x11, 0x08, 0x8F, 0x5C, 0x48, 0x5C, 0x78, 0xE8, 0x2B, 0xE8, 0x7F, 0x9B, 0x60, 0x21, 
-0xE5, 0xF8, 0x67, 0x99, 0x62, 0x30, 0x74, 0x5D, 0x60, 0x36, 0x6B, 0x99, 0xCD, 0x54, 0x2D, 0x18, 
-0x7D, 0x60, 0xDA, 0x4D, 0x49, 0x74, 0x18, 0xE8, 0x9A, 0x71, 0xF5, 0x4B, 0x97, 0x4F, 0x5D, 0xB8, 
-0xDE, 0x7B, 0xCD, 0x01, 0x3C, 0x92, 0xE1, 0x8A, 0x48, 0x7C, 0xF7, 0xBB, 0xDF, 0xFD, 0x99, 0xF5, 
-0xB5, 0xE6, 0xF3, 0x31, 0xED, 0x05, 0x31, 0x09, 0x63, 0x1C, 0xFB, 0x53, 0x4F, 0x55, 0x6D, 0xF3, 
-0xA9, 0x4F, 0xBD, 0xC0, 0x7F, 0xF0, 0x7F, 0xFF, 0x4F, 0xF8, 0x8F, 0xFE, 0xC4, 0x9F, 0xE3, 0x1F, 
-0xFE, 0x83, 0x5F, 0xA1, 0x72, 0x9B, 0x88, 0xE9, 0xF9, 0x9F, 0xCC, 0xA2, 0x7B, 0xEC, 0xB9, 0x72, 
-0x5C, 0xBD, 0x7D, 0x77, 0xF1, 0x71, 0xAB, 0xB2, 0x75, 0x54, 0x45, 0xAF, 0x6A, 0x08, 0xB6, 0x44, 
-0xE8, 0x34, 0x42, 0x48, 0x91, 0x73, 0x17, 0x2E, 0xF0, 0xEC, 0x5B, 0xDE, 0x8C, 0x38, 0xF5, 0xEB, 
-0x50, 0xB6, 0xCC, 0x0E, 0xEF, 0x9B, 0x8F, 0xEA, 0x47, 0xBC, 0x8F, 0x5C, 0x61, 0x85, 0xE9, 0x16, 
-0x66, 0x5B, 0x18, 0xA4, 0xB5, 0x16, 0x3F, 0x99, 0x71, 0xED, 0xA5, 0x17, 0xE9, 0x26, 0x33, 0xC6, 
-0x55, 0x4D, 0xF2, 0xBA, 0xDD, 0x36, 0xA5, 0x94, 0x23, 0xEE, 0xC2, 0x7E, 0x37, 0x63, 0xB4, 0xB1, 
-0xC9, 0xB9, 0x4B, 0x17, 0x18, 0xAD, 0x8D, 0x09, 0x49, 0xEF, 0x8F, 0xF9, 0x9B, 0x62, 0x66, 0xB2, 
-0x31, 0x9B, 0x8E, 0x59, 0x31, 0xDC, 0xBD, 0x7D, 0x87, 0x1B, 0xD7, 0xAF, 0x33, 0x9B, 0x4C, 0x21, 
-0xFB, 0xBB, 0x8D, 0xBE, 0xB7, 0xBF, 0xBD, 0x17, 0x96, 0xE4, 0x95, 0xE0, 0x51, 0xDF, 0xFF, 0x38, 
-0x18, 0x3E, 0x6B, 0xDE, 0xB0, 0x57, 0xD4, 0x5B, 0x39, 0xF6, 0x28, 0xA2, 0xA7, 0xDE, 0x79, 0x14, 
-0x8E, 0x73, 0xDD, 0xF0, 0xF9, 0x0B, 0xC9, 0xE8, 0xB5, 0x41, 0xEA, 0xCD, 0x8A, 0xCA, 0xD4, 0xB6, 
-0xB4, 0x29, 0xEF, 0x3D, 0xA7, 0x4E, 0x9D, 0xE2, 0x99, 0x37, 0x3D, 0x3B, 0xF7, 0x61, 0x6B, 0x2B, 
-0x87, 0x38, 0x1D, 0x5C, 0xC5, 0xE6, 0xE0, 0xA6, 0x2B, 0x20, 0x99, 0x8E, 0x82, 0xE4, 0xC1, 0xB9, 
-0xAA, 0xD4, 0x3E, 0xFC, 0xCA, 0x4B, 0x2F, 0x33, 0xD9, 0xDB, 0xD7, 0x41, 0xDB, 0x77, 0xEA, 0x7B, 
-0xA4, 0x58, 0x0B, 0x65, 0xFB, 0xF8, 0xE2, 0xB1, 0xEB, 0x50, 0x2A, 0x76, 0xF4, 0x8F, 0x61, 0x4F, 
-0xFF, 0x5A, 0xA1, 0xB4, 0x8F, 0xBE, 0x3F, 0xBF, 0x61, 0x7D, 0xCE, 0xEB, 0xB9, 0xCC, 0x6C, 0x93, 
-0x6A, 0xB9, 0x55, 0x03, 0x6E, 0xB1, 0xB6, 0x81, 0x54, 0x13, 0xBC, 0xD0, 0xCE, 0x22, 0xD3, 0xA9, 
-0x67, 0xB2, 0xDF, 0x32, 0x9B, 0x06, 0x7C, 0xEB, 0xF1, 0x3E, 0x00, 0x2A, 0x48, 0x41, 0xA2, 0xAE, 
-0x65, 0x07, 0xF1, 0xFF, 0xCB, 0x77, 0x7E, 0xEC, 0x3D, 0x87, 0x9A, 0x84, 0xB1, 0x92, 0xB3, 0xAD, 
-0xC0, 0x6F, 0xFE, 0xCD, 0x97, 0xEE, 0x54, 0x35, 0xFF, 0x83, 0x15, 0xB3, 0x1B, 0xA3, 0x47, 0xA8, 
-0x58, 0xAB, 0x4F, 0xE0, 0xDB, 0x0A, 0x49, 0x1B, 0x7C, 0xFE, 0xF3, 0x57, 0xF8, 0x89, 0x9F, 0xF8, 
-0xBB, 0xFC, 0x47, 0x7F, 0xF2, 0x3F, 0xE5, 0xC7, 0x7E, 0xFC, 0xAF, 0x21, 0xD4, 0xBD, 0x5D, 0x19, 
-0x3D, 0x26, 0x9A, 0x95, 0xFA, 0x5A, 0x20, 0xC7, 0x7A, 0xF5, 0x12, 0xFA, 0x9D, 0xED, 0x51, 0x30, 
-0x46, 0xE3, 0x7E, 0xF9, 0xA8, 0x2E, 0x18, 0x2F, 0x5F, 0xBE, 0xCC, 0xF9, 0x0B, 0x17, 0x48, 0x92, 
-0xB7, 0xFD, 0x66, 0x66, 0xBB, 0xD4, 0x70, 0x8B, 0x1A, 0x24, 0x9B, 0x5E, 0x1D, 0x05, 0x3B, 0xD0, 
-0xA5, 0xF5, 0x99, 0x6D, 0x0C, 0x1D, 0xF7, 0xEF, 0xDE, 0xE3, 0xE1, 0xDD, 0x7B, 0x48, 0x4C, 0xD4, 
-0x62, 0x49, 0x3E, 0xA8, 0xA1, 0xB9, 0xA8, 0x27, 0xB0, 0x98, 0xE3, 0x7C, 0x6E, 0x9E, 0x3A, 0xC1, 
-0xC6, 0x89, 0xED, 0xB9, 0x6B, 0xC8, 0xE2, 0x09, 0xAC, 0x3C, 0xDB, 0xE4, 0x80, 0x7D, 0x16, 0x61, 
-0x6F, 0x6F, 0x8F, 0x5B, 0x37, 0x6E, 0x32, 0xDB, 0x9F, 0xE0, 0xC4, 0x50, 0x59, 0x4B, 0xCA, 0xC1, 
-0x21, 0xC9, 0xCD, 0x2B, 0xBE, 0x8A, 0x12, 0xEE, 0x51, 0x18, 0x32, 0xA8, 0x21, 0xF5, 0xAF, 0x19, 
-0xDE, 0x53, 0xFE, 0xEF, 0x63, 0x78, 0xED, 0x71, 0xF0, 0x24, 0xF7, 0x14, 0x0C, 0xF3, 0x3A, 0xC4, 
-0x61, 0xC7, 0x5F, 0x2D, 0x78, 0xEF, 0x91, 0x9E, 0x1A, 0xAA, 0x0C, 0xDA, 0xDE, 0x7B, 0x9C, 0x73, 
-0x5C, 0xB8, 0x74, 0x91, 0x13, 0xA7, 0x4E, 0xCE, 0xAF, 0xB3, 0x4E, 0xFD, 0x2A, 0xA7, 0xBC, 0xF1, 
-0x41, 0xF2, 0x2C, 0xE8, 0x51, 0xF9, 0x1C, 0xB6, 0x85, 0x7E, 0xF9, 0xC7, 0x18, 0xB9, 0x73, 0xE7, 
-0x0E, 0xF7, 0xEF, 0xDF, 0x5F, 0xB4, 0xFB, 0xEC, 0xB3, 0xF9, 0x38, 0x6A, 0x91, 0x37, 0x12, 0x65, 
-0x10, 0x1D, 0x7E, 0x9F, 0xE2, 0xD1, 0x0C, 0x3F, 0xCD, 0x85, 0xBF, 0x65, 0x75, 0xA2, 0x9E, 0x53, 
-0xEE, 0xEC, 0xBB, 0xC4, 0x64, 0xDF, 0xB3, 0xBF, 0x37, 0x63, 0x7F, 0x6F, 0x46, 0xDB, 0x46, 0x42, 
-0x5E, 0x24, 0x6B, 0x2A, 0x5D, 0xA7, 0x1A, 0xAF, 0x55, 0x84, 0x38, 0x8B, 0x7B, 0xED, 0xBD, 0xCF, 
-0x7F, 0xF0, 0xBD, 0xEF, 0xFA, 0xB9, 0x8F, 0x7D, 0xEC, 0x63, 0x87, 0x2E, 0x98, 0x71, 0x5C, 0xAE, 
-0xF7, 0x6F, 0xFC, 0x1B, 0xFF, 0x46, 0xF7, 0x81, 0x0F, 0xBC, 0xFF, 0xAF, 0xD7, 0x8D, 0xFB, 0x07, 
-0x22, 0xF8, 0x2E, 0xCC, 0x52, 0xF0, 0x86, 0x18, 0x2A, 0x0C, 0xEB, 0x08, 0x6B, 0xEC, 0xEF, 0x26, 
-0x3E, 0xF3, 0xE9, 0x2F, 0xF3, 0x4F, 0x7F, 0xE1, 0xD7, 0xB8, 0x71, 0xE3, 0x0E, 0xB3, 0x59, 0x47, 
-0x68, 0x3B, 0x62, 0xA7, 0x8E, 0xB7, 0x25, 0xE6, 0x11, 0xA4, 0x04, 0x33, 0x4C, 0x2C, 0x76, 0xC3, 
-0x24, 0x5D, 0x14, 0x3A, 0xAE, 0x0E, 0xEC, 0x51, 0x8D, 0x8C, 0xCC, 0x00, 0x0B, 0xB6, 0x4F, 0x9E, 
-0xE4, 0xDC, 0x85, 0xF3, 0x34, 0x8D, 0xDA, 0xCC, 0x69, 0xE4, 0x53, 0x9D, 0x7A, 0x0C, 0x2B, 0xEE, 
-0xB0, 0x77, 0xF7, 0x3B, 0xE8, 0xB0, 0xA3, 0x48, 0x1E, 0x29, 0x5D, 0x96, 0xAA, 0xEF, 0xDE, 0xBD, 
-0xCB, 0x4B, 0x2F, 0xBC, 0x40, 0xE8, 0xF2, 0x82, 0x16, 0x50, 0xF5, 0xAC, 0x1F, 0x4A, 0xBA, 0xB1, 
-0xBD, 0xC5, 0x85, 0x4B, 0x17, 0xB3, 0x4E, 0xB9, 0xB8, 0x5D, 0xD4, 0x6F, 0x0B, 0x21, 0x50, 0x55, 
-0xEA, 0x66, 0xAE, 0x30, 0xF7, 0x6B, 0x57, 0xAE, 0x70, 0xEB, 0xFA, 0x0D, 0x44, 0x44, 0x1D, 0xA7, 
-0x57, 0xEA, 0x7F, 0xB8, 0xE4, 0x27, 0xB1, 0xD0, 0xFF, 0xBE, 0x96, 0x38, 0x4E, 0xF9, 0x1F, 0xE7, 
-0x9A, 0x82, 0x55, 0xD7, 0x0E, 0xCB, 0x7B, 0x48, 0x8F, 0xBA, 0xF6, 0x49, 0xCE, 0x0F, 0x21, 0xAF, 
-0x93, 0xA4, 0x4B, 0x1E, 0xC0, 0x4B, 0x9B, 0x3D, 0x7D, 0xFA, 0x34, 0xCF, 0x3C, 0xF3, 0x8C, 0x0A, 
-0x03, 0x39, 0x0F, 0xE4, 0x36, 0x2D, 0x3D, 0xA9, 0xEC, 0x28, 0xCC, 0x75, 0xAF, 0x2B, 0x74, 0x94, 
-0x05, 0xF7, 0xEE, 0xDE, 0xE5, 0xCA, 0x8B, 0x2F, 0x31, 0x9B, 0x4C, 0xA8, 0x9D, 0xFA, 0x67, 0x30, 
-0xBD, 0x48, 0x13, 0x05, 0xAB, 0xCA, 0xA6, 0x6F, 0x97, 0xDC, 0xC7, 0x2A, 0x9D, 0xEF, 0xEB, 0x85, 
-0xC3, 0xEA, 0x77, 0x15, 0x56, 0x95, 0x61, 0xCC, 0x7E, 0x56, 0xBA, 0xAE, 0x63, 0x36, 0x0B, 0x4C, 
-0x27, 0x9E, 0xE9, 0xC4, 0xD3, 0xCE, 0x00, 0x2F, 0x48, 0x14, 0xB5, 0xA1, 0x28, 0xDB, 0xF1, 0x99, 
-0xD1, 0x75, 0x6D, 0x04, 0x7F, 0xFD, 0xE9, 0x4B, 0x97, 0xFE, 0xCA, 0xEF, 0xF8, 0xBE, 0xDF, 0xF9, 
-0xB9, 0xE1, 0x33, 0x87, 0x58, 0x5D, 0x13, 0x2B, 0xF0, 0x43, 0x3F, 0xF4, 0xFB, 0xBF, 0xF8, 0xAE, 
-0x77, 0x3F, 0xFB, 0xE7, 0x7C, 0xB8, 0xF7, 0xA9, 0x71, 0x65, 0x67, 0x6D, 0x9C, 0x50, 0xB9, 0x8A, 
-0x59, 0x17, 0x69, 0xEC, 0x09, 0x2A, 0xBB, 0x45, 0xDB, 0x5A, 0x8C, 0x34, 0xC4, 0x20, 0x4C, 0xF6, 
-0x26, 0x4C, 0xF7, 0xA7, 0xCC, 0x66, 0x2D, 0x5D, 0x17, 0x88, 0x31, 0x3B, 0x05, 0x8E, 0x86, 0x90, 
-0x2C, 0x91, 0xBE, 0x8E, 0xA4, 0x40, 0xBD, 0xFA, 0x44, 0x89, 0x3D, 0xA7, 0x8D, 0xEA, 0x12, 0x71, 
-0x48, 0xAB, 0x0B, 0x55, 0x9F, 0x57, 0xF4, 0xC4, 0xD6, 0x5A, 0xDD, 0xBD, 0x75, 0xE6, 0x34, 0x9B, 
-0x27, 0xB6, 0xF1, 0x92, 0x88, 0x56, 0x43, 0xA2, 0xF7, 0x99, 0x5F, 0xFF, 0xFF, 0xD2, 0x90, 0x74, 
-0x42, 0xB5, 0xA8, 0x94, 0xE1, 0xDB, 0x62, 0xD4, 0xBC, 0xBA, 0x2C, 0x79, 0x98, 0xA4, 0x2E, 0xF5, 
-0x52, 0xEB, 0xB9, 0x77, 0xEB, 0x36, 0x37, 0xAF, 0x5E, 0xA1, 0x2E, 0x31, 0xCC, 0x92, 0xEE, 0x16, 
-0x2A, 0x7A, 0xE3, 0x2E, 0x78, 0xA2, 0x15, 0x4E, 0x9E, 0x3E, 0xC5, 0xB9, 0x0B, 0x17, 0xA8, 0xAA, 
-0x4A, 0x63, 0x95, 0x65, 0x09, 0xC7, 0x18, 0x43, 0x0C, 0x50, 0x5B, 0xA7, 0x7E, 0x45, 0x8D, 0x45, 
-0x42, 0xE4, 0xC6, 0x95, 0x6B, 0x3C, 0xB8, 0x7F, 0x1F, 0x67, 0x55, 0x7F, 0x14, 0xA3, 0xD7, 0x4E, 
-0x2A, 0xAA, 0xAB, 0x66, 0xDE, 0xE8, 0x8E, 0x5D, 0xAD, 0x8F, 0x8D, 0xD5, 0xE5, 0xFE, 0x68, 0xE8, 
-0x7D, 0x69, 0x4E, 0xA5, 0x6E, 0xAD, 0x80, 0x99, 0x1F, 0x5F, 0x5C, 0x5B, 0xCE, 0x43, 0x61, 0x78, 
-0x65, 0x96, 0xE4, 0x30, 0xC9, 0x61, 0xA9, 0x90, 0x42, 0x79, 0xDF, 0xFB, 0x62, 0x20, 0x3F, 0xC8, 
-0x64, 0xFB, 0xE7, 0x16, 0x83, 0xAA, 0xBE, 0x37, 0x89, 0x12, 0x86, 0xC5, 0xFF, 0xBD, 0xBC, 0xBC, 
-0x52, 0xAC, 0x62, 0x4C, 0xCE, 0xE6, 0xC9, 0x68, 0x96, 0xB2, 0x44, 0x84, 0x80, 0x60, 0xEA, 0x86, 
-0x93, 0xE7, 0xCF, 0x73, 0xFA, 0xFC, 0x39, 0x3A, 0xEF, 0x71, 0x4D, 0x0D, 0xA5, 0xBD, 0xE5, 0x2D, 
-0xF4, 0x36, 0xCF, 0x82, 0x4C, 0x0E, 0xD8, 0x38, 0xC4, 0x90, 0x99, 0xF4, 0x07, 0x0C, 0x93, 0x72, 
-0x44, 0x03, 0x1F, 0xB8, 0x7D, 0xFD, 0x1A, 0x57, 0x5E, 0x78, 0x09, 0x3F, 0x51, 0xA7, 0x35, 0x92, 
-0xF2, 0xCC, 0x30, 0xDB, 0xAE, 0xA7, 0xDE, 0x06, 0x89, 0xE3, 0xE2, 0xD5, 0x1D, 0xA0, 0x56, 0x4B, 
-0xAA, 0xB1, 0x17, 0x3A, 0x28, 0xA2, 0xEA, 0x95, 0x38, 0xE7, 0x23, 0x2A, 0xC0, 0x29, 0x72, 0x46, 
-0x8A, 0xC9, 0x5C, 0x4F, 0xB0, 0xB3, 0x79, 0xD6, 0x68, 0x25, 0xFB, 0xF9, 0x4E, 0x86, 0xE4, 0x0D, 
-0x5D, 0x17, 0x99, 0xB6, 0x89, 0xD9, 0x5E, 0x4B, 0x3B, 0xE9, 0x88, 0xAD, 0x47, 0x22, 0x58, 0xE3, 
-0xB2, 0xDF, 0x5D, 0xC1, 0xA4, 0x44, 0xDB, 0x4D, 0x18, 0xD5, 0x55, 0x6C, 0xBB, 0x9D, 0xAB, 0x5B, 
-0xDB, 0xCD, 0x5F, 0xFA, 0xC1, 0xEF, 0xFF, 0x9D, 0x9F, 0xF8, 0xA3, 0x7F, 0xF4, 0xF7, 0x4C, 0x4A, 
-0x1E, 0x0F, 0xC3, 0xB1, 0x57, 0xB0, 0x7E, 0xFC, 0xC7, 0x7F, 0x3C, 0xFE, 0xE4, 0x4F, 0xFE, 0x7F, 
-0x5F, 0xF8, 0xC5, 0x5F, 0xFC, 0xD5, 0x5F, 0xBE, 0x73, 0xFB, 0xBA, 0x4D, 0x21, 0x5D, 0xF4, 0xB1, 
-0x1B, 0x5B, 0x19, 0x49, 0x4A, 0x46, 0x42, 0x10, 0x9A, 0x6A, 0x44, 0xD7, 0x7A, 0x9C, 0xE8, 0x54, 
-0x37, 0x44, 0xB5, 0x5F, 0x0B, 0x31, 0xD2, 0x85, 0x48, 0xC0, 0x60, 0x6C, 0x83, 0xD8, 0x6C, 0xBF, 
-0x96, 0xD4, 0x61, 0xB9, 0x24, 0x65, 0x1A, 0x81, 0xA8, 0x8D, 0x5D, 0x50, 0x0F, 0x98, 0x51, 0x17, 
-0xA0, 0x6C, 0x02, 0x9B, 0xD5, 0x13, 0xD9, 0x86, 0x00, 0x41, 0x48, 0x08, 0x21, 0x26, 0x8C, 0xB1, 
-0x38, 0x57, 0xA9, 0x13, 0xEF, 0x90, 0x47, 0x20, 0x31, 0x84, 0x18, 0x38, 0x7D, 0xF6, 0x0C, 0x6F, 
-0x79, 0xE7, 0xDB, 0xD9, 0x38, 0x75, 0x82, 0x60, 0x85, 0x98, 0x75, 0xB7, 0x65, 0x3A, 0x66, 0x92, 
-0x3E, 0xD5, 0x62, 0x41, 0x8C, 0x6E, 0x38, 0x51, 0x25, 0xAE, 0x7A, 0x80, 0xE8, 0xB5, 0x5D, 0x11, 
-0x7D, 0x3B, 0xA8, 0x6E, 0x18, 0x23, 0x84, 0xE0, 0xF1, 0xC1, 0xD3, 0x38, 0x87, 0x01, 0x66, 0xBB, 
-0xBB, 0x7C, 0xE6, 0x97, 0x3E, 0xC5, 0xFD, 0x1B, 0xB7, 0x58, 0xAF, 0x47, 0xBA, 0x01, 0x22, 0x25, 
-0xB0, 0x10, 0x88, 0xE0, 0x0C, 0xAD, 0x44, 0xAA, 0xF5, 0x31, 0xEF, 0x7A, 0xFF, 0x7B, 0x38, 0x7D, 
-0xEE, 0x2C, 0x3E, 0x25, 0x8C, 0x75, 0xC4, 0x94, 0xB0, 0xD6, 0x11, 0xA3, 0x86, 0x9E, 0x9F, 0x4D, 
-0x27, 0xAC, 0x8D, 0x46, 0xA4, 0xB6, 0xE3, 0xCA, 0x0B, 0x2F, 0xF0, 0xD2, 0x17, 0xBF, 0x84, 0x9F, 
-0x4C, 0x71, 0xB9, 0x1C, 0x04, 0xCD, 0x27, 0x73, 0x2B, 0x0B, 0xC1, 0x88, 0x5A, 0x31, 0x4A, 0x76, 
-0xFD, 0x58, 0xE8, 0xB1, 0x91, 0x4A, 0x58, 0x93, 0x52, 0xE2, 0x0B, 0x2B, 0x09, 0x41, 0x17, 0xFC, 
-0x0A, 0x56, 0x3E, 0xDF, 0xF4, 0x6E, 0xCA, 0x24, 0x12, 0x41, 0x0A, 0xA3, 0x2D, 0x35, 0x98, 0xF4, 
-0x5D, 0x02, 0xA9, 0x67, 0x66, 0x63, 0x52, 0x24, 0xC5, 0xA0, 0x5D, 0xCE, 0x56, 0x18, 0xA9, 0x49, 
-0xD1, 0x92, 0x5A, 0x21, 0xB4, 0x06, 0xDF, 0x42, 0x0C, 0xCA, 0x96, 0x45, 0x2C, 0x46, 0x34, 0x90, 
-0xB6, 0x8D, 0x11, 0xC9, 0x91, 0x8D, 0x63, 0x4A, 0xA4, 0x14, 0x55, 0x3F, 0x27, 0x92, 0xC7, 0xA4, 
-0xBC, 0xA3, 0x48, 0x50, 0x7F, 0x00, 0x26, 0x11, 0x25, 0x91, 0x8C, 0xFA, 0x66, 0xC5, 0xE4, 0x6B, 
-0x8B, 0xAD, 0x68, 0x69, 0x6D, 0x87, 0x95, 0xA3, 0xA8, 0x37, 0xB7, 0xC2, 0x68, 0x16, 0x94, 0x23, 
-0x87, 0x88, 0xA8, 0x76, 0x4A, 0x74, 0xA1, 0x76, 0x5E, 0x1C, 0x09, 0x4C, 0x54, 0x3B, 0xEB, 0xB6, 
-0xED, 0x30, 0x75, 0x45, 0x10, 0xC3, 0xD6, 0xD9, 0x33, 0xBC, 0xE3, 0x7D, 0xEF, 0x65, 0xB4, 0xB5, 
-0x01, 0x95, 0x25, 0x65, 0xD5, 0x93, 0xE4, 0x1D, 0x61, 0x31, 0xCF, 0x98, 0x16, 0x83, 0x86, 0x22, 
-0x25, 0xBD, 0x4E, 0x5B, 0x81, 0x06, 0xA1, 0x9C, 0xCD, 0x66, 0x54, 0x4D, 0x45, 0x88, 0x81, 0x36, 
-0x74, 0x54, 0x75, 0xA5, 0x65, 0x1F, 0x13, 0xDD, 0xCE, 0x1E, 0x9F, 0xF9, 0xA5, 0x5F, 0x62, 0xFA, 
-0xE0, 0x21, 0x2E, 0x26, 0x4C, 0x36, 0x59, 0x6C, 0x3B, 0x5D, 0x81, 0x8F, 0x09, 0x5D, 0x0B, 0x90, 
-0x15, 0x15, 0x99, 0x5B, 0x5F, 0x69, 0x19, 0x29, 0x69, 0xDD, 0x69, 0xFD, 0xA9, 0x25, 0x6D, 0x3F, 
-0x5F, 0x7D, 0xAC, 0x2C, 0xC3, 0x95, 0x88, 0x80, 0xD6, 0x93, 0x90, 0xE6, 0x6D, 0x23, 0xA2, 0xE5, 
-0x1A, 0x73, 0x18, 0xF5, 0xE2, 0xBB, 0xD6, 0x14, 0x5F, 0xCE, 0xC9, 0x80, 0x40, 0x24, 0xE4, 0x7A, 
-0xAB, 0x34, 0x4F, 0xC9, 0x62, 0x92, 0x51, 0xD3, 0xCC, 0xFC, 0x7C, 0x43, 0xAE, 0x17, 0x0F, 0xB1, 
-0x4D, 0xCC, 0x66, 0x91, 0xFD, 0x19, 0x74, 0x53, 0x2D, 0xE3, 0x14, 0x3D, 0xD6, 0x54, 0x90, 0x04, 
-0x67, 0x1C, 0xA9, 0xEB, 0xA8, 0xAC, 0x21, 0x85, 0x49, 0x22, 0x4D, 0x26, 0x31, 0x4D, 0x7F, 0xE1, 
-0xCC, 0xD9, 0x8D, 0x3F, 0xFB, 0xFB, 0x7E, 0xDF, 0x0F, 0xFE, 0xF8, 0x9F, 0xFE, 0x73, 0xFF, 0xFE, 
-0xDD, 0xE1, 0x17, 0xAC, 0xC2, 0xB1, 0x19, 0x2E, 0xC0, 0x8F, 0xFE, 0xE8, 0x8F, 0xC6, 0x2B, 0x57, 
-0x3E, 0xFB, 0xF2, 0x9D, 0x7B, 0x7B, 0xFF, 0xE0, 0x73, 0x9F, 0xFD, 0xEC, 0xB5, 0x18, 0xC3, 0xA9, 
-0x59, 0x98, 0x9D, 0x74, 0xD6, 0xD5, 0x5D, 0x9A, 0x4A, 0x5D, 0x55, 0x80, 0x27, 0x04, 0xD5, 0x3B, 
-0x69, 0xB4, 0x36, 0xAD, 0x88, 0x98, 0xD4, 0xB8, 0x38, 0x24, 0x48, 0x3E, 0xE6, 0xF0, 0x2F, 0x49, 
-0x95, 0xF3, 0x79, 0x31, 0x49, 0x72, 0xC3, 0xD5, 0xCE, 0x57, 0x9A, 0x8F, 0x45, 0x8A, 0xB3, 0xE0, 
-0xA4, 0x0C, 0x31, 0x26, 0x6D, 0x07, 0x62, 0x72, 0x65, 0x48, 0x52, 0xF6, 0x93, 0x72, 0x63, 0xB4, 
-0x56, 0x0B, 0xD2, 0x08, 0x6F, 0x7A, 0xFB, 0xDB, 0xB8, 0xFC, 0xF4, 0xD3, 0xC8, 0xA8, 0x46, 0x9C, 
-0xC1, 0x27, 0x1D, 0x19, 0x0B, 0xB3, 0x2D, 0xC2, 0x8C, 0xB2, 0xFE, 0xDC, 0x1F, 0x45, 0xE6, 0xB3, 
-0xB0, 0x7E, 0x07, 0x59, 0x8A, 0x71, 0x96, 0xBD, 0x8E, 0x55, 0x75, 0x45, 0x8A, 0x51, 0x55, 0x06, 
-0x5D, 0xE0, 0xC6, 0xCB, 0x57, 0xB9, 0xFA, 0xC2, 0x8B, 0xC4, 0xC9, 0x74, 0xBE, 0xE0, 0x95, 0x52, 
-0xC2, 0x38, 0x1D, 0x89, 0x3B, 0x22, 0xD1, 0x19, 0xCE, 0x5F, 0xBE, 0xCC, 0x85, 0xA7, 0x2E, 0xD3, 
-0xAC, 0xAF, 0x13, 0x89, 0xC4, 0x6C, 0x77, 0x9B, 0xB2, 0xCB, 0x45, 0x31, 0xAA, 0x4F, 0x6B, 0xAC, 
-0x63, 0xEF, 0xC1, 0x0E, 0xD7, 0x5E, 0x7C, 0x51, 0x57, 0x92, 0x13, 0x44, 0x1F, 0x58, 0x6C, 0xE6, 
-0x5B, 0x96, 0x02, 0x16, 0x0D, 0xFA, 0xB8, 0x0D, 0xFB, 0x30, 0x68, 0xC1, 0x0C, 0x3B, 0xC8, 0xFC, 
-0xF7, 0x0A, 0x66, 0x5E, 0x7E, 0x4B, 0x19, 0x98, 0xF2, 0xA9, 0x64, 0xCA, 0xEF, 0x94, 0x67, 0x20, 
-0xDA, 0x89, 0xC5, 0x18, 0xED, 0x28, 0xD6, 0x16, 0x57, 0xEF, 0xCA, 0xAC, 0xE6, 0x12, 0x60, 0x6E, 
-0x43, 0xC1, 0xE0, 0xBB, 0x40, 0x37, 0x69, 0x69, 0x67, 0x2D, 0x6D, 0xDB, 0xD1, 0xCD, 0xB4, 0x9D, 
-0xA5, 0x98, 0x20, 0x05, 0xDD, 0xC5, 0x27, 0xB9, 0xAB, 0x1B, 0x21, 0x18, 0xA3, 0x03, 0x67, 0x96, 
-0x02, 0xF5, 0x59, 0x28, 0x33, 0xC8, 0x21, 0xE6, 0x29, 0xCE, 0xB2, 0x35, 0xF7, 0xE8, 0x59, 0x3D, 
-0x20, 0xAF, 0x58, 0x4C, 0x13, 0x6D, 0xAF, 0xA5, 0x81, 0x49, 0xF6, 0x10, 0x97, 0xA9, 0x2A, 0x5E, 
-0xDD, 0x44, 0xF3, 0xE3, 0x13, 0x98, 0xBA, 0xE2, 0x4D, 0x6F, 0x7F, 0x07, 0xE7, 0x9F, 0x7A, 0x0A, 
-0x33, 0xAA, 0xB4, 0x06, 0x72, 0xF9, 0x96, 0x72, 0x2E, 0xF7, 0x1F, 0x85, 0x72, 0x4D, 0x4A, 0x89, 
-0x12, 0xCD, 0xA0, 0xA8, 0x09, 0x24, 0xA8, 0x69, 0xE2, 0xD5, 0xE7, 0x9F, 0xE7, 0xEA, 0xF3, 0x2F, 
-0xD2, 0xED, 0x4D, 0x30, 0x21, 0xAB, 0xFB, 0x8C, 0x21, 0x64, 0x03, 0xFF, 0x32, 0xA0, 0x0E, 0xEB, 
-0xFF, 0x51, 0x10, 0xE5, 0x90, 0x87, 0xE6, 0xF1, 0xD8, 0xCF, 0x93, 0x34, 0x98, 0xA9, 0x69, 0xBB, 
-0x4A, 0xF9, 0xE1, 0x71, 0x7E, 0x6A, 0x51, 0x6F, 0x42, 0xDE, 0x96, 0x4B, 0xD4, 0xA0, 0x9B, 0x08, 
-0x29, 0x24, 0x52, 0x24, 0x3B, 0xF2, 0x31, 0x73, 0x1F, 0xD4, 0xBA, 0xD9, 0x29, 0xD2, 0x7A, 0x4F, 
-0xDB, 0x76, 0xF8, 0x36, 0x12, 0x7D, 0x22, 0x05, 0xE5, 0x25, 0xC1, 0xCF, 0x20, 0x45, 0x2A, 0xE7, 
-0xF0, 0xA1, 0xC3, 0x8A, 0xB6, 0xB3, 0x14, 0xA6, 0x2D, 0xB4, 0x57, 0x9C, 0xF5, 0xFF, 0xC3, 0x5B, 
-0xDF, 0x72, 0xFE, 0x3F, 0xFE, 0xBF, 0xFC, 0xB1, 0xDF, 0xF3, 0xD3, 0x1F, 0xFF, 0xF8, 0x1F, 0xD9, 
-0xED, 0x65, 0xF4, 0x48, 0x3C, 0x16, 0xC3, 0x05, 0xF8, 0xE1, 0x1F, 0xFE, 0x61, 0x7E, 0xEE, 0xE7, 
-0xFE, 0xC7, 0xFD, 0xBF, 0xF5, 0x53, 0x7F, 0xE5, 0x57, 0x9A, 0xF1, 0x89, 0xBF, 0xF3, 0xE0, 0xEE, 
-0xDD, 0x7F, 0xB2, 0xBB, 0x7B, 0xC7, 0x54, 0x36, 0x6C, 0xED, 0xB7, 0xB7, 0xD7, 0xAA, 0x0A, 0xA3, 
-0xB1, 0x31, 0xCB, 0x4E, 0x18, 0x65, 0x84, 0xC4, 0x04, 0x31, 0x40, 0x17, 0x88, 0x7E, 0x86, 0x23, 
-0x62, 0x62, 0x54, 0xA9, 0x24, 0xEF, 0x6C, 0x41, 0x2C, 0x26, 0x55, 0x24, 0x31, 0x04, 0x63, 0x88, 
-0x4E, 0x77, 0x81, 0x61, 0x2A, 0xC8, 0x6E, 0x1F, 0x93, 0x49, 0x88, 0x49, 0xEA, 0xC1, 0xC8, 0x0A, 
-0x88, 0x4E, 0xAD, 0xCB, 0xCA, 0xA8, 0x98, 0x84, 0x38, 0xC1, 0x03, 0x6B, 0x5B, 0x9B, 0x7C, 0xCD, 
-0xFB, 0xDF, 0xC7, 0xE9, 0x0B, 0xE7, 0xE8, 0x82, 0xC7, 0x38, 0xAB, 0x9E, 0xC1, 0x92, 0x36, 0x2E, 
-0x50, 0xBE, 0xA2, 0x93, 0x3B, 0x6D, 0x08, 0x65, 0x3C, 0x2E, 0x7E, 0xD1, 0xE6, 0xCD, 0x23, 0xFF, 
-0x33, 0x6F, 0xF8, 0x79, 0xEA, 0xD5, 0x54, 0xA3, 0x3C, 0x80, 0x38, 0x76, 0xEE, 0x3D, 0xE4, 0xCB, 
-0x9F, 0xFF, 0x22, 0x77, 0x6F, 0xDC, 0xC8, 0xDF, 0xB6, 0x68, 0x5C, 0xD6, 0x39, 0x22, 0x82, 0x4F, 
-0x89, 0xF5, 0xAD, 0x2D, 0xDE, 0xFE, 0xCE, 0x77, 0x70, 0xF2, 0xEC, 0x69, 0xB0, 0x56, 0x1D, 0x1E, 
-0x1B, 0x8D, 0x1E, 0x2C, 0x59, 0x7F, 0xEB, 0x44, 0x70, 0x46, 0x1D, 0x43, 0x5F, 0x7B, 0xE9, 0x65, 
-0x5E, 0x7C, 0xFE, 0x79, 0xF6, 0x1F, 0xEE, 0xD0, 0xB8, 0x8A, 0xE8, 0x3D, 0x66, 0x1E, 0x95, 0xE0, 
-0x30, 0x09, 0xA2, 0x0C, 0x58, 0x4F, 0x46, 0x43, 0x66, 0xBA, 0xFC, 0xEC, 0xC5, 0xB4, 0xB1, 0xCF, 
-0x64, 0x17, 0xBF, 0xC1, 0x8A, 0x76, 0x62, 0xED, 0x1F, 0x39, 0xBA, 0x82, 0x58, 0x25, 0x1C, 0x01, 
-0x43, 0x14, 0x4B, 0xC2, 0xE2, 0xC5, 0x68, 0x07, 0xC0, 0x81, 0x38, 0xA4, 0x78, 0xE4, 0x8F, 0x06, 
-0x7C, 0x22, 0xB6, 0x1D, 0x61, 0xD2, 0xD2, 0x4D, 0x27, 0xB4, 0xDD, 0x94, 0x94, 0x3A, 0x42, 0x6C, 
-0x89, 0xB1, 0x03, 0xAF, 0xEB, 0x04, 0x29, 0x44, 0x62, 0x82, 0x60, 0x1D, 0xC9, 0x39, 0xBC, 0x59, 
-0x48, 0x68, 0xC9, 0x40, 0x14, 0x43, 0x90, 0x04, 0x58, 0xA2, 0x51, 0x06, 0x1F, 0xC5, 0xE8, 0x80, 
-0x8E, 0xD5, 0xD9, 0x56, 0xB2, 0x48, 0xB2, 0xD8, 0x68, 0x1F, 0x6B, 0x5A, 0x3C, 0x2C, 0xA7, 0x7C, 
-0x74, 0x59, 0x99, 0x39, 0x60, 0xB8, 0x29, 0x25, 0x7C, 0x0C, 0x2A, 0x7D, 0x19, 0xC3, 0x2C, 0x06, 
-0x36, 0x4F, 0x9D, 0xE0, 0xBD, 0xEF, 0xFF, 0x00, 0x9B, 0x27, 0xB6, 0x17, 0x03, 0xFE, 0x60, 0x40, 
-0x1B, 0x4A, 0x8C, 0x47, 0x41, 0x8C, 0x0A, 0x05, 0xA6, 0x98, 0x9B, 0x85, 0x88, 0x09, 0x89, 0xD9, 
-0xDE, 0x3E, 0x9F, 0xFF, 0xF4, 0xAF, 0x71, 0xE7, 0xC6, 0x2D, 0x75, 0x52, 0x93, 0x99, 0x99, 0x31, 
-0x46, 0xDB, 0xA2, 0xA8, 0x4C, 0xC9, 0xA1, 0xDF, 0x76, 0x38, 0xE6, 0xED, 0x60, 0x78, 0x22, 0x63, 
-0xB9, 0x9D, 0x1C, 0x4E, 0x43, 0xC9, 0x5A, 0x92, 0x21, 0x21, 0x1A, 0x89, 0x45, 0x34, 0x7C, 0x3C, 
-0xCA, 0x7E, 0xB1, 0xD9, 0xC2, 0x40, 0xAF, 0xC8, 0x33, 0x02, 0x9B, 0x67, 0x03, 0x11, 0x6C, 0x14, 
-0x2A, 0x34, 0xBE, 0x5F, 0x4A, 0x42, 0x17, 0x61, 0x1A, 0x22, 0xFB, 0x31, 0x31, 0xF5, 0x81, 0xAE, 
-0x0D, 0x04, 0xEF, 0x31, 0xDE, 0x53, 0x25, 0x4F, 0x85, 0xD7, 0x36, 0x5C, 0x57, 0x8C, 0x6A, 0x4B, 
-0xDB, 0x4D, 0x52, 0x65, 0xE9, 0x8C, 0x8B, 0x9F, 0x19, 0x55, 0xFC, 0x8D, 0x37, 0xBF, 0xE5, 0xE9, 
-0x1F, 0xFA, 0xE8, 0xEF, 0xFE, 0xDE, 0xBF, 0xFA, 0x53, 0x3F, 0xFD, 0x5F, 0x7E, 0xE9, 0x9B, 0xBE, 
-0xE9, 0x9B, 0x0E, 0xDD, 0xC6, 0xBB, 0x0A, 0x87, 0x95, 0xCB, 0xB1, 0xF1, 0x89, 0x4F, 0x7C, 0xC2, 
-0xFE, 0x4F, 0xFF, 0xD3, 0xE7, 0xCF, 0xFD, 0xC4, 0x4F, 0xFC, 0xF5, 0xDF, 0x7A, 0xE7, 0xCE, 0xC3, 
-0x8F, 0xA5, 0x94, 0xBE, 0x36, 0x84, 0xF4, 0x14, 0xE6, 0xA4, 0x43, 0x6A, 0x2D, 0xC0, 0x04, 0xC5, 
-0x28, 0x5F, 0x99, 0x90, 0x4A, 0x70, 0x95, 0xB5, 0x54, 0x55, 0x85, 0xCD, 0xF1, 0xE2, 0x8B, 0xB3, 
-0xED, 0x60, 0xA0, 0x35, 0x81, 0x64, 0xCA, 0x94, 0xDF, 0xAA, 0x4B, 0x42, 0x74, 0xBA, 0x88, 0x44, 
-0x92, 0xEF, 0x30, 0xB5, 0x10, 0xA3, 0xEF, 0xD9, 0x30, 0x66, 0xCB, 0x01, 0xB1, 0x74, 0xD6, 0xF1, 
-0xA6, 0xB7, 0xBF, 0x95, 0xAF, 0xFF, 0xF0, 0x37, 0x32, 0xDE, 0xDA, 0x60, 0x67, 0xB2, 0x0F, 0x2E, 
-0x87, 0x00, 0x29, 0x8D, 0xB6, 0x17, 0x0E, 0x59, 0xE7, 0xC0, 0x8A, 0x94, 0x74, 0xC8, 0x60, 0xC5, 
-0xD4, 0x0D, 0xB2, 0xC4, 0x66, 0x35, 0x70, 0x63, 0xED, 0x1A, 0xC4, 0x47, 0x4C, 0x4C, 0x3C, 0xF7, 
-0xB9, 0x2F, 0xF0, 0x99, 0x5F, 0xF9, 0x55, 0xF6, 0xEF, 0x3F, 0xA4, 0x06, 0x4C, 0x54, 0x8F, 0x4B, 
-0x21, 0xA9, 0xD7, 0xFE, 0x59, 0xF0, 0x48, 0x65, 0x79, 0xFA, 0x6D, 0x6F, 0xE1, 0xDD, 0xEF, 0x7D, 
-0x0F, 0xCD, 0xD6, 0x06, 0x21, 0x41, 0x97, 0xC0, 0xB8, 0xDC, 0xE9, 0x91, 0x1C, 0xAC, 0x2F, 0x31, 
-0xAE, 0x6A, 0x76, 0xEF, 0x3F, 0xE0, 0x53, 0x3F, 0xFF, 0x4F, 0xB9, 0xFA, 0xE2, 0x0B, 0xF8, 0x59, 
-0xCB, 0x46, 0x33, 0x26, 0x74, 0x5D, 0x36, 0xD3, 0x61, 0xE1, 0xF1, 0x3F, 0xE3, 0x71, 0x3B, 0xC8, 
-0x71, 0x31, 0x7C, 0xEE, 0xDC, 0xC7, 0x43, 0x0F, 0x8B, 0x6B, 0x12, 0x36, 0x95, 0x60, 0x7D, 0x96, 
-0x20, 0x86, 0x28, 0x1A, 0x4E, 0x09, 0xA9, 0xF4, 0x8A, 0x5E, 0xB6, 0x45, 0xB2, 0x84, 0xD2, 0x7B, 
-0x47, 0x08, 0x81, 0xD4, 0x79, 0xE2, 0xB4, 0x25, 0xB5, 0x1E, 0x1F, 0x5A, 0xD5, 0x63, 0x9A, 0xA4, 
-0x81, 0x3E, 0x93, 0xB6, 0x2B, 0x13, 0xD5, 0x63, 0x7F, 0x12, 0x95, 0x10, 0xCD, 0xA8, 0xC1, 0x8E, 
-0x2A, 0x4C, 0x76, 0x1E, 0xA4, 0x92, 0x9D, 0x6E, 0x1A, 0x28, 0xBA, 0x52, 0x20, 0x6F, 0x75, 0xCD, 
-0xDD, 0x39, 0xA1, 0x0B, 0x22, 0x59, 0x7D, 0x05, 0x90, 0xC4, 0xCF, 0x43, 0xFD, 0x0C, 0x71, 0xBC, 
-0x63, 0x8B, 0xF6, 0x14, 0x53, 0x52, 0xD3, 0xAA, 0x9E, 0xFE, 0xB8, 0xE8, 0x6E, 0x2B, 0xD7, 0x30, 
-0x0D, 0x1D, 0x76, 0x3C, 0xE6, 0x4D, 0xEF, 0x78, 0x1B, 0x1F, 0xFA, 0xF0, 0x37, 0x41, 0xED, 0x34, 
-0x6C, 0xF7, 0x8A, 0x72, 0x5F, 0x85, 0x83, 0xEF, 0x5E, 0x1C, 0xEB, 0x72, 0x9C, 0x3E, 0x42, 0xD4, 
-0x35, 0x86, 0xCE, 0xF3, 0xE2, 0x17, 0xBE, 0xCC, 0xA7, 0xFF, 0xE9, 0x2F, 0xB2, 0x7F, 0xEF, 0x21, 
-0xAE, 0x48, 0xF5, 0x49, 0x23, 0x8D, 0x84, 0xEC, 0x0C, 0xFF, 0x71, 0x24, 0xDC, 0xFE, 0xFB, 0xCB, 
-0xF5, 0x65, 0xAC, 0x19, 0xE6, 0xED, 0x58, 0xCF, 0x5B, 0xD2, 0xC9, 0x66, 0xED, 0xD4, 0xFC, 0x31, 
-0xEA, 0xBB, 0x3A, 0x66, 0x6B, 0x0D, 0xF2, 0x33, 0xD5, 0x75, 0xA9, 0xF6, 0xE9, 0x94, 0xC3, 0xF5, 
-0x80, 0xD6, 0x67, 0x76, 0x6C, 0xAA, 0xDB, 0xF7, 0x7D, 0xA0, 0x0D, 0x91, 0x89, 0xF7, 0x5A, 0xF9, 
-0x31, 0x68, 0x84, 0x94, 0x10, 0xA9, 0x62, 0xC4, 0x25, 0xAF, 0x42, 0x81, 0x6B, 0x98, 0x74, 0x53, 
-0x0C, 0xA6, 0x8D, 0x4C, 0x5E, 0x82, 0xF8, 0x8F, 0xDF, 0xF2, 0x96, 0x67, 0xFE, 0xF2, 0xF7, 0x7E, 
-0xEF, 0x37, 0xFF, 0xC2, 0x8F, 0xFC, 0xC8, 0x0F, 0x1F, 0xEA, 0xEF, 0xF6, 0x51, 0x78, 0x6C, 0x09, 
-0x77, 0x88, 0x4F, 0x7E, 0xF2, 0x93, 0xE9, 0x17, 0x7F, 0xF1, 0xEF, 0xED, 0xEE, 0xEE, 0x5E, 0xFB, 
-0xF4, 0x8D, 0x1B, 0x77, 0xFF, 0xD6, 0xBD, 0x5B, 0xD7, 0x7F, 0xF6, 0xC1, 0xCE, 0xEE, 0x77, 0x26, 
-0x71, 0xDB, 0x20, 0xA2, 0xCE, 0x6E, 0xC8, 0x5A, 0x52, 0xA3, 0x53, 0x35, 0x81, 0x18, 0x22, 0x1E, 
-0x8D, 0xBD, 0xE4, 0x93, 0x86, 0x06, 0x21, 0xA1, 0x22, 0x7F, 0xB6, 0x02, 0x84, 0x3C, 0xB5, 0xCB, 
-0x0B, 0x4F, 0x29, 0x06, 0x1D, 0xBF, 0x44, 0x63, 0x0B, 0xE9, 0x8C, 0x43, 0x0B, 0x5D, 0x3B, 0x96, 
-0x40, 0x80, 0x36, 0x25, 0xC6, 0x9B, 0x9B, 0xBC, 0xE3, 0xFD, 0xEF, 0x63, 0xFB, 0xD4, 0x29, 0x3C, 
-0x80, 0xA8, 0x7D, 0xAB, 0xCB, 0xDE, 0xF2, 0x65, 0x2E, 0xD9, 0x96, 0x4E, 0xB7, 0x3C, 0x0D, 0xCE, 
-0x93, 0x97, 0x25, 0xE8, 0x42, 0x42, 0xB1, 0x73, 0x15, 0xAC, 0xE8, 0xA2, 0x58, 0xED, 0x1C, 0xDD, 
-0xEE, 0x8C, 0xCF, 0x7F, 0xE6, 0x73, 0x3C, 0xBC, 0x7D, 0x0F, 0x49, 0x89, 0xCA, 0x18, 0x0D, 0xC9, 
-0xEC, 0x54, 0xBA, 0xE8, 0x62, 0xC0, 0xA7, 0xC8, 0xFA, 0xD6, 0x16, 0x6F, 0x79, 0xC7, 0xDB, 0xD9, 
-0x3E, 0x7D, 0x1A, 0xA9, 0x1C, 0x21, 0x2E, 0x98, 0x57, 0x4A, 0x11, 0x23, 0x16, 0x23, 0xBA, 0x1C, 
-0xE4, 0x48, 0xDC, 0xB8, 0x72, 0x95, 0x2F, 0x7F, 0xE1, 0x0B, 0xF8, 0xB6, 0xD5, 0xCE, 0x91, 0x02, 
-0xCE, 0x98, 0xB9, 0x04, 0x52, 0xBE, 0xBF, 0xE0, 0x38, 0x0D, 0xFA, 0x71, 0xD1, 0x7F, 0x66, 0x59, 
-0x4C, 0x59, 0x75, 0xAE, 0xFF, 0xDB, 0x6A, 0x11, 0x69, 0x49, 0x8A, 0xA8, 0xC5, 0xA2, 0x29, 0x56, 
-0x18, 0x06, 0x93, 0x25, 0x18, 0x93, 0xBD, 0x52, 0x69, 0xF4, 0xE2, 0x48, 0xF4, 0x9E, 0xD4, 0x76, 
-0xB4, 0x33, 0x4F, 0x37, 0x6B, 0x09, 0xD3, 0x96, 0x18, 0x62, 0xD6, 0x35, 0x19, 0x92, 0xD1, 0xB8, 
-0x77, 0x31, 0xE9, 0xDD, 0x06, 0x43, 0x99, 0x76, 0xC7, 0xA8, 0x81, 0x32, 0xA3, 0xF7, 0x10, 0x02, 
-0x92, 0x67, 0x19, 0xAA, 0xCF, 0xCE, 0xEF, 0x14, 0xCD, 0x63, 0xA9, 0x5D, 0x49, 0xDA, 0xDE, 0x6C, 
-0xB2, 0x98, 0x24, 0xB9, 0x7D, 0x2A, 0x83, 0xEC, 0x2F, 0x9E, 0x3D, 0x0A, 0xC3, 0x72, 0x30, 0xD9, 
-0x12, 0xA6, 0x40, 0x45, 0x89, 0x79, 0xF3, 0xD2, 0x32, 0x30, 0x16, 0xA9, 0x2C, 0xFB, 0xED, 0x8C, 
-0xB3, 0x97, 0x2E, 0xF1, 0xF6, 0x77, 0xBD, 0x8B, 0xAD, 0x93, 0xDB, 0x60, 0x8E, 0xD6, 0x91, 0xF7, 
-0x07, 0x8E, 0x55, 0x50, 0x81, 0x61, 0xF1, 0x0C, 0x93, 0x20, 0x78, 0xCF, 0xB8, 0x6A, 0xE8, 0xF6, 
-0xA7, 0xFC, 0xDA, 0x2F, 0x7F, 0x8A, 0xFB, 0xB7, 0x6E, 0x6B, 0xDB, 0xCD, 0x0B, 0x41, 0xA9, 0xC7, 
-0x1C, 0x8F, 0xAA, 0xDF, 0x47, 0x61, 0x7E, 0x7D, 0xAE, 0xFF, 0xD4, 0xFB, 0x5F, 0x29, 0x4F, 0xE3, 
-0x8E, 0x20, 0xD5, 0xD3, 0x1A, 0xA2, 0x91, 0x79, 0x9D, 0x94, 0xF2, 0xD3, 0x27, 0x66, 0x76, 0x9C, 
-0x74, 0xFA, 0x9F, 0x57, 0x2D, 0x54, 0x6D, 0x94, 0xC0, 0x44, 0xC1, 0xA0, 0xF1, 0x04, 0xC5, 0xE8, 
-0xD2, 0x6B, 0x17, 0x03, 0xD3, 0x6E, 0xC6, 0xC4, 0xB7, 0xB4, 0x5D, 0x07, 0x5D, 0x42, 0x82, 0x60, 
-0xA3, 0x46, 0xF5, 0x13, 0x31, 0x1A, 0x0F, 0x4E, 0x34, 0xBE, 0x5A, 0x4A, 0x09, 0x63, 0x62, 0x08, 
-0x69, 0xF2, 0xF3, 0xEF, 0x7B, 0xDF, 0xD7, 0xFC, 0x2B, 0x3F, 0xF0, 0x03, 0xFF, 0xDC, 0xFF, 0xE7, 
-0xA7, 0x7F, 0xFA, 0xBF, 0xFA, 0xFC, 0x77, 0x7D, 0xD7, 0xB7, 0x4D, 0x17, 0x5F, 0xFB, 0xF8, 0x58, 
-0x0C, 0x23, 0xAF, 0x10, 0x22, 0x92, 0xFE, 0xC2, 0x5F, 0xF8, 0xE1, 0xDD, 0xEF, 0xFE, 0xBE, 0xEF, 
-0xFC, 0x7C, 0x08, 0xB3, 0x5B, 0x48, 0x97, 0x10, 0x9D, 0xFA, 0xE7, 0x2B, 0x48, 0x39, 0xDE, 0xBB, 
-0x24, 0x10, 0xA7, 0xAA, 0x83, 0x59, 0x8C, 0x4C, 0xDA, 0xC0, 0xEE, 0xB4, 0x63, 0x32, 0xF5, 0xB4, 
-0x33, 0xD5, 0xA5, 0xD4, 0x01, 0xEA, 0x60, 0xA8, 0xA2, 0xC9, 0x8C, 0xA6, 0xF7, 0xB2, 0xA4, 0xC6, 
-0xDF, 0xA5, 0x61, 0x18, 0xE3, 0x20, 0x39, 0x82, 0x87, 0x18, 0xFE, 0xFF, 0xCC, 0xFD, 0x79, 0x90, 
-0x6D, 0xD9, 0x75, 0xDE, 0x89, 0xFD, 0xF6, 0x70, 0x86, 0x3B, 0xE6, 0x9C, 0xF9, 0xE6, 0xB9, 0xE6, 
-0x2A, 0xD4, 0x80, 0x02, 0x0A, 0x28, 0x4C, 0xC4, 0xC0, 0x49, 0x03, 0x45, 0x0D, 0xA0, 0x5A, 0x6C, 
-0xB9, 0x65, 0xB5, 0x15, 0x2D, 0x4B, 0x0E, 0xA9, 0x25, 0x75, 0x47, 0xCB, 0x8E, 0xB6, 0x45, 0xC1, 
-0x76, 0xB8, 0x6D, 0xB9, 0xBB, 0x1D, 0x0E, 0xB9, 0x25, 0x6B, 0x62, 0x9B, 0x6A, 0x4B, 0xD1, 0x41, 
-0x6A, 0x0C, 0x4A, 0x14, 0x08, 0x50, 0x04, 0x41, 0x12, 0x33, 0x08, 0x80, 0x28, 0xA0, 0xAA, 0x5E, 
-0x4D, 0xEF, 0x55, 0xBD, 0x7A, 0xF3, 0x7B, 0xF9, 0x32, 0xF3, 0x0E, 0x67, 0xD8, 0xC3, 0xF2, 0x1F, 
-0xFB, 0xDC, 0x7C, 0x59, 0x85, 0x02, 0x58, 0x24, 0x81, 0x6E, 0xAF, 0x8A, 0xAC, 0x7C, 0x99, 0xF7, 
-0x66, 0xE6, 0xBD, 0xE7, 0xEC, 0xB3, 0xCE, 0xDA, 0xDF, 0xFA, 0xD6, 0xF7, 0x29, 0xB4, 0xCA, 0x59, 
-0xDD, 0x4C, 0x9D, 0xDE, 0x68, 0xD2, 0xB6, 0xCA, 0x16, 0xA9, 0xDA, 0x16, 0x49, 0x20, 0xF0, 0x22, 
-0xD9, 0x2E, 0xFC, 0xCA, 0xD4, 0x5B, 0x6C, 0xA1, 0x17, 0x71, 0xB7, 0x23, 0x9A, 0xEE, 0x9E, 0x70, 
-0x80, 0x77, 0xAB, 0xD2, 0xB6, 0xFF, 0xCE, 0xED, 0x6D, 0x76, 0x6F, 0x6D, 0xA3, 0xC2, 0xDD, 0xDF, 
-0xBD, 0xF8, 0x7D, 0xD2, 0xB9, 0xED, 0xDA, 0x3C, 0x63, 0x6D, 0x63, 0x9D, 0xE5, 0xD5, 0x95, 0x34, 
-0x13, 0xDF, 0x25, 0x30, 0x7D, 0x60, 0x70, 0x42, 0x44, 0x92, 0x11, 0xA4, 0x04, 0x26, 0xBB, 0x7B, 
-0xC9, 0x3A, 0x67, 0x32, 0xC5, 0x76, 0x76, 0xEA, 0x8B, 0x71, 0xD0, 0xFF, 0xA9, 0xE2, 0xCD, 0xC7, 
-0xE4, 0xE0, 0x71, 0x7A, 0xAB, 0xC7, 0x16, 0x21, 0x9D, 0x19, 0x5F, 0xBA, 0x34, 0xEE, 0xE2, 0xE5, 
-0xA9, 0x4B, 0x1C, 0x31, 0x5A, 0xB0, 0x5A, 0x93, 0x69, 0x9D, 0xEC, 0xB1, 0x25, 0x22, 0xAE, 0x25, 
-0x54, 0x15, 0xF5, 0x6C, 0x8E, 0xAB, 0x1D, 0x6D, 0x13, 0x71, 0x41, 0x88, 0xDD, 0x88, 0xB6, 0x89, 
-0xA0, 0x7D, 0x44, 0xB5, 0x2D, 0xDA, 0x39, 0x74, 0xF0, 0x58, 0x49, 0xD0, 0x8B, 0xED, 0xC6, 0x9B, 
-0xA3, 0xF7, 0xF8, 0xAA, 0x21, 0x54, 0x0E, 0x3F, 0x6F, 0xF1, 0xF3, 0x16, 0x69, 0x92, 0x5D, 0xB7, 
-0x16, 0xB0, 0x92, 0x06, 0x48, 0x12, 0x98, 0x91, 0x6E, 0xED, 0x0B, 0xA1, 0x6D, 0x3A, 0x02, 0xFF, 
-0xDB, 0x49, 0xB3, 0x6F, 0x7E, 0xEF, 0x6F, 0x15, 0x6F, 0xB5, 0x3B, 0x5A, 0x84, 0x52, 0x09, 0x66, 
-0x09, 0x31, 0x26, 0x7D, 0xE6, 0xC3, 0x87, 0x58, 0xDD, 0x5C, 0x4F, 0x46, 0x89, 0xDF, 0xE5, 0x57, 
-0xCB, 0x5B, 0xF0, 0x4E, 0xDF, 0xEA, 0xEB, 0x45, 0xB2, 0x95, 0x03, 0x6B, 0x4B, 0x77, 0xC2, 0x47, 
-0xB7, 0x6F, 0xDE, 0x62, 0xFB, 0xE6, 0x2D, 0xA2, 0xF3, 0x18, 0xDE, 0x38, 0x52, 0x2C, 0x72, 0x77, 
-0x7D, 0xFF, 0xCF, 0x1D, 0x8B, 0x63, 0x20, 0x8A, 0x03, 0x83, 0x14, 0x89, 0x3B, 0xA4, 0x0E, 0xF4, 
-0x7C, 0x80, 0xFD, 0x41, 0xAA, 0x83, 0xE3, 0xCC, 0x56, 0x34, 0x5A, 0x14, 0xD1, 0x0B, 0x6D, 0xDB, 
-0x52, 0xD5, 0x35, 0x75, 0x5D, 0x13, 0x9C, 0x83, 0x10, 0xC8, 0xD0, 0x64, 0xA2, 0xC8, 0xA2, 0x42, 
-0x87, 0x44, 0x15, 0x8D, 0x18, 0xBC, 0x4A, 0xCD, 0xCB, 0x28, 0x1E, 0xA5, 0x62, 0x18, 0xF6, 0x7B, 
-0x5F, 0x7D, 0xEF, 0x7B, 0x7F, 0xEC, 0x99, 0xBF, 0xF3, 0x77, 0x3E, 0x31, 0xFD, 0x5E, 0x23, 0xBB, 
-0x6F, 0x37, 0xBE, 0x6F, 0x09, 0x77, 0x11, 0xCE, 0xE1, 0xB5, 0x36, 0x4D, 0x22, 0xAE, 0xB5, 0xDF, 
-0x31, 0x75, 0x72, 0xF0, 0x62, 0x8D, 0xBA, 0xC3, 0x6A, 0x94, 0x42, 0x3A, 0x3C, 0x65, 0xDE, 0x3A, 
-0xDA, 0xAA, 0x46, 0xCD, 0x5B, 0xF2, 0xDA, 0x91, 0xB9, 0x40, 0x1E, 0x20, 0xEB, 0x2E, 0x94, 0xC5, 
-0xD6, 0x33, 0x2A, 0x45, 0x10, 0x85, 0x60, 0x93, 0x71, 0xB2, 0xA4, 0xF1, 0x3B, 0xAD, 0x4A, 0x7A, 
-0xFD, 0x31, 0x87, 0x8F, 0x9F, 0xC0, 0xE4, 0x59, 0xBA, 0x5B, 0x75, 0x6E, 0xC1, 0xA2, 0x52, 0xC3, 
-0x69, 0xF1, 0x1A, 0x16, 0x7A, 0xBD, 0x8B, 0x46, 0xC9, 0x5B, 0xC5, 0x5B, 0x2D, 0x68, 0x59, 0xE0, 
-0x5C, 0x3E, 0x90, 0x99, 0x9C, 0xC9, 0xF6, 0x1E, 0x57, 0x2F, 0xBD, 0x4E, 0x3D, 0x9F, 0xEF, 0x27, 
-0x16, 0x11, 0x41, 0x99, 0xAC, 0x7B, 0x8D, 0x1A, 0x6D, 0x33, 0x96, 0x56, 0xD6, 0x38, 0x74, 0xEC, 
-0x38, 0x79, 0x7F, 0x40, 0xD0, 0x1D, 0x0F, 0x58, 0x75, 0x58, 0xE3, 0x22, 0x54, 0x44, 0x62, 0x24, 
-0x3A, 0xCF, 0xB5, 0xD7, 0x2F, 0x27, 0x27, 0xDE, 0xE8, 0x31, 0x08, 0x4A, 0x12, 0xDE, 0x76, 0xF0, 
-0x35, 0xC5, 0x05, 0x8D, 0xAD, 0xFB, 0xF8, 0x7E, 0xC5, 0xA2, 0x29, 0x99, 0xEE, 0x8E, 0xE9, 0x22, 
-0x3E, 0x08, 0x23, 0x1C, 0x3C, 0x8F, 0x4A, 0x75, 0x0E, 0xCC, 0x8B, 0xEA, 0x57, 0x6B, 0x3C, 0xE0, 
-0xD1, 0x84, 0xC5, 0xCF, 0xA8, 0x88, 0x8E, 0x01, 0x23, 0x9E, 0x2C, 0x76, 0x1F, 0xD2, 0x62, 0x62, 
-0x43, 0x6C, 0x2B, 0xEA, 0xF9, 0x1E, 0xF5, 0x74, 0x42, 0x3B, 0x9F, 0xE1, 0x9B, 0x96, 0xE0, 0x62, 
-0xBA, 0x41, 0x2B, 0xDD, 0x41, 0x4B, 0x42, 0x26, 0x8E, 0xA1, 0x38, 0x96, 0xC5, 0xB3, 0x4E, 0x64, 
-0x29, 0x7A, 0x8A, 0xD8, 0x62, 0xA2, 0x43, 0xC5, 0x94, 0xDA, 0x6D, 0xD0, 0x98, 0xA0, 0x31, 0x4E, 
-0xA0, 0x0E, 0xF8, 0xCA, 0xD1, 0xCE, 0x1A, 0x62, 0xDD, 0x42, 0xEB, 0x31, 0x41, 0xB0, 0x41, 0xC8, 
-0x22, 0x18, 0xF1, 0x58, 0x02, 0x0A, 0x0F, 0xAA, 0x25, 0xEA, 0x96, 0xA0, 0x5B, 0xA2, 0xF6, 0xDD, 
-0x7B, 0xD5, 0xFB, 0x1F, 0x77, 0x2D, 0x57, 0x16, 0xDF, 0xFB, 0xCE, 0x78, 0x63, 0x12, 0x4E, 0x09, 
-0x5C, 0xCB, 0xE2, 0x23, 0x25, 0xE0, 0x85, 0x2B, 0x6C, 0x20, 0x99, 0x15, 0xB6, 0x22, 0x2C, 0xAF, 
-0x6F, 0x70, 0xE8, 0xD8, 0x51, 0xB2, 0xB2, 0x20, 0x90, 0xB0, 0xDD, 0x37, 0xD4, 0x17, 0x6F, 0x91, 
-0x68, 0x7F, 0xA7, 0x58, 0x9C, 0x2F, 0x91, 0xC4, 0xCA, 0x28, 0x6C, 0xC6, 0x64, 0x7B, 0x87, 0x8B, 
-0x2F, 0xBD, 0x8C, 0xAB, 0x9B, 0xE4, 0x18, 0xA2, 0xF4, 0x1B, 0x68, 0x69, 0x07, 0x7F, 0xF6, 0xFF, 
-0xFF, 0xE2, 0xBB, 0xEB, 0x64, 0x77, 0x47, 0x1A, 0x41, 0x13, 0x48, 0xF4, 0x3A, 0x1F, 0x3D, 0xAE, 
-0x69, 0x68, 0xAB, 0x9A, 0xA6, 0x6A, 0xF1, 0x8D, 0x47, 0x42, 0x5A, 0xA0, 0x0A, 0x83, 0xE9, 0x74, 
-0xA9, 0x35, 0x09, 0x0F, 0x8E, 0x28, 0x44, 0x0C, 0x8A, 0x02, 0x45, 0x82, 0x38, 0x9D, 0x9F, 0x86, 
-0xCC, 0xCA, 0x95, 0xBF, 0xFF, 0xF7, 0xFF, 0x7C, 0xE7, 0xAB, 0xFE, 0xFB, 0x8F, 0xB7, 0x5E, 0x39, 
-0xBF, 0x8F, 0xD8, 0x00, 0x0C, 0xD6, 0x27, 0xEE, 0x5B, 0x77, 0xBD, 0x02, 0x59, 0x14, 0x0A, 0x14, 
-0xA5, 0x04, 0x7A, 0x04, 0xAC, 0xAF, 0xC8, 0xA3, 0xEB, 0xA8, 0x42, 0xE9, 0x22, 0x05, 0x70, 0xCE, 
-0xD3, 0x54, 0x2D, 0xD5, 0x7C, 0x4E, 0x3B, 0xAB, 0x52, 0xC3, 0x64, 0x31, 0x40, 0x10, 0xA5, 0x93, 
-0x7A, 0x54, 0xA8, 0xA0, 0x50, 0x91, 0x04, 0x0D, 0x4B, 0xE2, 0xAD, 0x86, 0x98, 0x12, 0x5B, 0xAF, 
-0x3F, 0x60, 0x75, 0x6B, 0x83, 0x56, 0x92, 0x6E, 0x68, 0x3C, 0xE0, 0xE6, 0x10, 0xBB, 0x71, 0xD9, 
-0xB7, 0x5A, 0x53, 0xFB, 0xD5, 0xEB, 0x5B, 0x74, 0x59, 0xF7, 0x1F, 0xEB, 0xBE, 0xB6, 0x3A, 0x51, 
-0xDF, 0x8C, 0x52, 0xDC, 0xB9, 0xBD, 0xCD, 0xB5, 0x2B, 0x57, 0x09, 0x8D, 0x4B, 0x9B, 0x9B, 0x28, 
-0x84, 0xD0, 0x61, 0x8D, 0x5D, 0x22, 0xB4, 0x59, 0xC6, 0xD2, 0xCA, 0x32, 0xEB, 0x9B, 0x1B, 0x98, 
-0x3C, 0x75, 0xA0, 0xD3, 0x6B, 0xBB, 0x1B, 0x1A, 0x95, 0xA4, 0xF1, 0x04, 0x7C, 0xDD, 0x72, 0xE3, 
-0xDA, 0x75, 0xF6, 0x76, 0x76, 0xF7, 0x31, 0xB6, 0xD8, 0x75, 0x90, 0x7F, 0xB7, 0x17, 0xDF, 0x0F, 
-0x22, 0xF6, 0x13, 0xED, 0x9B, 0xBE, 0x56, 0x1D, 0x75, 0x27, 0xA8, 0x8E, 0x49, 0xDB, 0x5D, 0xBD, 
-0xA9, 0xBA, 0x4D, 0x49, 0x37, 0x5D, 0x12, 0x09, 0x3B, 0xF3, 0xA1, 0xA5, 0xA9, 0x6B, 0xAA, 0x69, 
-0xC5, 0x7C, 0x5E, 0xE3, 0x9C, 0x00, 0x09, 0x6B, 0x4F, 0x50, 0x41, 0xC4, 0xC6, 0x9A, 0x32, 0x4E, 
-0x19, 0x33, 0xE5, 0x10, 0x53, 0x4E, 0x30, 0xE7, 0x24, 0x35, 0x47, 0x99, 0xB3, 0x2C, 0x7B, 0xF4, 
-0xC3, 0x1E, 0x59, 0x9C, 0x91, 0x07, 0x4F, 0x26, 0x42, 0xA1, 0x92, 0xF5, 0x3B, 0xA2, 0x09, 0xCE, 
-0xE3, 0x9A, 0x80, 0x6F, 0x22, 0xBE, 0x0D, 0x44, 0x9F, 0xD6, 0x8E, 0xDE, 0xA7, 0x1B, 0x72, 0x80, 
-0x07, 0xBC, 0xE0, 0xE4, 0xBE, 0xBD, 0x5D, 0xC4, 0x1B, 0x13, 0xEC, 0xEF, 0x32, 0x94, 0x22, 0x1A, 
-0x85, 0x18, 0xCD, 0xFA, 0xA1, 0x2D, 0x56, 0xB7, 0x36, 0xD2, 0xFB, 0xED, 0x34, 0x34, 0xBE, 0x57, 
-0x1C, 0xAC, 0x48, 0xBF, 0x57, 0x2C, 0xAA, 0x5B, 0xA2, 0x50, 0x18, 0xDB, 0x89, 0x29, 0x5D, 0x42, 
-0x07, 0x21, 0xD3, 0x66, 0x9F, 0xCF, 0xAB, 0x16, 0x83, 0x3C, 0x1D, 0x36, 0xFA, 0x3F, 0x7B, 0xA8, 
-0xBB, 0xBB, 0x8E, 0xD4, 0xFE, 0x7E, 0xEB, 0x71, 0xE1, 0xD4, 0xD5, 0xE9, 0x18, 0x4C, 0xA9, 0xC3, 
-0x43, 0xC4, 0x10, 0x95, 0xA2, 0x69, 0x1A, 0x9A, 0xB6, 0xA2, 0x69, 0x5A, 0xBC, 0x0B, 0xE8, 0x68, 
-0x30, 0xCA, 0x62, 0x94, 0x4D, 0xD5, 0x6D, 0x68, 0x29, 0x68, 0xE8, 0xD1, 0x52, 0xE2, 0xC8, 0xBA, 
-0x9B, 0x8E, 0x8E, 0x09, 0x66, 0xB0, 0xDA, 0xA0, 0x50, 0x21, 0x84, 0x66, 0xF6, 0xE6, 0xBF, 0xFB, 
-0xFB, 0x89, 0xEF, 0x7B, 0xC2, 0x9D, 0x0F, 0xFA, 0x4A, 0x22, 0x51, 0x47, 0x03, 0x5E, 0x63, 0xA2, 
-0xA6, 0xC4, 0x90, 0x23, 0x6C, 0x94, 0x39, 0xEF, 0x3E, 0x77, 0x82, 0xC3, 0x79, 0x64, 0x4D, 0x2A, 
-0x96, 0xFC, 0x9C, 0x81, 0xAF, 0x28, 0x25, 0x60, 0x44, 0x12, 0x7F, 0x1F, 0x83, 0x36, 0x39, 0x11, 
-0x4B, 0x15, 0x3C, 0x93, 0xAA, 0x62, 0x5A, 0xD7, 0xB4, 0x21, 0xE0, 0x63, 0x02, 0xBE, 0x7D, 0x1B, 
-0x90, 0x00, 0x1A, 0xD3, 0x61, 0x70, 0x29, 0x79, 0x65, 0x65, 0x81, 0xEE, 0xE5, 0x1C, 0x3D, 0x73, 
-0x8A, 0xFE, 0x60, 0x80, 0x31, 0x59, 0x4A, 0x63, 0x26, 0x23, 0xA2, 0xD1, 0xDA, 0x62, 0x4C, 0x96, 
-0x92, 0xE1, 0xE2, 0x67, 0xBB, 0xAA, 0x25, 0x79, 0xCE, 0xA7, 0x0F, 0xBA, 0x89, 0xAD, 0xC5, 0x42, 
-0x94, 0x85, 0x26, 0xC4, 0x02, 0xFF, 0x13, 0xA1, 0xAD, 0x6A, 0xAC, 0x31, 0x84, 0xA6, 0xE6, 0xEA, 
-0xA5, 0xD7, 0x98, 0xEE, 0xEC, 0x52, 0x66, 0xF9, 0xBE, 0x1A, 0x98, 0xB5, 0x36, 0x8D, 0x65, 0xDA, 
-0xD4, 0xF1, 0xCE, 0x7B, 0x25, 0x67, 0xEF, 0xBB, 0x97, 0xE1, 0x78, 0x19, 0x1F, 0x24, 0x41, 0x2A, 
-0x9D, 0x5A, 0x99, 0xE9, 0xAA, 0x0D, 0x2D, 0x40, 0x48, 0x8C, 0x8E, 0x1B, 0xD7, 0xAE, 0xB1, 0x7D, 
-0xE3, 0x3A, 0xF5, 0xBC, 0xA2, 0xCC, 0x72, 0xA2, 0xF3, 0xFB, 0x8D, 0x83, 0x04, 0x3D, 0x2C, 0x5E, 
-0xEB, 0x1B, 0xE3, 0x7B, 0x55, 0x43, 0x8B, 0xC7, 0xBE, 0xDB, 0xE3, 0x6F, 0x4C, 0x9A, 0xFB, 0x9B, 
-0x6C, 0x62, 0xCA, 0x0F, 0x5D, 0x52, 0x4A, 0xB1, 0xF8, 0x3D, 0xFB, 0x30, 0xCB, 0x62, 0xA2, 0x49, 
-0x16, 0x74, 0x27, 0xD3, 0x5D, 0x10, 0xE9, 0x79, 0x5A, 0xC0, 0x2A, 0x95, 0x1C, 0x87, 0xE9, 0x2E, 
-0x88, 0xA6, 0x61, 0x36, 0x6D, 0xD8, 0xDB, 0x9B, 0x53, 0x37, 0x11, 0x65, 0x07, 0x88, 0xE9, 0xE3, 
-0x82, 0x42, 0xDB, 0x0C, 0xA2, 0xC7, 0xC6, 0x8A, 0x81, 0xCC, 0x58, 0x63, 0x87, 0x73, 0x6A, 0xCE, 
-0x47, 0x0F, 0x8D, 0xF8, 0xB3, 0x4F, 0xDE, 0xCF, 0x5F, 0xF8, 0xE0, 0x23, 0xFC, 0xF4, 0x63, 0x67, 
-0xF9, 0xF0, 0xE1, 0x55, 0xCE, 0x99, 0xC8, 0x32, 0x73, 0x06, 0xD4, 0xF4, 0x10, 0x6C, 0x47, 0x43, 
-0x8C, 0xCA, 0x20, 0x3A, 0x27, 0x28, 0x4B, 0xDD, 0x06, 0xAA, 0x79, 0xCB, 0x74, 0x52, 0x31, 0x9D, 
-0xD6, 0x88, 0x53, 0x28, 0xAF, 0xD1, 0x41, 0x41, 0x24, 0x69, 0x9E, 0xAA, 0x80, 0x68, 0x41, 0x67, 
-0x89, 0x13, 0x4D, 0xE7, 0xCE, 0xBA, 0x38, 0xE7, 0x07, 0xD7, 0xC4, 0xF7, 0xAA, 0x74, 0xE1, 0xEE, 
-0xCE, 0x40, 0x91, 0x76, 0x52, 0xA6, 0x1B, 0xFB, 0x56, 0xAA, 0xB3, 0xE6, 0xD6, 0x06, 0xE7, 0x23, 
-0xEB, 0x87, 0xB6, 0x38, 0x79, 0xF6, 0x74, 0x62, 0xBD, 0xA8, 0xEE, 0x6F, 0x1C, 0x98, 0xF4, 0x3A, 
-0x78, 0x4E, 0x16, 0x09, 0x7E, 0xF1, 0x7A, 0x0E, 0xC6, 0x9B, 0xCF, 0xAB, 0xE1, 0xAE, 0x9E, 0x6D, 
-0x61, 0x33, 0xE6, 0xD3, 0x19, 0x2F, 0x7C, 0xFB, 0x39, 0xA4, 0xF5, 0x09, 0xE4, 0x11, 0x88, 0x5D, 
-0x83, 0x8C, 0x6E, 0x4D, 0x2D, 0xDE, 0xDB, 0xE2, 0xEF, 0x7C, 0xAF, 0x38, 0xF8, 0x9C, 0x83, 0xAF, 
-0xED, 0xCD, 0xAF, 0xE3, 0xBB, 0xBD, 0xFE, 0x78, 0x40, 0x5F, 0xE5, 0xCD, 0x1F, 0xA9, 0xB1, 0xE1, 
-0xD0, 0xD1, 0x25, 0x2E, 0x3E, 0x89, 0x4B, 0x4D, 0xB7, 0x96, 0x82, 0x44, 0x7C, 0x48, 0x43, 0x0F, 
-0x68, 0x43, 0x44, 0xE3, 0xBC, 0x50, 0xB7, 0x8E, 0xAA, 0x6E, 0x99, 0x55, 0x0D, 0xB3, 0xBA, 0x4A, 
-0xBF, 0x46, 0x19, 0x84, 0x1C, 0x74, 0x81, 0x56, 0x05, 0x44, 0x45, 0x16, 0x03, 0x03, 0x1C, 0x03, 
-0xA6, 0xAC, 0xE3, 0x59, 0x23, 0x32, 0x54, 0x8E, 0x9E, 0x8E, 0x14, 0xA8, 0xA4, 0x5B, 0xED, 0x3D, 
-0x82, 0x34, 0xC3, 0x7E, 0xFF, 0x6D, 0x53, 0xBE, 0xDE, 0x4E, 0x7C, 0x8F, 0x15, 0xF3, 0x7B, 0x8B, 
-0xFE, 0x6C, 0x20, 0x99, 0xEE, 0x05, 0xA5, 0x32, 0x31, 0x2A, 0x43, 0x93, 0x61, 0xA3, 0xA6, 0x8F, 
-0xE2, 0xD8, 0xA8, 0xCF, 0x53, 0xE7, 0x8E, 0xF3, 0x47, 0xDF, 0xFB, 0x28, 0x0F, 0xAF, 0x14, 0x1C, 
-0xCF, 0x1A, 0x96, 0xC2, 0x0E, 0xBD, 0x76, 0x87, 0xBE, 0xAB, 0x29, 0x82, 0xC7, 0xC4, 0x06, 0x1F, 
-0x6A, 0x82, 0x06, 0x6F, 0x0C, 0x4E, 0x29, 0x6A, 0xE7, 0x99, 0xCE, 0x52, 0x05, 0x14, 0x7C, 0xA4, 
-0xB0, 0x05, 0xA5, 0x2D, 0x50, 0x1E, 0x32, 0x12, 0x99, 0x39, 0x46, 0x4F, 0x13, 0x2A, 0x56, 0xB6, 
-0x56, 0x39, 0x7C, 0x22, 0x59, 0x9F, 0xEB, 0x8E, 0x28, 0xBE, 0xEF, 0xE2, 0x70, 0x60, 0xD1, 0xF3, 
-0x56, 0x8B, 0x66, 0x71, 0xB7, 0x97, 0x44, 0xFB, 0x02, 0xF0, 0x92, 0x94, 0xBD, 0xEE, 0x36, 0xB6, 
-0x12, 0x06, 0xAD, 0x49, 0x90, 0xC2, 0xCD, 0xAB, 0xD7, 0xD9, 0xDD, 0xD9, 0x21, 0x06, 0x87, 0xE2, 
-0xEE, 0x34, 0x50, 0x24, 0xA0, 0x6C, 0x67, 0x02, 0x69, 0x34, 0x5B, 0x87, 0x0F, 0x51, 0xF4, 0x4A, 
-0xE8, 0x06, 0x26, 0x62, 0x8C, 0xC8, 0x81, 0x84, 0x4E, 0xE8, 0xB8, 0xC9, 0x28, 0xDA, 0xF9, 0x8C, 
-0x6B, 0x57, 0x92, 0x31, 0xA4, 0x55, 0x9D, 0x07, 0xDA, 0xFE, 0x85, 0x9E, 0x14, 0xC5, 0xE8, 0x2A, 
-0xF1, 0xFD, 0xD7, 0xFE, 0x36, 0x2F, 0x92, 0xB7, 0xFB, 0xDC, 0xDF, 0x29, 0xDE, 0xEA, 0x77, 0x1D, 
-0xFC, 0xDE, 0x82, 0x75, 0xA2, 0x44, 0xA3, 0x31, 0x89, 0x57, 0xAB, 0x34, 0xDE, 0x7B, 0xE6, 0xF3, 
-0x8A, 0xBA, 0x72, 0xDC, 0xD9, 0x99, 0x52, 0x4D, 0x6B, 0x54, 0x56, 0x92, 0xF7, 0x46, 0x88, 0x64, 
-0x48, 0xB4, 0xE4, 0x59, 0x0F, 0xD3, 0x4E, 0x59, 0x32, 0x35, 0x87, 0x54, 0xCD, 0x71, 0xD5, 0xF0, 
-0xD8, 0xB0, 0xE0, 0x63, 0xF7, 0x6C, 0xF1, 0x23, 0xF7, 0x6D, 0xF1, 0xDE, 0x23, 0x25, 0x4F, 0xAC, 
-0x1A, 0xDE, 0x77, 0x74, 0xC8, 0x47, 0x4E, 0xAF, 0xF3, 0xFE, 0x63, 0xCB, 0x3C, 0x58, 0x1A, 0x36, 
-0xA9, 0x19, 0xB3, 0x47, 0x29, 0x33, 0xFA, 0x56, 0x25, 0xAE, 0xF2, 0xBE, 0xFE, 0xB2, 0x26, 0x8A, 
-0x21, 0x44, 0x8D, 0x6B, 0x23, 0x55, 0x95, 0x84, 0x48, 0x5C, 0x2B, 0xA8, 0x68, 0x31, 0x3A, 0x4F, 
-0x24, 0x77, 0x34, 0xAE, 0xE3, 0x91, 0xBF, 0xF9, 0xFD, 0xF1, 0x36, 0xAA, 0xCA, 0xC5, 0xF3, 0xDF, 
-0x9C, 0x78, 0x62, 0x37, 0x36, 0xBA, 0xF8, 0x9E, 0xCE, 0x2C, 0xBA, 0xC8, 0xD8, 0x3C, 0xB4, 0xC5, 
-0x70, 0x79, 0xA9, 0x13, 0x1C, 0x4F, 0xAD, 0xA1, 0xC5, 0x79, 0x7E, 0xBB, 0xF1, 0x56, 0xAF, 0xC9, 
-0x98, 0xC4, 0xEC, 0xC9, 0xAC, 0x45, 0x62, 0xE4, 0xE6, 0xD5, 0x6B, 0xD4, 0x55, 0x45, 0x5C, 0x68, 
-0x7A, 0x1C, 0x78, 0xAE, 0xF0, 0xC6, 0x46, 0xD9, 0xDB, 0x89, 0xB7, 0xFA, 0x9B, 0x6F, 0x37, 0xE4, 
-0xC0, 0x08, 0xF1, 0xC1, 0xE3, 0xBC, 0xF8, 0xD0, 0x1A, 0xAC, 0x56, 0x18, 0x05, 0x0A, 0x21, 0x76, 
-0x2E, 0xC5, 0x22, 0xDD, 0xF5, 0xA9, 0x6C, 0x67, 0xDE, 0x68, 0x92, 0xBD, 0x8D, 0x0F, 0x34, 0x6E, 
-0xD1, 0x68, 0x6D, 0xF0, 0x8D, 0x23, 0xCF, 0x7A, 0x28, 0x6C, 0xDA, 0xF5, 0xA2, 0xC8, 0xA2, 0x60, 
-0x5C, 0x45, 0x11, 0xF6, 0x18, 0xC9, 0x84, 0x35, 0x76, 0xB9, 0xDF, 0x68, 0x9E, 0x3E, 0xBE, 0xC1, 
-0x13, 0x47, 0xD7, 0x58, 0xC9, 0x14, 0xB1, 0xAD, 0x70, 0xB1, 0xC5, 0xFB, 0xD4, 0x17, 0x52, 0x58, 
-0x2F, 0x4A, 0xFF, 0xBE, 0x9A, 0x64, 0x6F, 0x8E, 0xDF, 0x37, 0x4B, 0xE1, 0xCD, 0xF1, 0xC4, 0xFB, 
-0x3F, 0x6A, 0x9E, 0xF9, 0xE6, 0x73, 0x3F, 0xD1, 0xB4, 0xFA, 0x3E, 0x45, 0xA9, 0x2C, 0x39, 0x39, 
-0x91, 0x3E, 0x8E, 0xD3, 0xE3, 0x92, 0x8F, 0xBD, 0xE3, 0x2C, 0x8F, 0x1D, 0x5B, 0xE6, 0xC1, 0xC3, 
-0x4B, 0x6C, 0x0D, 0x2C, 0xB6, 0xF1, 0xA8, 0xBA, 0xC5, 0x88, 0xA2, 0xC0, 0xD0, 0xEB, 0x2E, 0xCE, 
-0x4A, 0x47, 0x82, 0x21, 0x75, 0xA5, 0x75, 0x02, 0x14, 0x25, 0x42, 0xE8, 0x30, 0x5E, 0x13, 0x23, 
-0xD1, 0x35, 0x64, 0x56, 0x27, 0x70, 0x2C, 0xD7, 0xF4, 0xC6, 0x7D, 0xEE, 0x7B, 0xF4, 0x01, 0x8E, 
-0x9C, 0x38, 0x46, 0xE3, 0x5A, 0x50, 0x49, 0xB0, 0xD9, 0x74, 0x9D, 0xCA, 0x18, 0x23, 0x9D, 0x7A, 
-0x7A, 0xEA, 0x68, 0x1E, 0xBC, 0x40, 0x3A, 0xEE, 0xA9, 0x1C, 0x48, 0x1C, 0x22, 0x09, 0x67, 0xEB, 
-0xCA, 0x14, 0xE8, 0x6A, 0x61, 0x23, 0x90, 0xA1, 0x68, 0x66, 0x33, 0x2E, 0x9C, 0x7F, 0x81, 0xEB, 
-0x97, 0x2F, 0x23, 0xCE, 0x63, 0x8D, 0x4E, 0x8B, 0xD9, 0x2A, 0x42, 0xA7, 0xF0, 0x14, 0x45, 0x31, 
-0x18, 0x8D, 0xB9, 0xFF, 0xA1, 0x87, 0x18, 0xAD, 0xAC, 0xA0, 0x6C, 0x8E, 0xEB, 0x58, 0x19, 0x49, 
-0x3B, 0x41, 0xF6, 0xE1, 0x92, 0x22, 0xCB, 0x89, 0xAE, 0xE5, 0xEA, 0x6B, 0xAF, 0x73, 0xF1, 0xA5, 
-0x97, 0x70, 0x6D, 0xDD, 0xE5, 0x67, 0x85, 0x92, 0xC5, 0x74, 0x94, 0x24, 0x86, 0x86, 0x3A, 0xD0, 
-0x05, 0x5F, 0x0C, 0x16, 0x70, 0xB7, 0xD9, 0xDB, 0xF5, 0xAA, 0xDE, 0xD6, 0x87, 0xD2, 0x2A, 0x55, 
-0xB0, 0x07, 0x3E, 0x16, 0x97, 0xD3, 0x77, 0x26, 0x9D, 0xEE, 0x6B, 0xAD, 0x48, 0x2F, 0x68, 0xF1, 
-0x87, 0xEE, 0x86, 0x28, 0x50, 0x5D, 0x93, 0x2F, 0x6D, 0xD9, 0x53, 0x63, 0xD1, 0xB9, 0x34, 0x9B, 
-0x5E, 0x37, 0x8E, 0x36, 0x6A, 0xD0, 0x19, 0x2A, 0x2B, 0x10, 0xC9, 0x08, 0x6D, 0x4C, 0x54, 0x31, 
-0x31, 0x94, 0xB1, 0x61, 0x2C, 0xB7, 0x58, 0x8F, 0xDB, 0x9C, 0x2B, 0x84, 0xF7, 0x1E, 0x5B, 0xE7, 
-0x23, 0xF7, 0x1E, 0xE5, 0x5D, 0x47, 0x56, 0x39, 0xD1, 0x8B, 0x0C, 0xFC, 0x14, 0x76, 0x6F, 0x31, 
-0xC4, 0xB3, 0x39, 0xC8, 0x39, 0xB6, 0xBE, 0xC2, 0xC9, 0xF5, 0x75, 0xD6, 0xCA, 0x1C, 0xD5, 0xCC, 
-0x99, 0xB5, 0xBB, 0xB4, 0x51, 0xBA, 0xC9, 0x46, 0x85, 0x31, 0x69, 0xEB, 0x19, 0x62, 0x24, 0x04, 
-0x08, 0x5E, 0x08, 0x41, 0x21, 0xA1, 0x93, 0x0E, 0x55, 0x0A, 0xA5, 0x12, 0x6F, 0x5C, 0xA1, 0x89, 
-0x31, 0x75, 0xBC, 0x15, 0x69, 0x10, 0x25, 0x1D, 0x90, 0xC5, 0xC1, 0x7A, 0x23, 0xDE, 0xF9, 0xDD, 
-0xEE, 0x5D, 0x31, 0xB1, 0xED, 0xD3, 0x73, 0x55, 0xCA, 0x6A, 0x22, 0x92, 0xD6, 0xB1, 0xD1, 0x78, 
-0x05, 0xC5, 0xB0, 0xCF, 0xFD, 0x8F, 0x3C, 0xC4, 0xCA, 0xC6, 0x3A, 0xAD, 0x77, 0xFB, 0x0E, 0xBD, 
-0xFB, 0x83, 0x22, 0xBF, 0x43, 0x7C, 0xB7, 0xA4, 0xD7, 0xFD, 0x39, 0x08, 0x91, 0xD2, 0x64, 0xCC, 
-0x77, 0x27, 0xBC, 0xF8, 0xAD, 0xE7, 0xD8, 0xBE, 0x79, 0x0B, 0x9C, 0x4F, 0xE3, 0xA9, 0xDD, 0x1F, 
-0xD8, 0xFF, 0x0D, 0xDD, 0xD7, 0x8B, 0x25, 0xB0, 0xFF, 0xED, 0xEF, 0xF6, 0x06, 0x7F, 0x87, 0xF8, 
-0xBD, 0xFE, 0x5C, 0x0A, 0x01, 0xC2, 0x7E, 0x55, 0xDB, 0xCD, 0xA3, 0x2E, 0xAE, 0x3E, 0x44, 0x34, 
-0x6D, 0x1B, 0x68, 0x5A, 0x47, 0x55, 0x37, 0x84, 0xA6, 0x4D, 0xE6, 0xAA, 0xFB, 0x7C, 0xDC, 0x74, 
-0xE3, 0x86, 0x02, 0xA3, 0x0D, 0x05, 0x91, 0x5E, 0xAC, 0x19, 0x30, 0xE1, 0x48, 0x1E, 0x79, 0x68, 
-0x25, 0xE7, 0x23, 0x27, 0x0E, 0xF1, 0xD4, 0x89, 0x4D, 0x9E, 0x3C, 0x7D, 0x82, 0xCC, 0x2A, 0x2E, 
-0xDE, 0xB9, 0xC3, 0xED, 0x26, 0x10, 0xD5, 0x18, 0x6C, 0x49, 0x94, 0x86, 0x28, 0xED, 0xF6, 0xEA, 
-0xCA, 0xD2, 0xBF, 0xD9, 0xDD, 0xBB, 0xF4, 0xFC, 0x9B, 0x5F, 0xE1, 0xEF, 0x35, 0xDE, 0x32, 0xE1, 
-0x8A, 0x88, 0x3E, 0x7F, 0xFE, 0xF5, 0xCD, 0x23, 0x47, 0xEE, 0x39, 0x77, 0xFA, 0xF4, 0x23, 0xC7, 
-0x1F, 0x78, 0xE0, 0xDD, 0xAB, 0x3F, 0xFD, 0xD3, 0x3F, 0xCD, 0x7F, 0xF6, 0x9F, 0xFD, 0x57, 0xF2, 
-0x5F, 0xFE, 0x97, 0x7F, 0x59, 0xFD, 0xD0, 0x0F, 0xFD, 0x10, 0xBF, 0xF0, 0x0B, 0xBF, 0xF0, 0x96, 
-0x67, 0xFB, 0x47, 0x7F, 0xF4, 0xCF, 0xE9, 0x5F, 0xFF, 0xCC, 0x67, 0x7E, 0xCC, 0xC7, 0xEC, 0x61, 
-0x4D, 0x5F, 0x6B, 0x0C, 0x19, 0x42, 0xC1, 0x8C, 0x4D, 0x23, 0x3C, 0x79, 0x72, 0x8D, 0x13, 0x43, 
-0xC5, 0xA1, 0x1E, 0x1C, 0x1A, 0xE6, 0xAC, 0x0D, 0x07, 0xF4, 0xB4, 0xC2, 0xCD, 0x6B, 0x9C, 0x9F, 
-0x60, 0x98, 0xA3, 0xC4, 0x13, 0x4C, 0xE2, 0xD2, 0x89, 0x04, 0x12, 0xFD, 0x40, 0x20, 0x2E, 0xC6, 
-0x4D, 0x85, 0xE8, 0xDA, 0x8E, 0xCE, 0x12, 0x70, 0x31, 0x69, 0x13, 0x6C, 0x1E, 0x3E, 0xC4, 0x3D, 
-0x0F, 0xDC, 0x87, 0x29, 0xF3, 0x34, 0x44, 0xA1, 0x3A, 0x39, 0x3B, 0xAD, 0xBA, 0x45, 0xA6, 0xBA, 
-0xE4, 0xD2, 0x7D, 0x1C, 0x20, 0x9B, 0xEC, 0xAF, 0xB2, 0x03, 0x0B, 0x65, 0xC1, 0x4C, 0x58, 0x24, 
-0x62, 0xDD, 0x55, 0xB6, 0x56, 0x6B, 0x32, 0xA5, 0xB9, 0xFE, 0xFA, 0x15, 0x5E, 0x7E, 0xFE, 0x05, 
-0xDA, 0x6A, 0x8E, 0x12, 0x45, 0x2A, 0x2A, 0xBA, 0xA1, 0x01, 0x93, 0x30, 0x31, 0x8C, 0xE1, 0xF8, 
-0xF1, 0xE3, 0x9C, 0xBE, 0xE7, 0x2C, 0xA6, 0xC8, 0xE8, 0x00, 0x8B, 0x44, 0xC2, 0xD7, 0x0A, 0x89, 
-0x21, 0x8D, 0x1B, 0x2A, 0x4D, 0x69, 0x32, 0xA6, 0x3B, 0x3B, 0xBC, 0x74, 0xFE, 0x79, 0x76, 0x6F, 
-0x6F, 0xA3, 0xB5, 0xC2, 0x74, 0xB0, 0xC3, 0xC1, 0x66, 0x99, 0xB2, 0x77, 0x27, 0x81, 0x16, 0x57, 
-0x8E, 0xEA, 0x16, 0xF9, 0x7E, 0x67, 0xFC, 0x77, 0x58, 0xEF, 0xFB, 0xC7, 0xE0, 0xBB, 0x5D, 0x18, 
-0x6F, 0xF1, 0xD8, 0xC1, 0xE7, 0xEF, 0x6F, 0x7B, 0xBB, 0xD7, 0xF7, 0x86, 0xC7, 0x00, 0x91, 0x6E, 
-0x2B, 0x8D, 0x42, 0xBC, 0xD0, 0xCC, 0x1B, 0xAA, 0xCA, 0xD1, 0xB6, 0x9E, 0x18, 0x35, 0x46, 0xA7, 
-0x13, 0x2C, 0xCE, 0x63, 0x42, 0x4B, 0x0F, 0xC5, 0x40, 0xC1, 0x88, 0xC8, 0x12, 0x53, 0x4E, 0x99, 
-0x09, 0x8F, 0xAF, 0x17, 0x7C, 0xE8, 0x9E, 0x13, 0x3C, 0x7D, 0x6A, 0x8B, 0xB3, 0x83, 0x8C, 0x61, 
-0xB3, 0x87, 0xAD, 0xF6, 0xC8, 0xFD, 0x9C, 0x92, 0x88, 0x09, 0x2D, 0x79, 0x8C, 0x8C, 0x32, 0xC3, 
-0xDA, 0x68, 0xC0, 0xDA, 0x30, 0x67, 0x60, 0x03, 0x3D, 0x6D, 0xA8, 0x9B, 0xC4, 0x65, 0xD6, 0xA1, 
-0x45, 0xC5, 0x4E, 0x6E, 0x50, 0xA5, 0x26, 0xAD, 0x62, 0x31, 0xB1, 0x28, 0x48, 0x48, 0x54, 0xCC, 
-0x28, 0x8B, 0x3B, 0x45, 0x5A, 0x37, 0x48, 0xBA, 0xB1, 0x1D, 0x8C, 0xF4, 0x3E, 0xDF, 0xF0, 0xAD, 
-0x83, 0x29, 0x6B, 0x3F, 0xF6, 0x9F, 0xA3, 0x52, 0xB2, 0x50, 0x2A, 0x8D, 0x5C, 0x27, 0x4A, 0x94, 
-0x46, 0x8C, 0xC2, 0x23, 0x1C, 0x3D, 0x79, 0x9C, 0xD3, 0x67, 0xCF, 0x92, 0xF7, 0x4A, 0x5A, 0xE7, 
-0xD2, 0x2E, 0x6A, 0x71, 0x3E, 0xBB, 0x6A, 0xEE, 0xAD, 0xE2, 0xBB, 0x25, 0xDA, 0x37, 0x44, 0x4C, 
-0x23, 0xCA, 0x56, 0x69, 0x5E, 0x7D, 0xF9, 0x02, 0xAF, 0xBE, 0xFC, 0x0A, 0xED, 0xBC, 0x4A, 0xF0, 
-0x95, 0xD6, 0x6F, 0x78, 0xDD, 0xDF, 0xAB, 0xBA, 0xFD, 0x6E, 0xAF, 0xE1, 0xAD, 0xE2, 0xE0, 0x73, 
-0xDF, 0xEE, 0xCF, 0x2D, 0xDE, 0xCB, 0xC1, 0xF7, 0xA4, 0x14, 0x89, 0x02, 0x2A, 0x82, 0x51, 0x16, 
-0xAD, 0x3B, 0xD8, 0x2F, 0x2A, 0xBC, 0x57, 0x04, 0x9F, 0x86, 0x5C, 0xBC, 0x4F, 0x5C, 0x6D, 0x24, 
-0x35, 0xBE, 0xD2, 0xB0, 0x51, 0xE2, 0xC4, 0xAB, 0x28, 0xD8, 0x18, 0xC9, 0x62, 0x45, 0x4F, 0xA6, 
-0x6C, 0x30, 0xE7, 0x94, 0x8D, 0x3C, 0xB4, 0x55, 0xF2, 0xC4, 0xE1, 0x21, 0x1F, 0xBD, 0xFF, 0x04, 
-0xA7, 0x96, 0x4A, 0x46, 0xBD, 0x9C, 0x6B, 0x77, 0xB6, 0xF9, 0xFA, 0xD5, 0x6B, 0xDC, 0xF6, 0x1A, 
-0xCC, 0x98, 0x36, 0xA4, 0xA9, 0x32, 0x63, 0xB8, 0x32, 0x1C, 0x0C, 0xFE, 0xD5, 0xEE, 0xE4, 0xE2, 
-0x85, 0x03, 0x2F, 0x79, 0x3F, 0xE4, 0xE7, 0xC5, 0x7C, 0xFC, 0x67, 0xFE, 0x66, 0xF6, 0x9F, 0xFC, 
-0x91, 0xFF, 0x75, 0xE9, 0xCB, 0xE1, 0xD6, 0x99, 0xE3, 0x4F, 0x9C, 0x3C, 0x7E, 0xEC, 0xC1, 0xB3, 
-0xC3, 0xFE, 0xD1, 0x07, 0xCF, 0x9E, 0x7E, 0xF8, 0xC4, 0x7D, 0x0F, 0x3C, 0x96, 0xFD, 0xA3, 0x7F, 
-0xF4, 0xB7, 0xF7, 0x7E, 0xEE, 0xE7, 0x7E, 0x6E, 0x7F, 0x21, 0x7D, 0xC7, 0x51, 0x11, 0x11, 0xFD, 
-0x81, 0xF7, 0xFC, 0xD1, 0xC7, 0xBF, 0xF6, 0xCC, 0xB7, 0xFF, 0xEA, 0x7C, 0x3E, 0x79, 0x32, 0xB3, 
-0x83, 0x4C, 0x19, 0x35, 0x55, 0xE8, 0x17, 0xB3, 0xDC, 0x5C, 0xD5, 0x2A, 0xDC, 0x1C, 0x2D, 0x0F, 
-0x5E, 0x79, 0xE4, 0xD1, 0x47, 0xBE, 0xF9, 0xD4, 0x13, 0xEF, 0xB8, 0x02, 0xA3, 0x39, 0x5C, 0xA9, 
-0x3F, 0xF1, 0x89, 0x4F, 0xC4, 0xEE, 0xE7, 0xD5, 0x91, 0xCD, 0x8F, 0xFC, 0xDF, 0x6F, 0xDE, 0xAA, 
-0xFF, 0x37, 0xA8, 0x7E, 0xA9, 0x23, 0xF4, 0x08, 0x2C, 0xB1, 0xCB, 0x03, 0x7D, 0xC3, 0xFF, 0xEA, 
-0x23, 0x8F, 0xF1, 0xE8, 0x91, 0x1E, 0xA5, 0x9B, 0x90, 0x19, 0xCD, 0x6E, 0xCC, 0xB9, 0x3E, 0x0B, 
-0x5C, 0xDC, 0xA9, 0xB9, 0x70, 0x7D, 0x87, 0x97, 0x2E, 0xBE, 0xCA, 0x8B, 0x3B, 0xB7, 0xB9, 0x48, 
-0xA4, 0xA2, 0x8F, 0x68, 0x4B, 0x54, 0x19, 0x51, 0x52, 0x3F, 0x59, 0x91, 0x92, 0xA8, 0x04, 0x87, 
-0xB5, 0x3A, 0xD9, 0x9E, 0x97, 0x16, 0x55, 0xE6, 0x3C, 0xF0, 0xD8, 0x43, 0x3C, 0xFE, 0x9E, 0x77, 
-0xD3, 0x5B, 0x5A, 0x42, 0xB0, 0x34, 0x2E, 0xD0, 0x04, 0x87, 0xEF, 0xDC, 0x4F, 0x53, 0xF2, 0xBD, 
-0x2B, 0xBD, 0xA8, 0x25, 0x2D, 0x4C, 0xA0, 0xC3, 0x70, 0xBB, 0x81, 0x62, 0x11, 0xDC, 0xC2, 0xBA, 
-0xF7, 0x00, 0x94, 0x40, 0x14, 0xAC, 0x86, 0x1C, 0x8D, 0x0D, 0xF0, 0xB5, 0x2F, 0x7E, 0x99, 0xE7, 
-0xBF, 0xF5, 0x6D, 0x4A, 0x6B, 0x08, 0x2E, 0x76, 0x44, 0xFB, 0x84, 0xFF, 0x89, 0xB5, 0xA0, 0x14, 
-0xFD, 0xD1, 0x98, 0xC7, 0x9E, 0x7C, 0x27, 0x87, 0x8F, 0x1D, 0xA7, 0x55, 0x82, 0x27, 0xE2, 0x3B, 
-0x9A, 0x99, 0x28, 0x08, 0xAE, 0x25, 0x53, 0x9A, 0x52, 0x5B, 0x6C, 0x10, 0x2E, 0x5D, 0xB8, 0xC0, 
-0x57, 0xBF, 0xF8, 0x05, 0x7C, 0xDD, 0x60, 0x34, 0x28, 0x9F, 0xCE, 0xD5, 0x02, 0x1B, 0x06, 0xB0, 
-0x45, 0x9E, 0x60, 0x92, 0x0E, 0x53, 0xA6, 0xBB, 0x40, 0x21, 0x0D, 0x02, 0xA4, 0x7F, 0xA4, 0x4F, 
-0xDF, 0x2D, 0x7E, 0xA7, 0x0B, 0x42, 0x16, 0x99, 0xBB, 0xC3, 0x31, 0xF7, 0xBF, 0xBF, 0xF8, 0x7B, 
-0x0B, 0x1C, 0xB1, 0x1B, 0x89, 0x3A, 0x98, 0x70, 0x01, 0xBC, 0x73, 0x09, 0x27, 0x0F, 0xE0, 0x1A, 
-0x4F, 0x53, 0x27, 0x11, 0x23, 0xD5, 0xDD, 0x04, 0xB5, 0x86, 0xE0, 0x2A, 0x72, 0x22, 0x63, 0xA3, 
-0x29, 0x42, 0x85, 0xA1, 0xE1, 0x90, 0x19, 0x71, 0xDF, 0x46, 0x8F, 0x47, 0x37, 0x22, 0xF7, 0xAE, 
-0x97, 0x1C, 0x1B, 0x8F, 0x29, 0x9A, 0x1A, 0x5D, 0xCD, 0xE8, 0xA9, 0x48, 0xAE, 0x05, 0x89, 0x2D, 
-0xBD, 0xBC, 0x87, 0xF7, 0x9E, 0xC6, 0x09, 0x5E, 0x19, 0x7C, 0xDE, 0xA3, 0xC9, 0x2C, 0x13, 0x51, 
-0xDC, 0x92, 0x82, 0xDF, 0xBA, 0x32, 0xE7, 0xC5, 0xED, 0x8A, 0x97, 0xAE, 0xDE, 0xE0, 0x46, 0x6C, 
-0x98, 0x52, 0xE0, 0x54, 0x1F, 0xA7, 0xFB, 0x78, 0x95, 0xE1, 0x42, 0x62, 0x40, 0x2C, 0x84, 0x4E, 
-0xB4, 0x06, 0x9D, 0x19, 0xB2, 0xC2, 0x62, 0x73, 0x43, 0xD4, 0x01, 0x75, 0xA0, 0x9A, 0xFD, 0x0E, 
-0xBC, 0xFC, 0x00, 0x55, 0x89, 0xEF, 0x48, 0x82, 0x9D, 0xC0, 0xBD, 0x78, 0x54, 0xD4, 0x58, 0x9D, 
-0xF8, 0xE7, 0x21, 0x46, 0x3C, 0x8A, 0x68, 0x0C, 0xD9, 0x68, 0xC0, 0xBB, 0xDE, 0xFF, 0x5E, 0x0E, 
-0x1F, 0x3F, 0x01, 0x46, 0xE3, 0x25, 0xC1, 0x5E, 0x0B, 0x85, 0xB8, 0x83, 0x22, 0xE0, 0x77, 0x5F, 
-0xC3, 0xF7, 0x4E, 0xB4, 0x07, 0x1F, 0xD7, 0x4A, 0x51, 0x9A, 0x8C, 0x76, 0x3A, 0xE7, 0x0B, 0x9F, 
-0xFD, 0x0D, 0x6E, 0x5E, 0xBE, 0x8A, 0xAF, 0x9A, 0x7D, 0x0C, 0x1D, 0x12, 0x54, 0xF6, 0xE6, 0xD8, 
-0xEF, 0x13, 0x74, 0x09, 0xF9, 0x77, 0x5A, 0x27, 0x6F, 0x15, 0xD2, 0x55, 0xE9, 0xBF, 0x53, 0xBC, 
-0x75, 0xB2, 0x55, 0x68, 0x89, 0x77, 0x79, 0xCB, 0xA2, 0x92, 0x86, 0x86, 0xA8, 0xE4, 0xB6, 0x10, 
-0xEE, 0x8A, 0xFF, 0xC7, 0x98, 0xFA, 0x1A, 0x56, 0x2B, 0x32, 0x45, 0xD2, 0xF1, 0x8D, 0xA1, 0x1B, 
-0xE6, 0x30, 0xF4, 0x88, 0x8C, 0x70, 0x1C, 0x33, 0xF0, 0xF8, 0xD6, 0x32, 0x0F, 0x1F, 0x5B, 0xE2, 
-0xF0, 0x66, 0xC6, 0x5A, 0x5F, 0x28, 0x9B, 0x39, 0x8A, 0x8C, 0xCA, 0x8C, 0xF9, 0xF4, 0x2B, 0xD7, 
-0xF9, 0xC7, 0xCF, 0xBE, 0xC6, 0x85, 0x76, 0x80, 0x56, 0x47, 0xA9, 0x24, 0x50, 0x18, 0x4F, 0x1D, 
-0xB6, 0x7F, 0xE3, 0xDC, 0x3D, 0x47, 0xFF, 0xF2, 0x8B, 0x2F, 0xFE, 0xD2, 0x37, 0xBA, 0xD7, 0xA9, 
-0xFE, 0xFE, 0xDF, 0xFF, 0xFB, 0xBD, 0x9D, 0x1D, 0xB3, 0xFC, 0xC9, 0x4F, 0x7E, 0xFA, 0xD4, 0x6B, 
-0x5B, 0xFD, 0x9B, 0x96, 0x00, 0x00, 0xBA, 0x00, 0x49, 0x44, 0x41, 0x54, 0x17, 0xAF, 0x3C, 0x38, 
-0xD9, 0xAD, 0x0F, 0x79, 0x17, 0x8E, 0x18, 0x9B, 0xDF, 0xBB, 0x37, 0x99, 0x1C, 0x0D, 0x12, 0x87, 
-0x2A, 0x48, 0x6E, 0x8C, 0xF2, 0xC6, 0xC4, 0x97, 0xEE, 0x7F, 0xF0, 0xF4, 0xFF, 0xED, 0xBF, 0xFE, 
-0x7F, 0xFC, 0xF5, 0x4F, 0x7D, 0xF8, 0xC3, 0x1F, 0xF6, 0xBC, 0x75, 0x85, 0x7B, 0x6A, 0xE9, 0x97, 
-0x3F, 0xF9, 0xCB, 0x7F, 0x6D, 0x3E, 0xE7, 0x3F, 0x34, 0x66, 0xBC, 0xD5, 0xEB, 0x8D, 0x57, 0xDB, 
-0x86, 0xCD, 0x18, 0xB8, 0xB7, 0x2C, 0x87, 0xEF, 0x6C, 0x5B, 0x79, 0xDF, 0x9D, 0xED, 0xDD, 0x0F, 
-0x5D, 0x78, 0xF1, 0xD2, 0x8F, 0x7D, 0xF9, 0x2B, 0xBF, 0xFD, 0xD1, 0xAF, 0x7D, 0xED, 0x6B, 0x8F, 
-0xBE, 0xF2, 0xD2, 0x9D, 0x43, 0x0F, 0x3D, 0xFC, 0xF4, 0xC6, 0x07, 0x3E, 0xF0, 0x87, 0xE5, 0xB3, 
-0x9F, 0x7D, 0x26, 0xFF, 0xE6, 0x6F, 0x3F, 0xFF, 0x23, 0xCE, 0xC5, 0xC7, 0x05, 0x65, 0xBD, 0x08, 
-0x1A, 0x21, 0xA3, 0x65, 0x2D, 0x83, 0x77, 0x9E, 0xD9, 0xE2, 0xE4, 0x5A, 0x49, 0xE9, 0xA6, 0x18, 
-0x37, 0x07, 0xD7, 0xD0, 0xB3, 0x9A, 0x43, 0xEB, 0xCB, 0x9C, 0xD8, 0x18, 0xB1, 0x5A, 0x0A, 0x03, 
-0x15, 0xA0, 0x15, 0x0A, 0x22, 0x84, 0x1A, 0xA4, 0xC1, 0x88, 0x74, 0xE2, 0x1D, 0x42, 0x13, 0x1D, 
-0x56, 0x1B, 0x02, 0xE0, 0x63, 0xC0, 0xDA, 0x02, 0x44, 0x61, 0xF3, 0x1E, 0x12, 0x14, 0x21, 0x08, 
-0x5A, 0x59, 0x8C, 0x35, 0x14, 0x65, 0x49, 0x51, 0xE4, 0x88, 0x08, 0x3E, 0xF8, 0x34, 0x67, 0x6D, 
-0x12, 0x83, 0x62, 0x7F, 0xC1, 0x49, 0x47, 0xA7, 0x38, 0x10, 0xA1, 0xE3, 0xD9, 0x6A, 0x73, 0x37, 
-0x73, 0x69, 0xA5, 0x50, 0x31, 0xA2, 0x82, 0x30, 0xDB, 0x9B, 0xF0, 0xD2, 0xF3, 0xCF, 0xB1, 0xB7, 
-0xB3, 0x43, 0x61, 0x32, 0x42, 0x48, 0x2C, 0x08, 0x6D, 0x35, 0x62, 0xBA, 0xD7, 0x55, 0x14, 0x6C, 
-0x1D, 0x3A, 0xCC, 0xA9, 0xD3, 0xA7, 0x91, 0xAE, 0x2A, 0x75, 0x1D, 0xA6, 0x2B, 0x92, 0x1A, 0x2A, 
-0x12, 0x3C, 0xB9, 0xB6, 0x58, 0x14, 0x93, 0x3B, 0xBB, 0x5C, 0x7D, 0xFD, 0x12, 0xD7, 0xAF, 0x5C, 
-0xE9, 0x48, 0xDC, 0x69, 0x9B, 0x64, 0x74, 0x07, 0x8B, 0x74, 0x3A, 0x10, 0xBA, 0x9B, 0x04, 0x7A, 
-0x43, 0x45, 0xD1, 0xDD, 0x40, 0xF6, 0x2F, 0xCE, 0x37, 0x3D, 0xBE, 0xFF, 0xBC, 0xB7, 0xA8, 0x5C, 
-0x17, 0xB1, 0x78, 0x4C, 0x29, 0x95, 0xF4, 0x29, 0x94, 0x7A, 0x83, 0x10, 0x09, 0xA4, 0xCA, 0x76, 
-0x3F, 0xD9, 0x42, 0x1A, 0x28, 0x38, 0x20, 0xE9, 0x97, 0x92, 0xB0, 0x10, 0x5A, 0x87, 0xAB, 0x5B, 
-0xEA, 0x79, 0x8B, 0x6F, 0x1C, 0x44, 0x83, 0xD1, 0x59, 0x6A, 0x74, 0xA2, 0x30, 0xD1, 0x91, 0xD3, 
-0x32, 0xA6, 0x66, 0x49, 0x66, 0x6C, 0x32, 0xE3, 0x9E, 0x5C, 0xF1, 0xD4, 0xC9, 0x75, 0xDE, 0x7F, 
-0x66, 0x9D, 0xA7, 0x8F, 0x2E, 0x73, 0x44, 0x7B, 0xB2, 0x6A, 0x8A, 0xAD, 0xA6, 0xF4, 0x88, 0xF4, 
-0x8C, 0xC6, 0x90, 0xAA, 0x9A, 0xE0, 0x1C, 0xC4, 0x88, 0x55, 0x42, 0x66, 0x12, 0x5E, 0x5B, 0x68, 
-0xA1, 0x6F, 0x22, 0x23, 0x9B, 0x71, 0x78, 0x79, 0x99, 0xF5, 0x32, 0x67, 0x9C, 0x41, 0xEE, 0x3D, 
-0xBE, 0x69, 0xA8, 0x99, 0xE3, 0xC4, 0x75, 0xCD, 0x94, 0x05, 0x4E, 0x97, 0x5E, 0x77, 0x5C, 0x94, 
-0xB9, 0x5D, 0x83, 0x54, 0xE9, 0x4E, 0xA3, 0x63, 0xFF, 0x98, 0xBC, 0x31, 0xF1, 0xDD, 0x3D, 0x84, 
-0xDF, 0x99, 0x04, 0xEF, 0xDE, 0x08, 0xD3, 0x22, 0xD3, 0x2A, 0x61, 0x34, 0x21, 0x46, 0x44, 0x59, 
-0xC4, 0x68, 0x8E, 0x9E, 0x38, 0xCE, 0xBD, 0x0F, 0x3E, 0x80, 0xB2, 0x96, 0x26, 0x78, 0x4C, 0x96, 
-0x46, 0xBC, 0x75, 0x77, 0x63, 0xFD, 0x5E, 0x54, 0xC5, 0x37, 0xC7, 0x9B, 0x13, 0xB1, 0x02, 0x72, 
-0x9B, 0xA1, 0xA2, 0x70, 0xF3, 0xCA, 0x35, 0x5E, 0xF8, 0xF6, 0x73, 0xA8, 0x10, 0x93, 0x4C, 0xEA, 
-0xE2, 0xA9, 0xFA, 0xEE, 0x10, 0x8B, 0x1C, 0x60, 0xE5, 0xEC, 0x5F, 0x12, 0x8B, 0xAF, 0xBF, 0xCB, 
-0x5A, 0xF9, 0x5E, 0x91, 0xD6, 0xCF, 0x9B, 0xBF, 0xFB, 0x9D, 0x89, 0xF5, 0xE0, 0x5A, 0x3C, 0xF8, 
-0x6F, 0xE9, 0xC6, 0xDA, 0x25, 0x6A, 0x82, 0x13, 0xBC, 0x8F, 0xB8, 0x36, 0xE2, 0xBD, 0xE0, 0x7D, 
-0xE7, 0x8B, 0x18, 0x3C, 0x48, 0xC4, 0x88, 0x90, 0x01, 0x26, 0xB4, 0x28, 0x69, 0xC8, 0xF0, 0xF4, 
-0x69, 0x18, 0x33, 0xE1, 0x74, 0xA1, 0x78, 0x64, 0x6D, 0xC0, 0x53, 0x47, 0x57, 0x78, 0xFF, 0xB1, 
-0x75, 0x1E, 0xDC, 0xEC, 0xB3, 0x56, 0x7A, 0x8A, 0x38, 0x43, 0xAA, 0x19, 0x59, 0x5E, 0x10, 0xF3, 
-0x01, 0x2F, 0xEF, 0xCC, 0xF9, 0xFA, 0xAD, 0x5D, 0xEE, 0x84, 0x0C, 0xAB, 0x46, 0x64, 0x92, 0x23, 
-0xD2, 0x90, 0x65, 0xF6, 0xB2, 0x6B, 0xC3, 0x97, 0xDF, 0xFF, 0xC1, 0x1F, 0x9F, 0x9E, 0x3C, 0x7C, 
-0xFF, 0xB9, 0xBF, 0xFD, 0xB7, 0x7F, 0xF6, 0x47, 0x7E, 0xF5, 0x57, 0xBE, 0xFA, 0x67, 0x3E, 0xFD, 
-0xCB, 0x9F, 0xF9, 0xF3, 0xAF, 0xBC, 0xF4, 0xFA, 0x9F, 0x9E, 0xCF, 0xE4, 0x27, 0x67, 0xD3, 0xF6, 
-0x23, 0xD6, 0xF4, 0x9F, 0xDC, 0x9D, 0xD4, 0xA7, 0xF3, 0xBC, 0xBF, 0x11, 0x83, 0x5A, 0xCA, 0x8B, 
-0xDE, 0x20, 0x7A, 0x86, 0x6D, 0x68, 0x8E, 0x6D, 0xDF, 0xBA, 0x69, 0xEF, 0x7B, 0xF0, 0xDE, 0xCF, 
-0x7E, 0xFA, 0xD3, 0xFF, 0x76, 0xC6, 0x5B, 0x25, 0x5C, 0x37, 0x51, 0x47, 0x5F, 0x78, 0xE5, 0xF5, 
-0x3F, 0x1D, 0xE3, 0xE0, 0x3E, 0x1F, 0x4B, 0x1D, 0x63, 0x4E, 0x96, 0xF7, 0x55, 0x14, 0xAB, 0x9B, 
-0x26, 0x1A, 0x54, 0x6E, 0x8B, 0x62, 0x38, 0x8C, 0x41, 0x6F, 0xBA, 0x56, 0x9D, 0xAB, 0xAB, 0xF0, 
-0xC4, 0xF6, 0xF6, 0xEE, 0x47, 0x5F, 0x7F, 0xFD, 0xE6, 0x8F, 0x3D, 0xFF, 0xDC, 0xCB, 0x1F, 0xF8, 
-0xD2, 0x17, 0xBE, 0xFE, 0xC1, 0xA6, 0x75, 0x1F, 0x56, 0x9A, 0x95, 0x08, 0x2A, 0x4A, 0x1A, 0xC7, 
-0xD4, 0xE2, 0x18, 0x68, 0xCF, 0x43, 0xA7, 0x36, 0x38, 0xB1, 0xDA, 0xA7, 0x0C, 0x35, 0xB9, 0x0A, 
-0x58, 0x89, 0xA8, 0xD8, 0x12, 0x9B, 0x3D, 0x4C, 0x98, 0xB0, 0x39, 0x80, 0xB3, 0x47, 0xD7, 0x38, 
-0xB4, 0xBC, 0xCE, 0x4A, 0xD9, 0x43, 0xD7, 0x15, 0xA1, 0x9D, 0x13, 0xF0, 0x88, 0xE8, 0x34, 0xC2, 
-0x64, 0xD2, 0x4C, 0x7E, 0x54, 0x16, 0xA5, 0xD2, 0xC0, 0x43, 0xF0, 0x9A, 0xBD, 0xED, 0x09, 0x97, 
-0x2E, 0x5C, 0xE5, 0xEA, 0x95, 0xEB, 0x34, 0xBE, 0xA5, 0x6A, 0x6B, 0xB2, 0x3C, 0x27, 0xCF, 0xF3, 
-0xB4, 0xC5, 0x57, 0x0A, 0x4C, 0x12, 0x73, 0x0E, 0x21, 0x40, 0x07, 0xCF, 0x0A, 0xA4, 0xE4, 0x46, 
-0x97, 0x7C, 0x49, 0x84, 0x14, 0x63, 0x2C, 0x2C, 0x3A, 0xC7, 0x4A, 0x61, 0xB4, 0x41, 0x85, 0x40, 
-0xA8, 0x1B, 0x2E, 0xBD, 0xFC, 0x32, 0x97, 0x5F, 0xBB, 0x04, 0x3E, 0xA4, 0x13, 0x6F, 0xD2, 0x30, 
-0x86, 0x97, 0x24, 0x95, 0x28, 0xC0, 0xEA, 0xDA, 0x3A, 0x67, 0xCE, 0x9E, 0x63, 0xB4, 0x92, 0x04, 
-0xC6, 0xE3, 0xA2, 0xD1, 0xB5, 0xE0, 0x47, 0x02, 0x12, 0xD2, 0x88, 0xB3, 0xAF, 0x1A, 0x2E, 0xBF, 
-0x7A, 0x31, 0xE9, 0x93, 0xCE, 0xE7, 0xE9, 0x82, 0x53, 0x09, 0x4A, 0x50, 0xDD, 0xF3, 0x0F, 0x56, 
-0xB4, 0x2C, 0x78, 0x96, 0xDD, 0xC5, 0x72, 0xF0, 0x63, 0xF1, 0xF8, 0x9B, 0x2F, 0x96, 0x37, 0x7F, 
-0xBD, 0x88, 0x83, 0x8B, 0x7D, 0x3F, 0x16, 0x79, 0x76, 0xD1, 0x6D, 0xEF, 0x44, 0x3F, 0x16, 0x99, 
-0x66, 0xBF, 0xE1, 0xD1, 0x3D, 0x51, 0x3A, 0x7B, 0xA1, 0xC6, 0x07, 0x7C, 0xE3, 0xF0, 0x75, 0x4D, 
-0x74, 0x81, 0xE8, 0x25, 0x49, 0x2A, 0xAA, 0x0C, 0xAD, 0xB3, 0x04, 0xBD, 0x88, 0xA7, 0xAF, 0x3D, 
-0x3D, 0x99, 0xB3, 0xC4, 0x84, 0x93, 0x59, 0xE0, 0xE9, 0x13, 0x2B, 0xFC, 0xE8, 0x83, 0xC7, 0x79, 
-0xEA, 0xD8, 0x98, 0xD3, 0xB9, 0x63, 0x54, 0xCD, 0xC8, 0xAA, 0x8A, 0x5C, 0x84, 0x32, 0xB7, 0x18, 
-0x89, 0xB8, 0x7A, 0x86, 0xF2, 0x9E, 0x7E, 0x66, 0xC9, 0x8D, 0xDD, 0x4F, 0x1A, 0x41, 0x49, 0x1A, 
-0x1D, 0x8E, 0x11, 0xE5, 0x22, 0xB6, 0x6D, 0x59, 0xD3, 0x9A, 0xB5, 0x4C, 0xB1, 0x31, 0xEE, 0xB1, 
-0x3C, 0xEA, 0x63, 0x73, 0x8D, 0x6B, 0x1C, 0xCE, 0x77, 0x8E, 0xB8, 0xDA, 0x24, 0xD1, 0xF7, 0xFD, 
-0xD4, 0x96, 0x6E, 0x6E, 0x12, 0x63, 0x52, 0x80, 0x13, 0x97, 0x70, 0xD8, 0xFD, 0xE3, 0xD3, 0x1D, 
-0x8F, 0xC5, 0x71, 0xDC, 0xCF, 0x5C, 0x6F, 0x51, 0x09, 0xEE, 0xFF, 0x53, 0xD0, 0x2A, 0x0D, 0xB8, 
-0x48, 0x4C, 0x37, 0x4B, 0x9B, 0x15, 0xE4, 0xBD, 0x92, 0x7B, 0x1F, 0x7E, 0x98, 0x95, 0xF5, 0xF5, 
-0x74, 0x13, 0x8E, 0x21, 0xA9, 0xC5, 0xC5, 0xF4, 0xF7, 0xE9, 0x0E, 0x3B, 0x6F, 0xFE, 0xBD, 0x07, 
-0x92, 0x96, 0x7A, 0x0B, 0xA6, 0xC2, 0x22, 0x14, 0x49, 0x89, 0x6C, 0xBA, 0xB3, 0xCB, 0x4B, 0x2F, 
-0xBC, 0xC8, 0x8D, 0xAB, 0xD7, 0xB0, 0x2A, 0xF5, 0x17, 0xF4, 0xE2, 0x5C, 0x77, 0xEA, 0x65, 0x2C, 
-0xDE, 0xC1, 0x81, 0x75, 0xB4, 0xFF, 0xBD, 0xB7, 0xF8, 0xFB, 0x6F, 0x37, 0xDE, 0x9C, 0x70, 0xBF, 
-0xDB, 0x6B, 0x3D, 0x18, 0x07, 0x9F, 0x23, 0x5E, 0xE1, 0xBD, 0xE0, 0x9C, 0xE0, 0x5C, 0x20, 0x84, 
-0x0E, 0x5B, 0x97, 0x04, 0x05, 0x16, 0x59, 0x86, 0x41, 0x91, 0x89, 0x60, 0xC4, 0xA1, 0x68, 0x29, 
-0x70, 0x2C, 0xE9, 0x9C, 0x63, 0x85, 0xE2, 0x63, 0x27, 0xD7, 0xF8, 0xC0, 0xF1, 0x11, 0x4F, 0x9F, 
-0x5C, 0xE3, 0x91, 0xCD, 0x01, 0x27, 0x0A, 0xA1, 0x0C, 0x53, 0xE6, 0xCD, 0x2E, 0xDE, 0xB5, 0x58, 
-0xD3, 0x43, 0xEC, 0x80, 0xBD, 0x58, 0xF0, 0xEC, 0xF5, 0x1D, 0xBE, 0x7E, 0x6B, 0x87, 0x3B, 0x01, 
-0xAC, 0xA4, 0xDF, 0x5B, 0x53, 0x83, 0xD2, 0x3D, 0xA3, 0x39, 0x79, 0xE1, 0xC2, 0x85, 0x9F, 0xB8, 
-0xF4, 0xDA, 0xA5, 0xFF, 0xF8, 0xC6, 0x8D, 0x5B, 0x7F, 0x72, 0x3E, 0x6F, 0x9E, 0x6E, 0x1B, 0xCE, 
-0x4A, 0xC8, 0xD7, 0x7D, 0xD0, 0xBD, 0x7E, 0x6F, 0x2D, 0x9B, 0x57, 0xDE, 0x68, 0xAC, 0xD6, 0x2A, 
-0x57, 0x83, 0xD1, 0x80, 0xBD, 0xE9, 0x1E, 0xFD, 0x7C, 0xA0, 0xDA, 0xD0, 0xA8, 0xDC, 0xDA, 0xBD, 
-0xE7, 0xBF, 0xFD, 0xEC, 0xAF, 0xDE, 0xD9, 0xBB, 0x72, 0x93, 0xB7, 0x4A, 0xB8, 0x4F, 0xBD, 0xEF, 
-0x87, 0xED, 0x2B, 0x2F, 0xBD, 0xF2, 0x4E, 0xA4, 0xFF, 0x88, 0x31, 0x3D, 0x23, 0xA2, 0x94, 0xC4, 
-0x4E, 0x71, 0x47, 0x1B, 0x8C, 0x36, 0xD4, 0x75, 0x8D, 0xD2, 0x05, 0x36, 0x2B, 0x54, 0xF4, 0xCA, 
-0xF6, 0x47, 0x2B, 0x65, 0x5D, 0x57, 0x63, 0x1F, 0xCD, 0x49, 0x6B, 0xEC, 0x83, 0x22, 0x2C, 0x2B, 
-0xA5, 0xB5, 0xD6, 0x96, 0xA0, 0x2D, 0xD6, 0x68, 0x08, 0x2D, 0x16, 0xCF, 0xB9, 0x13, 0x5B, 0xAC, 
-0xAC, 0x2C, 0x11, 0x42, 0xA4, 0x6A, 0x3C, 0x6D, 0x4C, 0x78, 0xA7, 0x06, 0x62, 0x3B, 0x87, 0x66, 
-0x8E, 0x8E, 0x81, 0x95, 0xE1, 0x90, 0x8D, 0xE1, 0x80, 0xF5, 0x51, 0xC9, 0x48, 0x1B, 0x74, 0xD3, 
-0xE2, 0x7D, 0xC2, 0x77, 0x73, 0x0C, 0x31, 0x78, 0x8C, 0xD2, 0x14, 0xB6, 0xA0, 0xF6, 0x35, 0x65, 
-0x31, 0x82, 0xA8, 0x70, 0x4D, 0x45, 0x35, 0x6F, 0xB8, 0x7A, 0xF9, 0x12, 0xB7, 0x6E, 0xDE, 0x64, 
-0xB6, 0x37, 0x4D, 0xCD, 0x83, 0xBC, 0xA0, 0xC8, 0x73, 0x34, 0x0A, 0xD7, 0x36, 0xFB, 0x4D, 0xB3, 
-0x94, 0x60, 0xEF, 0x6E, 0x0B, 0x95, 0xA4, 0x55, 0x17, 0x11, 0x94, 0x49, 0xBC, 0xC4, 0x24, 0x0E, 
-0x9E, 0xB8, 0x79, 0xD1, 0x39, 0xDA, 0x79, 0xC5, 0x0B, 0xCF, 0x3E, 0xCB, 0xEE, 0xF6, 0x1D, 0x72, 
-0x63, 0x88, 0xDE, 0x93, 0x17, 0x05, 0xCA, 0x40, 0xD3, 0x36, 0xA0, 0x13, 0x15, 0xED, 0xD0, 0x91, 
-0x23, 0x9C, 0xBA, 0xE7, 0x4C, 0xFA, 0xDA, 0x5A, 0x82, 0x4E, 0xB8, 0xE1, 0x82, 0xA5, 0xB0, 0xB8, 
-0x08, 0x32, 0xA5, 0xA8, 0x27, 0x7B, 0x5C, 0x7C, 0xE5, 0x02, 0x37, 0xAE, 0x5D, 0x4F, 0xAD, 0x01, 
-0xAD, 0x53, 0x97, 0x76, 0xD1, 0xBC, 0x0B, 0x5D, 0xC5, 0xBD, 0x90, 0xE8, 0xEB, 0xD4, 0xFF, 0x17, 
-0x3B, 0xFF, 0xC5, 0xC5, 0xA2, 0xBA, 0x8B, 0xE4, 0x60, 0xD7, 0x7B, 0xB1, 0xF6, 0x53, 0x72, 0xBC, 
-0xFB, 0xCC, 0xA8, 0xEE, 0x2E, 0xE0, 0x37, 0xFC, 0x06, 0x45, 0xC2, 0xCC, 0xB4, 0x24, 0xD1, 0x10, 
-0x95, 0xB0, 0xC7, 0x83, 0x59, 0x67, 0x91, 0x70, 0xE9, 0x78, 0xD1, 0xC1, 0x05, 0x5C, 0x1B, 0x69, 
-0x2B, 0x87, 0xAB, 0x1D, 0xC1, 0x49, 0x9A, 0x61, 0xD7, 0x79, 0x1A, 0x81, 0x46, 0xD0, 0x31, 0x71, 
-0x1F, 0xFB, 0xCC, 0x58, 0x96, 0x39, 0x47, 0x55, 0xC3, 0x3B, 0xD6, 0x7A, 0x7C, 0xE8, 0xCC, 0x16, 
-0xEF, 0x3E, 0xB6, 0xCC, 0xC9, 0x32, 0xB0, 0x1A, 0x26, 0x0C, 0x7D, 0x85, 0xA9, 0x6B, 0x4A, 0x34, 
-0x5A, 0x2B, 0x62, 0x70, 0x88, 0x04, 0x6C, 0xA6, 0xC9, 0xAC, 0x26, 0x10, 0x68, 0x42, 0x45, 0x50, 
-0x81, 0x68, 0x40, 0x12, 0x1D, 0x01, 0x05, 0x14, 0xDA, 0xD0, 0x33, 0x06, 0xD3, 0xD4, 0xD8, 0xD0, 
-0xD0, 0x33, 0xB0, 0x34, 0x2C, 0x59, 0x1E, 0x0D, 0xE8, 0xE5, 0x1A, 0xA2, 0xC7, 0xC4, 0x80, 0x78, 
-0x97, 0xB6, 0xAD, 0x92, 0x90, 0xFA, 0xB4, 0x27, 0x48, 0x89, 0x26, 0x4A, 0xC4, 0x3B, 0x97, 0xF0, 
-0x78, 0xBA, 0x06, 0x93, 0x26, 0x09, 0x23, 0xDD, 0xBD, 0xE7, 0x74, 0xC7, 0x76, 0x71, 0xDC, 0x16, 
-0xC9, 0xA2, 0xDB, 0xB9, 0x2C, 0x1E, 0x4D, 0x7C, 0x4E, 0x42, 0x04, 0x94, 0x26, 0xEB, 0xF7, 0x28, 
-0x47, 0x63, 0xEE, 0x7B, 0xF8, 0x41, 0x24, 0xB3, 0x88, 0xBD, 0x3B, 0x31, 0xA9, 0x54, 0xAA, 0xB0, 
-0xAD, 0xED, 0x60, 0x29, 0x95, 0x7A, 0x06, 0x07, 0xE3, 0x8D, 0x5F, 0xBD, 0x75, 0x28, 0x20, 0xB6, 
-0x8E, 0x5B, 0xD7, 0x6F, 0xF0, 0xD2, 0xF9, 0x17, 0xA8, 0x67, 0x69, 0x20, 0x87, 0x28, 0xE8, 0xCE, 
-0x5E, 0x4A, 0x3A, 0xF6, 0xCD, 0xE2, 0xF9, 0x8B, 0xCF, 0x8B, 0x7F, 0x7F, 0xAF, 0x84, 0xAB, 0xBA, 
-0x42, 0x45, 0xB1, 0xF8, 0x5F, 0x4C, 0x12, 0x97, 0x4A, 0x88, 0xBA, 0x93, 0x52, 0xEC, 0x74, 0x41, 
-0xD2, 0x7F, 0xDD, 0x74, 0xE9, 0xE2, 0x48, 0xA9, 0x8E, 0xDA, 0x08, 0x9D, 0xEA, 0x71, 0x37, 0x90, 
-0x20, 0xA0, 0x42, 0x42, 0x6B, 0xEA, 0xC6, 0xE1, 0x83, 0x24, 0x5F, 0xC2, 0x6E, 0x8D, 0x2A, 0x05, 
-0x5A, 0x04, 0x2D, 0x01, 0x23, 0x0D, 0x46, 0x66, 0x94, 0xCC, 0x19, 0x50, 0xB1, 0x8A, 0xE3, 0x44, 
-0x99, 0xF3, 0xD0, 0xE1, 0x0D, 0xDE, 0x79, 0x74, 0x85, 0x0F, 0x9E, 0x5A, 0xE1, 0xEC, 0x40, 0xB3, 
-0x6C, 0x22, 0x65, 0x74, 0x28, 0xE7, 0x68, 0x82, 0xA7, 0x2D, 0x72, 0xD4, 0x68, 0x99, 0x59, 0x2C, 
-0xD8, 0x95, 0x1E, 0x97, 0x2B, 0xCD, 0x33, 0xD7, 0x77, 0x79, 0x69, 0xD2, 0x52, 0x51, 0xA0, 0x54, 
-0x4E, 0x54, 0x0A, 0x6B, 0x73, 0x5A, 0xEF, 0x7A, 0xCE, 0xFB, 0x33, 0xAD, 0x77, 0xF7, 0x80, 0xDE, 
-0x34, 0x26, 0xEF, 0x55, 0xAD, 0xD3, 0x59, 0x36, 0xC4, 0x98, 0x12, 0x24, 0x23, 0x86, 0x74, 0xD3, 
-0x2E, 0x8A, 0x1E, 0xCE, 0x39, 0x5A, 0xD7, 0x32, 0xE8, 0x0D, 0x70, 0x4D, 0x23, 0x9A, 0xE8, 0x43, 
-0xA8, 0x7F, 0xFD, 0xF1, 0x87, 0xEE, 0xFD, 0x57, 0xAF, 0xBC, 0xFE, 0xFC, 0x5B, 0x57, 0xB8, 0x7F, 
-0xF3, 0x6F, 0xFE, 0xE7, 0xCD, 0xAF, 0x7E, 0xFA, 0xD7, 0xA7, 0xD3, 0x79, 0x7B, 0x9F, 0x12, 0x96, 
-0x63, 0x6C, 0x6C, 0x99, 0x67, 0xDA, 0xB9, 0x1A, 0xD3, 0xDD, 0x19, 0xF7, 0xDD, 0x08, 0xA4, 0x13, 
-0x84, 0x70, 0x1E, 0x6D, 0x0B, 0x85, 0xD2, 0x2A, 0x08, 0x1A, 0x95, 0xA9, 0x18, 0x2D, 0x46, 0xF7, 
-0x50, 0x0E, 0x4C, 0x14, 0x0C, 0x1E, 0xA5, 0x23, 0xB7, 0x26, 0x7B, 0x3C, 0x7F, 0xE9, 0x0A, 0x57, 
-0xF6, 0x02, 0x3B, 0x21, 0xC3, 0xE5, 0x03, 0x6A, 0x51, 0x54, 0xCE, 0x11, 0x03, 0x28, 0x7A, 0xE8, 
-0xA8, 0xC1, 0xCF, 0xE8, 0x9B, 0x86, 0x43, 0xA3, 0x92, 0x73, 0x5B, 0xEB, 0x9C, 0xDD, 0x58, 0x63, 
-0xAB, 0x2C, 0xE9, 0x39, 0x87, 0xAE, 0xEB, 0xF4, 0xFB, 0xBA, 0x0A, 0xC4, 0x98, 0x2C, 0xB9, 0x9A, 
-0x0A, 0x48, 0xB7, 0x85, 0xD3, 0x02, 0xF5, 0xDE, 0x94, 0xED, 0x6B, 0x37, 0xB9, 0x71, 0xE9, 0x2A, 
-0xDB, 0xD7, 0x6E, 0xD2, 0x4C, 0x2A, 0x0A, 0x63, 0x19, 0x0E, 0x06, 0x9D, 0x94, 0x63, 0xBC, 0xAB, 
-0xBA, 0x25, 0x1D, 0x46, 0xAB, 0x2C, 0x26, 0xCB, 0xA9, 0x43, 0x8D, 0xED, 0x59, 0xA2, 0x8A, 0x69, 
-0xF1, 0x93, 0xF4, 0x7D, 0x0B, 0x63, 0xB9, 0xF8, 0xCA, 0x05, 0x2E, 0xBE, 0x74, 0x01, 0xBA, 0x21, 
-0x8A, 0x3C, 0xCB, 0xF0, 0xD1, 0x51, 0xD5, 0x73, 0xCA, 0x7E, 0x49, 0xDD, 0x36, 0x14, 0xFD, 0x3E, 
-0x8F, 0x3C, 0xFE, 0x18, 0x83, 0xE5, 0x25, 0xA2, 0x35, 0x44, 0xA3, 0x69, 0x63, 0x40, 0xE7, 0x59, 
-0x02, 0xFB, 0x7D, 0xA4, 0xCC, 0xF3, 0xC4, 0x6E, 0x00, 0x6E, 0x5E, 0xBD, 0xCA, 0x8B, 0x2F, 0x9E, 
-0x4F, 0x3A, 0x00, 0x24, 0x91, 0x68, 0xD5, 0xED, 0xF7, 0xD2, 0x62, 0x4B, 0xC9, 0x52, 0x84, 0xF4, 
-0xEF, 0xC5, 0x63, 0x8B, 0xCF, 0x9D, 0xC6, 0x83, 0x42, 0x11, 0x95, 0xA4, 0x44, 0xA4, 0x52, 0x42, 
-0x50, 0x8B, 0x69, 0xBE, 0x4E, 0xA7, 0x02, 0x14, 0xA2, 0xD3, 0x42, 0x5F, 0xDC, 0x6E, 0x44, 0x25, 
-0x65, 0x82, 0xC5, 0x25, 0x17, 0x88, 0x88, 0x4E, 0xFA, 0x03, 0xA2, 0xBB, 0xD1, 0x47, 0x49, 0x49, 
-0x43, 0x69, 0x93, 0x54, 0x30, 0xA2, 0x10, 0x7C, 0xA4, 0xAD, 0x3D, 0x6D, 0xE5, 0x71, 0x75, 0x40, 
-0xBC, 0x45, 0x47, 0x8B, 0x56, 0x39, 0xA1, 0xD3, 0xAB, 0xB5, 0x16, 0x6C, 0x6C, 0xB1, 0xB2, 0xCB, 
-0x2A, 0x13, 0x4E, 0x98, 0x9A, 0xC7, 0x96, 0x35, 0x1F, 0x3E, 0xB9, 0xCA, 0x8F, 0xDC, 0x73, 0x88, 
-0x47, 0x57, 0x73, 0x36, 0xA9, 0xE8, 0x87, 0x19, 0x36, 0x56, 0x28, 0xDF, 0x52, 0x98, 0x0C, 0x09, 
-0x82, 0x97, 0x90, 0xAA, 0x31, 0x9D, 0xF0, 0xEF, 0x1A, 0x87, 0x33, 0x81, 0x98, 0x45, 0x62, 0x16, 
-0x08, 0xCA, 0xE1, 0xA5, 0xC5, 0x18, 0x4D, 0x66, 0x2D, 0x10, 0x71, 0x4D, 0x93, 0x14, 0xD5, 0x94, 
-0x10, 0x5C, 0x43, 0xAC, 0x67, 0xAC, 0xF7, 0x73, 0xEE, 0x3D, 0xB2, 0xC1, 0xA9, 0xB5, 0x65, 0xD6, 
-0xCA, 0x0C, 0xEB, 0x1A, 0xA4, 0x9E, 0xE3, 0xA8, 0x31, 0x18, 0x44, 0x1B, 0x3C, 0x10, 0xB4, 0x01, 
-0x6D, 0xC9, 0x54, 0x89, 0x8A, 0x8A, 0xE0, 0x3D, 0x3E, 0x34, 0xC4, 0xD8, 0x10, 0x09, 0x29, 0x95, 
-0x2A, 0x01, 0x2C, 0xB1, 0x63, 0x35, 0x88, 0x28, 0xA2, 0xC4, 0x44, 0x05, 0x54, 0x1E, 0xA5, 0x04, 
-0x41, 0x27, 0x6D, 0xE3, 0x90, 0x96, 0x96, 0xCE, 0x72, 0x7C, 0x54, 0x14, 0xC3, 0x01, 0x27, 0xEE, 
-0xB9, 0x87, 0x8D, 0x63, 0x47, 0x89, 0x46, 0xE3, 0x93, 0xBA, 0x75, 0xB7, 0x9B, 0xE9, 0xD4, 0xAE, 
-0x64, 0xA1, 0x0B, 0x2D, 0x09, 0x1A, 0x42, 0xF6, 0xE5, 0x22, 0x17, 0x05, 0x41, 0xB7, 0x10, 0xB0, 
-0x36, 0xC7, 0x75, 0x6B, 0x5F, 0x99, 0xA4, 0x31, 0x61, 0x95, 0xC5, 0x86, 0xC8, 0xD7, 0xBE, 0xFC, 
-0x15, 0xEE, 0xDC, 0xDE, 0x4E, 0x43, 0x3A, 0x22, 0x69, 0x7A, 0xCA, 0x79, 0x6C, 0xE7, 0x2C, 0x92, 
-0x94, 0x28, 0xD2, 0x7F, 0x6A, 0xB1, 0x96, 0xBA, 0xDB, 0x05, 0x2A, 0x29, 0xF3, 0x25, 0xE9, 0xD3, 
-0x94, 0x1A, 0xD5, 0x81, 0x8F, 0xB4, 0x23, 0x4C, 0xDF, 0x17, 0x95, 0x34, 0x85, 0xBD, 0x4E, 0xCD, 
-0xE0, 0x28, 0x31, 0x09, 0xC4, 0x87, 0xAE, 0xAA, 0x8E, 0x92, 0x26, 0x01, 0x17, 0xEF, 0x4B, 0xBA, 
-0x99, 0x31, 0x63, 0xA1, 0xEB, 0x79, 0x04, 0x17, 0x88, 0x8D, 0x07, 0x17, 0x08, 0x4E, 0x68, 0x11, 
-0x62, 0x07, 0xFD, 0x11, 0x03, 0x46, 0x14, 0xB9, 0x4A, 0x79, 0x44, 0xCB, 0x8C, 0xA1, 0x75, 0x94, 
-0x71, 0x9B, 0x35, 0xA6, 0xDC, 0xBF, 0x94, 0xF1, 0xBE, 0xE3, 0x9B, 0x7C, 0xF0, 0xD4, 0x61, 0xDE, 
-0xBD, 0xB5, 0xC2, 0x7D, 0x43, 0xCB, 0xD8, 0x4F, 0xC9, 0xC5, 0xA3, 0x54, 0x81, 0xA3, 0x60, 0xA6, 
-0x7A, 0x6C, 0xAB, 0x92, 0x4B, 0x0D, 0xBC, 0xB4, 0xE7, 0x78, 0xE6, 0xFA, 0x94, 0xDF, 0x78, 0xF9, 
-0x0A, 0x9F, 0x7F, 0xE9, 0x2A, 0x2F, 0xED, 0xB6, 0xDC, 0xF4, 0x96, 0x4A, 0xE5, 0x78, 0x6B, 0x69, 
-0x88, 0xB8, 0x10, 0x50, 0x1D, 0xC5, 0xC5, 0xDA, 0x5C, 0xF9, 0x20, 0x2A, 0x88, 0x22, 0xCF, 0x07, 
-0x44, 0x49, 0xF0, 0x98, 0xF3, 0x81, 0x20, 0x01, 0x6D, 0x34, 0x51, 0x22, 0x21, 0x3A, 0xA2, 0x04, 
-0x42, 0xA8, 0x03, 0x54, 0xF3, 0x96, 0xC9, 0x73, 0x4F, 0x3C, 0xF2, 0xC8, 0x7F, 0xFD, 0x97, 0xFE, 
-0xFA, 0xBF, 0x7E, 0xEE, 0x17, 0x7E, 0xE1, 0x13, 0xC2, 0x81, 0x1B, 0xDA, 0x1B, 0xE2, 0xE7, 0x7F, 
-0xFE, 0xE7, 0xCD, 0x7F, 0xF3, 0xDF, 0xFC, 0xF3, 0x7B, 0x9F, 0xF9, 0xC6, 0x0B, 0xEF, 0x6D, 0xDA, 
-0xEA, 0xDD, 0xC6, 0xDA, 0x47, 0x7B, 0xC5, 0xE0, 0xE4, 0x64, 0x36, 0x1F, 0x46, 0x71, 0x65, 0x5E, 
-0x0C, 0x75, 0xDB, 0xB4, 0xDA, 0x98, 0x42, 0x65, 0x59, 0x91, 0x88, 0xC8, 0xEE, 0xEE, 0xF6, 0x2B, 
-0x46, 0xD0, 0x2A, 0x83, 0x98, 0xA8, 0x41, 0x19, 0x0A, 0xA5, 0x2A, 0x90, 0x29, 0x96, 0x86, 0x25, 
-0x6B, 0x29, 0x02, 0xAC, 0x66, 0x8A, 0xAD, 0x81, 0x62, 0xAB, 0xAF, 0x58, 0xEB, 0x45, 0x36, 0x06, 
-0x03, 0x36, 0xC7, 0xEB, 0xAC, 0x0E, 0x4B, 0x4A, 0x55, 0x61, 0xF1, 0x80, 0x4D, 0xF2, 0x8C, 0xBA, 
-0xC7, 0x2C, 0x28, 0xAE, 0xCF, 0x1A, 0xAE, 0xCF, 0x1A, 0x9E, 0xBF, 0x76, 0x9B, 0x57, 0x77, 0x27, 
-0x5C, 0xDA, 0x9B, 0x33, 0xC1, 0x12, 0xCC, 0x00, 0xAF, 0x0B, 0x1A, 0x97, 0x84, 0x6F, 0x92, 0xA8, 
-0x74, 0x67, 0xA7, 0x43, 0xE2, 0xE0, 0x0E, 0x56, 0x46, 0x6C, 0x1D, 0xDD, 0x62, 0x75, 0x6B, 0x95, 
-0x7B, 0x1F, 0xBA, 0x0F, 0x5D, 0x18, 0x4C, 0xA6, 0xBB, 0x8E, 0x89, 0x41, 0x2B, 0x8B, 0x88, 0xA2, 
-0x15, 0x87, 0x57, 0x8E, 0x20, 0x7E, 0xDF, 0x4A, 0xBD, 0xC8, 0x4A, 0x2C, 0x8A, 0xEA, 0xCE, 0x1E, 
-0x5F, 0xFB, 0xC2, 0x97, 0xB8, 0x79, 0xF1, 0x75, 0x94, 0x73, 0x14, 0x66, 0x51, 0x83, 0x48, 0x7A, 
-0xBE, 0x51, 0x38, 0x89, 0x1C, 0x39, 0x73, 0x96, 0xC7, 0x9F, 0x7C, 0x17, 0xE5, 0x70, 0xD4, 0x39, 
-0x4D, 0xE4, 0xFB, 0x5B, 0x47, 0xEF, 0x5C, 0x9A, 0x76, 0x51, 0x0A, 0x1D, 0x03, 0xBB, 0xB7, 0x6F, 
-0xF1, 0xC2, 0xB3, 0xCF, 0xF3, 0xDA, 0xC5, 0x57, 0xF0, 0xAE, 0x21, 0x57, 0x06, 0x1D, 0x52, 0x6A, 
-0x7C, 0x3B, 0xF1, 0xE6, 0x2A, 0x44, 0x80, 0xA8, 0x53, 0x05, 0x61, 0xE9, 0xD4, 0xDA, 0xE8, 0x06, 
-0x2B, 0xBA, 0x88, 0x6F, 0xA2, 0x7E, 0x2D, 0x6E, 0x52, 0xE9, 0x7A, 0x48, 0x43, 0x1E, 0x8B, 0x0A, 
-0x68, 0xA1, 0xDC, 0x94, 0xB6, 0xD6, 0xE9, 0x9B, 0x06, 0x45, 0x5B, 0x3B, 0xAA, 0xAA, 0xC1, 0x37, 
-0x1E, 0xA2, 0x46, 0xAB, 0x1C, 0x25, 0xE9, 0x1E, 0x6E, 0x62, 0x44, 0xA4, 0x45, 0xD1, 0x92, 0x53, 
-0xD3, 0xA3, 0x62, 0x13, 0xCF, 0xBD, 0x2B, 0x3D, 0xEE, 0x5F, 0xE9, 0xF1, 0xEE, 0x53, 0x5B, 0x1C, 
-0xCB, 0x85, 0x0D, 0x2D, 0xD8, 0x66, 0x42, 0x6C, 0xA6, 0x68, 0x02, 0xDA, 0xC4, 0x44, 0x4E, 0xEF, 
-0x1C, 0x41, 0xA2, 0x56, 0x04, 0x23, 0x38, 0xED, 0xF0, 0xCA, 0x23, 0x45, 0xC0, 0xE4, 0x9A, 0xAD, 
-0x23, 0x6B, 0x28, 0x89, 0xB4, 0x55, 0xCB, 0x64, 0x77, 0x46, 0x33, 0x71, 0xE8, 0x60, 0xC8, 0x54, 
-0x49, 0x46, 0x4E, 0xA8, 0x03, 0x5A, 0xB2, 0x4E, 0x90, 0x44, 0xD3, 0x6A, 0x43, 0x63, 0x0B, 0xDA, 
-0x7C, 0xC0, 0x3C, 0x1F, 0x71, 0xFE, 0xD6, 0x94, 0x6F, 0x5C, 0xBA, 0xC1, 0xB7, 0xAF, 0xEE, 0x72, 
-0xCD, 0x69, 0xB6, 0x25, 0x67, 0x17, 0x8D, 0xA3, 0xC0, 0xA9, 0x1C, 0xAB, 0x32, 0x34, 0x8A, 0x80, 
-0xC3, 0xC5, 0x0A, 0x94, 0xA3, 0xE8, 0xE5, 0x94, 0xFD, 0x1E, 0x26, 0x2B, 0x08, 0x02, 0x0A, 0xD3, 
-0x21, 0x50, 0x82, 0xE0, 0x50, 0x5D, 0x51, 0xA1, 0x94, 0x10, 0x83, 0x41, 0xE9, 0x04, 0x5D, 0x69, 
-0x6D, 0x93, 0x06, 0xB3, 0xCD, 0x38, 0x72, 0xFA, 0x24, 0x67, 0xEE, 0xBF, 0x9F, 0x95, 0xC3, 0x9B, 
-0x04, 0x05, 0x41, 0x77, 0xD7, 0x4D, 0x37, 0x06, 0xBC, 0x50, 0x2B, 0x73, 0x1D, 0xA4, 0xA3, 0xBB, 
-0x69, 0x38, 0x25, 0x49, 0xEB, 0x95, 0xAE, 0x42, 0x94, 0x6E, 0x40, 0xC2, 0x77, 0xB8, 0xBD, 0x3E, 
-0x60, 0xBB, 0x5E, 0x28, 0xC3, 0xCD, 0x8B, 0xAF, 0xF1, 0xD5, 0x2F, 0x7E, 0x89, 0xBD, 0x3B, 0x3B, 
-0x89, 0x95, 0x10, 0x3B, 0xB3, 0xD3, 0xD6, 0x27, 0x6B, 0xA6, 0x05, 0x34, 0xB1, 0xA0, 0xAB, 0x1D, 
-0x08, 0x79, 0x53, 0x43, 0x70, 0x11, 0x6A, 0x91, 0xF0, 0x49, 0xDC, 0x77, 0x20, 0x29, 0xAA, 0x75, 
-0xEA, 0x5C, 0xA1, 0xCB, 0x8F, 0xA0, 0xD1, 0x3E, 0x4B, 0xAF, 0xBB, 0x53, 0xF8, 0x33, 0xDD, 0x4D, 
-0x33, 0x92, 0x6E, 0x46, 0x41, 0x14, 0xCE, 0x05, 0x5A, 0x17, 0x20, 0x92, 0x5C, 0x4D, 0x04, 0xC4, 
-0x79, 0x5C, 0xF0, 0x98, 0xA2, 0x4C, 0xEF, 0x27, 0x0A, 0xB9, 0x44, 0xAC, 0x44, 0x0C, 0x0D, 0x3D, 
-0x3C, 0x3D, 0xED, 0x18, 0x50, 0x73, 0x64, 0xA9, 0xC7, 0x99, 0xB5, 0x31, 0xA7, 0xD7, 0x97, 0x39, 
-0x31, 0x1E, 0xB3, 0xD9, 0x1B, 0x50, 0x46, 0x21, 0x34, 0x15, 0x4A, 0x3B, 0x9A, 0x10, 0xD9, 0xAD, 
-0xE1, 0xCE, 0x2C, 0xB0, 0x3D, 0x77, 0xDC, 0x98, 0xD7, 0xDC, 0xA8, 0x27, 0xDC, 0x6A, 0x1A, 0x26, 
-0x4D, 0x60, 0xA7, 0x81, 0x4A, 0x4A, 0x2A, 0x72, 0x76, 0xC9, 0x68, 0x6C, 0x49, 0xCC, 0x0D, 0xC1, 
-0x07, 0x2C, 0x16, 0xA2, 0xE0, 0x7D, 0x95, 0x20, 0xBD, 0xE8, 0x30, 0x26, 0xF1, 0xF8, 0xDB, 0xE4, 
-0xB9, 0xC3, 0xB0, 0xBF, 0xC4, 0x7C, 0x3E, 0x8F, 0x92, 0x6E, 0xAB, 0x4D, 0x91, 0xE5, 0x93, 0xD6, 
-0x35, 0xAF, 0x0E, 0x06, 0xD9, 0x37, 0xFB, 0x7D, 0xFD, 0x85, 0x77, 0x3F, 0xF1, 0xE8, 0x57, 0x9E, 
-0x78, 0xCF, 0x7F, 0x78, 0xFE, 0x13, 0x9F, 0x48, 0x0D, 0xB3, 0xC5, 0x31, 0xFC, 0xAE, 0xF1, 0x99, 
-0xCF, 0x7C, 0xC6, 0xBE, 0xFC, 0xE5, 0xDD, 0xDE, 0x3F, 0xFC, 0x97, 0xFF, 0xFD, 0xA9, 0xE7, 0xBE, 
-0xF5, 0xE2, 0x7D, 0x79, 0x5E, 0x1C, 0x9E, 0xCC, 0x9B, 0x77, 0xB4, 0xAD, 0xBB, 0x5F, 0xA2, 0x39, 
-0x23, 0xC8, 0x0A, 0x98, 0x0C, 0x4A, 0x03, 0x5A, 0x59, 0x6B, 0xB1, 0x36, 0x4F, 0x5D, 0x56, 0x9B, 
-0xD1, 0x56, 0x0E, 0xC8, 0x01, 0x61, 0x90, 0xE7, 0x28, 0xE3, 0xA9, 0xAA, 0x3D, 0x0A, 0xA5, 0xC9, 
-0xB5, 0x81, 0x50, 0x91, 0x53, 0x51, 0x50, 0x51, 0xEA, 0x9A, 0x4C, 0x07, 0x46, 0xE5, 0x88, 0x95, 
-0xA2, 0xE0, 0xC4, 0xB0, 0x64, 0xB5, 0xC8, 0x58, 0x1E, 0x8C, 0x58, 0x19, 0x0D, 0xD9, 0x5C, 0x59, 
-0x66, 0x79, 0x3C, 0xC2, 0xEA, 0x54, 0x0D, 0xCF, 0x63, 0xE4, 0x95, 0x6B, 0x37, 0x78, 0xE6, 0xE5, 
-0xD7, 0x79, 0xE9, 0xC6, 0x1D, 0x6E, 0x34, 0x30, 0xC1, 0xE2, 0x18, 0xA2, 0xF3, 0x21, 0x77, 0x5A, 
-0x47, 0x20, 0x71, 0x1E, 0x05, 0x12, 0xC5, 0x47, 0x09, 0xAA, 0x34, 0x14, 0x65, 0xC6, 0x70, 0x38, 
-0xE0, 0xF4, 0xB9, 0x13, 0x9C, 0xBE, 0xE7, 0x0C, 0x4B, 0x1B, 0x6B, 0x84, 0x3C, 0x23, 0x18, 0x83, 
-0xD7, 0x9A, 0x48, 0xC0, 0xA2, 0x69, 0x5D, 0x8D, 0x35, 0x79, 0xAA, 0x64, 0x6D, 0x46, 0x3B, 0xAB, 
-0xB8, 0xFC, 0xF2, 0x05, 0xBE, 0xF6, 0x85, 0x2F, 0x13, 0xA7, 0x55, 0x12, 0xBF, 0xE8, 0xB6, 0x47, 
-0xD6, 0x5A, 0x30, 0x30, 0xAB, 0x2B, 0xFA, 0x2B, 0x4B, 0x3C, 0xF0, 0xE4, 0x63, 0x1C, 0x3D, 0x7D, 
-0x92, 0xA8, 0x0D, 0x5E, 0x22, 0x2A, 0x2B, 0xF1, 0x12, 0xD1, 0x3A, 0x19, 0x4A, 0x16, 0xC6, 0x20, 
-0x2E, 0x90, 0x6B, 0xC5, 0xF9, 0x6F, 0x7F, 0x8B, 0xE7, 0x9E, 0xF9, 0x16, 0xBE, 0xAE, 0x70, 0x4D, 
-0x4D, 0x91, 0xE7, 0x69, 0x74, 0xF9, 0xCD, 0x27, 0xE4, 0x40, 0x2C, 0x70, 0xE5, 0xEF, 0x1A, 0x4A, 
-0xDD, 0xD5, 0x08, 0xEE, 0xE6, 0xF8, 0x17, 0xCF, 0x96, 0x8E, 0xF2, 0xA6, 0x54, 0xA2, 0x21, 0x29, 
-0xD5, 0x69, 0x4A, 0x1C, 0x78, 0x0E, 0x0B, 0x28, 0x43, 0x75, 0xDB, 0xE9, 0xC5, 0xD7, 0x51, 0x88, 
-0x5E, 0x68, 0x66, 0x2E, 0x51, 0xAA, 0x62, 0xE2, 0xB2, 0x26, 0x8C, 0xB9, 0x13, 0x4A, 0x11, 0x4F, 
-0x89, 0xD0, 0x8B, 0x0D, 0x03, 0x5A, 0x96, 0xA8, 0x38, 0x94, 0x45, 0xEE, 0xDF, 0x1C, 0xF2, 0xCE, 
-0xE3, 0x9B, 0x3C, 0xB0, 0xB9, 0xC2, 0x28, 0xD4, 0x0C, 0xA3, 0x23, 0x73, 0x35, 0xD2, 0xD6, 0xA8, 
-0xD0, 0x62, 0xB3, 0xAE, 0x21, 0x17, 0x1D, 0x38, 0x87, 0xC9, 0x53, 0xB2, 0x9D, 0xA9, 0x39, 0x73, 
-0x5D, 0xA3, 0x47, 0x96, 0xD5, 0xA3, 0xCB, 0xAC, 0x1C, 0x5A, 0xC2, 0xF6, 0xF3, 0x74, 0xA3, 0xAC, 
-0x3C, 0xED, 0xED, 0x19, 0x3B, 0xD7, 0x66, 0x54, 0xDB, 0x15, 0x71, 0x0E, 0xD4, 0x9A, 0x5C, 0xF5, 
-0xB1, 0x26, 0x91, 0xE3, 0xA3, 0x36, 0x28, 0x93, 0x41, 0x5E, 0xE0, 0xC5, 0x32, 0x0D, 0x9A, 0x50, 
-0x8E, 0xB8, 0xE5, 0x14, 0xCF, 0x5D, 0xDF, 0xE3, 0x73, 0x2F, 0xBE, 0xCA, 0x6F, 0x4F, 0x76, 0xD8, 
-0xA5, 0x8F, 0x33, 0x23, 0xA6, 0x92, 0x31, 0x8F, 0x05, 0xE8, 0x1C, 0x8D, 0x27, 0x4A, 0x40, 0xEB, 
-0x88, 0x36, 0x29, 0x05, 0xF9, 0x18, 0x18, 0x8C, 0x86, 0xD0, 0x41, 0x3C, 0xDA, 0xA4, 0xA3, 0xA6, 
-0x25, 0x76, 0xBA, 0x93, 0xA9, 0xDA, 0x95, 0x85, 0xD5, 0xBD, 0xC9, 0x68, 0x83, 0x67, 0xB4, 0xBC, 
-0xC2, 0xC3, 0xEF, 0x7C, 0x9C, 0xA3, 0xA7, 0x4F, 0xE3, 0xAD, 0x4A, 0x10, 0x53, 0x77, 0xB8, 0x93, 
-0xF4, 0xE8, 0x42, 0x1E, 0x32, 0xE2, 0x3A, 0xFD, 0x0A, 0x2D, 0x3A, 0xED, 0x76, 0x16, 0xE7, 0xA5, 
-0x8B, 0x28, 0x69, 0x22, 0xAE, 0x69, 0x1C, 0xE9, 0xBA, 0xB3, 0x84, 0x36, 0xD9, 0x77, 0xFB, 0x79, 
-0xCD, 0xB3, 0x5F, 0xFB, 0x3A, 0x17, 0xCF, 0xBF, 0x88, 0x6B, 0xDB, 0xFD, 0x21, 0x08, 0x63, 0x4C, 
-0x12, 0xF1, 0xD1, 0x3A, 0x25, 0xC0, 0xEF, 0x81, 0xAB, 0x2E, 0x92, 0x3B, 0x5D, 0x82, 0x3F, 0xF8, 
-0xFD, 0x04, 0x17, 0x74, 0x8F, 0x75, 0xD3, 0x37, 0x8B, 0x21, 0x1C, 0x21, 0x41, 0x24, 0x61, 0xA1, 
-0xED, 0xD1, 0x39, 0xFE, 0xA6, 0x63, 0x93, 0x06, 0x7C, 0x54, 0x97, 0x9D, 0x25, 0xA4, 0x54, 0x15, 
-0x63, 0x24, 0x48, 0x67, 0x6F, 0xAE, 0x12, 0x1C, 0x51, 0x04, 0x85, 0x22, 0x62, 0x11, 0x72, 0x1D, 
-0x30, 0x71, 0x4A, 0xC1, 0x9C, 0x23, 0x99, 0xE6, 0xF8, 0x4A, 0x8F, 0x33, 0xEB, 0x2B, 0x9C, 0x3D, 
-0xB2, 0xC5, 0x91, 0xD5, 0xE5, 0x04, 0xF5, 0xC5, 0x48, 0xDD, 0x36, 0xEC, 0xEC, 0xEC, 0x70, 0x7B, 
-0x6F, 0xC2, 0xD5, 0xE9, 0x84, 0xDD, 0xDA, 0x73, 0x63, 0xB7, 0xE1, 0xE6, 0x5E, 0xCD, 0x4C, 0x14, 
-0x0D, 0xD0, 0x68, 0x68, 0x95, 0xA2, 0x8D, 0x0A, 0x2F, 0x39, 0x4A, 0xF7, 0x08, 0x14, 0x34, 0xD1, 
-0x12, 0x4C, 0x9E, 0x84, 0xA6, 0x7C, 0x03, 0xE2, 0xC8, 0xB3, 0x0C, 0xE7, 0x1B, 0x7A, 0xBD, 0x8C, 
-0xBA, 0x99, 0xA1, 0xC4, 0x61, 0x8C, 0x91, 0xD6, 0xD5, 0x02, 0xE2, 0x33, 0x63, 0x2B, 0x17, 0xAA, 
-0x4B, 0xBD, 0x62, 0xF4, 0xCD, 0xF1, 0xB0, 0xFF, 0x0D, 0xA5, 0xE3, 0x85, 0x7B, 0xCF, 0x9E, 0x3B, 
-0xFF, 0x07, 0x7E, 0xF2, 0x27, 0x5F, 0x7B, 0xEA, 0xA9, 0x8D, 0xD9, 0x82, 0x99, 0x70, 0x30, 0xDE, 
-0x7C, 0x1E, 0xBF, 0x67, 0x88, 0x88, 0xFA, 0x6B, 0x7F, 0xED, 0xBF, 0x2D, 0xAF, 0xBD, 0x78, 0x7E, 
-0xF0, 0xE2, 0xEB, 0x57, 0x4E, 0x5F, 0xB8, 0x74, 0xF5, 0x89, 0xE9, 0x5E, 0x73, 0xDC, 0x9A, 0x7C, 
-0xAB, 0xAA, 0xC3, 0xE9, 0x88, 0xBB, 0x57, 0x93, 0xAF, 0xA2, 0x6D, 0x1E, 0xB5, 0xB6, 0x60, 0x95, 
-0x52, 0x7D, 0xC4, 0x39, 0xB4, 0xB2, 0x68, 0xA3, 0x50, 0x1D, 0x69, 0xDF, 0x2A, 0x4B, 0x0C, 0x0D, 
-0x5A, 0x35, 0x18, 0x55, 0x83, 0x4C, 0xD3, 0xD7, 0x58, 0x4A, 0x84, 0x31, 0x2D, 0x4B, 0xCA, 0xB0, 
-0x54, 0x96, 0x2C, 0x15, 0x19, 0x9B, 0xC3, 0x3E, 0x27, 0x36, 0x96, 0x39, 0xB1, 0xB6, 0xC4, 0xEA, 
-0xB0, 0x64, 0x79, 0xD8, 0x43, 0xB4, 0xE2, 0xF2, 0xED, 0x3B, 0xBC, 0x72, 0xF5, 0x16, 0x2F, 0xDD, 
-0x98, 0x70, 0xE1, 0xC6, 0x0E, 0xD7, 0x5A, 0xC7, 0x2E, 0x9A, 0xC0, 0x06, 0x33, 0x14, 0x8E, 0x24, 
-0x92, 0x13, 0xB5, 0x4A, 0x16, 0x37, 0x31, 0x42, 0x4C, 0xBA, 0xB4, 0x79, 0x9E, 0x31, 0x5C, 0x19, 
-0x71, 0xF8, 0xE4, 0x71, 0x8E, 0xDF, 0x77, 0x2F, 0x9B, 0x27, 0x8F, 0x41, 0xAF, 0xA0, 0x71, 0x0D, 
-0x19, 0x69, 0x0E, 0x5F, 0x29, 0x45, 0x70, 0x8E, 0x32, 0x2F, 0xB8, 0x7D, 0xF5, 0x3A, 0xE7, 0x9F, 
-0xF9, 0x36, 0x57, 0x5E, 0xBE, 0x88, 0x09, 0x42, 0x8E, 0x46, 0x4B, 0x9A, 0x2E, 0x53, 0x4A, 0x41, 
-0x66, 0x98, 0x35, 0x35, 0xA7, 0xEE, 0x3F, 0xCB, 0x3D, 0xEF, 0x78, 0x88, 0xE1, 0xEA, 0x32, 0x4D, 
-0xF4, 0x84, 0x08, 0x3A, 0x4F, 0xC2, 0x24, 0x4A, 0x69, 0x74, 0x10, 0x72, 0xAD, 0x31, 0x02, 0xED, 
-0x74, 0xCA, 0x6F, 0x7D, 0xE9, 0x8B, 0x5C, 0x7A, 0xE5, 0x22, 0x79, 0x96, 0x46, 0x85, 0xAD, 0xB5, 
-0xC9, 0x2A, 0xE4, 0xF7, 0x13, 0xEA, 0x6E, 0xC2, 0x4E, 0x34, 0x9B, 0xC5, 0xB7, 0x13, 0x03, 0x21, 
-0x25, 0xC8, 0x4E, 0x74, 0xA6, 0x83, 0x53, 0x74, 0xAA, 0x5D, 0x00, 0x85, 0xD2, 0xC9, 0x88, 0x44, 
-0x2D, 0xB6, 0xB6, 0x9D, 0xDF, 0x5A, 0xDB, 0x04, 0xBC, 0x83, 0xE8, 0x93, 0xC5, 0x4D, 0x4C, 0xF7, 
-0x31, 0x50, 0x1E, 0x4D, 0xC0, 0xE8, 0x48, 0x21, 0x9E, 0x7E, 0xA8, 0x19, 0x51, 0xB1, 0x46, 0xE0, 
-0x9E, 0xB5, 0x01, 0x8F, 0x1D, 0x5D, 0xE6, 0xE1, 0xAD, 0x15, 0x8E, 0x14, 0x8A, 0x7E, 0x68, 0xC8, 
-0x9B, 0x86, 0x2C, 0x86, 0x44, 0x63, 0xEB, 0x74, 0x83, 0x95, 0x16, 0x42, 0x70, 0x38, 0x5F, 0x93, 
-0x17, 0x81, 0x2A, 0xCE, 0x69, 0x55, 0x8B, 0x1E, 0x5B, 0x06, 0x87, 0x87, 0x8C, 0x8F, 0x8C, 0x29, 
-0xD7, 0x7B, 0x30, 0xD0, 0x10, 0x1A, 0x30, 0x06, 0x82, 0x81, 0x5A, 0xC1, 0x9D, 0xC8, 0xF4, 0xC6, 
-0x8C, 0x9D, 0x2B, 0xBB, 0x4C, 0x6E, 0xCE, 0xC9, 0x62, 0x8F, 0x5E, 0x3E, 0x22, 0xD3, 0x19, 0xD1, 
-0xA7, 0x61, 0x87, 0xDC, 0x94, 0xA0, 0x33, 0x3C, 0x06, 0xA7, 0x0D, 0x53, 0x95, 0x31, 0xB3, 0x03, 
-0x2E, 0xD7, 0xC2, 0xD7, 0xAF, 0xDC, 0xE6, 0xB7, 0x5F, 0xBF, 0xC9, 0xEB, 0xF3, 0x9A, 0x6D, 0x72, 
-0xF6, 0xD4, 0x98, 0x8A, 0x44, 0x47, 0x12, 0x3A, 0x58, 0x05, 0x21, 0x74, 0x13, 0x64, 0x59, 0xA9, 
-0x31, 0x46, 0x91, 0x65, 0x19, 0xB6, 0x93, 0xE0, 0xA4, 0xBB, 0x11, 0x26, 0x69, 0x47, 0x8F, 0xB1, 
-0xE0, 0x42, 0xD2, 0x6F, 0xF5, 0x11, 0x0E, 0x9F, 0x3C, 0xCE, 0x3B, 0xDF, 0xFB, 0x14, 0xC3, 0xD5, 
-0x55, 0xEA, 0xE8, 0xF1, 0x07, 0x7E, 0x46, 0x75, 0x02, 0x37, 0x99, 0xA4, 0xBE, 0x81, 0x53, 0x92, 
-0xF4, 0x84, 0x3B, 0x1F, 0x2E, 0x0E, 0x5C, 0xAC, 0xD2, 0x25, 0x38, 0xAD, 0x35, 0x75, 0xDD, 0x26, 
-0x4D, 0xE9, 0xAE, 0xFD, 0xA7, 0x80, 0x0B, 0x2F, 0xBC, 0xC4, 0x8B, 0xCF, 0x3C, 0xC3, 0xCE, 0x8D, 
-0x5B, 0x29, 0xB9, 0x1A, 0x93, 0x5C, 0x42, 0xBA, 0x9E, 0x81, 0x52, 0xC9, 0xCB, 0xEB, 0xBB, 0x85, 
-0x4A, 0x15, 0xCA, 0xFE, 0xD7, 0xF2, 0x86, 0xA4, 0x9B, 0xD6, 0xA5, 0x51, 0x9D, 0x29, 0x6A, 0x97, 
-0x69, 0xF7, 0x8B, 0x62, 0xD1, 0x04, 0x1D, 0x89, 0x56, 0xA5, 0xEA, 0x5D, 0x12, 0x85, 0x4B, 0x45, 
-0x21, 0xFA, 0x00, 0x01, 0x08, 0x10, 0xEB, 0xA4, 0x43, 0x92, 0x76, 0x95, 0xA9, 0x71, 0x18, 0xF0, 
-0xA0, 0x35, 0x7D, 0xA5, 0x19, 0x07, 0x85, 0x26, 0xED, 0x90, 0x86, 0x08, 0xAB, 0x59, 0xE0, 0xF0, 
-0xC8, 0xF2, 0xF0, 0xE1, 0x15, 0xEE, 0x39, 0xB4, 0xCA, 0x91, 0xE5, 0x65, 0x7A, 0x79, 0x8F, 0xBD, 
-0x79, 0xCB, 0xA5, 0x5B, 0x77, 0xB8, 0xBC, 0x3B, 0xE1, 0xC6, 0x74, 0xC6, 0x8D, 0x9D, 0x1D, 0x6E, 
-0xCD, 0xE7, 0xDC, 0x68, 0x1D, 0x73, 0x2C, 0x35, 0x96, 0x96, 0x0C, 0x4F, 0x12, 0xB5, 0xF7, 0x3A, 
-0xE2, 0x88, 0x18, 0x9B, 0x23, 0x31, 0x43, 0x62, 0x0E, 0x31, 0x4B, 0xE2, 0x57, 0x24, 0xBA, 0xA2, 
-0xE0, 0xB1, 0x26, 0x00, 0x5E, 0x5A, 0x37, 0x8B, 0x45, 0x6E, 0x9A, 0xBA, 0x9D, 0xEC, 0x0A, 0xFE, 
-0xD5, 0xA2, 0xC8, 0x5E, 0x37, 0x70, 0x45, 0x1B, 0xAE, 0x3C, 0x78, 0xFF, 0x7D, 0x5F, 0xB9, 0xE7, 
-0x81, 0x07, 0x5E, 0x38, 0x72, 0x64, 0x6D, 0xF7, 0x6F, 0xFD, 0xAD, 0xFF, 0xE2, 0x6D, 0xA9, 0x89, 
-0xFD, 0xAE, 0x12, 0xEE, 0x9B, 0xE3, 0x33, 0x9F, 0xF9, 0x8C, 0xAD, 0xAA, 0xCA, 0x3C, 0xF3, 0x4C, 
-0x9B, 0x7F, 0xE5, 0x37, 0x3F, 0xBB, 0xF5, 0x95, 0xAF, 0x7D, 0xE3, 0x1D, 0xB7, 0x6F, 0xDF, 0xB9, 
-0x77, 0xE6, 0xC3, 0x53, 0xE2, 0xFD, 0xA3, 0xD8, 0xD1, 0x29, 0x5D, 0x2C, 0xAB, 0x58, 0xA5, 0x66, 
-0x00, 0x12, 0xE8, 0x67, 0x05, 0xCE, 0xF9, 0xBB, 0x60, 0x3A, 0x11, 0x45, 0x4B, 0xBA, 0xFF, 0xA4, 
-0xAE, 0x7C, 0x72, 0x72, 0x9A, 0x61, 0x49, 0x0D, 0xB2, 0x12, 0xA1, 0x8F, 0x67, 0x4D, 0x69, 0x4E, 
-0x2D, 0x97, 0x9C, 0x1C, 0x17, 0x3C, 0x79, 0xCF, 0x71, 0x4E, 0x1D, 0x5E, 0x03, 0x71, 0xEC, 0xCD, 
-0xE6, 0x6C, 0x57, 0x2D, 0xAF, 0xDD, 0xDE, 0xE5, 0xC5, 0xCB, 0x37, 0x38, 0x7F, 0x73, 0xC2, 0x6B, 
-0xCE, 0xB2, 0x47, 0x49, 0x8D, 0xA2, 0xC5, 0xE0, 0x94, 0xC5, 0x29, 0x93, 0x54, 0xFE, 0xB5, 0x49, 
-0xC3, 0x14, 0xDD, 0x08, 0xAA, 0xED, 0x15, 0x14, 0xA3, 0x01, 0x1B, 0x87, 0x0F, 0x71, 0xF2, 0x9E, 
-0xB3, 0x1C, 0x3E, 0x71, 0x8C, 0x72, 0x50, 0xA2, 0x4C, 0xDA, 0xA6, 0xB9, 0xA6, 0x25, 0xB7, 0x86, 
-0xE7, 0xBE, 0xF1, 0x0C, 0xDF, 0xFA, 0xDA, 0x37, 0xF0, 0xF3, 0x9A, 0x7E, 0x67, 0x02, 0xA8, 0x51, 
-0x04, 0x89, 0xB4, 0x51, 0x88, 0x5A, 0xA1, 0x8A, 0x8C, 0x27, 0xDE, 0xFB, 0x24, 0x9B, 0xC7, 0x8E, 
-0x60, 0xCB, 0x22, 0x19, 0x46, 0x2A, 0xD0, 0x26, 0x4B, 0x15, 0xAE, 0x24, 0x7B, 0x95, 0x4C, 0x19, 
-0xB2, 0x08, 0xAF, 0xBE, 0xF8, 0x22, 0xCF, 0x7C, 0xFD, 0x6B, 0xCC, 0x27, 0x53, 0x0A, 0x9B, 0x04, 
-0xA2, 0xD5, 0x9B, 0xED, 0xDB, 0xDF, 0x66, 0xBC, 0xA1, 0xE2, 0x15, 0xDD, 0x89, 0x80, 0x74, 0xDB, 
-0x3A, 0x95, 0xA6, 0xD5, 0x12, 0xE4, 0x9B, 0xAE, 0x8E, 0x83, 0xB0, 0xC1, 0xA2, 0xC2, 0xD5, 0x74, 
-0xDE, 0x6E, 0xBA, 0xB3, 0xCA, 0x96, 0x00, 0xDE, 0xE3, 0x5B, 0x97, 0x9A, 0x62, 0x4E, 0xD2, 0x94, 
-0x98, 0x29, 0x91, 0x90, 0xD6, 0x97, 0x55, 0x81, 0x12, 0x87, 0x0D, 0x33, 0x8C, 0x54, 0xF4, 0x99, 
-0x71, 0x4C, 0x1B, 0xCE, 0xAC, 0x94, 0xDC, 0xBF, 0xB9, 0xC2, 0xD9, 0xF5, 0x92, 0x53, 0x7D, 0xCB, 
-0x46, 0x16, 0xE9, 0x35, 0x53, 0x62, 0x35, 0x67, 0x54, 0xF4, 0xD0, 0xD2, 0x4D, 0x0F, 0x76, 0xCB, 
-0x30, 0x46, 0x8F, 0x04, 0x4F, 0xC3, 0x9C, 0x4A, 0xEF, 0xA0, 0x47, 0xC2, 0x68, 0x7D, 0xCC, 0xF2, 
-0xE1, 0x25, 0xF2, 0x43, 0x43, 0x18, 0x69, 0x30, 0x35, 0x4D, 0x9C, 0xA3, 0x6D, 0x62, 0x25, 0x98, 
-0x60, 0x31, 0x92, 0x43, 0x18, 0xC2, 0x54, 0x98, 0x6D, 0xCF, 0xA8, 0x6E, 0xD7, 0x4C, 0xAE, 0xCF, 
-0xF0, 0x7B, 0x01, 0xE3, 0x33, 0x06, 0xF9, 0x80, 0x1E, 0x3D, 0x62, 0x23, 0x49, 0x68, 0x3C, 0xCB, 
-0xA9, 0xA3, 0x67, 0xCF, 0x7B, 0x9A, 0xBC, 0x4F, 0x1C, 0xAD, 0xB3, 0x23, 0x25, 0xAF, 0xDE, 0x9E, 
-0xF1, 0xEC, 0x6B, 0xD7, 0x78, 0xEE, 0xC6, 0x2E, 0x2F, 0xB9, 0xC8, 0x36, 0x05, 0x2D, 0x96, 0x68, 
-0xFB, 0x34, 0x62, 0x98, 0x87, 0x08, 0x2A, 0x89, 0xE6, 0x7B, 0x57, 0x93, 0xA9, 0x48, 0x6E, 0x75, 
-0x62, 0xA8, 0x58, 0x93, 0x9A, 0x77, 0x26, 0x35, 0x1B, 0x8D, 0x0A, 0x68, 0x9D, 0x74, 0x58, 0x7D, 
-0x0C, 0x64, 0xBD, 0x92, 0xFB, 0x1F, 0x79, 0x88, 0x07, 0x9F, 0x78, 0x14, 0xAF, 0x4D, 0xA7, 0xBB, 
-0xDA, 0x4D, 0x96, 0x89, 0x60, 0x62, 0x82, 0x0C, 0x6C, 0x47, 0x59, 0x73, 0x2A, 0x19, 0x39, 0xD2, 
-0xC1, 0x0A, 0x07, 0x23, 0x2A, 0xD2, 0x58, 0xAB, 0x82, 0xE0, 0x3C, 0x99, 0x36, 0x04, 0xE7, 0x19, 
-0x96, 0x3D, 0xDA, 0xBA, 0xE1, 0x37, 0x7F, 0xED, 0xB3, 0xDC, 0x7E, 0xFD, 0x32, 0x6D, 0x35, 0xDF, 
-0x37, 0x39, 0x15, 0xDF, 0xDD, 0xD4, 0xBA, 0x04, 0x9F, 0x56, 0xEF, 0x1B, 0x63, 0x51, 0xF1, 0xA6, 
-0x4A, 0xBB, 0xA3, 0xCB, 0x75, 0xC9, 0x56, 0x92, 0xE4, 0xC4, 0x3E, 0xDC, 0x94, 0x1C, 0xE4, 0x52, 
-0xB5, 0x9B, 0x76, 0x35, 0x0B, 0xC8, 0x43, 0xA5, 0x14, 0xAD, 0x25, 0x71, 0x8B, 0x43, 0xF2, 0x35, 
-0x14, 0x9F, 0x28, 0x9D, 0x21, 0x08, 0x12, 0x93, 0x5A, 0x57, 0x08, 0x81, 0x28, 0x91, 0x4C, 0x2B, 
-0x32, 0x15, 0x41, 0x3C, 0x88, 0xA3, 0x2F, 0x8E, 0x65, 0x1A, 0x56, 0x10, 0xD6, 0x8B, 0x21, 0x27, 
-0x36, 0xC6, 0x9C, 0xDB, 0x1C, 0x71, 0x7A, 0xB9, 0xE4, 0xC8, 0x40, 0x33, 0x2E, 0x0C, 0xA8, 0x82, 
-0x57, 0xAE, 0xDF, 0xE1, 0xEB, 0xAF, 0xDE, 0xE6, 0xFC, 0xCD, 0x19, 0x57, 0x1A, 0x61, 0x3B, 0x04, 
-0xE6, 0x78, 0xE6, 0x08, 0x8E, 0x1E, 0x8E, 0x82, 0x48, 0x8E, 0xA8, 0x2C, 0x0D, 0x9B, 0xA8, 0x88, 
-0x97, 0x96, 0x20, 0x9E, 0x2C, 0x2B, 0x08, 0x5E, 0x11, 0x83, 0xE9, 0x18, 0x34, 0x79, 0x1A, 0x7B, 
-0x26, 0x60, 0x4C, 0x44, 0xC5, 0x99, 0x38, 0x99, 0x5D, 0x56, 0x84, 0x17, 0xCB, 0xDC, 0x7C, 0x76, 
-0xEB, 0xD0, 0xFA, 0xB7, 0x9E, 0x78, 0xF4, 0xDC, 0xF3, 0x4F, 0xFF, 0xD0, 0x53, 0x57, 0x8F, 0x1D, 
-0x7B, 0xA8, 0x52, 0x6A, 0x1C, 0x3E, 0xFE, 0xF1, 0x87, 0xDC, 0xDB, 0x49, 0xB2, 0x07, 0xE3, 0x3B, 
-0x8F, 0xFA, 0xF7, 0x21, 0xFE, 0xD2, 0x5F, 0xFA, 0x7F, 0x8E, 0xFF, 0xF5, 0xA7, 0x3E, 0xFD, 0xC3, 
-0xAF, 0xBD, 0x72, 0xE3, 0x1F, 0x22, 0xE5, 0x32, 0xD1, 0x90, 0x9B, 0x1C, 0xBC, 0x27, 0xD7, 0x8A, 
-0x3A, 0xCC, 0x30, 0x64, 0xA4, 0x54, 0x10, 0x11, 0x42, 0x12, 0x59, 0xD4, 0x1A, 0x1D, 0x15, 0x42, 
-0x12, 0x12, 0x89, 0x12, 0xD1, 0x4A, 0xD3, 0xB3, 0x16, 0xEB, 0x6B, 0xCA, 0x6E, 0x62, 0xE4, 0x30, 
-0x35, 0x7F, 0xF8, 0xF1, 0x87, 0x79, 0xD7, 0x99, 0xA3, 0x0C, 0x75, 0x83, 0x6B, 0x2B, 0x74, 0x96, 
-0x51, 0x89, 0x62, 0xBB, 0x6E, 0xB9, 0xB0, 0xD3, 0xF0, 0xC5, 0x57, 0x6E, 0x71, 0x65, 0x2E, 0x5C, 
-0xDD, 0x9D, 0xB0, 0x8D, 0x67, 0x46, 0x96, 0x4E, 0x82, 0x2E, 0x08, 0xC6, 0xE2, 0xE9, 0xB6, 0xC2, 
-0x1D, 0x1F, 0x33, 0x74, 0xCE, 0xBA, 0x4B, 0xAB, 0x2B, 0x2C, 0x6D, 0xAC, 0x70, 0xF4, 0xCC, 0x71, 
-0xD6, 0x0E, 0xAD, 0xB3, 0xBC, 0xBC, 0x4C, 0x61, 0x2D, 0xD5, 0x6C, 0xCE, 0x17, 0x7E, 0xE3, 0x37, 
-0xB9, 0x70, 0xFE, 0x3C, 0xFD, 0xBC, 0x20, 0x57, 0x06, 0x89, 0xC9, 0x61, 0xB7, 0x8D, 0x81, 0x2A, 
-0x04, 0x74, 0x99, 0xB3, 0x76, 0x64, 0x8B, 0x47, 0xDF, 0xFD, 0x24, 0xFD, 0xC1, 0x20, 0xD9, 0x7C, 
-0xEC, 0x73, 0x1D, 0x3B, 0x35, 0xFD, 0x20, 0xE4, 0xDA, 0x90, 0x6B, 0x43, 0xB5, 0xBB, 0xCB, 0x33, 
-0xBF, 0xF5, 0x75, 0x5E, 0xBF, 0x78, 0x81, 0x2C, 0xA6, 0xAA, 0x63, 0x71, 0xFA, 0xE2, 0xF7, 0xD0, 
-0x45, 0x7D, 0x73, 0xBC, 0x25, 0xB4, 0xD0, 0x25, 0xDC, 0xD4, 0x23, 0x4F, 0xE2, 0x1F, 0x29, 0xB9, 
-0xDE, 0xD5, 0x86, 0xD8, 0x9F, 0x56, 0x93, 0xA4, 0xEB, 0xAB, 0x54, 0x12, 0x7C, 0xA6, 0xC3, 0xD8, 
-0x62, 0x8C, 0x48, 0xDB, 0x10, 0x1B, 0x47, 0x68, 0x03, 0x21, 0x08, 0x5E, 0x2C, 0xA1, 0xC3, 0xBA, 
-0x31, 0x86, 0x5C, 0x41, 0x1E, 0xE6, 0xF4, 0xE2, 0x0E, 0x3D, 0xA6, 0x6C, 0x1A, 0xC5, 0x91, 0x9E, 
-0xE2, 0x89, 0xE3, 0x5B, 0xDC, 0xBB, 0x31, 0xE4, 0xCC, 0xC6, 0x12, 0x4B, 0xB4, 0x98, 0xBD, 0x9B, 
-0xD8, 0x6A, 0x8F, 0xBE, 0x82, 0xD2, 0x1A, 0xF0, 0x24, 0x4E, 0xAA, 0xB5, 0x08, 0xE0, 0xA3, 0xC3, 
-0x49, 0x8B, 0x52, 0x81, 0x50, 0x38, 0x58, 0x0A, 0x2C, 0x1F, 0x19, 0x32, 0x3A, 0xB2, 0x09, 0xE3, 
-0x0C, 0xA8, 0x08, 0x52, 0x21, 0xB9, 0x87, 0x3C, 0x35, 0x69, 0xD2, 0x80, 0x00, 0x98, 0x90, 0x63, 
-0xA5, 0x87, 0x0A, 0x79, 0x02, 0x3F, 0x1B, 0x45, 0x75, 0x73, 0xCE, 0xDE, 0xF5, 0x3D, 0xA6, 0x37, 
-0x66, 0xD8, 0x36, 0x63, 0xA4, 0x46, 0x64, 0xB1, 0x20, 0x36, 0x1E, 0xEF, 0x22, 0xDE, 0x2A, 0x54, 
-0x5E, 0x50, 0x29, 0xCD, 0x6E, 0x2B, 0x48, 0x39, 0xA6, 0x1C, 0x6F, 0xB2, 0x33, 0x8F, 0x3C, 0x7F, 
-0xED, 0x0E, 0x5F, 0xBC, 0x76, 0x9B, 0x97, 0x26, 0x35, 0x57, 0x66, 0x15, 0xBB, 0x58, 0xE6, 0x6A, 
-0x48, 0x45, 0x46, 0x8B, 0x05, 0xAD, 0x92, 0xAD, 0x4B, 0x4C, 0xD2, 0x8E, 0x4A, 0x45, 0xC4, 0x6A, 
-0x74, 0x9E, 0xA1, 0x8A, 0x2C, 0x25, 0x39, 0xD2, 0x56, 0xDA, 0xC5, 0x80, 0x93, 0xC8, 0xD6, 0xD1, 
-0xC3, 0x3C, 0xFC, 0xCE, 0x47, 0x39, 0x74, 0xE2, 0x18, 0x75, 0xF4, 0x9D, 0xCD, 0x8F, 0x00, 0x29, 
-0x61, 0x99, 0x98, 0x70, 0x51, 0x13, 0x17, 0x5B, 0xF2, 0x48, 0xD0, 0xE9, 0x86, 0xB9, 0x88, 0xFD, 
-0x6D, 0xBB, 0x62, 0xFF, 0xE7, 0x54, 0x27, 0xDA, 0x2F, 0x8D, 0x23, 0xD7, 0x86, 0xDB, 0x37, 0x6F, 
-0xF1, 0x9B, 0xBF, 0xFA, 0xAB, 0xD4, 0xD3, 0x49, 0xD7, 0x04, 0x4E, 0xB0, 0x87, 0x74, 0x10, 0x94, 
-0xEE, 0x84, 0x63, 0x0E, 0x26, 0xDC, 0x45, 0xA2, 0x5D, 0x44, 0xC2, 0x8B, 0x53, 0x65, 0x9D, 0xD6, 
-0x6F, 0x5A, 0x33, 0x51, 0xC5, 0x34, 0xFD, 0x79, 0x60, 0xB9, 0x25, 0x01, 0xA8, 0xA4, 0xB0, 0x05, 
-0x24, 0x31, 0x20, 0x15, 0xF1, 0xBE, 0x4D, 0x15, 0x6D, 0x8C, 0x04, 0x2F, 0x88, 0x68, 0x24, 0x1A, 
-0x3C, 0x09, 0xE2, 0xB3, 0xD6, 0x22, 0x31, 0xA0, 0xA3, 0xC3, 0xC4, 0x84, 0xF3, 0x67, 0x34, 0xF4, 
-0x81, 0x55, 0x22, 0xC7, 0xF3, 0xC8, 0xD9, 0xF5, 0x25, 0xEE, 0x3D, 0x71, 0x82, 0xD3, 0x6B, 0xCB, 
-0x1C, 0x2E, 0x61, 0x48, 0x4B, 0xEE, 0xF6, 0x68, 0x7D, 0x64, 0xAE, 0xFB, 0x7C, 0xE6, 0xD9, 0x8B, 
-0x7C, 0xE6, 0x95, 0x6D, 0x2E, 0x52, 0xB0, 0xC3, 0x90, 0x9A, 0xBC, 0xDB, 0x1D, 0x28, 0x5C, 0x37, 
-0xDC, 0x92, 0x5A, 0x7B, 0xAA, 0xC3, 0xD8, 0x23, 0x19, 0x01, 0xAB, 0x93, 0xB7, 0x22, 0xCA, 0xE2, 
-0xC5, 0x22, 0xAA, 0xC0, 0x9A, 0x22, 0x15, 0x57, 0xB1, 0xC1, 0xE2, 0x50, 0xAA, 0xDE, 0x39, 0x77, 
-0xE6, 0xF0, 0x5F, 0xFE, 0xC9, 0x9F, 0xFA, 0xA3, 0x9F, 0xCC, 0xF3, 0xD7, 0x6E, 0x2F, 0x06, 0xBB, 
-0x7E, 0xBF, 0xF1, 0x1D, 0x2C, 0x85, 0xEF, 0x47, 0x7C, 0xF9, 0xCB, 0x9F, 0x6C, 0x3E, 0xFE, 0x47, 
-0xFF, 0xE3, 0xC9, 0x37, 0x7F, 0xFB, 0x85, 0xFF, 0x45, 0xF4, 0x61, 0x8C, 0x78, 0xA5, 0x25, 0x20, 
-0x52, 0xA3, 0xA8, 0x58, 0x5B, 0xE9, 0x63, 0x6C, 0x43, 0x1B, 0xA7, 0xB4, 0x71, 0x97, 0x48, 0x45, 
-0xA0, 0x05, 0x69, 0x13, 0xFB, 0x00, 0x85, 0xC9, 0x0A, 0x3C, 0x96, 0x16, 0x4B, 0x1D, 0xA1, 0x4D, 
-0xEE, 0x67, 0x64, 0x40, 0x41, 0x64, 0xC9, 0x08, 0x27, 0x57, 0x07, 0x2C, 0x29, 0x47, 0xD9, 0xCE, 
-0x29, 0xA3, 0xA7, 0x17, 0x1C, 0x63, 0x6B, 0x58, 0xCA, 0x0C, 0xE7, 0x4E, 0x6C, 0xB1, 0xD9, 0xB7, 
-0x0C, 0x42, 0x45, 0x51, 0x57, 0xE4, 0x31, 0x60, 0xF0, 0x20, 0x89, 0x13, 0x69, 0x74, 0x96, 0x92, 
-0xAE, 0xA4, 0x13, 0xA2, 0x04, 0xC4, 0x05, 0xDA, 0x69, 0xC5, 0xDE, 0xF6, 0x1D, 0x5E, 0x7B, 0xF5, 
-0x22, 0xB7, 0x6F, 0xDC, 0xA0, 0xDA, 0x9B, 0xD0, 0xCC, 0xE6, 0xDC, 0xBC, 0x72, 0x95, 0x57, 0x5F, 
-0x7E, 0x89, 0x4C, 0x41, 0x2F, 0x33, 0x48, 0xF0, 0xC4, 0x98, 0x7C, 0xD5, 0x5A, 0x02, 0xC1, 0x2A, 
-0x8A, 0xE5, 0x21, 0xC7, 0xCE, 0x9D, 0x62, 0xED, 0xD0, 0x26, 0x18, 0x93, 0xB4, 0x70, 0x17, 0x6C, 
-0x80, 0x54, 0x5A, 0xA4, 0xEA, 0x41, 0x69, 0x42, 0xD3, 0xF0, 0xDA, 0x2B, 0x17, 0x78, 0xFD, 0xC2, 
-0xAB, 0x04, 0xE7, 0xB0, 0x24, 0xC3, 0x3B, 0xBD, 0xD8, 0xE2, 0xBF, 0x69, 0x61, 0xBF, 0x55, 0xA8, 
-0xB7, 0xE2, 0xCF, 0x76, 0x91, 0x88, 0x09, 0x0B, 0x58, 0xE1, 0x20, 0x38, 0xDB, 0xFD, 0x5B, 0xA9, 
-0x74, 0x11, 0x08, 0x60, 0x52, 0xC3, 0x50, 0x2D, 0xC6, 0x27, 0x9D, 0xE0, 0x42, 0x48, 0x66, 0x8D, 
-0x75, 0x4C, 0x06, 0x7B, 0x51, 0x21, 0x92, 0x13, 0x55, 0xDA, 0x7E, 0xE5, 0x59, 0x8E, 0x15, 0x47, 
-0xE9, 0x67, 0x0C, 0x64, 0x87, 0x4D, 0xF6, 0xB8, 0xAF, 0x30, 0xBC, 0xEF, 0xD4, 0x06, 0x1F, 0xBE, 
-0xE7, 0x10, 0xEF, 0x3A, 0xBA, 0xC4, 0xD1, 0xDC, 0x33, 0x68, 0x26, 0xD8, 0xF9, 0x0E, 0x85, 0xAB, 
-0xE8, 0x75, 0x34, 0x36, 0xD7, 0x7A, 0x94, 0x31, 0x04, 0x2D, 0x04, 0x23, 0xB4, 0xA6, 0xA5, 0x32, 
-0x33, 0x7C, 0xD1, 0x62, 0x56, 0x84, 0x7C, 0xDD, 0x70, 0xE4, 0x91, 0xA3, 0x14, 0x1B, 0x25, 0xF4, 
-0x00, 0x69, 0x10, 0xED, 0x11, 0x2B, 0x28, 0xDD, 0x75, 0xB8, 0xD3, 0x4E, 0x3D, 0xF9, 0x91, 0xA1, 
-0x3B, 0xC7, 0xE7, 0x88, 0x98, 0x00, 0x39, 0xE4, 0xE3, 0x82, 0xE1, 0xDA, 0x90, 0xB2, 0x9F, 0x51, 
-0x35, 0x15, 0x3B, 0x7B, 0x7B, 0x34, 0xCE, 0x61, 0x6C, 0x86, 0xCE, 0x2D, 0x8D, 0x6F, 0xF0, 0x04, 
-0xB2, 0xDC, 0x30, 0xEC, 0x17, 0xE4, 0x44, 0x4C, 0x3B, 0x67, 0x59, 0x0B, 0x47, 0x56, 0x87, 0x1C, 
-0xDD, 0x18, 0xB3, 0x3C, 0x30, 0xE8, 0xB6, 0xA6, 0x99, 0xEF, 0xD1, 0xD2, 0x00, 0x9D, 0x15, 0x92, 
-0x52, 0x8B, 0xDA, 0x6F, 0x5F, 0x9A, 0x3E, 0xA8, 0xB4, 0x25, 0x16, 0x9D, 0x58, 0x2D, 0x89, 0xE1, 
-0xA0, 0x50, 0xD6, 0x92, 0x15, 0x3D, 0x8E, 0x9F, 0x3D, 0xCD, 0x89, 0x33, 0xA7, 0xF1, 0x5A, 0xE1, 
-0x90, 0x24, 0xCD, 0xA8, 0xE8, 0xD8, 0x21, 0x0B, 0xB6, 0x09, 0x69, 0xDF, 0xD7, 0xA9, 0xB0, 0x75, 
-0x27, 0x2A, 0x15, 0x26, 0x2A, 0x7D, 0x4E, 0x7C, 0xEE, 0xC4, 0x1B, 0x58, 0x0C, 0x54, 0x68, 0x49, 
-0xCD, 0xD1, 0x9D, 0xDB, 0xDB, 0x5C, 0x38, 0xFF, 0x22, 0xB7, 0xAE, 0x5D, 0xC3, 0x44, 0x41, 0xEB, 
-0x94, 0x6A, 0x16, 0xB2, 0x17, 0x0A, 0xC1, 0x70, 0x57, 0x0C, 0xE9, 0xCD, 0x89, 0x76, 0x3F, 0xBA, 
-0xBF, 0xC5, 0x7E, 0x72, 0x5F, 0xAC, 0xC7, 0x44, 0x79, 0x4B, 0xBA, 0xA8, 0xC9, 0x69, 0x39, 0x61, 
-0x09, 0x09, 0xAA, 0x0B, 0xD1, 0x11, 0xBD, 0xDF, 0x77, 0xED, 0x48, 0xFE, 0x85, 0x92, 0x46, 0xB8, 
-0xA3, 0x41, 0x24, 0xB9, 0x75, 0xA0, 0x34, 0xD1, 0x37, 0x20, 0x9E, 0x9E, 0xD4, 0x0C, 0xA8, 0x58, 
-0x66, 0xCA, 0x61, 0x1C, 0x0F, 0x8E, 0xFB, 0x3C, 0xB1, 0xD5, 0xE7, 0x83, 0xF7, 0xAD, 0xF3, 0xD8, 
-0xB1, 0x3E, 0xF7, 0xAD, 0xF6, 0xD9, 0x34, 0x0D, 0xC3, 0xF9, 0x0E, 0x65, 0xB5, 0x43, 0x11, 0x1C, 
-0x26, 0xCF, 0xB8, 0xEE, 0x22, 0x5F, 0xBC, 0x74, 0x9D, 0xAF, 0x4F, 0x1D, 0xD7, 0xD5, 0x32, 0xB7, 
-0xCD, 0x90, 0xA9, 0xC9, 0x08, 0xDA, 0x50, 0xC7, 0x40, 0xA3, 0x02, 0xD1, 0x44, 0x32, 0x0D, 0xA5, 
-0x09, 0x94, 0xD2, 0x52, 0x30, 0x65, 0xC4, 0x9C, 0x91, 0x34, 0xF4, 0x71, 0x2C, 0xE5, 0x19, 0x56, 
-0x29, 0x5C, 0x68, 0x3A, 0x77, 0x10, 0x40, 0x05, 0xB4, 0x89, 0x12, 0xE2, 0xEE, 0xEB, 0x7F, 0xF0, 
-0xC7, 0x3E, 0xFA, 0xB7, 0xFE, 0x5F, 0x7F, 0xF7, 0x3F, 0xBF, 0xF4, 0xD9, 0xCF, 0x7E, 0xF6, 0xBB, 
-0x1C, 0xA8, 0xDF, 0x7D, 0xFC, 0x40, 0x12, 0x2E, 0xC0, 0x87, 0x3E, 0xF4, 0x27, 0xED, 0x17, 0x3E, 
-0xF7, 0xF9, 0x8F, 0xF7, 0x6C, 0x7F, 0x2B, 0xD7, 0x99, 0x02, 0x8F, 0x52, 0x9E, 0xD5, 0x95, 0x82, 
-0xF7, 0x7D, 0xF0, 0x31, 0x3E, 0xFA, 0xA3, 0xEF, 0xE1, 0xD0, 0xF1, 0x65, 0xCA, 0xB1, 0x21, 0xEF, 
-0x09, 0x99, 0x69, 0x20, 0x4C, 0xD0, 0x7E, 0x8F, 0x9C, 0x8A, 0x10, 0x6B, 0x94, 0x12, 0x6C, 0xA6, 
-0xC1, 0x08, 0x4A, 0x47, 0x0A, 0xE5, 0x29, 0xA4, 0xA1, 0x64, 0xC6, 0x99, 0x71, 0x9F, 0xFB, 0xB6, 
-0x56, 0x58, 0xC5, 0x51, 0xF8, 0x9A, 0x22, 0x38, 0xA8, 0x6B, 0x6C, 0x0C, 0x68, 0xD7, 0xD2, 0x57, 
-0x9E, 0xD5, 0x52, 0x71, 0x7C, 0x69, 0xC4, 0xD1, 0xE5, 0x25, 0x56, 0xB2, 0x9C, 0xAC, 0x8D, 0x18, 
-0xEF, 0x52, 0x23, 0x24, 0xB6, 0x64, 0x68, 0xAC, 0x35, 0x49, 0xF2, 0x80, 0xCE, 0xCC, 0xB2, 0x5B, 
-0xF0, 0x44, 0xCF, 0xE4, 0xD6, 0x2D, 0x6E, 0x5C, 0xBB, 0xC1, 0xE4, 0xCE, 0x0E, 0x37, 0xAF, 0x5E, 
-0x67, 0x72, 0xE7, 0x0E, 0xE3, 0xC1, 0x80, 0x7A, 0x5E, 0x63, 0xB4, 0x4A, 0x0B, 0xD7, 0xE8, 0x34, 
-0x06, 0x5C, 0x18, 0xC6, 0x2B, 0x4B, 0x9C, 0x3C, 0x7B, 0x96, 0xDE, 0x70, 0x80, 0x48, 0x6A, 0x96, 
-0x75, 0x44, 0x9F, 0xB4, 0xED, 0x52, 0xAA, 0xD3, 0x4D, 0x80, 0x66, 0x3A, 0xE3, 0xA5, 0xE7, 0xCE, 
-0xB3, 0xBB, 0x7D, 0x9B, 0xC2, 0x64, 0xD0, 0x91, 0xDE, 0x17, 0x09, 0x37, 0x59, 0xBD, 0xDF, 0x9D, 
-0xC6, 0x79, 0xAB, 0x8F, 0xEF, 0x15, 0xE9, 0xF1, 0xBB, 0x23, 0x92, 0x77, 0xAF, 0xDD, 0x74, 0xC1, 
-0xA2, 0x4C, 0xAA, 0x5E, 0x44, 0x03, 0x06, 0x8D, 0x4D, 0x15, 0x48, 0x1B, 0x71, 0x2E, 0xE0, 0x5B, 
-0xC1, 0xB7, 0x01, 0xEF, 0x02, 0x51, 0x0C, 0x4A, 0xE5, 0x18, 0x63, 0x53, 0x45, 0x25, 0x2E, 0x0D, 
-0xAE, 0xC4, 0x3B, 0xAC, 0xB2, 0xC7, 0x3D, 0x05, 0x3C, 0x75, 0x78, 0x85, 0xF7, 0x9E, 0x5E, 0xE3, 
-0xF1, 0xA3, 0xCB, 0xDC, 0xB7, 0x52, 0xD2, 0xAF, 0xEE, 0x30, 0xF2, 0x73, 0xCA, 0xD8, 0x52, 0x04, 
-0x47, 0x21, 0x92, 0x04, 0x9F, 0xBB, 0x4A, 0x3A, 0x1A, 0x68, 0x71, 0xD4, 0xAA, 0xA2, 0xB6, 0x73, 
-0x62, 0xD9, 0x52, 0x6C, 0x65, 0x6C, 0x9C, 0x59, 0x65, 0xE9, 0xBE, 0x43, 0xD0, 0x0B, 0x50, 0xA6, 
-0x2E, 0x52, 0x12, 0x04, 0x4F, 0x62, 0x30, 0x01, 0x21, 0x78, 0x9F, 0x70, 0xCC, 0xD0, 0x09, 0xDE, 
-0x24, 0x94, 0x31, 0xE9, 0xEC, 0x9A, 0x08, 0x3A, 0x12, 0x74, 0x0B, 0x59, 0xA4, 0x18, 0x94, 0x0C, 
-0x97, 0x47, 0x14, 0xBD, 0x9C, 0xC6, 0x35, 0xCC, 0xEA, 0x39, 0xB5, 0x6B, 0xC8, 0xCB, 0x22, 0xC1, 
-0x5C, 0x31, 0xA2, 0xA3, 0x47, 0x45, 0x47, 0x8E, 0x90, 0xE1, 0x90, 0x76, 0xC6, 0xB0, 0x97, 0xB1, 
-0xB9, 0x34, 0x64, 0x63, 0x69, 0x40, 0x4F, 0x6B, 0x62, 0xDD, 0x80, 0x6F, 0x89, 0xB1, 0x25, 0xC4, 
-0x16, 0x45, 0xD7, 0xC9, 0x32, 0x02, 0xA6, 0x4B, 0x84, 0x4A, 0x11, 0x24, 0x10, 0x7D, 0xC4, 0xA8, 
-0x1C, 0xEF, 0x84, 0xAC, 0xE8, 0xD1, 0x1F, 0x8F, 0x38, 0x7D, 0xEF, 0xBD, 0x6C, 0x1E, 0x39, 0xC2, 
-0x5E, 0x3D, 0x4F, 0xD0, 0x93, 0x49, 0xAE, 0xB2, 0x6A, 0x91, 0xD4, 0xBA, 0xBB, 0x6B, 0x5C, 0x50, 
-0xA7, 0x16, 0xE7, 0xEC, 0x4D, 0x95, 0xED, 0x3E, 0x54, 0xDA, 0xAD, 0xA7, 0x18, 0x52, 0xB5, 0x9A, 
-0x2B, 0xCD, 0xB5, 0xD7, 0x5E, 0xE7, 0xA5, 0x67, 0x9F, 0xC7, 0xB7, 0x2D, 0xB9, 0x49, 0x56, 0x4D, 
-0xFB, 0x95, 0x6D, 0x37, 0x09, 0xA8, 0xF8, 0x9D, 0xF5, 0x76, 0x17, 0x8B, 0x45, 0x16, 0x94, 0x6C, 
-0x52, 0xA2, 0xD5, 0x92, 0x3E, 0xAB, 0x05, 0xA5, 0x4C, 0x92, 0x26, 0x35, 0x11, 0xC4, 0x0B, 0xD1, 
-0x05, 0x7C, 0x9B, 0x76, 0x43, 0x48, 0x32, 0x27, 0x14, 0x49, 0xB0, 0x6D, 0x82, 0x10, 0xC1, 0x10, 
-0xC9, 0xA4, 0xA5, 0xAF, 0x23, 0x43, 0xA9, 0x58, 0x61, 0xCE, 0x51, 0x1C, 0xF7, 0xF6, 0x2C, 0x4F, 
-0x6C, 0x2D, 0xF3, 0xBE, 0xD3, 0x87, 0x79, 0xEA, 0xCC, 0x26, 0x67, 0x47, 0xC2, 0xBA, 0x72, 0xF4, 
-0x5C, 0x45, 0xD1, 0x54, 0xF4, 0x7D, 0x4B, 0x49, 0xC0, 0xEA, 0x88, 0x53, 0x8A, 0xDB, 0x51, 0xF1, 
-0xCD, 0x2B, 0xB7, 0x78, 0x65, 0x0E, 0xF3, 0x7C, 0x48, 0x4D, 0x82, 0x58, 0x4A, 0x23, 0xE0, 0x67, 
-0x64, 0xAA, 0x25, 0x8F, 0x33, 0x7A, 0x71, 0x46, 0x2F, 0xEE, 0x31, 0x64, 0x97, 0x75, 0xE6, 0x1C, 
-0x55, 0x81, 0xA3, 0x3D, 0xCD, 0x3D, 0x87, 0xD6, 0x39, 0xB6, 0xB9, 0x8E, 0xC9, 0x33, 0xE6, 0xB3, 
-0x7A, 0x7F, 0x60, 0x29, 0xEA, 0x88, 0x97, 0x3A, 0x2A, 0x69, 0x9F, 0x7B, 0xFF, 0xBB, 0x9E, 0xFC, 
-0xC7, 0x5F, 0xFE, 0xC6, 0xAF, 0xCE, 0xDF, 0x7C, 0x74, 0x7E, 0x3F, 0xF1, 0x03, 0x4B, 0xB8, 0x7F, 
-0xFC, 0x7D, 0x1F, 0xD7, 0x9F, 0xFF, 0xC2, 0x57, 0x7F, 0x0C, 0xE1, 0x8C, 0x17, 0xD1, 0x4A, 0x81, 
-0x36, 0x0E, 0xCF, 0x94, 0xC7, 0xDF, 0x7D, 0x1F, 0x7F, 0xEE, 0x2F, 0xFC, 0x29, 0x7E, 0xE4, 0x0F, 
-0xBF, 0x9F, 0x0F, 0xFF, 0xF0, 0xBB, 0xF8, 0xE0, 0x0F, 0x3D, 0xC6, 0xFD, 0x67, 0x36, 0xD1, 0xEE, 
-0x26, 0x23, 0x7D, 0x87, 0x42, 0xF6, 0x28, 0x6D, 0x85, 0x8A, 0x7B, 0x48, 0x9C, 0xD0, 0x33, 0x2D, 
-0x7D, 0xDD, 0x52, 0x86, 0x8A, 0x65, 0xA9, 0xD9, 0x20, 0xF0, 0xF8, 0xE1, 0x75, 0xCE, 0xAD, 0x8E, 
-0x58, 0xB3, 0x20, 0x93, 0x09, 0x56, 0x29, 0x72, 0x63, 0x68, 0x9A, 0x16, 0x83, 0x40, 0xB5, 0xCB, 
-0x40, 0x5A, 0x56, 0xAC, 0xE6, 0xC8, 0x68, 0xC0, 0xD9, 0x8D, 0x2D, 0xCE, 0x6D, 0x6E, 0x72, 0x68, 
-0x30, 0x60, 0xC5, 0x5A, 0xA8, 0x66, 0xD8, 0xE8, 0x90, 0xD8, 0x60, 0x54, 0xAA, 0x8E, 0x1A, 0x71, 
-0x04, 0x25, 0xA9, 0x8A, 0x09, 0x21, 0x55, 0x7C, 0x2E, 0x32, 0xDD, 0xDB, 0x63, 0x3E, 0x9D, 0x41, 
-0x48, 0x49, 0x28, 0x53, 0x86, 0xA6, 0x6A, 0x19, 0xF6, 0x47, 0x04, 0x89, 0x68, 0x6B, 0xC9, 0x6C, 
-0xCE, 0x23, 0x8F, 0x3E, 0xCA, 0xE6, 0xE6, 0x21, 0x74, 0xC7, 0x2F, 0x0C, 0x22, 0x49, 0x17, 0x56, 
-0x84, 0xCC, 0x58, 0xDA, 0xAA, 0xA6, 0xCC, 0x72, 0x24, 0x06, 0x2E, 0xBC, 0xF4, 0x32, 0x37, 0xAF, 
-0x5D, 0x4D, 0xBA, 0xBA, 0xDA, 0xA4, 0x6E, 0x2E, 0x89, 0x98, 0x2E, 0x07, 0x2E, 0xB2, 0x37, 0xC7, 
-0xDB, 0x49, 0xB4, 0x4A, 0xA5, 0x52, 0x32, 0x91, 0xEF, 0x13, 0x3C, 0x81, 0xEA, 0x08, 0xE6, 0x9D, 
-0x30, 0x78, 0xC4, 0x74, 0xFA, 0xC0, 0x39, 0x88, 0x21, 0x38, 0x68, 0xEB, 0x40, 0x5B, 0xA7, 0xAA, 
-0x56, 0x7C, 0x4A, 0xC6, 0x82, 0x41, 0x8C, 0x49, 0x15, 0xBB, 0x6F, 0x31, 0xB1, 0x66, 0xAC, 0x1D, 
-0x43, 0xB9, 0xC5, 0x49, 0x5A, 0x9E, 0x5C, 0xE9, 0xF3, 0xE1, 0x73, 0x87, 0x78, 0xDF, 0xA9, 0x75, 
-0x1E, 0x58, 0x29, 0x58, 0x37, 0x2D, 0xBD, 0x76, 0x42, 0x2F, 0x54, 0xF4, 0x11, 0xB2, 0x00, 0x36, 
-0x6A, 0x0A, 0xD2, 0x58, 0x6F, 0x70, 0xA9, 0x03, 0xEF, 0x4D, 0x60, 0x37, 0xEC, 0x52, 0x67, 0x15, 
-0xFD, 0xC3, 0x25, 0x87, 0xEF, 0xDF, 0x64, 0xFD, 0xDC, 0x3A, 0x76, 0xCD, 0x42, 0xD6, 0x24, 0x22, 
-0xB2, 0x49, 0xDD, 0xFE, 0x90, 0x8C, 0x67, 0x12, 0x5F, 0xB5, 0x03, 0xA1, 0x34, 0xA9, 0xBA, 0x23, 
-0xA4, 0x6D, 0xB7, 0x85, 0x44, 0xB3, 0x13, 0x01, 0x02, 0xC1, 0xA6, 0xBF, 0x21, 0x16, 0x54, 0xA1, 
-0x29, 0xC7, 0x7D, 0xCA, 0x51, 0x9F, 0xA8, 0x22, 0x6D, 0x07, 0x93, 0xE4, 0x3A, 0xA3, 0x30, 0x16, 
-0x23, 0xA9, 0x4E, 0x46, 0x07, 0x50, 0x01, 0x65, 0x23, 0xB1, 0x6E, 0x28, 0x63, 0x64, 0x73, 0x34, 
-0xE0, 0xC4, 0xC6, 0x2A, 0x87, 0x86, 0x03, 0x7A, 0x2A, 0x12, 0xE7, 0x13, 0xAA, 0xB8, 0x8B, 0xC5, 
-0xD2, 0x2A, 0x4F, 0xD4, 0x0A, 0xAF, 0xE9, 0x9C, 0x3D, 0x14, 0x2A, 0x2A, 0xA4, 0x05, 0x24, 0xC7, 
-0x7B, 0x70, 0xC0, 0x7D, 0x0F, 0x3D, 0xC4, 0xB9, 0xFB, 0xEF, 0xA3, 0x96, 0x40, 0x04, 0x54, 0x96, 
-0xA7, 0xFC, 0xAA, 0x41, 0x77, 0x8E, 0xD5, 0xA1, 0xE3, 0x79, 0x47, 0x89, 0x29, 0x35, 0x75, 0xE7, 
-0x39, 0x74, 0x37, 0x6B, 0x91, 0x74, 0x3E, 0x05, 0x52, 0x69, 0xDF, 0x89, 0x03, 0xE9, 0x74, 0x98, 
-0x50, 0x41, 0xF8, 0xC6, 0x6F, 0x7D, 0x2D, 0x0D, 0xE3, 0x28, 0xDD, 0x91, 0x54, 0xBA, 0xC9, 0x32, 
-0x52, 0xB6, 0x56, 0x6F, 0x21, 0x34, 0x94, 0x6C, 0x69, 0xEE, 0xF2, 0xBC, 0x49, 0xB7, 0x92, 0x34, 
-0xC0, 0xA0, 0x3A, 0xBE, 0x6D, 0x27, 0xDA, 0x64, 0xC4, 0x60, 0x30, 0x64, 0x58, 0x94, 0x87, 0xE0, 
-0xC0, 0xD5, 0x9E, 0x58, 0x87, 0x64, 0xF0, 0x12, 0x92, 0x5D, 0x0D, 0x51, 0x13, 0xC9, 0x88, 0xC6, 
-0x22, 0xFB, 0x63, 0xE8, 0x91, 0x0C, 0x47, 0x29, 0x15, 0x03, 0xA6, 0x6C, 0xCA, 0x9C, 0xB3, 0x16, 
-0xDE, 0xB9, 0x3A, 0xE2, 0x43, 0x27, 0x0F, 0xF1, 0x91, 0x73, 0xC7, 0x78, 0xD7, 0xB1, 0x0D, 0x4E, 
-0xF7, 0x15, 0x4B, 0xED, 0x84, 0xA5, 0xB6, 0xA2, 0x74, 0x8E, 0xCC, 0x2B, 0x6C, 0xEC, 0x34, 0xA3, 
-0x53, 0x55, 0x44, 0xB0, 0x39, 0x3E, 0x1F, 0x70, 0xAB, 0x8A, 0x5C, 0xBB, 0x33, 0x67, 0xEA, 0x6B, 
-0x72, 0xA0, 0xA0, 0xA6, 0x70, 0xB7, 0x19, 0xB2, 0xC7, 0xAA, 0xCC, 0x59, 0x65, 0xC2, 0x3D, 0x85, 
-0xE1, 0x98, 0x69, 0x78, 0xE7, 0xD1, 0x25, 0x9E, 0x3C, 0xB6, 0xCC, 0xD3, 0x27, 0xD6, 0x78, 0xFF, 
-0x03, 0xA7, 0xB9, 0xF7, 0xE8, 0x16, 0x47, 0x0E, 0xAD, 0x73, 0xE5, 0xF6, 0x6D, 0x6E, 0xEF, 0xED, 
-0x51, 0x47, 0x8F, 0x60, 0x89, 0xD6, 0xE0, 0xC3, 0x3C, 0x08, 0xD5, 0x97, 0x3F, 0xFE, 0xD1, 0xF7, 
-0xFC, 0xF3, 0x4F, 0x7F, 0xE1, 0xD3, 0xDF, 0x37, 0xB7, 0x07, 0x7E, 0x90, 0x09, 0xF7, 0xE9, 0x1F, 
-0xF9, 0x17, 0xE1, 0xB7, 0xBF, 0xF4, 0xFF, 0x79, 0xCF, 0xDC, 0xFB, 0xC7, 0x1D, 0x62, 0x95, 0xC9, 
-0xD2, 0x10, 0x41, 0x98, 0xB1, 0xBE, 0x31, 0xE0, 0x87, 0x7F, 0xFC, 0x69, 0x4E, 0x9C, 0x58, 0x65, 
-0x73, 0x63, 0xC0, 0xB9, 0x13, 0x6B, 0x9C, 0xDE, 0x1A, 0x71, 0x7C, 0xAC, 0xB8, 0x7F, 0x2B, 0xE7, 
-0xB1, 0x73, 0x6B, 0x1C, 0x5E, 0x31, 0x1C, 0xDB, 0x28, 0x59, 0x1D, 0x44, 0x4A, 0x99, 0x61, 0xDA, 
-0x5D, 0x86, 0x71, 0xCA, 0xB1, 0xBE, 0xE1, 0x9E, 0xA5, 0x3E, 0x4F, 0x9E, 0x3E, 0xC4, 0xD1, 0x41, 
-0x41, 0xDF, 0x37, 0xE0, 0xE6, 0x18, 0x11, 0x82, 0x0F, 0x38, 0x1F, 0xD0, 0x4A, 0xE8, 0xAB, 0x40, 
-0x11, 0x03, 0x3A, 0x04, 0xAC, 0x0F, 0xF4, 0xB4, 0x62, 0xA5, 0x9F, 0xB3, 0xB1, 0xD4, 0xE3, 0xF8, 
-0xFA, 0x32, 0xAB, 0x7D, 0x4B, 0xDF, 0x46, 0xC2, 0x6C, 0x82, 0x8B, 0x13, 0x54, 0x0C, 0x98, 0xCE, 
-0x89, 0x20, 0x86, 0xF4, 0x73, 0x4A, 0x3A, 0x71, 0x0C, 0x63, 0x3A, 0x29, 0x45, 0x45, 0xF0, 0x89, 
-0x3B, 0xA8, 0x95, 0x26, 0x08, 0x54, 0x75, 0x4B, 0x59, 0x0E, 0xD8, 0x3C, 0x74, 0x84, 0x7B, 0xEF, 
-0x7D, 0x80, 0xB2, 0xD7, 0xA7, 0x6E, 0x1D, 0xD6, 0xE4, 0xB4, 0x1D, 0x4D, 0xC7, 0x1A, 0x8B, 0x01, 
-0xAC, 0xD6, 0x14, 0x36, 0x63, 0x6F, 0x7B, 0x9B, 0x4B, 0x17, 0x2E, 0xB0, 0xB7, 0xBD, 0x93, 0x9A, 
-0x1E, 0xC6, 0xA6, 0x59, 0xFE, 0xEE, 0x62, 0xF8, 0xBD, 0x26, 0x5B, 0xF6, 0x9F, 0xB3, 0x8F, 0xCE, 
-0xA6, 0xCA, 0x44, 0xA7, 0x2E, 0xBA, 0x52, 0x86, 0xD8, 0xC1, 0x08, 0x4A, 0xE5, 0x20, 0x89, 0x65, 
-0x10, 0x5D, 0x24, 0xB8, 0x48, 0x74, 0xA9, 0x62, 0x54, 0xA2, 0xF0, 0xC1, 0x91, 0xAB, 0xBC, 0xEB, 
-0x75, 0xD6, 0xE8, 0xD0, 0x32, 0x36, 0x9E, 0xA5, 0x38, 0x67, 0x20, 0x37, 0x79, 0x47, 0x2F, 0xE7, 
-0xE9, 0x63, 0x2B, 0x7C, 0xE0, 0xEC, 0x26, 0x0F, 0xAF, 0x16, 0x6C, 0xE9, 0x86, 0x61, 0x98, 0x51, 
-0xFA, 0x39, 0xD6, 0x55, 0xF4, 0x48, 0x36, 0x36, 0x3A, 0x44, 0xF0, 0x31, 0x5D, 0x84, 0x12, 0x70, 
-0x26, 0x42, 0x0F, 0xA6, 0x6A, 0x4A, 0xBE, 0x96, 0xB1, 0x7C, 0x6A, 0xCC, 0xEA, 0xC9, 0x65, 0x8A, 
-0xF5, 0x0C, 0xCA, 0x40, 0xC8, 0x1C, 0x51, 0x07, 0xDA, 0xE8, 0xD0, 0x5A, 0x25, 0xCA, 0x95, 0x11, 
-0xC0, 0xE3, 0x3B, 0x2B, 0x1D, 0xD5, 0x89, 0x9B, 0x2C, 0x6E, 0xB2, 0xB6, 0xAB, 0xE6, 0x50, 0xA4, 
-0xAD, 0xAD, 0x04, 0xA2, 0x4E, 0x38, 0x75, 0x50, 0x21, 0xA5, 0x29, 0x13, 0xB1, 0xB9, 0xA6, 0xEC, 
-0x67, 0x8C, 0x97, 0x46, 0x14, 0x45, 0x81, 0xF7, 0x4D, 0xB7, 0x5B, 0xD1, 0xE8, 0x3C, 0x9D, 0x83, 
-0x20, 0x2D, 0x46, 0x6B, 0xFA, 0x36, 0x43, 0x35, 0x2D, 0x52, 0x57, 0x94, 0x22, 0xAC, 0xF6, 0x0B, 
-0x36, 0xC7, 0x03, 0xFA, 0x99, 0xC6, 0xB6, 0x81, 0x79, 0x3B, 0x25, 0x48, 0x40, 0xA2, 0xA4, 0xCC, 
-0x29, 0x0A, 0xAD, 0x32, 0x32, 0x6C, 0xE2, 0xFF, 0x46, 0x45, 0x66, 0x0B, 0x94, 0xD1, 0xF4, 0x07, 
-0x43, 0x96, 0xD6, 0xD6, 0xE8, 0x0D, 0x06, 0x68, 0x6B, 0xF1, 0xC1, 0x27, 0x7A, 0x5D, 0x8C, 0x5D, 
-0x12, 0xEC, 0x2A, 0xCE, 0xAE, 0x89, 0xAB, 0x8D, 0x26, 0xC4, 0x94, 0x5C, 0x17, 0xDB, 0xFE, 0x7D, 
-0x78, 0xA9, 0x83, 0x11, 0x54, 0x97, 0x48, 0x2D, 0x9A, 0xE8, 0x3D, 0xB7, 0x5E, 0xBF, 0xCA, 0x95, 
-0x57, 0x2F, 0xD1, 0xCC, 0x2B, 0xEC, 0xBE, 0xE8, 0x58, 0xF7, 0xB3, 0x92, 0xD8, 0x31, 0x07, 0x63, 
-0x81, 0xEB, 0xEE, 0x97, 0xD1, 0x07, 0x42, 0x48, 0x18, 0x32, 0x0A, 0xB4, 0x4A, 0xF6, 0xE2, 0x3A, 
-0xEA, 0xD4, 0x3F, 0x75, 0x11, 0xDF, 0x0A, 0xAD, 0x0B, 0x84, 0xA8, 0x91, 0x60, 0x88, 0x31, 0x39, 
-0xAE, 0xC4, 0x00, 0x5A, 0x2C, 0x5A, 0xD9, 0x04, 0x81, 0xC4, 0x88, 0x51, 0x91, 0x52, 0x05, 0xCA, 
-0x58, 0x31, 0x64, 0xCA, 0x26, 0x0D, 0xC7, 0x71, 0x3C, 0xB2, 0x34, 0xE0, 0x5D, 0x87, 0x57, 0x78, 
-0xDF, 0xA9, 0x2D, 0xDE, 0xB1, 0x39, 0xE6, 0x68, 0x21, 0x8C, 0xC3, 0x94, 0x7E, 0xA8, 0x19, 0xC4, 
-0x96, 0x9E, 0x0B, 0xC9, 0x6F, 0x6C, 0x21, 0x2E, 0x04, 0x48, 0x27, 0xD9, 0x18, 0x51, 0xD8, 0xDE, 
-0x90, 0x18, 0x15, 0x01, 0x83, 0x6D, 0x03, 0x79, 0xA8, 0x58, 0xD6, 0x0D, 0x27, 0xFA, 0xC2, 0xB9, 
-0xA5, 0x9C, 0x47, 0x0F, 0x2D, 0xF3, 0x8E, 0xD5, 0x21, 0xEF, 0x3A, 0xBE, 0xC6, 0x93, 0xC7, 0x57, 
-0x79, 0xE2, 0xD4, 0x2A, 0xF7, 0xAC, 0x66, 0x9C, 0x1E, 0x1A, 0xD6, 0x0B, 0xCD, 0x78, 0x50, 0xB2, 
-0x5B, 0x35, 0x7C, 0xED, 0xA5, 0x57, 0xB8, 0x3A, 0xAD, 0x69, 0xB1, 0x04, 0xB2, 0x34, 0xA4, 0x24, 
-0xAD, 0x1B, 0x2F, 0xE5, 0x9F, 0xFA, 0x8F, 0xFE, 0xC2, 0xFF, 0xF0, 0xCB, 0x8B, 0x81, 0x85, 0xEF, 
-0x57, 0x7C, 0xE7, 0xD1, 0xFE, 0x3E, 0xC6, 0xE1, 0xD5, 0xF7, 0xFF, 0xE5, 0x6B, 0x77, 0xE6, 0xFF, 
-0x67, 0x21, 0x1F, 0xD9, 0xAC, 0x87, 0xC4, 0x06, 0xC2, 0x36, 0x0F, 0x3D, 0xB8, 0xC9, 0xDF, 0xFD, 
-0x7B, 0xFF, 0x47, 0xDE, 0xF5, 0xAE, 0x7B, 0x70, 0x6E, 0x87, 0xBE, 0x6A, 0xF1, 0xD7, 0x2F, 0x73, 
-0xE3, 0xB9, 0x6F, 0x30, 0xBB, 0xF0, 0x2D, 0x72, 0xD5, 0x62, 0x87, 0x3D, 0xF6, 0xEA, 0xC0, 0xAD, 
-0xDD, 0x86, 0x1B, 0xD7, 0x67, 0xDC, 0xBE, 0x59, 0xD3, 0x4E, 0x1C, 0x4B, 0xD1, 0xB2, 0xA9, 0x33, 
-0x0E, 0x2B, 0xC5, 0x60, 0x5E, 0x91, 0xCD, 0x27, 0x14, 0x21, 0xD2, 0xCB, 0x0B, 0x7C, 0xD4, 0xCC, 
-0x7D, 0xDA, 0x62, 0x95, 0x3A, 0xBD, 0xB9, 0x16, 0x70, 0x68, 0xC8, 0x73, 0x28, 0xFB, 0x78, 0x9B, 
-0x51, 0x29, 0x83, 0xB3, 0x7D, 0x6E, 0xB6, 0x91, 0x57, 0x77, 0x2A, 0x9E, 0xBB, 0x76, 0x87, 0x6F, 
-0x5F, 0xBB, 0xC5, 0x6B, 0x7B, 0x33, 0x76, 0x30, 0x34, 0x14, 0x44, 0x5D, 0x92, 0xC0, 0x07, 0x45, 
-0x0B, 0xF8, 0xC5, 0x36, 0x4C, 0xE7, 0xA8, 0x2C, 0x4F, 0xFA, 0xB5, 0x45, 0x8F, 0xB6, 0x6D, 0x19, 
-0xAF, 0xAE, 0x70, 0xF4, 0xC4, 0x71, 0x1E, 0x7E, 0xE2, 0x31, 0x86, 0xCB, 0x4B, 0x50, 0x68, 0x2A, 
-0xE7, 0xA9, 0x5C, 0x85, 0xC9, 0xB2, 0xD4, 0x44, 0x68, 0x6A, 0x0C, 0xC9, 0xE4, 0xF0, 0xE5, 0xF3, 
-0xCF, 0xF3, 0xCA, 0xF3, 0xCF, 0x53, 0xED, 0x4D, 0x31, 0x48, 0x72, 0x74, 0xE8, 0x14, 0x90, 0xAC, 
-0x49, 0x42, 0x3B, 0x77, 0x79, 0x36, 0x29, 0xDE, 0x4E, 0xB2, 0xE5, 0x60, 0xC2, 0x55, 0x69, 0x5A, 
-0x4C, 0x77, 0x06, 0x8C, 0x0B, 0xCB, 0x19, 0x51, 0x09, 0xA7, 0x55, 0x2A, 0x91, 0xF2, 0x5D, 0x1B, 
-0xD2, 0x18, 0x6B, 0x93, 0x84, 0xA9, 0x35, 0x1D, 0xF7, 0xD3, 0x64, 0x5D, 0x1D, 0x1C, 0x29, 0x94, 
-0x43, 0xFB, 0x3D, 0x4A, 0x76, 0x38, 0x95, 0x19, 0x1E, 0x39, 0xBC, 0xC4, 0x93, 0xC7, 0xD7, 0x38, 
-0x5E, 0x2A, 0x0E, 0x65, 0x91, 0xD2, 0xCF, 0x31, 0x4D, 0x4D, 0xA1, 0x84, 0x32, 0xB3, 0x58, 0x05, 
-0x78, 0x97, 0x70, 0xF1, 0x4E, 0x64, 0x4B, 0x8C, 0xA2, 0x92, 0x86, 0xB9, 0xAA, 0x08, 0xBD, 0xC0, 
-0xE0, 0xE8, 0x80, 0x72, 0xAB, 0x60, 0xBC, 0x35, 0x44, 0x0F, 0x15, 0x91, 0x9A, 0x20, 0x0E, 0x8D, 
-0x42, 0x5B, 0x43, 0xBB, 0xCF, 0x37, 0x4B, 0x13, 0x81, 0x4A, 0x7C, 0x9A, 0x38, 0xEA, 0x9A, 0x40, 
-0xAE, 0x76, 0x5D, 0xF5, 0x96, 0xC8, 0x6C, 0x1A, 0xD5, 0x0D, 0xB0, 0x24, 0xB8, 0xA4, 0xD9, 0x9F, 
-0xD1, 0x4A, 0x13, 0x71, 0x5A, 0x14, 0x46, 0x32, 0xAC, 0x2F, 0xC0, 0xE5, 0xB0, 0x13, 0xA9, 0x6E, 
-0x36, 0xEC, 0x5C, 0x9B, 0xD1, 0xEC, 0xB5, 0x98, 0x68, 0xC9, 0x4C, 0x86, 0x55, 0x16, 0x15, 0x2D, 
-0xBE, 0x56, 0x58, 0x9D, 0xA3, 0xB4, 0xA5, 0x8A, 0x91, 0x2A, 0x0A, 0x55, 0x56, 0xB2, 0xA3, 0x73, 
-0xAE, 0x3A, 0xC5, 0x17, 0x2F, 0x5C, 0xE6, 0xF9, 0xDB, 0x53, 0x5E, 0x98, 0xCD, 0xD9, 0x25, 0xC7, 
-0x33, 0x46, 0x67, 0x63, 0x3C, 0x9A, 0xDA, 0x05, 0x02, 0x9A, 0x3C, 0x2B, 0xA8, 0x5C, 0x05, 0xFD, 
-0x82, 0x43, 0xA7, 0x8E, 0x71, 0xEC, 0xCC, 0x09, 0x8E, 0x9E, 0x39, 0xC5, 0xF2, 0xFA, 0x72, 0x07, 
-0xE7, 0x04, 0x5C, 0x70, 0xF8, 0xD0, 0xE2, 0x62, 0x2A, 0xA4, 0x94, 0x92, 0x24, 0xAA, 0x13, 0x15, 
-0xAA, 0x6B, 0x44, 0xD1, 0x25, 0xDC, 0x74, 0x33, 0x4E, 0xEB, 0x62, 0x41, 0xE1, 0x2B, 0xB5, 0x65, 
-0xE7, 0xE6, 0x6D, 0x9E, 0xFD, 0xEA, 0xD7, 0xB9, 0x75, 0xE5, 0x1A, 0xBE, 0x6A, 0x28, 0xBA, 0x9D, 
-0xC0, 0x5D, 0x2C, 0xF8, 0xEE, 0xFA, 0x59, 0xB8, 0x8C, 0x2C, 0x12, 0xEE, 0xBE, 0x05, 0x52, 0xF7, 
-0x1C, 0x91, 0x44, 0x47, 0x8B, 0x5D, 0xB7, 0xCE, 0x88, 0xEE, 0x78, 0xB3, 0x10, 0xDA, 0xA4, 0x23, 
-0xEC, 0x44, 0x70, 0x3E, 0x82, 0xD5, 0xD0, 0xD1, 0x07, 0x59, 0xC8, 0xA7, 0xC6, 0x04, 0xED, 0x94, 
-0x99, 0x45, 0xF9, 0x8A, 0x5C, 0x6A, 0x86, 0xD4, 0xAC, 0xD2, 0x72, 0x38, 0x57, 0x3C, 0xB8, 0xB5, 
-0xC2, 0xFD, 0xEB, 0x63, 0xCE, 0xAE, 0xAF, 0xB0, 0x62, 0x22, 0x23, 0x1D, 0xC9, 0x7C, 0x83, 0xB4, 
-0x73, 0x54, 0x68, 0x31, 0x1A, 0x4A, 0xA5, 0xD1, 0x3E, 0xD1, 0x35, 0x82, 0xB2, 0xA9, 0x79, 0x48, 
-0x44, 0x2B, 0x8F, 0x56, 0x01, 0xD1, 0x86, 0x90, 0x8F, 0x98, 0x17, 0x63, 0x6E, 0xF8, 0x92, 0x57, 
-0x77, 0x66, 0x5C, 0xDB, 0xDB, 0xC3, 0xAB, 0xC0, 0xCA, 0xB8, 0x60, 0x75, 0x90, 0xB3, 0x3E, 0xC8, 
-0x31, 0xD5, 0x0C, 0xEB, 0xE6, 0x18, 0x1A, 0xF2, 0xBE, 0x90, 0x6B, 0x61, 0xA5, 0xE8, 0x33, 0x0F, 
-0x19, 0xBB, 0x76, 0x95, 0x2F, 0x5C, 0x9D, 0xF2, 0x0F, 0x3E, 0xF7, 0x6D, 0x5E, 0xF5, 0x3D, 0x5A, 
-0x56, 0x98, 0x91, 0x11, 0x4D, 0x41, 0x90, 0xBD, 0xDB, 0x2B, 0x4B, 0xF2, 0xBF, 0xDD, 0xDE, 0xFE, 
-0xFA, 0x3F, 0xFA, 0xDD, 0xB2, 0x10, 0x7E, 0xA7, 0xF8, 0x81, 0x55, 0xB8, 0x00, 0xCB, 0xCB, 0x27, 
-0xCE, 0xCC, 0x1A, 0xF7, 0xA3, 0xA2, 0xF3, 0x7E, 0x24, 0x4B, 0xCD, 0x2A, 0x3C, 0x8A, 0x86, 0x1F, 
-0xFA, 0xF0, 0xBB, 0x78, 0xE0, 0xFE, 0x13, 0x68, 0x69, 0xD0, 0xD4, 0xE8, 0x66, 0x97, 0x72, 0x7A, 
-0x1D, 0x77, 0xFB, 0x15, 0x96, 0xCD, 0x94, 0x1E, 0x53, 0xC6, 0x59, 0xCD, 0xD6, 0xD0, 0x72, 0x7C, 
-0xBD, 0xC7, 0x3D, 0x47, 0x96, 0xB9, 0xF7, 0xC8, 0x12, 0x27, 0xD7, 0x32, 0x0E, 0x8F, 0x14, 0x85, 
-0x4C, 0x11, 0xB7, 0x83, 0xB4, 0x33, 0xA2, 0x78, 0x9C, 0x77, 0x38, 0xEF, 0x89, 0x2A, 0xD9, 0x4F, 
-0x4B, 0xDB, 0xA6, 0x17, 0x61, 0x54, 0xDA, 0x6F, 0xAA, 0x80, 0x52, 0x0E, 0x62, 0x83, 0x09, 0x15, 
-0xD6, 0x55, 0x0C, 0x54, 0x60, 0xB9, 0xC8, 0xD9, 0xEC, 0x97, 0x6C, 0x8D, 0x86, 0xAC, 0xF7, 0x4A, 
-0x06, 0x21, 0x62, 0xDA, 0x86, 0x56, 0x66, 0x88, 0xB4, 0x68, 0x49, 0x7E, 0x47, 0xD6, 0xEA, 0x34, 
-0x3A, 0x49, 0x6A, 0xBA, 0x89, 0x4F, 0x17, 0x86, 0xF7, 0x91, 0xD6, 0x05, 0xEA, 0xC6, 0xD1, 0x34, 
-0x2D, 0xB3, 0xE9, 0x1C, 0xE7, 0x3D, 0x45, 0x51, 0x92, 0x17, 0x05, 0xB9, 0xC9, 0xC0, 0x47, 0x54, 
-0x48, 0x36, 0x77, 0xF5, 0xDE, 0x94, 0xEB, 0x97, 0x5E, 0xE7, 0xF6, 0xB5, 0xEB, 0x10, 0x22, 0x99, 
-0x4E, 0x5B, 0xCA, 0xFD, 0xAD, 0x9E, 0x4E, 0xAA, 0x51, 0x6F, 0xCE, 0xAF, 0xBF, 0xBB, 0x84, 0x9B, 
-0x46, 0xB0, 0xF7, 0xEB, 0x17, 0xE9, 0x54, 0x5E, 0xD0, 0x10, 0x0D, 0x0A, 0x83, 0x77, 0x11, 0xD7, 
-0x3A, 0x7C, 0xDD, 0x10, 0x5B, 0x8F, 0x0A, 0x49, 0x3F, 0x36, 0x43, 0x92, 0xD4, 0x5D, 0x9C, 0xD1, 
-0x13, 0x4F, 0x29, 0x13, 0x7A, 0xF1, 0x0E, 0x87, 0xA8, 0x78, 0x64, 0xDC, 0xE3, 0xBD, 0x27, 0x56, 
-0x79, 0xD7, 0x91, 0x21, 0xF7, 0xAF, 0xE5, 0xAC, 0x84, 0x09, 0xBD, 0x66, 0x97, 0x41, 0x6C, 0xE8, 
-0xEB, 0x88, 0x0E, 0x1E, 0xE5, 0x13, 0xB7, 0x36, 0x78, 0x47, 0x96, 0x5B, 0x6C, 0x6E, 0xF1, 0xC6, 
-0x53, 0xC5, 0x19, 0x95, 0x9D, 0x93, 0x6F, 0x66, 0xAC, 0x9C, 0x5E, 0x61, 0xF9, 0xEC, 0x0A, 0xFD, 
-0xCD, 0x1C, 0x35, 0x54, 0x78, 0x55, 0xE1, 0xA2, 0x43, 0x4B, 0x24, 0x5D, 0xBE, 0x02, 0xD6, 0xD2, 
-0x46, 0x4F, 0xF4, 0xC9, 0xF7, 0xCE, 0xE8, 0xB4, 0xED, 0x57, 0x1D, 0xA7, 0xD3, 0x64, 0x05, 0xBA, 
-0x1B, 0xAD, 0xA5, 0xEB, 0x7C, 0x2F, 0xB0, 0xCF, 0x28, 0x09, 0x93, 0xD1, 0x42, 0x4A, 0x00, 0x12, 
-0x10, 0x71, 0x88, 0x0A, 0x88, 0xF2, 0x68, 0x13, 0x51, 0x85, 0x25, 0x1B, 0xF7, 0xE8, 0x8F, 0x7A, 
-0x60, 0xC1, 0x07, 0x97, 0x08, 0xF8, 0xDE, 0xE1, 0x5B, 0x47, 0xA6, 0x13, 0xAE, 0x1E, 0x83, 0x23, 
-0xB8, 0x8A, 0xE8, 0x6A, 0x72, 0x84, 0x41, 0xAE, 0x19, 0x17, 0x19, 0x87, 0x56, 0x97, 0x59, 0x2A, 
-0x72, 0x7A, 0x58, 0xB2, 0x56, 0x08, 0xD1, 0x75, 0xDA, 0xC6, 0x0A, 0x9B, 0x0C, 0x6E, 0x12, 0x5B, 
-0xC1, 0x68, 0x82, 0x78, 0xA6, 0xD3, 0x09, 0x77, 0xEE, 0xDC, 0xC1, 0x35, 0x2D, 0x46, 0x1B, 0xFA, 
-0x79, 0x8E, 0x6F, 0x17, 0xAA, 0x67, 0x82, 0x35, 0x06, 0x6B, 0x93, 0xA0, 0x4E, 0x08, 0xA1, 0x43, 
-0x4D, 0xF7, 0xBB, 0x5D, 0xFB, 0xE7, 0x5F, 0x2D, 0x1A, 0x57, 0x31, 0x19, 0x43, 0x1A, 0x81, 0xD7, 
-0x2E, 0x5C, 0xE4, 0xE2, 0x4B, 0x2F, 0x13, 0xDA, 0x34, 0xC1, 0x68, 0x4C, 0xD7, 0x0C, 0xDD, 0x07, 
-0x95, 0x0E, 0xAE, 0x9F, 0xBB, 0xEB, 0x68, 0x51, 0xF9, 0xAA, 0x0E, 0xE3, 0x5D, 0x24, 0x5C, 0x16, 
-0x3D, 0xD6, 0x18, 0x93, 0x5A, 0x97, 0x0B, 0xC4, 0x26, 0x25, 0xDB, 0x10, 0x93, 0xB5, 0x8D, 0xE8, 
-0xA4, 0x19, 0x8C, 0x6F, 0x21, 0xB4, 0x20, 0x81, 0xC2, 0x08, 0x85, 0x82, 0x81, 0x8A, 0xF4, 0xC3, 
-0x8C, 0x21, 0x53, 0xD6, 0xA8, 0xB9, 0xB7, 0xCC, 0x79, 0xD7, 0xD6, 0x12, 0xEF, 0x3F, 0xB9, 0xC9, 
-0xBB, 0x0E, 0x2D, 0x71, 0xDF, 0x52, 0xC1, 0x96, 0x71, 0x0C, 0xFD, 0x8C, 0xAC, 0x99, 0xA2, 0xFD, 
-0x9C, 0x42, 0x0B, 0x85, 0x35, 0x68, 0x22, 0xB1, 0x93, 0x73, 0xEB, 0x4E, 0x63, 0xA2, 0x2C, 0x92, 
-0xB8, 0xCA, 0x86, 0x80, 0x8E, 0x69, 0x87, 0x93, 0xA9, 0x48, 0x3F, 0x37, 0xAC, 0x8D, 0x72, 0x4E, 
-0x1F, 0x5A, 0xE2, 0x9E, 0x43, 0x63, 0x8E, 0x8F, 0x33, 0x56, 0x6D, 0x83, 0xAA, 0xAE, 0x33, 0x30, 
-0x73, 0x86, 0x7A, 0xCE, 0xEA, 0x48, 0x58, 0x59, 0xB5, 0x6C, 0xAE, 0x0F, 0x18, 0xAE, 0x8C, 0x51, 
-0x22, 0x5C, 0x9B, 0x35, 0x3C, 0x77, 0x73, 0x97, 0x2F, 0x5D, 0xBE, 0xC1, 0x44, 0x0D, 0x11, 0x3D, 
-0xA0, 0x15, 0x85, 0x32, 0x05, 0xDA, 0xAA, 0xD7, 0x0E, 0x6D, 0x0E, 0xFE, 0xE9, 0x5F, 0xF9, 0x2B, 
-0x7F, 0xF6, 0x95, 0xFD, 0x83, 0xF5, 0x7D, 0x8A, 0x1F, 0x68, 0xC2, 0x3D, 0x7B, 0xCF, 0x3B, 0xB6, 
-0x6E, 0xDC, 0x99, 0x7C, 0x34, 0x06, 0xBD, 0x46, 0xE8, 0x2A, 0x11, 0xE5, 0x71, 0x6E, 0xC2, 0x63, 
-0x4F, 0x9C, 0xE3, 0x1D, 0x8F, 0xDF, 0x8B, 0xB6, 0x82, 0x55, 0x1E, 0x7C, 0x85, 0x6E, 0xEE, 0xB0, 
-0x77, 0xF5, 0x05, 0xB4, 0xDB, 0xA3, 0x08, 0x8E, 0xDC, 0xD5, 0x68, 0x37, 0xA7, 0x08, 0x35, 0x7D, 
-0x53, 0x33, 0xCE, 0x6B, 0x86, 0x45, 0xC3, 0x20, 0xAF, 0x28, 0x8B, 0x8A, 0xB2, 0x2F, 0x94, 0x03, 
-0x85, 0xD8, 0xC0, 0xB4, 0xAE, 0x68, 0xBC, 0x03, 0x6D, 0x13, 0xDE, 0x63, 0x15, 0x3A, 0x33, 0x90, 
-0x69, 0xC8, 0x20, 0x1A, 0x01, 0x1D, 0x51, 0x2A, 0x41, 0x07, 0x36, 0x3A, 0xF2, 0x18, 0xE8, 0x49, 
-0x60, 0xB5, 0xC8, 0x38, 0xB5, 0xB6, 0xC6, 0xD9, 0x8D, 0x35, 0x4E, 0x8E, 0x46, 0x6C, 0x0D, 0x4B, 
-0x98, 0xD7, 0x64, 0xB1, 0x05, 0x99, 0xA0, 0xA9, 0xC9, 0x23, 0xA9, 0x11, 0xB1, 0xD8, 0xE6, 0xA9, 
-0x54, 0x05, 0x86, 0x90, 0xB6, 0x95, 0x4D, 0xE3, 0xB8, 0xB3, 0x7B, 0x87, 0xAB, 0x57, 0xAF, 0x72, 
-0xF5, 0xCA, 0x15, 0x26, 0x7B, 0x7B, 0x10, 0x02, 0xF8, 0x40, 0x69, 0x2C, 0xE3, 0xE1, 0x00, 0x82, 
-0xE7, 0xEA, 0xAB, 0x97, 0x78, 0xF5, 0x95, 0x57, 0x08, 0x6D, 0x8B, 0x55, 0x74, 0x62, 0xD0, 0x29, 
-0xF4, 0xC2, 0xD9, 0xE2, 0x4D, 0x09, 0xF7, 0xED, 0x26, 0x5B, 0x0E, 0x3E, 0xB7, 0x53, 0x1A, 0x4B, 
-0x72, 0x88, 0x06, 0x2D, 0x36, 0x4D, 0x86, 0x79, 0x21, 0xB8, 0x48, 0x5B, 0x37, 0xF8, 0xA6, 0x25, 
-0x7A, 0xDF, 0x4D, 0xF3, 0x40, 0xA6, 0x04, 0x2B, 0x81, 0x9C, 0x9A, 0x21, 0x15, 0x23, 0x76, 0x59, 
-0x63, 0xC6, 0x83, 0x65, 0xC1, 0xC7, 0xCE, 0x1D, 0xE5, 0x87, 0xEF, 0x3D, 0xC2, 0x63, 0x1B, 0x43, 
-0x8E, 0xE7, 0x81, 0x62, 0xBE, 0x4D, 0xE1, 0xE7, 0xE4, 0xE2, 0x29, 0xAC, 0x4E, 0xA3, 0xA2, 0x3E, 
-0x76, 0xDC, 0xDC, 0x88, 0xED, 0xE5, 0x54, 0xB1, 0x62, 0xAF, 0xDD, 0x61, 0x6E, 0xE7, 0xD8, 0x0D, 
-0xC3, 0xF8, 0xD4, 0x88, 0x95, 0x73, 0x2B, 0xF4, 0xCE, 0x2C, 0x21, 0x65, 0x4B, 0x2C, 0x1C, 0x8E, 
-0x36, 0x09, 0xD3, 0x20, 0x64, 0xCA, 0x80, 0x80, 0xF8, 0x34, 0x14, 0x10, 0x55, 0x87, 0xDD, 0x2D, 
-0xEC, 0xE8, 0x25, 0xB9, 0x34, 0x04, 0xAF, 0xD1, 0xD1, 0x22, 0x21, 0x91, 0xD5, 0x17, 0xDC, 0x6A, 
-0xD1, 0x1D, 0x9D, 0x4A, 0x02, 0x26, 0xE8, 0x74, 0x93, 0x4B, 0x3D, 0x2D, 0xCC, 0xC2, 0xD5, 0x42, 
-0x47, 0x82, 0x16, 0x54, 0xA9, 0x89, 0x59, 0xC0, 0x0C, 0x0B, 0x7A, 0xAB, 0x43, 0x7A, 0xBD, 0x82, 
-0xD6, 0x55, 0x54, 0xB3, 0x19, 0xDE, 0x79, 0x0A, 0x6B, 0x71, 0xAE, 0x21, 0x88, 0xC7, 0x66, 0x16, 
-0x9B, 0x59, 0x34, 0xA0, 0xDA, 0x16, 0xA9, 0xE6, 0x2C, 0x5B, 0xCB, 0xA1, 0xE1, 0x80, 0xD3, 0xEB, 
-0x1B, 0xAC, 0xF7, 0x7B, 0x50, 0x37, 0xF8, 0x66, 0x86, 0xC2, 0x93, 0xA1, 0x11, 0x02, 0x3E, 0xB8, 
-0x54, 0x99, 0x69, 0x08, 0xBE, 0xC5, 0xED, 0xEE, 0x71, 0xFB, 0xD6, 0x6D, 0xAE, 0x5F, 0xBB, 0x4E, 
-0x68, 0x3D, 0x46, 0x84, 0xE5, 0xE1, 0x12, 0xBD, 0xB2, 0x24, 0xC6, 0x48, 0xD3, 0xB6, 0x40, 0xA2, 
-0x27, 0xC6, 0xD8, 0x0D, 0xA6, 0x74, 0xD0, 0xC1, 0xC1, 0x84, 0xA9, 0x3A, 0xCC, 0x39, 0xB7, 0x19, 
-0xD5, 0x64, 0xCA, 0xF9, 0x67, 0x9F, 0x63, 0x72, 0xFB, 0x0E, 0x99, 0xD2, 0xDD, 0x28, 0x77, 0xE7, 
-0x54, 0x72, 0x20, 0xE1, 0xA6, 0x9A, 0xF8, 0xEE, 0x3A, 0x4A, 0xD2, 0xF0, 0xBA, 0x5B, 0x1F, 0x69, 
-0x64, 0x22, 0x89, 0x54, 0x09, 0x31, 0xA4, 0x21, 0x85, 0xE0, 0x22, 0xB1, 0x15, 0xA4, 0x95, 0x04, 
-0x3D, 0x89, 0x42, 0x3A, 0x78, 0x0A, 0x2B, 0x28, 0x1B, 0xB1, 0x26, 0x90, 0x69, 0x4F, 0x2F, 0xCE, 
-0x29, 0xE2, 0x8C, 0x52, 0x26, 0x0C, 0x64, 0x8F, 0x33, 0x16, 0x9E, 0x5C, 0x5F, 0xE2, 0xA3, 0xE7, 
-0x4E, 0xF3, 0xB1, 0x7B, 0x8E, 0xF3, 0xDE, 0xA3, 0x6B, 0x3C, 0xBC, 0xDC, 0xE3, 0xB0, 0xF1, 0x0C, 
-0xFD, 0x1C, 0x55, 0xED, 0x90, 0xE3, 0xC8, 0x0D, 0xA9, 0x98, 0x51, 0x69, 0xCD, 0xAA, 0x6E, 0x52, 
-0x4D, 0x08, 0x9D, 0x9E, 0x04, 0x2C, 0xF8, 0xFA, 0xB6, 0x1B, 0x7F, 0x4E, 0x19, 0x38, 0xE0, 0x69, 
-0x09, 0x54, 0x68, 0x35, 0xC7, 0xCA, 0x1C, 0x1B, 0x27, 0xE4, 0x32, 0xC5, 0xD8, 0x29, 0xE5, 0x06, 
-0xAC, 0x1C, 0x2B, 0x59, 0xDD, 0x1C, 0xB0, 0x7C, 0x64, 0x44, 0xB1, 0x51, 0x60, 0xC6, 0x05, 0xE2, 
-0x1D, 0xAF, 0x5C, 0xBB, 0xCD, 0xAE, 0x1E, 0xF0, 0xED, 0x9B, 0x33, 0x7E, 0xEB, 0xFA, 0x1E, 0x13, 
-0xFA, 0x44, 0xE9, 0x13, 0x31, 0x18, 0xAC, 0x14, 0x45, 0xFC, 0xCA, 0x53, 0xEF, 0x79, 0xE4, 0x67, 
-0xCF, 0x9F, 0xFF, 0xCA, 0x64, 0xFF, 0x80, 0x7D, 0x9F, 0xE2, 0x07, 0x9A, 0x70, 0xFF, 0xD0, 0x1F, 
-0xFA, 0xC3, 0x3C, 0x7F, 0xFE, 0xD5, 0xF7, 0xB5, 0xAD, 0x9C, 0x43, 0x2C, 0x4A, 0x6B, 0x34, 0x2D, 
-0xDE, 0xEF, 0xF1, 0xE0, 0x23, 0x27, 0x78, 0xFA, 0x7D, 0x8F, 0x93, 0xF7, 0x35, 0xD1, 0x57, 0x18, 
-0xF1, 0xA8, 0x58, 0xD1, 0xDC, 0x7E, 0x9D, 0x3C, 0x56, 0x0C, 0x74, 0x52, 0x05, 0xB2, 0xC1, 0xA1, 
-0x7C, 0x0D, 0xED, 0x14, 0x71, 0x53, 0x94, 0x9F, 0xA1, 0xA5, 0x22, 0x2F, 0x55, 0xFA, 0xE8, 0x17, 
-0x64, 0x83, 0x82, 0x72, 0x58, 0xD2, 0x1B, 0x96, 0x60, 0x85, 0x36, 0xD4, 0x24, 0xDE, 0x50, 0xE8, 
-0x54, 0x8C, 0x16, 0xD4, 0x95, 0xC4, 0x0B, 0x24, 0x44, 0xF2, 0x4E, 0xDA, 0xCD, 0x0A, 0x18, 0xE7, 
-0x50, 0xAE, 0xA1, 0xF0, 0x9E, 0x25, 0x2D, 0x6C, 0xF4, 0x4B, 0x8E, 0x6E, 0xAE, 0x70, 0x74, 0x79, 
-0xC4, 0xAA, 0xC9, 0x28, 0x9C, 0x27, 0xFA, 0x16, 0x1F, 0xAB, 0xC4, 0x32, 0x10, 0x8D, 0x25, 0x09, 
-0xBB, 0x58, 0x9D, 0x88, 0xE5, 0x48, 0xC0, 0x37, 0x2D, 0xBE, 0x9A, 0x53, 0x57, 0x35, 0x77, 0xB6, 
-0xB7, 0xF1, 0xAD, 0x63, 0xB6, 0x37, 0x81, 0x10, 0xC8, 0xB4, 0xA6, 0x9E, 0x4C, 0x78, 0xFD, 0xD5, 
-0x8B, 0xDC, 0xBA, 0x7A, 0x35, 0x09, 0x99, 0xEB, 0xC4, 0x86, 0x4C, 0x77, 0x70, 0xD5, 0xA9, 0x38, 
-0x75, 0x53, 0x44, 0xDD, 0x45, 0xF6, 0xBB, 0x49, 0xB6, 0x1C, 0xB8, 0x30, 0x13, 0xD2, 0x95, 0x8C, 
-0x32, 0x75, 0x87, 0xD5, 0xFA, 0x36, 0xD0, 0xD4, 0x8E, 0xB6, 0x72, 0x69, 0xAC, 0x32, 0x06, 0x4C, 
-0x97, 0x6C, 0xAD, 0x78, 0x54, 0x6C, 0x80, 0x86, 0x82, 0x39, 0x2B, 0x4C, 0x38, 0x6E, 0x03, 0x8F, 
-0x6E, 0x8C, 0xF9, 0xC0, 0xB9, 0x23, 0x3C, 0x79, 0x74, 0x89, 0x23, 0xA6, 0x61, 0x58, 0xED, 0x30, 
-0x70, 0x53, 0xCA, 0xD0, 0xD2, 0xD7, 0x89, 0x8E, 0xE4, 0x9A, 0x16, 0xEF, 0x13, 0x27, 0x59, 0x5B, 
-0x8D, 0x57, 0x9E, 0x46, 0xD5, 0x54, 0xA6, 0x46, 0x06, 0x09, 0x3E, 0xD8, 0xB8, 0x7F, 0x83, 0xF2, 
-0xCC, 0x08, 0xBD, 0xAC, 0x88, 0xD9, 0x9C, 0xA8, 0x1D, 0x51, 0x25, 0x01, 0x22, 0xD5, 0x59, 0xA3, 
-0xA4, 0x63, 0xD1, 0x61, 0x97, 0xA4, 0x9B, 0x91, 0xD1, 0x09, 0x0A, 0xF1, 0x01, 0x44, 0x67, 0x28, 
-0xDB, 0xC7, 0xE4, 0x23, 0x50, 0x05, 0xA2, 0xCB, 0x6E, 0xF8, 0x33, 0x71, 0x5A, 0xA5, 0x6B, 0xCE, 
-0x68, 0x12, 0x2F, 0x54, 0x75, 0x5D, 0x75, 0x16, 0x5C, 0xD4, 0x8E, 0x7F, 0x8C, 0x01, 0x31, 0x81, 
-0xA0, 0x7D, 0xA2, 0x01, 0xE5, 0x1A, 0xD3, 0x2F, 0x18, 0x0C, 0xCA, 0x74, 0x93, 0x36, 0x91, 0xAA, 
-0x9A, 0xD3, 0xF8, 0x1A, 0xA5, 0x13, 0x15, 0x2C, 0xF1, 0xF2, 0x23, 0x45, 0x84, 0x52, 0x81, 0x69, 
-0x1A, 0xFA, 0x08, 0x4B, 0x3D, 0xCB, 0xFA, 0xD2, 0x80, 0xCD, 0x95, 0x25, 0x96, 0x07, 0x3D, 0xB4, 
-0x73, 0xCC, 0x9A, 0xBD, 0x84, 0x97, 0x77, 0x5C, 0x5C, 0x91, 0x90, 0x94, 0xD3, 0xB2, 0x8C, 0x10, 
-0x22, 0x6D, 0xDD, 0xB2, 0x73, 0xF3, 0x36, 0xAE, 0x69, 0x13, 0x05, 0x52, 0xEB, 0xCE, 0x64, 0x32, 
-0x71, 0x7C, 0x7D, 0x4C, 0xF2, 0x91, 0x8B, 0x64, 0x2B, 0x5D, 0x95, 0xA7, 0x54, 0x37, 0x82, 0xDD, 
-0xF5, 0x03, 0xBC, 0x73, 0x5C, 0x7E, 0xED, 0x12, 0x17, 0x5F, 0x7A, 0x85, 0xD8, 0x0D, 0x40, 0x10, 
-0x92, 0xBD, 0x7C, 0x82, 0x63, 0x0E, 0x26, 0xDC, 0x37, 0xAE, 0x23, 0xAD, 0xBA, 0x4B, 0xBF, 0x83, 
-0x18, 0x62, 0x08, 0x69, 0x10, 0xC1, 0x79, 0x82, 0x0B, 0x49, 0x4C, 0xC6, 0x81, 0xF6, 0x1A, 0x25, 
-0x5D, 0x52, 0x56, 0x6A, 0x3F, 0xF9, 0x11, 0x2A, 0x0A, 0x69, 0xE9, 0x49, 0xC5, 0xC8, 0x27, 0x47, 
-0xE5, 0xC3, 0x78, 0xCE, 0xF5, 0x4B, 0x1E, 0x1A, 0x96, 0xBC, 0xFB, 0xF0, 0x98, 0xF7, 0x1C, 0x5B, 
-0xE7, 0x89, 0x23, 0x2B, 0x1C, 0x2B, 0x60, 0x54, 0xEF, 0x92, 0x57, 0x77, 0xC8, 0x9A, 0x09, 0x36, 
-0xD6, 0x0C, 0xAC, 0x21, 0xB3, 0xE9, 0xFD, 0x45, 0xE7, 0x88, 0x3E, 0xA6, 0x29, 0xB8, 0x08, 0x5A, 
-0xC9, 0xE2, 0xED, 0xDF, 0x1D, 0x4F, 0x27, 0x2D, 0x8A, 0xC4, 0x05, 0x8E, 0x34, 0xD2, 0x10, 0xB4, 
-0x43, 0x32, 0x87, 0x2E, 0x1A, 0x74, 0x5E, 0x91, 0x95, 0x2D, 0xA3, 0x15, 0xC3, 0xF8, 0x50, 0x49, 
-0x6F, 0x43, 0xD3, 0x5F, 0x31, 0xD8, 0xCC, 0x43, 0x1E, 0x68, 0xAD, 0x03, 0xA3, 0x99, 0x4F, 0x5B, 
-0x76, 0xA6, 0x9E, 0xDB, 0x4D, 0xC9, 0xD7, 0x5F, 0xBB, 0xC5, 0xB7, 0x77, 0x6A, 0xE6, 0x6A, 0x84, 
-0x56, 0x7D, 0x14, 0x96, 0x56, 0xEA, 0x60, 0x55, 0xF8, 0xCC, 0x8F, 0xFF, 0xC1, 0xF7, 0xFC, 0xDB, 
-0xCF, 0x7F, 0xFE, 0x57, 0xBA, 0x6D, 0xF2, 0xF7, 0x2F, 0x7E, 0xA0, 0x09, 0xF7, 0xCF, 0xFF, 0xF9, 
-0xFF, 0xA5, 0xFC, 0xDA, 0xAF, 0x7D, 0xE5, 0x89, 0xAA, 0xF6, 0xEF, 0x84, 0x5C, 0x59, 0x05, 0x26, 
-0xCE, 0xD1, 0x7A, 0xCA, 0xEA, 0x9A, 0xE5, 0x43, 0x1F, 0x79, 0x8A, 0xA5, 0x95, 0x11, 0x48, 0xC0, 
-0x5A, 0x03, 0xB1, 0xA5, 0xBA, 0xFA, 0x2A, 0xF3, 0x9D, 0x9B, 0x48, 0x3B, 0x03, 0x57, 0x77, 0x22, 
-0xC3, 0xC9, 0x1B, 0xCB, 0x74, 0x15, 0x8B, 0xD2, 0x0A, 0x1F, 0x62, 0x9A, 0xD6, 0x31, 0x82, 0xED, 
-0x67, 0xF4, 0x57, 0xFA, 0xF4, 0x57, 0x72, 0xB2, 0x32, 0xA0, 0x6D, 0x8B, 0xF8, 0x36, 0x71, 0x05, 
-0xD3, 0xC0, 0x7F, 0xD7, 0xF4, 0xB6, 0xC9, 0x02, 0x19, 0x0B, 0xD1, 0x10, 0x22, 0xF8, 0xD6, 0x13, 
-0xA3, 0x47, 0xC7, 0x88, 0x8D, 0x8E, 0x2C, 0xB6, 0xF4, 0xC4, 0xB3, 0x55, 0x96, 0x1C, 0x1B, 0xF6, 
-0x38, 0xB5, 0x3A, 0xE6, 0xC4, 0xCA, 0x0A, 0xAB, 0xBD, 0x01, 0x45, 0xD4, 0x18, 0xDF, 0xA9, 0x1F, 
-0x11, 0x13, 0x77, 0x4F, 0x3A, 0x5F, 0xFB, 0xE0, 0xF6, 0xDF, 0x47, 0x66, 0x2C, 0xAE, 0xAA, 0xD9, 
-0xDB, 0x9D, 0x70, 0xE3, 0xD5, 0x57, 0xB9, 0x72, 0xE5, 0x0A, 0xAF, 0x5D, 0xB8, 0xC0, 0xE5, 0x4B, 
-0xAF, 0x71, 0xFB, 0xC6, 0x0D, 0x7C, 0x5D, 0x77, 0xC2, 0x1E, 0x5D, 0xA7, 0xBD, 0xA3, 0x81, 0x75, 
-0xFF, 0x44, 0x14, 0x49, 0x99, 0xED, 0xF7, 0x10, 0xFB, 0x09, 0xBA, 0xBB, 0x90, 0xC4, 0xD3, 0xD1, 
-0xBC, 0x92, 0x4D, 0x78, 0x70, 0x11, 0x89, 0x21, 0x19, 0x56, 0x4A, 0x12, 0xF0, 0xD6, 0x78, 0x4C, 
-0x4C, 0x88, 0xF5, 0x30, 0xB3, 0x1C, 0x2A, 0x15, 0x8F, 0x8C, 0x35, 0x3F, 0xF2, 0xC8, 0x49, 0x3E, 
-0xF8, 0xF0, 0x29, 0x4E, 0x8F, 0x34, 0xCB, 0x61, 0xC2, 0x58, 0x6A, 0x06, 0xA1, 0x46, 0x57, 0x15, 
-0xD6, 0x0B, 0x56, 0x0C, 0x2A, 0xA6, 0x84, 0xA7, 0xB4, 0x42, 0x32, 0x8D, 0x93, 0x96, 0x69, 0x9C, 
-0x52, 0x65, 0x15, 0xE3, 0x13, 0x63, 0x0E, 0x3D, 0x78, 0x84, 0xC1, 0x99, 0x25, 0xD4, 0x9A, 0xE0, 
-0xF2, 0x39, 0x2D, 0x13, 0xA2, 0x72, 0x69, 0xE3, 0x11, 0x41, 0x87, 0x44, 0x2F, 0x12, 0x01, 0x47, 
-0xA0, 0xB5, 0x09, 0x1B, 0xCC, 0x82, 0xC6, 0x76, 0x3A, 0x02, 0xCE, 0x0B, 0x5E, 0xE5, 0x88, 0x19, 
-0xD0, 0x50, 0x30, 0x69, 0x0D, 0xB5, 0xCA, 0xF1, 0xBA, 0x40, 0xD9, 0x7E, 0xD2, 0x47, 0x8E, 0x11, 
-0x09, 0x0E, 0xD5, 0x41, 0x13, 0x46, 0xA7, 0xE9, 0x46, 0xD1, 0x0A, 0x31, 0xA9, 0x59, 0x98, 0xD4, 
-0xE4, 0x12, 0x2F, 0x95, 0x18, 0xC8, 0x14, 0x88, 0x78, 0x9C, 0xAB, 0x30, 0x56, 0x50, 0x4B, 0x03, 
-0xEC, 0x72, 0x0F, 0xDD, 0xCF, 0x30, 0x36, 0xA2, 0xC4, 0x31, 0x6F, 0x1A, 0x7C, 0xEB, 0xD1, 0xC1, 
-0x52, 0xEA, 0x82, 0x42, 0x59, 0xB4, 0x0F, 0x9D, 0x38, 0x7E, 0x05, 0xB1, 0xA6, 0x57, 0xC0, 0xDA, 
-0xEA, 0x90, 0xA3, 0xEB, 0x4B, 0x0C, 0x33, 0x8D, 0x78, 0xC7, 0x5E, 0x1B, 0xA8, 0x43, 0x9A, 0xA1, 
-0x5B, 0x88, 0x9B, 0x1B, 0x6D, 0x89, 0xC1, 0x13, 0x9D, 0xE0, 0xEB, 0x86, 0x3B, 0x37, 0x6F, 0x72, 
-0xF9, 0xF2, 0x15, 0xF6, 0x26, 0xBB, 0x14, 0x65, 0xC1, 0xD2, 0xCA, 0x12, 0xD6, 0x1A, 0xAA, 0xB6, 
-0xC6, 0x64, 0x59, 0x07, 0x97, 0xA4, 0x94, 0xB9, 0xB8, 0x31, 0x2F, 0xD6, 0x85, 0xD1, 0x9A, 0x3B, 
-0x37, 0x6F, 0x71, 0xFE, 0xD9, 0x67, 0x99, 0xDE, 0xD9, 0x45, 0x05, 0xC1, 0xA8, 0x34, 0x51, 0x96, 
-0x58, 0x0E, 0xC2, 0xA2, 0x36, 0x7C, 0x43, 0xB2, 0x95, 0x6E, 0xA7, 0x20, 0x2A, 0x4D, 0x7E, 0xF9, 
-0x80, 0xF7, 0x29, 0xC9, 0x2E, 0x0C, 0x26, 0xA3, 0x87, 0x10, 0x0D, 0x88, 0xE9, 0x14, 0xE4, 0xD2, 
-0x67, 0x8D, 0x60, 0x24, 0x90, 0x49, 0x4B, 0x4F, 0x1A, 0x86, 0xB1, 0x62, 0x25, 0xCE, 0x39, 0x42, 
-0xCB, 0x43, 0x3D, 0xCB, 0x7B, 0x8F, 0xAD, 0xF3, 0xB1, 0x7B, 0x8E, 0xF3, 0xC3, 0xF7, 0x1C, 0xE1, 
-0xDD, 0x5B, 0x63, 0x8E, 0x59, 0x47, 0x51, 0x6D, 0xA3, 0xE7, 0xB7, 0xC9, 0xA4, 0xA2, 0x9F, 0x43, 
-0x66, 0x14, 0x20, 0x34, 0xAD, 0x23, 0xBA, 0x88, 0xF2, 0xA9, 0x31, 0x56, 0xAA, 0x8C, 0x52, 0x67, 
-0x58, 0x04, 0x89, 0xBE, 0x1B, 0x3D, 0x0E, 0x09, 0xC7, 0x96, 0x4E, 0xAD, 0x4E, 0x1B, 0x9C, 0x01, 
-0x6F, 0x15, 0xB1, 0xA7, 0x70, 0x59, 0x4B, 0xE8, 0x37, 0xF4, 0xD6, 0x33, 0x56, 0x8F, 0x0D, 0x59, 
-0x3A, 0xD6, 0x27, 0x5B, 0xB3, 0xC4, 0xA1, 0x47, 0xF7, 0x3D, 0xCA, 0x7A, 0xB4, 0x38, 0x8C, 0x81, 
-0x56, 0x79, 0x5C, 0x1B, 0xD9, 0xBE, 0xBA, 0xC3, 0x6C, 0x6E, 0xB8, 0xBC, 0x13, 0xF9, 0xAD, 0x0B, 
-0xB7, 0x78, 0xB5, 0x56, 0xB8, 0x7C, 0x8C, 0x92, 0x22, 0x21, 0x24, 0x54, 0xCD, 0x68, 0xD8, 0xFB, 
-0xF9, 0x9F, 0xF8, 0x23, 0x7F, 0xFC, 0x4B, 0x9F, 0xFC, 0xE4, 0x3F, 0xF9, 0x4E, 0x5B, 0xEC, 0xDF, 
-0x67, 0xFC, 0x40, 0x13, 0xEE, 0x5F, 0xFC, 0x8B, 0x7F, 0x91, 0x7F, 0xFE, 0xCF, 0x7E, 0xE9, 0xBE, 
-0xBA, 0xF6, 0x3F, 0x04, 0xD6, 0x88, 0x44, 0x84, 0x86, 0x2C, 0x13, 0xFA, 0x23, 0xC3, 0x8F, 0xFC, 
-0xC8, 0x47, 0x58, 0x5E, 0x1D, 0x11, 0xDB, 0x9A, 0xDC, 0x28, 0x10, 0x4F, 0x73, 0xEB, 0x2A, 0xED, 
-0x6C, 0x8F, 0x5C, 0x07, 0x94, 0x77, 0x44, 0x97, 0x3A, 0x93, 0xC9, 0xDB, 0x2B, 0xD1, 0x6F, 0xA2, 
-0x68, 0x9A, 0x10, 0xC0, 0x1A, 0xC4, 0x40, 0xC4, 0x83, 0x6A, 0x51, 0x3A, 0x60, 0x4B, 0x18, 0xAC, 
-0x0C, 0x19, 0x2D, 0x8F, 0x29, 0xFB, 0x05, 0xA2, 0x03, 0x3E, 0xB6, 0xB8, 0xD8, 0x26, 0xCA, 0x8D, 
-0x22, 0xB9, 0xC7, 0x4A, 0x00, 0x0D, 0x26, 0x4B, 0x5D, 0x58, 0xF1, 0x01, 0x69, 0x5B, 0x74, 0x0C, 
-0x1D, 0x09, 0xBE, 0xC2, 0xBA, 0x86, 0xBE, 0x51, 0x6C, 0x8E, 0x07, 0x1C, 0x59, 0x5D, 0x66, 0x6B, 
-0x3C, 0x60, 0x64, 0x35, 0x03, 0x03, 0x85, 0x6B, 0x31, 0xB1, 0xC2, 0xE2, 0xD2, 0x22, 0x24, 0x26, 
-0xAF, 0x33, 0xAD, 0x69, 0x9B, 0x06, 0x6D, 0x0C, 0x31, 0x04, 0x08, 0x0E, 0x6D, 0x0C, 0xD3, 0x3B, 
-0xDB, 0x4C, 0x27, 0x53, 0x82, 0x0F, 0xA9, 0x99, 0x14, 0x63, 0x5A, 0xCC, 0x92, 0xA8, 0x5A, 0x4A, 
-0xA7, 0x84, 0x10, 0x85, 0x24, 0x74, 0xDE, 0x9D, 0x1A, 0x4D, 0xD2, 0x3E, 0xD0, 0x5D, 0x22, 0x3E, 
-0x18, 0xE9, 0x92, 0xEA, 0x2E, 0xA2, 0xEE, 0xC2, 0x4A, 0xFA, 0x6C, 0x0A, 0x23, 0x1A, 0xF1, 0xE0, 
-0x1B, 0x8F, 0xAB, 0x1D, 0xB1, 0x0D, 0x48, 0x48, 0xFA, 0xB6, 0xC6, 0x1C, 0xB8, 0x78, 0x68, 0x29, 
-0xBB, 0x71, 0xDC, 0x75, 0x1C, 0x67, 0x96, 0x4B, 0x1E, 0x5A, 0xCB, 0xF9, 0xB1, 0x87, 0x8E, 0xF1, 
-0xC0, 0x6A, 0xC1, 0xA6, 0xF5, 0x0C, 0xDC, 0x94, 0xBE, 0xAB, 0x28, 0xDB, 0x8A, 0xCC, 0x39, 0x72, 
-0x92, 0xAD, 0x7B, 0x0C, 0x9D, 0x0E, 0xAA, 0x89, 0xD4, 0xBA, 0x61, 0x1A, 0xA7, 0xB8, 0xAC, 0x45, 
-0x2D, 0x19, 0x36, 0xCE, 0x6D, 0xB1, 0x74, 0x62, 0x09, 0xB3, 0x9E, 0x41, 0xCF, 0x11, 0xF3, 0x06, 
-0xC9, 0x7C, 0x82, 0x75, 0x48, 0x83, 0x01, 0xD1, 0x27, 0x90, 0xCE, 0x68, 0x83, 0x36, 0x26, 0xCD, 
-0xE0, 0xAB, 0x24, 0x81, 0xA8, 0x7D, 0x40, 0x8B, 0xC6, 0x8B, 0xC2, 0xAB, 0x1E, 0x3E, 0x5B, 0xA5, 
-0x52, 0xEB, 0x5C, 0xDA, 0xCB, 0x39, 0x7F, 0x3D, 0xF0, 0xAD, 0x0B, 0x13, 0x6E, 0xCF, 0x73, 0x82, 
-0x2E, 0xD1, 0xA6, 0x8F, 0xD1, 0x2A, 0xA9, 0x8D, 0x75, 0x55, 0x3B, 0x21, 0x4D, 0xEA, 0x2D, 0x28, 
-0x6D, 0xA2, 0x92, 0xE0, 0x8B, 0x52, 0x1A, 0x8D, 0x85, 0x90, 0x8E, 0xA9, 0x36, 0x82, 0xB6, 0x0A, 
-0x27, 0x8E, 0xDA, 0xCD, 0x71, 0x4A, 0x28, 0x87, 0x05, 0xA3, 0x41, 0x81, 0xCE, 0x35, 0x9E, 0x88, 
-0xF3, 0x0E, 0x1F, 0x7C, 0x3A, 0xD6, 0x31, 0xE0, 0x7D, 0x8D, 0x35, 0x8A, 0x22, 0xB7, 0xE4, 0xB9, 
-0x26, 0x86, 0x96, 0xE8, 0x1A, 0x86, 0x99, 0xE2, 0xD0, 0xA8, 0xE4, 0xC8, 0xFA, 0x0A, 0x65, 0x91, 
-0x81, 0x6F, 0x50, 0xAE, 0x22, 0xC6, 0xBA, 0xAB, 0x76, 0x35, 0x21, 0xAA, 0xBB, 0x5A, 0x19, 0xA2, 
-0x09, 0x6D, 0xC3, 0x64, 0x6F, 0x97, 0xC9, 0xEE, 0x0E, 0x6D, 0x5D, 0x53, 0xE4, 0x19, 0xC3, 0xC1, 
-0x10, 0x45, 0x96, 0x2A, 0x73, 0xD1, 0x1D, 0x97, 0xBA, 0xA3, 0x77, 0x29, 0x95, 0x2A, 0x40, 0x14, 
-0x57, 0x2F, 0x5D, 0xE6, 0xFC, 0xB7, 0x9E, 0xC5, 0xA0, 0x10, 0x27, 0x58, 0x65, 0x20, 0xA4, 0xF5, 
-0xDD, 0x3D, 0xF9, 0x0D, 0x35, 0x2E, 0x74, 0x59, 0x5B, 0x14, 0x21, 0x24, 0x0D, 0x10, 0xEF, 0x52, 
-0x65, 0x1B, 0xBC, 0x24, 0x92, 0x6F, 0x24, 0xAD, 0x3A, 0x9D, 0xD6, 0x51, 0x22, 0x11, 0x06, 0x32, 
-0x1A, 0x4A, 0x5A, 0x7A, 0x54, 0x8C, 0x98, 0xB1, 0x81, 0xE3, 0x68, 0x1E, 0x79, 0x64, 0xA5, 0xCF, 
-0x7B, 0x4F, 0x6E, 0xF1, 0x81, 0xD3, 0x47, 0x78, 0xE2, 0xF0, 0x0A, 0xA7, 0xFB, 0x9A, 0x55, 0x3F, 
-0xA3, 0x98, 0xDC, 0xA2, 0xE7, 0xA6, 0xF4, 0x94, 0xA7, 0x67, 0x52, 0x6F, 0x20, 0xFA, 0x16, 0x91, 
-0x98, 0xDC, 0x58, 0xB4, 0xC1, 0xEA, 0x2C, 0x15, 0x08, 0x21, 0x26, 0x67, 0x5E, 0x52, 0x53, 0xD4, 
-0x5A, 0x93, 0x04, 0xE0, 0x11, 0x3C, 0x9E, 0xA0, 0x3D, 0xDE, 0x7A, 0x7C, 0x56, 0xE3, 0x0A, 0x87, 
-0x2B, 0x5A, 0xCC, 0xB2, 0xA1, 0x7F, 0x78, 0xC0, 0xDA, 0x89, 0x0D, 0x86, 0x5B, 0x43, 0x18, 0x80, 
-0xCB, 0x1A, 0x42, 0xD1, 0x20, 0xB9, 0x23, 0xA8, 0x80, 0xF7, 0x2D, 0x04, 0x8F, 0x31, 0x9A, 0x10, 
-0xA0, 0x9D, 0x47, 0x6E, 0xBC, 0xBE, 0xC7, 0xDC, 0x8D, 0x78, 0x75, 0x9A, 0xF1, 0xF5, 0x57, 0x77, 
-0xB8, 0x11, 0xFA, 0x78, 0x3D, 0xC2, 0xA7, 0xD1, 0x33, 0x34, 0x61, 0x76, 0xFA, 0xCC, 0xA1, 0x7F, 
-0xF0, 0x73, 0xFF, 0xF8, 0xFF, 0x70, 0xFE, 0x13, 0x9F, 0xF8, 0xC4, 0x1B, 0x8F, 0xDD, 0xF7, 0x21, 
-0x7E, 0xA0, 0x09, 0xF7, 0x9F, 0xFC, 0x93, 0x7F, 0x12, 0x7E, 0xE2, 0x27, 0xFE, 0x83, 0xFE, 0xB7, 
-0xBF, 0xF5, 0xDC, 0xC7, 0xAD, 0xED, 0xE5, 0x28, 0x4D, 0x44, 0xA1, 0x6C, 0x86, 0xD2, 0x86, 0xF7, 
-0x3D, 0xFD, 0x34, 0xC7, 0x0F, 0x6D, 0x91, 0x89, 0x23, 0xCB, 0x24, 0xC1, 0x06, 0xF3, 0x19, 0x37, 
-0x6F, 0x5C, 0xA3, 0x9D, 0x6C, 0xD3, 0xB7, 0x06, 0x63, 0x0C, 0xC1, 0x7B, 0x92, 0x3B, 0xBD, 0xC1, 
-0xA1, 0xA9, 0x11, 0xA2, 0xB1, 0x78, 0x84, 0xA2, 0x97, 0xE1, 0xDB, 0x34, 0x24, 0x91, 0x15, 0xC9, 
-0xC7, 0xCC, 0xF6, 0x32, 0x28, 0x2C, 0x66, 0x39, 0xA7, 0xDC, 0x18, 0x32, 0x5C, 0x2D, 0xA0, 0x8C, 
-0x34, 0xAA, 0xA1, 0x8E, 0x15, 0x8D, 0x54, 0x49, 0x5F, 0x55, 0x7C, 0x57, 0xE1, 0x0A, 0x46, 0x19, 
-0x8C, 0xB6, 0xE8, 0xCE, 0x3B, 0xC9, 0xDA, 0xA4, 0x8D, 0x92, 0xE9, 0x34, 0xA5, 0xB2, 0xA4, 0x23, 
-0x47, 0x47, 0x39, 0xF7, 0x6F, 0x2D, 0xF1, 0xC8, 0xF1, 0x0D, 0xCE, 0x6E, 0x0C, 0xD9, 0xEA, 0x59, 
-0x4C, 0x35, 0x03, 0x37, 0x43, 0x11, 0xD1, 0x92, 0x30, 0x30, 0xA5, 0x34, 0x3E, 0x34, 0xA9, 0x51, 
-0xA7, 0x55, 0x6A, 0xFC, 0x74, 0xEE, 0xC3, 0x12, 0x21, 0xF8, 0x40, 0x88, 0x82, 0x77, 0x89, 0x53, 
-0x9A, 0x28, 0x3B, 0x09, 0xBF, 0xD5, 0xDA, 0xA2, 0x94, 0x49, 0xB3, 0xEC, 0xA2, 0x21, 0xA4, 0x6E, 
-0x76, 0xDA, 0x1E, 0x27, 0xAA, 0x8E, 0x52, 0x74, 0x34, 0xFF, 0xD4, 0x65, 0x96, 0x8E, 0x56, 0x6E, 
-0x48, 0xBA, 0xA6, 0x26, 0x28, 0xF0, 0x8A, 0x7A, 0x5A, 0xE1, 0xAA, 0x1A, 0xDD, 0x55, 0x3F, 0x21, 
-0x4A, 0x6A, 0x2A, 0x1A, 0x83, 0x52, 0x60, 0x42, 0x43, 0xCE, 0x94, 0x65, 0x2A, 0xEE, 0xCB, 0xE0, 
-0x03, 0x27, 0x56, 0xF9, 0x03, 0xF7, 0x6C, 0xF1, 0xC3, 0xE7, 0x36, 0x38, 0xA6, 0x1B, 0xC6, 0x6E, 
-0x42, 0x56, 0xCF, 0x28, 0x5C, 0x4D, 0x5F, 0x20, 0x17, 0x85, 0x8E, 0x1D, 0x46, 0x18, 0x1D, 0x64, 
-0xE0, 0x4C, 0xC3, 0x34, 0xEE, 0x32, 0xB3, 0x53, 0xCC, 0x1A, 0xAC, 0x9E, 0x5D, 0x61, 0xF3, 0xDE, 
-0x4D, 0xCA, 0xAD, 0x11, 0x76, 0xA3, 0x87, 0x30, 0x45, 0xA4, 0x02, 0x5A, 0x62, 0xDB, 0x62, 0x94, 
-0x41, 0x82, 0x4E, 0x42, 0xCF, 0x58, 0x82, 0x68, 0x6C, 0xD9, 0x63, 0x5A, 0x4D, 0xB0, 0x46, 0xD3, 
-0xCB, 0x33, 0x7C, 0xDB, 0xA0, 0xAC, 0x62, 0xEE, 0x3D, 0x98, 0x1E, 0x31, 0x5F, 0xE5, 0xFA, 0x6C, 
-0xC8, 0x27, 0xBF, 0x74, 0x95, 0xFF, 0xEF, 0x2F, 0x5F, 0xE0, 0x67, 0xFF, 0xCD, 0x73, 0xFC, 0xFB, 
-0x6F, 0x6C, 0xF3, 0xEF, 0xBF, 0x7C, 0x91, 0x97, 0x5F, 0xBB, 0x43, 0xD9, 0x1B, 0xB3, 0x32, 0x1E, 
-0x92, 0x11, 0x93, 0xBE, 0x82, 0x49, 0x9A, 0xBD, 0xA2, 0x15, 0xAD, 0xF2, 0x9D, 0xAE, 0x6B, 0xD2, 
-0x4D, 0x2E, 0xEC, 0x12, 0xB1, 0x16, 0xAC, 0x94, 0x28, 0x95, 0x23, 0x4A, 0x92, 0x12, 0x94, 0x09, 
-0x58, 0x2B, 0x88, 0x6F, 0xC8, 0x32, 0x83, 0xD7, 0x42, 0xB9, 0x3C, 0x64, 0xBC, 0x31, 0xA6, 0x18, 
-0x65, 0x4C, 0xE6, 0xBB, 0x54, 0x7E, 0x46, 0xE3, 0x6B, 0xB2, 0x7E, 0x89, 0x18, 0x83, 0xCA, 0x32, 
-0xB4, 0x4D, 0x95, 0xA8, 0x95, 0x40, 0xE6, 0x5B, 0xFA, 0xA1, 0x62, 0xC9, 0x78, 0xCE, 0x6D, 0x0E, 
-0x39, 0xB1, 0x5C, 0x52, 0xC4, 0x86, 0x6A, 0xB2, 0x4B, 0x25, 0x9E, 0xA0, 0x33, 0x62, 0x56, 0x50, 
-0xB9, 0xC4, 0xF1, 0xD6, 0x4A, 0x10, 0x49, 0xE2, 0xD8, 0xD5, 0xDE, 0x2E, 0x37, 0xAF, 0x5D, 0x61, 
-0xB2, 0xBB, 0x43, 0xA6, 0x2C, 0xA3, 0xE1, 0x5A, 0x9A, 0xAB, 0x14, 0x8D, 0x52, 0x16, 0x27, 0x42, 
-0x56, 0x66, 0x44, 0xE7, 0xC9, 0x33, 0x4B, 0x33, 0x9D, 0xF2, 0xC2, 0xB7, 0xBF, 0xCD, 0x64, 0x7B, 
-0x9B, 0x9C, 0x34, 0x3A, 0x2F, 0x4E, 0xD0, 0xBA, 0x40, 0x75, 0x10, 0x12, 0x2C, 0xA6, 0xD1, 0xD2, 
-0x50, 0x4D, 0x0C, 0x8E, 0xD6, 0x35, 0xB4, 0x6D, 0x4B, 0x53, 0xD7, 0xDD, 0x50, 0x8B, 0x4A, 0x37, 
-0xA0, 0xD8, 0xB1, 0x57, 0x48, 0xD7, 0x5C, 0x34, 0x92, 0x44, 0x5C, 0x68, 0xE8, 0xA9, 0x86, 0x92, 
-0x29, 0x63, 0xF6, 0x38, 0x61, 0x22, 0x0F, 0x2E, 0x17, 0x3C, 0x7D, 0x72, 0x8B, 0x1F, 0x7E, 0xF0, 
-0x24, 0x1F, 0xBB, 0xEF, 0x34, 0x0F, 0xAF, 0x0F, 0x39, 0x5A, 0x44, 0xD6, 0xAD, 0xA7, 0x1F, 0x2B, 
-0x74, 0x3B, 0xA5, 0x50, 0x01, 0x23, 0x01, 0x15, 0x63, 0xA7, 0x3D, 0xAD, 0xD0, 0x92, 0x20, 0x2E, 
-0x24, 0x75, 0x17, 0xD2, 0xBA, 0x5D, 0x80, 0xEC, 0xA4, 0xC9, 0x43, 0x1C, 0x8D, 0x78, 0xC4, 0x1A, 
-0x2A, 0xE5, 0xA8, 0xA9, 0xA9, 0xCC, 0x8C, 0x38, 0x9A, 0x51, 0xAC, 0x47, 0x96, 0x8E, 0x1A, 0x96, 
-0x4E, 0x96, 0xAC, 0x9E, 0x5E, 0x45, 0x2F, 0x15, 0x64, 0x6B, 0x4B, 0xD4, 0x56, 0xE1, 0xAC, 0x10, 
-0xB2, 0x00, 0xAA, 0xA1, 0xF5, 0x15, 0x2E, 0x5A, 0xCA, 0x62, 0x88, 0x92, 0x88, 0xAF, 0x1C, 0x45, 
-0xB0, 0x4C, 0x6E, 0x35, 0xDC, 0xBC, 0xEA, 0xD9, 0x71, 0x2B, 0x7C, 0xEE, 0xE2, 0x8C, 0x67, 0x6E, 
-0x39, 0xE6, 0xAC, 0xE2, 0x62, 0x81, 0x42, 0xD3, 0xCB, 0x6D, 0x9C, 0x87, 0x3B, 0x57, 0x3E, 0xFC, 
-0xFE, 0x27, 0xFF, 0xCE, 0xC7, 0xFF, 0xD4, 0x8F, 0xDF, 0x7C, 0x73, 0x3E, 0xFB, 0x7E, 0xC4, 0x0F, 
-0x34, 0xE1, 0x02, 0x3C, 0xF0, 0xC0, 0xE3, 0xE5, 0xF9, 0xE7, 0x2F, 0xFC, 0xA9, 0x10, 0xF4, 0x40, 
-0xE9, 0x5C, 0x65, 0x79, 0x9F, 0xB6, 0x9E, 0x10, 0xB5, 0xE1, 0xEC, 0x99, 0x93, 0x3C, 0xFD, 0xD4, 
-0xE3, 0xF4, 0xAD, 0x42, 0x29, 0x0F, 0x44, 0x42, 0xE3, 0xD8, 0xB9, 0xB5, 0x03, 0xAD, 0xC7, 0xDA, 
-0x1E, 0xD1, 0x0C, 0x69, 0xD5, 0x80, 0x69, 0x28, 0xD8, 0x6D, 0x73, 0x26, 0x52, 0x22, 0xF9, 0x18, 
-0x65, 0x4B, 0x00, 0xC4, 0xB5, 0x18, 0x22, 0xB9, 0x49, 0x13, 0x34, 0x9E, 0x48, 0xD4, 0x60, 0xAD, 
-0x02, 0xE5, 0x41, 0x39, 0xC8, 0x84, 0xBC, 0x9F, 0x51, 0x0C, 0x73, 0x8A, 0x7E, 0x4E, 0x5E, 0xE6, 
-0x54, 0xF5, 0x9C, 0x18, 0x65, 0x7F, 0xEB, 0xA5, 0x14, 0xFB, 0x62, 0xE4, 0x5A, 0x0B, 0xC6, 0x2A, 
-0xAC, 0x16, 0x2C, 0x11, 0x1B, 0x03, 0x36, 0x34, 0x94, 0xD1, 0x53, 0x46, 0x47, 0x2F, 0x3A, 0x8E, 
-0xAE, 0x8E, 0xD9, 0x18, 0x0F, 0xD8, 0x5C, 0x1E, 0xB2, 0xD4, 0x2F, 0xC8, 0x10, 0x94, 0x73, 0xD8, 
-0xE8, 0xB1, 0x2A, 0x92, 0x65, 0x09, 0x8B, 0xB2, 0x5D, 0xE7, 0x3C, 0x78, 0x9F, 0xAC, 0x9C, 0x03, 
-0x64, 0xB6, 0x40, 0x82, 0x4A, 0x8D, 0x8D, 0x90, 0xE4, 0x0E, 0x43, 0xE8, 0x78, 0xB0, 0x9D, 0xCE, 
-0xA8, 0x4E, 0x3D, 0x79, 0x94, 0x51, 0xC9, 0x7D, 0x58, 0x1D, 0x84, 0x20, 0x40, 0x44, 0x27, 0x05, 
-0x36, 0x95, 0x75, 0x8F, 0x27, 0xB9, 0x3B, 0xDF, 0x26, 0xA1, 0x99, 0x6A, 0x32, 0xC7, 0xAA, 0x8C, 
-0xCC, 0xE4, 0xA0, 0x92, 0x5A, 0x55, 0xAA, 0x8E, 0x22, 0x3A, 0x34, 0x94, 0xB1, 0x61, 0xC8, 0x8C, 
-0xC3, 0x04, 0x1E, 0x5E, 0x2A, 0x79, 0xEF, 0xB1, 0x65, 0x9E, 0xDC, 0x1A, 0x72, 0xCF, 0x40, 0xD8, 
-0x08, 0x73, 0x86, 0x7E, 0xCE, 0x20, 0x06, 0x4A, 0x22, 0x99, 0x8F, 0xC4, 0xA6, 0x26, 0x78, 0x87, 
-0x56, 0x11, 0x53, 0x18, 0xA2, 0x15, 0x66, 0x32, 0x67, 0x2A, 0x53, 0xE2, 0x20, 0x32, 0x38, 0x32, 
-0x64, 0xF5, 0xD4, 0x1A, 0x4B, 0xC7, 0x96, 0xC9, 0xD6, 0x4A, 0x62, 0xCF, 0x50, 0x87, 0xAA, 0x9B, 
-0xC4, 0x8A, 0x68, 0xDB, 0x49, 0x19, 0x5A, 0x4B, 0xDB, 0x24, 0x5D, 0x06, 0xAD, 0x33, 0x42, 0x10, 
-0xAC, 0x49, 0x73, 0xFB, 0x5A, 0x45, 0xC4, 0x27, 0x7A, 0x94, 0xD3, 0x05, 0xC1, 0x8E, 0x69, 0xB3, 
-0x0D, 0xAE, 0x4E, 0x7A, 0x7C, 0xFE, 0xDB, 0x13, 0x7E, 0xE1, 0x53, 0xE7, 0xF9, 0xD2, 0x8B, 0x73, 
-0x26, 0x1C, 0x61, 0xB7, 0x1D, 0x53, 0x4B, 0x9F, 0xDB, 0x3B, 0x73, 0xAE, 0x5C, 0xBB, 0x89, 0x31, 
-0x9A, 0xE3, 0x47, 0x8F, 0x33, 0x1E, 0x8D, 0x99, 0x4E, 0x26, 0x18, 0xA3, 0xB0, 0x99, 0xC1, 0xC5, 
-0x16, 0x63, 0x15, 0x65, 0x5E, 0xE0, 0x6B, 0x47, 0xA8, 0x1C, 0x39, 0x96, 0xE8, 0x03, 0xDA, 0x28, 
-0x9A, 0x50, 0x13, 0x6D, 0x62, 0xB3, 0xF8, 0xA8, 0xC8, 0x4D, 0x0F, 0x41, 0xE3, 0xB5, 0x20, 0x46, 
-0x50, 0x19, 0xF4, 0xFA, 0x05, 0x45, 0x3F, 0xA7, 0x1C, 0x64, 0x84, 0x18, 0x98, 0xB7, 0x35, 0x45, 
-0xAF, 0x4C, 0xAC, 0xED, 0x4E, 0x7D, 0xAB, 0xB4, 0x96, 0x42, 0x6B, 0xAC, 0x6F, 0xA1, 0xAD, 0xD0, 
-0x6D, 0xC3, 0xFA, 0xA0, 0xC7, 0xE1, 0xCD, 0x55, 0xC6, 0xFD, 0x01, 0xAE, 0x76, 0xCC, 0xE6, 0x7B, 
-0xB4, 0xC1, 0x25, 0xB1, 0x19, 0xF1, 0x64, 0x79, 0x96, 0xC4, 0xC1, 0x63, 0x04, 0x92, 0xD8, 0x79, 
-0x35, 0x99, 0x73, 0xF3, 0xE6, 0x6D, 0x24, 0x42, 0xD9, 0x1B, 0xB0, 0xB4, 0x9C, 0x60, 0x86, 0xD6, 
-0x35, 0x10, 0x85, 0x5E, 0x91, 0x61, 0x88, 0x5C, 0x7C, 0xF1, 0x25, 0xAE, 0xBF, 0x7E, 0x89, 0x66, 
-0x3A, 0x25, 0xD7, 0x8B, 0x1B, 0x74, 0x62, 0x1B, 0x08, 0x89, 0x4B, 0x2D, 0x24, 0x67, 0x5B, 0xEF, 
-0x16, 0xF4, 0xBF, 0xC4, 0x3A, 0x08, 0x1E, 0xCA, 0x62, 0x08, 0x92, 0xF0, 0x71, 0x25, 0x8A, 0x5C, 
-0x1B, 0x2C, 0x49, 0x5A, 0x53, 0x4B, 0x92, 0x7E, 0x29, 0xE3, 0x9C, 0x01, 0x73, 0x56, 0xA9, 0x38, 
-0x6E, 0x85, 0x87, 0x56, 0x86, 0xBC, 0xE7, 0xE4, 0x06, 0xEF, 0x3D, 0xB9, 0xC5, 0xE3, 0x5B, 0x4B, 
-0x9C, 0x2C, 0x14, 0x6B, 0xB1, 0xA1, 0xDF, 0x4E, 0xC8, 0x9B, 0x19, 0xA6, 0xAD, 0x52, 0x55, 0x1F, 
-0x5A, 0x6C, 0x88, 0xE8, 0xCE, 0x13, 0x4E, 0xAB, 0x04, 0x49, 0x24, 0xC8, 0x2C, 0x09, 0xAC, 0x07, 
-0x49, 0xD6, 0x0E, 0x51, 0x47, 0xC4, 0x78, 0xBC, 0xF1, 0x04, 0xDD, 0xA6, 0x5D, 0x8E, 0x49, 0x3D, 
-0x00, 0xD5, 0x0B, 0x94, 0xAB, 0x86, 0xD1, 0xE1, 0x82, 0xE5, 0xC3, 0x39, 0xA3, 0x43, 0x39, 0x83, 
-0x8D, 0x8C, 0x6C, 0xA5, 0x4F, 0x63, 0x33, 0xDA, 0xDE, 0x12, 0xB7, 0xDB, 0x9C, 0xB9, 0x1E, 0xD3, 
-0xE8, 0x01, 0xAD, 0x2A, 0xD1, 0xB6, 0x47, 0xDE, 0x5F, 0xC1, 0xD1, 0x47, 0x9B, 0x3E, 0x56, 0x2C, 
-0x39, 0x25, 0x61, 0xA6, 0xB9, 0x73, 0xAD, 0xE5, 0xCE, 0x8E, 0xE5, 0x4E, 0x58, 0xE6, 0x9B, 0xDB, 
-0xC2, 0x0B, 0xBB, 0x9E, 0x8A, 0x01, 0x42, 0x09, 0x1A, 0x66, 0x7E, 0x37, 0x0E, 0x33, 0xFB, 0xEC, 
-0x63, 0xEF, 0xB8, 0xEF, 0x9F, 0x7C, 0xFD, 0x5B, 0x9F, 0xFF, 0xBE, 0x37, 0xCC, 0xF8, 0x9F, 0x22, 
-0xE1, 0xFE, 0xE8, 0x07, 0xFE, 0x68, 0xFE, 0xDB, 0xCF, 0x9C, 0xFF, 0xF1, 0x18, 0x8B, 0xC3, 0x48, 
-0xA6, 0x50, 0x06, 0x5B, 0xE4, 0x14, 0xB9, 0x61, 0x36, 0xDB, 0xE6, 0xE9, 0xA7, 0xDF, 0xC5, 0xE6, 
-0xE6, 0x0A, 0x4A, 0xAB, 0x34, 0x7B, 0xDD, 0x0A, 0x6D, 0x25, 0xB4, 0x33, 0xD8, 0x9B, 0x5B, 0x5E, 
-0xBE, 0xE6, 0xF9, 0xFA, 0xC5, 0x3D, 0x3E, 0xF7, 0xFC, 0x2D, 0x7E, 0xED, 0x9B, 0xAF, 0xF3, 0xA5, 
-0xE7, 0xAF, 0xF3, 0xFC, 0xAB, 0xB7, 0x59, 0x5F, 0x3D, 0x42, 0x3F, 0x2B, 0xE9, 0x01, 0x7D, 0x0D, 
-0x5A, 0x05, 0x62, 0x0C, 0xE8, 0x22, 0x4F, 0xA3, 0x93, 0x92, 0xB6, 0x7F, 0x11, 0x49, 0xB2, 0x90, 
-0x65, 0x4E, 0x56, 0xF6, 0x28, 0x7B, 0x05, 0xFD, 0x5E, 0x8F, 0xE1, 0x70, 0x48, 0x5E, 0x18, 0x5C, 
-0x68, 0xA9, 0xEB, 0x8A, 0xDA, 0xCD, 0x09, 0x92, 0x92, 0xB3, 0xC9, 0xC1, 0x35, 0xCD, 0x3E, 0x94, 
-0xA1, 0x3B, 0x3E, 0xA2, 0x51, 0xA9, 0x59, 0x96, 0x29, 0x83, 0xAB, 0x2B, 0x46, 0x45, 0xC1, 0xA1, 
-0x8D, 0x65, 0xCE, 0x1C, 0x3D, 0xCC, 0xE9, 0xC3, 0xEB, 0x6C, 0x8D, 0x0A, 0x7A, 0x71, 0x06, 0xCD, 
-0x04, 0x17, 0x92, 0x53, 0x80, 0x44, 0x47, 0x2E, 0x86, 0x5E, 0xDE, 0x43, 0x8B, 0x05, 0x31, 0x48, 
-0x00, 0xD3, 0x2D, 0xC2, 0x64, 0x29, 0xA2, 0x52, 0x87, 0x5F, 0xC2, 0xBE, 0x58, 0x89, 0x53, 0xE0, 
-0x48, 0x6C, 0x08, 0xA5, 0x14, 0xA6, 0x1B, 0xBF, 0x55, 0xD1, 0xA2, 0xA2, 0x41, 0xAB, 0x3C, 0x55, 
-0x26, 0x24, 0xF1, 0x97, 0xE0, 0x3D, 0xAD, 0x6F, 0x69, 0x5C, 0x4B, 0xDB, 0xB6, 0x64, 0x2A, 0x23, 
-0x46, 0xA8, 0x82, 0xA3, 0x95, 0xA4, 0x3C, 0xA5, 0xAC, 0x90, 0x8B, 0xA3, 0x27, 0x13, 0x56, 0xD8, 
-0xE3, 0x81, 0x7E, 0xC6, 0x87, 0x4F, 0x6F, 0xF0, 0xC3, 0xF7, 0x1F, 0xE3, 0x5D, 0xC7, 0x56, 0x39, 
-0x35, 0xB0, 0x0C, 0x42, 0x8D, 0xAA, 0x66, 0x94, 0x3E, 0x60, 0x5C, 0x40, 0xF9, 0x80, 0x8A, 0x01, 
-0x6D, 0x15, 0x64, 0x69, 0x7A, 0xAB, 0xD5, 0x8E, 0xDB, 0xED, 0x0E, 0xBE, 0x8C, 0x14, 0x5B, 0x03, 
-0x36, 0xCE, 0x1E, 0x62, 0xE3, 0xDE, 0xC3, 0x94, 0x47, 0x96, 0x51, 0x3D, 0x61, 0x1E, 0x5B, 0x82, 
-0x56, 0x88, 0xD1, 0x98, 0x7E, 0x49, 0xA3, 0x34, 0x8D, 0xF2, 0xD4, 0x31, 0x0D, 0x21, 0x18, 0x9D, 
-0xA8, 0x53, 0x79, 0xD1, 0x43, 0x39, 0x4F, 0x6C, 0x5D, 0xC2, 0x5F, 0xD3, 0xFE, 0x07, 0x5B, 0x8E, 
-0xD8, 0x99, 0x17, 0x98, 0xE5, 0x7B, 0x39, 0x7F, 0x33, 0xE3, 0x1F, 0xFD, 0xCB, 0xAF, 0xF1, 0x3F, 
-0x7E, 0xFA, 0x79, 0xCE, 0x5F, 0x8B, 0xB4, 0xAC, 0xD2, 0x86, 0x1E, 0x3E, 0x58, 0xB2, 0x72, 0xC4, 
-0x4E, 0x1D, 0xB8, 0x78, 0xFB, 0x16, 0xAF, 0x5D, 0xBA, 0xC5, 0xDE, 0xDC, 0x31, 0x1E, 0x2F, 0x73, 
-0xE6, 0xD4, 0x49, 0x54, 0xA8, 0x50, 0xB1, 0x21, 0xB3, 0xE9, 0x28, 0xD5, 0xD3, 0x29, 0x46, 0x84, 
-0xA2, 0xDF, 0x07, 0x3F, 0x07, 0xDD, 0x20, 0xB9, 0x30, 0x95, 0x1A, 0x6F, 0x72, 0xA2, 0xE9, 0xD3, 
-0xD2, 0x47, 0xD9, 0x25, 0xE6, 0x95, 0x47, 0x5B, 0x45, 0x08, 0x0D, 0x12, 0x3C, 0x59, 0x51, 0x50, 
-0x14, 0x19, 0xFD, 0xF1, 0x90, 0x5E, 0xCF, 0x62, 0x8A, 0x8C, 0x59, 0x35, 0x43, 0x8C, 0x49, 0x0D, 
-0x35, 0x63, 0x13, 0xCE, 0xDC, 0x46, 0x42, 0xD0, 0x18, 0x9D, 0x61, 0x4C, 0x81, 0xB8, 0x48, 0x16, 
-0x85, 0xF5, 0xC1, 0x90, 0x63, 0x2B, 0x4B, 0xAC, 0x14, 0x19, 0x71, 0x3E, 0x65, 0xE6, 0x6E, 0x13, 
-0x89, 0x38, 0xA0, 0x56, 0x91, 0x68, 0x2C, 0x3A, 0x2F, 0xD1, 0xBA, 0x20, 0xB6, 0x82, 0xAB, 0x1A, 
-0xAE, 0xBE, 0x7E, 0x81, 0x5B, 0xBB, 0xB7, 0x89, 0xA1, 0xA1, 0xDF, 0xCB, 0x19, 0xF4, 0x07, 0x10, 
-0x3D, 0xA1, 0x75, 0xDC, 0xB8, 0x72, 0x99, 0x97, 0x9E, 0x3D, 0xCF, 0x6C, 0x67, 0x07, 0xED, 0x23, 
-0xB9, 0xD6, 0xC4, 0xE0, 0xD3, 0x4E, 0x88, 0xB4, 0xFB, 0x70, 0x21, 0xF1, 0xAB, 0x5D, 0x13, 0x10, 
-0x27, 0xA8, 0x60, 0xB0, 0x31, 0xC3, 0xC6, 0x82, 0x8C, 0x1E, 0xE2, 0x3A, 0xDB, 0x1F, 0xF1, 0xE8, 
-0xAE, 0x61, 0xAA, 0xA8, 0xD0, 0xD4, 0xF4, 0x99, 0xB3, 0x2E, 0x13, 0x8E, 0xD1, 0x70, 0x7F, 0x59, 
-0xF0, 0x9E, 0x63, 0x9B, 0xFC, 0xC8, 0x83, 0x67, 0xF9, 0xF0, 0xBD, 0x27, 0x78, 0x74, 0x63, 0xCC, 
-0x71, 0x2B, 0x6C, 0x48, 0x4B, 0xBF, 0x9D, 0x91, 0x37, 0x73, 0x8A, 0x18, 0x53, 0xC1, 0xD1, 0x8D, 
-0xA6, 0x67, 0x36, 0x4F, 0x3B, 0x21, 0x3A, 0x98, 0x2C, 0x26, 0xAF, 0x8C, 0x80, 0x4F, 0xD2, 0xA0, 
-0x3A, 0xA0, 0x0B, 0x88, 0xC6, 0xD1, 0x52, 0x53, 0xCB, 0x8C, 0x3A, 0xCE, 0x08, 0xA6, 0x46, 0xF2, 
-0x88, 0xEA, 0x39, 0xD6, 0x8E, 0x8F, 0x58, 0xDA, 0xCA, 0x59, 0x3A, 0x5C, 0xD0, 0xDF, 0xB0, 0xE4, 
-0x4B, 0x0A, 0xDB, 0x13, 0xBC, 0x4E, 0xAF, 0xB0, 0x2E, 0x0E, 0xF3, 0xDC, 0x95, 0x96, 0x7F, 0xFE, 
-0x2B, 0xCF, 0xF3, 0x2B, 0x5F, 0xBA, 0xC8, 0x17, 0xBF, 0x71, 0x9D, 0xE7, 0x2E, 0xCE, 0xB9, 0x33, 
-0xED, 0xD1, 0xCA, 0x2A, 0x91, 0x92, 0xCC, 0x0C, 0xC9, 0xF5, 0x08, 0xE3, 0x7B, 0xDC, 0xB9, 0x5E, 
-0x71, 0xFB, 0x96, 0x47, 0xF4, 0x3A, 0xBB, 0x8C, 0xF9, 0xEC, 0x4B, 0x57, 0x78, 0xB5, 0x09, 0xCC, 
-0xC8, 0x69, 0x17, 0x70, 0x56, 0xAC, 0xDB, 0xC1, 0xA8, 0xF8, 0x77, 0x7F, 0xE2, 0xA7, 0x3F, 0xFE, 
-0x8B, 0x9F, 0xFA, 0xD4, 0x3F, 0xFB, 0x0E, 0x2D, 0xDB, 0xEF, 0x47, 0xFC, 0xC0, 0x13, 0xEE, 0xFB, 
-0x7E, 0xE8, 0xC7, 0xE3, 0xB3, 0xDF, 0x78, 0xE9, 0x7D, 0xD3, 0xA6, 0x79, 0x20, 0xD3, 0x03, 0xE3, 
-0xBC, 0xC7, 0xE8, 0x8C, 0xD9, 0x7C, 0x87, 0x28, 0x9E, 0x1F, 0xFF, 0xD1, 0x8F, 0x71, 0xE4, 0xF0, 
-0x61, 0xA4, 0x8D, 0x68, 0xC9, 0xD9, 0xDD, 0xF3, 0x5C, 0xBC, 0x78, 0x8B, 0x5F, 0xF9, 0xF4, 0x97, 
-0xF9, 0xEA, 0x33, 0x57, 0xF8, 0xB5, 0x6F, 0x5C, 0xE2, 0x0B, 0xDF, 0xBE, 0xC1, 0x6F, 0x5D, 0x98, 
-0xF0, 0xCC, 0x6B, 0x53, 0x5E, 0xBE, 0x56, 0x71, 0xF5, 0xFA, 0x94, 0xE8, 0x23, 0x4B, 0x83, 0x01, 
-0x47, 0x56, 0x06, 0x58, 0x69, 0xF1, 0xCD, 0x0C, 0x63, 0x24, 0xC9, 0xE3, 0xED, 0xDB, 0x2C, 0x77, 
-0xC6, 0x80, 0x08, 0x2A, 0xA6, 0xC5, 0x88, 0xD6, 0x09, 0x6E, 0x28, 0x33, 0xCA, 0xB2, 0xA0, 0xDF, 
-0x2F, 0x28, 0x07, 0x19, 0x59, 0x69, 0x89, 0x26, 0xD0, 0x86, 0x8A, 0xAA, 0x9D, 0x93, 0x59, 0x83, 
-0xD1, 0xA0, 0x4D, 0xC2, 0x2B, 0x8D, 0x52, 0x49, 0xEF, 0x20, 0x04, 0xA2, 0xF7, 0xF4, 0xAC, 0x85, 
-0xD0, 0x12, 0xEB, 0x39, 0xC6, 0xB5, 0x8C, 0x0B, 0xC5, 0x91, 0xA5, 0x1E, 0xA7, 0x56, 0x46, 0x9C, 
-0xDC, 0x5C, 0xA3, 0x5F, 0x58, 0x86, 0xDA, 0x62, 0xE6, 0x33, 0x84, 0x59, 0x9A, 0xD6, 0x92, 0x24, 
-0x90, 0x91, 0xED, 0xF3, 0x1D, 0x63, 0x47, 0xC9, 0x49, 0x59, 0x56, 0x16, 0x33, 0xE9, 0x01, 0x5C, 
-0xF4, 0x49, 0xAD, 0x2B, 0x74, 0x93, 0x55, 0x91, 0xAE, 0x12, 0x37, 0x68, 0x9D, 0xA1, 0x49, 0x09, 
-0x35, 0xF8, 0x8E, 0x1D, 0xD1, 0x3A, 0x82, 0x6F, 0x11, 0xEF, 0xF6, 0xA7, 0x9F, 0xBC, 0x04, 0x8C, 
-0xD6, 0xE4, 0x99, 0xC1, 0xA8, 0x96, 0xCC, 0x4F, 0x58, 0x96, 0x8A, 0x53, 0x36, 0xF2, 0xD4, 0xA1, 
-0x65, 0xDE, 0x7D, 0x68, 0xC8, 0x3B, 0x37, 0x47, 0x9C, 0x2E, 0x23, 0xA3, 0x76, 0x8A, 0x9E, 0xDC, 
-0xC1, 0xB4, 0x73, 0x7A, 0x12, 0xC8, 0x83, 0x60, 0x82, 0x80, 0x0A, 0x88, 0x8E, 0x04, 0xE3, 0x71, 
-0xA6, 0xA5, 0xD2, 0x35, 0x53, 0x3D, 0xA7, 0xB7, 0xD1, 0x67, 0x74, 0x74, 0x89, 0xF5, 0x53, 0x9B, 
-0xF4, 0x8E, 0x8C, 0x60, 0xA8, 0xF1, 0xB6, 0xA5, 0x55, 0x2D, 0xDE, 0x2A, 0x5A, 0x4A, 0xBC, 0x1D, 
-0x71, 0x69, 0xBB, 0x65, 0xBB, 0xD2, 0x04, 0x3B, 0x22, 0xEB, 0x2D, 0xA1, 0xB5, 0x05, 0x49, 0xDE, 
-0x63, 0xD2, 0x36, 0xB8, 0xB6, 0x21, 0x2F, 0x2D, 0x59, 0x99, 0xE3, 0x04, 0x82, 0x64, 0xCC, 0xE3, 
-0x00, 0x35, 0x3C, 0xC7, 0xD7, 0x5F, 0xAE, 0xF9, 0x77, 0x5F, 0xBA, 0xC2, 0xAF, 0x7C, 0xF5, 0x1A, 
-0x17, 0x6F, 0xE7, 0x34, 0x6A, 0x8D, 0x2C, 0x5F, 0x43, 0xE9, 0x12, 0xC8, 0x88, 0x64, 0x78, 0x5D, 
-0x80, 0x1D, 0x30, 0x77, 0x91, 0xAB, 0xD7, 0xEF, 0xE0, 0x83, 0x61, 0x6D, 0x6D, 0x83, 0xE5, 0x61, 
-0x89, 0x6B, 0xE6, 0x44, 0x05, 0x79, 0xAF, 0x44, 0x47, 0x41, 0xBC, 0x4B, 0x63, 0xDC, 0xB1, 0x25, 
-0x68, 0xA8, 0x44, 0xD1, 0x9A, 0x65, 0x1A, 0xB3, 0xCA, 0x8D, 0x49, 0xC1, 0xD5, 0x6D, 0xCD, 0xCC, 
-0x8D, 0x28, 0x07, 0xCB, 0x49, 0x45, 0x55, 0x07, 0x82, 0x73, 0x18, 0x02, 0x88, 0x47, 0x95, 0x19, 
-0x76, 0x90, 0x33, 0x58, 0xEA, 0x93, 0x95, 0x19, 0x5E, 0x02, 0xD3, 0xAA, 0xA2, 0x69, 0x3B, 0x4B, 
-0x78, 0x63, 0x11, 0x49, 0x38, 0xAD, 0x8A, 0x82, 0x6F, 0x1A, 0xA8, 0x2B, 0x86, 0x4A, 0xB3, 0xDE, 
-0x2F, 0x59, 0xEF, 0x97, 0x8C, 0x72, 0xCD, 0xD0, 0x58, 0xEA, 0x6A, 0x4A, 0x08, 0x1E, 0x17, 0x7D, 
-0xC2, 0x98, 0x83, 0x4A, 0xFA, 0xCB, 0xA2, 0x29, 0x8A, 0x92, 0xA0, 0x22, 0xD5, 0x6C, 0x8F, 0x5B, 
-0xB7, 0x6E, 0xE3, 0xDB, 0x96, 0xA5, 0xFE, 0x80, 0x7E, 0x51, 0x32, 0xCC, 0x0B, 0x6E, 0x5F, 0xB9, 
-0xCE, 0x85, 0xF3, 0xE7, 0x51, 0xAD, 0x23, 0x47, 0x43, 0x8C, 0x48, 0x87, 0xC5, 0x4A, 0x8C, 0xB4, 
-0xCE, 0x23, 0x5E, 0x08, 0x0E, 0x08, 0xD2, 0x35, 0x9E, 0x3A, 0x2B, 0xA0, 0x0E, 0xD7, 0xD5, 0x28, 
-0x0A, 0x60, 0x80, 0x30, 0xC0, 0xD1, 0x67, 0xC6, 0x98, 0x8A, 0x55, 0xED, 0x38, 0xAE, 0x03, 0xEF, 
-0x5A, 0x59, 0xE2, 0xDD, 0x5B, 0xEB, 0x3C, 0x75, 0xFA, 0x10, 0xEF, 0xD8, 0x5A, 0xE6, 0x44, 0x09, 
-0x1B, 0x52, 0x31, 0x6C, 0x26, 0x29, 0xD1, 0xFA, 0x39, 0xB9, 0x6F, 0x28, 0x95, 0x50, 0xE8, 0x54, 
-0xDC, 0x04, 0x9F, 0x7C, 0xC8, 0x0C, 0xE0, 0xBD, 0xEB, 0x58, 0x05, 0xD2, 0x4D, 0xFD, 0x85, 0xFD, 
-0x6A, 0x36, 0x18, 0xCF, 0xCC, 0xED, 0xD2, 0xEA, 0x06, 0x72, 0x87, 0xEE, 0x47, 0x8A, 0x91, 0x65, 
-0xB0, 0xDA, 0x63, 0x65, 0x6B, 0xC8, 0x78, 0x6B, 0x40, 0xB1, 0x9E, 0x61, 0xC6, 0x1A, 0x7A, 0x11, 
-0x8A, 0x00, 0xDA, 0x23, 0x5A, 0xE1, 0x4C, 0x49, 0xA3, 0x97, 0x38, 0x7F, 0xD9, 0xF1, 0x2B, 0x5F, 
-0x7E, 0x8D, 0x5F, 0xF9, 0xEA, 0x65, 0xBE, 0xF5, 0x6A, 0xC5, 0xC5, 0x5B, 0x91, 0x0B, 0xD7, 0x1A, 
-0x5E, 0xB9, 0xB2, 0xC7, 0xB3, 0x2F, 0x5F, 0xE3, 0xF5, 0xDB, 0x13, 0x6E, 0xEE, 0x35, 0xEC, 0x4E, 
-0x84, 0xC9, 0xCC, 0x70, 0xF3, 0xA6, 0xA7, 0x72, 0x43, 0x42, 0xB6, 0xC1, 0xF3, 0x37, 0x6A, 0x7E, 
-0xFD, 0x95, 0xAB, 0xCC, 0xB3, 0x31, 0x92, 0x8F, 0xD3, 0x4E, 0xC5, 0xD7, 0xA0, 0xE2, 0xEE, 0xCA, 
-0xA8, 0xF7, 0x2F, 0xFE, 0xE4, 0x9F, 0xFA, 0x6F, 0xBF, 0xF8, 0xFD, 0x9E, 0x30, 0x5B, 0xC4, 0xEF, 
-0xAD, 0x15, 0xFE, 0xBB, 0x08, 0x11, 0x51, 0x87, 0x56, 0x9E, 0xFE, 0x8B, 0x77, 0x76, 0xDC, 0xFF, 
-0x29, 0xCB, 0x96, 0x56, 0x9A, 0x00, 0xDA, 0x0A, 0xA2, 0xE6, 0x0C, 0xC7, 0x9A, 0xBF, 0xF1, 0xBF, 
-0xFF, 0x2B, 0x7C, 0xE8, 0xFD, 0xEF, 0xE4, 0x85, 0xE7, 0x9F, 0xE1, 0x2B, 0xBF, 0xF9, 0xEB, 0x7C, 
-0xF3, 0xEB, 0xDF, 0xE0, 0xCA, 0x85, 0x8B, 0xCC, 0x77, 0xF6, 0x68, 0x9B, 0xC0, 0x1E, 0x8A, 0xD4, 
-0xA6, 0x19, 0xA6, 0xEA, 0x87, 0x8A, 0x31, 0x7B, 0x9C, 0x19, 0x4E, 0xF8, 0x0F, 0x3E, 0xFC, 0x00, 
-0x7F, 0xF2, 0xC3, 0xE7, 0x58, 0x66, 0x1B, 0xA9, 0x6F, 0x60, 0x7A, 0x1A, 0xEF, 0x03, 0x18, 0x9B, 
-0x9A, 0x0D, 0x0B, 0x97, 0x02, 0x1F, 0x89, 0x01, 0x0C, 0x06, 0xA3, 0x2C, 0xE8, 0x1C, 0xFC, 0x02, 
-0x37, 0xCD, 0x93, 0x37, 0xC8, 0xDC, 0x31, 0x9B, 0xCC, 0x98, 0xEC, 0xEC, 0xD2, 0x4C, 0x1D, 0xAA, 
-0xB1, 0x68, 0x67, 0x11, 0xAF, 0xB0, 0x2A, 0x27, 0xA3, 0xC0, 0x90, 0xA7, 0xAD, 0x9A, 0xD2, 0xA9, 
-0xC9, 0x60, 0x33, 0xA2, 0xD5, 0x78, 0xAD, 0x08, 0xC6, 0x10, 0xAC, 0xC5, 0x0B, 0x4C, 0x83, 0x66, 
-0x97, 0x1E, 0x37, 0x2A, 0xCF, 0x2B, 0x37, 0xB6, 0x79, 0xFE, 0xF2, 0x75, 0x5E, 0xD9, 0x99, 0x70, 
-0x03, 0x61, 0x17, 0xC3, 0x9C, 0x8C, 0xC8, 0x00, 0xAF, 0x6C, 0xFA, 0xFB, 0xDA, 0xA2, 0x62, 0xC2, 
-0xDD, 0x16, 0xB8, 0x56, 0xD0, 0xAE, 0xD3, 0x55, 0x4D, 0x53, 0x41, 0xA6, 0x1B, 0x2F, 0xD6, 0x36, 
-0x4B, 0x74, 0x21, 0x65, 0xF0, 0xDE, 0xE3, 0x5C, 0x4A, 0xB4, 0x2A, 0x78, 0x74, 0x88, 0x28, 0x3C, 
-0xA2, 0x34, 0xAD, 0xB5, 0x18, 0x63, 0x28, 0x15, 0x64, 0xCD, 0x0C, 0x1B, 0x77, 0x58, 0xA3, 0xE5, 
-0xB1, 0xB5, 0x15, 0x1E, 0x3F, 0xB6, 0xC6, 0x3B, 0x8F, 0xAD, 0xB3, 0x1C, 0x66, 0x8C, 0x43, 0x4B, 
-0x19, 0xE6, 0xE4, 0xDE, 0x61, 0x25, 0x50, 0x68, 0x4D, 0x6E, 0x2C, 0xBE, 0x6E, 0x30, 0x46, 0x11, 
-0x6C, 0x64, 0x26, 0x33, 0xA6, 0x52, 0xE3, 0x0A, 0x8F, 0x1D, 0x5A, 0xCC, 0x28, 0xE7, 0xF0, 0xE9, 
-0x23, 0xD8, 0x61, 0x86, 0x1E, 0xE6, 0x60, 0x3D, 0x55, 0xAC, 0x70, 0x38, 0x54, 0xAE, 0xA1, 0x58, 
-0xA2, 0x92, 0x75, 0x3E, 0xF7, 0xB5, 0x8B, 0xFC, 0xCB, 0x5F, 0xFA, 0x0A, 0x6D, 0x80, 0xC3, 0x47, 
-0x57, 0xF8, 0xE8, 0x07, 0x1F, 0xE3, 0xDD, 0xF7, 0xAD, 0x92, 0xB7, 0x37, 0xE8, 0x85, 0x5D, 0x62, 
-0x33, 0xC1, 0x66, 0x82, 0xE9, 0x15, 0x4C, 0x5C, 0x64, 0xDE, 0x68, 0xF2, 0x62, 0x8B, 0x2A, 0x6E, 
-0xF0, 0xCD, 0x8B, 0x9A, 0x9F, 0xFB, 0xD7, 0x5F, 0xE1, 0x4B, 0xE7, 0xB7, 0xD9, 0x76, 0x63, 0x62, 
-0xB6, 0xC5, 0xBC, 0x49, 0x3B, 0x8D, 0x4C, 0xA7, 0x9B, 0x9F, 0x57, 0x82, 0x53, 0x06, 0x9B, 0x83, 
-0x65, 0x06, 0xF5, 0x0D, 0x8E, 0x0E, 0xE1, 0xA9, 0x73, 0x43, 0xFE, 0xCC, 0x8F, 0x3F, 0xC0, 0x93, 
-0xF7, 0x8D, 0x50, 0x72, 0x93, 0x7A, 0x76, 0x99, 0xD5, 0x5E, 0x12, 0xDD, 0x89, 0x55, 0x83, 0x32, 
-0x39, 0x2D, 0x25, 0x13, 0x19, 0x31, 0x31, 0x47, 0xF8, 0xFA, 0x0B, 0xDB, 0x7C, 0xEE, 0xCB, 0xAF, 
-0xF0, 0xEA, 0xEB, 0xB7, 0x29, 0xCB, 0x82, 0xF7, 0xBE, 0xE3, 0x30, 0x7F, 0xEC, 0xFD, 0x87, 0x39, 
-0x32, 0x6A, 0xF1, 0x6D, 0x8D, 0x96, 0x40, 0x6C, 0x9B, 0xE4, 0x14, 0x1C, 0x0D, 0x78, 0x0B, 0x66, 
-0x48, 0x73, 0x7D, 0xCE, 0xF6, 0xB5, 0x19, 0xD5, 0x1D, 0x4F, 0x9C, 0x69, 0xC4, 0xE9, 0xAE, 0x82, 
-0x34, 0xE8, 0x90, 0xC6, 0x8D, 0x55, 0x0C, 0xC9, 0x4A, 0x46, 0x29, 0xDA, 0xAC, 0x60, 0x92, 0x15, 
-0xDC, 0xB6, 0x25, 0x9F, 0x7B, 0xE5, 0x75, 0x7E, 0xFB, 0xC6, 0x2E, 0xCF, 0xED, 0xCD, 0xB9, 0x43, 
-0x1F, 0x6F, 0xC7, 0x38, 0xDD, 0xA3, 0x8D, 0xC9, 0xF9, 0xD9, 0x66, 0x02, 0x06, 0x7C, 0xDD, 0x42, 
-0x96, 0x71, 0xE4, 0xC4, 0x29, 0x4E, 0x9F, 0x39, 0xC9, 0xD6, 0xEA, 0x3A, 0xE7, 0x9F, 0x7F, 0x8E, 
-0x57, 0x5F, 0x7C, 0x91, 0xAC, 0x53, 0x5F, 0xF3, 0xDE, 0xE3, 0x7D, 0x4C, 0x12, 0xA0, 0x4A, 0x11, 
-0x5D, 0x84, 0x68, 0xBB, 0x36, 0x9B, 0xC6, 0x64, 0x36, 0xB9, 0x5C, 0xC7, 0x24, 0x85, 0x6A, 0x62, 
-0x44, 0x47, 0xD7, 0x59, 0x1F, 0xCD, 0x19, 0x32, 0x67, 0x9D, 0xC8, 0x89, 0xC1, 0x90, 0xB3, 0x5B, 
-0x6B, 0x9C, 0x1A, 0xF7, 0xB9, 0x77, 0x6D, 0x89, 0xF5, 0xC2, 0xD2, 0x2F, 0x34, 0xD2, 0xCE, 0x90, 
-0x6A, 0x0F, 0xEB, 0x1B, 0x4A, 0x23, 0xE4, 0x0A, 0x74, 0x32, 0x2F, 0x04, 0xD2, 0x20, 0x79, 0xA0, 
-0x83, 0xC8, 0xE8, 0x38, 0x8D, 0x51, 0x3A, 0xAB, 0xF9, 0x88, 0x17, 0x4F, 0x10, 0x47, 0x2B, 0x0D, 
-0x01, 0x87, 0x57, 0x0D, 0xB6, 0x30, 0x14, 0x43, 0x43, 0x7F, 0xA9, 0x4F, 0x7F, 0x5C, 0x50, 0xF4, 
-0x72, 0x74, 0xA1, 0x21, 0x37, 0x90, 0x19, 0x08, 0x0E, 0xC1, 0x21, 0xB4, 0x88, 0x09, 0x28, 0x23, 
-0x44, 0xD3, 0xA3, 0xD5, 0x23, 0x66, 0xFA, 0x10, 0xFF, 0xF4, 0x53, 0xCF, 0xF1, 0xF3, 0xFF, 0xFE, 
-0x39, 0x5E, 0xAF, 0x47, 0x4C, 0x64, 0x44, 0x5E, 0x0C, 0x08, 0xD1, 0x61, 0xC2, 0x0C, 0xE7, 0x77, 
-0x10, 0xE6, 0xAC, 0xF6, 0x33, 0x0E, 0xF5, 0x72, 0xCE, 0x2C, 0xAF, 0xB3, 0x9A, 0x15, 0x1C, 0x59, 
-0x3E, 0xCC, 0xF2, 0xE8, 0x38, 0xBF, 0xFD, 0xDA, 0x2D, 0xFE, 0xED, 0xF9, 0x8B, 0xEC, 0x98, 0x11, 
-0x73, 0xC9, 0x13, 0x87, 0x3B, 0xB4, 0x18, 0xEA, 0xE7, 0x1E, 0x3E, 0x7D, 0xEC, 0x3F, 0xF9, 0xEA, 
-0xCB, 0xBF, 0xF8, 0xB9, 0xEF, 0xF7, 0x84, 0xD9, 0x22, 0x7E, 0xE0, 0x15, 0xEE, 0x27, 0x3E, 0xF1, 
-0x09, 0x4E, 0x1F, 0x79, 0x42, 0xAA, 0xB9, 0xBC, 0x77, 0xD2, 0x36, 0x47, 0x2D, 0xC9, 0x15, 0xD3, 
-0xBB, 0x86, 0xD6, 0x07, 0x5E, 0xBB, 0x74, 0x99, 0x5F, 0xFB, 0xF5, 0x2F, 0xF2, 0xAF, 0xFF, 0xD5, 
-0xA7, 0xF8, 0xFA, 0x37, 0x5E, 0xE4, 0xB5, 0xD7, 0x77, 0xB9, 0xB1, 0xD3, 0x32, 0x0B, 0x25, 0x8D, 
-0x59, 0x21, 0xE8, 0x35, 0x9C, 0x5E, 0x23, 0xDA, 0x15, 0xA2, 0x1E, 0x26, 0xCB, 0x6D, 0x3C, 0xB4, 
-0x7B, 0x9C, 0xD8, 0x2C, 0x78, 0xE4, 0xEC, 0x06, 0xE3, 0xD2, 0x63, 0x94, 0x03, 0x0D, 0xA1, 0x69, 
-0xB1, 0x66, 0x21, 0xEC, 0x9C, 0x00, 0x7B, 0x94, 0xC2, 0x98, 0x6E, 0x75, 0x92, 0x9A, 0x07, 0xDA, 
-0xAA, 0x64, 0x11, 0x2A, 0x01, 0x70, 0x60, 0x03, 0x79, 0xA9, 0xE9, 0x2D, 0xF5, 0x58, 0x5A, 0x1D, 
-0xA7, 0x5C, 0x6C, 0x35, 0x5E, 0x27, 0xCB, 0xEC, 0x20, 0x31, 0x41, 0x0E, 0x5D, 0xE5, 0xAC, 0x94, 
-0x60, 0x35, 0x18, 0x15, 0xC1, 0xB7, 0x28, 0xD7, 0xA2, 0x9B, 0x9A, 0xCC, 0x3B, 0xCA, 0xE8, 0xE9, 
-0x47, 0xCF, 0x7A, 0x99, 0x73, 0x6C, 0x3C, 0xE4, 0xD8, 0xEA, 0x38, 0x61, 0xBE, 0x83, 0x3E, 0x7D, 
-0x04, 0xD3, 0xD4, 0x18, 0x9A, 0xCE, 0x10, 0xCF, 0x27, 0x5D, 0xD5, 0x85, 0x9A, 0x49, 0x37, 0xAE, 
-0x40, 0x67, 0x4B, 0x22, 0x11, 0x62, 0xF0, 0x49, 0xD8, 0x24, 0x04, 0xBC, 0x4F, 0x22, 0x27, 0x6E, 
-0x9F, 0xCE, 0xE3, 0x51, 0x5E, 0xD2, 0x45, 0x04, 0x74, 0xB3, 0x70, 0x18, 0x6B, 0x20, 0xCC, 0xC9, 
-0xDB, 0x3B, 0xAC, 0xC8, 0x1E, 0x0F, 0x95, 0x39, 0x1F, 0x39, 0xB1, 0xC5, 0x0F, 0x9D, 0x5E, 0xE7, 
-0xD1, 0xD5, 0x92, 0xD5, 0x76, 0x97, 0x71, 0x3B, 0xA5, 0x17, 0xA6, 0x14, 0xB1, 0xC5, 0x76, 0x14, 
-0xB7, 0xE8, 0x3C, 0x6D, 0x5B, 0x23, 0x4A, 0x68, 0xA4, 0x65, 0x26, 0x33, 0x2A, 0xDD, 0xA0, 0x46, 
-0xD0, 0x3F, 0x34, 0x64, 0xF5, 0xC4, 0x2A, 0xAB, 0xC7, 0x97, 0xC9, 0x56, 0x33, 0xA4, 0x84, 0x68, 
-0x5B, 0xBC, 0x72, 0xA8, 0x4C, 0x92, 0x27, 0xA0, 0x8E, 0x34, 0xE4, 0xBC, 0x7C, 0xDD, 0xF3, 0x2F, 
-0xFF, 0xFD, 0xB7, 0xF8, 0xB5, 0xAF, 0xD6, 0x5C, 0x9B, 0x28, 0x5E, 0x7A, 0xBD, 0xA2, 0xD7, 0x5F, 
-0xE1, 0xD4, 0xF1, 0x23, 0x14, 0x3A, 0x62, 0x7C, 0x4B, 0x5E, 0x68, 0x28, 0x0C, 0x7B, 0xCE, 0x31, 
-0xD7, 0x7D, 0xD4, 0xF8, 0x38, 0x7B, 0xED, 0x3A, 0xBF, 0xF9, 0x8D, 0x6D, 0x7E, 0xFE, 0x53, 0x2F, 
-0xF0, 0xD5, 0xF3, 0x13, 0xEE, 0xB4, 0x23, 0x66, 0xB1, 0x4F, 0xA0, 0xC7, 0xA0, 0x1C, 0x50, 0x28, 
-0x87, 0xF7, 0xBB, 0x94, 0x24, 0xAC, 0x5C, 0xB4, 0xA4, 0x2E, 0xA2, 0xCE, 0x09, 0xD1, 0x52, 0xB7, 
-0x86, 0xBD, 0x69, 0xCB, 0xF6, 0xAD, 0x6D, 0x46, 0x4B, 0xCB, 0x8C, 0xD7, 0x57, 0x31, 0x56, 0x21, 
-0x92, 0xCE, 0x75, 0x9A, 0xF3, 0xCF, 0x98, 0x86, 0x1C, 0xDF, 0x3F, 0xCA, 0x95, 0xBD, 0x15, 0xFE, 
-0xD9, 0xA7, 0x9E, 0xE3, 0xDF, 0x7F, 0xE9, 0x0A, 0x57, 0xF6, 0x32, 0x6E, 0xCC, 0x5A, 0x9A, 0x7A, 
-0xCA, 0x03, 0xC7, 0x46, 0x1C, 0x5A, 0xCA, 0x12, 0x4D, 0x8F, 0x80, 0xD6, 0x0A, 0xA5, 0x03, 0x51, 
-0x39, 0x04, 0x8F, 0x56, 0x60, 0xFB, 0x05, 0xA3, 0xF1, 0x12, 0xBD, 0x5E, 0x41, 0x14, 0x47, 0xDD, 
-0x54, 0x38, 0xDF, 0x74, 0x74, 0x44, 0x30, 0xA9, 0x43, 0x8A, 0xB8, 0x96, 0x4C, 0x02, 0x3D, 0x0B, 
-0x7D, 0xA5, 0x28, 0x25, 0x72, 0x68, 0x79, 0xCC, 0x4A, 0xAF, 0x64, 0x60, 0x2C, 0xCA, 0x35, 0x84, 
-0xB6, 0x4D, 0x10, 0x93, 0x51, 0xC4, 0x90, 0x28, 0x5A, 0x45, 0x56, 0xA2, 0x4D, 0x4E, 0x70, 0x81, 
-0x66, 0x56, 0x33, 0xDB, 0x99, 0xB2, 0x7B, 0x7B, 0x9B, 0xEB, 0xAF, 0x5F, 0xC1, 0xD7, 0x0E, 0xDD, 
-0x69, 0x1B, 0xB8, 0xA6, 0x33, 0x50, 0x25, 0x49, 0x82, 0x2A, 0x31, 0x1D, 0xBB, 0x01, 0x0C, 0x69, 
-0x1D, 0xA9, 0x58, 0x41, 0x9C, 0x93, 0xC5, 0x9A, 0xBE, 0x54, 0x8C, 0x98, 0xB0, 0x85, 0xE3, 0x74, 
-0xAE, 0x78, 0x68, 0xDC, 0xE3, 0xDD, 0x5B, 0x2B, 0x3C, 0x7D, 0x62, 0x8B, 0x77, 0x1E, 0x5E, 0xE1, 
-0xC1, 0xD5, 0x3E, 0x4B, 0x6E, 0x4A, 0xDF, 0x4D, 0x31, 0xD5, 0x0E, 0xD6, 0xCD, 0xE8, 0xE1, 0xE9, 
-0x5B, 0x50, 0xD1, 0x27, 0xB8, 0x0D, 0x41, 0x88, 0xC9, 0xE1, 0x58, 0x12, 0xE4, 0x94, 0xE7, 0x16, 
-0x65, 0x04, 0x27, 0x0D, 0x41, 0x79, 0x5A, 0x5A, 0x1A, 0x5A, 0x5A, 0xA9, 0x88, 0xDA, 0xA1, 0x7B, 
-0x91, 0x62, 0xC9, 0xD0, 0x5B, 0x29, 0xD8, 0x3C, 0xB6, 0xC2, 0x68, 0xB3, 0xCF, 0x70, 0xBD, 0x47, 
-0x36, 0xCE, 0x50, 0x7D, 0x81, 0x2C, 0xB1, 0x8D, 0x82, 0x6A, 0x91, 0x2C, 0x09, 0xE8, 0x44, 0xE3, 
-0xD3, 0xB8, 0xB6, 0x51, 0x44, 0x72, 0xEA, 0xD8, 0x63, 0x1A, 0x07, 0xFC, 0xD6, 0x0B, 0x37, 0xF8, 
-0xCD, 0xE7, 0xAE, 0x31, 0x53, 0x23, 0xF6, 0x62, 0x8F, 0xD6, 0xF4, 0x68, 0xC9, 0x30, 0xC5, 0x10, 
-0x6F, 0xFA, 0x30, 0xD8, 0x64, 0xE2, 0x4B, 0x76, 0xE7, 0x8A, 0x3B, 0x53, 0xCD, 0xA5, 0x9B, 0x35, 
-0xAF, 0xDD, 0x6C, 0xB9, 0xBC, 0x13, 0x78, 0x65, 0xBB, 0xE2, 0x7A, 0xAB, 0x99, 0x88, 0xC6, 0x09, 
-0x18, 0x31, 0x68, 0x62, 0xCC, 0x8D, 0xFA, 0xE2, 0x4F, 0xFF, 0xE4, 0x4F, 0xFE, 0xDC, 0xC7, 0xFE, 
-0xC8, 0x7B, 0xA7, 0x6F, 0xCE, 0x63, 0xDF, 0xAF, 0xF8, 0x81, 0x27, 0x5C, 0x80, 0xE5, 0xF1, 0xC9, 
-0xF1, 0x9D, 0x3B, 0xF5, 0x47, 0x8C, 0x2A, 0xCF, 0x14, 0x65, 0x8F, 0xAA, 0xAD, 0xE9, 0xF5, 0x86, 
-0xB8, 0xB6, 0xE5, 0xE6, 0xF5, 0x9B, 0x5C, 0xBB, 0xB9, 0xC7, 0xF6, 0xAD, 0x39, 0xD3, 0x19, 0x34, 
-0xAE, 0x40, 0xA9, 0x25, 0x1A, 0x0C, 0xC1, 0x94, 0x78, 0x29, 0x88, 0x31, 0x09, 0x64, 0xA8, 0xD8, 
-0x92, 0x51, 0x33, 0xD0, 0x33, 0x36, 0xFA, 0x35, 0x8F, 0xDE, 0xB3, 0xCA, 0xFD, 0x27, 0x46, 0xF4, 
-0x4D, 0x05, 0x6E, 0x8E, 0x0E, 0x2D, 0xC1, 0x87, 0xB4, 0x35, 0xEF, 0xDC, 0x04, 0xE8, 0x54, 0x95, 
-0xD2, 0x10, 0x41, 0x27, 0xEB, 0x22, 0x81, 0x28, 0x21, 0x41, 0x0F, 0x2A, 0x19, 0xFF, 0x61, 0x05, 
-0xB2, 0x88, 0xB6, 0xA0, 0x32, 0x45, 0xB9, 0x3A, 0x62, 0x30, 0x2A, 0xC8, 0xFA, 0x16, 0x5B, 0x26, 
-0xFA, 0x59, 0x23, 0x9E, 0x26, 0x38, 0xDA, 0xD0, 0xA2, 0x74, 0x1A, 0x07, 0x95, 0x90, 0xB6, 0xED, 
-0x99, 0x31, 0x18, 0x51, 0xA8, 0x36, 0xA6, 0xE6, 0x59, 0xF0, 0x58, 0x5F, 0x51, 0x04, 0xC7, 0x52, 
-0x0E, 0x47, 0x46, 0x7D, 0x8E, 0x2F, 0x0F, 0x38, 0x3E, 0xEE, 0x71, 0x6A, 0x65, 0xC8, 0x20, 0xB4, 
-0x2C, 0x6B, 0xC8, 0x42, 0x03, 0xD2, 0xE0, 0xF1, 0x78, 0x1C, 0xA9, 0x06, 0x58, 0xD8, 0xA0, 0x77, 
-0x53, 0x68, 0xE9, 0x85, 0xA7, 0xE4, 0xDB, 0xC1, 0x0C, 0x21, 0xC4, 0xA4, 0x35, 0x2A, 0x89, 0xFC, 
-0x63, 0x16, 0xAA, 0x50, 0x68, 0x34, 0x9E, 0x3C, 0xD4, 0x2C, 0xC7, 0x9A, 0x33, 0xB9, 0xF0, 0xF4, 
-0xD6, 0x2A, 0x7F, 0xF0, 0xBE, 0x23, 0x7C, 0xE8, 0xC4, 0x32, 0xA7, 0x75, 0x43, 0x7F, 0xEF, 0x3A, 
-0x4B, 0x31, 0x11, 0xD7, 0xCD, 0x02, 0xCE, 0x90, 0x24, 0x31, 0x68, 0xB4, 0x4D, 0x5A, 0x10, 0xAA, 
-0x62, 0x9E, 0xD5, 0xF8, 0x32, 0x50, 0xAE, 0x17, 0xAC, 0x9C, 0x5C, 0x61, 0xF5, 0xE4, 0x2A, 0xC5, 
-0x56, 0x0F, 0x3D, 0xD2, 0x90, 0x47, 0xBC, 0xD4, 0x34, 0xBE, 0x21, 0x84, 0x06, 0xB5, 0x50, 0xEE, 
-0x37, 0x86, 0xA8, 0x07, 0xBC, 0x74, 0x33, 0xF2, 0xCB, 0x9F, 0x7F, 0x85, 0xAB, 0xD3, 0x82, 0xB9, 
-0x6C, 0x72, 0xAB, 0x15, 0xA6, 0x7B, 0x9E, 0xB5, 0x41, 0xC1, 0xF1, 0x43, 0x1B, 0xF4, 0xBA, 0xF3, 
-0x31, 0x8B, 0x30, 0x95, 0x3E, 0x71, 0x7C, 0x8A, 0x1B, 0xF3, 0x55, 0x7E, 0xF5, 0xCB, 0xB7, 0xF9, 
-0xD9, 0x5F, 0xF8, 0x2A, 0xDF, 0x7C, 0xD9, 0xB1, 0xED, 0xFB, 0xE4, 0xFD, 0x4D, 0x44, 0x0C, 0x5A, 
-0x3C, 0xB1, 0xBD, 0x4D, 0x1E, 0x6E, 0x73, 0x74, 0xA4, 0x38, 0x7D, 0xA8, 0x87, 0x0D, 0x7B, 0xB8, 
-0x66, 0x07, 0x09, 0x2D, 0x99, 0xCE, 0xD0, 0xA6, 0xC4, 0xC7, 0x1E, 0xB3, 0x46, 0xB8, 0x76, 0x7D, 
-0x97, 0x57, 0x5E, 0xBF, 0x0E, 0xB9, 0xE5, 0xC4, 0xD9, 0x53, 0x14, 0x36, 0x63, 0xB2, 0x37, 0x05, 
-0x6D, 0xF1, 0xAA, 0x47, 0xEC, 0xAD, 0x31, 0x91, 0x35, 0xBE, 0xF8, 0xDC, 0x84, 0x5F, 0xFC, 0xEC, 
-0x0B, 0xBC, 0x36, 0xD3, 0xD8, 0xE1, 0x21, 0x66, 0xAA, 0x65, 0x3E, 0xDD, 0xE5, 0x1D, 0xC7, 0x0A, 
-0x4E, 0x1F, 0x5A, 0x4E, 0x8E, 0xB2, 0x3E, 0x60, 0xB4, 0x90, 0x4E, 0x47, 0xB2, 0xCE, 0x61, 0xE1, 
-0x1A, 0xAD, 0x93, 0x28, 0xCE, 0x70, 0x54, 0xD2, 0xEB, 0x5B, 0xBC, 0xAE, 0xA8, 0x9B, 0x59, 0x82, 
-0x76, 0x42, 0x48, 0xAC, 0xBF, 0x05, 0x6B, 0x22, 0xC6, 0x74, 0x63, 0x6E, 0x5B, 0x96, 0xAC, 0xE6, 
-0xE8, 0x78, 0xC0, 0x99, 0xAD, 0x75, 0x96, 0x8A, 0x8C, 0x6A, 0xE7, 0x0E, 0x33, 0xB7, 0x83, 0x0A, 
-0x21, 0xB9, 0x0F, 0x4B, 0x4E, 0x8C, 0x96, 0xE0, 0x12, 0x8D, 0xCA, 0xB5, 0x8E, 0xF9, 0xAC, 0x66, 
-0x77, 0x77, 0x92, 0x64, 0x29, 0x7D, 0x52, 0x10, 0x0B, 0x3E, 0x9D, 0x73, 0xD1, 0x79, 0x97, 0x70, 
-0x33, 0x14, 0xB6, 0x5B, 0x8F, 0x11, 0x4D, 0x83, 0x65, 0x4A, 0xC1, 0x1E, 0x63, 0x26, 0x6C, 0x52, 
-0x71, 0x3C, 0x6B, 0x78, 0x7C, 0x7D, 0xC8, 0xBB, 0x8E, 0x2E, 0xF3, 0xE1, 0x73, 0x47, 0xF8, 0xE0, 
-0xB9, 0x23, 0xBC, 0xEB, 0xC8, 0x0A, 0xA7, 0x06, 0x9A, 0x51, 0x3B, 0x43, 0xEF, 0xDD, 0x64, 0xA0, 
-0x3C, 0xB9, 0x09, 0x14, 0x5A, 0x30, 0x08, 0x21, 0x78, 0x62, 0x48, 0xFE, 0x6C, 0x79, 0xD9, 0xC7, 
-0x0B, 0x48, 0xC7, 0x04, 0x89, 0x06, 0xA2, 0x4A, 0x02, 0xF2, 0x6D, 0x98, 0xD1, 0x84, 0x39, 0x35, 
-0x35, 0xD1, 0x7A, 0x28, 0x02, 0xC5, 0xD8, 0x30, 0x5C, 0x2D, 0x59, 0x3E, 0x34, 0x62, 0xF5, 0xE8, 
-0x12, 0xA3, 0xA3, 0x2B, 0x64, 0xBD, 0x80, 0xE9, 0x81, 0x64, 0x8E, 0xA8, 0x1D, 0x81, 0x26, 0x7D, 
-0x36, 0x11, 0x31, 0x11, 0xEF, 0x1D, 0x31, 0x59, 0x7E, 0xA3, 0x6C, 0x48, 0xEE, 0x2B, 0x5A, 0x13, 
-0x55, 0x81, 0x33, 0x3D, 0xCE, 0xBF, 0x7A, 0x93, 0xE7, 0x5F, 0xB9, 0x49, 0x45, 0x46, 0x34, 0x25, 
-0x62, 0x4A, 0xEA, 0x0E, 0x43, 0x9F, 0xB7, 0x8A, 0xA6, 0x29, 0x69, 0x43, 0x0F, 0xB1, 0xAB, 0x38, 
-0x35, 0xE2, 0x8E, 0xB7, 0xDC, 0xF0, 0x8A, 0xEB, 0xB3, 0xC8, 0x76, 0xAB, 0x99, 0x52, 0x62, 0xF2, 
-0x25, 0x0A, 0xDD, 0x43, 0x89, 0xA6, 0x95, 0xDA, 0x17, 0xBD, 0xFC, 0x37, 0xDE, 0xFF, 0x63, 0x1F, 
-0xF8, 0x77, 0x9F, 0xFD, 0xEC, 0xBF, 0x4C, 0xE2, 0xC7, 0x3F, 0x80, 0xF8, 0xBE, 0x27, 0x5C, 0x11, 
-0xD1, 0x1F, 0xFF, 0xF8, 0xC7, 0xB3, 0x22, 0x2C, 0x1F, 0x5A, 0x5A, 0x3F, 0xF1, 0x58, 0xBF, 0x38, 
-0xF1, 0xEE, 0xD7, 0x5E, 0xBD, 0xF6, 0xD3, 0xD6, 0xF4, 0xDF, 0xAF, 0x74, 0x3E, 0x9A, 0x35, 0x0D, 
-0xD6, 0x16, 0x34, 0x6D, 0x83, 0xCD, 0x0B, 0xA2, 0x36, 0x84, 0x26, 0x22, 0x92, 0x93, 0x17, 0x4B, 
-0xE8, 0x98, 0xD1, 0x0A, 0x18, 0xAB, 0xBB, 0xE9, 0x30, 0x8F, 0xC5, 0x51, 0x98, 0x86, 0x5C, 0xF6, 
-0xC8, 0xD9, 0x66, 0x20, 0xB7, 0x78, 0xE8, 0x78, 0x8F, 0x0F, 0x3C, 0x7E, 0x82, 0x07, 0x8F, 0x8D, 
-0xE8, 0xE9, 0x0A, 0x69, 0xA6, 0x18, 0x03, 0xA6, 0x37, 0xE8, 0x04, 0x3A, 0xD2, 0xA8, 0x6C, 0xA6, 
-0x53, 0x4A, 0x89, 0x0B, 0x7A, 0x8A, 0xEA, 0x26, 0x87, 0x8C, 0xDE, 0xAF, 0x78, 0x45, 0x09, 0x42, 
-0xE8, 0x3C, 0xC7, 0xD2, 0x45, 0xA4, 0x4C, 0x44, 0x3A, 0x76, 0x43, 0x6F, 0xD4, 0x23, 0xEF, 0x17, 
-0x98, 0xC2, 0x60, 0x4B, 0x43, 0xD6, 0xB3, 0x04, 0xE5, 0x89, 0xCA, 0x27, 0x56, 0x44, 0xF4, 0x84, 
-0x10, 0x09, 0xDE, 0x03, 0x8A, 0xCC, 0x1A, 0xAC, 0x8A, 0xE8, 0x18, 0x31, 0xD1, 0x91, 0x4B, 0xA4, 
-0x20, 0x32, 0x20, 0xB0, 0xDE, 0x2B, 0x38, 0xBA, 0x3C, 0xE2, 0xCC, 0xE6, 0x0A, 0x9B, 0xA3, 0x1E, 
-0x43, 0xDD, 0xB9, 0x92, 0x86, 0xB4, 0xA5, 0xB7, 0xC9, 0x7D, 0x29, 0xB9, 0x5D, 0x88, 0x60, 0xE9, 
-0x1C, 0x75, 0x55, 0x42, 0x7A, 0x13, 0x2B, 0x92, 0xA4, 0xFA, 0xC5, 0x42, 0xA3, 0x34, 0xB1, 0x29, 
-0x12, 0xAA, 0x19, 0xE9, 0xD3, 0x70, 0xDC, 0x06, 0xEE, 0x1F, 0x65, 0xBC, 0xE7, 0xD8, 0x2A, 0xEF, 
-0x3B, 0xB9, 0xC1, 0xFD, 0x43, 0x58, 0x6E, 0x76, 0x19, 0xB5, 0xBB, 0xAC, 0x5A, 0x50, 0xAE, 0x46, 
-0xC7, 0x90, 0x86, 0xEF, 0x90, 0x4E, 0x46, 0x0F, 0xDA, 0xE8, 0x98, 0xC5, 0x8A, 0xB6, 0xF4, 0xA8, 
-0x25, 0xCD, 0xF0, 0xF0, 0x90, 0x95, 0xE3, 0xAB, 0xF4, 0x0E, 0x8F, 0x50, 0x23, 0x45, 0x54, 0x35, 
-0x95, 0x9B, 0x10, 0xA5, 0x45, 0x5B, 0xA1, 0xC8, 0x32, 0x0A, 0x6B, 0x31, 0x2A, 0x6D, 0x23, 0xB5, 
-0x40, 0x50, 0x03, 0xAE, 0xCD, 0x32, 0x3E, 0xF3, 0xE5, 0x0B, 0xDC, 0x98, 0x8E, 0xD9, 0x6B, 0x07, 
-0xE4, 0xE5, 0x26, 0x7B, 0xBB, 0x53, 0xDA, 0xD9, 0x36, 0x27, 0x0E, 0x6D, 0xB1, 0xB1, 0xBA, 0x4E, 
-0x13, 0x33, 0x1A, 0x3B, 0x66, 0x6E, 0xD7, 0x79, 0xF9, 0xA6, 0xE2, 0x17, 0xFE, 0xDD, 0x33, 0x7C, 
-0xF2, 0xD7, 0x2E, 0xF1, 0xEA, 0x35, 0x83, 0x37, 0xAB, 0xB4, 0xB1, 0x20, 0xA2, 0x71, 0x7E, 0xC6, 
-0xD0, 0x34, 0x94, 0xF1, 0x16, 0xF7, 0x6C, 0x28, 0x7E, 0xE2, 0xC3, 0x8F, 0xF0, 0xC7, 0x7E, 0xE4, 
-0x9D, 0x6C, 0x2E, 0x09, 0xD2, 0x4C, 0x98, 0x4F, 0x77, 0xA9, 0x5C, 0x83, 0x48, 0x86, 0x32, 0x3D, 
-0xA2, 0x2A, 0x88, 0xAA, 0x64, 0x67, 0x32, 0xE3, 0xEA, 0xCD, 0x5B, 0xCC, 0xE6, 0x0D, 0x45, 0x31, 
-0x62, 0x65, 0xE5, 0x08, 0xBD, 0xFE, 0x06, 0x3B, 0x95, 0x65, 0x22, 0x4B, 0x7C, 0xEB, 0xB5, 0x39, 
-0x9F, 0xFC, 0xDC, 0x25, 0xBE, 0xF9, 0xCA, 0x0C, 0xCF, 0x3A, 0xB5, 0x18, 0x2A, 0xB7, 0xC7, 0xB8, 
-0x68, 0x78, 0xFC, 0x78, 0xC9, 0xA3, 0xE7, 0x8E, 0x92, 0xE7, 0x19, 0x12, 0x1D, 0x56, 0x09, 0x21, 
-0xB4, 0x44, 0xD7, 0x92, 0x19, 0x4D, 0xF4, 0xAE, 0x9B, 0x5C, 0xF4, 0x28, 0x23, 0x90, 0x29, 0xF2, 
-0x9E, 0x26, 0x2F, 0x15, 0x59, 0xBE, 0xB8, 0x41, 0x06, 0xDA, 0x90, 0x68, 0x69, 0xDA, 0xDE, 0xB5, 
-0x64, 0x2A, 0xB5, 0x22, 0x57, 0x11, 0x69, 0x2B, 0xFA, 0xD6, 0x70, 0x68, 0x65, 0x89, 0x8D, 0x95, 
-0x15, 0xC6, 0x36, 0xC7, 0xF8, 0x96, 0xA6, 0x9E, 0x13, 0xD0, 0x18, 0x5D, 0x26, 0xF2, 0x94, 0x56, 
-0x78, 0x11, 0xB2, 0xBC, 0xC0, 0xBB, 0x36, 0x59, 0x8B, 0x2F, 0xC0, 0x40, 0x49, 0x20, 0x54, 0x66, 
-0xB2, 0x84, 0xE5, 0x8A, 0x27, 0x17, 0x21, 0x8F, 0x15, 0x05, 0x33, 0x86, 0xD4, 0x6C, 0xE0, 0x38, 
-0x99, 0xC3, 0x03, 0xE3, 0x1E, 0xEF, 0x3A, 0xBA, 0xCC, 0x7B, 0x4E, 0xAC, 0xF3, 0xD4, 0xF1, 0x4D, 
-0xDE, 0xB1, 0x3E, 0xE4, 0xCC, 0xD0, 0xB0, 0x12, 0x2B, 0xF2, 0xF9, 0x2E, 0x59, 0x3D, 0xA1, 0x94, 
-0x86, 0x61, 0xA6, 0x41, 0x92, 0x8E, 0x45, 0xF0, 0x0E, 0xA4, 0x73, 0x8E, 0x50, 0x8A, 0x10, 0x63, 
-0x82, 0xB1, 0x3A, 0x83, 0x51, 0xD1, 0x01, 0xAF, 0x5A, 0x9A, 0x38, 0xC3, 0x51, 0xA1, 0x73, 0x47, 
-0x3E, 0xCE, 0xC8, 0xC7, 0x19, 0x83, 0xD5, 0x1E, 0xAB, 0x87, 0xC6, 0xAC, 0x1E, 0x5A, 0xA1, 0xB7, 
-0xD1, 0x27, 0x1B, 0x67, 0x50, 0x78, 0xD0, 0x0D, 0xE4, 0x11, 0xB2, 0x80, 0x74, 0x32, 0x9C, 0x62, 
-0x54, 0x92, 0x84, 0xD4, 0x24, 0x8C, 0x59, 0x25, 0x68, 0x42, 0x69, 0xDF, 0x09, 0x74, 0x7A, 0x42, 
-0x54, 0x44, 0x65, 0x10, 0x9D, 0x41, 0x5E, 0x72, 0xFD, 0xF6, 0x6D, 0x6E, 0xDD, 0xD9, 0xC5, 0x87, 
-0x90, 0x3C, 0xD3, 0x62, 0xA4, 0xD4, 0x16, 0xA3, 0x0A, 0x54, 0x3E, 0x42, 0xE9, 0x1E, 0x31, 0x28, 
-0x66, 0xCE, 0xD3, 0xAA, 0x12, 0x65, 0xC7, 0xB8, 0x98, 0x51, 0x2F, 0xAC, 0x93, 0x44, 0x13, 0x83, 
-0x4B, 0xC5, 0x42, 0x99, 0xC7, 0x40, 0xB8, 0xF3, 0xF2, 0x4B, 0x17, 0x6E, 0xBE, 0xF3, 0x9D, 0x1F, 
-0x1C, 0xDF, 0x7B, 0xEF, 0xC3, 0x2B, 0x7F, 0xFA, 0x4F, 0xFF, 0x47, 0xE1, 0x6F, 0xFE, 0xCD, 0xFF, 
-0x9D, 0xFB, 0xB9, 0x9F, 0xFB, 0xB9, 0x37, 0x2A, 0x49, 0xFD, 0x3E, 0xE2, 0xFB, 0x86, 0xE1, 0xFE, 
-0xCC, 0xCF, 0xFC, 0xF7, 0xE5, 0x8B, 0xCF, 0x7C, 0x65, 0xEB, 0x37, 0xBF, 0xF4, 0xD5, 0x87, 0xF7, 
-0x26, 0x93, 0xC7, 0x66, 0x4D, 0xFB, 0xB4, 0xF3, 0xF2, 0x1E, 0x15, 0x6D, 0x29, 0x52, 0xE4, 0xB9, 
-0x59, 0x32, 0x4A, 0x4A, 0xE5, 0x62, 0x32, 0x70, 0x0B, 0xC1, 0x25, 0xCA, 0x93, 0x01, 0xD7, 0xCC, 
-0x28, 0x8A, 0x3E, 0xA0, 0x89, 0x4D, 0x20, 0x30, 0xA7, 0x97, 0x05, 0x6A, 0x77, 0x9B, 0x1C, 0x8F, 
-0xB0, 0xC7, 0xB2, 0x85, 0x52, 0x66, 0xAC, 0x8F, 0x84, 0x87, 0x8E, 0x0D, 0xF8, 0x43, 0xEF, 0x7B, 
-0x80, 0x77, 0x9F, 0x59, 0xE1, 0x70, 0x39, 0x43, 0x66, 0x37, 0xC9, 0x33, 0x00, 0x61, 0xE6, 0x02, 
-0x79, 0xD6, 0x4F, 0x98, 0xE6, 0x5D, 0x9E, 0x77, 0x17, 0x77, 0x8F, 0x5B, 0x7C, 0x03, 0x44, 0x93, 
-0x9E, 0x20, 0x24, 0x5F, 0x26, 0x51, 0x89, 0xBE, 0x92, 0x2E, 0x0F, 0x8B, 0x26, 0xC3, 0x48, 0x8E, 
-0x78, 0x8B, 0xB4, 0x82, 0xB4, 0x30, 0xB9, 0x33, 0xA5, 0xDA, 0x6D, 0x98, 0xEC, 0x54, 0xB8, 0x79, 
-0x24, 0x57, 0x25, 0x85, 0xE9, 0x61, 0x54, 0x8E, 0x8A, 0x26, 0x29, 0x27, 0x75, 0xA3, 0xB5, 0x41, 
-0x12, 0xE9, 0x1D, 0xAD, 0xC1, 0x58, 0xBC, 0x31, 0xB4, 0x36, 0xA7, 0xCD, 0x4A, 0x76, 0x95, 0xE2, 
-0xD2, 0x5E, 0xC5, 0xF9, 0x9B, 0xB7, 0x79, 0xF9, 0xC6, 0x36, 0xAF, 0xDF, 0x99, 0x70, 0xC3, 0x09, 
-0x3B, 0x8C, 0xA9, 0xE8, 0x75, 0x62, 0xE1, 0x96, 0x1A, 0x45, 0x2D, 0xA4, 0xAF, 0xB3, 0x2C, 0xE1, 
-0xCE, 0x46, 0x61, 0x63, 0xC0, 0x84, 0x86, 0x82, 0x86, 0x01, 0x42, 0x1F, 0x58, 0x61, 0xCA, 0x47, 
-0x4F, 0x6E, 0xF2, 0xC4, 0xB1, 0x15, 0xCE, 0x6C, 0x8C, 0xC8, 0xDB, 0x3D, 0xB2, 0xD9, 0x6D, 0x86, 
-0xB4, 0x0C, 0x24, 0x20, 0x4D, 0x85, 0x51, 0x96, 0x20, 0x49, 0xCC, 0x59, 0x4C, 0x32, 0xFE, 0x73, 
-0x78, 0x82, 0x04, 0x5A, 0x5B, 0xB3, 0x7C, 0x6A, 0x85, 0xC1, 0x46, 0xC9, 0xD2, 0xDA, 0x08, 0x7A, 
-0x92, 0xBA, 0xFA, 0xD6, 0x23, 0xCA, 0x13, 0xD4, 0xDD, 0x06, 0xAE, 0x96, 0xE4, 0xB2, 0x9A, 0xC6, 
-0x3E, 0x0D, 0x68, 0x45, 0x65, 0x56, 0x78, 0x71, 0xBA, 0xCA, 0x7F, 0xF5, 0x0F, 0x7E, 0x95, 0x5F, 
-0xFB, 0x56, 0xC0, 0x97, 0x27, 0x98, 0xB4, 0x82, 0x65, 0xCA, 0x9A, 0xBA, 0xCE, 0x07, 0x1F, 0x39, 
-0xCA, 0x0F, 0x3F, 0xF5, 0x30, 0x8F, 0xBF, 0xE3, 0x3E, 0xA6, 0xA1, 0xE2, 0x37, 0xBF, 0xF1, 0x4D, 
-0x7E, 0xF5, 0xAB, 0xCF, 0xF2, 0xCC, 0x8B, 0x3B, 0xCC, 0xAA, 0x0D, 0x50, 0xCB, 0x44, 0x9D, 0x64, 
-0x0C, 0xAD, 0x51, 0xE4, 0x66, 0x46, 0xE1, 0x6E, 0x70, 0xCF, 0x61, 0xC3, 0x9F, 0xF8, 0xD8, 0x23, 
-0xFC, 0xC1, 0x0F, 0x3D, 0x4A, 0x61, 0x3C, 0x98, 0x82, 0x5F, 0xFE, 0xDC, 0xB7, 0xF9, 0x67, 0x9F, 
-0xFC, 0x1A, 0xCF, 0x5E, 0xF1, 0xDC, 0x69, 0x47, 0x34, 0x8C, 0x31, 0x76, 0x09, 0xA5, 0x33, 0x42, 
-0xBB, 0x43, 0x5F, 0x6F, 0x33, 0xD0, 0xBB, 0x3C, 0x72, 0x7C, 0x95, 0x1F, 0xFB, 0xE0, 0x93, 0x9C, 
-0x3B, 0xB9, 0x45, 0xD3, 0xCE, 0x78, 0xFE, 0xB5, 0x57, 0xF9, 0xD5, 0x2F, 0x3D, 0xC7, 0xB7, 0x5E, 
-0x55, 0x4C, 0xFC, 0x32, 0xD8, 0x75, 0x7C, 0x98, 0x13, 0xE5, 0x22, 0xF7, 0xAF, 0x4D, 0xF8, 0xAB, 
-0x7F, 0xE8, 0x34, 0x7F, 0xE0, 0xDD, 0x27, 0xE8, 0x17, 0x9A, 0x66, 0x72, 0x87, 0x42, 0x47, 0xAC, 
-0xF2, 0xE4, 0x06, 0x5C, 0x53, 0x25, 0x5B, 0x1B, 0x51, 0xA8, 0x98, 0xEC, 0xDC, 0x53, 0x53, 0xB3, 
-0x13, 0x09, 0x0A, 0x05, 0xED, 0xF5, 0xC8, 0xEE, 0xCD, 0x86, 0x9D, 0xDB, 0x53, 0x42, 0xAB, 0xB0, 
-0x52, 0xA0, 0xBD, 0x25, 0x13, 0x43, 0x61, 0x2C, 0xDE, 0x45, 0x54, 0x96, 0xE1, 0xB2, 0x92, 0x36, 
-0x2B, 0x68, 0x7B, 0xCB, 0xEC, 0x04, 0xCD, 0xF3, 0x57, 0x6E, 0xF0, 0xB5, 0xD7, 0xB7, 0xF9, 0xFC, 
-0xF5, 0x39, 0xB7, 0xD5, 0x90, 0xB9, 0x44, 0x2A, 0x34, 0xAD, 0xCE, 0x71, 0xB6, 0x73, 0x4C, 0xE8, 
-0x1A, 0xAE, 0xC4, 0x48, 0x26, 0x92, 0x46, 0xD4, 0x49, 0x10, 0x86, 0x56, 0x8A, 0x5C, 0x5A, 0x72, 
-0x76, 0xD8, 0xC2, 0x72, 0x6C, 0x69, 0xC4, 0x89, 0x95, 0x01, 0xA7, 0x57, 0x07, 0x9C, 0x5A, 0xE9, 
-0x73, 0xA8, 0xA7, 0x19, 0x1B, 0xC1, 0xD6, 0x73, 0x4C, 0x70, 0xE8, 0xE0, 0xD0, 0xD1, 0xA5, 0x61, 
-0x8A, 0x85, 0x48, 0xBE, 0x52, 0x49, 0x00, 0x08, 0xD2, 0x54, 0xE5, 0x42, 0x78, 0x7C, 0xDF, 0x25, 
-0xA2, 0xD3, 0x29, 0xD6, 0x1E, 0x87, 0x23, 0xE8, 0x1A, 0xB1, 0x9E, 0x7C, 0x68, 0x19, 0x8C, 0x0B, 
-0xF2, 0x41, 0xC6, 0x60, 0x6D, 0x25, 0xF1, 0x6B, 0x35, 0x0B, 0xC1, 0xDE, 0x44, 0xD1, 0xC4, 0x77, 
-0x8E, 0xC6, 0x49, 0x11, 0x4F, 0x78, 0xA3, 0xC0, 0x7A, 0x87, 0x02, 0x27, 0x96, 0x11, 0x42, 0x34, 
-0x2D, 0xD1, 0x24, 0x1F, 0xB5, 0xA4, 0x33, 0xD2, 0xA3, 0x55, 0x23, 0x5C, 0xB6, 0xCE, 0x37, 0x5E, 
-0xB8, 0xC5, 0x2F, 0x7D, 0xE1, 0x3C, 0x5F, 0x7D, 0x6E, 0x9B, 0x1B, 0x53, 0x4D, 0xED, 0x87, 0x78, 
-0x4A, 0x60, 0x8C, 0xD3, 0x23, 0xEA, 0x98, 0xF8, 0xE9, 0xA2, 0x0C, 0x8D, 0xB1, 0xC4, 0xA8, 0x28, 
-0xE9, 0x03, 0x8A, 0x26, 0x26, 0x9A, 0x65, 0x41, 0xE2, 0xFE, 0x62, 0x44, 0xA2, 0x89, 0xB5, 0x6B, 
-0x77, 0xA6, 0x8A, 0x58, 0x2B, 0x5D, 0xEF, 0x0E, 0x87, 0xC5, 0x57, 0x86, 0xC3, 0xDE, 0x6F, 0x3E, 
-0xFC, 0xF0, 0xD9, 0x4F, 0xBF, 0xF7, 0xBD, 0x4F, 0xEF, 0x3E, 0xF4, 0xD0, 0xE1, 0xD9, 0x4F, 0xFD, 
-0xD4, 0x4F, 0xFD, 0xBE, 0xA6, 0xCF, 0x7E, 0x4F, 0x09, 0x57, 0x44, 0xF4, 0xCF, 0xFF, 0xFC, 0x17, 
-0x8A, 0x7F, 0xF3, 0xCF, 0xFE, 0xC7, 0x8D, 0x97, 0x2E, 0x5C, 0xDA, 0xDA, 0x9D, 0x4C, 0x4F, 0xBD, 
-0x7E, 0xE9, 0xDA, 0x7B, 0xEA, 0xBA, 0x7D, 0x6F, 0x88, 0xE1, 0x54, 0x20, 0x2E, 0x2B, 0x53, 0xE6, 
-0x12, 0x30, 0xFD, 0xE1, 0x2A, 0xF3, 0x69, 0x8D, 0xC2, 0x52, 0x98, 0x01, 0x9D, 0x91, 0x05, 0x41, 
-0x62, 0x92, 0x92, 0x96, 0x36, 0x35, 0x67, 0xFC, 0x1C, 0x70, 0xE4, 0xB6, 0xC4, 0x88, 0xC3, 0x87, 
-0x6D, 0x36, 0x46, 0x9A, 0xB5, 0x01, 0xAC, 0xF6, 0x03, 0xE7, 0x8E, 0x0E, 0x39, 0x34, 0x82, 0xB3, 
-0x47, 0xC7, 0x9C, 0xDD, 0x1A, 0x70, 0x64, 0x10, 0x39, 0x3A, 0x54, 0x64, 0xCD, 0x36, 0xB1, 0xDA, 
-0x25, 0xCF, 0x72, 0x44, 0x69, 0xE6, 0x51, 0x91, 0x65, 0x05, 0xDA, 0xC7, 0x84, 0xA1, 0x2D, 0x5E, 
-0x33, 0x1C, 0x90, 0x3C, 0xEC, 0x4E, 0xE0, 0xFE, 0xE9, 0xED, 0x1E, 0x3F, 0x10, 0x49, 0x2A, 0x1A, 
-0x40, 0x61, 0xC8, 0xD0, 0x2A, 0xEB, 0x2E, 0x26, 0x8D, 0x78, 0x95, 0x78, 0x5B, 0xC1, 0x12, 0x1B, 
-0x98, 0xED, 0xB5, 0x4C, 0xB7, 0x6B, 0xAA, 0x49, 0x4B, 0x70, 0x60, 0x62, 0x46, 0xAE, 0x32, 0x8C, 
-0x18, 0xAC, 0x4A, 0x42, 0xDF, 0x4A, 0x92, 0x67, 0x95, 0x88, 0x10, 0x44, 0x61, 0x7A, 0x25, 0x35, 
-0x9A, 0x4A, 0x29, 0x1A, 0x5B, 0x30, 0xB7, 0x19, 0xDB, 0x6D, 0xCB, 0xE5, 0xDB, 0x3B, 0xBC, 0xB6, 
-0xD3, 0xF0, 0xE2, 0xAD, 0xC0, 0xE5, 0x69, 0xCB, 0x4D, 0x37, 0x63, 0x06, 0x34, 0x94, 0xD4, 0xE4, 
-0xD4, 0xCA, 0xE2, 0x75, 0x37, 0x14, 0x11, 0x1D, 0x3D, 0x02, 0x4B, 0x44, 0x46, 0x34, 0xAC, 0x69, 
-0xCD, 0xB9, 0x23, 0x1B, 0x3C, 0x7A, 0x68, 0xCC, 0xBB, 0x56, 0x0C, 0x6B, 0x32, 0xA5, 0xD0, 0x82, 
-0x15, 0x47, 0xE6, 0x2A, 0x32, 0xF1, 0x98, 0xE8, 0x93, 0x05, 0xB9, 0xD6, 0x04, 0x15, 0xF1, 0x4A, 
-0xA8, 0x62, 0x4D, 0x43, 0x83, 0x2E, 0x35, 0xA3, 0xF5, 0x31, 0xFD, 0xF5, 0x1E, 0xF9, 0x7A, 0x86, 
-0x19, 0x1A, 0xB2, 0x52, 0x21, 0x1D, 0xAE, 0x86, 0x49, 0x18, 0xB6, 0x48, 0x48, 0x55, 0x77, 0xC7, 
-0xFD, 0x54, 0x2A, 0x25, 0x02, 0x21, 0x25, 0xDE, 0xCA, 0x2C, 0x71, 0x2B, 0x6C, 0xF1, 0x3F, 0x7C, 
-0xF2, 0x39, 0xFE, 0xDF, 0xFF, 0xEA, 0x59, 0xF6, 0x38, 0x4A, 0x1C, 0xAC, 0x53, 0xD7, 0x33, 0x06, 
-0xB2, 0xCB, 0x6A, 0xDE, 0xB2, 0x35, 0x2C, 0xD9, 0x5C, 0x5D, 0xA2, 0xC1, 0x71, 0x63, 0x6F, 0xCA, 
-0xE5, 0x9D, 0x29, 0x93, 0x3A, 0x23, 0xB3, 0xC7, 0x09, 0xB1, 0xC0, 0xE8, 0x06, 0xA5, 0x6A, 0xA2, 
-0xBB, 0xC3, 0x72, 0x36, 0xE3, 0xE9, 0x87, 0x37, 0xF8, 0xC3, 0x1F, 0xBA, 0x9F, 0x27, 0xCF, 0x0D, 
-0x18, 0x67, 0x53, 0x4A, 0xED, 0x29, 0xFB, 0x63, 0x6E, 0xCC, 0x33, 0xBE, 0xF4, 0xED, 0x5B, 0xFC, 
-0xE2, 0xAF, 0xBF, 0xCC, 0x57, 0x9E, 0xBB, 0xC3, 0x9D, 0x76, 0xCC, 0x3C, 0x0E, 0x68, 0x24, 0xB9, 
-0x3A, 0xF7, 0xB2, 0x1A, 0xD5, 0xEE, 0x51, 0x4A, 0xC3, 0x5A, 0xAF, 0x64, 0x3C, 0xB0, 0xF4, 0x07, 
-0x19, 0x57, 0x77, 0x6E, 0xB2, 0x5B, 0x29, 0xE6, 0xB2, 0x49, 0xE3, 0x4A, 0xF2, 0x6C, 0x80, 0x95, 
-0x09, 0x85, 0xBE, 0xCC, 0x13, 0xA7, 0x1D, 0x7F, 0xF5, 0x8F, 0x3F, 0xC0, 0x93, 0x67, 0x06, 0xD8, 
-0xE8, 0x91, 0xA6, 0x22, 0x23, 0x40, 0xDB, 0x90, 0x6B, 0x49, 0x42, 0xEC, 0xDD, 0xB0, 0x8A, 0x28, 
-0x3A, 0x06, 0xC0, 0x02, 0x9A, 0x11, 0xB4, 0x64, 0x28, 0x37, 0xC2, 0xEF, 0x06, 0xF6, 0xEE, 0x54, 
-0x4C, 0xEE, 0xD4, 0x54, 0x7B, 0x0E, 0x5F, 0x09, 0x7D, 0x55, 0xD2, 0x33, 0x69, 0x1B, 0xAB, 0x75, 
-0x4E, 0x88, 0x42, 0x2B, 0x96, 0x58, 0xF6, 0x91, 0xA2, 0x64, 0xE2, 0x84, 0x4B, 0xB5, 0xE2, 0xCB, 
-0xB7, 0x1D, 0xDF, 0xBC, 0xBE, 0xCB, 0x2B, 0x37, 0x6F, 0xB1, 0x23, 0x9A, 0xB9, 0x2E, 0x98, 0x44, 
-0x68, 0xB5, 0x45, 0x65, 0x19, 0xD2, 0xB4, 0xE4, 0x46, 0xD1, 0x47, 0xB0, 0xA1, 0x49, 0x03, 0x0A, 
-0x08, 0xCB, 0xB6, 0xC7, 0x5A, 0x61, 0xB8, 0x7F, 0x75, 0xC8, 0xD1, 0x61, 0xC1, 0xD1, 0xD5, 0x11, 
-0x5B, 0x83, 0x82, 0xD5, 0x1C, 0x86, 0xD2, 0x24, 0xBD, 0xE2, 0xB6, 0xA6, 0xD0, 0x0A, 0x23, 0x69, 
-0xE4, 0x18, 0x15, 0x93, 0x30, 0x8D, 0x24, 0xC3, 0xC7, 0xD4, 0x00, 0x4B, 0x09, 0x36, 0xA9, 0xB4, 
-0x09, 0x88, 0x4B, 0xBB, 0x40, 0x09, 0xC4, 0xD8, 0xE2, 0x55, 0xC0, 0xF6, 0x2C, 0xE5, 0x38, 0x23, 
-0x1F, 0x65, 0xE4, 0x03, 0x8B, 0x1D, 0x1A, 0x4C, 0x4F, 0x43, 0x69, 0x93, 0x8A, 0x58, 0xB7, 0x83, 
-0x4C, 0xF3, 0xF8, 0x69, 0x92, 0x2C, 0xAA, 0x03, 0x8E, 0x16, 0xFB, 0x25, 0xD0, 0xDD, 0x82, 0x67, 
-0xF1, 0x95, 0x89, 0xE9, 0x7A, 0xF5, 0x3A, 0x10, 0x6C, 0x47, 0x6B, 0x54, 0x0A, 0xC4, 0x22, 0x14, 
-0x44, 0x3D, 0xA0, 0xB1, 0x63, 0x6E, 0xD5, 0x96, 0x8B, 0xD7, 0x6B, 0x5E, 0xBA, 0x3C, 0xE7, 0xA5, 
-0x8B, 0xBB, 0x5C, 0xB9, 0x3C, 0xE3, 0xCE, 0x44, 0xB8, 0x7A, 0x27, 0x30, 0xF1, 0x42, 0x20, 0x27, 
-0xAA, 0x01, 0x73, 0xD3, 0xA3, 0x55, 0x16, 0x15, 0x0B, 0x7C, 0x48, 0x43, 0x54, 0x81, 0xC0, 0x50, 
-0x59, 0x94, 0x08, 0x3E, 0x0B, 0xD4, 0xAE, 0xA6, 0x97, 0x19, 0x7C, 0xA8, 0x69, 0xE3, 0x9E, 0x68, 
-0xC4, 0x47, 0xFC, 0x14, 0xE2, 0x2B, 0x83, 0xB2, 0xBC, 0x58, 0x94, 0xE6, 0x37, 0x4E, 0x9F, 0x3A, 
-0xFA, 0x6C, 0xD1, 0xEF, 0xDD, 0xFC, 0x33, 0x7F, 0xE6, 0xA7, 0x5E, 0x7F, 0xDF, 0xCA, 0xA3, 0x7B, 
-0x0F, 0xFD, 0x2E, 0x8D, 0x24, 0xDF, 0x76, 0xC2, 0xFD, 0x99, 0x9F, 0x11, 0xDD, 0xEF, 0xFF, 0xA3, 
-0xC1, 0xD5, 0xAB, 0xD7, 0x86, 0x9F, 0xFB, 0xDC, 0xD7, 0xEE, 0xB9, 0x75, 0xE3, 0xCE, 0x47, 0x2E, 
-0xBC, 0xFA, 0xEA, 0xD3, 0x90, 0x9F, 0x03, 0xB5, 0xDE, 0xCB, 0x07, 0x3D, 0xEF, 0xC4, 0x64, 0xDA, 
-0x2A, 0x65, 0x32, 0x66, 0x6D, 0x83, 0xC9, 0x4B, 0x42, 0x3B, 0xA3, 0xEC, 0x2D, 0x27, 0x4A, 0x95, 
-0xA8, 0x4E, 0x11, 0x49, 0x61, 0x6D, 0x81, 0xF7, 0x15, 0xA8, 0x88, 0xCD, 0x22, 0x4A, 0x35, 0x64, 
-0x26, 0x92, 0x67, 0xD0, 0x2F, 0x23, 0xEF, 0x79, 0xE7, 0x03, 0x3C, 0x74, 0x7A, 0x9D, 0xAD, 0x7E, 
-0xCB, 0x56, 0xD9, 0x70, 0x76, 0xCD, 0x30, 0x52, 0x13, 0x56, 0xFB, 0x42, 0xE6, 0x27, 0x18, 0x37, 
-0x21, 0x0B, 0x49, 0xD4, 0xC6, 0x48, 0x44, 0x9B, 0x1C, 0x89, 0x86, 0x2A, 0x68, 0x8C, 0xCE, 0xC9, 
-0x3A, 0x51, 0x14, 0x78, 0x63, 0xA2, 0x7D, 0xE3, 0x78, 0x6C, 0x24, 0xB5, 0x9A, 0xDE, 0x14, 0x2A, 
-0xA6, 0x62, 0x25, 0xFA, 0x54, 0xC5, 0x74, 0xE4, 0xED, 0x24, 0x1E, 0x92, 0x2E, 0x34, 0xAD, 0x2C, 
-0x88, 0x4D, 0x36, 0xDD, 0x8D, 0xA2, 0x99, 0x04, 0x66, 0x7B, 0x0D, 0xB3, 0x49, 0x83, 0x9B, 0x45, 
-0x64, 0x16, 0xD1, 0x3E, 0x25, 0x24, 0xA3, 0x0B, 0x94, 0xCA, 0x20, 0x82, 0x25, 0xC7, 0x18, 0x43, 
-0xDB, 0x7A, 0x94, 0xB1, 0xE8, 0x2C, 0x87, 0x2C, 0xA9, 0xE3, 0x7B, 0xA3, 0x13, 0xCB, 0x81, 0x9C, 
-0x57, 0x77, 0x5B, 0x5E, 0xD9, 0xDE, 0xE3, 0xA5, 0xAB, 0x37, 0xB9, 0x78, 0x67, 0xC2, 0x95, 0x18, 
-0xB9, 0x8D, 0x4A, 0xBC, 0x41, 0x95, 0x91, 0xD9, 0x02, 0x5C, 0xEA, 0x32, 0x2F, 0xD3, 0x70, 0xC6, 
-0x14, 0x3C, 0x72, 0x74, 0x83, 0xC7, 0x4E, 0x1D, 0xE1, 0xBE, 0x8D, 0x3E, 0x1B, 0xFE, 0x0E, 0xB6, 
-0xDE, 0xC3, 0x39, 0x87, 0xF8, 0xA4, 0x88, 0x93, 0xEC, 0x7D, 0x34, 0x56, 0x45, 0xA2, 0xB4, 0x38, 
-0xA9, 0xF1, 0xAA, 0xC2, 0xE7, 0x01, 0x33, 0xD2, 0xF4, 0xD7, 0x7A, 0x2C, 0x6D, 0x8E, 0xC9, 0x56, 
-0xFA, 0x50, 0x24, 0x5C, 0x5B, 0x62, 0x8B, 0x97, 0x1A, 0x3A, 0xDB, 0x6F, 0xA5, 0xBA, 0xF9, 0xE3, 
-0xA8, 0xBA, 0x09, 0xB9, 0xE4, 0x51, 0x95, 0x2C, 0x7B, 0x34, 0x51, 0x2B, 0x9C, 0x2A, 0xA9, 0x8B, 
-0xA3, 0x7C, 0xEE, 0xD9, 0x3D, 0xFE, 0xAF, 0x3F, 0xFB, 0x79, 0x9E, 0xB9, 0xA5, 0xF1, 0xD9, 0x09, 
-0xE6, 0xD1, 0x60, 0x4D, 0x40, 0xB9, 0x26, 0x25, 0x7F, 0x24, 0x79, 0x1A, 0x18, 0x4D, 0x13, 0x22, 
-0x5A, 0xF5, 0xC8, 0xCD, 0x2A, 0x95, 0x9F, 0xD1, 0x53, 0x15, 0x3D, 0xBB, 0xC7, 0xE6, 0xA0, 0xE6, 
-0x3D, 0x0F, 0x6C, 0xF1, 0x87, 0x3E, 0x78, 0x8E, 0x77, 0xDE, 0xB7, 0xC2, 0xC8, 0xEE, 0xA1, 0xDB, 
-0x5B, 0x10, 0x2B, 0x14, 0x16, 0x31, 0x63, 0x1A, 0xBB, 0xC9, 0xD7, 0x5E, 0xAC, 0xF8, 0x85, 0x5F, 
-0xFE, 0x26, 0x9F, 0xFF, 0xF6, 0x2D, 0x6E, 0xD6, 0x25, 0x6D, 0xBE, 0x4A, 0xE8, 0x84, 0xDD, 0xEB, 
-0x66, 0x4E, 0xCF, 0xF4, 0xC8, 0x4C, 0x4E, 0x53, 0xCF, 0xD2, 0x1A, 0xB0, 0x10, 0xC9, 0x50, 0x66, 
-0x05, 0xE5, 0x85, 0x3C, 0xD4, 0x28, 0xB9, 0xCC, 0xC9, 0xE5, 0x29, 0x7F, 0xE2, 0xA3, 0xA7, 0xF9, 
-0xA9, 0xF7, 0x6F, 0x71, 0x64, 0x50, 0x23, 0x4D, 0x45, 0xAE, 0x20, 0x8B, 0x42, 0xAC, 0x6B, 0x32, 
-0x9B, 0x81, 0x0F, 0x9D, 0xB2, 0x4A, 0x5A, 0x3B, 0x5D, 0x9D, 0xD6, 0xED, 0x8C, 0x02, 0x4A, 0x2C, 
-0x46, 0x0D, 0x20, 0x58, 0x68, 0xA0, 0xDA, 0x6D, 0xB8, 0x73, 0x6B, 0xC2, 0x6C, 0xA7, 0x41, 0x66, 
-0x0A, 0xE5, 0x33, 0xFA, 0x7A, 0x84, 0xA5, 0x24, 0x46, 0x85, 0x0B, 0x82, 0x68, 0x83, 0x29, 0x73, 
-0x54, 0x91, 0x51, 0x67, 0x7D, 0x2E, 0x35, 0x96, 0x6F, 0x5C, 0xB9, 0xCD, 0x57, 0x5E, 0xB8, 0xC0, 
-0x0B, 0xB3, 0x1D, 0x6E, 0x91, 0x31, 0x67, 0x80, 0xA3, 0x20, 0xA8, 0x24, 0xCB, 0x68, 0xA9, 0x29, 
-0xA8, 0x18, 0xD1, 0xB2, 0x49, 0xC6, 0x89, 0xD5, 0x25, 0x4E, 0x1F, 0xDE, 0xE4, 0xF8, 0x68, 0xC0, 
-0xC3, 0xAB, 0x63, 0x46, 0xCA, 0x91, 0x6B, 0x92, 0x4E, 0x46, 0x5B, 0xA5, 0x1B, 0xAF, 0x4A, 0x72, 
-0x3F, 0xDE, 0xB5, 0xFB, 0x9C, 0x6F, 0xA2, 0xA0, 0x44, 0x25, 0xA1, 0x9E, 0x85, 0x78, 0x52, 0x96, 
-0xE1, 0x24, 0x10, 0x62, 0x43, 0x88, 0x35, 0x9E, 0x1A, 0x8C, 0xC7, 0x64, 0x82, 0xCA, 0x84, 0xA5, 
-0xF5, 0x25, 0x4C, 0xDF, 0x50, 0x8E, 0x4A, 0x74, 0xDF, 0x42, 0x4E, 0xE7, 0x98, 0x11, 0x93, 0x28, 
-0x51, 0x27, 0x1A, 0x95, 0x9A, 0xD7, 0xC9, 0xF7, 0x6D, 0x91, 0x97, 0xEE, 0xC2, 0x21, 0x8B, 0x6B, 
-0xAF, 0x3B, 0x96, 0x0B, 0xB1, 0x71, 0xD1, 0x9D, 0x7B, 0x71, 0xC4, 0x69, 0x08, 0x76, 0x61, 0x80, 
-0x0A, 0x56, 0x52, 0xC1, 0xD6, 0xB8, 0x80, 0x64, 0x16, 0x9F, 0x17, 0x38, 0x5D, 0xE2, 0xF5, 0x88, 
-0x3A, 0xF4, 0xD9, 0xBE, 0xED, 0xB8, 0x7C, 0xAD, 0xE1, 0x73, 0x5F, 0x78, 0x99, 0x4B, 0xD7, 0x1B, 
-0x6E, 0xDD, 0xA9, 0xD8, 0x75, 0x39, 0x57, 0xBC, 0x66, 0x8F, 0x02, 0x61, 0x48, 0xA4, 0xA4, 0x01, 
-0xCA, 0xBC, 0xA4, 0x6E, 0x27, 0xF4, 0x28, 0x68, 0x49, 0x1C, 0x62, 0x13, 0x43, 0x3A, 0x97, 0x5A, 
-0xF6, 0x8B, 0xAE, 0x10, 0x9D, 0x24, 0xFF, 0xE5, 0xA6, 0x05, 0x35, 0xD7, 0x2A, 0xDE, 0x88, 0xE2, 
-0xBE, 0xB1, 0xB9, 0xB9, 0xF1, 0xE5, 0x8D, 0x8D, 0xF1, 0x57, 0x3E, 0xF0, 0x63, 0x1F, 0x7A, 0xF1, 
-0x81, 0x13, 0x4F, 0xED, 0xFE, 0xA7, 0xFF, 0xE9, 0x1F, 0xF8, 0x1D, 0xB1, 0xDF, 0xEF, 0x9A, 0x70, 
-0x7F, 0xE6, 0x67, 0x44, 0x9F, 0x3D, 0xFB, 0xA9, 0xDE, 0x7F, 0xF7, 0xDF, 0xFD, 0xDD, 0x13, 0x97, 
-0x2F, 0xDF, 0x3E, 0x91, 0xE7, 0xC5, 0x03, 0x97, 0x2F, 0x5F, 0x79, 0x0A, 0xEC, 0xB9, 0x10, 0x38, 
-0xA4, 0xC4, 0x6E, 0x80, 0xCE, 0x7A, 0xBD, 0xBE, 0xDA, 0x9B, 0xEE, 0xA9, 0x42, 0xF7, 0x89, 0x9D, 
-0x3E, 0x40, 0x4B, 0xA0, 0xEC, 0x8D, 0xA9, 0xEA, 0x0A, 0xE8, 0x1C, 0x63, 0x69, 0xC8, 0xF3, 0xBE, 
-0xB4, 0x6D, 0xAB, 0xFA, 0xBD, 0x25, 0xEA, 0xA6, 0x21, 0x46, 0x4F, 0x5E, 0x18, 0xDA, 0xE6, 0x36, 
-0x67, 0xCF, 0x1E, 0xE5, 0x27, 0xFE, 0xC8, 0x47, 0xB8, 0xF7, 0x9E, 0x63, 0x3C, 0xFA, 0xE8, 0x59, 
-0x8E, 0x6C, 0x8D, 0x59, 0x2B, 0x1A, 0x26, 0x17, 0xBE, 0xC1, 0xF6, 0xF3, 0x5F, 0xA2, 0x37, 0x7B, 
-0x9D, 0x91, 0x4C, 0xE9, 0xEB, 0x9A, 0xD8, 0x4C, 0xC8, 0x75, 0x24, 0x86, 0x86, 0x4C, 0x25, 0x07, 
-0x50, 0xBC, 0x26, 0x04, 0x4D, 0xA0, 0xE8, 0x46, 0x63, 0xDF, 0x4E, 0xC2, 0x3D, 0x08, 0x32, 0xBC, 
-0x31, 0xAC, 0x4E, 0xB8, 0x6E, 0x0C, 0x49, 0xA1, 0x48, 0x29, 0x03, 0x3A, 0x4D, 0xCE, 0x00, 0x09, 
-0x2A, 0x08, 0x11, 0xBC, 0x26, 0xD3, 0x3D, 0x30, 0x3D, 0xF0, 0x16, 0x3F, 0x6B, 0x68, 0xA7, 0x81, 
-0x66, 0x67, 0x4E, 0x33, 0xF5, 0x54, 0x73, 0x47, 0x74, 0x8A, 0xE0, 0x0D, 0x04, 0x4D, 0xA1, 0x4B, 
-0x8A, 0xAC, 0x87, 0x89, 0xC9, 0x26, 0x9A, 0x90, 0x6C, 0x54, 0x8C, 0xCD, 0x51, 0x99, 0x45, 0x19, 
-0x83, 0xD7, 0x19, 0xB5, 0xC9, 0xD8, 0x71, 0xC2, 0xAD, 0xC6, 0x71, 0x75, 0xEE, 0xB8, 0x38, 0xA9, 
-0x79, 0x79, 0x7B, 0xC2, 0x6B, 0x3B, 0x33, 0xEE, 0x34, 0x0D, 0x0D, 0x8E, 0x11, 0x86, 0xAD, 0x7E, 
-0xC1, 0x99, 0xE5, 0x3E, 0x8F, 0x1C, 0x5A, 0xE1, 0xFE, 0x8D, 0x11, 0x9B, 0x85, 0xA2, 0xE7, 0x26, 
-0x98, 0xE6, 0x36, 0xA5, 0x8E, 0x10, 0x12, 0x29, 0x9F, 0x98, 0xA5, 0x9B, 0x04, 0x10, 0xA5, 0xC5, 
-0xCB, 0x9C, 0x68, 0x5B, 0xCC, 0x20, 0xD2, 0x5F, 0xCB, 0x19, 0x6E, 0xF4, 0xC9, 0x56, 0xF2, 0x4E, 
-0x0A, 0x2B, 0x12, 0x10, 0x30, 0xA9, 0xB1, 0x18, 0x95, 0x43, 0xAB, 0x90, 0x46, 0x66, 0x49, 0xF6, 
-0xE4, 0x2A, 0x26, 0xCF, 0x35, 0x21, 0x25, 0x5B, 0xB4, 0x21, 0xA8, 0x74, 0x31, 0x39, 0x9D, 0x11, 
-0xF3, 0x15, 0xAE, 0x55, 0x63, 0x7E, 0xF1, 0x0B, 0x37, 0xF8, 0xA7, 0xBF, 0xFC, 0x1C, 0xCF, 0xDD, 
-0x34, 0xF8, 0x72, 0x93, 0xD6, 0x83, 0xB6, 0xFD, 0xA4, 0xF5, 0x10, 0x3C, 0x44, 0x87, 0x22, 0x89, 
-0x95, 0x58, 0x6D, 0xC8, 0xA4, 0x8F, 0xF8, 0x3D, 0x34, 0x57, 0x79, 0xC7, 0xB9, 0x31, 0x1F, 0x79, 
-0xEC, 0x08, 0x1F, 0x7A, 0xEC, 0x28, 0xF7, 0x1F, 0xC9, 0x30, 0xED, 0x35, 0x7C, 0xB3, 0xCD, 0x68, 
-0x68, 0x70, 0xD5, 0x1E, 0xBD, 0x5E, 0x0F, 0x57, 0x09, 0xC1, 0x2E, 0x11, 0x7A, 0x27, 0x39, 0x7F, 
-0x4D, 0xF8, 0xA5, 0xCF, 0xBF, 0xC2, 0x2F, 0x7D, 0xFE, 0x45, 0x2E, 0xDE, 0xF2, 0x34, 0x6A, 0x40, 
-0xB4, 0x19, 0x4D, 0x34, 0x44, 0xD5, 0x43, 0xA9, 0x92, 0xE8, 0x02, 0x18, 0x8D, 0xC9, 0x2D, 0xA1, 
-0x0D, 0x58, 0x6D, 0xD3, 0x54, 0x95, 0xDF, 0x66, 0xD9, 0xDC, 0xE0, 0x87, 0x9E, 0x5C, 0xE5, 0xCF, 
-0xFD, 0x89, 0x77, 0x72, 0x72, 0xB0, 0x43, 0x2F, 0xDC, 0x41, 0xDA, 0x96, 0x9E, 0x31, 0x29, 0x01, 
-0xB4, 0x1E, 0x63, 0xD3, 0x8D, 0xF3, 0xEE, 0xC2, 0x59, 0xB8, 0x2B, 0x0B, 0x89, 0xDE, 0xDF, 0x85, 
-0x03, 0x6B, 0x7B, 0xA0, 0xBA, 0xB5, 0x59, 0x45, 0xAA, 0x5D, 0xC7, 0xE4, 0xE6, 0x9C, 0xF9, 0xB6, 
-0x83, 0x26, 0xC3, 0xC6, 0x92, 0x5C, 0x15, 0x1D, 0x73, 0x22, 0x25, 0xEE, 0xA0, 0x23, 0x41, 0x5B, 
-0x6A, 0x3D, 0xA2, 0xB2, 0x7D, 0xAE, 0x55, 0x8E, 0x67, 0x2E, 0xDF, 0xE4, 0x6B, 0x97, 0x6E, 0xF0, 
-0xDA, 0x6C, 0xCE, 0x34, 0xB9, 0x82, 0x51, 0x60, 0x19, 0x65, 0x86, 0xC3, 0xC3, 0x9C, 0xE3, 0xE3, 
-0x1E, 0x27, 0x97, 0xFA, 0x1C, 0x59, 0x1A, 0xB0, 0x3E, 0xEC, 0xB1, 0x9A, 0x29, 0x96, 0x5C, 0x4D, 
-0x29, 0xC9, 0x7B, 0x2D, 0x7A, 0x87, 0xB8, 0x16, 0x62, 0xE8, 0x04, 0xCE, 0x75, 0x5A, 0xCF, 0x5D, 
-0xF2, 0x53, 0x9D, 0xDB, 0x08, 0x31, 0xA0, 0xBA, 0x21, 0x99, 0xE4, 0x2C, 0x2C, 0x90, 0x05, 0x54, 
-0xE6, 0xB1, 0x7D, 0xE8, 0x0D, 0x33, 0x7A, 0xE3, 0x8C, 0x7C, 0x90, 0xA1, 0xCA, 0x34, 0x05, 0x49, 
-0x9E, 0xB2, 0xB4, 0xA8, 0x6E, 0xC7, 0xDA, 0x55, 0xB1, 0xC6, 0x74, 0x53, 0x65, 0x24, 0x61, 0x7D, 
-0x11, 0xE9, 0x12, 0xEE, 0x81, 0x02, 0x67, 0x5F, 0x03, 0x24, 0x25, 0xD9, 0xC5, 0x63, 0x2A, 0x0D, 
-0x27, 0x82, 0x82, 0xD6, 0xC4, 0x24, 0x38, 0xAE, 0xD2, 0x44, 0x9C, 0x0D, 0x3A, 0x51, 0x25, 0x4D, 
-0x4C, 0xFC, 0x70, 0x1B, 0xA9, 0x42, 0xC0, 0x49, 0x4E, 0x5E, 0x2C, 0x13, 0x5C, 0xC9, 0xAD, 0x9B, 
-0x81, 0x8B, 0xAF, 0xCC, 0xB9, 0x71, 0x53, 0xD8, 0xAB, 0x73, 0xEE, 0xC8, 0x90, 0x2F, 0x5D, 0xDE, 
-0xE3, 0xB9, 0xEB, 0x13, 0x6E, 0xCF, 0xA0, 0x31, 0x05, 0x6D, 0x07, 0xF5, 0x95, 0xDA, 0x22, 0x12, 
-0x44, 0x15, 0x99, 0x4C, 0xAB, 0x89, 0x1E, 0x52, 0xA2, 0x50, 0xD4, 0xB4, 0x38, 0x7C, 0x27, 0x5F, 
-0x29, 0xE4, 0x59, 0x8E, 0xD6, 0x8A, 0xA6, 0x69, 0x08, 0x38, 0x31, 0x2A, 0x2D, 0x2D, 0x1F, 0xDC, 
-0x0D, 0xA5, 0xE3, 0x05, 0x63, 0xD4, 0x73, 0xAB, 0xAB, 0xAB, 0xBF, 0x35, 0x1C, 0x16, 0xAF, 0x66, 
-0x59, 0x79, 0xF1, 0x6F, 0xFC, 0x8D, 0x3F, 0x7B, 0xE5, 0xA7, 0x7E, 0xEA, 0xA7, 0xEA, 0x37, 0x57, 
-0xBF, 0x6F, 0x99, 0x70, 0xFF, 0xDE, 0xDF, 0xFB, 0x7B, 0xD9, 0xFF, 0xE5, 0x13, 0xFF, 0xF0, 0xC9, 
-0x1B, 0x77, 0x66, 0x7F, 0xAC, 0x6D, 0xFC, 0xD3, 0x59, 0xDE, 0x3B, 0x53, 0xD7, 0xD5, 0xB2, 0xB1, 
-0xFD, 0x5C, 0xC4, 0xE8, 0x18, 0x1C, 0x65, 0xB9, 0x4C, 0x5D, 0x4F, 0xC8, 0xEC, 0x10, 0xA3, 0x14, 
-0xB5, 0xAB, 0xC9, 0x74, 0x46, 0x6E, 0x0D, 0xB3, 0xB6, 0xEA, 0x7E, 0xB5, 0xA7, 0xDF, 0xEF, 0x4B, 
-0x5B, 0x4F, 0x83, 0x8F, 0x4D, 0x03, 0xE2, 0x86, 0xFD, 0xF5, 0x7C, 0x3A, 0xAF, 0xFB, 0x83, 0xE1, 
-0x0A, 0xB3, 0xE9, 0x94, 0x3C, 0x37, 0xF8, 0x30, 0xE1, 0xA3, 0x1F, 0x7B, 0x9C, 0xFF, 0xE2, 0xAF, 
-0xFF, 0x79, 0xDE, 0xF9, 0xF8, 0x59, 0x6C, 0xDE, 0xE2, 0xFC, 0x94, 0x91, 0x9A, 0xA1, 0xAE, 0xBD, 
-0xC0, 0xCD, 0x6F, 0xFC, 0x26, 0x5C, 0x79, 0x9E, 0x35, 0xDB, 0x60, 0xDC, 0x14, 0x15, 0x9B, 0xA4, 
-0x31, 0x1A, 0x5D, 0x57, 0x71, 0x29, 0x42, 0x2B, 0x28, 0x2C, 0xD6, 0x0C, 0x3A, 0x7D, 0x81, 0x34, 
-0x2A, 0x0C, 0x07, 0x13, 0xEE, 0x22, 0xE2, 0x1B, 0x4F, 0x3C, 0x07, 0xEF, 0xB6, 0xE9, 0xF9, 0x9A, 
-0x34, 0xF6, 0x2B, 0x31, 0xD5, 0xC1, 0x4A, 0xE9, 0x0E, 0xF7, 0x4D, 0xBF, 0x2B, 0x92, 0xB6, 0xD5, 
-0x2A, 0xB1, 0x2E, 0x41, 0xF2, 0xC4, 0xD1, 0x24, 0x4B, 0x60, 0x94, 0x17, 0xFC, 0xB4, 0x65, 0x36, 
-0xAD, 0x69, 0x26, 0x81, 0x76, 0x16, 0x69, 0xA6, 0x01, 0xD5, 0x28, 0x4C, 0xCC, 0xE9, 0xD9, 0x3E, 
-0x5A, 0x92, 0x1E, 0x29, 0x5A, 0x13, 0xD4, 0xDD, 0x0F, 0x51, 0x9D, 0xC5, 0xB6, 0x40, 0xA3, 0x2C, 
-0xCE, 0xF6, 0x98, 0x4A, 0xC6, 0xAD, 0x99, 0xE7, 0xCA, 0x9D, 0x3D, 0xB6, 0xA7, 0x73, 0xA6, 0xF3, 
-0x9A, 0x5E, 0xA6, 0x39, 0xB4, 0x32, 0xE0, 0xF4, 0xE6, 0x32, 0x5B, 0x03, 0x45, 0xE9, 0x26, 0x64, 
-0xED, 0x94, 0x5C, 0x39, 0xB4, 0x4D, 0x53, 0x6B, 0xE2, 0x13, 0x0C, 0x92, 0xE6, 0xAD, 0xC0, 0x79, 
-0x4F, 0x1D, 0xE7, 0xA8, 0x32, 0xD2, 0x5B, 0x2D, 0x18, 0x6F, 0xF5, 0x29, 0x57, 0xB3, 0x84, 0xD3, 
-0x66, 0x89, 0x60, 0x8E, 0x4A, 0x0D, 0x08, 0xB4, 0xDE, 0xE7, 0x52, 0x12, 0xEF, 0x26, 0x13, 0x25, 
-0x02, 0x62, 0x13, 0xA6, 0xA7, 0x3A, 0x61, 0x18, 0xA3, 0x3A, 0x0B, 0xED, 0x64, 0xA5, 0xDD, 0xA2, 
-0xF0, 0xC5, 0x21, 0x2E, 0xDC, 0x19, 0xF0, 0xB3, 0xFF, 0xE2, 0xB7, 0xF8, 0xD4, 0xD7, 0xAE, 0xB3, 
-0x13, 0x96, 0xD9, 0x69, 0x7B, 0x98, 0x62, 0x15, 0xEF, 0x55, 0xB7, 0x4B, 0xF0, 0x64, 0xB1, 0xA5, 
-0xD0, 0x91, 0x10, 0x66, 0x58, 0x22, 0x9B, 0x85, 0xE1, 0xF4, 0x09, 0xC7, 0x1F, 0xFB, 0xD1, 0x47, 
-0xF8, 0xD8, 0xA3, 0x47, 0x58, 0x37, 0xBB, 0x94, 0x7E, 0x1B, 0x1D, 0x27, 0x34, 0x21, 0x61, 0x80, 
-0xC6, 0xA6, 0xB1, 0xEE, 0x8C, 0x80, 0xD1, 0x3D, 0x5A, 0xBB, 0x86, 0x1A, 0x9F, 0xE4, 0xC5, 0x9B, 
-0x9A, 0x5F, 0xFC, 0xF5, 0xF3, 0xFC, 0xEA, 0xE7, 0x5F, 0xE5, 0xFC, 0xE5, 0x19, 0x33, 0x0C, 0x14, 
-0xCB, 0xCC, 0x43, 0x49, 0x1B, 0x73, 0x94, 0x31, 0xD8, 0xBC, 0x44, 0x82, 0x43, 0x7C, 0x4B, 0x1E, 
-0x5B, 0x74, 0xBC, 0xC1, 0xA6, 0xDE, 0xE5, 0x7D, 0x8F, 0xAC, 0xF0, 0x47, 0x3E, 0x7C, 0x8A, 0x0F, 
-0x3C, 0xB6, 0xC9, 0xC0, 0xDD, 0xC4, 0xB4, 0x13, 0x54, 0xF0, 0x49, 0x46, 0xB3, 0x4D, 0x43, 0x05, 
-0x5A, 0x67, 0x88, 0xEB, 0xD6, 0xC3, 0x9B, 0xD6, 0x90, 0xEC, 0x27, 0xDC, 0xC5, 0x3A, 0xE9, 0xF4, 
-0x02, 0x24, 0x35, 0xC0, 0x08, 0x19, 0x6E, 0xD7, 0xD3, 0xEE, 0x04, 0x76, 0xAE, 0x4D, 0x91, 0xCA, 
-0x20, 0x6D, 0x07, 0x59, 0x59, 0x43, 0x44, 0xE1, 0x24, 0xA6, 0x5D, 0x54, 0xAB, 0xF1, 0x3A, 0xA7, 
-0xB1, 0x7D, 0xB6, 0x83, 0xE6, 0xE5, 0xDB, 0x53, 0x5E, 0xBC, 0x7E, 0x8B, 0xED, 0xB9, 0x03, 0x9B, 
-0xB1, 0x34, 0xE8, 0xB3, 0x35, 0x1E, 0x73, 0x62, 0x7D, 0x89, 0xC3, 0x83, 0x82, 0x01, 0x8E, 0x3C, 
-0x34, 0x14, 0xE2, 0xC9, 0x55, 0x00, 0x5F, 0x61, 0x55, 0x4C, 0x32, 0x05, 0x9D, 0xAC, 0xA3, 0x74, 
-0x82, 0x35, 0xB1, 0xBB, 0xC1, 0xC7, 0xEE, 0x7C, 0x45, 0x69, 0x89, 0x31, 0x10, 0x25, 0x25, 0x65, 
-0x51, 0x29, 0xF1, 0x9B, 0xBE, 0xA1, 0x1C, 0xE7, 0x94, 0xA3, 0x9C, 0x6C, 0xA4, 0xB1, 0x03, 0xD0, 
-0xA5, 0x81, 0x52, 0xE1, 0x7C, 0x7D, 0xA0, 0xD7, 0x01, 0x90, 0xF0, 0x63, 0x83, 0x42, 0x29, 0x21, 
-0x4A, 0x57, 0x29, 0xEE, 0x3F, 0xBE, 0x88, 0x83, 0x09, 0xF7, 0xCD, 0xE9, 0x27, 0xF5, 0x50, 0x92, 
-0xE2, 0x4A, 0x3A, 0x86, 0xAD, 0x49, 0x6C, 0x88, 0x34, 0x86, 0x9C, 0x61, 0x83, 0x45, 0x01, 0x12, 
-0x1A, 0x94, 0x8D, 0xE8, 0x12, 0x5C, 0x68, 0x71, 0x1E, 0x32, 0x3D, 0xC0, 0xD7, 0x86, 0xE9, 0x4D, 
-0xCF, 0xE5, 0xF3, 0x7B, 0xB8, 0x76, 0x84, 0xF4, 0x8F, 0xB2, 0xD7, 0x3F, 0xC4, 0xBF, 0xFE, 0xF6, 
-0x25, 0x7E, 0xFD, 0xA5, 0xAB, 0xBC, 0x56, 0x3B, 0x5A, 0xFA, 0xB4, 0x3A, 0xF5, 0x54, 0x7A, 0x06, 
-0x3F, 0x6B, 0xE6, 0x37, 0x22, 0x4D, 0x85, 0xCD, 0x37, 0x4A, 0x53, 0x0C, 0xA4, 0x15, 0x83, 0xB6, 
-0x69, 0xFD, 0x2B, 0x45, 0xDB, 0xB6, 0x44, 0x84, 0x4C, 0x27, 0x37, 0x16, 0xAD, 0x35, 0xC6, 0x2A, 
-0x9C, 0x4B, 0x70, 0xA8, 0x0F, 0xAD, 0xE4, 0xB9, 0x0A, 0x75, 0x53, 0x55, 0x4A, 0xE9, 0x49, 0xFC, 
-0xFF, 0xB5, 0xF7, 0xE6, 0xF1, 0x96, 0x5D, 0x65, 0x9D, 0xF7, 0xF7, 0x59, 0x6B, 0xED, 0xBD, 0xCF, 
-0x70, 0x87, 0xBA, 0x55, 0xA9, 0xAA, 0xCC, 0x24, 0x21, 0x8C, 0x21, 0x8C, 0x41, 0x50, 0x44, 0xA4, 
-0x45, 0x44, 0x44, 0x79, 0x7D, 0x6D, 0x63, 0x0B, 0x4E, 0xBC, 0xF6, 0x2B, 0xDD, 0x8A, 0xDA, 0xB4, 
-0xB6, 0x43, 0x0F, 0x42, 0xB4, 0xDB, 0x01, 0x07, 0x9C, 0x5E, 0x94, 0x56, 0xC4, 0xA1, 0x41, 0x05, 
-0x14, 0x51, 0x06, 0x41, 0x21, 0x03, 0x10, 0x42, 0x48, 0x42, 0x02, 0x84, 0x8C, 0x95, 0x54, 0x25, 
-0x35, 0x0F, 0xB7, 0xEE, 0xBD, 0x67, 0xDA, 0xC3, 0x1A, 0xDE, 0x3F, 0xD6, 0xDE, 0xE7, 0x9E, 0x7B, 
-0xEB, 0xDE, 0x9A, 0x52, 0x19, 0xB9, 0xBF, 0xFA, 0xEC, 0x3A, 0xF7, 0xEC, 0xB3, 0x87, 0xB5, 0xD7, 
-0x5E, 0xEB, 0xB7, 0x9E, 0xF5, 0xAC, 0x67, 0xF0, 0xE5, 0xBD, 0x53, 0xAD, 0xEC, 0xE3, 0x2F, 0xFC, 
-0xFA, 0x17, 0xFE, 0xED, 0xD5, 0x57, 0xFF, 0xE5, 0x8E, 0xC9, 0x27, 0x5C, 0xFD, 0xC4, 0x84, 0x10, 
-0xE4, 0x29, 0x4F, 0x79, 0xC1, 0x8B, 0x1E, 0xD8, 0xB9, 0xF8, 0xC7, 0xA5, 0x55, 0xCF, 0x50, 0x92, 
-0x26, 0x41, 0xB4, 0x04, 0xAF, 0x48, 0x92, 0x8C, 0x10, 0x34, 0x89, 0xC9, 0x6A, 0x63, 0xEB, 0x38, 
-0x55, 0x48, 0x93, 0x94, 0xAA, 0x1A, 0x61, 0x62, 0x5C, 0xD8, 0x68, 0x77, 0x25, 0xBA, 0xAA, 0xFC, 
-0x68, 0x3F, 0x8C, 0xEE, 0xDB, 0x32, 0xB7, 0xF9, 0xF6, 0x73, 0xCF, 0xDF, 0x7E, 0xC3, 0xF6, 0xED, 
-0xE7, 0xDC, 0x73, 0xE3, 0x8D, 0x5F, 0x7C, 0xD5, 0x52, 0xCF, 0xFE, 0x3C, 0xC1, 0x74, 0x41, 0x89, 
-0xD1, 0x09, 0x41, 0xFA, 0x9C, 0xB5, 0x15, 0xDE, 0xF0, 0x23, 0xDF, 0xC5, 0xCF, 0xFF, 0xC2, 0x8F, 
-0x11, 0xA4, 0x47, 0xD2, 0x0E, 0xA4, 0x76, 0x91, 0xB4, 0x7F, 0x88, 0xEA, 0xAB, 0x37, 0x72, 0xE4, 
-0xCB, 0x37, 0x30, 0x5D, 0xF5, 0x30, 0xE5, 0x90, 0x2C, 0x15, 0xC0, 0xE3, 0x5D, 0x39, 0x5E, 0x9D, 
-0x0C, 0x41, 0x30, 0x3A, 0x83, 0x90, 0x52, 0xD8, 0x2A, 0xDA, 0xDD, 0xD6, 0x5D, 0xC2, 0x4B, 0x0C, 
-0xEB, 0x78, 0x2C, 0x56, 0x8F, 0xB6, 0x13, 0xA8, 0x73, 0xC3, 0x44, 0x52, 0x89, 0xBB, 0x3C, 0x91, 
-0x8C, 0xA3, 0x0E, 0xCA, 0xC7, 0x8A, 0x97, 0xE8, 0xB0, 0xE0, 0x9C, 0x47, 0x79, 0x83, 0xD6, 0x49, 
-0x8C, 0x7A, 0xD3, 0x9C, 0x50, 0x69, 0x7C, 0x01, 0x76, 0x10, 0xC8, 0x97, 0x2C, 0xC5, 0x52, 0x89, 
-0x1D, 0x58, 0xCA, 0x5E, 0x85, 0x21, 0xC5, 0xA8, 0x04, 0xA5, 0x12, 0x6C, 0x88, 0x1D, 0x2E, 0x68, 
-0x1D, 0x1D, 0x0F, 0x8A, 0x11, 0xC1, 0x39, 0x4A, 0x07, 0x95, 0xC4, 0xD4, 0x1F, 0xDE, 0xB4, 0xF0, 
-0xBA, 0x85, 0x57, 0x71, 0xC1, 0x26, 0x04, 0x8B, 0x0A, 0x05, 0x09, 0x25, 0x89, 0x1D, 0xA0, 0xED, 
-0x90, 0x4C, 0x59, 0xB2, 0x44, 0x21, 0x46, 0x53, 0x56, 0x71, 0x85, 0x59, 0x44, 0xF0, 0x95, 0xA5, 
-0xB0, 0x05, 0xD2, 0x12, 0xD2, 0xE9, 0x8C, 0xA9, 0x6D, 0x53, 0xB4, 0x37, 0xB5, 0x30, 0x73, 0x29, 
-0xB4, 0x80, 0x30, 0xC4, 0xF9, 0x11, 0xA2, 0x22, 0xD9, 0x47, 0xBE, 0x35, 0x71, 0x71, 0xA3, 0xEE, 
-0x38, 0xE3, 0x85, 0x44, 0x11, 0x94, 0x8F, 0xCF, 0x18, 0x54, 0x5D, 0x3F, 0x8A, 0x3A, 0xDA, 0x57, 
-0x9C, 0x60, 0x27, 0x9D, 0x16, 0xB9, 0x6F, 0x31, 0x92, 0x6D, 0xDC, 0xB1, 0xD7, 0xF1, 0xC9, 0x5B, 
-0xF6, 0xF3, 0x89, 0x1B, 0x76, 0xB0, 0xE3, 0x80, 0xA3, 0xEF, 0xDA, 0x20, 0x33, 0x20, 0x09, 0x2A, 
-0x54, 0x98, 0x50, 0xD0, 0x62, 0x88, 0x66, 0xC0, 0x05, 0x73, 0x9B, 0x79, 0xE9, 0x8B, 0x2F, 0xE5, 
-0xEB, 0x9E, 0x3B, 0xC7, 0xB3, 0x9F, 0xD4, 0xE6, 0x82, 0x4E, 0x8E, 0x2C, 0xED, 0x23, 0xB5, 0x4B, 
-0xE8, 0x56, 0x82, 0x13, 0xCD, 0xA8, 0x2C, 0xD1, 0x69, 0x42, 0x39, 0xEC, 0x93, 0xFA, 0x92, 0x76, 
-0xB7, 0x4B, 0x65, 0x13, 0x86, 0xBE, 0x43, 0xD1, 0xDA, 0xCA, 0x7C, 0xB9, 0x89, 0x5B, 0xEE, 0x5C, 
-0xE2, 0x13, 0x9F, 0xB9, 0x83, 0x5B, 0xEE, 0xDE, 0xCB, 0xFE, 0xA1, 0xA3, 0x4F, 0x87, 0xC4, 0x6C, 
-0xC6, 0xAB, 0x84, 0xA2, 0x2C, 0x68, 0x1B, 0x85, 0x72, 0x23, 0x66, 0x52, 0xC7, 0xF9, 0x73, 0x9E, 
-0xE7, 0x5F, 0x3A, 0xCD, 0xAB, 0x5E, 0x72, 0x09, 0x57, 0x3C, 0xA5, 0x4D, 0x56, 0x1D, 0x26, 0xA9, 
-0x96, 0x30, 0xA1, 0x42, 0x4B, 0x40, 0x5C, 0x88, 0xC9, 0x2A, 0xEB, 0xD9, 0x8D, 0xB3, 0x01, 0x51, 
-0xC9, 0xB8, 0xFD, 0x84, 0xD0, 0xC4, 0xA9, 0x8D, 0xF6, 0xB7, 0x88, 0xC3, 0x49, 0xA3, 0x62, 0x08, 
-0xB8, 0xA0, 0x50, 0x92, 0x92, 0xA8, 0x14, 0x71, 0x09, 0xE4, 0x82, 0x1B, 0x04, 0x06, 0xF3, 0x43, 
-0xFA, 0x87, 0xE3, 0xA2, 0x2B, 0x56, 0x62, 0x86, 0x32, 0x49, 0x30, 0x18, 0x12, 0x2B, 0x94, 0x85, 
-0x67, 0x10, 0x04, 0x9B, 0x74, 0xB0, 0x59, 0x97, 0x42, 0x25, 0x8C, 0x3C, 0x58, 0xEB, 0xC9, 0x94, 
-0x22, 0x53, 0x81, 0x0E, 0x9E, 0xD4, 0x5B, 0x8C, 0x2D, 0x6A, 0x95, 0x01, 0x68, 0x03, 0x3A, 0x95, 
-0x98, 0x85, 0xA2, 0x8E, 0x4E, 0x27, 0x75, 0x5B, 0x16, 0x89, 0xD1, 0x8F, 0x86, 0x55, 0x4C, 0x13, 
-0x1F, 0x1D, 0x11, 0x2A, 0x54, 0xE2, 0xC9, 0x32, 0x4D, 0xBB, 0x93, 0x92, 0xB4, 0x35, 0x9D, 0xE9, 
-0x2E, 0x2A, 0x93, 0xA8, 0x2E, 0x68, 0x01, 0xDA, 0xE2, 0xA4, 0xA4, 0xA2, 0xC2, 0xE3, 0x30, 0xA9, 
-0xC6, 0x11, 0xA2, 0xBD, 0x6F, 0x73, 0x7D, 0x1F, 0xA5, 0xD9, 0xD8, 0xE6, 0x80, 0xDA, 0xC5, 0x3E, 
-0xC8, 0x72, 0x6C, 0x87, 0x75, 0x51, 0x0B, 0x82, 0x8D, 0x3C, 0xA8, 0x43, 0xA3, 0x52, 0x88, 0xF5, 
-0x28, 0x24, 0x48, 0xD0, 0x68, 0x97, 0xC4, 0x5A, 0x4F, 0x0C, 0xDE, 0x8E, 0xB0, 0x21, 0x47, 0x29, 
-0x15, 0xFB, 0x7E, 0x95, 0xD0, 0xDB, 0xDB, 0x67, 0xFE, 0x81, 0x25, 0x58, 0x54, 0x78, 0xE6, 0xA8, 
-0xDA, 0x17, 0xF0, 0xA0, 0xCC, 0xF2, 0x97, 0x37, 0xEF, 0xE0, 0xFA, 0x7D, 0x8B, 0x1C, 0x22, 0xC5, 
-0xA7, 0x33, 0x0C, 0xCA, 0x1C, 0x11, 0x1F, 0x24, 0x8C, 0x76, 0x9F, 0xBD, 0x6D, 0xEB, 0xCF, 0x3F, 
-0xFD, 0x85, 0xCF, 0xBF, 0x69, 0xE7, 0x9E, 0xFB, 0x2F, 0xDA, 0x73, 0xCF, 0xFD, 0xAF, 0xC0, 0xCB, 
-0xD7, 0x8D, 0x46, 0xC3, 0x4B, 0x95, 0xB4, 0xB7, 0x08, 0x3A, 0x35, 0x26, 0xD3, 0xCE, 0xF9, 0x3A, 
-0xFD, 0x55, 0x5C, 0x38, 0x54, 0x4A, 0x45, 0xA1, 0x04, 0x1F, 0x1D, 0x54, 0x5C, 0x81, 0x77, 0x25, 
-0x10, 0x42, 0xCC, 0x70, 0x54, 0x0D, 0x3C, 0xF9, 0xBF, 0xBC, 0xF2, 0xDB, 0xBE, 0xE9, 0x27, 0x3E, 
-0xFE, 0xF1, 0xF7, 0xEC, 0x6B, 0x1E, 0xF3, 0x18, 0xB3, 0xB0, 0x17, 0xBD, 0xE8, 0x45, 0xD9, 0xBB, 
-0xDE, 0xF5, 0xDE, 0x1F, 0x28, 0x0A, 0xF5, 0xDD, 0x59, 0x3A, 0xD5, 0x12, 0x51, 0x62, 0x92, 0x14, 
-0xAD, 0x13, 0xAA, 0xB2, 0xA4, 0xD5, 0x9E, 0x62, 0x94, 0xE7, 0x04, 0x02, 0xED, 0x4E, 0x9B, 0xAA, 
-0xCA, 0x71, 0x7E, 0x18, 0x44, 0x05, 0xEB, 0x42, 0xDE, 0xF3, 0xA1, 0xFF, 0x00, 0xF0, 0xB9, 0x96, 
-0x09, 0x7F, 0xBF, 0x79, 0x73, 0xF7, 0x4F, 0xAF, 0xFC, 0xBF, 0x5E, 0xFD, 0xEE, 0x1F, 0xFE, 0xF7, 
-0xAF, 0xFF, 0xD0, 0x9F, 0xFE, 0xE9, 0x5B, 0x6F, 0xFD, 0xE1, 0x1F, 0xFE, 0xAE, 0xBD, 0x2F, 0x7B, 
-0xD9, 0xB7, 0x2D, 0xEE, 0xD8, 0xF1, 0xC0, 0xB7, 0x6B, 0xD5, 0x9D, 0xD3, 0x3A, 0x13, 0x8F, 0x27, 
-0x49, 0x14, 0xA3, 0xD1, 0x51, 0xF2, 0xFC, 0x08, 0xDF, 0xF0, 0x92, 0xE7, 0xB3, 0x65, 0x6B, 0x17, 
-0x51, 0x0E, 0xB1, 0x43, 0x12, 0x6D, 0xD1, 0xC6, 0x53, 0xCE, 0x1F, 0xA2, 0x1C, 0x0C, 0x62, 0x0E, 
-0x26, 0x17, 0x62, 0x96, 0x50, 0x1B, 0xD5, 0x46, 0x0A, 0x41, 0xE9, 0x18, 0xB1, 0xB8, 0x00, 0xAA, 
-0xE0, 0x30, 0xBA, 0x89, 0xDA, 0x5C, 0xF7, 0x0B, 0x59, 0xB9, 0x05, 0xA2, 0x5E, 0x28, 0x36, 0x83, 
-0xE6, 0x87, 0x65, 0xF8, 0x40, 0xAD, 0x9B, 0x34, 0x78, 0x51, 0x84, 0xA0, 0x63, 0x75, 0x05, 0x03, 
-0xE8, 0x98, 0x13, 0x2C, 0xD4, 0xA9, 0xBA, 0x01, 0x51, 0x26, 0xA6, 0x38, 0x17, 0x70, 0xC1, 0x51, 
-0xB8, 0x1C, 0xEA, 0xD0, 0x7F, 0x2A, 0x15, 0x74, 0x3B, 0x25, 0x9B, 0x4E, 0x69, 0x75, 0x53, 0xD2, 
-0x8E, 0x89, 0x81, 0xD7, 0x55, 0x45, 0x5E, 0xF5, 0xB1, 0xC1, 0xA2, 0x74, 0x4C, 0x0F, 0xE5, 0x6D, 
-0x34, 0x2C, 0x77, 0x85, 0x43, 0x05, 0x43, 0xA2, 0x52, 0x92, 0x00, 0xC6, 0x3A, 0x12, 0x5B, 0xD1, 
-0x09, 0x96, 0x36, 0x15, 0x59, 0x95, 0xD3, 0x95, 0x18, 0x4C, 0x47, 0x17, 0x39, 0xC6, 0x5B, 0xDA, 
-0x26, 0x21, 0x55, 0x1A, 0x5B, 0x78, 0x7C, 0xA5, 0x63, 0x5E, 0x2C, 0xF1, 0x78, 0x29, 0x28, 0x54, 
-0x9F, 0xD0, 0x2D, 0x98, 0x3A, 0xBB, 0xC5, 0xA6, 0x0B, 0x66, 0xE9, 0x9C, 0x3D, 0x85, 0x4C, 0x2B, 
-0x42, 0xEA, 0x71, 0xB5, 0x75, 0x82, 0xE8, 0xBA, 0x3E, 0x7C, 0xEC, 0x25, 0x3E, 0x84, 0x7A, 0x61, 
-0x93, 0x3A, 0xAE, 0xAA, 0xAE, 0xA7, 0xA2, 0xAA, 0x5E, 0xBC, 0x88, 0xE1, 0x03, 0x63, 0x1F, 0xA9, 
-0x57, 0xB3, 0x25, 0xE6, 0x51, 0x0B, 0x39, 0xB8, 0xDC, 0xD1, 0x52, 0xC2, 0xF9, 0xDB, 0x37, 0x73, 
-0xC1, 0xB6, 0x59, 0xC2, 0x68, 0x01, 0x55, 0x0D, 0x09, 0xA3, 0x1E, 0x6D, 0xA9, 0x50, 0x6E, 0x81, 
-0x36, 0x8B, 0xB4, 0x39, 0xC2, 0xF6, 0xF6, 0x80, 0xE7, 0x5C, 0x92, 0xF1, 0x8A, 0x97, 0x6C, 0xE7, 
-0x3B, 0x5E, 0x76, 0x01, 0x2F, 0xBC, 0xB4, 0x45, 0xA7, 0xDC, 0x4B, 0x58, 0xDA, 0x4B, 0x16, 0x46, 
-0x18, 0x2C, 0xA1, 0xC8, 0xF1, 0x95, 0xC7, 0xE8, 0x04, 0x9B, 0x57, 0x4C, 0xCF, 0xCE, 0xA2, 0x50, 
-0x54, 0x45, 0x8E, 0x92, 0x98, 0xBE, 0xA9, 0x2D, 0x39, 0xB3, 0x2D, 0xC7, 0xD9, 0x5B, 0x52, 0xB6, 
-0xCE, 0x69, 0x36, 0x75, 0x15, 0xAA, 0x1C, 0x12, 0x46, 0x7D, 0x32, 0x0A, 0x3A, 0x7E, 0x89, 0x6E, 
-0x58, 0xA0, 0xE3, 0x8F, 0x70, 0x76, 0xBB, 0xC7, 0xE5, 0x17, 0x66, 0x7C, 0xEB, 0x0B, 0xCF, 0xE7, 
-0x95, 0x2F, 0x7A, 0x12, 0xCF, 0xBE, 0xB0, 0xCB, 0xA6, 0xD0, 0xA3, 0x3A, 0x7A, 0x90, 0x2C, 0x08, 
-0xE2, 0x40, 0x7B, 0x35, 0x0E, 0x28, 0x04, 0x01, 0xDB, 0x98, 0xD0, 0x49, 0xED, 0xB6, 0x4A, 0x6C, 
-0x67, 0x26, 0x84, 0x48, 0x16, 0xCD, 0x64, 0xAA, 0x71, 0x29, 0x17, 0x13, 0x3D, 0x99, 0x44, 0x47, 
-0x53, 0x2A, 0x15, 0x70, 0xDA, 0x92, 0xCC, 0x26, 0x98, 0x56, 0x40, 0x67, 0x12, 0x4D, 0x10, 0x5D, 
-0x8C, 0x79, 0x60, 0x0A, 0x41, 0x2A, 0xE8, 0x2F, 0x0D, 0xC8, 0x5A, 0x29, 0xED, 0xAC, 0x85, 0x04, 
-0x8B, 0xB2, 0x25, 0x6D, 0xA9, 0x98, 0xD3, 0x81, 0x39, 0x0A, 0x36, 0x87, 0x82, 0xA9, 0x6A, 0x40, 
-0x56, 0xF4, 0x48, 0x6C, 0x4E, 0x86, 0x8D, 0xA9, 0x91, 0x82, 0xC7, 0x7A, 0x8F, 0x0D, 0x42, 0xE5, 
-0x41, 0x49, 0x1D, 0x8E, 0x53, 0xE2, 0x9A, 0x44, 0xE5, 0xCA, 0xE8, 0xF1, 0xA5, 0x4B, 0x24, 0xB5, 
-0x84, 0xB6, 0xC3, 0xCC, 0x08, 0xE9, 0x26, 0x43, 0x77, 0x6B, 0xCA, 0xD4, 0xD9, 0x2D, 0x3A, 0x5B, 
-0x33, 0xD4, 0x26, 0x8D, 0x4C, 0x85, 0xE8, 0x56, 0x6B, 0x2A, 0x50, 0x55, 0x0C, 0xD6, 0x0E, 0xD1, 
-0x42, 0xA3, 0x0A, 0x48, 0x15, 0x10, 0x17, 0xDB, 0x40, 0x52, 0x07, 0xCE, 0x59, 0x4E, 0xA5, 0xAE, 
-0x09, 0x41, 0xEA, 0x58, 0xC7, 0xF1, 0x33, 0xF6, 0xD4, 0x89, 0x7F, 0x75, 0xBA, 0x20, 0x21, 0x2E, 
-0xDC, 0x41, 0x5C, 0x5C, 0x8B, 0x91, 0xC4, 0xB2, 0x98, 0xF0, 0x49, 0x02, 0x88, 0x8D, 0xF9, 0xCC, 
-0xEA, 0x24, 0xAF, 0x41, 0x1C, 0xD6, 0x8E, 0xF0, 0x2A, 0x20, 0xC6, 0x90, 0x24, 0x6D, 0x70, 0x1D, 
-0x46, 0x87, 0x1C, 0x0B, 0xBB, 0x47, 0x94, 0x47, 0x3D, 0x1D, 0xDF, 0xC2, 0xE8, 0x19, 0x86, 0x74, 
-0xD8, 0xB1, 0x54, 0xF1, 0xC9, 0x1D, 0xBB, 0x79, 0xD0, 0x45, 0xFB, 0xDB, 0x91, 0x57, 0x98, 0x2C, 
-0x45, 0xE3, 0x7C, 0x16, 0xDC, 0xE7, 0x2F, 0x7F, 0xF6, 0xD3, 0xFF, 0xE8, 0x53, 0x9F, 0xFA, 0xD3, 
-0xFB, 0x8E, 0xEC, 0xBB, 0xEB, 0xFE, 0xEA, 0x2C, 0xF3, 0xD9, 0x03, 0xF7, 0xEE, 0xFE, 0x34, 0xF8, 
-0x1B, 0x45, 0x71, 0x5F, 0x5E, 0x2C, 0x8A, 0x08, 0x2D, 0x04, 0xE3, 0x9C, 0xD7, 0x0E, 0xC4, 0x4D, 
-0xC4, 0xAF, 0xAE, 0x6A, 0x6B, 0x2B, 0x44, 0x48, 0x5B, 0x19, 0xA2, 0x94, 0x68, 0xA3, 0x25, 0x58, 
-0x9F, 0xCC, 0x76, 0x66, 0xCE, 0x7E, 0x70, 0xD7, 0x83, 0x37, 0xFF, 0xD5, 0x7B, 0xDF, 0x71, 0xCF, 
-0xFB, 0xDF, 0xFF, 0xFE, 0xC0, 0x31, 0x2C, 0x03, 0x7C, 0xF4, 0xA3, 0x1F, 0xCD, 0x5E, 0xF7, 0xBA, 
-0x37, 0xFD, 0x42, 0x6F, 0x49, 0xFD, 0x9C, 0xA2, 0xDB, 0x49, 0x5B, 0x19, 0x83, 0xE1, 0x90, 0x24, 
-0xED, 0xC4, 0xD1, 0xDA, 0x7A, 0x44, 0x24, 0xF8, 0x60, 0x2D, 0xC1, 0xE5, 0x5A, 0xEB, 0xBD, 0x69, 
-0x5B, 0x7D, 0xDE, 0x48, 0xB8, 0xED, 0xBC, 0xF3, 0xB6, 0x5F, 0xFF, 0xA2, 0x17, 0xBD, 0x68, 0xE7, 
-0x45, 0x17, 0x5D, 0xB4, 0x70, 0xD5, 0x55, 0x6F, 0xC8, 0x57, 0x5F, 0x1B, 0xE0, 0xE3, 0x1F, 0xBF, 
-0xB5, 0xFB, 0xDA, 0xD7, 0xFE, 0xC0, 0x6F, 0xE4, 0xB9, 0xFE, 0x51, 0x25, 0x53, 0x2D, 0xA5, 0x0C, 
-0x81, 0x1C, 0x98, 0x27, 0xC9, 0x96, 0xF8, 0x9D, 0xB7, 0xFF, 0x37, 0x5E, 0xF7, 0xFA, 0xEF, 0x20, 
-0x6B, 0x5B, 0xFC, 0xE8, 0x10, 0x1D, 0xDB, 0x83, 0x90, 0xB3, 0x74, 0xE3, 0x35, 0x2C, 0xED, 0xB8, 
-0x83, 0x19, 0x5B, 0x12, 0xFA, 0x0B, 0xCC, 0x18, 0x8D, 0xF8, 0xA8, 0x03, 0x04, 0x40, 0x05, 0x2A, 
-0xE7, 0xA8, 0xB4, 0xC6, 0xA4, 0x09, 0x38, 0x1B, 0xD5, 0x02, 0x71, 0x78, 0x1D, 0xDF, 0xBF, 0xF9, 
-0xB3, 0x99, 0xE9, 0x44, 0xC9, 0xB7, 0x96, 0x6E, 0x57, 0x4B, 0xB9, 0x34, 0xD3, 0x99, 0xC6, 0x1C, 
-0x26, 0x4E, 0xF7, 0xEB, 0x5F, 0xEA, 0x46, 0xB2, 0xAC, 0xAE, 0x68, 0x8E, 0x01, 0x8F, 0xD7, 0x01, 
-0xAD, 0x63, 0xA0, 0x1A, 0x5B, 0x81, 0x91, 0x84, 0xD4, 0x64, 0x71, 0x91, 0x2D, 0x8F, 0x59, 0x6C, 
-0x19, 0x59, 0x8A, 0x9E, 0x65, 0xD8, 0xCF, 0x19, 0xF6, 0x6A, 0x7D, 0xAF, 0x13, 0x4C, 0x48, 0x48, 
-0x7C, 0x0B, 0xB1, 0x71, 0x14, 0x35, 0xA2, 0x48, 0xB4, 0xC1, 0x98, 0x24, 0xBE, 0x03, 0x17, 0xBD, 
-0xAB, 0xAC, 0x8D, 0xE6, 0x59, 0xDA, 0x08, 0xC1, 0x57, 0x54, 0x55, 0x81, 0x92, 0x40, 0x9A, 0xA6, 
-0x71, 0x10, 0x30, 0x01, 0xA7, 0x47, 0x58, 0x35, 0x44, 0xCF, 0xC0, 0xCC, 0xF6, 0x0E, 0x9D, 0xB3, 
-0x66, 0xA0, 0xA3, 0xB1, 0xE2, 0xC1, 0x44, 0xFD, 0xB1, 0xF7, 0xB5, 0xCD, 0xB0, 0x80, 0x96, 0x26, 
-0x7B, 0x30, 0x78, 0x42, 0xAD, 0xBF, 0x96, 0xB8, 0x28, 0x46, 0x8C, 0x99, 0x1A, 0xBC, 0x44, 0x17, 
-0x69, 0xA2, 0x54, 0x07, 0x31, 0x2E, 0xAE, 0xA8, 0xD0, 0x54, 0x28, 0xBE, 0x52, 0x98, 0xAC, 0x8B, 
-0x13, 0x61, 0x7E, 0x58, 0xD0, 0xDA, 0x74, 0x2E, 0x7D, 0xD7, 0x65, 0xC7, 0x81, 0x82, 0xBB, 0x76, 
-0x2E, 0x70, 0xFF, 0xDE, 0x25, 0xFA, 0x83, 0x9C, 0x56, 0x96, 0x30, 0xDD, 0xD6, 0x3C, 0xE9, 0xDC, 
-0x36, 0x4F, 0xBF, 0x74, 0x1B, 0x9B, 0x67, 0x3D, 0x5D, 0x3D, 0x24, 0x29, 0x16, 0xC8, 0x7C, 0x4E, 
-0x5B, 0x62, 0x52, 0x77, 0xCA, 0x28, 0xAD, 0x23, 0xAD, 0xA8, 0xD3, 0x03, 0x6C, 0x88, 0x65, 0x36, 
-0x09, 0xD8, 0x32, 0xAE, 0x57, 0x24, 0x69, 0xCA, 0xA0, 0xF0, 0xA8, 0xEE, 0x16, 0xFA, 0xBE, 0x4B, 
-0xAF, 0x9C, 0xE2, 0xC1, 0x23, 0x15, 0xBB, 0xF6, 0x0D, 0x78, 0x70, 0xDF, 0x02, 0x4B, 0xFD, 0x01, 
-0x53, 0x9D, 0x36, 0xDD, 0x96, 0xE6, 0x82, 0xB3, 0x37, 0x71, 0xDE, 0xF6, 0x29, 0xCE, 0xDD, 0x9C, 
-0x31, 0x9B, 0x95, 0xA8, 0xD1, 0x3C, 0x99, 0xEB, 0xD3, 0x52, 0x31, 0xA4, 0x61, 0x8C, 0xEE, 0xE2, 
-0xF1, 0xC1, 0xC6, 0x31, 0x26, 0x38, 0x2A, 0xEF, 0xD0, 0xC6, 0xD4, 0xE1, 0x0F, 0x05, 0x82, 0x8A, 
-0x01, 0xD1, 0xA2, 0x06, 0x2A, 0x36, 0x07, 0x89, 0x2B, 0xF3, 0xB6, 0x09, 0xBD, 0x29, 0x91, 0x70, 
-0x3D, 0x12, 0xD5, 0x45, 0x01, 0x9C, 0x73, 0xB4, 0x74, 0x86, 0xF8, 0x14, 0x7A, 0x9E, 0xC1, 0xC1, 
-0x92, 0xE1, 0xE1, 0x11, 0xC5, 0xA2, 0x27, 0xE4, 0xD0, 0x49, 0xBB, 0x94, 0xA5, 0xA5, 0xB4, 0x3E, 
-0x26, 0xF4, 0x54, 0x51, 0x85, 0xA3, 0x91, 0x68, 0x5B, 0x5E, 0x46, 0xBD, 0xB7, 0x22, 0xB6, 0x4D, 
-0xEB, 0x1D, 0x4E, 0x88, 0xA9, 0xE4, 0xB5, 0xA2, 0x94, 0xA8, 0x53, 0xD6, 0x0A, 0xB4, 0x84, 0xE8, 
-0x22, 0x1B, 0x2C, 0x41, 0x3B, 0x54, 0x0A, 0x21, 0x13, 0xB2, 0x6E, 0x42, 0x6B, 0x53, 0x8B, 0x6C, 
-0xA6, 0x85, 0xCE, 0x02, 0x18, 0x07, 0x3A, 0x86, 0x99, 0x09, 0x4A, 0x70, 0xC1, 0x8E, 0x55, 0x02, 
-0x42, 0x6C, 0x07, 0x4D, 0x16, 0x5D, 0x11, 0x53, 0x07, 0x7D, 0x8F, 0x5D, 0x4C, 0x49, 0xFD, 0xEE, 
-0x9B, 0x80, 0x51, 0xCA, 0x8C, 0x13, 0x54, 0x06, 0x5C, 0xB4, 0xE4, 0x50, 0xA1, 0x1E, 0xB0, 0xEB, 
-0x3E, 0x53, 0x93, 0x6C, 0x9C, 0x41, 0x4E, 0xF6, 0x25, 0x03, 0x3E, 0x8B, 0x8B, 0x77, 0x94, 0xD1, 
-0x9C, 0xAC, 0x56, 0xB3, 0x35, 0x8B, 0xD6, 0x82, 0x26, 0x88, 0xC2, 0x7A, 0x41, 0x87, 0x14, 0x29, 
-0x5A, 0x2C, 0xED, 0xCB, 0xE9, 0x3F, 0x38, 0x44, 0x8F, 0x34, 0x99, 0xD7, 0xD8, 0x6C, 0x96, 0x7B, 
-0x8B, 0x2E, 0xD7, 0xEE, 0x1F, 0xF1, 0xA7, 0x5F, 0xBD, 0x87, 0xFD, 0x6C, 0xC6, 0x66, 0x73, 0x94, 
-0xD6, 0x61, 0x42, 0x89, 0xF7, 0x8B, 0x87, 0x2E, 0x98, 0x99, 0x7E, 0xEB, 0x1F, 0xFD, 0xCD, 0xDF, 
-0xBC, 0xEB, 0xD5, 0xAF, 0x7E, 0xEA, 0x31, 0x0B, 0x5E, 0x6F, 0x79, 0x4B, 0x50, 0xF3, 0xF3, 0x6F, 
-0x9D, 0xDA, 0xB9, 0xF3, 0xD0, 0xB6, 0xBB, 0xEF, 0xBE, 0xF7, 0x39, 0xBB, 0x1F, 0xD8, 0xFF, 0x75, 
-0xD6, 0x86, 0xCB, 0x44, 0x25, 0xCF, 0x2D, 0x0B, 0xB7, 0x49, 0x29, 0x69, 0x05, 0xA5, 0x94, 0xB3, 
-0x56, 0xA8, 0xF3, 0xC2, 0x29, 0x05, 0x12, 0x1C, 0xDA, 0x43, 0xEE, 0x17, 0x7B, 0x9B, 0x3A, 0xDD, 
-0x9F, 0xFC, 0xE0, 0x47, 0xFE, 0xBF, 0xF7, 0xBC, 0xFC, 0xE5, 0x2F, 0xB7, 0xAC, 0x45, 0xB8, 0xEF, 
-0x7B, 0xDF, 0xFB, 0xF4, 0x4F, 0xFC, 0x87, 0x5F, 0x7A, 0xED, 0xD2, 0xA2, 0x7E, 0xBB, 0x75, 0xFA, 
-0x3C, 0x8D, 0x51, 0x5A, 0x0B, 0x85, 0x1B, 0x3A, 0x21, 0x14, 0x0A, 0x59, 0xB2, 0x94, 0x07, 0xB5, 
-0xF0, 0xC5, 0xB3, 0xCE, 0x9A, 0xFB, 0xC2, 0xE6, 0xB9, 0xE9, 0x3B, 0x5F, 0xFB, 0x3D, 0xAF, 0xF8, 
-0xF2, 0x4B, 0x5F, 0xFA, 0xBC, 0xA5, 0x57, 0xBF, 0xFA, 0xC4, 0xAB, 0x74, 0x21, 0x04, 0x75, 0xD1, 
-0x45, 0x2F, 0x79, 0xD9, 0xDE, 0xDD, 0x0B, 0x7F, 0xEA, 0x5D, 0xEB, 0x62, 0x63, 0xBA, 0x62, 0x83, 
-0x45, 0xC9, 0x88, 0x8A, 0xA3, 0x5C, 0x79, 0xE5, 0x2B, 0xF8, 0xA5, 0xB7, 0xFE, 0x24, 0x4F, 0x79, 
-0xD2, 0x2C, 0x8A, 0x1E, 0xF8, 0x01, 0xC6, 0xF6, 0x29, 0xEE, 0xFF, 0x2A, 0xFB, 0x6F, 0xBD, 0x1E, 
-0x7D, 0x68, 0x17, 0x67, 0x69, 0x8B, 0x29, 0x73, 0x4C, 0x70, 0x04, 0x1B, 0xC3, 0x32, 0x8A, 0x36, 
-0xA8, 0x54, 0x53, 0xAA, 0x98, 0x4B, 0xCA, 0xA0, 0x63, 0x76, 0xED, 0xA0, 0xD6, 0xD0, 0xE1, 0xAE, 
-0x43, 0xAE, 0xC7, 0xE8, 0x9B, 0x58, 0xA9, 0x76, 0x98, 0x40, 0x5C, 0x3C, 0x5B, 0xE3, 0xBA, 0x2C, 
-0xAB, 0xA6, 0x7C, 0xED, 0x4D, 0x1C, 0x1B, 0x49, 0x5C, 0x18, 0x90, 0x10, 0x3B, 0x69, 0xF4, 0x5E, 
-0xD0, 0xE0, 0x35, 0xA1, 0x0C, 0x0C, 0x07, 0x05, 0xBD, 0xA5, 0x11, 0x83, 0xDE, 0x80, 0x6A, 0xE8, 
-0x51, 0x23, 0x8D, 0xF6, 0x1A, 0x09, 0x86, 0x44, 0xA7, 0x24, 0x92, 0xA2, 0xC5, 0x20, 0x75, 0x3A, 
-0x6A, 0x2D, 0x3A, 0x86, 0xE2, 0x0B, 0x81, 0xE0, 0x6C, 0xB4, 0x6B, 0x96, 0x38, 0x08, 0x38, 0xE5, 
-0x18, 0xC9, 0x08, 0x49, 0x3C, 0xA6, 0xA3, 0xE8, 0x6E, 0x6E, 0x33, 0xBD, 0xAD, 0x83, 0x99, 0x6B, 
-0x41, 0x6A, 0xF1, 0x44, 0xB3, 0x9E, 0xE5, 0xC1, 0x63, 0x62, 0x32, 0x30, 0xAE, 0x82, 0x48, 0xA2, 
-0x93, 0x08, 0x12, 0x9B, 0x3A, 0x75, 0x27, 0x1F, 0x2F, 0x20, 0xD6, 0xCF, 0x1B, 0x89, 0x39, 0x5E, 
-0x33, 0x76, 0xB6, 0x98, 0x03, 0xCB, 0x6A, 0x8D, 0x53, 0x31, 0x58, 0xB8, 0x95, 0x0C, 0xAB, 0x32, 
-0x7A, 0x83, 0x92, 0xAA, 0x72, 0x48, 0xF0, 0x4C, 0xB5, 0x32, 0x3A, 0x99, 0x42, 0x53, 0xE1, 0xDD, 
-0x08, 0xED, 0x73, 0x12, 0x9F, 0xA3, 0x43, 0xCC, 0xFC, 0x1B, 0x63, 0x0D, 0x37, 0xA5, 0x88, 0xD2, 
-0x65, 0x63, 0x42, 0xD4, 0xBC, 0x03, 0x99, 0x78, 0x17, 0x5E, 0x4C, 0x4C, 0x7B, 0xAD, 0x52, 0xD0, 
-0x1D, 0x82, 0x8A, 0x8E, 0x10, 0x2E, 0x28, 0x9C, 0x8F, 0xC4, 0xD9, 0x48, 0x83, 0x8A, 0x12, 0x09, 
-0x25, 0x49, 0xA8, 0xD0, 0xBE, 0xA8, 0x63, 0xB8, 0x46, 0xFD, 0xB7, 0x84, 0x48, 0x0A, 0xCB, 0xED, 
-0x62, 0x22, 0x0B, 0xEE, 0xF8, 0xFE, 0xAA, 0x9E, 0x0E, 0xAD, 0x6C, 0x29, 0xA1, 0x5E, 0x7C, 0x1A, 
-0xA3, 0x49, 0x69, 0xD3, 0x7C, 0x95, 0x26, 0xFD, 0x91, 0x80, 0x4D, 0x08, 0x55, 0x60, 0xD4, 0xB7, 
-0x2C, 0xCE, 0x2F, 0x31, 0x38, 0x34, 0x42, 0x06, 0x09, 0xBA, 0x4A, 0x11, 0x89, 0xA6, 0x85, 0x09, 
-0x69, 0x7D, 0xBC, 0x89, 0x99, 0x85, 0xEB, 0xC1, 0x00, 0xA2, 0xA4, 0xED, 0x82, 0x1D, 0xBF, 0x53, 
-0x2F, 0x9E, 0x4A, 0x45, 0x9B, 0xE9, 0x40, 0xB4, 0x1A, 0x20, 0xF1, 0x64, 0x1D, 0x45, 0x6B, 0xBA, 
-0x45, 0xD2, 0xD5, 0xCC, 0x6C, 0x9E, 0x82, 0x24, 0x20, 0xA9, 0x80, 0x89, 0x6A, 0x32, 0x4F, 0x85, 
-0xF7, 0x71, 0x10, 0x6F, 0xD4, 0x27, 0xEB, 0xA1, 0x21, 0xD3, 0x28, 0x5E, 0xD4, 0x9F, 0xB5, 0xEA, 
-0xCE, 0xCB, 0xAA, 0xFE, 0x25, 0x1E, 0x42, 0x5C, 0x0F, 0x20, 0x4C, 0x08, 0x2D, 0xAB, 0xDA, 0x57, 
-0x93, 0x91, 0x98, 0xA0, 0xA8, 0x82, 0x23, 0xD1, 0x09, 0x49, 0x88, 0x01, 0xCA, 0xEB, 0x64, 0xF7, 
-0xF1, 0x1C, 0x1F, 0x48, 0x4C, 0x82, 0x2B, 0x2A, 0x94, 0x6E, 0x23, 0xE9, 0x0C, 0x87, 0x76, 0xCD, 
-0x93, 0x1F, 0xB2, 0xA8, 0x45, 0x4D, 0xEA, 0x5A, 0x84, 0x0A, 0xAA, 0x99, 0xED, 0x7C, 0x6E, 0x5E, 
-0xF1, 0x77, 0x77, 0xEC, 0xE5, 0xBA, 0x83, 0x39, 0xFB, 0x68, 0x81, 0x6A, 0x23, 0x21, 0x60, 0x42, 
-0xCF, 0xA7, 0x32, 0xFA, 0xC2, 0x2B, 0xFE, 0xCD, 0x0B, 0x7E, 0xE8, 0x1F, 0x3E, 0xF9, 0xB7, 0x77, 
-0xAF, 0x28, 0xC8, 0x1A, 0x78, 0xDF, 0xFB, 0x82, 0xDE, 0xB5, 0xEB, 0xAF, 0x5A, 0xD7, 0x5D, 0xF7, 
-0x89, 0x6D, 0xB7, 0xDE, 0x7A, 0xE7, 0xE5, 0x8B, 0x47, 0xFB, 0x97, 0xF5, 0xFA, 0xC3, 0x97, 0x77, 
-0xD2, 0xE9, 0x27, 0x0F, 0xCB, 0x62, 0x73, 0x22, 0xC9, 0x94, 0x60, 0x94, 0x0D, 0x5E, 0x12, 0x2D, 
-0x04, 0x5F, 0xBA, 0x22, 0xF4, 0xEF, 0xFA, 0xA6, 0x17, 0xBF, 0xF0, 0xFB, 0xAF, 0xBB, 0xE1, 0x43, 
-0x5F, 0x6E, 0xAE, 0xB3, 0x66, 0xAD, 0xFE, 0xF6, 0x9B, 0x7F, 0xBB, 0xFD, 0xB6, 0xBF, 0xF8, 0x9B, 
-0xEF, 0x3B, 0x32, 0xDF, 0xFF, 0xCE, 0x6E, 0xBB, 0xBD, 0x25, 0x1F, 0x0D, 0x8F, 0x4E, 0x4F, 0x4F, 
-0xDD, 0x29, 0x4A, 0xEE, 0x7A, 0xF1, 0x8B, 0x5F, 0xF8, 0x85, 0xA7, 0x5C, 0x76, 0xC9, 0x81, 0xE9, 
-0xE9, 0x5E, 0xFF, 0xAA, 0xAB, 0xAE, 0x5A, 0x53, 0x8A, 0x3D, 0x11, 0xDE, 0xF2, 0x96, 0x3F, 0x9C, 
-0x7A, 0xDB, 0xFF, 0xFA, 0xBD, 0xDF, 0xCB, 0x6D, 0xF2, 0x43, 0x99, 0x9E, 0x33, 0x85, 0xB3, 0x31, 
-0x5B, 0x43, 0x5A, 0x72, 0xF6, 0x05, 0x1D, 0x7E, 0xEA, 0x27, 0x5F, 0xC7, 0x4F, 0xFE, 0xD8, 0xBF, 
-0xC5, 0xBA, 0x23, 0xA4, 0x99, 0x20, 0xF9, 0x51, 0xF4, 0xF0, 0x20, 0xC3, 0xBB, 0x6E, 0xE6, 0xF0, 
-0x97, 0x3E, 0xC7, 0x9C, 0x5D, 0xC2, 0x14, 0x03, 0x5A, 0x41, 0x10, 0x0C, 0x84, 0x18, 0x6A, 0xCE, 
-0x8A, 0xC3, 0x2A, 0x8B, 0x28, 0x48, 0x9B, 0x60, 0xC7, 0xA7, 0x80, 0xB5, 0x09, 0x77, 0x6D, 0x34, 
-0x64, 0xB3, 0x1E, 0xA2, 0x5B, 0x6E, 0xAD, 0xD3, 0x9B, 0xE8, 0x8C, 0xF1, 0xBB, 0x8A, 0x8B, 0x00, 
-0x12, 0xA7, 0xE6, 0x78, 0x05, 0x2E, 0x26, 0x77, 0xAC, 0x0A, 0x0F, 0x15, 0x0C, 0x8E, 0xE4, 0xD8, 
-0x81, 0x65, 0xD8, 0x1B, 0x51, 0xE6, 0x0E, 0xED, 0x35, 0x46, 0x32, 0x32, 0xD3, 0x42, 0x8B, 0x89, 
-0x69, 0xCD, 0x43, 0x6C, 0x7C, 0xAA, 0x4E, 0xC4, 0x07, 0x01, 0xEB, 0x63, 0x90, 0x10, 0xDF, 0xF1, 
-0xB4, 0xB7, 0x64, 0x6C, 0xDA, 0x32, 0x4B, 0xBA, 0x29, 0x8B, 0x7A, 0x38, 0x63, 0xF1, 0x52, 0xC4, 
-0x20, 0x33, 0x26, 0x4A, 0x17, 0x0D, 0x24, 0x34, 0xD2, 0x4B, 0x2C, 0x77, 0x6C, 0xFC, 0xC7, 0xD6, 
-0xC7, 0x5A, 0xCF, 0xBD, 0xD6, 0xBE, 0x28, 0xF9, 0x82, 0x93, 0x18, 0x58, 0xDD, 0x29, 0x85, 0x57, 
-0xD1, 0x56, 0xD7, 0x23, 0x88, 0x56, 0x58, 0x6B, 0x91, 0x00, 0x89, 0x8E, 0x79, 0x2A, 0xBC, 0xB3, 
-0x75, 0x8A, 0x18, 0x4F, 0x22, 0x1E, 0x99, 0x5C, 0xF5, 0x3F, 0x05, 0x84, 0x7A, 0xB1, 0xCA, 0x35, 
-0x99, 0x68, 0x25, 0xAA, 0x42, 0x1A, 0xCD, 0x40, 0x08, 0xA1, 0x8E, 0x37, 0xDC, 0x58, 0xB2, 0x84, 
-0x3A, 0x9E, 0x45, 0x24, 0xD7, 0x86, 0xE0, 0x65, 0x8D, 0x36, 0x31, 0x96, 0xF8, 0xEA, 0x67, 0x6E, 
-0x88, 0x67, 0x35, 0xC6, 0xE7, 0xD5, 0x24, 0xB2, 0xBA, 0x8E, 0x5C, 0x9D, 0xF5, 0x59, 0xA3, 0x6B, 
-0xF3, 0xBA, 0x04, 0xEF, 0x02, 0xA3, 0x61, 0x4E, 0xD9, 0xF3, 0xF4, 0x1F, 0x18, 0xE2, 0xFA, 0x81, 
-0x2A, 0x8F, 0xAA, 0xA5, 0xB6, 0xE9, 0x90, 0xA9, 0x0C, 0x45, 0xB4, 0x07, 0x0F, 0xD6, 0x21, 0x75, 
-0xDA, 0x74, 0x8F, 0xC3, 0x53, 0x51, 0x06, 0x4B, 0xA0, 0xC2, 0x29, 0x87, 0xD7, 0x0E, 0xD3, 0xD6, 
-0x74, 0xBA, 0x19, 0xAD, 0xA9, 0x94, 0xA4, 0x93, 0x60, 0x3A, 0x0A, 0xDD, 0x02, 0x49, 0x05, 0x17, 
-0x4A, 0x42, 0x12, 0x10, 0x1D, 0x25, 0x47, 0x47, 0x8C, 0x3D, 0x42, 0xDD, 0x02, 0x62, 0x6C, 0x8F, 
-0xF5, 0xB1, 0xBA, 0x5E, 0x8E, 0x41, 0xD3, 0xF7, 0x26, 0x07, 0xF5, 0xDA, 0x5B, 0x32, 0x7E, 0x59, 
-0x45, 0xB6, 0x13, 0x7F, 0x07, 0x89, 0xEB, 0x01, 0xDA, 0x43, 0x62, 0x63, 0xA6, 0xE9, 0x40, 0x94, 
-0xDE, 0x83, 0x89, 0xBA, 0x62, 0xA9, 0x1C, 0x4A, 0x65, 0xE0, 0x52, 0xAA, 0xA1, 0xB0, 0x67, 0xD7, 
-0x3C, 0xBE, 0x2F, 0x64, 0x45, 0x4A, 0x4A, 0x87, 0x51, 0x48, 0x58, 0x48, 0xE6, 0xF8, 0xC0, 0x9D, 
-0x07, 0xF9, 0xF8, 0x7D, 0x47, 0xF9, 0xB2, 0x33, 0x94, 0x66, 0x2B, 0x3E, 0x08, 0x09, 0x36, 0x78, 
-0x77, 0x60, 0x78, 0xD6, 0x54, 0xF6, 0xB6, 0xDF, 0xFF, 0xB3, 0xB7, 0xFE, 0xFA, 0x95, 0x57, 0x5E, 
-0x79, 0xCA, 0xB9, 0xCB, 0x42, 0x08, 0xF2, 0x73, 0x3F, 0xF7, 0xB6, 0xA9, 0x9D, 0x3B, 0x77, 0x75, 
-0x77, 0xED, 0xD8, 0xFF, 0x8C, 0xAF, 0x7C, 0xE9, 0x8E, 0x6F, 0xF0, 0xCE, 0x5F, 0xDC, 0xE9, 0x4E, 
-0x5F, 0x32, 0xDF, 0x3F, 0x34, 0x6D, 0x08, 0xF7, 0x6C, 0xDB, 0xB6, 0xF9, 0xCF, 0xDE, 0xF2, 0x2B, 
-0xFF, 0xF1, 0xDA, 0x37, 0xBE, 0xF1, 0x8D, 0xF5, 0x34, 0x7C, 0x1D, 0xC2, 0x05, 0x78, 0xF3, 0x9B, 
-0x7F, 0xBB, 0x7D, 0xE3, 0x8D, 0x37, 0x6C, 0x5D, 0x3C, 0x74, 0xB0, 0x33, 0x3B, 0x3D, 0x3D, 0x7C, 
-0xC5, 0x6B, 0x5E, 0x35, 0x7F, 0xEE, 0xB9, 0x2F, 0x2E, 0xDE, 0xF8, 0xC6, 0x2B, 0xC6, 0x27, 0x9F, 
-0x2E, 0x42, 0x08, 0x72, 0xF9, 0x33, 0x5F, 0xFD, 0xDA, 0x3B, 0xEF, 0x7C, 0xE0, 0xCF, 0x08, 0x9D, 
-0x4D, 0x48, 0x22, 0x62, 0x02, 0xA8, 0x11, 0x3A, 0xCB, 0x79, 0xE9, 0x4B, 0x9E, 0xC9, 0x9F, 0xFD, 
-0xE9, 0xAF, 0x73, 0xCE, 0xF6, 0x16, 0x9A, 0x02, 0xAA, 0x79, 0x28, 0x8E, 0xC0, 0xDE, 0x3B, 0xB9, 
-0xE7, 0xD3, 0x1F, 0xC3, 0x2C, 0x1C, 0x60, 0x8B, 0x38, 0x5A, 0xCE, 0x92, 0x10, 0x93, 0x53, 0x86, 
-0x20, 0x31, 0xEE, 0xAB, 0x76, 0x68, 0xAD, 0x51, 0xAE, 0x8E, 0x89, 0x7B, 0x0A, 0x38, 0x61, 0x23, 
-0x3A, 0x5D, 0x4C, 0x34, 0xBA, 0xB1, 0x0A, 0xC3, 0x47, 0x49, 0x57, 0x42, 0xB4, 0x74, 0x80, 0x48, 
-0x4C, 0x75, 0x34, 0x6C, 0x18, 0x38, 0xAA, 0x91, 0x65, 0xB0, 0x34, 0x22, 0x1F, 0xE4, 0x54, 0x23, 
-0x8B, 0x2B, 0x03, 0xBE, 0x12, 0x70, 0x42, 0x27, 0x8D, 0x99, 0x5E, 0x43, 0xA8, 0xA5, 0x5A, 0x67, 
-0x63, 0x24, 0x28, 0xAD, 0x49, 0xDA, 0x42, 0x7B, 0x6B, 0x9B, 0xF6, 0x5C, 0x9B, 0x64, 0xB6, 0x03, 
-0x99, 0x40, 0xC8, 0x09, 0xBE, 0xC0, 0x9B, 0x26, 0xB9, 0xE6, 0x32, 0xA1, 0x2A, 0x62, 0x2B, 0x6F, 
-0xA6, 0x6B, 0xE0, 0x6B, 0x49, 0xE9, 0xD8, 0xFA, 0x58, 0x96, 0x6A, 0x97, 0x9B, 0xCE, 0x5A, 0xF5, 
-0x16, 0x73, 0x52, 0xD5, 0x8F, 0x89, 0xC2, 0x49, 0x8C, 0xB2, 0x16, 0xED, 0x3F, 0x14, 0xCA, 0xE8, 
-0x48, 0x6E, 0xA1, 0x9E, 0x8E, 0xD6, 0xAE, 0xD1, 0x21, 0x04, 0x12, 0x25, 0x71, 0x0A, 0xBB, 0xC6, 
-0x75, 0x1B, 0xAC, 0x26, 0xB0, 0xD5, 0x08, 0xD2, 0xE8, 0x9D, 0x89, 0x59, 0x7D, 0xA9, 0xCD, 0xD7, 
-0xEA, 0x32, 0x45, 0x9D, 0x62, 0x3D, 0x60, 0x11, 0xAD, 0x30, 0x62, 0x9E, 0xBA, 0x9A, 0x50, 0x57, 
-0x5C, 0x2D, 0x62, 0xF2, 0x39, 0x65, 0x1C, 0x62, 0x73, 0xED, 0x41, 0xFD, 0x98, 0x3A, 0x69, 0x54, 
-0x33, 0x35, 0xBC, 0x8B, 0x52, 0x6E, 0x8C, 0x6A, 0x17, 0xB3, 0x3A, 0x20, 0x1A, 0x3C, 0xF8, 0x42, 
-0x28, 0x8F, 0x78, 0x46, 0x47, 0x47, 0x2C, 0xCC, 0x2F, 0x51, 0x0D, 0x4B, 0x4C, 0x48, 0x30, 0x2A, 
-0xC5, 0x48, 0x86, 0x11, 0x13, 0x33, 0x78, 0x38, 0x87, 0xF5, 0x15, 0x95, 0x8F, 0x09, 0x39, 0x83, 
-0xF1, 0x71, 0xE0, 0x4D, 0xA0, 0xBB, 0xA9, 0x4D, 0xD2, 0x49, 0x98, 0x9A, 0x6A, 0xA1, 0xA6, 0x5A, 
-0x90, 0xA9, 0xA8, 0x2E, 0x50, 0x36, 0xB6, 0x47, 0x5F, 0xD4, 0x4E, 0x08, 0x51, 0x52, 0x9E, 0x2C, 
-0xAF, 0x92, 0x38, 0x6B, 0x3C, 0x93, 0x18, 0x0F, 0x50, 0xE3, 0x1D, 0xC7, 0x27, 0x5C, 0xD1, 0x31, 
-0xC3, 0xB4, 0xA9, 0x24, 0x0E, 0x8E, 0x22, 0xD1, 0x36, 0x56, 0xC5, 0x7A, 0x0C, 0x25, 0xA4, 0xAA, 
-0x43, 0xD5, 0x13, 0x16, 0x0F, 0x8D, 0x58, 0xD8, 0xDF, 0x27, 0xF3, 0x2D, 0xDA, 0xA4, 0x04, 0xE9, 
-0x32, 0xCA, 0xE6, 0xB8, 0x6B, 0xA0, 0x78, 0xF7, 0x67, 0x6F, 0xE7, 0x96, 0x25, 0xCF, 0x83, 0x6C, 
-0xA2, 0xCA, 0x36, 0x45, 0x7D, 0xBF, 0xB2, 0xA1, 0x45, 0xFF, 0xDE, 0x67, 0x3D, 0xE3, 0xC2, 0x37, 
-0xDE, 0x78, 0xFB, 0x27, 0xAE, 0x9E, 0xB8, 0xF5, 0x69, 0x21, 0x84, 0xA0, 0xFE, 0xFC, 0xCF, 0xAF, 
-0x49, 0xFF, 0xF5, 0x5F, 0xAF, 0x49, 0x6F, 0xF9, 0xDC, 0x67, 0xB7, 0x67, 0x6D, 0xD5, 0x39, 0xFB, 
-0xAC, 0xAD, 0x47, 0xBE, 0xFB, 0x75, 0xDF, 0x74, 0x60, 0x92, 0x6C, 0x59, 0xA7, 0x5D, 0x3D, 0x22, 
-0x78, 0xF3, 0x9B, 0x7F, 0xFB, 0xBC, 0xB7, 0xBF, 0xFD, 0x8F, 0xFE, 0x40, 0x33, 0xFD, 0x1A, 0xA5, 
-0x3A, 0x89, 0x17, 0x8B, 0x73, 0x23, 0xD2, 0xAE, 0x63, 0x6E, 0xCE, 0xF0, 0xF6, 0xDF, 0xF9, 0xAF, 
-0x7C, 0xE7, 0x6B, 0xBE, 0x11, 0xE3, 0x7A, 0xB4, 0xD2, 0x12, 0x46, 0x7B, 0xA1, 0x38, 0xCC, 0xD1, 
-0x2F, 0x5D, 0xCF, 0xC2, 0xBD, 0xB7, 0x33, 0x3B, 0xEA, 0xD1, 0x29, 0x4B, 0x12, 0xE7, 0xA2, 0x74, 
-0x64, 0x14, 0xA8, 0x98, 0x76, 0x86, 0x9A, 0xD8, 0xD6, 0xE0, 0x8B, 0xE3, 0xE2, 0x98, 0x4E, 0x72, 
-0x26, 0xB0, 0x4A, 0x9D, 0xD1, 0x4C, 0x8D, 0xA3, 0x84, 0x15, 0xD3, 0x9A, 0x84, 0x5A, 0xED, 0x20, 
-0xD4, 0xAE, 0x9B, 0xC4, 0x51, 0x1D, 0x1F, 0x53, 0xE5, 0x50, 0xF9, 0x31, 0xF9, 0x0E, 0x7B, 0x39, 
-0xF9, 0x30, 0xC7, 0xDB, 0x40, 0x55, 0x55, 0x31, 0x1A, 0x95, 0x8A, 0x52, 0x62, 0xD2, 0x4A, 0xD8, 
-0xB4, 0x69, 0x86, 0x99, 0xCD, 0xD3, 0xA8, 0x39, 0x0D, 0x26, 0xC6, 0x85, 0x08, 0x21, 0x9A, 0x52, 
-0xA9, 0x24, 0xBA, 0xF0, 0x88, 0x06, 0x57, 0x4F, 0x1D, 0x69, 0xA4, 0x99, 0xA0, 0x6A, 0xE2, 0x55, 
-0xE3, 0x8E, 0xD8, 0x10, 0x6E, 0x98, 0x50, 0x1F, 0x70, 0x12, 0x64, 0x87, 0x2C, 0x7B, 0xF9, 0x85, 
-0x09, 0x15, 0x40, 0x4C, 0x0B, 0x14, 0x6D, 0x77, 0x27, 0x25, 0x45, 0xAD, 0x62, 0xAC, 0x0B, 0xF1, 
-0x51, 0x6A, 0x33, 0x5A, 0x13, 0xDC, 0xE9, 0x49, 0xB7, 0x0D, 0x44, 0x64, 0x3C, 0xFD, 0x8F, 0x5E, 
-0x53, 0x8D, 0x55, 0x45, 0xFC, 0x1C, 0x13, 0x6B, 0x20, 0x76, 0xF7, 0xE0, 0x62, 0x09, 0x97, 0x19, 
-0xA1, 0xF9, 0x03, 0x8E, 0xD7, 0x36, 0x4E, 0x81, 0x70, 0x27, 0xA1, 0xC4, 0x10, 0x42, 0x5C, 0xE5, 
-0x6F, 0x62, 0x7F, 0xC4, 0x3C, 0x76, 0xAA, 0x36, 0xE3, 0x9B, 0x82, 0x61, 0xC9, 0x60, 0x61, 0x48, 
-0x6F, 0xB1, 0xC7, 0x68, 0x29, 0xA7, 0x1C, 0xD9, 0xE8, 0x14, 0x50, 0x67, 0xCA, 0x10, 0x89, 0x8B, 
-0xB2, 0x3A, 0xD5, 0xA4, 0x6D, 0x43, 0x67, 0x2A, 0xA3, 0xD5, 0x6D, 0x93, 0x64, 0x06, 0xE9, 0xA8, 
-0x68, 0xCC, 0x6A, 0x96, 0xA3, 0xE4, 0x41, 0x85, 0xAF, 0xE3, 0x1B, 0xC7, 0x2C, 0xC6, 0x31, 0xE8, 
-0xFD, 0xF8, 0x5D, 0x4C, 0x94, 0xEF, 0x98, 0xF2, 0x3F, 0x44, 0x9C, 0x0A, 0xE1, 0x42, 0xED, 0xC1, 
-0xEC, 0xC0, 0xB8, 0xDA, 0x74, 0x12, 0xA8, 0x6A, 0xB5, 0x89, 0x88, 0x26, 0x93, 0x36, 0x76, 0xA8, 
-0xE8, 0xED, 0xCF, 0xE9, 0x1F, 0x2C, 0x50, 0xB9, 0xA1, 0xA5, 0x5B, 0x28, 0xAF, 0xC8, 0xCD, 0x14, 
-0x87, 0x5B, 0x67, 0x71, 0xCD, 0x7D, 0x87, 0xF9, 0xDB, 0x2F, 0xDC, 0xC9, 0x1E, 0x66, 0x38, 0xA8, 
-0x66, 0x19, 0x91, 0x80, 0x1F, 0x82, 0x84, 0x62, 0x3A, 0x29, 0xFE, 0xF7, 0x4F, 0xFC, 0xE8, 0x0F, 
-0xBF, 0xE5, 0xD7, 0xFF, 0xE8, 0x17, 0x8F, 0xAE, 0xBA, 0xF5, 0xC3, 0x8A, 0x63, 0xAC, 0x14, 0x1E, 
-0x29, 0xFC, 0xDA, 0xAF, 0xFD, 0xE2, 0xE8, 0xDA, 0x6B, 0x6F, 0x75, 0xFD, 0x5E, 0xFE, 0x32, 0x11, 
-0xD3, 0x15, 0xA5, 0x45, 0x6B, 0x4D, 0x55, 0x96, 0x94, 0x55, 0xC9, 0xA6, 0xCD, 0x33, 0x5C, 0x7A, 
-0xC9, 0x93, 0xD8, 0x7E, 0xD6, 0x66, 0x94, 0x2B, 0xF0, 0x6E, 0x80, 0x32, 0x1E, 0x5B, 0x0C, 0x38, 
-0xB4, 0x6F, 0x2F, 0xA6, 0xB2, 0x74, 0xE2, 0x04, 0x0B, 0x42, 0x34, 0xB8, 0x8E, 0x73, 0x40, 0x70, 
-0x95, 0xC5, 0xD4, 0x1D, 0xEB, 0x51, 0xC7, 0xB8, 0x61, 0xAD, 0x6A, 0xD4, 0x52, 0x77, 0x42, 0x15, 
-0x1B, 0xA3, 0x48, 0xD3, 0x31, 0x42, 0xF4, 0x3B, 0x57, 0x36, 0x12, 0x66, 0x12, 0x20, 0x53, 0xE8, 
-0x96, 0xD0, 0xEA, 0x24, 0xA4, 0x5D, 0x4D, 0x67, 0x26, 0x43, 0xB5, 0xC0, 0xE9, 0x12, 0xA7, 0x2A, 
-0x92, 0x69, 0xCD, 0xCC, 0x96, 0x2E, 0xB3, 0xDB, 0xA6, 0x99, 0xD9, 0x3A, 0x85, 0x9A, 0x4B, 0x21, 
-0xAB, 0xC0, 0x14, 0x31, 0x9C, 0xA0, 0x54, 0xE8, 0x44, 0x10, 0x13, 0xEF, 0xE9, 0x6C, 0x15, 0xCB, 
-0x11, 0x80, 0x20, 0xF5, 0xF4, 0xB9, 0x99, 0x11, 0xC4, 0x4A, 0x0C, 0x4D, 0x64, 0xB5, 0x09, 0xAC, 
-0x47, 0xB4, 0xC7, 0xEC, 0x97, 0x48, 0xAF, 0xC4, 0x35, 0x7C, 0x64, 0xFC, 0xBF, 0xC4, 0x48, 0x7B, 
-0x41, 0x30, 0x52, 0x27, 0x7D, 0xC4, 0xD7, 0x5B, 0xB3, 0x62, 0xBD, 0xAC, 0x7E, 0x79, 0x28, 0x90, 
-0x26, 0x0F, 0x5C, 0x08, 0xF1, 0xDE, 0x75, 0xE8, 0x38, 0xF1, 0x31, 0x33, 0x01, 0x21, 0x20, 0xC1, 
-0xC5, 0xD0, 0x85, 0xB5, 0x64, 0x1B, 0xFF, 0x8E, 0xC1, 0x80, 0x90, 0x48, 0x82, 0x27, 0xC6, 0xDA, 
-0x75, 0x52, 0x4F, 0xCC, 0x97, 0x29, 0x66, 0x15, 0xC1, 0x04, 0x7C, 0xAC, 0x7B, 0xA2, 0x84, 0x1B, 
-0x8F, 0x89, 0xEF, 0x27, 0x26, 0x70, 0x74, 0x90, 0x40, 0x3A, 0x95, 0xD0, 0xEE, 0x64, 0x48, 0x1A, 
-0xF0, 0xC6, 0x13, 0x8C, 0x23, 0x24, 0x0E, 0xD3, 0x11, 0xB2, 0x99, 0x94, 0xA9, 0x2D, 0x2D, 0x66, 
-0xB6, 0x4D, 0x31, 0xB3, 0x7D, 0x8A, 0xF6, 0x96, 0x36, 0x7A, 0x36, 0x41, 0xA6, 0x80, 0xD4, 0x81, 
-0xB1, 0xA0, 0x4B, 0xAC, 0x14, 0x38, 0x0A, 0x9C, 0x72, 0x31, 0xDD, 0x91, 0x0E, 0xF8, 0x60, 0xEB, 
-0xD0, 0xA5, 0x51, 0x77, 0x22, 0xC4, 0x76, 0x10, 0x67, 0x3A, 0x31, 0x71, 0xE9, 0x99, 0x82, 0x4C, 
-0xAA, 0x12, 0x96, 0xF7, 0xAE, 0xD8, 0x44, 0x56, 0xEE, 0xA1, 0xD6, 0x92, 0xC7, 0xFA, 0x21, 0xBE, 
-0x3B, 0x21, 0x26, 0x01, 0x55, 0x71, 0xB1, 0xB1, 0x7F, 0x28, 0xA7, 0xB7, 0x3F, 0x27, 0xF4, 0x84, 
-0x4E, 0xE8, 0x80, 0xD5, 0x78, 0xD1, 0x0C, 0xD2, 0x29, 0xEE, 0xE8, 0x0B, 0xD7, 0xDE, 0x77, 0x90, 
-0x3B, 0x97, 0x72, 0x16, 0xE9, 0x50, 0x9A, 0x0E, 0x56, 0x09, 0x88, 0x04, 0xA3, 0xEC, 0xBE, 0x73, 
-0xCE, 0xE9, 0xFE, 0xDE, 0x0F, 0xBD, 0xF1, 0x35, 0xB7, 0x37, 0xD6, 0x03, 0x8F, 0x14, 0x1E, 0x35, 
-0x56, 0xFA, 0x8B, 0xBF, 0xF8, 0x0B, 0xFF, 0xD3, 0x3F, 0xFD, 0xDF, 0xF6, 0x5D, 0x77, 0xCD, 0xE7, 
-0x5E, 0x10, 0xE0, 0x29, 0x49, 0xDA, 0x52, 0x65, 0x69, 0x49, 0xD2, 0x8C, 0x40, 0x60, 0xDF, 0xFE, 
-0x07, 0x49, 0x13, 0xC5, 0x37, 0xBC, 0xF0, 0xF9, 0x40, 0x89, 0x49, 0x03, 0xA2, 0x1D, 0xA9, 0x11, 
-0x5A, 0x46, 0xB1, 0xB0, 0x67, 0x1F, 0x69, 0x08, 0x64, 0x2A, 0x1A, 0x91, 0xD4, 0xD9, 0x16, 0xA3, 
-0x09, 0x8A, 0x98, 0xF1, 0x42, 0xCE, 0xA3, 0x8F, 0xC6, 0x4A, 0xA2, 0x69, 0x46, 0x11, 0xDE, 0xC7, 
-0xEC, 0xB4, 0xD4, 0x0D, 0x92, 0xBA, 0x13, 0x7A, 0x3C, 0x16, 0x57, 0x47, 0x61, 0xAA, 0x62, 0x46, 
-0x62, 0xCA, 0xB8, 0x42, 0x9B, 0x82, 0x69, 0x6B, 0xD2, 0xA9, 0x94, 0xEE, 0xDC, 0x14, 0x33, 0x73, 
-0x1D, 0x66, 0xB6, 0x4C, 0x31, 0xBB, 0x75, 0x9A, 0x99, 0xCD, 0x1D, 0xB2, 0xE9, 0x04, 0xC9, 0x80, 
-0xA4, 0xC2, 0x93, 0xE3, 0x74, 0x15, 0x23, 0x59, 0xA9, 0xB8, 0x62, 0x1D, 0x88, 0xD9, 0x51, 0xBD, 
-0x8F, 0x12, 0x0E, 0x4D, 0x27, 0x1B, 0x97, 0x93, 0x9A, 0x6C, 0x22, 0xD9, 0xAE, 0xA5, 0xC6, 0x3B, 
-0x86, 0x5C, 0x27, 0xD0, 0xFC, 0x16, 0x57, 0xCE, 0xDD, 0xF2, 0xD3, 0x86, 0xD8, 0x8D, 0x54, 0x3D, 
-0x95, 0x8F, 0x4A, 0x85, 0x28, 0x65, 0x4A, 0xED, 0x11, 0xA8, 0xF0, 0x75, 0xF8, 0xC3, 0xC6, 0x68, 
-0x7E, 0xFD, 0xFB, 0x9C, 0x08, 0x0A, 0x88, 0x66, 0x04, 0x3E, 0x66, 0xD4, 0x90, 0x18, 0x51, 0x8B, 
-0xE6, 0xAA, 0x35, 0xF9, 0xC6, 0x81, 0x26, 0x40, 0x6D, 0x43, 0x0B, 0x44, 0x62, 0x96, 0x86, 0x74, 
-0x4E, 0xA6, 0x0C, 0xC7, 0x1E, 0x13, 0xA5, 0xC3, 0x66, 0xFF, 0xDA, 0x84, 0xEB, 0x7D, 0x24, 0x3B, 
-0x21, 0x9A, 0x6E, 0x4D, 0xC8, 0x7E, 0x28, 0x05, 0x96, 0x68, 0x86, 0x25, 0x2A, 0xA0, 0x32, 0xA1, 
-0xD5, 0x4E, 0x69, 0x4D, 0x65, 0x74, 0x66, 0xDA, 0x4C, 0xCD, 0x76, 0xD8, 0xBC, 0x7D, 0x8E, 0xE9, 
-0xB3, 0xBA, 0x74, 0x37, 0xB7, 0x49, 0x66, 0x34, 0xAA, 0x05, 0xDE, 0x14, 0xB8, 0x50, 0x50, 0x86, 
-0x21, 0x28, 0x8B, 0x93, 0x9C, 0x20, 0x75, 0xA6, 0x85, 0x98, 0xCB, 0x09, 0x54, 0x74, 0x6C, 0xA8, 
-0x7D, 0x09, 0xC7, 0xA5, 0xD4, 0xF5, 0xCB, 0x8E, 0xF6, 0xB2, 0xF1, 0xFD, 0xAC, 0xF5, 0xFE, 0x4F, 
-0x07, 0xAB, 0xDB, 0xCC, 0xEA, 0xEF, 0x71, 0xE7, 0xB1, 0x5F, 0x15, 0xB1, 0x2C, 0xB1, 0xA0, 0x82, 
-0x52, 0x09, 0x5A, 0x65, 0xA8, 0x90, 0xD0, 0x3B, 0x9C, 0xD3, 0x3B, 0x30, 0x20, 0x1C, 0xF5, 0x24, 
-0x65, 0x42, 0x26, 0x1D, 0xAC, 0x37, 0x94, 0x69, 0xCA, 0x52, 0x6B, 0x96, 0x4F, 0xDE, 0x7F, 0x94, 
-0x9B, 0xF6, 0xF6, 0x99, 0xB7, 0x19, 0x7D, 0x5A, 0x54, 0xA6, 0x09, 0x34, 0x3E, 0x28, 0x8D, 0xB6, 
-0x1F, 0x79, 0xDD, 0xEB, 0x5F, 0xFB, 0xC7, 0xFF, 0xE5, 0xBF, 0xBC, 0xE9, 0xB4, 0xD6, 0xA0, 0x1E, 
-0x0A, 0x1E, 0x35, 0xC2, 0x05, 0xB8, 0xE6, 0x9A, 0x7F, 0xCC, 0xFF, 0xF6, 0x6F, 0x3E, 0x26, 0x07, 
-0x0E, 0x1D, 0x79, 0x69, 0x08, 0xD2, 0xF5, 0xDE, 0x49, 0x92, 0x74, 0xF0, 0xCE, 0x33, 0xCA, 0xFB, 
-0xD8, 0x6A, 0xC4, 0x8B, 0x5E, 0xF0, 0x5C, 0xB6, 0x6D, 0xDF, 0x84, 0x24, 0x16, 0xE7, 0x72, 0xB4, 
-0x56, 0xB4, 0x5A, 0x2D, 0x96, 0xF6, 0x1F, 0x40, 0x57, 0x25, 0x52, 0xE5, 0xA4, 0xF8, 0x98, 0x13, 
-0x2D, 0x04, 0x94, 0x68, 0x8C, 0x49, 0xC7, 0x0B, 0x00, 0x8F, 0x1E, 0x26, 0x3A, 0xD1, 0xB8, 0xB3, 
-0x45, 0x3B, 0xDD, 0xA8, 0xA3, 0x52, 0x75, 0x88, 0x48, 0x15, 0x5B, 0x97, 0x44, 0xA9, 0x22, 0x08, 
-0x88, 0x78, 0x5C, 0xA3, 0x6B, 0x13, 0x1B, 0x3B, 0x8B, 0x0A, 0x31, 0x85, 0xB8, 0x44, 0x3B, 0x44, 
-0x2F, 0x16, 0x9D, 0x09, 0x49, 0x47, 0x63, 0xDA, 0x1A, 0x31, 0x1E, 0xAF, 0xA3, 0x04, 0xE3, 0x55, 
-0x34, 0x52, 0x0F, 0x3A, 0x4E, 0x3B, 0x9D, 0xF7, 0x78, 0x17, 0xA7, 0x8E, 0x2A, 0xC4, 0x94, 0x41, 
-0xD1, 0x22, 0xB2, 0x91, 0xC2, 0x84, 0xB8, 0x50, 0x16, 0xA5, 0xBB, 0x46, 0x95, 0xB0, 0xC2, 0x66, 
-0xB2, 0x91, 0x50, 0x8F, 0xD9, 0x33, 0xF1, 0x6F, 0xAC, 0xC6, 0x59, 0x7E, 0x5E, 0x22, 0x8B, 0xD7, 
-0x6A, 0x8B, 0xE6, 0xB7, 0x10, 0x53, 0xC8, 0x87, 0xBA, 0x33, 0xD5, 0xC4, 0x17, 0x8F, 0xF6, 0x71, 
-0x01, 0x4F, 0x1A, 0x7B, 0x88, 0x53, 0xDF, 0x80, 0x78, 0x6D, 0xEA, 0x38, 0xC8, 0xF1, 0x2F, 0xA8, 
-0x55, 0x06, 0xAB, 0x8F, 0x6D, 0x88, 0x37, 0x7E, 0xAF, 0x45, 0x2D, 0x4E, 0x8F, 0x70, 0x97, 0xA7, 
-0xE2, 0xCD, 0xFE, 0xD5, 0x6D, 0xA0, 0xFE, 0x5A, 0x5F, 0x7B, 0x59, 0x4F, 0xDD, 0x38, 0xF0, 0xC4, 
-0xF7, 0xA0, 0x12, 0x55, 0xDB, 0x47, 0x5B, 0x42, 0xED, 0x2A, 0x6B, 0x5A, 0x86, 0xB4, 0x9B, 0x91, 
-0x4E, 0x67, 0xA8, 0x34, 0xA0, 0x52, 0x40, 0x3B, 0xBC, 0x2A, 0x71, 0xCA, 0xE2, 0x55, 0x85, 0x37, 
-0x1E, 0x65, 0x62, 0x5B, 0x09, 0x2A, 0x9A, 0xA7, 0x05, 0x55, 0xB7, 0x1F, 0x62, 0x1C, 0x68, 0x1F, 
-0x1C, 0xBA, 0x4E, 0x98, 0xDA, 0x14, 0x2F, 0xEA, 0xB4, 0x63, 0x3D, 0xD5, 0xFC, 0xF6, 0x90, 0x08, 
-0x77, 0x5C, 0x0B, 0x6B, 0xD4, 0xE1, 0x5A, 0xFB, 0x56, 0xBC, 0x15, 0x89, 0x7A, 0x20, 0xA9, 0xFB, 
-0x83, 0x0B, 0x1E, 0x8D, 0x41, 0x74, 0x8A, 0xAF, 0x14, 0x45, 0x2F, 0x30, 0xBF, 0xFB, 0x28, 0xE5, 
-0xD1, 0x82, 0xA9, 0x22, 0x25, 0x71, 0x29, 0x89, 0x74, 0x28, 0x55, 0xC6, 0x82, 0x69, 0x73, 0xCF, 
-0x28, 0xF0, 0x91, 0xDB, 0xF7, 0x71, 0x67, 0xCF, 0x52, 0xA8, 0x29, 0x72, 0x0C, 0xA5, 0x87, 0x10, 
-0xAA, 0x80, 0xEF, 0xED, 0x7E, 0xFA, 0xA5, 0xE7, 0xFF, 0xC1, 0x87, 0x3F, 0xFA, 0xEE, 0x5B, 0x57, 
-0x97, 0xE0, 0x91, 0xC0, 0x99, 0x98, 0xBD, 0x9D, 0x36, 0x44, 0x24, 0xBC, 0xE6, 0xBB, 0x5E, 0xF1, 
-0xE9, 0x2C, 0x93, 0x4F, 0x79, 0x6F, 0xAB, 0x99, 0xE9, 0xCD, 0x14, 0x79, 0x85, 0x90, 0x52, 0xE5, 
-0xF0, 0xA5, 0x5B, 0xEF, 0xE2, 0x63, 0x9F, 0xB8, 0x8E, 0x85, 0x5E, 0xC9, 0xA8, 0x14, 0x5C, 0x68, 
-0x43, 0x3A, 0x03, 0xED, 0x4D, 0xCC, 0x9D, 0x77, 0x09, 0xBE, 0x3B, 0xCB, 0xC0, 0x45, 0x17, 0x58, 
-0xB4, 0x8E, 0x46, 0xD6, 0xD1, 0xEE, 0x67, 0xF5, 0xAD, 0x1E, 0x25, 0xC4, 0x49, 0x11, 0x61, 0x39, 
-0x30, 0x47, 0xD3, 0x11, 0x43, 0x00, 0xEF, 0x03, 0xCE, 0xC5, 0x5C, 0x54, 0x3E, 0xC4, 0x45, 0x2F, 
-0x88, 0x9D, 0x44, 0x54, 0x40, 0x54, 0x0C, 0x63, 0x17, 0x14, 0xD1, 0xC4, 0x47, 0x2C, 0x41, 0xC5, 
-0x00, 0xCD, 0x18, 0x87, 0x57, 0x15, 0x96, 0x92, 0xCA, 0x8F, 0x70, 0xCA, 0xA1, 0x12, 0xC1, 0x6B, 
-0x4F, 0xE5, 0xF2, 0x15, 0x8D, 0x5A, 0x29, 0x85, 0x31, 0xD1, 0x8E, 0x37, 0x9A, 0x92, 0xC9, 0x8A, 
-0x57, 0xEF, 0x25, 0x46, 0x4F, 0x0B, 0xC4, 0x54, 0xD5, 0xC7, 0x9B, 0x4E, 0x4E, 0xEA, 0x5E, 0x57, 
-0x23, 0xD4, 0xDE, 0x68, 0xD1, 0x1D, 0x3A, 0xEA, 0x6E, 0xA1, 0xD1, 0x51, 0xD6, 0xFE, 0xF4, 0x3E, 
-0x6E, 0x1A, 0xA9, 0x03, 0xE9, 0xC4, 0x6C, 0xBE, 0xF1, 0xB8, 0x38, 0x43, 0x39, 0x13, 0xFA, 0x43, 
-0xA9, 0x83, 0x0D, 0xC5, 0xEB, 0xD5, 0x66, 0x6C, 0x0D, 0xF7, 0x8D, 0x83, 0xB5, 0x2F, 0x13, 0xCD, 
-0xB2, 0x99, 0x59, 0x7C, 0x57, 0x7E, 0x8D, 0xE7, 0x3B, 0x11, 0x4E, 0xB6, 0xDC, 0x61, 0x42, 0x27, 
-0x1E, 0x9F, 0xB9, 0xF6, 0x6A, 0x6C, 0xDE, 0xBB, 0x04, 0xAC, 0xCD, 0x63, 0x0A, 0x75, 0xED, 0x11, 
-0x15, 0x4D, 0xBB, 0xAC, 0xCF, 0x71, 0x6E, 0x80, 0x0F, 0x43, 0x9C, 0xE4, 0x58, 0x29, 0xF0, 0xC6, 
-0x12, 0x4C, 0xC0, 0xEB, 0x5A, 0x3F, 0xDB, 0xCC, 0x8A, 0x74, 0xE3, 0x5A, 0x5B, 0xDB, 0x11, 0xFA, 
-0x10, 0x6D, 0x96, 0x95, 0x26, 0xD1, 0xA6, 0x8E, 0xA7, 0x20, 0x63, 0xED, 0x69, 0xB3, 0xF6, 0x11, 
-0x07, 0x7C, 0x59, 0x69, 0xD2, 0x76, 0x06, 0xB1, 0x56, 0xBB, 0x59, 0x0D, 0x09, 0x31, 0xD0, 0x52, 
-0x44, 0x2D, 0x38, 0x69, 0x03, 0x2E, 0xA1, 0xEC, 0x0B, 0xC3, 0xC3, 0x05, 0xE5, 0xA2, 0x45, 0xE7, 
-0x42, 0x8B, 0x04, 0xED, 0x05, 0x27, 0x9A, 0x5C, 0xB7, 0xD8, 0x5D, 0xC2, 0x17, 0xF7, 0x2C, 0xF0, 
-0xE0, 0x30, 0xD0, 0xA3, 0x45, 0x41, 0x0B, 0x93, 0x76, 0xD0, 0xA2, 0x68, 0x69, 0xCA, 0x4D, 0xDD, 
-0xA9, 0x7F, 0xFD, 0xD6, 0x6F, 0x7F, 0xF9, 0xF5, 0x93, 0xF7, 0x7B, 0x24, 0xF1, 0xA8, 0x12, 0x2E, 
-0xC0, 0x15, 0x57, 0xFC, 0xD4, 0xBE, 0xA7, 0x3C, 0xE5, 0x49, 0x7F, 0x8E, 0x94, 0x7B, 0xFA, 0x83, 
-0xA5, 0x20, 0x12, 0x57, 0xF0, 0x8D, 0x64, 0x14, 0x23, 0xCF, 0xDF, 0xFE, 0xDD, 0x87, 0xB8, 0xE9, 
-0xB6, 0x3B, 0x68, 0xB5, 0x36, 0x93, 0xE7, 0x0A, 0xF4, 0x34, 0x24, 0xB3, 0xCC, 0x5E, 0x70, 0x11, 
-0xE9, 0x59, 0xDB, 0xB1, 0x59, 0x97, 0x52, 0x9A, 0x70, 0x85, 0xD1, 0x57, 0x7C, 0xD2, 0xBE, 0xF4, 
-0xD1, 0x45, 0x4D, 0xB8, 0xC7, 0x10, 0x6F, 0x6D, 0x8B, 0x1B, 0xEA, 0x95, 0xF3, 0x3A, 0xB4, 0x61, 
-0x20, 0x86, 0xFB, 0x0B, 0xA1, 0x36, 0xBA, 0x77, 0xD1, 0x3C, 0xA9, 0xF1, 0x2D, 0x97, 0xBA, 0x03, 
-0xC5, 0x30, 0x7A, 0xB6, 0x8E, 0x66, 0x16, 0x3B, 0x96, 0xF7, 0x16, 0x6B, 0x4B, 0x82, 0xB3, 0x68, 
-0x55, 0xDB, 0x86, 0xBA, 0xB8, 0xD2, 0x1B, 0x5C, 0x20, 0xF8, 0xC6, 0xF6, 0x37, 0xAE, 0xFA, 0xC6, 
-0xC5, 0xBA, 0x10, 0xBD, 0x9F, 0xEA, 0xCD, 0xE1, 0x71, 0x12, 0xB7, 0xD5, 0x12, 0xD9, 0x24, 0x42, 
-0x68, 0xA4, 0xB1, 0x9A, 0x60, 0xC7, 0x6E, 0xBF, 0x93, 0xC7, 0x80, 0x0F, 0x82, 0x0B, 0x75, 0x2F, 
-0x5E, 0x21, 0x57, 0xC6, 0x2D, 0xC4, 0x22, 0x8E, 0xCF, 0x8D, 0x24, 0x19, 0x5D, 0xEE, 0x56, 0x5F, 
-0xFB, 0xF4, 0xB6, 0xFA, 0x3E, 0x13, 0xDB, 0x78, 0x00, 0x68, 0xB4, 0xCC, 0x02, 0x5E, 0x04, 0x5F, 
-0x07, 0xE2, 0x59, 0xD6, 0x24, 0x1F, 0x8B, 0x63, 0xAF, 0xBF, 0x72, 0x3B, 0x2E, 0x26, 0x06, 0x5D, 
-0x99, 0xB0, 0x02, 0x58, 0x26, 0xDE, 0x7A, 0xB0, 0x25, 0x06, 0xDD, 0x1F, 0x97, 0x62, 0xEC, 0xBA, 
-0xEE, 0xA2, 0x9A, 0x4C, 0x51, 0xCF, 0xDE, 0x02, 0x01, 0x8B, 0x73, 0x31, 0xE3, 0x46, 0xD4, 0xC7, 
-0xD6, 0xED, 0x5E, 0x3C, 0xCA, 0x45, 0x33, 0xBF, 0xC9, 0x4D, 0xBC, 0x44, 0xCD, 0x9B, 0x0D, 0x04, 
-0x5B, 0x0F, 0x7E, 0x52, 0x7B, 0x7C, 0x35, 0x9E, 0x73, 0xB5, 0x1D, 0xEF, 0x43, 0x45, 0xBC, 0xEE, 
-0xB1, 0xF5, 0xD8, 0xD4, 0x55, 0xF3, 0x7B, 0x43, 0xFC, 0xCD, 0xC0, 0x48, 0xED, 0x3A, 0x2E, 0x22, 
-0x31, 0xE8, 0x55, 0xED, 0x46, 0x2B, 0x5E, 0xE3, 0xF3, 0xC0, 0x70, 0xBE, 0x60, 0x61, 0x6F, 0x8F, 
-0xA4, 0x48, 0x98, 0x36, 0x53, 0x84, 0xCA, 0xA2, 0xB5, 0x66, 0x80, 0x70, 0xD0, 0xC3, 0x3D, 0x3D, 
-0xC7, 0xE7, 0x1F, 0x98, 0xE7, 0x50, 0xA5, 0x08, 0x32, 0x45, 0xE5, 0xA1, 0x2A, 0x2D, 0x99, 0x56, 
-0xBE, 0x28, 0x97, 0x1E, 0xBC, 0xF4, 0x29, 0x17, 0xBE, 0xFB, 0xED, 0x6F, 0xFF, 0x6F, 0x07, 0x56, 
-0x97, 0xEB, 0x91, 0xC2, 0xA3, 0x4E, 0xB8, 0x57, 0x5E, 0x29, 0xEE, 0xDB, 0xBF, 0xFD, 0x1B, 0x6F, 
-0x98, 0x9E, 0x4A, 0xAF, 0xF1, 0x21, 0xB7, 0x59, 0x5A, 0x8F, 0xBE, 0x41, 0x61, 0x2B, 0x61, 0xE7, 
-0xCE, 0xFD, 0xFC, 0xC5, 0x5F, 0x7E, 0x80, 0x7B, 0xEF, 0x3B, 0xC8, 0xD4, 0xD4, 0x56, 0x60, 0x1A, 
-0x54, 0x17, 0xD9, 0x7C, 0x0E, 0xB3, 0xE7, 0x5F, 0x42, 0xBA, 0x65, 0x3B, 0x43, 0x95, 0xC6, 0x38, 
-0xBB, 0x49, 0x86, 0xD4, 0xF9, 0xCC, 0x1E, 0x7D, 0x4C, 0x56, 0xED, 0x84, 0xF4, 0x44, 0xDD, 0xF9, 
-0x4E, 0x0A, 0xB5, 0x9F, 0xFA, 0x31, 0xC7, 0xC7, 0x85, 0xA6, 0xE5, 0xCF, 0xC9, 0x3B, 0xD4, 0xDF, 
-0xEB, 0xC5, 0x0F, 0x55, 0xE7, 0xB7, 0x52, 0xE3, 0x0E, 0xDF, 0xB8, 0xE2, 0xC6, 0xEE, 0xDD, 0x4C, 
-0x1B, 0x7D, 0x13, 0x4E, 0x4F, 0xC5, 0xF3, 0x1F, 0x7A, 0x97, 0x63, 0x4C, 0x5C, 0x8D, 0xF4, 0x4C, 
-0x5D, 0xE2, 0xA6, 0xB4, 0xCB, 0x52, 0x54, 0x4D, 0x88, 0x21, 0x9C, 0xA1, 0xFB, 0xB2, 0x4C, 0xEA, 
-0xAB, 0x77, 0xAF, 0xC0, 0xCA, 0x7A, 0x8D, 0xC4, 0x3B, 0x59, 0xAE, 0x65, 0x3C, 0xD2, 0x6D, 0x6A, 
-0xD9, 0x9A, 0x65, 0xF9, 0x9D, 0xAE, 0x7C, 0x2B, 0x2B, 0x6B, 0xAA, 0x51, 0x4D, 0x08, 0xB1, 0xBD, 
-0x48, 0x88, 0x6E, 0xC9, 0xDA, 0xAB, 0x18, 0x2E, 0xB2, 0xFE, 0x5C, 0x6E, 0x4B, 0xAB, 0xDB, 0xD4, 
-0x23, 0x8B, 0xD5, 0x03, 0xF6, 0x6A, 0x72, 0x56, 0x26, 0x89, 0x89, 0x5A, 0xBD, 0xC2, 0xA8, 0x0C, 
-0x2A, 0xC5, 0xE0, 0xC8, 0x88, 0xD1, 0x91, 0x82, 0xA4, 0xCA, 0xC8, 0x68, 0x11, 0xCA, 0x80, 0x49, 
-0x52, 0x06, 0xC1, 0xB3, 0xA8, 0x14, 0xFB, 0x9C, 0x70, 0xE3, 0x03, 0x07, 0xB9, 0x6F, 0xA9, 0xA2, 
-0x94, 0x2E, 0xFD, 0x50, 0x20, 0x3A, 0x41, 0x82, 0x67, 0x54, 0xCD, 0x8F, 0x36, 0x4F, 0x75, 0x3F, 
-0xF2, 0xCB, 0xBF, 0xFA, 0xC6, 0x9B, 0x45, 0xCE, 0xC0, 0x88, 0x72, 0x9A, 0x78, 0x54, 0x75, 0xB8, 
-0x0D, 0xAE, 0xBF, 0xFE, 0x5F, 0xCB, 0x0B, 0x2E, 0x78, 0xA6, 0x9B, 0x5F, 0x38, 0xFA, 0x22, 0xE7, 
-0x64, 0xB3, 0x46, 0x44, 0x87, 0x68, 0xC4, 0x5F, 0xF9, 0x8A, 0x23, 0x0B, 0x47, 0xB8, 0xFC, 0x19, 
-0xCF, 0xE0, 0xC2, 0x0B, 0x2E, 0x44, 0xB9, 0x0A, 0x6F, 0x2B, 0x74, 0x27, 0x45, 0x25, 0x0A, 0x3B, 
-0xEC, 0x33, 0x58, 0x3C, 0x8A, 0x72, 0x51, 0x2F, 0x15, 0xA5, 0xB5, 0xE5, 0x40, 0x23, 0x8F, 0x1E, 
-0x56, 0x37, 0xE8, 0xA6, 0xC3, 0x36, 0xB2, 0x4B, 0xDC, 0xD6, 0xFE, 0x17, 0x8F, 0x17, 0x84, 0xE8, 
-0x12, 0xB0, 0xBC, 0x7F, 0xFC, 0x19, 0x17, 0xD2, 0xD7, 0xF8, 0xAC, 0x8F, 0x1D, 0x7F, 0x36, 0xE7, 
-0x6B, 0x64, 0xAC, 0x97, 0x94, 0x28, 0x21, 0x35, 0x0A, 0xCD, 0x66, 0x81, 0x4C, 0x02, 0xA8, 0x65, 
-0x7D, 0x6B, 0xD4, 0xA2, 0x9E, 0x1E, 0x82, 0xC4, 0xFB, 0x4E, 0x3E, 0x27, 0x34, 0xFA, 0xD1, 0xF8, 
-0x74, 0x63, 0x52, 0x9C, 0xD4, 0x71, 0x53, 0x4B, 0x47, 0x21, 0x7E, 0x3F, 0xFD, 0x4D, 0xAD, 0xB1, 
-0xAF, 0x26, 0xD4, 0x5A, 0x97, 0xDB, 0x94, 0x63, 0xF5, 0x46, 0x88, 0xAB, 0xE6, 0x27, 0x87, 0xF5, 
-0x0E, 0x6C, 0xF6, 0xAF, 0x26, 0xEA, 0xA6, 0x2C, 0xCB, 0x04, 0xB9, 0x36, 0xEA, 0xF7, 0x36, 0xD6, 
-0x39, 0x37, 0xEF, 0xBD, 0xA9, 0xC3, 0xBA, 0x06, 0xE3, 0x88, 0x1C, 0x7F, 0x97, 0x78, 0x94, 0x0A, 
-0x12, 0x09, 0x76, 0xF2, 0xDF, 0xB8, 0x3D, 0x50, 0x5F, 0x6D, 0xE5, 0xEF, 0xAB, 0x27, 0x21, 0x72, 
-0x9C, 0x92, 0x9D, 0x0C, 0x9A, 0xF7, 0x78, 0x2C, 0xE2, 0x7B, 0x89, 0xE3, 0xC3, 0xF2, 0x0D, 0x25, 
-0xD4, 0x27, 0xC5, 0xD8, 0x37, 0x75, 0x53, 0x34, 0x68, 0x52, 0xB0, 0x09, 0xA3, 0xF9, 0x8A, 0x85, 
-0xFD, 0x03, 0xCA, 0x25, 0x48, 0x43, 0x46, 0x4B, 0x5A, 0x31, 0xB5, 0xBC, 0x36, 0xF4, 0x4C, 0x8B, 
-0x83, 0xAA, 0xC3, 0x17, 0x0E, 0xF5, 0xF8, 0xD4, 0x7D, 0x07, 0x79, 0x20, 0x28, 0x2A, 0x3A, 0x40, 
-0x82, 0xD1, 0x1A, 0xE7, 0x47, 0x3E, 0xC5, 0xDF, 0xF2, 0xF5, 0x2F, 0xBE, 0xFC, 0x77, 0x7E, 0xF9, 
-0x57, 0x7F, 0x7E, 0xE7, 0xEA, 0x12, 0x3D, 0x92, 0x58, 0xCD, 0x0A, 0x8F, 0x1A, 0xDE, 0xF0, 0x86, 
-0xEF, 0xFA, 0x7C, 0x96, 0xF1, 0x8F, 0xA9, 0x09, 0x65, 0xE5, 0x46, 0x04, 0x25, 0x28, 0x49, 0x70, 
-0xCE, 0xB0, 0x7F, 0xEF, 0x02, 0xEF, 0x7F, 0xFF, 0xC7, 0xB8, 0xF9, 0xA6, 0x3B, 0x51, 0xC9, 0x26, 
-0x92, 0xCE, 0x56, 0x08, 0x2D, 0x68, 0xCF, 0xD1, 0xDE, 0xFE, 0x24, 0xF4, 0x59, 0xE7, 0x31, 0xD4, 
-0x2D, 0x06, 0x5E, 0xE3, 0x75, 0x8C, 0x2D, 0xFA, 0x50, 0x14, 0xFE, 0x67, 0x06, 0xF5, 0xF4, 0x70, 
-0xBC, 0x9D, 0x1A, 0xD4, 0x38, 0xE0, 0xC7, 0xCA, 0x07, 0xA9, 0xFB, 0xD7, 0xF8, 0xEF, 0xF5, 0x3F, 
-0xE3, 0x2C, 0x61, 0x72, 0x2A, 0xDB, 0xA8, 0x5A, 0x1A, 0x9D, 0x6D, 0xC4, 0x72, 0xD9, 0x04, 0x62, 
-0x9C, 0xDB, 0xBA, 0x61, 0x9C, 0xD4, 0x54, 0x79, 0x1D, 0xA8, 0xDA, 0xB5, 0xBE, 0xD9, 0x26, 0x11, 
-0xEA, 0xF7, 0xD3, 0x6C, 0x93, 0xCD, 0x50, 0x85, 0x65, 0x1B, 0xD9, 0x33, 0x8D, 0x93, 0x7D, 0x9E, 
-0xD5, 0x6D, 0xE7, 0x64, 0xCE, 0x39, 0xD3, 0x98, 0x7C, 0xCF, 0xC7, 0xA0, 0xD6, 0xF9, 0x36, 0x68, 
-0xE2, 0x1B, 0xC4, 0xA6, 0x16, 0x17, 0x46, 0x1B, 0xD9, 0x78, 0xDC, 0x0E, 0xC6, 0x9F, 0xCB, 0x7A, 
-0xEB, 0x65, 0xC2, 0x5B, 0xE3, 0xA1, 0xCF, 0x00, 0x8E, 0x57, 0xDF, 0xCB, 0x3A, 0xE4, 0x88, 0x95, 
-0xC7, 0x29, 0x6C, 0x11, 0x10, 0xD5, 0x86, 0xD0, 0x66, 0x74, 0xB8, 0x60, 0x61, 0x5F, 0x0F, 0xDB, 
-0xF3, 0x64, 0x21, 0x21, 0x21, 0xC5, 0x7B, 0x81, 0x56, 0x97, 0xA3, 0x3E, 0xA1, 0x97, 0xCD, 0x72, 
-0x6F, 0xDF, 0xF2, 0xF9, 0x9D, 0xFB, 0x39, 0xE4, 0x13, 0x2C, 0xD3, 0x58, 0x04, 0x93, 0x18, 0x72, 
-0x3B, 0xA0, 0x62, 0x30, 0xBC, 0xE0, 0xBC, 0x6D, 0xEF, 0xFF, 0xD1, 0x2B, 0xBF, 0x73, 0xEC, 0x62, 
-0xFB, 0x68, 0xE1, 0x31, 0x21, 0xE1, 0x02, 0x7C, 0xEA, 0x53, 0xFF, 0x3C, 0xFC, 0xB7, 0xDF, 0xF3, 
-0xFA, 0xBB, 0xEF, 0xB9, 0x6B, 0xC7, 0xCB, 0x9C, 0x77, 0xDB, 0x7D, 0x08, 0x4A, 0x25, 0x06, 0x1F, 
-0x02, 0xA1, 0x2A, 0xD9, 0xB7, 0xFF, 0x20, 0xAD, 0x34, 0xE5, 0x79, 0xCF, 0x7B, 0x1E, 0xED, 0x76, 
-0x0A, 0xCA, 0x21, 0x80, 0x4E, 0x0D, 0x0A, 0x4F, 0x7F, 0x61, 0x01, 0x5B, 0x8E, 0x48, 0x75, 0x9D, 
-0x1A, 0xBA, 0x96, 0x00, 0x1E, 0x3D, 0x4C, 0x0C, 0xD9, 0x6B, 0x6E, 0xB1, 0x74, 0x71, 0x85, 0x7C, 
-0xF5, 0x56, 0x4B, 0x2B, 0xA2, 0x26, 0x24, 0x81, 0xD8, 0x20, 0x63, 0x0C, 0xAA, 0x28, 0xD1, 0xAC, 
-0x85, 0x46, 0xA2, 0x5D, 0xEE, 0x47, 0x75, 0xCF, 0x15, 0xC6, 0x3A, 0xBE, 0x48, 0xBC, 0x51, 0x85, 
-0xB0, 0xE2, 0x9E, 0x44, 0xBB, 0x50, 0xC5, 0xB1, 0x23, 0xD6, 0xDA, 0xD2, 0xCA, 0xFA, 0x98, 0x94, 
-0x19, 0x8F, 0x7D, 0xF6, 0xB5, 0xB6, 0x33, 0x8D, 0x95, 0xD7, 0x6F, 0xF4, 0x9E, 0x27, 0x5B, 0xA6, 
-0xA8, 0x57, 0x3C, 0x99, 0x72, 0xAD, 0x57, 0x2F, 0x27, 0x78, 0xAE, 0x7A, 0x30, 0x8D, 0xEF, 0x71, 
-0x72, 0x8B, 0xE7, 0x34, 0xEF, 0x77, 0x59, 0xF2, 0x0C, 0x13, 0x91, 0x1C, 0xEA, 0xF7, 0x31, 0x31, 
-0x33, 0x6E, 0x34, 0xD4, 0xE3, 0xF3, 0xD6, 0x79, 0xCA, 0xE8, 0xD5, 0x36, 0xA9, 0xAB, 0x6E, 0xAC, 
-0x48, 0x1A, 0xAB, 0x90, 0xA6, 0x4C, 0x0F, 0x1D, 0x8D, 0xE0, 0x13, 0x22, 0xDD, 0xD7, 0x7B, 0xE3, 
-0xE7, 0xB8, 0x3D, 0xC5, 0xFC, 0xEE, 0xF1, 0x88, 0xBA, 0x6C, 0x31, 0x7E, 0x44, 0x0A, 0x2E, 0xC5, 
-0xCE, 0x5B, 0x7A, 0xFB, 0x06, 0x14, 0xF3, 0x96, 0xD4, 0xB7, 0x48, 0x55, 0x06, 0x41, 0xA8, 0x1C, 
-0xB8, 0xD6, 0x14, 0xBD, 0x6C, 0x86, 0xFB, 0x0A, 0xC5, 0x35, 0xF7, 0x1D, 0xE0, 0xE6, 0x43, 0x8B, 
-0x2C, 0xC8, 0x14, 0x45, 0xD2, 0x02, 0xA5, 0xA8, 0x6C, 0x0E, 0x54, 0x65, 0x37, 0xD1, 0xD7, 0xBD, 
-0xF6, 0x35, 0xAF, 0xFC, 0xE5, 0x9F, 0xFF, 0xF5, 0x37, 0x3D, 0xA2, 0x4E, 0x0E, 0x6B, 0xE1, 0x31, 
-0x23, 0xE1, 0x02, 0x7C, 0xCF, 0xF7, 0xBC, 0xE4, 0x41, 0x2F, 0xF9, 0xFB, 0x7D, 0xC8, 0xFB, 0x2E, 
-0x78, 0x90, 0x04, 0xAD, 0xDA, 0x28, 0x33, 0xCB, 0xB0, 0x1F, 0xF8, 0xD8, 0xC7, 0xAF, 0xE3, 0x9A, 
-0x4F, 0xDF, 0xC8, 0xA8, 0x54, 0x04, 0xE9, 0x42, 0xD2, 0x81, 0x4D, 0xDB, 0xE9, 0x9E, 0x73, 0x11, 
-0xC9, 0xF6, 0x73, 0x28, 0x5B, 0x6D, 0x6C, 0x3D, 0x9A, 0x3F, 0xEA, 0x8F, 0x26, 0xF5, 0x22, 0xC6, 
-0xE4, 0x76, 0xB2, 0x38, 0x89, 0x63, 0x8F, 0xB7, 0x30, 0x18, 0xB9, 0xB2, 0x5E, 0x3C, 0x9C, 0xD8, 
-0xBC, 0x44, 0x93, 0xB1, 0x30, 0x76, 0xE9, 0x5C, 0x86, 0x0E, 0xA0, 0xBD, 0x8C, 0xB7, 0x13, 0x75, 
-0xB9, 0x49, 0xFD, 0xDB, 0xEA, 0x8D, 0xB1, 0x35, 0x42, 0xED, 0x2A, 0x1B, 0xA2, 0xE5, 0x48, 0x98, 
-0x88, 0xAB, 0xEB, 0xC6, 0x99, 0x12, 0x96, 0x31, 0x41, 0x01, 0x8F, 0x3A, 0x4E, 0x8E, 0x6C, 0x1F, 
-0x3E, 0x2C, 0x4B, 0xFF, 0xF5, 0xF7, 0xA6, 0x3C, 0xCD, 0xA2, 0xD6, 0x71, 0xDE, 0x3F, 0xE3, 0x59, 
-0x4C, 0xBD, 0x9D, 0x68, 0x8E, 0xD5, 0x48, 0xC8, 0x13, 0xB3, 0xA1, 0x87, 0x82, 0x93, 0xA9, 0xB9, 
-0xD5, 0xD2, 0xEF, 0x78, 0xA1, 0x4C, 0xE2, 0xB0, 0x8F, 0x69, 0x31, 0x5C, 0xC8, 0x59, 0xD8, 0xDB, 
-0xA3, 0x5A, 0x80, 0xB6, 0xEB, 0x92, 0xB9, 0x98, 0xDE, 0xC8, 0x7B, 0x8F, 0x37, 0x86, 0xA1, 0x68, 
-0x06, 0xD9, 0x2C, 0x5F, 0xDA, 0xDF, 0xE3, 0xE6, 0xDD, 0xF3, 0x2C, 0xD2, 0x61, 0x84, 0xC6, 0x86, 
-0xC6, 0xCE, 0x38, 0x0F, 0x81, 0xFC, 0xC0, 0xEC, 0x96, 0xE9, 0xF7, 0x6C, 0x7F, 0xF2, 0x5B, 0x0F, 
-0xAF, 0x28, 0xC0, 0xA3, 0x84, 0xC7, 0x8C, 0x84, 0x0B, 0xF0, 0xFE, 0xF7, 0xBF, 0x3F, 0x7C, 0xC7, 
-0x77, 0x5C, 0xF9, 0xC0, 0xBE, 0x7D, 0x87, 0xB7, 0x15, 0xD6, 0x3D, 0xCB, 0x07, 0xA5, 0x43, 0x25, 
-0xD1, 0x06, 0x4F, 0x84, 0xC5, 0xFE, 0x02, 0x22, 0x8E, 0x8B, 0x2F, 0xB9, 0x90, 0xB3, 0xB6, 0x6E, 
-0xC2, 0xE8, 0x68, 0x4A, 0x83, 0xF2, 0x64, 0xDA, 0xE3, 0x46, 0x03, 0x58, 0x3C, 0x4A, 0xE2, 0x2A, 
-0xB4, 0xC4, 0x51, 0xFF, 0x51, 0x41, 0x2D, 0x41, 0x1E, 0x03, 0xA1, 0x96, 0xBC, 0x1B, 0xF9, 0xA2, 
-0x91, 0x3E, 0x97, 0xB7, 0xB8, 0x2F, 0x1E, 0xEE, 0xC5, 0x47, 0x79, 0xB6, 0xB6, 0x47, 0x8C, 0xDB, 
-0xF2, 0xDF, 0x02, 0x2B, 0xCF, 0x1B, 0x9F, 0x1B, 0x62, 0x17, 0xAB, 0x15, 0x63, 0xBE, 0x96, 0x70, 
-0xC7, 0x3A, 0xDB, 0x89, 0x4D, 0x6A, 0xE7, 0x87, 0x26, 0x72, 0x95, 0x10, 0xE3, 0x3B, 0xC4, 0x38, 
-0xAF, 0x2B, 0x0F, 0x8E, 0x1E, 0x51, 0xAB, 0x2E, 0xB0, 0xC6, 0x26, 0xE3, 0x19, 0x86, 0x8F, 0xF2, 
-0x92, 0xF8, 0x5A, 0x26, 0x8F, 0x4E, 0x05, 0x8C, 0x17, 0xD1, 0x02, 0x6A, 0x75, 0x39, 0xEA, 0xAB, 
-0xC4, 0xFF, 0x4E, 0x1F, 0xCB, 0x75, 0x4C, 0x1C, 0x00, 0x8E, 0x29, 0xE5, 0xF1, 0xB7, 0x93, 0x2F, 
-0xC0, 0xC9, 0x1E, 0xB7, 0x76, 0xDD, 0xC5, 0x20, 0x31, 0xB5, 0x12, 0x1E, 0x26, 0x7E, 0x8B, 0xF6, 
-0xB8, 0xF1, 0x7D, 0xD7, 0xF3, 0x9A, 0x55, 0xDF, 0x19, 0xB7, 0x87, 0x95, 0x6D, 0x22, 0x4A, 0x96, 
-0x71, 0x40, 0x1B, 0x4F, 0x4C, 0x26, 0x66, 0x3A, 0x51, 0x67, 0x1E, 0x7F, 0x50, 0x63, 0x1D, 0xFF, 
-0xE4, 0xBF, 0xE6, 0x98, 0x87, 0x86, 0xC9, 0x01, 0x43, 0x42, 0x23, 0xD5, 0xC6, 0x9D, 0x0D, 0xD9, 
-0x0A, 0x0D, 0xD9, 0x46, 0xA2, 0xF7, 0xDE, 0xE3, 0x3D, 0xE4, 0x4B, 0x25, 0x0B, 0xFB, 0xFB, 0x14, 
-0x07, 0x2D, 0x49, 0xD5, 0xA2, 0x1D, 0x32, 0x54, 0x9D, 0xC9, 0x25, 0x68, 0xC1, 0x67, 0x6D, 0x0E, 
-0x5B, 0xCD, 0xED, 0xF3, 0x39, 0x9F, 0xBE, 0x77, 0x3F, 0x77, 0x8D, 0x4A, 0x86, 0x6A, 0x96, 0x52, 
-0x25, 0xF1, 0xF9, 0xA3, 0x29, 0x46, 0x6F, 0xCB, 0xDC, 0xA6, 0xFF, 0xFD, 0xE2, 0x97, 0xBC, 0xF0, 
-0xCF, 0xDF, 0xF9, 0xCE, 0x6F, 0x1F, 0x2D, 0x97, 0xE6, 0xD1, 0xC3, 0x43, 0x1F, 0xCE, 0xCE, 0x30, 
-0xFE, 0xE1, 0x1F, 0xDE, 0xB1, 0xE7, 0xEB, 0xBE, 0xEE, 0xB9, 0x7F, 0x8C, 0xAB, 0xEE, 0x31, 0x4A, 
-0xFB, 0x54, 0x1B, 0x04, 0x83, 0xB5, 0x86, 0xD4, 0xCC, 0xF1, 0x4F, 0x1F, 0xB9, 0x8E, 0x3F, 0xFC, 
-0xFF, 0xFE, 0x92, 0xFE, 0x50, 0x70, 0xA1, 0x85, 0x0B, 0x29, 0xB4, 0x67, 0x48, 0xCF, 0x7F, 0x32, 
-0xDD, 0xB3, 0x2F, 0x64, 0xD8, 0x9A, 0x21, 0x4F, 0xBB, 0xB8, 0x7A, 0x2C, 0x89, 0x0D, 0x31, 0x4A, 
-0x74, 0x8D, 0xC4, 0xB7, 0x2C, 0xFF, 0xAE, 0x92, 0x86, 0xA5, 0x71, 0x33, 0x3D, 0xAE, 0x3C, 0xF0, 
-0xB0, 0x62, 0xB9, 0x91, 0xAE, 0x57, 0x86, 0x71, 0x0F, 0x3A, 0x46, 0x42, 0x6C, 0xB0, 0x2C, 0x1D, 
-0x2D, 0xE7, 0xDB, 0x5A, 0xAB, 0xFB, 0xC4, 0xCE, 0xBE, 0x1A, 0xEB, 0xCF, 0x0E, 0xCE, 0xA4, 0xD4, 
-0xD7, 0xDC, 0x25, 0x4C, 0xD8, 0xC7, 0x9E, 0x59, 0x34, 0x1D, 0x7B, 0xE5, 0xF7, 0xA8, 0x1B, 0x5F, 
-0xFE, 0xBE, 0xF6, 0xE7, 0x5A, 0xF5, 0xF2, 0xC8, 0x62, 0xF2, 0xDD, 0xAE, 0x57, 0xEF, 0xEB, 0xED, 
-0x3F, 0x13, 0x88, 0x96, 0x2D, 0x6B, 0xE8, 0xDF, 0x6B, 0x32, 0x8E, 0x43, 0xF9, 0xDA, 0x5B, 0x53, 
-0x83, 0xF1, 0xDC, 0xF8, 0xA6, 0x63, 0x10, 0xFF, 0xD0, 0x28, 0x9A, 0x51, 0x12, 0xED, 0x8D, 0xA3, 
-0xDD, 0x71, 0x34, 0x61, 0x13, 0x2B, 0xE8, 0x42, 0xA1, 0x86, 0x86, 0xF9, 0xDD, 0x8B, 0x14, 0x0B, 
-0x0E, 0xB1, 0xD1, 0xD2, 0x22, 0x84, 0x3A, 0x0E, 0x87, 0xCA, 0xF0, 0xD9, 0x14, 0xC3, 0x74, 0x86, 
-0x03, 0x2E, 0xE5, 0xB3, 0x3B, 0xF6, 0x71, 0xF7, 0xC2, 0x90, 0x21, 0xD3, 0xF4, 0xBC, 0x02, 0x95, 
-0xC4, 0x8C, 0xCA, 0x21, 0xB7, 0xC6, 0xF8, 0xCF, 0xBF, 0xF4, 0x65, 0x2F, 0xFC, 0xF3, 0x7F, 0xF8, 
-0x87, 0xDF, 0x5D, 0x5C, 0xF9, 0x14, 0x8F, 0x1E, 0xD6, 0xEE, 0x59, 0x8F, 0x22, 0x44, 0xC4, 0xBF, 
-0xE4, 0x25, 0x3F, 0x78, 0xEB, 0xA6, 0x4D, 0x9D, 0x3F, 0xF2, 0xE5, 0xF0, 0x40, 0xE9, 0x86, 0xE0, 
-0x03, 0x59, 0x32, 0x43, 0x31, 0xCC, 0xB0, 0xC5, 0x0C, 0xD7, 0x7F, 0xEE, 0x1E, 0x3E, 0xF4, 0x8F, 
-0xD7, 0x52, 0xDA, 0x94, 0x10, 0x12, 0xF0, 0x09, 0x98, 0x19, 0xA6, 0x2E, 0x79, 0x16, 0xE6, 0xA2, 
-0xCB, 0x38, 0xD2, 0x9A, 0x25, 0x57, 0x09, 0x41, 0x14, 0xB9, 0x2B, 0x28, 0xB0, 0x48, 0x2A, 0x78, 
-0xE5, 0xB0, 0x45, 0x11, 0xA5, 0x9F, 0xDA, 0x54, 0xCA, 0x07, 0x85, 0x0F, 0x31, 0xD0, 0x89, 0x0A, 
-0x01, 0x45, 0x55, 0x6F, 0xEB, 0x11, 0x5E, 0xC4, 0x71, 0x1B, 0x7B, 0x58, 0x5B, 0x9A, 0x21, 0x2C, 
-0x47, 0x0E, 0x68, 0xA6, 0x79, 0x6B, 0x6D, 0x11, 0xB1, 0x7C, 0x7A, 0xCD, 0x7F, 0xCB, 0xB6, 0x95, 
-0x4D, 0x83, 0x0E, 0xD2, 0x6C, 0xCB, 0xE7, 0x7B, 0x89, 0xF7, 0x84, 0x68, 0xEB, 0x24, 0xB5, 0xA9, 
-0x58, 0xB3, 0x35, 0x53, 0x48, 0x5F, 0xDB, 0xFF, 0x7A, 0x05, 0x5E, 0x5C, 0xF4, 0x68, 0xE3, 0x18, 
-0xE1, 0x3B, 0x12, 0xA3, 0x8F, 0x11, 0xB6, 0x56, 0xEF, 0x5F, 0x71, 0x4C, 0x68, 0xE4, 0xF8, 0x46, 
-0xCE, 0x6D, 0xEA, 0xA3, 0x8E, 0x8E, 0xB6, 0x6A, 0x8B, 0x5A, 0x88, 0xA8, 0x66, 0x68, 0x36, 0x8E, 
-0xAD, 0xBD, 0x53, 0xDA, 0xE2, 0x94, 0x75, 0xE2, 0x5D, 0xD4, 0x9F, 0xD1, 0x21, 0x63, 0xA2, 0x5E, 
-0xD6, 0xFA, 0x5C, 0xB5, 0x45, 0x0B, 0x0F, 0x7D, 0xCC, 0xFE, 0x78, 0xCE, 0xDA, 0x68, 0xA6, 0xCC, 
-0xCB, 0x5B, 0xB4, 0x9F, 0x6E, 0xB6, 0xE6, 0x6D, 0xAF, 0x9E, 0xF6, 0xBB, 0xDA, 0x36, 0x7A, 0xD2, 
-0x7E, 0xF6, 0xD8, 0xB7, 0x3F, 0xF1, 0xF7, 0x2A, 0x5B, 0xDB, 0x71, 0xBB, 0xF1, 0x42, 0xD2, 0xA8, 
-0x88, 0x82, 0x42, 0x4F, 0xD8, 0xE2, 0x8A, 0x97, 0x71, 0x9C, 0x89, 0xA6, 0xC6, 0x27, 0x55, 0x10, 
-0xD0, 0xBC, 0xCB, 0xB8, 0xD0, 0xD6, 0x2C, 0x62, 0x46, 0xA9, 0x39, 0xD4, 0x51, 0xBB, 0x26, 0xB7, 
-0xE8, 0x38, 0x11, 0xF3, 0x31, 0x08, 0xC1, 0x0B, 0x26, 0x68, 0xB4, 0xAB, 0xED, 0x7E, 0x7D, 0x6C, 
-0x0B, 0x5E, 0x54, 0x6C, 0x15, 0xE2, 0x91, 0x50, 0x22, 0xB5, 0x93, 0x86, 0x73, 0x0E, 0xBC, 0x46, 
-0x6C, 0x86, 0x3B, 0x0C, 0xF3, 0xF7, 0x2C, 0x50, 0xEE, 0x75, 0x64, 0x79, 0x46, 0xA6, 0x92, 0x98, 
-0xD6, 0x25, 0xF1, 0xF8, 0x44, 0x33, 0x52, 0x2D, 0x8E, 0xCA, 0x2C, 0xBB, 0xDD, 0x14, 0x9F, 0xDB, 
-0x37, 0xE4, 0xB6, 0x23, 0x23, 0xF6, 0x86, 0x84, 0x3C, 0xED, 0xA0, 0xD2, 0x0C, 0x6B, 0x3D, 0xCA, 
-0x3B, 0x2F, 0xBE, 0xB8, 0x7B, 0xDB, 0xE6, 0xCE, 0x1F, 0x7E, 0xF0, 0x39, 0xBF, 0x7F, 0xFF, 0xEA, 
-0x44, 0x8E, 0x8F, 0x26, 0x1E, 0x53, 0x2A, 0x85, 0x06, 0xD7, 0x5E, 0xFB, 0x17, 0xFE, 0x3F, 0xFC, 
-0xE0, 0x4F, 0xEC, 0xFE, 0xE2, 0x6D, 0x5F, 0x3E, 0x27, 0x51, 0xC9, 0xB3, 0x95, 0xCE, 0xB4, 0xF7, 
-0x02, 0x3A, 0xA5, 0xB2, 0x8E, 0x51, 0x3E, 0xE2, 0xC0, 0xFE, 0xBD, 0xB4, 0x3B, 0x09, 0xCF, 0x7E, 
-0xCE, 0x65, 0xD8, 0x2A, 0x8F, 0x39, 0xCC, 0x8C, 0xC6, 0x64, 0x09, 0xC5, 0x60, 0x40, 0x58, 0x9A, 
-0x47, 0xF9, 0x12, 0x95, 0x18, 0x90, 0x80, 0xB7, 0x15, 0x86, 0x40, 0x6A, 0x12, 0xB0, 0x21, 0x3A, 
-0x1B, 0x84, 0x68, 0x0E, 0xE3, 0x1B, 0xCF, 0xA3, 0x5A, 0xC2, 0x25, 0x10, 0x93, 0x23, 0xC6, 0xBD, 
-0xC7, 0xC5, 0xFA, 0x8B, 0x49, 0xAB, 0x29, 0x60, 0xBD, 0xE3, 0x8E, 0x45, 0x23, 0x25, 0xAC, 0x8F, 
-0xE3, 0xFF, 0xCA, 0x98, 0xB8, 0x9B, 0xE3, 0xE2, 0xE7, 0x4A, 0x57, 0xDE, 0x95, 0xD7, 0x58, 0x2D, 
-0xA5, 0x3C, 0x54, 0xC4, 0x69, 0x6E, 0x93, 0x0F, 0x6E, 0x65, 0x39, 0x4E, 0x06, 0xEB, 0xD7, 0xEB, 
-0x49, 0xA2, 0x21, 0x50, 0x38, 0x8D, 0xCF, 0x47, 0x1F, 0xC7, 0x33, 0x6B, 0x5C, 0xFF, 0x97, 0x65, 
-0x8C, 0xCD, 0xC0, 0x6A, 0x15, 0xC1, 0x09, 0x4F, 0x9A, 0xB8, 0x9F, 0x4C, 0x1C, 0x1E, 0x42, 0x33, 
-0x92, 0x2E, 0xAB, 0x82, 0xA2, 0x7C, 0x3B, 0x79, 0xC1, 0x66, 0xC0, 0x5A, 0x56, 0x51, 0xF8, 0xB2, 
-0x44, 0x2B, 0x85, 0x4A, 0x63, 0xB2, 0x4A, 0x4F, 0x88, 0x49, 0x38, 0x43, 0x1D, 0x0A, 0x53, 0xA2, 
-0xB1, 0x45, 0x40, 0x93, 0x98, 0x36, 0x52, 0x68, 0xCA, 0x23, 0x15, 0xFD, 0xFD, 0x23, 0x8A, 0xA3, 
-0x96, 0x96, 0x9A, 0x41, 0xAC, 0xC2, 0x10, 0x75, 0xFF, 0x79, 0x65, 0xA9, 0x4C, 0x4A, 0xD9, 0x99, 
-0xE3, 0xA8, 0x99, 0xE5, 0xFA, 0x07, 0x8F, 0xF0, 0xC9, 0x3B, 0x1E, 0xE4, 0x41, 0x67, 0x58, 0x08, 
-0x19, 0x56, 0xA7, 0x38, 0x2F, 0x04, 0x9F, 0x87, 0x10, 0xF2, 0xC5, 0xAD, 0x9B, 0xA6, 0xDE, 0xF9, 
-0xC6, 0x37, 0xFD, 0xF0, 0x07, 0x5E, 0x7E, 0xD5, 0xD7, 0x3F, 0x26, 0x54, 0x09, 0x0D, 0x1E, 0x93, 
-0x84, 0x0B, 0x70, 0xC3, 0x2D, 0x9F, 0xEA, 0x3F, 0xFB, 0x79, 0xDF, 0xB0, 0xEB, 0xC0, 0xBE, 0x83, 
-0xDF, 0x50, 0xF8, 0x62, 0x5B, 0x62, 0x3A, 0x4A, 0x14, 0x31, 0x67, 0x96, 0x12, 0xF6, 0xEE, 0xDF, 
-0x47, 0x65, 0x2D, 0x4F, 0x7B, 0xEA, 0xA5, 0x5C, 0x70, 0xD1, 0xB9, 0x60, 0x87, 0xA0, 0x3D, 0xC9, 
-0xD4, 0x34, 0x49, 0x59, 0x30, 0x38, 0x7A, 0x00, 0x5B, 0x8C, 0x10, 0x20, 0xD5, 0x1A, 0x29, 0x6D, 
-0x0C, 0x7E, 0xA7, 0x14, 0x2E, 0x06, 0x23, 0xC5, 0xC9, 0xB2, 0x0B, 0x67, 0x94, 0x7A, 0xEB, 0xA6, 
-0x56, 0xEB, 0x2A, 0x4F, 0x86, 0x70, 0xE1, 0x0C, 0x90, 0xC3, 0x1A, 0x78, 0xA8, 0x57, 0x5C, 0x8B, 
-0x34, 0x1F, 0x8E, 0x72, 0xAE, 0x8B, 0x47, 0x5D, 0xA8, 0x78, 0x04, 0x9F, 0xF5, 0x61, 0xC0, 0xF1, 
-0x08, 0xF7, 0x64, 0x30, 0x26, 0xCC, 0x49, 0xF6, 0x5C, 0x03, 0xBE, 0x19, 0xE0, 0x27, 0xEE, 0x17, 
-0xBF, 0x03, 0xF5, 0x1A, 0xC2, 0xB2, 0x7A, 0xA3, 0xA1, 0xEF, 0x65, 0x2A, 0xD7, 0x75, 0xE0, 0x7A, 
-0x09, 0xD4, 0xFA, 0x7F, 0x85, 0xAA, 0x17, 0x48, 0xC5, 0x08, 0x56, 0xC0, 0xFA, 0x18, 0x99, 0x4C, 
-0x69, 0xC1, 0x68, 0x85, 0x11, 0x1D, 0x93, 0x94, 0x4A, 0x8A, 0x0E, 0x1D, 0x7C, 0x91, 0x30, 0x9A, 
-0xB7, 0x2C, 0x1C, 0x18, 0x31, 0x3A, 0x52, 0xE2, 0x0B, 0x21, 0xD1, 0x19, 0xDE, 0x39, 0x52, 0x6D, 
-0x10, 0x49, 0x28, 0x83, 0x10, 0xBA, 0x73, 0xCC, 0x4B, 0x9B, 0xAF, 0x1C, 0x1E, 0xF0, 0xA9, 0x3B, 
-0x1E, 0xE0, 0xEE, 0x7E, 0xC1, 0x62, 0x68, 0x23, 0xED, 0x59, 0xF2, 0xA2, 0x44, 0x01, 0xDD, 0x34, 
-0x19, 0x68, 0x6F, 0xFF, 0xFE, 0x0D, 0x3F, 0xF8, 0x7D, 0xBF, 0xFD, 0x1B, 0xBF, 0xF3, 0xF3, 0x8F, 
-0x89, 0x85, 0xB2, 0x49, 0x3C, 0x66, 0x09, 0x17, 0xE0, 0xF7, 0x7E, 0xEF, 0xEF, 0x16, 0x3E, 0xF6, 
-0xB1, 0x7F, 0x70, 0x42, 0xFA, 0x6C, 0xE7, 0xDD, 0x6C, 0x69, 0x4B, 0x51, 0x46, 0x53, 0x55, 0x0E, 
-0x5F, 0x79, 0x0E, 0x1F, 0x9E, 0xE7, 0xC8, 0x91, 0x83, 0x3C, 0xFD, 0x29, 0x17, 0xB3, 0x75, 0xEB, 
-0x2C, 0xAE, 0x1A, 0xA2, 0x10, 0x92, 0xD4, 0x40, 0x31, 0x24, 0x1F, 0xF6, 0x29, 0xF3, 0x9C, 0x54, 
-0x25, 0xB4, 0x94, 0x02, 0x6B, 0xC1, 0x39, 0x94, 0x8E, 0xAE, 0x9C, 0x5E, 0x85, 0xB1, 0x56, 0x65, 
-0xD9, 0xA0, 0xBC, 0x0E, 0x30, 0x73, 0x8A, 0xDA, 0x96, 0x33, 0x4D, 0x66, 0x0F, 0xF5, 0x6A, 0x6B, 
-0xD1, 0xDD, 0x99, 0x2E, 0xE3, 0x71, 0xB1, 0x41, 0xB8, 0x0F, 0x09, 0x67, 0x8A, 0x70, 0x4F, 0x54, 
-0x0D, 0xCD, 0x5B, 0x5A, 0xDD, 0x36, 0x82, 0xC4, 0x74, 0xEA, 0x2B, 0x16, 0xBE, 0xEA, 0x99, 0xA0, 
-0x6A, 0x42, 0x27, 0x8E, 0x17, 0xDC, 0x14, 0xCA, 0x2F, 0x87, 0xF9, 0x84, 0x80, 0x4E, 0x24, 0xE6, 
-0xA1, 0x08, 0x75, 0x72, 0x1C, 0x1D, 0x73, 0xB1, 0x45, 0x0F, 0x48, 0x05, 0x95, 0x41, 0xA9, 0x2E, 
-0xA1, 0x34, 0x2C, 0x1E, 0x1C, 0x71, 0x74, 0xFF, 0x90, 0x72, 0x31, 0x60, 0x5C, 0x86, 0x09, 0xC9, 
-0x38, 0xF8, 0x94, 0x60, 0xB0, 0x2A, 0xC1, 0xB5, 0xA6, 0xE9, 0xA7, 0x33, 0xDC, 0x7E, 0x78, 0xC4, 
-0xA7, 0xEE, 0xDA, 0xC5, 0x6D, 0x47, 0xFA, 0xE4, 0xE9, 0x16, 0x16, 0x9C, 0x50, 0x7A, 0x45, 0xF0, 
-0x8E, 0x10, 0xCA, 0xD2, 0xBA, 0xC1, 0x4D, 0x97, 0x5D, 0xF6, 0xB4, 0xB7, 0x7D, 0xF0, 0x63, 0xEF, 
-0xB8, 0xF3, 0xAA, 0xAB, 0xAE, 0x5A, 0x2E, 0xFC, 0x63, 0x04, 0x8F, 0x69, 0xC2, 0x7D, 0xFF, 0xFB, 
-0xDF, 0xE1, 0xBE, 0xE7, 0xDF, 0xBE, 0xE1, 0xBE, 0x1D, 0xF7, 0xED, 0x48, 0x47, 0xF9, 0xE0, 0xF9, 
-0x26, 0xC9, 0x32, 0x1F, 0x90, 0x24, 0x6D, 0xA3, 0x93, 0x29, 0x8A, 0xD2, 0xF2, 0xE0, 0xEE, 0x5D, 
-0x28, 0x25, 0x3C, 0xEF, 0x05, 0xCF, 0x62, 0x6A, 0xA6, 0x13, 0x4F, 0xCC, 0x12, 0xB2, 0x54, 0x13, 
-0xBC, 0x65, 0x70, 0xB4, 0x4F, 0xC8, 0x0B, 0xBA, 0x26, 0x41, 0x0B, 0x78, 0x57, 0xA2, 0x8C, 0xC2, 
-0xD5, 0x8A, 0x7F, 0x64, 0x4C, 0xB9, 0x80, 0xE0, 0x45, 0xD5, 0xA9, 0x58, 0x1A, 0xFB, 0xC0, 0x93, 
-0xC3, 0xEA, 0x06, 0xFB, 0x90, 0x71, 0x3C, 0x1D, 0xF1, 0x49, 0x60, 0xAD, 0xB3, 0xCF, 0x78, 0x19, 
-0x8F, 0x87, 0xC7, 0x39, 0xE1, 0x86, 0x35, 0xDC, 0x4D, 0x1B, 0x1C, 0x57, 0x7F, 0x7F, 0x86, 0xF0, 
-0x50, 0x09, 0xB7, 0x6E, 0xCE, 0x27, 0xC4, 0x9A, 0x84, 0x2B, 0x31, 0x4C, 0xE8, 0xF8, 0x1A, 0xB5, 
-0x15, 0x09, 0xB0, 0xD2, 0xF7, 0x71, 0x82, 0x70, 0x97, 0x55, 0x18, 0xF1, 0xDD, 0x7B, 0xE5, 0xA9, 
-0xA8, 0x08, 0x22, 0xE8, 0x2C, 0xC1, 0x88, 0xE0, 0x9D, 0xC7, 0x97, 0x1E, 0x65, 0x0D, 0x5A, 0xDA, 
-0x84, 0xA1, 0xB0, 0x74, 0x30, 0x67, 0xF1, 0xC0, 0x90, 0x62, 0xC1, 0xA3, 0x6D, 0x46, 0x3B, 0x74, 
-0xC9, 0x54, 0x32, 0xB6, 0xE6, 0xA9, 0xBC, 0xA2, 0x4A, 0x3A, 0xF4, 0x5B, 0xB3, 0xDC, 0xB9, 0x54, 
-0x71, 0xDD, 0x7D, 0x07, 0xB8, 0x69, 0xDF, 0x22, 0x07, 0xE9, 0x32, 0x50, 0x53, 0x38, 0x32, 0x9C, 
-0xF7, 0x74, 0x5B, 0x99, 0xD7, 0xC1, 0xED, 0x78, 0xFA, 0x53, 0x2F, 0xF8, 0xF5, 0xFF, 0x7E, 0xD5, 
-0x0F, 0x5F, 0xFD, 0xAC, 0x67, 0x3D, 0xEB, 0xA1, 0x45, 0xB0, 0x7F, 0x98, 0xF0, 0x98, 0x26, 0x5C, 
-0x80, 0x2F, 0x7F, 0xF9, 0x33, 0xF9, 0xBF, 0xFB, 0x77, 0x3F, 0xB4, 0x6B, 0xE7, 0xCE, 0xDD, 0x17, 
-0x55, 0x95, 0xBD, 0xD4, 0xD9, 0x60, 0xB4, 0x69, 0x63, 0x83, 0xE0, 0xAC, 0x63, 0x34, 0xE8, 0x73, 
-0xE8, 0xF0, 0x21, 0xAC, 0x2B, 0x78, 0xEA, 0x53, 0x9F, 0x4A, 0x77, 0xBA, 0x8B, 0x2F, 0x0A, 0x54, 
-0x37, 0xA3, 0xA5, 0x35, 0xC5, 0x60, 0xC0, 0xA0, 0xB7, 0x48, 0xEA, 0x1D, 0xA9, 0x16, 0x42, 0x68, 
-0xC2, 0x1E, 0xD6, 0xB9, 0x07, 0x9A, 0xC5, 0x1B, 0xA2, 0x93, 0x41, 0x00, 0x82, 0x34, 0xDA, 0xCE, 
-0x53, 0xEB, 0x58, 0xEB, 0x75, 0xD0, 0xD3, 0xC1, 0x43, 0xBD, 0xD2, 0x5A, 0x25, 0x3F, 0x93, 0xE5, 
-0x3B, 0x21, 0x1E, 0xE7, 0x84, 0xCB, 0x23, 0x5D, 0x5F, 0xAB, 0xF0, 0x90, 0x09, 0xF7, 0x24, 0xB1, 
-0x16, 0xE1, 0x06, 0x89, 0x2E, 0x16, 0xA1, 0x36, 0xE7, 0x0B, 0xB5, 0x54, 0x0B, 0xA0, 0xC7, 0x33, 
-0xC2, 0xC6, 0x51, 0xA2, 0xE9, 0x27, 0x8D, 0xAB, 0x78, 0x0C, 0x80, 0xE3, 0x24, 0x26, 0xA6, 0x54, 
-0x3A, 0x92, 0x72, 0x70, 0x01, 0xB1, 0x90, 0x49, 0x1B, 0x65, 0xA6, 0xA1, 0x1F, 0x58, 0xDC, 0x3F, 
-0xE0, 0xE8, 0xFE, 0x1E, 0x76, 0x00, 0xAD, 0xD0, 0x26, 0x71, 0x09, 0xDA, 0x69, 0x04, 0x50, 0x1A, 
-0x2C, 0x9A, 0x22, 0x69, 0x33, 0x6C, 0xCF, 0xF1, 0x40, 0xA5, 0xF8, 0xCC, 0xCE, 0x03, 0x7C, 0xF6, 
-0xC1, 0x23, 0xEC, 0x75, 0x2D, 0x96, 0x98, 0xA6, 0x20, 0x21, 0x4D, 0x5A, 0x24, 0x8A, 0xD0, 0x2F, 
-0x0F, 0x1F, 0x9C, 0xED, 0xA6, 0x7F, 0xF4, 0xCB, 0xBF, 0xF1, 0x3F, 0xDE, 0xFB, 0xBA, 0xD7, 0xBD, 
-0xF6, 0x11, 0x8F, 0x73, 0x7B, 0xB2, 0x78, 0xCC, 0x13, 0x2E, 0xC0, 0xAD, 0xB7, 0x7E, 0x66, 0xF1, 
-0x9A, 0x6B, 0xBE, 0x70, 0x60, 0xD7, 0xCE, 0x5D, 0x4F, 0xF3, 0xB4, 0xCE, 0x75, 0x55, 0xD0, 0x31, 
-0x26, 0x40, 0x40, 0x99, 0x84, 0x51, 0x3E, 0xE2, 0xBE, 0x1D, 0xBB, 0x98, 0xDB, 0x3C, 0xC7, 0x79, 
-0xE7, 0x9F, 0xCB, 0xF4, 0xA6, 0x6E, 0xB4, 0xF9, 0x4C, 0x34, 0x99, 0x52, 0xD8, 0xB2, 0xA0, 0x1C, 
-0xF5, 0xC0, 0x97, 0x88, 0x72, 0x40, 0x55, 0xA7, 0x98, 0x6E, 0xA2, 0x71, 0xC5, 0xE9, 0x50, 0xB4, 
-0x15, 0x8D, 0x4D, 0x28, 0x5A, 0x2C, 0x9C, 0xBA, 0xFD, 0xA6, 0xAA, 0xA7, 0x5D, 0x0F, 0x95, 0x6E, 
-0x64, 0xF5, 0x8E, 0x53, 0xC4, 0x5A, 0xF7, 0x7F, 0x64, 0x09, 0x64, 0x75, 0xCD, 0x3C, 0xD2, 0xDB, 
-0x99, 0xC1, 0xEA, 0x3A, 0x7B, 0x24, 0xA4, 0x5B, 0x1E, 0x01, 0xC2, 0x6D, 0x74, 0xB7, 0x0D, 0x56, 
-0x4A, 0xB8, 0x8D, 0xDD, 0xEF, 0x64, 0x7F, 0x88, 0x22, 0x48, 0x53, 0xAE, 0xD5, 0x24, 0x1B, 0x68, 
-0x02, 0x9D, 0xC7, 0x00, 0x48, 0x41, 0x09, 0xCA, 0x44, 0xAB, 0x09, 0x57, 0x39, 0xF0, 0x42, 0x26, 
-0x2D, 0x94, 0x4D, 0x60, 0x28, 0x2C, 0xEC, 0x59, 0x62, 0x70, 0x38, 0xC7, 0xF6, 0x03, 0xA9, 0x4B, 
-0xC9, 0x24, 0x8B, 0x0E, 0x37, 0x2E, 0xA6, 0x3B, 0x0A, 0x5A, 0x31, 0x92, 0x84, 0xA5, 0xA4, 0xCB, 
-0xCE, 0x52, 0xF1, 0xD9, 0x3D, 0x0B, 0x5C, 0xFF, 0xE0, 0x51, 0xEE, 0xCB, 0x0D, 0x8B, 0x32, 0x43, 
-0x25, 0x2D, 0x94, 0x18, 0xBC, 0xCD, 0x83, 0x0E, 0xE5, 0x42, 0xA6, 0xC3, 0xFB, 0xBE, 0xE3, 0xD5, 
-0x2F, 0xFB, 0xA3, 0x5F, 0xFE, 0xB5, 0x9F, 0x3C, 0xB2, 0xFC, 0x20, 0x8F, 0x3D, 0x3C, 0x2E, 0x08, 
-0xF7, 0xAA, 0xAB, 0xAE, 0xE2, 0x07, 0x7E, 0xE0, 0x3B, 0x77, 0xEF, 0xD8, 0x71, 0x60, 0x67, 0x6F, 
-0x71, 0x78, 0x05, 0xA2, 0xCE, 0xC2, 0x39, 0x95, 0x64, 0x19, 0x02, 0x14, 0xC3, 0x11, 0x83, 0xC1, 
-0x90, 0x3B, 0xEE, 0xBA, 0x8B, 0xB3, 0xCF, 0xDE, 0xC6, 0x93, 0x2E, 0xBE, 0x10, 0x63, 0x34, 0x5A, 
-0x2B, 0x74, 0xBB, 0x8B, 0x91, 0xC0, 0xE2, 0xE2, 0x11, 0xF2, 0x7C, 0x40, 0x6A, 0xC0, 0xA8, 0x80, 
-0x0A, 0x0E, 0x15, 0xE2, 0x42, 0x59, 0x34, 0x91, 0x22, 0x76, 0xD4, 0x5A, 0xBA, 0x55, 0xCD, 0xEA, 
-0xEC, 0x69, 0x40, 0xD6, 0x4C, 0x29, 0x72, 0x6A, 0x78, 0xA8, 0xDD, 0x6D, 0xAD, 0xFB, 0xAF, 0x26, 
-0x8F, 0x0D, 0x9C, 0x18, 0x8F, 0x56, 0x9D, 0x3D, 0xDC, 0x84, 0xBB, 0xBA, 0x7D, 0xAC, 0x24, 0x5C, 
-0x21, 0xD4, 0xE2, 0x07, 0x34, 0xEE, 0xE7, 0xF5, 0xDF, 0x22, 0x91, 0xAE, 0x97, 0x6D, 0x00, 0x6B, 
-0x73, 0xB2, 0x10, 0x55, 0x11, 0x75, 0x3C, 0x65, 0x1F, 0xC0, 0x68, 0x13, 0x15, 0x0E, 0x4E, 0xD3, 
-0x92, 0x16, 0x2A, 0x74, 0x28, 0xE7, 0x2B, 0x0E, 0xEF, 0x3A, 0xC2, 0xD2, 0x81, 0x01, 0xC6, 0x26, 
-0x74, 0x42, 0x07, 0xE3, 0x35, 0xE2, 0x42, 0x4C, 0xBB, 0xA4, 0xEA, 0x34, 0x7E, 0x69, 0xC6, 0x82, 
-0xCA, 0xD8, 0xEB, 0x0C, 0x5F, 0xD8, 0xBB, 0xC8, 0xBF, 0xDE, 0xB5, 0x97, 0x7B, 0x72, 0x18, 0x9A, 
-0xCD, 0x8C, 0xC8, 0x48, 0x92, 0x16, 0x2A, 0xF8, 0xE0, 0xC3, 0xD2, 0xB0, 0xA3, 0xC3, 0x47, 0x5E, 
-0xF3, 0xDD, 0xDF, 0xF2, 0xB6, 0xF7, 0xFC, 0xFD, 0xEF, 0xDF, 0xBF, 0xFC, 0x10, 0x8F, 0x4D, 0x3C, 
-0x2E, 0x08, 0x17, 0xE0, 0xDA, 0x6B, 0xAF, 0x0D, 0xBF, 0xF4, 0x4B, 0x6F, 0x3B, 0x70, 0xC3, 0xF5, 
-0xD7, 0x4B, 0x55, 0x15, 0xCF, 0x0B, 0x84, 0xE9, 0x40, 0xA0, 0xD5, 0xEA, 0x50, 0x95, 0x15, 0xCE, 
-0x42, 0x9E, 0x17, 0xEC, 0xDC, 0xF5, 0x00, 0x17, 0x5C, 0x70, 0x01, 0x17, 0x9C, 0x77, 0x36, 0xAD, 
-0x2C, 0x8D, 0x04, 0x9A, 0x28, 0x82, 0x0A, 0xE4, 0x79, 0x9F, 0x32, 0x1F, 0xD0, 0x36, 0x2A, 0x26, 
-0x39, 0x74, 0x7E, 0x9C, 0xEB, 0x8A, 0xDA, 0x77, 0x5E, 0x42, 0xAD, 0x4E, 0xA8, 0x0D, 0xB2, 0x4F, 
-0x67, 0x63, 0x8D, 0x06, 0x7D, 0x22, 0xAC, 0x96, 0x9C, 0x1E, 0x72, 0x77, 0x5B, 0xA7, 0x5C, 0x67, 
-0x0A, 0xAB, 0xCB, 0x3B, 0x89, 0x93, 0xB9, 0x57, 0x73, 0xFE, 0xC9, 0x1C, 0xBB, 0x16, 0xD6, 0x3B, 
-0x7F, 0xBD, 0x72, 0x9D, 0xEC, 0x71, 0x8F, 0x36, 0xC6, 0xEF, 0x6B, 0xF5, 0x0F, 0xAB, 0xB0, 0xFA, 
-0x9D, 0xAE, 0xF5, 0x3C, 0xAB, 0x9F, 0x99, 0xC6, 0x5C, 0x70, 0x8D, 0xFD, 0xE3, 0x76, 0x5B, 0xFF, 
-0x14, 0x63, 0x6A, 0xD4, 0x91, 0x35, 0xA4, 0x4E, 0x53, 0x24, 0x8D, 0xB9, 0x5F, 0xED, 0xD9, 0xA6, 
-0x03, 0x0E, 0x17, 0x17, 0xC6, 0x14, 0xE8, 0x34, 0xF6, 0x33, 0x67, 0x3D, 0x5A, 0x34, 0xCA, 0x2B, 
-0x94, 0x33, 0x24, 0x3E, 0x43, 0xCA, 0x84, 0x72, 0xBE, 0x62, 0x61, 0x7F, 0x8F, 0xFE, 0xA1, 0x11, 
-0x69, 0xD5, 0x22, 0xF5, 0x09, 0x99, 0xA4, 0x31, 0x80, 0xB8, 0xB3, 0x04, 0x15, 0x40, 0xC3, 0x50, 
-0x60, 0xD4, 0x99, 0x65, 0xAF, 0x4B, 0xB8, 0x79, 0xFF, 0x12, 0x9F, 0xD9, 0x75, 0x98, 0xBB, 0x73, 
-0xC5, 0x22, 0x33, 0x14, 0x74, 0x10, 0x9D, 0x81, 0x2D, 0x09, 0x7E, 0x50, 0xB5, 0xC5, 0xDD, 0xB4, 
-0xF5, 0xBC, 0x99, 0xDF, 0xF8, 0xF1, 0xFF, 0x7C, 0xE5, 0x6D, 0x8F, 0x74, 0x7E, 0xB2, 0xD3, 0xC1, 
-0xE3, 0x86, 0x70, 0x01, 0x3E, 0xF1, 0x89, 0x0F, 0xD8, 0xDF, 0xF8, 0xCD, 0xB7, 0xDD, 0x71, 0xCB, 
-0xCD, 0xB7, 0x98, 0xD1, 0xA8, 0xB8, 0xDC, 0xBB, 0xD0, 0xAE, 0xCA, 0x52, 0x4C, 0x9A, 0x01, 0x42, 
-0x59, 0x55, 0xEC, 0xDD, 0xFD, 0x20, 0x77, 0xDD, 0x79, 0x0F, 0xE7, 0x9D, 0xBB, 0x9D, 0xAD, 0xDB, 
-0xB7, 0x91, 0x75, 0xA7, 0x50, 0x69, 0x42, 0x67, 0xBA, 0x8D, 0x73, 0x15, 0xD5, 0x70, 0x48, 0xDE, 
-0x1B, 0x90, 0x29, 0x4D, 0xA2, 0x74, 0x8C, 0x24, 0xAF, 0x62, 0xC0, 0x0C, 0x25, 0x2A, 0x46, 0x8B, 
-0x0D, 0x75, 0x03, 0x3C, 0xB6, 0x5D, 0x9E, 0x34, 0x4E, 0xE5, 0xCD, 0xAF, 0xD9, 0x59, 0x56, 0xEF, 
-0x38, 0x55, 0xAC, 0xD1, 0xA9, 0xD6, 0xC3, 0x7A, 0xE4, 0x75, 0x3A, 0x38, 0x95, 0x6B, 0x9C, 0xCA, 
-0xB1, 0xEB, 0xE1, 0x64, 0xAF, 0x71, 0xB2, 0xC7, 0x3D, 0x56, 0x70, 0xA2, 0xD2, 0x9E, 0xCC, 0xF3, 
-0xAC, 0x75, 0x4C, 0x58, 0x67, 0xFF, 0x78, 0xDF, 0xB1, 0x3F, 0x01, 0xCB, 0x2A, 0x04, 0x88, 0x16, 
-0x0C, 0x31, 0xE6, 0xBF, 0x20, 0x0A, 0x44, 0x47, 0xE7, 0x15, 0xEB, 0x3D, 0x22, 0x90, 0x98, 0x16, 
-0xCA, 0x1B, 0x8C, 0xCF, 0xD0, 0xD2, 0x46, 0x4A, 0xCD, 0xD2, 0xDE, 0x1E, 0xFB, 0xEE, 0x3F, 0x48, 
-0x7E, 0xB4, 0xA2, 0x6B, 0x66, 0x98, 0xEB, 0xCC, 0xE2, 0x72, 0x8F, 0x2D, 0x2C, 0xCA, 0x24, 0x04, 
-0xAD, 0x29, 0x08, 0xD8, 0x54, 0x51, 0x4E, 0xCF, 0x70, 0x5F, 0xAE, 0xB8, 0x71, 0xCF, 0x51, 0x3E, 
-0xF9, 0xD5, 0x9D, 0xDC, 0x53, 0x7A, 0x46, 0x72, 0x16, 0x36, 0x9D, 0x03, 0xD5, 0xC2, 0x56, 0x25, 
-0x86, 0xC2, 0xB6, 0x12, 0x7B, 0xEB, 0x79, 0x17, 0x4C, 0xBF, 0xF5, 0x7F, 0xFE, 0xD6, 0x7F, 0xBA, 
-0xEE, 0xCA, 0x2B, 0xAF, 0x7C, 0x4C, 0x2E, 0x92, 0xAD, 0xC6, 0xE3, 0x8A, 0x70, 0x01, 0xFE, 0xF9, 
-0x9F, 0x3F, 0x58, 0xFC, 0xC2, 0x2F, 0xFE, 0x8F, 0xBB, 0x6F, 0xB8, 0xE1, 0xC6, 0xED, 0xDE, 0x85, 
-0x67, 0x84, 0x20, 0xA9, 0x77, 0x8E, 0x34, 0x8B, 0x89, 0x23, 0x8D, 0x6A, 0x33, 0x3F, 0xBF, 0xC0, 
-0xFE, 0x7D, 0xBB, 0x39, 0xFB, 0xFC, 0xF3, 0xD8, 0x7E, 0xFE, 0x05, 0x48, 0x96, 0x92, 0x74, 0xBB, 
-0xA4, 0x3A, 0xA1, 0x1A, 0x8D, 0xB0, 0x45, 0x45, 0xB0, 0xB6, 0xCE, 0x30, 0x10, 0x53, 0xDD, 0xC4, 
-0xEC, 0x09, 0x1E, 0x25, 0x1A, 0x51, 0xB5, 0x49, 0xD8, 0x3A, 0x8D, 0xEF, 0x64, 0x70, 0x2C, 0x85, 
-0xAE, 0x8D, 0xB5, 0xC8, 0x96, 0xFA, 0xFC, 0x87, 0xB2, 0xAD, 0xD5, 0xA9, 0x4E, 0x84, 0xD3, 0x39, 
-0x67, 0x12, 0xA7, 0x72, 0xFE, 0xA9, 0x1C, 0x7B, 0x3C, 0x9C, 0xEC, 0x75, 0x4E, 0xF6, 0xB8, 0x06, 
-0xAB, 0x5D, 0x44, 0x1E, 0xE9, 0xED, 0x44, 0x90, 0x93, 0x88, 0x66, 0x26, 0x22, 0x63, 0x5D, 0x6D, 
-0xB3, 0x35, 0xFB, 0x1B, 0x8C, 0xED, 0x74, 0x65, 0xA5, 0x80, 0xB1, 0x6C, 0x81, 0x10, 0xD7, 0x31, 
-0xA2, 0xAE, 0x36, 0x1E, 0xEB, 0x25, 0x20, 0x4A, 0xE1, 0x5C, 0x45, 0x08, 0x82, 0xD6, 0x06, 0xAD, 
-0x13, 0x08, 0x10, 0x9C, 0x20, 0xDE, 0x90, 0x86, 0x36, 0x52, 0x19, 0xDC, 0x92, 0xA3, 0xB7, 0xBF, 
-0xC7, 0xD2, 0xC1, 0x01, 0xBE, 0x2F, 0x24, 0xA1, 0x45, 0xEA, 0x53, 0x7C, 0x05, 0xDE, 0x7A, 0x82, 
-0x36, 0x04, 0x6D, 0xC8, 0x75, 0x42, 0x9E, 0x24, 0x2C, 0xE9, 0x84, 0x7D, 0x24, 0x7C, 0x61, 0x7F, 
-0x9F, 0xCF, 0xEF, 0x59, 0xE0, 0xEE, 0xBC, 0x64, 0xC4, 0x26, 0x7A, 0xB4, 0xC8, 0x5D, 0x40, 0x39, 
-0x0D, 0x8C, 0xAC, 0x67, 0x69, 0x67, 0xA7, 0xA3, 0xFE, 0xF0, 0x27, 0x7F, 0xE6, 0x3F, 0x7E, 0xEC, 
-0x8D, 0x6F, 0xFC, 0xC1, 0xC7, 0xEC, 0x22, 0xD9, 0x6A, 0x3C, 0xEE, 0x08, 0x17, 0xE0, 0x53, 0x9F, 
-0xFA, 0x70, 0xFF, 0xC7, 0xFE, 0xDD, 0xFF, 0xF3, 0xB9, 0xAF, 0xDC, 0xB5, 0xE3, 0x2C, 0x6B, 0xAB, 
-0x67, 0x98, 0x24, 0x49, 0xAA, 0x72, 0x20, 0xDE, 0x39, 0x94, 0xB4, 0x71, 0xD6, 0xB1, 0x77, 0xDF, 
-0x1E, 0xBE, 0x78, 0xDB, 0xAD, 0x5C, 0xFC, 0x94, 0xA7, 0xB1, 0x65, 0xDB, 0x76, 0x08, 0x42, 0x7B, 
-0xD3, 0x1C, 0xC6, 0x79, 0x5A, 0x69, 0x8B, 0x85, 0x85, 0x05, 0x9C, 0x77, 0xF8, 0xA6, 0xD1, 0xD6, 
-0x26, 0x0A, 0x3A, 0x50, 0x3B, 0x3E, 0x9C, 0x64, 0xCB, 0x5F, 0x07, 0xC7, 0xEF, 0x0A, 0xEB, 0x13, 
-0xED, 0x99, 0xC2, 0xC9, 0x12, 0xCC, 0xEA, 0x72, 0x9C, 0xEC, 0x79, 0xAB, 0x71, 0xBA, 0xE7, 0x3D, 
-0x54, 0x9C, 0xEC, 0x7D, 0x4F, 0xF6, 0xB8, 0x06, 0xA7, 0x76, 0xF4, 0x23, 0x8F, 0xF5, 0x9E, 0x47, 
-0x26, 0x54, 0x0D, 0xB2, 0xCE, 0x5A, 0xC2, 0x8A, 0x73, 0xEB, 0x3F, 0x57, 0x5F, 0x4F, 0x87, 0x7A, 
-0xF1, 0xB7, 0xD6, 0xCD, 0x36, 0xD6, 0x07, 0x93, 0x41, 0x6D, 0xBC, 0x0F, 0x63, 0xD7, 0x67, 0xBC, 
-0x41, 0x39, 0x83, 0xC6, 0x90, 0x84, 0x0C, 0x29, 0x0C, 0xA3, 0x23, 0x25, 0xF3, 0x7B, 0x8E, 0xB2, 
-0xB4, 0x7F, 0x80, 0xA9, 0x52, 0xA6, 0xB3, 0x4D, 0xB4, 0x55, 0x07, 0x57, 0x79, 0xCA, 0xAA, 0x22, 
-0xCD, 0xDA, 0xA8, 0xAC, 0xC5, 0x48, 0x19, 0x8A, 0xD6, 0x14, 0x6E, 0xF6, 0x2C, 0xF6, 0x55, 0x70, 
-0xD3, 0x9E, 0xA3, 0x7C, 0xF8, 0x4B, 0xF7, 0x73, 0x7B, 0x9E, 0x53, 0x30, 0x8B, 0xD7, 0x33, 0xE4, 
-0x41, 0xA1, 0xD0, 0x24, 0xE2, 0xBD, 0xA7, 0xBF, 0xE3, 0xFC, 0x73, 0xB6, 0xFC, 0xC6, 0xAF, 0xFF, 
-0xF6, 0x8F, 0xFF, 0x9F, 0x37, 0xBD, 0xE9, 0x47, 0x87, 0x2B, 0x0A, 0xFE, 0x18, 0xC7, 0xE3, 0x92, 
-0x70, 0x01, 0xBE, 0xF0, 0xA5, 0xCF, 0x8C, 0x9E, 0x71, 0xE9, 0xF3, 0xEF, 0x19, 0xE4, 0xC3, 0x0B, 
-0xF2, 0x7C, 0x78, 0x69, 0x92, 0xA5, 0xBA, 0xD5, 0x9A, 0x92, 0xAA, 0x70, 0x31, 0x6B, 0xAF, 0x08, 
-0x0B, 0x8B, 0x03, 0x76, 0xEE, 0xDA, 0xCD, 0x39, 0xE7, 0x5C, 0xC8, 0x33, 0x9E, 0xF9, 0x2C, 0xC4, 
-0x06, 0xD2, 0xB9, 0x2D, 0x24, 0x49, 0xC2, 0x68, 0x38, 0xA4, 0xB4, 0x96, 0xBC, 0x28, 0xD0, 0x46, 
-0x91, 0xA5, 0x19, 0x06, 0x21, 0x38, 0x17, 0xF5, 0xBA, 0x4D, 0x36, 0xDD, 0xD3, 0xC4, 0x98, 0xC8, 
-0x1F, 0x26, 0x34, 0x1D, 0x6B, 0xBD, 0xED, 0x74, 0x71, 0xBA, 0xE7, 0x9E, 0xEE, 0x79, 0xEB, 0x61, 
-0xF5, 0x40, 0xB0, 0x1E, 0xD6, 0xBB, 0xEF, 0xEA, 0xFA, 0x38, 0xD9, 0xEB, 0x35, 0x58, 0xFB, 0xAA, 
-0x8F, 0x4D, 0x4C, 0x3E, 0x5B, 0x53, 0x1F, 0xEB, 0xE9, 0x6A, 0x59, 0x5D, 0x67, 0xEB, 0x10, 0x6E, 
-0x13, 0xFD, 0xB1, 0x09, 0x53, 0xD3, 0xFC, 0x8B, 0xFB, 0xA2, 0x80, 0x62, 0x74, 0x4A, 0x42, 0x46, 
-0xB0, 0x1A, 0x2A, 0x85, 0x0E, 0x09, 0xC6, 0x65, 0x88, 0x4D, 0xE9, 0x1D, 0x1C, 0xB0, 0xB8, 0xBF, 
-0xCF, 0x68, 0xBE, 0x22, 0x71, 0x2D, 0xDA, 0x74, 0x09, 0x15, 0x38, 0xEB, 0x30, 0x49, 0x82, 0x4A, 
-0x13, 0x4A, 0x81, 0x11, 0x8A, 0xA1, 0x69, 0xD1, 0x6F, 0x6D, 0x62, 0xAF, 0x35, 0x7C, 0x61, 0xF7, 
-0x12, 0xD7, 0xDE, 0x7B, 0x80, 0x5D, 0xB6, 0xCD, 0x12, 0x33, 0x60, 0x66, 0x28, 0x1C, 0x24, 0xC6, 
-0xA0, 0xB0, 0x6E, 0x14, 0x8E, 0x1C, 0x99, 0x9B, 0xCA, 0xFE, 0xF8, 0x0D, 0xAF, 0x7F, 0xED, 0x5F, 
-0xFF, 0xEC, 0x7F, 0xFD, 0xA9, 0xA5, 0x15, 0x85, 0x7E, 0x1C, 0xE0, 0x71, 0x4B, 0xB8, 0x00, 0xFB, 
-0x0F, 0xDD, 0x33, 0xFF, 0xCF, 0xFF, 0x7C, 0xCD, 0x0D, 0x87, 0x0E, 0xCD, 0x3F, 0xA9, 0xC8, 0x87, 
-0x4F, 0xF6, 0x41, 0x27, 0xAD, 0xB4, 0x4D, 0x5E, 0x16, 0x78, 0x31, 0x58, 0xAF, 0x98, 0x9F, 0x5F, 
-0xE2, 0x2B, 0xB7, 0x7D, 0x95, 0xD9, 0xE9, 0x59, 0x2E, 0xBE, 0xE8, 0x62, 0x12, 0x01, 0xD5, 0xCA, 
-0xE8, 0x4C, 0xB5, 0xB0, 0xAE, 0xA4, 0xD7, 0x5B, 0xC2, 0x97, 0x05, 0x49, 0x1C, 0xA7, 0x51, 0xC1, 
-0x13, 0x82, 0xC4, 0xB4, 0xEB, 0x6B, 0xB7, 0xD7, 0x93, 0xC2, 0xA9, 0x75, 0xEF, 0x53, 0xC7, 0xEA, 
-0x0E, 0x72, 0x3A, 0x58, 0x8F, 0x84, 0x4E, 0xF5, 0xDA, 0xA7, 0x7A, 0xFC, 0x99, 0xC4, 0x7A, 0xF7, 
-0x5E, 0x6F, 0xFF, 0xC9, 0xE2, 0xA1, 0x9D, 0xFD, 0xE8, 0x60, 0xF2, 0x99, 0xC3, 0x71, 0xEA, 0xE0, 
-0xA4, 0x08, 0x37, 0x48, 0x74, 0xED, 0xAD, 0xA5, 0xDA, 0x26, 0xA8, 0x4D, 0x8C, 0xA3, 0x1C, 0x9D, 
-0x1E, 0x34, 0x06, 0xE5, 0x0D, 0xDA, 0x67, 0x68, 0xD5, 0x45, 0x5C, 0x4A, 0xB1, 0x54, 0xB2, 0xB0, 
-0xBF, 0xC7, 0xC2, 0xBE, 0x25, 0xFC, 0x50, 0x91, 0xB8, 0x8C, 0x36, 0x1D, 0x8C, 0x4B, 0xC0, 0x09, 
-0xA0, 0xF0, 0x5A, 0x90, 0x44, 0x33, 0xF4, 0x9E, 0x32, 0x6B, 0xE1, 0xBA, 0x73, 0xEC, 0x1C, 0x06, 
-0x3E, 0x7B, 0xCF, 0x01, 0x3E, 0x7B, 0xEF, 0x7E, 0xEE, 0x1A, 0x39, 0xE6, 0x99, 0xA1, 0x90, 0x0E, 
-0x16, 0x85, 0x0B, 0x1E, 0x09, 0x36, 0x8C, 0xC2, 0xD1, 0x7D, 0xE7, 0x9F, 0xBD, 0xF5, 0x8F, 0x7F, 
-0xF6, 0x17, 0x7F, 0xEA, 0x77, 0x7F, 0xE9, 0x7F, 0xFE, 0xE4, 0xC2, 0x8A, 0x02, 0x3F, 0x4E, 0xF0, 
-0xB8, 0x26, 0xDC, 0xAB, 0xAE, 0xBA, 0x8A, 0x5D, 0xBB, 0xBE, 0xD2, 0xFB, 0xAB, 0xBF, 0xFD, 0xA7, 
-0x3B, 0xFB, 0xFD, 0xF2, 0xFC, 0xAA, 0x18, 0x3D, 0xB9, 0x72, 0x41, 0x99, 0x34, 0x13, 0xEF, 0x35, 
-0x04, 0x4D, 0x9A, 0xB4, 0xD8, 0xBF, 0x67, 0x1F, 0x7B, 0x77, 0xEF, 0xA3, 0xDD, 0xCE, 0x78, 0xEA, 
-0x33, 0x9F, 0x46, 0x92, 0x69, 0xF4, 0x4C, 0x9B, 0x44, 0x79, 0xB0, 0x05, 0x3E, 0xCF, 0xA1, 0x28, 
-0x30, 0xC1, 0x93, 0x88, 0x46, 0xA9, 0xE5, 0xD5, 0xDA, 0xD3, 0xC5, 0xDA, 0x54, 0xB6, 0x8C, 0x70, 
-0x1C, 0x4F, 0xA6, 0x93, 0xC1, 0x43, 0x39, 0xF7, 0x44, 0x38, 0x95, 0x6B, 0x9F, 0xCA, 0xB1, 0x27, 
-0x8B, 0xF5, 0x06, 0x82, 0xB5, 0xB0, 0xDE, 0xFD, 0xD7, 0xDB, 0x7F, 0xB2, 0x78, 0x68, 0x67, 0x3F, 
-0x3A, 0x38, 0x15, 0xC2, 0x5D, 0x1D, 0x63, 0x61, 0xF5, 0xB1, 0x8D, 0x32, 0xA2, 0xD1, 0xDD, 0x46, 
-0xCB, 0x84, 0xC6, 0xDD, 0xB6, 0xB6, 0xCB, 0xAD, 0x88, 0x2E, 0xBA, 0xD6, 0x40, 0x21, 0x14, 0x47, 
-0x73, 0x8E, 0xEC, 0x5B, 0x64, 0x61, 0x7F, 0x8F, 0x50, 0x68, 0x32, 0xDA, 0xB4, 0x42, 0x1B, 0x29, 
-0x15, 0x0A, 0x43, 0x62, 0x32, 0xC4, 0x08, 0x45, 0x28, 0x08, 0x99, 0xC6, 0x25, 0x29, 0x55, 0xDA, 
-0x65, 0x6F, 0x1E, 0xF8, 0xC2, 0xCE, 0x23, 0xDC, 0x70, 0xFF, 0x61, 0xEE, 0x2D, 0x15, 0x3D, 0xB6, 
-0x30, 0x62, 0x0A, 0x92, 0x2E, 0x84, 0x40, 0x08, 0x85, 0xB3, 0x2C, 0x1D, 0xDE, 0xB6, 0x65, 0xFA, 
-0xCF, 0xFE, 0xDD, 0x0F, 0x7C, 0xF7, 0xFF, 0xFE, 0xE5, 0x5F, 0x7E, 0x6C, 0xDB, 0xDA, 0x1E, 0x0F, 
-0x8F, 0x6B, 0xC2, 0xA5, 0x26, 0xDD, 0xC3, 0x07, 0xEE, 0x39, 0xF4, 0x4F, 0xFF, 0xF8, 0xD9, 0x1B, 
-0x0F, 0x1F, 0x3E, 0x7C, 0x91, 0x56, 0xEE, 0xA2, 0xAA, 0xB4, 0x89, 0xA4, 0x5D, 0x94, 0x6E, 0x51, 
-0x8D, 0x2A, 0x24, 0x40, 0xBF, 0xD7, 0xE7, 0xC6, 0x5B, 0x6E, 0x46, 0xA7, 0x86, 0x27, 0x5D, 0x7A, 
-0x09, 0xDD, 0x76, 0x87, 0x24, 0x4B, 0x69, 0x27, 0x29, 0x38, 0x8F, 0x2D, 0xF3, 0xA8, 0x4E, 0x18, 
-0x07, 0xCA, 0x6B, 0x42, 0xD7, 0x44, 0x1B, 0xC3, 0xE5, 0x55, 0xDA, 0xB8, 0x49, 0x98, 0x74, 0x93, 
-0x58, 0x6E, 0xBC, 0xAB, 0x0D, 0xCA, 0x4F, 0x84, 0xD5, 0x0D, 0xFD, 0x64, 0x71, 0xBA, 0xE7, 0x35, 
-0x38, 0x11, 0xA9, 0x9D, 0xCC, 0xF5, 0x4F, 0xE6, 0x98, 0x53, 0xC5, 0x89, 0xCA, 0xB5, 0x1A, 0xEB, 
-0x95, 0x61, 0xBD, 0xFD, 0x27, 0x8B, 0x87, 0x76, 0xF6, 0x99, 0x42, 0x94, 0x26, 0x4F, 0x16, 0x27, 
-0x24, 0xDC, 0x5A, 0x17, 0x1B, 0x77, 0x37, 0x6D, 0x39, 0x1E, 0x13, 0x8F, 0x5D, 0x5E, 0x2A, 0xF4, 
-0xD4, 0xC9, 0x3D, 0xC7, 0x21, 0x1B, 0x63, 0x3A, 0x26, 0x1D, 0x40, 0x05, 0x8D, 0xF6, 0x09, 0xC6, 
-0xB7, 0x50, 0x2E, 0xC3, 0x2D, 0x79, 0x8E, 0xEE, 0x5D, 0xE4, 0xF0, 0x03, 0x47, 0x28, 0x96, 0x2C, 
-0x19, 0x2D, 0xDA, 0xC9, 0x34, 0x52, 0x29, 0xB0, 0x60, 0x94, 0x02, 0x1C, 0x45, 0x35, 0xA4, 0xC2, 
-0x21, 0xAD, 0x36, 0x43, 0x9D, 0xD2, 0x4F, 0xA7, 0xD8, 0x39, 0x80, 0xEB, 0xEE, 0xDE, 0xC7, 0x67, 
-0xEE, 0x39, 0xC4, 0x4E, 0xA7, 0x19, 0xB2, 0x85, 0x01, 0x6D, 0x0A, 0xE2, 0xE2, 0xB5, 0x73, 0x03, 
-0xE7, 0x19, 0xEE, 0xDF, 0x3C, 0xD7, 0x79, 0xF7, 0x8F, 0xFE, 0xD8, 0xF7, 0xFF, 0xF6, 0x6F, 0xFD, 
-0xD6, 0x7F, 0x3B, 0xB8, 0xF2, 0xA1, 0x1E, 0x5F, 0x78, 0xDC, 0x13, 0x2E, 0x35, 0xE9, 0xEE, 0xDE, 
-0x7D, 0xDB, 0xE2, 0x07, 0x3E, 0xF0, 0xA1, 0xAF, 0xF4, 0x97, 0xE6, 0xE7, 0x2A, 0x6B, 0x9F, 0x2C, 
-0xD2, 0x49, 0xBC, 0x45, 0x4C, 0x9A, 0x92, 0x64, 0x19, 0x83, 0x7C, 0x88, 0x0D, 0x70, 0xC7, 0x9D, 
-0xF7, 0xD2, 0x1B, 0x14, 0x3C, 0xFD, 0xB2, 0xE7, 0xA0, 0x75, 0x46, 0x6B, 0x6A, 0x96, 0x56, 0x77, 
-0x8A, 0x41, 0xBF, 0x47, 0x59, 0x15, 0x14, 0x76, 0x84, 0x36, 0x0A, 0x09, 0x0E, 0xEF, 0xAA, 0xA8, 
-0x5A, 0x50, 0x82, 0x75, 0x25, 0xA2, 0x40, 0x6B, 0x83, 0xB3, 0x55, 0x6C, 0x9A, 0x75, 0x4C, 0xD1, 
-0x3A, 0xF0, 0x2A, 0x96, 0xE8, 0x83, 0x1E, 0x88, 0xD6, 0x0E, 0x5A, 0xA2, 0x67, 0x4E, 0x6C, 0xC2, 
-0x75, 0xD3, 0xAE, 0xB3, 0x0F, 0xA8, 0xE3, 0xFC, 0xD6, 0xFC, 0x3E, 0xF9, 0xDB, 0xA9, 0x6E, 0xAB, 
-0xCF, 0x3F, 0x5E, 0xD6, 0x83, 0xC9, 0x32, 0x35, 0xFB, 0x4E, 0x96, 0xF6, 0x8E, 0xE9, 0xD4, 0x27, 
-0x89, 0x13, 0x11, 0xEB, 0x63, 0xD1, 0x4A, 0x60, 0xB2, 0xCC, 0xA1, 0x5E, 0x90, 0x7A, 0xD8, 0xB6, 
-0x7A, 0x2A, 0x1F, 0x6A, 0xE9, 0xB2, 0xB9, 0x5B, 0x1C, 0xE8, 0x57, 0x6F, 0x4D, 0xA1, 0xEB, 0x78, 
-0xB5, 0x2C, 0xEB, 0xF1, 0x63, 0x3D, 0xFA, 0x15, 0xC7, 0x8E, 0xDB, 0xAC, 0x34, 0xED, 0xB0, 0xCE, 
-0x02, 0xE8, 0xEB, 0xD8, 0xC5, 0xA2, 0x70, 0xB5, 0x17, 0x59, 0x90, 0x98, 0x22, 0x49, 0x8B, 0x27, 
-0x45, 0xA2, 0x6D, 0x6D, 0xA9, 0xD1, 0xBE, 0x8B, 0xEB, 0x09, 0xA3, 0x83, 0x05, 0x4B, 0xFB, 0x87, 
-0x8C, 0x0E, 0x97, 0x84, 0x91, 0xA2, 0x1D, 0x32, 0xDA, 0xD2, 0x46, 0xBB, 0x36, 0xC1, 0x09, 0xC6, 
-0x38, 0x74, 0x62, 0xF1, 0x6A, 0x88, 0xD7, 0x0E, 0x97, 0x26, 0x51, 0x67, 0xDB, 0xDE, 0xCA, 0x97, 
-0x0E, 0x79, 0xFE, 0xE5, 0xEE, 0xC3, 0x7C, 0xE1, 0x60, 0xC1, 0x4E, 0xDB, 0xE2, 0x08, 0x6D, 0x72, 
-0x5A, 0x14, 0x78, 0xB4, 0x16, 0x94, 0x2A, 0xAC, 0xF3, 0xBD, 0xDD, 0x9B, 0x37, 0xB7, 0xFF, 0xE4, 
-0xFF, 0xF9, 0xA9, 0xD7, 0xFF, 0xF1, 0xDB, 0xFE, 0xD7, 0x2F, 0x3C, 0xE6, 0xA2, 0x7F, 0x9D, 0x2A, 
-0x9E, 0x10, 0x84, 0x4B, 0x4D, 0xBA, 0xFB, 0xF7, 0xDF, 0x7B, 0xF8, 0xDA, 0xEB, 0x6E, 0xB8, 0x61, 
-0xDF, 0x9E, 0x03, 0x5B, 0x2B, 0xAB, 0x2F, 0xC5, 0xFB, 0x96, 0x49, 0x53, 0xAC, 0xAD, 0x10, 0xA5, 
-0x28, 0x06, 0x7D, 0x7A, 0xA3, 0x8A, 0x3B, 0xEF, 0xBA, 0x9B, 0xFD, 0x07, 0x8E, 0x70, 0xFE, 0x05, 
-0x17, 0x71, 0xC1, 0x85, 0x17, 0x41, 0x96, 0x32, 0x95, 0x25, 0x58, 0x57, 0xB0, 0xB4, 0xB4, 0x40, 
-0x55, 0xE4, 0x4C, 0x65, 0x2D, 0x0C, 0xCD, 0xD4, 0x1F, 0xB4, 0x31, 0x78, 0x67, 0x71, 0x95, 0x8B, 
-0x19, 0x47, 0xA9, 0x75, 0xBC, 0xF5, 0x16, 0xA4, 0xCE, 0x67, 0xD2, 0x2C, 0x5A, 0xD5, 0xAB, 0xBC, 
-0x93, 0x58, 0x6B, 0x71, 0x63, 0x12, 0x93, 0xFB, 0xD6, 0xFA, 0xFD, 0x54, 0xB0, 0x42, 0xDA, 0x39, 
-0x01, 0xB9, 0x35, 0x58, 0x2D, 0x21, 0x9D, 0x0C, 0x1E, 0x6A, 0x39, 0xD7, 0xC3, 0xC3, 0x73, 0xD5, 
-0x87, 0x86, 0x15, 0xCF, 0xFA, 0x30, 0x3D, 0x77, 0x83, 0x66, 0x2A, 0xDF, 0xB4, 0xA2, 0xE6, 0x6E, 
-0x6B, 0xDD, 0x75, 0x52, 0xFD, 0x35, 0x19, 0x7F, 0xB8, 0xB6, 0xB5, 0x99, 0x78, 0x9B, 0xCB, 0x07, 
-0x2A, 0xA5, 0x22, 0x85, 0x87, 0x80, 0x0F, 0x31, 0xD7, 0x9C, 0xAB, 0x05, 0x87, 0x10, 0x40, 0x2B, 
-0x50, 0x2A, 0x0A, 0x05, 0xC1, 0x07, 0xC4, 0x81, 0x0A, 0x06, 0x15, 0x3A, 0x48, 0xE8, 0x62, 0xE7, 
-0x2B, 0x96, 0xF6, 0x0D, 0x39, 0xBA, 0x67, 0x91, 0xE1, 0xD1, 0x12, 0xED, 0x12, 0xDA, 0xBA, 0x83, 
-0x46, 0xE3, 0x5D, 0x20, 0x31, 0x6D, 0x82, 0xF7, 0x04, 0x5F, 0xE0, 0x28, 0xE3, 0x00, 0xD5, 0x6E, 
-0x53, 0x64, 0x53, 0xCC, 0xEB, 0x29, 0x3E, 0xF7, 0xE0, 0x12, 0x9F, 0xBE, 0xEF, 0x30, 0x9F, 0xDB, 
-0xBF, 0xC0, 0x6E, 0x9B, 0xD1, 0x97, 0x2E, 0x43, 0x12, 0x3C, 0x42, 0xBB, 0x9D, 0x91, 0x97, 0x8B, 
-0xCE, 0xFB, 0xC1, 0x03, 0xD3, 0x5D, 0xFD, 0x07, 0x6F, 0xBD, 0xEA, 0x3F, 0xFD, 0xEF, 0xB7, 0xFC, 
-0xE2, 0x9B, 0x1E, 0xF7, 0x64, 0xCB, 0x13, 0x89, 0x70, 0xA9, 0x49, 0x77, 0xC7, 0x8E, 0x2F, 0xF7, 
-0x7F, 0xE5, 0x7F, 0xBE, 0xFD, 0x8B, 0x5F, 0xBC, 0xF5, 0x2B, 0x1D, 0x1F, 0x78, 0x72, 0x55, 0x8E, 
-0x3A, 0x78, 0x2F, 0xC1, 0x07, 0x92, 0xA4, 0x8D, 0x73, 0x81, 0xE1, 0xD2, 0x12, 0xF7, 0xDD, 0xFF, 
-0x00, 0xBB, 0xEE, 0xDF, 0xC5, 0xB6, 0xB3, 0x36, 0x73, 0xCE, 0xDC, 0x1C, 0xC9, 0xF4, 0x34, 0xED, 
-0x56, 0x4A, 0x91, 0x17, 0x64, 0x69, 0x42, 0xBE, 0xB0, 0x80, 0x11, 0xF0, 0x3E, 0x06, 0xDE, 0x50, 
-0x41, 0x83, 0x87, 0x10, 0x3C, 0x49, 0x96, 0xE2, 0x83, 0xC7, 0xA9, 0xA8, 0x6E, 0x88, 0xB9, 0xA7, 
-0x62, 0x3C, 0x86, 0x26, 0x74, 0xDD, 0x24, 0xDD, 0xAE, 0x45, 0x78, 0xEB, 0x11, 0x55, 0xB3, 0x7F, 
-0xBD, 0xDF, 0x4F, 0x16, 0xA7, 0x73, 0xFE, 0x06, 0xE1, 0x9E, 0x18, 0xE3, 0xE7, 0x7D, 0x98, 0x9E, 
-0x7B, 0x8C, 0xA6, 0x1D, 0xD4, 0x31, 0x0C, 0xC6, 0x73, 0x0F, 0x59, 0x63, 0xAB, 0x7F, 0x5B, 0xCE, 
-0xC1, 0x3C, 0x49, 0xB6, 0x8C, 0x7F, 0x07, 0x81, 0x60, 0xF0, 0xA2, 0x41, 0x1A, 0x99, 0xB7, 0x8E, 
-0x77, 0xAB, 0x02, 0xCA, 0x78, 0x44, 0xC5, 0x20, 0xFC, 0xDA, 0x39, 0x94, 0x8B, 0x44, 0x6C, 0x74, 
-0x4A, 0x62, 0xA6, 0x08, 0x36, 0x65, 0x74, 0xD4, 0xD2, 0xDF, 0x37, 0xE0, 0xE8, 0xBE, 0x01, 0xC5, 
-0xD1, 0x0A, 0x19, 0x68, 0x92, 0x90, 0x92, 0xA8, 0x04, 0x44, 0x70, 0xB5, 0x9D, 0xAE, 0xB5, 0x15, 
-0x69, 0xAA, 0x48, 0xB5, 0xC6, 0x39, 0x4D, 0xA5, 0x5A, 0x14, 0xE9, 0x1C, 0xF7, 0x97, 0x09, 0x5F, 
-0x38, 0xD0, 0xE7, 0x9F, 0xEF, 0x7A, 0x80, 0x2F, 0x2F, 0x16, 0xF4, 0xCC, 0x2C, 0x47, 0x7C, 0xA0, 
-0x20, 0x30, 0xD3, 0x9A, 0x21, 0xD8, 0x82, 0xC2, 0x2E, 0x95, 0x89, 0xF2, 0xB7, 0x6F, 0x3B, 0x7B, 
-0xEE, 0x77, 0xFF, 0xFB, 0xFF, 0xF8, 0x89, 0xF7, 0xBC, 0xF9, 0xCD, 0x6F, 0x78, 0x5C, 0x2E, 0x90, 
-0xAD, 0x85, 0x27, 0x14, 0xE1, 0x36, 0xF8, 0xD7, 0x7F, 0xFD, 0xE0, 0xD2, 0xEF, 0xBE, 0xFD, 0x0F, 
-0x6E, 0xBA, 0xF6, 0xBA, 0x4F, 0x67, 0xBE, 0xAA, 0x9E, 0x6E, 0x6D, 0xD5, 0x99, 0x6A, 0x4F, 0x49, 
-0x55, 0x79, 0x02, 0x9A, 0xCE, 0xD4, 0x1C, 0xFD, 0x41, 0xCE, 0xBE, 0xFD, 0x07, 0xB8, 0xE5, 0x96, 
-0x5B, 0x68, 0x65, 0x2D, 0x9E, 0xFF, 0x9C, 0xE7, 0x40, 0xB7, 0xCB, 0x74, 0x6B, 0x8A, 0xC5, 0xA5, 
-0x45, 0xAA, 0x7C, 0x40, 0xA2, 0x14, 0x4A, 0xA7, 0x88, 0xC4, 0xD4, 0xE1, 0xBA, 0x9E, 0xAA, 0x85, 
-0xE0, 0x96, 0x13, 0xF5, 0xD5, 0x0B, 0x6C, 0x71, 0x21, 0x41, 0xEA, 0x40, 0xCC, 0x35, 0xE1, 0x8E, 
-0xFB, 0xE6, 0xB1, 0x9D, 0x73, 0xAD, 0x7D, 0x0D, 0x8E, 0xF7, 0xDB, 0xC9, 0x22, 0x96, 0xF3, 0x64, 
-0x69, 0x33, 0x62, 0x83, 0x70, 0x4F, 0x0E, 0xB2, 0x8E, 0x7D, 0xEB, 0x19, 0x85, 0xC4, 0xFF, 0x9A, 
-0x7A, 0x38, 0x5E, 0x7D, 0xAC, 0xB5, 0x6E, 0x20, 0xD4, 0xA1, 0x0E, 0x9A, 0x13, 0x43, 0x0C, 0xB6, 
-0x1F, 0x55, 0x14, 0x44, 0xB2, 0x8D, 0xB1, 0x65, 0x80, 0x26, 0xB7, 0x58, 0xA3, 0xB6, 0xF0, 0x98, 
-0xA0, 0x50, 0x5E, 0x21, 0x3E, 0x41, 0x85, 0x16, 0xBE, 0x34, 0x0C, 0xE6, 0x2B, 0x8E, 0xEC, 0x19, 
-0x30, 0xBF, 0xBB, 0x87, 0x1F, 0x08, 0xA9, 0x6F, 0xD3, 0x49, 0x3A, 0xB4, 0x93, 0x16, 0x01, 0x70, 
-0xCE, 0xE1, 0x01, 0x9D, 0x18, 0x94, 0x82, 0xD2, 0x39, 0x4A, 0xA7, 0x70, 0xE9, 0x34, 0xA3, 0xCE, 
-0x16, 0x76, 0xDB, 0x8C, 0x6B, 0x77, 0x1D, 0xE6, 0x63, 0xB7, 0xEF, 0xE2, 0x3E, 0x9B, 0x32, 0x4F, 
-0x97, 0x43, 0xCE, 0xD2, 0xE9, 0x6C, 0x21, 0xD5, 0x6D, 0xFA, 0xF9, 0x02, 0x99, 0x11, 0x6B, 0xFD, 
-0xE0, 0xCE, 0xCD, 0x9B, 0xDB, 0x6F, 0xFB, 0xD9, 0xFF, 0xF2, 0x13, 0xEF, 0xFF, 0x99, 0x9F, 0xF9, 
-0x91, 0xDE, 0xCA, 0x27, 0x7B, 0x7C, 0xE3, 0x09, 0x49, 0xB8, 0x00, 0x1F, 0xFE, 0xF0, 0x5F, 0x0F, 
-0x7F, 0xEF, 0x77, 0xDF, 0x71, 0xDB, 0x8D, 0x9F, 0xBF, 0x61, 0x50, 0x15, 0xC5, 0x93, 0xBC, 0x67, 
-0x53, 0x70, 0x4A, 0xA5, 0x49, 0x97, 0xA2, 0xF0, 0x98, 0xA4, 0x4D, 0x3E, 0xC8, 0x99, 0x5F, 0xE8, 
-0x71, 0xDF, 0xCE, 0x07, 0xE9, 0xF7, 0xFA, 0x6C, 0x3F, 0x6B, 0x1B, 0x9B, 0x2F, 0xB8, 0x98, 0xE9, 
-0xCD, 0x73, 0x88, 0x2D, 0x18, 0x0C, 0x06, 0xF4, 0x87, 0x23, 0x42, 0x00, 0x25, 0x1E, 0xA3, 0x40, 
-0x4B, 0xC0, 0x56, 0x25, 0xA2, 0x9B, 0x06, 0x1C, 0x5B, 0xAD, 0x0A, 0x1A, 0x62, 0x64, 0xD0, 0xE5, 
-0x56, 0x3E, 0xD1, 0x4B, 0xE4, 0x0C, 0xD9, 0xC9, 0x3E, 0x9C, 0x38, 0x15, 0xC2, 0x6D, 0x9E, 0xE3, 
-0x54, 0x49, 0xFD, 0x64, 0xF1, 0xD8, 0xAC, 0xA1, 0x65, 0x3C, 0x3C, 0x4F, 0xBD, 0x8C, 0xD8, 0x92, 
-0x9A, 0xB6, 0xB4, 0xAC, 0x81, 0x6D, 0xB2, 0x92, 0xF8, 0xB1, 0x84, 0x3A, 0x71, 0x4C, 0x2D, 0xF1, 
-0x4A, 0x7D, 0xDC, 0xE4, 0xF9, 0x51, 0x40, 0x88, 0x5F, 0x1B, 0x07, 0x06, 0xA5, 0xE2, 0x7B, 0xF4, 
-0xDE, 0xE3, 0x83, 0x8B, 0x64, 0x2B, 0x51, 0x4F, 0xAB, 0x75, 0x17, 0x42, 0x46, 0x28, 0x14, 0xA3, 
-0xA3, 0x96, 0xF9, 0xBD, 0x03, 0x96, 0xF6, 0x17, 0xB8, 0x9E, 0x90, 0x85, 0x2E, 0x5D, 0xD5, 0x45, 
-0x7B, 0x43, 0x70, 0x01, 0x67, 0xAB, 0x98, 0xE7, 0x8E, 0x40, 0x52, 0xAF, 0x03, 0x78, 0xD1, 0x0C, 
-0x83, 0xA6, 0x6A, 0x4F, 0xB3, 0xD4, 0xDE, 0xC4, 0x6D, 0x8B, 0x05, 0x9F, 0xB8, 0x67, 0x0F, 0xD7, 
-0xED, 0x59, 0xE4, 0x3E, 0x9B, 0x72, 0x54, 0xA6, 0x19, 0x84, 0x16, 0xAD, 0xF6, 0x66, 0x8A, 0x51, 
-0x89, 0xB5, 0xA3, 0x60, 0xC4, 0xE7, 0xD6, 0x0F, 0x3F, 0x7D, 0xF6, 0x39, 0xB3, 0xBF, 0xF9, 0xD6, 
-0x5F, 0xF9, 0xB1, 0x8F, 0xFC, 0xD4, 0x4F, 0x3D, 0xBE, 0x9C, 0x1A, 0x4E, 0x06, 0x4F, 0x58, 0xC2, 
-0xA5, 0x26, 0xDD, 0x77, 0xFD, 0xD9, 0x5F, 0x7D, 0xE9, 0x73, 0xD7, 0x5F, 0x7F, 0xF8, 0xE8, 0xD1, 
-0xA5, 0x67, 0x29, 0x31, 0x73, 0x95, 0x15, 0xA5, 0x54, 0x82, 0xAD, 0x1C, 0x49, 0x77, 0x86, 0xAA, 
-0x28, 0x99, 0x5F, 0x58, 0xE4, 0x86, 0x1B, 0x6F, 0x62, 0xE7, 0xEE, 0x7D, 0x3C, 0xF3, 0x59, 0xCF, 
-0x67, 0xEB, 0x59, 0xDB, 0xC8, 0xB6, 0xCD, 0x61, 0xCB, 0x11, 0x8B, 0xFD, 0x3E, 0x55, 0x55, 0x21, 
-0xD8, 0x18, 0xCE, 0x51, 0x3C, 0xA6, 0xD6, 0xE1, 0x4A, 0x74, 0x24, 0x8F, 0x09, 0xF0, 0x9A, 0x7F, 
-0x12, 0xBB, 0xC0, 0x89, 0xCC, 0xCA, 0x1E, 0xAA, 0x59, 0xD8, 0xC3, 0x81, 0x53, 0x25, 0xDC, 0x87, 
-0x13, 0x0F, 0xEF, 0xD5, 0x4F, 0x8C, 0x13, 0xBD, 0x9F, 0x13, 0xD5, 0xCF, 0x43, 0x87, 0xD4, 0xE2, 
-0xE7, 0xCA, 0x3B, 0x35, 0x25, 0x5A, 0xDD, 0xBE, 0x26, 0xBF, 0x47, 0x5E, 0x6D, 0x96, 0x1D, 0xA3, 
-0xCA, 0x20, 0x88, 0xC7, 0x8B, 0xAB, 0x4D, 0xBB, 0x22, 0xE1, 0x4A, 0xF3, 0x9C, 0x3E, 0xA0, 0x48, 
-0x48, 0x24, 0x45, 0x93, 0xA0, 0x5D, 0x8A, 0x14, 0x86, 0x6A, 0xC9, 0xB3, 0x74, 0xB8, 0x60, 0xF1, 
-0xC0, 0x90, 0xE1, 0x61, 0x4B, 0xE8, 0x2B, 0xDA, 0xB4, 0x99, 0x32, 0xD3, 0x31, 0x65, 0xB9, 0x73, 
-0x31, 0x01, 0x64, 0xA8, 0xA3, 0x87, 0x11, 0x55, 0x6A, 0x4E, 0x34, 0x7D, 0x95, 0x50, 0x74, 0x66, 
-0x39, 0x92, 0x74, 0xB9, 0xE5, 0x70, 0x8F, 0x8F, 0xDD, 0xF9, 0x00, 0x9F, 0x3D, 0x38, 0xCF, 0x6E, 
-0xD7, 0xA6, 0x6A, 0x6D, 0x67, 0x14, 0x32, 0x82, 0xA4, 0x24, 0x18, 0x4A, 0x37, 0x08, 0x2D, 0xA5, 
-0x06, 0x8E, 0xFC, 0x86, 0xB3, 0x2F, 0xD8, 0xFE, 0xCB, 0xFF, 0xE3, 0x97, 0x7E, 0xE4, 0x53, 0x6F, 
-0x7C, 0xE3, 0x1B, 0x8B, 0xE5, 0x27, 0x7A, 0xE2, 0xE0, 0x09, 0x4D, 0xB8, 0x00, 0xEF, 0x7F, 0xFF, 
-0x5F, 0x94, 0xEF, 0xFD, 0x9B, 0x77, 0xDE, 0x79, 0x68, 0xDF, 0xE0, 0x96, 0x43, 0x07, 0xE7, 0x37, 
-0x97, 0x95, 0x7F, 0x92, 0x23, 0x18, 0x65, 0x12, 0x69, 0xBC, 0xC1, 0x7C, 0x65, 0x29, 0x82, 0x70, 
-0xE8, 0xD0, 0x22, 0x37, 0x7E, 0xF1, 0x2B, 0xF4, 0x46, 0x15, 0x17, 0x5E, 0x78, 0x1E, 0x9B, 0xB6, 
-0x9F, 0xC5, 0xD4, 0xEC, 0x66, 0x4A, 0x5F, 0xE2, 0x5D, 0x0E, 0xAE, 0xC0, 0xDB, 0x9C, 0x4C, 0x1B, 
-0xF0, 0x4D, 0x2A, 0x69, 0x83, 0xD0, 0x24, 0x9C, 0x8C, 0xAD, 0xDE, 0xE3, 0x4F, 0x3A, 0xBC, 0xDE, 
-0xF1, 0x3A, 0xF5, 0xC3, 0x85, 0xF5, 0xC8, 0xE4, 0xB1, 0x44, 0xB8, 0x27, 0xCA, 0x78, 0xF1, 0xB0, 
-0xDF, 0xBF, 0xC6, 0x7A, 0xF7, 0x39, 0x7E, 0xE9, 0xCE, 0x04, 0x22, 0x59, 0x2E, 0x23, 0x2A, 0x0E, 
-0xC6, 0x96, 0x03, 0x71, 0xC9, 0xAB, 0x5E, 0x5C, 0x0B, 0xAB, 0x86, 0xA8, 0xC9, 0x60, 0xFA, 0x10, 
-0xC4, 0x81, 0xB8, 0xF8, 0x89, 0x8D, 0xC1, 0x67, 0x82, 0x07, 0x14, 0x3A, 0x08, 0xDA, 0x1B, 0x92, 
-0xD0, 0x42, 0xF9, 0x16, 0x7E, 0x04, 0xF9, 0x12, 0x2C, 0x1E, 0xCC, 0x59, 0x3C, 0x94, 0x33, 0x38, 
-0x54, 0xE0, 0x87, 0x8A, 0xCC, 0x77, 0xE8, 0x48, 0x9B, 0xC4, 0x69, 0xA8, 0x6A, 0x0B, 0x1E, 0x5C, 
-0x0C, 0x81, 0x9A, 0x08, 0x22, 0x3A, 0x66, 0x4A, 0x09, 0x8A, 0xDC, 0x74, 0x98, 0x4F, 0xA7, 0xB9, 
-0xBD, 0x5F, 0x71, 0xDD, 0x03, 0xFB, 0xF9, 0xE4, 0xCE, 0x7D, 0xDC, 0xB6, 0x54, 0x31, 0xAF, 0x67, 
-0x19, 0x99, 0x59, 0xFA, 0x25, 0xD1, 0xFD, 0xD7, 0x57, 0xE0, 0x72, 0x3F, 0x6D, 0xCC, 0x51, 0xE7, 
-0x47, 0x7F, 0xF5, 0x8A, 0x57, 0x7F, 0xD3, 0xAF, 0x7F, 0xE1, 0x0B, 0x7F, 0x77, 0xD3, 0x15, 0x57, 
-0x5C, 0xF1, 0xB8, 0x08, 0x44, 0x73, 0x3A, 0x78, 0xC2, 0x13, 0x2E, 0xC0, 0x7B, 0xDE, 0xF3, 0x1E, 
-0x77, 0xEF, 0x7D, 0x37, 0xEF, 0xBE, 0xF5, 0x96, 0x1D, 0x5F, 0xBD, 0xEF, 0xFE, 0x1D, 0x17, 0x5A, 
-0x57, 0x9D, 0xA7, 0x94, 0x4A, 0xBD, 0x2D, 0x04, 0xAD, 0xD1, 0xAD, 0x36, 0x4A, 0x0C, 0x83, 0xDC, 
-0xB2, 0x6B, 0xE7, 0x6E, 0x76, 0xEC, 0xDA, 0xCD, 0xB0, 0xCC, 0xB9, 0xE8, 0x29, 0x4F, 0xE5, 0xEC, 
-0x0B, 0x2F, 0x22, 0xCF, 0x73, 0x8A, 0xA2, 0xC0, 0x3B, 0x4B, 0xA8, 0x4A, 0xB2, 0x34, 0x85, 0x20, 
-0x28, 0xA2, 0x02, 0x57, 0xD5, 0x36, 0x8B, 0x82, 0xC7, 0xE3, 0x26, 0xA8, 0xF7, 0xE4, 0xB0, 0x5E, 
-0xA7, 0x7E, 0x38, 0xD0, 0xA8, 0x00, 0xD6, 0xBA, 0xE7, 0x63, 0x89, 0x70, 0x4F, 0x74, 0xF5, 0x87, 
-0xFB, 0xFE, 0x93, 0x58, 0xEB, 0x5E, 0x27, 0xAA, 0x9F, 0x87, 0x8E, 0xC9, 0x7B, 0xD6, 0x7E, 0xB6, 
-0x0D, 0x6A, 0x6F, 0xAF, 0xF8, 0xF7, 0x78, 0xE7, 0xC4, 0xEF, 0xD1, 0x34, 0x2C, 0x2E, 0x28, 0x78, 
-0xA8, 0x83, 0x83, 0xC7, 0xEB, 0x78, 0x04, 0xC1, 0x88, 0x41, 0xA3, 0x31, 0xBE, 0x85, 0x76, 0x2D, 
-0xC4, 0x77, 0x60, 0xA8, 0xE8, 0x1D, 0x2E, 0x58, 0x38, 0x10, 0x83, 0xCD, 0x54, 0xBD, 0x80, 0xB2, 
-0x09, 0x6D, 0xE9, 0xD0, 0x52, 0x19, 0x89, 0xD7, 0x28, 0x17, 0xD0, 0xA1, 0x22, 0x33, 0x1A, 0x8F, 
-0xC3, 0x06, 0x87, 0x53, 0x9A, 0x4A, 0xA7, 0x94, 0x26, 0x63, 0xA8, 0x3A, 0x1C, 0xD1, 0x1D, 0xBE, 
-0x9A, 0x0B, 0xD7, 0xEE, 0x3A, 0xC8, 0x67, 0x1F, 0x3C, 0xC8, 0xCE, 0x42, 0x71, 0x54, 0x4F, 0xD1, 
-0x0F, 0x19, 0x96, 0x94, 0xD4, 0xB4, 0x50, 0xCE, 0x02, 0x79, 0x68, 0x0B, 0x87, 0x47, 0x7E, 0xFE, 
-0x43, 0xAF, 0xF9, 0xCE, 0x57, 0xFE, 0xE6, 0x3F, 0xFC, 0xD3, 0x3B, 0xEE, 0x16, 0x69, 0x9C, 0x8A, 
-0x9F, 0x98, 0x38, 0xB6, 0x25, 0x3D, 0xC1, 0xF1, 0x53, 0x3F, 0xFA, 0xBF, 0xB6, 0xFF, 0xED, 0x87, 
-0xFF, 0xF9, 0x7B, 0x0F, 0x1C, 0x3C, 0xFC, 0x73, 0xA2, 0xB3, 0x73, 0xB5, 0x4A, 0xB5, 0xF5, 0x0E, 
-0xAD, 0x25, 0x4E, 0x8F, 0x5C, 0x85, 0x4E, 0x2A, 0xBA, 0x53, 0x23, 0xBE, 0xEE, 0x79, 0x17, 0xF3, 
-0x86, 0x2B, 0x5F, 0xCD, 0xCB, 0xAF, 0x78, 0x0A, 0xDB, 0x92, 0x25, 0xE6, 0x77, 0xDC, 0x8C, 0x3D, 
-0x78, 0x1F, 0xE9, 0x68, 0x81, 0xAE, 0x2B, 0x91, 0x72, 0x48, 0xA6, 0x0C, 0x18, 0x85, 0x2F, 0x0A, 
-0x4A, 0x5B, 0xA1, 0x12, 0x45, 0x92, 0x24, 0xD8, 0xC2, 0x8E, 0xEF, 0xB9, 0x56, 0x87, 0x55, 0x4D, 
-0x44, 0xB2, 0x75, 0xB0, 0x5A, 0x0A, 0x5D, 0x6D, 0x52, 0xF6, 0x70, 0xE9, 0x4E, 0x1B, 0x9C, 0x4A, 
-0xAB, 0x3F, 0x1E, 0x89, 0x9F, 0x0A, 0x26, 0x9F, 0x49, 0x3F, 0xC4, 0x6B, 0x9D, 0x0E, 0x56, 0xD7, 
-0xF1, 0xF1, 0x70, 0x3A, 0xF5, 0x33, 0xF9, 0x7D, 0xAD, 0xF7, 0x3F, 0x79, 0xDC, 0x8A, 0xDF, 0x25, 
-0x5A, 0x0B, 0x2C, 0x23, 0x9A, 0x6E, 0xAD, 0x68, 0x1F, 0xBE, 0x69, 0x13, 0x2A, 0x2E, 0xE2, 0x8A, 
-0xC4, 0xF8, 0xB2, 0xB5, 0x64, 0xAC, 0xA5, 0x6E, 0x4F, 0x3E, 0x80, 0x03, 0x2D, 0x19, 0x62, 0x0D, 
-0x14, 0x9A, 0x6A, 0x08, 0x79, 0xCF, 0x32, 0x5C, 0xAA, 0x18, 0xF5, 0x4B, 0x5C, 0xEE, 0x31, 0x5E, 
-0x30, 0x92, 0x45, 0xEB, 0x03, 0x0F, 0xE2, 0x3C, 0xC6, 0x41, 0x22, 0x12, 0x3D, 0x34, 0xF1, 0xE4, 
-0xDE, 0x63, 0x93, 0x16, 0x7D, 0xD1, 0x2C, 0x04, 0x43, 0x99, 0x4D, 0x71, 0x68, 0xE0, 0xB9, 0x79, 
-0xF7, 0x21, 0xAE, 0xDD, 0xBB, 0xC8, 0x6E, 0xA7, 0x38, 0x50, 0x59, 0x0A, 0x5A, 0x90, 0x4E, 0x33, 
-0x2A, 0xE3, 0x33, 0x6C, 0x6A, 0x4F, 0x31, 0x18, 0x2D, 0x94, 0x9E, 0xD1, 0xAE, 0x4B, 0x2E, 0x3A, 
-0xEF, 0x7F, 0xBE, 0xE6, 0x5B, 0x5E, 0xFE, 0xE1, 0xB7, 0xBF, 0xEB, 0xAA, 0xF9, 0x89, 0x07, 0x7C, 
-0xC2, 0xE2, 0x6B, 0x42, 0xC2, 0x9D, 0xC4, 0xE7, 0xBF, 0xF8, 0xA9, 0xC1, 0xEB, 0x5F, 0xFF, 0x86, 
-0xAF, 0xEC, 0x7E, 0xE0, 0xFE, 0xE1, 0x68, 0xD4, 0xBB, 0xC4, 0xD9, 0x62, 0x73, 0xAB, 0x95, 0x29, 
-0xEF, 0xEB, 0xD0, 0x72, 0x2A, 0xEA, 0x96, 0x8A, 0x51, 0xC5, 0xAE, 0xBD, 0x87, 0xF8, 0xCA, 0x57, 
-0xEF, 0x67, 0x66, 0x6E, 0x3B, 0x97, 0x5D, 0xFE, 0x5C, 0x5A, 0x9D, 0x19, 0x3C, 0x9A, 0xC1, 0x68, 
-0x48, 0x5E, 0xE5, 0x4C, 0x4D, 0x75, 0x11, 0x71, 0x14, 0xA3, 0x1E, 0x49, 0x62, 0x30, 0xAD, 0x8C, 
-0x60, 0x2D, 0xC5, 0x28, 0x47, 0x6B, 0x33, 0xBE, 0xE7, 0x89, 0x3A, 0xEF, 0x7A, 0x58, 0xEF, 0xBC, 
-0xF5, 0xF6, 0x9F, 0x49, 0x9C, 0x88, 0xCE, 0x27, 0xCB, 0x20, 0xAB, 0x16, 0x02, 0x4F, 0xB7, 0x7C, 
-0x93, 0xE7, 0x9D, 0xAC, 0x4A, 0xE6, 0x4C, 0xE2, 0x54, 0x9E, 0xE1, 0xA1, 0xD6, 0xCF, 0x5A, 0xD7, 
-0x5F, 0x73, 0xFF, 0x31, 0x02, 0x5F, 0xBC, 0x73, 0x93, 0xD5, 0x16, 0x88, 0xF6, 0x33, 0x22, 0x51, 
-0x45, 0x40, 0x5C, 0x38, 0x0B, 0x38, 0x54, 0xAD, 0xA7, 0xF5, 0xCE, 0xE3, 0xAC, 0x47, 0x9C, 0xC2, 
-0x48, 0x86, 0xA6, 0x8B, 0xD8, 0x0C, 0x72, 0x4D, 0x7E, 0xD4, 0xB1, 0xB0, 0xBF, 0xCF, 0xD1, 0x7D, 
-0x7D, 0xFA, 0xF3, 0x39, 0x52, 0x6A, 0x5A, 0xD2, 0xC6, 0x38, 0x4D, 0x82, 0x22, 0x11, 0x4D, 0xA6, 
-0x0D, 0x46, 0x04, 0x9C, 0x23, 0xB8, 0x02, 0xE7, 0x3D, 0xA6, 0xD5, 0x61, 0x14, 0x34, 0x7D, 0x9D, 
-0x92, 0x77, 0xB7, 0x30, 0x98, 0xDA, 0xCA, 0xBD, 0x43, 0xE1, 0x33, 0x3B, 0xF6, 0x71, 0xDD, 0xAE, 
-0xC3, 0xDC, 0x67, 0x53, 0xF6, 0x78, 0x8D, 0x63, 0x9A, 0x24, 0x99, 0xC2, 0x39, 0x30, 0x22, 0xE8, 
-0xE0, 0xC2, 0xC0, 0x1E, 0xAE, 0xB4, 0x2A, 0x6F, 0xDB, 0xB4, 0x25, 0xFB, 0xC3, 0x37, 0xBF, 0xFD, 
-0xE7, 0xFE, 0xFA, 0xAA, 0xFF, 0xFA, 0xA6, 0x27, 0x94, 0x25, 0xC2, 0xF1, 0xF0, 0x35, 0x47, 0xB8, 
-0x00, 0x37, 0xDF, 0x7C, 0x6D, 0xF5, 0xE1, 0x8F, 0xBC, 0xF7, 0x96, 0x3D, 0x7B, 0x0E, 0x5D, 0x77, 
-0xDF, 0x7D, 0x3B, 0xCE, 0x93, 0xE0, 0xCF, 0xB1, 0xD5, 0xA8, 0xD5, 0x6E, 0x4F, 0x23, 0xE8, 0xE8, 
-0xDC, 0x90, 0x74, 0xF0, 0x95, 0xE1, 0xF0, 0xE1, 0x45, 0x6E, 0xFB, 0xD2, 0x0E, 0x3E, 0xFB, 0xF9, 
-0x2F, 0x91, 0x74, 0xE6, 0xB8, 0xEC, 0x39, 0x57, 0x90, 0x4E, 0x4F, 0x13, 0x14, 0x2C, 0x0E, 0x17, 
-0x71, 0xBE, 0xA4, 0xDB, 0x6D, 0xE1, 0x6C, 0x85, 0x1B, 0xE5, 0x68, 0xD1, 0x68, 0x95, 0xD4, 0x66, 
-0x61, 0x6B, 0x74, 0xA0, 0x1A, 0xEB, 0xED, 0x5F, 0x8D, 0xB5, 0x8E, 0x5B, 0x6B, 0xDF, 0x99, 0xC6, 
-0xC9, 0x10, 0xCA, 0x6A, 0x82, 0x58, 0xFD, 0xFD, 0x74, 0xD0, 0x9C, 0xFF, 0x68, 0x10, 0x2E, 0x13, 
-0xF7, 0x3F, 0xD1, 0x73, 0x3C, 0x94, 0xFA, 0x91, 0x7A, 0x86, 0xB2, 0xDE, 0x3D, 0x44, 0x04, 0x55, 
-0x7B, 0x87, 0x35, 0x8B, 0x61, 0x91, 0x60, 0x27, 0x25, 0xF0, 0xB8, 0x28, 0xA6, 0x23, 0xC5, 0x22, 
-0x75, 0xF8, 0xC2, 0x98, 0xA1, 0x01, 0x24, 0xD8, 0xE8, 0xF1, 0xE8, 0x15, 0x89, 0xA4, 0xA4, 0xBA, 
-0x8B, 0x0E, 0x5D, 0x18, 0x6A, 0xF2, 0x05, 0x47, 0x6F, 0xDF, 0x90, 0xF9, 0x3D, 0x3D, 0x0E, 0xED, 
-0x59, 0x64, 0xB4, 0x60, 0x49, 0x43, 0xC6, 0x74, 0x32, 0x4D, 0x66, 0x32, 0x94, 0x87, 0xD4, 0x18, 
-0xBC, 0xAD, 0xA2, 0x45, 0x8E, 0x75, 0x28, 0xEF, 0x51, 0x02, 0xCA, 0x24, 0x90, 0xB6, 0x38, 0x52, 
-0x38, 0xAA, 0xE9, 0x2D, 0x2C, 0xB4, 0xE6, 0xB8, 0x67, 0x00, 0x9F, 0xD9, 0x75, 0x98, 0x8F, 0xDE, 
-0x7E, 0x3F, 0x37, 0x1C, 0x3A, 0xCA, 0x5E, 0xDA, 0x1C, 0x65, 0x06, 0x49, 0x67, 0x63, 0xC0, 0x1A, 
-0xEF, 0xE9, 0x28, 0x8D, 0x84, 0xC2, 0x5B, 0xFA, 0x87, 0xD3, 0x36, 0x1F, 0xBA, 0xFC, 0x8A, 0xCB, 
-0x7E, 0xEE, 0x4F, 0xDE, 0xF9, 0xAB, 0xFF, 0xF2, 0xBA, 0xD7, 0xBC, 0xA6, 0x5C, 0x7E, 0xF2, 0x27, 
-0x3E, 0xD6, 0x7E, 0xE3, 0x5F, 0x23, 0x08, 0x21, 0xA8, 0x7F, 0xF3, 0x92, 0xD7, 0x3E, 0xE5, 0xE6, 
-0x2F, 0xDD, 0xF5, 0x1F, 0x86, 0x23, 0xFF, 0xC3, 0xD6, 0xA9, 0xD9, 0x56, 0xBA, 0x49, 0x79, 0x12, 
-0x90, 0x28, 0x35, 0x84, 0xE0, 0x70, 0xAE, 0x87, 0x84, 0x1E, 0xCF, 0x79, 0xC6, 0x39, 0x7C, 0xD7, 
-0x2B, 0x9F, 0xC7, 0x1B, 0xAE, 0xFC, 0x37, 0x9C, 0xD3, 0xED, 0xB1, 0xEF, 0xCE, 0xEB, 0x29, 0x0E, 
-0xDC, 0xCB, 0x94, 0xEF, 0xD3, 0xAE, 0x72, 0x5A, 0xDE, 0x93, 0x05, 0x83, 0xAB, 0x8A, 0x71, 0xA0, 
-0x8F, 0xD3, 0xC5, 0x64, 0xC7, 0x5F, 0x3D, 0x25, 0x5D, 0x6B, 0xDF, 0x99, 0xC6, 0x89, 0x4A, 0xDF, 
-0x94, 0x6F, 0x75, 0x39, 0xD6, 0xDB, 0x7F, 0xAA, 0x38, 0x76, 0xC2, 0xFD, 0xD8, 0xC2, 0x89, 0xEA, 
-0xE7, 0x44, 0x38, 0x91, 0xFA, 0x42, 0xD5, 0x77, 0xF0, 0x63, 0xC2, 0x0D, 0x13, 0x84, 0x5B, 0x93, 
-0xB6, 0x97, 0xDA, 0xBD, 0xBC, 0xB6, 0x12, 0x0F, 0x52, 0xD7, 0x9C, 0x47, 0x19, 0x08, 0xDE, 0x83, 
-0x15, 0x84, 0x0C, 0x9C, 0xC1, 0x0D, 0x3D, 0x4B, 0x47, 0x06, 0xF4, 0xE7, 0x73, 0x86, 0x8B, 0x39, 
-0x2A, 0x24, 0x24, 0x24, 0x18, 0x95, 0x91, 0xA0, 0xD1, 0x68, 0x42, 0x08, 0x84, 0xE0, 0x40, 0x02, 
-0x5A, 0x40, 0x2B, 0x15, 0xCD, 0xC6, 0x1C, 0xF8, 0xA0, 0x70, 0x3A, 0x61, 0xA4, 0x33, 0xD4, 0xCC, 
-0x59, 0x1C, 0xF2, 0x09, 0x77, 0xCE, 0x8F, 0xF8, 0xC2, 0x9E, 0xC3, 0xDC, 0x76, 0x70, 0x89, 0x5D, 
-0xFD, 0x82, 0x9E, 0xB4, 0xB1, 0x59, 0x97, 0xA5, 0xDC, 0xD2, 0x6A, 0x4D, 0x21, 0x79, 0x8E, 0x22, 
-0x0F, 0x29, 0xCE, 0x0D, 0x58, 0xDC, 0x9F, 0xB5, 0xF5, 0x7B, 0x2F, 0x7D, 0xFA, 0x45, 0x7F, 0x72, 
-0xCB, 0x2D, 0xD7, 0xEC, 0x90, 0x68, 0xF8, 0xFB, 0x35, 0x85, 0x63, 0xDF, 0xF4, 0xD7, 0x20, 0xFE, 
-0xF0, 0x0F, 0xDF, 0x37, 0xF5, 0xAB, 0xBF, 0xF2, 0xBF, 0xBE, 0xF7, 0xC8, 0xE1, 0xC1, 0x8F, 0xA2, 
-0x5A, 0x2F, 0x2A, 0x2A, 0xA7, 0xA1, 0x2D, 0x5A, 0x4D, 0xA1, 0x14, 0x54, 0xAE, 0x00, 0x72, 0xDA, 
-0x2D, 0x4B, 0x37, 0xCD, 0xF9, 0xFA, 0xE7, 0x5F, 0xC4, 0xB7, 0x7D, 0xE3, 0xD3, 0xF9, 0xB6, 0x97, 
-0x3C, 0x8D, 0x73, 0xDA, 0x39, 0x8B, 0xF7, 0x7F, 0x99, 0x6C, 0x38, 0x4F, 0xAB, 0x1A, 0xE0, 0x97, 
-0x16, 0xC9, 0x94, 0x43, 0xE1, 0xD6, 0x98, 0x0E, 0x9E, 0x3C, 0x1E, 0xEB, 0x84, 0xFB, 0x70, 0xE3, 
-0x89, 0x46, 0xB8, 0xC7, 0x7B, 0x5F, 0x6B, 0x13, 0x6E, 0x84, 0x87, 0x35, 0xDB, 0x91, 0xF8, 0x48, 
-0xB8, 0x91, 0x91, 0x05, 0x2D, 0x06, 0x85, 0x26, 0x7A, 0x33, 0x10, 0xBB, 0xB6, 0x0B, 0xF8, 0x91, 
-0x63, 0xB0, 0x94, 0x33, 0x5A, 0x2C, 0x29, 0x87, 0x0E, 0x37, 0x0A, 0x04, 0xAB, 0x51, 0x2E, 0x89, 
-0x0B, 0x67, 0x12, 0x89, 0xD6, 0x7B, 0x1F, 0xF5, 0xBB, 0x00, 0x4A, 0x28, 0x5D, 0x49, 0x96, 0x65, 
-0x28, 0xA3, 0x29, 0xAD, 0xC7, 0x06, 0x85, 0x4B, 0xBB, 0x14, 0xE9, 0x14, 0x7D, 0xDD, 0x66, 0x67, 
-0xAF, 0xE2, 0x96, 0x5D, 0x07, 0xB8, 0x75, 0xEF, 0x3C, 0x3B, 0x07, 0x15, 0x87, 0x50, 0x54, 0x7A, 
-0x86, 0x52, 0xB7, 0x18, 0x96, 0x03, 0x3A, 0xD9, 0x0C, 0x45, 0xD1, 0xA3, 0x05, 0x41, 0xA8, 0x86, 
-0x39, 0x0B, 0xD7, 0x9D, 0x7B, 0xF6, 0xB6, 0x3F, 0x7B, 0xC3, 0x1B, 0xFF, 0xFD, 0x3F, 0x5F, 0x75, 
-0xD5, 0x9B, 0xFA, 0x93, 0xCF, 0xF2, 0xB5, 0x84, 0xAF, 0x49, 0x95, 0xC2, 0x6A, 0x7C, 0xF4, 0xA3, 
-0xEF, 0x2F, 0xDF, 0xF5, 0xEE, 0x4F, 0x7E, 0xB5, 0xCA, 0x0F, 0x7C, 0xE9, 0xCB, 0x77, 0x7C, 0x69, 
-0x73, 0x3B, 0x9B, 0xD9, 0x92, 0xAA, 0x6E, 0x87, 0x20, 0x54, 0xAE, 0x90, 0x34, 0x69, 0xA1, 0x8C, 
-0xC1, 0x5A, 0x28, 0x6D, 0xE0, 0xFE, 0x5D, 0x7B, 0xF8, 0xE2, 0x6D, 0x77, 0xE2, 0x7C, 0x4A, 0xAB, 
-0x3D, 0x8B, 0x92, 0x0C, 0x1D, 0x14, 0xC1, 0x3B, 0x70, 0x9E, 0x24, 0xD1, 0xE0, 0x6D, 0x1D, 0x79, 
-0xEC, 0xF4, 0xB1, 0xBA, 0x23, 0x1E, 0x6F, 0x1A, 0x7A, 0xA6, 0xB1, 0x3E, 0x3D, 0xAC, 0xC4, 0x6A, 
-0x22, 0x39, 0xD9, 0xF2, 0x9D, 0xE8, 0x59, 0xD6, 0xFF, 0xE5, 0xCC, 0xE0, 0x44, 0xF7, 0x3F, 0x11, 
-0x4E, 0x54, 0x3F, 0xAB, 0xEB, 0x65, 0x2D, 0xC8, 0x71, 0x54, 0x30, 0xCD, 0xDE, 0x78, 0x95, 0x48, 
-0xAA, 0x48, 0xCC, 0xB0, 0x00, 0x12, 0xC9, 0x15, 0x55, 0xE7, 0xE1, 0xD3, 0xA8, 0x90, 0x44, 0x9A, 
-0x76, 0x02, 0x56, 0x28, 0x16, 0x2D, 0xE5, 0xA2, 0xA3, 0x77, 0x64, 0x44, 0xEF, 0xF0, 0x88, 0x7C, 
-0xB1, 0xC0, 0x0F, 0x05, 0xE3, 0x12, 0x4C, 0x48, 0x69, 0xEB, 0x36, 0x62, 0x05, 0x57, 0x7A, 0xBC, 
-0x0B, 0x68, 0xA5, 0x31, 0x26, 0x41, 0x29, 0x0D, 0x02, 0x4A, 0x0C, 0x2E, 0x08, 0x7D, 0xE7, 0xC9, 
-0x95, 0xA1, 0x9C, 0xDA, 0x44, 0xBF, 0x33, 0xCB, 0x03, 0x95, 0xE6, 0xAB, 0x0B, 0x25, 0xD7, 0xDC, 
-0xBD, 0x97, 0xCF, 0x3F, 0x78, 0x84, 0x5D, 0x85, 0xA6, 0x2F, 0xD3, 0x2C, 0x91, 0x90, 0x87, 0x04, 
-0x92, 0x0C, 0x41, 0x11, 0xAA, 0x61, 0x10, 0x46, 0xB6, 0x60, 0xB0, 0x27, 0xD1, 0xFE, 0x43, 0xAF, 
-0x78, 0xF5, 0xCB, 0x7F, 0xF3, 0x37, 0x7F, 0xE7, 0x17, 0xAE, 0x7D, 0xC3, 0x1B, 0xBE, 0xEF, 0x71, 
-0x93, 0x0E, 0xE7, 0xE1, 0xC0, 0xDA, 0x6F, 0xFB, 0x6B, 0x18, 0xBF, 0xF0, 0x6B, 0xEF, 0x98, 0xFB, 
-0xE0, 0x9F, 0xFF, 0xC3, 0x77, 0xDF, 0x75, 0xD7, 0xCE, 0x37, 0xB7, 0xD2, 0xB9, 0x4B, 0xAB, 0xCA, 
-0xB6, 0x5C, 0xB0, 0x4C, 0x75, 0xA6, 0xB0, 0xD6, 0xE2, 0xBD, 0x25, 0x4B, 0x15, 0x99, 0x09, 0x90, 
-0x1F, 0xE6, 0x29, 0xDB, 0xDB, 0x7C, 0xFD, 0x33, 0xB7, 0xF3, 0x82, 0x8B, 0xDB, 0x5C, 0x7E, 0x61, 
-0x9B, 0x73, 0xA6, 0x4B, 0xE8, 0xED, 0x67, 0x4A, 0x55, 0x24, 0xA1, 0x82, 0x75, 0x3A, 0xDF, 0x7A, 
-0x1D, 0xAD, 0xC1, 0x5A, 0x84, 0xB0, 0xD6, 0xBE, 0xF5, 0xB0, 0xD6, 0x3D, 0x27, 0x71, 0xA2, 0xEB, 
-0x3C, 0xB4, 0xA1, 0xE2, 0xC4, 0x68, 0xCA, 0xB7, 0x5E, 0x39, 0x1E, 0x6E, 0x09, 0xF7, 0x44, 0xF7, 
-0x3F, 0x11, 0x1E, 0xCE, 0xFA, 0x89, 0xEF, 0x79, 0xA5, 0x2C, 0x14, 0xCB, 0xEB, 0xC7, 0x35, 0x63, 
-0x24, 0xDA, 0x82, 0xE3, 0x34, 0xDE, 0x43, 0xB0, 0x60, 0x4B, 0x47, 0x95, 0x57, 0x54, 0x79, 0xA0, 
-0x3C, 0x1A, 0xF0, 0x85, 0xC6, 0x15, 0x25, 0xC1, 0x06, 0x12, 0x31, 0xA4, 0x92, 0xA0, 0x9C, 0xE0, 
-0x2A, 0x0F, 0x08, 0x89, 0xD2, 0x28, 0x65, 0xA8, 0xBC, 0xA3, 0x2C, 0x2C, 0x2E, 0x78, 0x8C, 0x31, 
-0x24, 0x49, 0x86, 0x42, 0x93, 0x07, 0x4F, 0xDF, 0x24, 0x0C, 0xDA, 0x2D, 0x0E, 0x2A, 0xC3, 0xDD, 
-0x47, 0x87, 0xDC, 0xF2, 0xC0, 0x21, 0xEE, 0x3C, 0x30, 0x60, 0xC1, 0x75, 0x39, 0x5C, 0x05, 0x0A, 
-0x3A, 0x28, 0xDD, 0xA6, 0xF4, 0x81, 0x32, 0x38, 0x94, 0x16, 0x94, 0xB2, 0xDE, 0x57, 0x8B, 0x3D, 
-0x25, 0xF6, 0xFA, 0x27, 0x3F, 0xF3, 0x49, 0xEF, 0x7A, 0xF5, 0xAB, 0xBF, 0xFD, 0x13, 0xBF, 0xF9, 
-0x9B, 0x3F, 0xFF, 0x35, 0xB3, 0x30, 0x76, 0x3C, 0x9C, 0x5E, 0x6B, 0x7B, 0x82, 0xE3, 0xEA, 0xAB, 
-0xAF, 0x6E, 0xFD, 0xCC, 0xCF, 0xFC, 0xE1, 0x0B, 0xBF, 0x78, 0xCB, 0x57, 0x7E, 0x3C, 0x4D, 0xB3, 
-0x57, 0x54, 0x95, 0x9D, 0xF3, 0x41, 0xE9, 0x2C, 0xE9, 0x82, 0x4A, 0xE3, 0x74, 0xCE, 0x59, 0x74, 
-0x18, 0x32, 0xAD, 0x86, 0xCC, 0x9A, 0x45, 0x2E, 0xDE, 0x6A, 0xF9, 0xA6, 0xE7, 0x5F, 0xC0, 0x8B, 
-0x9F, 0x73, 0x01, 0x4F, 0x9A, 0x85, 0x4D, 0x7E, 0x89, 0xB6, 0x1F, 0x21, 0x38, 0x42, 0x70, 0xE8, 
-0x10, 0x55, 0x0C, 0x12, 0x62, 0x70, 0x90, 0xD8, 0xD1, 0x57, 0xD2, 0x4A, 0xEC, 0x4E, 0x1E, 0x2F, 
-0x71, 0xCA, 0xB8, 0x82, 0x0C, 0xEA, 0xE9, 0x9E, 0xD4, 0xFE, 0xF0, 0x93, 0xE7, 0x8C, 0x31, 0x31, 
-0xF5, 0x6C, 0x08, 0x45, 0x8D, 0x79, 0x77, 0xE5, 0xBD, 0xA2, 0xED, 0xF0, 0x8A, 0x5D, 0x2B, 0xB0, 
-0x7C, 0xA5, 0xA8, 0x13, 0x5C, 0xFD, 0x19, 0x09, 0xC1, 0x23, 0x5E, 0xF0, 0xE2, 0x51, 0x41, 0xE1, 
-0xC5, 0xC7, 0xE9, 0xE9, 0x31, 0x66, 0x4C, 0xC7, 0x62, 0xF2, 0xF7, 0xB5, 0x48, 0xEF, 0x91, 0x22, 
-0x5C, 0xD6, 0xBC, 0xFF, 0xEA, 0xE7, 0x3D, 0x16, 0xAB, 0x09, 0x77, 0x75, 0x2D, 0x1D, 0x17, 0xE2, 
-0x27, 0xA6, 0xFE, 0xCB, 0xF0, 0xC4, 0x58, 0x1C, 0x6B, 0x23, 0x1E, 0xDF, 0xC4, 0xEB, 0x88, 0x6E, 
-0xB5, 0x80, 0x15, 0x5C, 0x05, 0xC5, 0xB0, 0x62, 0xD4, 0x1F, 0x31, 0xE8, 0xE5, 0x14, 0x03, 0x8B, 
-0x14, 0x6D, 0x8C, 0xB4, 0x49, 0x95, 0x46, 0x82, 0x47, 0x07, 0x30, 0x41, 0x62, 0xCE, 0xBE, 0xBA, 
-0x6D, 0x39, 0xEB, 0x71, 0x21, 0x6A, 0x25, 0x44, 0x19, 0xBC, 0xD2, 0x78, 0x02, 0x36, 0x18, 0xBC, 
-0x6E, 0x33, 0x54, 0x86, 0x05, 0x93, 0xB2, 0xBB, 0xAA, 0xB8, 0xF5, 0xE0, 0x51, 0x6E, 0xDE, 0x7D, 
-0x90, 0x9D, 0x4B, 0x9E, 0x9E, 0x4C, 0xB3, 0xE8, 0x0C, 0xDA, 0x6C, 0x22, 0x78, 0x45, 0xE5, 0x6D, 
-0x8C, 0x2A, 0x46, 0x11, 0xCA, 0x30, 0x2A, 0x85, 0x7C, 0x67, 0x27, 0x0B, 0x1F, 0x7A, 0xDE, 0x73, 
-0x2F, 0xFF, 0xF3, 0x37, 0xFD, 0xCC, 0xEB, 0x76, 0x5C, 0x79, 0xE5, 0x95, 0x5F, 0x53, 0x0B, 0x63, 
-0xC7, 0xC3, 0xEA, 0x96, 0xB6, 0x81, 0x09, 0xFC, 0xA7, 0xFF, 0xF4, 0x3B, 0xE7, 0xBC, 0xF7, 0xBD, 
-0x7F, 0xFD, 0xDA, 0x43, 0x87, 0xFB, 0x3F, 0xAC, 0xC9, 0x9E, 0x2D, 0xBA, 0xDD, 0x76, 0x56, 0x49, 
-0x66, 0x32, 0x5C, 0x55, 0x12, 0x18, 0x31, 0xDB, 0x16, 0x28, 0x8F, 0xA2, 0xDC, 0x61, 0xE6, 0xA6, 
-0x03, 0xE7, 0x6E, 0xEB, 0xF2, 0xD2, 0xCB, 0x2F, 0xE0, 0x25, 0x4F, 0xEA, 0xF0, 0xD4, 0x2D, 0x09, 
-0xB3, 0xD3, 0x29, 0xB8, 0x21, 0xDA, 0xF5, 0x30, 0x94, 0x48, 0x28, 0x50, 0xDE, 0x93, 0x28, 0x1D, 
-0xB3, 0x05, 0xD7, 0x36, 0x93, 0x22, 0x12, 0xF3, 0xA0, 0x05, 0x0F, 0x2A, 0x3A, 0x55, 0x78, 0xEF, 
-0xC7, 0x11, 0xC8, 0xF0, 0x01, 0x5F, 0xF7, 0x64, 0x65, 0x12, 0x7C, 0x68, 0x5C, 0x36, 0xA9, 0xBB, 
-0xB8, 0x07, 0x71, 0x13, 0xDD, 0x3D, 0x76, 0xD0, 0x18, 0x6D, 0x2A, 0x76, 0xD4, 0x15, 0xDF, 0x57, 
-0x11, 0x6E, 0xB3, 0xC8, 0xE7, 0x85, 0x9A, 0x0C, 0x9A, 0xF3, 0x56, 0x53, 0xC9, 0x2A, 0xE2, 0x0D, 
-0xAA, 0xF6, 0x5C, 0x5A, 0xF9, 0x19, 0xFD, 0xF5, 0x63, 0xFC, 0xAA, 0xB5, 0xB0, 0x3C, 0x10, 0xAC, 
-0x8D, 0x66, 0xB1, 0x68, 0x3D, 0x9C, 0xCA, 0xF9, 0x6B, 0x49, 0xB3, 0x2A, 0xAC, 0x4D, 0xBA, 0x71, 
-0x5F, 0x20, 0x28, 0x45, 0x9C, 0xD0, 0xC7, 0xFD, 0x93, 0xF7, 0x13, 0x11, 0xC2, 0xAA, 0xD1, 0x4A, 
-0x42, 0x1D, 0xC4, 0x28, 0xC4, 0xB0, 0x87, 0x2B, 0xDF, 0x0D, 0x08, 0x93, 0x83, 0x50, 0x40, 0x44, 
-0x11, 0x42, 0x88, 0x71, 0x68, 0x6B, 0x89, 0xD6, 0xA3, 0xE2, 0x7D, 0xEA, 0x81, 0x39, 0xE0, 0x20, 
-0x98, 0x98, 0x5D, 0x9A, 0xE8, 0xD5, 0xA8, 0xBC, 0x42, 0x1C, 0xF8, 0xA1, 0xA3, 0x1C, 0x54, 0x8C, 
-0x96, 0x46, 0xE4, 0xBD, 0x12, 0x9F, 0x0B, 0x21, 0x28, 0xC4, 0x1B, 0x40, 0x13, 0x7C, 0x82, 0xD1, 
-0x49, 0xBC, 0x9D, 0xB5, 0x88, 0xB3, 0x24, 0x4A, 0x63, 0x82, 0x80, 0x8B, 0x65, 0xB2, 0x01, 0x2C, 
-0x80, 0x4E, 0xB1, 0x4A, 0xE3, 0x95, 0xA2, 0x12, 0x21, 0x4F, 0x3A, 0x1C, 0x0A, 0x5D, 0xEE, 0x5F, 
-0x2A, 0xB9, 0xF3, 0xE0, 0x61, 0x6E, 0xDF, 0x7F, 0x84, 0x7B, 0xFB, 0x05, 0x0B, 0x74, 0xC8, 0xCD, 
-0x2C, 0x39, 0x1D, 0x4A, 0xAB, 0x48, 0xB3, 0x0E, 0xB6, 0xC8, 0x31, 0xC6, 0x63, 0xED, 0x92, 0x57, 
-0x14, 0x0B, 0x5A, 0xDC, 0x35, 0xCF, 0x7D, 0xE1, 0x33, 0xDF, 0xF9, 0x7D, 0xAF, 0x7F, 0xF9, 0x0D, 
-0x3F, 0xFD, 0xD3, 0x3F, 0xFD, 0xB8, 0xCB, 0x39, 0xF6, 0x70, 0xE3, 0x04, 0xCD, 0x7A, 0x03, 0x57, 
-0x5F, 0x7D, 0xB5, 0x79, 0xFB, 0xDB, 0xFF, 0xFE, 0xF2, 0x7F, 0xF9, 0x97, 0xEB, 0x7E, 0xC0, 0xBA, 
-0xF4, 0xB5, 0xB6, 0x92, 0xF3, 0x53, 0x9D, 0xA5, 0xA9, 0x49, 0xC4, 0x55, 0x23, 0xAC, 0x1B, 0x92, 
-0x68, 0x47, 0x66, 0x2A, 0x8A, 0x62, 0x01, 0x28, 0xB8, 0x68, 0x73, 0xCA, 0xB3, 0xCF, 0x0A, 0x7C, 
-0xDD, 0xD3, 0xCE, 0xE6, 0xB9, 0xCF, 0xB8, 0x88, 0xF3, 0xB6, 0x24, 0x4C, 0x27, 0x39, 0xED, 0xB0, 
-0x84, 0xB6, 0x03, 0x12, 0x2C, 0x89, 0x00, 0xDE, 0x47, 0x67, 0x0B, 0x20, 0x88, 0x20, 0x1A, 0x42, 
-0xDD, 0x31, 0x3D, 0x82, 0xF8, 0x68, 0x47, 0x69, 0x44, 0xA1, 0x7C, 0x43, 0x06, 0x0A, 0xD1, 0x06, 
-0xE7, 0xEB, 0x4E, 0x4D, 0x23, 0xD9, 0x5A, 0x90, 0x18, 0xE9, 0x69, 0x52, 0x82, 0x8A, 0x84, 0x09, 
-0x10, 0xF3, 0x50, 0x35, 0x12, 0x94, 0x88, 0x1E, 0x93, 0x6C, 0xC3, 0x1D, 0xE3, 0xBC, 0x55, 0x00, 
-0x44, 0x3B, 0xE2, 0xF5, 0x24, 0xAE, 0x13, 0x13, 0xDE, 0x4A, 0x39, 0x6F, 0x92, 0xA6, 0x27, 0xB1, 
-0x4C, 0x54, 0x2B, 0x3F, 0x59, 0x93, 0xDE, 0x4F, 0xED, 0x7C, 0x87, 0x8B, 0xF5, 0xD0, 0xD4, 0x47, 
-0xFD, 0xA9, 0x25, 0xD6, 0x63, 0x08, 0x6E, 0x79, 0xE0, 0xA8, 0x25, 0xF6, 0x49, 0x72, 0x9E, 0x24, 
-0xED, 0xE5, 0x7A, 0x5C, 0x85, 0xE6, 0xBA, 0x93, 0xDF, 0x57, 0x10, 0x7E, 0xFD, 0x5B, 0x7D, 0x8C, 
-0x6A, 0x06, 0x4A, 0xEB, 0x08, 0xAA, 0xB6, 0x2E, 0x10, 0x41, 0xB4, 0x81, 0x50, 0xBB, 0xE4, 0x06, 
-0x4F, 0xF0, 0x16, 0x23, 0x06, 0xA5, 0x34, 0x42, 0x82, 0x2B, 0x05, 0x97, 0x7B, 0xAA, 0x61, 0x19, 
-0x17, 0xC2, 0x8E, 0x0E, 0x08, 0xB9, 0xC7, 0x17, 0x01, 0x4A, 0x90, 0x90, 0xA2, 0x55, 0xAB, 0xBE, 
-0x9E, 0x22, 0xA0, 0xF0, 0x21, 0x3A, 0xDF, 0xD4, 0x14, 0x0C, 0xCE, 0x82, 0x75, 0x84, 0x10, 0xA8, 
-0x82, 0x42, 0x25, 0x2D, 0xAC, 0x49, 0x19, 0x89, 0x66, 0x24, 0x9A, 0x81, 0x87, 0xA1, 0xF7, 0x1C, 
-0xF1, 0x09, 0x5F, 0x3C, 0x94, 0x73, 0xD7, 0xE1, 0x1E, 0xF7, 0x1F, 0x5E, 0xE2, 0x48, 0x80, 0x1E, 
-0x1D, 0x86, 0x74, 0x29, 0xC8, 0xF0, 0x40, 0x9A, 0xCE, 0x50, 0x95, 0x39, 0x50, 0x78, 0x45, 0x3E, 
-0x50, 0xE4, 0x77, 0xCC, 0x6D, 0xEE, 0xFC, 0xCD, 0xB7, 0x7C, 0xF3, 0x4B, 0x3F, 0xFC, 0xDE, 0xBF, 
-0xFB, 0xBD, 0x1D, 0x4F, 0x74, 0x8F, 0xB1, 0xD3, 0xC5, 0x06, 0xE1, 0x9E, 0x24, 0xFE, 0xF2, 0x2F, 
-0x3F, 0xDE, 0xFD, 0x85, 0xFF, 0xFE, 0x2B, 0x2F, 0xCF, 0x7B, 0xF6, 0xFB, 0xE6, 0x8F, 0x2E, 0xBE, 
-0x06, 0xD4, 0x8C, 0x42, 0xAB, 0x96, 0x31, 0x18, 0x2D, 0x14, 0xC5, 0x80, 0x44, 0x05, 0x3A, 0xED, 
-0x94, 0xA5, 0xC1, 0x5E, 0xA6, 0x28, 0x38, 0x6F, 0xCA, 0x70, 0xF1, 0xD9, 0x5D, 0x2E, 0xBF, 0x78, 
-0x8E, 0x2B, 0x9E, 0x72, 0x16, 0x4F, 0x3B, 0x3B, 0x63, 0x5B, 0x66, 0x69, 0x33, 0x22, 0x14, 0x3D, 
-0xDA, 0x89, 0x06, 0xA5, 0x21, 0x54, 0x54, 0xD6, 0xC6, 0x4E, 0xAA, 0xEA, 0xF8, 0xA4, 0x75, 0x14, 
-0x27, 0xC1, 0xA3, 0x89, 0x53, 0xC1, 0x10, 0x42, 0x94, 0xAC, 0x82, 0x42, 0x29, 0x53, 0x4B, 0xA3, 
-0x31, 0x4C, 0x09, 0x44, 0xD7, 0xE2, 0xE8, 0x23, 0xBF, 0x16, 0x56, 0x11, 0x86, 0xE8, 0xE8, 0xC1, 
-0x34, 0x49, 0xB4, 0xB5, 0x44, 0xB6, 0x52, 0xBA, 0x6C, 0x88, 0x7B, 0x72, 0xDF, 0x32, 0xD6, 0x27, 
-0xE4, 0x95, 0xF7, 0x93, 0x15, 0xF2, 0xE2, 0xC4, 0xFE, 0xE3, 0x10, 0x66, 0x73, 0xFC, 0xEA, 0xCF, 
-0x93, 0x39, 0xDF, 0x87, 0xDA, 0xAD, 0x75, 0x0D, 0xC2, 0x95, 0x9A, 0x60, 0xD7, 0x22, 0x5C, 0x22, 
-0xED, 0xD6, 0x29, 0x45, 0x8F, 0xC5, 0xB1, 0x92, 0x77, 0x33, 0x14, 0x44, 0x8C, 0x55, 0x39, 0xF8, 
-0x71, 0xDD, 0xC4, 0x7D, 0x7E, 0x45, 0xF9, 0x12, 0x6D, 0x70, 0x75, 0xC2, 0xD2, 0x10, 0xC2, 0x84, 
-0x8A, 0x41, 0x01, 0x42, 0x62, 0xA6, 0xF0, 0x85, 0xA7, 0x28, 0x1C, 0xE5, 0xB0, 0xA2, 0x1C, 0xC4, 
-0x4F, 0x3F, 0x74, 0x50, 0x04, 0x28, 0x3D, 0xCA, 0x09, 0xCA, 0x45, 0xD2, 0xD6, 0x3A, 0x23, 0x48, 
-0x8C, 0xEB, 0x01, 0x91, 0xE0, 0x7D, 0x55, 0x22, 0xC1, 0x92, 0x28, 0xC1, 0x10, 0x08, 0xDE, 0xA1, 
-0x44, 0x23, 0x49, 0x8B, 0x81, 0x75, 0xE4, 0xA6, 0xCD, 0xC0, 0x74, 0xE8, 0xEB, 0x16, 0x0B, 0xD2, 
-0x62, 0xDF, 0xA8, 0xE0, 0xCE, 0xBD, 0xFB, 0xB8, 0x6B, 0xDF, 0x51, 0x76, 0x2C, 0x39, 0x8E, 0x06, 
-0x18, 0x20, 0x94, 0x24, 0x54, 0xB4, 0x71, 0x92, 0x21, 0x2A, 0x41, 0xEB, 0x84, 0xA2, 0x1C, 0xA2, 
-0x70, 0x55, 0x37, 0xD3, 0x47, 0x92, 0x2C, 0xFC, 0xE5, 0x4B, 0xBF, 0xE5, 0x45, 0x1F, 0xF8, 0xFE, 
-0xEF, 0xFF, 0x89, 0xDB, 0xAE, 0xBC, 0xF2, 0x59, 0x1B, 0xEA, 0x83, 0xE3, 0xE0, 0x98, 0xE6, 0xB3, 
-0x81, 0xF5, 0x11, 0x42, 0x50, 0xFF, 0xF5, 0xBF, 0xFE, 0xFE, 0x96, 0x77, 0xFE, 0xD1, 0xBB, 0x5F, 
-0x37, 0x1A, 0xDA, 0x57, 0x07, 0x91, 0xAF, 0x73, 0xD6, 0xCF, 0x38, 0xE7, 0x54, 0xC7, 0x74, 0xB1, 
-0x36, 0x5A, 0x26, 0x44, 0x89, 0x25, 0x60, 0x18, 0xD1, 0x0D, 0x3D, 0xCE, 0x9D, 0x76, 0x5C, 0x7E, 
-0x41, 0x97, 0xE7, 0x3D, 0x79, 0x8E, 0xE7, 0x3D, 0x69, 0x0B, 0x4F, 0xDE, 0xD6, 0x65, 0xDA, 0x38, 
-0x4C, 0xC8, 0xA1, 0x1A, 0xE1, 0x6C, 0x8E, 0xD6, 0x90, 0xB5, 0x62, 0xA7, 0xAF, 0x6C, 0x89, 0x49, 
-0x12, 0xBC, 0x8F, 0xD3, 0xCA, 0x66, 0x7A, 0xD9, 0x74, 0xE6, 0xE0, 0xA5, 0x26, 0x6A, 0x85, 0xD4, 
-0x84, 0xAB, 0x7C, 0x43, 0x8A, 0x75, 0x2F, 0xAF, 0xC3, 0xF0, 0x11, 0xA2, 0xAB, 0xE7, 0x24, 0xC6, 
-0x12, 0x64, 0x1D, 0x45, 0x2A, 0xFE, 0xDD, 0x90, 0x46, 0x4D, 0x0C, 0xE3, 0x73, 0xD6, 0xD6, 0x2B, 
-0xC6, 0x69, 0x70, 0x0C, 0xBA, 0x7E, 0x0C, 0x7C, 0x34, 0xC8, 0x3F, 0x1E, 0x4E, 0xD4, 0xF0, 0xD6, 
-0xBA, 0xEC, 0x24, 0x8E, 0x77, 0x7E, 0x9C, 0xAA, 0xAF, 0x8D, 0xE6, 0xBC, 0xA8, 0x16, 0x58, 0x3E, 
-0x6A, 0x52, 0xDD, 0x10, 0x42, 0x88, 0x03, 0xD2, 0x31, 0xF0, 0x78, 0x59, 0x96, 0xB5, 0xC3, 0x04, 
-0x91, 0xC7, 0x59, 0xC9, 0xF2, 0xB0, 0x96, 0x4C, 0x14, 0x70, 0xF2, 0x3E, 0x91, 0xF0, 0xEB, 0x77, 
-0x08, 0xB5, 0xED, 0xEC, 0xF2, 0x00, 0x15, 0x82, 0x10, 0xAC, 0x60, 0x47, 0x42, 0x31, 0x74, 0x0C, 
-0x97, 0x46, 0x0C, 0x7A, 0x25, 0xD5, 0xC8, 0x83, 0x55, 0x98, 0x60, 0x30, 0x41, 0xD3, 0x4D, 0x32, 
-0xC4, 0x0B, 0xAA, 0xBE, 0x4E, 0x40, 0x11, 0x44, 0xE1, 0x1D, 0x04, 0x1C, 0x46, 0x40, 0x8B, 0xAF, 
-0x43, 0x30, 0x06, 0xAC, 0xB5, 0x14, 0xB6, 0xC2, 0xA9, 0x04, 0x9F, 0xB4, 0x28, 0xD3, 0x0E, 0x03, 
-0xD3, 0xE5, 0x88, 0x4F, 0xD9, 0xD5, 0xB7, 0xDC, 0x73, 0x74, 0xC8, 0x3D, 0x87, 0x7B, 0xDC, 0x7F, 
-0x70, 0x9E, 0x3D, 0x36, 0x27, 0x67, 0x9A, 0x52, 0x52, 0x2C, 0x82, 0x57, 0x1A, 0x4C, 0x42, 0x08, 
-0x01, 0x5B, 0x96, 0x04, 0x0A, 0x97, 0x89, 0x9E, 0x6F, 0x69, 0xF5, 0xC9, 0xCD, 0x67, 0x75, 0x3F, 
-0xF2, 0x7D, 0xDF, 0xFD, 0x7F, 0x7D, 0xE4, 0xD7, 0xDE, 0xF1, 0x0B, 0x0B, 0x5F, 0x8B, 0x76, 0xB5, 
-0xA7, 0x8A, 0xE3, 0xB5, 0xDB, 0x0D, 0xAC, 0x83, 0x77, 0xBE, 0xF3, 0xA6, 0xE4, 0x43, 0x1F, 0x7A, 
-0xC7, 0xB9, 0x57, 0x5F, 0xFD, 0xE9, 0x1F, 0x1D, 0x8D, 0xF2, 0x1F, 0x10, 0x5A, 0x17, 0xA4, 0x66, 
-0xCA, 0x60, 0x15, 0x22, 0x0A, 0xAF, 0x12, 0x4A, 0x0F, 0x5A, 0x43, 0xEA, 0x97, 0x48, 0xFD, 0x02, 
-0x9B, 0xE8, 0x73, 0x4E, 0xD7, 0xF3, 0xD4, 0x73, 0xBA, 0x3C, 0xE5, 0xEC, 0x59, 0x9E, 0x7D, 0xC9, 
-0xD9, 0x9C, 0xB3, 0x29, 0xE3, 0xEC, 0xD9, 0x16, 0x53, 0xA9, 0x25, 0x53, 0x25, 0xA9, 0x2A, 0xD0, 
-0xA1, 0x24, 0xF8, 0x98, 0xF8, 0x12, 0x00, 0xB1, 0x78, 0xB1, 0x78, 0x5C, 0x24, 0xC5, 0x7A, 0xAA, 
-0x1B, 0xA4, 0xEE, 0xBC, 0x41, 0xA1, 0x83, 0xC2, 0xB8, 0x9A, 0xFC, 0x6A, 0x31, 0xD0, 0x29, 0x70, 
-0x6A, 0x42, 0x5C, 0x1C, 0x13, 0x6D, 0x2D, 0x41, 0xD7, 0xC4, 0xBA, 0x8C, 0x95, 0x53, 0x5F, 0x91, 
-0x65, 0xA2, 0x5D, 0x8B, 0x54, 0x43, 0x58, 0xE5, 0x45, 0x35, 0xC9, 0x29, 0x21, 0x80, 0x5A, 0xBB, 
-0x69, 0x9D, 0x6C, 0x97, 0x5C, 0x3D, 0x48, 0x34, 0x38, 0xDE, 0xF9, 0x93, 0xC4, 0xD6, 0x78, 0x60, 
-0x8D, 0xF7, 0x07, 0x75, 0x2C, 0xA9, 0x4E, 0xDC, 0x67, 0xF5, 0x6F, 0xAA, 0xBE, 0xD1, 0x8A, 0xDB, 
-0x89, 0x8F, 0x39, 0xBF, 0xF0, 0x75, 0x1C, 0xE4, 0x28, 0xA1, 0x4E, 0xAA, 0x62, 0x9A, 0xAB, 0xF8, 
-0x5A, 0xE1, 0x2E, 0xC4, 0xDC, 0x76, 0x51, 0xF2, 0x8C, 0x6A, 0x9D, 0x98, 0xAA, 0x26, 0x4A, 0xA6, 
-0x04, 0x15, 0x75, 0xAA, 0xA5, 0x23, 0x1F, 0x8E, 0xC8, 0x07, 0x43, 0xFC, 0x28, 0x90, 0xCF, 0x17, 
-0x50, 0x25, 0x58, 0x17, 0x75, 0xB3, 0x84, 0x14, 0xAD, 0x52, 0xB4, 0x98, 0xF8, 0x64, 0x3E, 0xE6, 
-0x37, 0x53, 0x3E, 0x12, 0xEC, 0x18, 0x41, 0xA1, 0xF0, 0x64, 0x22, 0x40, 0xA0, 0xC2, 0x93, 0x07, 
-0x4F, 0xA9, 0x15, 0x2E, 0x6B, 0x51, 0xA5, 0x2D, 0x46, 0xA6, 0xC3, 0x51, 0x6B, 0xD8, 0xD5, 0xCB, 
-0xB9, 0xE7, 0xE0, 0x80, 0xBB, 0x0F, 0xF5, 0xB9, 0xEF, 0x68, 0xC1, 0x7E, 0xEB, 0x19, 0x60, 0xB0, 
-0x74, 0xE8, 0x03, 0xA8, 0x24, 0xBE, 0x7C, 0x09, 0xE0, 0x2B, 0x70, 0xC3, 0x00, 0xBE, 0x98, 0xC9, 
-0xD2, 0xDB, 0xB2, 0x54, 0x3E, 0xF0, 0xE3, 0xFF, 0xE1, 0x87, 0xDE, 0x7B, 0xD9, 0x0B, 0x2F, 0x3E, 
-0x70, 0xE5, 0x95, 0x57, 0x3E, 0x61, 0xA3, 0x7B, 0x9D, 0x69, 0xAC, 0xD3, 0xAC, 0x37, 0x70, 0x32, 
-0x78, 0xF7, 0xBB, 0xAF, 0x6E, 0x7D, 0xF0, 0xC3, 0x7F, 0xFB, 0x8C, 0x8F, 0xFC, 0xC3, 0xBF, 0xFC, 
-0x88, 0x73, 0xEA, 0x15, 0x99, 0xE9, 0x5E, 0x52, 0xDA, 0x90, 0x69, 0xD3, 0x15, 0x4F, 0x06, 0x1A, 
-0x4C, 0x28, 0x48, 0xC3, 0x88, 0xCC, 0x8F, 0x48, 0x5C, 0x9F, 0x36, 0x43, 0xE6, 0x8C, 0xE3, 0xBC, 
-0xB9, 0x36, 0x4F, 0x3B, 0x7F, 0x8E, 0xCB, 0x2F, 0x3E, 0x9B, 0x8B, 0xB6, 0xB5, 0xD9, 0xD2, 0xA9, 
-0x98, 0x49, 0x2C, 0xD3, 0xA9, 0xA3, 0xA5, 0x3D, 0xCA, 0x07, 0x12, 0xAD, 0x11, 0x6D, 0x09, 0xA1, 
-0xC2, 0x4B, 0x41, 0x90, 0x9A, 0x74, 0x55, 0xC0, 0xD6, 0x8B, 0x6B, 0x12, 0x14, 0x26, 0xE8, 0x7A, 
-0xF5, 0x39, 0xA0, 0xBC, 0x22, 0x10, 0xB0, 0x6A, 0x79, 0xFA, 0x3B, 0x49, 0x1A, 0x63, 0x49, 0x56, 
-0xC9, 0x98, 0x64, 0x97, 0x1B, 0xC1, 0xF2, 0xD4, 0xB8, 0x21, 0x59, 0x99, 0x9C, 0x92, 0xAF, 0x81, 
-0xC6, 0x7C, 0xA9, 0x39, 0x3E, 0x84, 0x30, 0x2E, 0xE3, 0xB1, 0xD3, 0xEF, 0xB5, 0xC9, 0x7B, 0x3D, 
-0x9C, 0xCA, 0xF9, 0x2B, 0xA4, 0xD5, 0x9A, 0x70, 0xA9, 0x09, 0x3A, 0x4E, 0xE5, 0xE3, 0x62, 0x56, 
-0xA4, 0x21, 0x60, 0x42, 0x0A, 0xF6, 0x12, 0x8F, 0x6F, 0xAC, 0x2D, 0x20, 0xEA, 0xC1, 0x27, 0xD5, 
-0x1B, 0x91, 0x5C, 0x27, 0x9E, 0x69, 0xD5, 0xCC, 0x61, 0x45, 0x59, 0x83, 0x02, 0xEF, 0x91, 0xB1, 
-0xAB, 0x6D, 0x74, 0x2E, 0x20, 0xC4, 0xD8, 0xC9, 0x38, 0x4D, 0x28, 0x03, 0x54, 0x01, 0x9B, 0x57, 
-0x14, 0xA3, 0x82, 0x72, 0x50, 0x90, 0x0F, 0x47, 0x94, 0xA3, 0x9C, 0x50, 0x04, 0x5A, 0x36, 0xC5, 
-0x84, 0x14, 0x94, 0x41, 0x54, 0x8A, 0xD2, 0x29, 0x41, 0xEA, 0x45, 0x30, 0xA2, 0x0E, 0x98, 0xB0, 
-0x9C, 0x65, 0x5A, 0xD5, 0xC1, 0x6C, 0x82, 0x8A, 0xB3, 0x8B, 0x10, 0x02, 0x5E, 0x69, 0x4A, 0x65, 
-0xC8, 0x8D, 0xA6, 0xC8, 0x5A, 0x0C, 0x4C, 0xC6, 0xA1, 0x32, 0xB0, 0x3F, 0x77, 0xDC, 0x7B, 0xB0, 
-0xCF, 0x3D, 0x07, 0x17, 0xB8, 0xF7, 0x40, 0x8F, 0x23, 0x08, 0x23, 0xBA, 0x14, 0xB4, 0x29, 0x49, 
-0x70, 0x3A, 0x81, 0x24, 0xA1, 0x74, 0x15, 0xD8, 0x02, 0xA4, 0xF2, 0x84, 0x7C, 0x48, 0x28, 0xEF, 
-0xD8, 0xBE, 0x7D, 0xEE, 0x63, 0xCF, 0x7A, 0xCA, 0xA5, 0xEF, 0x79, 0xE3, 0x4F, 0x7D, 0xCF, 0xCE, 
-0x0D, 0xEB, 0x83, 0x53, 0xC7, 0x1A, 0x4D, 0x7A, 0x03, 0xA7, 0x8A, 0x5F, 0xFF, 0xF5, 0x77, 0xCE, 
-0xBE, 0xEF, 0x7D, 0x1F, 0x7E, 0xC1, 0x6D, 0xB7, 0xDD, 0xFE, 0x7A, 0xEF, 0xC2, 0x77, 0x41, 0x3A, 
-0x27, 0xB4, 0x75, 0xA2, 0x53, 0x94, 0x52, 0xA8, 0x5A, 0x9F, 0x18, 0x6C, 0x85, 0x0E, 0x96, 0xB6, 
-0x81, 0x8E, 0x94, 0x74, 0xC9, 0x39, 0xAB, 0x55, 0x71, 0xD1, 0x66, 0xC3, 0xD3, 0xCE, 0x9D, 0xE2, 
-0xC9, 0xDB, 0xDB, 0x9C, 0x3D, 0x9B, 0x32, 0x9B, 0x78, 0xE6, 0xB2, 0x8C, 0xE9, 0x4C, 0xD1, 0x6E, 
-0x69, 0xB4, 0xAE, 0xD0, 0x52, 0xA2, 0xB4, 0x03, 0x6D, 0xC1, 0x04, 0xAC, 0x2D, 0xC6, 0xA4, 0xB6, 
-0xBC, 0xC2, 0xEE, 0x51, 0x8D, 0x4E, 0x10, 0xB5, 0x92, 0x24, 0xC5, 0x2F, 0xD3, 0xA9, 0x34, 0x66, 
-0x69, 0x11, 0xCB, 0x24, 0x16, 0x17, 0xE9, 0x08, 0x4D, 0x26, 0x8B, 0x9A, 0x3C, 0x26, 0x08, 0x77, 
-0x75, 0x83, 0x59, 0xAD, 0xEB, 0x0C, 0x21, 0xAC, 0xB0, 0x52, 0x58, 0x0F, 0xAB, 0xAF, 0x33, 0x89, 
-0x40, 0xCD, 0x94, 0x2B, 0x76, 0xAE, 0x3C, 0x63, 0x75, 0xAC, 0x85, 0x15, 0xD3, 0x76, 0x96, 0xEB, 
-0x44, 0x6A, 0x4B, 0x10, 0x15, 0xA2, 0xB3, 0xAC, 0x96, 0x48, 0x51, 0x52, 0xAB, 0x00, 0x1A, 0x69, 
-0x5C, 0x11, 0x17, 0x11, 0xE3, 0x00, 0x63, 0xC7, 0xEF, 0xAC, 0xC1, 0xF8, 0xFA, 0xE3, 0x3A, 0xAD, 
-0x17, 0xD5, 0x56, 0x0D, 0x44, 0x21, 0x08, 0x2A, 0x28, 0x12, 0xD2, 0xFA, 0xB7, 0xE8, 0x8C, 0x10, 
-0x2A, 0x70, 0x65, 0xC0, 0x16, 0x02, 0x4E, 0x58, 0x38, 0xB4, 0x88, 0x2B, 0x03, 0x2E, 0xF7, 0x84, 
-0xCA, 0x83, 0x0D, 0x51, 0x57, 0x2F, 0x06, 0x83, 0x90, 0x89, 0x20, 0x5E, 0xB0, 0x9E, 0xA8, 0x2A, 
-0x40, 0x08, 0x63, 0x6D, 0xBD, 0x8B, 0xA9, 0xC7, 0x25, 0x12, 0xED, 0x8A, 0x81, 0x40, 0x34, 0x4E, 
-0x34, 0xB9, 0x37, 0xD8, 0xB4, 0x4D, 0x99, 0x76, 0xE8, 0xEB, 0x94, 0x7D, 0x65, 0xE0, 0xDE, 0xF9, 
-0x25, 0xBE, 0xB2, 0xF7, 0x28, 0xF7, 0xCF, 0xF7, 0x39, 0x38, 0xA8, 0xE8, 0x93, 0x52, 0xD2, 0xA2, 
-0x22, 0xA1, 0xC4, 0x50, 0xD5, 0xF7, 0x50, 0x4A, 0x93, 0xFB, 0x1E, 0xA9, 0x32, 0xA1, 0xF4, 0x65, 
-0xE5, 0x19, 0x3C, 0xD8, 0xEA, 0xA4, 0xFF, 0x74, 0xD9, 0xB3, 0x9F, 0xFA, 0x81, 0x2B, 0xBF, 0xFB, 
-0xB5, 0x5F, 0xFA, 0xF9, 0x9F, 0xFF, 0xF7, 0x1B, 0x36, 0xB5, 0xA7, 0x89, 0xE3, 0xB5, 0xFB, 0x0D, 
-0x9C, 0x22, 0xDE, 0xFC, 0xE6, 0x37, 0xB7, 0x3F, 0xF2, 0xA1, 0xEB, 0x5F, 0xB0, 0x67, 0xEF, 0xA1, 
-0x1F, 0xB2, 0xB9, 0xFA, 0x66, 0x21, 0xBD, 0xD0, 0xA1, 0x52, 0xD0, 0xA2, 0xD3, 0x36, 0x41, 0x12, 
-0x82, 0x75, 0x48, 0x00, 0x15, 0x4A, 0x5A, 0x21, 0x67, 0x9A, 0x21, 0xB3, 0x7A, 0xC4, 0xE6, 0xAC, 
-0xE0, 0xBC, 0xD9, 0x84, 0x8B, 0xB6, 0x76, 0x38, 0x77, 0xB6, 0xCD, 0xD6, 0x8E, 0xE1, 0xAC, 0xAE, 
-0x61, 0xCB, 0x4C, 0x9B, 0xA9, 0x0C, 0xDA, 0xC6, 0xD1, 0x49, 0x3D, 0x9D, 0x0C, 0x12, 0xED, 0x10, 
-0xE3, 0x41, 0x47, 0x9F, 0x77, 0xAF, 0x23, 0xC9, 0x39, 0x5C, 0x0C, 0x48, 0xED, 0x41, 0xFB, 0x65, 
-0x8B, 0x84, 0xC8, 0x55, 0x2B, 0x55, 0x08, 0x93, 0x7C, 0x35, 0xD9, 0x08, 0x24, 0x4C, 0x12, 0xEE, 
-0xB1, 0x52, 0xED, 0x98, 0x07, 0x83, 0x22, 0x28, 0x8F, 0x0A, 0xBA, 0x96, 0x20, 0xEB, 0xFB, 0xF8, 
-0x3A, 0xB5, 0xB7, 0xB2, 0x13, 0xF2, 0xF2, 0xB1, 0x38, 0xF6, 0xCA, 0x93, 0x58, 0xBD, 0x70, 0x77, 
-0x2C, 0xB1, 0x4D, 0x86, 0x6F, 0x5C, 0x4D, 0xB6, 0xF1, 0xFC, 0xD5, 0xFB, 0x58, 0xB3, 0xB9, 0xFB, 
-0x5A, 0x35, 0x32, 0x39, 0x00, 0x81, 0x47, 0xD3, 0x98, 0xD8, 0x35, 0xBA, 0xD5, 0x18, 0xB3, 0x20, 
-0x7E, 0x91, 0x7A, 0xBF, 0x42, 0xBC, 0x1A, 0x5F, 0xB7, 0x19, 0xE8, 0xB4, 0x57, 0x84, 0x81, 0x47, 
-0xAC, 0xC2, 0xB9, 0x40, 0x59, 0x38, 0xF2, 0x91, 0x25, 0x1F, 0x96, 0xE4, 0x23, 0x8B, 0x2B, 0xA3, 
-0xCE, 0x47, 0x7B, 0xBD, 0x3C, 0x43, 0x11, 0x8D, 0x91, 0x28, 0x0D, 0x2B, 0x89, 0x31, 0x67, 0xF1, 
-0x01, 0x4F, 0x5C, 0x28, 0x0D, 0x75, 0x6C, 0x8F, 0x71, 0x8C, 0x05, 0xEF, 0x63, 0xF8, 0x45, 0xD1, 
-0x38, 0x51, 0x58, 0xC0, 0xA1, 0xB1, 0x08, 0x85, 0x4E, 0x28, 0xB2, 0x4D, 0x1C, 0x29, 0xE1, 0xC0, 
-0xC8, 0xB2, 0xBB, 0x97, 0x73, 0xEF, 0x91, 0x01, 0xF7, 0x1E, 0xE9, 0xB3, 0x6F, 0xE8, 0x59, 0x22, 
-0x61, 0x44, 0x86, 0x93, 0x0C, 0x5B, 0xD7, 0x01, 0xF5, 0xDA, 0x43, 0xB4, 0x92, 0x29, 0xBD, 0x90, 
-0x0F, 0x34, 0xE1, 0x6E, 0x9D, 0xE8, 0x7F, 0x7E, 0xCE, 0x73, 0x2E, 0xFB, 0xBB, 0x37, 0x7C, 0xC7, 
-0x6B, 0xEE, 0x78, 0xC3, 0x55, 0x6F, 0xF8, 0x9A, 0xF6, 0x12, 0x3B, 0x13, 0x38, 0xB6, 0x05, 0x6E, 
-0xE0, 0x21, 0x21, 0x84, 0x20, 0xBF, 0xFF, 0xFB, 0xFF, 0x67, 0xFA, 0xCF, 0xDF, 0xF1, 0xEE, 0x97, 
-0xED, 0xB8, 0xEF, 0xC1, 0xFF, 0x77, 0x58, 0x95, 0xDF, 0x90, 0x99, 0xE9, 0x99, 0x91, 0xF5, 0x06, 
-0x32, 0x49, 0x5B, 0x5D, 0x9C, 0x0B, 0x04, 0xEB, 0x48, 0x55, 0x00, 0xD7, 0x67, 0x46, 0x0B, 0xDA, 
-0x2D, 0xD2, 0xC5, 0x92, 0x51, 0xB1, 0x7D, 0x36, 0xE1, 0xC2, 0xB9, 0x16, 0x17, 0x6D, 0x9D, 0xE2, 
-0x49, 0xDB, 0xE6, 0xD8, 0x94, 0x04, 0xBA, 0x7E, 0xC8, 0xAC, 0xAA, 0xD8, 0x94, 0x08, 0x99, 0x2E, 
-0xE9, 0xB6, 0x84, 0xAC, 0x25, 0x98, 0xB6, 0x22, 0xE9, 0x68, 0x68, 0x81, 0x13, 0x8B, 0xC3, 0x61, 
-0x8C, 0x41, 0xBB, 0x98, 0x3A, 0x25, 0x84, 0x10, 0x89, 0x38, 0xB8, 0xA8, 0x82, 0xA8, 0x39, 0x43, 
-0xE9, 0x38, 0xED, 0x64, 0x3C, 0x1D, 0x5E, 0x6E, 0x0A, 0x6A, 0xC2, 0x7C, 0x8C, 0x9A, 0x48, 0x9A, 
-0x63, 0x97, 0xC9, 0x69, 0xD9, 0xEE, 0xD6, 0x87, 0x3A, 0x0C, 0x60, 0xFD, 0x09, 0x31, 0x9E, 0xAB, 
-0xD4, 0xD2, 0xD7, 0xE4, 0x75, 0x1A, 0xAC, 0xD0, 0xFF, 0xAE, 0x92, 0x56, 0x89, 0xC3, 0x43, 0x4D, 
-0x78, 0xCD, 0xEF, 0xB5, 0x84, 0xDD, 0x0C, 0x22, 0x4D, 0x99, 0x56, 0xE9, 0x66, 0x55, 0x6D, 0x0E, 
-0xE6, 0x93, 0x26, 0x9D, 0xCC, 0x24, 0x96, 0x8F, 0x5D, 0x96, 0x58, 0x97, 0x9F, 0x47, 0xC6, 0x0B, 
-0x69, 0xD1, 0x51, 0x00, 0xE2, 0xE0, 0x15, 0xEF, 0xD5, 0xE8, 0x5F, 0xEB, 0xBC, 0xCC, 0x41, 0xD5, 
-0x06, 0x57, 0xF5, 0xDF, 0x0E, 0x42, 0x59, 0x91, 0xE7, 0x25, 0x2E, 0xB7, 0xD8, 0xA5, 0x0A, 0x97, 
-0x3B, 0xF2, 0xBC, 0xA4, 0xAA, 0x1C, 0xC1, 0x47, 0x32, 0x15, 0x12, 0x08, 0x7A, 0xD9, 0x35, 0x17, 
-0x0D, 0x8D, 0xA5, 0x49, 0xFD, 0x2C, 0xA2, 0x3C, 0x48, 0x19, 0x23, 0x84, 0xD5, 0x29, 0x70, 0xF0, 
-0x60, 0x10, 0x8C, 0x24, 0x88, 0x08, 0xDE, 0x83, 0xD3, 0x9A, 0x51, 0x50, 0x0C, 0x02, 0xF8, 0xAC, 
-0x03, 0x9D, 0x29, 0xFA, 0x0E, 0x0E, 0xE4, 0x8E, 0xFB, 0x7A, 0x25, 0xB7, 0xEF, 0x3E, 0xC4, 0x91, 
-0xA1, 0x63, 0xF7, 0xD1, 0x01, 0xFD, 0xD0, 0xE2, 0x30, 0x90, 0x25, 0xE7, 0x70, 0xB8, 0xCA, 0xF1, 
-0xA4, 0x18, 0x95, 0x51, 0xF8, 0x1C, 0xA3, 0x02, 0x26, 0x09, 0x61, 0x54, 0x2C, 0x12, 0xA8, 0x06, 
-0x06, 0xBF, 0xBB, 0xAD, 0xED, 0x47, 0x9E, 0xF7, 0xCC, 0xA7, 0xFF, 0xE3, 0xAB, 0x7F, 0xE8, 0x07, 
-0x6F, 0xFE, 0xD9, 0x9F, 0xFD, 0xC1, 0xE1, 0xC6, 0x82, 0xD8, 0x99, 0xC1, 0xB1, 0x2D, 0x7D, 0x03, 
-0x67, 0x04, 0x21, 0x04, 0xF9, 0xF1, 0x1F, 0xFF, 0xC5, 0x4D, 0x1F, 0xFD, 0xE0, 0xC7, 0x5F, 0x7E, 
-0xF0, 0xF0, 0xD2, 0x77, 0xE8, 0xA4, 0xFD, 0x32, 0xE7, 0xF5, 0x79, 0x55, 0xA5, 0x32, 0x17, 0x94, 
-0xB4, 0x3A, 0x5D, 0x46, 0x83, 0x21, 0xAD, 0xD4, 0x90, 0x48, 0xC0, 0x15, 0x03, 0x60, 0xC4, 0xE6, 
-0x64, 0x8A, 0x61, 0x75, 0x80, 0xAD, 0xE2, 0x39, 0xAB, 0x23, 0x5C, 0x30, 0x37, 0xCB, 0x85, 0x9B, 
-0xA7, 0xB8, 0xA0, 0x9B, 0xB2, 0x35, 0x0B, 0x9C, 0x65, 0x1C, 0x53, 0xDA, 0x91, 0x52, 0xD0, 0x6D, 
-0x09, 0xDA, 0x58, 0xC4, 0x54, 0x24, 0x6D, 0x45, 0xDA, 0x56, 0x98, 0x4C, 0x91, 0xA6, 0x86, 0x4C, 
-0x2B, 0x8C, 0x12, 0x54, 0xA2, 0x40, 0x4B, 0xAD, 0x37, 0xF0, 0xE0, 0x2D, 0x36, 0x78, 0x94, 0x8A, 
-0x84, 0x19, 0x6A, 0x95, 0x44, 0xF4, 0x7F, 0x0B, 0x71, 0xF5, 0x3C, 0x84, 0x68, 0xB7, 0x29, 0x7E, 
-0xD9, 0x41, 0xC2, 0xC7, 0xA9, 0xB7, 0x04, 0x40, 0xAD, 0xBD, 0xC2, 0xBF, 0x2C, 0x0F, 0x46, 0x16, 
-0x5F, 0xDD, 0x45, 0x27, 0x89, 0x71, 0xBC, 0xA8, 0xB4, 0x06, 0xD9, 0x02, 0xF8, 0xC9, 0x85, 0x20, 
-0xE2, 0x54, 0x9D, 0x09, 0xC2, 0x1D, 0x07, 0xE8, 0x6E, 0x54, 0x1D, 0x8D, 0x0A, 0xA1, 0x1E, 0x60, 
-0x24, 0x09, 0xC4, 0x1C, 0xB2, 0x93, 0x03, 0x46, 0x7D, 0xAF, 0x15, 0xD2, 0xF2, 0xE4, 0xF9, 0xD1, 
-0xF1, 0x20, 0x84, 0x80, 0xB7, 0x0E, 0x5D, 0x4B, 0x95, 0x5A, 0x6A, 0x62, 0xF5, 0x12, 0x1F, 0xD2, 
-0x0B, 0xBE, 0x08, 0x58, 0xEB, 0xB1, 0x23, 0x1B, 0xDD, 0x62, 0x0B, 0x4B, 0x91, 0x97, 0x94, 0xA5, 
-0x25, 0x94, 0x9E, 0xC4, 0x1B, 0xC4, 0x12, 0xDD, 0x6E, 0x83, 0xA0, 0xC4, 0xA0, 0x75, 0x74, 0x62, 
-0x50, 0x08, 0xCE, 0xC5, 0x20, 0xE4, 0x4A, 0xCC, 0xB8, 0x3E, 0x9D, 0x73, 0x38, 0xE7, 0x71, 0x58, 
-0x74, 0xA2, 0x10, 0x1D, 0xA3, 0x75, 0xA9, 0xA0, 0xA3, 0x0A, 0xC4, 0xC6, 0xE0, 0xE1, 0x36, 0x28, 
-0x4A, 0x2F, 0x84, 0x76, 0x97, 0x32, 0x69, 0xD3, 0xC3, 0x30, 0x5F, 0x09, 0xFB, 0x87, 0x05, 0x0F, 
-0x1C, 0x3E, 0xCA, 0xFD, 0x0B, 0x7D, 0x76, 0xF6, 0x3D, 0x7B, 0x06, 0x23, 0xFA, 0x40, 0x60, 0x8A, 
-0x11, 0x06, 0x4F, 0x17, 0xD4, 0x54, 0x5C, 0xD0, 0x35, 0x19, 0xB9, 0xED, 0x93, 0x1A, 0x21, 0xB7, 
-0x4B, 0x2E, 0x30, 0x58, 0xD0, 0x8A, 0xAF, 0x76, 0xA7, 0xF4, 0x47, 0x9F, 0x7B, 0xD9, 0xD3, 0x3F, 
-0xFE, 0x82, 0x17, 0x3F, 0xF9, 0xCE, 0xB7, 0xBF, 0xFD, 0xED, 0xA3, 0x89, 0x8A, 0xDA, 0xC0, 0x19, 
-0xC0, 0xDA, 0xAD, 0x7D, 0x03, 0x67, 0x0C, 0xEF, 0x7B, 0xDF, 0xFB, 0xF4, 0xB5, 0xFF, 0x74, 0xCB, 
-0xA6, 0x4F, 0xDD, 0xF0, 0x99, 0xE7, 0x1D, 0xD8, 0xBF, 0xF8, 0x2D, 0xA3, 0x51, 0xF9, 0x5D, 0x23, 
-0xEB, 0x2F, 0xD4, 0x49, 0xBB, 0xE3, 0xAC, 0xC4, 0x54, 0xAB, 0x22, 0x4C, 0xB5, 0x3B, 0x54, 0xC3, 
-0x9C, 0x56, 0xDA, 0xA2, 0x28, 0x7B, 0x64, 0x14, 0x08, 0x03, 0x3A, 0x78, 0xCE, 0xD2, 0x86, 0xB3, 
-0x5B, 0xC2, 0x39, 0x9D, 0x84, 0x27, 0x6F, 0x99, 0xE1, 0x49, 0x67, 0xCD, 0xB0, 0x7D, 0x2A, 0x65, 
-0xA6, 0x05, 0x2D, 0x2A, 0x42, 0xB5, 0x84, 0x09, 0x05, 0x99, 0xF1, 0x28, 0xB1, 0x88, 0xB2, 0x88, 
-0xAA, 0x30, 0xA9, 0xA2, 0x95, 0x25, 0xB4, 0x5A, 0x29, 0x59, 0xCB, 0x60, 0x52, 0x8D, 0x36, 0xB5, 
-0x94, 0x6B, 0x54, 0x24, 0x61, 0xAD, 0xE2, 0x56, 0x5B, 0x3E, 0x34, 0xD3, 0x4B, 0xEF, 0x73, 0x44, 
-0x02, 0x2A, 0x80, 0x23, 0x20, 0xC1, 0xE1, 0x42, 0xD4, 0x22, 0x7A, 0x58, 0xA1, 0x07, 0x1E, 0x4B, 
-0x8D, 0x40, 0x93, 0x8B, 0x4C, 0x9A, 0xC8, 0x53, 0xAB, 0x48, 0x35, 0xAC, 0x63, 0xBD, 0xB0, 0x1A, 
-0xEB, 0x66, 0x44, 0x68, 0xC8, 0xB2, 0x71, 0xBB, 0x5B, 0x45, 0xB8, 0xCD, 0x71, 0xAB, 0x75, 0xBC, 
-0x12, 0x26, 0xF5, 0xCD, 0x02, 0x4A, 0xD5, 0x65, 0xAD, 0xAF, 0x27, 0xD1, 0xBE, 0x99, 0x50, 0xFB, 
-0xBA, 0x62, 0xA2, 0xA9, 0x87, 0xB5, 0xB8, 0xCA, 0x53, 0x95, 0x96, 0x32, 0xAF, 0x70, 0xB9, 0xC7, 
-0x95, 0x96, 0x32, 0x77, 0x38, 0x1B, 0xF0, 0x85, 0xC7, 0x7B, 0x50, 0xAE, 0x56, 0x4D, 0x04, 0x05, 
-0x08, 0xCE, 0x06, 0x6A, 0x0B, 0x59, 0x44, 0x04, 0x55, 0x9B, 0xD0, 0x29, 0x09, 0x63, 0xC9, 0xBF, 
-0xD9, 0xA2, 0x34, 0x1F, 0x8B, 0x24, 0xCA, 0x80, 0x56, 0x58, 0x04, 0x17, 0xC0, 0x3A, 0x1F, 0xF5, 
-0xB8, 0x18, 0x24, 0x49, 0x91, 0xA4, 0x8D, 0x33, 0x19, 0x65, 0xDA, 0x62, 0xBE, 0xF0, 0x3C, 0xB0, 
-0x30, 0x62, 0xC7, 0x91, 0x25, 0x76, 0x2D, 0x8C, 0xD8, 0x3B, 0x28, 0x39, 0x3C, 0x28, 0x39, 0xEA, 
-0x03, 0x7D, 0x32, 0xAC, 0xB4, 0xF0, 0xCA, 0xE0, 0x25, 0xA1, 0xB0, 0x01, 0x21, 0xC5, 0x23, 0xA0, 
-0x04, 0xEB, 0xCB, 0xD0, 0xCE, 0x94, 0x1F, 0x14, 0xF3, 0x47, 0x95, 0x84, 0x7B, 0x36, 0x6F, 0x9D, 
-0xFA, 0xDB, 0xA7, 0x3E, 0xE3, 0x82, 0x6B, 0xBF, 0xE7, 0xBB, 0x5E, 0x77, 0xD7, 0x7F, 0xFE, 0xCF, 
-0x57, 0xE6, 0x1B, 0x12, 0xED, 0xC3, 0x83, 0x93, 0x6B, 0xFD, 0x1B, 0x38, 0x23, 0xF8, 0xBD, 0xDF, 
-0xFB, 0x68, 0xF6, 0xB1, 0x7F, 0xFC, 0xEB, 0x67, 0x5E, 0xFF, 0x85, 0x9B, 0x5F, 0xB5, 0xD4, 0x1B, 
-0xBE, 0x22, 0xCD, 0xA6, 0x9E, 0x6B, 0x7D, 0x98, 0xF5, 0x95, 0x68, 0x48, 0xD0, 0xCA, 0xE0, 0x5C, 
-0x85, 0x26, 0x21, 0xCD, 0x0C, 0xBE, 0x1C, 0x62, 0x42, 0x45, 0x1B, 0x4F, 0x9B, 0x9C, 0x0E, 0x05, 
-0xE7, 0x24, 0x2D, 0xCE, 0xDB, 0x34, 0xC5, 0xB6, 0x6E, 0xCA, 0x79, 0x9B, 0x3A, 0x9C, 0x3B, 0xD3, 
-0x62, 0x73, 0xDB, 0xB0, 0x29, 0x0D, 0x64, 0xA1, 0x44, 0xCA, 0x02, 0x21, 0xC7, 0x87, 0x01, 0xA2, 
-0x2A, 0xB4, 0x12, 0xB4, 0xF2, 0x68, 0x13, 0xC8, 0x12, 0x45, 0x9A, 0x08, 0xC6, 0x68, 0x3A, 0xDD, 
-0x34, 0xFA, 0x3E, 0x18, 0x85, 0x4E, 0x0C, 0x4A, 0x6B, 0xC4, 0x68, 0x44, 0x2B, 0xD0, 0x1E, 0xB4, 
-0x45, 0xC4, 0x2D, 0x93, 0x69, 0x58, 0xB9, 0x88, 0xE4, 0x7D, 0x94, 0x40, 0xC7, 0xBF, 0x0B, 0x84, 
-0x10, 0x6D, 0x85, 0x43, 0xAD, 0xD6, 0xA0, 0x36, 0x9B, 0x5A, 0x96, 0x7D, 0x6B, 0xB3, 0x2A, 0xF1, 
-0x51, 0x92, 0x9E, 0xB0, 0x63, 0x5D, 0xFD, 0xB9, 0xFA, 0xF7, 0xD5, 0x8B, 0x73, 0xAB, 0x1D, 0x2B, 
-0x26, 0x64, 0xEB, 0x38, 0xFD, 0xD6, 0xD9, 0x84, 0x99, 0xC6, 0xA4, 0x63, 0x41, 0xBD, 0xCF, 0xC7, 
-0xC0, 0xD8, 0xB8, 0x18, 0x37, 0x36, 0x4A, 0x98, 0x81, 0xE0, 0x3C, 0xDE, 0x09, 0x55, 0xEE, 0xB0, 
-0xA5, 0xA7, 0x2C, 0x2C, 0x55, 0x55, 0x11, 0x6C, 0x94, 0x30, 0x5D, 0xE5, 0x08, 0x76, 0x59, 0xBD, 
-0x80, 0x8B, 0x6A, 0x81, 0xE8, 0x15, 0xA6, 0x62, 0x9E, 0x3B, 0x96, 0x75, 0xC3, 0x91, 0x68, 0x7D, 
-0xBC, 0x87, 0x73, 0x28, 0xEF, 0x10, 0x1F, 0x48, 0x52, 0x1D, 0x17, 0xED, 0x44, 0xE1, 0x6B, 0x8F, 
-0xC1, 0x18, 0xC7, 0x20, 0x86, 0x42, 0xF4, 0xBA, 0x83, 0xD7, 0x19, 0xA4, 0x29, 0xDE, 0x24, 0xE4, 
-0x28, 0xFA, 0x36, 0xB0, 0x58, 0x3A, 0x7A, 0x5E, 0xB8, 0xEF, 0xE0, 0x3C, 0x07, 0x86, 0x15, 0x0F, 
-0x2E, 0x0C, 0xD8, 0xBD, 0x54, 0x72, 0xB0, 0x0A, 0x2C, 0xA2, 0x28, 0xC9, 0x70, 0x64, 0x78, 0x95, 
-0x51, 0x7A, 0x8F, 0x12, 0x43, 0x19, 0x4A, 0xDA, 0xED, 0x19, 0xF2, 0x7C, 0x48, 0x08, 0x36, 0x28, 
-0x2D, 0x85, 0x77, 0xC3, 0xFD, 0x42, 0xB8, 0x71, 0xEB, 0x59, 0xDD, 0x7F, 0xB9, 0xEC, 0xF2, 0x67, 
-0x7C, 0xFA, 0x3F, 0xFE, 0xC7, 0xD7, 0xDE, 0xBF, 0x61, 0x75, 0xF0, 0xF0, 0x63, 0x83, 0x70, 0x1F, 
-0x61, 0x84, 0x10, 0xE4, 0x63, 0x1F, 0xFB, 0x58, 0xFA, 0xDB, 0xBF, 0xFD, 0xD7, 0x4F, 0xBA, 0xF9, 
-0xD6, 0x9B, 0xBF, 0xB5, 0x3F, 0xA8, 0x5E, 0x6B, 0x2B, 0xFF, 0x0C, 0x1C, 0xDB, 0xB2, 0xA4, 0x63, 
-0xB0, 0x4A, 0xE9, 0x34, 0xA3, 0xAA, 0x04, 0x47, 0x40, 0x07, 0x4F, 0xAA, 0xC0, 0x04, 0x8B, 0xF2, 
-0x05, 0x86, 0x92, 0x94, 0x8A, 0x2E, 0x81, 0x39, 0x14, 0xDB, 0xDB, 0x29, 0xE7, 0xCD, 0xB4, 0x39, 
-0x7F, 0x53, 0x97, 0xED, 0xDD, 0x8C, 0x6D, 0x53, 0x5D, 0xB6, 0xCE, 0xA4, 0xD8, 0xD1, 0x51, 0x12, 
-0xE5, 0x30, 0xE2, 0x31, 0x78, 0x34, 0x15, 0x46, 0x2A, 0x52, 0x02, 0x5A, 0x59, 0xC4, 0x57, 0x88, 
-0x38, 0x94, 0x0E, 0x68, 0x2D, 0x28, 0xA3, 0x51, 0x89, 0xC2, 0xA4, 0x09, 0x24, 0xA0, 0x3B, 0x82, 
-0x68, 0x41, 0xEB, 0x28, 0x15, 0x2B, 0xA5, 0xA2, 0x5E, 0xB6, 0xC9, 0x8D, 0x65, 0x6A, 0xEF, 0x88, 
-0x46, 0x10, 0x5A, 0xF1, 0xB7, 0x27, 0x84, 0xB2, 0xCE, 0x2E, 0x2B, 0xB5, 0xEC, 0xBB, 0xF2, 0x53, 
-0x19, 0x03, 0x75, 0x6E, 0xAE, 0xB5, 0x7E, 0x5F, 0xEB, 0x73, 0x52, 0x8D, 0xA1, 0x30, 0x30, 0xA1, 
-0x5B, 0x6E, 0x3C, 0xB6, 0xBC, 0xF7, 0x28, 0xA7, 0xD0, 0x2E, 0x8D, 0xA1, 0x0A, 0x5D, 0x24, 0x3A, 
-0xE7, 0x7C, 0xF4, 0xDC, 0xAB, 0x73, 0x7F, 0x95, 0xA5, 0x8D, 0x41, 0xB5, 0x6D, 0x74, 0xAF, 0xB6, 
-0xD6, 0xE2, 0x5C, 0xC0, 0x55, 0x36, 0x4A, 0xAC, 0x5E, 0xE3, 0x6D, 0x54, 0x1B, 0x84, 0x20, 0xD1, 
-0xBD, 0x5A, 0x99, 0x68, 0xE6, 0xE5, 0x6B, 0x5D, 0x6E, 0x88, 0x76, 0xD7, 0x0D, 0xF9, 0x4B, 0x88, 
-0xF1, 0x2F, 0x42, 0x08, 0x88, 0x8E, 0xFA, 0x58, 0xE5, 0x41, 0x42, 0x4D, 0xB4, 0x01, 0xA4, 0x96, 
-0x66, 0x83, 0x07, 0xAF, 0x18, 0x3B, 0x16, 0x04, 0x9D, 0x12, 0xB4, 0x22, 0x20, 0x54, 0x3A, 0x63, 
-0xA4, 0x3B, 0x8C, 0x48, 0x18, 0x7A, 0xC5, 0xD1, 0xAA, 0x64, 0x5F, 0x6F, 0xC8, 0x03, 0x0B, 0x8B, 
-0x3C, 0xB0, 0xD0, 0xE3, 0x50, 0x5E, 0x70, 0x70, 0x58, 0xB2, 0xE4, 0x85, 0x01, 0x9A, 0x82, 0x16, 
-0x95, 0xB4, 0x28, 0x25, 0xA5, 0x12, 0x0D, 0x18, 0x12, 0x0C, 0x38, 0x4B, 0x50, 0x81, 0xC2, 0xF7, 
-0x42, 0x92, 0xB6, 0x7C, 0x50, 0xD5, 0xC8, 0x56, 0xA3, 0x3D, 0x26, 0x51, 0xD7, 0x3D, 0xED, 0xC9, 
-0x4F, 0xFA, 0xC7, 0x6F, 0xFD, 0xD6, 0x6F, 0xBA, 0xF9, 0x07, 0x7E, 0xE0, 0x55, 0x87, 0xAF, 0xB8, 
-0xE2, 0x8A, 0x18, 0xD6, 0x6E, 0x03, 0x0F, 0x3B, 0x36, 0x08, 0xF7, 0x51, 0xC4, 0x5B, 0xDE, 0xF2, 
-0x16, 0xD5, 0xEB, 0xB1, 0xF9, 0x83, 0xFF, 0xF4, 0x89, 0x17, 0x1D, 0xDA, 0x77, 0xF4, 0x95, 0xC3, 
-0x7E, 0xFE, 0x52, 0x45, 0x72, 0x89, 0x43, 0x4D, 0x07, 0xDA, 0x4A, 0xEA, 0x05, 0x12, 0x09, 0x51, 
-0x9A, 0xD4, 0x22, 0x68, 0x04, 0x13, 0x2C, 0xA9, 0x78, 0xC4, 0xE7, 0x24, 0x0C, 0x99, 0xC2, 0xB1, 
-0x15, 0xC3, 0xE6, 0xD4, 0x70, 0xCE, 0xEC, 0x14, 0xE7, 0x6F, 0x9A, 0xE2, 0x9C, 0x99, 0x0E, 0xD3, 
-0x29, 0x4C, 0xB7, 0x5B, 0x4C, 0x65, 0x9A, 0xB6, 0x72, 0xA4, 0xA1, 0x20, 0x71, 0x05, 0x89, 0xAF, 
-0x0D, 0x81, 0xC4, 0x21, 0xA1, 0x84, 0xE0, 0x88, 0x46, 0x63, 0x1E, 0xB4, 0x42, 0xB4, 0x27, 0x98, 
-0x00, 0x2A, 0xA0, 0xB5, 0x46, 0xE9, 0x7A, 0x11, 0x4C, 0x6A, 0xBD, 0xA3, 0x12, 0x4C, 0x96, 0x8E, 
-0xC9, 0xB7, 0xF9, 0x3D, 0x7A, 0x35, 0x09, 0x28, 0x50, 0x49, 0xBD, 0xA8, 0x36, 0x61, 0x01, 0x30, 
-0xF9, 0xB7, 0xF7, 0xAB, 0x1D, 0x2F, 0x56, 0x42, 0xA9, 0x3A, 0xB8, 0xCB, 0xAA, 0x8D, 0x3A, 0xD8, 
-0x0B, 0xF5, 0x82, 0x60, 0xD4, 0x91, 0x36, 0x7F, 0xC7, 0xD8, 0xAE, 0x62, 0xC1, 0xE5, 0x31, 0x87, 
-0x97, 0xF8, 0xA8, 0x1B, 0xF5, 0xBE, 0xD6, 0x1B, 0xD7, 0x84, 0xEB, 0x2B, 0x37, 0x26, 0xE9, 0x98, 
-0x39, 0x21, 0x5E, 0xD7, 0xC7, 0x0B, 0xD2, 0xCD, 0xBA, 0x31, 0xB8, 0x90, 0x8F, 0xD2, 0x79, 0xF4, 
-0x0F, 0x03, 0xA9, 0xA5, 0x66, 0x6F, 0x63, 0x00, 0x9A, 0x48, 0xBA, 0x8D, 0x63, 0xC3, 0xB2, 0xC4, 
-0xEF, 0x1A, 0x17, 0x6B, 0x1F, 0x50, 0x44, 0x5D, 0x38, 0xD4, 0xD1, 0xD4, 0x94, 0xA6, 0x02, 0xAC, 
-0x68, 0x2A, 0x9D, 0x50, 0x29, 0x4D, 0xA5, 0x0C, 0x05, 0x42, 0xE1, 0x60, 0x18, 0x0C, 0x87, 0x2B, 
-0xC5, 0xA1, 0xDC, 0xB3, 0x7F, 0xA1, 0xC7, 0x9E, 0x85, 0x25, 0xF6, 0xF6, 0x87, 0x1C, 0x2A, 0x2C, 
-0x8B, 0xDE, 0xD3, 0x47, 0xE1, 0x54, 0x8B, 0x51, 0x80, 0x32, 0x68, 0xBC, 0x4A, 0xF0, 0x92, 0xE2, 
-0x45, 0x11, 0x7C, 0x54, 0x8B, 0xB4, 0x94, 0xC6, 0xB9, 0x61, 0xF0, 0x54, 0xCE, 0x24, 0x32, 0x5F, 
-0x54, 0xBD, 0xAF, 0x2A, 0x23, 0xFF, 0x72, 0xF1, 0x93, 0xCF, 0xBF, 0xE6, 0x95, 0xDF, 0xFD, 0xEA, 
-0x3B, 0xDE, 0xF1, 0x6B, 0x1B, 0x9E, 0x61, 0x8F, 0x06, 0x8E, 0xD3, 0xE4, 0x37, 0xF0, 0x48, 0x21, 
-0x84, 0xA0, 0x3E, 0xF1, 0x89, 0xDB, 0xDA, 0x7F, 0xF2, 0x8E, 0x3F, 0xB9, 0xE4, 0xB3, 0x9F, 0xBD, 
-0xF1, 0xE5, 0xF3, 0x47, 0x7B, 0xFF, 0xD6, 0x3A, 0x7D, 0xA9, 0x32, 0xC9, 0x16, 0xAD, 0x12, 0x03, 
-0x4A, 0x79, 0x1F, 0x89, 0x21, 0x28, 0x1D, 0xC9, 0xC8, 0x3A, 0x0C, 0x0E, 0x15, 0x1C, 0x2D, 0x6D, 
-0x49, 0xA5, 0x42, 0xEC, 0x08, 0x09, 0x39, 0xD3, 0x04, 0x36, 0xE1, 0xD9, 0x92, 0x64, 0x9C, 0x3D, 
-0x37, 0xCD, 0xF6, 0x4D, 0x53, 0x9C, 0x37, 0xDB, 0xE5, 0xEC, 0xE9, 0x8C, 0x6D, 0x9D, 0x94, 0x4D, 
-0x99, 0x42, 0xF2, 0x5E, 0x9C, 0x7C, 0x8A, 0x43, 0x7C, 0x05, 0xBE, 0xC4, 0xF9, 0x18, 0xEC, 0x44, 
-0x82, 0xC7, 0x55, 0x45, 0x24, 0x89, 0xC6, 0x8B, 0x2A, 0x84, 0x28, 0x69, 0x2A, 0x41, 0x24, 0xD4, 
-0x69, 0x58, 0x1A, 0x42, 0x0D, 0x04, 0x25, 0x28, 0x15, 0x25, 0x61, 0x91, 0xE5, 0x88, 0x54, 0x4C, 
-0x10, 0x6D, 0xB3, 0x79, 0x81, 0x34, 0x4D, 0xC7, 0xBF, 0x37, 0x08, 0x61, 0x39, 0x87, 0x97, 0xB7, 
-0x2B, 0x63, 0x09, 0x8F, 0xC9, 0x71, 0x15, 0x45, 0x34, 0x12, 0x6B, 0x73, 0xEC, 0x32, 0x31, 0x13, 
-0x57, 0xFD, 0xEB, 0xFD, 0x8D, 0x49, 0x97, 0xAA, 0xCD, 0xB8, 0x22, 0xD5, 0xA8, 0x65, 0x1D, 0xAB, 
-0x32, 0xF5, 0xE0, 0x16, 0x4F, 0xB5, 0x55, 0x41, 0xC3, 0x47, 0x93, 0xB1, 0x69, 0x1B, 0x9B, 0xE5, 
-0x38, 0x20, 0xC4, 0xC2, 0xAE, 0xBE, 0xAF, 0x47, 0x50, 0x89, 0x59, 0x8E, 0x93, 0x50, 0xD7, 0x81, 
-0x13, 0x70, 0x41, 0x53, 0x88, 0x60, 0x93, 0x36, 0xA5, 0x49, 0x19, 0xE9, 0x8C, 0x1E, 0xC2, 0xFC, 
-0xC8, 0xB2, 0x77, 0xA1, 0xCF, 0xBE, 0xF9, 0xA3, 0x1C, 0x18, 0x14, 0xEC, 0x98, 0xEF, 0xB3, 0xE4, 
-0x0C, 0x7D, 0xE7, 0x19, 0x22, 0x94, 0x64, 0x54, 0x92, 0x61, 0x55, 0x8A, 0xD3, 0x09, 0x65, 0xE5, 
-0xA0, 0x6E, 0x0B, 0xD4, 0x0A, 0x95, 0x7A, 0xC0, 0x08, 0xDE, 0x57, 0xCE, 0x33, 0x18, 0xB5, 0x24, 
-0xD9, 0x6D, 0x12, 0x6E, 0xD9, 0xB2, 0x6D, 0xF6, 0xEF, 0x5E, 0x7C, 0xC5, 0x0B, 0xBF, 0xF4, 0xC3, 
-0x3F, 0xF6, 0x93, 0xBB, 0xBF, 0xFD, 0xDB, 0x9F, 0x52, 0x6E, 0x10, 0xED, 0xA3, 0x87, 0x0D, 0xC2, 
-0x7D, 0x8C, 0xE1, 0xEA, 0xAB, 0xAF, 0x36, 0x7F, 0xFD, 0xD7, 0xD7, 0x9C, 0xFB, 0x8F, 0x1F, 0xF8, 
-0xC8, 0x15, 0xBD, 0x3C, 0x7F, 0x45, 0x31, 0x2A, 0xBE, 0xD1, 0x07, 0x7D, 0x91, 0xD1, 0x59, 0x47, 
-0x54, 0xA2, 0x5D, 0x50, 0x84, 0x3A, 0x92, 0x97, 0x52, 0x0A, 0xE7, 0x2B, 0xBC, 0x2D, 0x30, 0xDA, 
-0xA1, 0xC4, 0xA3, 0x7C, 0x45, 0x16, 0x3C, 0xDD, 0x60, 0x69, 0xE3, 0xC9, 0x80, 0x29, 0x11, 0xE6, 
-0x5A, 0x9A, 0xB3, 0xA7, 0x5B, 0x9C, 0x3B, 0xDB, 0x65, 0x6B, 0x3B, 0xE1, 0xBC, 0xCD, 0xD3, 0x4C, 
-0x29, 0xCF, 0x74, 0xAA, 0xE8, 0xE8, 0x40, 0x22, 0x0E, 0x15, 0x2C, 0xAA, 0x96, 0xA0, 0x33, 0x0B, 
-0x89, 0xF7, 0x04, 0x3C, 0xF8, 0xA8, 0x9B, 0x8D, 0x71, 0x22, 0x42, 0xA4, 0x94, 0xE0, 0xA3, 0xCE, 
-0xB6, 0x36, 0x39, 0x8B, 0x82, 0x5F, 0x94, 0x78, 0x45, 0x04, 0xC3, 0x38, 0x3E, 0xE1, 0xD8, 0x14, 
-0x8D, 0x49, 0x09, 0xB0, 0x8E, 0x92, 0xB6, 0x1A, 0x35, 0x3D, 0x2D, 0x93, 0xE6, 0x04, 0x1A, 0x92, 
-0x64, 0x82, 0x88, 0x57, 0x93, 0x39, 0xB5, 0x2E, 0x54, 0xA9, 0x68, 0xB1, 0x3A, 0xD6, 0xDC, 0x86, 
-0x3A, 0xF4, 0x61, 0x4D, 0xB3, 0xCD, 0xF5, 0x9A, 0xB0, 0x95, 0xE3, 0x23, 0x6B, 0xC9, 0x59, 0xF4, 
-0xF8, 0x86, 0x35, 0x99, 0x2E, 0xEB, 0xAC, 0x45, 0x04, 0xE7, 0x1C, 0x41, 0xC5, 0xBF, 0xEB, 0x1A, 
-0xC1, 0xD5, 0x65, 0x72, 0xA2, 0xF1, 0x26, 0x8D, 0x39, 0xC0, 0x42, 0x00, 0x6D, 0xF0, 0x2A, 0xA1, 
-0x12, 0xC5, 0x28, 0x08, 0xC3, 0xA0, 0xE8, 0x79, 0xC5, 0xE1, 0xD2, 0xB1, 0xBF, 0x9F, 0xB3, 0x67, 
-0x69, 0xC8, 0xFE, 0xDE, 0x88, 0x43, 0x83, 0x21, 0xF3, 0xC3, 0x82, 0x25, 0x17, 0x18, 0x49, 0x87, 
-0x91, 0x18, 0x2A, 0x1F, 0x1D, 0x19, 0x82, 0x4E, 0x71, 0x24, 0x38, 0x64, 0x4C, 0xF4, 0x5A, 0x0B, 
-0x5A, 0x3C, 0xAE, 0x2C, 0xF0, 0xA1, 0x0A, 0x9A, 0x90, 0x0B, 0x1C, 0x09, 0xD8, 0xCF, 0x4F, 0x4F, 
-0x65, 0x37, 0x5E, 0x74, 0xD1, 0xB9, 0x9F, 0xFE, 0xAE, 0x57, 0x7E, 0xEB, 0x3D, 0x4C, 0xFF, 0xCC, 
-0xFC, 0x55, 0x57, 0x1D, 0x63, 0x23, 0xB7, 0x81, 0x47, 0x01, 0x1B, 0x84, 0xFB, 0x18, 0x45, 0x08, 
-0x41, 0xBD, 0xEB, 0x5D, 0x1F, 0xEA, 0x7E, 0xF8, 0xEF, 0xFF, 0xE9, 0xFC, 0x3B, 0xEF, 0xB9, 0xEF, 
-0x85, 0x7B, 0xF7, 0x1E, 0xF8, 0x96, 0xDE, 0x60, 0xF8, 0x4D, 0x89, 0x69, 0x6F, 0xF1, 0x9E, 0x96, 
-0xF7, 0xDA, 0x64, 0x59, 0x47, 0xF2, 0x22, 0x47, 0xD0, 0xA4, 0x75, 0x70, 0x11, 0x8D, 0xC4, 0x38, 
-0x00, 0xB6, 0x24, 0x55, 0x0A, 0xEF, 0x4B, 0xA6, 0x92, 0x94, 0x5E, 0x75, 0x98, 0x6D, 0xC9, 0x34, 
-0xA1, 0xEA, 0x33, 0x53, 0x13, 0xF0, 0xB4, 0x0E, 0x6C, 0xED, 0xA6, 0x6C, 0x9F, 0x6E, 0x73, 0xC1, 
-0x59, 0x73, 0x74, 0x94, 0x67, 0xCB, 0xEC, 0x34, 0x6D, 0x1C, 0x9B, 0x51, 0x24, 0xAE, 0x22, 0x38, 
-0x87, 0x38, 0x8B, 0x0E, 0x1E, 0x25, 0x21, 0xEA, 0x83, 0x83, 0x47, 0xD7, 0x66, 0x66, 0x12, 0x2A, 
-0x90, 0xC6, 0xD1, 0x20, 0xAA, 0x25, 0x42, 0x08, 0x24, 0x35, 0xCB, 0x46, 0x12, 0xF4, 0x31, 0x9E, 
-0x80, 0x48, 0x24, 0xE5, 0x9A, 0xF8, 0x1A, 0xD2, 0x0C, 0xB5, 0xD7, 0x57, 0x03, 0x8F, 0x22, 0x78, 
-0xBD, 0x6C, 0x86, 0x56, 0x43, 0xC1, 0x58, 0xEA, 0x5C, 0x8D, 0xC9, 0x88, 0x67, 0x82, 0xAE, 0xA3, 
-0x81, 0xD5, 0x0E, 0x19, 0x21, 0xA0, 0xA8, 0x89, 0xB4, 0xDE, 0x97, 0x1A, 0x43, 0x70, 0x7E, 0x2C, 
-0x89, 0x6B, 0xA9, 0x25, 0xF3, 0x10, 0xB0, 0x21, 0x60, 0xB5, 0x1E, 0x6B, 0x90, 0xE3, 0x73, 0xC5, 
-0xC5, 0xC0, 0x10, 0x02, 0x2E, 0x58, 0xB4, 0x31, 0x78, 0x51, 0x31, 0x29, 0xAD, 0x28, 0x1C, 0x51, 
-0x1F, 0x1B, 0x50, 0x54, 0x18, 0x4A, 0x3D, 0xC5, 0xE2, 0xB0, 0x44, 0xB5, 0xBA, 0x38, 0x6D, 0x98, 
-0x1F, 0x14, 0x1C, 0x58, 0x1A, 0xB1, 0x7B, 0xA1, 0xCF, 0x42, 0xE5, 0xD8, 0xD7, 0xCF, 0x39, 0x52, 
-0x38, 0x0E, 0xE5, 0x25, 0x2E, 0xE9, 0x70, 0xB4, 0xAA, 0xB0, 0x18, 0xAC, 0x08, 0x36, 0x24, 0x58, 
-0x52, 0x7C, 0x1D, 0xFD, 0x2B, 0xA8, 0x58, 0xC6, 0xA6, 0xFE, 0xEA, 0x81, 0x2E, 0x04, 0x5F, 0x38, 
-0x63, 0xA4, 0xF4, 0xAE, 0x3A, 0x6A, 0x7D, 0xF1, 0xC0, 0xDC, 0xCC, 0xEC, 0x67, 0x2E, 0xBE, 0xF0, 
-0xE2, 0x7F, 0x79, 0xCD, 0xB7, 0x7D, 0xD3, 0x6D, 0xDF, 0xF9, 0xFD, 0x2F, 0x3F, 0xFA, 0x82, 0x17, 
-0xBC, 0xC0, 0x6E, 0x48, 0xB3, 0x8F, 0x2D, 0x6C, 0x10, 0xEE, 0xE3, 0x00, 0xEF, 0x7B, 0xDF, 0xFB, 
-0xF4, 0xE1, 0xC3, 0xD5, 0xCC, 0xAF, 0xFE, 0xF2, 0x6F, 0xBD, 0x68, 0x38, 0x2A, 0x9E, 0xB1, 0xB4, 
-0x34, 0xFC, 0x46, 0x30, 0xCF, 0x0E, 0x41, 0xCE, 0x49, 0xD2, 0x76, 0x3B, 0x2F, 0x2B, 0xA5, 0x49, 
-0xD1, 0x2A, 0xA1, 0xF4, 0x05, 0x42, 0x42, 0xA6, 0xDB, 0x14, 0xAE, 0x20, 0x11, 0x8D, 0x31, 0x06, 
-0xA3, 0x20, 0x2F, 0xFA, 0xCC, 0xB6, 0x32, 0xCA, 0xBC, 0x47, 0x07, 0x4F, 0x17, 0xC7, 0xB4, 0x09, 
-0x24, 0xB6, 0x60, 0xC6, 0xC0, 0x94, 0x81, 0x0B, 0xCF, 0xD9, 0xCE, 0xF6, 0xE9, 0x2E, 0x9B, 0x74, 
-0xA0, 0x6B, 0x60, 0xAA, 0x95, 0xD1, 0x4D, 0x52, 0xDA, 0x4A, 0x91, 0xA9, 0x40, 0x46, 0x20, 0x0D, 
-0x0E, 0x5C, 0x45, 0x4A, 0x94, 0xAA, 0xB5, 0x6A, 0xB2, 0x58, 0x34, 0x01, 0xC7, 0x3D, 0x49, 0x6D, 
-0x8D, 0x10, 0xA7, 0xE9, 0xF5, 0x42, 0x52, 0x88, 0xE1, 0x26, 0x19, 0x4F, 0xCD, 0x27, 0xD5, 0x15, 
-0x0D, 0x41, 0x47, 0xE9, 0xB3, 0xB4, 0x31, 0x74, 0xA2, 0x8C, 0x23, 0x92, 0xC5, 0x6B, 0xA8, 0xDA, 
-0x6E, 0x78, 0x59, 0xC2, 0x9D, 0x48, 0x25, 0x3E, 0xF6, 0x51, 0x56, 0x38, 0x5B, 0x3B, 0x70, 0x8C, 
-0x89, 0x3E, 0x96, 0xA5, 0x91, 0x6E, 0x9D, 0x8F, 0x2A, 0x0B, 0xA9, 0x63, 0x10, 0x4C, 0x6E, 0x81, 
-0x18, 0x88, 0xDB, 0x22, 0x04, 0x6F, 0x63, 0xA8, 0x47, 0x25, 0xD1, 0x7C, 0x4E, 0x49, 0xED, 0xD9, 
-0x25, 0x54, 0x28, 0x2A, 0xD1, 0x94, 0x41, 0x28, 0x50, 0x58, 0x2F, 0x54, 0x21, 0x12, 0xEE, 0xDE, 
-0xA5, 0x21, 0x8B, 0x85, 0x67, 0xBE, 0xD7, 0x67, 0xBE, 0x37, 0x62, 0xA9, 0x0C, 0x2C, 0xD9, 0xC0, 
-0xA1, 0x41, 0xC9, 0x92, 0x87, 0x45, 0x1C, 0xA2, 0x67, 0xE8, 0x39, 0x4F, 0x89, 0xC1, 0x22, 0x48, 
-0xD2, 0xC6, 0xFA, 0x80, 0x68, 0x83, 0xAD, 0xC0, 0xA8, 0xB8, 0x60, 0x19, 0x82, 0x03, 0x6F, 0xF1, 
-0xBE, 0x82, 0x50, 0x79, 0x1F, 0xAA, 0x42, 0xA8, 0x16, 0x44, 0xDC, 0xED, 0x59, 0xAA, 0x3F, 0x3F, 
-0xDD, 0xED, 0xDE, 0xF6, 0x75, 0xDF, 0xF8, 0xC2, 0x2F, 0xBD, 0xF2, 0x95, 0xAF, 0xDA, 0xF3, 0x13, 
-0x3F, 0xF1, 0xBD, 0xC3, 0x8D, 0x58, 0xB4, 0x8F, 0x5D, 0x6C, 0x10, 0xEE, 0xE3, 0x08, 0x21, 0xCE, 
-0x25, 0xD5, 0xFF, 0xF9, 0x3F, 0x1F, 0xEB, 0xFE, 0xCD, 0x5F, 0x7E, 0xE0, 0xC2, 0xCF, 0x5C, 0xFF, 
-0xF9, 0x57, 0x94, 0x55, 0x75, 0xC5, 0xA8, 0x2C, 0x2E, 0x37, 0xAA, 0x7D, 0x41, 0x92, 0xA4, 0x53, 
-0x45, 0x61, 0xF5, 0x54, 0x77, 0x93, 0x1A, 0x8D, 0x02, 0x26, 0x6D, 0x53, 0x14, 0x05, 0xC6, 0x18, 
-0xAA, 0xAA, 0x24, 0x49, 0x12, 0xCA, 0x6A, 0x48, 0xDB, 0xA4, 0x98, 0xE0, 0x50, 0x6E, 0x44, 0x4B, 
-0x04, 0xC2, 0x90, 0x0E, 0x02, 0x94, 0x08, 0x05, 0x8E, 0x21, 0xD3, 0x28, 0x5A, 0x22, 0x74, 0x8C, 
-0xA1, 0x9B, 0x1A, 0x36, 0x67, 0x6D, 0xCE, 0x9E, 0x9B, 0xE6, 0xFC, 0x4D, 0x9B, 0xD8, 0xDA, 0x6D, 
-0x73, 0x56, 0x2B, 0xA1, 0x25, 0xD0, 0x16, 0x4F, 0x2A, 0x9E, 0x24, 0x44, 0x8B, 0x88, 0x68, 0x7B, 
-0x1A, 0x10, 0x67, 0x51, 0x5A, 0xA2, 0xE4, 0x88, 0x8F, 0x2B, 0xE6, 0xDE, 0xA2, 0x1B, 0xC2, 0x74, 
-0x31, 0x94, 0x65, 0xA8, 0x3D, 0xA9, 0xE2, 0xB4, 0x7D, 0x59, 0x18, 0x33, 0x7A, 0x39, 0xF4, 0xA3, 
-0x04, 0xC6, 0x11, 0xB1, 0x1A, 0x82, 0x0C, 0x61, 0xD9, 0x69, 0x23, 0x12, 0xEA, 0xB2, 0x82, 0x35, 
-0x84, 0x80, 0x0E, 0x51, 0xC2, 0xA5, 0x5E, 0xC0, 0xF2, 0xB5, 0x3E, 0xD5, 0x05, 0x89, 0x0E, 0x1E, 
-0xDA, 0x44, 0x53, 0x36, 0x89, 0xAE, 0xC9, 0x21, 0x50, 0x9B, 0x44, 0x47, 0x3B, 0x55, 0x9D, 0xC4, 
-0x60, 0x36, 0x28, 0x8D, 0x17, 0x83, 0x13, 0x15, 0x6B, 0xC7, 0x6B, 0x72, 0x34, 0x23, 0xA7, 0x59, 
-0xAA, 0xE0, 0xD0, 0xB0, 0xE4, 0xD0, 0xE2, 0x88, 0xFD, 0x8B, 0x43, 0x0E, 0x2F, 0x0E, 0x59, 0x1C, 
-0x8C, 0xE8, 0xD9, 0x8A, 0x25, 0x46, 0x88, 0x6E, 0x93, 0xBB, 0x8A, 0x1C, 0x4F, 0xA0, 0x45, 0x8E, 
-0xE0, 0x48, 0x81, 0x36, 0x05, 0x20, 0xBA, 0xC5, 0xC8, 0x55, 0xB4, 0x5B, 0x33, 0x0C, 0xF2, 0x9C, 
-0x76, 0xB7, 0xCB, 0x70, 0x90, 0x23, 0x2A, 0x90, 0xA6, 0x8A, 0x3C, 0xEF, 0x01, 0xD6, 0x81, 0x73, 
-0x82, 0x0C, 0x03, 0xF6, 0x60, 0x92, 0x98, 0x1D, 0x9D, 0x56, 0x7A, 0xE3, 0x05, 0xE7, 0x6D, 0xBF, 
-0xFA, 0x55, 0xAF, 0x79, 0xE5, 0x5D, 0xDF, 0xF1, 0x1D, 0x2F, 0x3C, 0xFC, 0xCD, 0xDF, 0xFC, 0xCD, 
-0x6E, 0x43, 0x92, 0x7D, 0x7C, 0x60, 0x83, 0x70, 0x1F, 0xC7, 0x78, 0xE7, 0x3B, 0x6F, 0x4A, 0x86, 
-0xC3, 0x07, 0xBB, 0x9F, 0xFC, 0xE4, 0x47, 0x2F, 0xF9, 0xD4, 0xA7, 0xAE, 0x79, 0xF6, 0x68, 0x58, 
-0x3E, 0xB7, 0xD3, 0xE9, 0x7C, 0xFD, 0x60, 0x68, 0x2F, 0x36, 0x4C, 0x6D, 0x12, 0x95, 0x26, 0x4A, 
-0x19, 0x0A, 0x3B, 0x20, 0x49, 0xA7, 0xC8, 0xB2, 0x36, 0xFD, 0xDE, 0x22, 0xDA, 0xA4, 0x78, 0x57, 
-0x21, 0xC1, 0xD1, 0xD2, 0x9A, 0xCA, 0x8D, 0x30, 0x04, 0x5A, 0x22, 0x08, 0x01, 0xA3, 0x03, 0x95, 
-0x1D, 0x62, 0x94, 0xC7, 0x10, 0xD0, 0xDE, 0x92, 0xE2, 0x98, 0x16, 0xCD, 0x5C, 0x2B, 0x61, 0x36, 
-0x31, 0xCC, 0x65, 0x09, 0x33, 0x89, 0x30, 0xD7, 0x6E, 0x31, 0xD7, 0xCA, 0x98, 0x69, 0x27, 0xCC, 
-0x74, 0xDA, 0x74, 0xDA, 0x19, 0x1D, 0x93, 0xD0, 0x52, 0x81, 0x44, 0x09, 0xA9, 0xE8, 0xA8, 0x99, 
-0xB5, 0x55, 0x4D, 0xB8, 0x01, 0xAD, 0x22, 0xC9, 0xCA, 0x84, 0x7E, 0xB8, 0x89, 0x11, 0x10, 0x25, 
-0xE1, 0x80, 0xF6, 0x55, 0xBD, 0xBA, 0xAF, 0xC7, 0xD2, 0x2D, 0x30, 0x0E, 0xBA, 0xD8, 0x28, 0x21, 
-0x1A, 0x92, 0x6C, 0xA4, 0xDE, 0x18, 0xA3, 0x36, 0x8C, 0xA3, 0x85, 0xF9, 0xDA, 0x53, 0xCE, 0x05, 
-0xC1, 0x4B, 0xBC, 0xA2, 0x53, 0x42, 0x19, 0x88, 0xE6, 0x58, 0xA2, 0x70, 0x22, 0x78, 0x15, 0xE3, 
-0x47, 0x08, 0x1A, 0x54, 0xA0, 0xF2, 0x8E, 0x2A, 0x78, 0xAC, 0x17, 0x72, 0xEB, 0x18, 0x94, 0x9E, 
-0xA5, 0x51, 0xC1, 0x62, 0x11, 0xE8, 0x57, 0xC2, 0x03, 0x87, 0x16, 0x18, 0x79, 0x4D, 0xCF, 0x0A, 
-0xBD, 0x12, 0x7A, 0x65, 0xA0, 0x5F, 0x79, 0x0A, 0x02, 0x39, 0x0E, 0x4B, 0xC0, 0xE2, 0x28, 0xB0, 
-0x24, 0xD2, 0xC6, 0x24, 0x2D, 0x0A, 0xE7, 0xF1, 0x41, 0x53, 0x78, 0xC7, 0x4C, 0x77, 0x96, 0xC5, 
-0xC1, 0x02, 0x9D, 0x6C, 0xA6, 0xF6, 0x30, 0x0B, 0xD8, 0x90, 0x93, 0xA9, 0x0E, 0x81, 0x32, 0x54, 
-0xBE, 0x57, 0x04, 0x8A, 0x7E, 0x9A, 0xA4, 0xF7, 0x66, 0x69, 0xFA, 0x65, 0x17, 0xEC, 0x4D, 0x9B, 
-0x36, 0x4D, 0xEF, 0x78, 0xD1, 0x8B, 0x5E, 0x7C, 0xD7, 0xAB, 0x5E, 0xF5, 0xAD, 0xF3, 0x3F, 0xF6, 
-0x63, 0xDF, 0x39, 0xDA, 0x20, 0xD9, 0xC7, 0x1F, 0x36, 0x08, 0xF7, 0x09, 0x84, 0xAB, 0xAF, 0xBE, 
-0xDA, 0xBC, 0xF3, 0x9D, 0x1F, 0xDC, 0xF2, 0xC0, 0x03, 0xBB, 0xCE, 0xB9, 0xE3, 0xD6, 0xFB, 0x5F, 
-0x35, 0x2C, 0xDC, 0xE5, 0xCE, 0xF9, 0x67, 0x99, 0xA4, 0x75, 0x76, 0x5E, 0xE5, 0xB3, 0xDA, 0xB4, 
-0x13, 0x6D, 0x32, 0x55, 0x16, 0x15, 0xA2, 0xE3, 0x0A, 0xB7, 0x88, 0xE0, 0x9D, 0xC3, 0xDB, 0xB2, 
-0x6E, 0x0E, 0x0E, 0x8D, 0x22, 0x50, 0x92, 0x10, 0xFD, 0xF7, 0x35, 0x01, 0x55, 0x87, 0x46, 0x31, 
-0x78, 0x12, 0x1C, 0x8A, 0xA8, 0x52, 0xC8, 0x10, 0x32, 0x05, 0xA9, 0x52, 0x24, 0x06, 0xD2, 0x44, 
-0xD3, 0x11, 0xC5, 0x56, 0x9D, 0x30, 0x65, 0x34, 0xD3, 0xED, 0x0E, 0x9D, 0x4E, 0x9B, 0x4E, 0xA6, 
-0x69, 0x67, 0x29, 0xDD, 0x2C, 0x23, 0x4B, 0xA2, 0x6E, 0x56, 0xF0, 0x91, 0x80, 0x45, 0x30, 0xB5, 
-0x49, 0x99, 0x16, 0x85, 0xC1, 0x91, 0xF9, 0xDA, 0x0A, 0x43, 0x0C, 0xA2, 0x6A, 0xDD, 0xAB, 0x2C, 
-0x5B, 0x41, 0x84, 0x3A, 0x00, 0x7A, 0x23, 0xDD, 0x46, 0x29, 0x75, 0x59, 0xC2, 0xB5, 0xC1, 0x12, 
-0x42, 0xC0, 0x07, 0xA1, 0x0A, 0xE0, 0x62, 0x34, 0x44, 0x2A, 0xA2, 0x3A, 0x20, 0xF7, 0x9E, 0x51, 
-0xE5, 0xE8, 0x95, 0x25, 0xC3, 0xA2, 0x64, 0x90, 0x57, 0x8C, 0xCA, 0x82, 0x51, 0x51, 0x92, 0x57, 
-0x21, 0x26, 0x8E, 0xF1, 0x81, 0x51, 0x51, 0x91, 0x17, 0x8E, 0x51, 0x65, 0xC9, 0xF1, 0xE4, 0x48, 
-0xAD, 0x02, 0xD0, 0x58, 0x92, 0xFA, 0x7A, 0x86, 0x8A, 0x98, 0x93, 0x2C, 0xD4, 0x61, 0x6F, 0x40, 
-0x61, 0x71, 0x28, 0x14, 0x4A, 0x34, 0x45, 0x28, 0x01, 0x43, 0x96, 0x64, 0xD1, 0xE6, 0x37, 0x54, 
-0x68, 0xA5, 0x30, 0xA2, 0x42, 0xE9, 0x46, 0x0E, 0x5C, 0xD5, 0x49, 0xB2, 0xC5, 0xA2, 0x2A, 0xF7, 
-0x42, 0x75, 0x7F, 0x6B, 0x4A, 0xDF, 0x38, 0x77, 0x56, 0xF7, 0xF3, 0x2F, 0xBE, 0xFC, 0x39, 0x77, 
-0xFE, 0xDF, 0x3F, 0xF8, 0x6D, 0x47, 0x37, 0x9C, 0x12, 0x9E, 0x18, 0xD8, 0x20, 0xDC, 0x27, 0x28, 
-0xAE, 0xBE, 0xFA, 0xEA, 0xD6, 0x1D, 0x77, 0x0C, 0xDA, 0xBF, 0xFB, 0x9B, 0x6F, 0xBB, 0xB4, 0x3F, 
-0x1C, 0x5D, 0xDC, 0x5B, 0xEA, 0xBD, 0xA0, 0x3F, 0x2A, 0x9F, 0x13, 0xE0, 0xA9, 0xED, 0xCE, 0xDC, 
-0x59, 0x65, 0xE9, 0xBA, 0x41, 0x94, 0xF8, 0xAA, 0x00, 0xD3, 0x92, 0xB8, 0xC2, 0x24, 0xB1, 0x49, 
-0x58, 0x47, 0x96, 0x75, 0xC0, 0x79, 0x9C, 0xB5, 0x78, 0x2C, 0x10, 0xE3, 0x2B, 0x68, 0x89, 0xB4, 
-0x22, 0xC1, 0xA3, 0xC4, 0xD5, 0xA9, 0x64, 0xA2, 0xB4, 0xAA, 0x25, 0x60, 0x94, 0xD0, 0x02, 0xA6, 
-0x9C, 0xA5, 0x0D, 0xA4, 0x26, 0x21, 0x31, 0x0A, 0x23, 0x60, 0x34, 0xA4, 0x4A, 0x30, 0x5A, 0x68, 
-0x27, 0x26, 0xAA, 0x1E, 0x08, 0x51, 0x35, 0xAA, 0xA2, 0xF4, 0xAA, 0x94, 0xC2, 0x88, 0xA7, 0xAB, 
-0x15, 0x89, 0x34, 0xF6, 0xBD, 0x2A, 0x7A, 0x6C, 0x35, 0x7F, 0x37, 0xA6, 0x67, 0x93, 0x08, 0xAA, 
-0x8E, 0xBF, 0xD0, 0xE4, 0x2A, 0x8B, 0xAA, 0x84, 0xD2, 0x59, 0xCA, 0xCA, 0x91, 0xDB, 0xB8, 0x15, 
-0x2E, 0x60, 0x03, 0x0C, 0x4B, 0x4B, 0x11, 0x02, 0x85, 0x85, 0xD2, 0x47, 0x79, 0xD9, 0x7A, 0xA8, 
-0x9C, 0xA7, 0x74, 0x30, 0x0A, 0x06, 0x8B, 0x61, 0x22, 0xE2, 0x2C, 0x01, 0x5D, 0xC7, 0x11, 0xAB, 
-0x5D, 0x6F, 0x63, 0x4D, 0xD4, 0xBF, 0x2D, 0x2F, 0x12, 0x06, 0x20, 0x0F, 0x43, 0x34, 0x9A, 0x6E, 
-0xAB, 0x4B, 0x5E, 0x96, 0x14, 0x7E, 0x44, 0xAA, 0xD2, 0xE0, 0xF1, 0x38, 0x5F, 0x85, 0x40, 0x59, 
-0x24, 0x5A, 0xF5, 0xAD, 0x2B, 0xF7, 0x4F, 0xB7, 0x5A, 0x77, 0x77, 0x3B, 0xAD, 0x5B, 0xB4, 0xE2, 
-0xBE, 0xB4, 0x9D, 0xDE, 0xFB, 0x9A, 0x57, 0xBE, 0xEC, 0xC1, 0xE7, 0x7D, 0xE3, 0x53, 0x17, 0x7F, 
-0xE4, 0x47, 0x7E, 0xA4, 0xD8, 0x90, 0x62, 0x9F, 0x58, 0xD8, 0x20, 0xDC, 0xAF, 0x11, 0x84, 0x10, 
-0xE4, 0x8D, 0x6F, 0xFC, 0x85, 0x99, 0x07, 0x76, 0xEC, 0xBA, 0xE4, 0xFA, 0xEB, 0x6F, 0x7A, 0x51, 
-0x9E, 0xDB, 0x67, 0x2B, 0x6D, 0x9E, 0x96, 0xDB, 0xE2, 0xE2, 0x96, 0x99, 0xDA, 0x52, 0xB9, 0x90, 
-0xB9, 0x50, 0x1A, 0xAD, 0x5A, 0xCA, 0x05, 0x2F, 0x84, 0x24, 0xA6, 0x99, 0x89, 0xAB, 0x54, 0x91, 
-0x11, 0x89, 0x66, 0x53, 0x84, 0x80, 0x56, 0x71, 0x72, 0xAF, 0xEB, 0xD4, 0x3E, 0x12, 0x97, 0xB8, 
-0xC6, 0x56, 0x12, 0xCE, 0x0D, 0x22, 0x19, 0x23, 0x35, 0x25, 0x35, 0x5B, 0x6D, 0x5E, 0x86, 0xAD, 
-0xD5, 0x08, 0xCD, 0x16, 0x25, 0x5E, 0x20, 0xA6, 0x8A, 0xAF, 0x25, 0xED, 0x78, 0x7E, 0x0C, 0xE5, 
-0x2D, 0x31, 0x77, 0xED, 0x78, 0x5F, 0x83, 0xE6, 0xAC, 0xF8, 0x97, 0x8A, 0x69, 0x89, 0xA2, 0x4D, 
-0x01, 0x81, 0x98, 0x90, 0xD3, 0xD6, 0xEA, 0x85, 0x86, 0x3C, 0xA5, 0x5E, 0xA8, 0x8A, 0xFB, 0x04, 
-0xC6, 0x2A, 0x88, 0xC6, 0x4D, 0x21, 0x25, 0x90, 0xD4, 0x5D, 0x24, 0x3E, 0x81, 0x83, 0xDA, 0x1A, 
-0xC1, 0x93, 0x48, 0x12, 0x17, 0xEB, 0x42, 0x0C, 0x69, 0x48, 0xA8, 0xAD, 0x18, 0x08, 0x28, 0x2C, 
-0x53, 0xAD, 0x16, 0x79, 0x3E, 0x08, 0x01, 0xE7, 0x0B, 0x0A, 0x97, 0x62, 0x4A, 0xD1, 0x7A, 0xBE, 
-0x70, 0xFD, 0x7D, 0xED, 0xAC, 0xBD, 0xCB, 0x52, 0xDD, 0x71, 0xCE, 0xB9, 0xDB, 0xBE, 0xF0, 0xA2, 
-0x2B, 0x2E, 0xFF, 0xF2, 0xF4, 0xF4, 0xEC, 0xD1, 0x77, 0xBD, 0xEB, 0x6D, 0xFD, 0x0D, 0x72, 0x7D, 
-0xE2, 0x63, 0x83, 0x70, 0xBF, 0x06, 0x71, 0xD3, 0x4D, 0x37, 0x25, 0xF7, 0xDD, 0xD7, 0xCB, 0xEE, 
-0xBB, 0xFD, 0xB6, 0xCD, 0xEF, 0x79, 0xDF, 0x87, 0x2E, 0x3A, 0x7C, 0xF0, 0xE8, 0xF9, 0x4B, 0x0B, 
-0x4B, 0xCF, 0x1A, 0xBA, 0xE2, 0x99, 0xED, 0xB4, 0x73, 0xD6, 0xB0, 0xCC, 0xCF, 0x42, 0x65, 0x67, 
-0x81, 0xEE, 0x02, 0x09, 0x88, 0x20, 0x4A, 0xA2, 0x04, 0xAC, 0x89, 0xF6, 0x5A, 0x49, 0xA4, 0xD8, 
-0x10, 0x29, 0x30, 0x26, 0x7E, 0x89, 0x21, 0x19, 0xBD, 0x78, 0xBC, 0x76, 0x04, 0x71, 0x91, 0xA0, 
-0xC7, 0x94, 0xE5, 0xD1, 0x1E, 0x68, 0x6C, 0x5A, 0x43, 0x24, 0xE0, 0x46, 0x22, 0x6D, 0x8E, 0x6B, 
-0xD4, 0x03, 0x93, 0xF1, 0x13, 0x1A, 0x75, 0x41, 0x0C, 0x14, 0x5E, 0x2F, 0xA4, 0x09, 0x48, 0x58, 
-0x4E, 0xF7, 0x3E, 0x29, 0xF5, 0x36, 0x6A, 0x87, 0x65, 0x32, 0x5E, 0xFE, 0x0C, 0xD4, 0xB1, 0x6F, 
-0x54, 0x0C, 0x58, 0x13, 0xAF, 0x1D, 0xCF, 0xF5, 0xB5, 0x59, 0x99, 0x46, 0xE3, 0x83, 0xAF, 0xA9, 
-0x3B, 0xC6, 0x3C, 0x10, 0xDD, 0xE8, 0x78, 0x05, 0x5B, 0x15, 0x20, 0x21, 0x8C, 0x07, 0x94, 0xE0, 
-0x43, 0x9D, 0x7F, 0xCE, 0x0B, 0x55, 0xE1, 0x29, 0xFA, 0x81, 0xEA, 0x50, 0x27, 0x69, 0xEF, 0xAE, 
-0x6C, 0x79, 0xD7, 0xCC, 0xE6, 0xD9, 0x7B, 0x3A, 0xED, 0x74, 0xC7, 0x96, 0x6D, 0xDB, 0xF7, 0x7C, 
-0xFF, 0xF7, 0x7F, 0xCF, 0x81, 0xA7, 0x3D, 0x6D, 0x53, 0x3F, 0xCF, 0xF3, 0x62, 0x23, 0x3D, 0xCD, 
-0xD7, 0x16, 0x36, 0x08, 0x77, 0x03, 0x50, 0x4B, 0xC0, 0x3F, 0xFB, 0xB3, 0xBF, 0xD5, 0x99, 0x9F, 
-0x9F, 0xEF, 0x1C, 0x3A, 0xB4, 0x77, 0xCB, 0x97, 0x6E, 0xBA, 0xED, 0xF2, 0xF9, 0xC3, 0xF3, 0xCF, 
-0x28, 0x9D, 0x3D, 0x4F, 0xE9, 0xE4, 0xEC, 0xDC, 0x56, 0xDB, 0xC0, 0x6C, 0x56, 0x49, 0x36, 0xED, 
-0x2B, 0xBA, 0x31, 0xF7, 0x4B, 0xA6, 0x40, 0x74, 0xF4, 0x00, 0x48, 0x55, 0x6A, 0x32, 0x25, 0x21, 
-0x50, 0x5A, 0x8B, 0xCE, 0x62, 0x2C, 0x08, 0x11, 0xC1, 0x17, 0x05, 0x3A, 0x49, 0xA3, 0xF7, 0x9A, 
-0x8E, 0xB2, 0xAA, 0xB5, 0x16, 0x63, 0xCC, 0xD8, 0x64, 0x2C, 0x96, 0xC1, 0x45, 0x97, 0x58, 0x89, 
-0x94, 0xD7, 0x34, 0xCF, 0x15, 0xEA, 0x03, 0x1F, 0x09, 0x50, 0xE2, 0x0F, 0xD1, 0x25, 0x77, 0xC2, 
-0x5A, 0xC1, 0x7B, 0x8F, 0x0D, 0x35, 0x99, 0xFA, 0x80, 0x4E, 0x52, 0xBC, 0xF7, 0x68, 0xAD, 0xB1, 
-0xE5, 0x08, 0xEA, 0xF0, 0x88, 0x88, 0x1F, 0x47, 0x1C, 0x6B, 0x48, 0xB3, 0xF9, 0x3B, 0xD1, 0x1A, 
-0xE7, 0x0A, 0x5A, 0x49, 0xC2, 0xA8, 0x2A, 0xA9, 0xB0, 0x64, 0xA6, 0xE3, 0x83, 0x04, 0x5F, 0x54, 
-0xCE, 0xA1, 0x54, 0xAD, 0xF4, 0xB6, 0x23, 0x60, 0x51, 0x14, 0x3D, 0x09, 0x76, 0x3E, 0x04, 0x37, 
-0x9F, 0x6A, 0x7D, 0xC0, 0xB4, 0xD4, 0xAE, 0x56, 0x4B, 0xDD, 0x77, 0xDE, 0x79, 0xDB, 0xEE, 0x7C, 
-0xEA, 0x53, 0x9F, 0x79, 0xF4, 0x9C, 0x97, 0x5E, 0xBA, 0xF4, 0x07, 0x3F, 0xFD, 0xD3, 0xC5, 0xF2, 
-0x43, 0x6C, 0xE0, 0x6B, 0x15, 0x1B, 0x84, 0xBB, 0x81, 0x35, 0x71, 0xF5, 0xD5, 0x57, 0x9B, 0xEC, 
-0x60, 0x96, 0x2C, 0x94, 0x0B, 0xC9, 0xE7, 0x6F, 0xFD, 0x7C, 0xEB, 0x9A, 0x9B, 0xBE, 0xBC, 0xB9, 
-0x37, 0xBF, 0xB4, 0xA9, 0x0C, 0x6A, 0xBA, 0xDF, 0xCF, 0xE7, 0x4A, 0xEB, 0xB6, 0x2E, 0xF6, 0xFA, 
-0xDB, 0xF2, 0x91, 0x3D, 0xDB, 0xA8, 0x6C, 0x8B, 0x73, 0x7E, 0xCE, 0x56, 0xC5, 0x0C, 0xA8, 0x4D, 
-0xA9, 0x69, 0xB5, 0x4B, 0x5B, 0xB6, 0xC1, 0x6B, 0xB4, 0x49, 0x04, 0xA3, 0x95, 0x12, 0xED, 0xBD, 
-0x97, 0xA8, 0xFE, 0xB5, 0x64, 0xAD, 0x8E, 0x14, 0x45, 0x8C, 0xE3, 0x80, 0x68, 0x44, 0x89, 0x84, 
-0x3A, 0xE8, 0x8B, 0x52, 0x0A, 0x57, 0x45, 0x7D, 0xEC, 0x24, 0x56, 0x10, 0x6F, 0x68, 0x74, 0xB9, 
-0xCB, 0x81, 0xD4, 0x1B, 0xA9, 0xD6, 0xF9, 0x10, 0xB3, 0x1A, 0xAB, 0x3A, 0x0C, 0x57, 0x55, 0x73, 
-0x9D, 0x56, 0x68, 0xAD, 0xF1, 0xB6, 0x0A, 0x4A, 0x02, 0xDE, 0x5B, 0x14, 0x21, 0x68, 0x05, 0x2A, 
-0x84, 0xE0, 0x7C, 0x15, 0x1C, 0xBE, 0xF2, 0xD8, 0x4A, 0xE1, 0x4A, 0x8D, 0x2E, 0x03, 0x2A, 0x4F, 
-0x74, 0x92, 0xA3, 0xE5, 0xD0, 0xA8, 0x1C, 0x1D, 0x04, 0xD9, 0xB9, 0x65, 0xEB, 0xD6, 0x83, 0xAD, 
-0x76, 0x67, 0xFF, 0xF4, 0x4C, 0xFB, 0xA8, 0xC1, 0xCF, 0x3B, 0x37, 0x58, 0x3A, 0x6F, 0xF3, 0xF9, 
-0xBD, 0x2B, 0x5E, 0xFA, 0x8C, 0xC1, 0xA5, 0x97, 0x3E, 0xB3, 0x3C, 0xF7, 0xDC, 0xB4, 0xEC, 0xF7, 
-0xFB, 0x76, 0x43, 0x7A, 0xDD, 0xC0, 0x6A, 0x6C, 0x10, 0xEE, 0x06, 0x4E, 0x1B, 0x21, 0x04, 0x79, 
-0xEB, 0x5B, 0xDF, 0xDA, 0xDE, 0xB9, 0x73, 0x21, 0x2D, 0xE6, 0x43, 0xB6, 0xE7, 0xC0, 0xDE, 0xCE, 
-0x83, 0x7B, 0xF7, 0x5C, 0x30, 0xE8, 0x8D, 0xB6, 0x15, 0xB6, 0x3C, 0xBB, 0x2C, 0xCA, 0xA9, 0x10, 
-0xC2, 0xAC, 0xA0, 0xA7, 0x0A, 0x57, 0x4E, 0x69, 0x92, 0xAE, 0x52, 0x7A, 0xDA, 0xF9, 0xD0, 0x05, 
-0xA6, 0x1C, 0x7E, 0xCA, 0x28, 0xD3, 0x56, 0x4A, 0xB7, 0x2A, 0x6B, 0x53, 0x11, 0xB4, 0x17, 0x04, 
-0x5F, 0x49, 0x1D, 0xB0, 0xB7, 0xB9, 0x53, 0x54, 0x67, 0x88, 0xAA, 0x03, 0xCA, 0x8A, 0xE0, 0x09, 
-0x48, 0x94, 0x4D, 0x43, 0x1D, 0x70, 0x26, 0x1E, 0x4A, 0xDD, 0xAC, 0xA3, 0x1D, 0x44, 0x4C, 0x6F, 
-0xAB, 0x83, 0x0A, 0xC1, 0x6B, 0x83, 0xB3, 0xB6, 0xAC, 0x02, 0x45, 0xAE, 0xA0, 0xF0, 0x54, 0x7D, 
-0x08, 0x7D, 0x81, 0x45, 0x8D, 0x2C, 0x19, 0xAD, 0x7A, 0x89, 0x31, 0x47, 0x94, 0xD1, 0x87, 0xB4, 
-0x6A, 0x1D, 0x56, 0x5A, 0x8E, 0xE8, 0xAC, 0x75, 0x78, 0x6E, 0x6E, 0xF3, 0xD1, 0xAD, 0x5B, 0x37, 
-0xF7, 0x66, 0x66, 0x66, 0xF2, 0x4B, 0x2E, 0x79, 0xFA, 0xF0, 0xF7, 0x7F, 0xFF, 0xA7, 0x36, 0xE2, 
-0x11, 0x6C, 0xE0, 0xB4, 0xB0, 0x41, 0xB8, 0x1B, 0x38, 0xA3, 0x08, 0x21, 0xA8, 0xF7, 0xBF, 0xFF, 
-0xFD, 0xF2, 0x4C, 0x9E, 0xA9, 0x1F, 0x98, 0x4A, 0xC5, 0xDA, 0x25, 0xFD, 0xC0, 0xCD, 0x37, 0xA8, 
-0xEB, 0x6F, 0xBA, 0x3D, 0x79, 0x70, 0xDF, 0x7D, 0xAD, 0xD2, 0x91, 0xE9, 0x24, 0xCB, 0x86, 0xA3, 
-0xBC, 0x65, 0x9D, 0x74, 0x42, 0x15, 0x5A, 0xBD, 0xBC, 0xD7, 0x29, 0xCB, 0xB2, 0xDD, 0x9E, 0x6A, 
-0xB7, 0x5C, 0x15, 0xB2, 0xBD, 0xFB, 0xF7, 0x74, 0x8D, 0x4A, 0xDB, 0x1E, 0x9B, 0xB8, 0x20, 0x29, 
-0xDE, 0x25, 0x20, 0xCA, 0xE3, 0x05, 0xA5, 0x05, 0x20, 0xF8, 0x10, 0x44, 0xA9, 0x60, 0x50, 0xDE, 
-0xE3, 0x1C, 0x88, 0xD5, 0xA2, 0xAC, 0x52, 0xDA, 0x29, 0x08, 0x89, 0x4A, 0xED, 0xA8, 0x2C, 0x4A, 
-0xEF, 0x5D, 0xB9, 0x65, 0xF3, 0xA6, 0x32, 0x49, 0x4C, 0x91, 0x6A, 0x3D, 0x74, 0x21, 0x14, 0xAD, 
-0x96, 0x19, 0x09, 0x36, 0xCF, 0xA6, 0xBA, 0xA3, 0x6E, 0xA2, 0x46, 0x25, 0x61, 0x98, 0x94, 0xA1, 
-0xE8, 0x6E, 0xDB, 0x54, 0x5C, 0x72, 0xC9, 0x33, 0xAB, 0xCB, 0x2E, 0xDB, 0xEC, 0x5A, 0xAD, 0x97, 
-0xF8, 0xB9, 0xB9, 0xFB, 0xFC, 0xED, 0xB7, 0x7F, 0x6F, 0xD8, 0x88, 0x43, 0xB0, 0x81, 0x33, 0x85, 
-0x0D, 0xC2, 0xDD, 0xC0, 0x63, 0x0E, 0x6F, 0x79, 0xCB, 0x5B, 0x14, 0xA0, 0xCE, 0xDD, 0x77, 0xAE, 
-0xE4, 0x59, 0xAE, 0xE6, 0x37, 0xCF, 0xCB, 0xD2, 0xD2, 0xCC, 0x8A, 0xB6, 0x3A, 0x18, 0x2C, 0x49, 
-0xB7, 0xBB, 0x14, 0x66, 0xE6, 0x67, 0x02, 0xC0, 0xFC, 0xCC, 0xE6, 0x50, 0x14, 0x2D, 0x7F, 0xCE, 
-0x39, 0x7B, 0xC7, 0x92, 0xE7, 0x65, 0x5F, 0xBD, 0x2C, 0x7C, 0xEF, 0xFB, 0xBE, 0xD7, 0x6F, 0x48, 
-0xA3, 0x1B, 0xD8, 0xC0, 0x06, 0x36, 0xB0, 0x81, 0x0D, 0x6C, 0x60, 0x03, 0x1B, 0xD8, 0xC0, 0x06, 
-0x36, 0xB0, 0x81, 0x0D, 0x6C, 0x60, 0x03, 0x1B, 0xD8, 0xC0, 0x06, 0x36, 0xB0, 0x81, 0x0D, 0x6C, 
-0x60, 0x03, 0x1B, 0xD8, 0xC0, 0x06, 0x36, 0xB0, 0x81, 0x0D, 0x6C, 0x60, 0x03, 0x1B, 0xD8, 0xC0, 
-0x06, 0x36, 0xB0, 0x81, 0x0D, 0x6C, 0x60, 0x03, 0x1B, 0xD8, 0xC0, 0x06, 0x36, 0xB0, 0x81, 0x0D, 
-0x6C, 0x60, 0x03, 0x1B, 0xD8, 0xC0, 0x06, 0x36, 0xB0, 0x81, 0x0D, 0x6C, 0x60, 0x03, 0x1B, 0xD8, 
-0xC0, 0x06, 0x36, 0xF0, 0x35, 0x85, 0xFF, 0x1F, 0xA8, 0xBF, 0x4E, 0xFB, 0x38, 0xBD, 0xD8, 0x50, 
-0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82, 
-])
\ No newline at end of file
+# Generated by convert_png_to_bytes.py from assets/banner/mau-logo-alpha.png, do not edit.
+import binascii
+from functools import lru_cache
+
+_ICON_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAVwAAAE6CAYAAABau+prAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAEnQA"
+    "ABJ0Ad5mH3gAAAGHaVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8P3hwYWNrZXQgYmVnaW49J++7vycgaWQ9J1c1TTBNcENlaGlI"
+    "enJlU3pOVGN6a2M5ZCc/Pg0KPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyI+PHJkZjpSREYgeG1sbnM6cmRmPSJo"
+    "dHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj48cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0idXVp"
+    "ZDpmYWY1YmRkNS1iYTNkLTExZGEtYWQzMS1kMzNkNzUxODJmMWIiIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vdGlm"
+    "Zi8xLjAvIj48dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPjwvcmRmOkRlc2NyaXB0aW9uPjwvcmRmOlJERj48"
+    "L3g6eG1wbWV0YT4NCjw/eHBhY2tldCBlbmQ9J3cnPz4slJgLAAD+EklEQVR4Xuy9d5hlR3nu+6uw1tqh0/RETdAo5ywkIaJETjZZ"
+    "YLKJxjbYGGcfH4F9je1rH8frAOfYHIwDFrYxJpgsRBKgrBlpJE2OPdO5d1yhqr77R+2eGY0kQIDRSO63n3p277TWXrWq3vrqi7CE"
+    "JSxhCUtYwhKWsIQlLGEJS1jCEpawhCUsYQlLWMISlrCEJSxhCUtYwhKWsIQlLGEJS1jCEpawhCUsYQlLWMISlrCEJSxhCUtYwhKW"
+    "sIQlLGEJS1jCEpawhCUsYQlLWMLDhDr2hcc63v/+9ycHDuT1iYnZVA+jmwyR55XXuqjGx8/N3/vea8pjv7OEJSzh4eNP//RPsx23"
+    "ztZlNM28L01R9HVZVjI0NOKzjHL9+pH+u9/97v6x33ss4zFPuNddJ+arX33f+Kc//dnztNZnHDwweWG/X6xJsmxZWZSJD1VQWpdp"
+    "krZtag+ddNKJW3zl9jSbzf0/9VM/ufu000YWrr766vzY4y5hCUs4guuuu87ceuuhsS9+8fMn94pqY7fVW7swN3+WTZK1C63WsrLs"
+    "1LKsaZ0rRcQXWqt5YHLjxg23efzupz7pqjuf//zXHrjmmvMe0wLPY5pwr79+Z+0XfuEdT9y5fc8rirJ6Wj/PV6e2kVUuGCEosMpo"
+    "I8YYyqovULrENsrKVf1aVjtYueKeer1269lnn/6Zq6563PY/+INfaR97jiUs4b8z3v/+m5M77/ziyrvuuuf02dmFl+/YsevxvW5/"
+    "Y2LSWuH6aS2pGxF05SqlNbhQYZSSNLNSFHlQitKHYn64OXZTs9H8t2c/77n/8aEPvXf+2PM8VvCYJFwR0S987hvPun3z9tcePDj9"
+    "ihDCBh+USUxdOS8YY9HKIqJw3qFM7AZjFCJCCAERJSJCmunCVfl+a8Mda9aOfyFL1J2/9ms/d1ezWbWvueYaf+y5l7CExzr++Z+/"
+    "Uf/0pz+x8c47775s5869F3mvn0EwJ7S7vXHQutEYVa44Iqg6X6K1Jk0TQnCUVU6QnDRpIOIJIUijWQvdbmc2y2qfO+OME//uN37j"
+    "9778WJR2H3OEKyLqda/8+bP+83Pf/JXpufaLMlsfcc4prSy1Wo1Ov0tiUyQoRCu89yilkOBJbUrhKhKd4EWT1Wu4siSIkxAKb7Tr"
+    "el/uXjbe/Nqy4frnn/OC5331//v/fm1OKRWO/R1LWMJjDdde+8Ha3kPbN97+7bt+bP+eg8+amp6/sJYNDZeV1LQkqhTP6NAo7W4X"
+    "VMBajXMOUUAQREo0Bq0VWmtCCDgJGGuR4FBKJLUmL4r2HY+//Ozf/p3f+/nPXX311e7Y3/FoxmOKcEVEP/e5b7/w29/adO3sXPVs"
+    "SGs1awi+RGuofI4xQsCjlOARlDJordHeIE7QaLRJKEQjSmF0Ami89xil0Tic7/tAb6FZs7cMDdmvPP5Jj/vcS1/6pHte85rXtJVS"
+    "cuzvWsISHq24/vrr7Ze//K01H/mXz1wxM9u/emE+f5q45CQj9bo4FecGnqG0RulLhIALBaQBLw4JAbQCAYLCBNBKgRgqgaRWpxJQ"
+    "AkYJlCVGB1/4hW3r1qz4nTe/7V3//FgyZD+mCPdlL3vXui987sZr51vFa9JkVc2YRBV5m0CX4XpGWcxTSY6oCptoggr4EMCDUSk1"
+    "U0OJxnkIOsFjUcoSvCYEhTUpShm8y9FSkqa4fjmTK9y969atvH7jySf8y9Of/vQt73nPO5eIdwmPaoiIfs97/mjsy1/79hPu3bLz"
+    "Jzqd4kmdVrEKhrLENlTwlsymaK0pixwo8ZSAA13i6WNSjbYKCQ4jgUQUpvS4UNJIltGrHN5kBFsniAWxWNEoDWIKn/enb33KFU/6"
+    "jRve/cEvqWvUY0J995gh3P94/3803vybv/0/5mbcW5HG8ipYNJpaCqJyqmqeoRHDZZdfwOq1y9h40jrSegJaURQFvU6P+bkWe3ft"
+    "Ze/eA8zP9lloF5QVGFsjSELwBtBo0YirsFqoJ5Z+3kLh81qaHUgS+7XVq5d/6OWvfcHN733vz7WO/Z1LWMLxjOuuu87ccsuOdR/5"
+    "yCeecfDg7AuKonq8wqxKVcNoleCCJmAwKgWjcaFCaQeqQusKbTyNmmL16lFO2riak05czfhInZFM0QBCp013ocW9d29n36FZ9ky2"
+    "6YaMvgzhzRje1+iVbZSBxEqFK288/7yTf+nm2z9202NBiHlMEO7NN9+cvOlN73n+nXfe96ciQ+vTZFgHr/GhQJGTZp5160d4wpMu"
+    "5HWvfRmnnLEeVEVW02hrCMHhBPJ+yeTkFJOHZrnv7t3c9O3buePOe5ib75HnUOQBJCG1daQMFFWXlDoahceTmlSc9yVU946Np58/"
+    "58JT/+2SSx53xx/+4S/2HguDZQmPXUSJ9v+M3XjjV55w4423vq5fmKtcpZdp0daiUCgyk+GCoLSmLw60J1CQNROszhlf1uSkDas4"
+    "5/SNXP3EyzjtpFWcunEVY3WBsg29BarZWbqzC2y+4y527p/ilrt2s2XPPHft6dEOY4hdQ+4VXpVYi1gVekaVf/++//mu33jHr79+"
+    "5tjf/WjDY4Jw3/nO3zr9Ax/4x/9VudrzNcPamBTnCtLEo3TBpZefyU/91Kt58pMvYPXqIUT1sNrjJcc5R1AebRJQBgc4L7jcMDWx"
+    "wN59k2y5extf/9rN3PLtTRw8MIc4gwoJia1FdYMYlKnRrzxBHEZbCK0yUX7nsvHhT1/1tCf+208846pbf/xtP9479rcvYQmPJERE"
+    "/dmf/f3w+9//d8+amJj58YWF3tO0qa1xlTFgGK2P0u7PMWoa5L6DNpYi5DhdkTQ14yvqXHLxWTz+cedy5eMu4PQT17B+5RhWekAP"
+    "ihmY3k13Zh/l3CFcp0XoFeA12jRZKFJ2THn+/cv38bU7ptjTrhPMOJIqOv0FDBaT+N2rVme/9Zu/+ecfftvbHlcdew2PJjzqCff9"
+    "739/8lu/9cGfPTTV+XVortA0qaoKa0ucm+fc807hda9/EW94w4tYsTzDlVNo6aN1AaFCoSCxoBWVCJUIqIRMDQMJQSwL8z127jjA"
+    "Ld/exJe+8HVu/uYdzM/1KSuNkOHEUnoFZJAOgXgSX6JCERz93Ch2rVu38kNnnHP6v/3RH71rz3nnPfbcXZbw6IKIqFtuOVD/zd/8"
+    "rYtvvvmOl+d9/+J2p7cGkgSdqCwdwlcOI0IR2tTRCAVBV+haoDZsedJVj+NZz7ySKy4+i9PWr2B8JIN+Czoz0G9RzexjfnIrvbkD"
+    "SH8GXfUwzqFdoG5rKGqobAV9s4KvbJrhM9+e4Is3H2KeEXJSVFLHJBnd3lQFnZtf8pJnvv7f/u39W4+9lkcTHvWE+6xnvf6sL3zh"
+    "6x8OwV4Cw1qpBjaBIDOsWdPgXe96C6997QtZtcJS9A6SqA46EygLCGW0nioTu0I8GAMmpXIKVILSGYglSEaRB/bvm2bHjgPcesvd"
+    "XPfRT7B9x35cqFE6g22M4UmQXkViUirXZ6Q+TFF2RajmmsPZnWOjzf+48omXffwf/uF3dy6pGZbwSGDz5s3pX/7lv59z3XWffGVZ"
+    "+Oe12v1TIa3XGyOqLF30RfclGg+UjIzUWWhNMjRiOfHk1Vz9rMfz5Kc+jtNOXs3Ja8doqpw0dKA9S5idpJg9xOzuHfjeNC6fwUqf"
+    "xDhSpVBBgQ/UtcUVAZ0MURvbyGxYzaZ9gb/4p69z8/Y2PbucBZdRAbV6Jnn/QH/lCaP/z//6/Xf+2ete97rusdf0aMGjmnD/+Z+/"
+    "UX/rT739He354jdFNYaSZBjvopEMPc1zn30F733vu7nwgpORapJEFsC3oOxBrwMhgA8QAGshSSFLIE1BZ+ABZcGkeCxBpQSV4UPC"
+    "1HSP67/4DW65ZQvXX/9Ntu6YQJsmec+TZCOEypLYGnmRkyYJNtHS680LhPnl42M3rVw19v6f+Zl3fOVnf/YZs0vEu4QfBa6//nr7"
+    "mY/dsfZjn/n88ycnZ1/faZXnBUw9TWu6rDzBR59YhQfpYqzDhxylC047Yz1PfuolPOUpl3DZZWezajyjbgoyejBzAFpTzO7eSm9q"
+    "Aj8/R+JyalQYnaMkBxVQSqElQ4vGhkBiLARFzyX4oZPpJuv5y4/cwPV3znL3rKUyq6l0Rl71UAmCan374vM2/tytt37+W8de26MF"
+    "j2rCffObf/WMv/u7T/xFWfJ0Y4aUDxqtNeguJ5/a5Fd/5U1c89Jn0Uh6WOZB2jC5i7k9O3Bzc4S8RCqHVhadZug0IxtqkDYa2GYT"
+    "NTQCzWHIapAkiK1R6oQqJEANkTq9duC2W+7hm1+7g0987DNMHJjl0FyXWn01vX5Brb4caxM67R6gUUqhtPPBl/uGG9knL7r0zL97"
+    "zWsuv+1tb3vbo1o3tYTjG9de+7/H//Zv//EZ3bZ72fx896lG11cotMZYyqrAGkOSWPp5B2MrkqRPreE5/YwTedozruSpV1/Omaet"
+    "ZdkI1E1BLXQgn6M8uI/5XffSm9iD6s/T8A7rK2oojDiUKgCHV5rImglKNNo5UqvAFZDU6alRunY19x6Cf/zcXXzqlmnanEBf1cnR"
+    "oB1IZ37FiuRPPvr2P/+dq9/76AyIMMe+8GjBtdeKvvHGv37+7t0Tr7G62bTaKh8qjBFsWvL8513Oy1/6dNavqmPcPPhZ8l13ceje"
+    "O/AzBygnD+Jb09BpQXcB15mnmDtEb3qCzvR+2hMHqOan0L0FjOuhJEdJhdUOYx2aEq08zVrK+hNWcfF553DqyRtZNtKkKkraRR9R"
+    "lrLKKfo9bFojTZu4yoFKtVbpaAjhgl27dl7+rW/e3Xj5Na+ffvvb/6j9yU9+YClqbQk/NHz2s59t7tqVP+HTn/jyu6enuz/T74fL"
+    "UjsypMRqFwKptVijCD5HpI+1juYQrN1Q55pXPouf+/k38YLnP5HTThlnxXCgobrYfBZm99HdcTfTW26nv3cn9f4CQ1LRlIoansQL"
+    "JgQ0AQUYEhADkmLEorxgtIpqPQ2CxmQpJk0ogububQfpVYoKQ8BEVR8+yXvt0XJt+blNm26eO/ZaHw141BLulVdm45/6xFd+uaz8"
+    "hdbUTfCCUKEoGBtV/PTbX85VTz4fI23IZ2ByJ1P33UZ7z32k/Xnqrk/d59QpaRhHjRzruiSuhS076F4b35qjN32Q+cn9tKYOUHZm"
+    "MVWfFI/BY1WAssBqYWisySmnbeSCi87jiidcQXN0mJnZKSYnD6CtJktrKKUIogGFNVYFH6zAGl+FKzbfeee5N9/0Jf+mV7zpwDdv"
+    "u+G/Vcq6JfzX4DWveddpf/Zn//jazZu3/TJSv8ro2vLKo10IKlEWowSRClQfYwvSrOK8c0/kmlc8m3f/8pt43nOv5LRTVpPRxpRz"
+    "pK4Fc/vJd93HzF230du5AzUzyZh4RqwmCRWhKsAHjE5QaBQasIOWoCXBiEJ5j7YGQgUKKhU1xiZNSbJhNm/dy9RCjz4aIUVMAkpr"
+    "8e3h+ZnZnd/4my/c+Zcf/ctHXTDEo5Jwr7vuOvPhD//n03btPvA2y/CoEoOTAq092uZceukpvOH1z+OE5RZ6k9A6yOTdN+Gm9jAS"
+    "crKiQ+oKEleQ+AobKozPUSHHSkEmjjQItiyg7KH6Xcr2AvnsDP3ZGXozk0ivS4ZHG43WiqrfJkk1Q8N11q5fxdlnn8HoaJ0s0/iq"
+    "z8zUJEXex1qLdwU+eKzV+OCVhFCrQnlqr5dftXXH9vWXXfqUqd/+nT+a+9jH/n5JzbCEh433/fmHlh/am1990zfveu/MdOs1gjnR"
+    "mnpalYF62qCWpXiXU4QFND3qDc+6tUM85zlX8pa3vJIff+FTOfmkMeppgfVt6irHhjZM7aGz9S4Wtm8hTE6Q9hYYksCwVhjv8GWO"
+    "UpBlNcRHwUK0BuL/CoUSg5KACiHaqsUjGrwyFC4a7FRS4+BMj/2HWrScEKjjlEEAgkuKfrd35qVn3PDpz3+8c+y1H+94VBLua1/7"
+    "2vrfvP9fXo9Ln2ZUzcTY7BJlSsaWGV796ufw9KecTZ05aE1STmzn0N23MuK6LMORFD3qWpMowWiNVqAJWPFYHIkIynkSEWpKUVea"
+    "zDt0L0e128hCh/7kJNX8AtLtkmowKkBmENclSMlwM+PySy7giY+/lBNPXIPRgbnZQ3Q6CySpwSbgfYWIJ0lTpbTRIYRGN++edWhy"
+    "4bKvf/Oby57z7Ffcd9ddX+++973vPbYLlrCEB+C668SsXVvb+Ge//1e/tG//7NuNbj5Oqaye2LoKIeBCHyWevJxHSY9GPbBipeU5"
+    "z3k8v/LLb+ZVr34+Z5+1lhXLNanqkJk+lj50pqi2383Upltp79pK0ppjDE8tRGEF7wg40KCMRWmDiAIFQcVEqKIVIGgRFALiUBo8"
+    "ATEWZSwhCOIFazJUbYR9kwtMzPapyChVBt6TWK3EO7Vz6323T83v3X5sHxzveFQSrus1z920edvPpUlzfeVQ0fJXAh3OOnsDb33z"
+    "SzhjQxPl5ykndjC782781D7GlSPNexhXQZDYBGTwf/ABnAMP1qQYrdABtA9oF8hEqA0a/Zze3CwLU5P05mfot+apKYfBY+op2oAK"
+    "JcNNy9lnncZ5553NmhNW4XzB/v17qMqcgMckJmYkC4GsNqRCSFJtsxPmZ+eesGf3/ov+8i8/XPzu735oz6c+9X+rJeJdwoNBRPRJ"
+    "J101+j//51tf8Y2v3vyeqrIvtmbkhH7pTGIytNbkVZ8stRhTIfQZGhYuv+Js3vKWa3jzm1/KWWevJUsLkjRH+Xk0fcjn4eAe5u+5"
+    "k4WdW9ALkwxVfWpVD+NyEiVYC0oLSi9Ks+CcwygNCEEHghIEDwS0CBBQViMITglegVIWgqB9hVIJ9ZGVHGqV3LtrinZI8KpBUDqq"
+    "QYJrNrNs9p2/+DtfveGGjz+qjGePOsK99tpr9ZdvuPUFszOdlymyuhejFIIip1YPPPf5T+JFL3gSw40+dPYzce+d9Cd2M+L71KsC"
+    "430kWmz0v1UJSicoLEpbNAlKJZQSEKVBG5RSWG2wSmODoMqKpjVkCprGQN6nPztHf2qSzsEDFHPTWKNxocRm0RiwrJlxzjlncMFF"
+    "57N6zUompw7S6nTwISBobJIBCc5VeBdUlo3Zfj8/sdPuXP6tG786/o0bbp+8Z+u3p5ZIdwlH49Of/nT20z/9O4/70N/+w7vnZ/O3"
+    "dvLiHGuGUyTFqJTKVXhfkSYaF3oE6fLEJ1/M69/wYt70lmu4+qqLGRmFLC2pNTwmqVBVC/pzcGg/CzvuZWHXfejZKYZCzhAlieRY"
+    "HVDGIzpQiacMFUEC2sS8t+JLRFUE5QnKIwTQghZiajCtcAJe2+id6T06BNLo14lLmxSqwabtU0z3oFJNsCkqVCiC7ncWkgvOOf1T"
+    "N958/aMqX8mjjnBf9dxXjXz8Uzf8XF6YS5ykWquUgMOqPmtW13nFq1/A5ZeejFUzVAfvY3rL7dR784yFgMpzTK0GVTWweoJ4jfcB"
+    "7wMhCEEUXkCpSLQhBJz3UQtlDcooDHFbZIMjsxaqAl2VKNfHd+Ypey3m5yeh7CGdBdKyj0lS6lnK+tWrOPesMznt9FMoi5x2e55W"
+    "u00ICu8FxJKlTcqyICExQ43RZXPtucdN7D102f/98Mf3/9Iv/eLUF77wyeLYflnCfy+IiL7pK1tP/MDf/NtP3r1lz3v6vfCMKqTj"
+    "UDPaZPgA1kAIBSZxQJszTlvNC3/8afzk61/Mi1/8DDasG8GYnFrqMNLFdWYwZRd6C/id9zG/dTMLu7eS9hcYUR5b9aHooZVHaYeX"
+    "kkpiboWYSU+BCOIckVmJuXBVQCFoPEo8ghCCxytBG4sIBF+RKiERAaPJxWDr42zaeoCJmR6F1BBTw3nQKC2EbM+ePfd88Yb/uOcD"
+    "H3j0ePY86gi3Khrn7tg+/ebAyAmeWnQZ0Q4t8zzuwlP4iTe8gHVrU2RuB62dm+DANpZXBbpdkJka6ATRoGqast9FB8Fog/M5QQd0"
+    "YpEgGHS0phqFtgqsgHIo8TDIN66UQYLHKjBasJRY+uiqTWjNkB/cx8KePczu2kOYm6eJgiSl2axx5ikncvGlF7B8+TidbovWfIuq"
+    "qFBiSJRBK4exClcIAZt4XzuhNV9e9tUb71z7olf85D3v+R9f7nz0o+9dCpj4b4gPfvD62s+87RevvvFbd/5qux1eLTQ3BGoWSdC1"
+    "Js57UBVpTajcLKvX1Hjec67g59/5Wl77E8/lvHPWUU8rNDlalZjQR4UKExxh/x5m77yN1pZbSRcO0vBt6qEk84EEsFqDEoQSFGil"
+    "0WJRwaJFR2FEgbY18sqjlUZ5T2YUUpYkFlCe6MKpcUWJGUwvJKCtinmqdcxM1ul7tu+epBdSKskIpATReFyilRy67IonfOVjH/uH"
+    "R40A8qgi3JtvluSDf/0XL55d6L9YGKqJrQEeVM6w6fHCF13F1c++lGbSQab30N6+GTN7gKwsqCVDlGJY8BCaTfKyIqs3MUmKdw7R"
+    "DmM1goYAVnSM9tVxCyQalAqgJOZfEImBDCggYFRAqxItJYmUDFmFynuEdodybo7pffuZ3rsPum2aWqETxfK1K7nwnLM4//xzSZKU"
+    "udlpfFlRVH0qnxOEqM+ywxRBtIhZAeb8LZvvPnvLlk+1/+yXf2vvv3zuXx5VOqwlfP8QETU11V3z53/+16+5577t1yqaV1rTGHYe"
+    "1WgOoYzC5R1s3eDLGUZGFOeffxJv/MkX86bXv5jHXXoaWa1EVA+TlIh0SLRDUUJrGtmzg/lt99Lbu5WhskXNdUhcHxMqzCBJeDR7"
+    "eNCDSg7YAY1YlKgYpaagrDzaGGrWEpxHoQmicVh6lULXRhA7hFMJxSDtKVqB8oiKE090Rk6NXRMLTCx4nG7iyFA6JU1TbVRZ7dy6"
+    "5Rv7D247dGxfHa94VBHuk598xdAnPv6F1xW5vtyRamMMIeTYpODE9UO86Y0v4fzz16M6B+nes4Xe3h006FNUJWp4nLK5jDnTxNVG"
+    "0dkI7X5OnucoIyjjcd6hxZKldfAhGgKUxIA8pRClUOjItQOylYHJTgZ6KkV0efFViaocTWMZqWUkZcn8oQPsvXcL9911B6HXoaYE"
+    "qzUnnbyRpzzpSs4+5zSULtm5dyuFBmxC8NEg0cjqOFcoxKVof/LBqf2P/9xNX135yhe9Yv/tm741+973Lkm7j2V88IMfrL3jXb9/"
+    "6b9/7IvvyXPz2lq67ETx2opED5miXEB8D9F9alnFhhNHeO3rfoyf/anX8txnPZG1a4ZA9/G6wNaFvGqRqgKtcpg7RLHtbqa3bqJ3"
+    "aDemt0AtlBhfIjgUsUqDIuoIREf2DUohGASLYIg8GXeARikInqqqotohbeJ0HZcsQ+qr6ZpxZosaVbYCnzSpgkZrQ2oMBMEFCKaO"
+    "aqxm/1zFlj3zFNLAqRSUJriSEMr62Ehz08GpHXc+WmwbjyrCHR5ed9rdm3e/vaz0Wk+iFArRFfWG56lPPo9rXnY1K8YEZvYxs+k2"
+    "mDlEo6bxNuVgnrB9znHPwZIt+zu0S0slNYZGxzCpJS96JNZQsw06C22SNEFUiFyrJfoAEs1zMSJaD1Z4GZByiNZXAY1QMwYTHHiH"
+    "CgVZAkMphLJPd3aafdu3MbN3H9Lt09CKhlWctnED5555EqtWjrGw0GHi0EGMCIinLAtCtPQqNFaUH897nYvu3r79tI/+6ycn//D/"
+    "fc/kxz72sSW/3ccgfvd3/3LZ7/7+B1+3Zcu+X1U0n+ZcGK2c02law/sCrQq09NC6x/iY5YrLzuQNb3wRL3/ps7novFMxJqesFmKE"
+    "ZFpSVS1qtsJWXZjaR+u+TcxuvYswO8FQyGlQYnyM8VLKR5fHgdCBUgTUYOzHGLLY4nwQ5VB4gq9QRhOUIZg6LhmhxygzRYOpfIi7"
+    "9hXcezBn50zOoVZBVm+Q2AQpejD4rjMW6suY6xvu3HaQdqkRXceFGDjkfGFdmc/3ivClG2749KMiA9+jhnBFRL3v9z9w9d49s68O"
+    "kjSMrqlAQHSPkTF4zWuew1VPOpvEzeIPbqPafR+2vwCJoauG+NQ3d/CRz93Dp27cy5du2seNt+1g31QHbxKyZpN6PcGIR5eezGjQ"
+    "AVGRTJVSA8IdOHMPBlwccwHwKBHUYNuFCFW3T2Ki6gDjsBnU64ZGqmlohcwt0J+YZOqerey5czPdiQnotxnJFE+58gqe+PgrSZVi"
+    "bvoQs7OT6MxgUoNojYggolSS1FNXyimHJqavvP76W4fe/vZf2n7jjZ/tPFpW+yV8Z1x3nZi9e++47N///Uu/sDDvf9pXnKbVaJJl"
+    "IwoxaOVxvkMtdSRZzplnrObV1zyXd/zca7nqqksYH7cU5TzGFNSGUqCLhB41XWKkwu/fwezdd9LafjdmfpIRXdGgRJU9rFIYJdFA"
+    "trjLWxQ0AKX0wMtnoFJQREOZdrGAZPS6JZcEn47ha6uZzJt8Y9MkH//yffzLlzbzjbsn+eIt29h0317GxsZYsWyEkdTQrBtQDmyC"
+    "sw0K3eDendMcmO+AGcVJrLhdr9VMt9tO1q854fN33vX16WP773jEo4Zw62vPHf3yZ298y8J8caXSDRMZr0LosmHDCG9+849z+unL"
+    "YW4vvV130dtzHzWj6YWUeycc//G1ndyxyzPrxui4EeZLzdSCY++hWbAJa9euJRHw7S7NRj06chPQekCkA+ezOODUgFkDSgUGmt/B"
+    "lgsUCpumsfy68jiJelnnSmrWMN5osLw+RDW/wLBOUN2cmb17yKen0f0OdWB5c4Srrng8K8ebdFqztDsLdLttjNaUZUGmMlQwSlRi"
+    "JDBeei64/fa7Tvj0p76y52Mf++DMo8lyu4QH4tpr/7+hf/+XP7nqpm9v+a1Or3peCNmyWm2lriqHCGhdUVazCD1GRoXzzzuRt7zl"
+    "Gt74xpezfv0YSVqiE4exHmsDioKq1yKTEuVy2Lmdufvuprd7G7VeiyEctVChgkOLYIgCLSoSqAhIgKCiVKuUOUzBAxFk8FkfPXis"
+    "Ja+gsEO42hruO+j4yh37+eyNu7hx2yFafgWHioxWSJjr5/TbHZqZ5YwNq5GigzElYhRB1ZFklD2HOmzfPU1FA1EpJqkRAipLrZ08"
+    "tHfTv3/iw3d/6EMfOu7H/KOCcEVE/dxbf/OinTsOvtWFbK2IUSKCVQFl+zzlqefzkpc+lfGhkrD/Plq7tpDkc6RZkz3zlv+4YSfX"
+    "3zHPjKyklLX0GMKpETqVZd9Cm127JnGFY+2K1ZwwOgZVD6UDSge0RJeWOLAUIa7vBCUoJYPkHPEz8ROGgMKL4CTgUWhjsEZjlcYo"
+    "MEqTaM1oc5hENK7bZ1SnZL2SuXt2MHHXPbT274demwvPOZ3nPvMqCI6t994LhaeuM4wkhABVEOr1EVWVVd2V+dnz7e7Fn/3sN8wr"
+    "3vLmHTd99QvFkrT76MJ1111nVq68+NQPfvCff23LPbvf6Xx6YSMbTzWZ8h5EAqn1hNCmVvecffYJvOktL+OXf+1nuOyyM2nUIUk9"
+    "VdlCqYoqlHR6LazypKmFXpdy82bm7roTJg5Q67cZVWBxBB935SZJEFFRsh3YJqIzl8JE/53D80EpjyK2mIIxpjcoK4+zQ1SNdeye"
+    "T/joFzbziRvuY9u8R8xG2mqcjtQxjZU4b5icm6JqzXHhmSeR2ZIsKRFxKNsEM8RCrtkzscBCT+MkBZtRlH28qxJrZfdzn//Sr/zT"
+    "P33guFepPSoI9z3veY+59r1//qxuT14KWVMpCxJIE6FWL3nxS67iKU89h4afJ991D8Xkbmyo6JSaeyc0n/7GPvZ0xvBsoCDewGDr"
+    "FGJI02V0c8eBPROMD41y+kkbMDpaYZWqBqGIUTerBn6FMqj6LGpA+kpQ0eFwIAFHGtY2xWgDAjootIoeEN57jDUktRq4QChKVF6S"
+    "ORiVhKzylJ0WsxN76M5NM5xq1o6Ps3HVSvpTc8zOHUSLUKdGQCicR7RSyqZJ0eusXWj1Hrd7636/edOufXfcccP8sf25hOMT1123"
+    "OX3fb/3FE794/Td+udX214iqr6lnozovCoVAZjUutFDSodn0PPmpF/La1/84z33ekzhx4zjGlqR1KIoWmQUljqymqSca40uYnIB9"
+    "u5m7ezNMHaCedxjCY8UhoQKlUdrgfUAv7uKUj3YKBJTCKINSOnokqIAWHz8zIF5R4JVF0gZFspy9C3VuuGOKT351G/uLBo7VzEtG"
+    "V2rYdJy8UvggjBiNL9uctnElp528kpru4asck9YRU6eUGvsn2xyY6VNIhie6iFmtFCpMr1s+/KWvfvNz7WP79HiDOvaF4xGbN29O"
+    "n/q0t7xnZrp8N9JMbdZAu4oQ5jnrnGX81m+/lR97wfnYufto3Xw9vV1bUL6itCv44Cd2ct0Xd3GoWE2HEQIxeqyUiiRLcGVBXfUZ"
+    "8pOc0cx51dPO5seeeDJNdYDUT9O0Qui30YkFLzhl8UojVkeVw6AEtAkxSUcgiQqGga8uoqP2YfB8kayD0uhg0NKgbAmzezt0JnPq"
+    "YYhafYQujlYQOtpQJnVqy0+gvmID9+ya4lPXf5tt0x0mCHSoU2UNOj6a1Kw2uMoLIi2Tcsd555/66z/91tfc9rbjpJ7atddeq889"
+    "9+VWpGWUKkxR9HWaanvw4IL5h3/4YCZSa1RVVbekqQTJipAbEa1FRIlUg+UuwgGJ0kEliQAorwNQqtSWoahcrZYVVVUVr3nNa/vr"
+    "1q10jQZOqcRrXfPWjvhvfev06r3vXbxRjxxERD/nOT914q03b7pmfq54WxXMemXSVHwgSTIyq+j150gJMdHMhmW88S0v41nPewKn"
+    "nLYGL62oXgs5mkCqQVc5Md1LiCkQp2eYumcznW33Mdxv03R9apIPJFNH0OAlhicA6BBfR1UEteh5aNEhQYnFqAR8gfN97FCK+JJ+"
+    "5ag3RuiLpTQj9JK1/MPntvJPn9nCgWKMSq2kIiUXg1BHdILHYKXNqJpmVPbwkqtO5A3PP491yX7S0MZky2mHMWbDav7ps1v4h8/e"
+    "x2xYTTuM4XRKCH2pJ277+eec8NZv3/Ef19+vY49DPCoI93d+53+vft/vvv//dLvy3Kyx0hTdDloFarU+z372hfyP33g9l1y4DLf/"
+    "dha+/RWKQ/tIG3X2zmX88T9t4nO3ztNiLRVDg9XaY01C4R2gscoxLG3GmOHyU5u8+KmncvXFYzSqA9j+HDUboOrFPAu1BkUQxNj7"
+    "Ea6SSLgi2cCgNvBaCPZwN0cjXCCo6OBdlo5EN0l8jd6UZ+FAF9cG4xOUMgRtyEXRcUJlUnRtjJwGM07zjS27uHX/FNurPh2a5LZB"
+    "qVMEg/MWwYj37arRSL+1bFn24d/93V//x9e97tk/ktIk1157bTo/T6MoSEWSpN+fr3mfZLOzhxr33rtzRCSs1ZiNaVZb1mn3a0Xe"
+    "r2tta/OtVqNZb9T7RV5XOqkFX9VBLAolErQHhRflg0cvlslQ2ltrBRQuBLEqqTDalf3c14caZa81XzRHRheKvNfJsrTXaNZylG9p"
+    "FQ4mSbr9vLPPnll94op20zb6dlTnqlcWWo8Uf/zH7/6RpMi89lrRmza944wvfP7GX2i3yx+HxspabVjnPpAkCWVvBo2jmQqNmuOy"
+    "y8/imlc+l6c96wpWrh3ChTZl1aVWtygVCK5EVSU1HRPE0Osgk5Ms7N5JZ+8O7PwMI1KSuC7JwE4BELTGi4o5awHBRcIdEDKAFo0S"
+    "iwoGjQUq0CVBVYjWBJVRhYzCDNOrr+Qrm6b5ty/t45Ydjjm/ij4N/KJKbuBKJiQYCoaZo8kBnnzRKK9/3plccWJJvZrGB0NIVtJm"
+    "JZ+75RB//a+3srM9Qt+cQLvUGA21LLTGhqr3vfmn3/3H733vNce1t8KjgnCf82NvfvxnP/3N60TqG6wdwZV9IGd0zPNzP/dy3vlT"
+    "L2T5cJti+7fp3vltQmueZGicb9wzz29/6FvcfsBQ2vV4hsk8scijyiilogI0JSNWEHeQYTXH0y9azRtfcD7nrgLd2suYLaFcAKmg"
+    "Vsc5ossKYL07rHKIEm5GUPGYMSuSAbEDf10hqIAoh1aBqqpITYY1Q0gvoTPrmJvs0pvKGfY1Mp1RCQRtMElK3yuKoKE5yhx1tkwv"
+    "8M3dh7jz4DwTQdE3I5S6Qe4NxjTJXQ7S88ZWLZMW/3D+uWf89S/90mvvueaaa36gPKIiov7v//1y5v1CsnfvoWzTpjuaW7fuPrEs"
+    "O2uKQta22+1Tirw4s9cvV4gwLuIyrWvWaGsqV9rEZrZyLklM3YaA8hJQGIYaQ/R6OZ6KuH8YCJ+xc+MuIUi0TKJA6RiZEq07g9Fs"
+    "UNoiTjBpEp3uB8lTxFeYxIoPpWhwwbcdWAfOQyi0TWbSLDvQaKQ7a1m63ahwyCuZrdXS+bPOu3Dv0594cXv9+nP7Su0rf9A+BHj3"
+    "u/+g+c///K8v2rdv4pdq2YqzxacJkqjSB8QoCBVaF9RMztpVDV71yufxMz/7GlasalCGFiZzFK6DNoJRgeAqrDYkJkDRhrwLBw4y"
+    "c/dmOnt30ww5DVMRqg5GexQOg4oVGMQQ03rZwR4iELSLAoqKdorofhsJV4UBodcDVZkjSYrJxujkdXxjLZumSv7m49/ma3f0abOB"
+    "HivpY1GUKO1RQQaEWyMhkDBPxiFOX+t55bNO4eWXjTHOLEWvSza0gnZYxuYDnj/8+29y625hnhMo9SiKgA8LvmmLT77jF9/5k7/3"
+    "ez99XCcmP+4J9+abb05e9apffuvW+w79gdLD9RAsxoIyHVatVPzhH7yLlz73YtLqAJ27vk7Ycy/S61Mky/jEjbv4/Y/czt5iOblZ"
+    "Ca5G6i1WovHLoPEGnM/JjIC0MWGO9aM5L7z8BH7i6eewLuuR9vfTpI3SZYz7VpZKJTAgXC1xMAalcSoBrRBKlATAoIMduJQRt28q"
+    "4H2JsdHIJk6jQwMVMhamukzvmmW0GMY6i/celCK1GdpaCh/oB41vjNK2Te5b6POtXZPcNrHAvgLmSenToI/FmBpaB/KqLYH+QqNm"
+    "brjgotP/4Bd+4Xdvuuaa761ysIioD3zgFnv77Z8f6nbbjarKh3ft2r1uamrmvHa7u77fzddU3q0KLqx33o+LhIZgksRmtqwqrUi0"
+    "IEphSGw09CVJGl3bgkJEYYyhLB1pmtIvO9SSJnmVH/FtVosBKA+GgRlCxcdoPdfUag16nZguVRlFliYURTHQVQrGanxVkNRSIODK"
+    "SpRSEqQKxmjnq36Zpmllrek5V7Wc83uyenpgbGRkx0izcd+ll1++s9lszo+M1NpDQyta73nPG4qHU5vup3/62jUf/edPvXR2vvMz"
+    "WTp0RlUqU/mS4cYK8iqnkgKtSlJbcskFp/CWN76Ypz3tcZx44hiBLlXoI5RUoaCeWaxWUJUQPBQd6M7h9+6ktWMH+YF92G6L0boi"
+    "tZ5u0UFFLQwahQkW7VXUyw4Id3EnFncRgpIQPXGCiWkSgsKHEtMIFMFR6gxTW0O/GmcmjPP3X7yDj311G/s7I3g20mEIRQa6j0gf"
+    "o0CCQtEgzo4WlmnG6gu86Mnr+OnnnsKJ9RauN49N6nSlzr7uCH9y3U188Y4W02EtpV4Ww+t9TxQLtz3tqZe/4nM3/P22Y/v6eMJx"
+    "T7h//McfHPuNX//997uy8XLvE5UkGXnVwWQ5556/ig/8xW9w2Znj6Nn7mLzty2StCXweaPsV/N1n7uSvP7ODGbWWwiyD3JCQYdE4"
+    "PCkJlSoJ2iG+wGhPIwtIfx9nrah4/fMu5YVXbGSo3Eej2I+RDihDGQQxGRIUiTi0eLSA1xqvLV6B02V0SwyaJCh00Iv5PPA64JRD"
+    "W4NohS8CVjIS08R1ChYO9OjuybFlQprU0EpR9EustdTr9ZhlySS4rEk/GeVgpbntYIdvbNvHPdMtZqmzQIZPG7TKFkPpMEWVU0q/"
+    "0tpvbzSz//2yl73ww3/7t++bPpokRER99KN3JTCVfvzjnx++8847z5manV6HyMWt+fbFvV53rVLpqNY2876sGZ0lWmsd/YIHE1hr"
+    "jInEWrpAmqZorXEuICJ4F0kUFNYmMWEP0fpuBruGJEmoqmhwFomCpCxKu0QXvRDCQLKNSYbUwFVpYNqMCxUBYwzeOcBh04wQAsYo"
+    "fOUIwaEGfs2IoI1CKYUxcVqUVQ4i2CSJx/Ee711lUJXz/bJWa/bzvDWx+oTV33aluz1J1J6hoZHdL3vZyybOPPPs/hvecNUDSPi6"
+    "665Lf+3X3n/pnj37/qd35qlZOlIry0qJCGmaEoKndC104hlqKl7x8ufx2tf8OFdcdhZJ0qdyLZzvUW/UAEdVltjg0VJGyT8UMDtJ"
+    "2LediS13Uk1OsiLRNHGEqoMoB4miHPSnChYlcYwu+pGLCBjwisMukEqim20k5YFdwgQq3acymi51TPMkFrrL+cqmWf7PZ2/jnoOC"
+    "Yw0Vy+iTYlSCqB5CEYURMRjqGAShi2aORM3wjIvH+bWXX8BZKwp0Pot3OcEOMVmN8ndf3ME/X7+LiXwNPb0CrRKCK1AyP1Wvybs+"
+    "/p/3/PPVVx9WOh93OO4J95lPvea8G75664cJIxehMpQonOrh9TwvvuZJ/PHv/zwbh3PCrtvYf9tXGPFtKpdyYGGUv/zoTfz7LS1m"
+    "zRoqOwTOkno7yFwUSbeiIE0TyrJC4Rlt1im7Bxgz0zz+zGHe+ZIruGitkLS2ospp6vWMfuFRto4SwYaAwqNxBG1wyuA1g21vwIjG"
+    "HDWYo6Qbt4yljwUsjTGoEAdycAHpGaa2tekcKqiplNHmMC4PqBD9G50rsfWMImhc0qSojTBRZWyemOeWnQfZPNNip8ACCVk6ivOa"
+    "nvcEhHq9Hjr96f2jy4b//hlPe/JHxtY1D6meT0JImzOHpk7YdOfdF7VavdMKJ+vzwp+ZJMkKY1Sz18sTCdokSaJCiOSptY4kJJ7E"
+    "JCgtVFUVHYh0ghwmRQaEZkiSuDOoqoo0tVRVNSBpQ1EUAzKtUIPcqhHxfBCDUNTiMfVApUBsCkMIYXDegE0GZKwUZVGQpClVWaIw"
+    "aD0o6Dk41iKJL15bOiiJFEuGy+D1I9PFavDeiZcigJRZmvaNUQtKs18ptqVpun3dxtV3bjhx/Z7x4fqCGVH99nwvu2fTjsvvuWvH"
+    "zyiyy7N0uO6qSHBJqhBx9IsZmkMZ6zeM8MxnXMlb3vxKzjzjBFAdkC5BVWSZodvrk9kELQEbPLgcqi4sTJPv3cHcvXfBwjRpVTBs"
+    "hVQKpMoJyqFsMnDksmhRgB7kSojujSI+7tIUhIHpTbFIuJFsQwiYuqUvXXJtyO0Yqn4K9+zQfPDfb+WLW7vM+VFgOUIdPziOkKOs"
+    "DJLvKxJVG3gA9VAskKgOF21U/MYrL+KKky1JfhBfdEmaw8yFZXx2c5e/+vfbuXdqiNyspnKGID2GEskbDf7kzz/wV7/1ilc84Uei"
+    "f/9+cFwTrojoFcsueGWvK39SVclKSwNHEZ25R/v80q++nne85QUscxN07/g68/fdQkN3CYzy7bvgLz9yO7dPDjPDMiqbIaLIBHwo"
+    "0SYhDy66f9kUVVq0xBy3SIvUTLK6NsnLrlzHK596Mhvqs+j+BLVainMBVD0SoASMVIBDjKLSFkSReI2SEAetjuqxeFF6kFXJ4ooC"
+    "rQw6SQh4SqkGOUNr6E6TfVsO0TnUZjQZYdgOoSVmUgoETEKUtJWlMDWqZJQiGWHvfJ+bDs3wuYlJNs22gSaOlMQuo+9CNG4YL5Vr"
+    "56hyt0mYFHFNcbJagh81aii1pp5oU9N56dDakiRJJJ4Qt/eLjxDwPupIrbVUrkREqNVS+v0u2hwlocYcfINO8IP0mAF8DibFJiYS"
+    "T5JQq6UkRtAarLUYG6sxK6XQOv6vtSZEHsd7wTvBuUBVecqyxHtPURRU/R6YFEKIH0ajdRIl5MHiBxZrkoF0m4C25P0Km2aYwWej"
+    "6sMeJugoIQfSNCGIoyxLIKA1eN8bRAGEEoo+mpm0Zg4qpetV6U9DasuCS5RWNZTSGAuV6yH0aTQNZ555Au/5zZ/lggtPZt3aEUS6"
+    "eGlhbKCocjCWxNZRTlBFSWok9uOh3cxv38zUfXfTWGixsqZRuqIqOmjJqVkDXsApIANlEdRgfArgUBKNZRqFKB2z8Q2wSLigCSGg"
+    "a5q+yuloQ5Wt5lBnjC9+ZZp/+sy97HarabMMTYIlA4SKEq0UXgeCKEIArQxIwKoSJS0aiWN9Y5aff+EZPP+yVTTcFCb0UKmlrVdw"
+    "x3SDv/iXW/nqPRVz1ShKN1DBk5nCJ4n70tOf9vi3/Nun/3b34R99nOG4JtzrRew145e8d2qu+65Urax7CQzVEtr5BKdduJzffd87"
+    "ecFVZ5O2djF945coJraTSB+nl/Ov18/xf/71bmY4idnQoMQSEDIlOKliuIIGlWikdBia1EyNwvVIcQQ9y6g5xNljbd7+okt4+nlN"
+    "svwgVF2yxODFIAKJVFGlQIlog1MWg0W7WE0CHQgKvI6O46AxQUe3mspHElCKCo/YgFgI3kKnRnuiR+tAi6TIGNYjSBV1z1nd4kOJ"
+    "cyVJkuG0pectzg7RM022l/DpA5Pc23Zs2ztNJxgCYzibUYnCq4BQAF6s9eLyvjJJpkBjTQ1XKQR72GKt9KLKIAZ7KEJMap0ZnHN4"
+    "14uZnoiGFGs0SQq1zGCMod7IGB4eotGo0WjWsKmhUavTHG6SpZYkTTEaRpeNYZSm2ayT1VKSxJBlGVmWxOqyNkrC+rD0q6m8pywd"
+    "RVFQFBX9Xk5RFHRaLYrK0221KYqCfr+g1ergXaAoKsrSETx0Ol06vZyiqOj1coq8wnlIbAO/eP0q5goIPhJ21BMPpGmJeTayNMNL"
+    "NOpprdAG8nwBbSBJlRRFLogoYzPlnaGWjuJ99MkWSmziGRk2PPHJl/Dq17yAq558HivGDWUxg0pLKtfBZhrRhqoSNJaaaGxeRsl2"
+    "ai/z2+6kfXAXLEyzSiAJFYXrItpTSxXKB1TlQdeg0oOQXE3QAa8j4QoOjRuE82qQbGCYHOjTFxUkWuFQVKmmRY2WXcNtWwv+8T/u"
+    "45u7e/TUyeRqBIKQmRTvCwKBNK3RL/tRyvY++vQGR2oC4rsMNTXNag9veuYG3vDsMxkLhxiyPfquIE+Xsadaw/v//Q4+8bVJJqtR"
+    "0mQNeVVh6YvR5X1PfPIlb/jCDf/wzcGvPO5wXBPuB//4Y2Nv/+Vf/kheZc/QLDdKGTAtbDLNS17xeP7HL7+OczYMwcR9TN3ydcqp"
+    "CYZqGQe7TX7vHzfzuVsX6PkVlIzhVUolcVDFagxx5IgaBDUMVm6NBhxB96nbeerlTn7iKafzk884g7XpLMt0B8oOYgxBSfRGUBU2"
+    "RBczkWZUWEh0uVkMlCDaGYBF95qjLpTFz8SIHh0spqpBkTC7t8Wh3bMM6XGa2QhV4bBWE6o+iY1bYieQq5TcNOjZjFk7wuTIWr61"
+    "e4qv3L6Jve0+C9SR+ghFGfWnWAsu1qOySqO1jQvD4bi6uPXXBFAerUFpj/clwXXBeJQKJBaymqGWGhrNlGXLxhgdaXDiuhUsGxti"
+    "9epVrF6zkhUrxlm+Yozly5fRGKozPNRAlGCURhkdc68NHhlIxIdVB1FTi1pUgh+FqHP0hyXwKMgKKggeBX7g9hQE5xxV6fFeWJjv"
+    "sNDpMjk1x4GDUxw8NMXEgSkOTk6yMN+lyME76Pf7LCy0aXeL+N2gEDGIshidRTc8F0As2kR9qA9RPeV9gTaKJDF4CbjCgbKkaZOy"
+    "cKS2hncF1gqVn+eSS87i//2D3+bSS04h0QtYvYALLZK6J/ddSDSl16QmI5UU3elglSDbNjG39U7yQ7tJQ0ypWBdPEgJ+EAEGsdqC"
+    "AlSICz+AKB2TNMVeGnSqH3g5a1Sox4VX+VjhVxeICmiVUjgD9XEO5XUOhtX81b98ky/c0aUtq+jLCJ4sHuN+NBPnhFKDwIrg4xgT"
+    "h1Eeo4UhNcmzL2zwK69/IuvCTmp+CpUKbeosJOv55I0T/PV1t3Owv4IeJ2DsMKWbIzMy1xxTv/7b73vr37ztbW87LqPOjmvCveb5"
+    "b7vwuk/957/aZPUpvhpWgkPZBUw6xa//6iv42Tc9j5UNh9t2JwfvvBlpL9BMm+yYTbj2nzbx9S19XFiOZwihPkg0N0hyPDDWRE+C"
+    "mOc2sp4dWGhLMtMnrSY4f3XgNU89ieddegLN3l7GGx4XKoKuEBXdaxJx6GARiQNUdHVkAD9MiCgsDXAJ/UM5k7vmoZ9QUw28g3qt"
+    "hlKCC47SeZy2lNkoPZ0xlQcOFIa75hw7WhV3HTjAdAXzJFRZk+g4kYGLrjmJCEZFsqoIBGXARnUIKqBV3CYbK9TqhmVjTUbH6qxc"
+    "PsLwSI3Va5az9oQVrFo9zoqVy1g+NsrwUJ2x4ZQ0FbIsw9oo8RnlMUZjjMJoDvfP0YNQC6AMYdEId9R7EOKuYRFq8fn9XowHdAO7"
+    "iRocQeLXg4eAwmYNxIMLisIJRRnolxX9vKIqhfmZHr1uwczMDJPTM0xOzzM9Ncfk1BzzCz0mp+eYmmoxt9BDgonEW0lM5mYTJHi0"
+    "1oj4w+oLbVKsqYEYfBXVMlaDsYGqatNoKq5++hM49aSVPOuqizj1tFWs3ziK6Byv+qhUEZSm6vapC2SuhOkDzN/+LZjZB+0pVNmh"
+    "mcb7pwbqnIcPIegy7sZccxBFKYguEdOPhSG9wdEkJKuYdsv54l0LfODjt7C1Pcp8GEMxNJCgHyqYdVAFQgJxaQwoBQahoWe48kzN"
+    "L77qci4YmqLp9iNJRV/V6Kbr+MrdLf78w99m29wILdah1Dhe2gjdIk2rv7n2t3/pV3/lV958XEadHbeEe/3119vXv/zdb9w/0/lj"
+    "L7WGVisJUoGaZu0G+L3ffSvXvOAyss4B5u6+lfmtm0jLinra4Pa9Fdd++A5u36cRVuAZiZniiVmIREVS41jChSOO37rC6h6Jn2dI"
+    "9vPkk2q861VP5eTGAsvTHir0QJVR96WiW5gJGiVRMhykUjxyQQ8DXmlK0SSqhswGJu87hJt1jKZjQPSSyAGyGj4boqvrTOaGHTMF"
+    "WycW2L1QsK1VsEDCvDgKUgqVEkyCeIVNLZQlWhyKKipbNHhkQLoOLSXNesL4+BirVi9n1apxTty4jvPOPYNTT9vABReeTZJCmmmM"
+    "FpSOEpAQCKEc+Ib62K3KoRHEO3QYxN57Fy3fLPLlIP3fYFGM2VOi98CRNlDBQPTHVSFKsIvvL/a3VodDUZUy8bgDIo8pBg1SVKik"
+    "FvW7JkpiKAvagE7BDIEHqkAVBB8UeVGx0O7T6Zbcc99O7rl3O3ffvY2Dk7PMzLaZODTN3NwCrgLxsTaeyGAhVwlap5Gcg5AkQ1SV"
+    "x2qFDwWpFQrXARzLhhNWjKVcecW5vPDFT+eiS09lzfoxvPTIEk9KCWUf2XUPc1tuobPzHsZNoB5KpCqxiUVCDLP9/hD9xQF0yOLu"
+    "T4WoctBV1MGqhJ5vQP1E7ptK+dtP3MGnbt9PW2+gLaMoqaFY9OnlAUtnXNCPEG7cW0XCrak5zl+f8/YXXcgzTxFGQoypLHRGJ13L"
+    "vZOW//Whr3HLLqHDSVQMk1mPD10vpnPDz/78W177B3/wKwfud8LjBN/3Lfmvxt/93Web7/7Zd//OfF/eUVVKp+lalPIUxU5OO3OE"
+    "v/6LX+Rpj9+ITGzl0F03k+/ZRlNpjB3iq3fN8tsf2cyO2VGCjONkiIpYMDKoKroDDfRyD064AWUcSnISldOQGVbIQd72kst42RM3"
+    "0ij20dRtDAVeMejG6PZlB3Ne5Psf8F5pCqOxkpJ1DXPbp2jv71A3w+hsmEKnlLUm0xUcaJfsmi3YPpmzc7Zksh+YJ6GNpiClRCMm"
+    "ISQpLnhcWQABS0mqPVYLIjnawtCyYdauX8fKNeOcfso61q1bwemnn8rGjSeybLRJVrMMD9UYaqYE30MbQFXRNiQV0bnSE1yJ1kII"
+    "BbhqoKRQ8TM+5giGgRRaOShKKCtCFWMQRDzOF/dTFUhwUV+62Hx8rhbfH3xWJJblxmhEH/FC0HKU0U1ZMLFoqDIpSqcoY9A2JUlr"
+    "aFtD2RrKZqgkA5uASSIhKxurEYSETu7oditavYLZuRY7du1jy5Z72b1ngr37F5icmmdqcoZWp4+rNEEsRtcwSZMi96AsiUmoXEUt"
+    "i9V1e/0WiQGlcpo1WLNmiLPOXc+zn/V4nvSECzl5wxg1N4+b3MHEpm+gp3aynB51lyP9DhoD2sY0nt/n+IuqL4nrhCi0LJJlICiP"
+    "1yC2xrxrUCYn8bEvb+cjn9/Kru4Q84zh7TKCN3Gn9xCEG5M8HiXwDAQUA9TUHBuXt3nt007mVVcsZ7kcxPsFKpvQ0cs55FbwgX+7"
+    "jc/cNMVc2EArZNS0BlVI30/tvOyyS9767W9/4kvHuuQdD/g+b8l/Pf78fR9a/ivvfd8HSmdf4qkjvgGU6GSap199Bn/6h+/g7FMa"
+    "uJ2bmdz8LcpD+6lrC2qIT35zD3/8iR0c6K+icmN4aVKg0ViCKhCRODAPD4NweFsaFrtEx9h0azQN3UdXu3ja2St4+wvP49wVJSNh"
+    "gkR6A0uuQkhRAoksRpgtJml+aERD1APhlcYllpAHhnydcqLL1O5Z8twi9RX40RXMqAab9s9z87ZDbJ3oMuUNPRpUNHCkFEpwWuMl"
+    "UAYPRuNDCRRYE0h0gdYlw8MJJ248gQsvOptLL7uYM88+i1WrxxgaTmjULfVaSmJUdIHT0QUOn4MrQUe1A74chIAK+ArKfnys+pDn"
+    "hKogOI9UOb7Ikaqi6vdQlSeUBVVe4ApHVZRI6aL063KMDIxSEl2VRKJ2WUTwA9KOeauiYY/Be4HoGSI6vicyqBZL9BPWehD5pyyi"
+    "DUonaJtikyx6ZCQJenQE0kjAJolBJ8bWMGkdnTXA1KA+BGkzSsg2i5JxXtLrFUzMd9mybQ+33rqZuzZvZdvOAxyYWGBuvk/hFLXa"
+    "OF4s3luC2Mg3OkOZuEMS6cfQWbeAsRUnrG7y1Csv4PlXX8ITzl9Hse8OwuQWRnr7WJWV2KoTI790QlUJxqbf9/RetDXEjceiD258"
+    "MSih0oZCZxTZCdxzKOOPPng9N+8L5Go9C5IhpjEIaT+K9A//E2fcIuHqRTe0AeEqFJleYE1zluddupx3Puc01pgprJ/Da8OCHqKd"
+    "ruejX97Fhz65malqLV0ZRrRgjJBXk7PLlg39yuz77/2gumaQuuw4wvd3R34EuPySH3v8Tbdu+YC2Q+cb26QqNCJtGkNd3vSTz+I3"
+    "f+UnWDnSp7j7Jqa23AoL02S6Rs81uO6L9/DXXzjAbNhAWY0gNMkRDEkkXMJg1Y4msiOEGwZqh7gdduKi32vVoqk6nDSW8/xLR3nz"
+    "889lhd9FIyzEXS8KpzKUQCpFzJoU43KOvawHxbHEGxRUGLRX1MqM1kSL9rTD2WVMlnV2tQ23TLTYOufYMVUw6yyVGqJUliJAicTS"
+    "KAPPgTIUZKkhq2lWrmwyvqzOxRefzimnrOHcc05hw4mrGB7KSDNNo5aRpZAknsQAQRBfoVWIfq9lH7rtOEGqHPo5Vb+Dy/tUZUFZ"
+    "9PFFj6rXigRbVkjwIFGNEKoScY5EEQt4hoAOA92nxFIuJgSip+hACjospYbBzmTgjqbjwqkGSeIXISK4++l1j/SxGZRK8t5HgxEa"
+    "UTGhkcLgUVRKKCxUqCgla4MyFlGGoC2iE9JaE2Ub2KyOTRukWYMkq1NrNFH1Ji7L8EkN5y2dTmB6NmfP/lnu2bqPnXsOsXXbAfYe"
+    "mGHPgWkwDYrCECTBmgaFC3G3QADlGG4k9NrTZKrPicszLjx1lCedOcaVpw+zPp2nVh2i5rtkWYzc8xL9uuEon+WHCS9q4Ac2IEIZ"
+    "5ARRisJkdKhTNE7kX2/Yx//+11s4VK2mwzhim1ROMOqhCVdE4uUdRbyIH+hyFYluM5oc4iln1vjVF1/AyY156jKPNsKC1Og31/OF"
+    "2+f584/cyPb2KCFbS+EB7VGqyJtDyR/+1V/9j9++5prjL6/CQ2m0H3G0W/bJQbJXOq/r3nmyWh1jPENDjuc+8zKefMWZJMUc3T1b"
+    "yKcPkInD6JR2Yfnabbu5c09JX43hQgIqI0CsR6Z8VOPJYEDCYbKN/8XikWhBa0PwhgDYtE7p+vRaBznrtBNYPaRIJWZnUjHlcpQG"
+    "DrvUxON/P1CAxpDZGgRLu+Xp+joLaoxNhzw3bJ3lm3tzti1kTIZhumqUXCf0gsMrh009VeihdEGSeYYawplnruWqqy7m1a96Pq99"
+    "/Y/xnOdewRVXnMGZp6/ihFUZy4c9Iw1PPStJbYHpz6PyeVR3FtWagvkpmN5HdWA35cRu5rfdS3fXVlo7t9HZs5PO3l309+2mOrgf"
+    "mTpIrd0iac+T9Tpk/Q71oke96NOocuquZMhX1EMVK8KKoy6emjgycSR4EIci5pxQ+PioFo0r0UNCqYFUTaymLMFFKU88KsRcxlqi"
+    "677BYxikEwwOqwSjIVGQ6BjVb3AYPIk4mqqiHgoavqAZHPVQkJV90rJHmndJ8i7SnsbNTVLNHqI/tYfWgR109u9gYWIrC5PbKGd2"
+    "o9tTZGWL1U3LWRtXc+WFp3H148/nsgtO4ZT1y0hVl4ScUCxgfBeqHpoCFypsEjPPFkUFkmFMg07Ps2v3fnbs2Emz3mDFshGWjQ+D"
+    "eIqqpPIxdDoMPBI4asF6OFAsujREIVGpANoQlKFSdfp6lM17Cz7xte1sPQSFWU0pQ1FFo+xApx5VSYo43+KvWMwdfdR5AAb5dkHH"
+    "opbSYXzIc+U56xivVdSlxBBwCsTW6UmN+3ZPc2DW4VWTvnM47wniQcIhY0e/cOedXzvuAiAe/p34EUBE1Pj4pe+em6t+W9tazdga"
+    "VZ6D7nHRRSv4/f/np3jWE06C1g7mbv0yvb3baCoIqsGe2ZQ//cev8bl7hI49ibzKsHqMMniUVjjJo0QUog73iIQbB1YYWLW9VFht"
+    "ccGRmAzRJaqaYKXZx9teeD6vfdIJjLsDNHwfIw6nUoIKGKJ3golWn/td13fCsVIuaCRYtGsyNevZvq/gtp09vrqtw5YWzLCKBRoU"
+    "ZJAYRPr40CFLHfWm5tRTNnDaKeu57NKLOPvMUzjzzBMZaViGhg1pUqFUF6QbfTirfqwCkHcp2y2qVgtV9PH9Pv28R9XLqcqcUBZo"
+    "V8V0lBLAVdgQiWvxuZIYhWVjRq/B4kN0/VmUWAf5ERYXuZiQJvaBiEQ1jY7xgItpLR+ojRsskEd5MywSi1Ixak8WI/x0NKBBAFGE"
+    "EA2n0TVpYCQdBJUoNNoodKgQ8fEzWuECeAmIitJuEAiH089rlIkW+RCgDBWV9jgUoutgGmCGUOkQaXMMWx8mGR6jOboKr2vM9wJb"
+    "th5g8+YdfP0bt7N/qs3EXM5Cz+FdTFhk7Aili+55OrSocZCzVsHTz1/OS68+m3WNnJpbIMGhfIU51kj1MElXZBDkoo/sFUQlOJXR"
+    "02PMyUr+8Qt3849f3MXBcjmFXkuwo1RlH6vSQSh2OKxCQAaGzGOwKPHF9+I9taqHYT+XbNS851WP47yxHstlHh269LUhr69kV2eU"
+    "v/v0XXz869PMyQp6ugZJDS2ViM83P/Vpj3/V5z//t5vvd7LjAMerhKu//a09P9HP3WXG1A0KhIDVOZdddgrPuuoS1q0fwh3aTmfv"
+    "VqQ9i7iKtDbG/nnhizftYPeCpR+GgDpukOczEND66BpNizJuXI2Bw1V4lTZYkyAhWsBtklL5gsQGQtnhtHWjLG8mZFKRJAZ8iK5P"
+    "VuP8IJmzfO8DXQ3CTJWK29igAiqp0fWGtmtw34zjk9+8h3u70FbLaek6PTTBCEr30Wqe0WWeiy/dyLOfdSlvfsuLefGPP4VnXHUh"
+    "Z5++nGXDjkazxKoFVHEQlU+h2geRmb1Uh3ZT7NtOd+e9tLfdR3f3VsqJnbjp/bAwje3OUyvaNKoudd+nFvrUQ05NKmqqIKXAUpGo"
+    "ilQ7LA4rghlImFqiL++ing4EkUVDVyAMasctNlQAZQ57BD94D8Z3lNIopWPcxSIkhvweTgp/+PZKfF2pgbtY/NLgzqMBPbhviI/f"
+    "HywCGolVvJWgxWMU2EHAqlUeKx4jFRZHjUAjeIZEaDqh7hxZWZAVXejO4FsTuLl95NPb6U/vQHf2s35YccFJy7j01OWctX6EtJpn"
+    "KLSR9kF0aEPoRuqyCrEBnSp6vXnaCy02nDDMmSeeQBYcNQmQF2gTPTIWx9TDgUgAiS58lfNoYwnBI9ZSqhQzdAI7Zy3/9Knb2Ntu"
+    "0FPLcGYI54Q0GaLyVYxU00d74EZZd/Evphg6cnfjqxqFBl1iVE7Ddrj41JWcfsIQqj9Pohw6Aa8tpdTZtb/N3dtm6NMg6AZBJ4hT"
+    "KgSnsyT5yk//7L3bbrjh+KpmfVwS7sUXP3PNTTfd8/NlpTZgEuV9dIpuNoVnPfNSnvX0ixiuVTC7l3zfTlTexirB22F2z2q+dPNO"
+    "DnYzKkYIDNxTiBNZLea1kDjhHopwg0jMbi+RINTioBOHoYR8lvNOO4khE0iloqz6JEbjgsfaBIkFfx/2YAcQJTgqSgRTW868z/jy"
+    "bTv41u55WqbJVHD08ajMsWZ1jcsu3shLX/gE3v6mF/PWN72Ia158Faeub7JqmZDQgs4BmNuNO3Qf/T1309m1hdltdzC/fQuzO+6h"
+    "vXsb5cQ+mJ8l7beou5xGKMmkJPMVaahIJRJpEiqseJLB9tvg0INcEkfkvYE0q4iiqToivUSEgdHqyL43LAaIDAp2HrkvavDd7/x4"
+    "/16Ok/fwfF5sDHx0eWD2scXzx3EyUDkdJubF7x5ZAKIFQAY17QIaH/tDJPaT99ggJCGQhIpEHKlUZBRkIUfKOVLfxpYLhM4UvnUQ"
+    "3Z9mLC3ZuKLO5eedxkVnrOW8k1awYSwjkxKfz1NWLZxvYchJcIQunLwqcPaGlSRlD5P3sVl6OKz84eKwrltrnHMEL+gkwSEEXcMl"
+    "o8yVI3xt0wxfu2OSqaJJzgiia0hQWJUMNiWDfjx85GPv0Hd65oAuQ2nFpWcs55Q1Q9RdG6sqlAnRF5kmeyfa3LOzS8fXKVWDoDPA"
+    "kBhjlIQ9r3n6md/4l8/9zXGVyOb++47jBAcPTq8rKr8BEq3Q4KOrkLGeU087kfGxZjTeVDmh6GHEY4yhcjDfc7QKcIMEx4uIK/1g"
+    "yzpQHxx+bzB9joUMUncInuA82qQ41eTgvPCN2w8w2a/hayvoB4vRSZTWvDCIqfgBEMgSKKs+BRVST2lrTxvoJx3UUJ+VGyquvmot"
+    "73j7k3jvr/4Y/+Odz+PFP3YBp55g0HP3YYt9MHEnvS030LrrK8zf9RXm7/wKrU3fIL/nZuzebWSH9jI0N81It8VI1WfY5wxRMaRD"
+    "1HfG3fRhPepiMMTiNp+jlioZyKOCwiuF0xqnNE4zaDp6TajYFmlqsS1KpUhMQgMcDif9Xh7DoC0+91pwh9vgN5hwuHnNoAW8DoiK"
+    "zeuAQxbpMzZl8coSWGwakZjYRoVjmvhoaIR4TO3BOLQu0apPQpdEujRCj7Rs0XALLFM9hsMcaXsfZm47tc4OhsttnDo0xVWnG665"
+    "cjVvvHoDr37iap51esYl4znryFmfwkljsLqZ0DCQalBSRQ+S7wP3U2vpmC/B2uib7JWhMjV8toydUwXfvGMfU12DYwghWzxAzLOx"
+    "uCTJ4ip2hFAffKbFBW+xxU8YitIz0+qRe/Amjcu4xLuSSclYPWVFs0aKi30uIKJRpOn8QmftgdahwQ87fnDcSbg333xz8id/8MHn"
+    "z7f8iyBNjE0GNe5LhofgVT/xLM48ZRxTzOGm9tLZu41MKoxJ6EidO/ZUfGPTBAtVY1DhIUOUieGLKlp9AZSYQdChuR9tLEq4ZjFe"
+    "fzAIvYDWFm004iuoepy64QROWjOG9l2GahbvcpQx+BBrQqkB0T9cKCVUvodJUxx1GuMnsHzdyZxywelc/MTLeN6PP5U3vuH5vOol"
+    "T+G5TzqTk1YZ0mISJnfQn9hBd2IH8/feTGvn3XT376Kc3E2YnUC1psnyLo1QUq8Khgg0FDS1IlUSAyF8EfOc6qjjVkoRe2pRulvc"
+    "/B3pvbgRHDSJrwgQVNTbLcqp8eLiMRafaFk84jF/6mgK53t4vL80FY30gzOro/ysH4D7vx65IV4h6qiwVHXks1oG0jnq8GuLwnpc"
+    "vAWMIhiFDBLDRKNfVK0oFUgShfLRcyORaLiz4jGhQrsc5dsY32FYl6xsKk5cOczZJ6/ivNPWcf6p6zjn5FEuOm2cK84a4dKzTmQs"
+    "rdBlmzQzUUAxAwn/e8T9bQiLV62wWYZDUYgmpGMshHG+etsE1988wWTZwJtxKmLiHwAr0XYRdwrx3hyNxefH6nPv91xVaClJVY9T"
+    "Tqhx7imrGdElVvpoXYIyVD5leh527/McWvB0qeNNRggDs3eo2stWZ1+6866vzRx9nkcaD7bYPKLYvr20+w8cPCkEiatTEJSO4aDj"
+    "y0dYuWqcRAv4El/0B5ZlQSmD84qp+R796v5ZjhaxGC76QAMVg6EwWJUZEGWIBgOtTByCQUAyRA3Tl2V85ZZdbN7Tpm9GKUhxxMim"
+    "Rd/QHwRSBhppnUwcmetw6Tnr+MmXXc3bXvFk3vSiS3jC6TU21qbhwE20Nn2BqZs+zcTNn2f2zm/QvfdWwu6t1KYmGGnNMNybp5m3"
+    "GHYFw5Q0cSRVhS5LVFEQ8gJfFnhfEQxR/zcgFi0xMbUeZPo3RzXrDdolD2jWGUzQi7IrepGQhEF1AR2rv4oepPs7ph3z+YffohEv"
+    "phscPD5kO/pcYAKDVIWgZFH+jn68i+1wUdGH+H2iNJXWVAPJ2huoTJSevSJWdPYKrRKMrhG8wRcCnljZWYPVnkTlWDdPaO9HtXaw"
+    "XA5x/grP084c4ZorT+PlTzidZ19yKicvS9BFi8r1QIMzEDgqSORB2neDq2RQkUEoqhKvU1wyxr6ZwLc3TzDVtXjGEFVDQqwWoVGD"
+    "gpKLu/jFux+N0/cnGzmmDV5VxM+rhOANc62CnoNgagRlDquiEi2MZoZVIw3qaBIVYtIgDSrmSjnhS1/8ymlydE7N4wDHHeFOTh5s"
+    "DA2Nb1TKGtCHcx5kieW0k09ixfhIvKmupCxi5nilFEGE0sGh6QXyoIEk+ldyZPDFLaigVPTp/I7wLkpnWiE2puXzQZBKIaFGqUa4"
+    "c8cs39y8m64aoe1BTEpVVRh9JNn49wMlkCUZ9AtUmePb0/T330tv12107/sW+7/5GWZu+RL7b/xPDnzzS7TuvomwfxvJ3D6S9gT1"
+    "zhTLqpwxVzEcChreUQuO1HiMOEJZYMxi1FXMwGWNIbUaa23MIytRTlGLkooslheMv+/Ij138ZzClopiHIkTyGrSjCevIN76bQefo"
+    "4Xlk8n5vbfG/I6R/vyYDEniwR2Gglz7K0KfcYXXK0TvlIy0SrShiva5gICRHGe8GC/0gcUyoJCa8UenhqEcRoXIFvV6HotdHKodW"
+    "QpoEUp1jynlUfgjdO4C0djOiFmj6eVRvmprxpIkmLwsertLygQSsY/QdCZV3VMGjsyZ5qLFlxyxbds/TCw28buIkiQG5hyPSFo2g"
+    "xxzy4UAUYAneMN/J6VVES8HAX1ojWDx1oxkfbtJMDFpiCaU4vwVBxloLnTVHj9DjAXFkHkf4z//81Kp2u32SVpHkFgdDlmWcc+7Z"
+    "jI6O4F2Jz/vk3Q5mkVQDVCLMLHSognqAGeU74/7doIWYpk5FNzEfBFncZkK83dKkVSbcfO8+9sx08KZOGDh7q4Gb0/cLQaN0jTx3"
+    "1BWMSM5Qbwq9ZwvJ7ruo7b6X5r7dLDs0yap2j9WVsFICo6GiGbo0dUlSFaiyRKoKHyqc8pR4Ci1UBhwhLkQQx2QQghNcvyTv9VFS"
+    "oaQ43IKqDjevY6tsRWU9VeKpkooqqSiS+Boc8VDQi5LmoEVj10DiG7Sj9atH63wPN/W9N79Y6+w7NKXMwHC66NFwpMUucQQdExQF"
+    "XRGUP6od0Rl7FSsjOM3h8yOGxGdkVUZapqTeklQaGzTGgXExbFsqKPoFZV4SgsNYwWaGWj0lNQ10yAjeIiSoJEVSRUVF6XukSYW4"
+    "NqFqIVUH7QsscRG1Nr3/gPoOeCDZAqLRKiNg8CLoNMGTMjHV4Za79jDbM5RkVFhcELSKNdEWjxXC0RLuIhaXuu8NSgyCpdfzlCVx"
+    "H6sSlImugsrH4JkVIyMsaw5hlCL4AjVIFmSVbdabQyd8+ctf/t5P+iPAcfVjALbdtfWkIHp9CFFNAGB0oNmwnHrKOkZGMpAKV/So"
+    "+r2BJBLTGgqWXlERSEAlR7wTBtuoOJniFvkIFgng/tBYElKUKIJ30aFag1IaUZaKlEoPsW1/i3v3tQn15VS6jkkSwuFE298vFJUT"
+    "alkdZTRFZx5btGi4FqOuw2pdMlL0GHElDRfJVZclpipIfIH1FXagN7RGkdqYQ1YGeVR0YtGJRZlFiSz6XGqtSZKEzMbw0iNbvcHu"
+    "YGBYWmyRcO7fgh7Uwvou693h8FHFIJfukbsQjdxHjGlRRj3ynfg40NM+yKMc9dkH4sjEXxxfDCKijsjwD/z+/aTZQc8s9s79f9fi"
+    "izEkVgH4QVmagXQrEiV7YzRpmlKrZRgTcwtXVUEIA/9f0QQZJAJX0U/YGEWWKhIrFL0FEgO1oebh3LxpUsNXMbXid8ODku0ATkL0"
+    "O9Yakjodb9g2scCmXZP0aFDqGl7ZWLVBJzHijyggRaP0g8+rI3iwG7SoBhrsSlHklaYMmiAaUQoZLJTBeVIlrGhaVg5lDCcKe3gn"
+    "obBpLen1ynP/9m8/O3rsWR5JfPe78iPGQru/Wik9HKW8qI+zKrBs1LJxwzKEHKMcqt/FlH1UKLBWkSY1Kid0eg4fLCIWGWT+WnRX"
+    "UkGhQnpUUUdBCAMn7Tj49ECWTcnQYjAhhiEqE6vtVirgUHgSKqnTYxm33jfNnjlFXw9RBcEmRFWEMg+wxj9U86Lu17S2eIHgKtJa"
+    "AkbQFoxyBB/7AFURtDsseYla1CkKoiP5eXGI92ivsF5jnIIqbr9iAIA/ikTjYI2TIU7yMHg8LBke1bTE0ixHNztQHwTi7kC0QfQg"
+    "TZ+KZVaOJqZFXahGYVTUAxqlDruXPfRj9Kx+sMcoRR+xet+/DRaKwd/R0mpcKEL8fYPFebHFWl6L7f76Yn2UvlcRYkIfUyK6QHSF"
+    "6EU1hAatUIYj0jIOL1FdEfX/seyNEoc2HnQcofE9g/IO4z2qqsiSFBEIhUPpBKUNvqqwRyVof2CL+E5kiwpxfBkISZ3SDDEfmtx4"
+    "916m+obCNimUxYmg0URZJJZOl0HpJZSPY0vH8bX4t/g74uejUTLuHY/2gPFohAqhwtIt4+JotUEHg1YZCRZd5qysCWuHIPNR8FLB"
+    "4EVTVMFUqDPn54tlx17eI4njjnAbzcYJLkgWJ/9AsvIlq5ePMDZciwMhOHyRY7xHq/iZgJCXDufDQJ0wiP0GIAwcrQcW5vsZ1I6W"
+    "VY5gcYAsdlCUjuMkFBSohDJYijDEtv0dNm+dJKcBNqX6gSXcIzgiWR0ZkHFwxkl6NFly1A1dfH0RDzrtjjrm/SVSfVjK5OjHY3Cs"
+    "wenoBpqgYsrHo9si2S4ab45u0bUnPi4e/6EfF6sPPPDxB8H9pNQHUUU8WF8c+V1H1CUoh2h3/8Xsfm1wfw6TzCIGd+hB33vgfVTK"
+    "HNYf//CmcwCpEOcoS8hDg90HS+7b02a2Z8h9MjBKP/CcQUUPlfuNp8UO+i44Wr+vBjuVymt6/YALDM4Vk7wbY0i00LSBZXVLTXkS"
+    "Bnpk0bgQdBC1dtu2rRuPJ8PZD+sO/VDwp3/6p9nBydmzBUkOR/hoQWnhlFNPZtWqFVGCCI4i7w1KdCwaXjRFUVFVsVjiDwLBU6n+"
+    "oAlIApKhQoYeVDkNKByWoBrs3j/HbZt20C8SlG3iYs7G/9b4ThLUd3rvvwsezFh49GuL4/qh2rGf/2FCIRgd1VHGNgl6Gbv29tgz"
+    "UVHJMFqNoiQdCCFRMPGLGaAHdo+4GzpqhTlMzkctSg8JHV05MRRVSbvbieqNoxbExTFktWLZ8DCZMcSsJ7HChTEGwQ/t2bXn3D/7"
+    "s//83pXa/8U4rgj35psnhhScaFSqGRCf0oJNFGeccQorV4wdJlzX78csVBDj27WhKAPexRtx9JQ+7Ev5PSIo8NrjTNQjgcXIoA22"
+    "tEE8giHoJh0ytu5tsX+mpKCBV/WYzOa/Mb4TGXyn95bwveG/vA9DIHhFMCNMzjju3j7HQpFR0cSH9HDe6NgcQjQgRrctzaJa6sGk"
+    "4CM4duE98jmlYgBMVXparXa83sPx25oQiOH0wPBQjUYCdqDsizuMQAghcc6fZExn0SjxiOOheuIRQXeus9LadG2QoLXSEDwhlKSp"
+    "ZsP6E2g2suiqEzyuKqJrV5B4GTqldH6Q1C+qDNSg3d/MsdiOxeKn4zfi1kgNiDOmorE4NAVK5THNo7HkkuJZzsE5xd3b55nv1/F2"
+    "BP8gfsDHE46VmB6wvf8Bcezxj21LOI4xULt5MkoZ5q5tM2zZMYeocRRNRNmBcWvRbe4oFZpYCCY+cpSe+35kI4O/B0q70bVMESQK"
+    "OqWDdqcXc2scPW6CIjhBBc9wZhmppaSHQ8yFEBzB+8RYvW7z5rsaR774yOK4IdzrrrvO3LFp01mt7ty4NUkssY3Hh5JGM2H5imGU"
+    "9ujgIVRIVUTndiWxThcDCTccjlU69hQPAxolcdCogX/m4kquqECVkbS1ogjgadCqFFu2T3CoVSJm6L+9hHs0HoxkjyXgY9t/V/ww"
+    "rv0HXTBF6Vh6KBmiVSg23beH/dMLYOvEuMNBoh8BBgq8RcqMOvyBe91hfffiYxgIO9+DSkEUCosLgXa3T9CaMMhZfDgpTxCUd9SN"
+    "ZvlQnYEjGyIVSim0UZrAhq997atrjj3DI4XjhnCHhobsbGvhVLDNNE0Hhfc8SlcsXzHC8vGh+Fwc5DnKFWhxMaG0KJxX9HOP83KU"
+    "UeyBK+giFtfYB/tTQqyc6xdNbTLYNlWIioUj0TLIVK8Jg+LSB2dbTLf7lMbc3/jyCODoK/9+2g8TPyypeQnfHT+Mfg5A3wWcscy2"
+    "u+w5OElOgav6BLqo0I+5NQAwh6M6lYAWN6iVd3+lwoPiGINgRPxGQCHK4ryi2ysOe5mIIqosPATv0a4iI7CimdAk5lAWYkZAay1l"
+    "VazbvXv/Scee5ZHCQ/bFjxp79zpTFf4ErdKk3y8IPnaeTRTLxpuMjNajZV48oezHnJ+Ho8wUlYd+4al8vFE/KOFpifkCFjsoaoZC"
+    "dJEabLisVNRVjqZFSg/xLfJiHpGHG+vz2MNDkexDvb6EHxw/zH71WrB1i/N9VOgyaj2ZWqBOh4aOKTn1oJT6kcoZoAcBwfooD58j"
+    "y/hRsvCDkm1E/FQ8iguKvHI4WQzNH6g7Ko+ULhbNDCVjqaWGx+IgBMR7vBdccMNZVlt97DkeKRw3hLt586ZmQG0UsdqaFGssIiVp"
+    "pjjl1A0Y7aDqARVVr0Mo+1g83nu0jQUi250+KIsyi362PGCNXZRiHwg5pgUCFSiiBVZpVNZEmzomGNLgqYUOo3qONekCp60Wrrhg"
+    "JetXWixdlFQPOgEeinCO3VI/WHuwzx+LY7/zUO1YHPv+d2vfHcfKzLHFcjiLE+9Ii7lxj7T/zvje+vcIFsfUsffoO92vY9+/X9NC"
+    "kgohdBgfhec//SKuPH8lG5flLDfTZGGCjDj/IJpRdJYQJEqX1gJUBMrD0qYaJDICogeBxJ3pkfm4OE+jXKyUxQ1cMfOiwklADwJ4"
+    "CIHgYmRkCqgyZyzTDBuFoSIx0SZhrQVUVpbV8uPFNey4IdxbbrltPM/LNQzi66PzNNQbhhUrR0kzFavD5l2KbituXVRMDK2UoQqa"
+    "3AmVaH4YbrBGmRg9YwMYjyiHq2JKyJEkMKo6jMgkZ6wueeVzzuKdb3wGL3rGeZy8MqMmOXqxWsAxeLDXHgyLk+jo9qPEsec+tn0v"
+    "eDjXuoT/Wnyv9yJCcGWJ8j3WDGueftnJ/NQrn8Lbrnk8T7t0ORuGW9SYoKlbjDQCRlW4ooPSkKUZfVfEAJaYZSEW2xiYoAXBLVZt"
+    "fkhE0kUZgii8gA8cVmIgmlAFlA9IVZKGimWJYTSNVelEPGmaUhQVRqUG9PjgoI84jhvC3blz5wqFXi3ESCvxFVZDvWFZt2EFQ80s"
+    "RvBUOb7fA1ehw6AMCAofFHkeqJyPgQ+Hff8eCg+Uvo40yKVAEHwoCb6LJqemeqTMklUTnLoi5wVPWM0bXngGP/bElVy43rE6bdGs"
+    "WmRVgX1QKTriexn8x/6ixeZF8IuVab9De6TxvVzjYxnH3o+H2/4r8L3eEy1QT1KSqiTpzzImM5yxvMtVF9R42TPW8boXn80zL1vJ"
+    "WHaQqreNoaRNIwtIyHGVom5GiFmFSzwFPuQEKaP0POC9WPPh6LaY4DP+Lc5hCRrvhCrEiDUAglAVDioPZUUSPGOpYbyRYol178qy"
+    "xJoEL5XWyp74zne+Z+j+V/nI4Dsx0o8UOknHtElG4nZi8WcFGo2UtWtXUaubqPfxFb7sIVUO4mOiGVFUQejmFS5E7dFiprDvD4Ga"
+    "TmJZdt+mmfQYMbPU/AFObnZ59qVreNvLLuNtL7+c5z1hNRvG2tTdBA2ZZ0jFTP+LZz92u/aD4od1nOMBD0daXsKD4+H23/c2fmIF"
+    "5VSE1Ofo7jSmvZdxfYhLT8140VM38qaXX8rLn3U6F52oafo91KoDjJqSuvHkvjVwz6qIsYZu0DxaL8q+R871kMLnICzcieDDUcuQ"
+    "D1R5gQ4K4x2J84xYzXitFmMkg8eqBOcETV1XlZwwu2+hefShHyn8IKz0Q4VSyWjlQl2rVCmlMMagNAyPDLFsfATBgS/A5ZS9HuIc"
+    "yjlEhOAheEU/LwiBowh78WY+xA2FB5EtYgyZCn0aOqfOLLraznK9lys2Ol7ypDW85tkn8bRz65zYnEK3t2K6e6mFNtaXkHuoYvHC"
+    "HwTHEvWx7b8ax57v2PaD4uESxRK+M46+Jz+U++NjsqdUKZpGaNCn5uZpVAdp+n2ctrzNTzzzFH72ZRfw/MeNcdrYLA2/k8QdYizG"
+    "iKG1JzUBoxRGaZSEmGQHGWSdUA+goBjQG8fH4lgTOSrjSVDgAlVRQRCsBxMqMoSRehrDewd9oFWCJtFg1nSLYux+J3qEcNwQbtnP"
+    "VyPeWmtxLsRk2MExPj7CyHA96m9DBc4RXIXy0WNhsayHD5CXYZB6ZjH13tH4XgZhJFwdU2aQhGmG9DRnrVC86Mkn846fuILXPPM0"
+    "Lt0AjXwXaW8fdd+mmXhSLXGLozVkRyp7fD+6T75nSWQJ/13xcMfTw4VYRcARKoeUDooKel3oLGA6M6j5PaxS0zz5zBo/+YKzePVz"
+    "zuSCtVBnPynTCB1cyPGhxOrA4QIqyGAuRoNYxLFzNRrRFiXhEAZEPbhmXzmqwqG9isnag5AijNQy6ir6v5fBkWU1QKmyqMbuvuu+"
+    "jXLtA0jhR45H/AcAXHv99baqwkmoxAQgDFZCCKxes5LhkcYRCVSE4GMp8sUbEMIgH27lY7aro0IA73+J34nAjmxZFBWp7lBjinM2"
+    "pLzk6tN5+VUnccnawPKwl2RhB0NujrTqkzhBnKKoFGIsGMEX3e+Yz+F7mSj/1RPqkcR3u67v9v4SHhrfyyL93T4TlFBKn8qUqESh"
+    "khqGOsY3SXyNhiSsUIpmf5qRfA9njLR53uXjvPllF/DsK1bRsAdpJtGts5IC713cOQ6m4pGgpGPn5/2xKN065yi9iykbfcB7T6gc"
+    "wfmYoY5oLBttNqhnKSBYUvp5QS1rUPmqXlTlmlvW3vKIh38+9NX+CLHt/3y54ULYiGBj4boEqw1ZmrJqfIxmM4uxDCHgqxJfFgOC"
+    "FMJgu+FF4bxE/a0M6ljhCXBU0UIGKeLC4NINkMVcCYAlJ2OOJhOsTvfzkqds5F2vv5ofe8IprMnaNPw0I7pDJh2SRLCujOXZxWIG"
+    "+TpJDCqJaTQejDge7LXvhkXyPbr9V+PY8x3bvl98t+9+t/eX8IPhu5FtREBZCERjVfA+5i4ICh0USQBd9bFVj4Z0ycpJxtUcTzhr"
+    "lNf/2Hm88UUXcvKyPitrXRq0MMS81QFPUI5gAqgYhhsVCxpFdOWMyTXVwHWQ6KUQwPsK8QElUY2gKkH5KCSJihJ0vZZSMxkGTaIj"
+    "t+alJ1HN7NDk9MrJDSOPON894j8AQA1TKytWgNbG2kFIr6C9cOZpJ1KvGwpfgo25XvEBNcj3GowhKEu/yCkrF0vriEJwqMSjEjVI"
+    "3uzxOqBsrKQa9UcNrFmOooEm8P+z9+fRsj3ZXR/42RFxzsm845vH31DzoBqlklQCSVBCFkKSJUqNKNwWxtjYGNvdNjRg9+RVUhts"
+    "vBobBGthkI3VagxtVy1skAVCNgbJA2KQhKRSqeb6jW+e3x0y85wY+o8dkXny3Lz33fd+UwnVd6194+YZ48SwY8eOHXuPeMA2z/Ge"
+    "C7f4vb/lJP/Cb9rka8/scCZeZ4NdnM+jtTHQdRhjqFPCeE+F7rRpYyKaw3Wdhx0/CuWePh12rmDIIB+XhjjsPY+LR92/OF8GxjeK"
+    "XiFyyONll4w951mvEIfVR6m/4u936Pe37ybzMAKjselShTEC4hEJGBswEolBI1SISfjWU4swCvustzd45/pd/qVvPc+/+h2X+fqn"
+    "9jknt9k2e0ia0MUp0XmCnWHcDGFGBdRUWCqEhmgqQt40YUSZbTSW6Fvd1j+LSCu4WaKJyrJbC53xNOOGMTXrrGNSpK4cRiwpGWnG"
+    "aydeeumzX5VwAfZvPtgwVCdM1UhpPJWraJqKEyc2GY0cYq16oQ8BiSk7uVAleiQzCpVvATDG4H3Ed0EnMa7COKc7YjDUTUMiMAv3"
+    "qNhjk4ecMnf4yNee4V/76If42D/3Lt57ybHhbzNOu2xUYCTgvc8exBTFMYdua9RjaiUxv+Sr+A2KVQPXG4GjBrjVWDhZ1zadNI5g"
+    "HozUwXvCJI2mQkq4GBiFPTbDPbbiNT76W97MH/mXv52PfuRdbLo7VPE2p9Yto1qgm+gaTXbr6Gnp6Ih4xIJ1lpj7egf4qP1OUkKS"
+    "JUwjJoCJmQekDiuekfWcqB0bQEgz2m6m2/5JdjKdba+t6ZaMNxJvOMNNKclzzz1/PoS0BRpILxLxaYa4xMlT21RVpRsh1G/Nwlt8"
+    "yvFxYyJFD6kDZkiKpDSGNNbJSgxUISBtJHlLTI4ueBIP2bAP2DQvcdq9wNe/1fJ7vv09fPBNJ9muhdTNmE33SaFDUiDFqB77Kw1Q"
+    "uXD8vIAGICzOsL+K36g4jNmqc5fh0V8PWNa39pm4xABlh6BEbOpo7A5PnfL8tm96mn/+W9/Gm08G6v1rjNs9xlIxsmOcHSPOgTHK"
+    "xE0HaUr0U1DrL5XIk9B6DQeQMOxPZ6SY47eRqIiM6dh2nvPriXWZsmEtjas0hFE1MnXVnPj0p7/0hrtpfMMZ7ic/+Unz/Esvvcn7"
+    "bjMFXQhT3uqpxsLG1hqIbnCQJGgo6RxDKRkk6DwopUQKXu3+UiBGg6GhwVEhSFKDaIPFWQNxn+3RlDp8ifPjq/zrP/B1/Lu/97fw"
+    "9W/Z4HzT4nfvIkTWRjWVtfnZqm+KPi5bQeT/tQm+CtPRr+KreBUwVDe8FpDYjxkIxIClg8ltbHuNr3/HFn/w93wLv/97P8QHnxlx"
+    "yuywlvYQPyGEljZ0dHii9YjzGOMxBGze/i2k3J81BFHEMWujqj2MwRmLI1GLZ10CZ9cNYyZ0YR/vPfuzfdpuRui6c3//7/ydU8P8"
+    "v954wxnuvXtvMTs7u2eMkVq38yrDrRs4eXqTjQ11ZSkpYbGk7FZeIzzZPP3JekeJCB2GSKDNDFbXRC2OGkdlwaR9qngb1z3PB59N"
+    "fP9vucT3/aaLvPtsS7PzPJtpl62RobGCTQH8jBjVi7y1ltZ3qu/KLjoWjnJ0+6JOuX5jY6gTHtJXsRrLcuST45UzWhlQgeZwcSRl"
+    "9UKELNTY1FKFh5y0uzSTFzhrb/DPf9NF/sXvfCcfeMawmW6yZvaoZIaxEbFCJNCFjhhbrAvZFaovPQyJam/vfWQ26zDGYW2FE4cT"
+    "Q5WU6Z5cs9RmRi2JqrI0xuHEIaTtF29c2+p9yBuCV6NuXxHqesemKBesrStQm7tEwDo4c/Ykzagiea8eMkSnHv3q1gl8ju6alNVF"
+    "E9AYpx2eToPwkdSlXHiICzc509zjQ29t+Hd+8CP8gd/5jWynm8jD59lyLS7uY2JLN9mlm03zuqnqlAAqVy/pcQ8ix2L7Kr6Kf4Yh"
+    "mbFrvF50g24CSZ46tawzoZ7dxew8z4XRPb7zmy7ze7/3/XznNz/NifoOY/OAmgnOBbXTTYkQgqoVU8i6l5AjIBtS5+n2Z3SzDiMO"
+    "I44kFiOVsrKU2FqrGDkIqaXrZhhjiCky7doT46p5wzc/vOEM19rWgjkRYzApb2JQaVI4d+4MTZX13FGVXxKDRgQ1iSSiK5iilHAk"
+    "HDElXBUI7OPRGGeegOchG9VDnt6e8s3vHvOD3/5OvvaSsDW9yUbYZcsZ8B2+nVGZRG1hrXGMmxFODMkHfNKorlEW8myRAIr+th8M"
+    "76v4jY2is+3rbvvSZ5FoXy3J9jh4HOn3YFtfxoLpkq9ImAQuQJjMWJPApmkJ97/EenyeD7+r5vu//Sm+4V0VT53cxfobpMkDXEpY"
+    "4zCuytGuVWMrBExMVGKgi/hJR2ojxugbwZKkIqaKhGO0vsFoNJov7lnRgUCQrYT7KsMNYb+KSU76kCTl7XxWhLW1EefOnmZtfUxd"
+    "2azT0ZEvpbzxQXK1ZN2O+nsXbSCpI+GJ4rFVQtij5i4XN/f4ujdZ/vC/+Fv5jg+eY9vfYRzu08QZsZ1iRKiqCmLQrYi+o+tmhOip"
+    "qgrnXN6UYTRYXp5UfRVfxXHwOMzutcCr/X4RlW5FVLolDzIGS2MdcdZhugmbtafubrNlbvCN79rgD/0ffzPf8eFLPHOyZcxtqrRH"
+    "IyDJEHxm7m4xFLnkEO+IbdAdZmIQEd3qi9MYa8lQ1zV146gwWGvms9KmWlu/f/f+Gx4y/Q1nuH/1r/63a03TnLTWisn7/2LUkenN"
+    "zz5NZR2xy+7crGR7wISpoMMTJCFVTZdATI1QQVKnFxAQF5h2t1lzD7i8NeOb373J7/+uD/Dm8S4b02ushR2qqL5rxTmCGELWMzoD"
+    "NruANMaQUOlbVsQAS0ntG18tDJ89xPD8kIYda9UzHgfD5w/xqPOvF16thaLhNzzuMw+zRijl80ol2vKdh9FheMX1MzAkVt/FqgZE"
+    "5qsaWb50GFshYsF32DCl9g8x+y/y9nMdP/Btb+Uj79/iqY2H1OEqtnuA8wmoiFIxCYlIRaJG4oiRXafbC1Q4HFAbQ97fkKFMX3eb"
+    "RSQFfPRUriFFbBJ5w2ObvZI6f1XwYMLJtvVniu4mpUSIHdYKa2tjKqOmXwYBScTUEukwLlE1Fa5x6mnemLw7RRlkaCeITTj22HA7"
+    "nGhu863vO8G/9v0f5kPPjtn0txj5HWyaqiRMyFFHVfcqJj2RxUHKFhNvNEoe+h3stWKIr/bzXgm+kvLyGwEHmbv2mZSS2sgn0Rlh"
+    "djpjuxn1dIf17jZvOdXyu779bXzfb30TT61PGHGHsQ00BrAWrM5aLRWN28T4EXQVEgw2gaQOCR0SWggeGyK1REbOEJkikrAidL4j"
+    "BrFr4/WvLprNdvY3Yuc3UhJELJIiBE/dGLa3N3GV2uaWio1RR9KZb2m7fbxv8d2M9XHDxrimocOmGeN6HcKMsTzkRHWT3/715/g9"
+    "v+0dXDR32JrdYdztY0OrNr+iIdGjUYY9f1feEtyHyRscbA4lsmhw5Z6yW+eNhUEtO/r6wcehV4rh8x6XXgn6EuST0muF4z9/uPPt"
+    "cemVQvtCobkutxCALHbS9aE6XwhG+1YQg08VMVSk1mFbwe7v0LQ3ef8zhu/5lov81g+d5vz4ISlcoY4TCFNS9GoW5i02jGh3Ic4M"
+    "jRnpDCJ6JLRInOF8Rx1b1ohsVUIN6r5VBNQ/mYQ2bi/n9PXH8er+NYQnrYNZK1MhYwyYRN1YTpxcwxkhRg+SHRInrWBrBWuFygqV"
+    "JMYuMjItjl3WzZRx2OGUmbDhr/HbPniRf+Wj38h7n6oYzW4Rd28g0WtFpNKYtKGq/qnIyVo8ZXPDoyXEnL/ECm9lrz8OSh+vLo4u"
+    "i6/in2U8sm1JL5ySiPotSTUmVkgQxpJg/w52epW3nPN8/7e/i9/+m57hstljjVusyUPW7ZQNYF0MMgns3d0n7kNj17IfbF1AtzFi"
+    "Y8SFSENgzVlGYgmxBSJOHAZjJtPZ6Y9//BP1MKuvJ95wrhCDXbOuHlmz2AQikmhGol7CRH3ekkze4CAQBImCEaFxhrUKRmnKupmw"
+    "zg6nqh2a8CLnzS2+5xue5mO/9Z08u75DM7nKiZGnLgucqJMZQG39iFlnq0oMXZBbLqKyEluoYFkeeOXFOtTJ9Zn9cZjc8P4hvVIc"
+    "Jw+vBMP8DumfVRym+x1i2B6G9OqgLzEvS7pzmmtt85W5aorgAmS79EVPsxgkJJoYse0OZv8m77jk+J0feRvf+eELXK5vcTJeZaO9"
+    "wSb3OCEetz+FvY4qVJjo8lMTEbVYEiImBpqUGFswsojAbY3BGou17uStW5/+Dc5wY1gTsY3OgEtDSTSNYzS2hH5ssGQgOVKyRB8J"
+    "0xY/nVDj2agCl041bFlgdpM3jff4lndv8vu/++t476WK6fXPYWZ3SWFKF1p9d/58k8BEsFFXSbUyZZ7q/6vRPxMFkrGk7LTkKwH/"
+    "LDOnr+K1QnpFagkRFYiIuilJklr8SOogeUiR6D2+m9EYoeommP0bvPWs4Xu+9U185GtPcd7eY5tbbPGAc9YjOw+p2siaXYOg1vgJ"
+    "QxD1WxKTWiwYhNo6YvRUxqlPleAJMRpn3WZV8Yb6U3jDGa7vZusxRktKamsLJAL1msONjHolElFmG1A3bsEwbtZoqlrDpceWceV5"
+    "/zsu8aH3nOYDbxrzOz58mR/8zq/hzVtTttM9zqxXmNhi1hqCM7Sibh1tgipCHQwuOiQaYio2vT21wnwwyDtf5hFm+w1TN2B8JagT"
+    "Cl49aef4eD3e+ettIDGP6GzHlWxfL2h+DzLdxSwuz/GGXtByvRgqbDTYaLRfpxkwBZmAzBCrwV9tahhXazTJM/J3ef9bHN//bW/m"
+    "+77pEt/+zvP85sun+bpnzrPezahnHbWxxGAAhxcIIgRxBHEkLEZqKtdQGau287ktJoTOx83J5Dc6w23jekrRkjuRyTofVzvEGAIJ"
+    "scX7ltrYRhJt6+d7qU2csmZbvuE9l/l93/dh/tjv/+383u/5AO+6AOvxNmHnJiMJNNawc/eO2tmC6mxjZvRRSDFbGcQSIqfsaTOQ"
+    "FscKUy0ey+bXlNHd5H3lbyD6U8vXZrq5Gq/W84/TML+SmW5hsENGW9pFP13VVlYdexy8OptvTJkDLmxsh9Tb1GGylzGSUcYrdule"
+    "iCAexBNCoKnH+NYTJzMaAkzvsMF93n2p4g/8rm/lX/qer+cHfuv7+eb3PsuJyiJdp1t8ozLaiMvMXJ3nkAJWhFoqalOps/LYUdUO"
+    "5yqZzdq1tNe9oQ5sjtOuX1OImO0UozhxOJMdB4eO8do6441N9e4eI8kkcBFP0M26AiEkkEhKU2R2k5P2Lu8/O+U9J3Y5Z26yzV3q"
+    "uMdGY0k+IMkwqhqSV38LQiQZDcecjFH/pSZhJGCI2KS7xkw25BbRAJfJLAhU+pZ8naSACdrCinZrmQ52xteClsv4cP3nYec0DtWC"
+    "hs8/jMr1OdDcoaRTzNUEaut81Ht1qnq4NcJwkBnSozB89/Bdh5VNyVefET0uFQzXC7KL3UeSVqO6T3wyYu6eUV00quMok0roc5au"
+    "VVJf1YUKkuhOMEGpzBzBQFSH4pURqtCxYRJm/yFr8QEnm7u840Lkrac82+EertsHn52YGyFgMeKoE1ShpabFpRkuesZiMT4wMo4k"
+    "iVnq6FKUejQehSS/cXW4H//4x83t2/e2DZWklOg63YBgq4a10SaNa6hMrcwuqxsE3WFCsiph5oo2zKjjQ9b8A9bDXcZxF8c+FR2m"
+    "RLQ3utCGqJI95dYddD2OYJIycCk+P4ubRZ1aJYCUPe4mQ8yLefPwzeV6iSCLLcDLpI6g+8sRRxE5NPoiF8dLXy3iCd4Py9PMxyUy"
+    "wxy+t2xIGR5/zdJcr0elKaUDx1c8aZ7q9y2nSZZTiCAa/atPMR08tooKDra949PieQKknK/+03M776c9RIkEo8f13jJLVZYjIkTJ"
+    "qygSsClhJVIRcWlGFe6zxj2a+IA0uUOVAnVl6bqZ9q0YtT3EIhh5nElUArURKsycZwQSPkX2p7PqhRdfXAQcfAPwhjJcwE33pxvO"
+    "1iZmqTDGiEmGE+Mt1s2YOtXYYJHoIDhqaupUY4LFBINR3pZJR+GUBFDGliRlvwvaMVb9HqYhM+MoSbcPD9JQXCcfcj6JPv9oUsb+"
+    "KNI8PX56XIqElf/Pjz1BqnSwEz8eaX5CDs0Sct5Wve+1Sw+2jX4ae21s6bgkgtHfKR9/nDSYRPY6+kQUjNJwIHsc0mfkvCylPcpM"
+    "dSnNdLAsNe1TkjxzNaVP6nERIHVUBhoL0c8wBCprD8QzpAxnRtWNkr0NGgyevP4TopqbpljfuXlrOymDeEPwhjLchw+3bFXV45Si"
+    "xBRxVtUrKUQ2x2vUUmFiHiKjTkOsqFkJsTc9LBQTKWW9LDrNKamIunQUkaXj/VTyLjGDvtPkeimpRJW8hseHKf36HLbkQnP0J6QL"
+    "kmIGFxd6scdKVzzzcehR70+5d69KU5S5nvuVkMnRl1e9/6iU/P7h8WOnuWak1PuKNKW08ni+E4CYVTTDVHf3Hzxe0qIhVeny8dMD"
+    "be1JCHJbGKaFhseH5xdrHP20qB/0at2XK/l3SVGXNFhJrG+MaEaWNrYkiSCii9liVRWIBVE1RUxCFEMygrVWg7En7bMigrHO7exN"
+    "1vmheRW/7lh84RuA2ayxKaaxjx2g23NDCFSVpa4dBg95g0KZtpisj0fy8UwRTzLqkjGh+lrJuqchabSI5WM6i1v8tskskYkHjx1G"
+    "Jgo2WqUV520yWUK3mCCr6THet5LyCvFxqLxz6dgrfr97ZZSf47BLdOA9PTI5yOHw+GPTPB8Hy+pxSPWai7SYSg2PH0ijw0SHpBoT"
+    "66VUQjVPidWh6aNIUn7eSnJItMt0oB/ZAeVvLN8QFjTvCz2qgsWFg8eVBGMcPkaazU3WTm4zS4G9bkayTkNPGkegxpuaYCs6Ywli"
+    "1aGUWJVo0c0XiaBrQSG4yWx/45Pv+Q3KcDc3d20IvgHEWYcPHT6pV65mVKmworZgynAtGGdJjjzlytMSieiVJe6SB+ktePVIYsox"
+    "0Q6eW7ruCUitHY65YDKXYw6h4fWPQQyf9SS04rmvG2XJZBXpSvjB48cu92PT4Xl4FBWU/6VIWb3fR6ZZ52uyyeGTpNqOnzQdyqr5"
+    "2GPQUnnEdFDRfEidzdXEyYN00CQ2t8fYKjIJ+yTjNQxmT6UgKa/roO3DitGQW6hPFGstMXpS8ibGOD579mf04jcAbyjDbdvKxhRH"
+    "DiuCxiWzInShxa2NSJXFG1BPFYATUmVJ1hBNDn/e012lol+VREqexEFCdDtgn1YdT6abU5R26fcrIgmZuqNpeF+PorRHUqKF4fMe"
+    "l1a8t//+4bGD1D45iVc65HsPvusgIa+MkglHUhR1/TkkrEaUZl7PT0aLvJT61Dp9vdIogShdj4KS6Q4hPyc1/Sr5H5AZEO2Cynla"
+    "JE5x1kOaYNeE9RMVyITEFGs6KklUBKqodg9VTFShVYuF2OVgspGUgkYeBkSMQWQ05EOvJ95Qhuv91CZCnQj40GKNMBpVdH6GaxxU"
+    "lqKWCwZA9TMYm7fdsrSNti9dZC3BIymkdODY45x/3OuGCxyH0VAYWAgFx1upftSiy1GhsgOHv+O4719eIHx8ikRiSgfed9ixg+9/"
+    "cjqq/B+HYpajitvO8vs4aVlYCvj8fwl1XsKeL34flfKk6dyCYkArvnNIMS+69e8rU6d+Gxu2u0iuW4mk5KEykFqoI6PtGmkSQVpM"
+    "lTBWF8KMMWotn2OrmeAxMeCMmuupZBuAjhiDsaS1zc3N35gS7v7+rqmscQGvwTttYjrZQbK+NpJIIgSfKD7lKzfGd4nKNBgckiw2"
+    "OY1rHy02L3ZFLN6YQ6kToRM5cLxQEKVo7Pz/PmnEJVm6rk+La1W3tCBRo21jBuSWqDOykrw1eGsIzs7/X0mqWDmUojHzvAwpmsVz"
+    "Dnv/o+hR9wyfO7xu1bFV5w+9RuSJqZTDMH+tMKfhuf418zJOukCWEKLootax00wlMnT5/Tik95X7Hy/1CCEpLVuSOyIub2FXiqLO"
+    "+KOoAabqWC3eLqgzhlb0nEeI1hGMPUj53S2JkDydSVALzdkT1CfX2On2aYl0KYJYYvbbF1LCmgrfRZ0MV4aOKSJCCAExFZFguhBG"
+    "X/7y6Dcmwx2NaosRmwgy81Nm3YRAh7GwNqowEkixUx+4yavBvCRGdYWkiEWwxSAcwZGwERylPHtD64DKJobDaHj9kI53ne60WUUp"
+    "m6+lJKRo56v7i1V+d+Ceo0gtXRa/RewropK3Ve85Dq3aTAEHN1ocdt1h7xvm5zAafs+QhtcPKZmD9xjjDhw7jNSWRlvoqnSldUQv"
+    "LfbmT0pzXXf5f5DCCt3xPFWhZdjG+/+nqJYqQ4sUjXCm3zekck5Y3b7mdSNWt+5G8EbX+RgbxqfWaLZGdHREAz5vzw9R99OkpKOc"
+    "iLC/v8uGbOhCfMw6X5JJMa5tbNTDxva6wQwPvJ6o60pSiLYyFaNqxKgZUdkKZxPWdBB2kTjBMsNJC2lG7PYhdggektfAkKnDJB07"
+    "IUCKVBFcMIeS9XIk9S0GhqvPtreyfxi5IDh/OFXBLCgOSf07LF0zoP4zyv8HnnsEDfMzpMOuGz5nJUVVu68iE9Oh1L/OhXTwuYfk"
+    "aRUN66uQSxaX7IHjQxo+r1AdLXW0B/LUJxtXWD4MqFhUrKaEi2gbekKyUckEMIH57+Hx1ZRw2BXtckH6Ho1dVkWZU50MdTLYJCvJ"
+    "FMp5WpU/Ew1GHDEJQcBLgCpSb45wGxV77S7JFJVLtoGe62lFo/iaipQS+36fylXUdY2RStoujMbjK78xGS6M6WJHiIGu65jNZir+"
+    "izBuKqxJWBPVv4IRsOqMwntdgVT9ULHJQ/W5Wc/0StGXFlZhKFEcoGzzexgtsKoKHk+60WgXhz3/lWH43GMReRfgY2JhV63SECve"
+    "X47N9XeH0BD9+58U/fuH+RrSozC8fkivJlY9b/i+QqX8RB7dhlUiXdRJ+f8o9O/v/x5chRWn5pqSnZjTUa8b1jZqsAEfZ8TYEpKf"
+    "u2mMKu+SUqCqGjwBS4W1Fe2sQzCmqsdN07x1+MLXDQdb5uuItvWpNlVaq9ZomtG8gpumoWkaLIbgE7NpR+g8RGHqI1Mf8VITjCMY"
+    "h7eOztZ0tqa1Nd46vLUHN5n3SKw5kpYU/ivuH9JwcSHalEnmVHYABUPveL7OyBKlY1JZcBj+7r/3SWj4nsehaPUbmBunq9e1VVSu"
+    "6VMafM9h/x9JK76pT/26WEWp7H7qkS5G5V1SK84vXfuK6GB+H5dCj7zRqbk3LB0/kkR3mvXbZFBX1Log28/r4Nwqml83aP/D/+eL"
+    "bUFnPZI0yktMLTSW7ZNrnDi5nuNwd0S8WiUZtG7oiAIhBCwNtVnDdwmoqaqR7D2cuJdeennIil43vGGcHuDf+QN/8vx/8WOf/GQX"
+    "5VuN1Pg0IzFjYzPyl3/sT/Dd3/0NVOkhJk2x1iKzPe788j/k5q/+I86FB4zTtASCgKynAZN1OXmf9hOi2Pj1cXAkVhx17ZL3xkOu"
+    "VSznNntseCQOfZ5ZnddjI+/W6+Ow7x8ilcskh+d43JSFLm4Vys6hw5BE8xpFbUJXpRJ1lXx43JTPltUe30p5r5Ki+4iPqL9D6y1D"
+    "vy8i2VfH46Zg1NogmbxF0micvvw7aSEcOM4xZyYa8+/4EJGlEllVf6UJkC1BQxK6yhISGB9ZlzFux/Lg2j7XnruPdBU2JBpTE2Mi"
+    "mIbWbPLZacWf/d8/wxfjmDtYOmqa0Rq+3Q/E3T/313/ip/+f3/d9l/eH7389cPCrX0f8y//yxy/8D//d3/v/PdjZ+wgYjICrEmsb"
+    "kb/4X/wpftu3fQATH2DpdNTbvcvtT/8C0xc/w9b+TcZxSrKZsSXdXx0AUllEOhwa6vxwPKpDSY7C0Ef/93BKfeDao1/PINDEkRg+"
+    "e1Vjfr0hIugnCpB0ECTNf/dTze7y8eJxavgt5VuHx4dIOd4WMS3z8vzbZF+uQ15fOrzJue+Xbf//R73/lUZwLs83SRnn46Y6ezic"
+    "4Q5TwR7NcLPl0Pznge9XD28LqFqij9T7PTwnub4WC3eJaCytM/gUER8YpYpq4ggPDc/92g3oHKaDyuginDc1nd3m+anlL/y9f8xL"
+    "seE2jiBNtrbYDee2N//Cj/74f/7/+OhH372zlIHXCcNSe2yklMwnPvGJ5uFDxp/4xCe3Hz6cbaaONSOVbdv9AK713ayt1hv/vne8"
+    "O7zjfe9IVdWEGzf2zV/7K//N19+5vfcfCvXbMZa2myLiqUeBf+UP/ADf+PXvZrp/hxQmhBDodh+w+9IXqHZvsTa9T508mOx1KEV8"
+    "Un+25M50aOM5BmRFo+h3oXLusA5JXG5AQ6a4+G1QC93ldPjuwzB8boGON/o84WBHOuy+gsMGnOPmayHhLb5L7SEPfq9GWx58f+l4"
+    "wzo4BsMtY22R9Mp7++8XsQfyMc9PHg2l975heuT783VHjfmHlW/BQro+mL/jpIe9W7Lkb9G0f7yP4W999kGU51i0sav164KxzPvJ"
+    "4Jn9/1OZjUnW2wPJB7CGWFuCgImBKla4zmFmNddfukeaWVIX1W9CFJKtSNUmVyeJ//XLN3h5ltjFIvUaXRuoHSn43b/1tre/6U98"
+    "x3d9w7Vf+IVfPdl1D0+NxyMrIaREEhFsFDESY7ImzEJIk3d8zTtvfcu3/Ob7J08+M9nc3Gm/7du+TReRngDDUn0s/MjH/8rWf/cz"
+    "f+PrPvWpz3z3dOrf3AVz3rrxOsE2ojVPStLqvgAVQVNU/14BSeAukuQpKAHNokqqMuXUdo2RGUZy3PuU1KA5tLjoqdGInvOpIOry"
+    "ML92MTU8BnNZBV1N1WdTOlGeqkLveF7oMdkEh9yYyuaBRxWwSsIrOkxuhCaV/C+819NvsJmRLudLPW0VsU0nc/o9qbfFFJirHvrf"
+    "AwuGcFTZDTvlymsPkagelQ6fzeD56Qi1wuK6UgOLVE2bDh4fnl9Z1gOs/N58/VEzqGHeD3u+QvOlr1rOr962+jt0cOk9JTMz0Has"
+    "w3A//6XMNd+PmiGW9rE0M8j1ZyWRsocu6c0Eyz0haTsv7jZT1ruTdO2EmKiMbjMOORsighQLj+Ro24iJ5UaFLqA7ZmbMva5hJo3a"
+    "LeXpoq6n+weJ8NnGyX6y8aQzbKG+0FJKQQAxBnEpJR9jK4mZGHPf2up2iOGLb7781K98z3f/c/9ztf21t374hx+f8R5dqofgL/2l"
+    "n69+/L/8D9/z+S8+/6/f39n9qPfpnHHrLgaHSIOIg5h9Js73OZdX5Y6c05VILaRJZraLBqkMQ33bLjXYRK/BKA7rDMeBAap5PnUH"
+    "WWl/pRsN26PMbR417VboDJYY3QD90pjfWVrzAXasjHouGSxBdXgx+6Sav7N4UJu/qQwIZeq/kAjLAEeutYR20NJRS6fo/5YEEWXm"
+    "5fdrkZJ3lR2lEkiPUBmkQ/L/JOlQZXHc5/Xvw6jN7NJ1vQE7JvUD1merJutE+8cRWfSyA90rt+eyKy8OtMxLKoPSDg6HHNKWi+Ah"
+    "SQUEyVYIKSVCUjFEEIyxmpccNRs0//OBJWkQgJKP3peVV5GvXIJgCTiS2yBQIb12CUX3HPHeY4xgRX/HpG4fyzXBTzFGbY0DkZGs"
+    "E1IXOyZ7pzdPfObcua1PfvdHv++v/+k//X9+XnSKdiys6rFH4u///b/v/v0//Oe/9XOfe+mP701n3+LcaCOChGQJAaDGGEuME6A3"
+    "xSgjbJbIUi/eUKmURUfPW/tKcRbJMf/UJywaiCxVSMEywxtKEUcyZIk58FH2u9kbSA+7S/I75lJxGa371xx2c26oS8ir4WRd2FyS"
+    "L4s+YXlKuEDu8FhCngGQ391vqvOO3yupZPoS5uI61QguM9wDDGLISLL8JANG8UrTOcPtMZzCaBaMyWDQ8h/m70A+Dzl/nLQ/wPTL"
+    "BSMaK7F3/bDcVr1/zniNRkIYnj/ugNaXKnMJZVWbouQHIwNGW+4hM74FZPC7MNNhu9X3GsjsUhCccUjZ8QU4Z/Dek0jq2S9fp9B2"
+    "E00e2HsQkTn/MKbwj+WZn36ZIQRLRGd3hW3rOxLkM4hGGBGjgtyc/0gg0GbbXcds1lGZBucck9kegTY2Nt05eXLtJz/6A9/9n/3F"
+    "v/jDv9rLwJEYfNKj8e/+W3/mgz/2Y5/4M+1EvqVDnBOTpwiAdaSYRzTa7EIxd/O5DrGMeKtXLfOy15zJDhnjPMNxWaI1vWcAmVkd"
+    "xPw9wxY1gG6OHbDtLFGufMZgVb8/hetj2ECHKB2uNAz9sqJzVCjjFeK89w6xCH6p3FkXU/rPm0uq+TuiaKMrxwySg2RqupyPxXNW"
+    "pakfafkJ0R+MVx1/FBbltZyvVfldla76zkeVw0IX3UMZwPqLUsdI+xLqqm8eHhuW0wL5QUXQyfcVlcfQ2mAxM1r+jmG7Le8zAxZS"
+    "mKCxji4mYszf3oMlDwgSIaX5AmWfAwRhaZFtjpyvRR8cXqPnh4vWBXmNXetSFgKedu0cwYMATn06WCpCSMSYMFLhjMGYqA52TDdb"
+    "XzM/9Tv/D9/5x//yX/5TXxy8aiWGuT0SH//4n7/0o//53/iTd25NfjdpvC7iMBZmfpdIhxMIKWCNEKLvNUjQ8WVh5GzE5U6+rM/S"
+    "D04LN82FmR9odDJnyvQaRJHucwCJw9GvzAPPHpyfHzvkOCyEg/KsAw1hNVY3C4DiRKTPCDJEyy+VDroKvXwk4gExaC6J968lzgcV"
+    "m3fqDO8XzNJzhr9T5KA49AToM5Rh++hjyGjmjNosGFgiHGBoj0qV4QzLP+YOHjHGLf0eMtyg071euZMbieR0udyWUgBTZoSHlOVh"
+    "7TD3gRTjoHeXH4tNMorcv+Zlp+8zK6TXPsr3CX3pVJEEXfBKiRTztxqHczUk1W+n+SYXfackcrmrRFoW0BZYfseQiS+wPLCshuqX"
+    "58JdnsEVBpwkYhyEroXkcPUI8lZmI0IIHc4kkI6U9u5fuHDyR/7F3/u9f+Y/+U/+rw8GLzqAw2ttgL/9t/9284f+0P/7D7744r3/"
+    "lzOnT6RoaFwDMqMLu4hMWN9wSAo0I0dV2XmHFlnetYIRrNjMWBcolRD7DbbXefsNYN6xBuVqiPpe0febpCY6wyk5Qa/rH+9fJ3lK"
+    "Om8Ycwm2SHAq4ehuG21UImnFyLq645ZUDunwKeuv6X2rlo0Wajpi4cUAJk9P9cCyCZveu3gmpY4kRxzGEkvlZXOiIqENJbXh78Lg"
+    "+naeT5IeZidajgv2UDMn7Ui6UWGVvW0gzVfXh+2itLF+mfcxPD5MSz04Vx8o8356NLS+Yo54q5+8/B1H5X8+u+tbDQx2hqmAu2B8"
+    "mq+F7t5ANs0TlgcKTZ2rln6bJCQDFkMU3cyDWERyJIZgmflA2yVaH1WHmyOsSMqLfLGsmGj/K8yzQPO2+B69brU5m3HKkFeXu8ZE"
+    "SylL2dqrF6eNqix8isQuYU1D6BJ0EesaYuhoagdxhnU+zdoHV973NW/5t3/xV37yJ6V43joEx2a4H//4jz7153/kv/pLk+nod8xm"
+    "1oybNaazPUK6TV1H3vPey3zrt3yINz17kQsXzyISlhhq6dDGuCW2M0QpmNgtn01FPzdvHApJy4U5Z6h5x5IMdF9Fd5aCms4Mz2uq"
+    "e7RBp14pqdPyUuFDhqtRKPLvnjPknMOVDfaRqdHGMO8QuXH281W+ty+xlLS2C0mmCE2pTJfo68AW5TxnusnQNOtaX+KWGO6QwR12"
+    "/JUy3BjydLf3nr6ketgAUN4bc0iWfqmuWnwapouZwaIDL3dWRREI+u2xf13IU6z+scP+76PUScqS1jB//XyuOq6pwbla6zILOmox"
+    "sBB6dNFKGU+Mpb33+lxYLHqvSmNgqT4MFkxapM5lTamjC8LNOw94/oVr3Ly7Q9tFprNASEaDOOc+FmOcOxcv/X9YTn1dtH7Loh/2"
+    "US47rH6sLffphSkLIcYYjcQsDkmG6bTDd3Dn5j1uXrtN9DpYCxHfTXC2I/j9MKrDX/s//ZF/6d/9U3/q/3Zv/pIVWOT+EXjve7/7"
+    "Y5/+tZf/U0nbT6klghDZZ3O94zd987v4Xb/r2/kdv+NbWV+3WcehjKz/kX0GMByZ+h9Oj5GUY6VCCFo5WmCKlDtS//7UU6YP01Xo"
+    "n4tS7BjzlLEfPy1DrQTSktTQz2+cX7u6SzzKPMkYo0EdS0PsTcXKOwBMVtMUAp0OVsaqDwqxpCy2RfRZkaAqifz8oquVlCX2lJ+c"
+    "G7TqExeS+VAXOrSj7Q9I/eOPk5ap+nGeU96/rGPVBZk+oxj+PvR4ry6Hz+2rFIY67sV1y3a2q9rdqmPL0D7Esa4dwszXSIwxGKMh"
+    "Z9TbmbaT0paCVzeIKSUCQcP8FDH/CAz7qwz8MKSU8DFS1RtELM+/eIN/+suf4YWXb+GjZdpGYjKEIPgYiVF9IKfcv/uh1vvvKf8f"
+    "5k2tnI+92Wmh5edoHxt+hzEGay211BDA+4izDdeu3OQX/8kvcfPabUIXsZKoHLSzXVKYsLXpfu3ihRN/6DNf+Hv/a37BSpRWdSQ+"
+    "/vG/tPbn//yP/tl799Pvq8zJxseEc9B293jzmzf5E//RH+GjH/0Izk0JYS/HD3LEzKiKNFUc07iqWtJ99QtTESH5uTK9DzmwCrss"
+    "UfYbQB/D3wX9iur/T56SkKd1/evzUbV2DZGqqmiDx1rLrG21wlUOGYzAywylr4pYTvUdIQ9YVVURY6RtW5xzxBixVlQt4rVMU4w4"
+    "5xiNRsQu4qRhNpvRjMdgDK1vMc4SUckkJJQpZUlGsKTQZX+i6jDIZUkoxrBkB1p+i5Bd+HFgwOgPKEkVu0u/Hz3gWDjE/nRVuvy8"
+    "Uu4sDexD1URhtKsY7oJhHmTwEOdT8mH9lvfGvKi71KY4OPgvt+X+8ezWsIdhPzmsTat0l/WUKWmbstmdomQmLOq20Hv1C2GMofUz"
+    "dMxYfs8qDN8dZdF/nCjjbduWUb2NR/jyc1f52f/tH9EFx937+0QsIRqChy7qwKXOwpO2l6gLuwfftxgwCoPvM3m0dnSnYXZkUwaX"
+    "fpn360fP6f/GWQ1UGw3r6xsYcdR2RPDw6U99lv/tZ/8BV55/iaaqmU33MeJpXKJt7+5evnD6h//0n/tjf+ZjH/vYQh84wOoaG+AH"
+    "f/Dfe+onf/Lv/fcPHnQfsvaMWGvxYY+q3uM7fvsH+bM/8nGefnqb6fQu40obyax1dF3A+xyqODdCALFm/n9Bf6qAxCwtRJamTr0G"
+    "N78/2/stFWiPyReVQVElDO0vh8dL6lPpsPreRRvUfHrvcXVNFzQG23TWUY0axuMxGKENPrPcgx2Ffv57WFy3aEit7+adP/qQ4zNF"
+    "QueRFJjuz5AYGI1GqtDvPN5HmnpN/YQitKFla3ubZm1M67u5VUlIGhlVkk6RU26YLkHyUy3/Q+xM+yqZVanJhmH944eZUa1K++8d"
+    "PicJWDErVUWaGiSq6mr1eb1/+J6+Pezi+1b7KjgyRWcZfXM18qwnRY1kYY0uKg3Pl1Sfp9Gpy3f223Fl3Tz/q86H0M0H8JDygOOs"
+    "zgzFqh1q5Thz5gxiDV3XkSTSdQHnDLNOV/FXzQjKgLX0ez6z0DWNSqDrAmJrhIpf+dRn+cVf+BSzTpjOPClaQhRi1L4w3wRByFG3"
+    "F7PWPnNf1kkve8oj96EkxbZXVRTzeweDH6KLYIiq0cSqdGutxZkqM2NYX9tka32La1du8o9/7hf50ue/xHR3H2KkroTQ7uHs1Nc1"
+    "f/1f/di/8Id+5Md/+P7iJcvovX01PvGJT9g/+kf/7PfcuL7/X3Xd+LTIGjHNcM5z8ozl3/q3f4A//u/9QayZYsSTOs/P/5Nf4vNf"
+    "fIHJtGU2my1GnhgJQf0iFCZSzDrKNSnqaJmSHGiQen75+vL/kOkmn8+nRIjKuMtzEhBD1oYOOoKeN4SUTavyM01m7AVd6xmtrxFS"
+    "RKzFx8D5ixe4ePlpXF3hk8q4w9G1YJ7PUjZz9qwQsSo5Z4nZGEMKOipHH7AiXL96hc/92ue4dfM6I1tBSnTTGbauSNFi6grjHFVT"
+    "8XXf+A2cvXBedXXWMJvNiDHmfegJ33VYMTgxhNmUL3z204SuJXR+zpBCCaxoNaxJv8MT1YXmkDEOGXZJ+89dlQ4Z+vA50asJ25DR"
+    "aCqkgNZf73ifQQ+fX9LyXYUhr2SoWWcZc3ToJNpoF+ehnc6W8pdCJCSdMkcSs8l0KV8lXeRLrxueL8+LXtdI+t/fLwe1olAG5ZNK"
+    "5NY5qqYmoB75Ll2+zNd9w9ezvrnBrG1xlWFvd4I4yVY+ZQZ6UKWyPEMNGi23x3BHeYYYfMKJ4x/+g5/ni1/4MqFTW1pdE8mLg1Fn"
+    "VUB+1zKWGO6K//tp6U/GDRbtRdPFzGXRjjGikbyzOsEYw/rmOmISlVMham20xv5+y8svXOP6lRvMdmZY5zDJk/yEcUOKafKZb/6m"
+    "b/id/+PP/teHmogtcn8IfuzH/v7o3/y3/80/Pt2v/wMj25UzY1wlBO7x9NOb/Mn/+A/zHd/xYcYj/ZBf/sVf48//ub/Ip3/tS0xn"
+    "XWYYiwUGn/VFCx3sMiOLSfKozNLmiDnTOqBjW6B/raTenqoBcyYrzYdMr6QRNNZ9ygwkJQ1xnVEGhKqu1aVcilTjEV/7oa/j6Wff"
+    "pI065zdkpzqrJNo+Um4QBTFCXdd0XYeIRiLtug5TtujGyOc+/at89tc+x979+6zVDVYMoeuomoYueGbB02yssX3yBB/+5t/M+vYW"
+    "vnTIrJqorFUm4ANrzYgYAnduXOfnfvZ/oZvs6zvLlsygOl/nVBd4oG4y+ucKhr/7Df9RGN572LE+4rzfCqtUEKxQdWjx6+9HqTwW"
+    "W4BZ8byD7bOUUaGqyrvZe+f7KRQ71dUSpRG38ni/f+i0WxePg0+YymFcRRsD4/U13vv+9/Pu93wNUcDHgHVuLvmGkG2y80BS0vK+"
+    "Ve+Nogy3bO0t7WmyO+Uf/e8/x81rN5EgWHSdQHIcMu1xqtqal8O8ZBSrynOIYf/RQYI8EMg87as/FAsp2YgDk5jFFltZRk2lIdu9"
+    "R3D4NrH/cELo1FKknexTO8F3D4DJza//wPt+zz/65b/1M/OMDLC8tLcC3/3d37P+03/nf/vB5EdfO643ZeandH6Hyra85a1n+IGP"
+    "fScXLpxkNGq4euU2/81f/Zt88pN/h919x96+YTI1tG3F1DtmXUXnG7xvmM4cs7Zi1jra1jFra2ZtRdvVtJ3DhwrvHcE7fGfpvB7r"
+    "fIUPjraz+ODmx32oe1SRosNniqkmpIqQKmKqSTR03s7Ph1gpza+p8MkSojLWmCXegFLCgmuYhUiQiklIrJ88zTvf+36a9U2ireiS"
+    "0A1imvVjlvleHKdol+OZRamI+R6fBHE1yTpCBOsaXD3i7t0HfPZzX2Dn3i610/huKRq8Bx/ArtXsz2acPH+OZ978Zi696VmiNQTr"
+    "CEbwxVcp0IYI1uJGI3b3p7zwwsvcun4L7yMhCcbWGFuDcRhbY11DiALGgTgwDjEVYir9LQ5MrS4yMompQRa/NRaVO5SQiiROiZz2"
+    "CKmWSAbvM2KwzmJMhXEGYypsZbG2wrqcVhZra4wzWLu4zjgNsYPJ37giNa7KvpMXqXEW43RWkcSoLW0msRaxDuOU6WHMnPScUrnW"
+    "2Urz7Jqc50WqJmc5nI9RhmBM3UstYgUkOwawFlNV6o82+yc4c/ES7/3gB6k3N5h0HdQVHYlg1IdzQOOrxV4agCiLNBlDMkbbkln8"
+    "jsYSo8HV67Rt5OWXr/Lyi1eY7k2pbI2J6oxGojqdKiHpE8qAY1KTzShpTmnwG6NmaOVc/zwiVK7BmQprHNbYTAYjFiuWyjiM0f81"
+    "HJLRfQJ5wLLO6QCawHeerm0RgUocvgt0bSB6nWGMmoq2mwLRGczn/vAf+89+/md/9pMHRfXeEHAobt9+MNrc2D6TsKJcPrHWNDjX"
+    "8Z73vYUzp8e4OhBj4O7de/zqpz6PD44oa4jdwtUnsfUWxm4hdgOxGxi3eYDEbWTaRNwmyHhOYtawZg1j13B2HWvXl1Jj1rCyhsgY"
+    "wxhrRkQaIg1JFv8XCqnGuPUlErvWoxFiaoxrEDNGzBjjRhg3wlZrSDUGVxOlJpmKzZOnufzMm9g4dZoWx8RH2mSVQSeH7gpXJhqp"
+    "CMYRpSaKpgFLoFqk4sA1tFHokiGImtYkWyPViC4It+7e497dh/iYcLZBcFRuxPr6FhsbmySpoKo5eeoM5y5fBtcw6SIzH5iESLIV"
+    "uFpT22CqNXxy3Huwy/Vbd+l8IkQDqSImSwy6yBGDxQe1qyxpTJYUXS9V5h+Tyb81TVhIFQmLNSNl3sdIrWtwdqxMJx830iizyalQ"
+    "gziEWqPbSYVu0NbAhzprUjd+JfXRECMrUxGrA8UhaYyoWVNEB48cuFRTNX8U6w5N9TnKNJOYnE/RLpk0UGPMg2hIdintgppbJamQ"
+    "fB3JzlNwkNQ6gaTf4lydFwoN4/UNNra2aNbX6XwgiFCNRuAc0TnaCJg84Nk8yFmXBzOnXrmsptEo09fgqY5oLEhFM9oAseztzXj5"
+    "5atMJy2SVGXlxGDFUGV9qbUWcRZjq0wO56olstbNqX9seJ0er0jZ3Kyv0ptLxRLnC2p6rDf7FN18YZKDaJFg8sJwNsvM5oAmQexa"
+    "nK3xXcSZEY3bqO7ffXj50qWR6nNW4JEM9+/8zz9z+fa9BxcTRS8U2J/dZzxKfO0H38HWiYrO79J2u1y/fo17D+6ztrGFsRU4pWSd"
+    "RvXMUce6lA5Eik2ozjRm3W1KSUe+qDawElU/JTGoY4ukkzeTgJSQFBAikgvRWotxshRMAJPtW03Cx+4ICqSQdD+8jyQfdetaSLrN"
+    "L0DXBhKGLkTOnD3PpaefIWLwQYPaaQcqkpIDq5IgubPNO16P+hJRIVstpu/OaT3evXuXa1eu5lXghso5XVlN0O5NmO1Ome7OWBtt"
+    "sbV5mrXRNt4bxDSIHVFXGwRvaTtD543OALzl7p1drrx8i9s371HZEaN6xLge44zDiZunkoTa1lS2ojJVlhgqnHH5eP3I1CQNlnhY"
+    "KiriHEjLeX2fvt+ZCicOKzmf4qhMTSUjnIxwNFgabKoxqcammsqMaewatV1bShu3zsitz+89LC3PdDTzZ5pUL71LYoWJ1cp01fMW"
+    "aZXJ5m9SKUzlMLt0fNV5g4Z3sKnSMA+dQDAkD1YqTp84yzvf9jWMqjViMMRomE48XZsgVVRuDDhMKa/8jUIDqcakBssIk5rFsVgj"
+    "oQLvVH8eInu7D7ny0otce+mlvKKf6GZTYujmzDCkhMcSksVj6cTi0eeYzmF9dYBM55DWYjq9ZkjiAaKqQkyap4UHRANhLi2rlQY2"
+    "z/ctGim8i0jI5Zq0bFOnDNdaS9M0eeBNdF0iRqH10ex3/ux0+uDJGe71a7dPjZuNbWsbpr4FhNoajA1cuHiajc0x1qhO5Itf/CK3"
+    "79yn86rXDMlrWjwTiSqkyUb5xduV6kSLUX+2w+uZ1BSy2SSkpMVyoH/cGB1By6glRdWTd4qV3zabrpTUZVtFm0dftRJYjMA6XXNz"
+    "6wERLfSUEqdPn+b0mXN0XnVEVdVkhX0p3uVUpSxdyNCRd2GaUkbioi81eQobo5ZxN51x89p1du491GCLydJOpoQc5y2SMHWFa0ac"
+    "Onee7ZOnMU1DF9UmV6VSUE2axSRLYytcMkx29nh47wHtpCV2fqG3ztKCSbnMsiZK8mYMQt4IkK+TmFSHln+vSkFtmQ9Lj6pvM9er"
+    "54F5kOpgbXJdL1K1WbYYRAdOHwhB9Y0xKpMoaUoyX9hZlYrYnK/lFHTQILPA/m/9Li33EBLJL8pJnyvzNkBMqjdNmoIu4B2WSl5p"
+    "B+bSbW1VvaD6aUsSS1WPOHn6DBtb2zzc3Scg1NVIy0k0X6GLS2sW5FA3+hWKvnWAZF3ovOxjInWedmeP+zdv0u7tU4lhXDdIFoYk"
+    "O6hPYkBEBRGjUrSRSgeWpMFAJeVvzGn5RpLRjR09MpRZA8icoUoOkaRqB8gLpwJJSptRq6iU1FLCWq3NruuIIcz7fcoL+eptzOBD"
+    "S1VVOFMDjq31Uxt37+7XpeiGKOV3KLpJOt22aSNE1QclBB8D9bhiPG5I3iJpxL27+3zxSy/SBZOnVokUPTF0pOjJw16WUou0misy"
+    "obafqjHC5L3+qrVfoFRoKaCjiKArwuVdJimz7b97mJa8gBo8Sw4X3nVBrStSIEaPD63+JnD2/HkuXr6EtWpqE6PuMurndQhjtPMP"
+    "SRtUbuDR4KQiZuPruh4RfGK6P+NLn/sSk/t7NFQaYdZUiHF0Cex4zF4MuI2GZ9/+ZjZOn2CvmzFLGgEKa9TuMUQkRGg9cTph8vA+"
+    "d6++xN7dW6xVWh9FCimdKuXFv/5UjbxYUTod83o6WCdL9ZMXSo57fHguRr9Ew2t1sFfSAIPLlEQloCHNz694/5NQyfPwu0TK9url"
+    "83pcTeqOznOfaeSukuPrSV6Nn3XqoD8ITH1HNW4waxVPv/VZUiVQCZGAjypxmgQu+4EWNAq24DESMKIKL2sizkQQT9vtY10ippbg"
+    "p9SVYCSQfIdpO65/6QVuvnSF2joqoJ1NqKpKF5JLfpfaVe6HJGxSXlD4Qimb/iy1X19aXmpxpJuOFqalWualP+o6nSSZkykzq5ij"
+    "bidIqUOsR5y+IwS15zVIFsAgpg4jVjduIAg1gebkf//f/tSpXndfwiMZbghyIuHqVKb66IC7sbnG2toaVnQ62s4id+7tMJ112dKg"
+    "oKcfyShS5mHpEIcxrkehLxE9Kk0DSUl6xtFVVWGMmW+rLczF1TXnz59nPB7TdZ1aXqzwUTvMe//3kDGXtLw7+oBFLQokGa689BKz"
+    "vX3d6JAspEQKysSjUT+8gcTp8+dY29zA1JUOlKJ2t3muQUqJ0HnGlaM2wp0b17lx5WXa/R3IDbSPYf5ee5R2U3RwpdOUtYjF+a+8"
+    "tPz/SvDKn1EsgcQaFZLWxjz17DM0G2uEzKCGtVkGf4UuaNFjepC3/EaPtbpZwVqhrp0KIaGjdoYHd25z4+oVaD21CKREbZ2a86nO"
+    "DVC1oOQ+KNnMrfRLQNUBAGQmncslke2E8/nCnNWCQ53R9GdFBQvhYDHrUPTld3rPTqhVynK/tk4O+ByOCN7H0633F5fPLPBIhru/"
+    "v38phNjkeY9OKa1w4sQJNjc3lRGFwGw248b1m8xm3avSKYeM6LXAUe+wCLHzc8YX8rbYlLcNRhLb29s89dRTVKOGaddiivnUiuf2"
+    "33Wc4/0KlpSwSdi9/4ArL7xEN51pAy27ZCRvJkHz1qyNuXz5MhtbWj/lWSmpNG+RuTmYFaGbtdy4dp07t26rjip3uGG++vl7rTF8"
+    "9+Ni2EEeF6VjPik9Cse5puC4z+wjRvX8VtZDYoycOHGCZ555hrpWxzpHlbGyGd18kUTXI+ZMKU/nnauzz4jsuyFqeHNi4ub169y8"
+    "fpUYOioxmJBwYpAQcZE52ZhnnqjFgm4biWpumd8bUYGhwET02hRxMeJKGiNVSrioy4+qhsja7V66YLJlKFkMJyH7vj5YIst1VtQi"
+    "Mt+ppt59u647tTebnl+6sYcjGe7HP/6Jerq//+aUkhMxuvhklNufOHFCd1UBKUHrA/fv38+reDnW8RuMVY20HFvVyProF+bS1Npq"
+    "kYk1nLtwnu2TJyA3cJ8jB/efPfxdUPIxzGN5rzFqd1s7bcCh63jhy8+x9+AhkrIOWlQNYYw2mC4G3T107iynzpyeT98KSj5EVIqp"
+    "nWE6nXLrxg3u372t0vRw2O5hVV5fKfrPGP5faBX651dR/5qvVByVv+G3PA50NpMlQSP4FBmvr3Hu4gW2trYOtM9huqq9kp87/99o"
+    "G015ECdEKudwznH/zl1u37xBCsoUy6yk34dSnm313yUUSTW/o68uORJlgSyoD+6eWCu5jwzLcVmKXpAy+v6Vyxi2s1Je5fkxhnE3"
+    "bc8M7ys4vHcB+/vPNQm5YK0xRXqLMWIFTpzYoqpUVysidF3HZNbiX/lM6CsCBsHlRTNQCw1jK5JYYhI2tra4cPmSbov06kehr9cc"
+    "YlVDLpU0TAFi0q27xEBjDfdu3eTF575MmLZUYlQKLQuBWf0RUmRtc4NLzzzNaH2NlI8XQ2+y5E5U/XrtKnbvP+SlF15kb2cX5xwm"
+    "6S6u0iD7jWvV71UYfucrRf+dx6Xh/V/JeC3yZ53T7RjGgVhOnz3L5cuX9V3GzPWn/XeXNrqq/lYxvZAizqikF0KgrmvoAi889zx3"
+    "79xhY208P0dlmaVAa6CzwswaWmPwpqwJqoypNrmq+FLLpZ60nSXdlCXQBHgTF2QTnU14m53XZHM7yJYvmZYk9R70HqXFmqFkOohh"
+    "WeWIEnWI/mJKq0rsEQx3dzc6YCMlzHwRIKqzlrNnzzJqmvmUdX9vovux88jVX+R8EhzVgY6Do+45zjP7PiDo7UzzMeDqiouXL3Hi"
+    "5Mm5qsHkKQa9KfwQq46XY6vONU2j/g1C5NpLV9h/uIOESIVujZyrOPKOtqquOXXmNBcuXcTVlRqH96Y/VrJEnCUSSYmdB/e4e+s2"
+    "vu1wstg+vCpPw9+rUBpgv+5WUR9HHVt17tXA8PlDeqUYPm9Ij8LjXFuwdE9eHI0CaxvrXLhwga3tbXxSpy9HIYnWY8iLUPPjmYpK"
+    "rZhIVXlTQQqRu3fucOWFF9nf2VXLnywFGrNgmB0qSRbGVniFiMYYK998GA9RpljUDGb+jFBoYdixtGZRUNaKjiyFue54NfrPS8Wq"
+    "SpmzjTFd/NEf/dGVpmFHvjOEqQ0hjAq3NkZVCnXtOHfmVI75oyv5Dx7s4LtIwmDzPu5XE4/bYI+Do55XCjQEbbTGWp2y24rTZ8/z"
+    "9LNvVlvZbN4Ws/ciMWmudlk2WFEFfiHp2Rf3j5dzJqmDEkLkxpWr3L5+A/ERqyaFc0qC+m1whq3TJzlz4TybJ7ZJanSYXfItNhRa"
+    "UemWmHhw5x63btxkOpmoh6dcDmpWd3AEXyX5vJYo71/13v65VTTEqjr+SsJR+TusjR4G1UEaPIKtHBcuXeLchYu6w01s3va6jKP6"
+    "V2G0fRSmnbKZVO0qJju7XHk+z5aMZTab5evU760KLYIEwcSDEuZBHFxcK1JqMf+aS6uYudVBkV7n+tmkdv7FbUCReMnb//uL9WXX"
+    "W1/lMEQpoyJsLpdXMgJnfuEXri7v3c448otTqiqiqawYrBOcVUcVxsDGxsZ8T32Mkb29vWwOtVgdfSU4rPJfKwwbnHNqcxtz6xSn"
+    "tn3VqOHcpYucOndGPYIZdenWBbXLKx3+qApjBTM7cDwmgvdIiDz/5efYffAQCarfStklY6n0lAeEja0ttk+eUB8PSZ3xFMuK8kyZ"
+    "m8ZF7ty6we0bN/Fth82Nx2SLjX7+hnldle9XG6ve0c/Xo2gVXq+29KR4Jfkb3hvzQmo9arhw6SLbp9VSyTk3N59ahVV9rl+eRXK0"
+    "Vt0YFvPLSgyTh7vcunETK8LGeI122qqokSC2HRUOG42qxBLYzNhsYs6K5gtkh0iYUsw7E5hosMnigrpTNMFio8Mk9QccKVuCF/nu"
+    "t4/CwAvT7Qszh6GUzbz/Wc2rPjMCyaTE+vb22komeCTDbduu8cE3SEQEvG8RE2lqx8ZGjghgdKS4e/8hIYGxFSGbZAzpKAyvPU7n"
+    "OYoeB0e9x7matlP/sdbV1KOGp555Gls1upsOQ/DqjMT74s9z9bPoV1Rm5nPJuOfwRRKQApURHt6/x5c//zkkBhyJ6DvEqHG2T54k"
+    "kUCgGq/x5re+jY2tE+zsT+ZbOsuA4YzVLZV5k0c3m3L75i2mkwmjymm+s/vHsukiDexuC/XrZkgFw+OPS6vwOPU7zPMw768Vht/x"
+    "uHQU+t+fsgMc6TkTpyd5diHiRmO2T5/h1Jlz1KOGNnhCNnFalKFKfOX9pZz6GOZPsrmicw4BGlcR2o5Pf+pXafcnOBwhJJrRGimA"
+    "MxWNqUnTljoKzidsF3E+0SRHYxxlM0pIOlBozha2uJLI9um6QUQZrOC8UMeKUaioO1GKyut0s0NeUCPLnmXbaU+6lmQwMWVroAUj"
+    "1j6UyypfX8qhqOnKBoiU1SbqizfVpm8K0cPKgwVt247EmCalRNfNiMlD8Fhr2Nxcn1d4CIG9vb2F3nOumP51DqO7YQozHW2u8+yb"
+    "38z65sZcT516o95xUBptqSB6XrhMdg9nraW2jr0HD7l985aaqM06Kus0/EeOeeXqii5FXFNz4fIlNk+ewDRqdxtzx3LOzfXPKdsY"
+    "EyMvPv8C9+/czVstiw9S7bB9k5cnpUdheP2rTaUcD6Ph9UM6Lob3DJ/zpHQc+Ly7sD/TjFFnNmIMo7Uxl556iq0T20QBl/vro9Cf"
+    "Yh+GlHSAbqqayjluXr/B7v0H+OlM22veAFTaNqVsVGeGmERMntbP6LoOctsr36FSbJ5d9vJTJNWQktqVl/Kal5syP5s3Tw2l1dT3"
+    "3JfUfedCYs4S92rhOqPHqJfKcn6TSJJGHj4Bw31w+8HImroqFVrXDlcZRuOazY0NrDDfjfXw4S4h6FbUUsC/nqEmK7kSrep/tk+e"
+    "5s1vfRs2b90tzDblbYQiaW4feBRKpZfOn3pbmcv/1lpuXr/BtZdexokhek9ltR4wora+Am3wuHHDxacvM15fA9FtwykJIQnWVDpS"
+    "x5QZtsG3HddfvsJkf191y8boCnHeZMCryDielB4F0/P2v4qGzxvSozC8/jAa3nNcDJ8zpEfB5pkIpQ32BnIyY9o6dZLLTz9FMx7R"
+    "tm1+9sKhTcoWBquI3pbkVWSxpAC1rWknLVdfuMJsf4Z4qHDq38KoBzWxhmgT3iVaE5iJh5FVagzR6aai0i9SUIZb1A4FRT3QWvCV"
+    "4CuhNZGJiUyMZ2oDMxcJNulGmejnu1zLon/xnZDywp+uTikMeQ2lV47F5vgwlLqa9xv1p1zNRtOVlXjok1JK8vyVFze6bupCCMTQ"
+    "QVIH4hA1Km9vKrO7u09KgrUaDubXO0Q0HI1Y1Sk1a2POX7zA5vaW2tvmBqDMdrlsjzvgSFYtFIkrBN1CmLJD8OtXr3Hv9h1tBIl5"
+    "JAsAjDALHqxh68QJtk6cwBfby6ROuAtC10FM1Nmh+e2bt9h7uKO6N+fUIL03ELwa9TfswEN6rZFWTNf79JWOYXkNad4Osvok5bZR"
+    "zjfjERcvX2J9c4MuBnwIedFXGWDKW4CPg+F1KQsFxhi897z4/AvcunlTB3XUaX83a+eSamF4pC5vF+6YTnbw3YSUOhLd/BpjDJV1"
+    "Wa+6+MaUBZwi6My3bhOIqSXRISYgtJA6nEAjQg1UOSBWWS00eddoeVaxZDguSnmUsp63J1VdCDFWbTtbWbiHMtwf+iHk/v2dUYQl"
+    "k4OUt+hVVdXroImdh7vzjq72b7/OkfUypVLOnD3LxcuX1A4378CJ2SSlQHr0qE5t8g690lHoNeTKOR7eu8/dmzfo2imSB7iu01Xf"
+    "kBJiDW3wbJ7Y5uLTlxmtjem87p03xuAymdwhrVXnKvfv3uaF577EdDqdd9S+pDTsXIdhyMAelx6F4fVDmk+fD6Hh9UN6FIbXH0bD"
+    "e46L4XOG9CikHtPrM9yU2+zJ06e5/PSzJLF0PuKaESmHburXcZ+J9+t/nubBvmA+TY+Jyjkme/t88fNfYPfeg+wHoTj/0ZucMTgS"
+    "VfDUMbBGZMMkxikwToEmBuoUqSTirCCiJo75bXP15JzZ5i23IglrIpXxNCayJp41PGM6xmFG1XVUPtIgNEbjrEliHoQ2sWDgYW5/"
+    "q54b0uFscQnDvlJ+R7BmfzUTXHmwoLajtdrUpjIa7gU0eOFoXNNkG9yUEt57dnd35+Fvhhn59You6Nbeejzi3MULnDhxQq0RcviQ"
+    "eQGrr2eAJUc0R3WewnCLNFmYYlVVhNBx49p19nd39Vkx4fLGCvKI3IW8q+zCec5fuqhqj97OndIJRYTKOsajETFG7t6+w507d5Bs"
+    "/lXseUUEyYy/Lz29VhgymCH9esOrnedheQyp6G9LXZW+GEJgPB5z/vxFtk+ewGdbXA3cqlPokIO5DplswfD3KkiW7HYePODOzVtq"
+    "UeM1Bp4Tox60nMHGiG091XTKxt6M7f2OU3sdl6PhdBdY359RTSa4EKkEINIFTxCT7WoX23qLftXFyCgmxq2nmUxwDx8yerjL1u6E"
+    "0/tTtmcd1WQC0ylpNoPOY5P6WEA0dFEstrvZHrhPR31/f0BaVXYZbn8RcGYJKw8CvOc9n5Qose5iZ3T1Pairstw5y2IMedFn1rWa"
+    "4Ve54b1RKN8hxnH+/EUuXLiAWEsox3sFvfzNi40Dj0K5L/V0ujFGbt26xY1r1/FtR2Xs3P9BaeQA0Qob21ucPX+OtfV1fNBVY++9"
+    "SgIpEUN2BpKloPt373H75i2iD1RWfWKY7JJyyWvT8bL/ijDs8EN6pRg+b0iPwvD6w2h4/euFYT+TvNjknOPixYucv3hhSfJdsjzp"
+    "MZXCeIZ5l6TCQ/93ESIKHty9x0svvEjbqh8RERUOrLUECYTYkdoZo2nHuWB5m1vng80JPjQ6xQerTd5nN3mLjDnnLaOZx/igm3Vq"
+    "hxeDNyb7y86DSoIqRta6SLM3ZXvmuRQs77Bj3ldv8LWjLb5utMX7xps8tbHFZtPgIphsv16iCZOd3CRRZUKRcheSLgvJ+pj8bMkN"
+    "UIym8fXKxnAowwWQzlcp7yx2boSIxVlLVVllLIY5g0lJNH7SMTP4RuC4jCQKYARbV9SjhvMXLnDizCkiCWNVfwTMbQVNYm7XuBgp"
+    "F3rQlBYroWV6VsppvmKe/SN00xm3rl1n9/49bSS50fsUEWfxaI24pmbr1Ek2Tm4jzupOs6oikHV51oKoxBNDx2x3n9vXr3H75k1S"
+    "dgBdAmQWiwbQ0OyvBoaMaUiPwvD6x6VHYXj9kI6L4T3D5xxGj8Zy1yyMsbThItkWphrzBhjb1Jy/dJntk1tMu5ZkdAF2Hhsvz6JM"
+    "0rz2V/IPy1df+iMzX3zgzo2bvPzcC0jwurnHZHO8pBtrqhjZjPBMNeIbt87xnZffwkff/l5+99e8n4+952v5XV/zQf75t7yLD58+"
+    "z2VbUc9mxG4GRKJRZmgAqx0SAJsiVQxsdx1vrmp+09nzfM/b387vet8H+IH3foDvf9u7+a5n386Hz5zj3VvbnK8qxilil/qgyYtj"
+    "xSNYb83iEYtkeq1er3WZlu/PS+lTu7/yISsPFszamTUaeoDgDZJGCOr3VUzExxmmgta3kBzB6yaAhQu9BfrSXOqtyh+/AT4ejGgI"
+    "5PL8mBtMv+EWB+gpJd0tVkb7vKjQBs+5y+e5+MwlsDDzM3ws4ac1Kpcl5dBU6h6xTIX0WVo5xSGHoJUteZUY4+hytMMUs3/a2Ywr"
+    "X3yO2f0d1qtG3dmlBHlVuZNEcIJUNW995zvZ2NxmOuswxjGZdVSuIcaITx2m0o0qtTXs3LvL7atXSbOZ5pmoK7cmkUzSyK6CRnSI"
+    "2pAO99f6aPpKR2mHh9Fxcfg9y+U2pFVlu6AFYwBDzNPqlFfWdVCFunZ03QxbWyT7Jbj47LOcOH8W29TZoUuiCy1149QUK3QQ/MI7"
+    "lySMpIW9a9kpSdaV5nYvTrC1pW2nGEnMdnb44q9+mnZnhzolJKjv6yiRGD2NNTQhcTIkPnjiDN998Vl+y/gk746Jp/b3uby3xztj"
+    "5JubDb5t+xzvGq2x0XU0wVMbUUsf31GFBK3Ht7rJKJiIDVMumMTXnzjBRy6c41tPnuBdJJ6dTHgfFR+yDd914iy/7eQpLpNYix6n"
+    "rhOppcEGwcSg8dTwGHSAkChIsqSBdJsI892jhUGL6PFyjW7rVUn3YFtY4EiGiwXJcUlJLmeEudd0yd7SVbcoiBQzkyHXf/1R+ryw"
+    "LNnOG25Px1n0XylLe10MtL5j+9RJTp4+ja2chlrPC1KK3DFWDBZL0sAhA8pcb5od/zjniG3HtZeu0O1NqI0leI/NVgw+BrU9JNGl"
+    "yOkL5xivr2NrNb0pzjnnjSQl9VXqhOA9N668zJ1bt4ihm1s9fBVvLFa1C0XMXfOglFvuSSnNfTAbY5j5jq1TJzl54RzjzfUDs7k+"
+    "Eyin+pcM89Jvv845bX8hUFcVEiK3r99gursHvlMXi1lwEJMHoNmM9RB514mzfODEed5sGs7POrZ3dzg1myjt7XE5BN7ejHn/ybO8"
+    "feMEaz5CN5szf5PU4ZIxav0gPrAGvOfseb72zDneZivO7k0533nOth2b+/uc7TxvcxUf2DrJu0+dZtsYUqfrJaWvSVJp2aQEqG63"
+    "YNE3BjxsadYa9L4V52I63N/YkQxXAqlfwQVzrl68VGX9kMhqV2jl2n76RqFMK2xejJKcpz7z1WlR4tyF81y4dHEeNrowyFWNd/47"
+    "b0woDpCPguQpHTGpFPrgPi+98MI8NHnbddjexoViN7i+vs6lS5dY21ifO80Z1pNBsoMamOzucf36dXYePKQyGmKmP5Ukq0X6v7+K"
+    "1wePaiN9lIGytMFiXeKzgHDuwnnOnj9HNdLQT316XIio46OA6mSj1ygqzlh2HzzkyksvM9nbn/eZosNFBJsitY+c6OBrNk/x7s0T"
+    "bDvDmomM/Iw137ERA3U3o06RU03De0+e5z1bZzjRJapW14yiEUKOzGutwcRA1XlOiuNt22d4y8YJTnvLeL9l3UfqFIihxaZA3XrO"
+    "uIa3nTrPuWaNNWMYVY4ONSXrIwoEEzXMOxpx4nHQ738FldclwCGOZLjYwp4WSHlBpjColFdMn6RSj8LwAx4XZYROuaEOURb8yrcU"
+    "nVZ579rmBqfPnp37Dy1T/+LQuY+S0yHTUj2RImWKxdN+b5HKWUuYtVy7cpX7t+7Md5LNy1iAbDtojOHSU5c5efrUfJGt6F1LfZDd"
+    "MBoR9nd2dRfQwx2MMSpJvwp2tl/Fq4dVbX0+E+udKj3RJDTkd24TXQw04xHnL11kvL6mMQQPPnIJq945b/+ZilMmeu/EB66++DL3"
+    "bt8h+aCWLr22LFkIq02ikcQpW7EOSDfDmkBjIk1qGdlElVpSmJBmE05XFZfWt1gzhkrAZEuCsn3dWNS+NkY2XMVJ11BPWuzehNGs"
+    "o8lWDsaqqoz9CWZnn/PVmLPNmjondw5EaLPKU+ZlGjW2WVYXqCP03EcO8elQsKocjZjUuW4F13kEwxUpPXMxfS6MIMY49y5VpufD"
+    "/w/DqkyuwnGvOy6G02jJ+YVlsxpE1OHHyRMYZ3VBLLs6TMXAPN/ff1ZBmQYN86+MVkdSXVjwpBBpXMX9u/e4+uJL+FmLyVsirbWq"
+    "swthsQFjNOLpZ59ltKZhUpacnpssqUcNMeKM5f69eyqNTCbqfazEcevltT9IHBxinxTaeJ+cvop+KRR9bn8Qr6qKENXHx/nLlzh7"
+    "4Tw4i88VWAb5w2jOWIfHe+4Tddei2tw2xjHd2ePaSy8z3dufz+RSnuWWmW4g4m0kOXB5HWEa94m2w9aJaFoSM7AJnzpmYYqIeiGU"
+    "2hCMLnDZHGQ15PhuoPrl2ggbo4bYauy0sbWqgpCIaQzJeNasxU5mbBnHtqsJkwmz2YTkIOa1G0nLDDCa3PYewWRXoZjEll/WVit7"
+    "0SMYrsZZLZJWYbje+/n+Z1gw2XnHfxUxZFqvBkxC/QfkZ4vIfKXfp8hobZ1LTz3F2sb6XHqcT5ny/32UsikD0PBcYnnBrn/OGkPw"
+    "LXdv3uLh3Xu6U6cMAk63b/qkkUfrpmH7zClOnTmNqysNmJeflwamPc4KEiIP79zj3p07pDz9DNl87Kv4ysKwneuC6zJM0sVgybsS"
+    "i+Czub3FU88+w3hDdbcl9uBxUdrvvI9nhlQc3UC2oMm7FB/cvacRHuzC3y2ZWYtV5+at90Sb6CQRK2UmPnld9yHifatxwSyIEzpJ"
+    "tFmNEGPCZYcyKrhkvwlGECt4SaTaEY1gagfZjWnMbbzETDPoJqJR02BIeL/w2aAzAN0MYWOvP0vMA93B8h+ilFdBiqJDkHUxxtX7"
+    "+w9luJ/+9O9OIrajLJplxBjnDDdlUwuyQxRJeWVz1Rx+RaM6CoU5PQkBPfMOXeUtixBlf3gMYMRBduUmYokB6mrEuXPnOH32DK6p"
+    "tfFm7/gB/b//HUOJsM98pScxxIFpDblBmBS5fe0GN16+im9n6nSDNA9rHbIvzySweWKbS089hR3V840OUlQOKeTgednxR2a2d27d"
+    "ppu1Gv49qypW1YP06FVBKZgnpd+AGNZL37TQFLvY0q6TwSewdcXps2c5d/GCWscY9R43xJCpPgqlH5UdioTIg9t3ufbSyzoLyzOo"
+    "grl5oyjTsegOt2v7OzyIHuMc4tEYYzmumMVqOHZjeeg7ru/t4EPSSNTRYIMKJCY7Y0pW8M6yE1puTfaYjSpCM2KWEj6CCYK0am0w"
+    "TYm2rnkw3efhZIpUGv4H8jpHLkNJgk2Cjdk1aS73OR+ZY7lNDsuwN8QlQUIsfHuAQxnuDwHJpBmIL1Jeypn13ueQ4PrM+QjX0zu+"
+    "lniUFN1nbgcLboEiqZZFsijQjEecPX+eZjxSr1sCJRJv+b7j2qqWckgmM8U+QiTFSGw7bly5yq2b17FpsS1y3sgk++IFtk5sc+7C"
+    "eXSMy/nIaoSUFpsjBOimM27fvMX923fAB2pX4azFpIWXqaMwzO5X8fpAiglj79ic2fbqxdUViDDaWOPkuTNsnthW9ZKoc6M+nqQ/"
+    "lntK1IbgPffu3OXOjZuI12ghkhae7mKWtkMIeO9xrmavi7z48C7XuhmTqmJiHDNX07qGWTViYiv2orCL4Xpoubq/yyyAk1pNJ2PC"
+    "iJs7xIroItpuDLz48D47lWGvqXgoBm8rkmmIUcA1zMZjJutjnt97yHN3bzIhQuWU5WmnngtgktSfriSjMc3MkL0WrGa6KWkAyflx"
+    "6NaKY5MBDmW4/BBJRPaNtb6MXmWlvm3bOVPoui5v+1Uk3x360KMY5apGURjJqt/l/+PS8J5iDO7qam5za/NW2dMXzoE1aptKmku3"
+    "0rNiOAzl+dKz4LDWzkfXcr8k2GjG7N5/yMvPvUCYtqpbTRrIMWVzsXo8IpKwdcXb3vEONk5uM/OdbsJwahNdFgBns5n6vI0w3d3n"
+    "6osvaUieMuUq+vVemZZZwbBm+uVGT0J6vTCsvyE9CsPrh/RGY5iffp4kT9NLqvWmFRWT+irpQiI5x9mLl7h46als/54tCnrtc1hn"
+    "w3cOqQ9rtX3VrmK6s8fLz79Atz/NPjoWzy1WNCV1rsZHYYblhb09/umN67zQtexubHC3rrlTNdwUw71mTHvqDDed5VN3bvPczg77"
+    "UYhYAgKuwudvLzO0KI69BF+4f4d/eu0aV2JgsrnJA1uzmywtNXtSsbuxyWcnu/zKvVtcjx1To7EIrTjEJyTPeiVlp+jJYqN6BSw7"
+    "25iX17LKtFCZ7QPYHFUlEsHQxY3HlHBFJI3H42nr94L302zwr50uxshkMtGQOkl1gv0pxWE46twqDJ9Xfj/ucwr694voJo2Y45FF"
+    "EuPNDZ565mm2trchT9Ufp2um3jfGGLE5imnKi3EpD1KNq6irit2H97l35w7tbIKOuZqvMpUUZ9mfThBjOHv+HJvbWyAa9dSnbI5X"
+    "viXvVKuMxYrw4vPP8+DuPXzbZUkhh/kxZu4zYYjH+dZVOKzjvhEY1vWQvhKxqvzKYC1ZchVR15xtCqxvbHD+4kXq9TFJBFdXqqPv"
+    "uV1k0I+O+/0pady7UVUTO8/tm7d4eO8+vu20nfaqeFjbUaAToRs13JTEL927yf9642V+ud3nysY6t06e4O7ZUzzvDP9k9z4/d+sG"
+    "v3L/Nle6GftGiLamM4aYBQ8Ai4bTCWKYVY7ndnb5pTs3+ce3b/Dpdp9rayPuntzm1saYq7XlH9++zj+5fYMv7D3kfmXo6pouabSU"
+    "ureGISJYrEZ7IFtmlJmxROjpsQ+2n4NlKdhkjG23tk48HsMFeMc73rrX1Gu+qnKwSKOMYzKZsLOzMzcHG48bRqPRnOm+2h3uuI2k"
+    "j37hrLq36D+7GFRHa4RTZ05z/vIl3Fj93TIYJA6oBQ6B5EGpr7Iox4vD48Yabl+/yY2XrzKbTFVPlhltYdBFCl/f2uTi5cu4caML"
+    "aKiaI4lQ5VAnBlEHNz6w/3CX61evMZtOkZ4rv6FkfpS65XEwZBJ6sKfXeQIqjf5J6Z8FpJR1jSw8gqlTfDUtPHnuDBefvkxV1/io"
+    "14agLg5Z0W/6v486R3FslDTdvf+AG1euMt3bh56+lgGzTaLq9wT4uuKhg+sm8iVa/ve9O/yNq1/mb155jr/74A7/091b/O2bL/OT"
+    "N1/kf3lwg8/5KXcqy6SpmTqDt7pjswwyAhgsURxTW3OnsnxmNuVn7lznp66/wE/depmfunuVn7p7nZ++fYWfufoSv3T3Ni90LQ+s"
+    "xVcavZhcriKgfxSrymX4f/9YiROo7T7vHC3PSnZ669adx2e4J0+en6aEZ55J3YsdY2J3d0+nxiI0TcPa2tqiEoad71XAK33moqAW"
+    "hRizBBtSZH1zk7MXL+DGDW1cbHKAvAW4VHyvkgpSfg69Kbpk1UGx33XOqeQRk5rRtB23b97kzu2b4APW5nflZ0W0c9VNw8XLlzhz"
+    "7iyd93QljlqvU8VsotcYx2Rnl5dfeJHZ/mQu8UpSnXHIq7gln6tQvuNRpb1KGns1MayvIR2F4bVPQm80bDZTlP40VlD7bSOs5UF4"
+    "Y3tLzQO9J4SQB+DD++Hw2PB7y2+D0LiKdjLlpRde5O6t21TGUhX7dVFmWP5P/V1wAl2KzEToGsf+2ogXTOKfPLjL333peX7qS1/k"
+    "p770Rf7+1Sv8/IN7fCl27NSOMG7wztGlSJREMGneEiUBMZHE0BrLdGOdW43ls2HKP7x/h//x6nP8xAuf5yeufpm/e+MlfnWyyw2J"
+    "7NUNExHaBKbSmXjXtTmfKrz0LUJSSir4zOOUPQp9FpqXNa2ZPT1aW3nzkQx3bY02xtjGnlPqEidrf39/qcOtrY/UO9CKFdI+Hrcx"
+    "Dzt1+T3sIEN6pKRT4iZVjiRw7vJFLj/9FLPg5w2IQ/Lbb6TluiGkF/KkxGhKKeGMpTGOB3fu8eD2Xdq9SXb8UfZuL/w6hAhrm1tc"
+    "euoZ1je3iBEEC8YSCCQCMXpi1+IEDJEHd27z0nNfpp1MkaiSclFnSFo2b+sLlUeW1RNBJbMnp8dHv15+vcPk1Xnydxlns79WQVzF"
+    "mQsXOXfpEohKvGWAbxr1pUEeVLWVLGg4E1hFABITo6pm/+EOLz//Ars7O/O1gvL8fj/pQxJE3+Iq3WgzjZFd49hb3+BeM+aFznMV"
+    "4aZx3K0qdo1llkPypKTx+uZMj+yYPKtEQ0rMjPCAxN3KcnfUcHN9jZdHNc83ji81wnO14Vbl2KkagqvA1pB9I0SJ6C7h3H+y1zAv"
+    "QTdYJHUxWQytCu9ZlZb/B20uGTE7D5utlYzwyJbt3Hpb1/VsaTU/Rtq2ZWdnZz7NiTHOd2SB7qd+pRgy2nLs1UTI7uyqpuGpp59m"
+    "89QJQorYKuvMjui8aUUHjwMGFkjYSqP/eu91a2SWQG5cucr+zq5OlXqe+vtMMBlhc2uLra0tXZAwqr/tS6qgtpnOWvy05d6du+zu"
+    "7EDIKo2YsKImPCWvPq3eifQ4TLfk9yuFwT1uPkr7OoxeaxyW35Q3rnjvKd7cyNP4kKM2VDkS73hzQz2C5RlUSgkrhtA92gqlYPi9"
+    "5f2C6jvv3bnLzoOHatuaN8yUdhqVuyy1m2KLbq1A8PiuU6tRZwmuoq0a2tGYWb1GGK2R6oZgKmJUCx1DRCd7JVSVHpO8SaGYdQYc"
+    "Xmpa2zBzNb5ZJ6xt0K5tsN+MmY5G7CWYBbDiqIw68A+hwzYC4tElrkAwce6aUVhsuDgKw3Irx3SkSLfetbexshKOZLje7/kYu1l/"
+    "665kHe29e/eWXL6dP3OWxmmQumFGDmtcR2FVhx7+PgqP6jxF8quamtOnT3Ph0kVdgLKqqC93rcpHweonL5B6JnIpqL9biYm7t+9w"
+    "7eUrdNPZ3LdBSmoNEXsDy/b2NufPn6dqarrMZBczDc2TzT4+u67j1q1b3L5xE0l5sSUvoMnAQU9BX6J5JTisfL6Kx8NS3WR13XyG"
+    "EjUwo3WOs2fPcv7iBbWkCWkee8+IEDq/ZEHQb7/9Ohq2heFvSXD7+g1eeuFFYucZVTUpBLUdP2TRtcBIonKW2HXQBRqx1Dj8NDKZ"
+    "BQI1PghdECRYXHZDWglzT3aWNPA+l+3L0Y0KI1MxMhVNdNgpmEmimlmqmUVaCMnis7mXS9l3CFmNkCNGiOg2yyCJ4BLBKJN36E7N"
+    "PkrZzftzj7/0yzYRA8KdP/iX/uDjM1xrR6GqbWtsSs6qpCQixGB4cH+PrlNTkGZkOXV6i2akbs77Etiqjrjq2FEYNpbHvb8UTBG8"
+    "Y9aTJqOxn06eO8P2qZP4mLfTlp1e/Xf2bCEPIKswhogxSwVRK6Wpag3gePUK9+/dw/dCLKdYOoUhJMFYy5mzZzl74byuPufdZj5F"
+    "9XWL6mUlJsRH2r0Jt27c4M7t2/qdWRoJOapESovQJaXDmMG2XpMOnyYeB6s69pOi/6xVNLz2KwGr2sCTwiLqfB7wUbeDJwfj9TXO"
+    "XjzHydOnESnhmbRebZZyq6ZeuBMcYFX59WEyU5MQufbSFa6++BIpRmqnsQpFBJ/XJVYhAQmVsuu6pq5rvF946apHY9X9VurlDFCb"
+    "Xin5jcTQaR7yM6Og9xjBZJeofjrFhEQlFmfc3F7XmQpr1VqjqhehwFIKVJUGbZ3vkpW8qSlL6avKRqQXaVhkns/SZ/vIA5Z3KT2Q"
+    "Q3yUHslwnVsL0+n+jNimykasJLyPGGm4d2dKCBUhASZy9uImVeNpu11qm80uRMcrRAPX6cr6YkEIk3dRlThCOWb8MKZQf/QdjsTD"
+    "awpFAsago1jwSFRdUEoBTMKOHJ0JnDh/lje9423s7usi4Hg8xrethuMofmyz/wHJup2+L4KYRG0ks+6x7+/WicOiafE96tspLz7/"
+    "ZVL2SUoURqM1vI+0HqwbERFcU/P0m55m7eQGe35KdDCLLVKp8xmToBZL4ypGruLBndvcvn6NFHSqZCyk0FFVFhFd1VZ7aTX2Ntgl"
+    "stiee02lZBY01PM9mrLPiCekw+q5oJ/PVTiYn2U66tvSio0D5T3D+5fu6/8/aI+raIjyDgEqY4mdp66dmgk2BjuuGG2vc/Hpi6rn"
+    "jJ7KGXX8nbz6uzW6CJy1uOTIe/N2K1Hba0qCqxu6EHVtQCy1renaFpeEvdv3uPb8i9gsaHRdR9U0S8y2TPEXbceSSkgccYSU1BTL"
+    "qiliJKjzfqP9M6J602jUqX4QZdZinLbRpLEDEwaP4IvjJwKVEYgdPrV4G/AuMU0dsxRIAs5EJHV0tOoJzKiTJwGcqbKPYe2zIJio"
+    "O8+iLPwPi3b+7Iqx6JM1FRG894yaNbRIDM5YKnE+SXgwL6QBjmS4s9ldby17zkmatBNmfoalYjYN7DycMpuq1Cwmsb7RMB5rjPpV"
+    "WNXAVkGZ1ytHSokueCQmtRAopizW6FQsBra2t7n41GXWNtbnVspt29I0zdKzhj4SDuvkBanowXJHbdsWZy3ddMaVl15ksrev+tzs"
+    "aSmEgHFqb9nFhLGW02fP0Kw3ajM7d1OXBysdnIkhYGJiuj/h9s1b7Dx4qIsLKSxJrqtQpNuhlFsQj/7E1wWPKuevJJRme9QM4VGD"
+    "BH2mm9tPjBGsYdrOaMYjnnnT06xvberUOEtuoDMaFTRU3i1S2fy5mea/s5Rmsz9dQiT6QFPVSIjcunqdye4e0Qckx71bUmcduRM7"
+    "O0wvaY+gx8BKmJsD1yxj5fmyqCbqZD2aSMwOdxS5JExxGLV4XkFKolv388lUdsylpIvTB2a0vfLM/bZt1eIhBM8s7hJSO62a6mHv"
+    "piUcyXAvXnyPH41Gt0IIEQy1HdHUY6qq4eHDXbou4GyNMYaNjS1GozFGHNEvpjNHNS5YFNwC/f+fHGURIQ127MS5/17h5JmzXLhw"
+    "YWllt23blR1j+Lt/vI8ysPQlpRQiVgwPHzzg+eeew+edepJ1qyHbThpn8SHM7W7HG+sqSfU7awKbNzpIUrXFw/sPuHXjBvv7+/MF"
+    "uF+vWFX25fgbgWEbOAyrGc/h33MURFR1BAtdbtd1bJ08wdPPPtObJi9mfQX9/4fvHH5LjHGuJovR03ndqfjg3n1efvll9vb2tJ31"
+    "+s/wmV/JOE5eh3Wz9Lvnj2UxixVI2sestSARVxkqK1gcta0ndWWejOH+8A9/rN06sfmcD11nTYNxDfvtDN8ldvcmzGaqlzFY1kfr"
+    "rI3WceI0Uxze8cvxfuNY9XsVDnvmENYuFqOKHrMUpg+B8fo6586fp65rZbY59pMZbN09skKOgPQaqXMOP2u59vIV7t66rTrd3EmL"
+    "HivlTibWcP6C2t0OB41icF7yWFvHbH/C7Zs32dnZycz4+IHv3iisKr+jyvWw41+pkMykXmm+E9kKgEQzHnPhwgU2NjbmLjkLyruO"
+    "+87CROcMNGTVWYJ2NuP555/nzp07hJ7T/T6O074eJz9PiqOef9jxAtNzmi4DJ+pKqiIpDLZQmYHv7u4SQyDGlq6bkdBoGMbGXWPk"
+    "/vB9BUcyXAAr5jrYFoTgi4sGw2Qy5cHDh3Op0TnH5uY2xjhq1yw+ONvSLZCAREpx/j8sjI2Pg0cVJqCrtbkAU1I7RVM5xOqxs+fP"
+    "cfHyJaKobZ9kU5em6eX9MdFviCEV3wWBUVPx8MEDrr74MmHWIl7VCXMYwceED4lmbcz5SxdZ21gHUZeR+tysK0u6CGeya8f7t+9y"
+    "9eUrtNMZtc3OxbMDnKPojcCqDrLqWB/9c0dd91pg1ftWHetjlZT7uEjoxpmUN9CklDh/8QIXL2l7LfVXesuCSSyo6ECH23BL/lNK"
+    "pLzoClC7ilFVM9nd0/Y0m8zNslLSmF66cKShm4o6YD51P0CvDfrfeBT6uvVV6oQCyXQoUpZqe1emJDTNiNFoRFUpv2jDjEm3x6Td"
+    "e7h9evvO8DEFj2S4U9/dqurxfogBHyKNXcdVY7yP3L17n9lsptJWXXP+zOksVQbdqjrAUR39sHOHHX8UhqOzFJ1LdlJz/tJFTpzW"
+    "SLwp60aLI4oidb5SSJFGO8+9m7d5cO8ejhybKQG9aVog4eqKU6dPs336JKaudFpZNnEUn8NBGWotlnYy5daNG9y7cwuiOomWWFau"
+    "v7Iw7CDH6TSPOv/rEY8a8Eq5JIEu6vYWV1dcfuZptk5sqwWQmccjWDDQxygqKavsZeaUdySamLhz6zZ7Dx4Svaq5ikDFK+iLrxZe"
+    "rfbQ//7VtHiPiCDk9Z9kSFHvnU2mTPZ21TOagcpUVMZy9tTpe9/7vd/1ZItmAKdObT6oqmoPRNcIo9B2HV0buH79Og8fPiRGz3jc"
+    "cPmpi1S1zdKrbjcdKtcfSTl66CuFxITL0+uUXS/OupaEYfv0Gc6cPavBIVNe+Uwa9mbWhbzqqFjVQUpDPQpqsqNM9cb161x5+UVi"
+    "O6MStQuchyiPEYzBWMvGiW0uPvMUo7W1+QJZeU/MJmaSzcxiCNy6doPbN28QfcgmRAu1ya9XlPy/0d8wtEDoS0qPm7d+Zz4K/ecG"
+    "EiHvUjxx6hSXLl+eqxfK4Bvzqv3RWN7nT5b+yrskz5S6tuXBvftceeF5om/nux8FbcP96/v5LAtZpf+uwuOW1yo8zjMW1x7kI+Xc"
+    "gbpI6kVPrYyWz0uOQFGempJaFompqaqGFAUfPV2csT/ZffDMxsXZ/OYBHslwt9ZOXZ91+zetceqnUiyCsLM/4ebNWzx4oGqF8bjh"
+    "/PlzjMcVtes/9pGvWInjNNCjIHkUCyEQJbuQM8JobczFpy6zub1FjHFhm+oco9Fo7pCHFZXyOHlKIZJ8oJu1XHnxJW5dvY4E9cBk"
+    "yuqzTtjAqKenrZMnOHv+3NzuNkS1vdUL8yIbgkOY7u1z8/p1Ht6/r67rzMI36XHz+HrhuJ3luNf9esBxmWxB/9tjViVQWaqm5sTZ"
+    "05w+fVrrN9vB9hntEnM44p0pP5s8i7M5RI5JMNufcP/2HW5cuUrqdHZY1gwKled+Jc6gCrQcV6s1+mU8/L/Q4pw+o+ya7V9vki6u"
+    "pxgx2WGQM47GjQJibu2PDnc4/ciS+8hHvulOY+ytlALNqGYWpzT1mBSF27fus7/XYozqDi9dusDGZsN0tjvPoDa6RWX1P6xgVQNZ"
+    "dd0qDBt1v/BijIjL2wYxWFezffIkZ8+pv9vWe4ytSGKJEdrWU1tdqCrP6kMGyvXy7lUN0BhDU9e0+xNuXbtBN5tRG6vuEnP+rHMY"
+    "55j4Fpzl2be+mbWtbXw/tImt5vaxFsF36h7v4d373Lx+g5TNy0JQKTcWM6EB+uUy/K5V6DOMVfVzXAzfter9w2PDvPbp4OLG6u9a"
+    "dewwDK897HsfpzwOy1dBjJGq0s0E5Xmp5882kEAsWydO8fZ3vIvJrMXYitYHXNUgpni/MirFlggG2aa6r7tNKWXb9kU7La46p5M9"
+    "KqdhxL/0hS/i2w4nRoWCzmNyfD6C2vKmMis7BAdmrJlMYe4lovUjrjmoEz4eqa19v37KuYP1t1TnURYbGSRqiCqNMEbKi+7WWipT"
+    "0XWeFAXraqJuRND7QvIWufn00251JzwOw/3whz80bcbVvZhmaW9yH8EpA0uGT//q57ny8k02N0/TNOtsnTxBM6poGl35TzGv8AEU"
+    "5xHZpu+4WNVYjwMRtbm11mKsZX82xVZO/d2e2FYJMmnDHnagYcfto1SY9CSAkHfW9ZmBiYlu1nL72g32HjzExKzmyNt79QaZ+7s9"
+    "fe4s65ubRMBH7SCSjauN0eCBKfsnnU0m3Lh2jf2HO6TWk6IufpR8mex57NXCsAyOi+F9w9+rjg1/H4bSWQoNjx917fB8H0edP+z4"
+    "k6K0m9KOYk9fWja/XH72GdY3NxBnwarqadheCx4ndzFGUtCNPrHz3Lh2jd37DzSaQ5bi/llGv6xZ0UaGTLlf94Jlf28fev5wLcIs"
+    "7e29461v/7Xv+q7vUuPcFXgkw93e7roYw0si0a+N10kEjHH4Tnj5yh2ee/4apIYUHZcuPs2b3/RW9qaTJcbUl0gUsoIOx1ENfakg"
+    "ev/7xHyPuYgw61pGa2tcfPop6vGIkLL3/J4OtzxDHtHxyBXWl3TLd4Iy1hQiO/fuc/XFF5ju7lCJOpIp0mjCILZiFj1r25tceuYp"
+    "xusbPasESEYdlhTfpKKyDHdu3OLO9Zt0M91QUbaAlkgOh3XI1xNHlR2HlO/w91EYXluedxQNr38SDO8bbiAp9CiYbH9NfmZf8sII"
+    "IUa2TmzzzJue1fYaNfqI9Gx0C4Z5Am37R3XvUiajqubBgwe8/OILTPZ252GYhtLn8N43GofVax/LmyUWku7yRcXWtndoLsULxlis"
+    "VWdWMYD3GuXBukr7v9EBs43TtDXevHny7PYXD9vWy5E1kvGRj3ykfec73/ozKU13p9M9nHHMOk9db/LyS3f4a//13+Rv/M3/mS99"
+    "+SrrG6f4+m/4JkbNeF7hKWVRPRsQDxX4ryVC1FX+Lgaa8YhzF86ztrGOL5YJg50tJjO1YSUOf5Olk9JBimSbss5YEuAD1194WWOK"
+    "leijvcoslhHNaMTFy09z6sw5YjYnk7yttjD1EILuZ7eO6f4+V158if29vfl+e2N0Cjhn1K8Sw31Ug34cHPWcJ33Pk95XcJxOuwqP"
+    "e/0qzAfnnoOaIukCVKNG/d1ubZKANvi5Tv/VeD85D23bcu3KVe7cujVvT/2t6308SVm9EQiPXEhceOgr6H+bYCHl+GeZYjB0XWA2"
+    "a5nNVC0YfWDaTUl0GOiacfVLl09duN57zQE8kuGKSHz3u9/9mfW15vMx7QUxCWMc+1NPVW3zqU+9wH/wf/9P+I/+xJ/jH/6DX6Fy"
+    "m4jp+Z/MonvsuXJcvX138XGrsnVURa9qCLZE6DRCSJFzFy7w7FvejDj161C2zA7vm4/qR7yPXGGF6RZmWxiktRY/mXHtpRfpJjPG"
+    "VU3yut02pZQj7sJ+N2O0scm5SxcYrY0JSe+P+ZtiZrIxm45ZMdy9fYcb168zm0wh+7uNvre/vReW5JXgUd//OBg+a96wV9RbOfYo"
+    "oqfeeRSOc93w+QvJ6LVB6s2KytS2tCnvPadOneKZNz0792FrK4c4HVzF5uCmKyCZjoLkwbmq1D78yksvM9nb10Hbd+p7pFgLZfv4"
+    "4rHrUCp29I9hT/9aobSPvj+/YX3O67nMbJNquVUDbrG2gVQTvNDOItOpZ7LfMpsGfOvxPgAqSEGirmUH8f/Ld37sPYeahLGSs63A"
+    "b/7Nl+5UNf+DFbMbo0eoWKtP4NsKSRt8/vNX+Imf+Lv8R3/yP+XHfvyvIdS9XRk9JpqV+logx3r1Evqd7VEwRuN++aguGC9fvsz5"
+    "CxdIkrf9Zma71HCLGiSbXh0FO9Cl9ZltDB33797j4d17SEzUYkk+qKG5qCewmON8bp46wcaJ7blryOIJrDzb5IB9FmFvb49bN24y"
+    "25/gxFBZS8rBIcnNK76KEu5RGDKoIfWvGd5T/u9jeO1x8CT3FAzzOsRhx18teO+RnhqqDNree5xzXLh0kROnTs6vs079Kqe88UHy"
+    "LOhR+Ry2hX75xxi5c+cO9+/fX7T77LP5OGqRNxJlEB1+n+LRDD/Nhb9ldaKeU+7su8Rk37O/N2N/b0bbRkJeJGsqXacar1WEOIt7"
+    "7b3Pf/C97/q5j33sY4cumHFcrvdv/Bv/RveBD7z/r9eN+wci+C7MUvCGGCoM6whr7O8mPvPpL/NPf+HXuHHjDrNZR2g7YqeOtyXm"
+    "EaQEM0wsdsMkXRQ6rg7sUY2MzAALtk+e5NyF8zSN2sxp5FOdegwr7rB39zvosKNIHildlqrv3r3LSy+8QOjyghZQ9awfSrqxvcWF"
+    "SxezTrm4XdRvCyFQVepmrjD3a1eucOv6DUREHadX6n+45Cex0P++ljhO+R/nmoJV1w7Le0iPuvZJzg8hr5OkSx7AS5s9ffo0zzzz"
+    "jAoDOQ/kNi09qewozHWvK3SUBffu3uXKiy8xm0yonfpnML1IEwWryqZvl9zHKp3v64XD6ncVVpVhzH5Wuq5jNgtMJ57pxNPOAC9I"
+    "FLWhKNvxmdF1bQR//elLl/7K7/i+3/m54TOHWF0TK/BDP/T7v/iudz/753y496lxZWdtnFC5ilkXaewJKrtF21qMNMQgTPYmTPen"
+    "zGYtXReIMTsFjoaQLJG+jqRAvfpEiT2njeoScUirC1WfV/TE1lrdvXXmNJsntvGSiFZDoveZX///0pB0QrWolOHbYtS8uix5mKQu"
+    "9VLruXfrNjevXqEuMcyS7hYqeuMueKIVTp4+xbkLF6iqSmOVZQnHGEMMUFunfkWNRULkxpVrPLh/H2dVfxSj104qqqtm3uiOXa2P"
+    "jdXl/mjofWlOpW6tgJkfX1xbzkNheGWW5DDJYamQQnnf+2IgP8hk++cWg6q+N4kShsX/vby8UqxiTM7myWiWskSEgGDqhpPnz3P6"
+    "/Dk673FNDaW95S30Ns+CTA7YOMSQmfQHDJNyRAMfuH39GldeeAk/Uac1kvLMMNuup94GiePi1R2gVkuqsRc6KKLqlTjnIyrAKXJG"
+    "islcT7CzedZoJfv5TobkDV0XmbaJ2V5LO+mIrUciWOOy313BpETbTRjVVWy7natb281f+sHv/52f+KN/9PdMSh4Pw7FXsH78x388"
+    "/uRP/n9f+MVf/NVfvnP7uk0hXfSxG1sZSUpGQhCaakTXepzoVDdEtV8LMdKFSMBgbIPYbL+W1GG5JGUagaiNXVAPmFEXoGwCm9UT"
+    "2YYAQUgIISaMsThXqRPvkEcgMYQYOH32DG9559vZOHWCYIWYdbdlOmaSPtViQYxuOFElrnqA6LVdEX07qG4YI4Tg8cHTOIcBZru7"
+    "fOaXPsX9G7dYr0e6ASIlsBCI4AytRKr1Me96/3s4fe4sPiWMdcSUsNYRo4aen00nrI1GpLbjygsv8NIXv4SfTHG5HATNJ3MrC8GI"
+    "WjFKdv1Y6LGRSliTUuILKwlBF/wKVj7f9G7KJBJBCqMtNZj0XQKpZ2ZjUiTFoF3OVhipSdGSWiG0Bt9CDMqWRSxGNJC2jRHJkY1j"
+    "SqQUVT8nksekvKNIUH8AJhElkYz6ZsXka4utaGlth5WjqDe3wmgWlCOHiKh2SnShdl4cCUxUO+u27TB1RRDD1tkzvON972W0tQGV"
+    "JWXVk+QdYTHPmBaDhiIlvU5bgQahnM1mVE1FiIE2dFR1pWUfE93OHp/5pV9i+uAhLiZMNllsO12BjwldC5AVFZlbX2kZKWndaf2p"
+    "JW0/X32sLMOViIDWk5DmbSOi5RpzGPXiu9YUX87JgEAk5HqrNE/JYpJR08z8fEOuFw+xTcxmkf0ZdFMt4xQ91lSQBGccqeuorCGF"
+    "SSJNJjFNf+HM2Y0/+/t+3w/++J/+c//+3eEXrMKxGS7Aj/7oj8YrVz778p17e//gc5/97LUYw6lZmJ101tVdmkpdVYAnBNU7abQ2"
+    "rYiY1Lg4JEg+5vAvSZXzeTFJcsPVzleaj0WKs+CkDDEmbQdicmVIUvaTcmO0VgvSCG96+9u4/PTTyKhGnMEnHRkLsy3CjLL+3B9F"
+    "5rOwfgdZinGWvY5VdUWKUVUGXeDGy1e5+sKLxMl0vuCVUsI4HYk7ItEZzl++zIWnLtOsrxOJxGx3m7LLRTGqT2usY+/BDtdefFFX"
+    "khNEH1hs5luWAhYN+rgN+zBowQw7yPz3CmZefksZmPKpZMrvlGcg2onFGO0o1hZX78qs5hJgbkPB4LtAN2lpZy1t29HNtJ2lmCAF"
+    "3cUnuasbIRijA2eWAvVZKDPIIeYpzrI19+hZPSCvWEwTba+lgUn2EJepKl7dRPPjE5i64k1vfwfnn3oKM6q0BnL5lnIu9x+Fck1K"
+    "iRLNoKgJJKhp4tXnn+fq8y/S7U0wIav7jCFkA/8yoA7r/1EQ5ZCH5vHYz5M0mKlpu0r54XF+alFvQt6WS9SgmwgpJFIkO/Ixcx/U"
+    "utkp0npP23b4NhJ9IgXlJcHPIEUq5/Chw4q2sxSmLbRXnPX/w1vfcv4//r/8sd/z0x//+B/Z7WX0SDwWwwX44R/+YX7u5/7H/b/1"
+    "U3/lV5rxib/z4O7df7K7e8dUNmztt7fXqgqjsTHLThhlhMQEMUAXiH6GI2JiVKkk72xBLCZVJDEEY4hOd4FhKshuH5NJiEnqwcgK"
+    "iE6ty8qomIQ4wQNrW5t8zfvfx+kL5+iCxzirnsGSNi5QvqKTO20IZTwuftHmzSP/M2/4eerVVKM8gDh27j3ky5//Indv3Mjftmhc"
+    "1jkigk+J9a0t3v7Od3Dy7GmwVh0eG40eLFl/60RwRh1DX3vpZV58/nn2H+7QuIroPWYeleAwCaIMWE9GQ2a6/OzFtLHPZBe/wYp2"
+    "Yu0fObqCWCUcAUMUS8LixWgHwIE4pHjkjwZ8IrYdYdLSTSe03ZSUOkJsibEDr+sEKURigmAdyTm8WUhoyUAUQ5AEWKJRBh/F6ICO"
+    "1dlWskiy2Ggfa1o8LKd8dFmZOWC4KSV8DCp9GcMsBjZPneC97/8Amye2FwP+YEAbSoxHQYwKBaaYm4WICYnZ3j6f//SvcefGLXVS"
+    "k5mZMUbboqhMyaHfdjjm7WB4ImO5nRxOQ8lakiEhGolFNHw8yn6x2cJAr8gzAptnAxFsFCo0vl9KQhdhGiL7MTH1ga4NBO8x3lMl"
+    "T4XXNlxXjGpL201SZemMi58ZVfyNN7/l6R/66O/+3r/6Uz/9X37pm77pmw7dxrsKh5XLsfGJT3zC/k//0+fP/cRP/PXfeufOw4+l"
+    "lL42hPQU5qRDai3ABMUoX5mQSnCVtVRVhc3x4ouz7WCgNYFkypTfqktCdLqIRJLvMLUQo+/ZMGbLAbF01vGmt7+Vr//wNzLe2mBn"
+    "sg8uhwApjbYXDlnnwIqUdMhgxdQNssRmNXBj7RrER0xMPPe5L/CZX/lV9u8/pAZMVI9LIanX/lnwSGV5+m1v4d3vfQ/N1gYhQZfA"
+    "uNzpkRysLzGuanbvP+BTP/9PufriC/hZy0YzJnRdNtNh4fE/43E7yHExfO7cx0MPi2sSNpVgfZYghigaTgmp9IpetkWyhNJ7RwiB"
+    "1HnitCW1Hh9a1WOapIE+k7YrE9VjfxKVEM2owY4qTHYepJKdbhooulIgb3XN3TmhCyJZfQWQxM9D/QxxvGOL9hRTUtOqnv646G4r"
+    "1zANHXY85k3veBsf+vA3Qe00bPeKcl+Fg+9eHOtynD5C1DWGzvPiF77Mp//pL7J/7yGuSPVJI42E7Az/cSTc/vvL9WWsGebtWM9b"
+    "0slm7dT8Meq7OmZrDfIz1XWp9umUw/WA1md2bKrb932gDZGJ91r5MWiElBCpYsQlr0KBa5h0UwymjUxegviP3/KWZ/7y937vN//C"
+    "j/zIDx/q7/ZReGwJd4hPfvKT6Rd/8e/t7u5e+/SNG3f/1r1b13/2wc7udyZx2yCizm7IWlKjUzWBGCIejb3kk4YGIaEif7YChDy1"
+    "ywtPKQYdv0RjC+mMQwtdO5ZAgDYlxpubvOP972P71Ck8gKh9q8ve8mUu2ZZOtzwNzpOXJehCQrFzFazooljtHN3ujM9/5nM8vH0P"
+    "SYnKGA3J7FS66GLAp8j61hZvecfb2T59GqkcIS6YV0oRIxYjuhzkSNy4cpUvf+EL+LbVzpECzpi5BFK+v+A4Dfpx0X9mWUxZda7/"
+    "22oRaUmKqMWiKVYYBpMlGJO9Umn04kj0ntR2tDNPN2sJ05YYYtY1GZLRuHcx6d0GQ5l2x6iBMqP3EAKSZxmqz87vFM1jqV1J2t5s"
+    "spgkuX0qg+wvnj0Kw3Iw2RKmQEWJefPSMjAWqSz77Yyzly7x9ne9i62T22CO1pH3B45VUIFh8QyTIHjPuGro9qf82i9/ivu3bmvb"
+    "zQtBqcccj6rfR2F+fa7/1PtfKU/jjiDV0xqikXmdlPLTJ2Z2nHT6n1ctVG2UwETBoPEExejSaxcD027GxLe0XQddQoJgo0b1EzEa"
+    "D040vlpKCWNiCGny8+9739f8Kz/wA//c/+enf/q/+vx3fde3TRdf+/hYDCOvECKS/sJf+OHd7/6+7/x8CLNbSJcQnfrnK0g53rsk"
+    "EKeqg1mMTNrA7rRjMvW0M9Wl1AHqYKiiyYym97Kkxt+lYRjjIDmChxj+/8z9eZBt2XXeif32cIY75pz55rnmKtSAAgooTMTASQNF"
+    "DaBabLlltRUtSw6pJXVHy462RcF2uG25ux0OuSVrYptqS9FBagxKFAhQBEESMwiAKKCqXk3vVb1683v5MvMOZ9jD8h/73HxZhQJY"
+    "JIFur4qsfJn3Zua95+yzztrf+tb3KbTKWd1Mnd5o0rbKFqnaFkkg8CLZLvzK1FtsoRdxtyOa7p5wgHer0rb/zu1tdm9to8Ld3734"
+    "fdK57do8Y21jneXVlTQT3yUwfWBwQkSSEaQEJrt7yTpnMsV2duqLcdD/qeLNx+TgcXqrxxYhnRlfujTu4uWpSxwxWrBak2md7LEl"
+    "Iq4lVBX1bI6rHW0TcUGI3Yi2iaB9RLUt2jl08FhJ0Ivtxpuj9/iqIVQOP2/x8xZpkl23FrCSBkgSmJFu7QuhbToC/9tJs29+728V"
+    "b7U7WoRSCWYJMSZ95sOHWN1cT0aJ3+VXy1vwTt/q60WylQNrS3fCR7dv3mL75i2i8xjeOFIscnd9/88di2MgigODFIk7pA70fID9"
+    "QaqD48xWNFoU0Qtt21LVNXVdE5yDEMjQZKLIokKHRBWNGLxKzcsoHqViGPZ7X33ve3/smb/zdz4x/V4ju283vm8JdxHO4bU2TSKu"
+    "td8xdXLwYo26w2qUQjo8Zd462qpGzVvy2pG5QB4g6y6UxdYzKkUQhWCTcbKk8TutSnr9MYePn8DkWbpbdW7BolLDafEaFnq9i0bJ"
+    "W8VbLWhZ4Fw+kJmcyfYeVy+9Tj2f7ycWEUGZrHuNGm0zllbWOHTsOHl/QNAdD1h1WOMiVERiJDrPtdcvJyfe6DEIShLedvA1xQWN"
+    "rfv4fsWiKZnujukiPggjHDyPSnUOzIvqV2s84NGExc+oiI4BI54sdh/SYmJDbCvq+R71dEI7n+GbluBiukEr3UFLQiaOoTiWxbNO"
+    "ZCl6ithiokPFlNpt0JigMU6gDvjK0c4aYt1C6zFBsEHIIhjxWAIKD6ol6pagW6L23XvV+x93LVcW3/vOeGMSTglcy+IjJeCFK2wg"
+    "mRW2Iiyvb3Do2FGysiCQsN031BdvkWh/p1icL5HEyihsxmR7h4svvYyrm+QYovQbaGkHf/b//+K762R3RxpBE0j0Oh89rmloq5qm"
+    "avGNR0JaoAqD6XSpNQkPjihEDIoCRYI4nZ+GzMqVv//3/3znq/77j7deOb+P2AAM1ifuW3e9AlkUChSlBHoErK/Io+uoQukiBXDO"
+    "01Qt1XxOO6tSw2QxQBClk3pUqKBQkQQNS+KthpgSW68/YHVrg1aSbmg84OYQu3HZt1pT+9XrW3RZ9x/rvrY6Ud+MUty5vc21K1cJ"
+    "jUubmyiE0GGNXSK0WcbSyjLrmxuYPHWg02u7GxqVpPEEfN1y49p19nZ29zG22HWQf7cX3w8i9hPtm75WHXUnqI5J2129qbpNSTdd"
+    "Egk786GlqWuqacV8XuOcAAlrT1BBxMaaMk4ZM+UQU04w5yQ1R5mzLHv0wx5ZnJEHTyZCoZL1O6IJzuOagG8ivg1En9aO3qcbcoAH"
+    "vODkvr1dxBsT7O8ylCIahRjN+qEtVrc20vvtNDS+VxysSL9XLKpbolAY24kpXUIHIdNmn8+rFoM8HTb6P3uou7uO1P5+63Hh1NXp"
+    "GEypw0PEEJWiaRqatqJpWrwL6GgwymKUTdVtaClo6NFS4si6m46OCWaw2qBQIYRm9ua/+/uJ73vCnQ/6SiJRRwNeY6KmxJAjbJQ5"
+    "7z53gsN5ZE0qlvycga8oJWBEEn8fgzY5EUsVPJOqYlrXtCHgYwK+fRuQABrTYXApeWVlge7lHD1ziv5ggDFZSmMmI6LR2mJMlpLh"
+    "4me7qiV5zqcPuomtxUKUhSbEAv8Toa1qrDGEpubqpdeY7uxSZvm+Gpi1No1l2tTxznslZ++7l+F4GR8kQSqdWpnpqg0tQEiMjhvX"
+    "rrF94zr1vKLMcqLz+42DBD0sXusb43tVQ4vHvtvjb0ya+5tsYsoPXVJKsfg9+zDLYqJJFnQn010Q6XlawCqVHIfpLoimYTZt2Nub"
+    "UzcRZQeI6eOCQtsMosfGioHMWGOHc2rORw+N+LNP3s9f+OAj/PRjZ/nw4VXOmcgycwbU9BBsR0OMyiA6JyhL3Qaqect0UjGd1ohT"
+    "KK/RQUEkaZ6qgGhBZ4kTTefOujjnB9fE96p04e7OQJF2UqYb+1aqs+bWBucj64e2OHn2dGK9qO5vHJj0OnhOFgl+8XoOxpvPq+Gu"
+    "nm1hM+bTGS98+zmk9QnkEYhdg4xuTS3e2+LvfK84+JyDr+3Nr+O7vf54QF/lzR+pseHQ0SUuPolLTbeWgkR8SEMPaENE47xQt46q"
+    "bplVDbO6Sr9GGYQcdIFWBURFFgMDHAOmrONZIzJUjp6OFKikW+09gjTDfv9tU77eTnyPFfN7i/5sIJnuBaUyMSpDk2Gjpo/i2KjP"
+    "U+eO80ff+ygPrxQczxqWwg69doe+qymCx8QGH2qCBm8MTilq55nOUgUUfKSwBaUtUB4yEpk5Rk8TKla2Vjl8Ilmf644ovu/icGDR"
+    "81aLZnG3l0T7AvCSlL3uNrYSBq1JkMLNq9fZ3dkhBofi7jRQJKBsZwJpNFuHD1H0SugGJmKMyIGETui4ySja+YxrV5IxpFWdB9r+"
+    "hZ4Uxegq8f3X/jYvkrf73N8p3up3HfzegnWiRKMxiVerNN575vOKunLc2ZlSTWtUVpL3RohkSLTkWQ/TTlkyNYdUzXHV8Niw4GP3"
+    "bPEj923x3iMlT6wa3nd0yEdOr/P+Y8s8WBo2qRmzRykz+lYlrvK+/rImiiFEjWsjVZWESFwrqGgxOk8kdzSu45G/+f3xNqrKxfPf"
+    "nHhiNza6+J7OLLrI2Dy0xXB5qRMcT62hxXl+u/FWr8mYxOzJrEVi5ObVa9RVRVxoehx4rvDGRtnbibf6m2835MAI8cHjvPjQGqxW"
+    "GAUKIXYuxSLd9alsZ95okr2NDzRu0Wht8I0jz3oobNr1osiiYFxFEfYYyYQ1drnfaJ4+vsETR9dYyRSxrXCxxfvUF1JYL0r/vppk"
+    "b47fN0vhzfHE+z9qnvnmcz/RtPo+RaksOTmRPo7T45KPveMsjx1b5sHDS2wNLLbxqLrFiKLA0OsuzkpHgiF1pXUCFCVC6DBeEyPR"
+    "NWRWJ3As1/TGfe579AGOnDhG41pQSbDZdJ3KGCOdenrqaB68QDruqRxIHCIJZ+vKFOhqYSOQoWhmMy6cf4Hrly8jzmONTovZKkKn"
+    "8BRFMRiNuf+hhxitrKBsjutYGUk7QfbhkiLLia7l6muvc/Gll3Bt3eVnhZLFdJQkhoY60AVfDBZwt9nb9are1ofSKlWwBz4Wl9N3"
+    "Jp3ua61IL2jxh+6GKFBdky9t2VNj0bk0m143jjZq0BkqKxDJCG1MVDExlLFhLLdYj9ucK4T3HlvnI/ce5V1HVjnRiwz8FHZvMcSz"
+    "Ocg5tr7CyfV11soc1cyZtbu0UbrJRoUxaesZYiQECF4IQSGhkw5VCqUSb1yhiTF1vBVpECUdkMXBeiPe+d3uXTGx7dNzVcpqIpLW"
+    "sdF4BcWwz/2PPMTKxjqtd/sOvfuDIr9DfLek1/05CJHSZMx3J7z4refYvnkLnE/jqd0f2P8N3deLJbD/7e/2Bn+H+L3+XAoBwn5V"
+    "282jLq4+RDRtG2haR1U3hKZN5qr7fNx044YCow0FkV6sGTDhSB55aCXnIycO8dSJTZ48fYLMKi7eucPtJhDVGGxJlIYo7fbqytK/"
+    "2d279PybX+HvNd4y4YqIPn/+9c0jR+45d/r0I8cfeODdqz/90z/Nf/af/VfyX/6Xf1n90A/9EL/wC7/wlmf7R3/0z+lf/8xnfszH"
+    "7GFNX2sMGULBjE0jPHlyjRNDxaEeHBrmrA0H9LTCzWucn2CYo8QTTOLSiQQS/UAgLsZNhejajs4ScDFpE2wePsQ9D9yHKfM0RKE6"
+    "OTutukWmuuTSfRwgm+yvsgMLZcFMWCRi3VW2Vmsypbn++hVefv4F2mqOEkUqKrqhAZMwMYzh+PHjnL7nLKbI6ACLRMLXCokhjRsq"
+    "TWkypjs7vHT+eXZvb6O1wnSww8FmmbJ3J4EWV47qFvl+Z/x3WO/7x+C7XRhv8djB5+9ve7vX94bHAJFuK41CvNDMG6rK0baeGDVG"
+    "pxMszmNCSw/FQMGIyBJTTpkJj68XfOieEzx9aouzg4xhs4et9sj9nJKICS15jIwyw9powNowZ2ADPW2om8Rl1qFFxU5uUKUmrWIx"
+    "sShISFTMKIs7RVo3SLqxHYz0Pt/wrYMpaz/2n6NSslAqjVwnSpRGjMIjHD15nNNnz5L3Slrn0i5qcT67au6t4rsl2jdETCPKVmle"
+    "ffkCr778Cu28SvCV1m943d+ruv1ur+Gt4uBz3+7PLd7LwfekFIkCKoJRFq072C8qvFcEn4ZcvE9cbSQ1vtKwUeLEqyjYGMliRU+m"
+    "bDDnlI08tFXyxOEhH73/BKeWSka9nGt3tvn61Wvc9hrMmDakqTJjuDIcDP7V7uTihQMveT/k58V8/Gf+Zvaf/JH/denL4daZ40+c"
+    "PH7swbPD/tEHz55++MR9DzyW/aN/9Lf3fu7nfm5/IX3HURER/YH3/NHHv/bMt//qfD55MrODTBk1VegXs9xc1SrcHC0PXnnk0Ue+"
+    "+dQT77gCozlcqT/xiU/E7ufVkc2P/N9v3qr/N6h+qSP0CCyxywN9w//qI4/x6JEepZuQGc1uzLk+C1zcqblwfYeXLr7Kizu3uUik"
+    "oo9oS1QZUVI/WZGSqASHtTrZnpcWVeY88NhDPP6ed9NbWkKwNC7QBIfv3E9T8r0rvaglLUygw3C7gWIR3MK69wCUQBSshhyNDfC1"
+    "L36Z57/1bUprCC52RPuE/4m1oBT90ZjHnnwnh48dp1WCJ+I7mpkoCK4lU5pSW2wQLl24wFe/+AV83WA0KJ/O1QIbBrBFnmCSDlOm"
+    "u0AhDQKkf6RP3y1+pwtCFpm7wzH3v7/4ewscsRuJOphwAbxzCScP4BpPUycRI9XdBLWG4CpyImOjKUKFoeGQGXHfRo9HNyL3rpcc"
+    "G48pmhpdzeipSK4FiS29vIf3nsYJXhl83qPJLBNR3JKC37oy58Xtipeu3uBGbJhS4FQfp/t4leFCYkAshE60Bp0ZssJic0PUAXWg"
+    "mv0OvPwAVYnvSIKdwL14VNRYnfjnIUY8imgM2WjAu97/Xg4fPwFG4yXBXguFuIMi4Hdfw/dOtAcf10pRmox2OucLn/0Nbl6+iq+a"
+    "fQwdElT25tjvE3QJ+XdaJ28V0lXpv1O8dbJVaIl3ecuikoaGqOS2EO6K/8eY+hpWKzJF0vGNoRvmMPSIjHAcM/D41jIPH1vi8GbG"
+    "Wl8omzmKjMqM+fQr1/nHz77GhXaAVkepJFAYTx22f+PcPUf/8osv/tI3utep/v7f//u9nR2z/MlPfvrUa1v9m5YAALoASURBVBev"
+    "PDjZrQ95F44Ym9+7N5kcDRKHKkhujPLGxJfuf/D0/+2//n/89U99+MMf9rx1hXtq6Zc/+ct/bT7nPzRmvNXrjVfbhs0YuLcsh+9s"
+    "W3nfne3dD1148dKPffkrv/3Rr33ta4++8tKdQw89/PTGBz7wh+Wzn30m/+ZvP/8jzsXHBWW9CBoho2Utg3ee2eLkWknpphg3B9fQ"
+    "s5pD68uc2BixWgoDFaAVCiKEGqTBiHTiHUITHVYbAuBjwNoCRGHzHhIUIQhaWYw1FGVJUeSICD74NGdtEoNif8FJR6c4EKHj2Wpz"
+    "N3NppVAxooIw25vw0vPPsbezQ2EyQkgsCG01YrrXVRRsHTrMqdOnka4qdR2mK5IaKhI8ubZYFJM7u1x9/RLXr1zpSNxpm2R0B4t0"
+    "OhC6mwR6Q0XR3UD2L843Pb7/vLeoXBexeEwplfQplHqDEAmkynY/2UIaKDgg6ZeSsBBah6tb6nmLbxxEg9FZanSiMNGR0zKmZklm"
+    "bDLjnlzx1Ml13n9mnaePLnNEe7Jqiq2m9Ij0jMaQqprgHMSIVUJmEl5baKFvIiObcXh5mfUyZ5xB7j2+aaiZ48R1zZQFTpded1yU"
+    "uV2DVOlOo2P/mLwx8d09hN+ZBO/eCNMi0yphNCFGRFnEaI6eOM69Dz6AspYmeEyWRrx1d2P9XlTFN8ebE7ECcpuhonDzyjVe+PZz"
+    "qBCTTOriqfruEIscYOXsXxKLr7/LWvlekdbPm7/7nYn14Fo8+G/pxtolaoITvI+4NuK94H3nixg8SMSIkAEmtChpyPD0aRgz4XSh"
+    "eGRtwFNHV3j/sXUe3OyzVnqKOEOqGVleEPMBL+/M+fqtXe6EDKtGZJIj0pBl9rJrw5ff/8Efn548fP+5v/23f/ZHfvVXvvpnPv3L"
+    "n/nzr7z0+p+ez+QnZ9P2I9b0n9yd1KfzvL8Rg1rKi94geoZtaI5t37pp73vw3s9++tP/dsZbJVw3UUdfeOX1Px3j4D4fSx1jTpb3"
+    "VRSrmyYaVG6LYjiMQW+6Vp2rq/DE9vbuR19//eaPPf/cyx/40he+/sGmdR9WmpUIKkoax9TiGGjPQ6c2OLHapww1uQpYiajYEps9"
+    "TJiwOYCzR9c4tLzOStlD1xWhnRPwiOg0wmTSTH5UFqXSwEPwmr3tCZcuXOXqles0vqVqa7I8J8/ztMVXCkwScw4hQAfPCqTkRpd8"
+    "SYQUYywsOsdKYbRBhUCoGy69/DKXX7sEPqQTb9IwhpcklSjA6to6Z86eY7SSBMbjotG14EcCEtKIs68aLr96MemTzufpglMJSlDd"
+    "8w9WtCx4lt3FcvBj8fibL5Y3f72Ig4t9PxZ5dtFt70Q/Fplmv+HRPVE6e6HGB3zj8HVNdIHoJUkqqgytswS9iKevPT2Zs8SEk1ng"
+    "6RMr/OiDx3nq2JjTuWNUzciqilyEMrcYibh6hvKefmbJjd1PGkFJGh2OEeUitm1Z05q1TLEx7rE86mNzjWsczneOuNok0ff91JZu"
+    "bhJjUoATl3DY/ePTHY/FcdzPXG9RCe7/U9AqDbhITDdLmxXkvZJ7H36YlfX1dBOOIanFxfT36Q47b/69B5KWegumwiIUSYlsurPL"
+    "Sy+8yI2r17Aq9Rf04lx36mUs3sGBdbT/vbf4+2833pxwv9trPRgHnyNe4b3gnOBcIIQOW5cEBRZZhkGRiWDEoWgpcCzpnGOF4mMn"
+    "1/jA8RFPn1zjkc0BJwqhDFPmzS7etVjTQ+yAvVjw7PUdvn5rhzsBrKTfW1OD0j2jOXnhwoWfuPTapf/4xo1bf3I+b55uG85KyNd9"
+    "0L1+by2bV95orNYqV4PRgL3pHv18oNrQqNzavee//eyv3tm7cpO3SrhPve+H7SsvvfJOpP+IMT0jopTETnFHG4w21HWN0gU2K1T0"
+    "yvZHK2VdV2MfzUlr7IMiLCultdaWoC3WaAgtFs+5E1usrCwRQqRqPG1MeKcGYjuHZo6OgZXhkI3hgPVRyUgbdNPifcJ3cwwxeIzS"
+    "FLag9jVlMYKocE1FNW+4evkSt27eZLY3Tc2DvKDIczQK1zb7TbOUYO9uC5WkVRcRlEm8xCQOnrh50TnaecULzz7L7vYdcmOI3pMX"
+    "BcpA0zagExXt0JEjnLrnTPraWoJOuOGCpbC4CDKlqCd7XHzlAjeuXU+tAa1Tl3bRvAtdxb2Q6OvU/xc7/8XForqL5GDXe7H2U3K8"
+    "+8yo7i7gN/wGRcLMtCTREJWwx4NZZ5Fw6XjRwQVcG2krh6sdwUmaYdd5GoFG0DFxH/vMWJY5R1XDO9Z6fOjMFu8+tszJMrAaJgx9"
+    "halrSjRaK2JwiARspsmsJhBoQkVQgWhAEh0BBRTa0DMG09TY0NAzsDQsWR4N6OUaosfEgHiXtq2SkPq0J0iJJkrEO5fweLoGkyYJ"
+    "I92953THdnHcFsmi27ksHk18TkIElCbr9yhHY+57+EEks4i9OzGpVKqwre1gKZV6BgfjjV+9dSggto5b12/w0vkXqGdpIIco6M5e"
+    "Sjr2zeL5i8+Lf3+vhKu6QkWx+F9MEpdKiLqTUux0QdJ/3XTp4kipjtoInepxN5AgoEJCa+rG4YMkX8JujSoFWgQtASMNRmaUzBlQ"
+    "sYrjRJnz0OEN3nl0hQ+eWuHsQLNsImV0KOdogqctctRomVks2JUelyvNM9d3eWnSUlGgVE5UCmtzWu96zvszrXf3gN40Ju9VrdNZ"
+    "NsSYEiQjhnTTLooezjla1zLoDXBNI5roQ6h//fGH7v1Xr7z+/FtXuH/zb/7nza9++ten03l7nxKWY2xsmWfauRrT3Rn33QikE4Rw"
+    "Hm0LhdIqCBqVqRgtRvdQDkwUDB6lI7cmezx/6QpX9gI7IcPlA2pRVM4RAyh66KjBz+ibhkOjknNb65zdWGOrLOk5h67r9Pu6CsSY"
+    "LLmaCki3hdMC9d6U7Ws3uXHpKtvXbtJMKgpjGQ4GnZRjvKu6JR1Gqywmy6lDje1Zoopp8ZP0fQtjufjKBS6+dAG6IYo8y/DRUdVz"
+    "yn5J3TYU/T6PPP4Yg+UlojVEo2ljQOdZAvt9pMzzxG4Abl69yosvnk86ACSRaNXt99JiS8lShPTvxWOLz53Gg0IRlaREpFJCUItp"
+    "vk6nAhSi00Jf3G5EJWWCxSUXiIhO+gOiu9FHSUlDaZNUMKIQfKStPW3lcXVAvEVHi1Y5odOrtRZsbLGyyyoTTpiax5Y1Hz65yo/c"
+    "c4hHV3M2qeiHGTZWKN9SmAwJgpeQqjGd8O8ahzOBmEViFgjK4aXFGE1mLRBxTZMU1ZQQXEOsZ6z3c+49ssGptWXWygzrGqSe46gx"
+    "GEQbPBC0AW3JVImKiuA9PjTE2BAJKZUqASyxYzWIKKLERAVUHqUEQSdt45CWls5yfFQUwwEn7rmHjWNHiUbjk7p1t5vp1K5koQst"
+    "CRpC9uUiFwVBtxCwNsd1a1+ZpDFhlcWGyNe+/BXu3N5OQzoiaXrKeWznLJKUKNJ/arGWutsFKinzJenTlBrVgY+0I0zfF5U0hb1O"
+    "zeAoMQnEh66qjpImARfvS7qZMWOh63kEF4iNBxcITmgRYgf9EQNGFLlKeUTLjKF1lHGbNabcv5TxvuObfPDUYd69tcJ9Q8vYT8nF"
+    "o1SBo2CmemyrkksNvLTneOb6lN94+Qqff+kqL+223PSWSuV4a2mIuBBQHcXF2lz5ICqIIs8HREnwmPOBIAFtNFEiITqiBEKoA1Tz"
+    "lslzTzzyyH/9l/76v37uF37hE8KBG9ob4ud//ufNf/Pf/PN7n/nGC+9t2urdxtpHe8Xg5GQ2H0ZxZV4Mddu02phCZVmRiMju7vYr"
+    "RtAqg5ioQRkKpSqQKZaGJWspAqxmiq2BYquvWOtFNgYDNsfrrA5LSlVh8YBN8oy6xywors8ars8anr92m1d3J1zamzPBEswArwsa"
+    "l4Rvkqh0Z6dD4uAOVkZsHd1idWuVex+6D10YTKa7jolBK4uIohWHV44gft9KvchKLIrqzh5f+8KXuHnxdZRzFGZRg0h6vlE4iRw5"
+    "c5bHn3wX5XDUOU3k+1tH71yadlEKHQO7t2/xwrPP89rFV/CuIVcGHVJqfDvx5ipEgKhTBWHp1NroBiu6iG+ifi1uUul6SEMeiwpo"
+    "odyUttbpmwZFWzuqqsE3HqJGqxwl6R5uYkSkRdGSU9OjYhPPvSs97l/p8e5TWxzLhQ0t2GZCbKZoAtrERE7vHEGiVgQjOO3wyiNF"
+    "wOSarSNrKIm0Vctkd0YzcehgyFRJRk6oA1qyTpBE02pDYwvafMA8H3H+1pRvXLrBt6/ucs1ptiVnF42jwKkcqzI0ioDDxQqUo+jl"
+    "lP0eJisIAgrTIVCC4FBdUaGUEINB6QRdaW2TBrPNOHL6JGfuv5+Vw5sEBUF31003BrxQK3MdpKO7aTglSeuVrkKUbkDCd7i9PmC7"
+    "XijDzYuv8dUvfom9OzuJlRA7s9PWJ2umBTSxoKsdCHlTQ3ARapHwSdx3ICmqdepcocuPoNE+S6+7U/gz3U0zkm5GQRTOBVoXIJJc"
+    "TQTEeVzwmKJM7ycKuUSsRAwNPTw97RhQc2Spx5m1MafXlzkxHrPZG1BGITQVSjuaENmt4c4ssD133JjX3Kgn3GoaJk1gp4FKSipy"
+    "dslobEnMDcEHLBai4H2VIL3oMCbx+NvkucOwv8R8Po+SbqtNkeWT1jWvDgbZN/t9/YV3P/HoV554z394/hOfSA2zxTH8rvGZz3zG"
+    "vvzl3d4//Jf//annvvXifXleHJ7Mm3e0rbtfojkjyAqYDEoDWllrsTZPXVab0VYOyAFhkOco46mqPQqlybWBUJFTUVBR6ppMB0bl"
+    "iJWi4MSwZLXIWB6MWBkN2VxZZnk8wupUDc9j5JVrN3jm5dd56cYdbjQwweIYovMhd1pHIHEeBRLFRwmqNBRlxnA44PS5E5y+5wxL"
+    "G2uEPCMYg9eaSMCiaV2NNXmqZG1GO6u4/PIFvvaFLxOnVRK/6LZH1lowMKsr+itLPPDkYxw9fZKoDV4iKivxEtE6GUoWxiAukGvF"
+    "+W9/i+ee+Ra+rnBNTZHnaXT5zSfkQCxw5e8aSt3VCO7m+BfPlo7yplSiISnVaUoceA4LKEN12+nF11GIXmhmLlGqYuKyJoy5E0oR"
+    "T4nQiw0DWpaoOJRF7t8c8s7jmzywucIo1AyjI3M10tao0GKzriEXHTiHyVOynak5c12jR5bVo8usHFrC9vN0o6w87e0ZO9dmVNsV"
+    "cQ7Umlz1sSaR46M2KJNBXuDFMg2aUI645RTPXd/jcy++ym9PdtiljzMjppIxjwXoHI0nSkDriDYpBfkYGIyG0EE82qSjpiV2upOp"
+    "2pWF1b3JaINntLzCw+98nKOnT+OtShBTd7iT9OhCHjLiOv0KLTrtdhbnpYsoaSKuaRzpurOENtl3+3nNs1/7OhfPv4hr2/0hCGNM"
+    "EvHROiXA74GrLpI7XYI/+P0EF3SPddM3iyEcIUEkYaHt0Tn+pmOTBnxUl50lpFQVYyRIZ2+uEhxRBIUiYhFyHTBxSsGcI5nm+EqP"
+    "M+srnD2yxZHV5QT1xUjdNuzs7HB7b8LV6YTd2nNjt+HmXs1MFA3QaGiVoo0KLzlK9wgUNNESTJ6EpnwD4sizDOcber2MupmhxGGM"
+    "kdbVAuIzYysXqku9YvTN8bD/DaXjhXvPnjv/B37yJ1976qmN2YKZcDDefB6/Z4iI+mt/7b8tr714fvDi61dOX7h09YnpXnPcmnyr"
+    "qsPpiLtXk6+ibR61tmCVUn3EObSyaKNQHWnfKksMDVo1GFWDTNPXWEqEMS1LyrBUliwVGZvDPic2ljmxtsTqsGR52EO04vLtO7xy"
+    "9RYv3Zhw4cYO11rHLprABjMUjiSSE7VKFjcxQky6tHmeMVwZcfjkcY7fdy+bJ49Br6BxDRlpDl8pRXCOMi+4ffU655/5NldevogJ"
+    "Qo5GS5ouU0pBZpg1NafuP8s973iI4eoyTfSECDpPwiRKaXQQcq0xAu10ym996YtceuUieZZGha21ySrk9xPqbsJONJvFtxMDISXI"
+    "TnSmg1N0ql0AhdLJiEQttrad31rbBLyD6JPFTUz3MVAeTcDoSCGefqgZUbFG4J61AY8dXebhrRWOFIp+aMibhiyGRGPrdIOVFkJw"
+    "OF+TF4EqzmlVix5bBoeHjI+MKdd7MNAQGjAGgoFawZ3I9MaMnSu7TG7OyWKPXj4i0xnRp2GH3JSgMzwGpw1TlTGzAy7Xwtev3Oa3"
+    "X7/J6/OabXL21JiKREcSOlgFIXQTZFmpMUaRZRm2k+CkuxEmaUePseBC0m/1EQ6fPM473/sUw9VV6ujxB35GdQI3maS+gVOS9IQ7"
+    "Hy4OXKzSJTitNXXdJk3prv2ngAsvvMSLzzzDzo1bKbkak1xCup6BUsnL67uFShXK/tfyhqSb1qVRnSlql2n3i2LRBB2JVqXqXRKF"
+    "S0Uh+gABCBDrpEOSdpWpcRjwoDV9pRkHhSbtkIYIq1ng8Mjy8OEV7jm0ypHlZXp5j715y6Vbd7i8O+HGdMaNnR1uzefcaB1zLDWW"
+    "lgxPErX3OuKIGJsjMUNiDjFL4lckuqLgsSYAXlo3i0Vumrqd7Ar+1aLIXjdwRRuuPHj/fV+554EHXjhyZG33b/2t/+JtqYn9rhLu"
+    "m+Mzn/mMrarKPPNMm3/lNz+79ZWvfeMdt2/fuXfmw1Pi/aPY0SldLKtYpWYAEuhnBc75u2A6EUVLuv+krnxycpphSQ2yEqGPZ01p"
+    "Ti2XnBwXPHnPcU4dXgNx7M3mbFctr93e5cXLNzh/c8JrzrJHSY2ixeCUxSmTVP61ScMU3Qiq7RUUowEbhw9x8p6zHD5xjHJQokza"
+    "prmmJbeG577xDN/62jfw85p+ZwKoUQSJtFGIWqGKjCfe+ySbx45gyyIZRirQJksVriR7lUwZsgivvvgiz3z9a8wnUwqbBKLVm+3b"
+    "32a8oeIV3YmAdNs6labVEuSbro6DsMGiwtV03m66s8qWAN7jW5eaYk7SlJgpkZDWl1WBEocNM4xU9JlxTBvOrJTcv7nC2fWSU33L"
+    "RhbpNVNiNWdU9NDSTQ92yzBGjwRPw5xK76BHwmh9zPLhJfJDQxhpMDVNnKNtYiWYYDGSQxjCVJhtz6hu10yuz/B7AeMzBvmAHj1i"
+    "I0loPMupo2fPe5q8TxytsyMlr96e8exr13juxi4vucg2BS2WaPs0YpiHCCqJ5ntXk6lIbnViqFiTmncmNRuNCmiddFh9DGS9kvsf"
+    "eYgHn3gUr02nu9pNlolgYoIMbEdZcyoZOdLBCgcjKtJYq4LgPJk2BOcZlj3auuE3f+2z3H79Mm013zc5Fd/d1LoEn1bvG2NR8aZK"
+    "u6PLdclWkuTEPtyUHORStZt2NQvIQ6UUrSVxi0PyNRSfKJ0hCBKTWlcIgSiRTCsyFUE8iKMvjmUaVhDWiyEnNsac2xxxernkyEAz"
+    "Lgyogleu3+Hrr97m/M0ZVxphOwTmeOYIjh6OgkiOqCwNm6iIl5YgniwrCF4Rg+kYNHkaeyZgTETFmTiZXVaEF8vcfHbr0Pq3nnj0"
+    "3PNP/9BTV48de6hSahw+/vGH3NtJsgfjO4/69yH+0l/6f47/9ac+/cOvvXLjHyLlMtGQmxy8J9eKOswwZKRUEBFCElnUGh0VQhIS"
+    "iRLRStOzFutrym5i5DA1f/jxh3nXmaMMdYNrK3SWUYliu265sNPwxVducWUuXN2dsI1nRpZOgi4IxuLptsIdHzN0zrpLqyssbaxw"
+    "9Mxx1g6ts7y8TGEt1WzOF37jN7lw/jz9vCBXBonJYbeNgSoEdJmzdmSLR9/9JP3BINl87HMdOzX9IOTakGtDtbvLM7/1dV6/eIEs"
+    "pqpjcfri99BFfXO8JbTQJdzUI0/iHym53tWG2J9Wk6Trq1QSfKbD2GKMSNsQG0doAyEIXiyhw7oxhlxBHub04g49pmwaxZGe4onj"
+    "W9y7MeTMxhJLtJi9m9hqj76C0hrwJE6qtQjgo8NJi1KBUDhYCiwfGTI6sgnjDKgIUiG5hzw1adKAAJiQY6WHCnkCPxtFdXPO3vU9"
+    "pjdm2DZjpEZksSA2Hu8i3ipUXlApzW4rSDmmHG+yM488f+0OX7x2m5cmNVdmFbtY5mpIRUaLBa2SrUtM0o5KRcRqdJ6hiiwlOdJW"
+    "2sWAk8jW0cM8/M5HOXTiGHX0nc2PAClhmZhwURMXW/JI0OmGuYj9bbti/+dUJ9ovjSPXhts3b/Gbv/qr1NNJ1wROsId0EJTuhGMO"
+    "JtxFol1EwotTZZ3Wb1ozUcU0/XlguSUBqKSwBSQxIBXxvk0VbYwEL4hoJBo8CeKz1iIxoKPDxITzZzT0gVUix/PI2fUl7j1xgtNr"
+    "yxwuYUhL7vZofWSu+3zm2Yt85pVtLlKww5CavNsdKFw33JJae6rD2CMZAauTtyLK4sUiqsCaIhVXscHiUKreOXfm8F/+yZ/6o5/M"
+    "89duLwa7fr/xHSyF70d8+cufbD7+R//jyTd/+4X/RfRhjHilJSBSo6hYW+ljbEMbp7Rxl0hFoAVpE/sAhckKPJYWSx2hTe5nZEBB"
+    "ZMkIJ1cHLClH2c4po6cXHGNrWMoM505ssdm3DEJFUVfkMWDwIIkTaXSWkq6kE6IExAXaacXe9h1ee/Uit2/coNqb0Mzm3LxylVdf"
+    "folMQS8zSPDEmHzVWgLBKorlIcfOnWLt0CYYk7RwF2yAVFqk6kFpQtPw2isXeP3CqwTnsCTDO73Y4r9pYb9VqLfiz3aRiAkLWOEg"
+    "ONv9W6l0EQhgUsNQLcYnneBCSGaNdUwGe1EhkhNV2n7lWY4VR+lnDGSHTfa4rzC879QGH77nEO86usTR3DNoJtj5DoWr6HU0Ntd6"
+    "lDEELQQjtKalMjN80WJWhHzdcOSRoxQbJfQAaRDtESso3XW40049+ZGhO8fniJgAOeTjguHakLKfUTUVO3t7NM5hbIbOLY1v8ASy"
+    "3DDsF+RETDtnWQtHVocc3RizPDDotqaZ79HSAJ0VklKL2m9fmj6otCUWnVgtieGgUNaSFT2Onz3NiTOn8VrhkCTNqOjYIQu2CWnf"
+    "16mwdScqFSYqfU587sQbWAxUaEnN0Z3b21w4/yK3rl3DREHrlGoWshcKwXBXDOnNiXY/ur/FfnJfrMdEeUu6qMlpOWEJCaoL0RG9"
+    "33ftSP6Fkka4o0EkuXWgNNE3IJ6e1AyoWGbKYRwPjvs8sdXng/et89ixPvet9tk0DcP5DmW1QxEcJs+47iJfvHSdr08d19Uyt82Q"
+    "qckI2lDHQKMC0UQyDaUJlNJSMGXEnJE09HEs5RlWKVxoOncQQAW0iRLi7ut/8Mc++rf+X3/3P7/02c9+9rscqN99/EASLsCHPvQn"
+    "7Rc+9/mP92x/K9eZAo9SntWVgvd98DE++qPv4dDxZcqxIe8JmWkgTNB+j5yKEGuUEmymwQhKRwrlKaShZMaZcZ/7tlZYxVH4miI4"
+    "qGtsDGjX0lee1VJxfGnE0eUlVrKcrI0Y71IjJLZkaKw1SfKAzsyyW/BEz+TWLW5cu8Hkzg43r15ncucO48GAel5jtEoL1+g0BlwY"
+    "xitLnDx7lt5wgEhqlnVEn7TtUqrTTYBmOuOl586zu32bwmTQkd4XCTdZvd+dxnmrj+8V6fG7I5J3r910waJMql5EAwaNTRVIG3Eu"
+    "4FvBtwHvAlEMSuUYY1NFJS4NrsQ7rLLHPQU8dXiF955e4/Gjy9y3UtKv7jDyc8rYUgRHIZIEn7tKOhpocdSqorZzYtlSbGVsnFll"
+    "6b5D0AtQpi5SEgRPYjABIXifcMzQCd4klDHp7JoIOhJ0C1mkGJQMl0cUvZzGNczqObVryMsiwVwxoqNHRUeOkOGQdsawl7G5NGRj"
+    "aUBPa2LdgG+JsSXEFkXXyTICpkuEShEkEH3EqBzvhKzo0R+POH3vvWweOcJePU/Qk0musmqR1Lq7a1xQpxbn7E2V7T5U2q2nGFK1"
+    "mivNtdde56Vnn8e3LblJVk37lW03Caj4nfV2F4tFFpRsUqLVkj6rBaVMkiY1EcQL0QV8m3ZDSDInFEmwbYIQwRDJpKWvI0OpWGHO"
+    "URz39ixPbC3zvtOHeerMJmdHwrpy9FxF0VT0fUtJwOqIU4rbUfHNK7d4ZQ7zfEhNglhKI+BnZKoljzN6cUYv7jFkl3XmHFWBoz3N"
+    "PYfWOba5jskz5rN6f2Ap6oiXOippn3v/u578x1/+xq/O33x0fj/xA0u4f/x9H9ef/8JXfwzhjBfRSoE2Ds+Ux999H3/uL/wpfuQP"
+    "v58P//C7+OAPPcb9ZzbR7iYjfYdC9ihthYp7SJzQMy193VKGimWp2SDw+OF1zq2OWLMgkwlWKXJjaJoWg0C1y0BaVqzmyGjA2Y0t"
+    "zm1ucmgwYMVaqGbY6JDYYFSqjhpxBCWpigkhVXwuMt3bYz6dQUhJKFOGpmoZ9kcEiWhryWzOI48+yubmIXTHLwwiSRdWhMxY2qqm"
+    "zHIkBi689DI3r11NurrapG4uiZguBy6yN8fbSbRKpVIyke8TPIHqCOadMHjEdPrAOYghOGjrQFunqlZ8SsaCQYxJFbtvMbFmrB1D"
+    "ucVJWp5c6fPhc4d436l1HlgpWDctvXZCL1T0EbIANmoK0lhvcKkD701gN+xSZxX9wyWH799k/dw6ds1C1iQisknd/pCMZxJftQOh"
+    "NKm6I6Rtt4VEsxMBAsGmvyEWVKEpx33KUZ+oIm0Hk+Q6ozAWI6lORgdQAWUjsW4oY2RzNODExiqHhgN6KhLnE6q4i8XSKk/UCq/p"
+    "nD0UKiqkBSTHe3DAfQ89xLn776OWQARUlqf8qkF3jtWh43lHiSk1dec5dDdrkXQ+BVJp34kD6XSYUEH4xm99LQ3jKN2RVLrJMlK2"
+    "Vm8hNJRsae7yvEm3kjTAoDq+bSfaZMRgMGRYlIfgwNWeWIdk8BKSXQ1RE8mIxiL7Y+iRDEcpFQOmbMqcsxbeuTriQycP8ZFzx3jX"
+    "sQ1O9xVL7YSltqJ0jswrbOw0o1NVRLA5Ph9wq4pcuzNn6mtyoKCmcLcZsseqzFllwj2F4ZhpeOfRJZ48tszTJ9Z4/wOnuffoFkcO"
+    "rXPl9m1u7+1RR49gidbgwzwI1Zc//tH3/PNPf+HT3ze3B36QCffpH/kX4be/9P95z9z7xx1ilcnSEEGYsb4x4Id//GlOnFhlc2PA"
+    "uRNrnN4acXysuH8r57FzaxxeMRzbKFkdREqZYdpdhnHKsb7hnqU+T54+xNFBQd834OYYEYIPOB/QSuirQBEDOgSsD/S0YqWfs7HU"
+    "4/j6Mqt9S99GwmyCixNUDJjOiSCG9HNKOnEMYzopRUXwiTuolSYIVHVLWQ7YPHSEe+99gLLXp24d1uS0HU3HGosBrNYUNmNve5tL"
+    "Fy6wt72Tmh7Gpln+7mL4vSZb9p+zj86mykSnLrpShtjBCErlIIllEF0kuEh0qWJUovDBkau863XW6NAyNp6lOGcgN3lHL+fpYyt8"
+    "4OwmD68WbOmGYZhR+jnWVfRINjY6RPAxXYQScCZCD6ZqSr6WsXxqzOrJZYr1DMpAyBxRB9ro0FolypURwOM7Kx3ViZssbrK2q+ZQ"
+    "pK2tBKJOOHVQIaUpE7G5puxnjJdGFEWB9023W9HoPJ2DIC1Ga/o2QzUtUleUIqz2CzbHA/qZxraBeTslSECipMwpCq0yMmzi/0ZF"
+    "ZguU0fQHQ5bW1ugNBmhr8cEnel2MXRLsKs6uiauNJsSUXBfb/n14qYMRVJdILZroPbdev8qVVy/RzCvsvuhY97OS2DEHY4Hr7pfR"
+    "B0JIGDIKtEr24jrq1D91Ed8KrQuEqJFgiDE5rsQAWixa2QSBxIhRkVIFylgxZMomDcdxPLI04F2HV3jfqS3esTnmaCGMw5R+qBnE"
+    "lp4LyW9sIS4ESCfZGFHY3pAYFQGDbQN5qFjWDSf6wrmlnEcPLfOO1SHvOr7Gk8dXeeLUKvesZpweGtYLzXhQsls1fO2lV7g6rWmx"
+    "BLI0pCStGy/ln/qP/sL/8MuLgYXvV3zn0f4+xuHV9//la3fm/2chH9msh8QGwjYPPbjJ3/17/0fe9a57cG6Hvmrx1y9z47lvMLvw"
+    "LXLVYoc99urArd2GG9dn3L5Z004cS9GyqTMOK8VgXpHNJxQh0ssLfNTMfdpilTq9uRZwaMhzKPt4m1Epg7N9braRV3cqnrt2h29f"
+    "u8VrezN2MDQURF2SwAdFC/jFNkznqCxP+rVFj7ZtGa+ucPTEcR5+4jGGy0tQaCrnqVyFybLURGhqDMnk8OXzz/PK889T7U0xSHJ0"
+    "6BSQrElCO3d5NineTrLlYMJVaVpMdwaMC8sZUQmnVSqR8l0b0hhrk4SpNR3302RdHRwplEP7PUp2OJUZHjm8xJPH1zheKg5lkdLP"
+    "MU1NoYQys1gFeJdw8U5kS4yikoa5qgi9wODogHKrYLw1RA8VkZogDo1CW0O7zzdLE4FKfJo46ppArnZd9ZbIbBrVDbAkuKTZn9FK"
+    "E3FaFEYyrC/A5bATqW427Fyb0ey1mGjJTIZVFhUtvlZYnaO0pYqRKgpVVrKjc646xRcvXOb521NemM3ZJcczRmdjPJraBQKaPCuo"
+    "XAX9gkOnjnHszAmOnjnF8vpyB+cEXHD40OJiKqSUkiSqExWqa0TRJdx0M07rYkHhK7Vl5+Ztnv3q17l15Rq+aii6ncBdLPju+lm4"
+    "jCwS7r4FUvcckURHi123zojueLMQ2qQj7ERwPoLV0NEHWcinxgTtlJlF+YpcaobUrNJyOFc8uLXC/etjzq6vsGIiIx3JfIO0c1Ro"
+    "MRpKpdE+0TWCsql5SEQrj1YB0YaQj5gXY274kld3Zlzb28OrwMq4YHWQsz7IMdUM6+YYGvK+kGthpegzDxm7dpUvXJ3yDz73bV71"
+    "PVpWmJERTUGQvdsrS/K/3d7++j/63bIQfqf4gVW4AMvLJ87MGvejovN+JEvNKjyKhh/68Lt44P4TaGnQ1Ohml3J6HXf7FZbNlB5T"
+    "xlnN1tByfL3HPUeWuffIEifXMg6PFIVMEbeDtDOieJx3OO+JKtlPS9umF2FU2m+qgFIOYoMJFdZVDFRgucjZ7JdsjYas90oGIWLa"
+    "hlZmiLRoSX5H1uo0OklquolPF4b3kdYF6sbRNC2z6RznPUVRkhcFucnAR1RINnf13pTrl17n9rXrECKZTlvK/a2eTqpRb86vv7uE"
+    "m0aw9+sX6VRe0BANCoN3Edc6fN0QW48KST82Q5LUXZzRE08pE3rxDoeoeGTc470nVnnXkSH3r+WshAm9ZpdBbOjriA4e5RO3NnhH"
+    "lltsbvHGU8UZlZ2Tb2asnF5h+ewK/c0cNVR4VeGiQ0skXb4C1tJGT/TJ987otO1XHafTZAW6G62l63wvsM8oCZPRQkoAEhBxiAqI"
+    "8mgTUYUlG/foj3pgwQeXCPje4VtHphOuHoMjuIroanKEQa4ZFxmHVpdZKnJ6WLJWCNF12sYKmwxuElvBaIJ4ptMJd+7cwTUtRhv6"
+    "eY5vF6pngjUGa5OgTgihQ033u137518tGlcxGUMagdcuXOTiSy8T2jTBaEzXDN0HlQ6un7vraFH5qg7jXSRcFj3WGJNalwvEJiXb"
+    "EJO1jeikGYxvIbQggcIIhYKBivTDjCFT1qi5t8x519YS7z+5ybsOLXHfUsGWcQz9jKyZov2cQguFNWgisZNz605joiySuMqGgI5p"
+    "h5OpSD83rI1yTh9a4p5DY46PM1Ztg6quMzBzhnrO6khYWbVsrg8YroxRIlybNTx3c5cvXb7BRA0RPaAVhTIF2qrXDm0O/ulf+St/"
+    "9pX9g/V9ih9owj17zzu2btyZfDQGvUboKhHlcW7CY0+c4x2P34u2glUefIVu7rB39QW026MIjtzVaDenCDV9UzPOa4ZFwyCvKIuK"
+    "si+UA4XYwLSuaLwDbRPeYxU6M5BpyCAaAR1RKkEHNjryGOhJYLXIOLW2xtmNNU6ORmwNS5jXZLEFmaCpySOpEbHY5qlUBYaQtpVN"
+    "47ize4erV69y9coVJnt7EAL4QGks4+EAgufqq5d49ZVXCG2LVXRi0Cn0wtniTQn37SZbDj63UxpLcogGLTZNhnkhuEhbN/imJXrf"
+    "TfNApgQrgZyaIRUjdlljxoNlwcfOHeWH7z3CYxtDjueBYr5N4efk4imsTqOiPnbc3Ijt5VSxYq/dYW7n2A3D+NSIlXMr9M4sIWVL"
+    "LByONgnTIGTKgID4NBQQVYfdLezoJbk0BK/R0SIhkdUX3GrRHZ1KAibodJNLPS3MwtVCR4IWVKmJWcAMC3qrQ3q9gtZVVLMZ3nkK"
+    "a3GuIYjHZhabWTSg2hap5ixby6HhgNPrG6z3e1A3+GaGwpOhEQI+uFSZaQi+xe3ucfvWba5fu05oPUaE5eESvbIkxkjTtkCiJ8bY"
+    "DaZ00MHBhKk6zDm3GdVkyvlnn2Ny+w6Z0t0od+dUciDhppr47jpK0vC6Wx9pZCKJVAkxpCGF4CKxFaSVBD2JQjp4CisoG7EmkGlP"
+    "L84p4oxSJgxkjzMWnlxf4qPnTvOxe47z3qNrPLzc47DxDP0cVe2Q48gNqZhRac2qblJNCJ2eBCz4+rYbf04ZOOBpCVRoNcfKHBsn"
+    "5DLF2CnlBqwcK1ndHLB8ZESxUWDGBeIdr1y7za4e8O2bM37r+h4T+kTpEzEYrBRF/MpT73nkZ8+f/8pk/4B9n+IHmnD/0B/6wzx/"
+    "/tX3ta2cQyxKazQt3u/x4CMnePp9j5P3NdFXGPGoWNHcfp08Vgx0UgWywaF8De0UcVOUn6GlIi9V+ugXZIOCcljSG5ZghTbUJN5Q"
+    "6FSMFtSVxAskRPJO2s0KGOdQrqHwniUtbPRLjm6ucHR5xKrJKJwn+hYfq8QyEI0lCbtYnYjlSMA3Lb6aU1c1d7a38a1jtjeBEMi0"
+    "pp5MeP3Vi9y6ejUJmevEhkx3cNWpOHVTRN1F9rtJthy4MBPSlYwydYfV+jbQ1I62cmmsMgZMl2yteFRsgIaCOStMOG4Dj26M+cC5"
+    "Izx5dIkjpmFY7TBwU8rQ0teJjuSaFu8TJ1lbjVeeRtVUpkYGCT7YuH+D8swIvayI2ZyoHVElASLVWaOkY9Fhl6SbkdEJCvEBRGco"
+    "28fkI1AFostu+DNxWqVrzmgSL1R1XXUWXNSOf4wBMYGgfaIB5RrTLxgMynSTNpGqmtP4GqUTFSzx8iNFhFKBaRr6CEs9y/rSgM2V"
+    "JZYHPbRzzJq9hJd3XFyRkJTTsowQIm3dsnPzNq5pEwVS685kMnF8fUzykYtkK12Vp1Q3gt31A7xzXH7tEhdfeoXYDUAQkr18gmMO"
+    "Jtw3riOtuku/gxhiCGkQwXmCC0lMxoH2GiVdUlZqP/kRKgpp6UnFyCdH5cN4zvVLHhqWvPvwmPccW+eJIyscK2BU75JXd8iaCTbW"
+    "DKwhs+n9ReeIPqYpuAhayeLt3x1PJy2KxAWONNIQtEMyhy4adF6RlS2jFcP4UElvQ9NfMdjMQx5orQOjmU9bdqae203J11+7xbd3"
+    "auZqhFZ9FJZW6mBV+MyP/8H3/NvPf/5Xum3y9y9+oAn3z//5/6X82q995Ymq9u+EXFkFJs7ResrqmuVDH3mKpZURSMBaA7Gluvoq"
+    "852bSDsDV3ciw8kby3QVi9IKH2Ka1jGC7Wf0V/r0V3KyMqBti/g2cQXTwH/X9LbJAhkL0RAi+NYTo0fHiI2OLLb0xLNVlhwb9ji1"
+    "OubEygqrvQFF1BjfqR8RE3dPOl/74PbfR2YsrqrZ251w49VXuXLlCq9duMDlS69x+8YNfF13wh5dp72jgXX/RBRJme33EPsJuruQ"
+    "xNPRvJJNeHARiSEZVkoS8NZ4TEyI9TCzHCoVj4w1P/LIST748ClOjzTLYcJYagahRlcV1gtWDCqmhKe0QjKNk5ZpnFJlFeMTYw49"
+    "eITBmSXUmuDyOS0TonJp4xFBh0QvEgFHoLUJG8yCxnY6As4LXuWIGdBQMGkNtcrxukDZftJHjhEJDtVBE0an6UbRCjGpWZjU5BIv"
+    "lRjIFIh4nKswVlBLA+xyD93PMDaixDFvGnzr0cFS6oJCWbQPnTh+BbGmV8Da6pCj60sMM414x14bqEOaoVuImxtticETneDrhjs3"
+    "b3L58hX2JrsUZcHSyhLWGqq2xmRZB5eklLm4MS/WhdGaOzdvcf7ZZ5ne2UUFwag0UZZYDsKiNnxDspVupyAqTX75gPcpyS4MJqOH"
+    "EA2I6RTk0meNYCSQSUtPGoaxYiXOOULLQz3Le4+t87F7jvPD9xzh3VtjjllHUW2j57fJpKKfQ2YUIDStI7qI8qkxVqqMUmdYBIm+"
+    "Gz0OCceWTq1OG5wBbxWxp3BZS+g39NYzVo8NWTrWJ1uzxKFH9z3KerQ4jIFWeVwb2b66w2xuuLwT+a0Lt3i1Vrh8jJIiISRUzWjY"
+    "+/mf+CN//Euf/OQ/+U5b7N9n/EAT7l/8i3+Rf/7Pfum+uvY/BNaIRISGLBP6I8OP/MhHWF4dEdua3CgQT3PrKu1sj1wHlHdElzqT"
+    "ydsr0W+iaJoQwBrEQMSDalE6YEsYrAwZLY8p+wWiAz62uNgmyo0iucdKAA0mS11Y8QFpW3QMHQm+wrqGvlFsjgccWV1mazxgZDUD"
+    "A4VrMbHC4tIiJCavM61pmwZtDDEECA5tDNM720wnU4IPqZkUY1rMkqhaSqeEEIUkdN6dGk3SPtBdIj4Y6ZLqLqLuwkr6bAojGvHg"
+    "G4+rHbENSEj6tsYcuHhoKbtx3HUcZ5ZLHlrL+bGHjvHAasGm9QzclL6rKNuKzDlykq17DJ0OqonUumEap7isRS0ZNs5tsXRiCbOe"
+    "Qc8R8wbJfIJ1SIMB0SeQzmiDNibN4Kskgah9QIvGi8KrHj5bpVLrXNrLOX898K0LE27Pc4Iu0aaP0SqpjXVVOyFN6i0obaKS4ItS"
+    "Go2FkI6pNoK2CieO2s1xSiiHBaNBgc41nojzDh98OtYx4H2NNYoit+S5JoaW6BqGmeLQqOTI+gplkYFvUK4ixrqrdjUhqrtaGaIJ"
+    "bcNkb5fJ7g5tXVPkGcPBEEWWKnPRHZe6o3cplSpAFFcvXeb8t57FoBAnWGUgpPXdPfkNNS50WVsUISQNEO9SZRu8JJJvJK06ndZR"
+    "IhEGMhpKWnpUjJixgeNoHnlkpc97T27xgdNHeOLwCqf7mlU/o5jcouem9JSnZ1JvIPoWkZjcWLTB6iwVCCEmZ15SU9RakwTgETye"
+    "oD3eenxW4wqHK1rMsqF/eMDaiQ2GW0MYgMsaQtEguSOogPctBI8xmhCgnUduvL7H3I14dZrx9Vd3uBH6eD3Cp9EzNGF2+syhf/Bz"
+    "//j/cP4Tn/jEG4/d9yF+oAn3n/yTfxJ+4if+g/63v/Xcx63t5ShNRKFshtKG9z39NMcPbZGJI8skwQbzGTdvXKOdbNO3BmMMwXuS"
+    "O73BoakRorF4hKKX4ds0JJEVycfM9jIoLGY5p9wYMlwtoIw0qqGOFY1USV9VfFfhCkYZjLbozjvJ2qSNkuk0pbKkI0dHOfdvLfHI"
+    "8Q3ObgzZ6llMNQM3QxHRkjAwpTQ+NKlRp1Vq/HTuwxIh+ECIgneJU5ooOwm/1dqilEmz7KIhpG522h4nqo5SdDT/1GWWjlZuSLqm"
+    "Jijwinpa4aoa3VU/IUpqKhqDUmBCQ86UZSruy+ADJ1b5A/ds8cPnNjimG8ZuQlbPKFxNXyAXhY4dRhgdZOBMwzTuMrNTzBqsnl1h"
+    "895Nyq0RdqOHMEWkAlpi22KUQYJOQs9Ygmhs2WNaTbBG08szfNugrGLuPZgeMV/l+mzIJ790lf/vL1/gZ//Nc/z7b2zz7798kZdf"
+    "u0PZG7MyHpIRk76CSZq9ohWt8p2ua9JNLuwSsRaslCiVI0qSEpQJWCuIb8gyg9dCuTxkvDGmGGVM5rtUfkbja7J+iRiDyjK0TZWo"
+    "lUDmW/qhYsl4zm0OObFcUsSGarJLJZ6gM2JWULnE8dZKEEni2NXeLjevXWGyu0OmLKPhWpqrFI1SFidCVmZE58kzSzOd8sK3v81k"
+    "e5ucNDovTtC6QHUQEiym0dJQTQyO1jW0bUtT191Qi0o3oNixV0jXXDSSRFxo6KmGkilj9jhhIg8uFzx9cosffvAkH7vvNA+vDzla"
+    "RNatpx8rdDulUAEjARVjpz2t0JIgLiR1F9K6XYDspMlDHI14xBoq5aipqcyMOJpRrEeWjhqWTpasnl5FLxVka0vUVuGsELIAqqH1"
+    "FS5aymKIkoivHEWwTG413Lzq2XErfO7ijGduOeas4mKBQtPLbZyHO1c+/P4n/87H/9SP33xzPvt+xA804QI88MDj5fnnL/ypEPRA"
+    "6VxleZ+2nhC14eyZkzz91OP0rUIpD0RC49i5tQOtx9oe0Qxp1YBpKNhtcyZSIvkYZUsAxLUYIrlJEzSeSNRgrQLlQTnIhLyfUQxz"
+    "in5OXuZU9ZwYZX/rpRT7YuRaC8YqrBYsERsDNjSU0VNGRy86jq6O2RgP2FwestQvyBCUc9josSqSZQmLsl3nPHifrJwDZLZAgkqN"
+    "jZDkDkPoeLCdzqhOPXmUUcl9WB2EIEBEJwU2lXWPJ7k73yahmWoyx6qMzOSgklpVqo4iOjSUsWHIjMMEHl4qee+xZZ7cGnLPQNgI"
+    "c4Z+ziAGSiKZj8SmJniHVhFTGKIVZjJnKlPiIDI4MmT11BpLx5bJ1kpiz1CHqpvEimjbSRlaS9skXQatM0IQrElz+1pFxCd6lNMF"
+    "wY5psw2uTnp8/tsTfuFT5/nSi3MmHGG3HVNLn9s7c65cu4kxmuNHjzMejZlOJhijsJnBxRZjFWVe4GtHqBw5lugD2iiaUBNtYrP4"
+    "qMhND0HjtSBGUBn0+gVFP6ccZIQYmLc1Ra9MrO1Ofau0lkJrrG+hrdBtw/qgx+HNVcb9Aa52zOZ7tMElsRnxZHmWxMFjBJLYeTWZ"
+    "c/PmbSRC2RuwtJxghtY1EIVekWGIXHzxJa6/folmOiXXixt0YhsIiUstJGdb7xb0v8Q6CB7KYgiS8HElilwbLElaU0uSfinjnAFz"
+    "Vqk4boWHVoa85+QG7z25xeNbS5wsFGuxod9OyJsZpq1SVR9abIjozhNOqwRJJMgsCawHSdYOUUfEeLzxBN2mXY5JPQDVC5SrhtHh"
+    "guXDOaNDOYONjGylT2Mz2t4St9ucuR7T6AGtKtG2R95fwdFHmz5WLDklYaa5c63lzo7lTljmm9vCC7ueigFCCRpmfjcOM/vsY++4"
+    "7598/Vuf/743zPifIuH+6Af+aP7bz5z/8RiLw0imUAZb5BS5YTbb5umn38Xm5gpKqzR73QptJbQz2JtbXr7m+frFPT73/C1+7Zuv"
+    "86Xnr/P8q7dZXz1CPyvpAX0NWgViDOgiT6OTkrZ/EUmykGVOVvYoewX9Xo/hcEheGFxoqeuK2s0JkpKzycE1zT6UoTs+olGpWZYp"
+    "g6srRkXBoY1lzhw9zOnD62yNCnpxBs0EF5JTgERHLoZe3kOLBTFIANMtwmQpolKHX8K+WIlT4EhsCKUUphu/VdGiokGrPFUmJPGX"
+    "4D2tb2lcS9u2ZCojRqiCo5WkPKWskIujJxNW2OOBfsaHT2/ww/cf413HVjk1sAxCjapmlD5gXED5gIoBbRVkaXqr1Y7b7Q6+jBRb"
+    "AzbOHmLj3sOUR5ZRPWEeW4JWiNGYfkmjNI3y1DENIRidqFN50UM5T2xdwl/T/gdbjtiZF5jlezl/M+Mf/cuv8T9++nnOX4u0rNKG"
+    "Hj5YsnLETh24ePsWr126xd7cMR4vc+bUSVSoULEhs+ko1dMpRoSi3wc/B90guTCVGm9younT0kfZJeaVR1tFCA0SPFlRUBQZ/fGQ"
+    "Xs9iioxZNUOMSQ01YxPO3EZC0BidYUyBuEgWhfXBkGMrS6wUGXE+ZeZuE4k4oFaRaCw6L9G6ILaCqxquvn6BW7u3iaGh38sZ9AcQ"
+    "PaF13LhymZeePc9sZwftI7nWxODTToi0+3Ah8atdExAnqGCwMcPGgowe4jrbH/HormGqqNDU9JmzLhOO0XB/WfCeY5v8yINn+fC9"
+    "J3h0Y8xxK2xIS7+dkTdzihhTwdGNpmc2TzshOpgsJq+MgE/SoDqgC4jG0VJTy4w6zgimRvKI6jnWjo9Y2spZOlzQ37DkSwrbE7xO"
+    "r7AuDvPclZZ//ivP8ytfusgXv3Gd5y7OuTPt0coqkZLMDMn1CON73LlecfuWR/Q6u4z57EtXeLUJzMhpF3BWrNvBqPh3f+KnP/6L"
+    "n/rUP/sOLdvvR/zAE+77fujH47PfeOl906Z5INMD47zH6IzZfIconh//0Y9x5PBhpI1oydnd81y8eItf+fSX+eozV/i1b1ziC9++"
+    "wW9dmPDMa1NevlZx9fqU6CNLgwFHVgZYafHNDGMkyePt2yx3xoAIKqbFiNYJbigzyrKg3y8oBxlZaYkm0IaKqp2TWYPRoE3CK41S"
+    "Se8gBKL39KyF0BLrOca1jAvFkaUep1ZGnNxco19Yhtpi5jOEWZrWkiSQke3zHWNHyUlZVhYz6QFc9EmtK3STVZGuEjdonaFJCTX4"
+    "jh3ROoJvEe/2p5+8BIzW5JnBqJbMT1iWilM28tShZd59aMg7N0ecLiOjdoqe3MG0c3oSyINggoAKiI4E43GmpdI1Uz2nt9FndHSJ"
+    "9VOb9I6MYKjxtqVVLd4qWkq8HXFpu2W70gQ7IustobUFSd5j0ja4tiEvLVmZ4wSCZMzjADU8x9dfrvl3X7rCr3z1Ghdv5zRqjSxf"
+    "Q+kSyIhkeF2AHTB3kavX7+CDYW1tg+VhiWvmRAV5r0RHQbxLY9yxJWioRNGaZRqzyo1JwdVtzcyNKAfLSUVVB4JzGAKIR5UZdpAz"
+    "WOqTlRleAtOqomk7S3hjEUk4rYqCbxqoK4ZKs94vWe+XjHLN0FjqakoIHhd9wpiDSvrLoimKkqAi1WyPW7du49uWpf6AflEyzAtu"
+    "X7nOhfPnUa0jR0OMSIfFSoy0ziNeCA4I0jWeOiugDtfVKApggDDA0WfGmIpV7TiuA+9aWeLdW+s8dfoQ79ha5kQJG1IxbCYp0fo5"
+    "uW8olVDoVNwEn3zIDOC961gF0k39hf1qNhjPzO3S6gZyh+5HipFlsNpjZWvIeGtAsZ5hxhp6EYoA2iNa4UxJo5c4f9nxK19+jV/5"
+    "6mW+9WrFxVuRC9caXrmyx7MvX+P12xNu7jXsToTJzHDzpqdyQ0K2wfM3an79lavMszGSj9NOxdeg4u7KqPcv/uSf+m+/+P2eMFvE"
+    "760V/rsIEVGHVp7+i3d23P8py5ZWmgDaCqLmDMeav/G//yt86P3v5IXnn+Erv/nrfPPr3+DKhYvMd/Zom8AeitSmGabqh4oxe5wZ"
+    "TvgPPvwAf/LD51hmG6lvYHoa7wMYm5oNC5cCH4kBDAajLOgc/AI3zZM3yNwxm8yY7OzSTB2qsWhnEa+wKiejwJCnrZrSqclgM6LV"
+    "eK0IxhCsxQtMg2aXHjcqzys3tnn+8nVe2ZlwA2EXw5yMyACvbPr72qJiwt0WuFbQrtNVTVNBphsv1jZLdCFl8N7jXEq0Knh0iCg8"
+    "ojSttRhjKBVkzQwbd1ij5bG1FR4/tsY7j62zHGaMQ0sZ5uTeYSVQaE1uLL5uMEYRbGQmM6ZS4wqPHVrMKOfw6SPYYYYe5mA9Vaxw"
+    "OFSuoViiknU+97WL/Mtf+gptgMNHV/joBx/j3fetkrc36IVdYjPBZoLpFUxcZN5o8mKLKm7wzYuan/vXX+FL57fZdmNitsW8STuN"
+    "TKebn1eCUwabg2UG9Q2ODuGpc0P+zI8/wJP3jVByk3p2mdVeEt2JVYMyOS0lExkxMUf4+gvbfO7Lr/Dq67cpy4L3vuMwf+z9hzky"
+    "avFtjZZAbJvkFBwNeAtmSHN9zva1GdUdT5xpxOmugjTokMaNVQzJSkYp2qxgkhXctiWfe+V1fvvGLs/tzblDH2/HON2jjcn52WYC"
+    "BnzdQpZx5MQpTp85ydbqOueff45XX3yRrFNf897jfUwSoEoRXYRouzabxmQ2uVzHJIVqYkRH11kfzRkyZ53IicGQs1trnBr3uXdt"
+    "ifXC0i800s6Qag/rG0oj5Ap0Mi8E0iB5oIPI6DiNUTqr+YgXTxBHKw0Bh1cNtjAUQ0N/qU9/XFD0cnShITeQGQgOwSG0iAkoI0TT"
+    "o9UjZvoQ//RTz/Hz//45Xq9HTGREXgwI0WHCDOd3EOas9jMO9XLOLK+zmhUcWT7M8ug4v/3aLf7t+YvsmBFzyROHO7QY6ucePn3s"
+    "P/nqy7/4ue/3hNkifuAV7ic+8QlOH3lCqrm8d9I2Ry3JFdO7htYHXrt0mV/79S/yr//Vp/j6N17ktdd3ubHTMgsljVkh6DWcXiPa"
+    "FaIeJsttPLR7nNgseOTsBuPSY5QDDaFpsWYh7JwAe5TCmG51kpoH2qpkESoBcGADeanpLfVYWh2nXGw1XifL7CAxQQ5d5ayUYDUY"
+    "FcG3KNeim5rMO8ro6UfPeplzbDzk2Oo4Yb6DPn0E09QYms4Qzydd1YWaSTeuQGdLIhFi8EnYJAS8TyInbp/O41Fe0kUEdLNwGGsg"
+    "zMnbO6zIHg+VOR85scUPnV7n0dWS1XaXcTulF6YUscV2FLfoPG1bI0popGUmMyrdoEbQPzRk9cQqq8eXyVYzpIRoW7xyqEySJ6CO"
+    "NOS8fN3zL//9t/i1r9Zcmyheer2i11/h1PEjFDpifEteaCgMe84x133U+Dh77Tq/+Y1tfv5TL/DV8xPutCNmsU+gx6AcUCiH97uU"
+    "JKxctKQuos4J0VK3hr1py/atbUZLy4zXVzFWIZLOdZrzz5iGHN8/ypW9Ff7Zp57j33/pClf2Mm7MWpp6ygPHRhxayhJNj4DWCqUD"
+    "UTkEj1Zg+wWj8RK9XkEUR91UON90dEQwqUOKuJZMAj0LfaUoJXJoecxKr2RgLMo1hLZNEJNRxJAoWkVWok1OcIFmVjPbmbJ7e5vr"
+    "r1/B1w7daRu4pjNQJUmCKjEduwEMaR2pWEGck8WavlSMmLCF43SueGjc491bKzx9Yot3Hl7hwdU+S25K300x1Q7Wzejh6VtQ0Se4"
+    "DUGIyeFYEuSU5xZlBCcNQXlaWhpaWqmI2qF7kWLJ0Fsp2Dy2wmizz3C9RzbOUH2BLLGNgmqRLAnoROPTuLZRRHLq2GMaB/zWCzf4"
+    "zeeuMVMj9mKP1vRoyTDFEG/6MNhk4kt254o7U82lmzWv3Wy5vBN4ZbviequZiMYJGDFoYsyN+uJP/+RP/tzH/sh7p2/OY9+v+IEn"
+    "XIDl8cnxnTv1R4wqzxRlj6qt6fWGuLbl5vWbXLu5x/atOdMZNK5AqSUaDMGUeCmIMQlkqNiSUTPQMzb6NY/es8r9J0b0TQVujg4t"
+    "wYe0Ne/cBOhUldIQQSfrIoEoIUEPKhn/YQWyiLagMkW5OmIwKsj6Flsm+lkjniY42tCidBoHlZC27ZkxGFGoNqbmWfBYX1EEx1IO"
+    "R0Z9ji8POD7ucWplyCC0LGvIQgPS4PF4HKkGWNigd1No6YWn5NvBDCHEpDUqifxjFqpQaDSePNQsx5ozufD01ip/8L4jfOjEMqd1"
+    "Q3/vOksxEdfNAs6QJDFotE1aEKpintX4MlCuF6ycXGH15CrFVg890pBHvNQ0viGEBrVQ7jeGqAe8dDPyy59/havTgrlscqsVpnue"
+    "tUHB8UMb9LrzMYswlT5xfIob81V+9cu3+dlf+CrffNmx7fvk/U1EDFo8sb1NHm5zdKQ4faiHDXu4ZgcJLZnO0KbExx6zRrh2fZdX"
+    "Xr8OueXE2VMUNmOyNwVt8apH7K0xkTW++NyEX/zsC7w209jhIWaqZT7d5R3HCk4fWk6Osj5gtJBOR7LOYeEarZMoznBU0utbvK6o"
+    "m1mCdkJIrL8FayLGdGNuW5as5uh4wJmtdZaKjGrnDjO3gwohuQ9LToyW4BKNyrWO+axmd3eSZCl9UhALPp1z0XmXcDMUtluPEU2D"
+    "ZUrBHmMmbFJxPGt4fH3Iu44u8+FzR/jguSO868gKpwaaUTtD791koDy5CRRaMAgheGJI/mx52ccLSMcEiQaiSgLybZjRhDk1NdF6"
+    "KALF2DBcLVk+NGL16BKjoytkvYDpgWSOqB2BJn02ETER7x0xWX6jbEjuK1oTVYEzPc6/epPnX7lJRUY0JWJK6g5Dn7eKpilpQw+x"
+    "qzg14o633PCK67PIdquZUmLyJQrdQ4mmldoXvfw33v9jH/h3n/3sv0zixz+A+L4nXBHRH//4x7MiLB9aWj/xWL848e7XXr3209b0"
+    "3690Ppo1DdYWNG2DzQuiNoQmIpKTF0vomNEKGKu76TCPxVGYhlz2yNlmILd46HiPDzx+ggePjejpCmmmGAOmN+gEOtKobKZTSokL"
+    "eorqJoeM3q94RQlC6DzH0kWkTEQ6dkNv1CPvF5jCYEtD1rME5YnKJ1ZE9IQQCd4DiswarIroGDHRkUukIDIgsN4rOLo84szmCpuj"
+    "HkPduZKGtKW3yX0puV2IYOkcdVVCehMrkqT6xUKjNLEpEqoZ6dNw3AbuH2W859gq7zu5wf1DWG52GbW7rFpQrkbHkIbvkE5GD9ro"
+    "mMWKtvSoJc3w8JCV46v0Do9QI0VUNZWbEKVFW6HIMgprMSptI7VAUAOuzTI+8+UL3JiO2WsH5OUme7tT2tk2Jw5tsbG6ThMzGjtm"
+    "btd5+abiF/7dM3zy1y7x6jWDN6u0sSCicX7G0DSU8Rb3bCh+4sOP8Md+5J1sLgnSTJhPd6lcg0iGMj2iKoiqZGcy4+rNW8zmDUUx"
+    "YmXlCL3+BjuVZSJLfOu1OZ/83CW++coMzzq1GCq3x7hoePx4yaPnjpLnGRIdVgkhtETXkhlN9K6bXPQoI5Ap8p4mLxVZvrhBBtqQ"
+    "aGna3rVkKrUiVxFpK/rWcGhliY2VFcY2x/iWpp4T0BhdJvKUVngRsrzAuzZZiy/AQEkgVGayhOWKJxchjxUFM4bUbOA4mcMD4x7v"
+    "OrrMe06s89TxTd6xPuTM0LASK/L5Llk9oZSGYaZBko5F8A6kc45QihBjgrE6g1HRAa9amjjDUaFzRz7OyMcZg9Ueq4fGrB5aobfR"
+    "JxtnUHjQDeQRsoB0MpxiVJKE1CSMWSVoQmnfCXR6QlREZRCdQV5y/fZtbt3ZxYeQPNNipNQWowpUPkLpHjEoZs7TqhJlx7iYUS+s"
+    "k0QTg0vFQpnHQLjz8ksXbr7znR8c33vvwyt/+k//R+Fv/s3/nfu5n/u5NypJ/T7i+4bh/szP/Pfli898Zes3v/TVh/cmk8dmTfu0"
+    "8/IeFW0pUuS5WTJKSuViMnALwSXKkwHXzCiKPqCJTSAwp5cFanebHI+wx7KFUmasj4SHjg34Q+97gHefWeFwOUNmN8kzAGHmAnnW"
+    "T5jmXZ53F3ePW3wDRJOeICRfJlGJvpIuD4smw0iOeIu0grQwuTOl2m2Y7FS4eSRXJYXpYVSOiiYpJ3WjtUES6R2twVi8MbQ2p81K"
+    "dpXi0l7F+Zu3efnGNq/fmXDDCTuMqeh1YuGWGkUtpK+zLOHORmFjwISGgoYBQh9YYcpHT27yxLEVzmyMyNs9stlthrQMJCBNhVGW"
+    "IEnMWUwy/nN4ggRaW7N8aoXBRsnS2gh6krr61iPKE9TdBq6W5LKaxj4NaEVlVnhxusp/9Q9+lV/7VsCXJ5i0gmXKmrrOBx85yg8/"
+    "9TCPv+M+pqHiN7/xTX71q8/yzIs7zKoNUMtEnWQMrVHkZkbhbnDPYcOf+Ngj/MEPPUphPJiCX/7ct/lnn/waz17x3GlHNIwxdgml"
+    "M0K7Q19vM9C7PHJ8lR/74JOcO7lF0854/rVX+dUvPce3XlVM/DLYdXyYE+Ui969N+Kt/6DR/4N0n6BeaZnKHQkes8uQGXFMlWxtR"
+    "qJjs3FNTsxMJCgXt9cjuzYad21NCq7BSoL0lE0NhLN5FVJbhspI2K2h7y+wEzfNXbvC117f5/PU5t9WQuUQqNK3OcbZzTOgarsRI"
+    "JpJG1EkQhlaKXFpydtjCcmxpxImVAadXB5xa6XOopxkbwdZzTHDo4NDRpWGKhUi+UkkACNJU5UJ4fN8lotMp1h6HI+gasZ58aBmM"
+    "C/JBxmBtJfFrNQvB3kTRxHeOxkkRT3ijwHqHAieWEUI0LdEkH7WkM9KjVSNcts43XrjFL33hPF99bpsbU03th3hKYIzTI+qY+Omi"
+    "DI2xxKgo6QOKJiaaZUHi/mJEoom1a3emilgrXe8Oh8VXhsPebz788NlPv/e9T+8+9NDh2U/91E/9vqbPfk8JV0T0z//8F4p/88/+"
+    "x42XLlza2p1MT71+6dp76rp9b4jhVCAuK1PmEjD94SrzaY3CUpgBnZEFQWKSkpY2NWf8HHDktsSIw4dtNkaatQGs9gPnjg45NIKz"
+    "R8ec3RpwZBA5OlRkzTax2iXPckRp5lGRZQXax4ShLV4zHJA87E7g/untHj8QSSoaQGHI0CrrLiaNeJV4W8ESG5jttUy3a6pJS3Bg"
+    "YkauMowYrEpC30qSZ5WIEERheiU1mkopGlswtxnbbcvl2zu8ttPw4q3A5WnLTTdjBjSU1OTUyuJ1NxQRHT0CS0RGNKxpzbkjGzx6"
+    "aMy7VgxrMqXQghVH5ioy8ZjokwW51gQV8UqoYk1Dgy41o/Ux/fUe+XqGGRqyUiEdroZJGLZISFV3x/1UKiUCISXeyixxK2zxP3zy"
+    "Of7f/+pZ9jhKHKxT1zMGsstq3rI1LNlcXaLBcWNvyuWdKZM6I7PHCbHA6AalaqK7w3I24+mHN/jDH7qfJ88NGGdTSu0p+2NuzDO+"
+    "9O1b/OKvv8xXnrvDnXbMPA5oJLk697Ia1e5RSsNar2Q8sPQHGVd3brJbKeaySeNK8myAlQmFvswTpx1/9Y8/wJNnBtjokaYiI0Db"
+    "kGtJQuzdsIooOgbAApoRtGQoN8LvBvbuVEzu1FR7Dl8JfVXSM2kbq3VOiEIrllj2kaJk4oRLteLLtx3fvL7LKzdvsSOauS6YRGi1"
+    "RWUZ0rTkRtFHsKFJAwoIy7bHWmG4f3XI0WHB0dURW4OC1RyG0iS94ram0AojaeQYFZMwjSTDx9QASwk2qbQJiEu7QAnE2OJVwPYs"
+    "5TgjH2XkA4sdGkxPQ2mTili3g0zz+GmSLKoDjhb7JdDdgmfxlYnpevU6EGxHa1QKxCIURD2gsWNu1ZaL12teujznpYu7XLk8485E"
+    "uHonMPFCICeqAXPTo1UWFQt8SENUgcBQWZQIPgvUrqaXGXyoaeOeaMRH/BTiK4OyvFiU5jdOnzr6bNHv3fwzf+anXn/fyqN7D/0u"
+    "jSTfdsL9mZ8R3e//o8HVq9eGn/vc1+65dePORy68+urTkJ8Dtd7LBz3vxGTaKmUyZm2DyUtCO6PsLSdKlahOEUlhbYH3FaiIzSJK"
+    "NWQmkmfQLyPveecDPHR6na1+y1bZcHbNMFITVvtC5icYNyELSdTGSESbHImGKmiMzsk6URR4Y6J943hsJLWa3hQqpmIl+lTFdOTt"
+    "JB6SLjStLIhNNt2NopkEZnsNs0mDm0VkFtE+JSSjC5TKIIIlxxhD23qUsegshyyp43ujE8uBnFd3W17Z3uOlqze5eGfClRi5jUq8"
+    "QZWR2QJc6jIv03DGFDxydIPHTh3hvo0+G/4Ott7DOYf4pIiT7H00VkWitDip8arC5wEz0vTXeixtjslW+lAkXFtii5caOttvpbr5"
+    "46i6CbnkUZUsezRRK5wqqYujfO7ZPf6vP/t5nrml8dkJ5tFgTUC5JiV/JHkaGE0TIlr1yM0qlZ/RUxU9u8fmoOY9D2zxhz54jnfe"
+    "t8LI7qHbWxArFBYxYxq7ydderPiFX/4mn//2LW7WJW2+SuiE3etmTs/0yExOU8/SGrAQyVBmBeWFPNQouczJ5Sl/4qOn+an3b3Fk"
+    "UCNNRa4gi0KsazKbgQ+dskpaO12d1u2MAkosRg0gWGig2m24c2vCbKdBZgrlM/p6hKUkRoULgmiDKXNUkVFnfS41lm9cuc1XXrjA"
+    "C7MdbpExZ4CjIKgky2ipKagY0bJJxonVJU4f3uT4aMDDq2NGypFrkk5GW6Ubr0pyP961+5xvoqBEJaGehXhSluEkEGJDiDWeGozH"
+    "ZILKhKX1JUzfUI5KdN9CTueYEZMoUScalZrXyfdtkZfuwiGLa687lguxcdGde3HEaQh2YYAKVlLB1riAZBafFzhd4vWIOvTZvu24"
+    "fK3hc194mUvXG27dqdh1OVe8Zo8CYUikpAHKvKRuJ/QoaEkcYhNDOpda9ouuEJ0k/+WmBTXXKt6I4r6xubnx5Y2N8Vc+8GMfevGB"
+    "E0/t/qf/6R/4HbHf75pwf+ZnRJ89+6nef/ff/d0Tly/fPpHnxQOXL195Cuy5EDikxG6Aznq9vtqb7qlC94mdPkBLoOyNqeoK6Bxj"
+    "acjzvrRtq/q9JeqmIUZPXhja5jZnzx7lJ/7IR7j3nmM8+uhZjmyNWSsaJhe+wfbzX6I3e52RTOnrmthMyHUkhoZMJQdQvCYETaDo"
+    "RmPfTsI9CDK8MaxOuG4MSaFIKQM6Tc4ACSoIEbwm0z0wPfAWP2top4FmZ04z9VRzR3SK4A0ETaFLiqyHickmmpBsVIzNUZlFGYPX"
+    "GbXJ2HHCrcZxde64OKl5eXvCazsz7jQNDY4Rhq1+wZnlPo8cWuH+jRGbhaLnJpjmNqWOEBIpn5ilmwQQpcXLnGhbzCDSX8sZbvTJ"
+    "VvJOCisSEDCpsRiVQ6uQRmZJ9uQqJs81ISVbtCGodDE5nRHzFa5VY37xCzf4p7/8HM/dNPhyk9aDtv2k9RA8RIciiZVYbcikj/g9"
+    "NFd5x7kxH3nsCB967Cj3H8kw7TV8s81oaHDVHr1eD1cJwS4Reic5f034pc+/wi99/kUu3vI0akC0GU00RNVDqZLoAhiNyS2hDVht"
+    "01SV32bZ3OCHnlzlz/2Jd3JysEMv3EHalp4xKQG0HmPTjfPuwlm4KwuJ3t+FA2t7oLq1WUWqXcfk5pz5toMmw8aSXBUdcyIl7qAj"
+    "QVtqPaKyfa5Vjmcu3+Rrl27w2mzONLmCUWAZZYbDw5zj4x4nl/ocWRqwPuyxmimWXE0pyXsteoe4FmLoBM51Ws9d8lOd2wgxoLoh"
+    "meQsLJAFVOaxfegNM3rjjHyQoco0BUmesrSobsfaVbHGdFNlJGF9EekS7oECZ18DJCXZxWMqDSeCgtbEJDiu0kScDTpRJU1M/HAb"
+    "qULASU5eLBNcya2bgYuvzLlxU9irc+7IkC9d3uO56xNuz6AxBW0H9ZXaIhJEFZlMq4keUqJQ1LQ4fCdfKeRZjtaKpmkIODEqLS0f"
+    "3A2l4wVj1HOrq6u/NRwWr2ZZefFv/I0/e+Wnfuqn6jdXv2+ZcP/e3/t72f/lE//wyRt3Zn+sbfzTWd47U9fVsrH9XMToGBxluUxd"
+    "T8jsEKMUtavJdEZuDbO26n61p9/vS1tPg49NA+KG/fV8Oq/7g+EKs+mUPDf4MOGjH3uc/+Kv/3ne+fhZbN7i/JSRmqGuvcDNb/wm"
+    "XHmeNdtg3BQVm6QxGl1XcSlCKygs1gw6fYE0KgwHE+4i4htPPAfvtun5mjT2KzHVwUrpDvdNvyuSttUqsS5B8sTRJEtglBf8tGU2"
+    "rWkmgXYWaaYB1ShMzOnZPlqSHilaE9TdD1GdxbZAoyzO9phKxq2Z58qdPbanc6bzml6mObQy4PTmMlsDRekmZO2UXDm0TVNr4hMM"
+    "kuatwHlPHeeoMtJbLRhv9SlXs4TTZolgjkoNCLTe51IS7yYTJQJiE6anOmEYozoL7WSl3aLwxSEu3Bnws//it/jU166zE5bZaXuY"
+    "YhXvVbdL8GSxpdCREGZYIpuF4fQJxx/70Uf42KNHWDe7lH4bHSc0IWGAxqax7oyA0T1au4Yan+TFm5pf/PXz/OrnX+X85RkzDBTL"
+    "zENJG3OUMdi8RIJDfEseW3S8wabe5X2PrPBHPnyKDzy2ycDdxLQTVPBJRrNNQwVaZ4jr1sOb1pDsJ9zFOun0AiQ1wAgZbtfT7gR2"
+    "rk2RyiBtB1lZQ0ThJKZdVKvxOqexfbaD5uXbU168fovtuQObsTToszUec2J9icODggGOPDQU4slVAF9hVUwyBZ2so3SCNbG7wcfu"
+    "fEVpiTEQJSVlUSnxm76hHOeUo5xspLED0KWBUuF8faDXAZDwY4NCKSFKVynuP76Igwn3zekn9VCS4ko6hq1JbIg0hpxhg0UBEhqU"
+    "jegSXGhxHjI9wNeG6U3P5fN7uHaE9I+y1z/Ev/72JX79pau8Vjta+rQ69VR6Bj9r5jciTYXNN0pTDKQVg7Zp/StF27ZEhEwnNxat"
+    "NcYqnEtwqA+t5LkKdVNVSulJ/P+19+bxll1lnff3WWvtvc9wh7pVqarMJCGMIYxBUESkRUREeX1tYwtOvPYr3YratLZDD0K02wEH"
+    "nF6UVsShQQUUUQZBIQMQQkhCAoSMlVQlNQ+37r1n2sMa3j/W3ueee+vemlIZub/67Dr37LOHtdde67ee9axn8OW9U63s4y/8+hf+"
+    "7dVX/+WOySdc/cSEEOQpT3nBix7YufjHpVXPUJImQbQEr0iSjBA0iclqY+s4VUiTlKoaYWJc2Gh3Jbqq/Gg/jO7bMrf59nPP337D"
+    "9u3n3HPjjV981VLP/jzBdEGJ0QlB+py1Fd7wI9/Fz//CjxGkR9IOpHaRtH+I6qs3cuTLNzBd9TDlkCwVwONdOV6dDEEwOoOQUtgq"
+    "2t3WXcJLDOt4LFaPthOoc8NEUom7PJGMow7Kx4qX6LDgnEd5g9ZJjHrTnFBpfAF2EMiXLMVSiR1Yyl6FIcWoBKUSbIgdLmgdHQ+K"
+    "EcE5SgeVxNQf3rTwuoVXccEmBIsKBQkliR2g7ZBMWbJEIUZTVnGFWUTwlaWwBdIS0umMqW1TtDe1MHMptIAwxPkRoiLZR741cXGj"
+    "7jjjhUQRlI/PGFRdP4o62lecYCedFrlvMZJt3LHX8clb9vOJG3aw44Cj79ogMyAJKlSYUNBiiGbABXObeemLL+XrnjvHs5/U5oJO"
+    "jiztI7VL6FaCE82oLNFpQjnsk/qSdrdLZROGvkPR2sp8uYlb7lziE5+5g1vu3sv+oaNPh8RsxquEoixoG4VyI2ZSx/lznudfOs2r"
+    "XnIJVzylTVYdJqmWMKFCS0BciMkq69mNswFRybj9hNDEqY32t4jDSaNiCLigUJKSqBRxCeSCGwQG80P6h+OiK1ZihjJJMBgSK5SF"
+    "ZxAEm3SwWZdCJYw8WOvJlCJTgQ6e1FuMLWqVAWgDOpWYhaKOTid1WxaJ0Y+GVUwTHx0RKlTiyTJNu5OStDWd6S4qk6guaAHa4qSk"
+    "osLjMKnGEaK9b3N9H6XZ2OaA2sU+yHJsh3VRC4KNPKhDo1KI9SgkSNBol8RaTwzejrAhRykV+36V0NvbZ/6BJVhUeOao2hfwoMzy"
+    "lzfv4Pp9ixwixaczDMocER8kjHafvW3rzz/9hc+/aeee+y/ac8/9r8DL141Gw0uVtLcIOjUm0875Ov1VXDhUSkWhBB8dVFyBdyUQ"
+    "QsxwVA08+b+88tu+6Sc+/vH37Gse8xizsBe96EXZu9713h8oCvXdWTrVElFikhStE6qypNWeYpTnBALtTpuqynF+GEQF60Le86H/"
+    "APC5lgl/v3lz90+v/L9e/e4f/vev/9Cf/ulbb/3hH/6uvS972bct7tjxwLdr1Z3TOhOPJ0kUo9FR8vwI3/CS57NlaxdRDrFDEm3R"
+    "xlPOH6IcDGIOJhdillAb1UYKQekYsbgAquAwuonaXPcLWbkFol4oNoPmh2X4QK2bNHhRhKBjdQUD6JgTLNSpugFRJqY4F3DBUbgc"
+    "6tB/KhV0OyWbTml1U9KOiYHXVUVe9bHBonRMD+VtNCx3hUMFQ6JSkgDGOhJb0QmWNhVZldOVGExHFznGW9omIVUaW3h8pWNeLPF4"
+    "KShUn9AtmDq7xaYLZumcPYVMK0LqcbV1gui6PnzsJT6EemGTOq6qrqeiql68iOEDYx+pV7Ml5lELObjc0VLC+ds3c8G2WcJoAVUN"
+    "CaMebalQboE2i7Q5wvb2gOdckvGKl2znO152AS+8tEWn3EtY2ksWRhgsocjxlcfoBJtXTM/OolBURY6SmL6pLTmzLcfZW1K2zmk2"
+    "dRWqHBJGfTIKOn6Jblig449wdrvH5RdmfOsLz+eVL3oSz76wy6bQozp6kCwI4kB7NQ4oBAHbmNBJ7bZKbGcmhEgWzWSqcSkXEz2Z"
+    "REdTKhVw2pLMJphWQGcSTRBdjHlgCkEq6C8NyFop7ayFBIuyJW2pmNOBOQo2h4KpakBW9EhsToaNqZGCx3qPDULlQUkdjlPimkTl"
+    "yujxpUsktYS2w8wI6SZDd2vK1NktOlsz1CaNTIXoVmsqUFUM1g7RQqMKSBUQF9tAUgfOWU6lrglB6ljH8TP21Il/dbogIS7cQVxc"
+    "i5HEspjwSQKIjfnM6iSvQRzWjvAqIMaQJG1wHUaHHAu7R5RHPR3fwugZhnTYsVTxyR27edBF+9uRV5gsReN8FtznL3/20//oU5/6"
+    "0/uO7Lvr/uos89kD9+7+NPgbRXFfXiyKCC0E45zXDsRNxK+uamsrREhbGaKUaKMlWJ/MdmbOfnDXgzf/1Xvfcc/73//+wDEsA3z0"
+    "ox/NXve6N/1Cb0n9nKLbSVsZg+GQJO3E0dp6RCT4YC3B5VrrvWlbfd5IuO2887Zf/6IXvWjnRRddtHDVVW/IV18b4OMfv7X72tf+"
+    "wG/kuf5RJVMtpQyBHJgnyZb4nbf/N173+u8ga1v86BAd24OQs3TjNSztuIMZWxL6C8wYjfioAwRABSrnqLTGpAk4G9UCcXgd37/5"
+    "s5npRMm3lm5XS7k005nGHCZO9+tf6kayrK5ojgGP1wGtY6AaW4GRhNRkcZEtj1lsGVmKnmXYzxn2an2vE0xISHwLsXEUNaJItMGY"
+    "JL4DF72rrI3mWdoIwVdUVYGSQJqmcRAwAadHWDVEz8DM9g6ds2ago7HiwUT9sfe1zbCAliZ7MHhCrb+WuChGjJkavEQXaaJUBzEu"
+    "rqjQVCi+UpisixNhfljQ2nQufddlx4GCu3YucP/eJfqDnFaWMN3WPOncNk+/dBubZz1dPSQpFsh8TltiUnfKKK0jrajTA2yIZTYJ"
+    "2DKuVyRpyqDwqO4W+r5Lr5ziwSMVu/YNeHDfAkv9AVOdNt2W5oKzN3He9inO3Zwxm5Wo0TyZ69NSMaRhjO7i8cHGMSY4Ku/QxtTh"
+    "DwWCigHRogYqNgeJK/O2Cb0pkXA9EtVFAZxztHSG+BR6nsHBkuHhEcWiJ+TQSbuUpaW0Pib0VFGFo5FoW15Gvbcitk3rHU6IqeS1"
+    "opSoU9YKtIToIhssQTtUCiETsm5Ca1OLbKaFzgIYBzqGmQlKcMGOVQJCbAdNFl0RUwd9j11MSf3um4BRyowTVAZctORQoR6w6z5T"
+    "k2ycQU72JQM+i4t3lNGcrFazNYvWgiaIwnpBhxQpWizty+k/OESPNJnX2GyWe4su1+4f8adfvYf9bMZmc5TWYUKJ94uHLpiZfusf"
+    "/c3fvOvVr37qMQteb3lLUPPzb53aufPQtrvvvvc5ux/Y/3XWhstEJc8tC7dJKWkFpZSzVqjzwikFEhzaQ+4Xe5s63Z/84Ef+v/e8"
+    "/OUvt6xFuO973/v0T/yHX3rt0qJ+u3X6PI1RWguFGzohFApZspQHtfDFs86a+8Lmuek7X/s9r/jyS1/6vKVXv/rEq3QhBHXRRS95"
+    "2d7dC3/qXetiY7pig0XJiIqjXHnlK/ilt/4kT3nSLIoe+AHG9inu/yr7b70efWgXZ2mLKXNMcAQbwzKKNqhUU6qYS8qgY3btoNbQ"
+    "4a5Drsfom1ipdphAXDxb47osq6Z87U0cG0lcGJAQO2n0XtDgNaEMDAcFvaURg96AauhRI432GgmGRKckkqLFIHU6ai06huILgeBs"
+    "tGuWOAg45RjJCEk8pqPobm4zva2DmWtBavFEs57lwWNiMjCugkiikwgSmzp1Jx8vINbPG4k5XjN2tpgDy2qNUzFYuJUMqzJ6g5Kq"
+    "ckjwTLUyOplCU+HdCO1zEp+jQ8z8G2MNN6WI0mVjQtS8A5l4F15MTHutUtAdgoqOEC4onI/E2UiDihIJJUmo0L6oY7hG/beESArL"
+    "7WIiC+74/qqeDq1sKaFefBqjSWnTfJUm/ZGATQhVYNS3LM4vMTg0QgYJukoRiaaFCWl9vImZhevBAKKk7YIdv1MvnkpFm+lAtBog"
+    "8WQdRWu6RdLVzGyegiQgqYCJajJPhfdxEG/UJ+uhIdMoXtSfterOy6r+JR5CXA8gTAgtq9pXk5GYoKiCI9EJSYgByutk9/EcH0hM"
+    "gisqlG4j6QyHds2TH7KoRU3qWoQKqpntfG5e8Xd37OW6gzn7aIFqIyFgQs+nMvrCK/7NC37oHz75t3evKMgaeN/7gt61669a1133"
+    "iW233nrn5YtH+5f1+sOXd9LpJw/LYnMiyZRglA1eEi0EX7oi9O/6phe/8Puvu+FDX26us2at/vabf7v9tr/4m+87Mt//zm67vSUf"
+    "DY9OT0/dKUruevGLX/iFp1x2yYHp6V7/qquuWlOKPRHe8pY/nHrb//q938tt8kOZnjOFszFbQ1py9gUdfuonX8dP/ti/xbojpJkg"
+    "+VH08CDDu27m8Jc+x5xdwhQDWkEQDIQYas6KwyqLKEibYMengLUJd200ZLMeolturdOb6Izxu4qLABKn5ngFLiZ3rAoPFQyO5NiB"
+    "ZdgbUeYO7TVGMjLTQouJac1DbHyqTsQHAetjkBDf8bS3ZGzaMku6KYt6OGPxUsQgMyZKFw0kNNJLLHds/MfWx1rPvda+KPmCkxhY"
+    "3SmFV9FW1yOIVlhrkQCJjnkqvLN1ihhPIh6ZXPU/BYR6sco1mWglqkIazUAIoY433FiyhDqeRSTXhuBljTYxlvjqZ26IZzXG59Uk"
+    "srqOXJ31WaNr87oE7wKjYU7Z8/QfGOL6gSqPqqW26ZCpDEW0Bw/WIXXadI/DU1EGS6DCKYfXDtPWdLoZramUpJNgOgrdAkkFF0pC"
+    "EhAdJUdHjD1C3QJibI/1sbpejkHT9yYH9dpbMn5ZRbYTfweJ6wHaQ2JjpulAlN6DibpiqRxKZeBSqqGwZ9c8vi9kRUpKh1FIWEjm"
+    "+MCdB/n4fUf5sjOUZis+CAk2eHdgeNZU9rbf/7O3/vqVV155yrnLQgjycz/3tqmdO3d1d+3Y/4yvfOmOb/DOX9zpTl8y3z80bQj3"
+    "bNu2+c/e8iv/8do3vvGN9TR8HcIFePObf7t94403bF08dLAzOz09fMVrXjV/7rkvLt74xivGJ58uQghy+TNf/do773zgzwidTUgi"
+    "YgKoETrLeelLnsmf/emvc872FpoCqnkojsDeO7nn0x/DLBxgizhazpIQk1OGIDHuq3ZorVGujol7CjhhIzpdTDS6sQrDR0lXQrR0"
+    "gEhMdTRsGDiqkWWwNCIf5FQjiysDvhJwQieNmV5DqKVaZ2MkKK1J2kJ7a5v2XJtktgOZQMgJvsCbJrnmMqEqYitvpmvga0np2PpY"
+    "lmqXm85a9RZzUtWPicJJjLIW7T8UyuhIbqGejtau0SEEEiVxCrvGdRusJrDVCNLonYlZfanN1+oyRZ1iPWARrTBinrqaUFdcLWLy"
+    "OWUcYnPtQf2YOmlUMzW8i1JujGoXszogGjz4QiiPeEZHRyzML1ENS0xIMCrFSIYREzN4OIf1FZWPCTmD8XHgTaC7qU3SSZiaaqGm"
+    "WpCpqC5QNrZHX9ROCFFSniyvkjhrPJMYD1DjHccnXNExw7SpJA6OItE2VsV6DCWkqkPVExYPjVjY3yfzLdqkBOkyyua4a6B492dv"
+    "55Ylz4Nsoso2RX2/sqFF/95nPePCN954+yeunrj1aSGEoP78z69J//Vfr0lv+dxnt2dt1Tn7rK1Hvvt133RgkmxZp109Injzm3/7"
+    "vLe//Y/+QDP9GqU6iReLcyPSrmNuzvD23/mvfOdrvhHjerTSEkZ7oTjM0S9dz8K9tzM76tEpSxLnonRkFKiYdoaa2Nbgi+PimE5y"
+    "JrBKndFMjaOEFdOahFrtINSum8RRHR9T5VD5MfkOezn5MMfbQFVVMRqVilJi0krYtGmGmc3TqDkNJsaFCCGaUqkkuvCIBldPHWmk"
+    "maBq4lXjjtgQbphQH3ASZIcse/mFCRVATAsUbXcnJUWtYqwL8VFqM1oT3OlJtw1EZDz9j15TjVVF/BwTayB29+BiCZcZofkDjtc2"
+    "ToFwJ6HEEEJc5W9if8Q8dqo245uCYclgYUhvscdoKacc2egUUGfKEImLsjrVpG1DZyqj1W2TZAbpqGjMapaj5EGFr+MbxyzGMej9"
+    "+F1MlO+Y8j9EnArhQu3B7MC42nQSqGq1iYgmkzZ2qOjtz+kfLFC5oaVbKK/IzRSHW2dxzX2H+dsv3MkeZjioZhmRgB+ChGI6Kf73"
+    "T/zoD7/l1//oF4+uuvXDimOsFB4p/Nqv/eLo2mtvdf1e/jIR0xWlRWtNVZaUVcmmzTNcesmT2H7WZpQr8G6AMh5bDDi0by+msnTi"
+    "BAtCNLiOc0BwlcXUHetRx7hhrWrUUndCFRujSNMxQvQ7VzYSZhIgU+iW0OokpF1NZyZDtcDpEqcqkmnNzJYus9ummdk6hZpLIavA"
+    "FDGcoFToRBAT7+lsFcsRgCD19LmZEcRKDE1ktQmsR7TH7JdIr8Q1fGT8v8RIe0EwUid9xNdbs2K9rH55KJAmD1wI8d516DjxMTMB"
+    "ISDBxdCFtWQb/47BgJBIgifG2nVST8yXKWYVwQR8rHuihBuPie8nJnB0kEA6ldDuZEga8MYTjCMkDtMRspmUqS0tZrZNMbN9ivaW"
+    "Nno2QaaA1IGxoEusFDgKnHIx3ZEO+GDr0KVRdyLEdhBnOjFx6ZmCTKoSlveu2ERW7qHWksf6Ib47ISYBVXGxsX8op7c/J/SETuiA"
+    "1XjRDNIp7ugL1953kDuXchbpUJoOVgmIBKPsvnPO6f7eD73xNbc31gOPFB41VvqLv/gL/9M//d/2XXfN514Q4ClJ2lJlaUnSjEBg"
+    "3/4HSRPFN7zw+UCJSQOiHakRWkaxsGcfaQhkKhqR1NkWowmKmPFCzqOPxkqiaUYR3sfstNQNkroTejwWV0dhqmJGYsq4QpuCaWvS"
+    "qZTu3BQzcx1mtkwxu3Wamc0dsukEyYCkwpPjdBUjWam4Yh2I2VG9jxIOTScbl5OabCLZrqXGO4ZcJ9D8FlfO3fLThtiNVD2Vj0qF"
+    "KGVK7RGo8HX4w8Zofv37nAgKiGYEPmbUkBhRi+aqNfnGgSZAbUMLRGKWhnROpgzHHhOlw2b/2oTrfSQ7IZpuTch+KAWWaIYlKqAy"
+    "odVOaU1ldGbaTM122Lx9jumzunQ3t0lmNKoF3hS4UFCGISiLk5wgdaaFmMsJVHRsqH0Jx6XU9cuO9rLx/az1/k8Hq9vM6u9x57Ff"
+    "FbEssaCCUglaZaiQ0Duc0zswIBz1JGVCJh2sN5RpylJrlk/ef5Sb9vaZtxl9WlSmCTQ+KI22H3nd61/7x//lv7zptNagHgoeNcIF"
+    "uOaaf8z/9m8+JgcOHXlpCNL13kmSdPDOM8r72GrEi17wXLZt34QkFudytFa0Wi2W9h9AVyVS5aT4mBMtBJRojEnHCwCPHiY60biz"
+    "RTvdqKNSdYhIFVuXRKkiCIh4XKNrExs7iwoxhbhEO0QvFp0JSUdj2hoxHq+jBONVNFIPOk47nfd4F6eOKsSUQdEispHChLhQFqW7"
+    "RpWwwmaykVCP2TPxb6zGWX5eIovXaovmtxBTyIe6M9XEF4/2cQFPGnuIU9+AeG3qOMjxL6hVBquPbYg3fq9FLU6PcJen4s3+1W2g"
+    "/lpfe1lP3TjwxPegElXbR1tC7SprWoa0m5FOZ6g0oFJAO7wqccriVYU3HmViWwkqmqcFVbcfYhxoHxy6TpjaFC/qtGM91fz2kAh3"
+    "XAtr1OFa+1a8FYl6IKn7gwsejUF0iq8URS8wv/so5dGCqSIlcSmJdChVxoJpc88o8JHb93Fnz1KoKXIMpYcQqoDv7X76pef/wYc/"
+    "+u5bV5fgkcCZmL2dNkQkvOa7XvHpLJNPeW+rmenNFHmFkFLl8KVb7+Jjn7iOhV7JqBRcaEM6A+1NzJ13Cb47y8BFF1i0jkbW0e5n"
+    "9a0eJcRJEWE5MEfTEUMA7wPOxVxUPsRFL4idRFRAVAxjFxTRxEcsQcUAzRiHVxWWksqPcMqhEsFrT+XyFY1aKYUx0Y43mpLJilfv"
+    "JUZPC8RU1cebTk7qXlcj1N5o0R066m6h0VHW/vQ+bhqpA+nEbL7xuDhDORP6Q6mDDcXr1WZsDfeNg7UvE82ymVl8V36N5zsRTrbc"
+    "YUInHp+59mps3rsErM1jCnXtERVNu6zPcW6AD0Oc5Fgp8MYSTMDrWj/bzIp041pb2xH6EG2WlSbRpo6nIGPtabP2EQd8WWnSdgax"
+    "VrtZDQkx0FJELThpAy6h7AvDwwXlokXnQosE7QUnmly32F3CF/cs8OAw0KNFQQuTdtCiaGnKTd2pf/3Wb3/59ZP3eyTxqBIuwBVX"
+    "/NS+pzzlSX+OlHv6g6UgElfwjWQUI8/f/t2HuOm2O2i1NpPnCvQ0JLPMXnAR6VnbsVmXUppwhdFXfNK+9NFFTbjHEG9tixvqlfM6"
+    "tGEghvsLoTa6d9E8qfEtl7oDxTB6to5mFjuW9xZrS4KzaFXbhrq40htcIPjG9jeu+sbFuhC9n+rN4XESt9US2SRCaKSxmmDHbr+T"
+    "x4APggt1L14hV8YtxCKOz40kGV3uVl/79Lb6PhPbeABotMwCXgRfB+JZ1iQfi2Ovv3I7LiYGXZmwAlgm3nqwJQbdH5di7LruoppM"
+    "Uc/eAgGLczHjRtTH1u1ePMpFM7/JTbxEzZsNBFsPflJ7fDWec7Ud70NFvO6x9djUVfN7Q/zNwEjtOi4iMehV7UYrXuPzwHC+YGFv"
+    "j6RImDZThMqitWaAcNDDPT3H5x+Y51ClCDJF5aEqLZlWviiXHrz0KRe+++1v/28HVpfrkcKjTrhXXinu27/9G2+Ynkqv8SG3WVqP"
+    "vkFhK2Hnzv38xV9+gHvvO8jU1FZgGlQX2XwOs+dfQrplO0OVxji7SYbU+cwefUxW7YT0RN35Tgq1n/oxx8eFpuXPyTvU3+vFD1Xn"
+    "t1LjDt+44sbu3UwbfRNOT8XzH3qXY0xcjfRMXeKmtMtSVE2IIZyh+7JM6qt3r8DKeo3EO1muZTzSbWrZmmX5na58KytrqlFNCLG9"
+    "SIhuydqrGC6y/lxuS6vb1COL1QP2anJWJomJWr3CqAwqxeDIiNGRgqTKyGgRyoBJUgbBs6gU+5xw4wMHuW+popQu/VAgOkGCZ1TN"
+    "jzZPdT/yy7/6xptFzsCIcpp4VHW4Da6//l/LCy54pptfOPoi52SzRkSHaMRf+YojC0e4/BnP4MILLkS5Cm8rdCdFJQo77DNYPIpy"
+    "US8VpbXlQCOPHlY36KbDNrJL3Nb+F48XhOgSsLx//BkX0tf4rI8dfzbna2Ssl5QoITUKzWaBTAKoZX1r1KKeHoLE+04+JzT60fh0"
+    "Y1Kc1HFTS0chfj/9Ta2xrybUWpfblGP1Roir5ieH9Q5s9q8m6qYsywS5Nur3NtY5N++9qcO6BuOIHH+XeJQKEgl28t+4PVBfbeXv"
+    "qychcpySnQya93gs4nuJ48PyDSXUJ8XYN3VTNGhSsAmj+YqF/QPKJUhDRktaMbW8NvRMi4OqwxcO9fjUfQd5ICgqOkCC0RrnRz7F"
+    "3/L1L778d375V39+5+oSPZJYzQqPGt7whu/6fJbxj6kJZeVGBCUoSXDOsH/vAu9//8e4+aY7Uckmks5WCC1oz9He/iT0Wecx1C0G"
+    "XuN1jC36UBT+Zwb19HC8nRrUOODHygep+9f47/U/4yxhcirbqFoanW3EctkEYpzbumGc1FR5Hajatb7ZJhHq99Nsk81QhWUb2TON"
+    "k32e1W3nZM4505h8z8eg1vk2aOIbxKYWF0Yb2XjcDsafy3rrZcJb46HPAI5X38s65IiVxylsERDVhtBmdLhgYV8P2/NkISEhxXuB"
+    "VpejPqGXzXJv3/L5nfs55BMs01gEkxhyO6BiMLzgvG3v/9Erv3PsYvto4TEh4QJ86lP/PPy33/P6u++5a8fLnHfbfQhKJQYfAqEq"
+    "2bf/IK005XnPex7tdgrKIYBODQpPf2EBW45IdZ0aupYAHj1MDNlrbrF0cYV89VZLK6ImJIHYIGMMqijRrIVGol3uR3XPFcY6vki8"
+    "UYWw4p5Eu1DFsSPW2tLK+piUGY999rW2M42V12/0nidbpqhXPJlyrVcvJ3iuejCN73Fyi+c073dZ8gwTkRzq9zExM2401OPz1nnK"
+    "6NU2qaturEgaq5CmTA8djeATIt3Xe+PnuD3F/O7xiLpsMX5ECi7Fzlt6+wYU85bUt0hVBkGoHLjWFL1shvsKxTX3HeDmQ4ssyBRF"
+    "0gKlqGwOVGU30de99jWv/OWf//U3PaJODmvhMSPhAnzP97zkQS/5+33I+y54kASt2igzy7Af+NjHr+OaT9/IqFQE6ULSgU3b6Z5z"
+    "Ecn2cyhbbWw9mj/qjyb1IsbkdrI4iWOPtzAYubJePJzYvESTsTB26VyGDqC9jLcTdblJ/dvqjbE1Qu0qG6LlSJiIq+vGmRKWMUEB"
+    "jzpOjmwfPixL//X3pjzNotZx3j/jWUy9nWiO1UjIE7Ohh4KTqbnV0u94oUzisI9pMVzIWdjbo1qAtuuSuZjeyHuPN4ahaAbZLF/a"
+    "3+Pm3fMs0mGExobGzjgPgfzA7Jbp92x/8lsPryjAo4THjIQL8P73vz98x3dc+cC+fYe3FdY9ywelQyXRBk+Exf4CIo6LL7mQs7Zu"
+    "wuhoSoPyZNrjRgNYPEriKrTEUf9RQS1BHgOhlrwb+aKRPpe3uC8e7sVHeba2R4zb8t8CK88bnxtiF6sVY76WcMc624lNaueHJnKV"
+    "EOM7xDivKw+OHlGrLrDGJuMZho/ykvhaJo9OBYwX0QJqdTnqq8T/Th/LdUwcAI4p5fG3ky/AyR63dt3FIDG1Eh4mfov2uPF91/Oa"
+    "Vd8Zt4eVbSJKlnFAG09MJmY6UWcef1BjHf/kv+aYh4bJAUNCI9XGnQ3ZCg3ZRqL33uM95EslC/v7FActSdWiHTJUncklaMFnbQ5b"
+    "ze3zOZ++dz93jUqGapZSJfH5oylGb8vcpv/94pe88M/f+c5vHy2X5tHDQx/OzjD+4R/esefrvu65f4yr7jFK+1QbBIO1htTM8U8f"
+    "uY4//P/+kv5QcKGFCym0Z0jPfzLdsy9k2JohT7u4eiyJDTFKdI3Etyz/rpKGpXEzPa488LBiuZGuV4ZxDzpGQmywLB0t59taq/vE"
+    "zr4a688OzqTU19wlTNjHnlk0HXvl96gbX/6+9uda9fLIYvLdrlfv6+0/E4iWLWvo32syjkP52ltTg/Hc+KZjEP/QKJpREu2No91x"
+    "NGETK+hCoYaG+d2LFAsOsdHSIoQ6DofK8NkUw3SGAy7lszv2cffCkCHT9LwClcSMyiG3xvjPv/RlL/zzf/iH311c+RSPHtbuWY8i"
+    "RMS/5CU/eOumTZ0/8uXwQOmG4ANZMkMxzLDFDNd/7h4+9I/XUtqUEBLwCZgZpi55FuaiyzjSmiVXCUEUuSsosEgqeOWwRRGln9pU"
+    "ygeFDzHQiQoBRVVv6xFexHEbe1hbmiEsRw5opnlrbRGxfHrNf8u2lU2DDtJsy+d7ifeEaOsktalYszVTSF/b/3oFXlz0aOMY4TsS"
+    "o48RtlbvX3FMaOT4Rs5t6qOOjrZqi1qIqGZoNo6tvVPa4pR14l3Un9EhY6Je1vpctUULD33M/njO2mimzMtbtJ9utuZtr572u9o2"
+    "etJ+9ti3P/H3KlvbcbvxQtKoiIJCT9jiipdxnImmxidVENC8y7jQ1ixiRqk51FG7JrfoOBHzMQjBCyZotKvtfn1sC15UbBXikVAi"
+    "tZOGcw68RmyGOwzz9yxQ7nVkeUamkpjWJfH4RDNSLY7KLLvdFJ/bN+S2IyP2hoQ87aDSDGs9yjsvvrh72+bOH37wOb9//+pEjo8m"
+    "HlMqhQbXXvsX/j/84E/s/uJtXz4nUcmzlc609wI6pbKOUT7iwP69tDsJz37OZdgqjznMjMZkCcVgQFiaR/kSlRiQgLcVhkBqErAh"
+    "OhuEaA7jG8+jWsIlEJMjxr3HxfqLSaspYL3jjkUjJayP4//KmLib4+LnSlfelddYLaU8VMRpbpMPbmU5Tgbr1+tJoiFQOI3PRx/H"
+    "M2tc/5dljM3AahXBCU+auJ9MHB5CM5Iuq4KifDt5wWbAWlZR+LJEK4VKY7JKT4hJOEMdClOisUVAk5g2UmjKIxX9/SOKo5aWmkGs"
+    "whB1/3llqUxK2ZnjqJnl+geP8Mk7HuRBZ1gIGVanOC8En4cQ8sWtm6be+cY3/fAHXn7V1z8mVAkNHpOEC3DDLZ/qP/t537DrwL6D"
+    "31D4YltiOkoUMWeWEvbu30dlLU976qVccNG5YIegPcnUNElZMDh6AFuMECDVGiltDH6nFC4GI8XJsgtnlHrrplbrKk+GcOEMkMMa"
+    "eKhXXIs0H45yrotHXah4BJ/1YcDxCPdkMCbMSfZcA74Z4CfuF78D9RrCsnqjoe9lKtd14HoJ1Pp/haoXSMUIVsD6GJlMacFohREd"
+    "k5RKig4dfJEwmrcsHBgxOlLiCyHRGd45Um0QSSiDELpzzEubrxwe8Kk7HuDufsFiaCPtWfKiRAHdNBlob//+DT/4fb/9G7/z84+J"
+    "hbJJPGYJF+D3fu/vFj72sX9wQvps591saUtRRlNVDl95Dh+e58iRgzz9KRezdessrhqiEJLUQDEkH/Yp85xUJbSUAmvBOZSOrpxe"
+    "hbFWZdmgvA4wc4raljNNZg/1amvR3Zku43GxQbgPCWeKcE9UDc1bWt02gsR06isWvuqZoGpCJ44X3BTKL4f5hIBOJOahCHVyHB1z"
+    "sUUPSAWVQakuoTQsHhxxdP+QcjFgXIYJyTj4lGCwKsG1pumnM9x+eMSn7trFbUf65OkWFpxQekXwjhDK0rrBTZdd9rS3ffBj77jz"
+    "qquuWi78YwSPacJ9//vf4b7n377hvh337UhH+eD5JskyH5AkbaOTKYrS8uDuXSglPO8Fz2JqphNPzBKyVBO8ZXC0T8gLuiZBC3hX"
+    "oozC1Yp/ZEy5gOBF1alYGvvAk8PqBvuQcTwd8UlgrbPPeBmPh8c54YY13E0bHFd/f4bwUAm3bs4nxJqEKzFM6PgatRUJsNL3cYJw"
+    "l1UY8d175amoCCLoLMGI4J3Hlx5lDVrahKGwdDBn8cCQYsGjbUY7dMlUMrbmqbyiSjr0W7PcuVRx3X0HuGnfIgfpMlBTODKc93Rb"
+    "mdfB7Xj6Uy/49f9+1Q9f/axnPeuhRbB/mPCYJlyAL3/5M/m/+3c/tGvnzt0XVZW91NlgtGljg+CsYzToc+jwIawreOpTn0p3uosv"
+    "ClQ3o6U1xWDAoLdI6h2pFkJowh7WuQeaxRuik0EAgjTazlPrWOt10NPBQ73SWiU/k+U7IR7nhMsjXV+r8JAJ9ySxFuEGiS4WoTbn"
+    "C7VUC6DHM8LGUaLpJ42reAyA4yQmplQ6knJwAbGQSRtlpqEfWNw/4Oj+HnYArdAmcQnaaQRQGiyaImkzbM/xQKX4zM4DfPbBI+x1"
+    "LZaYpiAhTVokitAvDx+c7aZ/9Mu/8T/e+7rXvfYRj3N7snjMEy7Arbd+ZvGaa75wYNfOXU/ztM51VdAxJkBAmYRRPuK+HbuY2zzH"
+    "eeefy/SmbrT5TDSZUtiyoBz1wJeIckBVp5huonHF6VC0FY1NKFosnLr9pqqnXQ+VbmT1jlPEWvd/ZAlkdc080tuZweo6eySkWx4B"
+    "wm10tw1WSriN3e9kf4giSFOu1SQbaAKdxwBIQQnKRKsJVznwQiYtlE1gKCzsWWJwOMf2A6lLySSLDjcupjsKWjGShKWky85S8dk9"
+    "C1z/4FHuyw2LMkMlLZQYvM2DDuVCpsP7vuPVL/ujX/61nzyy/CCPPTwuCPeqq67iB37gO3fv2HFgZ29xeAWizsI5lWQZAhTDEYPB"
+    "kDvuuouzz97Gky6+EGM0Wit0u4uRwOLiEfJ8QGrAqIAKDhXiQlk0kSJ21Fq6Vc3q7GlA1kwpcmp4qN1trfuvJo8NnBiPVp093IS7"
+    "un2sJFwh1OIHNO7n9d8ika6XbQBrc7IQVRF1PGUfwGgTFQ5O05IWKnQo5ysO7zrC0oEBxiZ0QgfjNeJCTLuk6jR+acaCytjrDF/Y"
+    "u8i/3rWXe3IYms2MyEiSFir44MPSsKPDR17z3d/ytvf8/e/fv/wQj008LggX4Nprrw2/9EtvO3DD9ddLVRXPC4TpQKDV6lCVFc5C"
+    "nhfs3PUAF1xwARecdzatLI0EmiiCCuR5nzIf0DYqJjl0fpzritp3XkKtTqgNsk9nY40GfSKslpwecndbp1xnCqvLO4mTuVdz/skc"
+    "uxbWO3+9cp3scY82xu9r9Q+rsPqdrvU8q5+Zxlxwjf3jdlv/FGNq1JE1pE5TJI25X+3ZpgMOFxfGFOg09jNnPVo0yiuUMyQ+Q8qE"
+    "cr5iYX+P/qERadUi9QmZpDGAuLMEFUDDUGDUmWWvS7h5/xKf2XWYu3PFIjMUdBCdgS0JflC1xd209byZ3/jx/3zlbY90frLTweOG"
+    "cAE+8YkP2N/4zbfdccvNt5jRqLjcu9CuylJMmgFCWVXs3f0gd915D+edu52t27eRdadQaUJnuo1zFdVwSN4bkClNonSMJK9iwAwl"
+    "KkaLDXUDPLZdnjRO5c2v2VlW7zhVrNGp1sN65HU6OJVrnMqx6+Fkr3Gyxz1WcKLSnszzrHVMWGf/eN+xPwHLKgSIFgwx5r8gCkRH"
+    "5xXrPSKQmBbKG4zP0NJGSs3S3h777j9IfrSia2aY68zico8tLMokBK0pCNhUUU7PcF+uuHHPUT751Z3cU3pGchY2nQPVwlYlhsK2"
+    "EnvreRdMv/V//tZ/uu7KK698TC6SrcbjinAB/vmfP1j8wi/+j7tvuOHG7d6FZ4QgqXeONIuJI41qMz+/wP59uzn7/PPYfv4FSJaS"
+    "dLukOqEajbBFRbC2zjAQU93E7AkeJRpRtUnYOo3vZHAsha6NtciW+vyHsq3VqU6E0zlnEqdy/qkcezyc7HVO9rgGq11EHuntRJCT"
+    "iGYmImNdbbM1+xuM7XRlpYCxbIEQ1zGirjYe6yUgSuFcRQiC1gatEwgQnCDekIY2UhnckqO3v8fSwQG+LyShRepTfAXeeoI2BG3I"
+    "dUKeJCzphH0kfGF/n8/vWeDuvGTEJnq0yF1AOQ2MrGdpZ6ej/vAnf+Y/fuyNb/zBx+wi2Wo87ggX4FOf+nD/x/7d//O5r9y14yxr"
+    "q2eYJEmqciDeOZS0cdaxd98evnjbrVz8lKexZdt2CEJ70xzGeVppi4WFBZx3+KbR1iYKOlA7Ppxky18Hx+8K6xPtmcLJEszqcpzs"
+    "eatxuuc9VJzsfU/2uAandvQjj/WeRyZUDbLOWsKKc+s/V19Ph3rxt9bNNtYHk0FtvA9j12e8QTmDxpCEDCkMoyMl83uOsrR/gKlS"
+    "prNNtFUHV3nKqiLN2qisxUgZitYUbvYs9lVw056jfPhL93N7nlMwi9cz5EGh0CTivae/4/xztvzGr//2j/+fN73pR4crCv4Yx+OS"
+    "cAG+8KXPjJ5x6fPvGeTDC/J8eGmSpbrVmpKqcDFrrwgLiwN27trNOedcyDOe+SzEBtK5LSRJwmg4pLSWvCjQRpGlGQYhOBf1uk02"
+    "3dPEmMgfJjQda73tdHG6557ueeth9UCwHta77+r6ONnrNVj7qo9NTD5bUx/r6WpZXWfrEG4T/bEJU9P8i/uigGJ0SkJGsBoqhQ4J"
+    "xmWITekdHLC4v89oviJxLdp0CRU46zBJgkoTSoERiqFp0W9tYq81fGH3Etfee4Bdts0SM2BmKBwkxqCwbhSOHJmbyv74Da9/7V//"
+    "7H/9qaUVhX4c4HFLuAD7D90z/8//fM0Nhw7NP6nIh0/2QSettE1eFngxWK+Yn1/iK7d9ldnpWS6+6GISAdXK6Ey1sK6k11vClwVJ"
+    "HKdRwROCxLTra7fXk8Kpde9Tx+oOcjpYj4RO9dqnevyZxHr3Xm//yeKhnf3oYPKZw3Hq4KQIN0h07a2l2iaoTYyjHJ0eNAblDdpn"
+    "aNVFXEqxVLKwv8fCviX8UJG4jDYdjEvACaDwWpBEM/SeMmvhunPsHAY+e88BPnvvfu4aOeaZoZAOFoULHgk2jMLRfeefvfWPf/YX"
+    "f+p3f+l//uTCigI/TvC4JtyrrrqKXbu+0vurv/2nO/v98vyqGD25ckGZNBPvNQRNmrTYv2cfe3fvo93OeOozn0aSafRMm0R5sAU+"
+    "z6EoMMGTiEap5dXa08XaVLaMcBxPppPBQzn3RDiVa5/KsSeL9QaCtbDe/dfbf7J4aGc/OjgVwl0dY2H1sY0yotHdRsuExt22tsut"
+    "iC661kAhFEdzjuxbZGF/j1BoMtq0QhspFQpDYjLECEUoCJnGJSlV2mVvHvjCziPccP9h7i0VPbYwYgqSLoRACIWzLB3etmX6z/7d"
+    "D3z3//7lX35s29oeD49rwqUm3cMH7jn0T//42RsPHz58kVbuoqq0iaRdlG5RjSokQL/X58ZbbkanhiddegnddockS2knKTiPLfOo"
+    "ThgHymtC10Qbw+VV2rhJmHSTWG68qw3KT4TVDf1kcbrnNTgRqZ3M9U/mmFPFicq1GuuVYb39J4uHdvaZQpQmTxYnJNxaFxt3N205"
+    "HhOPXV4q9NTJPcchG2M6Jh1ABY32Cca3UC7DLXmO7l3k8ANHKJYsGS3ayTRSKbBglAIcRTWkwiGtNkOd0k+n2DmA6+7ex2fuOcRO"
+    "pxmyhQFtCuLitXMD5xnu3zzXefeP/tj3//Zv/dZ/O7jyoR5feNwTLjXp7t592+IHPvChr/SX5ucqa58s0km8RUyakmQZg3yIDXDH"
+    "nffSGxQ8/bLnoHVGa2qWVneKQb9HWRUUdoQ2CgkO76qoWlCCdSWiQGuDs1VsmnVM0TrwKpbogx6I1g5aomdObMJ1066zD6jj/Nb8"
+    "PvnbqW6rzz9e1oPJMjX7Tpb2junUJ4kTEetj0UpgssyhXpB62LZ6Kh9q6bK5WxzoV29Noet4tSzr8WM9+hXHjtusNO2wzgLo69jF"
+    "onC1F1mQmCJJiydFom1tqdG+i+sJo4MFS/uHjA6XhJGiHTLa0ka7NsEJxjh0YvFqiNcOlyZRZ9veypcOef7l7sN84WDBTtviCG1y"
+    "WhR4tBaUKqzzvd2bN7f/5P/5qdf/8dv+1y885qJ/nSqeEIRLTbr79997+Nrrbrhh354DWyurL8X7lklTrK0QpSgGfXqjijvvupv9"
+    "B45w/gUXccGFF0GWMpUlWFewtLRAVeRMZS0MzdQftDF4Z3GVixlHqXW89RakzmfSLFrVq7yTWGtxYxKT+9b6/VSwQto5Abk1WC0h"
+    "nQweajnXw8Nz1YeGFc/6MD13g2Yq37Si5m5r3XVS/TUZf7i2tZl4m8sHKqUihYeADzHXnKsFhxBAK1AqCgXBB8SBCgYVOkjoYucr"
+    "lvYNObpnkeHREu0S2rqDRuNdIDFtgvcEX+Ao4wDVblNkU8zrKT734BKfvu8wn9u/wG6b0ZcuQxI8QrudkZeLzvvBA9Nd/Qdvveo/"
+    "/e+3/OKbHvdkyxOJcKlJd8eOL/d/5X++/YtfvPUrHR94clWOOngvwQeSpI1zgeHSEvfd/wC77t/FtrM2c87cHMn0NO1WSpEXZGlC"
+    "vrCAEfA+Bt5QQYOHEDxJluKDx6moboi5p2I8hiZ03STdrkV46xFVs3+9308Wp3P+BuGeGOPnfZiee4ymHdQxDMZzD1ljq39bzsE8"
+    "SbaMfweBYPCiQRqZt453qwLKeETFIPzaOZSLRGx0SmKmCDZldNTS3zfg6L4BxdEKGWiSkJKoBERwtZ2utRVpqki1xjlNpVoU6Rz3"
+    "lwlfONDnn+96gC8vFvTMLEd8oCAw05oh2ILCLpWJ8rdvO3vud//7//iJ97z5zW94XC6QrYUnFOE2+Nd//eDS7779D2669rpPZ76q"
+    "nm5t1ZlqT0lVeQKaztQc/UHOvv0HuOWWW2hlLZ7/nOdAt8t0a4rFpUWqfECiFEqniMTU4bqeqoXglhP11QtscSFB6kDMNeGO++ax"
+    "nXOtfQ2O99vJIpbzZGkzYoNwTw6yjn3rGYXE/5p6OF59rLVuINShDpoTQwy2H1UURLKNsWWAJrdYo7bwmKBQXiE+QYUWvjQM5iuO"
+    "7Bkwv7uHHwipb9NJOrSTFgFwzuEBnRiUgtI5Sqdw6TSjzhZ224xrdx3mY7fv4j6bMk+XQ87S6Wwh1W36+QKZEWv94M7Nm9tv+9n/"
+    "8hPv/5mf+ZHeyid7fOMJSbgAH/7wXw9/73ffcduNn79hUBXFk7xnU3BKpUmXovCYpE0+yJlf6HHfzgfp9/psP2sbmy+4mOnNc4gt"
+    "GAwG9IcjQgAlHqNAS8BWJaKbBhxbrQoaYmTQ5VY+0UvkDNnJPpw4FcJtnuNUSf1k8disoWU8PE+9jNiSmra0rIFtspL4sYQ6cUwt"
+    "8Up93OT5UUCIXxsHBqXie/Te44OLZCtRT6t1F0JGKBSjo5b5vQOW9he4npCFLl3VRXtDcAFnq5jnjkBSrwN40QyDpmpPs9TexG2L"
+    "BZ+4Zw/X7VnkPptyVKYZhBat9maKUYm1o2DE59YPP332ObO/+dZf+bGP/NRPPb6cGk4GT1jCpSbdd/3ZX33pc9dff/jo0aVnKTFz"
+    "lRWlVIKtHEl3hqoomV9Y5IYbb2Ln7n0881nPZ+tZ28i2zWHLEYv9PlVVIdgYzlE8ptbhSnQkjwnwmn8Su8CJzMoeqlnYw4FTJdyH"
+    "Ew/v1U+ME72fE9XPQ4fU4ufKOzUlWt2+Jr9HXm2WHaPKIIjHi6tNuyLhSvOcPqBISCRFk6BdihSGasmzdLhg8cCQ4WFL6CvatJky"
+    "0zFluXMxAWSoo4cRVWpONH2VUHRmOZJ0ueVwj4/d+QCfPTjPbtemam1nFDKCpCQYSjcILaUGjvyGsy/Y/sv/45d+5FNvfOMbi+Un"
+    "euLgCU24AO9//1+U7/2bd955aN/glkMH5zeXlX+SIxhlEmm8wXxlKYJw6NAiN37xK/RGFRdeeB6btp/F1OxmSl/iXQ6uwNucTBvw"
+    "TSppg9AknIyt3uNPOrze8Tr1w4X1yOSxRLgnynjxsN+/xnr3OX7pzgQiWS4jKg7GlgNxyateXAurhqjJYPoQxIG4+ImNwWeCBxQ6"
+    "CNobktBC+RZ+BPkSLB7MWTyUMzhU4IeKzHfoSJvEaahqCx5cDIGaCCI6ZkoJitx0mE+nub1fcd0D+/nkzn3ctlQxr2cZmVn6JdH9"
+    "11fgcj9tzFHnR3/1ild/069/4Qt/d9MVV1zxuAhEczp4whMuwHve8x5373037771lh1fve/+HRdaV52nlEq9LQSt0a02SgyD3LJr"
+    "52527NrNsMy56ClP5ewLLyLPc4qiwDtLqEqyNIUgKKICV9U2i4LH4yao9+SwXqd+ONCoANa652OJcE909Yf7/pNY614nqp+Hjsl7"
+    "1n62DWpvr/j3eOfE79E0LC4oeKiDg8freATBiEGjMb6Fdi3Ed2Co6B0uWDgQg81UvYCyCW3p0FIZidcoF9ChIjMaj8MGh1OaSqeU"
+    "JmOoOhzRHb6aC9fuOshnHzzIzkJxVE/RDxmWlNS0UM4CeWgLh0d+/kOv+c5X/uY//NM77hZpnIqfmDi2JT3B8VM/+r+2/+2H//l7"
+    "Dxw8/HOis3O1SrX1Dq0lTo9chU4qulMjvu55F/OGK1/Ny694CtuSJeZ33Iw9eB/paIGuK5FySKYMGIUvCkpboRJFkiTYwo7vuVaH"
+    "VU1EsnWwWgpdbVL2cOlOG5xKqz8eiZ8KJp9JP8RrnQ5W1/HxcDr1M/l9rfc/edyK3yVaCywjmm6taB++aRMqLuKKxPiytWSspW5P"
+    "PoADLRliDRSaagh5zzJcqhj1S1zuMV4wkkXrAw/iPMZBIhI9NPHk3mOTFn3RLARDmU1xaOC5efchrt27yG6nOFBZClqQTjMq4zNs"
+    "ak8xGC2UntGuSy4673++5lte/uG3v+uq+YkHfMLia0LCncTnv/ipwetf/4av7H7g/uFo1LvE2WJzq5Up7+vQcirqlopRxa69h/jK"
+    "V+9nZm47l13+XFqdGTyawWhIXuVMTXURcRSjHkliMK2MYC3FKEdrM77niTrveljvvPX2n0mciM4nyyCrFgJPt3yT552sSuZM4lSe"
+    "4aHWz1rXX3P/MQJfvHOT1RaI9jMiUUVAXDgLOFStp/XO46xHnMJIhqaL2AxyTX7UsbC/z9F9ffrzOVJqWtLGOE2CIhFNpg1GBJwj"
+    "uALnPabVYRQ0fZ2Sd7cwmNrKvUPhMzv2cd2uw9xnU/Z4jWOaJJnCOTAi6ODCwB6utCpv27Ql+8M3v/3n/vqq//qmJ5QlwvHwNUe4"
+    "ADfffG314Y+895Y9ew5dd999O86T4M+x1ajVbk8j6OjckHTwleHw4UVu+9IOPvv5L5F05rjsOVeQTk8TFCwOF3G+pNtt4WyFG+Vo"
+    "0WiV1GZha3SgGuvtX421jltr35nGyRDKaoJY/f100Jz/aBAuE/c/0XM8lPqReoay3j1EBFV7hzWLYZFgJyXwuCimI8UidfjCmKEB"
+    "JNjo8egViaSkuosOXRhq8gVHb9+Q+T09Du1ZZLRgSUPGdDJNZjKUh9QYvK2iRY51KO9RAsokkLY4Ujiq6S0stOa4ZwCf2XWYj95+"
+    "PzccOspe2hxlBklnY8Aa7+kojYTCW/qH0zYfuvyKy37uT975q//yute8plx+8ic+1n7jXyMIIah/85LXPuXmL931H4Yj/8PWqdlW"
+    "ukl5EpAoNYTgcK6HhB7PecY5fNcrn8cbrvw3nNPtse/O6ykO3MuU79OuclrekwWDq4pxoI/TxWTHXz0lXWvfmcaJSt+Ub3U51tt/"
+    "qjh2wv3Ywonq50Q4kfpC1XfwY8INE4Rbk7aX2r28thIPUtecRxkI3oMVhAycwQ09S0cG9Odzhos5KiQkJBiVkaDRaEIIhOBAAlpA"
+    "KxXNxhz4oHA6YaQz1MxZHPIJd86P+MKew9x2cIld/YKetLFZl6Xc0mpNIXmOIg8pzg1Y3J+19XsvffpFf3LLLdfskGj4+zWFY9/0"
+    "1yD+8A/fN/Wrv/K/vvfI4cGPolovKiqnoS1aTaEUVK4ActotSzfN+frnX8S3fePT+baXPI1z2jmL93+ZbDhPqxrglxbJlEPh1pgO"
+    "njwe64T7cOOJRrjHe19rE26EhzXbkfhIuJGRBS0GhSZ6MxC7tgv4kWOwlDNaLCmHDjcKBKtRLokLZxKJ1nsf9bsASihdSZZlKKMp"
+    "rccGhUu7FOkUfd1mZ6/ill0HuHXvPDsHFYdQVHqGUrcYlgM62QxF0aMFQaiGOQvXnXv2tj97wxv//T9fddWb+pPP8rWEr0mVwmp8"
+    "9KPvL9/17k9+tcoPfOnLd3xpczub2ZKqbocgVK6QNGmhjMFaKG3g/l17+OJtd+J8Sqs9i5IMHRTBO3CeJNHgbR157PSxuiMebxp6"
+    "prE+PazEaiI52fKd6FnW/+XM4ET3PxFOVD+r62UtyHFUMM3eeJVIqkjMsAASyRVV5+HTqJBEmnYCVigWLeWio3dkRO/wiHyxwA8F"
+    "4xJMSGnrNmIFV3q8C2ilMSZBKQ0CSgwuCH3nyZWhnNpEvzPLA5Xmqwsl19y9l88/eIRdhaYv0yyRkIcEkgxBEaphEEa2YLAn0f5D"
+    "r3j1y3/zN3/nF659wxu+73GTDufhwNpv+2sYv/Br75j74J//w3ffddfON7fSuUuryrZcsEx1prDW4r0lSxWZCZAf5inb23z9M7fz"
+    "govbXH5hm3OmS+jtZ0pVJKGCdTrfeh2twVqEsNa+9bDWPSdxous8tKHixGjKt145Hm4J90T3PxEezvqJ73mlLBTL68c1YyTaguM0"
+    "3kOwYEtHlVdUeaA8GvCFxhUlwQYSMaSSoJzgKg8IidIoZai8oywsLniMMSRJhkKTB0/fJAzaLQ4qw91Hh9zywCHuPDBgwXU5XAUK"
+    "OijdpvSBMjiUFpSy3leLPSX2+ic/80nvevWrv/0Tv/mbP/81szB2PJxea3uC4+qrr279zM/84Qu/eMtXfjxNs1dUlZ3zQeks6YJK"
+    "43TOWXQYMq2GzJpFLt5q+abnX8CLn3MBT5qFTX6Jth8hOEJw6BBVDBJicJDY0VfSSuxOHi9xyriCDOrpntT+8JPnjDEx9WwIRY15"
+    "d+W9ou3wil0rsHylqBNc/RkJwSNe8OJRQeHFx+npMWZMx2Ly97VI75EiXNa8/+rnPRarCXd1LR0X4iem/svwxFgcayMe38TriG61"
+    "gBVcBcWwYtQfMejlFAOLFG2MtEmVRoJHBzBBYs6+um0563EhaiVEGbzSeAI2GLxuM1SGBZOyu6q49eBRbt59kJ1Lnp5Ms+gM2mwi"
+    "eEXlbYwqRhHKMCqFfGcnCx963nMv//M3/czrdlx55ZVfUwtjx8PqlraBCfyn//Q757z3vX/92kOH+z+syZ4tut12VklmMlxVEhgx"
+    "2xYoj6LcYeamA+du6/LSyy/gJU/q8NQtCbPTKbgh2vUwlEgoUN6TKB2zBdc2kyIS86AFDyo6VXjvxxHI8AFf92RlEnxoXDapu7gH"
+    "cRPdPXbQGG0qdtQV31cRbrPI54WaDJrzVlPJKuINqvZcWvkZ/fVj/Kq1sDwQrI1msWg9nMr5a0mzKqxNunFfIChFnNDH/ZP3ExHC"
+    "qtFKQh3EKMSwhyvfDQiTg1BARBFCiHFoa4nWo+J96oE54CCYmF2a6NWovEIc+KGjHFSMlkbkvRKfCyEoxBtAE3yC0Um8nbWIsyRK"
+    "Y4KAi2WyASyATrFK45WiEiFPOhwKXe5fKrnz4GFu33+Ee/sFC3TIzSw5HUqrSLMOtsgxxmPtklcUC1rcNc994TPf+X2vf/kNP/3T"
+    "P/24yzn2cOMEzXoDV199tXn72//+8n/5l+t+wLr0tbaS81OdpalJxFUjrBuSaEdmKopiASi4aHPKs88KfN3Tzua5z7iI87YkTCc5"
+    "7bCEtgMSLIkA3kdnCyCIIBpC3TE9gvhoR2lEoXxDBgrRBufrTk0j2VqQGOlpUoKKhAkQ81A1EpSIHpNswx3jvFUARDvi9SSuExPe"
+    "SjlvkqYnsUxUKz9Zk95P7XyHi/XQ1Ef9qSXWYwhueeCoJfZJcp4k7eV6XIXmupPfVxB+/Vt9jGoGSusIqrYuEEG0gVC75AZP8BYj"
+    "BqU0QoIrBZd7qmEZF8KODgi5xxcBSpCQolWrvp4ioPAhOt/UFAzOgnWEEKiCQiUtrEkZiWYkmoGHofcc8QlfPJRz1+Ee9x9e4kiA"
+    "Hh2GdCnI8ECazlCVOVB4RT5Q5HfMbe78zbd880s//N6/+70dT3SPsdPFBuGeJP7yLz/e/YX//isvz3v2++aPLr4G1IxCq5YxGC0U"
+    "xYBEBTrtlKXBXqYoOG/KcPHZXS6/eI4rnnIWTzs7Y1tmaTMiFD3aiQalIVRU1sZOqur4pHUUJ8GjiVPBEEKUrIJCKVNLozFMCUTX"
+    "4ugjvxZWEYbo6ME0SbS1RLZSumyIe3LfMtYn5JX3kxXy4sT+4xBmc/zqz5M534farXUNwpWaYNciXCLt1ilFj8WxknczFESMVTn4"
+    "cd3EfX5F+RJtcHXC0hDChIpBAUJipvCFpygc5bCiHMRPP3RQBCg9ygnKRdLWOiNIjOsBkeB9VSLBkijBEAjeoUQjSYuBdeSmzcB0"
+    "6OsWC9Ji36jgzr37uGvfUXYsOY4GGCCUJFS0cZIhKkHrhKIconBVN9NHkiz85Uu/5UUf+P7v/4nbrrzyWRvqg+PgmOazgfURQlD/"
+    "9b/+/pZ3/tG7Xzca2lcHka9z1s8451THdLE2WiZEiSVgGNENPc6ddlx+QZfnPXmO5z1pC0/e1mXaOEzIoRrhbI7WkLVip69siUkS"
+    "vI/TymZ62XTm4KUmaoXUhKt8Q4p1L6/D8BGiq+ckxhJkHUUq/t2QRk0M43PW1ivGaXAMun4MfDTIPx5O1PDWuuwkjnd+nKqvjea8"
+    "qBZYPmpS3RBCiAPSMfB4WZa1wwSRx1nJ8rCWTBRw8j6R8Ot3CLXt7PIAFYIQrGBHQjF0DJdGDHol1ciDVZhgMEHTTTLEC6q+TkAR"
+    "ROEdBBxGQIuvQzAGrLUUtsKpBJ+0KNMOA9PliE/Z1bfcc3TIPYd73H9wnj02J2eaUlIsglcaTEIIAVuWBAqXiZ5vafXJzWd1P/J9"
+    "3/1/feTX3vELC1+LdrWniuO12w2sg3e+86bkQx96x7lXX/3pHx2N8h8QWhekZspgFSIKrxJKD1pD6pdI/QKb6HNO1/PUc7o85exZ"
+    "nn3J2ZyzKePs2RZTqSVTJakq0KEk+Jj4EgCxeLF4XCTFeqobpO68QaGDwria/Gox0ClwakJcHBNtLUHXxLqMlVNfkWWiXYtUQ1jl"
+    "RTXJKSGAWrtpnWyXXD1INDje+ZPE1nhgjfcHdSypTtxn9W+qvtGK24mPOb/wdRzkKKFOqmKaq/ha4S7E3HZR8oxqnZiqJkqmBBV1"
+    "qqUjH47IB0P8KJDPF1AlWBd1s4QUrVK0mPhkPuY3Uz4S7BhBofBkIkCgwpMHT6kVLmtRpS1GpsNRa9jVy7nn4IC7D/W572jBfusZ"
+    "YLB06AOoJL58CeArcMMAvpjJ0tuyVD7w4//hh9572QsvPnDllVc+YaN7nWms06w3cDJ497uvbn3ww3/7jI/8w7/8iHPqFZnpXlLa"
+    "kGnTFU8GGkwoSMOIzI9IXJ82Q+aM47y5Nk87f47LLz6bi7a12dKpmEks06mjpT3KBxKtEW0JocJLQZCadFXA1otrEhQm6Hr1OaC8"
+    "IhCwann6O0kaY0lWyZhklxvB8tS4IVmZnJKvgcZ8qTk+hDAu47HT77XJez2cyvkrpNWacKkJOk7l42JWpCFgQgr2Eo9vrC0g6sEn"
+    "1RuRXCeeadXMYUVZgwLvkbGrbXQuIMTYyThNKANUAZtXFKOCclCQD0eUo5xQBFo2xYQUlEFUitIpQepFMKIOmLCcZVrVwWyCirOL"
+    "EAJeaUplyI2myFoMTMahMrA/d9x7sM89Bxe490CPIwgjuhS0KUlwOoEkoXQV2AKk8oR8SCjv2L597mPPesql73njT33Pzg3rg1PH"
+    "Gk16A6eKX//1d86+730ffsFtt93+eu/Cd0E6J7R1olOUUqhanxhshQ6WtoGOlHTJOatVcdFmw9POneLJ29ucPZsym3jmsozpTNFu"
+    "abSu0FKitANtwQSsLcaktrzC7lGNThC1kiTFL9OpNGZpEcskFhfpCE0mi5o8Jgh3dYNZresMIaywUlgPq68ziUDNlCt2rjxjdayF"
+    "FdN2lutEaksQFaKzrJZIUVKrABppXBEXEeMAY8fvrMH4+uM6rRfVVg1EIQgqKBLS+rfojBAqcGXAFgJOWDi0iCsDLveEyoMNUVcv"
+    "BoOQiSBesJ6oKkAIY229i6nHJRLtioFANE40uTfYtE2ZdujrlH1l4N75Jb6y9yj3z/c5OKjok1LSoiKhxFDV91BKk/seqTKh9GXl"
+    "GTzY6qT/dNmzn/qBK7/7tV/6+Z//9xs2taeJ47X7DZwi3vzmN7c/8qHrX7Bn76Efsrn6ZiG90KFS0KLTNkESgnVIABVKWiFnmiGz"
+    "esTmrOC82YSLtnY4d7bN1o7hrK5hy0ybqQzaxtFJPZ0MEu0Q40FHn3evI8k5XAxI7UH7ZYuEyFUrVQiTfDXZCCRMEu6xUu2YB4Mi"
+    "KI8KupYg6/v4OrW3shPy8rE49sqTWL1wdyyxTYZvXE228fzV+1izuftaNTI5AIFH05jYNbrVGLMgfpF6v0K8Gl+3Gei0V4SBR6zC"
+    "uUBZOPKRJR+W5COLK6POR3u9PEMRjZEoDSuJMWfxAU9cKA11bI9xjAXvY/hF0ThRWMChsQiFTiiyTRwp4cDIsruXc++RAfce6bNv"
+    "6FkiYUSGkwxb1wH12kO0kim9kA804W6d6H9+znMu+7s3fMdr7njDVW/4mvYSOxM4tgVu4CEhhCC///v/Z/rP3/Hul+2478H/d1iV"
+    "35CZ6ZmR9QYySVtdnAsE60hVANdnRgvaLdLFklGxfTbhwrkWF22d4knb5tiUBLp+yKyq2JQImS7ptoSsJZi2IuloaIETi8NhjEG7"
+    "mDolhBCJOLiogqg5Q+k47WQ8HV5uCmrCfIyaSJpjl8lp2e7WhzoMYP0JMZ6r1NLX5HUarND/rpJWicNDTXjN77WE3QwiTZlW6WZV"
+    "bQ7mkyadzCSWj12WWJefR8YLadFRAOLgFe/V6F/rvMxB1QZX9d8OQlmR5yUut9ilCpc78rykqhzBRzIVEgh62TUXDY2lSf0sojxI"
+    "GSOE1Slw8GAQjCSICN6D05pRUAwC+KwDnSn6Dg7kjvt6JbfvPsSRoWP30QH90OIwkCXncLjK8aQYlVH4HKMCJglhVCwSqAYGv7ut"
+    "7Uee98yn/+Orf+gHb/7Zn/3B4caC2JnBsS19A2cEIQT58R//xU0f/eDHX37w8NJ36KT9Muf1eVWlMheUtDpdRoMhrdSQSMAVA2DE"
+    "5mSKYXWAreI5qyNcMDfLhZunuKCbsjULnGUcU9qRUtBtCdpYxFQkbUXaVphMkaaGTCuMElSiQEutN/DgLTZ4lIqEGWqVRPR/C3H1"
+    "PIRotyl+2UHCx6m3BECtvcK/LA9GFl/dRSeJcbyotAbZAvjJhSDiVJ0Jwh0H6G5UHY0KoR5gJAnEHLKTA0Z9rxXS8uT50fEghIC3"
+    "Dl1LlVpqYvUSH9ILvghY67EjG91iC0uRl5SlJZSexBvEEt1ug6DEoHV0YlAIzsUg5ErMuD6dczjncVh0ohAdo3WpoKMKxMbg4TYo"
+    "Si+EdpcyadPDMF8J+4cFDxw+yv0LfXb2PXsGI/pAYIoRBk8X1FRc0DUZue2TGiG3Sy4wWNCKr3an9Eefe9nTP/6CFz/5zre//e2j"
+    "iYrawBnA2q19A2cM73vf+/S1/3TLpk/d8JnnHdi/+C2jUfldI+sv1Em746zEVKsiTLU7VMOcVtqiKHtkFAgDOnjO0oazW8I5nYQn"
+    "b5nhSWfNsH0qZaYFLSpCtYQJBZnxKLGIsoiqMKmilSW0WilZy2BSjTa1lGtUJGGt4lZbPjTTS+9zRAIqgCMgweFC1CJ6WKEHHkuN"
+    "QJOLTJrIU6tINaxjvbAa62ZEaMiycbtbRbjNcat1vBIm9c0CStVlra8n0b6ZUPu6YqKph7W4ylOVljKvcLnHlZYydzgb8IXHe1Cu"
+    "Vk0EBQjOBmoLWUQEVZvQKQljyb/ZojQfiyTKgFZYBBfAOh/1uBgkSZGkjTMZZdpivvA8sDBix5Eldi2M2DsoOTwoOeoDfTKstPDK"
+    "4CWhsAEhxSOgBOvL0M6UHxTzR5WEezZvnfrbpz7jgmu/57ted9d//s9X5hsS7cODk2v9Gzgj+L3f+2j2sX/862de/4WbX7XUG74i"
+    "zaaea32Y9ZVoSNDK4FyFJiHNDL4cYkJFG0+bnA4F5yQtzts0xbZuynmbOpw702Jz27ApDWShRMoCIceHAaIqtBK08mgTyBJFmgjG"
+    "aDrdNPo+GIVODEprxGhEK9AetEXELZNpWLmI5H2UQMe/C4QQbYVDrdagNptaln1rsyrxUZKesGNd/bn699WLc6sdKyZk6zj91tmE"
+    "mcakY0G9z8fA2LgYNzZKmIHgPN4JVe6wpacsLFVVEWyUMF3lCHZZvYCLaoHoFaZinjuWdcORaH28h3Mo7xAfSFIdF+1E4WuPwRjH"
+    "IIZC9LqD1xmkKd4k5Cj6NrBYOnpeuO/gPAeGFQ8uDNi9VHKwCiyiKMlwZHiVUXqPEkMZStrtGfJ8SAg2KC2Fd8P9Qrhx61ndf7ns"
+    "8md8+j/+x9fev2F18PBjg3AfYYQQ5GMf+1j627/910+6+dabv7U/qF5rK/8MHNuypGOwSuk0o6oER0AHT6rABIvyBYaSlIougTkU"
+    "29sp5820OX9Tl+3djG1TXbbOpNjRURLlMOIxeDQVRipSAlpZxFeIOJQOaC0oo1GJwqQJJKA7gmhB6ygVK6WiXrbJjWVq74hGEFrx"
+    "tyeEss4uK7Xsu/JTGQN1bq61fl/rc1KNoTAwoVtuPLa89yin0C6NoQpdJDrnfPTcq3N/laWNQbVtdK+21uJcwFU2Sqxe421UG4Qg"
+    "0b1amWjm5Wtdboh21w35S4jxL0IIiI76WOVBQk20AaSWZoMHrxg7FgSdErQiIFQ6Y6Q7jEgYesXRqmRfb8gDC4s8sNDjUF5wcFiy"
+    "5IUBmoIWlbQoJaUSDRgSDDhLUIHC90KStnxQ1chWoz0mUdc97clP+sdv/dZvuvkHfuBVh6+44ooY1m4DDzs2CPdRxFve8hbV67H5"
+    "g//0iRcd2nf0lcN+/lJFcolDTQfaSuoFEglRmtQiaAQTLKl4xOckDJnCsRXD5tRwzuwU52+a4pyZDtMpTLdbTGWatnKkoSBxBYmv"
+    "DYHEIaGE4IhGYx60QrQnmAAqoLVG6XoRTGq9oxJMlo7Jt/k9ejUJKFBJvag2YQEw+bf3qx0vVkKpOrjLqo062Av1gmDUkTZ/x9iu"
+    "YsHlMYeX+Kgb9b7WG9eE6ys3JumYOSFe18cL0s26MbiQj9J59A8DqaVmb2MAmki6jWPDssTvGhdrH1BEXTjU0dSUpgKsaCqdUClN"
+    "pQwFQuFgGAyHK8Wh3LN/oceehSX29occKiyL3tNH4VSLUYAyaLxK8JLiRRF8VIu0lMa5YfBUziQyX1S9ryoj/3Lxk8+/5pXf/eo7"
+    "3vFrG55hjwaO0+Q38EghhKA+8Ynb2n/yjj+55LOfvfHl80d7/9Y6fakyyRatEgNKeR+JISgdycg6DA4VHC1tSaVC7AgJOdMENuHZ"
+    "kmScPTfN9k1TnDfb5ezpjG2dlE2ZQvJenHyKQ3wFvsT5GOxEgsdVRSSJxosqhChpKkEk1GlYGkINBCUoFSVhkeWIVEwQbbN5gTRN"
+    "x783CGE5h5e3K2MJj8lxFUU0Emtz7DIxE1f96/2NSZeqzbgi1ahlHasy9eAWT7VVQcNHk7FpG5vlOCDEwq6+r0dQiVmOk1DXgRNw"
+    "QVOIYJM2pUkZ6YwewvzIsnehz775oxwYFOyY77PkDH3nGSKUZFSSYVWK0wll5aBuC9QKlXrACN5XzjMYtSTZbRJu2bJt9u9efMUL"
+    "v/TDP/aTu7/9259SbhDto4cNwn2M4eqrrzZ//dfXnPuPH/jIFb08f0UxKr7RB32R0VlHVKJdUIQ6kpdSCucrvC0w2qHEo3xFFjzd"
+    "YGnjyYApEeZamrOnW5w722VrO+G8zdNMKc90qujoQCIOFSyqlqAzC4n3BDz4qJuNcSJCpJTgo862NjmLgl+UeEUEwzg+4dgUjUkJ"
+    "sI6Stho1PS2T5gQakmSCiFeTObUuVKlosTrW3IY69GFNs831mrCV4yNryVn0+IY1mS7rrEUE5xxBxb/rGsHVZXKi8SaNOcBCAG3w"
+    "KqESxSgIw6DoecXh0rG/n7Nnacj+3ohDgyHzw4IlFxhJh5EYKh8dGYJOcSQ4ZEz0WgtaPK4s8KEKmpALHAnYz09PZTdedNG5n/6u"
+    "V37rPUz/zPxVVx1jI7eBRwEbhPsYRQhBvetdH+p++O//6fw777nvhXv3HviW3mD4TYlpb/GelvfaZFlH8iJH0KR1cBGNxDgAtiRV"
+    "Cu9LppKUXnWYbck0oeozUxPwtA5s7aZsn25zwVlzdJRny+w0bRybUSSuIjiHOIsOHiUh6oODR9dmZhIqkMbRIKolQggkNctGEvQx"
+    "noBIJOWa+BrSDLXXVwOPIni9bIZWQ8FY6lyNyYhngq6jgdUOGSGgqIm03pcaQ3B+LIlrqSXzELAhYLUea5Djc8XFwBACLli0MXhR"
+    "MSmtKBxRHxtQVBhKPcXisES1ujhtmB8UHFgasXuhz0Ll2NfPOVI4DuUlLulwtKqwGKwINiRYUnwd/SuoWMam/uqBLgRfOGOk9K46"
+    "an3xwNzM7GcuvvDif3nNt33Tbd/5/S8/+oIXvMBuSLOPLWwQ7uMA73vf+/Thw9XMr/7yb71oOCqesbQ0/EYwzw5BzknSdjsvK6VJ"
+    "0Sqh9AVCQqbbFK4gEY0xBqMgL/rMtjLKvEcHTxfHtAkktmDGwJSBC8/ZzvbpLpt0oGtgqpXRTVLaSpGpQEYgDQ5cRUqUqrVqslg0"
+    "Acc9SW2NEKfp9UJSiOEmGU/NJ9UVDUFH6bO0MXSijCOSxWuo2m54WcKdSCU+9lFWOFs7cIyJPpalkW6djyoLqWMQTG6BGIjbIgRv"
+    "Y6hHJdF8Tknt2SVUKCrRlEEoUFgvVCES7t6lIYuFZ77XZ743YqkMLNnAoUHJkodFHKJn6DlPicEiSNLG+oBog63AqLhgGYIDb/G+"
+    "glB5H6pCqBZE3O1Zqj8/3e3e9nXf+MIvvfKVr9rzEz/xvcONWLSPXWwQ7uMIIc4l1f/5Px/r/s1ffuDCz1z/+VeUVXXFqCwuN6p9"
+    "QZKkU0Vh9VR3kxqNAiZtUxQFxhiqqiRJEspqSNukmOBQbkRLBMKQDgKUCAWOIdMoWiJ0jKGbGjZnbc6em+b8TZvY2m1zViuhJdAW"
+    "TyqeJESLiGh7GhBnUVqi5IiPK+beohvCdDGUZag9qeK0fVkYM3o59KMExhGxGoIMYdlpIxLqsoI1hIAOUcKlXsDytT7VBYkOHtpE"
+    "UzaJrskhUJtERztVncRgNiiNF4MTFWvHa3I0I6dZquDQsOTQ4oj9i0MOLw5ZHIzo2YolRohuk7uKHE+gRY7gSIE2BSC6xchVtFsz"
+    "DPKcdrfLcJAjKpCmijzvAdaBc4IMA/ZgkpgdnVZ64wXnbb/6Va955V3f8R0vPPzN3/zNbkOSfXxgg3Afx3jnO29KhsMHu5/85Ecv"
+    "+dSnrnn2aFg+t9PpfP1gaC82TG0SlSZKGQo7IEmnyLI2/d4i2qR4VyHB0dKayo0wBFoiCAGjA5UdYpTHENDekuKYFs1cK2E2Mcxl"
+    "CTOJMNduMdfKmGknzHTadNoZHZPQUoFECanoqJm1VU24Aa0iycqEfriJERAl4YD2Vb26r8fSLTAOutgoIRqSbKTeGKM2jKOF+dpT"
+    "zgXBS7yiU0IZiOZYonAieBXjRwgaVKDyjip4rBdy6xiUnqVRwWIR6FfCA4cWGHlNzwq9EnploF95CgI5DkvA4iiwJNLGJC0K5/FB"
+    "U3jHTHeWxcECnWym9jAL2JCTqQ6BMlS+VwSKfpqk92Zp+mUX7E2bNk3veNGLXnzXq171rfM/9mPfOdog2ccfNgj3CYSrr77avPOd"
+    "H9zywAO7zrnj1vtfNSzc5c75Z5mkdXZe5bPatBNtMlUWFaLjCreI4J3D27JuDg6NIlCSEP33NQFVh0YxeBIciqhSyBAyBalSJAbS"
+    "RNMRxVadMGU00+0OnU6bTqZpZyndLCNLom5W8JGARTC1SZkWhcGR+doKQwyiat2rLFtBhDoAeiPdRil1WcK1wRJCwAehCuBiNEQq"
+    "ojog955R5eiVJcOiZJBXjMqCUVGSVyEmjvGBUVGRF45RZcnx5EitAtBYkvp6hoqYkyzUYW9AYXEoFEo0RSgBQ5Zk0eY3VGilMKJC"
+    "6UYOXNVJssWiKvdCdX9rSt84d1b38y++/Dl3/t8/+G1HN5wSnhjYINwnKK6++urWHXcM2r/7m2+7tD8cXdxb6r2gPyqfE+Cp7c7c"
+    "WWXpukGU+KoA05K4wiSxSVhHlnXAeZy1eCwQ4ytoibQiwaPE1alkorSqJWCU0AKmnKUNpCYhMQojYDSkSjBaaCcmqh4IUTWqovSq"
+    "lMKIp6sViTT2vSp6bDV/N6Znkwiqjr/Q5CqLqoTSWcrKkdu4FS5gAwxLSxEChYXSR3nZeqicp3QwCgaLYSLiLAFdxxGrXW9jTdS/"
+    "LS8SBiAPQzSabqtLXpYUfkSq0uDxOF+FQFkkWvWtK/dPt1p3dzutW7TivrSd3vuaV77swed941MXf+RHfqTYkGKfWNgg3K8RhBDk"
+    "jW/8hZkHduy65Prrb3pRnttnK22eltvi4paZ2lK5kLlQGq1aygUvhCSmmYmrVJERiWZThIBWcXKv69Q+Epe4xlYSzg0iGSM1JTVb"
+    "bV6GrdUIzRYlXiCmiq8l7Xh+DOUtMXfteF+D5qz4l4ppiaJNAYGYkNPW6oWGPKVeqIr7BMYqiMZNISWQ1F0kPoGD2hrBk0gSF+tC"
+    "DGlIqK0YCCgsU60WeT4IAecLCpdiStF6vnD9fe2svctS3XHOudu+8KIrLv/y9PTs0Xe96239DXJ94mODcL8GcdNNNyX33dfL7rv9"
+    "ts3ved+HLjp88Oj5SwtLzxq64pnttHPWsMzPQmVnge4CCYggSqIErIn2Wkmk2BApMCZ+iSEZvXi8dgRxkaDHlOXRHmhsWkMk4EYi"
+    "bY5r1AOT8RMadUEMFF4vpAlIWE73Pin1NmqHZTJe/gzUsW9UDFgTrx3P9bVZmUbjg6+pO8Y8EN3oeAVbFSAhjAeU4EOdf84LVeEp"
+    "+oHqUCdp765sedfM5tl7Ou10x5Zt2/d8//d/z4GnPW1TP8/zYiM9zdcWNgh3A1BLwD/7s7/VmZ+f7xw6tHfLl2667fL5w/PPKJ09"
+    "T+nk7NxW28BsVkk27Su6MfdLpkB09ABIVWoyJSFQWovOYiwIEcEXBTpJo/eajrKqtRZjzNhkLJbBRZdYiZTXNM8V6gMfCVDiD9El"
+    "d8JawXuPDTWZ+oBOUrz3aK2x5Qjq8IiIH0cca0iz+TvRGucKWknCqCqpsGSm44MEX1TOoVSt9LYjYFEUPQl2PgQ3n2p9wLTUrlZL"
+    "3XfeedvufOpTn3n0nJdeuvQHP/3TxfJDbOBrFRuEu4E1cfXVV5vsYJYslAvJ52/9fOuam768uTe/tKkMarrfz+dK67Yu9vrb8pE9"
+    "26hsi3N+zlbFDKhNqWm1S1u2wWu0SQSjlRLtvZeo/rVkrY4URYzjgGhEiYQ66ItSCldFfewkVhBvaHS5y4HUG6nW+RCzGqs6DFdV"
+    "c51WaK3xtgpKAt5bFCFoBSqE4HwVHL7y2ErhSo0uAypPdJKj5dCoHB0E2bll69aDrXZn//RM+6jBzzs3WDpv8/m9K176jMGllz6z"
+    "PPfctOz3+3ZDet3AamwQ7gZOGyEEeetb39reuXMhLeZDtufA3s6De/dcMOiNthW2PLssyqkQwqygpwpXTmmSrlJ62vnQBaYcfsoo"
+    "01ZKtyprUxG0FwRfSR2wt7lTVGeIqgPKiuAJSJRNQx1wJh5K3ayjHURMb6uDCsFrg7O2rAJFrqDwVH0IfYFFjSwZrXqJMUeU0Ye0"
+    "ah1WWo7orHV4bm7z0a1bN/dmZmbySy55+vD3f/+nNuIRbOC0sEG4GzijCCGo97///fJMnqkfmErF2iX9wM03qOtvuj15cN99rdKR"
+    "6STLhqO8ZZ10QhVavbzXKcuy3Z5qt1wVsr3793SNStsem7ggKd4lIMrjBaUFIPgQRKlgUN7jHIjVoqxS2ikIiUrtqCxK7125ZfOm"
+    "MklMkWo9dCEUrZYZCTbPprqjbqJGJWGYlKHobttUXHLJM6vLLtvsWq2X+Lm5+/ztt39v2IhDsIEzhQ3C3cBjDm95y1sUoM7dd67k"
+    "Wa7mN8/L0tLMirY6GCxJt7sUZuZnAsD8zOZQFC1/zjl7x5LnZV+9LHzv+77Xb0ijG9jABjawgQ1sYAMb2MAGNrCBDWxgAxvYwAY2"
+    "sIENbGADG9jABjawgQ1sYAMb2MAGNrCBDWxgAxvYwAY2sIENbGADG9jABjawgQ1sYAMb2MAGNvA1hf8fqL9O+zi92FAAAAAASUVO"
+    "RK5CYII="
+)
+
+
+@lru_cache(maxsize=None)
+def get_icon_bytes():
+    """PNG bytes of the application icon, decoded on first use."""
+    return binascii.a2b_base64(_ICON_B64)
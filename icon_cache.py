@@ -0,0 +1,115 @@
+from collections import OrderedDict
+import hashlib
+import os
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon, QImageReader, QPixmap
+
+THUMBNAIL_DIR = os.path.join(os.path.expanduser("~"), ".myapp", "thumbnails")
+
+
+class IconCache:
+    """
+    Process-wide cache of decoded icons keyed by (path, size).
+
+    Entries are evicted least-recently-used first once the decoded pixmaps go
+    over `max_bytes`. When a size is requested and the image on disk is bigger,
+    the downscaled copy is also written to THUMBNAIL_DIR so the full image is
+    decoded only once, even across restarts.
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024, thumbnail_dir=THUMBNAIL_DIR):
+        self.max_bytes = max_bytes
+        self.thumbnail_dir = thumbnail_dir
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def icon(self, path, size=None):
+        return self._entry(path, size)[1]
+
+    def pixmap(self, path, size=None):
+        return self._entry(path, size)[0]
+
+    def invalidate(self, path):
+        for key in [key for key in self._entries if key[0] == path]:
+            pixmap, _ = self._entries.pop(key)
+            self.total_bytes -= self._cost(pixmap)
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def _entry(self, path, size):
+        key = (path, size.width(), size.height()) if size else (path, 0, 0)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        pixmap = self._load(path, size)
+        entry = (pixmap, QIcon(pixmap))
+        self._entries[key] = entry
+        self.total_bytes += self._cost(pixmap)
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (old_pixmap, _) = self._entries.popitem(last=False)
+            self.total_bytes -= self._cost(old_pixmap)
+        return entry
+
+    def _load(self, path, size):
+        if size is None:
+            return QPixmap(path)
+
+        reader = QImageReader(path)
+        source_size = reader.size()
+        if not source_size.isValid() or (source_size.width() <= size.width()
+                                         and source_size.height() <= size.height()):
+            return QPixmap(path)
+
+        thumbnail_path = self._thumbnail_path(path, size)
+        if thumbnail_path and os.path.exists(thumbnail_path):
+            pixmap = QPixmap(thumbnail_path)
+            if not pixmap.isNull():
+                return pixmap
+
+        # Let the reader decode straight to the target size (cheap for JPEG/WebP).
+        reader.setScaledSize(source_size.scaled(size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            return QPixmap(path)
+        if thumbnail_path:
+            try:
+                os.makedirs(self.thumbnail_dir, exist_ok=True)
+                image.save(thumbnail_path, "PNG")
+            except OSError as e:
+                print(f"Error al guardar miniatura: {e}")
+        return QPixmap.fromImage(image)
+
+    def _thumbnail_path(self, path, size):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{size.width()}x{size.height()}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.thumbnail_dir, f"{digest}.png")
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+icon_cache = IconCache()
+
+
+def get_icon(path, size=None):
+    """Cached QIcon for `path`, downscaled to `size` (a QSize) when given."""
+    return icon_cache.icon(path, size)
+
+
+def get_pixmap(path, size=None):
+    """Cached QPixmap for `path`, downscaled to `size` (a QSize) when given."""
+    return icon_cache.pixmap(path, size)
@@ -0,0 +1,246 @@
+from bisect import bisect_left
+
+from PySide6.QtCore import QAbstractProxyModel, QModelIndex
+
+# Ranks, higher first
+EXACT, PREFIX, KEY_SUBSTRING, VALUE_SUBSTRING, FUZZY = 5000, 4000, 3000, 2000, 1000
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def fuzzy_score(query, text):
+    """
+    Score of `query` as a subsequence of `text` (0 if it is not one); letters
+    that come close together score higher than scattered ones.
+    """
+    position = -1
+    gaps = 0
+    for char in query:
+        found = text.find(char, position + 1)
+        if found < 0:
+            return 0
+        if position >= 0:
+            gaps += found - position - 1
+        position = found
+    return max(1, 999 - gaps * 10 - len(text))
+
+
+class InfoSearchIndex:
+    """
+    Lowercased keys and values of an info table with a trigram index over both,
+    so substring matches only look at rows that contain every trigram of the
+    query instead of scanning the whole table.
+    """
+
+    def __init__(self, rows):
+        # rows: [(key, value), ...] in table order
+        self.keys = [key.lower() for key, _ in rows]
+        self.values = [str(value).lower() for _, value in rows]
+        self._trigrams = {}
+        for row in range(len(self.keys)):
+            self._add(row)
+
+    def _grams(self, row):
+        return trigrams(f"{self.keys[row]}\n{self.values[row]}")
+
+    def _add(self, row):
+        for gram in self._grams(row):
+            self._trigrams.setdefault(gram, set()).add(row)
+
+    def update_row(self, row, key, value):
+        """Index the edited key and value of `row` in place of the old ones."""
+        for gram in self._grams(row):
+            rows = self._trigrams.get(gram)
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del self._trigrams[gram]
+        self.keys[row] = key.lower()
+        self.values[row] = str(value).lower()
+        self._add(row)
+
+    def _candidates(self, query):
+        grams = trigrams(query)
+        if not grams:
+            return range(len(self.keys))
+        postings = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+        return set.intersection(*postings)
+
+    def _substring_score(self, row, query):
+        key = self.keys[row]
+        if key == query:
+            return EXACT
+        if key.startswith(query):
+            return PREFIX - len(key)
+        if query in key:
+            return KEY_SUBSTRING - key.index(query)
+        if query in self.values[row]:
+            return VALUE_SUBSTRING
+        return None
+
+    def score(self, row, query):
+        """Score of one row for a stripped, lowercased query, or None if it does not match."""
+        score = self._substring_score(row, query)
+        if score is None and len(query) > 1:
+            fuzzy = fuzzy_score(query, self.keys[row])
+            if fuzzy:
+                score = FUZZY + fuzzy
+        return score
+
+    def search(self, query):
+        """{row: score} of the rows matching `query`."""
+        query = query.strip().lower()
+        if not query:
+            return None
+
+        scores = {}
+        for row in self._candidates(query):
+            score = self._substring_score(row, query)
+            if score is not None:
+                scores[row] = score
+        # Typo-tolerant fallback on keys: "dbpass" finds "db_password"
+        if len(query) > 1:
+            for row, key in enumerate(self.keys):
+                if row not in scores:
+                    score = fuzzy_score(query, key)
+                    if score:
+                        scores[row] = FUZZY + score
+        return scores
+
+
+class InfoFilterProxyModel(QAbstractProxyModel):
+    """
+    Shows the rows of an InfoTableModel that match a search query, best match
+    first. The order is a plain list of source rows sorted once per query, so
+    ranking thousands of rows does not call back into Python per comparison
+    the way QSortFilterProxyModel.lessThan does.
+
+    The search index is rebuilt lazily after rows are added or removed. An
+    edited row is re-indexed on its own and, while searching, moved to its new
+    rank or into/out of the results with row signals instead of a reset, so
+    the selection and an open editor survive.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._index = None
+        self._query = ""
+        self._order = []
+        self._positions = {}
+        self._scores = None
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.rowsAboutToBeInserted.connect(self.beginResetModel)
+        model.rowsAboutToBeRemoved.connect(self.beginResetModel)
+        model.modelReset.connect(self._on_rows_changed)
+        model.rowsInserted.connect(self._on_rows_changed)
+        model.rowsRemoved.connect(self._on_rows_changed)
+        model.dataChanged.connect(self._on_data_changed)
+        self.beginResetModel()
+        self._on_rows_changed()
+
+    def search_index(self):
+        if self._index is None:
+            self._index = InfoSearchIndex(self.sourceModel().items())
+        return self._index
+
+    def set_query(self, query):
+        self._query = query
+        self.beginResetModel()
+        self._update_order()
+        self.endResetModel()
+
+    def query(self):
+        return self._query
+
+    def _update_order(self):
+        scores = self.search_index().search(self._query) if self._query.strip() else None
+        if scores is None:
+            self._order = list(range(self.sourceModel().rowCount()))
+        else:
+            self._order = sorted(scores, key=lambda row: (-scores[row], row))
+        self._scores = scores
+        self._update_positions()
+
+    def _update_positions(self):
+        self._positions = {row: position for position, row in enumerate(self._order)}
+
+    def _on_rows_changed(self, *args):
+        self._index = None
+        self._update_order()
+        self.endResetModel()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        rows = range(top_left.row(), bottom_right.row() + 1)
+        if self._index is not None:
+            source = self.sourceModel()
+            for row in rows:
+                _, key, value = source.row_data(row)
+                self._index.update_row(row, key, value)
+        if self._scores is not None:
+            query = self._query.strip().lower()
+            for row in rows:
+                self._rerank(row, self._index.score(row, query))
+        for row in rows:
+            first = self.mapFromSource(top_left.siblingAtRow(row))
+            if first.isValid():
+                self.dataChanged.emit(first, self.mapFromSource(bottom_right.siblingAtRow(row)), roles)
+
+    def _rerank(self, row, score):
+        """Move one source row to where `score` puts it in the results, None takes it out."""
+        if self._scores.get(row) == score:
+            return
+        position = self._positions.get(row)
+        if score is None:
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._order[position]
+            del self._scores[row]
+            self._update_positions()
+            self.endRemoveRows()
+            return
+
+        self._scores[row] = score
+        others = [(-self._scores[other], other) for other in self._order if other != row]
+        target = bisect_left(others, (-score, row))
+        if position is None:
+            self.beginInsertRows(QModelIndex(), target, target)
+            self._order.insert(target, row)
+            self._update_positions()
+            self.endInsertRows()
+        elif target != position:
+            # beginMoveRows counts the destination before the row is taken out
+            self.beginMoveRows(QModelIndex(), position, position, QModelIndex(),
+                               target + 1 if target > position else target)
+            self._order.pop(position)
+            self._order.insert(target, row)
+            self._update_positions()
+            self.endMoveRows()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._order)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self.sourceModel() is None else self.sourceModel().columnCount()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or proxy_index.row() >= len(self._order):
+            return QModelIndex()
+        return self.sourceModel().index(self._order[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        position = self._positions.get(source_index.row()) if source_index.isValid() else None
+        if position is None:
+            return QModelIndex()
+        return self.index(position, source_index.column())
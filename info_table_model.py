@@ -0,0 +1,175 @@
+from PySide6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QRect, QSize, Qt, Signal
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QToolTip
+
+from icon_cache import get_icon
+from utils import get_resource_path
+
+KEY_COLUMN, ACTIONS_COLUMN, VALUE_COLUMN = range(3)
+
+
+class InfoTableModel(QAbstractTableModel):
+    """
+    Key/value rows of the current project's info.
+
+    Edits to a key or value stay in the model until the row is saved; the key
+    the row had when it was last saved is returned for Qt.UserRole on the key
+    column, so a rename knows which key to replace.
+    """
+
+    HEADERS = ["Key", "Actions", "Value"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # [saved_key, key, value]
+        self._rows = []
+
+    def set_info(self, info):
+        self.beginResetModel()
+        self._rows = [[key, key, value] for key, value in info.items()]
+        self.endResetModel()
+
+    def clear(self):
+        self.set_info({})
+
+    def row_for_key(self, key):
+        for row, (saved_key, _, _) in enumerate(self._rows):
+            if saved_key == key:
+                return row
+        return -1
+
+    def set_value(self, key, value):
+        """Add `key`, or replace its value if it is already listed. Returns the row."""
+        row = self.row_for_key(key)
+        if row >= 0:
+            self._rows[row] = [key, key, value]
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+            return row
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append([key, key, value])
+        self.endInsertRows()
+        return row
+
+    def row_data(self, row):
+        """(saved_key, key, value) of `row`."""
+        return tuple(self._rows[row])
+
+    def items(self):
+        """[(key, value), ...] as currently shown, edits included."""
+        return [(key, value) for _, key, value in self._rows]
+
+    def mark_saved(self, row):
+        self._rows[row][0] = self._rows[row][1]
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or row < 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == ACTIONS_COLUMN:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        saved_key, key, value = self._rows[index.row()]
+        column = index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if column == KEY_COLUMN:
+                return key
+            if column == VALUE_COLUMN:
+                return value
+        elif role == Qt.UserRole and column == KEY_COLUMN:
+            return saved_key
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or index.column() == ACTIONS_COLUMN:
+            return False
+        self._rows[index.row()][1 if index.column() == KEY_COLUMN else 2] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+
+class InfoActionDelegate(QStyledItemDelegate):
+    """
+    Paints the copy, delete and save buttons of a row and turns clicks on them
+    into signals, so rows need no widgets of their own.
+    """
+
+    copy_clicked = Signal(QModelIndex)
+    delete_clicked = Signal(QModelIndex)
+    save_clicked = Signal(QModelIndex)
+
+    BUTTON_SIZE = 24
+    ICON_SIZE = 16
+    ACTIONS = [
+        ("copy", "assets/icons/icon_copy.png", "Copy value"),
+        ("delete", "assets/icons/delete.png", "Delete"),
+        ("save", "assets/icons/save.png", "Save"),
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icons = [get_icon(get_resource_path(path)) for _, path, _ in self.ACTIONS]
+
+    def _button_rects(self, cell):
+        left = cell.left() + (cell.width() - self.BUTTON_SIZE * len(self.ACTIONS)) // 2
+        top = cell.top() + (cell.height() - self.BUTTON_SIZE) // 2
+        return [QRect(left + i * self.BUTTON_SIZE, top, self.BUTTON_SIZE, self.BUTTON_SIZE)
+                for i in range(len(self.ACTIONS))]
+
+    def _action_at(self, cell, pos):
+        for (name, _, tooltip), rect in zip(self.ACTIONS, self._button_rects(cell)):
+            if rect.contains(pos):
+                return name, tooltip
+        return None, None
+
+    def paint(self, painter, option, index):
+        self.initStyleOption(option, index)
+        style = option.widget.style() if option.widget else None
+        if style:
+            style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        mode = QIcon.Active if option.state & QStyle.State_MouseOver else QIcon.Normal
+        for icon, rect in zip(self._icons, self._button_rects(option.rect)):
+            icon_rect = QRect(0, 0, self.ICON_SIZE, self.ICON_SIZE)
+            icon_rect.moveCenter(rect.center())
+            icon.paint(painter, icon_rect, Qt.AlignCenter, mode)
+
+    def sizeHint(self, option, index):
+        return QSize(self.BUTTON_SIZE * len(self.ACTIONS), self.BUTTON_SIZE)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action, _ = self._action_at(option.rect, event.position().toPoint())
+            if action:
+                getattr(self, f"{action}_clicked").emit(index)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            _, tooltip = self._action_at(option.rect, event.pos())
+            if tooltip:
+                QToolTip.showText(event.globalPos(), tooltip, view)
+                return True
+        return super().helpEvent(event, view, option, index)
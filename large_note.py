@@ -0,0 +1,107 @@
+"""
+Opening notes too big for the editor (log excerpts, dumps...).
+
+Above LARGE_NOTE_BYTES a note is shown read-only in a QPlainTextEdit and
+filled a chunk at a time from a memory-mapped file, so the window keeps
+responding while tens of MB come in and only the part being copied is ever
+held as one Python string.
+"""
+
+import codecs
+import mmap
+import os
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QTextCursor
+
+LARGE_NOTE_BYTES = 2 * 1024 * 1024
+CHUNK_BYTES = 512 * 1024
+
+
+def is_large_note(path):
+    try:
+        return os.path.getsize(path) > LARGE_NOTE_BYTES
+    except OSError:
+        return False
+
+
+def read_mapped(path):
+    """Whole file as text through mmap; used for the on-demand preview of a large note."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return codecs.decode(mapped, "utf-8", errors="replace")
+
+
+class LargeNoteLoader(QObject):
+    """
+    Appends a file to a QPlainTextEdit chunk by chunk, one chunk per turn of
+    the event loop. Chunks end on a line break when there is one, and the
+    incremental decoder carries a UTF-8 sequence split between two chunks.
+    """
+
+    progress = Signal(int, int)  # bytes loaded, total bytes
+    finished = Signal(str)  # path
+
+    def __init__(self, viewer, parent=None, chunk_bytes=CHUNK_BYTES):
+        super().__init__(parent)
+        self.viewer = viewer
+        self.chunk_bytes = chunk_bytes
+        self.path = None
+        self._file = None
+        self._mapped = None
+        self._decoder = None
+        self._position = 0
+        self._size = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._load_next)
+
+    def is_loading(self):
+        return self._timer.isActive()
+
+    def open(self, path):
+        self.close()
+        self.viewer.clear()
+        self.path = path
+        self._file = open(path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._position = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        if self._size == 0:
+            self.close()
+            self.finished.emit(path)
+            return
+        self._mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._timer.start()
+
+    def close(self):
+        """Stop loading and release the file (Windows keeps mapped files locked)."""
+        self._timer.stop()
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _load_next(self):
+        end = min(self._position + self.chunk_bytes, self._size)
+        if end < self._size:
+            line_end = self._mapped.rfind(b"\n", self._position, end)
+            if line_end >= self._position:
+                end = line_end + 1
+        text = self._decoder.decode(self._mapped[self._position:end], final=end >= self._size)
+        self._position = end
+
+        cursor = QTextCursor(self.viewer.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.progress.emit(self._position, self._size)
+
+        if self._position >= self._size:
+            path = self.path
+            self.close()
+            self.viewer.moveCursor(QTextCursor.Start)
+            self.finished.emit(path)
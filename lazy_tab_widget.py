@@ -0,0 +1,64 @@
+from PySide6.QtWidgets import QTabWidget, QWidget, QVBoxLayout
+from PySide6.QtCore import Signal
+
+
+class LazyTabPage(QWidget):
+    """Empty page that builds its real tab the first time it is shown."""
+
+    def __init__(self, owner, key):
+        super().__init__()
+        self.owner = owner
+        self.key = key
+        self.page_layout = QVBoxLayout(self)
+        self.page_layout.setContentsMargins(0, 0, 0, 0)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.owner.tab(self.key)
+
+
+class LazyTabWidget(QTabWidget):
+    """
+    QTabWidget whose pages are registered as factories.
+
+    A tab is only instantiated when its page becomes visible (or when some code
+    asks for it with tab()), and tab_created is emitted so the caller can bring
+    the new tab up to date.
+    """
+
+    tab_created = Signal(str, QWidget)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._factories = {}
+        self._pages = {}
+        self._tabs = {}
+
+    def add_lazy_tab(self, key, factory, label):
+        page = LazyTabPage(self, key)
+        self._factories[key] = factory
+        self._pages[key] = page
+        self.addTab(page, label)
+
+    def tab(self, key):
+        """Return the tab registered as `key`, building it if needed."""
+        tab = self._tabs.get(key)
+        if tab is None:
+            tab = self._factories[key]()
+            self._tabs[key] = tab
+            page = self._pages[key]
+            page.page_layout.addWidget(tab)
+            if page.isVisible():
+                tab.show()
+            self.tab_created.emit(key, tab)
+        return tab
+
+    def created_tab(self, key):
+        """Return the tab if it has already been built, None otherwise."""
+        return self._tabs.get(key)
+
+    def created_tabs(self):
+        return list(self._tabs.items())
+
+    def show_tab(self, key):
+        self.setCurrentWidget(self._pages[key])
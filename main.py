@@ -1,22 +1,31 @@
-from mongita import MongitaClientDisk
-from PySide6.QtWidgets import (QApplication, QMainWindow, QTabWidget,
+from PySide6.QtWidgets import (QApplication, QMainWindow,
                                QWidget, QVBoxLayout, QSystemTrayIcon,
-                               QMenu, QListWidget, QScrollArea, QLabel,
-                               QDockWidget, QListWidgetItem, QPushButton)
-from PySide6.QtGui import QIcon, QAction, QPixmap, QMovie
-from PySide6.QtCore import Slot, Qt, QEvent, QTimer
+                               QMenu, QListView, QDockWidget, QPushButton)
+from PySide6.QtGui import QIcon, QAction, QPixmap, QShortcut, QKeySequence
+from PySide6.QtCore import Slot, Qt, QEvent, QTimer, QModelIndex, QPersistentModelIndex
 from PySide6.QtWidgets import QSizePolicy
 import json, sys, os
 from dotenv import load_dotenv
 # Mau resources
 from about_tab import AboutTab
 from setting_tab import SettingTab
-from icon import icon
 from project_tab import ProjectTab
 from project_info_tab import ProjectInfoTab
 from project_todo_tab import ProjectTodoTab
 from project_note_tab import ProjectNoteTab
-from utils import get_resource_path
+from lazy_tab_widget import LazyTabWidget
+from project_list_model import ProjectListModel, DEFAULT_ICON_PATH
+from gif_animator import GifAnimator
+from storage_worker import StorageService, ensure_indexes
+from storage_backend import open_database, DEFAULT_BACKEND, DEFAULT_DB_NAME
+from project_store import migrate_embedded_info
+from rank import RANK_FIELD, rank_collection
+from global_search import GlobalSearch
+from note_index import NoteIndex
+from project_loader import ProjectLoader
+from project_repository import ProjectRepository
+from search_palette import SearchPalette
+from utils import get_qss_path
 
 
 # load env file
@@ -27,34 +36,17 @@ if sys.platform.startswith('win'):
     import ctypes
     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(u'CompanyName.ProductName.SubProduct.VersionInformation')
 
-class GIFLabel(QLabel):
-    def __init__(self, gif_path):
-        super().__init__()
-        self.movie_obj = None 
-        resolved_path = get_resource_path(gif_path)
-        if os.path.exists(resolved_path):
-            self.movie_obj = QMovie(resolved_path)
-            self.setMovie(self.movie_obj)
-            self.movie_obj.start()
-
-        # if os.path.exists(gif_path):
-        #     self.movie_obj = QMovie(gif_path)
-        #     self.setMovie(self.movie_obj)
-        #     self.movie_obj.start()
-
-    def currentPixmap(self):
-        if isinstance(self.movie_obj, QMovie) and self.movie_obj.isValid():
-            return self.movie_obj.currentPixmap()
-        return QPixmap()
-
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("GNU Mau")
         self.setGeometry(300, 300, 800, 600)
 
+        # Notes and the database live next to the app unless MAU_DATA_DIR says otherwise
+        self.data_dir = os.environ.get("MAU_DATA_DIR", os.path.dirname(__file__))
+
         # --- CAMBIO 1: Inicializar directorio base storage ---
-        self.storage_dir = os.path.join(os.path.dirname(__file__), "storage")
+        self.storage_dir = os.path.join(self.data_dir, "storage")
         if not os.path.exists(self.storage_dir):
             try:
                 os.makedirs(self.storage_dir)
@@ -69,12 +61,7 @@ class MainWindow(QMainWindow):
         self.config = {}
         self.load_config()
 
-        qp = QPixmap()
-        qp.loadFromData(icon)
-        appIcon = QIcon(qp)
-        self.setWindowIcon(appIcon)
-
-        self.tray_icon = QSystemTrayIcon(appIcon, parent=self)
+        self.tray_icon = QSystemTrayIcon(parent=self)
         self.tray_icon.setToolTip("GNU Mau")
         tray_menu = QMenu()
         show_action = QAction("Show", self)
@@ -86,55 +73,72 @@ class MainWindow(QMainWindow):
         show_action.triggered.connect(self.show)
         quit_action.triggered.connect(QApplication.quit)
 
-        self.tray_icon.show()
+        # The embedded icon is decoded on the first event loop pass, not while building the window.
+        QTimer.singleShot(0, self.load_app_icon)
 
         self.current_project_name = ""
         self.current_project_description = ""
         self.current_project_item = None
         self.current_project_info = {}
+        self.current_project_info_loaded = True
         self.current_project_id = "default_project_id" 
-        self.db_name = "projects_db"
+        self.db_name = self.config.get("db_name", DEFAULT_DB_NAME)
+        self.storage_backend = self.config.get("storage_backend", DEFAULT_BACKEND)
 
-        print("Connecting to Mongita...")
-        mongita_db_dir = os.path.join(os.path.dirname(__file__), "mongita_data")
-        os.environ["MONGITA_DIR"] = mongita_db_dir
-        self.client = MongitaClientDisk(mongita_db_dir)
-        self.db = self.client[self.db_name]
+        print(f"Connecting to {self.storage_backend} ({self.db_name})...")
+        self.client, self.db = open_database(self.storage_backend, self.data_dir, self.db_name)
+        # Every database call goes through this worker thread, never the GUI thread.
+        self.storage = StorageService(self.db, self)
         self.create_collections()
 
-        if self.db.projects.count_documents({}) == 0:
-            print("Inserting a test project into Mongita...")
-            self.db.projects.insert_one({
-                "name": "Demo project",
-                "description": "This is a test project.",
-                "icon_path": "assets/project_images/default_icon.png"
-            })
+        # Cross-project search, indexed the first time the palette is opened
+        self.global_search = GlobalSearch(self.storage, self.storage_dir, self)
 
-        self.tabs = QTabWidget()
+        # Full-text index of the notes, on its own thread so it never waits behind the database
+        self.note_index = NoteIndex(self.storage_dir)
+        self.note_storage = StorageService(self.note_index, self, name="MauNoteIndex")
+        self.note_storage.about_to_stop.connect(lambda: self.note_storage.submit(lambda index: index.close()))
+        self.note_storage.submit(
+            lambda index: index.reconcile(),
+            callback=lambda counts: print(f"Índice de notas: {counts[0]} indexadas, {counts[1]} eliminadas.")
+        )
+        # A project switch reads everything in one batch; newer selections cancel older ones
+        # Project documents are read and written through this cache
+        self.project_repository = ProjectRepository(self.storage)
+        self.project_loader = ProjectLoader(self.storage, self.project_repository, self.storage_dir, self)
+        self.project_loader.loaded.connect(self.on_project_loaded)
+        self.search_palette = None
+        self.pending_project = None
+        self.after_project_loaded = None
+        QShortcut(QKeySequence("Ctrl+K"), self, activated=self.show_search_palette)
+
+        # Tabs are built the first time they are shown, see LazyTabWidget.
+        self.tabs = LazyTabWidget()
         self.setCentralWidget(self.tabs)
-        self.project_tab = ProjectTab(self)
-        self.project_info_tab = ProjectInfoTab(self)
-        self.project_todo_tab = ProjectTodoTab(self, project_id=self.current_project_id)
-        self.project_note_tab = ProjectNoteTab(self)
-        self.setting_tab = SettingTab(self)
-        self.about_tab = AboutTab(self)
-        self.tabs.addTab(self.project_tab, "Project")
-        self.tabs.addTab(self.project_info_tab, "Information")
-        self.tabs.addTab(self.project_todo_tab, "Todo")
-        self.tabs.addTab(self.project_note_tab, "Note")
-        self.tabs.addTab(self.setting_tab, "Setting")
-        self.tabs.addTab(self.about_tab, "About")
-
-        self.project_list_widget = QListWidget()
-        self.project_list_widget.itemClicked.connect(self.display_project_info)
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.project_list_widget)
-
-        self.add_create_project_button()
+        self.tabs.tab_created.connect(self.on_tab_created)
+        self.tabs.add_lazy_tab("project", lambda: ProjectTab(self), "Project")
+        self.tabs.add_lazy_tab("info", lambda: ProjectInfoTab(self), "Information")
+        self.tabs.add_lazy_tab("todo", lambda: ProjectTodoTab(self, project_id=self.current_project_id), "Todo")
+        self.tabs.add_lazy_tab("note", lambda: ProjectNoteTab(self), "Note")
+        self.tabs.add_lazy_tab("setting", lambda: SettingTab(self), "Setting")
+        self.tabs.add_lazy_tab("about", lambda: AboutTab(self), "About")
+
+        self.gif_animator = GifAnimator(self)
+        self.project_model = ProjectListModel(self.storage, self.gif_animator, self)
+        self.project_list_view = QListView()
+        self.project_list_view.setModel(self.project_model)
+        self.gif_animator.attach(self.project_list_view)
+        self.project_model.page_loaded.connect(self.on_projects_page_loaded)
+        # Selecting a row (mouse or keyboard) switches projects; see on_project_clicked for the rest
+        self.project_list_view.selectionModel().currentChanged.connect(self.on_current_project_changed)
+        self.project_list_view.clicked.connect(self.on_project_clicked)
+        # Projects are reordered by dragging them; each drop saves one rank
+        self.project_list_view.setDragDropMode(QListView.InternalMove)
+        self.project_model.project_moved.connect(
+            lambda project_id, rank: self.project_repository.update_fields(project_id, {RANK_FIELD: rank}))
 
         sidebar_layout = QVBoxLayout()
-        sidebar_layout.addWidget(scroll_area)
+        sidebar_layout.addWidget(self.project_list_view)
 
         sidebar_widget = QWidget()
         sidebar_widget.setLayout(sidebar_layout)
@@ -146,16 +150,45 @@ class MainWindow(QMainWindow):
 
         self.load_projects()
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_gif_icons)
-        self.timer.start(100)
-
         dock_position_int = self.config.get("sidebar_position", Qt.LeftDockWidgetArea.value)
         dock_position = Qt.DockWidgetArea(dock_position_int)
         self.addDockWidget(dock_position, self.dock_widget)
 
         self.dock_widget.dockLocationChanged.connect(self.save_sidebar_position)
 
+    @property
+    def project_tab(self):
+        return self.tabs.tab("project")
+
+    @property
+    def project_info_tab(self):
+        return self.tabs.tab("info")
+
+    @property
+    def project_todo_tab(self):
+        return self.tabs.tab("todo")
+
+    @property
+    def project_note_tab(self):
+        return self.tabs.tab("note")
+
+    @property
+    def setting_tab(self):
+        return self.tabs.tab("setting")
+
+    @property
+    def about_tab(self):
+        return self.tabs.tab("about")
+
+    def load_app_icon(self):
+        from icon import get_icon_bytes
+        qp = QPixmap()
+        qp.loadFromData(get_icon_bytes())
+        appIcon = QIcon(qp)
+        self.setWindowIcon(appIcon)
+        self.tray_icon.setIcon(appIcon)
+        self.tray_icon.show()
+
     def save_sidebar_position(self):
         position = self.dockWidgetArea(self.dock_widget)
         self.config["sidebar_position"] = position.value
@@ -179,7 +212,7 @@ class MainWindow(QMainWindow):
     def apply_theme(self, dark_mode):
         if dark_mode:
             try:
-                with open("dark_theme.qss", "r") as f:
+                with open(get_qss_path(), "r") as f:
                     dark_style_sheet = f.read()
                 self.setStyleSheet(dark_style_sheet)
             except FileNotFoundError:
@@ -188,10 +221,27 @@ class MainWindow(QMainWindow):
             self.setStyleSheet("")
 
     def create_collections(self):
-        if 'projects' not in self.db.list_collection_names():
-            print("Mongita: Colección 'projects' creada automáticamente al primer insert.")
-        if 'todos' not in self.db.list_collection_names():
-            print("Mongita: Colección 'todos' creada automáticamente al primer insert.")
+        def create(db):
+            if 'projects' not in db.list_collection_names():
+                print("Storage: Colección 'projects' creada automáticamente al primer insert.")
+            if 'todos' not in db.list_collection_names():
+                print("Storage: Colección 'todos' creada automáticamente al primer insert.")
+
+            if db.projects.count_documents({}) == 0:
+                print("Inserting a test project...")
+                db.projects.insert_one({
+                    "name": "Demo project",
+                    "description": "This is a test project.",
+                    "icon_path": DEFAULT_ICON_PATH
+                })
+
+            migrate_embedded_info(db)
+            ensure_indexes(db)
+            ranked = rank_collection(db.projects)
+            if ranked:
+                print(f"Storage: orden guardado para {ranked} proyectos.")
+
+        self.storage.submit(create)
 
     def add_create_project_button(self):
         create_project_button = QPushButton("Create Project")
@@ -200,148 +250,240 @@ class MainWindow(QMainWindow):
         create_project_button.setSizePolicy(size_policy)
         create_project_button.clicked.connect(self.show_create_project_form)
         
-        create_project_item = QListWidgetItem(self.project_list_widget)
-        create_project_item.setSizeHint(create_project_button.sizeHint())
-        create_project_item.setData(Qt.UserRole, None) 
-        self.project_list_widget.setItemWidget(create_project_item, create_project_button)
+        self.project_model.create_row_size = create_project_button.sizeHint()
+        self.project_list_view.setIndexWidget(self.project_model.index(0, 0), create_project_button)
 
     def show_create_project_form(self):
+        self.project_loader.cancel()
         self.current_project_item = None
         self.current_project_name = ""
         self.current_project_description = ""
         self.current_project_info = {}
+        self.current_project_info_loaded = True
         self.current_project_id = None 
         self.project_tab.name_input.clear()
         self.project_tab.description_input.clear()
         self.project_tab.clear_table() 
         self.project_tab.set_editing_enabled(True) 
-        self.tabs.setCurrentWidget(self.project_tab)
+        self.tabs.show_tab("project")
 
     def load_projects(self):
-        self.gif_labels = []
-        projects_collection = self.db.projects
-        projects = projects_collection.find()
-        
-        self.project_list_widget.clear()
-        self.add_create_project_button() 
-        
-        for project in projects:
-            description = project['description'] if len(project['description']) <= 8 else project['description'][:8] + "..."
-            item = QListWidgetItem(f"{project['name']}: {description}")
-            
-            project_id = str(project["_id"]) 
-            item.setData(Qt.UserRole, project_id) 
-
-            icon_path = project.get('icon_path', "assets/project_images/default_icon.png")
-            item.setData(Qt.UserRole + 1, icon_path) 
-
-            project_folder_path = os.path.join(self.storage_dir, project_id)
-            if not os.path.exists(project_folder_path):
-                try:
-                    os.makedirs(project_folder_path)
-                except OSError as e:
-                    print(f"Error al crear la carpeta: {e}")
-
-            if icon_path.endswith('.gif'):
-                gif_label = GIFLabel(icon_path)
-                self.gif_labels.append((item, gif_label))
-                item.setIcon(QIcon(gif_label.currentPixmap()))
-            else:
-                item.setIcon(QIcon(icon_path))
-            
-            item.icon_path = icon_path
-            self.project_list_widget.addItem(item)
-
-        if self.project_list_widget.count() > 1:
-            first_project_item = self.project_list_widget.item(1)
-            self.project_list_widget.setCurrentItem(first_project_item)
-            self.display_project_info(first_project_item)
-
-    def update_gif_icons(self):
-        for item, gif_label in self.gif_labels:
-            try:
-                pix = gif_label.currentPixmap()
-                if pix and not pix.isNull():
-                    item.setIcon(QIcon(pix))
-            except Exception:
-                continue
+        self.project_model.reload()
+        self.add_create_project_button()
+        self.select_first_project_pending = True
+        if self.project_model.canFetchMore():
+            self.project_model.fetchMore()
+
+    def on_data_imported(self, summary):
+        """An archive was imported (see data_archive): drop what was read before and reload."""
+        self.project_repository.invalidate()
+        self.global_search.invalidate()
+        self.note_storage.submit(
+            lambda index: index.reconcile(),
+            callback=lambda counts: print(f"Índice de notas: {counts[0]} indexadas, {counts[1]} eliminadas.")
+        )
+        self.pending_project = None
+        self.load_projects()
+
+    @Slot()
+    def on_projects_page_loaded(self):
+        if self.pending_project:
+            self.show_project(*self.pending_project)
+        if not self.select_first_project_pending:
+            return
+        self.select_first_project_pending = False
+        if self.project_model.rowCount() > 1:
+            self.select_project_index(self.project_model.index(1, 0))
+
+    def select_project_index(self, index):
+        if self.project_list_view.currentIndex() == index:
+            self.display_project_info(index)
+        else:
+            self.project_list_view.setCurrentIndex(index)  # on_current_project_changed loads it
 
     @Slot()
-    def display_project_info(self, item):
-        project_id = item.data(Qt.UserRole)
+    def display_project_info(self, index):
+        project_id = index.data(Qt.UserRole)
         if project_id is None: 
             self.show_create_project_form()
             return 
 
-        project = self.db.projects.find_one({"_id": project_id})
-        if not project:
+        # Pending todo edits have to be written before the batch reads the todos back
+        todo_tab = self.tabs.created_tab("todo")
+        if todo_tab:
+            todo_tab.flush_pending_writes()
+        self.project_loader.load(project_id, QPersistentModelIndex(index),
+                                 with_todos=todo_tab is not None,
+                                 with_notes=self.tabs.created_tab("note") is not None,
+                                 with_info=self.info_tabs_created())
+
+    @Slot(QModelIndex, QModelIndex)
+    def on_current_project_changed(self, current, previous):
+        if current.isValid() and current.data(Qt.UserRole) is not None:
+            self.display_project_info(current)
+
+    @Slot(QModelIndex)
+    def on_project_clicked(self, index):
+        # The click that changed the current row already loaded it; this covers
+        # the "Create Project" row and going back to the selected row after it
+        project_id = index.data(Qt.UserRole)
+        if project_id is None or str(project_id) != str(self.current_project_id):
+            self.display_project_info(index)
+
+    def on_project_loaded(self, index, batch):
+        project = batch["project"]
+        if not index.isValid():
             return
 
-        self.current_project_item = item
+        project_id = index.data(Qt.UserRole)
+        index = QModelIndex(index)
+        self.current_project_item = QPersistentModelIndex(index)
         self.current_project_id = project_id
         self.current_project_name = project["name"]
         self.current_project_description = project["description"]
-        self.current_project_info = project.get("info", {})
-
-        icon_path = project.get('icon_path', "assets/project_images/default_icon.png")
-        item.setData(Qt.UserRole + 1, icon_path)
-
-        self.project_info_tab.update_project_info(
+        # The cached info is shared, the tabs edit their own copy
+        info = batch.get("info")
+        self.current_project_info = dict(info) if info is not None else {}
+        self.current_project_info_loaded = info is not None
+
+        icon_path = project.get('icon_path', DEFAULT_ICON_PATH)
+        if index.data(Qt.UserRole + 1) != icon_path:
+            self.project_model.setData(index, icon_path, Qt.UserRole + 1)
+
+        # Only tabs that already exist are refreshed; the rest pick the
+        # project up in on_tab_created when they are first shown.
+        info_tabs_created = self.info_tabs_created()
+        for key, tab in self.tabs.created_tabs():
+            self.apply_project_to_tab(key, tab, batch)
+        self.tabs.show_tab("info")
+        # A tab created just now asked for the info already (on_tab_created)
+        if info_tabs_created and not self.current_project_info_loaded:
+            self.load_current_project_info()
+
+        after = self.after_project_loaded
+        if after and after[0] == str(project_id):
+            self.after_project_loaded = None
+            after[1]()
+
+    def apply_project_to_tab(self, key, tab, batch=None):
+        """Show the current project in one tab, with the todos and notes of `batch` when it has them."""
+        batch = batch or {}
+        if key == "info":
+            tab.update_project_info(
+                self.current_project_name,
+                self.current_project_description,
+                self.current_project_info
+            )
+            tab.clear_search()
+        elif key == "project":
+            tab.update_project_form(
+                self.current_project_name,
+                self.current_project_description
+            )
+            tab.enable_editing()
+        elif key == "todo":
+            tab.update_project_id(self.current_project_id, batch.get("todos"))
+        elif key == "note":
+            tab.set_project_id(self.current_project_id, batch.get("notes"))
+
+    def info_tabs_created(self):
+        """Whether a tab that shows the project info exists, so the info has to be read."""
+        return self.tabs.created_tab("info") is not None or self.tabs.created_tab("project") is not None
+
+    def load_current_project_info(self):
+        """Read the info of the current project once a tab needs it (see on_tab_created)."""
+        project_id = self.current_project_id
+        repository = self.project_repository
+        self.storage.submit(lambda db: repository.get_info(db, project_id),
+                            callback=lambda info: self.on_project_info_loaded(project_id, info))
+
+    def on_project_info_loaded(self, project_id, info):
+        if self.current_project_info_loaded or str(project_id) != str(self.current_project_id):
+            return
+        # Keys added while the read was on its way are kept
+        self.current_project_info = {**info, **self.current_project_info}
+        self.current_project_info_loaded = True
+        for key in ("info", "project"):
+            tab = self.tabs.created_tab(key)
+            if tab:
+                self.apply_project_to_tab(key, tab)
+
+    @Slot(str, QWidget)
+    def on_tab_created(self, key, tab):
+        # The todo tab already loads current_project_id in its constructor.
+        if self.current_project_item is not None and key != "todo":
+            self.apply_project_to_tab(key, tab)
+            if key in ("info", "project") and not self.current_project_info_loaded:
+                self.load_current_project_info()
+
+    def reindex_current_project(self):
+        self.global_search.update_project(
+            self.current_project_id,
             self.current_project_name,
             self.current_project_description,
             self.current_project_info
         )
-        self.project_tab.update_project_form(
-            self.current_project_name,
-            self.current_project_description
-        )
 
-        if icon_path.endswith('.gif'):
-            gif_label = GIFLabel(icon_path)
-            icon = QIcon(gif_label.currentPixmap())
+    @Slot()
+    def show_search_palette(self):
+        if self.search_palette is None:
+            self.search_palette = SearchPalette(self.global_search, self)
+            self.search_palette.result_activated.connect(self.open_search_result)
+        self.search_palette.open()
+
+    def show_project(self, project_id, then=None):
+        """Select `project_id` in the sidebar, paging it in if needed, then call `then`."""
+        index = self.project_model.index_for_project(project_id)
+        if index.isValid():
+            self.pending_project = None
+            self.after_project_loaded = (str(project_id), then) if then else None
+            self.project_list_view.scrollTo(index)
+            self.select_project_index(index)
+        elif self.project_model.is_exhausted():
+            self.pending_project = None
+            print(f"Proyecto {project_id} no encontrado.")
         else:
-            icon = QIcon(icon_path)
-        self.current_project_item.setIcon(icon)
-
-        #self.project_todo_tab.project_id = self.current_project_id
-        self.project_todo_tab.update_project_id(self.current_project_id)
-        self.project_todo_tab.update_project_id(self.current_project_id)
-        self.project_note_tab.set_project_id(self.current_project_id)
-
-        self.project_info_tab.clear_search()
-        self.project_tab.enable_editing()
-        self.tabs.setCurrentWidget(self.project_info_tab)
+            # on_projects_page_loaded tries again with every new page
+            self.pending_project = (project_id, then)
+            if self.project_model.canFetchMore():
+                self.project_model.fetchMore()
+
+    @Slot(object, str)
+    def open_search_result(self, document, query):
+        self.show_project(document.project_id, lambda: self.show_search_result(document, query))
+
+    def show_search_result(self, document, query):
+        if document.kind == "todo":
+            self.tabs.show_tab("todo")
+            self.project_todo_tab.load_todos(select_todo_id=document.key[1])
+        elif document.kind == "note":
+            self.tabs.show_tab("note")
+            self.project_note_tab.open_note_path(document.key[1])
+        else:
+            # Filter the info table if the match came from it
+            words = query.lower().split()
+            info_text = " ".join(f"{key} {value}" for key, value in self.current_project_info.items()).lower()
+            if words and all(word in info_text for word in words):
+                self.project_info_tab.search_input.setText(query)
+                self.project_info_tab.search_info()
 
     @Slot()
     def update_project_icon(self, project_name, icon_path):
         if self.current_project_id:
-            for i in range(self.project_list_widget.count()):
-                item = self.project_list_widget.item(i)
-                if item.data(Qt.UserRole) == self.current_project_id:
-                    # --- CORRECCIÓN 3: Actualizar la "mochila" de datos ---
-                    item.setData(Qt.UserRole + 1, icon_path)
-                    
-                    if icon_path.endswith('.gif'):
-                        found = False
-                        for idx, (existing_item, existing_gif_label) in enumerate(self.gif_labels):
-                            if existing_item == item:
-                                existing_gif_label = GIFLabel(icon_path) 
-                                self.gif_labels[idx] = (item, existing_gif_label)
-                                item.setIcon(QIcon(existing_gif_label.currentPixmap()))
-                                found = True
-                                break
-                        if not found: 
-                            gif_label = GIFLabel(icon_path)
-                            self.gif_labels.append((item, gif_label))
-                            item.setIcon(QIcon(gif_label.currentPixmap()))
-                    else:
-                        item.setIcon(QIcon(icon_path))
-                    item.icon_path = icon_path 
-                    break
+            index = self.project_model.index_for_project(self.current_project_id)
+            if index.isValid():
+                self.project_model.setData(index, icon_path, Qt.UserRole + 1)
 
     @Slot()
     def closeEvent(self, event):
         should_minimize = self.config.get("minimize_to_tray", True)
+        # Buffered todo and note edits are written whether the window hides or closes
+        todo_tab = self.tabs.created_tab("todo")
+        if todo_tab:
+            todo_tab.flush_pending_writes()
+        note_tab = self.tabs.created_tab("note")
+        if note_tab:
+            note_tab.save_current_note()
 
         if should_minimize and self.tray_icon.isVisible():
             self.hide()
@@ -353,11 +495,23 @@ class MainWindow(QMainWindow):
             )
             event.ignore() 
         else:
+            self.storage.stop()
+            self.note_storage.stop()
             self.client.close() 
             event.accept()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.gif_animator.set_active(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.gif_animator.set_active(False)
+
     @Slot()
     def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            self.gif_animator.set_active(not self.isMinimized())
         if event.type() == QEvent.WindowStateChange and self.isMinimized():
             self.tray_icon.showMessage(
                 "Minimized to Tray",
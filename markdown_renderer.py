@@ -0,0 +1,133 @@
+from collections import OrderedDict
+import hashlib
+import re
+import threading
+
+import markdown2
+
+EXTRAS = ["fenced-code-blocks", "blockquote", "tables"]
+
+FENCE_RE = re.compile(r"^ {0,3}(```|~~~)")
+HEADING_RE = re.compile(r"^#{1,6}\s")
+LIST_ITEM_RE = re.compile(r"^\s*([-*+]|\d+[.)])\s")
+# [id]: url -- reference links resolve across the whole document
+LINK_DEFINITION_RE = re.compile(r"^ {0,3}\[[^\]]+\]:\s", re.MULTILINE)
+# Sections are also cut at paragraph breaks once they get this long
+MAX_SECTION_LINES = 200
+
+
+def content_hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _safe_break(previous, following):
+    """A blank line between `previous` and `following` can end a section."""
+    if not following or following[0].isspace() or not previous or previous[0].isspace():
+        return False
+    return not (LIST_ITEM_RE.match(previous) or LIST_ITEM_RE.match(following)
+                or following.startswith(("|", ">")))
+
+
+def split_sections(text):
+    """
+    Cut a markdown document into pieces that render the same on their own:
+    before every heading and at long paragraph breaks, never inside a fenced
+    code block or a list.
+    """
+    sections = []
+    current = []
+    in_fence = False
+    last_text_line = ""
+    lines = text.split("\n")
+    for position, line in enumerate(lines):
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+        elif not in_fence and current:
+            if HEADING_RE.match(line):
+                sections.append("\n".join(current))
+                current = []
+            elif not line.strip() and len(current) >= MAX_SECTION_LINES:
+                following = lines[position + 1] if position + 1 < len(lines) else ""
+                if _safe_break(last_text_line, following):
+                    current.append(line)
+                    sections.append("\n".join(current))
+                    current = []
+                    continue
+        current.append(line)
+        if line.strip():
+            last_text_line = line
+    if current:
+        sections.append("\n".join(current))
+    return sections
+
+
+class MarkdownRenderer:
+    """
+    markdown2 with two caches: whole documents by content hash, and the
+    sections of a document (see split_sections) by their own hash, so editing
+    one part of a long note only renders that part again. Both are bounded by
+    the size of the HTML they hold; documents also by count.
+
+    render() is meant to run on a worker thread; cached_html() can be called
+    from the GUI thread to skip the round trip when the result is known.
+    """
+
+    def __init__(self, max_documents=8, max_document_bytes=32 * 1024 * 1024,
+                 max_section_bytes=32 * 1024 * 1024):
+        self.max_documents = max_documents
+        self.max_document_bytes = max_document_bytes
+        self.max_section_bytes = max_section_bytes
+        self.document_bytes = 0
+        self.section_bytes = 0
+        self.section_hits = 0
+        self.section_misses = 0
+        self._documents = OrderedDict()
+        self._sections = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cached_html(self, key):
+        with self._lock:
+            html = self._documents.get(key)
+            if html is not None:
+                self._documents.move_to_end(key)
+            return html
+
+    def render(self, text, key=None):
+        key = key or content_hash(text)
+        html = self.cached_html(key)
+        if html is not None:
+            return key, html
+
+        if LINK_DEFINITION_RE.search(text):
+            html = markdown2.markdown(text, extras=EXTRAS)
+        else:
+            html = "\n".join(self._render_section(section) for section in split_sections(text))
+
+        with self._lock:
+            if key not in self._documents:
+                self._documents[key] = html
+                self.document_bytes += len(html)
+            # The newest document always stays, however big, so cached_html finds it
+            while len(self._documents) > 1 and (len(self._documents) > self.max_documents
+                                                or self.document_bytes > self.max_document_bytes):
+                _, old = self._documents.popitem(last=False)
+                self.document_bytes -= len(old)
+        return key, html
+
+    def _render_section(self, section):
+        key = content_hash(section)
+        with self._lock:
+            html = self._sections.get(key)
+            if html is not None:
+                self.section_hits += 1
+                self._sections.move_to_end(key)
+                return html
+        self.section_misses += 1
+        html = markdown2.markdown(section, extras=EXTRAS)
+        with self._lock:
+            self._sections[key] = html
+            self.section_bytes += len(html)
+            while self.section_bytes > self.max_section_bytes and len(self._sections) > 1:
+                _, old = self._sections.popitem(last=False)
+                self.section_bytes -= len(old)
+        return html
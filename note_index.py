@@ -0,0 +1,166 @@
+"""
+Full-text index of the notes under storage/<project_id>/.
+
+The index is a SQLite FTS5 database next to the notes (storage/notes_index.sqlite)
+that remembers the mtime and size each file had when it was indexed, so
+reconcile() only reads files that changed since the last run. NoteIndex is not
+thread-safe: every call goes through one StorageService thread (see
+MainWindow.note_storage).
+"""
+
+import html
+import os
+import sqlite3
+
+NOTE_EXTENSIONS = (".md", ".txt")
+INDEX_FILE = "notes_index.sqlite"
+# Snippet markers that cannot show up in a note, replaced by <b> after escaping
+MARK_START, MARK_END = "\x02", "\x03"
+
+
+def fts_query(text):
+    """User text -> FTS5 query: every word must match, the words as prefixes."""
+    words = [word.replace('"', '""') for word in text.split()]
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def snippet_html(snippet):
+    return html.escape(snippet).replace(MARK_START, "<b>").replace(MARK_END, "</b>")
+
+
+class NoteIndex:
+    def __init__(self, storage_dir):
+        self.storage_dir = storage_dir
+        self.path = os.path.join(storage_dir, INDEX_FILE)
+        self.available = True
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            try:
+                self._conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS files (
+                        path TEXT PRIMARY KEY,
+                        project_id TEXT NOT NULL,
+                        mtime_ns INTEGER NOT NULL,
+                        size INTEGER NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS files_project ON files (project_id);
+                    CREATE VIRTUAL TABLE IF NOT EXISTS notes USING fts5(name, content);
+                """)
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5, the note tab falls back to file names
+                print(f"Índice de notas no disponible: {e}")
+                self.available = False
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _write(self, conn, project_id, path, content, stat):
+        row = conn.execute("SELECT rowid FROM files WHERE path = ?", (path,)).fetchone()
+        if row:
+            conn.execute("UPDATE files SET project_id = ?, mtime_ns = ?, size = ? WHERE rowid = ?",
+                         (project_id, stat.st_mtime_ns, stat.st_size, row[0]))
+            conn.execute("DELETE FROM notes WHERE rowid = ?", (row[0],))
+            rowid = row[0]
+        else:
+            rowid = conn.execute("INSERT INTO files (path, project_id, mtime_ns, size) VALUES (?, ?, ?, ?)",
+                                 (path, project_id, stat.st_mtime_ns, stat.st_size)).lastrowid
+        conn.execute("INSERT INTO notes (rowid, name, content) VALUES (?, ?, ?)",
+                     (rowid, os.path.basename(path), content))
+
+    def _remove(self, conn, path):
+        row = conn.execute("SELECT rowid FROM files WHERE path = ?", (path,)).fetchone()
+        if row:
+            conn.execute("DELETE FROM notes WHERE rowid = ?", (row[0],))
+            conn.execute("DELETE FROM files WHERE rowid = ?", (row[0],))
+
+    def update_note(self, project_id, path, content=None):
+        """Index `path` as saved; `content` saves reading it back from disk."""
+        conn = self._connection()
+        if not self.available:
+            return
+        try:
+            stat = os.stat(path)
+            if content is None:
+                with open(path, "r", encoding="utf-8") as f:
+                    content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error al indexar nota {path}: {e}")
+            return
+        with conn:
+            self._write(conn, str(project_id), path, content, stat)
+
+    def remove_note(self, path):
+        conn = self._connection()
+        if self.available:
+            with conn:
+                self._remove(conn, path)
+
+    def reconcile(self, project_id=None):
+        """
+        Bring the index in line with the files on disk, for one project or all
+        of them. Only files whose mtime or size changed are read.
+        Returns (indexed, removed).
+        """
+        conn = self._connection()
+        if not self.available:
+            return 0, 0
+        if project_id is None:
+            known = conn.execute("SELECT path, mtime_ns, size FROM files").fetchall()
+            project_ids = [name for name in os.listdir(self.storage_dir)
+                           if os.path.isdir(os.path.join(self.storage_dir, name))] \
+                if os.path.isdir(self.storage_dir) else []
+        else:
+            project_id = str(project_id)
+            known = conn.execute("SELECT path, mtime_ns, size FROM files WHERE project_id = ?",
+                                 (project_id,)).fetchall()
+            project_ids = [project_id]
+        known = {path: (mtime_ns, size) for path, mtime_ns, size in known}
+
+        indexed = 0
+        with conn:
+            for pid in project_ids:
+                notes_dir = os.path.join(self.storage_dir, pid)
+                if not os.path.isdir(notes_dir):
+                    continue
+                for entry in os.scandir(notes_dir):
+                    if not entry.name.endswith(NOTE_EXTENSIONS) or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    if known.pop(entry.path, None) == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    try:
+                        with open(entry.path, "r", encoding="utf-8") as f:
+                            content = f.read()
+                    except (OSError, UnicodeDecodeError) as e:
+                        print(f"Error al indexar nota {entry.path}: {e}")
+                        continue
+                    self._write(conn, pid, entry.path, content, stat)
+                    indexed += 1
+            # Whatever is left was deleted from disk
+            for path in known:
+                self._remove(conn, path)
+        return indexed, len(known)
+
+    def search(self, project_id, text, limit=200):
+        """[(path, snippet_html), ...] of the project's notes matching `text`, best first."""
+        conn = self._connection()
+        query = fts_query(text)
+        if not self.available or not query:
+            return []
+        try:
+            rows = conn.execute(
+                f"""SELECT files.path, snippet(notes, -1, '{MARK_START}', '{MARK_END}', '…', 12)
+                    FROM notes JOIN files ON files.rowid = notes.rowid
+                    WHERE notes MATCH ? AND files.project_id = ?
+                    ORDER BY rank LIMIT ?""",
+                (query, str(project_id), limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            print(f"Error en la búsqueda de notas: {e}")
+            return []
+        return [(path, snippet_html(snippet)) for path, snippet in rows]
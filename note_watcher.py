@@ -0,0 +1,117 @@
+"""
+Watches storage/<project_id>/ so the note tab follows changes made by other
+programs (editors, synced folders) without rebuilding its list.
+"""
+
+import os
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+from note_index import NOTE_EXTENSIONS
+
+
+def scan_notes(directory):
+    """{path: (mtime_ns, size)} of the notes in `directory`."""
+    stats = {}
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return stats
+    for entry in entries:
+        if not entry.name.endswith(NOTE_EXTENSIONS):
+            continue
+        try:
+            if entry.is_file():
+                stat = entry.stat()
+                stats[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass  # deleted between listing and stat
+    return stats
+
+
+class NoteDirWatcher(QObject):
+    """
+    QFileSystemWatcher on a notes directory and its files. Bursts of events are
+    collected for `delay` ms, then compared with the last known mtime/size of
+    every note and reported as one notes_changed(added, removed, modified,
+    renamed) with lists of paths ((old, new) pairs for renamed).
+    """
+
+    notes_changed = Signal(list, list, list, list)
+
+    def __init__(self, parent=None, delay=200):
+        super().__init__(parent)
+        self.directory = None
+        self.stats = {}
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._schedule)
+        self._watcher.fileChanged.connect(self._schedule)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.rescan)
+
+    def watch(self, directory, stats=None):
+        """Start over on `directory` (`stats`: its scan_notes(), if known); returns the notes it holds."""
+        self.stop()
+        self.directory = directory
+        self.stats = scan_notes(directory) if stats is None else dict(stats)
+        self._watch_paths()
+        return list(self.stats)
+
+    def stop(self):
+        self._timer.stop()
+        watched = self._watcher.directories() + self._watcher.files()
+        if watched:
+            self._watcher.removePaths(watched)
+        self.directory = None
+        self.stats = {}
+
+    def acknowledge(self, path):
+        """The app itself wrote `path`: take its new stat as known, so it is not reported."""
+        if self.directory is None or os.path.dirname(path) != self.directory:
+            return
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        self.stats[path] = (stat.st_mtime_ns, stat.st_size)
+        self._watch_paths()
+
+    def _watch_paths(self):
+        # Replacing a file (os.replace, most editors) drops its watch, so re-add what is missing
+        if self.directory not in self._watcher.directories() and os.path.isdir(self.directory):
+            self._watcher.addPath(self.directory)
+        watched = set(self._watcher.files())
+        missing = [path for path in self.stats if path not in watched]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _schedule(self, path):
+        if self.directory is not None:
+            self._timer.start()
+
+    def rescan(self):
+        self._timer.stop()
+        if self.directory is None:
+            return
+        current = scan_notes(self.directory)
+        added = [path for path in current if path not in self.stats]
+        removed = [path for path in self.stats if path not in current]
+        modified = [path for path, stat in current.items()
+                    if path in self.stats and self.stats[path] != stat]
+
+        # A rename keeps mtime and size: pair such files up instead of remove + add
+        renamed = []
+        for old in list(removed):
+            for new in added:
+                if current[new] == self.stats[old]:
+                    renamed.append((old, new))
+                    removed.remove(old)
+                    added.remove(new)
+                    break
+
+        self.stats = current
+        self._watch_paths()
+        if added or removed or modified or renamed:
+            self.notes_changed.emit(added, removed, modified, renamed)
@@ -1,9 +1,11 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit, QHBoxLayout, QPushButton, QScrollArea, 
-                               QCompleter, QTableWidget, QTableWidgetItem, QHeaderView, QFrame, QHBoxLayout, QApplication, QFileDialog, QAbstractItemView)
-from PySide6.QtCore import Slot, Qt
-from PySide6.QtGui import QIcon, QClipboard
+                               QCompleter, QTableView, QHeaderView, QFrame, QHBoxLayout, QApplication, QFileDialog, QAbstractItemView)
+from PySide6.QtCore import Slot, Qt, QTimer
+from PySide6.QtGui import QClipboard
 import json, sys, os
-from utils import get_resource_path
+from info_table_model import InfoTableModel, InfoActionDelegate, ACTIONS_COLUMN
+from info_search import InfoFilterProxyModel
+from project_store import set_info_value, unset_info_key, rename_info_key
 
 class ProjectInfoTab(QWidget):
     def __init__(self, main_window):
@@ -21,6 +23,12 @@ class ProjectInfoTab(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by key")
         self.search_input.returnPressed.connect(self.search_info)
+        # Search as you type, once the typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.search_info)
+        self.search_input.textChanged.connect(self.search_timer.start)
         buttons_layout.addWidget(self.search_input)
         self.info_layout.addLayout(buttons_layout)
 
@@ -38,11 +46,22 @@ class ProjectInfoTab(QWidget):
         self.info_form_layout.addWidget(self.info_value_input)
         self.info_layout.addLayout(self.info_form_layout)
 
-        self.additional_info_table = QTableWidget(0, 3)
-        self.additional_info_table.setHorizontalHeaderLabels(["Key", "Actions", "Value"])
+        # Rows are painted by the model and the delegate, no widgets per row
+        self.info_model = InfoTableModel(self)
+        self.info_proxy = InfoFilterProxyModel(self)
+        self.info_proxy.setSourceModel(self.info_model)
+        self.action_delegate = InfoActionDelegate(self)
+        self.action_delegate.copy_clicked.connect(lambda index: self.copy_to_clipboard(self.info_model.row_data(self.source_row(index))[2]))
+        self.action_delegate.delete_clicked.connect(lambda index: self.delete_row(self.source_row(index)))
+        self.action_delegate.save_clicked.connect(lambda index: self.save_row(self.source_row(index)))
+
+        self.additional_info_table = QTableView()
+        self.additional_info_table.setModel(self.info_proxy)
+        self.additional_info_table.setItemDelegateForColumn(ACTIONS_COLUMN, self.action_delegate)
         self.additional_info_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.additional_info_table.setAlternatingRowColors(True)
         self.additional_info_table.verticalHeader().setVisible(False)
+        self.additional_info_table.setMouseTracking(True)
 
         self.additional_info_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
 
@@ -55,84 +74,41 @@ class ProjectInfoTab(QWidget):
     def update_project_info(self, name, description, info):
         self.project_name_label.setText(f"Name: {name}")
         self.project_description_label.setText(f"Description: {description}")
-        self.clear_table()
-        info_dict = info if isinstance(info, str) else info
-        for key, value in info_dict.items():
-            self.add_info_item(key, value)
+        self.info_model.set_info(info)
 
     def clear_table(self):
-        self.additional_info_table.setRowCount(0)
+        self.info_model.clear()
+
+    def source_row(self, index):
+        """Row in info_model of an index of the (filtered) table."""
+        return self.info_proxy.mapToSource(index).row()
 
     def add_info_item(self, key, value):
-        row_position = self.additional_info_table.rowCount()
-        self.additional_info_table.insertRow(row_position)
-        
-        key_item = QTableWidgetItem(key)
-        key_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-        key_item.setData(Qt.UserRole, key)  # Guardar el valor original del key
-        self.additional_info_table.setItem(row_position, 0, key_item)
-        
-        value_item = QTableWidgetItem(value)
-        value_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-        self.additional_info_table.setItem(row_position, 2, value_item)
-        
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout()
-        actions_layout.setContentsMargins(0, 0, 0, 0)
-        actions_layout.setSpacing(1)
-        actions_widget.setLayout(actions_layout)
-
-        copy_button = QPushButton()
-        copy_button.setIcon(QIcon(get_resource_path("assets/icons/icon_copy.png")))
-        copy_button.setMaximumSize(24, 24)
-        copy_button.clicked.connect(lambda: self.copy_to_clipboard(value))
-        actions_layout.addWidget(copy_button)
-
-        delete_button = QPushButton()
-        delete_button.setIcon(QIcon(get_resource_path("assets/icons/delete.png")))
-        delete_button.setMaximumSize(24, 24)
-        delete_button.clicked.connect(lambda: self.delete_row(row_position))
-        actions_layout.addWidget(delete_button)
-
-        save_button = QPushButton()
-        save_button.setIcon(QIcon(get_resource_path("assets/icons/save.png")))
-        save_button.setMaximumSize(24, 24)
-        save_button.clicked.connect(lambda: self.save_row(row_position))
-        actions_layout.addWidget(save_button)
-
-        self.additional_info_table.setCellWidget(row_position, 1, actions_widget)
+        self.info_model.set_value(key, value)
 
     @Slot()
     def save_row(self, row_position):
-        key_item = self.additional_info_table.item(row_position, 0)
-        value_item = self.additional_info_table.item(row_position, 2)
-        
-        if key_item and value_item:
-            old_key = key_item.data(Qt.UserRole)  # Obtén el key original antes de la edición
-            new_key = key_item.text()
-            value = value_item.text()
-
-            if old_key != new_key:  # Si el key ha cambiado
-                # Actualiza el diccionario del proyecto
-                if old_key in self.main_window.current_project_info:
-                    self.main_window.current_project_info[new_key] = self.main_window.current_project_info.pop(old_key)
-                else:
-                    self.main_window.current_project_info[new_key] = value
-            else:
-                # Si el key no ha cambiado, solo actualiza el valor
-                self.main_window.current_project_info[new_key] = value
-
-            # Actualiza la base de datos
-            projects_collection = self.main_window.db.projects
-            projects_collection.update_one(
-                {"name": self.main_window.current_project_name, "description": self.main_window.current_project_description},
-                {"$set": {
-                    "info": self.main_window.current_project_info
-                }}
-            )
-
-            # Actualiza el key original almacenado en UserRole para futuras ediciones
-            key_item.setData(Qt.UserRole, new_key)
+        old_key, new_key, value = self.info_model.row_data(row_position)
+
+        if not new_key:
+            return
+
+        project_id = self.main_window.current_project_id
+        if old_key != new_key:  # Si el key ha cambiado
+            # Actualiza el diccionario del proyecto
+            self.main_window.current_project_info.pop(old_key, None)
+            self.main_window.current_project_info[new_key] = value
+            self.main_window.project_repository.submit_write(
+                project_id, lambda db: rename_info_key(db, project_id, old_key, new_key, value))
+        else:
+            # Si el key no ha cambiado, solo actualiza el valor
+            self.main_window.current_project_info[new_key] = value
+            self.main_window.project_repository.submit_write(
+                project_id, lambda db: set_info_value(db, project_id, new_key, value))
+
+        # Actualiza el key original para futuras ediciones
+        self.info_model.mark_saved(row_position)
+        self.main_window.reindex_current_project()
 
     @Slot()
     def enable_editing(self):
@@ -145,31 +121,26 @@ class ProjectInfoTab(QWidget):
 
     @Slot()
     def search_info(self):
-        search_key = self.search_input.text().lower()
-        for row in range(self.additional_info_table.rowCount()):
-            item = self.additional_info_table.item(row, 0)
-            if item and search_key in item.text().lower():
-                self.additional_info_table.showRow(row)
-            else:
-                self.additional_info_table.hideRow(row)
+        self.search_timer.stop()
+        self.info_proxy.set_query(self.search_input.text())
 
     @Slot()
     def clear_search(self):
+        self.search_input.blockSignals(True)
         self.search_input.clear()
-        for row in range(self.additional_info_table.rowCount()):
-            self.additional_info_table.showRow(row)
+        self.search_input.blockSignals(False)
+        self.search_timer.stop()
+        self.info_proxy.set_query("")
 
     @Slot()
     def change_icon(self):
         icon_path, _ = QFileDialog.getOpenFileName(self, "Seleccionar Icono", "", "Imágenes PNG (*.png);;Imágenes GIF (*.gif);;Imágenes WebP (*.webp)")
         if icon_path:
-            self.main_window.current_project_item.setIcon(QIcon(icon_path))
-            projects_collection = self.main_window.db.projects
-            result = projects_collection.update_one(
-                {"name": self.main_window.current_project_name, "description": self.main_window.current_project_description},
-                {"$set": {"icon_path": icon_path}}
+            self.main_window.update_project_icon(self.main_window.current_project_name, icon_path)
+            self.main_window.project_repository.update_fields(
+                self.main_window.current_project_id, {"icon_path": icon_path},
+                callback=lambda result: print(f"Icon path updated: {result.modified_count} document(s) modified.")
             )
-            print(f"Icon path updated: {result.modified_count} document(s) modified.")     
 
     @Slot()
     def add_project_info(self):
@@ -180,13 +151,10 @@ class ProjectInfoTab(QWidget):
             self.main_window.current_project_info[name] = value
             self.add_info_item(name, value)
 
-            projects_collection = self.main_window.db.projects
-            projects_collection.update_one(
-                {"name": self.main_window.current_project_name, "description": self.main_window.current_project_description},
-                {"$set": {
-                    "info": self.main_window.current_project_info
-                }}
-            )
+            project_id = self.main_window.current_project_id
+            self.main_window.project_repository.submit_write(
+                project_id, lambda db: set_info_value(db, project_id, name, value))
+            self.main_window.reindex_current_project()
 
             self.info_name_input.clear()
             self.info_value_input.clear()
@@ -198,16 +166,11 @@ class ProjectInfoTab(QWidget):
 
     @Slot()
     def delete_row(self, row_position):
-        key_item = self.additional_info_table.item(row_position, 0)
-        if key_item:
-            key = key_item.text()
-            if key in self.main_window.current_project_info:
-                del self.main_window.current_project_info[key]
-            projects_collection = self.main_window.db.projects
-            projects_collection.update_one(
-                {"name": self.main_window.current_project_name, "description": self.main_window.current_project_description},
-                {"$set": {
-                    "info": self.main_window.current_project_info
-                }}
-            )
-            self.additional_info_table.removeRow(row_position)
+        key = self.info_model.row_data(row_position)[0]
+        if key in self.main_window.current_project_info:
+            del self.main_window.current_project_info[key]
+        project_id = self.main_window.current_project_id
+        self.main_window.project_repository.submit_write(
+            project_id, lambda db: unset_info_key(db, project_id, key))
+        self.info_model.removeRows(row_position, 1)
+        self.main_window.reindex_current_project()
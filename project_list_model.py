@@ -0,0 +1,236 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSize, Qt, Signal
+from PySide6.QtGui import QFontMetrics
+from PySide6.QtWidgets import QApplication
+
+from icon_cache import get_icon
+from rank import RANK_FIELD, rank_between
+from storage_worker import find_summaries
+
+DEFAULT_ICON_PATH = "assets/project_images/default_icon.png"
+
+
+def project_label(name, description):
+    """Text shown for a project in the sidebar."""
+    if len(description) > 8:
+        description = description[:8] + "..."
+    return f"{name}: {description}"
+
+
+class ProjectListModel(QAbstractListModel):
+    """
+    Sidebar model paged from the database in rank order (see rank.py).
+
+    Projects are pulled from the database in pages through canFetchMore/fetchMore,
+    so only the rows the view scrolls to are ever read. Each page is its own
+    bounded query starting after the last rank read (keyset paging), so no
+    cursor stays open between pages. Pages are read on the
+    storage thread and inserted when they arrive; page_loaded is emitted then. Each row keeps just the id,
+    label and icon path; icons are decoded when the view asks for the decoration
+    of a visible row, and animated ones come from the shared GifAnimator.
+
+    Row 0 is the "Create Project" row (Qt.UserRole is None), the rest keep the
+    old QListWidgetItem contract: Qt.UserRole -> project id, Qt.UserRole + 1 -> icon path.
+
+    Projects can be dragged to another place (moveRows); project_moved then
+    gives the one new rank to save. A project cannot be dropped past the last
+    page read, as the rank of the next project is not known yet.
+    """
+
+    PAGE_SIZE = 100
+    ICON_SIZE = 16
+    # Icons are cached at twice the painted size so they stay sharp on HiDPI screens.
+    THUMBNAIL_SIZE = QSize(32, 32)
+
+    page_loaded = Signal()
+    project_moved = Signal(str, str)  # project id, new rank
+
+    def __init__(self, storage, animator=None, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self.animator = animator
+        self._rows = []
+        self._page_state = {}
+        self._generation = 0
+        self._pending = False
+        self._exhausted = True
+        self._appended_ids = set()
+        self.create_row_size = QSize()
+
+    def reload(self):
+        self.beginResetModel()
+        self._rows = [[None, "", None, None]]
+        # Where the next page starts; only touched on the storage thread, a new dict per reload.
+        self._page_state = {}
+        self._generation += 1
+        self._pending = False
+        self._exhausted = False
+        self._appended_ids = set()
+        self.endResetModel()
+
+    # --- Qt model API ---
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return not self._exhausted and not self._pending
+
+    def is_exhausted(self):
+        """True once every project has been paged in."""
+        return self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or self._pending:
+            return
+        state = self._page_state
+        generation = self._generation
+        page_size = self.PAGE_SIZE
+
+        def fetch_page(db):
+            # Ranks from the last one read on, minus the projects already read
+            # with that rank in case two share it
+            last_rank, seen = state.get("last_rank"), state.get("seen", set())
+            filter = {RANK_FIELD: {"$gte": last_rank}} if last_rank is not None else None
+            documents = find_summaries(db, "projects", filter, sort=[(RANK_FIELD, 1)],
+                                       limit=page_size + len(seen))
+            page = [self._row_from_doc(doc) for doc in documents if str(doc["_id"]) not in seen][:page_size]
+            if page:
+                rank = page[-1][3]
+                state["seen"] = {row[0] for row in page if row[3] == rank} | (seen if rank == last_rank else set())
+                state["last_rank"] = rank
+            return page
+
+        self._pending = True
+        self.storage.submit(fetch_page, callback=lambda page: self._on_page(generation, page))
+
+    def _on_page(self, generation, page):
+        if generation != self._generation:
+            return
+        self._pending = False
+        if len(page) < self.PAGE_SIZE:
+            self._exhausted = True
+        # Projects created in this session are already in the list.
+        page = [row for row in page if row[0] not in self._appended_ids]
+        if page:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self._rows.extend(page)
+            self.endInsertRows()
+        self.page_loaded.emit()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        project_id, label, icon_path, _ = self._rows[index.row()]
+
+        if role == Qt.UserRole:
+            return project_id
+        if role == Qt.UserRole + 1:
+            return icon_path
+        if project_id is None:
+            if role == Qt.SizeHintRole and self.create_row_size.isValid():
+                return self.create_row_size
+            return None
+
+        if role == Qt.DisplayRole:
+            return label
+        if role == Qt.DecorationRole:
+            return self._icon_for_path(icon_path)
+        if role == Qt.SizeHintRole:
+            # Answering the size hint here keeps the delegate from loading the
+            # icon of every row just to lay out the list.
+            metrics = QFontMetrics(QApplication.font())
+            width = metrics.horizontalAdvance(label) + self.ICON_SIZE + 12
+            return QSize(width, max(metrics.height(), self.ICON_SIZE) + 4)
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return False
+        row = self._rows[index.row()]
+        if role == Qt.UserRole + 1:
+            row[2] = value
+        elif role in (Qt.DisplayRole, Qt.EditRole):
+            row[1] = value
+        else:
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled  # drops go between rows
+        if index.row() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination):
+        """Called by the view for internal drops; destination is the row it goes before."""
+        last = source_row + count
+        if (source_parent.isValid() or destination_parent.isValid() or source_row < 1
+                or last > len(self._rows) or destination < 1 or source_row <= destination <= last):
+            return False
+        if not self._exhausted and (destination >= len(self._rows)
+                                    or self._rows[destination - 1][0] in self._appended_ids):
+            return False
+        before = self._rows[destination - 1][3] if destination - 1 > 0 else None
+        after = self._rows[destination][3] if destination < len(self._rows) else None
+        ranks = []
+        try:
+            for _ in range(count):
+                before = rank_between(before, after)
+                ranks.append(before)
+        except (ValueError, TypeError):
+            return False  # rows without a rank (not saved yet) or out of order
+
+        self.beginMoveRows(QModelIndex(), source_row, last - 1, QModelIndex(), destination)
+        moved = self._rows[source_row:last]
+        del self._rows[source_row:last]
+        at = destination if destination < source_row else destination - count
+        self._rows[at:at] = moved
+        self.endMoveRows()
+        for row, rank in zip(moved, ranks):
+            row[3] = rank
+            self.project_moved.emit(row[0], rank)
+        return True
+
+    # --- helpers used by the tabs ---
+
+    def index_for_project(self, project_id):
+        project_id = str(project_id)
+        for row, (row_id, _, _, _) in enumerate(self._rows):
+            if row_id == project_id:
+                return self.index(row, 0)
+        return QModelIndex()
+
+    def append_project(self, project_id, name, description, icon_path=DEFAULT_ICON_PATH, rank=None):
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append([str(project_id), project_label(name, description), icon_path, rank])
+        self._appended_ids.add(str(project_id))
+        self.endInsertRows()
+        return self.index(row, 0)
+
+    def update_project(self, index, name, description):
+        self.setData(index, project_label(name, description), Qt.DisplayRole)
+
+    @staticmethod
+    def _row_from_doc(doc):
+        return [
+            str(doc["_id"]),
+            project_label(doc.get("name", ""), doc.get("description", "")),
+            doc.get("icon_path", DEFAULT_ICON_PATH),
+            doc.get(RANK_FIELD),
+        ]
+
+    def _icon_for_path(self, icon_path):
+        if icon_path.endswith('.gif') and self.animator is not None:
+            return self.animator.icon(icon_path)
+        return get_icon(icon_path, self.THUMBNAIL_SIZE)
@@ -0,0 +1,92 @@
+"""
+Loading what the tabs show when another project is selected.
+
+One batch on the storage thread reads the project (through the
+ProjectRepository cache), its info, its todos and its note list, each only
+when a tab that shows it exists; a cached project with nothing else to read
+is applied at once, without the round trip. Every
+selection bumps a generation number: batches still queued or running for an
+older selection stop at their next step, and their results are dropped, so
+scrolling through the sidebar only ever applies the last project reached.
+"""
+
+import os
+
+from PySide6.QtCore import QObject, Signal
+
+from note_watcher import scan_notes
+from rank import find_ranked
+
+
+def load_project_batch(db, repository, project_id, notes_dir, with_todos, with_info, is_current):
+    """
+    {"project", "info", "todos", "notes"} for one project, or None once
+    is_current() says a newer selection replaced it. Runs on the storage thread.
+    """
+    if not is_current():
+        return None
+    project = repository.get(db, project_id)
+    if not project or not is_current():
+        return None
+    info = repository.get_info(db, project_id) if with_info else None
+    todos = find_ranked(db, "todos", {"project_id": str(project_id)}) if with_todos else None
+    if not is_current():
+        return None
+    notes = scan_notes(notes_dir) if notes_dir and os.path.isdir(notes_dir) else None
+    return {"project": project, "info": info, "todos": todos, "notes": notes}
+
+
+class ProjectLoader(QObject):
+    """Front end of load_project_batch; loaded(index, batch) only fires for the latest load()."""
+
+    loaded = Signal(object, object)
+
+    def __init__(self, storage, repository, storage_dir, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self.repository = repository
+        self.storage_dir = storage_dir
+        self.loading_project_id = None
+        self.cancelled = 0
+        self._generation = 0
+
+    def is_loading(self):
+        return self.loading_project_id is not None
+
+    def load(self, project_id, index, with_todos=True, with_notes=True, with_info=True):
+        if project_id == self.loading_project_id:
+            return  # already on its way (click and current change of the same row)
+        self.cancel()
+        self._generation += 1
+        generation = self._generation
+
+        if not with_todos and not with_notes:
+            project = self.repository.cached(project_id)
+            info = self.repository.cached_info(project_id) if with_info else None
+            if project is not None and (info is not None or not with_info):
+                self.loaded.emit(index, {"project": project, "info": info, "todos": None, "notes": None})
+                return
+        self.loading_project_id = project_id
+
+        def is_current():
+            return generation == self._generation
+
+        notes_dir = os.path.join(self.storage_dir, str(project_id)) if with_notes else None
+        repository = self.repository
+        self.storage.submit(
+            lambda db: load_project_batch(db, repository, project_id, notes_dir, with_todos, with_info, is_current),
+            callback=lambda batch: self._on_loaded(generation, index, batch)
+        )
+
+    def cancel(self):
+        if self.loading_project_id is not None:
+            self.cancelled += 1
+            self._generation += 1
+            self.loading_project_id = None
+
+    def _on_loaded(self, generation, index, batch):
+        if generation != self._generation:
+            return
+        self.loading_project_id = None
+        if batch is not None:
+            self.loaded.emit(index, batch)
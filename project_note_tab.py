@@ -1,15 +1,56 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QTextEdit, QPushButton,
                                QHBoxLayout, QLineEdit, QListWidget, 
                                QListWidgetItem, QMessageBox, QSplitter, 
-                               QInputDialog, QStackedWidget)
-from PySide6.QtGui import (QFont, QTextCursor, Qt)
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem)
-from PySide6.QtCore import (Qt, Slot)
+                               QInputDialog, QStackedWidget, QPlainTextEdit, QLabel)
+from PySide6.QtGui import (QFont, QTextCursor, Qt, QTextDocument)
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem,
+                               QStyledItemDelegate, QStyle)
+from PySide6.QtCore import (Qt, Slot, QTimer, QSize)
 
-import os, markdown2
-from utils import get_resource_path, clean_text_format
+import os, html
+from utils import get_resource_path, clean_text_format, atomic_write_text
+from markdown_renderer import MarkdownRenderer, content_hash
+from large_note import LargeNoteLoader, is_large_note, read_mapped
+from storage_worker import StorageService
+from note_watcher import NoteDirWatcher
+from global_search import read_note
 from emoji_picker import  EmojiPicker
 
+SNIPPET_ROLE = Qt.UserRole + 1
+
+
+class NoteItemDelegate(QStyledItemDelegate):
+    """Draws the matching snippet (HTML with <b> highlights) under the note name."""
+
+    def _document(self, option, index):
+        doc = QTextDocument()
+        doc.setDefaultFont(option.font)
+        doc.setHtml(f"{html.escape(index.data(Qt.DisplayRole))}"
+                    f"<br><span style='color: gray;'>{index.data(SNIPPET_ROLE)}</span>")
+        doc.setTextWidth(option.rect.width())
+        return doc
+
+    def paint(self, painter, option, index):
+        if not index.data(SNIPPET_ROLE):
+            return super().paint(painter, option, index)
+        self.initStyleOption(option, index)
+        option.text = ""
+        style = option.widget.style() if option.widget else None
+        if style:
+            style.drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+        painter.save()
+        painter.translate(option.rect.topLeft())
+        self._document(option, index).drawContents(painter)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        if not index.data(SNIPPET_ROLE):
+            return super().sizeHint(option, index)
+        self.initStyleOption(option, index)
+        doc = self._document(option, index)
+        return QSize(int(doc.idealWidth()), int(doc.size().height()))
+
+
 class ProjectNoteTab(QWidget):
     def __init__(self, main_window):
         super().__init__()
@@ -18,6 +59,20 @@ class ProjectNoteTab(QWidget):
         self.current_note_file = None
         self.project_id = None
         self.notes_dir = ""
+        # Markdown is rendered on its own thread; the hashes say what the preview shows
+        self.renderer = MarkdownRenderer()
+        self.render_service = StorageService(self.renderer, self, name="MauMarkdown")
+        self.preview_hash = None
+        self.pending_preview_hash = None
+        # Notes over LARGE_NOTE_BYTES open read-only in large_viewer, without preview until asked
+        self.large_note = False
+        # Autosave: edits since the last save, hash of what is on disk, writes still queued per path
+        self.note_dirty = False
+        self.saved_hash = None
+        self.writing_notes = {}
+        # Follows storage/<project_id>/ for notes changed by other programs
+        self.note_watcher = NoteDirWatcher(self)
+        self.note_watcher.notes_changed.connect(self.on_notes_changed)
 
         self.preview_css = """
         <style>
@@ -59,6 +114,8 @@ class ProjectNoteTab(QWidget):
         self.explorer_layout.addLayout(self.top_bar)
         
         self.notes_list_widget = QListWidget()
+        self.notes_list_widget.setWordWrap(True)
+        self.notes_list_widget.setItemDelegate(NoteItemDelegate(self.notes_list_widget))
         self.notes_list_widget.itemClicked.connect(self.open_selected_note)
         self.explorer_layout.addWidget(self.notes_list_widget)
 
@@ -117,6 +174,9 @@ class ProjectNoteTab(QWidget):
         self.toolbar.addWidget(self.code_btn)
         
         self.toolbar.addStretch()
+        self.large_note_label = QLabel()
+        self.large_note_label.hide()
+        self.toolbar.addWidget(self.large_note_label)
         self.editor_layout.addLayout(self.toolbar)
 
         # Stacked Widget
@@ -128,8 +188,17 @@ class ProjectNoteTab(QWidget):
         self.view_area = QTextEdit()
         self.view_area.setReadOnly(True)
         
+        self.large_viewer = QPlainTextEdit()
+        self.large_viewer.setReadOnly(True)
+        self.large_viewer.setUndoRedoEnabled(False)
+        self.large_viewer.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.large_viewer.setStyleSheet("font-family: 'Consolas', 'Monaco', monospace; font-size: 13px;")
+        self.large_loader = LargeNoteLoader(self.large_viewer, self)
+        self.large_loader.progress.connect(self.on_large_note_progress)
+
         self.stack.addWidget(self.edit_area) 
         self.stack.addWidget(self.view_area) 
+        self.stack.addWidget(self.large_viewer)
         self.editor_layout.addWidget(self.stack)
 
         # Splitter
@@ -143,7 +212,12 @@ class ProjectNoteTab(QWidget):
         self.new_note_btn.clicked.connect(self.create_new_note)
         # self.clean_button.clicked.connect(clean_text_format)
         self.clean_button.clicked.connect(lambda: clean_text_format(self.edit_area, self.save_current_note))
-        self.search_input.textChanged.connect(self.filter_notes)
+        # The search looks inside the notes (NoteIndex), once the typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(lambda: self.filter_notes(self.search_input.text()))
+        self.search_input.textChanged.connect(self.search_timer.start)
         
         # Lógica de inserción
         self.bold_btn.clicked.connect(lambda: self.insert_md("**", "**"))
@@ -157,13 +231,26 @@ class ProjectNoteTab(QWidget):
         self.link_btn.clicked.connect(lambda: self.insert_md("[", "](url)")) 
 
         self.emoji_btn.clicked.connect(self.open_emoji_picker)
+
+        # Edits are saved a moment after the typing stops, and before leaving the note
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(1000)
+        self.autosave_timer.timeout.connect(self.save_current_note)
+        self.edit_area.textChanged.connect(self.on_note_edited)
+        self.main_window.note_storage.about_to_stop.connect(self.save_current_note)
         self.setEnabled(False)
 
-    def set_project_id(self, project_id):
+    def set_project_id(self, project_id, notes=None):
+        """`notes` is scan_notes() of the project when the caller already listed it."""
+        self.save_current_note()
         self.project_id = str(project_id)
         self.notes_list_widget.clear()
-        self.edit_area.clear()
+        self.close_large_note()
+        self.set_editor_text("")
         self.view_area.clear()
+        self.preview_hash = None
+        self.pending_preview_hash = None
         self.current_note_file = None
         if project_id:
             self.setEnabled(True)
@@ -171,22 +258,178 @@ class ProjectNoteTab(QWidget):
             if not os.path.exists(self.notes_dir):
                 try: os.makedirs(self.notes_dir)
                 except OSError: pass
-            self.load_notes_from_dir()
+            self.load_notes_from_dir(notes)
+            self.reconcile_note_index()
         else:
+            self.note_watcher.stop()
             self.setEnabled(False)
 
-    def load_notes_from_dir(self):
+    def load_notes_from_dir(self, notes=None):
         self.notes_list_widget.clear()
-        if os.path.exists(self.notes_dir):
-            files = [f for f in os.listdir(self.notes_dir) if f.endswith(('.md', '.txt'))]
-            for f in files:
-                item = QListWidgetItem(f"📄 {f}")
-                item.setData(Qt.UserRole, os.path.join(self.notes_dir, f))
-                self.notes_list_widget.addItem(item)
+        for path in self.note_watcher.watch(self.notes_dir, notes):
+            self.add_note_item(path)
+        if self.search_input.text().strip():
+            self.search_timer.start()
+
+    def add_note_item(self, path):
+        item = QListWidgetItem(f"📄 {os.path.basename(path)}")
+        item.setData(Qt.UserRole, path)
+        self.notes_list_widget.addItem(item)
+
+    def note_item(self, path):
+        for i in range(self.notes_list_widget.count()):
+            item = self.notes_list_widget.item(i)
+            if item.data(Qt.UserRole) == path:
+                return item
+        return None
+
+    def on_notes_changed(self, added, removed, modified, renamed):
+        """Apply what NoteDirWatcher saw on disk to the list, the open note and the indexes."""
+        for path in added:
+            if self.note_item(path) is None:
+                self.add_note_item(path)
+        for path in removed:
+            item = self.note_item(path)
+            if item:
+                self.notes_list_widget.takeItem(self.notes_list_widget.row(item))
+            if path == self.current_note_file and not self.note_dirty:
+                self.close_current_note()
+        for old, new in renamed:
+            item = self.note_item(old)
+            if item:
+                item.setText(f"📄 {os.path.basename(new)}")
+                item.setData(Qt.UserRole, new)
+            if old == self.current_note_file:
+                self.current_note_file = new
+        # Our own saves show up too; they are indexed by write_note already
+        modified = [path for path in modified if path not in self.writing_notes]
+        if self.current_note_file in modified:
+            self.reload_current_note()
+
+        stale = removed + [old for old, _ in renamed]
+        fresh = added + modified + [new for _, new in renamed]
+        project_id = self.project_id
+
+        def reindex(index):
+            for path in stale:
+                index.remove_note(path)
+            contents = {}
+            for path in fresh:
+                contents[path] = read_note(path)
+                index.update_note(project_id, path, contents[path])
+            return contents
+
+        self.main_window.note_storage.submit(
+            reindex, callback=lambda contents: self.on_notes_reindexed(project_id, stale, contents))
+
+    def on_notes_reindexed(self, project_id, stale, contents):
+        for path in stale:
+            self.main_window.global_search.remove_note(path)
+        for path, content in contents.items():
+            self.main_window.global_search.update_note(path, project_id, content)
+        if project_id == self.project_id and self.search_input.text().strip():
+            self.search_timer.start()
+
+    def close_current_note(self):
+        self.close_large_note()
+        self.current_note_file = None
+        self.set_editor_text("")
+        self.view_area.clear()
+        self.preview_hash = None
+        self.pending_preview_hash = None
+
+    def reload_current_note(self):
+        """The open note changed on disk: show the new text unless there are unsaved edits."""
+        self.preview_hash = None
+        if self.large_note:
+            if self.mode_btn.isChecked():
+                self.render_markdown()
+            return
+        if self.note_dirty:
+            print(f"Nota modificada fuera de la app, se conservan los cambios sin guardar: {self.current_note_file}")
+            return
+        try:
+            with open(self.current_note_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error al recargar nota {self.current_note_file}: {e}")
+            return
+        if content_hash(content) != self.saved_hash:
+            self.set_editor_text(content)
+        if self.mode_btn.isChecked():
+            self.render_markdown()
+
+    def reconcile_note_index(self):
+        """Pick up notes changed outside the app since they were last indexed."""
+        project_id = self.project_id
+        self.main_window.note_storage.submit(
+            lambda index: index.reconcile(project_id),
+            callback=lambda counts: self.on_note_index_reconciled(project_id, counts)
+        )
+
+    def on_note_index_reconciled(self, project_id, counts):
+        if project_id == self.project_id and any(counts) and self.search_input.text().strip():
+            self.search_timer.start()
+
+    def set_editor_text(self, text):
+        """Load text into the editor without it counting as an edit."""
+        self.edit_area.blockSignals(True)
+        self.edit_area.setPlainText(text)
+        self.edit_area.blockSignals(False)
+        self.autosave_timer.stop()
+        self.note_dirty = False
+        self.saved_hash = content_hash(text)
+
+    def on_note_edited(self):
+        if self.current_note_file and not self.large_note:
+            self.note_dirty = True
+            self.autosave_timer.start()
+
+    def index_note(self, path, content):
+        project_id = self.project_id
+        self.main_window.note_storage.submit(lambda index: index.update_note(project_id, path, content))
+        self.main_window.global_search.update_note(path, project_id, content)
 
     def render_markdown(self):
+        if self.large_note:
+            self.render_large_note()
+            return
         raw_text = self.edit_area.toPlainText()
-        html = markdown2.markdown(raw_text, extras=["fenced-code-blocks", "blockquote", "tables"])
+        key = content_hash(raw_text)
+        if key in (self.preview_hash, self.pending_preview_hash):
+            return  # already shown, or on its way
+        html = self.renderer.cached_html(key)
+        if html is not None:
+            self.show_preview(key, html)
+            return
+        self.pending_preview_hash = key
+        self.render_service.submit(lambda renderer: renderer.render(raw_text, key),
+                                   callback=self.on_markdown_rendered)
+
+    def on_markdown_rendered(self, result):
+        key, html = result
+        if key != self.pending_preview_hash:
+            return  # the text changed again while this was rendering
+        self.pending_preview_hash = None
+        self.show_preview(key, html)
+
+    def render_large_note(self):
+        """The preview of a large note is read and rendered on the render thread, only on request."""
+        path = self.current_note_file
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        key = f"file:{path}:{stat.st_mtime_ns}:{stat.st_size}"
+        if key in (self.preview_hash, self.pending_preview_hash):
+            return
+        self.pending_preview_hash = key
+        self.view_area.setPlainText("Rendering preview...")
+        self.render_service.submit(lambda renderer: (key, renderer.render(read_mapped(path))[1]),
+                                   callback=self.on_markdown_rendered)
+
+    def show_preview(self, key, html):
+        self.preview_hash = key
         self.view_area.setHtml(self.preview_css + html)
 
     @Slot(bool)
@@ -204,6 +447,9 @@ class ProjectNoteTab(QWidget):
             self.mode_btn.setText("👁️")
             self.mode_btn.setToolTip("Preview")
             self.mode_btn.setFixedWidth(35)
+            if self.large_note:
+                self.stack.setCurrentIndex(2)
+                return
             self.stack.setCurrentIndex(0)
             for btn in self.format_btns:
                 btn.setEnabled(True)
@@ -211,12 +457,19 @@ class ProjectNoteTab(QWidget):
 
     @Slot()
     def open_selected_note(self, item):
+        self.save_current_note()
+        self.close_large_note()
         self.current_note_file = item.data(Qt.UserRole)
+        if self.current_note_file in self.writing_notes:
+            self.main_window.note_storage.flush()  # read it back as it was saved
+        if is_large_note(self.current_note_file):
+            self.open_large_note(self.current_note_file)
+            return
         if os.path.exists(self.current_note_file):
             try:
                 with open(self.current_note_file, 'r', encoding='utf-8') as f:
                     content = f.read()
-                    self.edit_area.setPlainText(content)
+                    self.set_editor_text(content)
                     
                     self.render_markdown() # Renderizar
                     
@@ -225,17 +478,109 @@ class ProjectNoteTab(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"No se pudo abrir la nota: {e}")
 
+    def open_large_note(self, path):
+        self.large_note = True
+        self.set_editor_text("")
+        self.view_area.clear()
+        self.preview_hash = None
+        self.pending_preview_hash = None
+        self.save_btn.setEnabled(False)
+        try:
+            self.large_loader.open(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"No se pudo abrir la nota: {e}")
+            return
+        # Preview off: rendering tens of MB of markdown waits until the eye button is pressed
+        self.mode_btn.setChecked(False)
+        self.toggle_mode(False)
+        for btn in self.format_btns:
+            btn.setEnabled(False)
+        self.large_note_label.setText("Read-only (large note)")
+        self.large_note_label.show()
+
+    def close_large_note(self):
+        if not self.large_note:
+            return
+        self.large_loader.close()
+        self.large_viewer.clear()
+        self.large_note = False
+        self.large_note_label.hide()
+        self.save_btn.setEnabled(True)
+        if self.stack.currentIndex() == 2:
+            self.stack.setCurrentIndex(0)
+
+    def on_large_note_progress(self, loaded, total):
+        mb = 1024 * 1024
+        text = "Read-only (large note)"
+        if loaded < total:
+            text += f" · loading {loaded / mb:.0f}/{total / mb:.0f} MB"
+        self.large_note_label.setText(text)
+
+    def open_note_path(self, path):
+        item = self.note_item(path)
+        if item:
+            self.notes_list_widget.setCurrentItem(item)
+            self.open_selected_note(item)
+
     @Slot()
     def save_current_note(self):
-        if self.current_note_file:
-            try:
-                content = self.edit_area.toPlainText()
-                with open(self.current_note_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                if self.mode_btn.isChecked():
-                    self.render_markdown() # Renderizar
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not save: {e}")
+        self.autosave_timer.stop()
+        if self.large_note or not self.current_note_file or not self.note_dirty:
+            return  # large notes are read-only; nothing typed since the last save
+        self.note_dirty = False
+        content = self.edit_area.toPlainText()
+        key = content_hash(content)
+        if key == self.saved_hash:
+            return
+        self.saved_hash = key
+        self.write_note(self.current_note_file, content)
+        if self.mode_btn.isChecked():
+            self.render_markdown() # Renderizar
+
+    def write_note(self, path, content, exclusive=False):
+        """
+        Atomic write on the note index thread, which then indexes the saved text.
+        With exclusive=True (a new note) it fails instead of replacing a file
+        that already has that name.
+        """
+        project_id = self.project_id
+        self.writing_notes[path] = self.writing_notes.get(path, 0) + 1
+
+        def write(index):
+            atomic_write_text(path, content, exclusive)
+            index.update_note(project_id, path, content)
+
+        def written(_):
+            if exclusive:
+                self.main_window.global_search.update_note(path, project_id, content)
+            self.on_note_written(path)
+
+        self.main_window.note_storage.submit(
+            write,
+            callback=written,
+            on_error=lambda message: self.on_note_written(path, message, created=exclusive)
+        )
+        if not exclusive:
+            self.main_window.global_search.update_note(path, project_id, content)
+
+    def on_note_written(self, path, error=None, created=False):
+        self.writing_notes[path] -= 1
+        if not self.writing_notes[path]:
+            del self.writing_notes[path]
+        if error and created:
+            # Not ours: a file that took the name meanwhile is listed by the note watcher
+            item = self.note_item(path)
+            if item:
+                self.notes_list_widget.takeItem(self.notes_list_widget.row(item))
+            QMessageBox.critical(self, "Error", f"Could not create the note: {error}")
+            return
+        self.note_watcher.acknowledge(path)
+        if error:
+            if path == self.current_note_file:
+                # Keep the text as unsaved so the next edit or note switch tries again
+                self.note_dirty = True
+                self.saved_hash = None
+            QMessageBox.critical(self, "Error", f"Could not save: {error}")
 
     def insert_md(self, prefix, suffix):
         if self.stack.currentIndex() != 0: return 
@@ -255,17 +600,43 @@ class ProjectNoteTab(QWidget):
         if ok and name:
             if not name.endswith(".md"): name += ".md"
             path = os.path.join(self.notes_dir, name)
-            try:
-                with open(path, 'w', encoding='utf-8') as f: 
-                    f.write(f"# {name[:-3]}\n\n Write here...")
-                self.load_notes_from_dir()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", str(e))
+            if os.path.exists(path) or self.note_item(path) is not None:
+                QMessageBox.warning(self, "New Nota", f"A note named '{name}' already exists.")
+                return
+            # Same atomic write on the note thread as a save; exclusive, in case the
+            # name is taken between this check and the write
+            self.write_note(path, f"# {name[:-3]}\n\n Write here...", exclusive=True)
+            self.add_note_item(path)
 
     def filter_notes(self, text):
+        self.search_timer.stop()
+        text = text.strip()
+        if not text:
+            self.show_note_matches(None)
+            return
+        project_id = self.project_id
+        self.main_window.note_storage.submit(
+            lambda index: (index.available, index.search(project_id, text)),
+            callback=lambda result: self.on_notes_found(project_id, text, *result)
+        )
+
+    def on_notes_found(self, project_id, text, available, results):
+        if project_id != self.project_id or text != self.search_input.text().strip():
+            return  # a newer search is on its way
+        if not available:
+            # Sin índice: solo por nombre de archivo
+            results = [(self.notes_list_widget.item(i).data(Qt.UserRole), None)
+                       for i in range(self.notes_list_widget.count())
+                       if text.lower() in self.notes_list_widget.item(i).text().lower()]
+        self.show_note_matches(dict(results))
+
+    def show_note_matches(self, snippets):
+        """Show only the notes in `snippets` ({path: snippet_html}), or all of them for None."""
         for i in range(self.notes_list_widget.count()):
             item = self.notes_list_widget.item(i)
-            item.setHidden(text.lower() not in item.text().lower())
+            path = item.data(Qt.UserRole)
+            item.setHidden(snippets is not None and path not in snippets)
+            item.setData(SNIPPET_ROLE, snippets.get(path) if snippets else None)
 
     def open_emoji_picker(self):
             # Solo funciona si estamos en modo edición
@@ -0,0 +1,168 @@
+"""
+Project documents and their info as read by the app, with an LRU cache in
+front of the database.
+
+Every write to a project goes through ProjectRepository.submit_write (or
+insert), so the cache can never hand out a document older than a write the
+GUI has already made: the entry is dropped once the write ran, and while a
+write is still queued cached() does not answer for that project at all.
+A project's info (project_store.load_info) is cached next to its document
+and dropped with it; info writes go through submit_write as well.
+"""
+
+from collections import OrderedDict
+import json
+import threading
+
+from project_store import as_object_id, load_info
+from rank import RANK_FIELD, next_rank
+
+
+def document_size(document):
+    """Rough size in bytes of a project document, for the cache budget."""
+    return len(json.dumps(document, default=str))
+
+
+class ProjectRepository:
+    """
+    get() reads through the cache and runs on the storage thread like any other
+    operation; cached() can be called from the GUI thread to skip the round
+    trip when the document is known. Both count towards hits and misses.
+    """
+
+    def __init__(self, storage, max_projects=256, max_bytes=16 * 1024 * 1024):
+        self.storage = storage
+        self.max_projects = max_projects
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.cached_bytes = 0
+        self._entries = OrderedDict()  # str(project_id) -> (document, size)
+        self._info = {}  # str(project_id) -> (info, size), only for projects in _entries
+        self._pending_writes = {}
+        self._lock = threading.Lock()
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "projects": len(self._entries), "bytes": self.cached_bytes}
+
+    def cached(self, project_id):
+        """The cached document, or None if it has to be read. Treat it as read-only."""
+        key = str(project_id)
+        with self._lock:
+            if self._pending_writes.get(key):
+                return None
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get(self, db, project_id):
+        key = str(project_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        document = db.projects.find_one({"_id": project_id})
+        if document is not None:
+            self._store(key, document)
+        return document
+
+    def cached_info(self, project_id):
+        """Like cached(), for the project's info."""
+        key = str(project_id)
+        with self._lock:
+            if self._pending_writes.get(key):
+                return None
+            entry = self._info.get(key)
+            if entry is None:
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def get_info(self, db, project_id):
+        """{key: value} of the project, read through the cache. Storage thread only."""
+        key = str(project_id)
+        with self._lock:
+            entry = self._info.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        info = load_info(db, key)
+        size = document_size(info)
+        with self._lock:
+            if key in self._entries and not self._pending_writes.get(key):
+                self._info[key] = (info, size)
+                self.cached_bytes += size
+        return info
+
+    def _drop(self, key):
+        """Forget one project; the lock is held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.cached_bytes -= entry[1]
+        info = self._info.pop(key, None)
+        if info is not None:
+            self.cached_bytes -= info[1]
+
+    def _store(self, key, document):
+        size = document_size(document)
+        with self._lock:
+            if self._pending_writes.get(key):
+                return  # a write is queued behind this read
+            self._drop(key)
+            self._entries[key] = (document, size)
+            self.cached_bytes += size
+            while self._entries and (len(self._entries) > self.max_projects
+                                     or self.cached_bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, project_id=None):
+        """Drop one project, or every project when project_id is None."""
+        with self._lock:
+            if project_id is None:
+                self._entries.clear()
+                self._info.clear()
+                self.cached_bytes = 0
+                return
+            self._drop(str(project_id))
+
+    def submit_write(self, project_id, operation, callback=None):
+        """Queue `operation(db)`, which changes project_id, on the storage thread."""
+        key = str(project_id)
+        with self._lock:
+            self._pending_writes[key] = self._pending_writes.get(key, 0) + 1
+
+        def write(db):
+            try:
+                return operation(db)
+            finally:
+                self.invalidate(key)
+                with self._lock:
+                    self._pending_writes[key] -= 1
+                    if not self._pending_writes[key]:
+                        del self._pending_writes[key]
+
+        return self.storage.submit(write, callback=callback)
+
+    def update_fields(self, project_id, fields, callback=None):
+        """$set of top-level fields (name, description, icon_path...)."""
+        object_id = as_object_id(project_id)
+        return self.submit_write(
+            project_id, lambda db: db.projects.update_one({"_id": object_id}, {"$set": fields}), callback)
+
+    def insert(self, document, callback=None):
+        """Insert a new project at the end of the list; the callback gets its id as a string."""
+        def insert(db):
+            document[RANK_FIELD] = next_rank(db.projects)
+            project_id = str(db.projects.insert_one(document).inserted_id)
+            self._store(project_id, document)
+            return project_id
+        return self.storage.submit(insert, callback=callback)
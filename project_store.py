@@ -0,0 +1,125 @@
+"""
+A project's key/value info, stored one record per key.
+
+Records live in the `project_info` collection:
+
+    {"project_id": str, "key": str, "value": str, "updated_at": float, "order": int}
+
+indexed on project_id (with key, where the engine has compound indexes) and
+on key, so a project document stays small and "which projects have key X"
+is an index lookup. `order` keeps the keys in the order they were added.
+
+The write functions run on the storage thread (see StorageService.submit and
+ProjectRepository.submit_write) and touch a single record.
+"""
+
+import time
+
+from bson.objectid import ObjectId
+
+from storage_worker import find_projected
+
+INFO_COLLECTION = "project_info"
+
+# Keys used to be stored as field names of the embedded `info` map, escaped
+_ESCAPES = (("%", "%25"), (".", "%2E"), ("$", "%24"))
+
+
+def as_object_id(project_id):
+    """
+    Mongita only matches string ids in find_one; update filters need the ObjectId.
+    """
+    if isinstance(project_id, str) and ObjectId.is_valid(project_id):
+        return ObjectId(project_id)
+    return project_id
+
+
+def unescape_info_key(key):
+    for char, escaped in reversed(_ESCAPES):
+        key = key.replace(escaped, char)
+    return key
+
+
+def unescape_info(info):
+    """Embedded info map of an older project document -> {key: value}."""
+    return {unescape_info_key(key): value for key, value in (info or {}).items()}
+
+
+def load_info(db, project_id):
+    """{key: value} of one project, in the order the keys were added."""
+    records = db[INFO_COLLECTION].find({"project_id": str(project_id)}, sort=[("order", 1)])
+    return {record["key"]: record.get("value", "") for record in records}
+
+
+def projects_with_info_key(db, key):
+    """Ids of the projects that have `key` in their info."""
+    return [record["project_id"] for record in db[INFO_COLLECTION].find({"key": key})]
+
+
+def _next_order(db, project_id):
+    last = db[INFO_COLLECTION].find_one({"project_id": project_id}, sort=[("order", -1)])
+    return last.get("order", 0) + 1 if last else 0
+
+
+def set_info_value(db, project_id, key, value):
+    """Returns True if the key was new to the project, False if its value was replaced."""
+    project_id = str(project_id)
+    result = db[INFO_COLLECTION].update_one(
+        {"project_id": project_id, "key": key},
+        {"$set": {"value": value, "updated_at": time.time()}})
+    if result.matched_count == 0:
+        db[INFO_COLLECTION].insert_one({
+            "project_id": project_id, "key": key, "value": value,
+            "updated_at": time.time(), "order": _next_order(db, project_id),
+        })
+        return True
+    return False
+
+
+def unset_info_key(db, project_id, key):
+    return db[INFO_COLLECTION].delete_one({"project_id": str(project_id), "key": key}).deleted_count > 0
+
+
+def rename_info_key(db, project_id, old_key, new_key, value):
+    """The record keeps its place in the order; a record already named new_key is replaced."""
+    project_id = str(project_id)
+    if old_key != new_key:
+        db[INFO_COLLECTION].delete_many({"project_id": project_id, "key": new_key})
+    result = db[INFO_COLLECTION].update_one(
+        {"project_id": project_id, "key": old_key},
+        {"$set": {"key": new_key, "value": value, "updated_at": time.time()}})
+    if result.matched_count == 0:
+        set_info_value(db, project_id, new_key, value)
+    return True
+
+
+def migrate_embedded_info(db):
+    """
+    Move the `info` map of older project documents into INFO_COLLECTION.
+    Every project that still has a non-empty map is migrated and its map
+    emptied once its records are written, so a run cut short is finished the
+    next time; keys that already have a record are not written twice.
+    Returns how many records were written.
+    """
+    moved = 0
+    now = time.time()
+    for project in list(find_projected(db.projects, None, ("info",))):
+        info = unescape_info(project.get("info"))
+        if not info:
+            continue
+        project_id = str(project["_id"])
+        existing = {record["key"]: record.get("order", 0)
+                    for record in db[INFO_COLLECTION].find({"project_id": project_id})}
+        first = max(existing.values()) + 1 if existing else 0
+        records = [
+            {"project_id": project_id, "key": key, "value": value, "updated_at": now, "order": first + order}
+            for order, (key, value) in enumerate(item for item in info.items() if item[0] not in existing)
+        ]
+        if records:
+            db[INFO_COLLECTION].insert_many(records)
+        # No $unset in Mongita; an empty map keeps the document small all the same
+        db.projects.update_one({"_id": as_object_id(project_id)}, {"$set": {"info": {}}})
+        moved += len(records)
+    if moved:
+        print(f"Storage: {moved} entradas de info movidas a '{INFO_COLLECTION}'.")
+    return moved
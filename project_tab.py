@@ -1,13 +1,15 @@
 import sys
 import os
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit, QTextEdit, QPushButton,
-                               QListWidgetItem, QHBoxLayout, QFileDialog, QTableWidget, QTableWidgetItem,
+                               QHBoxLayout, QFileDialog, QTableWidget, QTableWidgetItem,
                                QHeaderView, QCompleter, QApplication)
-from PySide6.QtCore import Slot, Qt
+from PySide6.QtCore import Slot, Qt, QModelIndex, QPersistentModelIndex
 import json
 from PySide6.QtGui import QIcon, QClipboard
 from bson.objectid import ObjectId
 from utils import get_resource_path
+from icon_cache import get_icon
+from project_store import set_info_value
 class ProjectTab(QWidget):
     def __init__(self, main_window):
         super().__init__()
@@ -85,38 +87,34 @@ class ProjectTab(QWidget):
         icon_path, _ = QFileDialog.getOpenFileName(self, "Select Icon", initial_dir, "Images (*.gif *.png *.ico *.webp)")
         
         if icon_path:
-            # 1. Intentar guardar en DB inmediatamente
+            # 1. Guardar en DB (en el hilo de storage)
             if hasattr(self.main_window, 'current_project_id') and self.main_window.current_project_id:
-                try:
-                    # Aseguramos que el ID sea un ObjectId para que la DB lo encuentre
-                    p_id = self.main_window.current_project_id
-                    if isinstance(p_id, str):
-                        p_id = ObjectId(p_id)
+                # Aseguramos que el ID sea un ObjectId para que la DB lo encuentre
+                p_id = self.main_window.current_project_id
+                if isinstance(p_id, str):
+                    p_id = ObjectId(p_id)
+                project_name = self.name_input.text()
+                repository = self.main_window.project_repository
 
+                def save_icon(db):
                     # Intentamos la actualización
-                    result = self.main_window.db.projects.update_one(
+                    result = db.projects.update_one(
                         {"_id": p_id},
                         {"$set": {"icon_path": icon_path}}
                     )
 
                     # Si no se modificó nada por ID, intentamos por Nombre (Plan B)
                     if result.modified_count == 0:
-                        self.main_window.db.projects.update_one(
-                            {"name": self.name_input.text()},
+                        db.projects.update_one(
+                            {"name": project_name},
                             {"$set": {"icon_path": icon_path}}
                         )
-                    
+                        repository.invalidate()  # no idea which cached project that was
                     print(f"DEBUG: Icono guardado físicamente en DB: {icon_path}")
-                except Exception as e:
-                    print(f"DEBUG ERROR al guardar icono: {e}")
+
+                repository.submit_write(p_id, save_icon)
 
             # 2. Actualizar visualmente la lista (sidebar)
-            if self.main_window.current_project_item:
-                self.main_window.current_project_item.setIcon(QIcon(icon_path))
-                # Guardamos la ruta en el item para que persista en la sesión
-                self.main_window.current_project_item.setData(Qt.UserRole + 1, icon_path)
-            
-            # 3. Refrescar el icono en el resto de la interfaz
             self.main_window.update_project_icon(self.name_input.text(), icon_path)
 
     @Slot()
@@ -127,43 +125,44 @@ class ProjectTab(QWidget):
         if not project_name or not project_description:
             return
 
-        projects_collection = self.main_window.db.projects
-
         # Caso: Proyecto Nuevo
         if self.main_window.current_project_item is None:
             default_path = "assets/project_images/default_icon.png"
             project_doc = {
                 "name": project_name,
                 "description": project_description,
-                "info": {}, 
                 "icon_path": default_path 
             }
-            result = projects_collection.insert_one(project_doc)
-            self.main_window.current_project_id = result.inserted_id
-            
-            # Crear item en lista
-            new_item = QListWidgetItem(f"{project_name}: {project_description[:8]}...")
-            new_item.setIcon(QIcon(default_path))
-            new_item.setData(Qt.UserRole, self.main_window.current_project_id)
-            new_item.setData(Qt.UserRole + 1, default_path)
-            self.main_window.project_list_widget.addItem(new_item)
-            self.main_window.current_project_item = new_item
-            print("DEBUG: Nuevo proyecto creado.")
+
+            def on_inserted(project_id):
+                self.main_window.current_project_id = project_id
+                # Crear fila en la lista
+                new_index = self.main_window.project_model.append_project(
+                    project_id, project_name, project_description, default_path, project_doc.get("rank")
+                )
+                self.main_window.current_project_item = QPersistentModelIndex(new_index)
+                self.main_window.global_search.update_project(project_id, project_name, project_description, {})
+                print("DEBUG: Nuevo proyecto creado.")
+
+            self.main_window.project_repository.insert(project_doc, callback=on_inserted)
 
         # Caso: Proyecto Existente
         else:
             # IMPORTANTE: Aquí NO incluimos icon_path para que sea INDEPENDIENTE
-            projects_collection.update_one(
-                {"_id": self.main_window.current_project_id},
-                {"$set": {
-                    "name": project_name,
-                    "description": project_description,
-                    "info": self.main_window.current_project_info
-                }}
-            )
+            # info se guarda clave a clave (project_store), aquí solo nombre y descripción
+            self.main_window.project_repository.update_fields(self.main_window.current_project_id, {
+                "name": project_name,
+                "description": project_description
+            })
             
+            self.main_window.current_project_name = project_name
+            self.main_window.current_project_description = project_description
+            self.main_window.reindex_current_project()
+
             # Actualizar solo el texto del item
-            self.main_window.current_project_item.setText(f"{project_name}: {project_description[:8]}...")
+            self.main_window.project_model.update_project(
+                QModelIndex(self.main_window.current_project_item), project_name, project_description
+            )
             print(f"DEBUG: Texto del proyecto {self.main_window.current_project_id} actualizado.")
 
         self.name_input.setReadOnly(True)
@@ -183,19 +182,13 @@ class ProjectTab(QWidget):
             # 2. Guardar en la base de datos
             if self.main_window.current_project_id:
                 p_id = self.main_window.current_project_id
-                if isinstance(p_id, str):
-                    try:
-                        p_id = ObjectId(p_id)
-                    except:
-                        pass
-                
-                self.main_window.db.projects.update_one(
-                    {"_id": p_id},
-                    {"$set": {"info": self.main_window.current_project_info}}
-                )
+                self.main_window.project_repository.submit_write(
+                    p_id, lambda db: set_info_value(db, p_id, name, value))
+                self.main_window.reindex_current_project()
             
-            if hasattr(self.main_window, 'project_info_tab'):
-                self.main_window.project_info_tab.update_project_info(
+            project_info_tab = self.main_window.tabs.created_tab("info")
+            if project_info_tab:
+                project_info_tab.update_project_info(
                     self.main_window.current_project_name,
                     self.main_window.current_project_description,
                     self.main_window.current_project_info
@@ -228,7 +221,7 @@ class ProjectTab(QWidget):
         self.additional_info_table.setItem(row_position, 0, QTableWidgetItem(key))
         self.additional_info_table.setItem(row_position, 1, QTableWidgetItem(value))
         copy_button = QPushButton()
-        copy_button.setIcon(QIcon(get_resource_path("assets/icons/icon_copy.png")))
+        copy_button.setIcon(get_icon(get_resource_path("assets/icons/icon_copy.png")))
         copy_button.setMaximumSize(24, 24)
         copy_button.clicked.connect(lambda: self.copy_to_clipboard(value))
         self.additional_info_table.setCellWidget(row_position, 2, copy_button)
@@ -10,14 +10,25 @@ from bson.objectid import ObjectId
 # MAU imports
 from todo_text_editor import TodoTextEditor
 from emoji_picker import EmojiPicker
+from write_buffer import WriteBehindBuffer
+from rank import RANK_FIELD, find_ranked, next_rank, rank_between, spread_ranks
+
+# Rank of the todo of a list item, see rank.py
+RANK_ROLE = Qt.UserRole + 1
 
 class ProjectTodoTab(QWidget):
     def __init__(self, main_window, project_id):
         super().__init__()
         self.main_window = main_window
         self.project_id = project_id
-        self.todos_collection = self.main_window.db.todos
+        self.storage = self.main_window.storage
         self.current_todo_id = None
+        # Todo whose document is being read on the storage thread
+        self.loading_todo_id = None
+        # The editor has changes that have not been handed to write_buffer yet
+        self.todo_dirty = False
+        self.write_buffer = WriteBehindBuffer(self.storage, "todos", parent=self)
+        self.storage.about_to_stop.connect(self.flush_pending_writes)
 
         self.init_ui()
         self.load_todos()
@@ -35,6 +46,8 @@ class ProjectTodoTab(QWidget):
         self.todo_list_widget = QListWidget()
         self.todo_list_widget.setDragDropMode(QAbstractItemView.InternalMove)
         self.todo_list_widget.itemClicked.connect(self.select_todo_item)
+        # A drop moves the row in the model; only the moved todo's rank is written
+        self.todo_list_widget.model().rowsMoved.connect(self.on_todos_moved)
         
         self.add_button = QPushButton("➕ New TODO")
         self.add_button.clicked.connect(self.create_new_todo)
@@ -108,31 +121,52 @@ class ProjectTodoTab(QWidget):
         )
 
         if reply == QMessageBox.Yes:
-            self.todos_collection.delete_one({"_id": ObjectId(self.current_todo_id)})
+            self.write_buffer.forget(self.current_todo_id)
+            self.main_window.global_search.remove_todo(self.current_todo_id)
+            todo_id = ObjectId(self.current_todo_id)
+            self.storage.submit(lambda db: db.todos.delete_one({"_id": todo_id}))
             
             # Clean vars
             self.current_todo_id = None
+            self.todo_dirty = False
             self.title_input.clear()
             self.text_editor.clear()
             
             self.load_todos()
 
-    def load_todos(self):
+    def load_todos(self, select_todo_id=None):
+        # Pending titles have to reach the database before the list is read back
+        self.write_buffer.flush()
+        project_id = str(self.project_id)
+        self.storage.submit(
+            lambda db: find_ranked(db, "todos", {"project_id": project_id}),
+            callback=lambda todos: self.on_todos_loaded(project_id, todos, select_todo_id)
+        )
+
+    def on_todos_loaded(self, project_id, todos, select_todo_id=None):
+        if project_id != str(self.project_id):
+            return  # the project changed while the todos were loading
+
         self.title_input.blockSignals(True)
         self.text_editor.blockSignals(True)
         self.todo_list_widget.clear()
         
-        todos = self.todos_collection.find({"project_id": str(self.project_id)})
         for todo in todos:
             item = QListWidgetItem(todo["title"])
             item.setData(Qt.UserRole, str(todo["_id"]))
+            item.setData(RANK_ROLE, todo.get(RANK_FIELD))
             self.todo_list_widget.addItem(item)
         
         self.title_input.blockSignals(False)
         self.text_editor.blockSignals(False)
 
         if self.todo_list_widget.count() > 0:
-            self.todo_list_widget.setCurrentRow(0)
+            row = 0
+            for i in range(self.todo_list_widget.count()):
+                if self.todo_list_widget.item(i).data(Qt.UserRole) == select_todo_id:
+                    row = i
+                    break
+            self.todo_list_widget.setCurrentRow(row)
             self.select_todo_item(self.todo_list_widget.currentItem())
         else:
             self.current_todo_id = None
@@ -144,20 +178,66 @@ class ProjectTodoTab(QWidget):
             "content": "☐ My first task",
             "project_id": str(self.project_id)
         }
-        res = self.todos_collection.insert_one(new_todo)
-        self.load_todos()
-        
-        for i in range(self.todo_list_widget.count()):
-            if self.todo_list_widget.item(i).data(Qt.UserRole) == str(res.inserted_id):
-                self.todo_list_widget.setCurrentRow(i)
-                self.select_todo_item(self.todo_list_widget.item(i))
-                break
+
+        def insert(db):
+            new_todo[RANK_FIELD] = next_rank(db.todos, {"project_id": new_todo["project_id"]})
+            return str(db.todos.insert_one(new_todo).inserted_id)
+
+        self.storage.submit(insert, callback=lambda todo_id: self.on_todo_created(todo_id, new_todo))
+
+    def on_todo_created(self, todo_id, todo):
+        self.main_window.global_search.update_todo(todo_id, todo["project_id"], todo["title"], todo["content"])
+        self.load_todos(select_todo_id=todo_id)
+
+    def on_todos_moved(self, parent, start, end, destination, row):
+        count = end - start + 1
+        first = row if row < start else row - count
+        before = self.todo_list_widget.item(first - 1) if first > 0 else None
+        after = self.todo_list_widget.item(first + count)
+        rank = before.data(RANK_ROLE) if before else None
+        upper = after.data(RANK_ROLE) if after else None
+        ranks = []
+        try:
+            for _ in range(count):
+                rank = rank_between(rank, upper)
+                ranks.append(rank)
+        except ValueError:
+            self.rerank_todos()
+            return
+        for offset, rank in enumerate(ranks):
+            self.write_rank(self.todo_list_widget.item(first + offset), rank)
+
+    def rerank_todos(self):
+        """Renumber the whole list; only needed if two ranks ever collide."""
+        ranks = spread_ranks(self.todo_list_widget.count())
+        for row, rank in enumerate(ranks):
+            self.write_rank(self.todo_list_widget.item(row), rank)
+
+    def write_rank(self, item, rank):
+        item.setData(RANK_ROLE, rank)
+        todo_id = ObjectId(item.data(Qt.UserRole))
+        self.storage.submit(lambda db: db.todos.update_one({"_id": todo_id}, {"$set": {RANK_FIELD: rank}}))
 
     def select_todo_item(self, item):
         if not item: return
         self.save_current_todo()
-        self.current_todo_id = item.data(Qt.UserRole)
-        data = self.todos_collection.find_one({"_id": ObjectId(self.current_todo_id)})
+        # Until the document arrives there is no current todo, so edits are not saved over another one
+        self.current_todo_id = None
+        todo_id = item.data(Qt.UserRole)
+        self.loading_todo_id = todo_id
+        self.write_buffer.flush()
+        self.storage.submit(
+            lambda db: db.todos.find_one({"_id": ObjectId(todo_id)}),
+            callback=lambda data: self.on_todo_loaded(todo_id, data)
+        )
+
+    def on_todo_loaded(self, todo_id, data):
+        if todo_id != self.loading_todo_id:
+            return
+        self.loading_todo_id = None
+        self.current_todo_id = todo_id
+        
+        self.todo_dirty = False
         
         if data:
             self.title_input.blockSignals(True)
@@ -167,6 +247,8 @@ class ProjectTodoTab(QWidget):
             self.text_editor.setMarkdown(data.get("content", ""))
             self.title_input.blockSignals(False)
             self.text_editor.blockSignals(False)
+            self.write_buffer.remember(todo_id, self.todo_fields(data.get("title", ""),
+                                                                 data.get("content", "")))
 
     def insert_checkbox_at_cursor(self):
         cursor = self.text_editor.textCursor()
@@ -177,36 +259,55 @@ class ProjectTodoTab(QWidget):
 
     def start_save_timer(self):
         if self.current_todo_id:
+            self.todo_dirty = True
             self.save_timer.start()
 
+    def todo_fields(self, title, content):
+        return {
+            "title": title,
+            "content": content,
+            "project_id": str(self.project_id) # Aseguramos consistencia
+        }
+
     def save_current_todo(self):
-            if not self.current_todo_id: return
-            self.save_timer.stop()
-            
-            title = self.title_input.text()
-            # toPlainText() captura todos los caracteres Unicode (incluyendo ☐ y ☑)
-            #content = self.text_editor.toPlainText()
-            content = self.text_editor.toMarkdown()
-            
+        """
+        Hand the editor to the write-behind buffer. Nothing is serialized
+        unless it was edited, and the buffer skips contents already saved.
+        """
+        self.save_timer.stop()
+        if not self.current_todo_id or not self.todo_dirty:
+            return
+        self.todo_dirty = False
 
-            self.todos_collection.update_one(
-                {"_id": ObjectId(self.current_todo_id)},
-                {"$set": {
-                    "title": title, 
-                    "content": content,
-                    "project_id": str(self.project_id) # Aseguramos consistencia
-                }}
-            )
-            
-            curr = self.todo_list_widget.currentItem()
-            if curr: curr.setText(title)
+        title = self.title_input.text()
+        # toPlainText() captura todos los caracteres Unicode (incluyendo ☐ y ☑)
+        #content = self.text_editor.toPlainText()
+        content = self.text_editor.toMarkdown()
+        if not self.write_buffer.stage(self.current_todo_id, self.todo_fields(title, content)):
+            return
+        self.main_window.global_search.update_todo(self.current_todo_id, str(self.project_id), title, content)
 
-    def update_project_id(self, new_project_id):
-        if self.current_todo_id:
-            self.save_current_todo()
+        for i in range(self.todo_list_widget.count()):
+            item = self.todo_list_widget.item(i)
+            if item.data(Qt.UserRole) == self.current_todo_id:
+                item.setText(title)
+                break
+
+    def flush_pending_writes(self):
+        self.save_current_todo()
+        self.write_buffer.flush()
+
+    def update_project_id(self, new_project_id, todos=None):
+        """`todos` are the project's todos when the caller already read them (see ProjectLoader)."""
+        self.save_current_todo()
         self.project_id = new_project_id
         self.current_todo_id = None 
-        self.load_todos()
+        self.todo_dirty = False
+        self.loading_todo_id = None
+        if todos is None:
+            self.load_todos()
+        else:
+            self.on_todos_loaded(str(new_project_id), todos)
     
     def open_emoji_picker(self):
         dialog = EmojiPicker(self)
@@ -0,0 +1,140 @@
+"""
+Manual ordering of todos and projects with fractional rank keys.
+
+Each document has a "rank": a string of base-62 digits read as a fraction
+(0.d1d2...), compared as plain strings by Python, Mongita and SQLite alike.
+There is always room between two ranks, so moving an item writes only its
+own rank (rank_between its new neighbours) instead of renumbering the list.
+Appending bumps the last digit of a fixed-width key, which keeps ranks short
+when items are always added at the end.
+
+Documents written before ranks existed get them (rank_documents,
+rank_collection) the first time their list is read.
+"""
+
+from storage_worker import find_projected, find_summaries
+
+RANK_FIELD = "rank"
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+WIDTH = 4
+_VALUE = {digit: value for value, digit in enumerate(DIGITS)}
+
+
+def _midpoint(low, high):
+    """A key strictly between low ("" = 0) and high (None = 1); neither ends in "0"."""
+    if high is not None:
+        common = 0
+        while common < len(high) and (low[common] if common < len(low) else "0") == high[common]:
+            common += 1
+        if common:
+            return high[:common] + _midpoint(low[common:], high[common:])
+    low_digit = _VALUE[low[0]] if low else 0
+    high_digit = _VALUE[high[0]] if high is not None else BASE
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit + 1) // 2]
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def _step(rank, delta):
+    """rank +/- one unit in the last of WIDTH digits, or None when that over/underflows."""
+    digits = [_VALUE[digit] for digit in rank.ljust(max(WIDTH, len(rank)), "0")]
+    position = len(digits) - 1
+    while position >= 0:
+        digits[position] += delta
+        if 0 <= digits[position] < BASE:
+            break
+        digits[position] %= BASE
+        position -= 1
+    if position < 0:
+        return None
+    stepped = "".join(DIGITS[value] for value in digits).rstrip("0")
+    return stepped or None
+
+
+def rank_between(before=None, after=None):
+    """A rank that sorts after `before` and before `after`; None means that end is open."""
+    if before is not None and after is not None:
+        if before >= after:
+            raise ValueError(f"Rangos desordenados: {before!r} >= {after!r}")
+        return _midpoint(before, after)
+    if before is not None:
+        return _step(before, 1) or before + _midpoint("", None)
+    if after is not None:
+        return _step(after, -1) or _midpoint("", after)
+    return _midpoint("", None)
+
+
+def spread_ranks(count):
+    """`count` increasing ranks spaced evenly over the whole range."""
+    width = WIDTH
+    while BASE ** width <= count:
+        width += 1
+    ranks = []
+    for i in range(1, count + 1):
+        value = i * BASE ** width // (count + 1)
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        ranks.append("".join(reversed(digits)).rstrip("0"))
+    return ranks
+
+
+def last_rank(collection, filter=None):
+    """Highest rank among the documents matching `filter`, or None. Storage thread."""
+    last = collection.find_one(filter or {}, sort=[(RANK_FIELD, -1)])
+    return last.get(RANK_FIELD) if last else None
+
+
+def next_rank(collection, filter=None):
+    """Rank that puts a new document at the end of its list. Storage thread."""
+    return rank_between(last_rank(collection, filter), None)
+
+
+def rank_documents(collection, documents):
+    """
+    `documents` (already sorted by rank, so the unranked ones come first)
+    in list order, after writing a rank for those that had none: they go
+    after the ranked ones in the order they were created (ObjectIds start
+    with their creation time). Storage thread.
+    """
+    ranked = [document for document in documents if document.get(RANK_FIELD) is not None]
+    unranked = [document for document in documents if document.get(RANK_FIELD) is None]
+    if not unranked:
+        return documents
+    unranked.sort(key=lambda document: str(document["_id"]))
+    if ranked:
+        rank = ranked[-1][RANK_FIELD]
+        ranks = []
+        for _ in unranked:
+            rank = rank_between(rank, None)
+            ranks.append(rank)
+    else:
+        ranks = spread_ranks(len(unranked))
+    for document, rank in zip(unranked, ranks):
+        document[RANK_FIELD] = rank
+        collection.update_one({"_id": document["_id"]}, {"$set": {RANK_FIELD: rank}})
+    return ranked + unranked
+
+
+def find_ranked(db, collection_name, filter=None):
+    """find_summaries in list order; documents without a rank get one. Storage thread."""
+    documents = list(find_summaries(db, collection_name, filter, sort=[(RANK_FIELD, 1)]))
+    return rank_documents(db[collection_name], documents)
+
+
+def rank_collection(collection):
+    """
+    Give every document of `collection` a rank if some have none; a cheap
+    check when they all do. Returns how many were ranked. Storage thread.
+    """
+    first = collection.find_one({}, sort=[(RANK_FIELD, 1)])
+    if first is None or first.get(RANK_FIELD) is not None:
+        return 0
+    documents = list(find_projected(collection, None, (RANK_FIELD,), sort=[(RANK_FIELD, 1)]))
+    before = sum(1 for document in documents if document.get(RANK_FIELD) is None)
+    rank_documents(collection, documents)
+    return before
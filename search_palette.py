@@ -0,0 +1,95 @@
+import time
+
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel
+from PySide6.QtCore import Qt, QTimer, QEvent, Signal
+
+from global_search import snippet
+
+KIND_ICONS = {"project": "📁", "todo": "☑", "note": "📄"}
+
+
+class SearchPalette(QDialog):
+    """Ctrl+K palette that searches every project, todo and note at once."""
+
+    result_activated = Signal(object, str)
+
+    def __init__(self, global_search, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Search everywhere")
+        self.resize(560, 420)
+        self.global_search = global_search
+
+        layout = QVBoxLayout(self)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔍 Search projects, info, todos and notes...")
+        self.search_input.installEventFilter(self)
+        self.search_input.returnPressed.connect(self.activate_current)
+        layout.addWidget(self.search_input)
+
+        self.results_list = QListWidget()
+        self.results_list.setWordWrap(True)
+        self.results_list.itemActivated.connect(self.activate_item)
+        layout.addWidget(self.results_list)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(100)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_input.textChanged.connect(self.search_timer.start)
+
+        self.global_search.ready.connect(self.run_search)
+
+    def open(self):
+        self.global_search.ensure_index()
+        if not self.global_search.is_ready():
+            self.status_label.setText("Indexing...")
+        self.search_input.selectAll()
+        self.search_input.setFocus()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def run_search(self):
+        self.search_timer.stop()
+        query = self.search_input.text()
+        self.results_list.clear()
+        if not self.global_search.is_ready():
+            return
+        start = time.perf_counter()
+        results = self.global_search.search(query)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        index = self.global_search.index
+        for document in results:
+            title = f"{KIND_ICONS.get(document.kind, '')} {document.title}"
+            if document.kind != "project":
+                title += f"  ·  {index.project_title(document.project_id)}"
+            item = QListWidgetItem(f"{title}\n    {snippet(document.text, query)}")
+            item.setData(Qt.UserRole, document)
+            self.results_list.addItem(item)
+        if results:
+            self.results_list.setCurrentRow(0)
+        self.status_label.setText(f"{len(results)} results in {elapsed:.1f} ms" if query.strip() else "")
+
+    def eventFilter(self, obj, event):
+        # Arrow keys move through the results without leaving the search box
+        if obj is self.search_input and event.type() == QEvent.KeyPress \
+                and event.key() in (Qt.Key_Up, Qt.Key_Down, Qt.Key_PageUp, Qt.Key_PageDown):
+            self.results_list.keyPressEvent(event)
+            return True
+        return super().eventFilter(obj, event)
+
+    def activate_current(self):
+        if self.search_timer.isActive():
+            self.run_search()
+        item = self.results_list.currentItem()
+        if item:
+            self.activate_item(item)
+
+    def activate_item(self, item):
+        self.result_activated.emit(item.data(Qt.UserRole), self.search_input.text())
+        self.hide()
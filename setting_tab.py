@@ -1,12 +1,14 @@
 # pyside imports
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, 
-                               QFileDialog, QTextEdit, QGroupBox, QCheckBox)
+                               QFileDialog, QTextEdit, QGroupBox, QCheckBox, QProgressBar)
 from PySide6.QtCore import Slot, QTimer, Qt
 from pacmanprogress import Pacman
+from utils import get_qss_path
+from data_archive import ArchiveJob
 from PySide6.QtWidgets import QMessageBox
 from PySide6.QtCore import QThread, Signal
 # Other imports
-import os, json, sys, shutil
+import os, json, sys, time
 import urllib.request
 
 REPO_VERSION_URL = "https://raw.githubusercontent.com/l337quez/GNU-MAU/main/version.txt"
@@ -85,18 +87,34 @@ class SettingTab(QWidget):
         sidebar_group.setLayout(sidebar_layout)
         self.info_layout.addWidget(sidebar_group)
 
-        db_group = QGroupBox("Restore Database")
+        db_group = QGroupBox("Data")
         db_group_layout = QHBoxLayout() 
 
-        self.load_config_db_btn = QPushButton("Load config and apply changes")
-        self.load_config_db_btn.setFixedWidth(200) 
-        self.load_config_db_btn.clicked.connect(self.copy_files)
-        db_group_layout.addWidget(self.load_config_db_btn)
+        self.export_data_btn = QPushButton("Export data...")
+        self.export_data_btn.setFixedWidth(140) 
+        self.export_data_btn.clicked.connect(self.export_data)
+        db_group_layout.addWidget(self.export_data_btn)
+
+        self.import_data_btn = QPushButton("Import data...")
+        self.import_data_btn.setFixedWidth(140) 
+        self.import_data_btn.clicked.connect(self.import_data)
+        db_group_layout.addWidget(self.import_data_btn)
+
+        self.archive_progress = QProgressBar()
+        self.archive_progress.setVisible(False)
+        db_group_layout.addWidget(self.archive_progress)
         db_group_layout.addStretch()
 
         db_group.setLayout(db_group_layout)
         self.info_layout.addWidget(db_group)
 
+        # Export/import run on the storage thread, the window stays usable meanwhile
+        self.archive_job = ArchiveJob(self.main_window.storage, self.main_window.storage_dir, self)
+        self.archive_job.progress.connect(self.on_archive_progress)
+        self.archive_job.finished.connect(self.on_archive_finished)
+        self.archive_job.failed.connect(self.on_archive_failed)
+        self.archive_import = False
+
         self.animate_button = QPushButton("Animation Start")
         self.animate_button.setFixedWidth(140) 
         self.animate_button.clicked.connect(self.start_animation)
@@ -118,23 +136,15 @@ class SettingTab(QWidget):
 
         self.setLayout(self.info_layout)
 
-        # Load config from JSON file
-        config = self.load_config()
+        # MainWindow already loaded the config and applied the theme at startup
+        config = self.main_window.config
         self.dark_mode = config.get("dark_mode", False)
 
         tray_setting = config.get("minimize_to_tray", True)
+        self.tray_checkbox.blockSignals(True)
         self.tray_checkbox.setChecked(tray_setting)
-        if self.dark_mode:
-            qss_file = self.get_qss_path()
-            try:
-                with open(qss_file, "r") as file:
-                    self.main_window.setStyleSheet(file.read())
-                self.theme_label.setText("Dark Theme")
-            except FileNotFoundError:
-                pass 
-        else:
-            self.main_window.setStyleSheet("")
-            self.theme_label.setText("Light Theme")
+        self.tray_checkbox.blockSignals(False)
+        self.theme_label.setText("Dark Theme" if self.dark_mode else "Light Theme")
 
     def get_config_path(self):
         config_dir = os.path.join(os.path.expanduser("~"), ".myapp")
@@ -156,6 +166,9 @@ class SettingTab(QWidget):
         with open(config_path, "w") as f:
             json.dump(config, f, indent=4)
 
+        # Keep MainWindow's copy in sync, it rewrites this file when the sidebar moves
+        self.main_window.config.update(updated_data)
+
     def load_config(self):
         config_path = self.get_config_path()
         if os.path.exists(config_path):
@@ -164,13 +177,7 @@ class SettingTab(QWidget):
         return {}
 
     def get_qss_path(self):
-        if getattr(sys, 'frozen', False):
-            # Estamos empaquetados con PyInstaller
-            base_path = sys._MEIPASS
-        else:
-            # Estamos en modo de desarrollo
-            base_path = os.path.dirname(__file__)
-        return os.path.join(base_path, "dark_theme.qss")
+        return get_qss_path()
 
     @Slot()
     def toggle_theme(self):
@@ -205,153 +212,96 @@ class SettingTab(QWidget):
 
 
 
+    def flush_unsaved_data(self):
+        """Write pending todo edits and the open note so the archive sees them."""
+        todo_tab = self.main_window.tabs.created_tab("todo")
+        if todo_tab:
+            todo_tab.flush_pending_writes()
+        note_tab = self.main_window.tabs.created_tab("note")
+        if note_tab:
+            note_tab.save_current_note()
+        # Notes are written on their own thread; the archive job runs on the database one
+        self.main_window.note_storage.flush()
+
+    def set_archive_running(self, running):
+        self.export_data_btn.setEnabled(not running)
+        self.import_data_btn.setEnabled(not running)
+        self.archive_progress.setVisible(running)
+        if running:
+            self.archive_progress.setRange(0, 0)
+
     @Slot()
-    def copy_files(self):
-        """
-        Copy storage and mongita_data using an external process 
-        to bypass Windows file locking.
-        """
-        source_dir = QFileDialog.getExistingDirectory(self, "Seleccionar carpeta _internal de origen")
-        
-        if not source_dir:
+    def export_data(self):
+        """Save every project, info, todo and note to a zip that any GNU Mau can import."""
+        default_name = os.path.join(os.path.expanduser("~"), time.strftime("gnu-mau-%Y%m%d.zip"))
+        path, _ = QFileDialog.getSaveFileName(self, "Export data", default_name, "Zip archive (*.zip)")
+        if not path:
             return
+        if not path.lower().endswith(".zip"):
+            path += ".zip"
+        self.flush_unsaved_data()
+        self.archive_import = False
+        self.set_archive_running(True)
+        self.status_text.append(f"Exporting to {path}...")
+        self.archive_job.export_to(path)
 
-        if os.path.basename(source_dir) != "_internal":
-            QMessageBox.warning(self, "Incorrect folder", 
-                                "You must specifically select the folder named '_internal'.")
+    @Slot()
+    def import_data(self):
+        """Load an exported zip, merged into the current data or replacing it."""
+        path, _ = QFileDialog.getOpenFileName(self, "Import data", os.path.expanduser("~"), "Zip archive (*.zip)")
+        if not path:
             return
 
-        if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
-            exe_path = sys.executable
-        else:
-            base_path = os.path.dirname(os.path.abspath(__file__))
-            exe_path = sys.argv[0]
-
-        dest_internal = os.path.join(base_path, "_internal")
-
-        # 1. Crear el script de reemplazo (Batch script)
-        # Este script esperará a que el programa se cierre, borrará y copiará.
-        batch_path = os.path.join(base_path, "update_data.bat")
-        
-        storage_src = os.path.join(source_dir, "storage")
-        storage_dest = os.path.join(dest_internal, "storage")
-        mongita_src = os.path.join(source_dir, "mongita_data")
-        mongita_dest = os.path.join(dest_internal, "mongita_data")
-
-        # Script compatible with Windows cmd
-        batch_content = f"""
-        @echo off
-        timeout /t 2 /nobreak > nul
-        if exist "{storage_dest}" rd /s /q "{storage_dest}"
-        if exist "{mongita_dest}" rd /s /q "{mongita_dest}"
-        if exist "{storage_src}" xcopy "{storage_src}" "{storage_dest}" /e /i /y
-        if exist "{mongita_src}" xcopy "{mongita_src}" "{mongita_dest}" /e /i /y
-        start "" "{exe_path}"
-        del "%~f0"
-        """
-        try:
-            with open(batch_path, "w") as f:
-                f.write(batch_content)
-
-            self.status_text.append("Preparing update files...")
-            
-            QMessageBox.information(
-                self,
-                "Update Ready",
-                "The application will close to update the data and will restart automatically."
-            )
-
-            # 2. Ejecutar el script de forma independiente
-            import subprocess
-            subprocess.Popen([batch_path], shell=True, creationflags=subprocess.CREATE_NEW_CONSOLE)
-            
-            # 3. Cerrar la aplicación inmediatamente para liberar los archivos
-            sys.exit(0)
-
-        except Exception as e:
-            error_msg = f"Error in copy_files: {str(e)}"
-            self.status_text.append(error_msg)
-            QMessageBox.critical(self, "Error", f"Failed to prepare update: {e}")
-
-        """
-        Copy storage and mongita_data from selected _internal folder 
-        to the program's own _internal folder.
-        """
-        source_dir = QFileDialog.getExistingDirectory(self, "Seleccionar carpeta _internal de origen")
-        
-        if not source_dir:
+        box = QMessageBox(self)
+        box.setWindowTitle("Import data")
+        box.setText("How should the archive be imported?")
+        box.setInformativeText("Merge keeps your projects and adds or updates the ones in the archive.\n"
+                               "Replace deletes all current projects, todos and notes first.")
+        merge_btn = box.addButton("Merge", QMessageBox.AcceptRole)
+        replace_btn = box.addButton("Replace", QMessageBox.DestructiveRole)
+        box.addButton(QMessageBox.Cancel)
+        box.setDefaultButton(merge_btn)
+        box.exec()
+        if box.clickedButton() not in (merge_btn, replace_btn):
             return
-
-        if os.path.basename(source_dir) != "_internal":
-            QMessageBox.warning(self, "Incorrect folder", 
-                                "You must specifically select the folder named '_internal'.")
+        replace = box.clickedButton() is replace_btn
+        if replace and QMessageBox.question(
+                self, "Replace data",
+                "All current projects, todos and notes will be deleted. Continue?") != QMessageBox.Yes:
             return
 
-        if getattr(sys, 'frozen', False):
-            base_path = os.path.dirname(sys.executable)
+        self.flush_unsaved_data()
+        self.archive_import = True
+        self.set_archive_running(True)
+        self.status_text.append(f"Importing {path} ({'replace' if replace else 'merge'})...")
+        self.archive_job.import_from(path, replace)
+
+    @Slot(int, int)
+    def on_archive_progress(self, done, total):
+        self.archive_progress.setRange(0, max(total, 1))
+        self.archive_progress.setValue(done)
+
+    @Slot(object)
+    def on_archive_finished(self, summary):
+        self.set_archive_running(False)
+        if self.archive_import:
+            self.status_text.append(
+                f"Import completed: {summary['added']} added, {summary['updated']} updated, "
+                f"{summary['notes']} notes" + (f", {summary['skipped']} skipped." if summary["skipped"] else "."))
+            self.main_window.on_data_imported(summary)
         else:
-            base_path = os.path.dirname(os.path.abspath(__file__))
-
-        dest_internal = os.path.join(base_path, "_internal")
-
-        if not os.path.exists(dest_internal):
-            self.status_text.append(f"Error: Destination folder not found: {dest_internal}")
-            QMessageBox.critical(self, "Destination Error", 
-                                 "The '_internal' folder was not found in the program directory.")
-            return
+            self.status_text.append(
+                f"Export completed: {summary['projects']} projects, {summary['todos']} todos, "
+                f"{summary['notes']} notes.")
 
-        folders_to_copy = ["storage", "mongita_data"]
-
-        try:
-            # 1. Force Disconnect and release file handles
-            import gc
-            import time
-
-            if hasattr(self.main_window, 'db_client') and self.main_window.db_client:
-                self.main_window.db_client.close()
-                self.main_window.db_client = None
-            
-            if hasattr(self.main_window, 'db'):
-                self.main_window.db = None
-            
-            # Explicitly clear references and collect garbage
-            gc.collect()
-            time.sleep(1.0) 
-
-            self.status_text.append(f"Starting copy to: {dest_internal}")
-
-            for folder in folders_to_copy:
-                s = os.path.join(source_dir, folder)    
-                d = os.path.join(dest_internal, folder) 
-                
-                if os.path.exists(s):
-                    self.status_text.append(f"Copiando {folder}...")
-                    
-                    if os.path.exists(d):
-                        # Retry logic for rmtree
-                        for i in range(3):
-                            try:
-                                shutil.rmtree(d)
-                                break
-                            except OSError:
-                                if i == 2: raise
-                                time.sleep(1)
-
-                    shutil.copytree(s, d)
-                else:
-                    self.status_text.append(f"Warning: '{folder}' not found in source.")
-
-            self.status_text.append("Data copy completed!")
-            QMessageBox.information(self, "Success", "Data updated. The application will close to apply changes.")
-            
-            # Force exit to ensure no corrupted sessions
-            sys.exit(0)
-            
-        except Exception as e:
-            error_msg = f"Error in copy_files: {str(e)}"
-            self.status_text.append(error_msg)
-            QMessageBox.critical(self, "Error", f"Failed to copy files: {e}")
+    @Slot(str)
+    def on_archive_failed(self, message):
+        self.set_archive_running(False)
+        self.status_text.append(f"Error: {message}")
+        QMessageBox.critical(self, "Error", message)
+        if self.archive_import:
+            # A failed import may have written part of the archive
+            self.main_window.on_data_imported(None)
 
     @Slot()
     def start_animation(self):
@@ -0,0 +1,326 @@
+"""
+SQLite storage engine with the subset of the Mongita/PyMongo API the app uses.
+
+Every collection is a table (id TEXT PRIMARY KEY, doc TEXT) holding the
+document as JSON; create_index() adds an expression index on
+json_extract(doc, field), which SQLite uses for the equality filters the app
+runs ({"project_id": ...}, {"name": ...}) and the rank ranges of the sidebar
+pages. The database is in WAL mode so
+readers never wait for the writer. Each write runs in its own transaction
+(insert_many in one), and every statement is parameterised so sqlite3's
+statement cache reuses it.
+
+Supported: find/find_one with equality and $gt/$gte/$lt/$lte filters, sort,
+limit and skip,
+insert_one/insert_many, update_one/update_many with $set (dotted paths),
+delete_one/delete_many, count_documents, create_index (compound too),
+index_information.
+Like the Mongita client, a SQLiteClient is meant to be used from one thread
+at a time (the storage thread).
+"""
+
+from collections import namedtuple
+import json
+import os
+import re
+import sqlite3
+
+from bson.objectid import ObjectId
+
+InsertOneResult = namedtuple("InsertOneResult", "inserted_id")
+InsertManyResult = namedtuple("InsertManyResult", "inserted_ids")
+UpdateResult = namedtuple("UpdateResult", "matched_count modified_count")
+DeleteResult = namedtuple("DeleteResult", "deleted_count")
+
+NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+# "project_id_1_key_1" -> [("project_id", "1"), ("key", "1")]; "m1" is a descending -1
+INDEX_KEY_RE = re.compile(r"_?(.+?)_(1|m1)(?=_|$)")
+# Range filters, {"rank": {"$gt": "a"}}; anything else is equality only
+_COMPARISONS = {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+def _check_name(name):
+    if not NAME_RE.match(name):
+        raise ValueError(f"Nombre no válido para SQLite: {name!r}")
+    return name
+
+
+def _json_path(field):
+    """'info.host' -> '$."info"."host"'"""
+    return "$" + "".join('."' + part.replace('"', '""') + '"' for part in field.split("."))
+
+
+def _field_sql(field):
+    """
+    json_extract(doc, '<path>') with the path written in the SQL: SQLite only
+    uses an expression index when the query has the very same expression,
+    which a bound parameter is not.
+    """
+    return "json_extract(doc, '" + _json_path(field).replace("'", "''") + "')"
+
+
+def _id_text(value):
+    return str(value)
+
+
+def _id_value(text):
+    """Ids go back out as ObjectIds when they look like one, as Mongita returns them."""
+    return ObjectId(text) if ObjectId.is_valid(text) else text
+
+
+def _set_path(document, field, value):
+    parts = field.split(".")
+    for part in parts[:-1]:
+        child = document.get(part)
+        if not isinstance(child, dict):
+            child = document[part] = {}
+        document = child
+    document[parts[-1]] = value
+
+
+class SQLiteCollection:
+    def __init__(self, database, name):
+        self.database = database
+        self.name = _check_name(name)
+        self._table = f'"{name}"'
+
+    @property
+    def _conn(self):
+        return self.database.conn
+
+    def _ensure(self):
+        self.database.ensure_table(self.name)
+
+    def _where(self, filter):
+        """Equality and $gt/$gte/$lt/$lte filter -> (WHERE clause, params)."""
+        clauses, params = [], []
+        for field, value in (filter or {}).items():
+            conditions = value.items() if isinstance(value, dict) else [(None, value)]
+            if field.startswith("$") or not conditions or any(
+                    operator is not None and operator not in _COMPARISONS for operator, _ in conditions):
+                raise NotImplementedError(f"Filtro no soportado por el motor SQLite: {field}")
+            column = "id" if field == "_id" else _field_sql(field)
+            for operator, operand in conditions:
+                if field == "_id":
+                    operand = _id_text(operand)
+                elif isinstance(operand, ObjectId):
+                    operand = str(operand)
+                clauses.append(f"{column} {_COMPARISONS.get(operator, '=')} ?")
+                params.append(operand)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @staticmethod
+    def _order_by(sort):
+        if not sort:
+            return ""
+        if isinstance(sort, str):
+            sort = [(sort, 1)]
+        order = []
+        for field, direction in sort:
+            column = "id" if field == "_id" else _field_sql(field)
+            order.append(f"{column} {'DESC' if direction < 0 else 'ASC'}")
+        return " ORDER BY " + ", ".join(order)
+
+    def _query(self, select, filter, sort=None, limit=None, skip=None):
+        return self._execute(select, filter, sort, limit, skip).fetchall()
+
+    def _execute(self, select, filter, sort=None, limit=None, skip=None):
+        self._ensure()
+        where, params = self._where(filter)
+        sql = f"SELECT {select} FROM {self._table}{where}{self._order_by(sort)}"
+        if limit is not None or skip:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend((-1 if limit is None else limit, skip or 0))
+        return self._conn.execute(sql, params)
+
+    @staticmethod
+    def _document(row):
+        document = json.loads(row[1])
+        document["_id"] = _id_value(row[0])
+        return document
+
+    def find(self, filter=None, sort=None, limit=None, skip=None):
+        """Rows are read as the result is iterated, like a Mongita cursor."""
+        return (self._document(row) for row in self._execute("id, doc", filter, sort, limit, skip))
+
+    def find_one(self, filter=None, sort=None, skip=None):
+        rows = self._query("id, doc", filter, sort, 1, skip)
+        return self._document(rows[0]) if rows else None
+
+    def find_fields(self, filter=None, fields=(), sort=None, limit=None):
+        """
+        find() that only reads `fields` out of the JSON; see storage_worker.find_projected.
+        Rows are read as the result is iterated, like find().
+        """
+        if not fields:
+            return ({"_id": _id_value(row[0])} for row in self._execute("id", filter, sort, limit))
+        # With two or more paths json_extract returns a JSON array of the values
+        paths = [_json_path(field) for field in fields] * (2 if len(fields) == 1 else 1)
+        self._ensure()
+        where, params = self._where(filter)
+        sql = (f"SELECT id, json_extract(doc, {', '.join('?' for _ in paths)}) "
+               f"FROM {self._table}{where}{self._order_by(sort)}")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        cursor = self._conn.execute(sql, paths + params)
+        return (self._fields_document(fields, row_id, values) for row_id, values in cursor)
+
+    @staticmethod
+    def _fields_document(fields, row_id, values):
+        document = {field: value for field, value in zip(fields, json.loads(values))
+                    if value is not None}
+        document["_id"] = _id_value(row_id)
+        return document
+
+    def count_documents(self, filter):
+        return self._query("COUNT(*)", filter)[0][0]
+
+    def insert_one(self, document):
+        document.setdefault("_id", ObjectId())
+        self._ensure()
+        with self._conn:
+            self._insert(document)
+        return InsertOneResult(document["_id"])
+
+    def insert_many(self, documents):
+        self._ensure()
+        with self._conn:
+            for document in documents:
+                document.setdefault("_id", ObjectId())
+                self._insert(document)
+        return InsertManyResult([document["_id"] for document in documents])
+
+    def _insert(self, document):
+        body = {key: value for key, value in document.items() if key != "_id"}
+        self._conn.execute(f"INSERT INTO {self._table} (id, doc) VALUES (?, ?)",
+                           (_id_text(document["_id"]), json.dumps(body, default=str)))
+
+    def _update(self, filter, update, limit):
+        for operator in update:
+            if operator != "$set":
+                raise NotImplementedError(f"Operador no soportado por el motor SQLite: {operator}")
+        rows = self._query("id, doc", filter, limit=limit)
+        modified = 0
+        with self._conn:
+            for row_id, text in rows:
+                document = json.loads(text)
+                for field, value in update["$set"].items():
+                    _set_path(document, field, value)
+                new_text = json.dumps(document, default=str)
+                if new_text != text:
+                    self._conn.execute(f"UPDATE {self._table} SET doc = ? WHERE id = ?", (new_text, row_id))
+                    modified += 1
+        return UpdateResult(len(rows), modified)
+
+    def update_one(self, filter, update):
+        return self._update(filter, update, 1)
+
+    def update_many(self, filter, update):
+        return self._update(filter, update, None)
+
+    def _delete(self, filter, limit):
+        ids = [(row[0],) for row in self._query("id", filter, limit=limit)]
+        with self._conn:
+            self._conn.executemany(f"DELETE FROM {self._table} WHERE id = ?", ids)
+        return DeleteResult(len(ids))
+
+    def delete_one(self, filter):
+        return self._delete(filter, 1)
+
+    def delete_many(self, filter):
+        return self._delete(filter, None)
+
+    def create_index(self, keys):
+        """keys: a field name, or [(field, 1 or -1), ...] for a compound index."""
+        if isinstance(keys, str):
+            keys = [(keys, 1)]
+        self._ensure()
+        name = "_".join(f"{field}_{direction}" for field, direction in keys)
+        columns = ", ".join(f"{_field_sql(field)} {'DESC' if direction < 0 else 'ASC'}" for field, direction in keys)
+        sql_name = _check_name(f"{self.name}_{name.replace('.', '_').replace('-', 'm')}")
+        with self._conn:
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS "{sql_name}" ON {self._table} ({columns})')
+        return name
+
+    def index_information(self):
+        """Same shape as Mongita: [{'_id_': {...}}, {'name_1': {...}}, ...]"""
+        self._ensure()
+        info = [{"_id_": {"key": [("_id", 1)]}}]
+        prefix = f"{self.name}_"
+        for (sql_name,) in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                (self.name,)):
+            name = sql_name[len(prefix):] if sql_name.startswith(prefix) else sql_name
+            keys = [(field, -1 if direction == "m1" else 1) for field, direction in INDEX_KEY_RE.findall(name)]
+            info.append({name.replace("_m1", "_-1"): {"key": keys}})
+        return info
+
+
+class SQLiteDatabase:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+        self.conn = client.conn
+        self._tables = set(self.list_collection_names())
+        self._collections = {}
+
+    def list_collection_names(self):
+        return [name for (name,) in self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' "
+            "AND name != 'mau_meta'")]
+
+    def ensure_table(self, name):
+        if name not in self._tables:
+            with self.conn:
+                self.conn.execute(f'CREATE TABLE IF NOT EXISTS "{name}" (id TEXT PRIMARY KEY, doc TEXT NOT NULL)')
+            self._tables.add(name)
+
+    def __getitem__(self, name):
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = self._collections[name] = SQLiteCollection(self, name)
+        return collection
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    def get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM mau_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO mau_meta (key, value) VALUES (?, ?)", (key, value))
+
+
+class SQLiteClient:
+    """One SQLite file per database name, under `directory`."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._databases = {}
+        self.conn = None
+
+    def __getitem__(self, name):
+        database = self._databases.get(name)
+        if database is None:
+            if self._databases:
+                raise NotImplementedError("El motor SQLite abre una sola base de datos por cliente")
+            path = os.path.join(self.directory, f"{_check_name(name)}.sqlite3")
+            # Created here, then only used from the storage thread
+            self.conn = sqlite3.connect(path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS mau_meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.conn.commit()
+            database = self._databases[name] = SQLiteDatabase(self, name)
+        return database
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
@@ -0,0 +1,101 @@
+"""
+Choice of storage engine for projects and todos.
+
+config.json picks it with "storage_backend" ("mongita", the default, or
+"sqlite") and names the database with "db_name". Both engines expose the
+same collection API (see sqlite_store), so everything above this module
+works with either one.
+
+The first time the SQLite engine opens an empty database next to an existing
+mongita_data/ directory, everything is copied over once, keeping the ids
+(note folders are named after project ids). Mongita's files are left as they
+were. The copy can also be run by hand:
+
+    python storage_backend.py migrate [data_dir] [db_name]
+"""
+
+import os
+import sys
+
+BACKENDS = ("mongita", "sqlite")
+DEFAULT_BACKEND = "mongita"
+DEFAULT_DB_NAME = "projects_db"
+MIGRATED_KEY = "migrated_from_mongita"
+
+
+def mongita_dir(data_dir):
+    return os.path.join(data_dir, "mongita_data")
+
+
+def sqlite_dir(data_dir):
+    return os.path.join(data_dir, "sqlite_data")
+
+
+def open_mongita(data_dir, db_name):
+    from mongita import MongitaClientDisk
+    directory = mongita_dir(data_dir)
+    os.makedirs(data_dir, exist_ok=True)
+    os.environ["MONGITA_DIR"] = directory
+    client = MongitaClientDisk(directory)
+    return client, client[db_name]
+
+
+def open_sqlite(data_dir, db_name):
+    from sqlite_store import SQLiteClient
+    client = SQLiteClient(sqlite_dir(data_dir))
+    return client, client[db_name]
+
+
+def open_database(backend, data_dir, db_name=DEFAULT_DB_NAME):
+    """(client, db) for `backend`; unknown names fall back to Mongita."""
+    if backend not in BACKENDS:
+        print(f"Motor de almacenamiento desconocido '{backend}', se usa {DEFAULT_BACKEND}.")
+        backend = DEFAULT_BACKEND
+    if backend == "sqlite":
+        client, db = open_sqlite(data_dir, db_name)
+        if db.get_meta(MIGRATED_KEY) is None and not any(
+                db[name].count_documents({}) for name in db.list_collection_names()):
+            migrate_from_mongita(data_dir, db_name, db)
+        return client, db
+    return open_mongita(data_dir, db_name)
+
+
+def migrate_from_mongita(data_dir, db_name, sqlite_db, batch_size=500):
+    """
+    Copy every collection of the Mongita database into `sqlite_db`, once.
+    Returns {collection: documents copied}.
+    """
+    copied = {}
+    if os.path.isdir(os.path.join(mongita_dir(data_dir), db_name)):
+        mongita_client, mongita_db = open_mongita(data_dir, db_name)
+        try:
+            for name in mongita_db.list_collection_names():
+                batch = []
+                copied[name] = 0
+                for document in mongita_db[name].find({}):
+                    batch.append(document)
+                    if len(batch) == batch_size:
+                        sqlite_db[name].insert_many(batch)
+                        copied[name] += len(batch)
+                        batch = []
+                if batch:
+                    sqlite_db[name].insert_many(batch)
+                    copied[name] += len(batch)
+        finally:
+            mongita_client.close()
+        print(f"Migración Mongita -> SQLite: {copied}")
+    sqlite_db.set_meta(MIGRATED_KEY, "1")
+    return copied
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "migrate":
+        print(__doc__)
+        sys.exit(1)
+    data_dir = sys.argv[2] if len(sys.argv) > 2 else os.path.dirname(os.path.abspath(__file__))
+    db_name = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_DB_NAME
+    client, db = open_sqlite(data_dir, db_name)
+    try:
+        migrate_from_mongita(data_dir, db_name, db)
+    finally:
+        client.close()
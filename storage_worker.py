@@ -0,0 +1,167 @@
+import copy
+import itertools
+import threading
+import traceback
+
+from PySide6.QtCore import QCoreApplication, QObject, QThread, Signal, Slot
+
+# Secondary indexes kept by the storage engine, {collection: [field or (field, ...), ...]}.
+# Mongita only supports single-field indexes and uses them for equality filters;
+# it gets the first field of a compound index instead.
+INDEXES = {
+    "projects": ["name", "rank"],
+    "todos": ["project_id", ("project_id", "rank")],
+    "project_info": [("project_id", "key"), "key"],
+}
+
+
+def index_name(fields):
+    return "_".join(f"{field}_1" for field in fields)
+
+
+def ensure_indexes(db):
+    """Create the missing INDEXES. The engine keeps them up to date on every write."""
+    for collection_name, specs in INDEXES.items():
+        collection = db[collection_name]
+        existing = set()
+        for index in collection.index_information():
+            existing.update(index)
+        for spec in specs:
+            fields = (spec,) if isinstance(spec, str) else tuple(spec)
+            if index_name(fields) in existing:
+                continue
+            try:
+                collection.create_index([(field, 1) for field in fields])
+            except NotImplementedError:
+                fields = fields[:1]
+                if index_name(fields) in existing:
+                    continue
+                collection.create_index(fields[0])
+            existing.add(index_name(fields))
+            print(f"Storage: índice {collection_name}.{'+'.join(fields)} creado.")
+
+# What the list views show of each document; the rest is read on selection
+SUMMARY_FIELDS = {
+    "projects": ("name", "description", "icon_path", "rank"),
+    "todos": ("title", "project_id", "rank"),
+}
+
+
+def find_projected(collection, filter=None, fields=(), sort=None, limit=None):
+    """
+    find() keeping only `fields` (and _id) of each document, like a MongoDB
+    projection. The SQLite engine reads just those fields (find_fields).
+    Mongita has no projection and deep-copies every whole document it
+    returns, so its shallow internal find is used when available and only the
+    kept fields are copied.
+    """
+    # Looked up on the class: a Mongita collection answers any attribute with a sub-collection
+    if hasattr(type(collection), "find_fields"):
+        return collection.find_fields(filter, tuple(fields), sort, limit)
+    find_shallow = getattr(collection, "_Collection__find", None)
+    if find_shallow is not None:
+        documents = find_shallow(filter or {}, sort, limit, shallow=True)
+    else:
+        documents = collection.find(filter, sort=sort, limit=limit)
+    fields = ("_id",) + tuple(fields)
+    return ({field: copy.deepcopy(document[field]) for field in fields if field in document}
+            for document in documents if document)
+
+
+def find_summaries(db, collection_name, filter=None, sort=None, limit=None):
+    """The SUMMARY_FIELDS of every matching document, for list views."""
+    return find_projected(db[collection_name], filter, SUMMARY_FIELDS[collection_name], sort, limit)
+
+
+class StorageWorker(QObject):
+    """Runs database operations one at a time on the storage thread."""
+
+    result_ready = Signal(int, object)
+    error_occurred = Signal(int, str)
+
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+
+    @Slot(int, object)
+    def execute(self, request_id, operation):
+        try:
+            result = operation(self.db)
+        except Exception as e:
+            traceback.print_exc()
+            self.error_occurred.emit(request_id, str(e))
+            return
+        self.result_ready.emit(request_id, result)
+
+
+class StorageService(QObject):
+    """
+    Request/response front end for the storage thread.
+
+    submit() queues `operation(db)` on a dedicated QThread and returns at once;
+    the optional callback is called with the result back on the GUI thread.
+    Operations run in the order they were submitted, so a read queued after a
+    write always sees it.
+
+    about_to_stop is emitted before the thread is drained and stopped, while
+    submit() still works, so buffered writes can be handed over in time.
+    """
+
+    about_to_stop = Signal()
+    _request = Signal(int, object)
+
+    def __init__(self, db, parent=None, name="MauStorage"):
+        super().__init__(parent)
+        self.db = db
+        self._ids = itertools.count(1)
+        self._callbacks = {}
+
+        self._thread = QThread()
+        self._thread.setObjectName(name)
+        self._worker = StorageWorker(db)
+        self._worker.moveToThread(self._thread)
+        self._request.connect(self._worker.execute)
+        self._worker.result_ready.connect(self._on_result)
+        self._worker.error_occurred.connect(self._on_error)
+        self._thread.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    def submit(self, operation, callback=None, on_error=None):
+        request_id = next(self._ids)
+        if callback or on_error:
+            self._callbacks[request_id] = (callback, on_error)
+        self._request.emit(request_id, operation)
+        return request_id
+
+    def flush(self):
+        """Block until every operation submitted so far has run."""
+        if not self._thread.isRunning():
+            return
+        done = threading.Event()
+        self.submit(lambda db: done.set())
+        done.wait()
+
+    @Slot()
+    def stop(self):
+        if not self._thread.isRunning():
+            return
+        self.about_to_stop.emit()
+        self.flush()
+        self._thread.quit()
+        self._thread.wait()
+
+    @Slot(int, object)
+    def _on_result(self, request_id, result):
+        callback, _ = self._callbacks.pop(request_id, (None, None))
+        if callback:
+            callback(result)
+
+    @Slot(int, str)
+    def _on_error(self, request_id, message):
+        _, on_error = self._callbacks.pop(request_id, (None, None))
+        print(f"Storage error: {message}")
+        if on_error:
+            on_error(message)
@@ -1,4 +1,4 @@
-import  sys, os
+import  sys, os, tempfile
 from PySide6.QtGui import QTextCursor, QTextCharFormat 
 
 def get_resource_path(relative_path):
@@ -12,6 +12,17 @@ def get_resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def get_qss_path():
+    """
+    Path of the dark theme stylesheet, next to the sources or inside the PyInstaller bundle
+    """
+    if getattr(sys, 'frozen', False):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, "dark_theme.qss")
+
+
 
 def clean_text_format(editor, on_after_clean=None):
     """
@@ -32,4 +43,39 @@ def clean_text_format(editor, on_after_clean=None):
         editor.setFocus()
         
         if on_after_clean:
-            on_after_clean()
\ No newline at end of file
+            on_after_clean()
+
+def atomic_write_text(path, text, exclusive=False):
+    """
+    Write `text` to a temp file next to `path` and swap it in with os.replace,
+    so a crash mid-write leaves the old file instead of a truncated one.
+
+    With exclusive=True `path` must not exist yet: the temp file is hard-linked
+    to it instead, which raises FileExistsError rather than replacing a file
+    created in the meantime.
+    """
+    directory, name = os.path.split(path)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if not exclusive:
+            os.replace(temp_path, path)
+            return
+        try:
+            os.link(temp_path, path)
+        except FileExistsError:
+            raise
+        except OSError:
+            # No hard links on this filesystem (FAT): reserve the name, then write it
+            with open(path, "x", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+        os.remove(temp_path)
+    except BaseException:
+        try: os.remove(temp_path)
+        except OSError: pass
+        raise
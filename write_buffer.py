@@ -0,0 +1,80 @@
+import hashlib
+
+from PySide6.QtCore import QObject, QTimer, Slot
+
+from project_store import as_object_id
+
+
+def content_hash(fields):
+    digest = hashlib.blake2b(digest_size=16)
+    for key in sorted(fields):
+        digest.update(key.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(str(fields[key]).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.digest()
+
+
+class WriteBehindBuffer(QObject):
+    """
+    Coalescing write-behind buffer for one collection.
+
+    stage() records the latest fields of a document; repeated stages of the
+    same document before the next flush collapse into one write, and fields
+    whose hash matches what was last written are dropped. flush() hands every
+    pending write to the storage thread in a single operation, and it also runs
+    when the storage service is about to stop so nothing staged is lost.
+    """
+
+    def __init__(self, storage, collection_name, delay=500, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self.collection_name = collection_name
+        self._pending = {}
+        self._written = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(delay)
+        self._flush_timer.timeout.connect(self.flush)
+        storage.about_to_stop.connect(self.flush)
+
+    def remember(self, doc_id, fields):
+        """Record fields that are known to be in the database already."""
+        self._written[doc_id] = content_hash(fields)
+
+    def stage(self, doc_id, fields):
+        """Queue `fields` to be $set on `doc_id`. Returns False if nothing changed."""
+        fingerprint = content_hash(fields)
+        if self._written.get(doc_id) == fingerprint:
+            self._pending.pop(doc_id, None)
+            return False
+        self._pending[doc_id] = (fields, fingerprint)
+        self._flush_timer.start()
+        return True
+
+    def forget(self, doc_id):
+        self._pending.pop(doc_id, None)
+        self._written.pop(doc_id, None)
+
+    def has_pending(self, doc_id=None):
+        if doc_id is None:
+            return bool(self._pending)
+        return doc_id in self._pending
+
+    @Slot()
+    def flush(self):
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        writes = [(doc_id, fields) for doc_id, (fields, _) in self._pending.items()]
+        for doc_id, (_, fingerprint) in self._pending.items():
+            self._written[doc_id] = fingerprint
+        self._pending = {}
+        collection_name = self.collection_name
+
+        def write(db):
+            collection = db[collection_name]
+            for doc_id, fields in writes:
+                collection.update_one({"_id": as_object_id(doc_id)},{"$set": fields})
+
+        self.storage.submit(write)